@@ -17,7 +17,12 @@ def test_import(filepath):
         return False, str(e)
 
 def main():
-    base_path = r'c:\Users\Administrator\Documents\GitHub\whymath\worksheet-generator\generators\K_8'
+    app_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'worksheet-generator')
+    base_path = os.path.join(app_dir, 'generators', 'K_8')
+
+    # Generators import the shared helpers from the worksheet-generator folder
+    if app_dir not in sys.path:
+        sys.path.insert(0, app_dir)
 
     grades = ['Kindergarten', 'Grade_1', 'Grade_2', 'Grade_5', 'Grade_6', 'Grade_8']
 
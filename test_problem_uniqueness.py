@@ -0,0 +1,66 @@
+"""
+Test how the uniqueness layer handles generators with one problem per difficulty.
+"""
+
+import os
+import random
+import sys
+
+app_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'worksheet-generator')
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+from equation_generator import Equation
+from problem_uniqueness import generate_unique_worksheet
+
+
+class FixedQuestionGenerator:
+    """Asks the same question every time, like many statistics generators."""
+
+    def __init__(self):
+        self.rng = random.Random(0)
+        self.draws = 0
+
+    def generate_worksheet(self, difficulty, num_problems=10):
+        self.draws += num_problems
+        return [Equation(latex="\\text{Define a p-value.}", solution="\\text{...}", steps=[],
+                         difficulty=difficulty) for _ in range(num_problems)]
+
+
+class OneEntrySpaceGenerator(FixedQuestionGenerator):
+    """Declares its single question as a one-entry problem space."""
+
+    def problem_space(self, difficulty):
+        return [None]
+
+    def problem_for(self, difficulty, params):
+        return self.generate_worksheet(difficulty, 1)[0]
+
+
+class SmallSpaceGenerator(OneEntrySpaceGenerator):
+    """Three distinct questions."""
+
+    def problem_space(self, difficulty):
+        return [1, 2, 3]
+
+    def problem_for(self, difficulty, params):
+        return Equation(latex=f"{params} + 1", solution=params + 1, steps=[], difficulty=difficulty)
+
+
+def test_one_entry_space_repeats_the_question():
+    problems = generate_unique_worksheet(OneEntrySpaceGenerator(), 'easy', 8, strict=True)
+    assert len(problems) == 8
+
+
+def test_fixed_question_without_space_is_repeated():
+    generator = FixedQuestionGenerator()
+    problems = generate_unique_worksheet(generator, 'easy', 8, strict=True)
+    assert len(problems) == 8
+    # Recognised after the first worksheets, not the whole draw budget
+    assert generator.draws < 50
+
+
+def test_small_space_is_capped_with_a_warning(capsys):
+    problems = generate_unique_worksheet(SmallSpaceGenerator(), 'easy', 8)
+    assert sorted(p.solution for p in problems) == [2, 3, 4]
+    assert "only 3 unique problems" in capsys.readouterr().out
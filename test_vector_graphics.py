@@ -0,0 +1,50 @@
+"""
+Test that vector-mode graphs keep their transparency in the PDF.
+"""
+
+import io
+import os
+import sys
+
+import pytest
+
+app_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'worksheet-generator')
+if app_dir not in sys.path:
+    sys.path.insert(0, app_dir)
+
+pymupdf = pytest.importorskip('pymupdf')
+
+from reportlab.pdfgen import canvas
+
+import graphing_utils
+from vector_graphics import draw_graphic, end_form, get_graph_render_mode, set_graph_render_mode
+
+
+def test_shaded_inequality_is_translucent():
+    mode = get_graph_render_mode()
+    set_graph_render_mode('vector')
+    try:
+        graph = graphing_utils.graph_inequality(slope=1, y_intercept=2, inequality_type='>')
+    finally:
+        set_graph_render_mode(mode)
+
+    # Drawn on a page, and inside a form as answer key pages are
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=(400, 400))
+    draw_graphic(c, graph, 50, 50, 300, 300, preserveAspectRatio=True)
+    c.showPage()
+    c.beginForm('answer_key', 0, 0, 400, 400)
+    draw_graphic(c, graph, 50, 50, 300, 300, preserveAspectRatio=True)
+    end_form(c)
+    c.doForm('answer_key')
+    c.save()
+
+    pymupdf.TOOLS.mupdf_warnings(reset=True)
+    doc = pymupdf.open(stream=buf.getvalue(), filetype='pdf')
+    for page in doc:
+        pix = page.get_pixmap(dpi=72)
+        colours = {pix.pixel(x, y) for x in range(50, 350, 2) for y in range(50, 350, 2)}
+        # Blue at alpha 0.2 over white, not solid blue
+        assert (204, 204, 255) in colours
+        assert (0, 0, 255) not in colours
+    assert 'ExtGState' not in pymupdf.TOOLS.mupdf_warnings()
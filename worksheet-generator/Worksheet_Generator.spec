@@ -73,8 +73,9 @@ a = Analysis(
         ('High School Worksheet Topics List.xlsx', '.'),
         ('K-8 Worksheet Topics List.xlsx', '.'),
 
-        # Add generator registry and helpers
+        # Add generator registry, manifest and helpers
         ('generator_registry.py', '.'),
+        ('generator_manifest.json', '.'),
         ('resource_helper.py', '.'),
         ('check_progress.py', '.'),
 
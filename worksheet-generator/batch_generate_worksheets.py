@@ -0,0 +1,385 @@
+"""
+Headless batch generation of the whole worksheet catalogue.
+
+Discovers every generator through the generator manifest (the same source the
+GUI and generator_registry.py use), then generates one worksheet PDF per
+generator and difficulty in worker processes. Each job has a time limit; a
+worker that runs past it is killed and replaced, and the job is recorded as a
+timeout. Progress is printed as "[X/Y] ..." lines (parsed by the GUI's Batch
+Generate dialog) and a JSON summary of timings and failures is written next
+to the PDFs, so the full catalogue can be regenerated unattended.
+
+Usage:
+    python batch_generate_worksheets.py --difficulty easy --output easy_worksheets
+    python batch_generate_worksheets.py --difficulty all --output nightly --workers 8 --timeout 20
+    python batch_generate_worksheets.py --difficulty hard --filter "Algebra" --summary algebra.json
+    python batch_generate_worksheets.py --difficulty all --seed 2024 --output reproducible
+    python batch_generate_worksheets.py --filter "Unit 4" --trace --trace-output unit4_trace.json
+
+Exits with status 1 if any worksheet failed or timed out.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from datetime import datetime
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import tracing
+from generator_manifest import MANIFEST_FILE, load_manifest, manifest_entries, refresh_manifest
+from parallel_generation import GenerationJob, default_worker_count, run_job
+from renderer_pool import is_warm, warm_up
+from resource_helper import is_frozen, resource_path
+from seeding import derive_seed
+
+APP_DIR = Path(__file__).resolve().parent
+
+DIFFICULTIES = ['easy', 'medium', 'hard', 'challenge']
+
+# Jobs running longer than this are killed (seconds)
+DEFAULT_TIMEOUT = 6.0
+
+SUMMARY_FILE = "batch_summary.json"
+
+# Job status values in the summary
+STATUS_OK = 'ok'
+STATUS_FAILED = 'failed'
+STATUS_TIMEOUT = 'timeout'
+
+
+def _safe_name(name: str) -> str:
+    """Folder/file name for a class, unit or topic (same rules as the GUI)."""
+    return name.replace(":", "").replace(" ", "_").replace("/", "_").replace("(", "").replace(")", "")
+
+
+def discover_jobs(output_dir, difficulties: List[str], num_problems: int = 10,
+                  include_answer_key: bool = True, name_filter: Optional[str] = None,
+                  seed: Optional[int] = None) -> List[GenerationJob]:
+    """
+    Create one job per generator and difficulty.
+
+    PDFs are laid out as <output_dir>/<Class>/<Unit>/<Topic>_<difficulty>.pdf.
+
+    Args:
+        output_dir: Root folder for the generated PDFs
+        difficulties: Difficulties to generate for every generator
+        num_problems: Problems per worksheet
+        include_answer_key: Add an answer key page to each PDF
+        name_filter: Only include generators whose "Class/Unit/Topic" contains this (case-insensitive)
+        seed: Base seed; each job gets a seed derived from it and the job's class,
+              unit, topic and difficulty, so reruns give identical worksheets
+
+    Returns:
+        List of GenerationJob
+    """
+    if is_frozen():
+        manifest = load_manifest(resource_path(MANIFEST_FILE)) or {'generators': []}
+    else:
+        manifest = refresh_manifest(APP_DIR / "generators", APP_DIR / MANIFEST_FILE)
+
+    jobs = []
+    for entry in manifest_entries(manifest):
+        label = f"{entry['class']}/{entry['unit']}/{entry['topic']}"
+        if name_filter and name_filter.lower() not in label.lower():
+            continue
+        folder = Path(output_dir) / _safe_name(entry['class']) / _safe_name(entry['unit'])
+        for difficulty in difficulties:
+            jobs.append(GenerationJob(
+                module_name=entry['module'],
+                class_name=entry['class_name'],
+                difficulty=difficulty,
+                num_problems=num_problems,
+                output_path=str(folder / f"{_safe_name(entry['topic'])}_{difficulty}.pdf"),
+                title=entry['topic'],
+                include_answer_key=include_answer_key,
+                label=label,
+                path=str(APP_DIR / entry['path']),
+                seed=None if seed is None else derive_seed(
+                    seed, entry['class'], entry['unit'], entry['topic'], difficulty),
+            ))
+    return jobs
+
+
+def _worker_main(conn, app_dir: str, graph_mode: str, job_runner: Callable = run_job):
+    """Worker process: set up and warm up once, then run jobs sent over conn until it receives None."""
+    try:
+        warm_up(app_dir, graph_mode)
+    except Exception as e:
+        conn.send(('error', f"Worker setup failed: {e}"))
+        return
+    conn.send(('ready', None))
+
+    while True:
+        job = conn.recv()
+        if job is None:
+            break
+        conn.send(('result', job_runner(job)))
+
+
+def _process_context():
+    """Fork workers from a warmed-up parent (see renderer_pool) so they start warm."""
+    if is_warm() and 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing
+
+
+class _Worker:
+    """A worker process plus the job it is currently running."""
+
+    def __init__(self, app_dir: str, graph_mode: str, job_runner: Callable = run_job):
+        context = _process_context()
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main,
+                                               args=(child_conn, app_dir, graph_mode, job_runner),
+                                               daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+        self.job_index = None
+        self.started = None
+
+    def assign(self, index: int, job: GenerationJob):
+        self.job_index = index
+        self.started = time.perf_counter()
+        self.conn.send(job)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started if self.started is not None else 0.0
+
+    def finish(self):
+        self.job_index = None
+        self.started = None
+
+    def kill(self):
+        self.process.terminate()
+        self.process.join(5)
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (OSError, EOFError):
+            pass
+        self.process.join(5)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.conn.close()
+
+
+def run_batch(jobs: List[GenerationJob], workers: Optional[int] = None,
+              timeout: float = DEFAULT_TIMEOUT, on_result: Callable = None,
+              job_runner: Callable = run_job) -> List[dict]:
+    """
+    Run jobs in worker processes, killing any job that runs longer than timeout.
+
+    Args:
+        jobs: Jobs from discover_jobs()
+        workers: Number of worker processes (defaults to one per CPU, minus one)
+        timeout: Seconds a single job may run before it is killed (None or 0 for no limit)
+        on_result: Called as on_result(completed, total, record) after each job
+            (records of traced jobs have the job's tracing.Trace.to_json() as 'trace')
+        job_runner: Module-level function run in the worker for each job, returning a
+            GenerationResult (run_job; the benchmark passes one that also measures it)
+
+    Returns:
+        One summary record per job, in job order
+    """
+    from vector_graphics import get_graph_render_mode
+
+    app_dir = str(APP_DIR)
+    graph_mode = get_graph_render_mode()
+    total = len(jobs)
+    records = [None] * total
+    pending = list(range(total - 1, -1, -1))  # stack of job indexes, first job on top
+    completed = 0
+
+    def record(index, status, seconds, error=None, output=None, stats=None, trace=None):
+        nonlocal completed
+        job = jobs[index]
+        records[index] = {
+            'label': job.label,
+            'module': job.module_name,
+            'class_name': job.class_name,
+            'difficulty': job.difficulty,
+            'seed': job.seed,
+            'output': output,
+            'status': status,
+            'seconds': round(seconds, 3),
+            'error': error,
+        }
+        if stats:
+            records[index]['stats'] = stats
+        if trace:
+            records[index]['trace'] = trace
+        completed += 1
+        if on_result:
+            on_result(completed, total, records[index])
+
+    pool = [_Worker(app_dir, graph_mode, job_runner) for _ in range(min(workers or default_worker_count(), total))]
+    try:
+        while completed < total:
+            # Hand out work to idle workers
+            for worker in pool:
+                if worker.ready and worker.job_index is None and pending:
+                    index = pending.pop()
+                    os.makedirs(os.path.dirname(jobs[index].output_path), exist_ok=True)
+                    worker.assign(index, jobs[index])
+
+            for conn in wait([w.conn for w in pool], timeout=0.2):
+                worker = next(w for w in pool if w.conn is conn)
+                try:
+                    kind, payload = conn.recv()
+                except (EOFError, OSError):
+                    # The worker process died (crash, out of memory, ...)
+                    if worker.job_index is not None:
+                        record(worker.job_index, STATUS_FAILED, worker.elapsed(),
+                               f"Worker exited with code {worker.process.exitcode}")
+                    worker.kill()
+                    pool[pool.index(worker)] = _Worker(app_dir, graph_mode, job_runner)
+                    continue
+
+                if kind == 'ready':
+                    worker.ready = True
+                elif kind == 'error':
+                    raise RuntimeError(payload)
+                else:
+                    result = payload
+                    status = STATUS_OK if result.ok else STATUS_FAILED
+                    record(worker.job_index, status, worker.elapsed(), result.error,
+                           result.output_path, result.stats, result.trace)
+                    worker.finish()
+
+            # Kill and replace workers whose job ran past the time limit
+            if timeout:
+                for i, worker in enumerate(pool):
+                    if worker.job_index is not None and worker.elapsed() > timeout:
+                        record(worker.job_index, STATUS_TIMEOUT, worker.elapsed(),
+                               f"Timed out after {timeout:g}s")
+                        worker.kill()
+                        pool[i] = _Worker(app_dir, graph_mode, job_runner)
+    finally:
+        for worker in pool:
+            worker.stop()
+
+    return records
+
+
+def write_summary(summary_path, records: List[dict], **info):
+    """
+    Write the JSON batch summary.
+
+    Args:
+        summary_path: JSON file to write
+        records: Job records from run_batch()
+        **info: Extra top-level fields (settings, start/end time, ...)
+    """
+    counts = {status: sum(1 for r in records if r['status'] == status)
+              for status in (STATUS_OK, STATUS_FAILED, STATUS_TIMEOUT)}
+    summary = dict(info)
+    summary['total'] = len(records)
+    summary['counts'] = counts
+    summary['slowest'] = [
+        {'label': r['label'], 'difficulty': r['difficulty'], 'seconds': r['seconds']}
+        for r in sorted(records, key=lambda r: r['seconds'], reverse=True)[:10]
+    ]
+    summary['jobs'] = records
+
+    Path(summary_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate worksheets from every generator")
+    parser.add_argument('--difficulty', default='easy', choices=DIFFICULTIES + ['all'],
+                        help="Difficulty to generate, or 'all' (default: easy)")
+    parser.add_argument('--output', default=None,
+                        help="Output folder (default: <difficulty>_worksheets)")
+    parser.add_argument('--num-problems', type=int, default=10,
+                        help="Problems per worksheet (default: 10)")
+    parser.add_argument('--no-answer-key', action='store_true', help="Don't add answer keys")
+    parser.add_argument('--filter', default=None,
+                        help="Only generators whose Class/Unit/Topic contains this text")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes (default: number of CPUs minus one)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f"Seconds before a worksheet is skipped (default: {DEFAULT_TIMEOUT:g}, 0 = no limit)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Base seed for reproducible worksheets (default: random)")
+    parser.add_argument('--fork-after-warmup', action='store_true',
+                        help="Warm up once and fork the workers from the warmed process, "
+                             "so restarted workers start warm too (not on Windows)")
+    parser.add_argument('--trace', action='store_true',
+                        help="Time each stage of every worksheet and print a breakdown per worksheet")
+    parser.add_argument('--trace-output', default=None,
+                        help="Write the spans of all worksheets to this Chrome trace file (implies --trace)")
+    parser.add_argument('--summary', default=None,
+                        help=f"JSON summary file (default: <output>/{SUMMARY_FILE})")
+    args = parser.parse_args(argv)
+
+    difficulties = DIFFICULTIES if args.difficulty == 'all' else [args.difficulty]
+    output_dir = args.output or f"{args.difficulty}_worksheets"
+    summary_path = args.summary or os.path.join(output_dir, SUMMARY_FILE)
+
+    jobs = discover_jobs(output_dir, difficulties, args.num_problems,
+                         not args.no_answer_key, args.filter, args.seed)
+    print(f"Found {len(jobs) // len(difficulties)} generators", flush=True)
+    if not jobs:
+        print("Nothing to generate")
+        return 1
+
+    workers = min(args.workers or default_worker_count(), len(jobs))
+    print(f"Generating {len(jobs)} worksheets ({', '.join(difficulties)}) "
+          f"on {workers} workers, timeout {args.timeout:g}s", flush=True)
+
+    traces = []
+    if args.trace or args.trace_output:
+        # Workers started with 'spawn' read the environment; forked ones inherit the flag
+        os.environ[tracing.TRACE_ENV] = '1'
+        tracing.enable()
+
+    if args.fork_after_warmup:
+        print(f"Warmed up in {warm_up():.1f}s", flush=True)
+
+    def on_result(completed, total, record):
+        line = f"[{completed}/{total}] {record['status'].upper():7} {record['label']} ({record['difficulty']}) {record['seconds']:.2f}s"
+        if record['error']:
+            line += f" - {record['error']}"
+        print(line, flush=True)
+        if 'trace' in record:
+            traces.append(tracing.Trace(record['trace']['spans']))
+            # Only the per-stage totals go in the summary
+            record['trace'] = record['trace']['breakdown']
+            print(tracing.format_breakdown(record['trace']), flush=True)
+
+    started = datetime.now()
+    start_time = time.perf_counter()
+    records = run_batch(jobs, workers, args.timeout, on_result)
+    elapsed = time.perf_counter() - start_time
+
+    write_summary(summary_path, records,
+                  started=started.isoformat(timespec='seconds'),
+                  elapsed_seconds=round(elapsed, 1),
+                  difficulties=difficulties,
+                  output=os.path.abspath(output_dir),
+                  workers=workers,
+                  timeout=args.timeout,
+                  seed=args.seed)
+
+    ok = sum(1 for r in records if r['status'] == STATUS_OK)
+    print(f"\nGenerated {ok}/{len(records)} worksheets in {elapsed:.1f}s")
+    print(f"Summary written to {summary_path}")
+    if args.trace_output:
+        tracing.write_chrome_trace(args.trace_output, traces)
+        print(f"Trace written to {args.trace_output}")
+    return 0 if ok == len(records) else 1
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,369 @@
+"""
+Performance benchmark for every generator at every difficulty.
+
+For each generator in the manifest and each difficulty, generates one seeded
+worksheet in a worker process and measures:
+    - generate_seconds: generator.generate_worksheet()
+    - render_seconds:   laying out and saving the PDF (in memory)
+    - pages / bytes:    size of the PDF produced
+    - font_bytes:       size of the embedded font subsets
+    - peak_rss_mb:      peak resident memory of the worker during the job
+
+Results are written to a JSON file. Comparing them with a saved baseline flags
+regressions (slower or bigger than the baseline by more than --threshold), and
+within each unit, jobs that take many times longer than their unit mates are
+listed as outliers (e.g. a graphing generator that is 40x slower than the rest
+of its unit).
+
+Jobs use the same workers and time limit as batch_generate_worksheets.py, and a
+fixed seed, so every run measures the same worksheets.
+
+Usage:
+    python benchmark_generators.py --update-baseline
+    python benchmark_generators.py --filter "Algebra" --threshold 0.5
+    python benchmark_generators.py --difficulty easy --output easy_benchmark.json
+
+Exits with status 1 if any job regressed against the baseline.
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import platform
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from batch_generate_worksheets import DIFFICULTIES, STATUS_OK, discover_jobs, run_batch
+from parallel_generation import (GenerationJob, GenerationResult, get_worker_generator,
+                                 get_worker_pdf_generator)
+
+APP_DIR = Path(__file__).resolve().parent
+
+BASELINE_FILE = "benchmark_baseline.json"
+RESULTS_FILE = "benchmark_results.json"
+
+# Benchmarks measure the same worksheets on every run
+DEFAULT_SEED = 0
+
+# A single job may run this long before it is killed (seconds)
+DEFAULT_TIMEOUT = 60.0
+
+# Flag a job if it got this much slower/bigger than the baseline (0.25 = 25%)...
+DEFAULT_THRESHOLD = 0.25
+# ...and the difference is bigger than timing/memory noise
+MIN_SECONDS_DELTA = 0.05
+MIN_RSS_DELTA_MB = 20.0
+
+# Flag a job taking this many times the median of its unit (same difficulty)
+DEFAULT_OUTLIER_FACTOR = 10.0
+
+# Measurements compared against the baseline, with the noise floor for each
+COMPARED_STATS = {
+    'total_seconds': MIN_SECONDS_DELTA,
+    'peak_rss_mb': MIN_RSS_DELTA_MB,
+}
+
+_PAGE_PATTERN = re.compile(rb'/Type /Page\b')
+
+
+def _reset_peak_rss() -> bool:
+    """
+    Reset the process's peak RSS so the next reading only covers the next job.
+
+    Only possible on Linux; elsewhere the peak covers the worker's lifetime.
+
+    Returns:
+        True if the peak was reset
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident memory of this process in MB (None if it can't be measured)."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS, KB elsewhere
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    except ImportError:
+        pass
+
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, 'peak_wset', info.rss) / (1024 * 1024)
+    except ImportError:
+        return None
+
+
+def benchmark_job(job: GenerationJob) -> GenerationResult:
+    """
+    Generate one worksheet in a worker process and measure it.
+
+    The PDF is written to memory rather than job.output_path.
+
+    Returns:
+        GenerationResult whose stats hold the measurements
+    """
+    stats = {'peak_rss_per_job': _reset_peak_rss()}
+    try:
+        start = time.perf_counter()
+        pdf_gen = get_worker_pdf_generator()
+        generator = get_worker_generator(job)
+        stats['load_seconds'] = round(time.perf_counter() - start, 4)
+
+        start = time.perf_counter()
+        problems = generator.generate_worksheet(job.difficulty, job.num_problems)
+        stats['generate_seconds'] = round(time.perf_counter() - start, 4)
+        if not problems:
+            return GenerationResult(job.label, None, "No problems generated", stats)
+
+        buf = io.BytesIO()
+        start = time.perf_counter()
+        pdf_gen.write_worksheet(problems, buf, job.title, job.include_answer_key, invariant=True)
+        stats['render_seconds'] = round(time.perf_counter() - start, 4)
+
+        pdf = buf.getvalue()
+        stats['total_seconds'] = round(stats['generate_seconds'] + stats['render_seconds'], 4)
+        stats['problems'] = len(problems)
+        stats['pages'] = len(_PAGE_PATTERN.findall(pdf))
+        stats['bytes'] = len(pdf)
+        stats['font_bytes'] = sum(usage.bytes for usage in pdf_gen.last_font_usage)
+        return GenerationResult(job.label, None, None, stats)
+    except Exception as e:
+        return GenerationResult(job.label, None, str(e) or type(e).__name__, stats)
+    finally:
+        peak = _peak_rss_mb()
+        stats['peak_rss_mb'] = None if peak is None else round(peak, 1)
+
+
+def _job_key(record: dict) -> str:
+    return f"{record['module']}:{record['class_name']}:{record['difficulty']}"
+
+
+def find_regressions(records: List[dict], baseline: dict, threshold: float) -> List[dict]:
+    """
+    Compare benchmark records with a baseline.
+
+    Args:
+        records: Records from run_batch() with benchmark stats
+        baseline: Baseline from load_baseline()
+        threshold: Allowed relative increase (0.25 = 25% slower/bigger)
+
+    Returns:
+        One dict per regression: label, difficulty, stat, baseline, current
+    """
+    regressions = []
+    for record in records:
+        base = baseline.get('jobs', {}).get(_job_key(record))
+        if base is None:
+            continue
+
+        if record['status'] != STATUS_OK:
+            if base.get('status') == STATUS_OK:
+                regressions.append({'label': record['label'], 'difficulty': record['difficulty'],
+                                    'stat': 'status', 'baseline': STATUS_OK,
+                                    'current': record['status']})
+            continue
+
+        stats = record.get('stats', {})
+        for stat, noise in COMPARED_STATS.items():
+            old, new = base.get(stat), stats.get(stat)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + threshold) and new - old > noise:
+                regressions.append({'label': record['label'], 'difficulty': record['difficulty'],
+                                    'stat': stat, 'baseline': old, 'current': new})
+    return regressions
+
+
+def find_outliers(records: List[dict], factor: float) -> List[dict]:
+    """
+    Find jobs much slower than the other generators in their unit.
+
+    Args:
+        records: Records from run_batch() with benchmark stats
+        factor: Flag jobs taking more than factor times their unit's median
+
+    Returns:
+        One dict per outlier: label, difficulty, total_seconds, unit_median, ratio
+    """
+    units = defaultdict(list)
+    for record in records:
+        seconds = record.get('stats', {}).get('total_seconds')
+        if record['status'] == STATUS_OK and seconds is not None:
+            unit = record['label'].rsplit('/', 1)[0]
+            units[(unit, record['difficulty'])].append((record, seconds))
+
+    outliers = []
+    for jobs in units.values():
+        if len(jobs) < 3:
+            continue
+        median = statistics.median(seconds for _, seconds in jobs)
+        for record, seconds in jobs:
+            if seconds > median * factor and seconds - median > MIN_SECONDS_DELTA:
+                outliers.append({'label': record['label'], 'difficulty': record['difficulty'],
+                                 'total_seconds': seconds, 'unit_median': round(median, 4),
+                                 'ratio': round(seconds / max(median, 1e-6), 1)})
+    outliers.sort(key=lambda o: o['ratio'], reverse=True)
+    return outliers
+
+
+def load_baseline(path) -> dict:
+    """Load a baseline saved by save_baseline() (empty if there isn't one)."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read baseline {path}: {e}")
+        return {}
+
+
+def save_baseline(path, records: List[dict], **info):
+    """
+    Save benchmark records as the new baseline.
+
+    Jobs missing from this run (e.g. because of --filter) keep their old entries.
+    """
+    baseline = load_baseline(path)
+    jobs = baseline.get('jobs', {})
+    for record in records:
+        jobs[_job_key(record)] = {'status': record['status'], **record.get('stats', {})}
+    baseline.update(info)
+    baseline['jobs'] = dict(sorted(jobs.items()))
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every generator at every difficulty")
+    parser.add_argument('--difficulty', default='all', choices=DIFFICULTIES + ['all'],
+                        help="Difficulty to benchmark, or 'all' (default: all)")
+    parser.add_argument('--filter', default=None,
+                        help="Only generators whose Class/Unit/Topic contains this text")
+    parser.add_argument('--num-problems', type=int, default=10,
+                        help="Problems per worksheet (default: 10)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Worker processes (default: 1; more workers make timings noisier)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f"Seconds before a job is killed (default: {DEFAULT_TIMEOUT:g}, 0 = no limit)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help=f"Base seed for the benchmarked worksheets (default: {DEFAULT_SEED})")
+    parser.add_argument('--output', default=RESULTS_FILE,
+                        help=f"JSON results file (default: {RESULTS_FILE})")
+    parser.add_argument('--baseline', default=str(APP_DIR / BASELINE_FILE),
+                        help=f"Baseline JSON file to compare with (default: {BASELINE_FILE})")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="Save this run as the new baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Allowed slowdown/growth vs the baseline (default: {DEFAULT_THRESHOLD:g} = "
+                             f"{DEFAULT_THRESHOLD:.0%}%)")
+    parser.add_argument('--outlier-factor', type=float, default=DEFAULT_OUTLIER_FACTOR,
+                        help=f"Flag jobs this many times slower than their unit's median "
+                             f"(default: {DEFAULT_OUTLIER_FACTOR:g})")
+    args = parser.parse_args(argv)
+
+    difficulties = DIFFICULTIES if args.difficulty == 'all' else [args.difficulty]
+    # PDFs are only written to memory, but run_batch creates the output folders
+    output_dir = tempfile.mkdtemp(prefix="benchmark_")
+    jobs = discover_jobs(output_dir, difficulties, args.num_problems, True, args.filter, args.seed)
+    if not jobs:
+        print("Nothing to benchmark")
+        return 1
+    workers = min(args.workers, len(jobs))
+    print(f"Benchmarking {len(jobs) // len(difficulties)} generators ({', '.join(difficulties)}) "
+          f"on {workers} workers, timeout {args.timeout:g}s", flush=True)
+
+    def on_result(completed, total, record):
+        stats = record.get('stats', {})
+        if record['status'] == STATUS_OK:
+            line = (f"gen {stats['generate_seconds']:.3f}s render {stats['render_seconds']:.3f}s "
+                    f"{stats['pages']}p {stats['bytes'] / 1024:.0f}KB (fonts {stats['font_bytes'] / 1024:.0f}KB)")
+            if stats.get('peak_rss_mb') is not None:
+                line += f" {stats['peak_rss_mb']:.0f}MB"
+        else:
+            line = record['error']
+        print(f"[{completed}/{total}] {record['status'].upper():7} {record['label']} "
+              f"({record['difficulty']}) {line}", flush=True)
+
+    started = datetime.now()
+    start_time = time.perf_counter()
+    try:
+        records = run_batch(jobs, workers, args.timeout, on_result, job_runner=benchmark_job)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    elapsed = time.perf_counter() - start_time
+
+    baseline = load_baseline(args.baseline)
+    regressions = find_regressions(records, baseline, args.threshold)
+    outliers = find_outliers(records, args.outlier_factor)
+
+    info = {
+        'started': started.isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'num_problems': args.num_problems,
+        'seed': args.seed,
+        'workers': workers,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({**info,
+                   'elapsed_seconds': round(elapsed, 1),
+                   'baseline': args.baseline if baseline else None,
+                   'threshold': args.threshold,
+                   'regressions': regressions,
+                   'outliers': outliers,
+                   'jobs': records}, f, indent=2)
+
+    ok = sum(1 for r in records if r['status'] == STATUS_OK)
+    print(f"\nBenchmarked {ok}/{len(records)} worksheets in {elapsed:.1f}s")
+
+    if outliers:
+        print(f"\nSlow outliers (more than {args.outlier_factor:g}x their unit's median):")
+        for outlier in outliers:
+            print(f"  {outlier['label']} ({outlier['difficulty']}): {outlier['total_seconds']:.3f}s, "
+                  f"{outlier['ratio']:g}x the unit median of {outlier['unit_median']:.3f}s")
+
+    if not baseline:
+        print(f"\nNo baseline at {args.baseline} (create one with --update-baseline)")
+    elif regressions:
+        print(f"\nRegressions against {args.baseline}:")
+        for r in regressions:
+            print(f"  {r['label']} ({r['difficulty']}) {r['stat']}: {r['baseline']} -> {r['current']}")
+    else:
+        print(f"\nNo regressions against {args.baseline}")
+
+    if args.update_baseline:
+        save_baseline(args.baseline, records, **info)
+        print(f"Baseline saved to {args.baseline}")
+    print(f"Results written to {args.output}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Import-time regression benchmark for generator discovery.
+
+Runs a full discovery pass - scanning every generator file into a fresh
+manifest and then importing every generator module through GeneratorRef - and
+reports how long each step took and how much sys.path grew.
+
+Generator modules must not modify sys.path (the generators package sets up the
+import root once), so sys.path should grow by at most one entry. Exits with
+status 1 if it grows by more than --max-path-growth.
+
+Usage:
+    python benchmark_imports.py
+    python benchmark_imports.py --skip-imports --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent
+
+
+def run_benchmark(import_modules=True):
+    """
+    Run one full discovery pass in this process.
+
+    Args:
+        import_modules: Also import every generator module after scanning
+
+    Returns:
+        Dict of timings (seconds) and sys.path / sys.modules counts
+    """
+    # Headless matplotlib so graphing generators can be imported anywhere
+    import matplotlib
+    matplotlib.use('Agg')
+
+    from generator_manifest import GeneratorRef, build_manifest, manifest_entries
+
+    path_before = len(sys.path)
+    modules_before = len(sys.modules)
+
+    start = time.perf_counter()
+    manifest = build_manifest(APP_DIR / "generators")
+    scan_time = time.perf_counter() - start
+
+    entries = manifest_entries(manifest)
+    failed = []
+    import_time = 0.0
+    if import_modules:
+        start = time.perf_counter()
+        for entry in entries:
+            ref = GeneratorRef(entry['module'], entry['class_name'], str(APP_DIR / entry['path']))
+            try:
+                ref.load()
+            except Exception as e:
+                failed.append(f"{entry['module']}: {e}")
+        import_time = time.perf_counter() - start
+
+    return {
+        'generators': len(entries),
+        'scan_seconds': round(scan_time, 3),
+        'import_seconds': round(import_time, 3),
+        'failed_imports': failed,
+        'sys_path_before': path_before,
+        'sys_path_after': len(sys.path),
+        'sys_path_growth': len(sys.path) - path_before,
+        'new_modules': len(sys.modules) - modules_before,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark generator discovery and import cost")
+    parser.add_argument('--skip-imports', action='store_true',
+                        help="Only time the manifest scan, don't import the generator modules")
+    parser.add_argument('--max-path-growth', type=int, default=1,
+                        help="Fail if sys.path grows by more than this many entries (default: 1)")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args()
+
+    # Measure from the same starting point no matter where this is run from
+    os.chdir(APP_DIR)
+    if str(APP_DIR) not in sys.path:
+        sys.path.insert(0, str(APP_DIR))
+
+    results = run_benchmark(import_modules=not args.skip_imports)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"Generators:      {results['generators']}")
+        print(f"Manifest scan:   {results['scan_seconds']:.2f}s")
+        if not args.skip_imports:
+            print(f"Module imports:  {results['import_seconds']:.2f}s "
+                  f"({results['new_modules']} new modules, {len(results['failed_imports'])} failed)")
+        print(f"sys.path:        {results['sys_path_before']} -> {results['sys_path_after']} "
+              f"(+{results['sys_path_growth']})")
+        for failure in results['failed_imports']:
+            print(f"  FAILED {failure}")
+
+    if results['sys_path_growth'] > args.max_path_growth:
+        print(f"ERROR: sys.path grew by {results['sys_path_growth']} entries "
+              f"(limit {args.max_path_growth}) - a generator module is modifying sys.path")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -26,7 +26,16 @@ if errorlevel 1 (
 )
 echo.
 
-echo Step 3: Building executable...
+echo Step 3: Building generator registry and manifest...
+python build_generator_registry.py
+if errorlevel 1 (
+    echo ERROR: Could not build generator registry!
+    pause
+    exit /b 1
+)
+echo.
+
+echo Step 4: Building executable...
 echo This may take several minutes...
 echo.
 
@@ -1,96 +1,40 @@
 """
-Auto-generate generator_registry.py for PyInstaller packaging.
+Auto-generate generator_registry.py and generator_manifest.json for PyInstaller packaging.
 
 This script scans all generator files and creates a registry with explicit imports.
 This is necessary because PyInstaller cannot detect dynamic imports using importlib.
+It also writes the generator manifest the GUI uses to list generators without
+importing them.
 """
 
 from pathlib import Path
 import sys
-import importlib.util
 
+from generator_manifest import MANIFEST_FILE, build_manifest, load_manifest, save_manifest
 
-def discover_all_generators():
+
+def discover_all_generators(manifest=None):
     """
     Scan generators directory and return all generators with their metadata.
+
+    Args:
+        manifest: Manifest from generator_manifest.build_manifest() (scanned if None)
+
     Returns: dict of {subject_path: {topic_name: (module_path, class_name)}}
     """
     generators_by_subject = {}
-    generators_base = Path("generators")
-
-    if not generators_base.exists():
-        print(f"Error: generators directory not found")
-        return generators_by_subject
-
-    # Find K-8 and High_School directories
-    category_dirs = []
-    for category in ['K_8', 'High_School']:
-        category_path = generators_base / category
-        if category_path.exists() and category_path.is_dir():
-            category_dirs.append((category, category_path))
-
-    for category_name, category_path in category_dirs:
-        # Find all subject/grade directories
-        subject_dirs = sorted([d for d in category_path.iterdir() if d.is_dir()])
-
-        for subject_dir in subject_dirs:
-            # Create display name
-            category_display = category_name.replace('_', '-')
-            subject_display = subject_dir.name.replace('_', ' ')
-            full_path = f"{category_display} - {subject_display}"
-
-            generators_by_subject[full_path] = {}
-
-            # Find all generator files (both in root and Unit folders)
-            generator_files = []
-
-            # Check for generators directly in subject folder
-            generator_files.extend([f for f in subject_dir.glob('*_generator.py')
-                                   if f.name != '__init__.py'])
-
-            # Check for generators in Unit subfolders
-            # Support both Unit_ (High School) and Unit01 (K-8) formats
-            unit_dirs = [d for d in subject_dir.iterdir()
-                       if d.is_dir() and (d.name.startswith('Unit_') or d.name.startswith('Unit'))]
-            for unit_dir in unit_dirs:
-                generator_files.extend([f for f in unit_dir.glob('*_generator.py')
-                                      if f.name != '__init__.py'])
-
-            for gen_file in generator_files:
-                try:
-                    # Determine module path
-                    # Check if in a Unit folder (both Unit_ and Unit01 formats)
-                    if gen_file.parent.name.startswith('Unit'):
-                        module_name = f"generators.{category_name}.{subject_dir.name}.{gen_file.parent.name}.{gen_file.stem}"
-                    else:
-                        module_name = f"generators.{category_name}.{subject_dir.name}.{gen_file.stem}"
-
-                    # Load module to find class name
-                    spec = importlib.util.spec_from_file_location(module_name, gen_file)
-                    module = importlib.util.module_from_spec(spec)
-                    sys.modules[module_name] = module
-                    spec.loader.exec_module(module)
-
-                    # Find the generator class
-                    generator_class_name = None
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-                        if (isinstance(attr, type) and
-                            attr_name.endswith('Generator') and
-                            attr_name != 'Generator' and
-                            hasattr(attr, 'generate_worksheet')):
-                            generator_class_name = attr_name
-                            break
-
-                    if generator_class_name:
-                        # Create friendly name
-                        topic_name = gen_file.stem.replace('_generator', '').replace('_', ' ').title()
-                        generators_by_subject[full_path][topic_name] = (module_name, generator_class_name)
-                        print(f"  Found: {full_path} - {topic_name}")
-
-                except Exception as e:
-                    print(f"  Warning: Failed to load {gen_file}: {e}")
-                    continue
+
+    if manifest is None:
+        generators_base = Path("generators")
+        if not generators_base.exists():
+            print(f"Error: generators directory not found")
+            return generators_by_subject
+        manifest = build_manifest(generators_base, verbose=True)
+
+    for entry in manifest['generators']:
+        if entry['class_name']:
+            topics = generators_by_subject.setdefault(entry['class'], {})
+            topics[entry['topic']] = (entry['module'], entry['class_name'])
 
     return generators_by_subject
 
@@ -160,7 +104,14 @@ if __name__ == "__main__":
     print("Scanning generators directory...")
     print()
 
-    generators = discover_all_generators()
+    # Build the manifest used by the GUI for lazy discovery, re-scanning only
+    # generator files that changed since the last build
+    manifest = build_manifest(Path("generators"), load_manifest(MANIFEST_FILE), verbose=True)
+    save_manifest(manifest, MANIFEST_FILE)
+    print(f"\nWrote {MANIFEST_FILE} ({len(manifest['generators'])} files, "
+          f"{manifest['rescanned']} re-scanned)")
+
+    generators = discover_all_generators(manifest)
 
     if not generators:
         print("No generators found!")
@@ -0,0 +1,343 @@
+"""
+Vectorized bulk generation for arithmetic generators.
+
+generate_worksheet() builds problems one at a time (a few random draws, an
+f-string and an Equation each), which is fine for a worksheet but slow for a
+practice bank of tens of thousands of problems. Arithmetic generators also
+offer generate_bulk(difficulty, count), which draws whole operand arrays with
+NumPy, applies constraints as boolean masks, formats the LaTeX for all rows at
+once and returns a ProblemBatch: columns of operands, answers and LaTeX that
+only become Equation objects when a row is accessed.
+
+The NumPy generator is seeded from the generator's own random.Random, so
+seeding.reseed() makes bulk batches reproducible too.
+
+Usage:
+    batch = MultiplyBy2Or4Generator(seed=1).generate_bulk('medium', 50000)
+    batch.answers        # int array
+    batch.latex[:3]      # array of LaTeX strings
+    batch[0]             # Equation, built on access
+    batch.to_equations() # all rows as Equations
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from equation_generator import Equation
+
+# Rounds of drawing before sample_masked gives up on a constraint
+MAX_DRAW_ROUNDS = 100
+
+
+def numpy_rng(rng) -> np.random.Generator:
+    """NumPy generator seeded from a random.Random (advancing it by one draw)."""
+    return np.random.default_rng(rng.getrandbits(64))
+
+
+def join_columns(*parts) -> np.ndarray:
+    """
+    Concatenate strings and arrays element-wise, e.g. join_columns(a, " \\times ", b).
+
+    Returns:
+        Array of str
+    """
+    result = None
+    for part in parts:
+        text = np.asarray(part).astype(str)
+        result = text if result is None else np.char.add(result, text)
+    return result
+
+
+def draw_by_choice(np_rng: np.random.Generator, ranges: Dict[int, Tuple[int, int]],
+                   count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pick a key for each row, then draw a value from that key's (low, high) range.
+
+    Vectorized form of:
+        key = rng.choice(list(ranges)); value = rng.randint(*ranges[key])
+
+    Returns:
+        (keys, values) arrays
+    """
+    keys = np.array(list(ranges))
+    lows = np.array([low for low, _ in ranges.values()])
+    highs = np.array([high for _, high in ranges.values()])
+    picks = np_rng.integers(0, len(keys), count)
+    values = np_rng.integers(lows[picks], highs[picks], endpoint=True)
+    return keys[picks], values
+
+
+def pick(rng, options: Sequence):
+    """
+    rng.choice(options), without a draw when there is only one option.
+
+    Generators keep their problem tables as lists of options per difficulty;
+    a difficulty with a single option never drew one.
+    """
+    return options[0] if len(options) == 1 else rng.choice(options)
+
+
+def number_from_parts(rng, parts: Sequence[Tuple[int, object]]) -> int:
+    """
+    Build a number from (place value, values) parts, drawn in order: a (low, high)
+    range with rng.randint, a list with rng.choice.
+
+    Scalar form of bulk_number_from_parts, so both paths read the same table.
+    """
+    return sum(place * (rng.randint(*values) if isinstance(values, tuple) else rng.choice(values))
+               for place, values in parts)
+
+
+def bulk_number_from_parts(np_rng: np.random.Generator, parts: Sequence[Tuple[int, object]],
+                           count: int) -> np.ndarray:
+    """Vectorized number_from_parts: count numbers built from the same parts."""
+    number = np.zeros(count, dtype=np.int64)
+    for place, values in parts:
+        if isinstance(values, tuple):
+            number += place * np_rng.integers(values[0], values[1], count, endpoint=True)
+        else:
+            number += place * np_rng.choice(values, count)
+    return number
+
+
+def round_half_up(value, place):
+    """Round to the nearest multiple of place, halves up (works on ints and arrays)."""
+    return (value + place // 2) // place * place
+
+
+def with_commas(values) -> np.ndarray:
+    """Integers as strings with thousands separators, like f"{value:,}"."""
+    return np.array([f"{value:,}" for value in np.asarray(values).tolist()], dtype=str)
+
+
+def regroup_columns(first: np.ndarray, second: np.ndarray, subtract: bool,
+                    columns: int = 4) -> np.ndarray:
+    """
+    Which columns carry (addition) or borrow (subtraction), following the column algorithm.
+
+    Returns:
+        Bool array of shape (columns, rows); row 0 is the ones column
+    """
+    regroups = np.zeros((columns, len(first)), dtype=bool)
+    carry = np.zeros(len(first), dtype=np.int64)
+    for col in range(columns):
+        a = first // 10 ** col % 10
+        b = second // 10 ** col % 10
+        if subtract:
+            regroups[col] = a - b - carry < 0
+        else:
+            regroups[col] = a + b + carry >= 10
+        carry = regroups[col].astype(np.int64)
+    return regroups
+
+
+def sample_masked(np_rng: np.random.Generator, count: int,
+                  draw: Callable[[np.random.Generator, int], Tuple[np.ndarray, ...]],
+                  accept: Callable[..., np.ndarray]) -> Tuple[np.ndarray, ...]:
+    """
+    Draw candidate rows in bulk and keep those satisfying a constraint.
+
+    Args:
+        np_rng: NumPy generator
+        count: Rows wanted
+        draw: draw(np_rng, n) -> tuple of n-element arrays (one per operand)
+        accept: accept(*arrays) -> bool mask of rows meeting the constraint
+
+    Returns:
+        Tuple of count-element arrays
+
+    Raises:
+        ValueError: If too few candidates meet the constraint
+    """
+    kept = []
+    have = 0
+    batch = max(count, 64)
+    for _ in range(MAX_DRAW_ROUNDS):
+        if have >= count:
+            break
+        columns = draw(np_rng, batch)
+        mask = accept(*columns)
+        kept.append(tuple(column[mask] for column in columns))
+        have += int(mask.sum())
+        # Aim the next round at what's still missing, given the acceptance rate so far
+        rate = max(mask.mean(), 0.01)
+        batch = max(int((count - have) / rate * 1.2), 64)
+    if have < count:
+        raise ValueError(f"Only {have} of {count} rows met the constraint")
+    return tuple(np.concatenate(parts)[:count] for parts in zip(*kept))
+
+
+def sample_variants(np_rng: np.random.Generator, count: int, variants: Sequence[Tuple]) -> Tuple[np.ndarray, ...]:
+    """
+    Mix several (draw, accept) problem variants, picking one uniformly per row.
+
+    Vectorized form of "choice = rng.randint(1, len(variants))" followed by one
+    branch per variant.
+    """
+    picks = np_rng.integers(0, len(variants), count)
+    result = None
+    for index, (draw, accept) in enumerate(variants):
+        rows = picks == index
+        columns = sample_masked(np_rng, int(rows.sum()), draw, accept)
+        if result is None:
+            result = tuple(np.empty(count, dtype=column.dtype) for column in columns)
+        for target, column in zip(result, columns):
+            target[rows] = column
+    return result
+
+
+def _regrouping_variant(subtract: bool, first: Tuple[int, int], second: Tuple[int, int],
+                        regroup: Dict[int, bool] = None, min_regroups: int = 0,
+                        max_regroups: int = None, result: Tuple[int, Optional[int]] = (0, None)) -> Tuple:
+    """(draw, accept) for sample_masked: operands drawn from their ranges, constraints as masks."""
+    def draw(np_rng, n):
+        return (np_rng.integers(first[0], first[1], n, endpoint=True),
+                np_rng.integers(second[0], second[1], n, endpoint=True))
+
+    def accept(a, b):
+        values = a - b if subtract else a + b
+        regroups = regroup_columns(a, b, subtract, columns=len(str(max(first[1], second[1]))) + 1)
+        mask = values >= result[0]
+        if result[1] is not None:
+            mask &= values <= result[1]
+        for col, required in (regroup or {}).items():
+            mask &= regroups[col] == required
+        counts = regroups.sum(axis=0)
+        mask &= counts >= min_regroups
+        if max_regroups is not None:
+            mask &= counts <= max_regroups
+        return mask
+
+    return draw, accept
+
+
+def bulk_addition(np_rng: np.random.Generator, count: int, variants: Sequence[dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized regrouping_sampler.sample_addition, mixing several kinds of problem.
+
+    Args:
+        np_rng: NumPy generator
+        count: Number of problems
+        variants: sample_addition keyword arguments (addend1, addend2, regroup,
+                  min_regroups, max_regroups, total) for each kind of problem;
+                  each row picks one uniformly
+
+    Returns:
+        (addend1, addend2) arrays
+    """
+    return sample_variants(np_rng, count, [
+        _regrouping_variant(False, v['addend1'], v['addend2'], v.get('regroup'), v.get('min_regroups', 0),
+                            v.get('max_regroups'), v.get('total', (0, None)))
+        for v in variants
+    ])
+
+
+def bulk_subtraction(np_rng: np.random.Generator, count: int, variants: Sequence[dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized regrouping_sampler.sample_subtraction, mixing several kinds of problem.
+
+    Args:
+        np_rng: NumPy generator
+        count: Number of problems
+        variants: sample_subtraction keyword arguments (minuend, subtrahend, regroup,
+                  min_regroups, max_regroups, difference) for each kind of problem;
+                  each row picks one uniformly
+
+    Returns:
+        (minuend, subtrahend) arrays
+    """
+    return sample_variants(np_rng, count, [
+        _regrouping_variant(True, v['minuend'], v['subtrahend'], v.get('regroup'), v.get('min_regroups', 0),
+                            v.get('max_regroups'), v.get('difference', (0, None)))
+        for v in variants
+    ])
+
+
+class ProblemBatch:
+    """
+    Columnar batch of problems; rows become Equation objects on access.
+
+    Attributes:
+        difficulty: Difficulty the problems were generated at
+        latex: Array of LaTeX strings, one per problem
+        answers: Array of answers (numbers)
+        solutions: Array of answer strings as shown in the answer key
+        operands: Dict of operand name -> array
+    """
+
+    def __init__(self, difficulty: str, latex: np.ndarray, answers: np.ndarray,
+                 operands: Optional[Dict[str, np.ndarray]] = None,
+                 solutions: Optional[np.ndarray] = None,
+                 steps: Optional[Callable[..., List[str]]] = None,
+                 equations: Optional[List] = None):
+        """
+        Args:
+            difficulty: Difficulty of the problems
+            latex: LaTeX per problem
+            answers: Answer per problem
+            operands: Operand columns (passed to steps by name)
+            solutions: Answer strings (default: answers as str)
+            steps: steps(**operands_of_row) -> list of steps; default "<latex> = <solution>"
+            equations: Already built problems (for batches wrapped by from_equations)
+        """
+        self.difficulty = difficulty
+        self.latex = latex
+        self.answers = answers
+        self.operands = operands or {}
+        self.solutions = solutions if solutions is not None else np.asarray(answers).astype(str)
+        self._steps = steps
+        self._equations = equations
+
+    @classmethod
+    def from_equations(cls, equations: List, difficulty: str) -> 'ProblemBatch':
+        """Wrap problems generated one by one (e.g. word problems) as a batch."""
+        latex = np.array([getattr(eq, 'latex', str(eq)) for eq in equations], dtype=str)
+        solutions = np.array([getattr(eq, 'solution', '') for eq in equations], dtype=str)
+        return cls(difficulty, latex, solutions, solutions=solutions, equations=list(equations))
+
+    def __len__(self) -> int:
+        return len(self.latex)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ProblemBatch(self.difficulty, self.latex[index], self.answers[index],
+                                {name: values[index] for name, values in self.operands.items()},
+                                self.solutions[index], self._steps,
+                                self._equations[index] if self._equations is not None else None)
+        if self._equations is not None:
+            return self._equations[index]
+
+        latex = str(self.latex[index])
+        solution = str(self.solutions[index])
+        if self._steps is not None:
+            steps = self._steps(**{name: values[index].item() for name, values in self.operands.items()})
+        else:
+            steps = [f"{latex} = {solution}"]
+        return Equation(latex=latex, solution=solution, steps=steps, difficulty=self.difficulty)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_equations(self) -> List[Equation]:
+        """All rows as Equation objects."""
+        return list(self)
+
+
+def multiplication_batch(np_rng: np.random.Generator, number: np.ndarray, multiplier: np.ndarray,
+                         difficulty: str, steps: Optional[Callable[..., List[str]]] = None) -> ProblemBatch:
+    """Batch of "number × multiplier" facts, with the factor order chosen at random per row."""
+    swap = np_rng.random(len(number)) < 0.5
+    latex = np.where(swap, join_columns(number, " \\times ", multiplier),
+                     join_columns(multiplier, " \\times ", number))
+    return ProblemBatch(difficulty, latex, number * multiplier,
+                        {'number': number, 'multiplier': multiplier}, steps=steps)
+
+
+def division_batch(divisor: np.ndarray, quotient: np.ndarray, difficulty: str) -> ProblemBatch:
+    """Batch of "dividend ÷ divisor" facts built from divisor and quotient."""
+    dividend = divisor * quotient
+    latex = join_columns(dividend, " \\div ", divisor)
+    return ProblemBatch(difficulty, latex, quotient,
+                        {'dividend': dividend, 'divisor': divisor, 'quotient': quotient})
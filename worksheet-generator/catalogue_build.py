@@ -0,0 +1,421 @@
+"""
+Incremental, hash-driven rebuild of the published worksheet catalogue.
+
+The PDFs under worksheets/ (at the repository root) are published with the
+site. worksheets/catalogue.json declares how each generated PDF there is
+built - its generator, difficulty, number of problems and seed:
+
+    {
+      "version": 1,
+      "targets": [
+        {"output": "Grade1/place-value/tens-and-ones.pdf",
+         "module": "generators.K_8.Grade_1.Unit06.place_value_tens_and_ones_generator",
+         "class_name": "PlaceValueTensAndOnesGenerator",
+         "difficulty": "easy", "num_problems": 10, "seed": 1,
+         "title": "Tens and Ones"}
+      ]
+    }
+
+A target's inputs are its generator's source file, every module of this app
+that the generator or the PDF renderer imports (pdf_generator.py,
+worksheet_config.py, layout_strategies.py, ... - found by scanning import
+statements), and the fonts and icons drawn on every page.
+worksheets/catalogue.lock.json records, per target, the hash of each input,
+of the target's declaration (plus the library versions and graph render
+mode) and of the PDF written. A build regenerates only the targets whose
+declaration, inputs or PDF changed since the lock was written, runs them in
+parallel worker processes (batch_generate_worksheets.run_batch) and updates
+the lock. Seeded targets give byte-identical PDFs, so a rebuild only changes
+the files whose content really changed. Rebuilt PDFs are then optimized
+(pdf_optimizer, if pikepdf is installed). Published PDFs the catalogue
+doesn't declare are left alone.
+
+Usage:
+    python catalogue_build.py                 # rebuild what changed
+    python catalogue_build.py --dry-run       # list what would be rebuilt, and why
+    python catalogue_build.py --force --workers 4
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+APP_DIR = Path(__file__).resolve().parent
+ROOT_DIR = APP_DIR.parent
+
+CATALOGUE_FILE = ROOT_DIR / "worksheets" / "catalogue.json"
+LOCK_FILE = ROOT_DIR / "worksheets" / "catalogue.lock.json"
+
+# Bump when the catalogue or lock format changes
+CATALOGUE_VERSION = 1
+
+# Modules every worksheet is drawn with, besides the generator's own imports
+RENDERER_MODULES = ['pdf_generator', 'worksheet_config', 'parallel_generation']
+
+# Fonts and icons drawn on every page (relative to the repository root)
+ASSET_FILES = [
+    'Lexend/static/Lexend-Regular.ttf',
+    'Lexend/static/Lexend-Bold.ttf',
+    'Poppins/Poppins-Regular.ttf',
+    'Poppins/Poppins-Bold.ttf',
+    'src/icons/freshmath_qr.png',
+    'src/icons/FreshMath_V3/Black/FreshMath_Black_Secondary.png',
+]
+
+# Libraries whose version changes the PDFs
+LIBRARIES = ['matplotlib', 'reportlab', 'numpy', 'PIL', 'pikepdf']
+
+
+@dataclass
+class Target:
+    """One published PDF and how it is generated."""
+    output: str  # PDF path, relative to the catalogue's folder
+    module: str  # Generator module, e.g. "generators.K_8.Grade_1.Unit06.place_value_tens_and_ones_generator"
+    class_name: str  # Generator class in that module
+    difficulty: str
+    num_problems: int
+    seed: int
+    title: str = ''  # Worksheet title (defaults to the output file name)
+    include_answer_key: bool = True
+
+    @property
+    def display_title(self) -> str:
+        return self.title or Path(self.output).stem.replace('-', ' ').replace('_', ' ').title()
+
+
+def load_catalogue(catalogue_path=CATALOGUE_FILE) -> List[Target]:
+    """
+    Read the targets declared in a catalogue file.
+
+    Args:
+        catalogue_path: Catalogue JSON file
+
+    Returns:
+        List of Target, in catalogue order
+
+    Raises:
+        ValueError: If the file is from another version, a target is missing a
+                    field or two targets write the same PDF
+    """
+    with open(catalogue_path, 'r', encoding='utf-8') as f:
+        catalogue = json.load(f)
+    if catalogue.get('version') != CATALOGUE_VERSION:
+        raise ValueError(f"{catalogue_path}: expected catalogue version {CATALOGUE_VERSION}")
+
+    targets = []
+    outputs = set()
+    for index, entry in enumerate(catalogue.get('targets', [])):
+        try:
+            target = Target(**entry)
+        except TypeError as e:
+            raise ValueError(f"{catalogue_path}: target {index + 1}: {e}") from None
+        if target.output in outputs:
+            raise ValueError(f"{catalogue_path}: {target.output} is declared twice")
+        outputs.add(target.output)
+        targets.append(target)
+    return targets
+
+
+def load_lock(lock_path=LOCK_FILE) -> dict:
+    """The lock file's contents, or an empty lock if it is missing, unreadable or from another version."""
+    try:
+        with open(lock_path, 'r', encoding='utf-8') as f:
+            lock = json.load(f)
+    except (OSError, ValueError):
+        lock = None
+    if not lock or lock.get('version') != CATALOGUE_VERSION:
+        return {'version': CATALOGUE_VERSION, 'targets': {}}
+    return lock
+
+
+def save_lock(lock: dict, lock_path=LOCK_FILE):
+    """Write the lock file atomically."""
+    lock_path = Path(lock_path)
+    fd, tmp_path = tempfile.mkstemp(dir=lock_path.parent, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(lock, f, indent=1, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, lock_path)
+
+
+def _module_file(module_name: str) -> Optional[Path]:
+    """Source file of one of this app's modules (None for other modules)."""
+    base = APP_DIR.joinpath(*module_name.split('.'))
+    for candidate in (base.with_suffix('.py'), base / '__init__.py'):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _imported_modules(path: Path) -> Set[str]:
+    """Names of the modules a source file imports (anywhere in the file), made absolute."""
+    parts = list(path.relative_to(APP_DIR).with_suffix('').parts)
+    package = parts[:-1]
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except SyntaxError:
+        return set()
+
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package[:len(package) - node.level + 1]
+                module = '.'.join(base + ([node.module] if node.module else []))
+            else:
+                module = node.module
+            if not module:
+                continue
+            names.add(module)
+            # "from package import submodule"
+            names.update(f"{module}.{alias.name}" for alias in node.names)
+    return names
+
+
+class InputScanner:
+    """Finds and hashes a target's input files, caching both for the run."""
+
+    def __init__(self):
+        self._hashes = {}  # Path -> sha256
+        self._dependencies = {}  # Path -> set of Paths
+
+    def file_hash(self, path: Path) -> str:
+        """sha256 of a file ('missing' if it doesn't exist)."""
+        digest = self._hashes.get(path)
+        if digest is None:
+            try:
+                digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            except OSError:
+                digest = 'missing'
+            self._hashes[path] = digest
+        return digest
+
+    def dependencies(self, path: Path) -> Set[Path]:
+        """A module's file and the files of every app module it imports, directly or not."""
+        found = self._dependencies.get(path)
+        if found is not None:
+            return found
+        found = set()
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            if current in found:
+                continue
+            found.add(current)
+            for name in _imported_modules(current):
+                # Importing a.b.c also runs a/__init__.py and a/b/__init__.py
+                pieces = name.split('.')
+                for i in range(1, len(pieces) + 1):
+                    module_file = _module_file('.'.join(pieces[:i]))
+                    if module_file is not None and module_file not in found:
+                        stack.append(module_file)
+        self._dependencies[path] = found
+        return found
+
+    def target_inputs(self, target: Target) -> Dict[str, str]:
+        """
+        Hashes of everything a target's PDF is built from.
+
+        Returns:
+            Input path (relative to the repository root) -> sha256
+        """
+        files = set()
+        generator_file = _module_file(target.module)
+        if generator_file is None:
+            raise ValueError(f"{target.output}: generator module {target.module} not found")
+        files |= self.dependencies(generator_file)
+        for module in RENDERER_MODULES:
+            files |= self.dependencies(_module_file(module))
+        inputs = {path.relative_to(ROOT_DIR).as_posix(): self.file_hash(path) for path in files}
+        for asset in ASSET_FILES:
+            inputs[asset] = self.file_hash(ROOT_DIR / asset)
+        return dict(sorted(inputs.items()))
+
+
+def _environment(optimize: bool = False) -> dict:
+    """Library versions, graph render mode and optimization, which change the PDFs without changing any input file."""
+    from importlib import import_module
+    from pdf_optimizer import is_available
+    from vector_graphics import get_graph_render_mode
+    versions = {}
+    for name in LIBRARIES:
+        try:
+            versions[name] = getattr(import_module(name), '__version__', '?')
+        except ImportError:
+            versions[name] = None
+    return {'python': '.'.join(map(str, sys.version_info[:2])), 'graph_mode': get_graph_render_mode(),
+            'optimized': optimize and is_available(), 'libraries': versions}
+
+
+def declaration_hash(target: Target, environment: dict) -> str:
+    """Hash of a target's declaration and the build environment."""
+    key = json.dumps({'target': asdict(target), 'environment': environment}, sort_keys=True)
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def plan_build(targets: List[Target], lock: dict, output_dir: Path, scanner: InputScanner,
+               force: bool = False, optimize: bool = False) -> List[dict]:
+    """
+    Work out which targets are out of date.
+
+    Args:
+        targets: Targets from load_catalogue()
+        lock: Lock from load_lock()
+        output_dir: Folder the targets' output paths are relative to
+        scanner: InputScanner for this run
+        force: Rebuild every target
+        optimize: Whether the build optimizes the PDFs it writes
+
+    Returns:
+        One dict per target: target, declaration (hash), inputs (hashes) and
+        reasons (why it must be rebuilt; empty if it is up to date)
+    """
+    environment = _environment(optimize)
+    plan = []
+    for target in targets:
+        declaration = declaration_hash(target, environment)
+        inputs = scanner.target_inputs(target)
+        locked = lock['targets'].get(target.output)
+        output_path = output_dir / target.output
+
+        reasons = []
+        if force:
+            reasons.append("forced")
+        if locked is None:
+            reasons.append("not built yet")
+        else:
+            if locked.get('declaration') != declaration:
+                reasons.append("declaration or environment changed")
+            changed = sorted(path for path in set(inputs) | set(locked.get('inputs', {}))
+                             if inputs.get(path) != locked.get('inputs', {}).get(path))
+            if changed:
+                shown = ', '.join(changed[:3]) + (f" (+{len(changed) - 3} more)" if len(changed) > 3 else "")
+                reasons.append(f"inputs changed: {shown}")
+        if not output_path.is_file():
+            reasons.append("PDF missing")
+        elif locked is not None and scanner.file_hash(output_path) != locked.get('output'):
+            reasons.append("PDF modified since it was built")
+        plan.append({'target': target, 'declaration': declaration, 'inputs': inputs, 'reasons': reasons})
+    return plan
+
+
+def build(catalogue_path=CATALOGUE_FILE, lock_path=LOCK_FILE, workers: Optional[int] = None,
+          timeout: float = 0, force: bool = False, dry_run: bool = False,
+          optimize: bool = True) -> List[dict]:
+    """
+    Rebuild the out-of-date targets of a catalogue and update its lock file.
+
+    Args:
+        catalogue_path: Catalogue JSON file (target outputs are relative to its folder)
+        lock_path: Lock file
+        workers: Worker processes (defaults to one per CPU, minus one)
+        timeout: Seconds a single target may take (0 for no limit)
+        force: Rebuild every target
+        dry_run: Only print what would be rebuilt
+        optimize: Optimize the rebuilt PDFs (see pdf_optimizer)
+
+    Returns:
+        run_batch() records of the targets that were rebuilt
+    """
+    from batch_generate_worksheets import STATUS_OK, run_batch
+    from parallel_generation import GenerationJob
+
+    output_dir = Path(catalogue_path).resolve().parent
+    targets = load_catalogue(catalogue_path)
+    lock = load_lock(lock_path)
+    scanner = InputScanner()
+    plan = [item for item in plan_build(targets, lock, output_dir, scanner, force, optimize) if item['reasons']]
+
+    print(f"{len(plan)} of {len(targets)} targets out of date", flush=True)
+    for item in plan:
+        print(f"  {item['target'].output}: {'; '.join(item['reasons'])}", flush=True)
+    if dry_run or not plan:
+        return []
+
+    jobs = [GenerationJob(
+        module_name=item['target'].module,
+        class_name=item['target'].class_name,
+        difficulty=item['target'].difficulty,
+        num_problems=item['target'].num_problems,
+        output_path=str(output_dir / item['target'].output),
+        title=item['target'].display_title,
+        include_answer_key=item['target'].include_answer_key,
+        label=item['target'].output,
+        path=str(_module_file(item['target'].module)),
+        seed=item['target'].seed,
+    ) for item in plan]
+
+    def on_result(completed, total, record):
+        line = f"[{completed}/{total}] {record['status'].upper():7} {record['label']} {record['seconds']:.2f}s"
+        if record['error']:
+            line += f" - {record['error']}"
+        print(line, flush=True)
+
+    records = run_batch(jobs, workers, timeout, on_result)
+
+    built = [output_dir / item['target'].output for item, record in zip(plan, records)
+             if record['status'] == STATUS_OK]
+    if optimize and built:
+        from pdf_optimizer import PDFOptimizer, format_results, is_available
+        if not is_available():
+            print("Note: pikepdf is not installed (pip install pikepdf); PDFs will not be optimized")
+        print(format_results(PDFOptimizer().optimize_files(built)), flush=True)
+
+    # Record what each rebuilt PDF was built from; drop targets no longer declared
+    declared = {target.output for target in targets}
+    lock['targets'] = {output: entry for output, entry in lock['targets'].items() if output in declared}
+    for item, record in zip(plan, records):
+        if record['status'] == STATUS_OK:
+            output_path = output_dir / item['target'].output
+            lock['targets'][item['target'].output] = {
+                'declaration': item['declaration'],
+                'inputs': item['inputs'],
+                'output': hashlib.sha256(output_path.read_bytes()).hexdigest(),
+            }
+        else:
+            # Rebuild it next time, whatever its old lock entry says
+            lock['targets'].pop(item['target'].output, None)
+    save_lock(lock, lock_path)
+    return records
+
+
+def main(argv=None):
+    from batch_generate_worksheets import STATUS_OK
+
+    parser = argparse.ArgumentParser(description="Rebuild the published worksheet PDFs whose inputs changed")
+    parser.add_argument('--catalogue', default=str(CATALOGUE_FILE),
+                        help="Catalogue file (default: worksheets/catalogue.json)")
+    parser.add_argument('--lock', default=None,
+                        help="Lock file (default: catalogue.lock.json next to the catalogue)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes (default: number of CPUs minus one)")
+    parser.add_argument('--timeout', type=float, default=0,
+                        help="Seconds before a target is given up on (default: 0 = no limit)")
+    parser.add_argument('--force', action='store_true', help="Rebuild every target")
+    parser.add_argument('--dry-run', action='store_true', help="Only list the targets that would be rebuilt")
+    parser.add_argument('--no-optimize', action='store_true', help="Don't optimize the rebuilt PDFs")
+    args = parser.parse_args(argv)
+
+    lock_path = args.lock or str(Path(args.catalogue).with_name("catalogue.lock.json"))
+    start_time = time.perf_counter()
+    records = build(args.catalogue, lock_path, args.workers, args.timeout, args.force, args.dry_run,
+                    not args.no_optimize)
+    if records:
+        ok = sum(1 for r in records if r['status'] == STATUS_OK)
+        print(f"\nRebuilt {ok}/{len(records)} targets in {time.perf_counter() - start_time:.1f}s")
+        return 0 if ok == len(records) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -27,8 +27,7 @@ class LinearEquationGenerator:
         Args:
             seed: Random seed for reproducibility (optional)
         """
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_equation(self, difficulty: str) -> Equation:
         """
@@ -66,15 +65,15 @@ class LinearEquationGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate one-step equations: x + a = b or ax = b"""
-        problem_type = random.choice(['addition', 'multiplication'])
+        problem_type = self.rng.choice(['addition', 'multiplication'])
 
         if problem_type == 'addition':
             # x + a = b or x - a = b
-            a = random.randint(1, 20)
-            x = random.randint(1, 30)
+            a = self.rng.randint(1, 20)
+            x = self.rng.randint(1, 30)
             b = x + a
 
-            if random.choice([True, False]):
+            if self.rng.choice([True, False]):
                 # x + a = b
                 latex = f"x + {a} = {b}"
                 steps = [f"x = {b} - {a}", f"x = {x}"]
@@ -86,8 +85,8 @@ class LinearEquationGenerator:
 
         else:  # multiplication
             # ax = b
-            a = random.randint(2, 12)
-            x = random.randint(1, 20)
+            a = self.rng.randint(2, 12)
+            x = self.rng.randint(1, 20)
             b = a * x
             latex = f"{a}x = {b}"
             steps = [f"x = {b} \\div {a}", f"x = {x}"]
@@ -96,9 +95,9 @@ class LinearEquationGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate two-step equations: ax + b = c"""
-        a = random.randint(2, 10)
-        b = random.randint(-15, 15)
-        x = random.randint(-10, 20)
+        a = self.rng.randint(2, 10)
+        b = self.rng.randint(-15, 15)
+        x = self.rng.randint(-10, 20)
         c = a * x + b
 
         # Format with proper signs
@@ -117,10 +116,10 @@ class LinearEquationGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate multi-step equations with parentheses: a(x + b) + c = d"""
-        a = random.randint(2, 8)
-        b = random.randint(-10, 10)
-        c = random.randint(-15, 15)
-        x = random.randint(-10, 15)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(-10, 10)
+        c = self.rng.randint(-15, 15)
+        x = self.rng.randint(-10, 15)
         d = a * (x + b) + c
 
         # Format with proper signs
@@ -140,13 +139,13 @@ class LinearEquationGenerator:
     def _generate_challenge(self) -> Equation:
         """Generate equations with variables on both sides: ax + b = cx + d"""
         # Ensure a != c to have a valid equation
-        a = random.randint(2, 10)
-        c = random.randint(1, 10)
+        a = self.rng.randint(2, 10)
+        c = self.rng.randint(1, 10)
         while c == a:
-            c = random.randint(1, 10)
+            c = self.rng.randint(1, 10)
 
-        b = random.randint(-15, 15)
-        d = random.randint(-15, 15)
+        b = self.rng.randint(-15, 15)
+        d = self.rng.randint(-15, 15)
 
         # Calculate x
         x = (d - b) / (a - c)
@@ -154,7 +153,7 @@ class LinearEquationGenerator:
         # Only generate equations with integer solutions
         if x != int(x):
             # Adjust d to ensure integer solution
-            x = random.randint(-10, 20)
+            x = self.rng.randint(-10, 20)
             d = a * x + b - c * x
         else:
             x = int(x)
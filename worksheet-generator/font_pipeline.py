@@ -0,0 +1,146 @@
+"""
+TrueType font embedding for worksheet PDFs.
+
+ReportLab embeds a subset of each TrueType font a document uses, but by
+default every subset starts with all of printable ASCII (rl_config's
+ttfAsciiReadable) whether the document uses it or not - a title in
+Poppins-Bold carries 96 glyphs for the dozen letters it needs. Fonts loaded
+here embed only the characters each document draws.
+
+Fonts are parsed once per process and shared by every PDFWorksheetGenerator
+(and vector graph) that registers them, and the subset font programs are
+cached, so documents drawing the same characters - every worksheet of a
+class-wide run has the same header - reuse the bytes built for the first one
+instead of rebuilding the subset.
+
+After a canvas is saved, document_font_usage() reports what each font
+embedded in it.
+
+Usage:
+    register_font('Lexend', 'Lexend/static/Lexend-Regular.ttf')
+    c = canvas.Canvas(output)
+    ...
+    c.save()
+    for usage in document_font_usage(c):
+        print(usage.font, usage.glyphs, usage.bytes)
+"""
+
+import os
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont, TTFontFace
+
+# Subset font programs kept per font, for reuse by later documents
+SUBSET_CACHE_SIZE = 64
+
+# Font path -> SubsetTTFont, for every font loaded in this process
+_loaded_fonts = {}
+
+# Canvas document -> [FontUsage, ...], filled in as the document is saved
+_document_usage = weakref.WeakKeyDictionary()
+
+
+@dataclass
+class FontUsage:
+    """What one font embedded in one document."""
+    font: str  # ReportLab font name
+    subsets: int  # Embedded subsets (each holds up to 256 characters)
+    glyphs: int  # Characters embedded, over all subsets
+    bytes: int  # Size of the embedded font programs (before stream compression)
+    reused: int  # Subsets whose font program was built for an earlier document
+
+
+class SubsetTTFont(TTFont):
+    """
+    TTFont that embeds only the characters a document draws and reuses
+    subset font programs across documents.
+    """
+
+    def __init__(self, name: str, filename: str):
+        super().__init__(name, filename, asciiReadable=False)
+        self._subsets = OrderedDict()  # tuple of character codes -> font program
+        self._usage = None  # FontUsage of the document being saved
+        # Route the face's subsetting through the cache (the face is only used by this font)
+        self.face.makeSubset = self._make_subset
+
+    def _make_subset(self, subset) -> bytes:
+        key = tuple(subset)
+        data = self._subsets.get(key)
+        if data is None:
+            data = self._subsets[key] = TTFontFace.makeSubset(self.face, subset)
+            if len(self._subsets) > SUBSET_CACHE_SIZE:
+                self._subsets.popitem(last=False)
+        else:
+            self._subsets.move_to_end(key)
+            if self._usage is not None:
+                self._usage.reused += 1
+        if self._usage is not None:
+            self._usage.subsets += 1
+            self._usage.glyphs += len(set(key))
+            self._usage.bytes += len(data)
+        return data
+
+    def addObjects(self, doc):
+        """Add the font's subsets to a document being saved, recording their sizes."""
+        self._usage = FontUsage(self.fontName, 0, 0, 0, 0)
+        try:
+            super().addObjects(doc)
+        finally:
+            _document_usage.setdefault(doc, []).append(self._usage)
+            self._usage = None
+
+
+def load_font(name: str, path: str) -> SubsetTTFont:
+    """
+    The process's SubsetTTFont for a font file, parsing it on first use.
+
+    Args:
+        name: ReportLab font name to register the font under
+        path: TrueType (.ttf) file
+
+    Returns:
+        The registered font
+    """
+    key = os.path.abspath(path)
+    font = _loaded_fonts.get(key)
+    if font is None or font.fontName != name:
+        font = _loaded_fonts[key] = SubsetTTFont(name, key)
+    if pdfmetrics._fonts.get(name) is not font:
+        pdfmetrics.registerFont(font)
+    return font
+
+
+def loaded_font_name(path: str) -> Optional[str]:
+    """
+    ReportLab name of a font file already loaded with load_font().
+
+    Args:
+        path: TrueType (.ttf) file
+
+    Returns:
+        The name it is registered under, or None if it hasn't been loaded
+    """
+    font = _loaded_fonts.get(os.path.abspath(path))
+    return font.fontName if font is not None else None
+
+
+def document_font_usage(canvas) -> List[FontUsage]:
+    """
+    What each TrueType font embedded in a saved document.
+
+    Args:
+        canvas: ReportLab canvas, after save()
+
+    Returns:
+        One FontUsage per font loaded with load_font() that the document used
+    """
+    return list(_document_usage.get(canvas._doc, []))
+
+
+def font_bytes(canvas) -> int:
+    """Total size of the font programs embedded in a saved document."""
+    return sum(usage.bytes for usage in document_font_usage(canvas))
@@ -0,0 +1,440 @@
+"""
+Generator manifest for fast, lazy generator discovery.
+
+Finding the generator class in each of the ~1,000 generator files used to mean
+executing every module at GUI startup. The manifest records, for every
+generator file, where it lives in the Class -> Unit -> Topic tree, its module
+path and generator class name, plus the file's mtime, size and hash.
+
+At startup the GUI only reads the manifest and stats the generator files.
+Files whose mtime/size changed are hashed, and only files whose contents
+actually changed are re-scanned. Scanning parses the source with ast and only
+falls back to importing the module when the class can't be determined
+statically. Generator modules themselves are imported on first use through
+GeneratorRef.
+
+The manifest is written by build_generator_registry.py (and refreshed by the
+GUI in development mode).
+"""
+
+import ast
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+MANIFEST_FILE = "generator_manifest.json"
+
+# Bump when the entry format or class-resolution rules change
+MANIFEST_VERSION = 1
+
+CATEGORIES = ['K_8', 'High_School']
+
+
+class GeneratorRef:
+    """
+    Lazy stand-in for a generator class.
+
+    Calling it (like calling the class) imports the generator module on first
+    use and returns a new generator instance.
+    """
+
+    def __init__(self, module_name: str, class_name: str, path: Optional[str] = None):
+        """
+        Args:
+            module_name: Dotted module path, e.g. "generators.K_8.Grade_3.Unit03.foo_generator"
+            class_name: Name of the generator class in that module
+            path: Source file, used if the module can't be imported by name
+        """
+        self.module_name = module_name
+        self.class_name = class_name
+        self.path = path
+        self.__name__ = class_name
+        self._class = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """
+        Import the generator module (once) and return the generator class.
+
+        Returns:
+            The generator class
+        """
+        if self._class is None:
+            with self._lock:
+                if self._class is None:
+                    module = _import_generator_module(self.module_name, self.path)
+                    self._class = getattr(module, self.class_name)
+        return self._class
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the generator module has been imported yet."""
+        return self._class is not None
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self):
+        return f"GeneratorRef({self.module_name}.{self.class_name})"
+
+
+def _import_generator_module(module_name: str, path: Optional[str] = None):
+    """Import a generator module by name, falling back to loading it from its file."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        if not path:
+            raise
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def unit_display_name(unit_dir_name: Optional[str]) -> str:
+    """
+    Display name for a unit folder: Unit_1 (High School) and Unit01 (K-8) both become "Unit 1".
+
+    Args:
+        unit_dir_name: Unit folder name, or None for generators directly in a subject folder
+
+    Returns:
+        Display name like "Unit 1", or "No Unit"
+    """
+    if not unit_dir_name:
+        return "No Unit"
+    if unit_dir_name.startswith('Unit_'):
+        unit_num = unit_dir_name.replace('Unit_', '')
+    else:
+        # Remove 'Unit' prefix and strip leading zeros
+        unit_num = unit_dir_name.replace('Unit', '').lstrip('0') or '0'
+    return f"Unit {unit_num}"
+
+
+def topic_display_name(gen_file: Path) -> str:
+    """Display name for a generator file, e.g. adding_fractions_generator.py -> "Adding Fractions"."""
+    return gen_file.stem.replace('_generator', '').replace('_', ' ').title()
+
+
+def iter_generator_files(generators_base: Path):
+    """
+    Yield (category, subject, unit, file) for every generator file.
+
+    Uses the same layout rules as the GUI: *_generator.py files directly in a
+    subject folder (unit is None) or in its Unit_N / UnitNN subfolders.
+
+    Args:
+        generators_base: The generators/ directory
+    """
+    for category_name in CATEGORIES:
+        category_path = generators_base / category_name
+        if not category_path.is_dir():
+            continue
+
+        subject_dirs = sorted(d for d in category_path.iterdir()
+                              if d.is_dir() and d.name != '__pycache__')
+        for subject_dir in subject_dirs:
+            for gen_file in sorted(subject_dir.glob('*_generator.py')):
+                yield category_name, subject_dir.name, None, gen_file
+
+            unit_dirs = sorted(d for d in subject_dir.iterdir()
+                               if d.is_dir() and d.name != '__pycache__' and d.name.startswith('Unit'))
+            for unit_dir in unit_dirs:
+                for gen_file in sorted(unit_dir.glob('*_generator.py')):
+                    yield category_name, subject_dir.name, unit_dir.name, gen_file
+
+
+def _module_statements(body):
+    """Yield top-level statements, descending into module-level if/try/with blocks."""
+    for node in body:
+        yield node
+        if isinstance(node, (ast.If, ast.Try, ast.With)):
+            for field in ('body', 'orelse', 'finalbody'):
+                yield from _module_statements(getattr(node, field, []))
+            for handler in getattr(node, 'handlers', []):
+                yield from _module_statements(handler.body)
+
+
+def _class_defines(node: ast.ClassDef, attr: str) -> bool:
+    """Whether a class body directly defines attr (as a method or assignment)."""
+    for item in node.body:
+        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) and item.name == attr:
+            return True
+        if isinstance(item, ast.Assign):
+            if any(isinstance(t, ast.Name) and t.id == attr for t in item.targets):
+                return True
+    return False
+
+
+def find_generator_class_static(source: str):
+    """
+    Find the generator class name from source code without executing it.
+
+    Mirrors the runtime rule: the alphabetically first module attribute whose
+    name ends in "Generator" and which is a class with generate_worksheet.
+
+    Args:
+        source: Python source of a generator module
+
+    Returns:
+        The class name, '' if the module has no generator class, or None if
+        it can't be decided statically (imported names, inherited methods...)
+    """
+    tree = ast.parse(source)
+
+    # name -> True (generator), False (not one), None (unknown)
+    candidates = {}
+    for node in _module_statements(tree.body):
+        if isinstance(node, ast.ClassDef):
+            if _class_defines(node, 'generate_worksheet'):
+                candidates[node.name] = True
+            elif any(not (isinstance(b, ast.Name) and b.id == 'object') for b in node.bases):
+                candidates[node.name] = None  # might inherit generate_worksheet
+            else:
+                candidates[node.name] = False
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                if alias.name == '*':
+                    return None
+                name = alias.asname or alias.name.split('.')[0]
+                candidates[name] = None
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    candidates[target.id] = None
+
+    for name in sorted(candidates):
+        if not name.endswith('Generator') or name == 'Generator':
+            continue
+        if candidates[name] is None:
+            return None
+        if candidates[name]:
+            return name
+    return ''
+
+
+def find_generator_class_by_import(gen_file: Path, module_name: str) -> str:
+    """
+    Find the generator class name by executing the module (slow path).
+
+    Args:
+        gen_file: Generator source file
+        module_name: Dotted module path to register the module under
+
+    Returns:
+        The class name, or '' if there is none
+    """
+    spec = importlib.util.spec_from_file_location(module_name, gen_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+
+    for attr_name in dir(module):
+        attr = getattr(module, attr_name)
+        if (isinstance(attr, type) and
+            attr_name.endswith('Generator') and
+            attr_name != 'Generator' and
+            hasattr(attr, 'generate_worksheet')):
+            return attr_name
+    return ''
+
+
+def scan_generator_file(gen_file: Path, category_name: str, subject_name: str,
+                        unit_name: Optional[str], app_dir: Path, data: bytes = None) -> Optional[dict]:
+    """
+    Build the manifest entry for one generator file.
+
+    Args:
+        gen_file: Generator source file
+        category_name: 'K_8' or 'High_School'
+        subject_name: Subject/grade folder name
+        unit_name: Unit folder name, or None
+        app_dir: Directory containing generators/ (paths are stored relative to it)
+        data: File contents, if already read
+
+    Returns:
+        Manifest entry dict (class_name is '' when the file has no generator),
+        or None if the file could not be scanned
+    """
+    parts = ['generators', category_name, subject_name] + ([unit_name] if unit_name else [])
+    module_name = '.'.join(parts + [gen_file.stem])
+
+    try:
+        stat = gen_file.stat()
+        if data is None:
+            data = gen_file.read_bytes()
+        class_name = None
+        try:
+            class_name = find_generator_class_static(data.decode('utf-8'))
+        except (SyntaxError, UnicodeDecodeError, ValueError):
+            pass
+        if class_name is None:
+            class_name = find_generator_class_by_import(gen_file, module_name)
+    except Exception as e:
+        print(f"Warning: Failed to load {gen_file}: {e}")
+        return None
+
+    return {
+        'class': f"{category_name.replace('_', '-')} - {subject_name.replace('_', ' ')}",
+        'unit': unit_display_name(unit_name),
+        'topic': topic_display_name(gen_file),
+        'module': module_name,
+        'class_name': class_name,
+        'path': gen_file.relative_to(app_dir).as_posix(),
+        'mtime': stat.st_mtime,
+        'size': stat.st_size,
+        'sha256': hashlib.sha256(data).hexdigest(),
+    }
+
+
+def build_manifest(generators_base: Path, previous: Optional[dict] = None, verbose: bool = False) -> dict:
+    """
+    Build the manifest, reusing entries from a previous manifest where possible.
+
+    An entry is reused when the file's mtime and size are unchanged, or when
+    its contents hash the same (e.g. after a fresh checkout). Only changed or
+    new files are scanned.
+
+    Args:
+        generators_base: The generators/ directory
+        previous: Previously saved manifest (or None for a full scan)
+        verbose: Print each generator found
+
+    Returns:
+        Manifest dict with 'version', 'generators' and 'rescanned' (number of
+        files that had to be scanned)
+    """
+    generators_base = Path(generators_base)
+    app_dir = generators_base.parent
+
+    old_entries = {}
+    if previous and previous.get('version') == MANIFEST_VERSION:
+        old_entries = {e['path']: e for e in previous.get('generators', [])}
+
+    entries = []
+    rescanned = 0
+    for category_name, subject_name, unit_name, gen_file in iter_generator_files(generators_base):
+        rel_path = gen_file.relative_to(app_dir).as_posix()
+        old = old_entries.get(rel_path)
+        entry = None
+        data = None
+
+        if old is not None:
+            try:
+                stat = gen_file.stat()
+                if stat.st_mtime == old['mtime'] and stat.st_size == old['size']:
+                    entry = old
+                else:
+                    data = gen_file.read_bytes()
+                    if hashlib.sha256(data).hexdigest() == old['sha256']:
+                        entry = dict(old, mtime=stat.st_mtime, size=stat.st_size)
+            except OSError:
+                pass
+
+        if entry is None:
+            entry = scan_generator_file(gen_file, category_name, subject_name, unit_name, app_dir, data)
+            rescanned += 1
+            if entry is None:
+                continue
+            if verbose and entry['class_name']:
+                print(f"  Found: {entry['class']} - {entry['topic']}")
+
+        entries.append(entry)
+
+    return {'version': MANIFEST_VERSION, 'generators': entries, 'rescanned': rescanned}
+
+
+def load_manifest(manifest_path) -> Optional[dict]:
+    """
+    Load a saved manifest.
+
+    Args:
+        manifest_path: Path to the manifest JSON file
+
+    Returns:
+        Manifest dict, or None if missing, unreadable or from another version
+    """
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('version') != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def save_manifest(manifest: dict, manifest_path):
+    """
+    Write the manifest atomically (best effort: failures only print a warning).
+
+    Args:
+        manifest: Manifest dict from build_manifest()
+        manifest_path: Destination JSON file
+    """
+    data = {'version': manifest['version'], 'generators': manifest['generators']}
+    manifest_path = Path(manifest_path)
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=manifest_path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1)
+        os.replace(tmp_path, manifest_path)
+    except OSError as e:
+        print(f"Warning: Could not save generator manifest: {e}")
+
+
+def refresh_manifest(generators_base, manifest_path) -> dict:
+    """
+    Load the manifest, re-scan changed generator files and save it if anything changed.
+
+    Args:
+        generators_base: The generators/ directory
+        manifest_path: Manifest JSON file
+
+    Returns:
+        Up-to-date manifest dict
+    """
+    previous = load_manifest(manifest_path)
+    manifest = build_manifest(generators_base, previous)
+
+    previous_entries = previous.get('generators') if previous else None
+    if previous_entries != manifest['generators']:
+        save_manifest(manifest, manifest_path)
+    return manifest
+
+
+def organize_manifest(manifest: dict, path_base: Optional[Path] = None) -> Dict[str, Dict[str, dict]]:
+    """
+    Arrange manifest entries into the GUI's Class -> Unit -> Topic structure.
+
+    Args:
+        manifest: Manifest dict
+        path_base: Directory the entry paths are relative to (for file fallback imports)
+
+    Returns:
+        dict: {class_name: {unit_name: {topic_name: GeneratorRef}}}
+    """
+    organized = {}
+    for entry in manifest.get('generators', []):
+        units = organized.setdefault(entry['class'], {})
+        topics = units.setdefault(entry['unit'], {})
+        if not entry['class_name']:
+            continue
+        path = str(path_base / entry['path']) if path_base else None
+        topics[entry['topic']] = GeneratorRef(entry['module'], entry['class_name'], path)
+    return organized
+
+
+def manifest_entries(manifest: dict) -> List[dict]:
+    """Return the manifest entries that have a generator class."""
+    return [e for e in manifest.get('generators', []) if e['class_name']]
@@ -3,14 +3,11 @@ Language of Variation and Variables Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class LanguageVariationVariablesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
         self.scenarios = [
             ("Students in a class", ["age", "grade level", "favorite subject", "hours studied per week", "GPA"]),
@@ -30,8 +27,8 @@ class LanguageVariationVariablesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        subject, variables = random.choice(self.scenarios)
-        var = random.choice(variables)
+        subject, variables = self.rng.choice(self.scenarios)
+        var = self.rng.choice(variables)
 
         question = f"\\text{{Identify whether ''{var}'' for {subject} is categorical or quantitative.}}"
 
@@ -44,8 +41,8 @@ class LanguageVariationVariablesGenerator:
         return Equation(latex=question, solution=solution, steps=[], difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        subject, variables = random.choice(self.scenarios)
-        var = random.choice(variables)
+        subject, variables = self.rng.choice(self.scenarios)
+        var = self.rng.choice(variables)
 
         question = f"\\text{{For the variable ''{var}'' measured on {subject}, classify it as:}}\\\\"\
                    f"\\text{{(a) Categorical or Quantitative}}\\\\"\
@@ -65,8 +62,8 @@ class LanguageVariationVariablesGenerator:
         return Equation(latex=question, solution=solution, steps=[], difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        subject, variables = random.choice(self.scenarios)
-        selected_vars = random.sample(variables, 3)
+        subject, variables = self.rng.choice(self.scenarios)
+        selected_vars = self.rng.sample(variables, 3)
 
         question = f"\\text{{For {subject}, classify each variable:}}\\\\"\
                    f"\\text{{1. {selected_vars[0]}}}\\\\"\
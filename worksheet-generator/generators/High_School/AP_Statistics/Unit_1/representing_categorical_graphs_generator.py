@@ -3,14 +3,11 @@ Representing Categorical Data with Graphs Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class RepresentingCategoricalGraphsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class RepresentingCategoricalGraphsGenerator:
 
     def _generate_easy(self) -> Equation:
         categories = ["Red", "Blue", "Green", "Yellow"]
-        counts = [random.randint(10, 40) for _ in range(4)]
+        counts = [self.rng.randint(10, 40) for _ in range(4)]
         total = sum(counts)
 
         question = f"\\text{{Survey results for favorite color:}}\\\\"\
@@ -37,7 +34,7 @@ class RepresentingCategoricalGraphsGenerator:
 
     def _generate_medium(self) -> Equation:
         categories = ["A", "B", "C", "D", "E"]
-        counts = sorted([random.randint(15, 50) for _ in range(5)], reverse=True)
+        counts = sorted([self.rng.randint(15, 50) for _ in range(5)], reverse=True)
         total = sum(counts)
 
         question = f"\\text{{Grade distribution: A:{counts[0]}, B:{counts[1]}, C:{counts[2]}, D:{counts[3]}, E:{counts[4]}}}\\\\"\
@@ -51,7 +48,7 @@ class RepresentingCategoricalGraphsGenerator:
 
     def _generate_hard(self) -> Equation:
         sports = ["Soccer", "Basketball", "Baseball", "Tennis"]
-        counts = [random.randint(20, 60) for _ in range(4)]
+        counts = [self.rng.randint(20, 60) for _ in range(4)]
         total = sum(counts)
 
         question = f"\\text{{Preferred sport survey (n={total}):}}\\\\"\
@@ -70,7 +67,7 @@ class RepresentingCategoricalGraphsGenerator:
     def _generate_challenge(self) -> Equation:
         categories = ["Category A", "Category B", "Category C", "Category D"]
         percentages = [25, 35, 20, 20]
-        total = random.randint(200, 400)
+        total = self.rng.randint(200, 400)
 
         question = f"\\text{{A pie chart shows: A(25\\%), B(35\\%), C(20\\%), D(20\\%). Total n={total}.}}\\\\"\
                    f"\\text{{(a) How many individuals are in Category B?}}\\\\"\
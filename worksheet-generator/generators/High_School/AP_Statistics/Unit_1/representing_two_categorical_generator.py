@@ -3,14 +3,11 @@ Representing Two Categorical Variables Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class RepresentingTwoCategoricalGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,10 +19,10 @@ class RepresentingTwoCategoricalGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        male_yes = random.randint(30, 50)
-        male_no = random.randint(20, 40)
-        female_yes = random.randint(35, 55)
-        female_no = random.randint(15, 35)
+        male_yes = self.rng.randint(30, 50)
+        male_no = self.rng.randint(20, 40)
+        female_yes = self.rng.randint(35, 55)
+        female_no = self.rng.randint(15, 35)
 
         question = f"\\text{{Two-way table: Support for proposal by gender}}\\\\"\
                    f"\\begin{{array}}{{|c|c|c|}} \\hline"\
@@ -41,10 +38,10 @@ class RepresentingTwoCategoricalGenerator:
         return Equation(latex=question, solution=solution, steps=[], difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        freshman_yes = random.randint(25, 45)
-        freshman_no = random.randint(15, 30)
-        sophomore_yes = random.randint(30, 50)
-        sophomore_no = random.randint(20, 35)
+        freshman_yes = self.rng.randint(25, 45)
+        freshman_no = self.rng.randint(15, 30)
+        sophomore_yes = self.rng.randint(30, 50)
+        sophomore_no = self.rng.randint(20, 35)
 
         total = freshman_yes + freshman_no + sophomore_yes + sophomore_no
 
@@ -65,10 +62,10 @@ class RepresentingTwoCategoricalGenerator:
         return Equation(latex=question, solution=solution, steps=[], difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        urban_dem = random.randint(60, 90)
-        urban_rep = random.randint(30, 50)
-        rural_dem = random.randint(40, 60)
-        rural_rep = random.randint(50, 80)
+        urban_dem = self.rng.randint(60, 90)
+        urban_rep = self.rng.randint(30, 50)
+        rural_dem = self.rng.randint(40, 60)
+        rural_rep = self.rng.randint(50, 80)
 
         question = f"\\text{{Political affiliation by location:}}\\\\"\
                    f"\\begin{{array}}{{|c|c|c|}} \\hline"\
@@ -95,10 +92,10 @@ class RepresentingTwoCategoricalGenerator:
         return Equation(latex=question, solution=solution, steps=[], difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        treatment_success = random.randint(70, 90)
-        treatment_fail = random.randint(20, 40)
-        control_success = random.randint(40, 60)
-        control_fail = random.randint(50, 70)
+        treatment_success = self.rng.randint(70, 90)
+        treatment_fail = self.rng.randint(20, 40)
+        control_success = self.rng.randint(40, 60)
+        control_fail = self.rng.randint(50, 70)
 
         question = f"\\text{{Medical study results:}}\\\\"\
                    f"\\begin{{array}}{{|c|c|c|}} \\hline"\
@@ -3,14 +3,11 @@ Statistics in Two Categorical Variables - Association Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class StatisticsTwoCategoricalAssociationGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,10 +20,10 @@ class StatisticsTwoCategoricalAssociationGenerator:
 
     def _generate_easy(self) -> Equation:
         # Create data with clear association
-        group1_yes = random.randint(70, 90)
-        group1_no = random.randint(10, 30)
-        group2_yes = random.randint(20, 40)
-        group2_no = random.randint(60, 80)
+        group1_yes = self.rng.randint(70, 90)
+        group1_no = self.rng.randint(10, 30)
+        group2_yes = self.rng.randint(20, 40)
+        group2_no = self.rng.randint(60, 80)
 
         question = f"\\text{{Segmented bar chart shows two groups:}}\\\\"\
                    f"\\text{{Group A: Yes={group1_yes}, No={group1_no}}}\\\\"\
@@ -44,10 +41,10 @@ class StatisticsTwoCategoricalAssociationGenerator:
 
     def _generate_medium(self) -> Equation:
         # Create data with moderate association
-        online_satisfied = random.randint(80, 100)
-        online_unsatisfied = random.randint(40, 60)
-        store_satisfied = random.randint(50, 70)
-        store_unsatisfied = random.randint(70, 90)
+        online_satisfied = self.rng.randint(80, 100)
+        online_unsatisfied = self.rng.randint(40, 60)
+        store_satisfied = self.rng.randint(50, 70)
+        store_unsatisfied = self.rng.randint(70, 90)
 
         question = f"\\text{{Customer satisfaction by purchase method:}}\\\\"\
                    f"\\begin{{array}}{{|c|c|c|}} \\hline"\
@@ -73,12 +70,12 @@ class StatisticsTwoCategoricalAssociationGenerator:
 
     def _generate_hard(self) -> Equation:
         # Three-way comparison
-        cat1_a = random.randint(40, 60)
-        cat1_b = random.randint(30, 50)
-        cat2_a = random.randint(50, 70)
-        cat2_b = random.randint(25, 45)
-        cat3_a = random.randint(35, 55)
-        cat3_b = random.randint(40, 60)
+        cat1_a = self.rng.randint(40, 60)
+        cat1_b = self.rng.randint(30, 50)
+        cat2_a = self.rng.randint(50, 70)
+        cat2_b = self.rng.randint(25, 45)
+        cat3_a = self.rng.randint(35, 55)
+        cat3_b = self.rng.randint(40, 60)
 
         question = f"\\text{{Three categories vs. two outcomes:}}\\\\"\
                    f"\\begin{{array}}{{|c|c|c|}} \\hline"\
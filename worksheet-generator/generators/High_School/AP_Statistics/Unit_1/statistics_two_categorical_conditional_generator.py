@@ -3,14 +3,11 @@ Statistics in Two Categorical Variables - Conditional Distribution Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class StatisticsTwoCategoricalConditionalGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,10 +19,10 @@ class StatisticsTwoCategoricalConditionalGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        male_sport = random.randint(40, 60)
-        male_music = random.randint(20, 35)
-        female_sport = random.randint(25, 40)
-        female_music = random.randint(35, 55)
+        male_sport = self.rng.randint(40, 60)
+        male_music = self.rng.randint(20, 35)
+        female_sport = self.rng.randint(25, 40)
+        female_music = self.rng.randint(35, 55)
 
         question = f"\\text{{Extracurricular preference by gender:}}\\\\"\
                    f"\\begin{{array}}{{|c|c|c|}} \\hline"\
@@ -43,12 +40,12 @@ class StatisticsTwoCategoricalConditionalGenerator:
         return Equation(latex=question, solution=solution, steps=[], difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        fresh_bus = random.randint(30, 50)
-        fresh_walk = random.randint(20, 35)
-        fresh_car = random.randint(10, 25)
-        senior_bus = random.randint(15, 30)
-        senior_walk = random.randint(25, 40)
-        senior_car = random.randint(40, 60)
+        fresh_bus = self.rng.randint(30, 50)
+        fresh_walk = self.rng.randint(20, 35)
+        fresh_car = self.rng.randint(10, 25)
+        senior_bus = self.rng.randint(15, 30)
+        senior_walk = self.rng.randint(25, 40)
+        senior_car = self.rng.randint(40, 60)
 
         question = f"\\text{{Transportation method by grade level:}}\\\\"\
                    f"\\begin{{array}}{{|c|c|c|c|}} \\hline"\
@@ -76,12 +73,12 @@ class StatisticsTwoCategoricalConditionalGenerator:
         return Equation(latex=question, solution=solution, steps=[], difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        treat_mild = random.randint(20, 35)
-        treat_moderate = random.randint(40, 60)
-        treat_severe = random.randint(10, 25)
-        placebo_mild = random.randint(15, 30)
-        placebo_moderate = random.randint(30, 50)
-        placebo_severe = random.randint(25, 45)
+        treat_mild = self.rng.randint(20, 35)
+        treat_moderate = self.rng.randint(40, 60)
+        treat_severe = self.rng.randint(10, 25)
+        placebo_mild = self.rng.randint(15, 30)
+        placebo_moderate = self.rng.randint(30, 50)
+        placebo_severe = self.rng.randint(25, 45)
 
         question = f"\\text{{Symptom severity by treatment:}}\\\\"\
                    f"\\begin{{array}}{{|c|c|c|c|}} \\hline"\
@@ -3,14 +3,11 @@ Carrying Out Test Proportion Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class CarryingOutTestProportionGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -3,14 +3,11 @@ Comparing Distributions of Quantitative Data Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ComparingDistributionsQuantitativeGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -39,8 +36,8 @@ class ComparingDistributionsQuantitativeGenerator:
 
     def _generate_medium(self) -> Equation:
         # Two datasets with different spreads
-        data_1 = sorted([random.randint(40, 60) for _ in range(10)])
-        data_2 = sorted([random.randint(45, 55) for _ in range(10)])
+        data_1 = sorted([self.rng.randint(40, 60) for _ in range(10)])
+        data_2 = sorted([self.rng.randint(45, 55) for _ in range(10)])
 
         question = f"\\text{{Class 1: {', '.join(map(str, data_1))}}}\\\\"\
                    f"\\text{{Class 2: {', '.join(map(str, data_2))}}}\\\\"\
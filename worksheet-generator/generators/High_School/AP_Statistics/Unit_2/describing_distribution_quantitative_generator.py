@@ -3,14 +3,11 @@ Describing Distribution of Quantitative Data Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class DescribingDistributionQuantitativeGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -42,8 +39,8 @@ class DescribingDistributionQuantitativeGenerator:
 
     def _generate_medium(self) -> Equation:
         # Dataset with outlier
-        base = [random.randint(20, 30) for _ in range(8)]
-        outlier = random.randint(55, 70)
+        base = [self.rng.randint(20, 30) for _ in range(8)]
+        outlier = self.rng.randint(55, 70)
         data = sorted(base + [outlier])
 
         question = f"\\text{{Ages: {', '.join(map(str, data))}}}\\\\"\
@@ -3,14 +3,11 @@ Representing Quantitative Data with Dot Plots Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class RepresentingQuantitativeDotPlotsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class RepresentingQuantitativeDotPlotsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Small dataset
-        data = sorted([random.randint(1, 10) for _ in range(8)])
+        data = sorted([self.rng.randint(1, 10) for _ in range(8)])
 
         question = f"\\text{{Test scores: {', '.join(map(str, data))}}}\\\\"\
                    f"\\text{{(a) What is the minimum value?}}\\\\"\
@@ -36,8 +33,8 @@ class RepresentingQuantitativeDotPlotsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Dataset with mode
-        base = [random.randint(10, 20) for _ in range(6)]
-        mode_val = random.randint(15, 18)
+        base = [self.rng.randint(10, 20) for _ in range(6)]
+        mode_val = self.rng.randint(15, 18)
         data = sorted(base + [mode_val, mode_val, mode_val])
 
         question = f"\\text{{Number of hours studied: {', '.join(map(str, data))}}}\\\\"\
@@ -64,8 +61,8 @@ class RepresentingQuantitativeDotPlotsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Two datasets to compare
-        data1 = sorted([random.randint(50, 70) for _ in range(10)])
-        data2 = sorted([random.randint(60, 90) for _ in range(10)])
+        data1 = sorted([self.rng.randint(50, 70) for _ in range(10)])
+        data2 = sorted([self.rng.randint(60, 90) for _ in range(10)])
 
         question = f"\\text{{Class A scores: {', '.join(map(str, data1))}}}\\\\"\
                    f"\\text{{Class B scores: {', '.join(map(str, data2))}}}\\\\"\
@@ -89,8 +86,8 @@ class RepresentingQuantitativeDotPlotsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Gap in data
-        lower_group = [random.randint(10, 20) for _ in range(6)]
-        upper_group = [random.randint(35, 45) for _ in range(4)]
+        lower_group = [self.rng.randint(10, 20) for _ in range(6)]
+        upper_group = [self.rng.randint(35, 45) for _ in range(4)]
         data = sorted(lower_group + upper_group)
 
         question = f"\\text{{Data values: {', '.join(map(str, data))}}}\\\\"\
@@ -3,14 +3,11 @@ Representing Quantitative Data with Histograms and Stem Plots Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class RepresentingQuantitativeHistogramsStemGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -24,7 +21,7 @@ class RepresentingQuantitativeHistogramsStemGenerator:
     def _generate_easy(self) -> Equation:
         # Histogram bin counts
         bins = ["0-10", "10-20", "20-30", "30-40"]
-        counts = [random.randint(5, 15) for _ in range(4)]
+        counts = [self.rng.randint(5, 15) for _ in range(4)]
 
         question = f"\\text{{Histogram bins and frequencies:}}\\\\"\
                    f"\\text{{{bins[0]}: {counts[0]}, {bins[1]}: {counts[1]}, {bins[2]}: {counts[2]}, {bins[3]}: {counts[3]}}}\\\\"\
@@ -41,9 +38,9 @@ class RepresentingQuantitativeHistogramsStemGenerator:
 
     def _generate_medium(self) -> Equation:
         # Stem plot data
-        stems_20s = [random.randint(0, 9) for _ in range(3)]
-        stems_30s = [random.randint(0, 9) for _ in range(5)]
-        stems_40s = [random.randint(0, 9) for _ in range(2)]
+        stems_20s = [self.rng.randint(0, 9) for _ in range(3)]
+        stems_30s = [self.rng.randint(0, 9) for _ in range(5)]
+        stems_40s = [self.rng.randint(0, 9) for _ in range(2)]
 
         question = f"\\text{{Stem-and-leaf plot:}}\\\\"\
                    f"\\text{{2 | {' '.join(map(str, sorted(stems_20s)))}}}\\\\"\
@@ -3,14 +3,11 @@ Measuring Center of Quantitative Data Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class MeasuringCenterQuantitativeGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class MeasuringCenterQuantitativeGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        data = [random.randint(10, 50) for _ in range(7)]
+        data = [self.rng.randint(10, 50) for _ in range(7)]
 
         question = f"\\text{{Data: {', '.join(map(str, data))}}}\\\\"\
                    f"\\text{{Find the mean.}}"
@@ -34,7 +31,7 @@ class MeasuringCenterQuantitativeGenerator:
         return Equation(latex=question, solution=solution, steps=[], difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        data = sorted([random.randint(15, 45) for _ in range(9)])
+        data = sorted([self.rng.randint(15, 45) for _ in range(9)])
 
         question = f"\\text{{Data: {', '.join(map(str, data))}}}\\\\"\
                    f"\\text{{(a) Find the median}}\\\\"\
@@ -48,7 +45,7 @@ class MeasuringCenterQuantitativeGenerator:
         return Equation(latex=question, solution=solution, steps=[], difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        data = sorted([random.randint(20, 40) for _ in range(10)])
+        data = sorted([self.rng.randint(20, 40) for _ in range(10)])
 
         question = f"\\text{{Data: {', '.join(map(str, data))}}}\\\\"\
                    f"\\text{{(a) Calculate mean and median}}\\\\"\
@@ -3,14 +3,11 @@ More on Mean and Median Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class MoreMeanMedianGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class MoreMeanMedianGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        data = sorted([random.randint(10, 30) for _ in range(5)])
-        outlier = random.randint(70, 90)
+        data = sorted([self.rng.randint(10, 30) for _ in range(5)])
+        outlier = self.rng.randint(70, 90)
         data_with_outlier = sorted(data + [outlier])
 
         question = f"\\text{{Data without outlier: {', '.join(map(str, data))}}}\\\\"\
@@ -44,8 +41,8 @@ class MoreMeanMedianGenerator:
 
     def _generate_medium(self) -> Equation:
         n = 6
-        data = [random.randint(20, 40) for _ in range(n-1)]
-        target_mean = random.randint(30, 35)
+        data = [self.rng.randint(20, 40) for _ in range(n-1)]
+        target_mean = self.rng.randint(30, 35)
 
         question = f"\\text{{Data: {', '.join(map(str, data))}, x}}\\\\"\
                    f"\\text{{If the mean is {target_mean}, find x.}}"
@@ -58,7 +55,7 @@ class MoreMeanMedianGenerator:
         return Equation(latex=question, solution=solution, steps=[], difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        data = sorted([random.randint(25, 45) for _ in range(8)])
+        data = sorted([self.rng.randint(25, 45) for _ in range(8)])
 
         question = f"\\text{{Data: {', '.join(map(str, data))}}}\\\\"\
                    f"\\text{{(a) Find mean and median}}\\\\"\
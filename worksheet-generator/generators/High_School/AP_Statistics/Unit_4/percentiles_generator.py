@@ -3,14 +3,11 @@ Percentiles Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class PercentilesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class PercentilesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        score = random.randint(70, 90)
-        percentile = random.randint(60, 85)
+        score = self.rng.randint(70, 90)
+        percentile = self.rng.randint(60, 85)
         question = f"\\text{{A score of {score} is at the {percentile}th percentile.}}\\\\"\
                    f"\\text{{What does this mean?}}"
         solution = f"{percentile}% of scores are below {score}"
@@ -39,7 +36,7 @@ class PercentilesGenerator:
         return Equation(latex=question, solution=solution, steps=[], difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        data = sorted([random.randint(60, 100) for _ in range(20)])
+        data = sorted([self.rng.randint(60, 100) for _ in range(20)])
         percentile = 80
         position = int(len(data) * percentile / 100)
         value = data[position-1] if position > 0 else data[0]
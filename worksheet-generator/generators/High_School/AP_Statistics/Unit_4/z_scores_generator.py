@@ -3,14 +3,11 @@ Z-Scores Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ZScoresGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class ZScoresGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        mean = random.randint(70, 90)
-        std = random.randint(5, 15)
-        x = mean + random.randint(-2, 2) * std
+        mean = self.rng.randint(70, 90)
+        std = self.rng.randint(5, 15)
+        x = mean + self.rng.randint(-2, 2) * std
         z = round((x - mean) / std, 2)
         question = f"\\text{{Mean}} = {mean}, \\text{{SD}} = {std}, x = {x}. \\text{{ Find the z-score.}}"
         solution = f"z = {z}"
@@ -36,7 +33,7 @@ class ZScoresGenerator:
         return Equation(latex=question, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        score = random.randint(90, 130)
+        score = self.rng.randint(90, 130)
         mean = 100
         std = 15
         z = round((score - mean) / std, 2)
@@ -50,8 +47,8 @@ class ZScoresGenerator:
         return Equation(latex=question, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        sat_score = random.randint(480, 600)
-        act_score = random.randint(20, 32)
+        sat_score = self.rng.randint(480, 600)
+        act_score = self.rng.randint(20, 32)
         question = f"\\text{{SAT}} = {sat_score} \\text{{ (mean=500, SD=100)}}, \\text{{ACT}} = {act_score} \\text{{ (mean=21, SD=5)}}. \\text{{ Which is relatively better?}}"
         z_sat = round((sat_score - 500) / 100, 2)
         z_act = round((act_score - 21) / 5, 2)
@@ -65,7 +62,7 @@ class ZScoresGenerator:
         return Equation(latex=question, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        data = [random.randint(10, 30) for _ in range(5)]
+        data = [self.rng.randint(10, 30) for _ in range(5)]
         data.sort()
         mean = sum(data) / len(data)
         variance = sum((x - mean) ** 2 for x in data) / len(data)
@@ -3,14 +3,11 @@ Estimating Probabilities Simulation Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class EstimatingProbabilitiesSimulationGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -21,21 +18,40 @@ class EstimatingProbabilitiesSimulationGenerator:
         elif difficulty == 'hard': return self._generate_hard()
         else: return self._generate_challenge()
 
+    def problem_space(self, difficulty: str) -> List[tuple]:
+        """Every (trials, successes) pair for the difficulty, or the one question for conceptual ones."""
+        if difficulty == 'easy':
+            return [(n, k) for n in (50, 100, 200, 500) for k in range(n * 2 // 5, n * 3 // 5 + 1)]
+        elif difficulty == 'hard':
+            return [(n, k) for n in (60, 120, 300, 600) for k in range(n // 10, n // 4 + 1)]
+        elif difficulty == 'medium':
+            return [("Why simulation?", "Approximate when calculation difficult")]
+        else:
+            return [("More trials does what?", "Increases accuracy")]
+
+    def problem_for(self, difficulty: str, params: tuple) -> Equation:
+        """The problem for one entry of problem_space()."""
+        if difficulty == 'easy':
+            n, k = params
+            question = f"{n} flips, {k} heads. Estimate P(H)"; solution = f"{round(k / n, 3):g}"
+        elif difficulty == 'hard':
+            n, k = params
+            question = f"{n} rolls, {k} sixes. Estimate P(6)"; solution = f"{round(k / n, 3):g}"
+        else:
+            question, solution = params
+        return Equation(latex=question, solution=solution, steps=[], difficulty=difficulty)
+
     def _generate_easy(self) -> Equation:
-        question = "100 flips, 58 heads. Estimate P(H)"; solution = "0.58"
-        return Equation(latex=question, solution=solution, steps=[], difficulty='easy')
+        return self.problem_for('easy', self.rng.choice(self.problem_space('easy')))
 
     def _generate_medium(self) -> Equation:
-        question = "Why simulation?"; solution = "Approximate when calculation difficult"
-        return Equation(latex=question, solution=solution, steps=[], difficulty='medium')
+        return self.problem_for('medium', self.problem_space('medium')[0])
 
     def _generate_hard(self) -> Equation:
-        question = "600 rolls, 105 sixes. Estimate P(6)"; solution = "0.175"
-        return Equation(latex=question, solution=solution, steps=[], difficulty='hard')
+        return self.problem_for('hard', self.rng.choice(self.problem_space('hard')))
 
     def _generate_challenge(self) -> Equation:
-        question = "More trials does what?"; solution = "Increases accuracy"
-        return Equation(latex=question, solution=solution, steps=[], difficulty='challenge')
+        return self.problem_for('challenge', self.problem_space('challenge')[0])
 
 def main():
     gen = EstimatingProbabilitiesSimulationGenerator()
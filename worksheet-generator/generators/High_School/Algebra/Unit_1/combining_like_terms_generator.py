@@ -5,9 +5,6 @@ Generates problems focused on simplifying expressions by combining like terms
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class CombiningLikeTermsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the combining like terms generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -69,11 +65,11 @@ class CombiningLikeTermsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy combining like terms problems (same variable)."""
-        var = random.choice(['x', 'y', 'n'])
+        var = self.rng.choice(['x', 'y', 'n'])
 
         # Two like terms: 3x + 5x
-        coef1 = random.randint(1, 9)
-        coef2 = random.randint(1, 9)
+        coef1 = self.rng.randint(1, 9)
+        coef2 = self.rng.randint(1, 9)
 
         latex = f"{coef1}{var} + {coef2}{var}"
         total = coef1 + coef2
@@ -83,15 +79,15 @@ class CombiningLikeTermsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium combining like terms problems (multiple terms, one variable)."""
-        var = random.choice(['x', 'y', 'a', 'n'])
+        var = self.rng.choice(['x', 'y', 'a', 'n'])
 
-        problem_type = random.choice(['three_terms', 'with_constant', 'subtraction'])
+        problem_type = self.rng.choice(['three_terms', 'with_constant', 'subtraction'])
 
         if problem_type == 'three_terms':
             # 2x + 5x + 3x
-            coef1 = random.randint(1, 7)
-            coef2 = random.randint(1, 7)
-            coef3 = random.randint(1, 7)
+            coef1 = self.rng.randint(1, 7)
+            coef2 = self.rng.randint(1, 7)
+            coef3 = self.rng.randint(1, 7)
 
             latex = f"{coef1}{var} + {coef2}{var} + {coef3}{var}"
             total = coef1 + coef2 + coef3
@@ -99,9 +95,9 @@ class CombiningLikeTermsGenerator:
 
         elif problem_type == 'with_constant':
             # 3x + 5 + 2x
-            coef1 = random.randint(1, 8)
-            const = random.randint(1, 12)
-            coef2 = random.randint(1, 8)
+            coef1 = self.rng.randint(1, 8)
+            const = self.rng.randint(1, 12)
+            coef2 = self.rng.randint(1, 8)
 
             latex = f"{coef1}{var} + {const} + {coef2}{var}"
             total_coef = coef1 + coef2
@@ -109,8 +105,8 @@ class CombiningLikeTermsGenerator:
 
         else:  # subtraction
             # 7x - 3x
-            coef1 = random.randint(5, 12)
-            coef2 = random.randint(1, coef1 - 1)
+            coef1 = self.rng.randint(5, 12)
+            coef2 = self.rng.randint(1, coef1 - 1)
 
             latex = f"{coef1}{var} - {coef2}{var}"
             total = coef1 - coef2
@@ -120,14 +116,14 @@ class CombiningLikeTermsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard combining like terms problems (multiple variables)."""
-        problem_type = random.choice(['two_vars', 'mixed_ops', 'three_vars'])
+        problem_type = self.rng.choice(['two_vars', 'mixed_ops', 'three_vars'])
 
         if problem_type == 'two_vars':
             # 3x + 2y + 5x + 4y
-            x_coef1 = random.randint(1, 7)
-            y_coef1 = random.randint(1, 7)
-            x_coef2 = random.randint(1, 7)
-            y_coef2 = random.randint(1, 7)
+            x_coef1 = self.rng.randint(1, 7)
+            y_coef1 = self.rng.randint(1, 7)
+            x_coef2 = self.rng.randint(1, 7)
+            y_coef2 = self.rng.randint(1, 7)
 
             latex = f"{x_coef1}x + {y_coef1}y + {x_coef2}x + {y_coef2}y"
             x_total = x_coef1 + x_coef2
@@ -136,11 +132,11 @@ class CombiningLikeTermsGenerator:
 
         elif problem_type == 'mixed_ops':
             # 5x - 2x + 3 + 4x - 1
-            x_coef1 = random.randint(4, 9)
-            x_coef2 = random.randint(1, x_coef1 - 1)
-            const1 = random.randint(2, 8)
-            x_coef3 = random.randint(1, 6)
-            const2 = random.randint(1, const1)
+            x_coef1 = self.rng.randint(4, 9)
+            x_coef2 = self.rng.randint(1, x_coef1 - 1)
+            const1 = self.rng.randint(2, 8)
+            x_coef3 = self.rng.randint(1, 6)
+            const2 = self.rng.randint(1, const1)
 
             latex = f"{x_coef1}x - {x_coef2}x + {const1} + {x_coef3}x - {const2}"
             x_total = x_coef1 - x_coef2 + x_coef3
@@ -149,11 +145,11 @@ class CombiningLikeTermsGenerator:
 
         else:  # three_vars
             # 2x + 3y + 4z + 5x + 2y
-            x_coef1 = random.randint(1, 5)
-            y_coef1 = random.randint(1, 5)
-            z_coef = random.randint(1, 5)
-            x_coef2 = random.randint(1, 5)
-            y_coef2 = random.randint(1, 5)
+            x_coef1 = self.rng.randint(1, 5)
+            y_coef1 = self.rng.randint(1, 5)
+            z_coef = self.rng.randint(1, 5)
+            x_coef2 = self.rng.randint(1, 5)
+            y_coef2 = self.rng.randint(1, 5)
 
             latex = f"{x_coef1}x + {y_coef1}y + {z_coef}z + {x_coef2}x + {y_coef2}y"
             x_total = x_coef1 + x_coef2
@@ -164,18 +160,18 @@ class CombiningLikeTermsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge combining like terms problems (more terms, negative coefficients, multi-variable)."""
-        problem_type = random.choice(['many_terms', 'negative_heavy', 'four_vars', 'complex_mixed'])
+        problem_type = self.rng.choice(['many_terms', 'negative_heavy', 'four_vars', 'complex_mixed'])
 
         if problem_type == 'many_terms':
             # Five or more terms with two variables
-            var = random.choice(['x', 'y', 'a'])
-            coef1 = random.randint(2, 8)
-            coef2 = random.randint(-6, -1)
-            coef3 = random.randint(1, 7)
-            coef4 = random.randint(-5, -1)
-            coef5 = random.randint(1, 6)
-            const1 = random.randint(3, 12)
-            const2 = random.randint(-8, -1)
+            var = self.rng.choice(['x', 'y', 'a'])
+            coef1 = self.rng.randint(2, 8)
+            coef2 = self.rng.randint(-6, -1)
+            coef3 = self.rng.randint(1, 7)
+            coef4 = self.rng.randint(-5, -1)
+            coef5 = self.rng.randint(1, 6)
+            const1 = self.rng.randint(3, 12)
+            const2 = self.rng.randint(-8, -1)
 
             terms = []
             total_coef = 0
@@ -193,11 +189,11 @@ class CombiningLikeTermsGenerator:
 
         elif problem_type == 'negative_heavy':
             # Multiple negative coefficients
-            var = random.choice(['x', 'y', 'n'])
-            coef1 = random.randint(-8, -3)
-            coef2 = random.randint(2, 9)
-            coef3 = random.randint(-7, -2)
-            coef4 = random.randint(3, 8)
+            var = self.rng.choice(['x', 'y', 'n'])
+            coef1 = self.rng.randint(-8, -3)
+            coef2 = self.rng.randint(2, 9)
+            coef3 = self.rng.randint(-7, -2)
+            coef4 = self.rng.randint(3, 8)
 
             term1 = self._format_term(coef1, var, True)
             term2 = self._format_term(coef2, var, False)
@@ -210,13 +206,13 @@ class CombiningLikeTermsGenerator:
 
         elif problem_type == 'four_vars':
             # Four different variables
-            x_coef1 = random.randint(2, 7)
-            y_coef1 = random.randint(2, 6)
-            z_coef1 = random.randint(1, 5)
-            w_coef1 = random.randint(1, 5)
-            x_coef2 = random.randint(-5, -1)
-            y_coef2 = random.randint(1, 6)
-            z_coef2 = random.randint(-4, -1)
+            x_coef1 = self.rng.randint(2, 7)
+            y_coef1 = self.rng.randint(2, 6)
+            z_coef1 = self.rng.randint(1, 5)
+            w_coef1 = self.rng.randint(1, 5)
+            x_coef2 = self.rng.randint(-5, -1)
+            y_coef2 = self.rng.randint(1, 6)
+            z_coef2 = self.rng.randint(-4, -1)
 
             latex = f"{x_coef1}x + {y_coef1}y + {z_coef1}z + {w_coef1}w - {abs(x_coef2)}x + {y_coef2}y - {abs(z_coef2)}z"
             x_total = x_coef1 + x_coef2
@@ -226,14 +222,14 @@ class CombiningLikeTermsGenerator:
 
         else:  # complex_mixed
             # Three variables with constants and negative coefficients
-            x_coef1 = random.randint(3, 9)
-            y_coef1 = random.randint(-6, -2)
-            const1 = random.randint(5, 15)
-            x_coef2 = random.randint(-7, -2)
-            z_coef1 = random.randint(2, 8)
-            y_coef2 = random.randint(3, 8)
-            const2 = random.randint(-10, -3)
-            x_coef3 = random.randint(1, 6)
+            x_coef1 = self.rng.randint(3, 9)
+            y_coef1 = self.rng.randint(-6, -2)
+            const1 = self.rng.randint(5, 15)
+            x_coef2 = self.rng.randint(-7, -2)
+            z_coef1 = self.rng.randint(2, 8)
+            y_coef2 = self.rng.randint(3, 8)
+            const2 = self.rng.randint(-10, -3)
+            x_coef3 = self.rng.randint(1, 6)
 
             latex = f"{x_coef1}x - {abs(y_coef1)}y + {const1} - {abs(x_coef2)}x + {z_coef1}z + {y_coef2}y - {abs(const2)} + {x_coef3}x"
             x_total = x_coef1 + x_coef2 + x_coef3
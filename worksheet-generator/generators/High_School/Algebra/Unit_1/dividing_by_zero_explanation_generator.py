@@ -5,9 +5,6 @@ Generates conceptual problems to help students understand why division by zero i
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class DividingByZeroExplanationGenerator:
 
     def __init__(self, seed=None):
         """Initialize the dividing by zero explanation generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -52,7 +48,7 @@ class DividingByZeroExplanationGenerator:
         Generate easy problems: Basic examples showing undefined results.
         Focus on recognizing division by zero in simple expressions.
         """
-        problem_type = random.choice([
+        problem_type = self.rng.choice([
             'basic_division',
             'is_defined',
             'conceptual_check',
@@ -61,23 +57,23 @@ class DividingByZeroExplanationGenerator:
 
         if problem_type == 'basic_division':
             # Simple division by zero examples
-            numerator = random.randint(1, 20)
+            numerator = self.rng.randint(1, 20)
             latex = f"\\text{{Is }} \\frac{{{numerator}}}{{0}} \\text{{ defined? (1=yes, 0=no)}}"
             solution = 0  # No, it's not defined
             steps = ["Division by zero is undefined", "Answer: No (0)"]
 
         elif problem_type == 'is_defined':
             # Ask if various divisions are defined
-            if random.choice([True, False]):
+            if self.rng.choice([True, False]):
                 # Division by zero (undefined)
-                num = random.randint(1, 15)
+                num = self.rng.randint(1, 15)
                 latex = f"\\text{{Is }} {num} \\div 0 \\text{{ defined? (1=yes, 0=no)}}"
                 solution = 0
                 steps = ["Dividing by zero is undefined", "Answer: No (0)"]
             else:
                 # Normal division (defined)
-                num = random.randint(1, 15)
-                denom = random.randint(1, 10)
+                num = self.rng.randint(1, 15)
+                denom = self.rng.randint(1, 10)
                 latex = f"\\text{{Is }} {num} \\div {denom} \\text{{ defined? (1=yes, 0=no)}}"
                 solution = 1
                 steps = ["Dividing by a non-zero number is defined", "Answer: Yes (1)"]
@@ -92,13 +88,13 @@ class DividingByZeroExplanationGenerator:
                 (f"\\text{{Is }} \\frac{{7}}{{0}} \\text{{ equal to infinity? (1=yes, 0=no)}}",
                  0, ["Division by zero is undefined, not infinity", "Answer: No (0)"]),
             ]
-            latex, solution, steps = random.choice(scenarios)
+            latex, solution, steps = self.rng.choice(scenarios)
 
         else:  # comparison
             # Compare two expressions
-            num1 = random.randint(1, 12)
-            num2 = random.randint(1, 12)
-            denom = random.randint(1, 8)
+            num1 = self.rng.randint(1, 12)
+            num2 = self.rng.randint(1, 12)
+            denom = self.rng.randint(1, 8)
 
             scenarios = [
                 (f"\\text{{Which is undefined: }} \\frac{{{num1}}}{{0}} \\text{{ or }} \\frac{{{num2}}}{{{denom}}}? \\text{{ (1=first, 2=second, 0=both)}}",
@@ -106,7 +102,7 @@ class DividingByZeroExplanationGenerator:
                 (f"\\text{{Which is defined: }} \\frac{{{num1}}}{{{denom}}} \\text{{ or }} \\frac{{{num2}}}{{0}}? \\text{{ (1=first, 2=second, 0=neither)}}",
                  1, [f"{num1}/{denom} is defined", f"{num2}/0 is undefined", "Answer: First (1)"]),
             ]
-            latex, solution, steps = random.choice(scenarios)
+            latex, solution, steps = self.rng.choice(scenarios)
 
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
@@ -115,7 +111,7 @@ class DividingByZeroExplanationGenerator:
         Generate medium problems: Algebraic expressions that would require dividing by zero.
         Students identify when expressions become undefined.
         """
-        problem_type = random.choice([
+        problem_type = self.rng.choice([
             'simple_fraction',
             'evaluate_fraction',
             'which_undefined',
@@ -124,23 +120,23 @@ class DividingByZeroExplanationGenerator:
 
         if problem_type == 'simple_fraction':
             # Evaluate fractions with variables
-            numerator = random.randint(2, 15)
-            var = random.choice(['x', 'y', 'n', 'a'])
+            numerator = self.rng.randint(2, 15)
+            var = self.rng.choice(['x', 'y', 'n', 'a'])
 
             scenarios = [
                 # x = 0 case
                 (f"\\text{{Is }} \\frac{{{numerator}}}{{{var}}} \\text{{ defined when }} {var} = 0? \\text{{ (1=yes, 0=no)}}",
                  0, [f"When {var}=0, denominator = 0", "Division by zero is undefined", "Answer: No (0)"]),
                 # x ≠ 0 case
-                (f"\\text{{Is }} \\frac{{{numerator}}}{{{var}}} \\text{{ defined when }} {var} = {random.randint(1, 10)}? \\text{{ (1=yes, 0=no)}}",
+                (f"\\text{{Is }} \\frac{{{numerator}}}{{{var}}} \\text{{ defined when }} {var} = {self.rng.randint(1, 10)}? \\text{{ (1=yes, 0=no)}}",
                  1, [f"Denominator is non-zero", "Division is defined", "Answer: Yes (1)"]),
             ]
-            latex, solution, steps = random.choice(scenarios)
+            latex, solution, steps = self.rng.choice(scenarios)
 
         elif problem_type == 'evaluate_fraction':
             # Evaluate or identify as undefined
-            numerator = random.randint(3, 20)
-            denominator_expr_val = random.choice([0, random.randint(1, 8)])
+            numerator = self.rng.randint(3, 20)
+            denominator_expr_val = self.rng.choice([0, self.rng.randint(1, 8)])
 
             if denominator_expr_val == 0:
                 latex = f"\\text{{Evaluate }} \\frac{{{numerator}}}{{{denominator_expr_val}}} \\text{{ or write 'undefined' (use 999 for undefined)}}"
@@ -154,18 +150,18 @@ class DividingByZeroExplanationGenerator:
                     steps = [f"{numerator} ÷ {denominator_expr_val} = {solution}"]
                 else:
                     # Pick a denominator that divides evenly
-                    denominator_expr_val = random.choice([d for d in range(2, 9) if numerator % d == 0])
+                    denominator_expr_val = self.rng.choice([d for d in range(2, 9) if numerator % d == 0])
                     solution = numerator // denominator_expr_val
                     latex = f"\\text{{Evaluate }} \\frac{{{numerator}}}{{{denominator_expr_val}}}"
                     steps = [f"{numerator} ÷ {denominator_expr_val} = {solution}"]
 
         elif problem_type == 'which_undefined':
             # Multiple expressions, identify which is undefined
-            var = random.choice(['x', 'a', 'n'])
-            var_value = random.choice([0, random.randint(1, 8)])
+            var = self.rng.choice(['x', 'a', 'n'])
+            var_value = self.rng.choice([0, self.rng.randint(1, 8)])
 
-            num1 = random.randint(5, 20)
-            num2 = random.randint(5, 20)
+            num1 = self.rng.randint(5, 20)
+            num2 = self.rng.randint(5, 20)
 
             if var_value == 0:
                 latex = f"\\text{{When }} {var} = 0, \\text{{ which is undefined: }} \\frac{{{num1}}}{{{var}}} \\text{{ (enter 1) or }} {num2}{var} \\text{{ (enter 2)?}}"
@@ -179,7 +175,7 @@ class DividingByZeroExplanationGenerator:
 
         else:  # zero_numerator_vs_denominator
             # Understanding difference between 0/n and n/0
-            num = random.randint(1, 15)
+            num = self.rng.randint(1, 15)
 
             scenarios = [
                 (f"\\text{{What is }} \\frac{{0}}{{{num}}}?",
@@ -189,7 +185,7 @@ class DividingByZeroExplanationGenerator:
                 (f"\\text{{Which equals 0: }} \\frac{{0}}{{{num}}} \\text{{ (enter 1) or }} \\frac{{{num}}}{{0}} \\text{{ (enter 2)?}}",
                  1, [f"0/{num} = 0", f"{num}/0 is undefined", "Answer: First (1)"]),
             ]
-            latex, solution, steps = random.choice(scenarios)
+            latex, solution, steps = self.rng.choice(scenarios)
 
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
@@ -198,7 +194,7 @@ class DividingByZeroExplanationGenerator:
         Generate hard problems: Finding values that make expressions undefined.
         Students solve for values where denominator equals zero.
         """
-        problem_type = random.choice([
+        problem_type = self.rng.choice([
             'find_undefined_value',
             'linear_denominator',
             'multiple_restrictions',
@@ -207,16 +203,16 @@ class DividingByZeroExplanationGenerator:
 
         if problem_type == 'find_undefined_value':
             # Find value of x that makes denominator zero
-            var = random.choice(['x', 'y', 'n', 'a'])
+            var = self.rng.choice(['x', 'y', 'n', 'a'])
 
             # Simple: denominator is (x - a)
-            a = random.randint(-8, 8)
+            a = self.rng.randint(-8, 8)
             if a >= 0:
                 denom_str = f"{var} - {a}"
             else:
                 denom_str = f"{var} + {abs(a)}"
 
-            num = random.randint(3, 15)
+            num = self.rng.randint(3, 15)
             latex = f"\\text{{For what value of }} {var} \\text{{ is }} \\frac{{{num}}}{{{denom_str}}} \\text{{ undefined?}}"
             solution = a
             steps = [f"Set denominator = 0: {denom_str} = 0",
@@ -225,9 +221,9 @@ class DividingByZeroExplanationGenerator:
 
         elif problem_type == 'linear_denominator':
             # Denominator is ax + b
-            var = random.choice(['x', 'y', 't'])
-            a = random.choice([2, 3, 4, 5])
-            b = random.randint(-10, 10)
+            var = self.rng.choice(['x', 'y', 't'])
+            a = self.rng.choice([2, 3, 4, 5])
+            b = self.rng.randint(-10, 10)
 
             # Calculate where ax + b = 0
             # ax + b = 0 → x = -b/a
@@ -235,7 +231,7 @@ class DividingByZeroExplanationGenerator:
                 solution = -b // a
             else:
                 # Adjust b to make it divisible
-                b = a * random.randint(-3, 3)
+                b = a * self.rng.randint(-3, 3)
                 solution = -b // a
 
             if b >= 0:
@@ -243,7 +239,7 @@ class DividingByZeroExplanationGenerator:
             else:
                 denom_str = f"{a}{var} - {abs(b)}"
 
-            num = random.randint(5, 20)
+            num = self.rng.randint(5, 20)
             latex = f"\\text{{Find }} {var} \\text{{ where }} \\frac{{{num}}}{{{denom_str}}} \\text{{ is undefined}}"
             steps = [f"Set denominator = 0: {denom_str} = 0",
                     f"{a}{var} = {-b}",
@@ -251,13 +247,13 @@ class DividingByZeroExplanationGenerator:
 
         elif problem_type == 'multiple_restrictions':
             # Count how many values make expression undefined
-            var = random.choice(['x', 'n'])
+            var = self.rng.choice(['x', 'n'])
 
             # Two denominators with different restrictions
-            a1 = random.randint(-5, 5)
-            a2 = random.randint(-5, 5)
+            a1 = self.rng.randint(-5, 5)
+            a2 = self.rng.randint(-5, 5)
             while a2 == a1:  # Make sure they're different
-                a2 = random.randint(-5, 5)
+                a2 = self.rng.randint(-5, 5)
 
             if a1 >= 0:
                 denom1 = f"{var} - {a1}"
@@ -277,18 +273,18 @@ class DividingByZeroExplanationGenerator:
 
         else:  # compound_fraction
             # Nested fraction or complex expression
-            var = random.choice(['x', 'a'])
-            a = random.randint(1, 6)
+            var = self.rng.choice(['x', 'a'])
+            a = self.rng.randint(1, 6)
 
             scenarios = [
                 # 1/(x-a) format - find the restriction
                 (f"\\text{{When is }} \\frac{{1}}{{{var} - {a}}} \\text{{ undefined? }} {var} = ?",
                  a, [f"{var} - {a} = 0", f"{var} = {a}"]),
                 # More complex: (x+b)/(x-a)
-                (f"\\text{{For what }} {var} \\text{{ is }} \\frac{{{var} + {random.randint(1, 5)}}}{{{var} - {a}}} \\text{{ undefined?}}",
+                (f"\\text{{For what }} {var} \\text{{ is }} \\frac{{{var} + {self.rng.randint(1, 5)}}}{{{var} - {a}}} \\text{{ undefined?}}",
                  a, [f"Only denominator matters: {var} - {a} = 0", f"{var} = {a}"]),
             ]
-            latex, solution, steps = random.choice(scenarios)
+            latex, solution, steps = self.rng.choice(scenarios)
 
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
@@ -297,7 +293,7 @@ class DividingByZeroExplanationGenerator:
         Generate challenge problems: Analyzing when rational expressions are undefined.
         Complex expressions with multiple variables and restrictions.
         """
-        problem_type = random.choice([
+        problem_type = self.rng.choice([
             'quadratic_denominator',
             'factored_denominator',
             'system_restrictions',
@@ -306,11 +302,11 @@ class DividingByZeroExplanationGenerator:
 
         if problem_type == 'quadratic_denominator':
             # Denominator is (x-a)(x-b), find how many restrictions
-            var = random.choice(['x', 't'])
-            a = random.randint(-4, 4)
-            b = random.randint(-4, 4)
+            var = self.rng.choice(['x', 't'])
+            a = self.rng.randint(-4, 4)
+            b = self.rng.randint(-4, 4)
             while b == a:
-                b = random.randint(-4, 4)
+                b = self.rng.randint(-4, 4)
 
             # Format the factored form
             if a >= 0:
@@ -332,8 +328,8 @@ class DividingByZeroExplanationGenerator:
         elif problem_type == 'factored_denominator':
             # Find specific restriction from factored form
             var = 'x'
-            a = random.randint(2, 8)
-            b = random.randint(-6, 6)
+            a = self.rng.randint(2, 8)
+            b = self.rng.randint(-6, 6)
 
             if b >= 0:
                 factor = f"{var} - {b}"
@@ -352,16 +348,16 @@ class DividingByZeroExplanationGenerator:
                  [f"({factor})^2 = 0 only when {var} = {b}",
                   "One distinct value"]),
             ]
-            latex, solution, steps = random.choice(scenarios)
+            latex, solution, steps = self.rng.choice(scenarios)
 
         elif problem_type == 'system_restrictions':
             # Multiple fractions in one expression
             var = 'x'
-            a = random.randint(1, 5)
-            b = random.randint(-5, -1)
-            c = random.randint(1, 5)
+            a = self.rng.randint(1, 5)
+            b = self.rng.randint(-5, -1)
+            c = self.rng.randint(1, 5)
             while c == a:
-                c = random.randint(1, 5)
+                c = self.rng.randint(1, 5)
 
             latex = f"\\text{{How many values make }} \\frac{{1}}{{{var} - {a}}} + \\frac{{2}}{{{var} + {abs(b)}}} + \\frac{{3}}{{{var} - {c}}} \\text{{ undefined?}}"
             solution = 3
@@ -370,7 +366,7 @@ class DividingByZeroExplanationGenerator:
 
         else:  # conceptual_analysis
             # Deep conceptual questions
-            var = random.choice(['x', 'n'])
+            var = self.rng.choice(['x', 'n'])
 
             scenarios = [
                 # Why can't we divide by zero
@@ -394,7 +390,7 @@ class DividingByZeroExplanationGenerator:
                   "Cannot simplify before substituting",
                   "Answer: No"]),
             ]
-            latex, solution, steps = random.choice(scenarios)
+            latex, solution, steps = self.rng.choice(scenarios)
 
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='challenge')
 
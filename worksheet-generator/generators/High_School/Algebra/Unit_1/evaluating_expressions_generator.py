@@ -21,8 +21,7 @@ class EvaluatingExpressionsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the evaluating expressions generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[EvaluatingProblem]:
         """
@@ -55,23 +54,23 @@ class EvaluatingExpressionsGenerator:
 
     def _generate_easy(self) -> EvaluatingProblem:
         """Generate easy evaluation problems (one variable, simple operations)."""
-        var = random.choice(['x', 'n', 'y'])
-        value = random.randint(1, 10)
+        var = self.rng.choice(['x', 'n', 'y'])
+        value = self.rng.randint(1, 10)
 
-        problem_type = random.choice(['add', 'subtract', 'multiply'])
+        problem_type = self.rng.choice(['add', 'subtract', 'multiply'])
 
         if problem_type == 'add':
-            num = random.randint(1, 10)
+            num = self.rng.randint(1, 10)
             solution = value + num
             latex = f"{var} + {num}; {var} = {value}"
 
         elif problem_type == 'subtract':
-            num = random.randint(1, value)  # Keep positive
+            num = self.rng.randint(1, value)  # Keep positive
             solution = value - num
             latex = f"{var} - {num}; {var} = {value}"
 
         else:  # multiply
-            num = random.randint(2, 5)
+            num = self.rng.randint(2, 5)
             solution = num * value
             latex = f"{num}{var}; {var} = {value}"
 
@@ -79,21 +78,21 @@ class EvaluatingExpressionsGenerator:
 
     def _generate_medium(self) -> EvaluatingProblem:
         """Generate medium evaluation problems (one variable, two operations)."""
-        var = random.choice(['x', 'n', 'y', 'a'])
-        value = random.randint(2, 10)
+        var = self.rng.choice(['x', 'n', 'y', 'a'])
+        value = self.rng.randint(2, 10)
 
-        problem_type = random.choice(['two_ops', 'with_exponent'])
+        problem_type = self.rng.choice(['two_ops', 'with_exponent'])
 
         if problem_type == 'two_ops':
             # ax + b format
-            coef = random.randint(2, 8)
-            const = random.randint(1, 12)
+            coef = self.rng.randint(2, 8)
+            const = self.rng.randint(1, 12)
             solution = coef * value + const
             latex = f"{coef}{var} + {const}; {var} = {value}"
 
         else:  # with_exponent
             # x^2 + b format
-            const = random.randint(1, 10)
+            const = self.rng.randint(1, 10)
             solution = value ** 2 + const
             latex = f"{var}^2 + {const}; {var} = {value}"
 
@@ -101,34 +100,34 @@ class EvaluatingExpressionsGenerator:
 
     def _generate_hard(self) -> EvaluatingProblem:
         """Generate hard evaluation problems (multiple variables or complex expressions)."""
-        problem_type = random.choice(['two_vars', 'complex_exp', 'with_division'])
+        problem_type = self.rng.choice(['two_vars', 'complex_exp', 'with_division'])
 
         if problem_type == 'two_vars':
             # ax + by format
-            x_val = random.randint(2, 8)
-            y_val = random.randint(2, 8)
-            a = random.randint(2, 6)
-            b = random.randint(2, 6)
+            x_val = self.rng.randint(2, 8)
+            y_val = self.rng.randint(2, 8)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(2, 6)
             solution = a * x_val + b * y_val
             latex = f"{a}x + {b}y; x = {x_val}, y = {y_val}"
 
         elif problem_type == 'complex_exp':
             # ax^2 + bx + c format
-            x_val = random.randint(2, 6)
-            a = random.randint(1, 4)
-            b = random.randint(2, 8)
-            c = random.randint(1, 10)
+            x_val = self.rng.randint(2, 6)
+            a = self.rng.randint(1, 4)
+            b = self.rng.randint(2, 8)
+            c = self.rng.randint(1, 10)
             solution = a * (x_val ** 2) + b * x_val + c
             latex = f"{a}x^2 + {b}x + {c}; x = {x_val}"
 
         else:  # with_division
             # (ax + b) / c format - ensure divisible
-            x_val = random.randint(2, 6)
-            c = random.randint(2, 4)
+            x_val = self.rng.randint(2, 6)
+            c = self.rng.randint(2, 4)
             # Make sure ax + b is divisible by c
-            quotient = random.randint(3, 10)
+            quotient = self.rng.randint(3, 10)
             ax_plus_b = quotient * c
-            a = random.randint(2, 5)
+            a = self.rng.randint(2, 5)
             b = ax_plus_b - (a * x_val)
 
             if b > 0:
@@ -146,36 +145,36 @@ class EvaluatingExpressionsGenerator:
 
     def _generate_challenge(self) -> EvaluatingProblem:
         """Generate challenge evaluation problems (multiple substitutions, nested expressions, complex operations)."""
-        problem_type = random.choice(['three_vars', 'nested_exp', 'complex_fraction', 'mixed_exponents'])
+        problem_type = self.rng.choice(['three_vars', 'nested_exp', 'complex_fraction', 'mixed_exponents'])
 
         if problem_type == 'three_vars':
             # Three variables with complex expression
-            x_val = random.randint(2, 8)
-            y_val = random.randint(2, 8)
-            z_val = random.randint(2, 8)
-            a = random.randint(2, 5)
-            b = random.randint(2, 5)
-            c = random.randint(2, 5)
+            x_val = self.rng.randint(2, 8)
+            y_val = self.rng.randint(2, 8)
+            z_val = self.rng.randint(2, 8)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(2, 5)
+            c = self.rng.randint(2, 5)
             solution = a * x_val + b * y_val - c * z_val
             latex = f"{a}x + {b}y - {c}z; x = {x_val}, y = {y_val}, z = {z_val}"
 
         elif problem_type == 'nested_exp':
             # Nested expression with multiple operations
-            x_val = random.randint(2, 5)
-            a = random.randint(2, 4)
-            b = random.randint(2, 6)
-            c = random.randint(3, 8)
+            x_val = self.rng.randint(2, 5)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(2, 6)
+            c = self.rng.randint(3, 8)
             solution = a * (x_val ** 2) + b * x_val - c
             latex = f"{a}x^2 + {b}x - {c}; x = {x_val}"
 
         elif problem_type == 'complex_fraction':
             # Complex fraction with two variables
-            x_val = random.randint(3, 8)
-            y_val = random.randint(2, 6)
-            divisor = random.randint(2, 4)
+            x_val = self.rng.randint(3, 8)
+            y_val = self.rng.randint(2, 6)
+            divisor = self.rng.randint(2, 4)
             # Ensure divisible result
-            numerator_val = divisor * random.randint(5, 15)
-            a = random.randint(2, 5)
+            numerator_val = divisor * self.rng.randint(5, 15)
+            a = self.rng.randint(2, 5)
             b = numerator_val - (a * x_val + y_val)
             if b > 0:
                 solution = (a * x_val + y_val + b) // divisor
@@ -187,10 +186,10 @@ class EvaluatingExpressionsGenerator:
 
         else:  # mixed_exponents
             # Expression with multiple exponents and variables
-            x_val = random.randint(2, 5)
-            y_val = random.randint(2, 5)
-            a = random.randint(1, 3)
-            b = random.randint(2, 4)
+            x_val = self.rng.randint(2, 5)
+            y_val = self.rng.randint(2, 5)
+            a = self.rng.randint(1, 3)
+            b = self.rng.randint(2, 4)
             solution = a * (x_val ** 2) + b * (y_val ** 2)
             latex = f"{a}x^2 + {b}y^2; x = {x_val}, y = {y_val}"
 
@@ -11,8 +11,7 @@ class EvaluatingExpressionsWithMultipleTermsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int):
         """Generate worksheet problems."""
@@ -36,9 +35,9 @@ class EvaluatingExpressionsWithMultipleTermsGenerator:
     def _generate_easy(self):
         """Generate an easy problem."""
         # Basic algebraic problem
-        a = random.randint(1, 10)
-        b = random.randint(1, 10)
-        op = random.choice(['+', '-', '×'])
+        a = self.rng.randint(1, 10)
+        b = self.rng.randint(1, 10)
+        op = self.rng.choice(['+', '-', '×'])
 
         if op == '+':
             latex = f"{a} + {b}"
@@ -62,9 +61,9 @@ class EvaluatingExpressionsWithMultipleTermsGenerator:
     def _generate_medium(self):
         """Generate a medium problem."""
         # Complex problem
-        a = random.randint(2, 10)
-        b = random.randint(-20, 20)
-        c = random.randint(-10, 10)
+        a = self.rng.randint(2, 10)
+        b = self.rng.randint(-20, 20)
+        c = self.rng.randint(-10, 10)
 
         latex = f"{a}x + {b} = {c}"
         solution = (c - b) / a
@@ -80,9 +79,9 @@ class EvaluatingExpressionsWithMultipleTermsGenerator:
     def _generate_hard(self):
         """Generate a hard problem."""
         # Complex problem
-        a = random.randint(2, 10)
-        b = random.randint(-20, 20)
-        c = random.randint(-10, 10)
+        a = self.rng.randint(2, 10)
+        b = self.rng.randint(-20, 20)
+        c = self.rng.randint(-10, 10)
 
         latex = f"{a}x + {b} = {c}"
         solution = (c - b) / a
@@ -98,9 +97,9 @@ class EvaluatingExpressionsWithMultipleTermsGenerator:
     def _generate_challenge(self):
         """Generate a challenge problem."""
         # Complex problem
-        a = random.randint(2, 10)
-        b = random.randint(-20, 20)
-        c = random.randint(-10, 10)
+        a = self.rng.randint(2, 10)
+        b = self.rng.randint(-20, 20)
+        c = self.rng.randint(-10, 10)
 
         latex = f"{a}x + {b} = {c}"
         solution = (c - b) / a
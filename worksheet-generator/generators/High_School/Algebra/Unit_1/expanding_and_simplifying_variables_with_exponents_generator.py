@@ -11,8 +11,7 @@ class ExpandingAndSimplifyingVariablesWithExponentsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int):
         """Generate worksheet problems."""
@@ -36,8 +35,8 @@ class ExpandingAndSimplifyingVariablesWithExponentsGenerator:
     def _generate_easy(self):
         """Generate an easy problem."""
         # Exponent problem
-        base = random.randint(2, 5)
-        exp = random.randint(2, 4)
+        base = self.rng.randint(2, 5)
+        exp = self.rng.randint(2, 4)
 
         latex = f"{base}^{{{exp}}}"
         solution = base ** exp
@@ -53,9 +52,9 @@ class ExpandingAndSimplifyingVariablesWithExponentsGenerator:
     def _generate_medium(self):
         """Generate a medium problem."""
         # Complex exponent
-        a = random.randint(2, 5)
-        b = random.randint(2, 4)
-        c = random.randint(1, 3)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 4)
+        c = self.rng.randint(1, 3)
 
         latex = f"({a}^{{{b}}})^{{{c}}}"
         solution = a ** (b * c)
@@ -71,9 +70,9 @@ class ExpandingAndSimplifyingVariablesWithExponentsGenerator:
     def _generate_hard(self):
         """Generate a hard problem."""
         # Complex exponent
-        a = random.randint(2, 5)
-        b = random.randint(2, 4)
-        c = random.randint(1, 3)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 4)
+        c = self.rng.randint(1, 3)
 
         latex = f"({a}^{{{b}}})^{{{c}}}"
         solution = a ** (b * c)
@@ -89,9 +88,9 @@ class ExpandingAndSimplifyingVariablesWithExponentsGenerator:
     def _generate_challenge(self):
         """Generate a challenge problem."""
         # Complex exponent
-        a = random.randint(2, 5)
-        b = random.randint(2, 4)
-        c = random.randint(1, 3)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 4)
+        c = self.rng.randint(1, 3)
 
         latex = f"({a}^{{{b}}})^{{{c}}}"
         solution = a ** (b * c)
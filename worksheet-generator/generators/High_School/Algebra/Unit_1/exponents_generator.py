@@ -21,8 +21,7 @@ class ExponentsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the exponents generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[ExponentProblem]:
         """
@@ -55,24 +54,24 @@ class ExponentsGenerator:
 
     def _generate_easy(self) -> ExponentProblem:
         """Generate easy exponent problems (small bases and exponents)."""
-        problem_type = random.choice(['simple', 'squared', 'cubed'])
+        problem_type = self.rng.choice(['simple', 'squared', 'cubed'])
 
         if problem_type == 'simple':
             # Simple powers: 2^3, 3^2, etc.
-            base = random.randint(2, 5)
-            exp = random.randint(2, 3)
+            base = self.rng.randint(2, 5)
+            exp = self.rng.randint(2, 3)
             solution = base ** exp
             latex = f"{base}^{{{exp}}}"
 
         elif problem_type == 'squared':
             # Specifically squared numbers
-            base = random.randint(2, 10)
+            base = self.rng.randint(2, 10)
             solution = base ** 2
             latex = f"{base}^2"
 
         else:  # cubed
             # Specifically cubed numbers
-            base = random.randint(2, 5)
+            base = self.rng.randint(2, 5)
             solution = base ** 3
             latex = f"{base}^3"
 
@@ -80,25 +79,25 @@ class ExponentsGenerator:
 
     def _generate_medium(self) -> ExponentProblem:
         """Generate medium exponent problems."""
-        problem_type = random.choice(['larger_base', 'larger_exp', 'power_of_10'])
+        problem_type = self.rng.choice(['larger_base', 'larger_exp', 'power_of_10'])
 
         if problem_type == 'larger_base':
             # Larger bases with smaller exponents
-            base = random.randint(6, 12)
-            exp = random.randint(2, 3)
+            base = self.rng.randint(6, 12)
+            exp = self.rng.randint(2, 3)
             solution = base ** exp
             latex = f"{base}^{{{exp}}}"
 
         elif problem_type == 'larger_exp':
             # Smaller bases with larger exponents
-            base = random.randint(2, 4)
-            exp = random.randint(4, 5)
+            base = self.rng.randint(2, 4)
+            exp = self.rng.randint(4, 5)
             solution = base ** exp
             latex = f"{base}^{{{exp}}}"
 
         else:  # power_of_10
             # Powers of 10
-            exp = random.randint(2, 4)
+            exp = self.rng.randint(2, 4)
             solution = 10 ** exp
             latex = f"10^{{{exp}}}"
 
@@ -106,27 +105,27 @@ class ExponentsGenerator:
 
     def _generate_hard(self) -> ExponentProblem:
         """Generate hard exponent problems."""
-        problem_type = random.choice(['large_power', 'negative_base', 'expression'])
+        problem_type = self.rng.choice(['large_power', 'negative_base', 'expression'])
 
         if problem_type == 'large_power':
             # Larger exponents
-            base = random.randint(2, 7)
-            exp = random.randint(4, 6)
+            base = self.rng.randint(2, 7)
+            exp = self.rng.randint(4, 6)
             solution = base ** exp
             latex = f"{base}^{{{exp}}}"
 
         elif problem_type == 'negative_base':
             # Negative bases (even exponents to keep positive)
-            base = -random.randint(2, 6)
-            exp = 2 * random.randint(1, 3)  # Even exponent
+            base = -self.rng.randint(2, 6)
+            exp = 2 * self.rng.randint(1, 3)  # Even exponent
             solution = base ** exp
             latex = f"({base})^{{{exp}}}"
 
         else:  # expression
             # Simple expression with exponent
-            base = random.randint(2, 5)
-            exp = random.randint(2, 3)
-            add = random.randint(1, 5)
+            base = self.rng.randint(2, 5)
+            exp = self.rng.randint(2, 3)
+            add = self.rng.randint(1, 5)
             solution = base ** exp + add
             latex = f"{base}^{{{exp}}} + {add}"
 
@@ -134,38 +133,38 @@ class ExponentsGenerator:
 
     def _generate_challenge(self) -> ExponentProblem:
         """Generate challenge exponent problems (larger numbers, combined operations, multi-step)."""
-        problem_type = random.choice(['very_large_power', 'multiple_exponents', 'complex_expression', 'negative_exponent_product'])
+        problem_type = self.rng.choice(['very_large_power', 'multiple_exponents', 'complex_expression', 'negative_exponent_product'])
 
         if problem_type == 'very_large_power':
             # Very large exponents requiring careful calculation
-            base = random.randint(2, 5)
-            exp = random.randint(7, 9)
+            base = self.rng.randint(2, 5)
+            exp = self.rng.randint(7, 9)
             solution = base ** exp
             latex = f"{base}^{{{exp}}}"
 
         elif problem_type == 'multiple_exponents':
             # Multiple exponential terms to add/subtract
-            base1 = random.randint(2, 4)
-            exp1 = random.randint(3, 5)
-            base2 = random.randint(2, 4)
-            exp2 = random.randint(3, 5)
+            base1 = self.rng.randint(2, 4)
+            exp1 = self.rng.randint(3, 5)
+            base2 = self.rng.randint(2, 4)
+            exp2 = self.rng.randint(3, 5)
             solution = base1 ** exp1 + base2 ** exp2
             latex = f"{base1}^{{{exp1}}} + {base2}^{{{exp2}}}"
 
         elif problem_type == 'complex_expression':
             # Expression with exponents and multiple operations
-            base = random.randint(2, 5)
-            exp = random.randint(3, 5)
-            mult = random.randint(2, 4)
-            add = random.randint(5, 15)
+            base = self.rng.randint(2, 5)
+            exp = self.rng.randint(3, 5)
+            mult = self.rng.randint(2, 4)
+            add = self.rng.randint(5, 15)
             solution = mult * (base ** exp) + add
             latex = f"{mult} \\cdot {base}^{{{exp}}} + {add}"
 
         else:  # negative_exponent_product
             # Product of negative base with larger exponent
-            base = -random.randint(2, 5)
-            exp = 2 * random.randint(2, 4)  # Even exponent
-            mult = random.randint(2, 6)
+            base = -self.rng.randint(2, 5)
+            exp = 2 * self.rng.randint(2, 4)  # Even exponent
+            mult = self.rng.randint(2, 6)
             solution = mult * (base ** exp)
             latex = f"{mult} \\cdot ({base})^{{{exp}}}"
 
@@ -5,9 +5,6 @@ Reviews parts of a term, now including exponents
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class PartsOfTermExponentsReviewGenerator:
     """Generates review problems about parts of a term with exponents."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,10 +33,10 @@ class PartsOfTermExponentsReviewGenerator:
 
     def _generate_easy(self) -> Equation:
         """Easy: Identify coefficient, variable, and exponent"""
-        coef = random.randint(2, 9)
-        exp = random.randint(2, 4)
+        coef = self.rng.randint(2, 9)
+        exp = self.rng.randint(2, 4)
         
-        question_type = random.choice(['coefficient', 'variable', 'exponent'])
+        question_type = self.rng.choice(['coefficient', 'variable', 'exponent'])
         
         if question_type == 'coefficient':
             latex = f"\\text{{In the term }} {coef}x^{{{exp}}}\\text{{, what is the coefficient?}}"
@@ -61,9 +57,9 @@ class PartsOfTermExponentsReviewGenerator:
 
     def _generate_medium(self) -> Equation:
         """Medium: Identify all parts of more complex terms"""
-        coef = random.randint(2, 12)
-        var1_exp = random.randint(2, 4)
-        var2_exp = random.randint(1, 3)
+        coef = self.rng.randint(2, 12)
+        var1_exp = self.rng.randint(2, 4)
+        var2_exp = self.rng.randint(1, 3)
         
         latex = f"\\text{{In the term }} {coef}x^{{{var1_exp}}}y^{{{var2_exp}}}\\text{{, identify: coefficient, variables, and exponents.}}"
         solution = f"Coef: {coef}, Vars: x,y, Exp: {var1_exp},{var2_exp}"
@@ -78,9 +74,9 @@ class PartsOfTermExponentsReviewGenerator:
 
     def _generate_hard(self) -> Equation:
         """Hard: Write term given parts"""
-        coef = random.randint(2, 15)
-        var = random.choice(['x', 'a', 'n'])
-        exp = random.randint(2, 5)
+        coef = self.rng.randint(2, 15)
+        var = self.rng.choice(['x', 'a', 'n'])
+        exp = self.rng.randint(2, 5)
         
         latex = f"\\text{{Write a term with coefficient }} {coef}\\text{{, variable }} {var}\\text{{, and exponent }} {exp}"
         solution = f"{coef}{var}^{{{exp}}}"
@@ -94,11 +90,11 @@ class PartsOfTermExponentsReviewGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Challenge: Complex terms with negative exponents or fractions"""
-        problem_type = random.choice(['negative_exp', 'fraction_coef', 'multiple_vars'])
+        problem_type = self.rng.choice(['negative_exp', 'fraction_coef', 'multiple_vars'])
         
         if problem_type == 'negative_exp':
-            coef = random.randint(2, 8)
-            exp = random.randint(-3, -1)
+            coef = self.rng.randint(2, 8)
+            exp = self.rng.randint(-3, -1)
             
             latex = f"\\text{{In }} {coef}x^{{{exp}}}\\text{{, what does the negative exponent mean?}}"
             solution = f"1/{coef}x^{{{abs(exp)}}}" if coef == 1 else f"{coef}/x^{{{abs(exp)}}}"
@@ -109,9 +105,9 @@ class PartsOfTermExponentsReviewGenerator:
             ]
             
         elif problem_type == 'fraction_coef':
-            num = random.randint(1, 5)
-            denom = random.randint(2, 6)
-            exp = random.randint(2, 4)
+            num = self.rng.randint(1, 5)
+            denom = self.rng.randint(2, 6)
+            exp = self.rng.randint(2, 4)
             
             latex = f"\\text{{In }} \\frac{{{num}}}{{{denom}}}x^{{{exp}}}\\text{{, what is the coefficient?}}"
             solution = f"{num}/{denom}"
@@ -122,10 +118,10 @@ class PartsOfTermExponentsReviewGenerator:
             ]
             
         else:  # multiple_vars
-            coef = random.randint(2, 10)
-            exp1 = random.randint(2, 4)
-            exp2 = random.randint(2, 3)
-            exp3 = random.randint(1, 2)
+            coef = self.rng.randint(2, 10)
+            exp1 = self.rng.randint(2, 4)
+            exp2 = self.rng.randint(2, 3)
+            exp3 = self.rng.randint(1, 2)
             
             latex = f"\\text{{Find the degree (sum of exponents) of }} {coef}x^{{{exp1}}}y^{{{exp2}}}z^{{{exp3}}}"
             solution = exp1 + exp2 + exp3
@@ -5,9 +5,6 @@ Generates problems focused on simplifying cube root expressions
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 from equation_generator import Equation
 
 
@@ -19,8 +16,7 @@ class SimplifyingCubeRootsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -43,7 +39,7 @@ class SimplifyingCubeRootsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy: Perfect cube roots."""
-        root = random.choice([2, 3, 4, 5])
+        root = self.rng.choice([2, 3, 4, 5])
         n = root ** 3
 
         latex = f"\\sqrt[3]{{{n}}}"
@@ -60,9 +56,9 @@ class SimplifyingCubeRootsGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium: Simplify with one perfect cube factor."""
         # Create number with one perfect cube factor
-        perfect_root = random.choice([2, 3])
+        perfect_root = self.rng.choice([2, 3])
         perfect = perfect_root ** 3
-        other = random.choice([2, 3, 4, 5])
+        other = self.rng.choice([2, 3, 4, 5])
         n = perfect * other
 
         latex = f"\\sqrt[3]{{{n}}}"
@@ -79,11 +75,11 @@ class SimplifyingCubeRootsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard: Larger perfect cubes or negative cube roots."""
-        problem_type = random.choice(['large_perfect', 'negative', 'coefficient'])
+        problem_type = self.rng.choice(['large_perfect', 'negative', 'coefficient'])
 
         if problem_type == 'large_perfect':
             # Larger perfect cubes
-            root = random.choice([5, 6, 7])
+            root = self.rng.choice([5, 6, 7])
             n = root ** 3
 
             latex = f"\\sqrt[3]{{{n}}}"
@@ -96,7 +92,7 @@ class SimplifyingCubeRootsGenerator:
 
         elif problem_type == 'negative':
             # Negative cube roots (cube roots of negative numbers)
-            root = random.choice([2, 3, 4, 5])
+            root = self.rng.choice([2, 3, 4, 5])
             n = -(root ** 3)
 
             latex = f"\\sqrt[3]{{{n}}}"
@@ -110,8 +106,8 @@ class SimplifyingCubeRootsGenerator:
 
         else:  # coefficient
             # Coefficient with cube root
-            coef = random.randint(2, 4)
-            root = random.choice([2, 3])
+            coef = self.rng.randint(2, 4)
+            root = self.rng.choice([2, 3])
             inside = root ** 3
 
             latex = f"{coef}\\sqrt[3]{{{inside}}}"
@@ -126,12 +122,12 @@ class SimplifyingCubeRootsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge: Complex simplifications with cube roots."""
-        problem_type = random.choice(['multiply_cubes', 'simplify_large', 'mixed'])
+        problem_type = self.rng.choice(['multiply_cubes', 'simplify_large', 'mixed'])
 
         if problem_type == 'multiply_cubes':
             # Multiply cube roots
-            a = random.choice([2, 3, 4])
-            b = random.choice([2, 4, 5])
+            a = self.rng.choice([2, 3, 4])
+            b = self.rng.choice([2, 4, 5])
             product = a * b
 
             # Check if product is a perfect cube
@@ -159,9 +155,9 @@ class SimplifyingCubeRootsGenerator:
 
         elif problem_type == 'simplify_large':
             # Larger number with perfect cube factor
-            perfect_root = random.choice([2, 3, 4])
+            perfect_root = self.rng.choice([2, 3, 4])
             perfect = perfect_root ** 3
-            other = random.choice([2, 3, 5])
+            other = self.rng.choice([2, 3, 5])
             n = perfect * other
 
             latex = f"\\sqrt[3]{{{n}}}"
@@ -175,9 +171,9 @@ class SimplifyingCubeRootsGenerator:
 
         else:  # mixed
             # Expression with cube root
-            root = random.choice([2, 3])
+            root = self.rng.choice([2, 3])
             n = root ** 3
-            multiplier = random.randint(2, 5)
+            multiplier = self.rng.randint(2, 5)
 
             latex = f"{multiplier} \\times \\sqrt[3]{{{n}}}"
             result = multiplier * root
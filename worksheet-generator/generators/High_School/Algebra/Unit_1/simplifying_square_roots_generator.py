@@ -5,9 +5,6 @@ Generates problems focused on simplifying square root expressions
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 from equation_generator import Equation
 
 
@@ -19,8 +16,7 @@ class SimplifyingSquareRootsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -43,7 +39,7 @@ class SimplifyingSquareRootsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy: Perfect square roots."""
-        n = random.choice([4, 9, 16, 25, 36, 49, 64, 81, 100])
+        n = self.rng.choice([4, 9, 16, 25, 36, 49, 64, 81, 100])
         root = int(n ** 0.5)
 
         latex = f"\\sqrt{{{n}}}"
@@ -60,8 +56,8 @@ class SimplifyingSquareRootsGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium: Simplify non-perfect squares with one perfect square factor."""
         # Create number with one perfect square factor
-        perfect = random.choice([4, 9, 16, 25])
-        other = random.choice([2, 3, 5, 6, 7])
+        perfect = self.rng.choice([4, 9, 16, 25])
+        other = self.rng.choice([2, 3, 5, 6, 7])
         n = perfect * other
         root_perfect = int(perfect ** 0.5)
 
@@ -79,11 +75,11 @@ class SimplifyingSquareRootsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard: Larger numbers or multiple simplification steps."""
-        problem_type = random.choice(['large_perfect', 'two_factors', 'coefficient'])
+        problem_type = self.rng.choice(['large_perfect', 'two_factors', 'coefficient'])
 
         if problem_type == 'large_perfect':
             # Larger perfect squares
-            n = random.choice([121, 144, 169, 196, 225])
+            n = self.rng.choice([121, 144, 169, 196, 225])
             root = int(n ** 0.5)
 
             latex = f"\\sqrt{{{n}}}"
@@ -96,8 +92,8 @@ class SimplifyingSquareRootsGenerator:
 
         elif problem_type == 'two_factors':
             # Number with larger perfect square factor
-            perfect = random.choice([16, 25, 36, 49])
-            other = random.choice([2, 3, 5, 7])
+            perfect = self.rng.choice([16, 25, 36, 49])
+            other = self.rng.choice([2, 3, 5, 7])
             n = perfect * other
             root_perfect = int(perfect ** 0.5)
 
@@ -111,8 +107,8 @@ class SimplifyingSquareRootsGenerator:
 
         else:  # coefficient
             # Coefficient outside radical
-            coef = random.randint(2, 5)
-            inside = random.choice([4, 9, 16, 25])
+            coef = self.rng.randint(2, 5)
+            inside = self.rng.choice([4, 9, 16, 25])
             root_inside = int(inside ** 0.5)
 
             latex = f"{coef}\\sqrt{{{inside}}}"
@@ -127,12 +123,12 @@ class SimplifyingSquareRootsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge: Complex simplifications or operations with radicals."""
-        problem_type = random.choice(['multiply_radicals', 'add_radicals', 'nested'])
+        problem_type = self.rng.choice(['multiply_radicals', 'add_radicals', 'nested'])
 
         if problem_type == 'multiply_radicals':
             # Multiply two square roots
-            a = random.choice([2, 3, 5, 6])
-            b = random.choice([2, 3, 5, 8])
+            a = self.rng.choice([2, 3, 5, 6])
+            b = self.rng.choice([2, 3, 5, 8])
             product = a * b
 
             # Check if product is a perfect square
@@ -158,9 +154,9 @@ class SimplifyingSquareRootsGenerator:
 
         elif problem_type == 'add_radicals':
             # Add like radicals
-            coef1 = random.randint(2, 5)
-            coef2 = random.randint(2, 5)
-            inside = random.choice([2, 3, 5, 7])
+            coef1 = self.rng.randint(2, 5)
+            coef2 = self.rng.randint(2, 5)
+            inside = self.rng.choice([2, 3, 5, 7])
             result_coef = coef1 + coef2
 
             latex = f"{coef1}\\sqrt{{{inside}}} + {coef2}\\sqrt{{{inside}}}"
@@ -174,8 +170,8 @@ class SimplifyingSquareRootsGenerator:
 
         else:  # nested
             # Square root of a perfect square times a number
-            a = random.choice([2, 3])
-            b = random.choice([4, 9, 16])
+            a = self.rng.choice([2, 3])
+            b = self.rng.choice([4, 9, 16])
             root_b = int(b ** 0.5)
             n = a * b
 
@@ -21,8 +21,7 @@ class SubstitutionGenerator:
 
     def __init__(self, seed=None):
         """Initialize the substitution generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[SubstitutionProblem]:
         """
@@ -55,10 +54,10 @@ class SubstitutionGenerator:
 
     def _generate_easy(self) -> SubstitutionProblem:
         """Generate easy substitution problems."""
-        var = random.choice(['x', 'n', 'a'])
-        value = random.randint(1, 10)
+        var = self.rng.choice(['x', 'n', 'a'])
+        value = self.rng.randint(1, 10)
 
-        problem_type = random.choice(['direct', 'simple_add', 'simple_mult'])
+        problem_type = self.rng.choice(['direct', 'simple_add', 'simple_mult'])
 
         if problem_type == 'direct':
             # Direct substitution: x when x = 5
@@ -67,13 +66,13 @@ class SubstitutionGenerator:
 
         elif problem_type == 'simple_add':
             # Simple addition: x + 3 when x = 5
-            add = random.randint(1, 8)
+            add = self.rng.randint(1, 8)
             solution = value + add
             latex = f"{var} + {add}; {var} = {value}"
 
         else:  # simple_mult
             # Simple multiplication: 3x when x = 4
-            mult = random.randint(2, 7)
+            mult = self.rng.randint(2, 7)
             solution = mult * value
             latex = f"{mult}{var}; {var} = {value}"
 
@@ -81,28 +80,28 @@ class SubstitutionGenerator:
 
     def _generate_medium(self) -> SubstitutionProblem:
         """Generate medium substitution problems."""
-        var = random.choice(['x', 'n', 'y', 'a'])
-        value = random.randint(2, 12)
+        var = self.rng.choice(['x', 'n', 'y', 'a'])
+        value = self.rng.randint(2, 12)
 
-        problem_type = random.choice(['two_step', 'with_parentheses', 'squared'])
+        problem_type = self.rng.choice(['two_step', 'with_parentheses', 'squared'])
 
         if problem_type == 'two_step':
             # ax + b when x = value
-            a = random.randint(2, 8)
-            b = random.randint(1, 10)
+            a = self.rng.randint(2, 8)
+            b = self.rng.randint(1, 10)
             solution = a * value + b
             latex = f"{a}{var} + {b}; {var} = {value}"
 
         elif problem_type == 'with_parentheses':
             # a(x + b) when x = value
-            a = random.randint(2, 6)
-            b = random.randint(1, 8)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 8)
             solution = a * (value + b)
             latex = f"{a}({var} + {b}); {var} = {value}"
 
         else:  # squared
             # x^2 when x = value (keep value small)
-            value = random.randint(2, 8)
+            value = self.rng.randint(2, 8)
             solution = value ** 2
             latex = f"{var}^2; {var} = {value}"
 
@@ -110,33 +109,33 @@ class SubstitutionGenerator:
 
     def _generate_hard(self) -> SubstitutionProblem:
         """Generate hard substitution problems."""
-        problem_type = random.choice(['multi_var', 'complex_exp', 'fraction'])
+        problem_type = self.rng.choice(['multi_var', 'complex_exp', 'fraction'])
 
         if problem_type == 'multi_var':
             # ax + by when x = val1, y = val2
-            x_val = random.randint(2, 9)
-            y_val = random.randint(2, 9)
-            a = random.randint(2, 7)
-            b = random.randint(2, 7)
+            x_val = self.rng.randint(2, 9)
+            y_val = self.rng.randint(2, 9)
+            a = self.rng.randint(2, 7)
+            b = self.rng.randint(2, 7)
             solution = a * x_val + b * y_val
             latex = f"{a}x + {b}y; x = {x_val}, y = {y_val}"
 
         elif problem_type == 'complex_exp':
             # ax^2 + bx when x = val
-            x_val = random.randint(2, 6)
-            a = random.randint(1, 5)
-            b = random.randint(2, 8)
+            x_val = self.rng.randint(2, 6)
+            a = self.rng.randint(1, 5)
+            b = self.rng.randint(2, 8)
             solution = a * (x_val ** 2) + b * x_val
             latex = f"{a}x^2 + {b}x; x = {x_val}"
 
         else:  # fraction
             # (ax + b) / c when x = val
-            x_val = random.randint(2, 6)
-            c = random.randint(2, 4)
+            x_val = self.rng.randint(2, 6)
+            c = self.rng.randint(2, 4)
             # Ensure divisible result
-            result = random.randint(4, 12)
+            result = self.rng.randint(4, 12)
             numerator = result * c
-            a = random.randint(2, 5)
+            a = self.rng.randint(2, 5)
             b = numerator - (a * x_val)
 
             if b >= 0:
@@ -151,49 +150,49 @@ class SubstitutionGenerator:
 
     def _generate_challenge(self) -> SubstitutionProblem:
         """Generate challenge substitution problems (multiple variables with different values, complex expressions)."""
-        problem_type = random.choice(['three_vars_complex', 'quadratic_multi_var', 'nested_operations', 'four_vars'])
+        problem_type = self.rng.choice(['three_vars_complex', 'quadratic_multi_var', 'nested_operations', 'four_vars'])
 
         if problem_type == 'three_vars_complex':
             # Three variables with squared and linear terms
-            x_val = random.randint(2, 6)
-            y_val = random.randint(2, 6)
-            z_val = random.randint(2, 6)
-            a = random.randint(1, 4)
-            b = random.randint(2, 5)
-            c = random.randint(2, 5)
+            x_val = self.rng.randint(2, 6)
+            y_val = self.rng.randint(2, 6)
+            z_val = self.rng.randint(2, 6)
+            a = self.rng.randint(1, 4)
+            b = self.rng.randint(2, 5)
+            c = self.rng.randint(2, 5)
             solution = a * (x_val ** 2) + b * y_val - c * z_val
             latex = f"{a}x^2 + {b}y - {c}z;x={x_val},y={y_val},z={z_val}"
 
         elif problem_type == 'quadratic_multi_var':
             # Quadratic expression with two variables
-            x_val = random.randint(2, 5)
-            y_val = random.randint(2, 5)
-            a = random.randint(1, 3)
-            b = random.randint(2, 5)
-            c = random.randint(1, 8)
+            x_val = self.rng.randint(2, 5)
+            y_val = self.rng.randint(2, 5)
+            a = self.rng.randint(1, 3)
+            b = self.rng.randint(2, 5)
+            c = self.rng.randint(1, 8)
             solution = a * (x_val ** 2) + b * (y_val ** 2) + c
             latex = f"{a}x^2 + {b}y^2 + {c};x={x_val},y={y_val}"
 
         elif problem_type == 'nested_operations':
             # Nested parentheses with multiple variables
-            x_val = random.randint(2, 8)
-            y_val = random.randint(2, 8)
-            a = random.randint(2, 5)
-            b = random.randint(2, 6)
-            c = random.randint(2, 4)
+            x_val = self.rng.randint(2, 8)
+            y_val = self.rng.randint(2, 8)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(2, 6)
+            c = self.rng.randint(2, 4)
             solution = a * (b * x_val + c * y_val)
             latex = f"{a}({b}x + {c}y);x={x_val},y={y_val}"
 
         else:  # four_vars
             # Four different variables
-            w_val = random.randint(2, 7)
-            x_val = random.randint(2, 7)
-            y_val = random.randint(2, 7)
-            z_val = random.randint(2, 7)
-            a = random.randint(1, 4)
-            b = random.randint(1, 4)
-            c = random.randint(1, 4)
-            d = random.randint(1, 4)
+            w_val = self.rng.randint(2, 7)
+            x_val = self.rng.randint(2, 7)
+            y_val = self.rng.randint(2, 7)
+            z_val = self.rng.randint(2, 7)
+            a = self.rng.randint(1, 4)
+            b = self.rng.randint(1, 4)
+            c = self.rng.randint(1, 4)
+            d = self.rng.randint(1, 4)
             solution = a * w_val + b * x_val + c * y_val - d * z_val
             latex = f"{a}w + {b}x + {c}y - {d}z;w={w_val},x={x_val},y={y_val},z={z_val}"
 
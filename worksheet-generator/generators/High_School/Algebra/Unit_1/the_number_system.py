@@ -11,8 +11,7 @@ class TheNumberSystemNaturalWholeIntegersRealRationalIrrationalGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int):
         """Generate worksheet problems."""
@@ -36,9 +35,9 @@ class TheNumberSystemNaturalWholeIntegersRealRationalIrrationalGenerator:
     def _generate_easy(self):
         """Generate an easy problem."""
         # System of equations
-        a = random.randint(1, 3)
-        b = random.randint(-5, 5)
-        c = random.randint(-5, 5)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(-5, 5)
+        c = self.rng.randint(-5, 5)
 
         latex = f"\\begin{{cases}} y = {a}x + {b} \\\\ y = {c} \\end{{cases}}"
         x_sol = (c - b) / a
@@ -55,8 +54,8 @@ class TheNumberSystemNaturalWholeIntegersRealRationalIrrationalGenerator:
     def _generate_medium(self):
         """Generate a medium problem."""
         # Complex system
-        a1, b1, c1 = random.randint(1, 3), random.randint(-5, 5), random.randint(-10, 10)
-        a2, b2, c2 = random.randint(1, 3), random.randint(-5, 5), random.randint(-10, 10)
+        a1, b1, c1 = self.rng.randint(1, 3), self.rng.randint(-5, 5), self.rng.randint(-10, 10)
+        a2, b2, c2 = self.rng.randint(1, 3), self.rng.randint(-5, 5), self.rng.randint(-10, 10)
 
         latex = f"\\begin{{cases}} {a1}x + {b1}y = {c1} \\\\ {a2}x + {b2}y = {c2} \\end{{cases}}"
         solution = "Solve system"
@@ -72,8 +71,8 @@ class TheNumberSystemNaturalWholeIntegersRealRationalIrrationalGenerator:
     def _generate_hard(self):
         """Generate a hard problem."""
         # Complex system
-        a1, b1, c1 = random.randint(1, 3), random.randint(-5, 5), random.randint(-10, 10)
-        a2, b2, c2 = random.randint(1, 3), random.randint(-5, 5), random.randint(-10, 10)
+        a1, b1, c1 = self.rng.randint(1, 3), self.rng.randint(-5, 5), self.rng.randint(-10, 10)
+        a2, b2, c2 = self.rng.randint(1, 3), self.rng.randint(-5, 5), self.rng.randint(-10, 10)
 
         latex = f"\\begin{{cases}} {a1}x + {b1}y = {c1} \\\\ {a2}x + {b2}y = {c2} \\end{{cases}}"
         solution = "Solve system"
@@ -89,8 +88,8 @@ class TheNumberSystemNaturalWholeIntegersRealRationalIrrationalGenerator:
     def _generate_challenge(self):
         """Generate a challenge problem."""
         # Complex system
-        a1, b1, c1 = random.randint(1, 3), random.randint(-5, 5), random.randint(-10, 10)
-        a2, b2, c2 = random.randint(1, 3), random.randint(-5, 5), random.randint(-10, 10)
+        a1, b1, c1 = self.rng.randint(1, 3), self.rng.randint(-5, 5), self.rng.randint(-10, 10)
+        a2, b2, c2 = self.rng.randint(1, 3), self.rng.randint(-5, 5), self.rng.randint(-10, 10)
 
         latex = f"\\begin{{cases}} {a1}x + {b1}y = {c1} \\\\ {a2}x + {b2}y = {c2} \\end{{cases}}"
         solution = "Solve system"
@@ -5,9 +5,6 @@ Generates problems about classifying numbers (natural, whole, integers, rational
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 from equation_generator import Equation
 
 
@@ -49,8 +46,7 @@ class TheNumberSystemGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -73,19 +69,19 @@ class TheNumberSystemGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy: Basic classification of simple numbers."""
-        problem_type = random.choice(['classify', 'identify', 'true_false'])
+        problem_type = self.rng.choice(['classify', 'identify', 'true_false'])
 
         if problem_type == 'classify':
             # Classify a simple number
-            num_type = random.choice(['natural', 'whole', 'integer'])
+            num_type = self.rng.choice(['natural', 'whole', 'integer'])
             if num_type == 'natural':
-                num = random.randint(1, 20)
+                num = self.rng.randint(1, 20)
                 solution = "Natural, Whole, Integer, Rational, Real"
             elif num_type == 'whole':
                 num = 0
                 solution = "Whole, Integer, Rational, Real"
             else:
-                num = random.randint(-10, -1)
+                num = self.rng.randint(-10, -1)
                 solution = "Integer, Rational, Real"
 
             latex = f"\\text{{Classify the number: }} {num}"
@@ -93,7 +89,7 @@ class TheNumberSystemGenerator:
 
         elif problem_type == 'identify':
             # Which set does this number belong to?
-            num = random.randint(1, 10)
+            num = self.rng.randint(1, 10)
             latex = f"\\text{{Is }} {num} \\text{{ a natural number?}}"
             solution = "Yes"
             steps = [f"\\text{{{num} is a counting number, so it is natural}}"]
@@ -105,7 +101,7 @@ class TheNumberSystemGenerator:
                 ("Negative numbers are integers", "True"),
                 ("All integers are natural numbers", "False"),
             ]
-            statement, answer = random.choice(statements)
+            statement, answer = self.rng.choice(statements)
             latex = f"\\text{{True or False: {statement}}}"
             solution = answer
             steps = [f"\\text{{This statement is {answer.lower()}}}"]
@@ -114,12 +110,12 @@ class TheNumberSystemGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium: Rational numbers and fractions."""
-        problem_type = random.choice(['classify_fraction', 'classify_decimal', 'compare_sets'])
+        problem_type = self.rng.choice(['classify_fraction', 'classify_decimal', 'compare_sets'])
 
         if problem_type == 'classify_fraction':
-            num = random.randint(1, 9)
-            denom = random.randint(2, 9)
-            if random.choice([True, False]):
+            num = self.rng.randint(1, 9)
+            denom = self.rng.randint(2, 9)
+            if self.rng.choice([True, False]):
                 num = -num
 
             latex = f"\\text{{Classify: }} \\frac{{{num}}}{{{denom}}}"
@@ -137,7 +133,7 @@ class TheNumberSystemGenerator:
                 (-1.5, "Rational, Real", "-1.5 = -3/2"),
                 (0.75, "Rational, Real", "0.75 = 3/4"),
             ]
-            decimal, answer, explanation = random.choice(decimals)
+            decimal, answer, explanation = self.rng.choice(decimals)
 
             latex = f"\\text{{Classify: }} {decimal}"
             solution = answer
@@ -150,7 +146,7 @@ class TheNumberSystemGenerator:
                 ("integers", "rational numbers", "Integer \\subset Rational"),
                 ("rational numbers", "real numbers", "Rational \\subset Real"),
             ]
-            set1, set2, relationship = random.choice(comparisons)
+            set1, set2, relationship = self.rng.choice(comparisons)
 
             latex = f"\\text{{What is the relationship between {set1} and {set2}?}}"
             solution = f"{set1.capitalize()} is a subset of {set2}"
@@ -160,7 +156,7 @@ class TheNumberSystemGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard: Irrational numbers and edge cases."""
-        problem_type = random.choice(['irrational', 'sqrt_classify', 'multiple_sets'])
+        problem_type = self.rng.choice(['irrational', 'sqrt_classify', 'multiple_sets'])
 
         if problem_type == 'irrational':
             irrationals = [
@@ -169,7 +165,7 @@ class TheNumberSystemGenerator:
                 ("\\sqrt{3}", "Irrational, Real", "Square root of 3 is non-terminating, non-repeating"),
                 ("e", "Irrational, Real", "Euler's number is irrational"),
             ]
-            num, answer, explanation = random.choice(irrationals)
+            num, answer, explanation = self.rng.choice(irrationals)
 
             latex = f"\\text{{Classify: }} {num}"
             solution = answer
@@ -184,7 +180,7 @@ class TheNumberSystemGenerator:
                 (5, "\\sqrt{5}", "Irrational, Real"),
                 (16, "4", "Natural, Whole, Integer, Rational, Real"),
             ]
-            n, simplified, classification = random.choice(options)
+            n, simplified, classification = self.rng.choice(options)
 
             latex = f"\\text{{Classify }} \\sqrt{{{n}}}"
             solution = classification
@@ -195,7 +191,7 @@ class TheNumberSystemGenerator:
 
         else:  # multiple_sets
             # List all sets a number belongs to
-            num = random.randint(1, 10)
+            num = self.rng.randint(1, 10)
 
             latex = f"\\text{{List ALL number sets that }} {num} \\text{{ belongs to.}}"
             solution = "Natural, Whole, Integer, Rational, Real"
@@ -211,7 +207,7 @@ class TheNumberSystemGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge: Complex classification and reasoning."""
-        problem_type = random.choice(['venn_diagram', 'counterexample', 'always_sometimes'])
+        problem_type = self.rng.choice(['venn_diagram', 'counterexample', 'always_sometimes'])
 
         if problem_type == 'venn_diagram':
             # Describe the relationship between sets
@@ -230,7 +226,7 @@ class TheNumberSystemGenerator:
                 ("The sum of two irrational numbers is always irrational", "False",
                  "\\sqrt{2} + (-\\sqrt{2}) = 0 \\text{ is rational}"),
             ]
-            statement, answer, counterexample = random.choice(statements)
+            statement, answer, counterexample = self.rng.choice(statements)
 
             latex = f"\\text{{True or False: {statement}. If false, give counterexample.}}"
             solution = f"{answer}. {counterexample}" if answer == "False" else answer
@@ -243,7 +239,7 @@ class TheNumberSystemGenerator:
                 ("A real number is always rational", "Sometimes", "Irrational numbers are real but not rational"),
                 ("A natural number is always positive", "Always", "Natural numbers start at 1"),
             ]
-            statement, answer, explanation = random.choice(statements)
+            statement, answer, explanation = self.rng.choice(statements)
 
             latex = f"\\text{{Always, Sometimes, or Never: {statement}}}"
             solution = answer
@@ -5,9 +5,6 @@ Generates problems about recognizing and understanding variables
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class VariablesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the variables generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
         # Different contexts for variables
         self.contexts = {
@@ -71,9 +67,9 @@ class VariablesGenerator:
     def _generate_problem(self, difficulty: str) -> Equation:
         """Generate a single variable problem."""
         if difficulty == 'challenge':
-            problem_type = random.choice(['identify', 'meaning', 'substitute_concept', 'multi_context'])
+            problem_type = self.rng.choice(['identify', 'meaning', 'substitute_concept', 'multi_context'])
         else:
-            problem_type = random.choice(['identify', 'meaning', 'substitute_concept'])
+            problem_type = self.rng.choice(['identify', 'meaning', 'substitute_concept'])
 
         if problem_type == 'identify':
             return self._generate_identify_problem(difficulty)
@@ -86,7 +82,7 @@ class VariablesGenerator:
 
     def _generate_identify_problem(self, difficulty: str) -> Equation:
         """Generate a problem asking to identify variables in an expression."""
-        var, context = random.choice(self.contexts.get(difficulty, self.contexts['easy']))
+        var, context = self.rng.choice(self.contexts.get(difficulty, self.contexts['easy']))
 
         if difficulty == 'easy':
             # Simple: What is the variable in this expression?
@@ -96,36 +92,36 @@ class VariablesGenerator:
                 (f"{var} - 2", var),
                 (f"7 + {var}", var),
             ]
-            expr, solution = random.choice(expressions)
+            expr, solution = self.rng.choice(expressions)
             latex = f"\\text{{What is the variable in: }} {expr}?"
 
         elif difficulty == 'medium':
             # Multiple terms: Identify the variable
-            num1 = random.randint(2, 9)
-            num2 = random.randint(1, 9)
+            num1 = self.rng.randint(2, 9)
+            num2 = self.rng.randint(1, 9)
             expr = f"{num1}{var} + {num2}"
             latex = f"\\text{{Identify the variable in: }} {expr}"
             solution = var
 
         elif difficulty == 'hard':
             # Two potential variables, identify the actual variable
-            var2 = random.choice(['a', 'b', 'c', 'm', 'n', 'p'])
+            var2 = self.rng.choice(['a', 'b', 'c', 'm', 'n', 'p'])
             while var2 == var:
-                var2 = random.choice(['a', 'b', 'c', 'm', 'n', 'p'])
+                var2 = self.rng.choice(['a', 'b', 'c', 'm', 'n', 'p'])
 
-            num = random.randint(2, 12)
+            num = self.rng.randint(2, 12)
             latex = f"\\text{{In }} {num}{var} + {var2}, \\text{{ what represents the coefficient's variable?}}"
             solution = var
 
         else:  # challenge
             # Multiple variables in complex expression
             vars_list = ['x', 'y', 'z', 'w']
-            num_vars = random.randint(3, 4)
-            selected_vars = random.sample(vars_list, num_vars)
+            num_vars = self.rng.randint(3, 4)
+            selected_vars = self.rng.sample(vars_list, num_vars)
 
-            num1 = random.randint(2, 8)
-            num2 = random.randint(2, 8)
-            num3 = random.randint(2, 8)
+            num1 = self.rng.randint(2, 8)
+            num2 = self.rng.randint(2, 8)
+            num3 = self.rng.randint(2, 8)
 
             if num_vars == 3:
                 expr = f"{num1}{selected_vars[0]}^2 + {num2}{selected_vars[1]} - {num3}{selected_vars[2]}"
@@ -146,7 +142,7 @@ class VariablesGenerator:
 
     def _generate_meaning_problem(self, difficulty: str) -> Equation:
         """Generate a problem about what a variable represents."""
-        var, context = random.choice(self.contexts.get(difficulty, self.contexts['easy']))
+        var, context = self.rng.choice(self.contexts.get(difficulty, self.contexts['easy']))
 
         if difficulty == 'easy':
             latex = f"\\text{{If }} {var} \\text{{ represents {context}, what does it stand for?}}"
@@ -164,10 +160,10 @@ class VariablesGenerator:
 
         else:  # challenge
             # Multiple variables with complex relationships
-            var1, context1 = random.choice(self.contexts['challenge'])
-            var2, context2 = random.choice(self.contexts['challenge'])
+            var1, context1 = self.rng.choice(self.contexts['challenge'])
+            var2, context2 = self.rng.choice(self.contexts['challenge'])
             while var2 == var1:
-                var2, context2 = random.choice(self.contexts['challenge'])
+                var2, context2 = self.rng.choice(self.contexts['challenge'])
 
             latex = f"\\text{{What does }} {var1} \\cdot {var2} \\text{{ represent?}}"
             solution = f"{var1}={context1}, {var2}={context2}"
@@ -182,38 +178,38 @@ class VariablesGenerator:
 
     def _generate_substitute_concept_problem(self, difficulty: str) -> Equation:
         """Generate a conceptual problem about variable substitution."""
-        var = random.choice(['x', 'n', 'y', 'a'])
+        var = self.rng.choice(['x', 'n', 'y', 'a'])
 
         if difficulty == 'easy':
-            num = random.randint(1, 10)
+            num = self.rng.randint(1, 10)
             latex = f"\\text{{If }} {var} = {num}, \\text{{ what does }} {var} \\text{{ equal?}}"
             solution = str(num)
 
         elif difficulty == 'medium':
-            num1 = random.randint(2, 9)
-            num2 = random.randint(1, 9)
-            value = random.randint(2, 8)
+            num1 = self.rng.randint(2, 9)
+            num2 = self.rng.randint(1, 9)
+            value = self.rng.randint(2, 8)
             result = num1 * value + num2
             latex = f"\\text{{If }} {var} = {value} \\text{{ in }} {num1}{var} + {num2}, \\text{{ what is the result?}}"
             solution = str(result)
 
         elif difficulty == 'hard':
             # Multiple variables concept
-            num1 = random.randint(2, 6)
-            num2 = random.randint(2, 6)
-            value = random.randint(2, 5)
+            num1 = self.rng.randint(2, 6)
+            num2 = self.rng.randint(2, 6)
+            value = self.rng.randint(2, 5)
             result = num1 * value + num2 * value
             latex = f"\\text{{If both variables equal }} {value} \\text{{ in }} {num1}x + {num2}y, \\text{{ find the sum}}"
             solution = str(result)
 
         else:  # challenge
             # Three variables with different values
-            x_val = random.randint(3, 12)
-            y_val = random.randint(3, 12)
-            z_val = random.randint(3, 12)
-            a = random.randint(2, 5)
-            b = random.randint(2, 5)
-            c = random.randint(2, 5)
+            x_val = self.rng.randint(3, 12)
+            y_val = self.rng.randint(3, 12)
+            z_val = self.rng.randint(3, 12)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(2, 5)
+            c = self.rng.randint(2, 5)
             result = a * x_val + b * y_val - c * z_val
             latex = f"\\text{{Evaluate }} {a}x + {b}y - {c}z \\text{{ when }} x={x_val}, y={y_val}, z={z_val}"
             solution = str(result)
@@ -234,7 +230,7 @@ class VariablesGenerator:
             ("P", "power (W)", "V", "voltage (V)", "I", "current (A)", "P = V \\cdot I"),
         ]
 
-        var1, context1, var2, context2, var3, context3, formula = random.choice(contexts)
+        var1, context1, var2, context2, var3, context3, formula = self.rng.choice(contexts)
 
         latex = f"\\text{{In }} {formula}\\text{{, identify all variables}}"
         solution = f"{var1}={context1}, {var2}={context2}, {var3}={context3}"
@@ -28,8 +28,7 @@ class QuadraticGraphingGenerator:
 
     def __init__(self, seed=None):
         """Initialize the quadratic graphing generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[QuadraticGraphProblem]:
         """
@@ -103,13 +102,13 @@ class QuadraticGraphingGenerator:
 
     def _generate_easy(self) -> QuadraticGraphProblem:
         """Generate easy graphing problems (vertex form with integer coordinates)."""
-        form_type = random.choice(['vertex_simple', 'standard_simple', 'factored_simple'])
+        form_type = self.rng.choice(['vertex_simple', 'standard_simple', 'factored_simple'])
 
         if form_type == 'vertex_simple':
             # Vertex form: a(x - h)^2 + k
-            a = random.choice([-2, -1, 1, 2])
-            h = random.randint(-3, 3)
-            k = random.randint(-4, 4)
+            a = self.rng.choice([-2, -1, 1, 2])
+            h = self.rng.randint(-3, 3)
+            k = self.rng.randint(-4, 4)
 
             if a == 1:
                 if h == 0 and k == 0:
@@ -135,9 +134,9 @@ class QuadraticGraphingGenerator:
 
         elif form_type == 'standard_simple':
             # Standard form: ax^2 + bx + c
-            a = random.choice([-1, 1])
-            b = random.randint(-4, 4)
-            c = random.randint(-5, 5)
+            a = self.rng.choice([-1, 1])
+            b = self.rng.randint(-4, 4)
+            c = self.rng.randint(-5, 5)
 
             if a == 1:
                 if b == 0:
@@ -152,9 +151,9 @@ class QuadraticGraphingGenerator:
 
         else:  # factored_simple
             # Factored form: a(x - r1)(x - r2)
-            a = random.choice([-1, 1])
-            r1 = random.randint(-3, 3)
-            r2 = random.randint(-3, 3)
+            a = self.rng.choice([-1, 1])
+            r1 = self.rng.randint(-3, 3)
+            r2 = self.rng.randint(-3, 3)
 
             if a == 1:
                 latex = f"\\text{{Graph: }} y = (x {-r1:+d})(x {-r2:+d})".replace("+-", "-")
@@ -182,13 +181,13 @@ class QuadraticGraphingGenerator:
 
     def _generate_medium(self) -> QuadraticGraphProblem:
         """Generate medium graphing problems (with coefficients, transformations)."""
-        form_type = random.choice(['vertex_transform', 'standard_complete', 'factored_stretch'])
+        form_type = self.rng.choice(['vertex_transform', 'standard_complete', 'factored_stretch'])
 
         if form_type == 'vertex_transform':
             # Vertex form with stretching/compression
-            a = random.choice([-3, -2, -0.5, 0.5, 2, 3])
-            h = random.randint(-4, 4)
-            k = random.randint(-6, 6)
+            a = self.rng.choice([-3, -2, -0.5, 0.5, 2, 3])
+            h = self.rng.randint(-4, 4)
+            k = self.rng.randint(-6, 6)
 
             if abs(a) < 1:
                 a_str = f"\\frac{{1}}{{{int(1/abs(a))}}}"
@@ -210,10 +209,10 @@ class QuadraticGraphingGenerator:
 
         elif form_type == 'standard_complete':
             # Standard form that requires completing the square
-            a = random.choice([-2, -1, 1, 2])
+            a = self.rng.choice([-2, -1, 1, 2])
             # Make b even for easier completing the square
-            b = 2 * random.randint(-3, 3)
-            c = random.randint(-8, 8)
+            b = 2 * self.rng.randint(-3, 3)
+            c = self.rng.randint(-8, 8)
 
             if a == 1:
                 latex = f"\\text{{Graph: }} y = x^2 {b:+d}x {c:+d}".replace("+-", "-")
@@ -225,9 +224,9 @@ class QuadraticGraphingGenerator:
 
         else:  # factored_stretch
             # Factored form with coefficient
-            a = random.choice([-2, 2, 3])
-            r1 = random.randint(-4, 4)
-            r2 = random.randint(-4, 4)
+            a = self.rng.choice([-2, 2, 3])
+            r1 = self.rng.randint(-4, 4)
+            r2 = self.rng.randint(-4, 4)
 
             latex = f"\\text{{Graph: }} y = {a}(x {-r1:+d})(x {-r2:+d})".replace("+-", "-")
 
@@ -252,13 +251,13 @@ class QuadraticGraphingGenerator:
 
     def _generate_hard(self) -> QuadraticGraphProblem:
         """Generate hard graphing problems (multiple forms, word problems)."""
-        form_type = random.choice(['convert_forms', 'from_description', 'application'])
+        form_type = self.rng.choice(['convert_forms', 'from_description', 'application'])
 
         if form_type == 'convert_forms':
             # Give equation in one form, ask to graph and convert
-            a = random.choice([-2, -1, 1, 2])
-            h = random.randint(-3, 3)
-            k = random.randint(-5, 5)
+            a = self.rng.choice([-2, -1, 1, 2])
+            h = self.rng.randint(-3, 3)
+            k = self.rng.randint(-5, 5)
 
             # Start with vertex form
             vertex_form = f"y = {a if a != 1 else ''}(x {-h:+d})^2 {k:+d}".replace("+-", "-")
@@ -276,10 +275,10 @@ class QuadraticGraphingGenerator:
 
         elif form_type == 'from_description':
             # Create parabola from description
-            vertex_h = random.randint(-3, 3)
-            vertex_k = random.randint(-4, 4)
-            opens = random.choice(['upward', 'downward'])
-            a = random.choice([1, 2]) if opens == 'upward' else random.choice([-1, -2])
+            vertex_h = self.rng.randint(-3, 3)
+            vertex_k = self.rng.randint(-4, 4)
+            opens = self.rng.choice(['upward', 'downward'])
+            a = self.rng.choice([1, 2]) if opens == 'upward' else self.rng.choice([-1, -2])
 
             latex = f"\\text{{Graph parabola with vertex ({vertex_h}, {vertex_k}) opening {opens}}}"
 
@@ -292,8 +291,8 @@ class QuadraticGraphingGenerator:
 
         else:  # application
             # Application problem (projectile motion)
-            v0 = random.choice([32, 48, 64])  # Initial velocity
-            h0 = random.choice([0, 16, 32])  # Initial height
+            v0 = self.rng.choice([32, 48, 64])  # Initial velocity
+            h0 = self.rng.choice([0, 16, 32])  # Initial height
 
             latex = f"\\text{{Graph height of projectile: }} h(t) = -16t^2 + {v0}t + {h0}"
 
@@ -316,15 +315,15 @@ class QuadraticGraphingGenerator:
 
     def _generate_challenge(self) -> QuadraticGraphProblem:
         """Generate challenge graphing problems (transformations, systems)."""
-        form_type = random.choice(['transformation_sequence', 'find_equation', 'system_quadratic'])
+        form_type = self.rng.choice(['transformation_sequence', 'find_equation', 'system_quadratic'])
 
         if form_type == 'transformation_sequence':
             # Apply sequence of transformations
             # Start with y = x^2, apply transformations
             shifts = {
-                'right': random.randint(1, 3),
-                'up': random.randint(-4, 4),
-                'stretch': random.choice([0.5, 2, 3])
+                'right': self.rng.randint(1, 3),
+                'up': self.rng.randint(-4, 4),
+                'stretch': self.rng.choice([0.5, 2, 3])
             }
 
             h = shifts['right']
@@ -351,10 +350,10 @@ class QuadraticGraphingGenerator:
 
         elif form_type == 'find_equation':
             # Find equation from given points
-            vertex = (random.randint(-3, 3), random.randint(-4, 4))
+            vertex = (self.rng.randint(-3, 3), self.rng.randint(-4, 4))
             # Another point on the parabola
-            other_x = vertex[0] + random.randint(1, 3)
-            a = random.choice([-2, -1, 1, 2])
+            other_x = vertex[0] + self.rng.randint(1, 3)
+            a = self.rng.choice([-2, -1, 1, 2])
             other_y = a * (other_x - vertex[0]) ** 2 + vertex[1]
 
             latex = f"\\text{{Find and graph parabola with vertex {vertex} passing through ({other_x}, {other_y})}}"
@@ -370,11 +369,11 @@ class QuadraticGraphingGenerator:
         else:  # system_quadratic
             # System with quadratic and linear
             # Parabola y = x^2 + bx + c
-            b = random.randint(-4, 4)
-            c = random.randint(-3, 3)
+            b = self.rng.randint(-4, 4)
+            c = self.rng.randint(-3, 3)
             # Line y = mx + n
-            m = random.randint(-2, 2)
-            n = random.randint(-3, 3)
+            m = self.rng.randint(-2, 2)
+            n = self.rng.randint(-3, 3)
 
             latex = f"\\text{{Graph system: }} y = x^2 {b:+d}x {c:+d} \\text{{ and }} y = {m}x {n:+d}".replace("+-", "-")
 
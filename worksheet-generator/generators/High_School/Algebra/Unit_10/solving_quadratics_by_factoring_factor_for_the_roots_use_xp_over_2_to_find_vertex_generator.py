@@ -11,8 +11,7 @@ class SolvingQuadraticsByFactoringFactorForTheRootsUseXPlusPOver2ToFindVertexGen
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int):
         """Generate worksheet problems."""
@@ -36,8 +35,8 @@ class SolvingQuadraticsByFactoringFactorForTheRootsUseXPlusPOver2ToFindVertexGen
     def _generate_easy(self):
         """Generate an easy problem."""
         # Polynomial problem
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"x^2 + {a+b}x + {a*b}"
         solution = f"(x + {a})(x + {b})"
@@ -53,9 +52,9 @@ class SolvingQuadraticsByFactoringFactorForTheRootsUseXPlusPOver2ToFindVertexGen
     def _generate_medium(self):
         """Generate a medium problem."""
         # Complex polynomial
-        a = random.randint(2, 5)
-        b = random.randint(-5, 5)
-        c = random.randint(-10, 10)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(-5, 5)
+        c = self.rng.randint(-10, 10)
 
         latex = f"{a}x^2 + {b}x + {c}"
         solution = "Factored form"
@@ -71,9 +70,9 @@ class SolvingQuadraticsByFactoringFactorForTheRootsUseXPlusPOver2ToFindVertexGen
     def _generate_hard(self):
         """Generate a hard problem."""
         # Complex polynomial
-        a = random.randint(2, 5)
-        b = random.randint(-5, 5)
-        c = random.randint(-10, 10)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(-5, 5)
+        c = self.rng.randint(-10, 10)
 
         latex = f"{a}x^2 + {b}x + {c}"
         solution = "Factored form"
@@ -89,9 +88,9 @@ class SolvingQuadraticsByFactoringFactorForTheRootsUseXPlusPOver2ToFindVertexGen
     def _generate_challenge(self):
         """Generate a challenge problem."""
         # Complex polynomial
-        a = random.randint(2, 5)
-        b = random.randint(-5, 5)
-        c = random.randint(-10, 10)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(-5, 5)
+        c = self.rng.randint(-10, 10)
 
         latex = f"{a}x^2 + {b}x + {c}"
         solution = "Factored form"
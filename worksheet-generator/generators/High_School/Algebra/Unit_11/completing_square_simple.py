@@ -3,10 +3,7 @@ Simplified Completing the Square Generator
 """
 
 import random
-import sys
-import os
 from math import sqrt
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 from typing import List
 
@@ -16,8 +13,7 @@ class CompletingSquareSimpleGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate a worksheet of completing the square problems."""
@@ -36,8 +32,8 @@ class CompletingSquareSimpleGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy: x² + bx = c (b is even)"""
-        b = random.choice([2, 4, 6, 8, -2, -4, -6, -8])
-        c = random.randint(-10, 10)
+        b = self.rng.choice([2, 4, 6, 8, -2, -4, -6, -8])
+        c = self.rng.randint(-10, 10)
 
         # Create LaTeX
         if b > 0:
@@ -63,10 +59,10 @@ class CompletingSquareSimpleGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium: x² + bx + c = 0 (b can be odd)"""
-        b = random.randint(-12, 12)
+        b = self.rng.randint(-12, 12)
         while b == 0:
-            b = random.randint(-12, 12)
-        c = random.randint(-20, 20)
+            b = self.rng.randint(-12, 12)
+        c = self.rng.randint(-20, 20)
 
         # Create LaTeX
         latex = "x^2"
@@ -100,11 +96,11 @@ class CompletingSquareSimpleGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard: ax² + bx + c = 0 (a ≠ 1)"""
-        a = random.choice([2, 3, 4, -2, -3])
-        b = random.randint(-20, 20)
+        a = self.rng.choice([2, 3, 4, -2, -3])
+        b = self.rng.randint(-20, 20)
         while b == 0:
-            b = random.randint(-20, 20)
-        c = random.randint(-30, 30)
+            b = self.rng.randint(-20, 20)
+        c = self.rng.randint(-30, 30)
 
         # Create LaTeX
         if a == 1:
@@ -144,14 +140,14 @@ class CompletingSquareSimpleGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge: complex forms"""
-        a = random.choice([2, 3, -2, -3])
-        b = random.randint(-30, 30)
+        a = self.rng.choice([2, 3, -2, -3])
+        b = self.rng.randint(-30, 30)
         while b == 0:
-            b = random.randint(-30, 30)
-        c = random.randint(-40, 40)
-        d = random.randint(-20, 20)
+            b = self.rng.randint(-30, 30)
+        c = self.rng.randint(-40, 40)
+        d = self.rng.randint(-20, 20)
         while d == 0:
-            d = random.randint(-20, 20)
+            d = self.rng.randint(-20, 20)
 
         # Create equation: ax² + bx + c = d
         if a == 1:
@@ -3,9 +3,6 @@ Generator for Completing the Square problems.
 """
 
 import random
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 from typing import List
 
@@ -15,8 +12,7 @@ class CompletingTheSquareGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -63,8 +59,8 @@ class CompletingTheSquareGenerator:
         x² + bx = c (where b is even)
         """
         # Generate coefficients
-        b = random.choice([2, 4, 6, 8, 10, -2, -4, -6, -8, -10])
-        c = random.randint(-20, 20)
+        b = self.rng.choice([2, 4, 6, 8, 10, -2, -4, -6, -8, -10])
+        c = self.rng.randint(-20, 20)
 
         # Calculate the value to complete the square
         half_b = b // 2
@@ -121,10 +117,10 @@ class CompletingTheSquareGenerator:
         x² + bx + c = 0 (b can be odd)
         """
         # Generate coefficients
-        b = random.randint(-12, 12)
+        b = self.rng.randint(-12, 12)
         while b == 0:
-            b = random.randint(-12, 12)
-        c = random.randint(-30, 30)
+            b = self.rng.randint(-12, 12)
+        c = self.rng.randint(-30, 30)
 
         # Calculate the value to complete the square
         if b % 2 == 0:
@@ -190,11 +186,11 @@ class CompletingTheSquareGenerator:
         ax² + bx + c = 0 (a ≠ 1)
         """
         # Generate coefficients
-        a = random.choice([2, 3, 4, 5, -2, -3, -4, -5])
-        b = random.randint(-20, 20)
+        a = self.rng.choice([2, 3, 4, 5, -2, -3, -4, -5])
+        b = self.rng.randint(-20, 20)
         while b == 0:
-            b = random.randint(-20, 20)
-        c = random.randint(-30, 30)
+            b = self.rng.randint(-20, 20)
+        c = self.rng.randint(-30, 30)
 
         # Problem text
         if a == 1:
@@ -252,14 +248,14 @@ class CompletingTheSquareGenerator:
         ax² + bx + c = d (both sides non-zero, complex coefficients)
         """
         # Generate coefficients
-        a = random.choice([2, 3, 4, 5, 6, -2, -3, -4, -5, -6])
-        b = random.randint(-30, 30)
+        a = self.rng.choice([2, 3, 4, 5, 6, -2, -3, -4, -5, -6])
+        b = self.rng.randint(-30, 30)
         while b == 0:
-            b = random.randint(-30, 30)
-        c = random.randint(-40, 40)
-        d = random.randint(-20, 20)
+            b = self.rng.randint(-30, 30)
+        c = self.rng.randint(-40, 40)
+        d = self.rng.randint(-20, 20)
         while d == 0:
-            d = random.randint(-20, 20)
+            d = self.rng.randint(-20, 20)
 
         # Problem text
         left_side = ""
@@ -11,8 +11,7 @@ class QuadraticFormulaHardToUseTheThreeMainMethodsAndCompletingTheSquareGenerato
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int):
         """Generate worksheet problems."""
@@ -36,7 +35,7 @@ class QuadraticFormulaHardToUseTheThreeMainMethodsAndCompletingTheSquareGenerato
     def _generate_easy(self):
         """Generate an easy problem."""
         # Quadratic equation
-        a = random.randint(1, 3)
+        a = self.rng.randint(1, 3)
 
         latex = f"x^2 = {a**2}"
         solution = f"x = ±{a}"
@@ -52,9 +51,9 @@ class QuadraticFormulaHardToUseTheThreeMainMethodsAndCompletingTheSquareGenerato
     def _generate_medium(self):
         """Generate a medium problem."""
         # Complex quadratic
-        a = random.randint(1, 3)
-        b = random.randint(-5, 5)
-        c = random.randint(-10, 10)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(-5, 5)
+        c = self.rng.randint(-10, 10)
 
         latex = f"{a}x^2 + {b}x + {c} = 0"
         # Use quadratic formula
@@ -72,9 +71,9 @@ class QuadraticFormulaHardToUseTheThreeMainMethodsAndCompletingTheSquareGenerato
     def _generate_hard(self):
         """Generate a hard problem."""
         # Complex quadratic
-        a = random.randint(1, 3)
-        b = random.randint(-5, 5)
-        c = random.randint(-10, 10)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(-5, 5)
+        c = self.rng.randint(-10, 10)
 
         latex = f"{a}x^2 + {b}x + {c} = 0"
         # Use quadratic formula
@@ -92,9 +91,9 @@ class QuadraticFormulaHardToUseTheThreeMainMethodsAndCompletingTheSquareGenerato
     def _generate_challenge(self):
         """Generate a challenge problem."""
         # Complex quadratic
-        a = random.randint(1, 3)
-        b = random.randint(-5, 5)
-        c = random.randint(-10, 10)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(-5, 5)
+        c = self.rng.randint(-10, 10)
 
         latex = f"{a}x^2 + {b}x + {c} = 0"
         # Use quadratic formula
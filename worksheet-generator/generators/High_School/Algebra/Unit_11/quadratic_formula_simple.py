@@ -3,10 +3,7 @@ Simplified Quadratic Formula Generator
 """
 
 import random
-import sys
-import os
 from math import sqrt
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 from typing import List
 
@@ -16,8 +13,7 @@ class QuadraticFormulaSimpleGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate a worksheet of quadratic formula problems."""
@@ -37,8 +33,8 @@ class QuadraticFormulaSimpleGenerator:
     def _generate_easy(self) -> Equation:
         """Generate easy: x² + bx + c = 0 with integer solutions"""
         # Generate two integer roots
-        root1 = random.randint(-8, 8)
-        root2 = random.randint(-8, 8)
+        root1 = self.rng.randint(-8, 8)
+        root2 = self.rng.randint(-8, 8)
 
         # Calculate coefficients from roots: (x - root1)(x - root2) = 0
         a = 1
@@ -70,11 +66,11 @@ class QuadraticFormulaSimpleGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium: ax² + bx + c = 0 with a ≠ 1"""
-        a = random.choice([2, 3, 4, -2, -3])
+        a = self.rng.choice([2, 3, 4, -2, -3])
 
         # Generate rational roots
-        root1 = random.choice([-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5])
-        root2 = random.choice([-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5])
+        root1 = self.rng.choice([-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5])
+        root2 = self.rng.choice([-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5])
 
         # Calculate b and c from roots
         b = -a * (root1 + root2)
@@ -111,14 +107,14 @@ class QuadraticFormulaSimpleGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard: ax² + bx + c = 0 with irrational solutions"""
-        a = random.choice([1, 2, 3])
-        b = random.choice([1, 2, 3, 4, 5, -1, -2, -3, -4, -5])
+        a = self.rng.choice([1, 2, 3])
+        b = self.rng.choice([1, 2, 3, 4, 5, -1, -2, -3, -4, -5])
 
         # Choose c to make discriminant positive but not perfect square
         max_c = int(b**2 / (4*a)) - 1
         if max_c > 10:
             max_c = 10
-        c = random.randint(-10, max_c) if max_c > -10 else random.randint(-10, -1)
+        c = self.rng.randint(-10, max_c) if max_c > -10 else self.rng.randint(-10, -1)
 
         # Create LaTeX
         if a == 1:
@@ -156,10 +152,10 @@ class QuadraticFormulaSimpleGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge: needs rearranging first"""
-        a = random.choice([2, 3, -2, -3])
-        b1 = random.randint(1, 10)
-        b2 = random.randint(1, 10)
-        c = random.randint(-15, 15)
+        a = self.rng.choice([2, 3, -2, -3])
+        b1 = self.rng.randint(1, 10)
+        b2 = self.rng.randint(1, 10)
+        c = self.rng.randint(-15, 15)
 
         # Create equation: ax² + b1x = b2x + c
         if a == 1:
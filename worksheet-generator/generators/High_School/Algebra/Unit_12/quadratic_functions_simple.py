@@ -3,9 +3,6 @@ Simplified Quadratic Functions Generator
 """
 
 import random
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 from typing import List
 
@@ -15,8 +12,7 @@ class QuadraticFunctionsSimpleGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate a worksheet of quadratic functions problems."""
@@ -35,12 +31,12 @@ class QuadraticFunctionsSimpleGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy: Find vertex, axis of symmetry, or direction"""
-        problem_type = random.choice(['vertex', 'axis', 'direction'])
+        problem_type = self.rng.choice(['vertex', 'axis', 'direction'])
 
         # Generate simple quadratic in vertex form
-        h = random.randint(-5, 5)
-        k = random.randint(-10, 10)
-        a = random.choice([-2, -1, 1, 2])
+        h = self.rng.randint(-5, 5)
+        k = self.rng.randint(-10, 10)
+        a = self.rng.choice([-2, -1, 1, 2])
 
         # Format function
         if a == 1:
@@ -81,20 +77,20 @@ class QuadraticFunctionsSimpleGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium: Find x-intercepts or y-intercept"""
-        problem_type = random.choice(['x_int', 'y_int'])
+        problem_type = self.rng.choice(['x_int', 'y_int'])
 
         if problem_type == 'x_int':
             # Use factored form
-            root1 = random.randint(-8, 8)
-            root2 = random.randint(-8, 8)
+            root1 = self.rng.randint(-8, 8)
+            root2 = self.rng.randint(-8, 8)
 
             latex = f"\\text{{Find x-intercepts of }} f(x) = (x - {root1})(x - {root2})"
             solution = min(root1, root2)  # Return smaller root
 
         else:  # y_int
-            a = random.choice([1, -1, 2])
-            b = random.randint(-10, 10)
-            c = random.randint(-15, 15)
+            a = self.rng.choice([1, -1, 2])
+            b = self.rng.randint(-10, 10)
+            c = self.rng.randint(-15, 15)
 
             if a == 1:
                 func = "f(x) = x^2"
@@ -125,9 +121,9 @@ class QuadraticFunctionsSimpleGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard: Find maximum/minimum value"""
-        a = random.choice([-2, -1, 1, 2])
-        h = random.randint(-5, 5)
-        k = random.randint(-10, 10)
+        a = self.rng.choice([-2, -1, 1, 2])
+        h = self.rng.randint(-5, 5)
+        k = self.rng.randint(-10, 10)
 
         # Format function
         if a == 1:
@@ -165,8 +161,8 @@ class QuadraticFunctionsSimpleGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge: Word problem with projectile motion"""
-        v0 = random.choice([32, 48, 64])  # Initial velocity
-        h0 = random.choice([0, 10, 20])   # Initial height
+        v0 = self.rng.choice([32, 48, 64])  # Initial velocity
+        h0 = self.rng.choice([0, 10, 20])   # Initial height
 
         latex = f"\\text{{Ball thrown up at }} {v0} \\text{{ ft/s from }} {h0} \\text{{ ft. Max height?}}"
 
@@ -5,9 +5,6 @@ Generates problems about evaluating absolute value expressions
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class AbsoluteValueGenerator:
 
     def __init__(self, seed=None):
         """Initialize the absolute value generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -49,7 +45,7 @@ class AbsoluteValueGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate simple absolute value: |a|"""
-        value = random.randint(-20, 20)
+        value = self.rng.randint(-20, 20)
 
         latex = f"|{value}|"
         solution = abs(value)
@@ -58,9 +54,9 @@ class AbsoluteValueGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate absolute value with simple arithmetic: |a + b| or |a - b|"""
-        a = random.randint(-15, 15)
-        b = random.randint(-15, 15)
-        op = random.choice(['+', '-'])
+        a = self.rng.randint(-15, 15)
+        b = self.rng.randint(-15, 15)
+        op = self.rng.choice(['+', '-'])
 
         if op == '+':
             latex = f"|{a} + {b}|"
@@ -73,8 +69,8 @@ class AbsoluteValueGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate absolute value with multiplication: |a × b|"""
-        a = random.randint(-12, 12)
-        b = random.randint(-12, 12)
+        a = self.rng.randint(-12, 12)
+        b = self.rng.randint(-12, 12)
 
         latex = f"|{a} \\times {b}|"
         solution = abs(a * b)
@@ -83,8 +79,8 @@ class AbsoluteValueGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate nested absolute values: ||a| - |b||"""
-        a = random.randint(-15, 15)
-        b = random.randint(-15, 15)
+        a = self.rng.randint(-15, 15)
+        b = self.rng.randint(-15, 15)
 
         latex = f"||{a}| - |{b}||"
         solution = abs(abs(a) - abs(b))
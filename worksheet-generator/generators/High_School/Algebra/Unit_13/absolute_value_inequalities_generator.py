@@ -5,9 +5,6 @@ Generates problems for solving |x| < a, |x| > a, and more complex forms
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class AbsoluteValueInequalitiesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the absolute value inequalities generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -49,8 +45,8 @@ class AbsoluteValueInequalitiesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate simple absolute value inequality: |x| < a or |x| > a"""
-        a = random.randint(3, 12)
-        inequality_type = random.choice(['less', 'greater', 'leq', 'geq'])
+        a = self.rng.randint(3, 12)
+        inequality_type = self.rng.choice(['less', 'greater', 'leq', 'geq'])
 
         if inequality_type == 'less':
             latex = f"|x| < {a}"
@@ -69,12 +65,12 @@ class AbsoluteValueInequalitiesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate absolute value inequality with linear expression: |x + b| < a"""
-        a = random.randint(4, 10)
-        b = random.randint(-8, 8)
+        a = self.rng.randint(4, 10)
+        b = self.rng.randint(-8, 8)
         if b == 0:
             b = 3
 
-        inequality_type = random.choice(['less', 'greater'])
+        inequality_type = self.rng.choice(['less', 'greater'])
 
         if b > 0:
             expr = f"x + {b}"
@@ -96,11 +92,11 @@ class AbsoluteValueInequalitiesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate absolute value inequality with coefficient: |ax + b| < c"""
-        a = random.randint(2, 4)
-        b = random.randint(-10, 10)
-        c = random.randint(6, 15)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(-10, 10)
+        c = self.rng.randint(6, 15)
 
-        inequality_type = random.choice(['less', 'greater', 'leq', 'geq'])
+        inequality_type = self.rng.choice(['less', 'greater', 'leq', 'geq'])
 
         if b >= 0:
             expr = f"{a}x + {b}" if a > 1 else f"x + {b}"
@@ -134,13 +130,13 @@ class AbsoluteValueInequalitiesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate complex absolute value inequality: |ax + b| < |cx + d|"""
-        problem_type = random.choice(['double_abs', 'nested', 'compound'])
+        problem_type = self.rng.choice(['double_abs', 'nested', 'compound'])
 
         if problem_type == 'double_abs':
-            a = random.randint(2, 4)
-            b = random.randint(-5, 5)
-            c = random.randint(1, 3)
-            d = random.randint(-5, 5)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(-5, 5)
+            c = self.rng.randint(1, 3)
+            d = self.rng.randint(-5, 5)
 
             if b >= 0:
                 expr1 = f"{a}x + {b}" if a > 1 else f"x + {b}"
@@ -157,8 +153,8 @@ class AbsoluteValueInequalitiesGenerator:
             solution = "\\text{Solve by cases}"
 
         elif problem_type == 'nested':
-            a = random.randint(3, 8)
-            b = random.randint(2, 5)
+            a = self.rng.randint(3, 8)
+            b = self.rng.randint(2, 5)
             latex = f"||x| - {a}| < {b}"
             # |x| - a < b and |x| - a > -b
             # |x| < a + b and |x| > a - b
@@ -170,9 +166,9 @@ class AbsoluteValueInequalitiesGenerator:
                 solution = f"x < -{upper} \\text{{ or }} x > {upper} \\text{{ or }} -{lower} < x < {lower}"
 
         else:  # compound
-            a = random.randint(2, 6)
-            b = random.randint(1, 4)
-            c = random.randint(8, 12)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 4)
+            c = self.rng.randint(8, 12)
             latex = f"{b} < |x + {a}| < {c}"
             # b < |x + a| < c means |x + a| > b AND |x + a| < c
             # For |x + a| > b: x + a < -b or x + a > b
@@ -5,9 +5,6 @@ Creates problems about building and writing geometric sequences
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class ConstructingGeometricSequencesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -40,9 +36,9 @@ class ConstructingGeometricSequencesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy: Write first n terms given a1 and r"""
-        a1 = random.choice([2, 3, 4, 5])
-        r = random.choice([2, 3, 0.5])
-        n = random.randint(4, 5)
+        a1 = self.rng.choice([2, 3, 4, 5])
+        r = self.rng.choice([2, 3, 0.5])
+        n = self.rng.randint(4, 5)
 
         latex = f"\\text{{Write the first }} {n} \\text{{ terms of geometric sequence with }} a_1 = {a1}, r = {r}"
 
@@ -74,12 +70,12 @@ class ConstructingGeometricSequencesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium: Find a1 and r, then write sequence"""
-        problem_type = random.choice(['two_terms', 'explicit_formula', 'word_problem'])
+        problem_type = self.rng.choice(['two_terms', 'explicit_formula', 'word_problem'])
 
         if problem_type == 'two_terms':
             # Given two terms, find a1 and r
-            a1 = random.choice([2, 3, 4])
-            r = random.choice([2, 3])
+            a1 = self.rng.choice([2, 3, 4])
+            r = self.rng.choice([2, 3])
             
             # Give 1st and 3rd term
             term1 = a1
@@ -102,8 +98,8 @@ class ConstructingGeometricSequencesGenerator:
 
         elif problem_type == 'explicit_formula':
             # Given explicit formula, write terms
-            a1 = random.choice([2, 3, 5])
-            r = random.choice([2, 3, -2])
+            a1 = self.rng.choice([2, 3, 5])
+            r = self.rng.choice([2, 3, -2])
             
             latex = f"\\text{{Write first 5 terms of }} a_n = {a1} \\cdot {r}^{{n-1}}"
 
@@ -120,8 +116,8 @@ class ConstructingGeometricSequencesGenerator:
 
         else:  # word_problem
             # Growth/decay scenario
-            initial = random.choice([100, 200, 500, 1000])
-            r = random.choice([2, 0.5, 0.75])
+            initial = self.rng.choice([100, 200, 500, 1000])
+            r = self.rng.choice([2, 0.5, 0.75])
             periods = 4
 
             if r > 1:
@@ -155,12 +151,12 @@ class ConstructingGeometricSequencesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard: Complex construction with negative ratios or fractions"""
-        problem_type = random.choice(['negative_ratio', 'fraction_ratio', 'reverse_engineer'])
+        problem_type = self.rng.choice(['negative_ratio', 'fraction_ratio', 'reverse_engineer'])
 
         if problem_type == 'negative_ratio':
             # Alternating sequence
-            a1 = random.choice([3, 4, 5])
-            r = random.choice([-2, -3])
+            a1 = self.rng.choice([3, 4, 5])
+            r = self.rng.choice([-2, -3])
             n = 6
 
             latex = f"\\text{{Write first }} {n} \\text{{ terms: }} a_1 = {a1}, r = {r}"
@@ -177,8 +173,8 @@ class ConstructingGeometricSequencesGenerator:
 
         elif problem_type == 'fraction_ratio':
             # Fractional ratio
-            a1 = random.choice([16, 32, 64])
-            r = random.choice([0.5, 0.25])
+            a1 = self.rng.choice([16, 32, 64])
+            r = self.rng.choice([0.5, 0.25])
             n = 5
 
             latex = f"\\text{{Write first }} {n} \\text{{ terms: }} a_1 = {a1}, r = {r}"
@@ -193,9 +189,9 @@ class ConstructingGeometricSequencesGenerator:
 
         else:  # reverse_engineer
             # Given nth term, find sequence
-            a1 = random.choice([2, 3])
-            r = random.choice([2, 3])
-            n = random.randint(4, 5)
+            a1 = self.rng.choice([2, 3])
+            r = self.rng.choice([2, 3])
+            n = self.rng.randint(4, 5)
             an = a1 * (r ** (n - 1))
 
             latex = f"\\text{{A geometric sequence has }} a_1 = {a1} \\text{{ and }} a_{n} = {an}. "
@@ -227,11 +223,11 @@ class ConstructingGeometricSequencesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge: Complex scenarios with multiple constraints"""
-        problem_type = random.choice(['sum_constraint', 'product_constraint', 'mixed_sequence'])
+        problem_type = self.rng.choice(['sum_constraint', 'product_constraint', 'mixed_sequence'])
 
         if problem_type == 'sum_constraint':
             # Given sum of first few terms
-            a1 = random.choice([2, 3, 4])
+            a1 = self.rng.choice([2, 3, 4])
             r = 2
             n = 4
             
@@ -251,8 +247,8 @@ class ConstructingGeometricSequencesGenerator:
 
         elif problem_type == 'product_constraint':
             # Given product of certain terms
-            a1 = random.choice([2, 3])
-            r = random.choice([2, 3])
+            a1 = self.rng.choice([2, 3])
+            r = self.rng.choice([2, 3])
             n = 5
 
             latex = f"\\text{{Construct geometric sequence with }} a_1 = {a1}, r = {r}, {n} \\text{{ terms}}"
@@ -270,7 +266,7 @@ class ConstructingGeometricSequencesGenerator:
 
         else:  # mixed_sequence
             # Geometric sequence embedded in larger pattern
-            a1 = random.choice([1, 2])
+            a1 = self.rng.choice([1, 2])
             r = 3
             n = 5
 
@@ -5,9 +5,6 @@ Creates real-world problems using arithmetic and geometric sequences
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class ModelingWithSequencesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -41,12 +37,12 @@ class ModelingWithSequencesGenerator:
     def _generate_easy(self) -> Equation:
         """Generate easy: Simple linear growth/savings (arithmetic)"""
         problem_types = ['savings', 'growth', 'debt_payment']
-        problem_type = random.choice(problem_types)
+        problem_type = self.rng.choice(problem_types)
 
         if problem_type == 'savings':
-            initial = random.choice([50, 100, 150])
-            weekly = random.choice([10, 15, 20, 25])
-            weeks = random.randint(4, 6)
+            initial = self.rng.choice([50, 100, 150])
+            weekly = self.rng.choice([10, 15, 20, 25])
+            weeks = self.rng.randint(4, 6)
 
             latex = f"\\text{{Sarah saves }} \\${initial} \\text{{ initially and adds }} \\${weekly} \\text{{ each week. "
             latex += f"\\text{{How much after }} {weeks} \\text{{ weeks?}}"
@@ -63,9 +59,9 @@ class ModelingWithSequencesGenerator:
             ]
 
         elif problem_type == 'growth':
-            initial = random.choice([100, 150, 200])
-            daily = random.choice([5, 10, 15])
-            days = random.randint(5, 8)
+            initial = self.rng.choice([100, 150, 200])
+            daily = self.rng.choice([5, 10, 15])
+            days = self.rng.randint(5, 8)
 
             latex = f"\\text{{A plant is }} {initial}\\text{{mm tall and grows }} {daily}\\text{{mm per day. "
             latex += f"\\text{{Height after }} {days} \\text{{ days?}}"
@@ -80,9 +76,9 @@ class ModelingWithSequencesGenerator:
             ]
 
         else:  # debt_payment
-            initial = random.choice([500, 600, 800, 1000])
-            monthly = random.choice([50, 75, 100])
-            months = random.randint(3, 5)
+            initial = self.rng.choice([500, 600, 800, 1000])
+            monthly = self.rng.choice([50, 75, 100])
+            months = self.rng.randint(3, 5)
 
             latex = f"\\text{{A debt of }} \\${initial} \\text{{ decreases by }} \\${monthly} \\text{{ per month. "
             latex += f"\\text{{Amount remaining after }} {months} \\text{{ months?}}"
@@ -106,12 +102,12 @@ class ModelingWithSequencesGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium: Exponential growth/decay (geometric)"""
         problem_types = ['population', 'depreciation', 'bacteria', 'investment']
-        problem_type = random.choice(problem_types)
+        problem_type = self.rng.choice(problem_types)
 
         if problem_type == 'population':
-            initial = random.choice([1000, 2000, 5000])
-            rate = random.choice([2, 3])
-            periods = random.randint(3, 5)
+            initial = self.rng.choice([1000, 2000, 5000])
+            rate = self.rng.choice([2, 3])
+            periods = self.rng.randint(3, 5)
 
             if rate == 2:
                 description = "doubles"
@@ -131,9 +127,9 @@ class ModelingWithSequencesGenerator:
             ]
 
         elif problem_type == 'depreciation':
-            initial = random.choice([10000, 15000, 20000])
+            initial = self.rng.choice([10000, 15000, 20000])
             rate = 0.8  # 20% depreciation = 80% remaining
-            years = random.randint(2, 4)
+            years = self.rng.randint(2, 4)
 
             latex = f"\\text{{A car worth }} \\${initial} \\text{{ depreciates 20\\% per year. "
             latex += f"\\text{{Value after }} {years} \\text{{ years?}}"
@@ -148,9 +144,9 @@ class ModelingWithSequencesGenerator:
             ]
 
         elif problem_type == 'bacteria':
-            initial = random.choice([100, 200, 500])
+            initial = self.rng.choice([100, 200, 500])
             rate = 2
-            hours = random.randint(4, 6)
+            hours = self.rng.randint(4, 6)
 
             latex = f"\\text{{Bacteria count starts at }} {initial} \\text{{ and doubles each hour. "
             latex += f"\\text{{Count after }} {hours} \\text{{ hours?}}"
@@ -165,9 +161,9 @@ class ModelingWithSequencesGenerator:
             ]
 
         else:  # investment
-            initial = random.choice([1000, 2000, 5000])
+            initial = self.rng.choice([1000, 2000, 5000])
             rate = 1.05  # 5% growth
-            years = random.randint(3, 5)
+            years = self.rng.randint(3, 5)
 
             latex = f"\\text{{An investment of }} \\${initial} \\text{{ grows 5\\% annually. "
             latex += f"\\text{{Value after }} {years} \\text{{ years (to nearest dollar)?}}"
@@ -191,12 +187,12 @@ class ModelingWithSequencesGenerator:
     def _generate_hard(self) -> Equation:
         """Generate hard: More complex scenarios, finding patterns"""
         problem_types = ['compound_growth', 'mixed_model', 'find_term', 'compare']
-        problem_type = random.choice(problem_types)
+        problem_type = self.rng.choice(problem_types)
 
         if problem_type == 'compound_growth':
             # Population with migration (arithmetic) and birth rate (geometric)
-            initial = random.choice([1000, 2000])
-            immigrants = random.choice([50, 100])
+            initial = self.rng.choice([1000, 2000])
+            immigrants = self.rng.choice([50, 100])
             birth_rate = 1.1  # 10% increase
             years = 3
 
@@ -221,8 +217,8 @@ class ModelingWithSequencesGenerator:
 
         elif problem_type == 'mixed_model':
             # Decide if situation is arithmetic or geometric
-            savings = random.choice([100, 200])
-            add_monthly = random.choice([25, 50])
+            savings = self.rng.choice([100, 200])
+            add_monthly = self.rng.choice([25, 50])
             months = 6
 
             latex = f"\\text{{Model: }} \\${savings} \\text{{ initial, }} \\${add_monthly} \\text{{ added monthly. "
@@ -240,7 +236,7 @@ class ModelingWithSequencesGenerator:
             # When does value reach target?
             initial = 50
             weekly = 15
-            target = random.choice([200, 250, 300])
+            target = self.rng.choice([200, 250, 300])
 
             latex = f"\\text{{Savings start at }} \\${initial}\\text{{, }} \\${weekly} \\text{{ added weekly. "
             latex += f"\\text{{After how many weeks will savings exceed }} \\${target}\\text{{?}}"
@@ -293,7 +289,7 @@ class ModelingWithSequencesGenerator:
     def _generate_challenge(self) -> Equation:
         """Generate challenge: Complex multi-step problems"""
         problem_types = ['optimization', 'break_even', 'compound_interest', 'decay_half_life']
-        problem_type = random.choice(problem_types)
+        problem_type = self.rng.choice(problem_types)
 
         if problem_type == 'optimization':
             # Find optimal strategy
@@ -346,7 +342,7 @@ class ModelingWithSequencesGenerator:
 
         elif problem_type == 'compound_interest':
             # Compound interest as geometric sequence
-            principal = random.choice([5000, 10000])
+            principal = self.rng.choice([5000, 10000])
             rate = 0.06  # 6%
             years = 4
 
@@ -364,8 +360,8 @@ class ModelingWithSequencesGenerator:
 
         else:  # decay_half_life
             # Radioactive decay / half-life
-            initial = random.choice([800, 1600, 3200])
-            half_lives = random.randint(2, 4)
+            initial = self.rng.choice([800, 1600, 3200])
+            half_lives = self.rng.randint(2, 4)
 
             latex = f"\\text{{Substance starts at }} {initial}\\text{{g, half-life is 1 year. "
             latex += f"\\text{{Amount after }} {half_lives} \\text{{ years?}}"
@@ -5,9 +5,6 @@ Creates problems about understanding and working with arithmetic sequences
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class ArithmeticSequencesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -40,19 +36,19 @@ class ArithmeticSequencesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy: Identify if sequence is arithmetic, find common difference"""
-        problem_type = random.choice(['identify', 'find_d', 'next_term'])
+        problem_type = self.rng.choice(['identify', 'find_d', 'next_term'])
 
         if problem_type == 'identify':
             # Is this arithmetic?
-            is_arithmetic = random.choice([True, False])
+            is_arithmetic = self.rng.choice([True, False])
             if is_arithmetic:
-                a1 = random.randint(2, 10)
-                d = random.randint(2, 5)
+                a1 = self.rng.randint(2, 10)
+                d = self.rng.randint(2, 5)
                 terms = [a1 + d * i for i in range(5)]
             else:
                 # Geometric or random
-                a1 = random.randint(2, 5)
-                r = random.choice([2, 3])
+                a1 = self.rng.randint(2, 5)
+                r = self.rng.choice([2, 3])
                 terms = [a1 * (r ** i) for i in range(5)]
 
             sequence_str = ", ".join(map(str, terms))
@@ -66,8 +62,8 @@ class ArithmeticSequencesGenerator:
 
         elif problem_type == 'find_d':
             # Find common difference
-            a1 = random.randint(2, 10)
-            d = random.randint(2, 6)
+            a1 = self.rng.randint(2, 10)
+            d = self.rng.randint(2, 6)
             terms = [a1 + d * i for i in range(4)]
             sequence_str = ", ".join(map(str, terms))
 
@@ -80,8 +76,8 @@ class ArithmeticSequencesGenerator:
             ]
 
         else:  # next_term
-            a1 = random.randint(3, 10)
-            d = random.randint(2, 5)
+            a1 = self.rng.randint(3, 10)
+            d = self.rng.randint(2, 5)
             terms = [a1 + d * i for i in range(4)]
             next_term = a1 + d * 4
             sequence_str = ", ".join(map(str, terms))
@@ -103,12 +99,12 @@ class ArithmeticSequencesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium: Find nth term, use formula a_n = a_1 + (n-1)d"""
-        problem_type = random.choice(['find_nth', 'find_formula', 'word_problem'])
+        problem_type = self.rng.choice(['find_nth', 'find_formula', 'word_problem'])
 
         if problem_type == 'find_nth':
-            a1 = random.randint(2, 10)
-            d = random.randint(2, 5)
-            n = random.randint(8, 15)
+            a1 = self.rng.randint(2, 10)
+            d = self.rng.randint(2, 5)
+            n = self.rng.randint(8, 15)
 
             latex = f"\\text{{Find }} a_{{{n}}} \\text{{ if }} a_1 = {a1} \\text{{ and }} d = {d}"
 
@@ -123,8 +119,8 @@ class ArithmeticSequencesGenerator:
             ]
 
         elif problem_type == 'find_formula':
-            a1 = random.randint(3, 8)
-            d = random.randint(2, 4)
+            a1 = self.rng.randint(3, 8)
+            d = self.rng.randint(2, 4)
             terms = [a1 + d * i for i in range(4)]
             sequence_str = ", ".join(map(str, terms))
 
@@ -139,9 +135,9 @@ class ArithmeticSequencesGenerator:
             ]
 
         else:  # word_problem
-            initial = random.choice([50, 100, 200])
-            d = random.choice([10, 15, 20, 25])
-            n = random.randint(5, 10)
+            initial = self.rng.choice([50, 100, 200])
+            d = self.rng.choice([10, 15, 20, 25])
+            n = self.rng.randint(5, 10)
 
             latex = f"\\text{{A student saves }} ${initial} \\text{{ initially, then adds }} ${d} \\text{{ each week. }}"
             latex += f"\\text{{How much after }} {n} \\text{{ weeks?}}"
@@ -164,13 +160,13 @@ class ArithmeticSequencesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard: Find a1 or d given other info, find term position"""
-        problem_type = random.choice(['find_a1', 'find_position', 'two_terms'])
+        problem_type = self.rng.choice(['find_a1', 'find_position', 'two_terms'])
 
         if problem_type == 'find_a1':
             # Given a_n and d, find a_1
-            d = random.randint(3, 6)
-            a1 = random.randint(5, 15)
-            n = random.randint(8, 12)
+            d = self.rng.randint(3, 6)
+            a1 = self.rng.randint(5, 15)
+            n = self.rng.randint(8, 12)
             an = a1 + (n - 1) * d
 
             latex = f"\\text{{If }} a_{{{n}}} = {an} \\text{{ and }} d = {d}, \\text{{ find }} a_1"
@@ -185,9 +181,9 @@ class ArithmeticSequencesGenerator:
 
         elif problem_type == 'find_position':
             # Which term equals a certain value?
-            a1 = random.randint(3, 8)
-            d = random.randint(2, 5)
-            n = random.randint(10, 20)
+            a1 = self.rng.randint(3, 8)
+            d = self.rng.randint(2, 5)
+            n = self.rng.randint(10, 20)
             an = a1 + (n - 1) * d
 
             latex = f"\\text{{In the sequence }} a_1 = {a1}, d = {d}, \\text{{ which term equals }} {an}?"
@@ -203,8 +199,8 @@ class ArithmeticSequencesGenerator:
 
         else:  # two_terms
             # Given two terms, find d and a1
-            a1 = random.randint(2, 8)
-            d = random.randint(2, 5)
+            a1 = self.rng.randint(2, 8)
+            d = self.rng.randint(2, 5)
             n1, n2 = 3, 7
             term1 = a1 + (n1 - 1) * d
             term2 = a1 + (n2 - 1) * d
@@ -228,12 +224,12 @@ class ArithmeticSequencesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge: Sum of arithmetic sequence, complex applications"""
-        problem_type = random.choice(['sum', 'missing_terms', 'mean'])
+        problem_type = self.rng.choice(['sum', 'missing_terms', 'mean'])
 
         if problem_type == 'sum':
-            a1 = random.randint(2, 5)
-            d = random.randint(2, 4)
-            n = random.randint(8, 12)
+            a1 = self.rng.randint(2, 5)
+            d = self.rng.randint(2, 4)
+            n = self.rng.randint(8, 12)
             an = a1 + (n - 1) * d
 
             # Sum formula: S_n = n/2 * (a1 + an)
@@ -251,8 +247,8 @@ class ArithmeticSequencesGenerator:
 
         elif problem_type == 'missing_terms':
             # Insert arithmetic means
-            a = random.randint(2, 5)
-            b = random.randint(20, 30)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(20, 30)
             n = 3  # number of means to insert
 
             # Total terms = n + 2
@@ -273,8 +269,8 @@ class ArithmeticSequencesGenerator:
 
         else:  # mean
             # Arithmetic mean of two terms
-            a = random.randint(10, 30)
-            b = random.randint(40, 60)
+            a = self.rng.randint(10, 30)
+            b = self.rng.randint(40, 60)
             mean = (a + b) // 2
             b = 2 * mean - a  # Adjust to ensure integer mean
 
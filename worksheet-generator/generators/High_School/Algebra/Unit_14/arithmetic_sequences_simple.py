@@ -3,9 +3,6 @@ Simplified Arithmetic Sequences Generator
 """
 
 import random
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 from typing import List
 
@@ -15,8 +12,7 @@ class ArithmeticSequencesSimpleGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate a worksheet of arithmetic sequences problems."""
@@ -35,13 +31,13 @@ class ArithmeticSequencesSimpleGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy: Find next term or common difference"""
-        problem_type = random.choice(['next_term', 'common_diff'])
+        problem_type = self.rng.choice(['next_term', 'common_diff'])
 
         # Generate sequence
-        a1 = random.randint(-10, 10)
-        d = random.randint(-5, 5)
+        a1 = self.rng.randint(-10, 10)
+        d = self.rng.randint(-5, 5)
         while d == 0:
-            d = random.randint(-5, 5)
+            d = self.rng.randint(-5, 5)
 
         # Generate first few terms
         terms = [a1 + i * d for i in range(4)]
@@ -63,11 +59,11 @@ class ArithmeticSequencesSimpleGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium: Find nth term"""
-        a1 = random.randint(-20, 20)
-        d = random.randint(-10, 10)
+        a1 = self.rng.randint(-20, 20)
+        d = self.rng.randint(-10, 10)
         while d == 0:
-            d = random.randint(-10, 10)
-        n = random.randint(10, 25)
+            d = self.rng.randint(-10, 10)
+        n = self.rng.randint(10, 25)
 
         # Show first few terms
         terms = [a1 + i * d for i in range(3)]
@@ -87,11 +83,11 @@ class ArithmeticSequencesSimpleGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard: Find sum of first n terms"""
-        a1 = random.randint(-10, 10)
-        d = random.randint(-5, 5)
+        a1 = self.rng.randint(-10, 10)
+        d = self.rng.randint(-5, 5)
         while d == 0:
-            d = random.randint(-5, 5)
-        n = random.randint(10, 20)
+            d = self.rng.randint(-5, 5)
+        n = self.rng.randint(10, 20)
 
         # Show first few terms
         terms = [a1 + i * d for i in range(3)]
@@ -111,12 +107,12 @@ class ArithmeticSequencesSimpleGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge: Find term number or complex sum"""
-        problem_type = random.choice(['find_n', 'partial_sum'])
+        problem_type = self.rng.choice(['find_n', 'partial_sum'])
 
         if problem_type == 'find_n':
-            a1 = random.randint(-10, 10)
-            d = random.randint(2, 5)  # Positive for simplicity
-            n = random.randint(15, 30)
+            a1 = self.rng.randint(-10, 10)
+            d = self.rng.randint(2, 5)  # Positive for simplicity
+            n = self.rng.randint(15, 30)
             target = a1 + (n - 1) * d
 
             # Show first few terms
@@ -127,10 +123,10 @@ class ArithmeticSequencesSimpleGenerator:
             solution = n
 
         else:  # partial_sum
-            a1 = random.randint(1, 10)
-            d = random.randint(2, 5)
-            m = random.randint(5, 10)
-            n = random.randint(m + 10, m + 20)
+            a1 = self.rng.randint(1, 10)
+            d = self.rng.randint(2, 5)
+            m = self.rng.randint(5, 10)
+            n = self.rng.randint(m + 10, m + 20)
 
             latex = f"\\text{{Sum from term }} {m} \\text{{ to }} {n} \\text{{ with }} a_1={a1}, d={d}"
 
@@ -5,9 +5,6 @@ Creates problems about building and writing arithmetic sequences
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class ConstructingArithmeticSequencesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -40,9 +36,9 @@ class ConstructingArithmeticSequencesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy: Write first n terms given a1 and d"""
-        a1 = random.randint(2, 10)
-        d = random.randint(2, 5)
-        n = random.randint(5, 6)
+        a1 = self.rng.randint(2, 10)
+        d = self.rng.randint(2, 5)
+        n = self.rng.randint(5, 6)
 
         latex = f"\\text{{Write the first }} {n} \\text{{ terms: }} a_1 = {a1}, d = {d}"
 
@@ -66,13 +62,13 @@ class ConstructingArithmeticSequencesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium: Construct from various given information"""
-        problem_type = random.choice(['from_two_terms', 'from_formula', 'word_problem'])
+        problem_type = self.rng.choice(['from_two_terms', 'from_formula', 'word_problem'])
 
         if problem_type == 'from_two_terms':
             # Given first term and another term
-            a1 = random.randint(3, 8)
-            d = random.randint(2, 4)
-            n = random.randint(5, 8)
+            a1 = self.rng.randint(3, 8)
+            d = self.rng.randint(2, 4)
+            n = self.rng.randint(5, 8)
             an = a1 + (n - 1) * d
 
             latex = f"\\text{{Construct sequence with }} a_1 = {a1} \\text{{ and }} a_{{{n}}} = {an}. "
@@ -90,8 +86,8 @@ class ConstructingArithmeticSequencesGenerator:
 
         elif problem_type == 'from_formula':
             # Given explicit formula
-            a1 = random.randint(2, 6)
-            d = random.randint(2, 5)
+            a1 = self.rng.randint(2, 6)
+            d = self.rng.randint(2, 5)
             n = 6
 
             # a_n = a_1 + (n-1)d = a1 + nd - d = (a1 - d) + nd
@@ -114,8 +110,8 @@ class ConstructingArithmeticSequencesGenerator:
             ]
 
         else:  # word_problem
-            initial = random.choice([20, 30, 50])
-            d = random.choice([5, 10, 15])
+            initial = self.rng.choice([20, 30, 50])
+            d = self.rng.choice([5, 10, 15])
             n = 6
 
             contexts = [
@@ -124,7 +120,7 @@ class ConstructingArithmeticSequencesGenerator:
                 (f"Week 1 savings: ${initial}, increasing by ${d} each week", "dollars")
             ]
 
-            context, unit = random.choice(contexts)
+            context, unit = self.rng.choice(contexts)
             latex = f"\\text{{{context}. Write the first }} {n} \\text{{ terms.}}"
 
             terms = [initial + d * i for i in range(n)]
@@ -145,12 +141,12 @@ class ConstructingArithmeticSequencesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard: Complex construction with constraints"""
-        problem_type = random.choice(['negative_d', 'given_sum', 'multiple_constraints'])
+        problem_type = self.rng.choice(['negative_d', 'given_sum', 'multiple_constraints'])
 
         if problem_type == 'negative_d':
             # Decreasing sequence
-            a1 = random.randint(50, 80)
-            d = random.randint(-8, -3)
+            a1 = self.rng.randint(50, 80)
+            d = self.rng.randint(-8, -3)
             n = 7
 
             latex = f"\\text{{Write first }} {n} \\text{{ terms: }} a_1 = {a1}, d = {d}"
@@ -167,8 +163,8 @@ class ConstructingArithmeticSequencesGenerator:
 
         elif problem_type == 'given_sum':
             # Given sum of certain terms
-            a1 = random.randint(2, 5)
-            d = random.randint(2, 4)
+            a1 = self.rng.randint(2, 5)
+            d = self.rng.randint(2, 4)
             n = 5
 
             terms = [a1 + d * i for i in range(n)]
@@ -188,8 +184,8 @@ class ConstructingArithmeticSequencesGenerator:
 
         else:  # multiple_constraints
             # Given two different terms
-            a1 = random.randint(2, 6)
-            d = random.randint(2, 4)
+            a1 = self.rng.randint(2, 6)
+            d = self.rng.randint(2, 4)
             n1, n2 = 2, 6
             term1 = a1 + (n1 - 1) * d
             term2 = a1 + (n2 - 1) * d
@@ -215,13 +211,13 @@ class ConstructingArithmeticSequencesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge: Advanced construction problems"""
-        problem_type = random.choice(['arithmetic_means', 'recursive_to_explicit', 'real_world'])
+        problem_type = self.rng.choice(['arithmetic_means', 'recursive_to_explicit', 'real_world'])
 
         if problem_type == 'arithmetic_means':
             # Insert multiple arithmetic means
-            a = random.randint(5, 10)
-            k = random.randint(3, 5)  # number of means
-            d = random.randint(3, 6)
+            a = self.rng.randint(5, 10)
+            k = self.rng.randint(3, 5)  # number of means
+            d = self.rng.randint(3, 6)
             b = a + (k + 1) * d
 
             latex = f"\\text{{Insert }} {k} \\text{{ arithmetic means between }} {a} \\text{{ and }} {b}, "
@@ -239,8 +235,8 @@ class ConstructingArithmeticSequencesGenerator:
 
         elif problem_type == 'recursive_to_explicit':
             # Convert recursive to explicit form and generate
-            a1 = random.randint(3, 8)
-            d = random.randint(2, 5)
+            a1 = self.rng.randint(3, 8)
+            d = self.rng.randint(2, 5)
             n = 6
 
             latex = f"\\text{{Given }} a_1 = {a1}, a_n = a_{{n-1}} + {d}, "
@@ -260,8 +256,8 @@ class ConstructingArithmeticSequencesGenerator:
         else:  # real_world
             # Complex real-world scenario
             start_year = 2020
-            initial = random.choice([1000, 2000, 5000])
-            d = random.choice([150, 200, 250, 500])
+            initial = self.rng.choice([1000, 2000, 5000])
+            d = self.rng.choice([150, 200, 250, 500])
             years = 6
 
             latex = f"\\text{{In }} {start_year}, \\text{{ a company had }} {initial} \\text{{ employees. }}"
@@ -5,9 +5,6 @@ Creates problems about understanding and working with geometric sequences
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class GeometricSequencesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -40,19 +36,19 @@ class GeometricSequencesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy: Identify geometric sequences, find common ratio"""
-        problem_type = random.choice(['identify', 'find_r', 'next_term'])
+        problem_type = self.rng.choice(['identify', 'find_r', 'next_term'])
 
         if problem_type == 'identify':
             # Is this geometric?
-            is_geometric = random.choice([True, False])
+            is_geometric = self.rng.choice([True, False])
             if is_geometric:
-                a1 = random.randint(2, 5)
-                r = random.choice([2, 3])
+                a1 = self.rng.randint(2, 5)
+                r = self.rng.choice([2, 3])
                 terms = [a1 * (r ** i) for i in range(5)]
             else:
                 # Arithmetic sequence
-                a1 = random.randint(2, 10)
-                d = random.randint(2, 5)
+                a1 = self.rng.randint(2, 10)
+                d = self.rng.randint(2, 5)
                 terms = [a1 + d * i for i in range(5)]
 
             sequence_str = ", ".join(map(str, terms))
@@ -66,8 +62,8 @@ class GeometricSequencesGenerator:
 
         elif problem_type == 'find_r':
             # Find common ratio
-            a1 = random.randint(2, 5)
-            r = random.choice([2, 3, 4])
+            a1 = self.rng.randint(2, 5)
+            r = self.rng.choice([2, 3, 4])
             terms = [a1 * (r ** i) for i in range(4)]
             sequence_str = ", ".join(map(str, terms))
 
@@ -80,8 +76,8 @@ class GeometricSequencesGenerator:
             ]
 
         else:  # next_term
-            a1 = random.randint(2, 4)
-            r = random.choice([2, 3])
+            a1 = self.rng.randint(2, 4)
+            r = self.rng.choice([2, 3])
             terms = [a1 * (r ** i) for i in range(4)]
             next_term = a1 * (r ** 4)
             sequence_str = ", ".join(map(str, terms))
@@ -103,12 +99,12 @@ class GeometricSequencesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium: Find nth term, use formula a_n = a_1 * r^(n-1)"""
-        problem_type = random.choice(['find_nth', 'find_formula', 'word_problem'])
+        problem_type = self.rng.choice(['find_nth', 'find_formula', 'word_problem'])
 
         if problem_type == 'find_nth':
-            a1 = random.randint(2, 5)
-            r = random.choice([2, 3])
-            n = random.randint(5, 7)
+            a1 = self.rng.randint(2, 5)
+            r = self.rng.choice([2, 3])
+            n = self.rng.randint(5, 7)
 
             latex = f"\\text{{Find }} a_{{{n}}} \\text{{ if }} a_1 = {a1} \\text{{ and }} r = {r}"
 
@@ -123,8 +119,8 @@ class GeometricSequencesGenerator:
             ]
 
         elif problem_type == 'find_formula':
-            a1 = random.randint(2, 4)
-            r = random.choice([2, 3])
+            a1 = self.rng.randint(2, 4)
+            r = self.rng.choice([2, 3])
             terms = [a1 * (r ** i) for i in range(4)]
             sequence_str = ", ".join(map(str, terms))
 
@@ -139,16 +135,16 @@ class GeometricSequencesGenerator:
             ]
 
         else:  # word_problem
-            initial = random.choice([100, 200, 500])
-            r = random.choice([2, 3])
-            n = random.randint(4, 6)
+            initial = self.rng.choice([100, 200, 500])
+            r = self.rng.choice([2, 3])
+            n = self.rng.randint(4, 6)
 
             contexts = [
                 (f"Bacteria start at {initial} and triple each hour", 3),
                 (f"An investment of ${initial} doubles each year", 2),
             ]
 
-            context, r_val = random.choice(contexts)
+            context, r_val = self.rng.choice(contexts)
             r = r_val
 
             latex = f"\\text{{{context}. How many after }} {n} \\text{{ periods?}}"
@@ -171,13 +167,13 @@ class GeometricSequencesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard: Find a1 or r given other info, negative/fractional ratios"""
-        problem_type = random.choice(['find_a1', 'find_position', 'fractional_r'])
+        problem_type = self.rng.choice(['find_a1', 'find_position', 'fractional_r'])
 
         if problem_type == 'find_a1':
             # Given a_n and r, find a_1
-            r = random.choice([2, 3])
-            a1 = random.randint(2, 5)
-            n = random.randint(4, 6)
+            r = self.rng.choice([2, 3])
+            a1 = self.rng.randint(2, 5)
+            n = self.rng.randint(4, 6)
             an = a1 * (r ** (n - 1))
 
             latex = f"\\text{{If }} a_{{{n}}} = {an} \\text{{ and }} r = {r}, \\text{{ find }} a_1"
@@ -192,9 +188,9 @@ class GeometricSequencesGenerator:
 
         elif problem_type == 'find_position':
             # Which term equals a certain value?
-            a1 = random.choice([2, 3])
-            r = random.choice([2, 3])
-            n = random.randint(5, 7)
+            a1 = self.rng.choice([2, 3])
+            r = self.rng.choice([2, 3])
+            n = self.rng.randint(5, 7)
             an = a1 * (r ** (n - 1))
 
             latex = f"\\text{{In the sequence }} a_1 = {a1}, r = {r}, \\text{{ which term equals }} {an}?"
@@ -210,7 +206,7 @@ class GeometricSequencesGenerator:
 
         else:  # fractional_r
             # Decreasing sequence with r < 1
-            a1 = random.choice([64, 128, 256])
+            a1 = self.rng.choice([64, 128, 256])
             r = 0.5
             n = 5
 
@@ -235,12 +231,12 @@ class GeometricSequencesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge: Sum formulas, negative ratios, complex applications"""
-        problem_type = random.choice(['sum_finite', 'negative_ratio', 'geometric_mean'])
+        problem_type = self.rng.choice(['sum_finite', 'negative_ratio', 'geometric_mean'])
 
         if problem_type == 'sum_finite':
-            a1 = random.choice([2, 3])
+            a1 = self.rng.choice([2, 3])
             r = 2
-            n = random.randint(5, 7)
+            n = self.rng.randint(5, 7)
 
             # Sum formula: S_n = a1(r^n - 1)/(r - 1)
             sum_n = a1 * ((r ** n) - 1) // (r - 1)
@@ -257,7 +253,7 @@ class GeometricSequencesGenerator:
 
         elif problem_type == 'negative_ratio':
             # Alternating sequence
-            a1 = random.choice([3, 4, 5])
+            a1 = self.rng.choice([3, 4, 5])
             r = -2
             n = 6
 
@@ -277,8 +273,8 @@ class GeometricSequencesGenerator:
 
         else:  # geometric_mean
             # Find geometric mean
-            a = random.choice([4, 9, 16, 25])
-            b = random.choice([16, 36, 64, 100])
+            a = self.rng.choice([4, 9, 16, 25])
+            b = self.rng.choice([16, 36, 64, 100])
 
             # Ensure clean geometric mean
             import math
@@ -3,9 +3,6 @@ Simplified Geometric Sequences Generator
 """
 
 import random
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 from typing import List
 
@@ -15,8 +12,7 @@ class GeometricSequencesSimpleGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate a worksheet of geometric sequences problems."""
@@ -35,11 +31,11 @@ class GeometricSequencesSimpleGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy: Find next term or common ratio"""
-        problem_type = random.choice(['next_term', 'common_ratio'])
+        problem_type = self.rng.choice(['next_term', 'common_ratio'])
 
         # Generate sequence with simple ratio
-        a1 = random.choice([1, 2, 3, 4, 5])
-        r = random.choice([2, 3, -2, 0.5])
+        a1 = self.rng.choice([1, 2, 3, 4, 5])
+        r = self.rng.choice([2, 3, -2, 0.5])
 
         # Generate first few terms
         terms = [a1 * (r ** i) for i in range(4)]
@@ -70,9 +66,9 @@ class GeometricSequencesSimpleGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium: Find nth term"""
-        a1 = random.choice([2, 3, 4, 5])
-        r = random.choice([2, 3, -2])
-        n = random.randint(5, 8)
+        a1 = self.rng.choice([2, 3, 4, 5])
+        r = self.rng.choice([2, 3, -2])
+        n = self.rng.randint(5, 8)
 
         # Show first few terms
         terms = [a1 * (r ** i) for i in range(3)]
@@ -92,9 +88,9 @@ class GeometricSequencesSimpleGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard: Find sum of first n terms"""
-        a1 = random.choice([2, 3, 4, 5])
-        r = random.choice([2, 3])
-        n = random.randint(5, 7)
+        a1 = self.rng.choice([2, 3, 4, 5])
+        r = self.rng.choice([2, 3])
+        n = self.rng.randint(5, 7)
 
         # Show first few terms
         terms = [a1 * (r ** i) for i in range(3)]
@@ -117,12 +113,12 @@ class GeometricSequencesSimpleGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge: Find term number or exponential growth problem"""
-        problem_type = random.choice(['find_n', 'growth'])
+        problem_type = self.rng.choice(['find_n', 'growth'])
 
         if problem_type == 'find_n':
-            a1 = random.choice([2, 3, 4])
-            r = random.choice([2, 3])
-            n = random.randint(4, 6)
+            a1 = self.rng.choice([2, 3, 4])
+            r = self.rng.choice([2, 3])
+            n = self.rng.randint(4, 6)
             target = a1 * (r ** (n - 1))
 
             # Show first few terms
@@ -133,9 +129,9 @@ class GeometricSequencesSimpleGenerator:
             solution = n
 
         else:  # growth
-            initial = random.choice([100, 200, 500])
-            rate = random.choice([1.1, 1.2, 1.5])  # 10%, 20%, or 50% growth
-            years = random.randint(3, 5)
+            initial = self.rng.choice([100, 200, 500])
+            rate = self.rng.choice([1.1, 1.2, 1.5])  # 10%, 20%, or 50% growth
+            years = self.rng.randint(3, 5)
 
             percent = int((rate - 1) * 100)
             latex = f"\\text{{Investment: \\$}}{initial} \\text{{ grows }} {percent}\\% \\text{{ yearly. Value after }} {years} \\text{{ years?}}"
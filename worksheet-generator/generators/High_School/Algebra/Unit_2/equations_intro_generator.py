@@ -5,9 +5,6 @@ Generates problems about understanding what equations are and their properties
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class EquationsIntroGenerator:
 
     def __init__(self, seed=None):
         """Initialize the equations intro generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,15 +46,15 @@ class EquationsIntroGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy equation concept problems."""
-        problem_type = random.choice(['identify_equation', 'true_false', 'complete'])
+        problem_type = self.rng.choice(['identify_equation', 'true_false', 'complete'])
 
         if problem_type == 'identify_equation':
             # Is this an equation?
-            var = random.choice(['x', 'n', 'y'])
-            num1 = random.randint(2, 9)
-            num2 = random.randint(1, 10)
+            var = self.rng.choice(['x', 'n', 'y'])
+            num1 = self.rng.randint(2, 9)
+            num2 = self.rng.randint(1, 10)
 
-            if random.choice([True, False]):
+            if self.rng.choice([True, False]):
                 # True equation
                 latex = f"Is {num1}{var} = {num2} an equation?"
                 solution = 1
@@ -69,9 +65,9 @@ class EquationsIntroGenerator:
 
         elif problem_type == 'true_false':
             # Check if equation is true for given value
-            x_val = random.randint(1, 8)
-            result = random.randint(10, 30)
-            coef = result // x_val if result % x_val == 0 else random.randint(2, 6)
+            x_val = self.rng.randint(1, 8)
+            result = self.rng.randint(10, 30)
+            coef = result // x_val if result % x_val == 0 else self.rng.randint(2, 6)
             actual_result = coef * x_val
 
             latex = f"If x = {x_val}, is {coef}x = {actual_result} true?"
@@ -79,8 +75,8 @@ class EquationsIntroGenerator:
 
         else:  # complete
             # Complete the equation
-            x_val = random.randint(2, 9)
-            coef = random.randint(2, 7)
+            x_val = self.rng.randint(2, 9)
+            coef = self.rng.randint(2, 7)
             result = coef * x_val
             latex = f"If x = {x_val} and {coef}x = ?, what is ?"
             solution = result
@@ -89,29 +85,29 @@ class EquationsIntroGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium equation concept problems."""
-        problem_type = random.choice(['balance', 'find_value', 'verify'])
+        problem_type = self.rng.choice(['balance', 'find_value', 'verify'])
 
         if problem_type == 'balance':
             # Find x that makes equation true
-            solution = random.randint(2, 10)
-            coef = random.randint(2, 6)
-            const = random.randint(1, 10)
+            solution = self.rng.randint(2, 10)
+            coef = self.rng.randint(2, 6)
+            const = self.rng.randint(1, 10)
             total = coef * solution + const
 
             latex = f"Find x if {coef}x + {const} = {total}"
 
         elif problem_type == 'find_value':
             # Find x that makes equation true
-            solution = random.randint(2, 10)
-            const = random.randint(5, 20)
+            solution = self.rng.randint(2, 10)
+            const = self.rng.randint(5, 20)
             total = solution + const
             latex = f"Find x if x + {const} = {total}"
 
         else:  # verify
             # Verify solution
-            x_val = random.randint(3, 12)
-            coef = random.randint(2, 5)
-            const = random.randint(1, 8)
+            x_val = self.rng.randint(3, 12)
+            coef = self.rng.randint(2, 5)
+            const = self.rng.randint(1, 8)
             result = coef * x_val + const
 
             latex = f"Is x = {x_val} a solution to {coef}x + {const} = {result}?"
@@ -121,31 +117,31 @@ class EquationsIntroGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard equation concept problems."""
-        problem_type = random.choice(['multiple_solutions', 'no_solution', 'identity'])
+        problem_type = self.rng.choice(['multiple_solutions', 'no_solution', 'identity'])
 
         if problem_type == 'multiple_solutions':
             # Which value satisfies the equation?
-            solution = random.randint(4, 12)
-            const = random.randint(10, 25)
+            solution = self.rng.randint(4, 12)
+            const = self.rng.randint(10, 25)
             total = solution + const
 
             latex = f"Which value makes x + {const} = {total} true?"
 
         elif problem_type == 'no_solution':
             # Check if value is a solution
-            x_test = random.randint(3, 10)
-            coef = random.randint(2, 6)
-            wrong_result = coef * x_test + random.randint(1, 5)  # Intentionally wrong
+            x_test = self.rng.randint(3, 10)
+            coef = self.rng.randint(2, 6)
+            wrong_result = coef * x_test + self.rng.randint(1, 5)  # Intentionally wrong
 
             latex = f"Is x = {x_test} a solution to {coef}x = {wrong_result}?"
             solution = 0
 
         else:  # identity
             # Find what makes both sides equal
-            x_val = random.randint(3, 9)
-            coef1 = random.randint(2, 5)
-            coef2 = random.randint(2, 5)
-            const = random.randint(2, 10)
+            x_val = self.rng.randint(3, 9)
+            coef1 = self.rng.randint(2, 5)
+            coef2 = self.rng.randint(2, 5)
+            const = self.rng.randint(2, 10)
 
             # Make equation true: coef1*x + const = coef2*x + ?
             # So ? = coef1*x + const - coef2*x = (coef1-coef2)*x + const
@@ -158,17 +154,17 @@ class EquationsIntroGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge equation concept problems."""
-        problem_type = random.choice(['complex_conceptual', 'prove_property', 'multi_variable_reasoning'])
+        problem_type = self.rng.choice(['complex_conceptual', 'prove_property', 'multi_variable_reasoning'])
 
         if problem_type == 'complex_conceptual':
             # Complex multi-step conceptual problem
             # Find the value that makes a complex relationship work
-            a = random.randint(2, 5)
-            b = random.randint(3, 7)
-            c = random.randint(2, 6)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(3, 7)
+            c = self.rng.randint(2, 6)
 
             # If ax + b = cx + d, and we know x = k, find d
-            x_val = random.randint(4, 12)
+            x_val = self.rng.randint(4, 12)
             solution = a * x_val + b - c * x_val
 
             latex = f"If x = {x_val} makes {a}x + {b} = {c}x + ? true, find ?"
@@ -176,10 +172,10 @@ class EquationsIntroGenerator:
         elif problem_type == 'prove_property':
             # Understand equation properties
             # Which transformation keeps equation balanced?
-            x_val = random.randint(3, 10)
-            coef = random.randint(2, 6)
-            const1 = random.randint(5, 15)
-            const2 = random.randint(3, 12)
+            x_val = self.rng.randint(3, 10)
+            coef = self.rng.randint(2, 6)
+            const1 = self.rng.randint(5, 15)
+            const2 = self.rng.randint(3, 12)
 
             # If 2x + 5 = 17, what operation gives 2x = 12?
             # Answer is the constant to subtract
@@ -191,9 +187,9 @@ class EquationsIntroGenerator:
         else:  # multi_variable_reasoning
             # Complex reasoning about equation structure - equation only
             # Solve: coef*x + const = total
-            solution = random.randint(3, 15)
-            coef = random.randint(3, 8)
-            const = random.randint(5, 20)
+            solution = self.rng.randint(3, 15)
+            coef = self.rng.randint(3, 8)
+            const = self.rng.randint(5, 20)
             total = coef * solution + const
 
             latex = f"{coef}x + {const} = {total}"
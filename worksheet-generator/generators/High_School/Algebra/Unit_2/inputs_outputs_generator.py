@@ -5,9 +5,6 @@ Generates problems about input/output relationships
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class InputsOutputsGenerator:
     """Generates problems about inputs and outputs."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,8 +33,8 @@ class InputsOutputsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple input/output: given input, find output
-        input_val = random.randint(1, 10)
-        add = random.randint(1, 8)
+        input_val = self.rng.randint(1, 10)
+        add = self.rng.randint(1, 8)
         output = input_val + add
 
         latex = f"Input: {input_val}, Rule: add {add}, Output: ?"
@@ -46,9 +42,9 @@ class InputsOutputsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Two-step rule: multiply then add
-        input_val = random.randint(2, 8)
-        mult = random.randint(2, 5)
-        add = random.randint(1, 7)
+        input_val = self.rng.randint(2, 8)
+        mult = self.rng.randint(2, 5)
+        add = self.rng.randint(1, 7)
         output = mult * input_val + add
 
         latex = f"Input: {input_val}, Rule: multiply by {mult} then add {add}, Output: ?"
@@ -56,9 +52,9 @@ class InputsOutputsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Given output, find input (working backwards)
-        output = random.randint(15, 40)
-        mult = random.randint(2, 4)
-        add = random.randint(3, 10)
+        output = self.rng.randint(15, 40)
+        mult = self.rng.randint(2, 4)
+        add = self.rng.randint(3, 10)
 
         # output = mult * input + add, so input = (output - add) / mult
         input_val = (output - add) // mult
@@ -69,20 +65,20 @@ class InputsOutputsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Reverse engineering with complex rules: find the rule or multi-step reasoning
-        problem_type = random.choice(['find_rule', 'multi_input_pattern', 'complex_reverse'])
+        problem_type = self.rng.choice(['find_rule', 'multi_input_pattern', 'complex_reverse'])
 
         if problem_type == 'find_rule':
             # Given multiple input-output pairs, find the missing output
             # Rule: ax + b
-            a = random.randint(2, 5)
-            b = random.randint(3, 10)
-            input_val = random.randint(5, 12)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(3, 10)
+            input_val = self.rng.randint(5, 12)
             output = a * input_val + b
 
             # Show pattern: (input1, output1), (input2, output2), find output for input3
-            input1 = random.randint(1, 4)
+            input1 = self.rng.randint(1, 4)
             output1 = a * input1 + b
-            input2 = random.randint(5, 8)
+            input2 = self.rng.randint(5, 8)
             output2 = a * input2 + b
 
             latex = f"Pattern: ({input1}, {output1}), ({input2}, {output2}). Find output for input {input_val}"
@@ -92,9 +88,9 @@ class InputsOutputsGenerator:
             # Complex pattern with two operations
             # Rule: ax^2 + b (but we'll simplify to keep integer solutions)
             # Actually use: (x * mult) + add1, then + add2
-            input_val = random.randint(2, 6)
-            mult = random.randint(3, 6)
-            add = random.randint(5, 15)
+            input_val = self.rng.randint(2, 6)
+            mult = self.rng.randint(3, 6)
+            add = self.rng.randint(5, 15)
 
             # Two-stage: first multiply, then square the input before adding
             # To keep it reasonable: mult * (input + add)
@@ -106,13 +102,13 @@ class InputsOutputsGenerator:
         else:  # complex_reverse
             # Given complex rule and output, find input
             # Rule: 2(x + 3) + 5, find x given output
-            mult = random.randint(2, 4)
-            add_inner = random.randint(2, 7)
-            add_outer = random.randint(3, 12)
+            mult = self.rng.randint(2, 4)
+            add_inner = self.rng.randint(2, 7)
+            add_outer = self.rng.randint(3, 12)
 
             # output = mult * (input + add_inner) + add_outer
             # input = (output - add_outer) / mult - add_inner
-            input_val = random.randint(2, 8)
+            input_val = self.rng.randint(2, 8)
             output = mult * (input_val + add_inner) + add_outer
 
             latex = f"Rule: {mult}(x + {add_inner}) + {add_outer}, Output: {output}, Input: ?"
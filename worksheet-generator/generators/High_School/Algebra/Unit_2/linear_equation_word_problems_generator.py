@@ -5,9 +5,6 @@ Generates word problems that require solving linear equations
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class LinearEquationWordProblemsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the linear equation word problems generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,11 +46,11 @@ class LinearEquationWordProblemsGenerator:
     def _generate_easy(self) -> Equation:
         """Generate simple word problems with direct relationships"""
         problem_types = ['age', 'money', 'collection', 'total_cost']
-        problem_type = random.choice(problem_types)
+        problem_type = self.rng.choice(problem_types)
 
         if problem_type == 'age':
-            x = random.randint(8, 15)
-            years = random.randint(3, 8)
+            x = self.rng.randint(8, 15)
+            years = self.rng.randint(3, 8)
             future_age = x + years
 
             latex = f"\\text{{Sarah is }} x \\text{{ years old. In }} {years} \\text{{ years, she will be }} {future_age}. \\text{{ How old is Sarah now?}}"
@@ -62,8 +58,8 @@ class LinearEquationWordProblemsGenerator:
             steps = [f"x + {years} = {future_age}", f"x = {x}"]
 
         elif problem_type == 'money':
-            x = random.randint(10, 50)
-            spent = random.randint(5, min(x - 2, 25))
+            x = self.rng.randint(10, 50)
+            spent = self.rng.randint(5, min(x - 2, 25))
             remaining = x - spent
 
             latex = f"\\text{{Maria had }} \\${x}. \\text{{ She spent }} \\${spent}. \\text{{ How much does she have left?}}"
@@ -71,8 +67,8 @@ class LinearEquationWordProblemsGenerator:
             steps = [f"{x} - {spent} = x", f"x = {remaining}"]
 
         elif problem_type == 'collection':
-            x = random.randint(15, 50)
-            bought = random.randint(5, 20)
+            x = self.rng.randint(15, 50)
+            bought = self.rng.randint(5, 20)
             total = x + bought
 
             latex = f"\\text{{Tom had }} {x} \\text{{ cards. He bought }} {bought} \\text{{ more. How many cards does he have now?}}"
@@ -80,8 +76,8 @@ class LinearEquationWordProblemsGenerator:
             steps = [f"{x} + {bought} = x", f"x = {total}"]
 
         else:  # total_cost
-            price = random.randint(3, 15)
-            quantity = random.randint(3, 8)
+            price = self.rng.randint(3, 15)
+            quantity = self.rng.randint(3, 8)
             total = price * quantity
 
             latex = f"\\text{{Each book costs }} \\${price}. \\text{{ If you buy }} {quantity} \\text{{ books, what is the total cost?}}"
@@ -93,10 +89,10 @@ class LinearEquationWordProblemsGenerator:
     def _generate_medium(self) -> Equation:
         """Generate word problems requiring equation setup"""
         problem_types = ['consecutive_numbers', 'perimeter', 'shared_items', 'two_step']
-        problem_type = random.choice(problem_types)
+        problem_type = self.rng.choice(problem_types)
 
         if problem_type == 'consecutive_numbers':
-            x = random.randint(10, 30)
+            x = self.rng.randint(10, 30)
             total = x + (x + 1)
 
             latex = f"\\text{{Two consecutive numbers add up to }} {total}. \\text{{ What are the numbers?}}"
@@ -109,8 +105,8 @@ class LinearEquationWordProblemsGenerator:
             ]
 
         elif problem_type == 'perimeter':
-            width = random.randint(5, 15)
-            length = random.randint(width + 3, 25)
+            width = self.rng.randint(5, 15)
+            length = self.rng.randint(width + 3, 25)
             perimeter = 2 * (length + width)
 
             latex = f"\\text{{A rectangle has a width of }} {width} \\text{{ cm and perimeter of }} {perimeter} \\text{{ cm. Find the length.}}"
@@ -123,8 +119,8 @@ class LinearEquationWordProblemsGenerator:
             ]
 
         elif problem_type == 'shared_items':
-            per_person = random.randint(3, 8)
-            people = random.randint(4, 10)
+            per_person = self.rng.randint(3, 8)
+            people = self.rng.randint(4, 10)
             total = per_person * people
 
             latex = f"\\text{{If }} {total} \\text{{ candies are shared equally among }} {people} \\text{{ people, how many does each person get?}}"
@@ -136,9 +132,9 @@ class LinearEquationWordProblemsGenerator:
             ]
 
         else:  # two_step
-            x = random.randint(10, 40)
-            multiplier = random.randint(2, 5)
-            added = random.randint(5, 15)
+            x = self.rng.randint(10, 40)
+            multiplier = self.rng.randint(2, 5)
+            added = self.rng.randint(5, 15)
             result = multiplier * x + added
 
             latex = f"\\text{{A number is multiplied by }} {multiplier} \\text{{ and }} {added} \\text{{ is added. The result is }} {result}. \\text{{ What is the number?}}"
@@ -155,13 +151,13 @@ class LinearEquationWordProblemsGenerator:
     def _generate_hard(self) -> Equation:
         """Generate complex word problems with multiple variables or constraints"""
         problem_types = ['age_relation', 'money_split', 'work_rate', 'mixture']
-        problem_type = random.choice(problem_types)
+        problem_type = self.rng.choice(problem_types)
 
         if problem_type == 'age_relation':
-            current_age = random.randint(10, 25)
-            years_ago = random.randint(3, 8)
+            current_age = self.rng.randint(10, 25)
+            years_ago = self.rng.randint(3, 8)
             past_age = current_age - years_ago
-            relation_mult = random.randint(2, 4)
+            relation_mult = self.rng.randint(2, 4)
             parent_past_age = relation_mult * past_age
 
             latex = f"\\text{{{years_ago} years ago, a mother was }} {relation_mult} \\text{{ times as old as her daughter.}}"
@@ -174,9 +170,9 @@ class LinearEquationWordProblemsGenerator:
             ]
 
         elif problem_type == 'money_split':
-            total = random.randint(50, 150)
-            ratio_a = random.randint(2, 4)
-            ratio_b = random.randint(2, 4)
+            total = self.rng.randint(50, 150)
+            ratio_a = self.rng.randint(2, 4)
+            ratio_b = self.rng.randint(2, 4)
             unit = total // (ratio_a + ratio_b)
             amount_a = ratio_a * unit
 
@@ -189,8 +185,8 @@ class LinearEquationWordProblemsGenerator:
             ]
 
         elif problem_type == 'work_rate':
-            hours = random.randint(4, 12)
-            pages_per_hour = random.randint(8, 20)
+            hours = self.rng.randint(4, 12)
+            pages_per_hour = self.rng.randint(8, 20)
             total_pages = hours * pages_per_hour
 
             latex = f"\\text{{A printer prints }} {pages_per_hour} \\text{{ pages per hour. How many hours to print }} {total_pages} \\text{{ pages?}}"
@@ -202,8 +198,8 @@ class LinearEquationWordProblemsGenerator:
             ]
 
         else:  # mixture
-            total_students = random.randint(30, 60)
-            boys = random.randint(15, total_students - 5)
+            total_students = self.rng.randint(30, 60)
+            boys = self.rng.randint(15, total_students - 5)
             girls = total_students - boys
 
             latex = f"\\text{{A class has }} {total_students} \\text{{ students. If there are }} {boys} \\text{{ boys, how many girls are there?}}"
@@ -219,12 +215,12 @@ class LinearEquationWordProblemsGenerator:
     def _generate_challenge(self) -> Equation:
         """Generate very complex word problems with multiple steps"""
         problem_types = ['investment', 'speed_distance', 'percent_change', 'multi_step']
-        problem_type = random.choice(problem_types)
+        problem_type = self.rng.choice(problem_types)
 
         if problem_type == 'investment':
-            principal = random.randint(1000, 5000)
-            rate = random.randint(3, 8)
-            years = random.randint(2, 5)
+            principal = self.rng.randint(1000, 5000)
+            rate = self.rng.randint(3, 8)
+            years = self.rng.randint(2, 5)
             interest = (principal * rate * years) // 100
             total = principal + interest
 
@@ -238,8 +234,8 @@ class LinearEquationWordProblemsGenerator:
             ]
 
         elif problem_type == 'speed_distance':
-            speed = random.randint(40, 80)
-            time = random.randint(2, 6)
+            speed = self.rng.randint(40, 80)
+            time = self.rng.randint(2, 6)
             distance = speed * time
 
             latex = f"\\text{{A car travels at }} {speed} \\text{{ mph for }} {time} \\text{{ hours. How far does it travel?}}"
@@ -251,8 +247,8 @@ class LinearEquationWordProblemsGenerator:
             ]
 
         elif problem_type == 'percent_change':
-            original = random.randint(100, 500)
-            percent = random.randint(10, 40)
+            original = self.rng.randint(100, 500)
+            percent = self.rng.randint(10, 40)
             increase = (original * percent) // 100
             new_value = original + increase
 
@@ -265,9 +261,9 @@ class LinearEquationWordProblemsGenerator:
 
         else:  # multi_step
             # Complex scenario: buying multiple items with discount
-            item_price = random.randint(15, 40)
-            quantity = random.randint(3, 6)
-            discount_per_item = random.randint(2, 8)
+            item_price = self.rng.randint(15, 40)
+            quantity = self.rng.randint(3, 6)
+            discount_per_item = self.rng.randint(2, 8)
             final_price = (item_price - discount_per_item) * quantity
 
             latex = f"\\text{{Items cost }} \\${item_price} \\text{{ each. With a }} \\${discount_per_item} \\text{{ discount per item,}}"
@@ -5,9 +5,6 @@ Generates general linear equation problems (one variable, first degree)
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class LinearEquationsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the linear equations generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -49,9 +45,9 @@ class LinearEquationsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate simple linear: ax + b = c"""
-        x = random.randint(1, 12)
-        a = random.randint(2, 6)
-        b = random.randint(1, 10)
+        x = self.rng.randint(1, 12)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 10)
         c = a * x + b
 
         latex = f"{a}x + {b} = {c}"
@@ -66,13 +62,13 @@ class LinearEquationsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate with distribution or combining like terms"""
-        equation_type = random.choice(['distribution', 'combine_terms', 'subtract_form'])
+        equation_type = self.rng.choice(['distribution', 'combine_terms', 'subtract_form'])
 
         if equation_type == 'distribution':
             # a(x + b) = c
-            x = random.randint(2, 10)
-            a = random.randint(2, 5)
-            b = random.randint(1, 8)
+            x = self.rng.randint(2, 10)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 8)
             c = a * (x + b)
 
             latex = f"{a}(x + {b}) = {c}"
@@ -87,9 +83,9 @@ class LinearEquationsGenerator:
 
         elif equation_type == 'combine_terms':
             # ax + bx = c
-            x = random.randint(2, 10)
-            a = random.randint(2, 5)
-            b = random.randint(1, 4)
+            x = self.rng.randint(2, 10)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 4)
             c = (a + b) * x
 
             latex = f"{a}x + {b}x = {c}"
@@ -103,9 +99,9 @@ class LinearEquationsGenerator:
 
         else:  # subtract_form
             # ax - b = c
-            x = random.randint(3, 12)
-            a = random.randint(2, 6)
-            b = random.randint(1, 15)
+            x = self.rng.randint(3, 12)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 15)
             c = a * x - b
 
             latex = f"{a}x - {b} = {c}"
@@ -120,14 +116,14 @@ class LinearEquationsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate with variables on both sides"""
-        equation_type = random.choice(['vars_both_sides', 'distribution_both', 'negative_coef'])
+        equation_type = self.rng.choice(['vars_both_sides', 'distribution_both', 'negative_coef'])
 
         if equation_type == 'vars_both_sides':
             # ax + b = cx + d
-            x = random.randint(3, 15)
-            a = random.randint(3, 8)
-            c = random.randint(1, a - 1)
-            b = random.randint(2, 12)
+            x = self.rng.randint(3, 15)
+            a = self.rng.randint(3, 8)
+            c = self.rng.randint(1, a - 1)
+            b = self.rng.randint(2, 12)
             d = (a - c) * x + b
 
             latex = f"{a}x + {b} = {c}x + {d}"
@@ -143,17 +139,17 @@ class LinearEquationsGenerator:
 
         elif equation_type == 'distribution_both':
             # a(x + b) = c(x + d)
-            x = random.randint(2, 8)
-            a = random.randint(2, 5)
-            c = random.randint(1, a - 1) if a > 1 else random.randint(1, 3)
-            b = random.randint(1, 6)
+            x = self.rng.randint(2, 8)
+            a = self.rng.randint(2, 5)
+            c = self.rng.randint(1, a - 1) if a > 1 else self.rng.randint(1, 3)
+            b = self.rng.randint(1, 6)
             # Solve for d: a(x + b) = c(x + d)
             # ax + ab = cx + cd
             # ax - cx = cd - ab
             # x(a - c) = cd - ab
             # cd = x(a - c) + ab
             # d = (x(a - c) + ab) / c
-            d = (x * (a - c) + a * b) // c if (x * (a - c) + a * b) % c == 0 else random.randint(1, 8)
+            d = (x * (a - c) + a * b) // c if (x * (a - c) + a * b) % c == 0 else self.rng.randint(1, 8)
 
             latex = f"{a}(x + {b}) = {c}(x + {d})"
             solution = x
@@ -168,9 +164,9 @@ class LinearEquationsGenerator:
 
         else:  # negative_coef
             # -ax + b = c
-            x = random.randint(2, 10)
-            a = random.randint(2, 6)
-            b = random.randint(5, 20)
+            x = self.rng.randint(2, 10)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(5, 20)
             c = -a * x + b
 
             latex = f"-{a}x + {b} = {c}"
@@ -185,16 +181,16 @@ class LinearEquationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate complex linear with fractions or multiple operations"""
-        challenge_type = random.choice(['fraction_coef', 'nested_parens', 'complex_both_sides'])
+        challenge_type = self.rng.choice(['fraction_coef', 'nested_parens', 'complex_both_sides'])
 
         if challenge_type == 'fraction_coef':
             # (a/b)x + c = d
-            x = random.randint(4, 20)
-            numerator = random.randint(2, 5)
-            denominator = random.choice([2, 3, 4])
+            x = self.rng.randint(4, 20)
+            numerator = self.rng.randint(2, 5)
+            denominator = self.rng.choice([2, 3, 4])
             # Make x divisible by denominator
-            x = random.randint(2, 8) * denominator
-            c = random.randint(3, 12)
+            x = self.rng.randint(2, 8) * denominator
+            c = self.rng.randint(3, 12)
             d = (numerator * x) // denominator + c
 
             latex = f"\\frac{{{numerator}}}{{{denominator}}}x + {c} = {d}"
@@ -208,11 +204,11 @@ class LinearEquationsGenerator:
 
         elif challenge_type == 'nested_parens':
             # a(b(x + c) + d) = e
-            x = random.randint(2, 8)
-            a = random.randint(2, 4)
-            b = random.randint(2, 3)
-            c = random.randint(1, 5)
-            d = random.randint(1, 6)
+            x = self.rng.randint(2, 8)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(2, 3)
+            c = self.rng.randint(1, 5)
+            d = self.rng.randint(1, 6)
             e = a * (b * (x + c) + d)
 
             latex = f"{a}({b}(x + {c}) + {d}) = {e}"
@@ -227,11 +223,11 @@ class LinearEquationsGenerator:
 
         else:  # complex_both_sides
             # ax + b - cx = dx + e
-            x = random.randint(3, 12)
-            a = random.randint(4, 8)
-            c = random.randint(1, 3)
-            d = random.randint(1, 4)
-            b = random.randint(5, 15)
+            x = self.rng.randint(3, 12)
+            a = self.rng.randint(4, 8)
+            c = self.rng.randint(1, 3)
+            d = self.rng.randint(1, 4)
+            b = self.rng.randint(5, 15)
             e = (a - c - d) * x + b
 
             latex = f"{a}x + {b} - {c}x = {d}x + {e}"
@@ -5,9 +5,6 @@ Generates problems where students solve for a specific variable in an equation
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class LiteralEquationsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the literal equations generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -58,7 +54,7 @@ class LiteralEquationsGenerator:
             ("V = lwh", "h", "h = \\frac{V}{lw}"),
         ]
 
-        formula, solve_for, solution = random.choice(formulas)
+        formula, solve_for, solution = self.rng.choice(formulas)
         latex = f"\\text{{Solve for }} {solve_for}: {formula}"
 
         return Equation(latex=latex, solution=solution, steps=[solution], difficulty='easy')
@@ -75,7 +71,7 @@ class LiteralEquationsGenerator:
             ("P = 2l + 2w", "w", "w = \\frac{P - 2l}{2}"),
         ]
 
-        formula, solve_for, solution = random.choice(formulas)
+        formula, solve_for, solution = self.rng.choice(formulas)
         latex = f"\\text{{Solve for }} {solve_for}: {formula}"
 
         return Equation(latex=latex, solution=solution, steps=[solution], difficulty='medium')
@@ -92,7 +88,7 @@ class LiteralEquationsGenerator:
             ("s = \\frac{1}{2}at^2", "t", "t = \\sqrt{\\frac{2s}{a}}"),
         ]
 
-        formula, solve_for, solution = random.choice(formulas)
+        formula, solve_for, solution = self.rng.choice(formulas)
         latex = f"\\text{{Solve for }} {solve_for}: {formula}"
 
         return Equation(latex=latex, solution=solution, steps=[solution], difficulty='hard')
@@ -111,7 +107,7 @@ class LiteralEquationsGenerator:
             ("\\frac{x - h}{a} = \\frac{y - k}{b}", "x", "x = \\frac{a(y - k)}{b} + h"),
         ]
 
-        formula, solve_for, solution = random.choice(formulas)
+        formula, solve_for, solution = self.rng.choice(formulas)
         latex = f"\\text{{Solve for }} {solve_for}: {formula}"
 
         return Equation(latex=latex, solution=solution, steps=[solution], difficulty='challenge')
@@ -5,9 +5,6 @@ Generates problems focused on understanding and applying the distributive proper
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class ParenthesisExplanationMultiplicationGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -40,13 +36,13 @@ class ParenthesisExplanationMultiplicationGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy: Basic distribution with positive numbers."""
-        problem_type = random.choice(['numeric', 'single_var', 'explain'])
+        problem_type = self.rng.choice(['numeric', 'single_var', 'explain'])
 
         if problem_type == 'numeric':
             # a(b + c) with numbers only
-            a = random.randint(2, 5)
-            b = random.randint(2, 10)
-            c = random.randint(1, 10)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(2, 10)
+            c = self.rng.randint(1, 10)
             result = a * (b + c)
 
             latex = f"\\text{{Expand: }} {a}({b} + {c})"
@@ -61,8 +57,8 @@ class ParenthesisExplanationMultiplicationGenerator:
 
         elif problem_type == 'single_var':
             # a(x + b)
-            a = random.randint(2, 5)
-            b = random.randint(1, 10)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 10)
 
             latex = f"\\text{{Expand: }} {a}(x + {b})"
             solution = f"{a}x + {a * b}"
@@ -74,9 +70,9 @@ class ParenthesisExplanationMultiplicationGenerator:
             ]
 
         else:  # explain
-            a = random.randint(2, 4)
-            b = random.randint(3, 8)
-            c = random.randint(2, 7)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(3, 8)
+            c = self.rng.randint(2, 7)
 
             latex = f"\\text{{Why does }} {a}({b} + {c}) = {a} \\times {b} + {a} \\times {c}?"
             solution = "Distributive Property"
@@ -91,12 +87,12 @@ class ParenthesisExplanationMultiplicationGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium: Distribution with subtraction and negative numbers."""
-        problem_type = random.choice(['subtraction', 'negative_outside', 'coefficient_var'])
+        problem_type = self.rng.choice(['subtraction', 'negative_outside', 'coefficient_var'])
 
         if problem_type == 'subtraction':
             # a(x - b)
-            a = random.randint(2, 6)
-            b = random.randint(1, 10)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 10)
 
             latex = f"\\text{{Expand: }} {a}(x - {b})"
             solution = f"{a}x - {a * b}"
@@ -109,8 +105,8 @@ class ParenthesisExplanationMultiplicationGenerator:
 
         elif problem_type == 'negative_outside':
             # -a(x + b)
-            a = random.randint(2, 5)
-            b = random.randint(1, 8)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 8)
 
             latex = f"\\text{{Expand: }} -{a}(x + {b})"
             solution = f"-{a}x - {a * b}"
@@ -123,9 +119,9 @@ class ParenthesisExplanationMultiplicationGenerator:
 
         else:  # coefficient_var
             # a(bx + c)
-            a = random.randint(2, 4)
-            b = random.randint(2, 5)
-            c = random.randint(1, 8)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(2, 5)
+            c = self.rng.randint(1, 8)
 
             latex = f"\\text{{Expand: }} {a}({b}x + {c})"
             solution = f"{a * b}x + {a * c}"
@@ -140,13 +136,13 @@ class ParenthesisExplanationMultiplicationGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard: Multiple terms or multiple variables."""
-        problem_type = random.choice(['three_terms', 'two_variables', 'negative_both'])
+        problem_type = self.rng.choice(['three_terms', 'two_variables', 'negative_both'])
 
         if problem_type == 'three_terms':
             # a(x + b + c)
-            a = random.randint(2, 5)
-            b = random.randint(1, 6)
-            c = random.randint(1, 6)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 6)
+            c = self.rng.randint(1, 6)
 
             latex = f"\\text{{Expand: }} {a}(x + {b} + {c})"
             solution = f"{a}x + {a * b} + {a * c}"
@@ -160,7 +156,7 @@ class ParenthesisExplanationMultiplicationGenerator:
 
         elif problem_type == 'two_variables':
             # a(x + y)
-            a = random.randint(2, 6)
+            a = self.rng.randint(2, 6)
 
             latex = f"\\text{{Expand: }} {a}(x + y)"
             solution = f"{a}x + {a}y"
@@ -173,8 +169,8 @@ class ParenthesisExplanationMultiplicationGenerator:
 
         else:  # negative_both
             # -a(x - b) or -a(-x + b)
-            a = random.randint(2, 5)
-            b = random.randint(1, 8)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 8)
 
             latex = f"\\text{{Expand: }} -{a}(x - {b})"
             solution = f"-{a}x + {a * b}"
@@ -190,14 +186,14 @@ class ParenthesisExplanationMultiplicationGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge: Complex distribution or combining after distribution."""
-        problem_type = random.choice(['double_distribute', 'combine_after', 'nested'])
+        problem_type = self.rng.choice(['double_distribute', 'combine_after', 'nested'])
 
         if problem_type == 'double_distribute':
             # a(x + b) + c(x + d)
-            a = random.randint(2, 4)
-            b = random.randint(1, 5)
-            c = random.randint(2, 4)
-            d = random.randint(1, 5)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(1, 5)
+            c = self.rng.randint(2, 4)
+            d = self.rng.randint(1, 5)
 
             latex = f"\\text{{Expand and simplify: }} {a}(x + {b}) + {c}(x + {d})"
             combined_x = a + c
@@ -214,10 +210,10 @@ class ParenthesisExplanationMultiplicationGenerator:
 
         elif problem_type == 'combine_after':
             # a(x + b) - c(x + d)
-            a = random.randint(3, 6)
-            b = random.randint(1, 5)
-            c = random.randint(2, a - 1)
-            d = random.randint(1, 5)
+            a = self.rng.randint(3, 6)
+            b = self.rng.randint(1, 5)
+            c = self.rng.randint(2, a - 1)
+            d = self.rng.randint(1, 5)
 
             latex = f"\\text{{Expand and simplify: }} {a}(x + {b}) - {c}(x + {d})"
             combined_x = a - c
@@ -238,9 +234,9 @@ class ParenthesisExplanationMultiplicationGenerator:
 
         else:  # nested
             # a(b(x + c))
-            a = random.randint(2, 3)
-            b = random.randint(2, 4)
-            c = random.randint(1, 5)
+            a = self.rng.randint(2, 3)
+            b = self.rng.randint(2, 4)
+            c = self.rng.randint(1, 5)
 
             latex = f"\\text{{Expand: }} {a}({b}(x + {c}))"
             solution = f"{a * b}x + {a * b * c}"
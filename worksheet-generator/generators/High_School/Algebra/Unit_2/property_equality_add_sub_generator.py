@@ -5,9 +5,6 @@ Teaches the addition and subtraction properties of equality
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class PropertyEqualityAddSubGenerator:
 
     def __init__(self, seed=None):
         """Initialize the property of equality (add/sub) generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -49,8 +45,8 @@ class PropertyEqualityAddSubGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate simple one-step: x + a = b"""
-        x = random.randint(1, 15)
-        a = random.randint(1, 12)
+        x = self.rng.randint(1, 15)
+        a = self.rng.randint(1, 12)
         b = x + a
 
         latex = f"x + {a} = {b}"
@@ -66,14 +62,14 @@ class PropertyEqualityAddSubGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate one-step with subtraction: x - a = b"""
-        x = random.randint(5, 20)
-        a = random.randint(1, 15)
+        x = self.rng.randint(5, 20)
+        a = self.rng.randint(1, 15)
         b = x - a
 
         if b < 0:
             # Make it positive
-            x = random.randint(10, 25)
-            a = random.randint(1, 8)
+            x = self.rng.randint(10, 25)
+            a = self.rng.randint(1, 8)
             b = x - a
 
         latex = f"x - {a} = {b}"
@@ -89,12 +85,12 @@ class PropertyEqualityAddSubGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate with negative numbers or larger values"""
-        equation_type = random.choice(['negative_const', 'negative_result', 'larger_numbers'])
+        equation_type = self.rng.choice(['negative_const', 'negative_result', 'larger_numbers'])
 
         if equation_type == 'negative_const':
             # x + (-a) = b  or  x - a = b
-            x = random.randint(5, 20)
-            a = random.randint(5, 15)
+            x = self.rng.randint(5, 20)
+            a = self.rng.randint(5, 15)
             b = x - a
 
             latex = f"x - {a} = {b}"
@@ -108,8 +104,8 @@ class PropertyEqualityAddSubGenerator:
 
         elif equation_type == 'negative_result':
             # Result is negative
-            x = random.randint(-15, -2)
-            a = random.randint(1, 10)
+            x = self.rng.randint(-15, -2)
+            a = self.rng.randint(1, 10)
             b = x + a
 
             latex = f"x + {a} = {b}"
@@ -122,9 +118,9 @@ class PropertyEqualityAddSubGenerator:
             ]
 
         else:  # larger_numbers
-            x = random.randint(20, 50)
-            a = random.randint(15, 40)
-            operation = random.choice(['+', '-'])
+            x = self.rng.randint(20, 50)
+            a = self.rng.randint(15, 40)
+            operation = self.rng.choice(['+', '-'])
 
             if operation == '+':
                 b = x + a
@@ -149,13 +145,13 @@ class PropertyEqualityAddSubGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate with multiple terms or variables on both sides"""
-        challenge_type = random.choice(['two_terms_left', 'constant_on_right', 'reorganize'])
+        challenge_type = self.rng.choice(['two_terms_left', 'constant_on_right', 'reorganize'])
 
         if challenge_type == 'two_terms_left':
             # x + a + b = c
-            x = random.randint(5, 15)
-            a = random.randint(2, 8)
-            b = random.randint(2, 8)
+            x = self.rng.randint(5, 15)
+            a = self.rng.randint(2, 8)
+            b = self.rng.randint(2, 8)
             c = x + a + b
 
             latex = f"x + {a} + {b} = {c}"
@@ -171,8 +167,8 @@ class PropertyEqualityAddSubGenerator:
 
         elif challenge_type == 'constant_on_right':
             # x = a + b
-            x = random.randint(10, 30)
-            a = random.randint(3, 15)
+            x = self.rng.randint(10, 30)
+            a = self.rng.randint(3, 15)
             b = x - a
 
             latex = f"x = {a} + {b}"
@@ -185,8 +181,8 @@ class PropertyEqualityAddSubGenerator:
 
         else:  # reorganize
             # a + x = b
-            x = random.randint(5, 20)
-            a = random.randint(3, 12)
+            x = self.rng.randint(5, 20)
+            a = self.rng.randint(3, 12)
             b = a + x
 
             latex = f"{a} + x = {b}"
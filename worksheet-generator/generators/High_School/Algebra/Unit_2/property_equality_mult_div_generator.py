@@ -5,9 +5,6 @@ Teaches the multiplication and division properties of equality
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class PropertyEqualityMultDivGenerator:
 
     def __init__(self, seed=None):
         """Initialize the property of equality (mult/div) generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -49,8 +45,8 @@ class PropertyEqualityMultDivGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate simple division: ax = b"""
-        x = random.randint(2, 12)
-        a = random.randint(2, 8)
+        x = self.rng.randint(2, 12)
+        a = self.rng.randint(2, 8)
         b = a * x
 
         latex = f"{a}x = {b}"
@@ -66,13 +62,13 @@ class PropertyEqualityMultDivGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate with fraction: x/a = b"""
-        x = random.randint(4, 30)
+        x = self.rng.randint(4, 30)
         # Find divisors of x for cleaner problems
         divisors = [i for i in range(2, 10) if x % i == 0]
         if divisors:
-            a = random.choice(divisors)
+            a = self.rng.choice(divisors)
         else:
-            a = random.randint(2, 5)
+            a = self.rng.randint(2, 5)
         b = x // a if x % a == 0 else x / a
 
         latex = f"\\frac{{x}}{{{a}}} = {int(b) if b == int(b) else b}"
@@ -88,12 +84,12 @@ class PropertyEqualityMultDivGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate with negative coefficients or larger numbers"""
-        equation_type = random.choice(['negative_coef', 'larger_numbers', 'negative_result'])
+        equation_type = self.rng.choice(['negative_coef', 'larger_numbers', 'negative_result'])
 
         if equation_type == 'negative_coef':
             # -ax = b
-            x = random.randint(2, 10)
-            a = random.randint(2, 8)
+            x = self.rng.randint(2, 10)
+            a = self.rng.randint(2, 8)
             b = -a * x
 
             latex = f"-{a}x = {b}"
@@ -107,8 +103,8 @@ class PropertyEqualityMultDivGenerator:
 
         elif equation_type == 'negative_result':
             # ax = -b (negative result)
-            x = random.randint(-12, -2)
-            a = random.randint(2, 7)
+            x = self.rng.randint(-12, -2)
+            a = self.rng.randint(2, 7)
             b = a * x
 
             latex = f"{a}x = {b}"
@@ -121,9 +117,9 @@ class PropertyEqualityMultDivGenerator:
             ]
 
         else:  # larger_numbers
-            x = random.randint(10, 30)
-            a = random.randint(5, 12)
-            operation = random.choice(['multiply', 'divide'])
+            x = self.rng.randint(10, 30)
+            a = self.rng.randint(5, 12)
+            operation = self.rng.choice(['multiply', 'divide'])
 
             if operation == 'multiply':
                 b = a * x
@@ -135,7 +131,7 @@ class PropertyEqualityMultDivGenerator:
                 ]
             else:  # divide
                 # Make x divisible by a for cleaner answer
-                x = random.randint(5, 15) * a
+                x = self.rng.randint(5, 15) * a
                 b = x // a
                 latex = f"\\frac{{x}}{{{a}}} = {b}"
                 steps = [
@@ -150,15 +146,15 @@ class PropertyEqualityMultDivGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate with fractions or decimals"""
-        challenge_type = random.choice(['fraction_coef', 'mixed_operations', 'decimal'])
+        challenge_type = self.rng.choice(['fraction_coef', 'mixed_operations', 'decimal'])
 
         if challenge_type == 'fraction_coef':
             # (a/b)x = c
-            x = random.randint(4, 20)
-            numerator = random.randint(2, 5)
-            denominator = random.choice([2, 3, 4, 5])
+            x = self.rng.randint(4, 20)
+            numerator = self.rng.randint(2, 5)
+            denominator = self.rng.choice([2, 3, 4, 5])
             # Make sure x is divisible by denominator for cleaner answer
-            x = random.randint(2, 8) * denominator
+            x = self.rng.randint(2, 8) * denominator
             c = (numerator * x) // denominator
 
             latex = f"\\frac{{{numerator}}}{{{denominator}}}x = {c}"
@@ -172,7 +168,7 @@ class PropertyEqualityMultDivGenerator:
 
         elif challenge_type == 'mixed_operations':
             # 2x = 3x - a (requires subtraction then division)
-            x = random.randint(5, 20)
+            x = self.rng.randint(5, 20)
             a = x  # So that 3x - x = 2x, and 2x = a
 
             latex = f"2x = 3x - {a}"
@@ -187,8 +183,8 @@ class PropertyEqualityMultDivGenerator:
 
         else:  # decimal
             # ax = b with decimal result
-            a = random.choice([2, 4, 5])
-            b = random.randint(10, 50)
+            a = self.rng.choice([2, 4, 5])
+            b = self.rng.randint(10, 50)
             x = b / a
 
             latex = f"{a}x = {b}"
@@ -24,8 +24,7 @@ class QuadraticEquationsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the quadratic equations generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[QuadraticProblem]:
         """
@@ -75,11 +74,11 @@ class QuadraticEquationsGenerator:
 
     def _generate_easy(self) -> QuadraticProblem:
         """Generate easy quadratic problems (simple square roots, factoring with integers)."""
-        problem_type = random.choice(['square_root_simple', 'factor_simple', 'vertex_form_simple'])
+        problem_type = self.rng.choice(['square_root_simple', 'factor_simple', 'vertex_form_simple'])
 
         if problem_type == 'square_root_simple':
             # Solve x^2 = c
-            c = random.choice([1, 4, 9, 16, 25, 36, 49, 64, 81, 100])
+            c = self.rng.choice([1, 4, 9, 16, 25, 36, 49, 64, 81, 100])
             sqrt_c = int(math.sqrt(c))
 
             latex = f"\\text{{Solve: }} x^2 = {c}"
@@ -88,8 +87,8 @@ class QuadraticEquationsGenerator:
 
         elif problem_type == 'factor_simple':
             # Solve (x - p)(x - q) = 0
-            p = random.randint(-5, 5)
-            q = random.randint(-5, 5)
+            p = self.rng.randint(-5, 5)
+            q = self.rng.randint(-5, 5)
 
             # Expand to standard form
             a = 1
@@ -111,8 +110,8 @@ class QuadraticEquationsGenerator:
 
         else:  # vertex_form_simple
             # Solve from vertex form (x - h)^2 = k
-            h = random.randint(-5, 5)
-            k = random.choice([0, 1, 4, 9, 16, 25])
+            h = self.rng.randint(-5, 5)
+            k = self.rng.choice([0, 1, 4, 9, 16, 25])
 
             if k == 0:
                 latex = f"\\text{{Solve: }} (x {-h:+d})^2 = 0".replace("+-", "-")
@@ -133,12 +132,12 @@ class QuadraticEquationsGenerator:
 
     def _generate_medium(self) -> QuadraticProblem:
         """Generate medium quadratic problems (with coefficients, standard form)."""
-        problem_type = random.choice(['square_root_coeff', 'standard_form', 'factor_with_coeff'])
+        problem_type = self.rng.choice(['square_root_coeff', 'standard_form', 'factor_with_coeff'])
 
         if problem_type == 'square_root_coeff':
             # Solve ax^2 = c
-            a = random.randint(2, 5)
-            c = random.choice([8, 18, 32, 50, 72, 98])
+            a = self.rng.randint(2, 5)
+            c = self.rng.choice([8, 18, 32, 50, 72, 98])
 
             latex = f"\\text{{Solve: }} {a}x^2 = {c}"
 
@@ -158,9 +157,9 @@ class QuadraticEquationsGenerator:
         elif problem_type == 'standard_form':
             # Standard form with nice discriminant
             a = 1
-            b = random.randint(-8, 8)
+            b = self.rng.randint(-8, 8)
             # Ensure discriminant is a perfect square
-            discriminant_sqrt = random.randint(0, 6)
+            discriminant_sqrt = self.rng.randint(0, 6)
             discriminant = discriminant_sqrt ** 2
             # b^2 - 4ac = discriminant
             # c = (b^2 - discriminant) / 4
@@ -181,10 +180,10 @@ class QuadraticEquationsGenerator:
 
         else:  # factor_with_coeff
             # Factor ax^2 + bx + c where a > 1
-            a = random.randint(2, 3)
+            a = self.rng.randint(2, 3)
             # Choose factors that work nicely
-            p = random.randint(-3, 3)
-            q = random.randint(-3, 3)
+            p = self.rng.randint(-3, 3)
+            q = self.rng.randint(-3, 3)
 
             # (ax - p)(x - q) = ax^2 - (aq + p)x + pq
             b = -(a * q + p)
@@ -207,13 +206,13 @@ class QuadraticEquationsGenerator:
 
     def _generate_hard(self) -> QuadraticProblem:
         """Generate hard quadratic problems (completing the square, complex vertex form)."""
-        problem_type = random.choice(['vertex_form_complex', 'complete_square_needed', 'word_problem'])
+        problem_type = self.rng.choice(['vertex_form_complex', 'complete_square_needed', 'word_problem'])
 
         if problem_type == 'vertex_form_complex':
             # Vertex form a(x - h)^2 + k = 0
-            a = random.choice([-2, -1, 1, 2, 3])
-            h = random.randint(-5, 5)
-            k = random.randint(-20, 20)
+            a = self.rng.choice([-2, -1, 1, 2, 3])
+            h = self.rng.randint(-5, 5)
+            k = self.rng.randint(-20, 20)
 
             if a == 1:
                 latex = f"\\text{{Solve: }} (x {-h:+d})^2 {k:+d} = 0".replace("+-", "-")
@@ -242,8 +241,8 @@ class QuadraticEquationsGenerator:
         elif problem_type == 'complete_square_needed':
             # Problem that benefits from completing the square
             a = 1
-            b = 2 * random.randint(-5, 5)  # Even coefficient for easier completing
-            c = random.randint(-10, 10)
+            b = 2 * self.rng.randint(-5, 5)  # Even coefficient for easier completing
+            c = self.rng.randint(-10, 10)
 
             latex = f"\\text{{Solve by completing the square: }} x^2 {b:+d}x {c:+d} = 0".replace("+-", "-")
 
@@ -269,8 +268,8 @@ class QuadraticEquationsGenerator:
 
         else:  # word_problem
             # Projectile motion problem
-            v0 = random.choice([16, 32, 48, 64])  # Initial velocity
-            h0 = random.choice([0, 10, 20, 30, 40])  # Initial height
+            v0 = self.rng.choice([16, 32, 48, 64])  # Initial velocity
+            h0 = self.rng.choice([0, 10, 20, 30, 40])  # Initial height
 
             latex = f"\\text{{A ball is thrown upward at {v0} ft/s from {h0} ft height. "
             latex += f"When does it hit the ground? (h = -16t^2 + {v0}t + {h0})}}"
@@ -301,14 +300,14 @@ class QuadraticEquationsGenerator:
 
     def _generate_challenge(self) -> QuadraticProblem:
         """Generate challenge quadratic problems (systems, complex applications)."""
-        problem_type = random.choice(['discriminant_analysis', 'parameter_problem', 'optimization'])
+        problem_type = self.rng.choice(['discriminant_analysis', 'parameter_problem', 'optimization'])
 
         if problem_type == 'discriminant_analysis':
             # Find values of k for which equation has specific solution types
             a = 1
-            b = random.randint(-6, 6)
+            b = self.rng.randint(-6, 6)
 
-            solution_type = random.choice(['two_real', 'one_real', 'no_real'])
+            solution_type = self.rng.choice(['two_real', 'one_real', 'no_real'])
 
             if solution_type == 'two_real':
                 latex = f"\\text{{Find k so that }} x^2 {b:+d}x + k = 0 \\text{{ has two distinct real solutions}}".replace("+-", "-")
@@ -330,8 +329,8 @@ class QuadraticEquationsGenerator:
 
         elif problem_type == 'parameter_problem':
             # Find parameter value given a root
-            root = random.randint(-5, 5)
-            other_root = random.randint(-5, 5)
+            root = self.rng.randint(-5, 5)
+            other_root = self.rng.randint(-5, 5)
 
             # If roots are r and s, then equation is x^2 - (r+s)x + rs = 0
             b = -(root + other_root)
@@ -344,7 +343,7 @@ class QuadraticEquationsGenerator:
 
         else:  # optimization
             # Maximum/minimum area or revenue problem
-            perimeter = random.choice([20, 24, 30, 40])
+            perimeter = self.rng.choice([20, 24, 30, 40])
 
             latex = f"\\text{{A rectangle has perimeter {perimeter} ft. Find dimensions for maximum area.}}"
 
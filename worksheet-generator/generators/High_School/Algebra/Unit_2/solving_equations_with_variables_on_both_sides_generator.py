@@ -5,9 +5,6 @@ Generates problems where variables appear on both sides of the equation
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class SolvingEquationsWithVariablesOnBothSidesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -41,10 +37,10 @@ class SolvingEquationsWithVariablesOnBothSidesGenerator:
     def _generate_easy(self) -> Equation:
         """Generate easy: Simple ax + b = cx + d."""
         # Ensure a != c for valid equation
-        a = random.randint(3, 8)
-        c = random.randint(1, a - 1)
-        x = random.randint(-10, 10)
-        b = random.randint(-15, 15)
+        a = self.rng.randint(3, 8)
+        c = self.rng.randint(1, a - 1)
+        x = self.rng.randint(-10, 10)
+        b = self.rng.randint(-15, 15)
         d = a * x + b - c * x
 
         # Format: ax + b = cx + d
@@ -67,14 +63,14 @@ class SolvingEquationsWithVariablesOnBothSidesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium: Equations requiring more steps."""
-        problem_type = random.choice(['larger_coef', 'negative_coef', 'move_larger'])
+        problem_type = self.rng.choice(['larger_coef', 'negative_coef', 'move_larger'])
 
         if problem_type == 'larger_coef':
             # Larger coefficients
-            a = random.randint(5, 12)
-            c = random.randint(2, a - 1)
-            x = random.randint(-8, 8)
-            b = random.randint(-20, 20)
+            a = self.rng.randint(5, 12)
+            c = self.rng.randint(2, a - 1)
+            x = self.rng.randint(-8, 8)
+            b = self.rng.randint(-20, 20)
             d = a * x + b - c * x
 
             left_const = f"+ {b}" if b >= 0 else f"- {abs(b)}"
@@ -84,10 +80,10 @@ class SolvingEquationsWithVariablesOnBothSidesGenerator:
 
         elif problem_type == 'negative_coef':
             # Negative coefficient on one side
-            a = random.randint(2, 6)
-            c = -random.randint(1, 5)
-            x = random.randint(-8, 8)
-            b = random.randint(-15, 15)
+            a = self.rng.randint(2, 6)
+            c = -self.rng.randint(1, 5)
+            x = self.rng.randint(-8, 8)
+            b = self.rng.randint(-15, 15)
             d = a * x + b - c * x
 
             left_const = f"+ {b}" if b >= 0 else f"- {abs(b)}"
@@ -97,10 +93,10 @@ class SolvingEquationsWithVariablesOnBothSidesGenerator:
 
         else:  # move_larger
             # Need to move the larger variable term
-            a = random.randint(2, 5)
-            c = random.randint(a + 1, 10)
-            x = random.randint(-8, 8)
-            b = random.randint(-15, 15)
+            a = self.rng.randint(2, 5)
+            c = self.rng.randint(a + 1, 10)
+            x = self.rng.randint(-8, 8)
+            b = self.rng.randint(-15, 15)
             d = a * x + b - c * x
 
             left_const = f"+ {b}" if b >= 0 else f"- {abs(b)}"
@@ -120,14 +116,14 @@ class SolvingEquationsWithVariablesOnBothSidesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard: Include distribution on one or both sides."""
-        problem_type = random.choice(['distribute_left', 'distribute_right', 'both_sides'])
+        problem_type = self.rng.choice(['distribute_left', 'distribute_right', 'both_sides'])
 
         if problem_type == 'distribute_left':
             # a(x + b) = cx + d
-            a = random.choice([2, 3, 4])
-            c = random.randint(1, 6)
-            x = random.randint(-6, 6)
-            b = random.randint(-5, 5)
+            a = self.rng.choice([2, 3, 4])
+            c = self.rng.randint(1, 6)
+            x = self.rng.randint(-6, 6)
+            b = self.rng.randint(-5, 5)
             d = a * (x + b) - c * x
 
             b_str = f"+ {b}" if b >= 0 else f"- {abs(b)}"
@@ -137,10 +133,10 @@ class SolvingEquationsWithVariablesOnBothSidesGenerator:
 
         elif problem_type == 'distribute_right':
             # ax + b = c(x + d)
-            a = random.randint(3, 7)
-            c = random.choice([2, 3])
-            x = random.randint(-6, 6)
-            d = random.randint(-5, 5)
+            a = self.rng.randint(3, 7)
+            c = self.rng.choice([2, 3])
+            x = self.rng.randint(-6, 6)
+            d = self.rng.randint(-5, 5)
             b = c * (x + d) - a * x
 
             b_str = f"+ {b}" if b >= 0 else f"- {abs(b)}"
@@ -150,18 +146,18 @@ class SolvingEquationsWithVariablesOnBothSidesGenerator:
 
         else:  # both_sides
             # a(x + b) = c(x + d)
-            a = random.choice([2, 3])
-            c = random.choice([4, 5])
-            x = random.randint(-5, 5)
-            b = random.randint(-4, 4)
-            d = (a * (x + b) - c * x) // c if (a * (x + b) - c * x) % c == 0 else random.randint(-4, 4)
+            a = self.rng.choice([2, 3])
+            c = self.rng.choice([4, 5])
+            x = self.rng.randint(-5, 5)
+            b = self.rng.randint(-4, 4)
+            d = (a * (x + b) - c * x) // c if (a * (x + b) - c * x) % c == 0 else self.rng.randint(-4, 4)
             # Recalculate x for clean solution
             if a != c:
-                d = random.randint(-4, 4)
-                x = (c * d - a * b) // (a - c) if (c * d - a * b) % (a - c) == 0 else random.randint(-5, 5)
+                d = self.rng.randint(-4, 4)
+                x = (c * d - a * b) // (a - c) if (c * d - a * b) % (a - c) == 0 else self.rng.randint(-5, 5)
                 # Verify
                 if a * (x + b) != c * (x + d):
-                    x = random.randint(-5, 5)
+                    x = self.rng.randint(-5, 5)
                     d = (a * (x + b) - c * x) // c
 
             b_str = f"+ {b}" if b >= 0 else f"- {abs(b)}"
@@ -182,14 +178,14 @@ class SolvingEquationsWithVariablesOnBothSidesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge: Complex equations or special cases."""
-        problem_type = random.choice(['fractions', 'no_solution', 'infinite'])
+        problem_type = self.rng.choice(['fractions', 'no_solution', 'infinite'])
 
         if problem_type == 'fractions':
             # Fractional coefficients
-            a = random.choice([2, 4])  # Coefficient that divides evenly
-            c = random.choice([2, 3])
-            x = a * random.randint(-4, 4)  # Ensure clean division
-            b = random.randint(-10, 10)
+            a = self.rng.choice([2, 4])  # Coefficient that divides evenly
+            c = self.rng.choice([2, 3])
+            x = a * self.rng.randint(-4, 4)  # Ensure clean division
+            b = self.rng.randint(-10, 10)
             d = x // a * a + b - c * x // 2
 
             latex = f"\\frac{{{a}x}}{{{a}}} + {b} = \\frac{{{c}x}}{{{2}}} + {d}"
@@ -206,9 +202,9 @@ class SolvingEquationsWithVariablesOnBothSidesGenerator:
 
         elif problem_type == 'no_solution':
             # Equations with no solution: ax + b = ax + c where b != c
-            a = random.randint(2, 6)
-            b = random.randint(1, 10)
-            c = b + random.randint(1, 5)  # c != b
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 10)
+            c = b + self.rng.randint(1, 5)  # c != b
 
             left_const = f"+ {b}" if b >= 0 else f"- {abs(b)}"
             right_const = f"+ {c}" if c >= 0 else f"- {abs(c)}"
@@ -224,8 +220,8 @@ class SolvingEquationsWithVariablesOnBothSidesGenerator:
 
         else:  # infinite
             # Equations with infinite solutions: ax + b = ax + b
-            a = random.randint(2, 6)
-            b = random.randint(-10, 10)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(-10, 10)
 
             const_str = f"+ {b}" if b >= 0 else f"- {abs(b)}"
 
@@ -5,9 +5,6 @@ Generates problems requiring multiple steps to solve linear equations
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class SolvingMultiStepEquationsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -49,9 +45,9 @@ class SolvingMultiStepEquationsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy: Two-step equations (ax + b = c)."""
-        a = random.choice([2, 3, 4, 5])
-        x = random.randint(-10, 10)
-        b = random.randint(-10, 10)
+        a = self.rng.choice([2, 3, 4, 5])
+        x = self.rng.randint(-10, 10)
+        b = self.rng.randint(-10, 10)
         c = a * x + b
 
         # Format equation
@@ -73,13 +69,13 @@ class SolvingMultiStepEquationsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium: Three-step equations with distribution or combining."""
-        problem_type = random.choice(['distribute', 'combine_then_solve'])
+        problem_type = self.rng.choice(['distribute', 'combine_then_solve'])
 
         if problem_type == 'distribute':
             # a(x + b) = c
-            a = random.choice([2, 3, 4])
-            x = random.randint(-8, 8)
-            b = random.randint(-5, 5)
+            a = self.rng.choice([2, 3, 4])
+            x = self.rng.randint(-8, 8)
+            b = self.rng.randint(-5, 5)
             c = a * (x + b)
 
             if b >= 0:
@@ -98,10 +94,10 @@ class SolvingMultiStepEquationsGenerator:
 
         else:  # combine_then_solve
             # ax + bx + c = d
-            a = random.randint(2, 5)
-            b = random.randint(1, 4)
-            x = random.randint(-8, 8)
-            c = random.randint(-10, 10)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 4)
+            x = self.rng.randint(-8, 8)
+            c = self.rng.randint(-10, 10)
             d = (a + b) * x + c
 
             latex = f"{a}x + {b}x + {c} = {d}" if c >= 0 else f"{a}x + {b}x - {abs(c)} = {d}"
@@ -118,15 +114,15 @@ class SolvingMultiStepEquationsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard: Multi-step with fractions or multiple distributions."""
-        problem_type = random.choice(['two_distributions', 'fraction_coef'])
+        problem_type = self.rng.choice(['two_distributions', 'fraction_coef'])
 
         if problem_type == 'two_distributions':
             # a(x + b) + c(x + d) = e
-            a = random.choice([2, 3])
-            c = random.choice([2, 3, 4])
-            x = random.randint(-5, 5)
-            b = random.randint(-4, 4)
-            d = random.randint(-4, 4)
+            a = self.rng.choice([2, 3])
+            c = self.rng.choice([2, 3, 4])
+            x = self.rng.randint(-5, 5)
+            b = self.rng.randint(-4, 4)
+            d = self.rng.randint(-4, 4)
             e = a * (x + b) + c * (x + d)
 
             b_str = f"+ {b}" if b >= 0 else f"- {abs(b)}"
@@ -148,8 +144,8 @@ class SolvingMultiStepEquationsGenerator:
 
         else:  # fraction_coef
             # (1/2)x + b = c  (use even numbers for clean answers)
-            x = random.choice([2, 4, 6, 8, 10]) * random.choice([-1, 1])
-            b = random.randint(-10, 10)
+            x = self.rng.choice([2, 4, 6, 8, 10]) * self.rng.choice([-1, 1])
+            b = self.rng.randint(-10, 10)
             c = x // 2 + b
 
             latex = f"\\frac{{1}}{{2}}x + {b} = {c}" if b >= 0 else f"\\frac{{1}}{{2}}x - {abs(b)} = {c}"
@@ -166,15 +162,15 @@ class SolvingMultiStepEquationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge: Complex multi-step with variables on one side."""
-        problem_type = random.choice(['nested', 'multiple_fractions', 'complex_combine'])
+        problem_type = self.rng.choice(['nested', 'multiple_fractions', 'complex_combine'])
 
         if problem_type == 'nested':
             # a(b(x + c) + d) = e
             a = 2
-            b = random.choice([2, 3])
-            x = random.randint(-4, 4)
-            c = random.randint(-3, 3)
-            d = random.randint(-5, 5)
+            b = self.rng.choice([2, 3])
+            x = self.rng.randint(-4, 4)
+            c = self.rng.randint(-3, 3)
+            d = self.rng.randint(-5, 5)
             e = a * (b * (x + c) + d)
 
             c_str = f"+ {c}" if c >= 0 else f"- {abs(c)}"
@@ -195,10 +191,10 @@ class SolvingMultiStepEquationsGenerator:
 
         elif problem_type == 'multiple_fractions':
             # x/a + x/b = c
-            a = random.choice([2, 3])
-            b = random.choice([4, 6])
+            a = self.rng.choice([2, 3])
+            b = self.rng.choice([4, 6])
             lcm = (a * b) // 2 if a * b % 2 == 0 else a * b  # Simplified LCM for 2,4 or 3,6
-            x = lcm * random.choice([1, 2])
+            x = lcm * self.rng.choice([1, 2])
             c = x // a + x // b
 
             latex = f"\\frac{{x}}{{{a}}} + \\frac{{x}}{{{b}}} = {c}"
@@ -212,11 +208,11 @@ class SolvingMultiStepEquationsGenerator:
 
         else:  # complex_combine
             # ax + b - cx + d = e
-            a = random.randint(3, 6)
-            c = random.randint(1, a - 1)
-            x = random.randint(-8, 8)
-            b = random.randint(-10, 10)
-            d = random.randint(-10, 10)
+            a = self.rng.randint(3, 6)
+            c = self.rng.randint(1, a - 1)
+            x = self.rng.randint(-8, 8)
+            b = self.rng.randint(-10, 10)
+            d = self.rng.randint(-10, 10)
             e = a * x + b - c * x + d
 
             b_str = f"+ {b}" if b >= 0 else f"- {abs(b)}"
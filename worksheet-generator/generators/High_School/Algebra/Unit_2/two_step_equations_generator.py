@@ -5,9 +5,6 @@ Generates problems that require two steps to solve
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class TwoStepEquationsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the two-step equations generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -49,9 +45,9 @@ class TwoStepEquationsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate simple two-step: ax + b = c"""
-        x = random.randint(1, 10)
-        a = random.randint(2, 5)
-        b = random.randint(1, 10)
+        x = self.rng.randint(1, 10)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 10)
         c = a * x + b
 
         latex = f"{a}x + {b} = {c}"
@@ -66,9 +62,9 @@ class TwoStepEquationsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate two-step with subtraction: ax - b = c"""
-        x = random.randint(1, 10)
-        a = random.randint(2, 6)
-        b = random.randint(1, 15)
+        x = self.rng.randint(1, 10)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 15)
         c = a * x - b
 
         if c < 0:
@@ -87,26 +83,26 @@ class TwoStepEquationsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate with negative coefficients or fractions"""
-        x = random.randint(1, 8)
+        x = self.rng.randint(1, 8)
 
-        equation_type = random.choice(['negative_coef', 'fraction_result', 'negative_both'])
+        equation_type = self.rng.choice(['negative_coef', 'fraction_result', 'negative_both'])
 
         if equation_type == 'negative_coef':
-            a = random.randint(-6, -2)
-            b = random.randint(1, 10)
+            a = self.rng.randint(-6, -2)
+            b = self.rng.randint(1, 10)
             c = a * x + b
             latex = f"{a}x + {b} = {c}"
         elif equation_type == 'fraction_result':
-            x = random.randint(1, 10)
-            a = random.randint(2, 5)
-            b = random.randint(1, 10)
+            x = self.rng.randint(1, 10)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 10)
             c = a * x + b
             # Swap to create fraction
             latex = f"{a}x + {b} = {c}"
             solution = x
         else:  # negative_both
-            a = random.randint(-5, -2)
-            b = random.randint(-10, -1)
+            a = self.rng.randint(-5, -2)
+            b = self.rng.randint(-10, -1)
             c = a * x + b
             latex = f"{a}x {b} = {c}" if b < 0 else f"{a}x + {b} = {c}"
 
@@ -116,27 +112,27 @@ class TwoStepEquationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate with distribution or variables on both sides"""
-        x = random.randint(1, 6)
+        x = self.rng.randint(1, 6)
 
-        equation_type = random.choice(['distribution', 'both_sides', 'fraction_coef'])
+        equation_type = self.rng.choice(['distribution', 'both_sides', 'fraction_coef'])
 
         if equation_type == 'distribution':
-            a = random.randint(2, 4)
-            b = random.randint(1, 5)
-            c = random.randint(1, 5)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(1, 5)
+            c = self.rng.randint(1, 5)
             result = a * (x + b)
             latex = f"{a}(x + {b}) = {result}"
             solution = x
         elif equation_type == 'both_sides':
-            a = random.randint(2, 5)
-            b = random.randint(1, 8)
-            c = random.randint(1, 4)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 8)
+            c = self.rng.randint(1, 4)
             d = a * x + b - c * x
             latex = f"{a}x + {b} = {c}x + {d}"
             solution = x
         else:  # fraction_coef
-            a = random.randint(2, 4)
-            b = random.randint(1, 10)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(1, 10)
             c = x + b * a
             latex = f"\\frac{{x}}{{{a}}} + {b} = {c // a}"
             solution = x
@@ -11,8 +11,7 @@ class WritingSlopeInterceptEquationsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int):
         """Generate worksheet problems."""
@@ -36,8 +35,8 @@ class WritingSlopeInterceptEquationsGenerator:
     def _generate_easy(self):
         """Generate an easy problem."""
         # Slope problem
-        m = random.randint(-5, 5)
-        b = random.randint(-10, 10)
+        m = self.rng.randint(-5, 5)
+        b = self.rng.randint(-10, 10)
 
         latex = f"y = {m}x + {b}"
         solution = f"slope = {m}, y-intercept = {b}"
@@ -53,8 +52,8 @@ class WritingSlopeInterceptEquationsGenerator:
     def _generate_medium(self):
         """Generate a medium problem."""
         # Find equation from points
-        x1, y1 = random.randint(-5, 5), random.randint(-10, 10)
-        x2, y2 = random.randint(-5, 5), random.randint(-10, 10)
+        x1, y1 = self.rng.randint(-5, 5), self.rng.randint(-10, 10)
+        x2, y2 = self.rng.randint(-5, 5), self.rng.randint(-10, 10)
         if x2 == x1:
             x2 += 1
 
@@ -75,8 +74,8 @@ class WritingSlopeInterceptEquationsGenerator:
     def _generate_hard(self):
         """Generate a hard problem."""
         # Find equation from points
-        x1, y1 = random.randint(-5, 5), random.randint(-10, 10)
-        x2, y2 = random.randint(-5, 5), random.randint(-10, 10)
+        x1, y1 = self.rng.randint(-5, 5), self.rng.randint(-10, 10)
+        x2, y2 = self.rng.randint(-5, 5), self.rng.randint(-10, 10)
         if x2 == x1:
             x2 += 1
 
@@ -97,8 +96,8 @@ class WritingSlopeInterceptEquationsGenerator:
     def _generate_challenge(self):
         """Generate a challenge problem."""
         # Find equation from points
-        x1, y1 = random.randint(-5, 5), random.randint(-10, 10)
-        x2, y2 = random.randint(-5, 5), random.randint(-10, 10)
+        x1, y1 = self.rng.randint(-5, 5), self.rng.randint(-10, 10)
+        x2, y2 = self.rng.randint(-5, 5), self.rng.randint(-10, 10)
         if x2 == x1:
             x2 += 1
 
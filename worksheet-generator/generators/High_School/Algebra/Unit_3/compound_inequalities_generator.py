@@ -7,11 +7,6 @@ Includes number line visualizations for solutions.
 import random
 from typing import Tuple, List, Optional
 from dataclasses import dataclass
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from numberline_utils import create_blank_numberline
 import matplotlib.pyplot as plt
@@ -47,8 +42,7 @@ class CompoundInequalityGenerator:
         Args:
             seed: Random seed for reproducibility (optional)
         """
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_inequality(self, difficulty: str, compound_type: Optional[str] = None) -> CompoundInequalityProblem:
         """
@@ -62,7 +56,7 @@ class CompoundInequalityGenerator:
             CompoundInequalityProblem object with problem and solution
         """
         if compound_type is None:
-            compound_type = random.choice(['and', 'or'])
+            compound_type = self.rng.choice(['and', 'or'])
 
         if difficulty == 'easy':
             return self._generate_easy(compound_type)
@@ -107,8 +101,8 @@ class CompoundInequalityGenerator:
 
         # Randomize padding to prevent predictable patterns
         # Use different padding on left and right sides
-        left_padding = random.randint(2, 5)
-        right_padding = random.randint(2, 5)
+        left_padding = self.rng.randint(2, 5)
+        right_padding = self.rng.randint(2, 5)
 
         return (min_boundary - left_padding, max_boundary + right_padding)
 
@@ -180,11 +174,11 @@ class CompoundInequalityGenerator:
         """
         if compound_type == 'and':
             # Generate a < x < b
-            a = random.randint(-10, 5)
-            b = a + random.randint(3, 8)
+            a = self.rng.randint(-10, 5)
+            b = a + self.rng.randint(3, 8)
 
             # Choose inequality types (both same for easy)
-            use_equal = random.choice([True, False])
+            use_equal = self.rng.choice([True, False])
             if use_equal:
                 ineq_1 = '\\leq'
                 ineq_2 = '\\leq'
@@ -198,10 +192,10 @@ class CompoundInequalityGenerator:
 
         else:  # 'or'
             # Generate x < a or x > b
-            a = random.randint(-5, 5)
-            b = a + random.randint(5, 10)
+            a = self.rng.randint(-5, 5)
+            b = a + self.rng.randint(5, 10)
 
-            use_equal = random.choice([True, False])
+            use_equal = self.rng.choice([True, False])
             if use_equal:
                 ineq_1 = '\\leq'
                 ineq_2 = '\\geq'
@@ -244,14 +238,14 @@ class CompoundInequalityGenerator:
         """
         if compound_type == 'and':
             # Generate a < x + c < b, solve for x
-            x_left = random.randint(-8, 4)
-            x_right = x_left + random.randint(4, 10)
-            c = random.randint(-6, 6)
+            x_left = self.rng.randint(-8, 4)
+            x_right = x_left + self.rng.randint(4, 10)
+            c = self.rng.randint(-6, 6)
 
             a = x_left + c
             b = x_right + c
 
-            use_equal = random.choice([True, False])
+            use_equal = self.rng.choice([True, False])
             if use_equal:
                 ineq_1 = '\\leq'
                 ineq_2 = '\\leq'
@@ -273,14 +267,14 @@ class CompoundInequalityGenerator:
 
         else:  # 'or'
             # Generate x + c < a or x + c > b
-            x_a = random.randint(-8, 2)
-            x_b = x_a + random.randint(6, 12)
-            c = random.randint(-6, 6)
+            x_a = self.rng.randint(-8, 2)
+            x_b = x_a + self.rng.randint(6, 12)
+            c = self.rng.randint(-6, 6)
 
             a = x_a + c
             b = x_b + c
 
-            use_equal = random.choice([True, False])
+            use_equal = self.rng.choice([True, False])
             c_str = f"+ {c}" if c >= 0 else f"- {abs(c)}"
 
             if use_equal:
@@ -330,15 +324,15 @@ class CompoundInequalityGenerator:
         """
         if compound_type == 'and':
             # Generate a < mx + c < b, solve for x
-            x_left = random.randint(-6, 3)
-            x_right = x_left + random.randint(4, 8)
-            m = random.randint(2, 5)
-            c = random.randint(-8, 8)
+            x_left = self.rng.randint(-6, 3)
+            x_right = x_left + self.rng.randint(4, 8)
+            m = self.rng.randint(2, 5)
+            c = self.rng.randint(-8, 8)
 
             a = m * x_left + c
             b = m * x_right + c
 
-            use_equal = random.choice([True, False])
+            use_equal = self.rng.choice([True, False])
             c_str = f"+ {c}" if c >= 0 else f"- {abs(c)}"
 
             if use_equal:
@@ -362,15 +356,15 @@ class CompoundInequalityGenerator:
 
         else:  # 'or'
             # Generate mx + c < a or mx + c > b
-            x_a = random.randint(-6, 2)
-            x_b = x_a + random.randint(5, 10)
-            m = random.randint(2, 5)
-            c = random.randint(-8, 8)
+            x_a = self.rng.randint(-6, 2)
+            x_b = x_a + self.rng.randint(5, 10)
+            m = self.rng.randint(2, 5)
+            c = self.rng.randint(-8, 8)
 
             a = m * x_a + c
             b = m * x_b + c
 
-            use_equal = random.choice([True, False])
+            use_equal = self.rng.choice([True, False])
             c_str = f"+ {c}" if c >= 0 else f"- {abs(c)}"
 
             if use_equal:
@@ -421,10 +415,10 @@ class CompoundInequalityGenerator:
         """
         if compound_type == 'and':
             # Generate a < mx + c < b with possible negative m
-            x_left = random.randint(-6, 3)
-            x_right = x_left + random.randint(4, 8)
-            m = random.choice([-4, -3, -2, 2, 3, 4, 5])
-            c = random.randint(-10, 10)
+            x_left = self.rng.randint(-6, 3)
+            x_right = x_left + self.rng.randint(4, 8)
+            m = self.rng.choice([-4, -3, -2, 2, 3, 4, 5])
+            c = self.rng.randint(-10, 10)
 
             if m > 0:
                 a = m * x_left + c
@@ -438,7 +432,7 @@ class CompoundInequalityGenerator:
                 final_left = x_left
                 final_right = x_right
 
-            use_equal = random.choice([True, False])
+            use_equal = self.rng.choice([True, False])
             c_str = f"+ {c}" if c >= 0 else f"- {abs(c)}"
 
             if use_equal:
@@ -471,15 +465,15 @@ class CompoundInequalityGenerator:
 
         else:  # 'or'
             # Generate mx + c < a or mx + c > b with possible negative m
-            x_a = random.randint(-6, 2)
-            x_b = x_a + random.randint(5, 10)
-            m = random.choice([-4, -3, -2, 2, 3, 4, 5])
-            c = random.randint(-10, 10)
+            x_a = self.rng.randint(-6, 2)
+            x_b = x_a + self.rng.randint(5, 10)
+            m = self.rng.choice([-4, -3, -2, 2, 3, 4, 5])
+            c = self.rng.randint(-10, 10)
 
             a = m * x_a + c
             b = m * x_b + c
 
-            use_equal = random.choice([True, False])
+            use_equal = self.rng.choice([True, False])
             c_str = f"+ {c}" if c >= 0 else f"- {abs(c)}"
             m_str = f"{m}x" if m != -1 else "-x"
 
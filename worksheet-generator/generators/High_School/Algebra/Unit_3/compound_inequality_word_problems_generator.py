@@ -11,8 +11,7 @@ class CompoundInequalityWordProblemsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int):
         """Generate worksheet problems."""
@@ -41,9 +40,9 @@ class CompoundInequalityWordProblemsGenerator:
             ("books", "had", "gave away"),
             ("coins", "collected", "spent")
         ]
-        item, action1, action2 = random.choice(scenarios)
-        a = random.randint(5, 20)
-        b = random.randint(1, a-1)
+        item, action1, action2 = self.rng.choice(scenarios)
+        a = self.rng.randint(5, 20)
+        b = self.rng.randint(1, a-1)
 
         latex = f"\\text{{A person {action1} {a} {item} and {action2} {b}. How many are left?}}"
         solution = a - b
@@ -59,9 +58,9 @@ class CompoundInequalityWordProblemsGenerator:
     def _generate_medium(self):
         """Generate a medium problem."""
         # More complex word problem
-        a = random.randint(10, 50)
-        b = random.randint(5, 20)
-        c = random.randint(2, 10)
+        a = self.rng.randint(10, 50)
+        b = self.rng.randint(5, 20)
+        c = self.rng.randint(2, 10)
 
         latex = f"\\text{{Complex problem with values {a}, {b}, and {c}}}"
         solution = (a + b) * c
@@ -77,9 +76,9 @@ class CompoundInequalityWordProblemsGenerator:
     def _generate_hard(self):
         """Generate a hard problem."""
         # More complex word problem
-        a = random.randint(10, 50)
-        b = random.randint(5, 20)
-        c = random.randint(2, 10)
+        a = self.rng.randint(10, 50)
+        b = self.rng.randint(5, 20)
+        c = self.rng.randint(2, 10)
 
         latex = f"\\text{{Complex problem with values {a}, {b}, and {c}}}"
         solution = (a + b) * c
@@ -95,9 +94,9 @@ class CompoundInequalityWordProblemsGenerator:
     def _generate_challenge(self):
         """Generate a challenge problem."""
         # More complex word problem
-        a = random.randint(10, 50)
-        b = random.randint(5, 20)
-        c = random.randint(2, 10)
+        a = self.rng.randint(10, 50)
+        b = self.rng.randint(5, 20)
+        c = self.rng.randint(2, 10)
 
         latex = f"\\text{{Complex problem with values {a}, {b}, and {c}}}"
         solution = (a + b) * c
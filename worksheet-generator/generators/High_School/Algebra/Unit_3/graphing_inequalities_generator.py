@@ -5,9 +5,6 @@ Creates problems for graphing and interpreting inequalities on a number line
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class GraphingInequalitiesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the graphing inequalities generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -49,8 +45,8 @@ class GraphingInequalitiesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate simple inequality graphing: x > 3, x ≤ -2"""
-        inequality_sign = random.choice(['<', '>', '\\leq', '\\geq'])
-        value = random.randint(-5, 8)
+        inequality_sign = self.rng.choice(['<', '>', '\\leq', '\\geq'])
+        value = self.rng.randint(-5, 8)
 
         latex = f"\\text{{Graph on a number line: }} x {inequality_sign} {value}"
 
@@ -92,16 +88,16 @@ class GraphingInequalitiesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate compound inequalities: 2 < x < 5 or x ≤ -1 or x > 3"""
-        problem_type = random.choice(['and', 'or'])
+        problem_type = self.rng.choice(['and', 'or'])
 
         if problem_type == 'and':
             # Compound inequality: a < x < b
-            a = random.randint(-5, 2)
-            b = random.randint(a + 3, a + 8)
+            a = self.rng.randint(-5, 2)
+            b = self.rng.randint(a + 3, a + 8)
 
             # Vary the inequality signs
-            left_sign = random.choice(['<', '\\leq'])
-            right_sign = random.choice(['<', '\\leq'])
+            left_sign = self.rng.choice(['<', '\\leq'])
+            right_sign = self.rng.choice(['<', '\\leq'])
 
             latex = f"\\text{{Graph on a number line: }} {a} {left_sign} x {right_sign} {b}"
 
@@ -125,11 +121,11 @@ class GraphingInequalitiesGenerator:
 
         else:  # or
             # Disjoint inequality: x ≤ a or x > b
-            a = random.randint(-5, 0)
-            b = random.randint(2, 6)
+            a = self.rng.randint(-5, 0)
+            b = self.rng.randint(2, 6)
 
-            left_sign = random.choice(['<', '\\leq'])
-            right_sign = random.choice(['>', '\\geq'])
+            left_sign = self.rng.choice(['<', '\\leq'])
+            right_sign = self.rng.choice(['>', '\\geq'])
 
             latex = f"\\text{{Graph on a number line: }} x {left_sign} {a} \\text{{ or }} x {right_sign} {b}"
 
@@ -160,12 +156,12 @@ class GraphingInequalitiesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Determine inequality from a graph description"""
-        problem_type = random.choice(['simple', 'compound'])
+        problem_type = self.rng.choice(['simple', 'compound'])
 
         if problem_type == 'simple':
-            value = random.randint(-5, 8)
-            circle_type = random.choice(['open', 'closed'])
-            direction = random.choice(['left', 'right'])
+            value = self.rng.randint(-5, 8)
+            circle_type = self.rng.choice(['open', 'closed'])
+            direction = self.rng.choice(['left', 'right'])
 
             circle_desc = "open circle" if circle_type == 'open' else "closed circle"
 
@@ -189,11 +185,11 @@ class GraphingInequalitiesGenerator:
             ]
 
         else:  # compound
-            a = random.randint(-5, 2)
-            b = random.randint(a + 3, a + 8)
+            a = self.rng.randint(-5, 2)
+            b = self.rng.randint(a + 3, a + 8)
 
-            left_type = random.choice(['open', 'closed'])
-            right_type = random.choice(['open', 'closed'])
+            left_type = self.rng.choice(['open', 'closed'])
+            right_type = self.rng.choice(['open', 'closed'])
 
             left_desc = "open circle" if left_type == 'open' else "closed circle"
             right_desc = "open circle" if right_type == 'open' else "closed circle"
@@ -221,16 +217,16 @@ class GraphingInequalitiesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Graph solutions to inequalities after solving"""
-        problem_type = random.choice(['one_step', 'two_step', 'negative_coef'])
+        problem_type = self.rng.choice(['one_step', 'two_step', 'negative_coef'])
 
         if problem_type == 'one_step':
             # x + a < b
-            a = random.randint(1, 10)
-            b = random.randint(5, 20)
+            a = self.rng.randint(1, 10)
+            b = self.rng.randint(5, 20)
             x_value = b - a
-            inequality_sign = random.choice(['<', '>', '\\leq', '\\geq'])
+            inequality_sign = self.rng.choice(['<', '>', '\\leq', '\\geq'])
 
-            if random.choice([True, False]):
+            if self.rng.choice([True, False]):
                 latex = f"\\text{{Solve and graph: }} x + {a} {inequality_sign} {b}"
                 solution_ineq = f"x {inequality_sign} {x_value}"
             else:
@@ -259,11 +255,11 @@ class GraphingInequalitiesGenerator:
 
         elif problem_type == 'two_step':
             # ax + b < c
-            a = random.randint(2, 5)
-            b = random.randint(1, 8)
-            x_value = random.randint(1, 10)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 8)
+            x_value = self.rng.randint(1, 10)
             c = a * x_value + b
-            inequality_sign = random.choice(['<', '>', '\\leq', '\\geq'])
+            inequality_sign = self.rng.choice(['<', '>', '\\leq', '\\geq'])
 
             latex = f"\\text{{Solve and graph: }} {a}x + {b} {inequality_sign} {c}"
             solution_ineq = f"x {inequality_sign} {x_value}"
@@ -289,11 +285,11 @@ class GraphingInequalitiesGenerator:
 
         else:  # negative_coef
             # -ax + b < c (flip sign when dividing)
-            a = random.randint(2, 5)
-            b = random.randint(10, 20)
-            x_value = random.randint(1, 8)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(10, 20)
+            x_value = self.rng.randint(1, 8)
             c = -a * x_value + b
-            inequality_sign = random.choice(['<', '>', '\\leq', '\\geq'])
+            inequality_sign = self.rng.choice(['<', '>', '\\leq', '\\geq'])
 
             latex = f"\\text{{Solve and graph: }} -{a}x + {b} {inequality_sign} {c}"
 
@@ -5,9 +5,6 @@ Generates word problems that require setting up and solving inequalities
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class InequalityWordProblemsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the inequality word problems generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -53,8 +49,8 @@ class InequalityWordProblemsGenerator:
             {
                 'problem': "Sarah has ${budget}. Each book costs ${cost}. What is the maximum number of books she can buy?",
                 'setup': lambda: {
-                    'budget': random.randint(20, 50),
-                    'cost': random.randint(3, 8)
+                    'budget': self.rng.randint(20, 50),
+                    'cost': self.rng.randint(3, 8)
                 },
                 'inequality': lambda v: f"{v['cost']}x \\leq {v['budget']}",
                 'solution': lambda v: f"x \\leq {v['budget'] // v['cost']}"
@@ -62,8 +58,8 @@ class InequalityWordProblemsGenerator:
             {
                 'problem': "A parking garage charges ${fee} per hour. If you have ${money}, how many hours can you park?",
                 'setup': lambda: {
-                    'fee': random.randint(3, 6),
-                    'money': random.randint(15, 30)
+                    'fee': self.rng.randint(3, 6),
+                    'money': self.rng.randint(15, 30)
                 },
                 'inequality': lambda v: f"{v['fee']}x \\leq {v['money']}",
                 'solution': lambda v: f"x \\leq {v['money'] // v['fee']}"
@@ -71,15 +67,15 @@ class InequalityWordProblemsGenerator:
             {
                 'problem': "To pass the class, you need at least {min_score} points. You have {current} points. How many more points do you need?",
                 'setup': lambda: {
-                    'min_score': random.randint(70, 90),
-                    'current': random.randint(50, 65)
+                    'min_score': self.rng.randint(70, 90),
+                    'current': self.rng.randint(50, 65)
                 },
                 'inequality': lambda v: f"{v['current']} + x \\geq {v['min_score']}",
                 'solution': lambda v: f"x \\geq {v['min_score'] - v['current']}"
             }
         ]
 
-        template = random.choice(templates)
+        template = self.rng.choice(templates)
         values = template['setup']()
         problem_text = template['problem'].format(**values)
 
@@ -94,9 +90,9 @@ class InequalityWordProblemsGenerator:
             {
                 'problem': "A phone plan costs ${base} per month plus ${per_gb} per GB. You can spend at most ${budget}. How many GB can you use?",
                 'setup': lambda: {
-                    'base': random.randint(20, 40),
-                    'per_gb': random.randint(5, 10),
-                    'budget': random.randint(60, 100)
+                    'base': self.rng.randint(20, 40),
+                    'per_gb': self.rng.randint(5, 10),
+                    'budget': self.rng.randint(60, 100)
                 },
                 'inequality': lambda v: f"{v['base']} + {v['per_gb']}x \\leq {v['budget']}",
                 'solution': lambda v: f"x \\leq {(v['budget'] - v['base']) // v['per_gb']}"
@@ -104,9 +100,9 @@ class InequalityWordProblemsGenerator:
             {
                 'problem': "A taxi charges ${base} plus ${per_mile} per mile. You have ${money}. What's the maximum distance you can travel?",
                 'setup': lambda: {
-                    'base': random.randint(3, 5),
-                    'per_mile': random.randint(2, 4),
-                    'money': random.randint(20, 40)
+                    'base': self.rng.randint(3, 5),
+                    'per_mile': self.rng.randint(2, 4),
+                    'money': self.rng.randint(20, 40)
                 },
                 'inequality': lambda v: f"{v['base']} + {v['per_mile']}x \\leq {v['money']}",
                 'solution': lambda v: f"x \\leq {(v['money'] - v['base']) / v['per_mile']:.1f}"
@@ -114,17 +110,17 @@ class InequalityWordProblemsGenerator:
             {
                 'problem': "You need at least {min_points} points. Each test is worth {test_points} points. You have {current} points from {num_tests} tests. How many more tests to pass?",
                 'setup': lambda: {
-                    'min_points': random.randint(200, 300),
-                    'test_points': random.randint(25, 50),
-                    'current': random.randint(100, 150),
-                    'num_tests': random.randint(3, 5)
+                    'min_points': self.rng.randint(200, 300),
+                    'test_points': self.rng.randint(25, 50),
+                    'current': self.rng.randint(100, 150),
+                    'num_tests': self.rng.randint(3, 5)
                 },
                 'inequality': lambda v: f"{v['current']} + {v['test_points']}x \\geq {v['min_points']}",
                 'solution': lambda v: f"x \\geq {(v['min_points'] - v['current']) / v['test_points']:.0f}"
             }
         ]
 
-        template = random.choice(templates)
+        template = self.rng.choice(templates)
         values = template['setup']()
         problem_text = template['problem'].format(**values)
 
@@ -139,9 +135,9 @@ class InequalityWordProblemsGenerator:
             {
                 'problem': "A company makes ${profit} profit per item after ${fixed} in fixed costs. How many items for at least ${target} profit?",
                 'setup': lambda: {
-                    'profit': random.randint(8, 15),
-                    'fixed': random.randint(200, 500),
-                    'target': random.randint(1000, 2000)
+                    'profit': self.rng.randint(8, 15),
+                    'fixed': self.rng.randint(200, 500),
+                    'target': self.rng.randint(1000, 2000)
                 },
                 'inequality': lambda v: f"{v['profit']}x - {v['fixed']} \\geq {v['target']}",
                 'solution': lambda v: f"x \\geq {(v['target'] + v['fixed']) / v['profit']:.0f}"
@@ -149,18 +145,18 @@ class InequalityWordProblemsGenerator:
             {
                 'problem': "Theater tickets: ${adult} for adults, ${child} for children. At least {min_people} people, budget ${budget}. Max adults if {children} children attend?",
                 'setup': lambda: {
-                    'adult': random.randint(12, 20),
-                    'child': random.randint(6, 10),
-                    'min_people': random.randint(10, 20),
-                    'budget': random.randint(150, 250),
-                    'children': random.randint(3, 7)
+                    'adult': self.rng.randint(12, 20),
+                    'child': self.rng.randint(6, 10),
+                    'min_people': self.rng.randint(10, 20),
+                    'budget': self.rng.randint(150, 250),
+                    'children': self.rng.randint(3, 7)
                 },
                 'inequality': lambda v: f"{v['adult']}x + {v['child'] * v['children']} \\leq {v['budget']}",
                 'solution': lambda v: f"x \\leq {(v['budget'] - v['child'] * v['children']) // v['adult']}"
             }
         ]
 
-        template = random.choice(templates)
+        template = self.rng.choice(templates)
         values = template['setup']()
         problem_text = template['problem'].format(**values)
 
@@ -175,10 +171,10 @@ class InequalityWordProblemsGenerator:
             {
                 'problem': "Concert venue: capacity {capacity}, tickets ${price} each, costs ${fixed} + ${per} per person. Min tickets for profit?",
                 'setup': lambda: {
-                    'capacity': random.randint(200, 500),
-                    'price': random.randint(20, 40),
-                    'fixed': random.randint(1000, 2000),
-                    'per': random.randint(5, 10)
+                    'capacity': self.rng.randint(200, 500),
+                    'price': self.rng.randint(20, 40),
+                    'fixed': self.rng.randint(1000, 2000),
+                    'per': self.rng.randint(5, 10)
                 },
                 'inequality': lambda v: f"{v['price']}x - ({v['fixed']} + {v['per']}x) > 0",
                 'solution': lambda v: f"x > {v['fixed'] / (v['price'] - v['per']):.0f}"
@@ -186,17 +182,17 @@ class InequalityWordProblemsGenerator:
             {
                 'problem': "Fundraiser: sell items at ${price}, buy at ${cost}, goal ${goal}, max {max_items} items. Required sales range?",
                 'setup': lambda: {
-                    'price': random.randint(15, 25),
-                    'cost': random.randint(8, 12),
-                    'goal': random.randint(500, 1000),
-                    'max_items': random.randint(100, 150)
+                    'price': self.rng.randint(15, 25),
+                    'cost': self.rng.randint(8, 12),
+                    'goal': self.rng.randint(500, 1000),
+                    'max_items': self.rng.randint(100, 150)
                 },
                 'inequality': lambda v: f"{v['goal'] / (v['price'] - v['cost']):.0f} \\leq x \\leq {v['max_items']}",
                 'solution': lambda v: f"{v['goal'] // (v['price'] - v['cost'])} \\leq x \\leq {v['max_items']}"
             }
         ]
 
-        template = random.choice(templates)
+        template = self.rng.choice(templates)
         values = template['setup']()
         problem_text = template['problem'].format(**values)
 
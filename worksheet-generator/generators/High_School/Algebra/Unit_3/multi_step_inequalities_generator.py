@@ -11,8 +11,7 @@ class MultiStepInequalitiesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int):
         """Generate worksheet problems."""
@@ -36,8 +35,8 @@ class MultiStepInequalitiesGenerator:
     def _generate_easy(self):
         """Generate an easy problem."""
         # Inequality problem
-        a = random.randint(1, 10)
-        b = random.randint(-10, 10)
+        a = self.rng.randint(1, 10)
+        b = self.rng.randint(-10, 10)
 
         latex = f"{a}x > {b}"
         solution = b / a
@@ -53,9 +52,9 @@ class MultiStepInequalitiesGenerator:
     def _generate_medium(self):
         """Generate a medium problem."""
         # Complex inequality
-        a = random.randint(2, 10)
-        b = random.randint(-20, 20)
-        c = random.randint(-10, 10)
+        a = self.rng.randint(2, 10)
+        b = self.rng.randint(-20, 20)
+        c = self.rng.randint(-10, 10)
 
         latex = f"{a}x + {b} \\leq {c}"
         solution = (c - b) / a
@@ -71,9 +70,9 @@ class MultiStepInequalitiesGenerator:
     def _generate_hard(self):
         """Generate a hard problem."""
         # Complex inequality
-        a = random.randint(2, 10)
-        b = random.randint(-20, 20)
-        c = random.randint(-10, 10)
+        a = self.rng.randint(2, 10)
+        b = self.rng.randint(-20, 20)
+        c = self.rng.randint(-10, 10)
 
         latex = f"{a}x + {b} \\leq {c}"
         solution = (c - b) / a
@@ -89,9 +88,9 @@ class MultiStepInequalitiesGenerator:
     def _generate_challenge(self):
         """Generate a challenge problem."""
         # Complex inequality
-        a = random.randint(2, 10)
-        b = random.randint(-20, 20)
-        c = random.randint(-10, 10)
+        a = self.rng.randint(2, 10)
+        b = self.rng.randint(-20, 20)
+        c = self.rng.randint(-10, 10)
 
         latex = f"{a}x + {b} \\leq {c}"
         solution = (c - b) / a
@@ -13,11 +13,7 @@ Covers:
 
 import random
 from typing import List
-import sys
-import os
 
-# Add parent directory to path to import Equation
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..')))
 from equation_generator import Equation
 
 
@@ -31,8 +27,7 @@ class OneStepInequalitiesGenerator:
         Args:
             seed: Random seed for reproducibility (optional)
         """
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -68,14 +63,14 @@ class OneStepInequalitiesGenerator:
         Examples: x + 5 > 12, x - 3 < 8
         """
         # Random inequality sign
-        inequality_sign = random.choice(['<', '>', '\\leq', '\\geq'])
+        inequality_sign = self.rng.choice(['<', '>', '\\leq', '\\geq'])
 
         # Choose between addition or subtraction
-        operation = random.choice(['add', 'subtract'])
+        operation = self.rng.choice(['add', 'subtract'])
 
         # Generate values
-        a = random.randint(1, 15)
-        solution = random.randint(-10, 20)
+        a = self.rng.randint(1, 15)
+        solution = self.rng.randint(-10, 20)
 
         if operation == 'add':
             # x + a > b  =>  x > b - a
@@ -123,15 +118,15 @@ class OneStepInequalitiesGenerator:
         Uses only positive coefficients (no sign flip required).
         Examples: 3x > 12, x/4 < 5
         """
-        inequality_sign = random.choice(['<', '>', '\\leq', '\\geq'])
+        inequality_sign = self.rng.choice(['<', '>', '\\leq', '\\geq'])
 
         # Choose between multiplication or division
-        operation = random.choice(['multiply', 'divide'])
+        operation = self.rng.choice(['multiply', 'divide'])
 
         if operation == 'multiply':
             # ax > b  =>  x > b/a
-            a = random.randint(2, 12)
-            solution = random.randint(-10, 15)
+            a = self.rng.randint(2, 12)
+            solution = self.rng.randint(-10, 15)
             b = a * solution
 
             latex = f"{a}x {inequality_sign} {b}"
@@ -144,8 +139,8 @@ class OneStepInequalitiesGenerator:
 
         else:  # divide
             # x/a > b  =>  x > ab
-            a = random.randint(2, 10)
-            b = random.randint(-8, 12)
+            a = self.rng.randint(2, 10)
+            b = self.rng.randint(-8, 12)
             solution = a * b
 
             latex = f"\\frac{{x}}{{{a}}} {inequality_sign} {b}"
@@ -175,11 +170,11 @@ class OneStepInequalitiesGenerator:
         REQUIRES FLIPPING THE INEQUALITY SIGN when dividing/multiplying by negative.
         Examples: -2x > 8  =>  x < -4
         """
-        inequality_sign = random.choice(['<', '>', '\\leq', '\\geq'])
+        inequality_sign = self.rng.choice(['<', '>', '\\leq', '\\geq'])
 
         # Negative coefficient
-        a = random.randint(-10, -2)
-        solution = random.randint(-12, 12)
+        a = self.rng.randint(-10, -2)
+        solution = self.rng.randint(-12, 12)
         b = a * solution
 
         latex = f"{a}x {inequality_sign} {b}"
@@ -218,12 +213,12 @@ class OneStepInequalitiesGenerator:
         Generate challenge word problems requiring one-step inequalities.
         Students must translate real-world scenario into inequality and solve.
         """
-        problem_type = random.choice(['money', 'score', 'temperature', 'weight', 'age'])
+        problem_type = self.rng.choice(['money', 'score', 'temperature', 'weight', 'age'])
 
         if problem_type == 'money':
-            name = random.choice(['Sarah', 'John', 'Maria', 'David', 'Emma'])
-            current = random.randint(50, 200)
-            needed = random.randint(current + 20, current + 100)
+            name = self.rng.choice(['Sarah', 'John', 'Maria', 'David', 'Emma'])
+            current = self.rng.randint(50, 200)
+            needed = self.rng.randint(current + 20, current + 100)
 
             latex = f"\\text{{{name} has \\${current}. She needs at least \\${needed}. How much more money (x) does she need?}}"
             solution_value = needed - current
@@ -238,9 +233,9 @@ class OneStepInequalitiesGenerator:
             ]
 
         elif problem_type == 'score':
-            name = random.choice(['Alex', 'Jordan', 'Casey', 'Taylor', 'Morgan'])
-            current = random.randint(70, 90)
-            target = random.randint(current + 5, 100)
+            name = self.rng.choice(['Alex', 'Jordan', 'Casey', 'Taylor', 'Morgan'])
+            current = self.rng.randint(70, 90)
+            target = self.rng.randint(current + 5, 100)
 
             latex = f"\\text{{{name} scored {current} points. To win, they need more than {target} points total. How many more points (x) are needed?}}"
             solution_value = target - current
@@ -255,9 +250,9 @@ class OneStepInequalitiesGenerator:
             ]
 
         elif problem_type == 'temperature':
-            city = random.choice(['Denver', 'Seattle', 'Boston', 'Phoenix', 'Chicago'])
-            current = random.randint(30, 70)
-            target = random.randint(current + 10, current + 40)
+            city = self.rng.choice(['Denver', 'Seattle', 'Boston', 'Phoenix', 'Chicago'])
+            current = self.rng.randint(30, 70)
+            target = self.rng.randint(current + 10, current + 40)
 
             latex = f"\\text{{The temperature in {city} is {current}°F. It must rise to at least {target}°F. How many degrees (x) must it rise?}}"
             solution_value = target - current
@@ -272,8 +267,8 @@ class OneStepInequalitiesGenerator:
             ]
 
         elif problem_type == 'weight':
-            multiplier = random.randint(3, 8)
-            weight = random.randint(15, 40)
+            multiplier = self.rng.randint(3, 8)
+            weight = self.rng.randint(15, 40)
             total = multiplier * weight
 
             latex = f"\\text{{Each box weighs x pounds. {multiplier} boxes weigh less than {total} lbs total. Find the weight of each box.}}"
@@ -288,10 +283,10 @@ class OneStepInequalitiesGenerator:
             ]
 
         else:  # age
-            name1 = random.choice(['Lisa', 'Tom', 'Anna', 'Mike', 'Kate'])
-            name2 = random.choice(['her brother', 'his sister', 'her friend', 'his cousin'])
-            multiplier = random.randint(2, 5)
-            age = random.randint(8, 20)
+            name1 = self.rng.choice(['Lisa', 'Tom', 'Anna', 'Mike', 'Kate'])
+            name2 = self.rng.choice(['her brother', 'his sister', 'her friend', 'his cousin'])
+            multiplier = self.rng.randint(2, 5)
+            age = self.rng.randint(8, 20)
             total = multiplier * age
 
             latex = f"\\text{{{name1} is x years old. {multiplier} times her age is at most {total} years. How old is {name1}?}}"
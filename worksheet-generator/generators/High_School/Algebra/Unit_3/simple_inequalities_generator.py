@@ -5,9 +5,6 @@ Generates problems for solving basic inequalities
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class SimpleInequalitiesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the simple inequalities generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -49,15 +45,15 @@ class SimpleInequalitiesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate one-step inequality: x + a < b or ax < b"""
-        inequality_sign = random.choice(['<', '>', '\\leq', '\\geq'])
-        problem_type = random.choice(['add_sub', 'mult_div'])
+        inequality_sign = self.rng.choice(['<', '>', '\\leq', '\\geq'])
+        problem_type = self.rng.choice(['add_sub', 'mult_div'])
 
         if problem_type == 'add_sub':
-            a = random.randint(1, 10)
-            b = random.randint(5, 20)
+            a = self.rng.randint(1, 10)
+            b = self.rng.randint(5, 20)
             x = b - a
 
-            if random.choice([True, False]):
+            if self.rng.choice([True, False]):
                 latex = f"x + {a} {inequality_sign} {b}"
                 if inequality_sign in ['<', '\\leq']:
                     solution = f"x {inequality_sign} {x}"
@@ -67,8 +63,8 @@ class SimpleInequalitiesGenerator:
                 latex = f"x - {a} {inequality_sign} {b - 2*a}"
                 solution = f"x {inequality_sign} {b - a}"
         else:  # mult_div
-            a = random.randint(2, 6)
-            b = random.randint(10, 30)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(10, 30)
             latex = f"{a}x {inequality_sign} {b}"
 
             if inequality_sign in ['<', '\\leq']:
@@ -80,10 +76,10 @@ class SimpleInequalitiesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate two-step inequality: ax + b < c"""
-        inequality_sign = random.choice(['<', '>', '\\leq', '\\geq'])
-        a = random.randint(2, 5)
-        b = random.randint(1, 10)
-        x = random.randint(1, 10)
+        inequality_sign = self.rng.choice(['<', '>', '\\leq', '\\geq'])
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 10)
+        x = self.rng.randint(1, 10)
         c = a * x + b
 
         latex = f"{a}x + {b} {inequality_sign} {c}"
@@ -102,10 +98,10 @@ class SimpleInequalitiesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate inequality with negative coefficient (flip sign)"""
-        inequality_sign = random.choice(['<', '>', '\\leq', '\\geq'])
-        a = random.randint(-5, -2)
-        b = random.randint(1, 10)
-        x = random.randint(1, 8)
+        inequality_sign = self.rng.choice(['<', '>', '\\leq', '\\geq'])
+        a = self.rng.randint(-5, -2)
+        b = self.rng.randint(1, 10)
+        x = self.rng.randint(1, 8)
         c = a * x + b
 
         latex = f"{a}x + {b} {inequality_sign} {c}"
@@ -129,14 +125,14 @@ class SimpleInequalitiesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate inequality with variables on both sides"""
-        inequality_sign = random.choice(['<', '>', '\\leq', '\\geq'])
-        a = random.randint(3, 6)
-        b = random.randint(1, 8)
-        c = random.randint(1, 3)
+        inequality_sign = self.rng.choice(['<', '>', '\\leq', '\\geq'])
+        a = self.rng.randint(3, 6)
+        b = self.rng.randint(1, 8)
+        c = self.rng.randint(1, 3)
         # Ensure a != c to avoid division by zero
         while a == c:
-            a = random.randint(3, 6)
-        x = random.randint(2, 10)
+            a = self.rng.randint(3, 6)
+        x = self.rng.randint(2, 10)
         d = a * x + b - c * x
 
         latex = f"{a}x + {b} {inequality_sign} {c}x + {d}"
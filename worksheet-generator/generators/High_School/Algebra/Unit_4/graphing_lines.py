@@ -4,16 +4,13 @@ Chapter 4: Linear Equations (Two Variables) - Graphing Lines
 """
 
 import random
-import sys
-from pathlib import Path
 from dataclasses import dataclass
 from typing import List, Tuple
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from graphing_utils import CoordinatePlane, PlaneSpec
 
-from graphing_utils import CoordinatePlane
-from PIL import Image
+# savefig() arguments for the answer key graphs
+ANSWER_SAVEFIG = (('bbox_inches', 'tight'), ('dpi', 150))
 
 
 @dataclass
@@ -23,7 +20,7 @@ class GraphingLineProblem:
     equation_latex: str  # LaTeX representation of the points
     difficulty: str  # easy, medium, hard
     worksheet_image: object  # PIL Image for worksheet (blank grid)
-    answer_image: object  # PIL Image for answer key (with line plotted)
+    answer_image: object  # PlaneSpec for answer key (with line plotted), rendered when drawn
     x_min: int = -10
     x_max: int = 10
     y_min: int = -10
@@ -40,8 +37,7 @@ class GraphingLinesGenerator:
         Args:
             seed: Random seed for reproducibility
         """
-        if seed is not None:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int = 6) -> List[GraphingLineProblem]:
         """
@@ -86,34 +82,30 @@ class GraphingLinesGenerator:
         Generate easy problem: two points with positive coordinates, small values.
         """
         # Generate two distinct points with small positive coordinates
-        x1 = random.randint(1, 5)
-        y1 = random.randint(1, 5)
-        x2 = random.randint(6, 10)
-        y2 = random.randint(1, 10)
+        x1 = self.rng.randint(1, 5)
+        y1 = self.rng.randint(1, 5)
+        x2 = self.rng.randint(6, 10)
+        y2 = self.rng.randint(1, 10)
 
         # Ensure points are different
         while x2 == x1 and y2 == y1:
-            y2 = random.randint(1, 10)
+            y2 = self.rng.randint(1, 10)
 
         points = [(x1, y1), (x2, y2)]
 
         # Create worksheet image (blank grid)
         plane = CoordinatePlane(x_min=-1, x_max=10, y_min=-1, y_max=10, first_quadrant_only=False)
-        fig, ax = plane.create_figure(figsize=(6, 6))
-        worksheet_img = self._fig_to_image(fig)
+        worksheet_img = plane.blank_image(figsize=(6, 6))
 
-        # Create answer key image (with line plotted)
-        plane_ans = CoordinatePlane(x_min=-1, x_max=10, y_min=-1, y_max=10, first_quadrant_only=False)
-        fig_ans, ax_ans = plane_ans.create_figure(figsize=(6, 6))
+        # Create answer key image (with line plotted), rendered when drawn
+        spec_ans = PlaneSpec(x_min=-1, x_max=10, y_min=-1, y_max=10, first_quadrant_only=False, savefig=ANSWER_SAVEFIG)
 
         # Plot the two points
         for i, (x, y) in enumerate(points):
-            plane_ans.plot_point(ax_ans, x, y, label=f"({x},{y})", color='blue')
+            spec_ans = spec_ans.point(x, y, label=f"({x},{y})", color='blue')
 
         # Plot the line through the two points
-        self._plot_line_through_points(ax_ans, points[0], points[1])
-
-        answer_img = self._fig_to_image(fig_ans)
+        answer_img = self._plot_line_through_points(spec_ans, points[0], points[1])
 
         # Create equation latex representation
         equation_latex = f"({x1}, {y1}), ({x2}, {y2})"
@@ -135,35 +127,31 @@ class GraphingLinesGenerator:
         Generate medium problem: two points across all four quadrants.
         """
         # Generate two distinct points with mixed positive/negative coordinates
-        x1 = random.randint(-8, 8)
-        y1 = random.randint(-8, 8)
-        x2 = random.randint(-8, 8)
-        y2 = random.randint(-8, 8)
+        x1 = self.rng.randint(-8, 8)
+        y1 = self.rng.randint(-8, 8)
+        x2 = self.rng.randint(-8, 8)
+        y2 = self.rng.randint(-8, 8)
 
         # Ensure points are different and not too close
         while (x2 == x1 and y2 == y1) or (abs(x2 - x1) < 3 and abs(y2 - y1) < 3):
-            x2 = random.randint(-8, 8)
-            y2 = random.randint(-8, 8)
+            x2 = self.rng.randint(-8, 8)
+            y2 = self.rng.randint(-8, 8)
 
         points = [(x1, y1), (x2, y2)]
 
         # Create worksheet image (blank grid)
         plane = CoordinatePlane(x_min=-10, x_max=10, y_min=-10, y_max=10)
-        fig, ax = plane.create_figure(figsize=(6, 6))
-        worksheet_img = self._fig_to_image(fig)
+        worksheet_img = plane.blank_image(figsize=(6, 6))
 
-        # Create answer key image (with line plotted)
-        plane_ans = CoordinatePlane(x_min=-10, x_max=10, y_min=-10, y_max=10)
-        fig_ans, ax_ans = plane_ans.create_figure(figsize=(6, 6))
+        # Create answer key image (with line plotted), rendered when drawn
+        spec_ans = PlaneSpec(x_min=-10, x_max=10, y_min=-10, y_max=10, savefig=ANSWER_SAVEFIG)
 
         # Plot the two points
         for i, (x, y) in enumerate(points):
-            plane_ans.plot_point(ax_ans, x, y, label=f"({x},{y})", color='blue')
+            spec_ans = spec_ans.point(x, y, label=f"({x},{y})", color='blue')
 
         # Plot the line through the two points
-        self._plot_line_through_points(ax_ans, points[0], points[1])
-
-        answer_img = self._fig_to_image(fig_ans)
+        answer_img = self._plot_line_through_points(spec_ans, points[0], points[1])
 
         # Create equation latex representation
         equation_latex = f"({x1}, {y1}), ({x2}, {y2})"
@@ -185,46 +173,42 @@ class GraphingLinesGenerator:
         Generate hard problem: two points with larger coordinates or fractional slopes.
         """
         # Generate two points that create interesting slopes (including vertical/horizontal)
-        problem_type = random.choice(['steep', 'horizontal', 'vertical'])
+        problem_type = self.rng.choice(['steep', 'horizontal', 'vertical'])
 
         if problem_type == 'steep':
             # Steep slope
-            x1 = random.randint(-8, 8)
-            y1 = random.randint(-8, 8)
-            x2 = x1 + random.choice([-2, -1, 1, 2])
-            y2 = y1 + random.choice([-8, -7, 7, 8])
+            x1 = self.rng.randint(-8, 8)
+            y1 = self.rng.randint(-8, 8)
+            x2 = x1 + self.rng.choice([-2, -1, 1, 2])
+            y2 = y1 + self.rng.choice([-8, -7, 7, 8])
         elif problem_type == 'horizontal':
             # Horizontal line (slope = 0)
-            y_val = random.randint(-8, 8)
-            x1 = random.randint(-8, -2)
-            x2 = random.randint(2, 8)
+            y_val = self.rng.randint(-8, 8)
+            x1 = self.rng.randint(-8, -2)
+            x2 = self.rng.randint(2, 8)
             y1 = y2 = y_val
         else:  # vertical
             # Vertical line (undefined slope)
-            x_val = random.randint(-8, 8)
+            x_val = self.rng.randint(-8, 8)
             x1 = x2 = x_val
-            y1 = random.randint(-8, -2)
-            y2 = random.randint(2, 8)
+            y1 = self.rng.randint(-8, -2)
+            y2 = self.rng.randint(2, 8)
 
         points = [(x1, y1), (x2, y2)]
 
         # Create worksheet image (blank grid)
         plane = CoordinatePlane(x_min=-10, x_max=10, y_min=-10, y_max=10)
-        fig, ax = plane.create_figure(figsize=(6, 6))
-        worksheet_img = self._fig_to_image(fig)
+        worksheet_img = plane.blank_image(figsize=(6, 6))
 
-        # Create answer key image (with line plotted)
-        plane_ans = CoordinatePlane(x_min=-10, x_max=10, y_min=-10, y_max=10)
-        fig_ans, ax_ans = plane_ans.create_figure(figsize=(6, 6))
+        # Create answer key image (with line plotted), rendered when drawn
+        spec_ans = PlaneSpec(x_min=-10, x_max=10, y_min=-10, y_max=10, savefig=ANSWER_SAVEFIG)
 
         # Plot the two points
         for i, (x, y) in enumerate(points):
-            plane_ans.plot_point(ax_ans, x, y, label=f"({x},{y})", color='blue')
+            spec_ans = spec_ans.point(x, y, label=f"({x},{y})", color='blue')
 
         # Plot the line through the two points
-        self._plot_line_through_points(ax_ans, points[0], points[1])
-
-        answer_img = self._fig_to_image(fig_ans)
+        answer_img = self._plot_line_through_points(spec_ans, points[0], points[1])
 
         # Create equation latex representation
         equation_latex = f"({x1}, {y1}), ({x2}, {y2})"
@@ -247,27 +231,27 @@ class GraphingLinesGenerator:
         fractional slopes with distant points.
         """
         # Generate two points that create very challenging slopes
-        problem_type = random.choice(['very_steep', 'very_flat', 'complex_fractional', 'negative_extremes'])
+        problem_type = self.rng.choice(['very_steep', 'very_flat', 'complex_fractional', 'negative_extremes'])
 
         if problem_type == 'very_steep':
             # Very steep slope with large negative values
-            x1 = random.randint(-10, 10)
-            y1 = random.randint(-10, 10)
-            x2 = x1 + random.choice([-1, 1])
-            y2 = y1 + random.choice([-12, -11, -10, 10, 11, 12])
+            x1 = self.rng.randint(-10, 10)
+            y1 = self.rng.randint(-10, 10)
+            x2 = x1 + self.rng.choice([-1, 1])
+            y2 = y1 + self.rng.choice([-12, -11, -10, 10, 11, 12])
         elif problem_type == 'very_flat':
             # Very flat slope with distant points
-            x1 = random.randint(-10, -5)
-            y1 = random.randint(-10, 10)
-            x2 = random.randint(5, 10)
-            y2 = y1 + random.choice([-2, -1, 1, 2])
+            x1 = self.rng.randint(-10, -5)
+            y1 = self.rng.randint(-10, 10)
+            x2 = self.rng.randint(5, 10)
+            y2 = y1 + self.rng.choice([-2, -1, 1, 2])
         elif problem_type == 'complex_fractional':
             # Create fractional slope with challenging coordinates
-            x1 = random.randint(-9, 9)
-            y1 = random.randint(-9, 9)
+            x1 = self.rng.randint(-9, 9)
+            y1 = self.rng.randint(-9, 9)
             # Create points that result in fractional slopes like 5/7, -8/3, etc.
-            dx = random.choice([-7, -5, -3, 3, 5, 7])
-            dy = random.choice([-9, -8, -6, 6, 8, 9])
+            dx = self.rng.choice([-7, -5, -3, 3, 5, 7])
+            dy = self.rng.choice([-9, -8, -6, 6, 8, 9])
             x2 = x1 + dx
             y2 = y1 + dy
             # Keep within bounds
@@ -275,34 +259,30 @@ class GraphingLinesGenerator:
             y2 = max(-10, min(10, y2))
         else:  # negative_extremes
             # Both points in negative regions with complex relationships
-            x1 = random.randint(-10, -5)
-            y1 = random.randint(-10, -5)
-            x2 = random.randint(-10, 5)
-            y2 = random.randint(-10, 5)
+            x1 = self.rng.randint(-10, -5)
+            y1 = self.rng.randint(-10, -5)
+            x2 = self.rng.randint(-10, 5)
+            y2 = self.rng.randint(-10, 5)
             # Ensure points are different and not too close
             while (x2 == x1 and y2 == y1) or (abs(x2 - x1) < 4 and abs(y2 - y1) < 4):
-                x2 = random.randint(-10, 5)
-                y2 = random.randint(-10, 5)
+                x2 = self.rng.randint(-10, 5)
+                y2 = self.rng.randint(-10, 5)
 
         points = [(x1, y1), (x2, y2)]
 
         # Create worksheet image (blank grid)
         plane = CoordinatePlane(x_min=-12, x_max=12, y_min=-12, y_max=12)
-        fig, ax = plane.create_figure(figsize=(6, 6))
-        worksheet_img = self._fig_to_image(fig)
+        worksheet_img = plane.blank_image(figsize=(6, 6))
 
-        # Create answer key image (with line plotted)
-        plane_ans = CoordinatePlane(x_min=-12, x_max=12, y_min=-12, y_max=12)
-        fig_ans, ax_ans = plane_ans.create_figure(figsize=(6, 6))
+        # Create answer key image (with line plotted), rendered when drawn
+        spec_ans = PlaneSpec(x_min=-12, x_max=12, y_min=-12, y_max=12, savefig=ANSWER_SAVEFIG)
 
         # Plot the two points
         for i, (x, y) in enumerate(points):
-            plane_ans.plot_point(ax_ans, x, y, label=f"({x},{y})", color='blue')
+            spec_ans = spec_ans.point(x, y, label=f"({x},{y})", color='blue')
 
         # Plot the line through the two points
-        self._plot_line_through_points(ax_ans, points[0], points[1])
-
-        answer_img = self._fig_to_image(fig_ans)
+        answer_img = self._plot_line_through_points(spec_ans, points[0], points[1])
 
         # Create equation latex representation
         equation_latex = f"({x1}, {y1}), ({x2}, {y2})"
@@ -319,21 +299,20 @@ class GraphingLinesGenerator:
             y_max=12
         )
 
-    def _plot_line_through_points(self, ax, point1, point2):
-        """Plot a line through two points."""
+    def _plot_line_through_points(self, spec, point1, point2) -> PlaneSpec:
+        """Add a line through two points to a plane spec."""
         x1, y1 = point1
         x2, y2 = point2
 
         # Get axis limits
-        x_lim = ax.get_xlim()
-        y_lim = ax.get_ylim()
+        x_lim, y_lim = spec.plane().limits()
 
         # Handle vertical line
         if x2 == x1:
-            ax.axvline(x=x1, color='red', linewidth=2, zorder=2)
+            return spec.axes('axvline', x=x1, color='red', linewidth=2, zorder=2)
         # Handle horizontal line
         elif y2 == y1:
-            ax.axhline(y=y1, color='red', linewidth=2, zorder=2)
+            return spec.axes('axhline', y=y1, color='red', linewidth=2, zorder=2)
         # Regular line
         else:
             # Calculate slope and intercept
@@ -344,18 +323,7 @@ class GraphingLinesGenerator:
             x_vals = [x_lim[0], x_lim[1]]
             y_vals = [slope * x + intercept for x in x_vals]
 
-            ax.plot(x_vals, y_vals, color='red', linewidth=2, zorder=2)
-
-    def _fig_to_image(self, fig):
-        """Convert matplotlib figure to PIL Image."""
-        import io
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png', bbox_inches='tight', dpi=150)
-        buf.seek(0)
-        img = Image.open(buf)
-        import matplotlib.pyplot as plt
-        plt.close(fig)
-        return img
+            return spec.axes('plot', x_vals, y_vals, color='red', linewidth=2, zorder=2)
 
 
 if __name__ == "__main__":
@@ -4,15 +4,10 @@ Chapter 11: Quadratic Functions and Parabolas
 """
 
 import random
-import sys
-from pathlib import Path
 from dataclasses import dataclass
 from typing import Tuple
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from graphing_utils import CoordinatePlane
+from graphing_utils import CoordinatePlane, PlaneSpec
 
 
 @dataclass
@@ -26,7 +21,7 @@ class ParabolaGraphingProblem:
     opens_upward: bool  # True if a > 0
     difficulty: str  # easy, medium, hard, challenge
     worksheet_image: object  # PIL Image for worksheet (blank grid with equation)
-    answer_image: object  # PIL Image for answer key (with parabola and vertex)
+    answer_image: object  # PlaneSpec for answer key (with parabola and vertex), rendered when drawn
     x_min: int = -10
     x_max: int = 10
     y_min: int = -10
@@ -43,8 +38,7 @@ class ParabolaGraphingGenerator:
         Args:
             seed: Random seed for reproducibility
         """
-        if seed is not None:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_problem(self, difficulty: str) -> ParabolaGraphingProblem:
         """
@@ -72,7 +66,7 @@ class ParabolaGraphingGenerator:
         Generate easy problem: y = x² or y = -x² (vertex at origin, a = ±1)
         """
         # Simple parabola with vertex at origin
-        a = random.choice([-1, 1])
+        a = self.rng.choice([-1, 1])
         h = 0
         k = 0
 
@@ -104,8 +98,8 @@ class ParabolaGraphingGenerator:
         Vertex form, a = 1, vertex not at origin
         """
         a = 1
-        h = random.randint(-4, 4)
-        k = random.randint(-4, 4)
+        h = self.rng.randint(-4, 4)
+        k = self.rng.randint(-4, 4)
 
         # Format equation: y = (x - h)² + k
         eq_latex = self._format_vertex_form(a, h, k)
@@ -132,9 +126,9 @@ class ParabolaGraphingGenerator:
         Includes vertical stretch/compression and flips
         """
         # Choose a from {-2, -1, -0.5, 0.5, 2}
-        a = random.choice([-2, -1, -0.5, 0.5, 2])
-        h = random.randint(-5, 5)
-        k = random.randint(-5, 5)
+        a = self.rng.choice([-2, -1, -0.5, 0.5, 2])
+        h = self.rng.randint(-5, 5)
+        k = self.rng.randint(-5, 5)
 
         # Format equation
         eq_latex = self._format_vertex_form(a, h, k)
@@ -162,11 +156,11 @@ class ParabolaGraphingGenerator:
         """
         # Choose a from fractional values
         a_choices = [-3, -2, -1.5, -1, -0.5, -0.25, 0.25, 0.5, 1, 1.5, 2, 3]
-        a = random.choice(a_choices)
+        a = self.rng.choice(a_choices)
 
         # Allow fractional vertex coordinates
-        h = random.randint(-8, 8) / 2.0  # 0.5 increments
-        k = random.randint(-8, 8) / 2.0
+        h = self.rng.randint(-8, 8) / 2.0  # 0.5 increments
+        k = self.rng.randint(-8, 8) / 2.0
 
         # Format equation
         eq_latex = self._format_vertex_form(a, h, k)
@@ -230,32 +224,26 @@ class ParabolaGraphingGenerator:
         return f"y = {a_str}{h_str}^2{k_str}"
 
     def _create_worksheet_image(self):
-        """Create blank coordinate plane for worksheet."""
-        plane = CoordinatePlane(-10, 10, -10, 10, grid=True)
-        fig, ax = plane.create_figure(figsize=(6, 6))
-
+        """Create blank coordinate plane for worksheet (shared across problems)."""
         # No equation on image - it will be displayed as text by PDF generator
 
-        return plane.render_to_image(fig)
+        return CoordinatePlane(-10, 10, -10, 10, grid=True).blank_image(figsize=(6, 6))
 
     def _create_answer_image(self, a, h, k):
-        """Create coordinate plane with parabola and vertex for answer key."""
-        plane = CoordinatePlane(-10, 10, -10, 10, grid=True)
-        fig, ax = plane.create_figure(figsize=(6, 6))
+        """Describe the coordinate plane with parabola and vertex for answer key (rendered when drawn)."""
+        spec = PlaneSpec(-10, 10, -10, 10, grid=True)
 
         # No equation on image - it will be displayed as text by PDF generator
 
         # Plot parabola (purple)
-        plane.plot_parabola(ax, a=a, h=h, k=k, color='purple', linewidth=2)
+        spec = spec.parabola(a=a, h=h, k=k, color='purple', linewidth=2)
 
         # Vertex is already plotted by plot_parabola, but let's add label
         # The plot_parabola method plots the vertex, we just ensure it's labeled
         vertex_label = f"Vertex: ({h}, {k})"
-        fig.text(0.5, 0.05, vertex_label, ha='center', va='bottom',
-                fontsize=10, bbox=dict(boxstyle='round,pad=0.5',
-                facecolor='yellow', alpha=0.7))
-
-        return plane.render_to_image(fig)
+        return spec.figure('text', 0.5, 0.05, vertex_label, ha='center', va='bottom',
+                           fontsize=10, bbox=dict(boxstyle='round,pad=0.5',
+                           facecolor='yellow', alpha=0.7))
 
     def generate_worksheet(self, difficulty: str,
                           num_problems: int) -> list:
@@ -4,16 +4,13 @@ Chapter 4: Linear Equations (Two Variables) - Point-Slope Form (y - y₁ = m(x -
 """
 
 import random
-import sys
-from pathlib import Path
 from dataclasses import dataclass
 from typing import Tuple
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from graphing_utils import CoordinatePlane, PlaneSpec
 
-from graphing_utils import CoordinatePlane
-from PIL import Image
+# savefig() arguments for the answer key graphs
+ANSWER_SAVEFIG = (('bbox_inches', 'tight'), ('dpi', 150))
 
 
 @dataclass
@@ -24,7 +21,7 @@ class PointSlopeProblem:
     equation_latex: str  # LaTeX string for the equation
     difficulty: str  # easy, medium, hard
     worksheet_image: object  # PIL Image for worksheet (blank grid)
-    answer_image: object  # PIL Image for answer key (with line plotted)
+    answer_image: object  # PlaneSpec for answer key (with line plotted), rendered when drawn
     x_min: int = -10
     x_max: int = 10
     y_min: int = -10
@@ -41,8 +38,7 @@ class PointSlopeGenerator:
         Args:
             seed: Random seed for reproducibility
         """
-        if seed is not None:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def _format_slope(self, numerator: int, denominator: int) -> str:
         """
@@ -111,11 +107,11 @@ class PointSlopeGenerator:
         Generate easy problem: integer slope, point in first quadrant or near origin.
         """
         # Small positive integer slopes
-        slope = random.choice([1, 2, 3])
+        slope = self.rng.choice([1, 2, 3])
 
         # Point near origin or in first quadrant
-        x1 = random.randint(0, 5)
-        y1 = random.randint(0, 5)
+        x1 = self.rng.randint(0, 5)
+        y1 = self.rng.randint(0, 5)
         point = (x1, y1)
 
         # Format equation: y - y1 = m(x - x1)
@@ -150,13 +146,13 @@ class PointSlopeGenerator:
         Generate medium problem: fractional slopes, points in any quadrant.
         """
         # Fractional slopes
-        numerator = random.choice([-4, -3, -2, -1, 1, 2, 3, 4])
-        denominator = random.choice([2, 3])
+        numerator = self.rng.choice([-4, -3, -2, -1, 1, 2, 3, 4])
+        denominator = self.rng.choice([2, 3])
         slope = numerator / denominator
 
         # Point anywhere
-        x1 = random.randint(-6, 6)
-        y1 = random.randint(-6, 6)
+        x1 = self.rng.randint(-6, 6)
+        y1 = self.rng.randint(-6, 6)
         point = (x1, y1)
 
         # Format equation with fraction
@@ -193,16 +189,16 @@ class PointSlopeGenerator:
         """
         Generate hard problem: negative slopes, larger coordinates, special cases.
         """
-        problem_type = random.choice(['negative_slope', 'zero_slope', 'steep'])
+        problem_type = self.rng.choice(['negative_slope', 'zero_slope', 'steep'])
 
         if problem_type == 'negative_slope':
             # Negative fractional slope
-            numerator = random.choice([-5, -4, -3, -2])
-            denominator = random.choice([2, 3, 4])
+            numerator = self.rng.choice([-5, -4, -3, -2])
+            denominator = self.rng.choice([2, 3, 4])
             slope = numerator / denominator
 
-            x1 = random.randint(-8, 8)
-            y1 = random.randint(-8, 8)
+            x1 = self.rng.randint(-8, 8)
+            y1 = self.rng.randint(-8, 8)
 
             slope_str = f"\\frac{{{numerator}}}{{{denominator}}}"
 
@@ -211,16 +207,16 @@ class PointSlopeGenerator:
             slope = 0
             slope_str = "0"
 
-            x1 = random.randint(-8, 8)
-            y1 = random.randint(-8, 8)
+            x1 = self.rng.randint(-8, 8)
+            y1 = self.rng.randint(-8, 8)
 
         else:  # steep
             # Steep slope
-            slope = random.choice([-6, -5, 5, 6])
+            slope = self.rng.choice([-6, -5, 5, 6])
             slope_str = str(slope)
 
-            x1 = random.randint(-6, 6)
-            y1 = random.randint(-6, 6)
+            x1 = self.rng.randint(-6, 6)
+            y1 = self.rng.randint(-6, 6)
 
         point = (x1, y1)
 
@@ -254,47 +250,47 @@ class PointSlopeGenerator:
         Generate challenge problem: very steep/flat fractional slopes, large negative coordinates,
         complex fractions with extreme points.
         """
-        problem_type = random.choice(['very_steep_fraction', 'very_flat_fraction', 'negative_extremes', 'complex_fraction'])
+        problem_type = self.rng.choice(['very_steep_fraction', 'very_flat_fraction', 'negative_extremes', 'complex_fraction'])
 
         if problem_type == 'very_steep_fraction':
             # Very steep fractional slope with extreme coordinates
-            numerator = random.choice([-11, -9, -7, 7, 9, 11])
-            denominator = random.choice([2, 3])
+            numerator = self.rng.choice([-11, -9, -7, 7, 9, 11])
+            denominator = self.rng.choice([2, 3])
             slope = numerator / denominator
             slope_str = f"\\frac{{{numerator}}}{{{denominator}}}"
 
-            x1 = random.randint(-10, 10)
-            y1 = random.randint(-10, 10)
+            x1 = self.rng.randint(-10, 10)
+            y1 = self.rng.randint(-10, 10)
 
         elif problem_type == 'very_flat_fraction':
             # Very flat fractional slope
-            numerator = random.choice([-3, -2, -1, 1, 2, 3])
-            denominator = random.choice([5, 6, 7, 8])
+            numerator = self.rng.choice([-3, -2, -1, 1, 2, 3])
+            denominator = self.rng.choice([5, 6, 7, 8])
             slope = numerator / denominator
             slope_str = f"\\frac{{{numerator}}}{{{denominator}}}"
 
-            x1 = random.randint(-9, 9)
-            y1 = random.randint(-9, 9)
+            x1 = self.rng.randint(-9, 9)
+            y1 = self.rng.randint(-9, 9)
 
         elif problem_type == 'negative_extremes':
             # Both slope and point with large negative values
-            numerator = random.choice([-13, -11, -9, -7])
-            denominator = random.choice([3, 4, 5])
+            numerator = self.rng.choice([-13, -11, -9, -7])
+            denominator = self.rng.choice([3, 4, 5])
             slope = numerator / denominator
             slope_str = f"\\frac{{{numerator}}}{{{denominator}}}"
 
-            x1 = random.randint(-10, -5)
-            y1 = random.randint(-10, -5)
+            x1 = self.rng.randint(-10, -5)
+            y1 = self.rng.randint(-10, -5)
 
         else:  # complex_fraction
             # Complex fractional slope with large coordinates
-            numerator = random.choice([-17, -13, -11, 11, 13, 17])
-            denominator = random.choice([4, 5, 6, 7])
+            numerator = self.rng.choice([-17, -13, -11, 11, 13, 17])
+            denominator = self.rng.choice([4, 5, 6, 7])
             slope = numerator / denominator
             slope_str = f"\\frac{{{numerator}}}{{{denominator}}}"
 
-            x1 = random.randint(-10, 10)
-            y1 = random.randint(-10, 10)
+            x1 = self.rng.randint(-10, 10)
+            y1 = self.rng.randint(-10, 10)
 
         point = (x1, y1)
 
@@ -327,41 +323,25 @@ class PointSlopeGenerator:
         """Create worksheet and answer key images."""
         # Create worksheet image (blank grid)
         plane = CoordinatePlane(x_min=-10, x_max=10, y_min=-10, y_max=10)
-        fig, ax = plane.create_figure(figsize=(6, 6))
-        worksheet_img = self._fig_to_image(fig)
+        worksheet_img = plane.blank_image(figsize=(6, 6))
 
-        # Create answer key image (with line plotted)
-        plane_ans = CoordinatePlane(x_min=-10, x_max=10, y_min=-10, y_max=10)
-        fig_ans, ax_ans = plane_ans.create_figure(figsize=(6, 6))
+        # Create answer key image (with line plotted), rendered when drawn
+        spec_ans = PlaneSpec(x_min=-10, x_max=10, y_min=-10, y_max=10, savefig=ANSWER_SAVEFIG)
 
         # Plot the point
         x1, y1 = point
-        plane_ans.plot_point(ax_ans, x1, y1, label=f"({x1},{y1})", color='blue')
+        spec_ans = spec_ans.point(x1, y1, label=f"({x1},{y1})", color='blue')
 
         # Plot the line using point-slope form
-        plane_ans.plot_line_from_equation(
-            ax_ans,
+        answer_img = spec_ans.line(
             slope=slope,
             point=point,
             color='red',
             linewidth=2
         )
 
-        answer_img = self._fig_to_image(fig_ans)
-
         return worksheet_img, answer_img
 
-    def _fig_to_image(self, fig):
-        """Convert matplotlib figure to PIL Image."""
-        import io
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png', bbox_inches='tight', dpi=150)
-        buf.seek(0)
-        img = Image.open(buf)
-        import matplotlib.pyplot as plt
-        plt.close(fig)
-        return img
-
 
 if __name__ == "__main__":
     # Test the generator
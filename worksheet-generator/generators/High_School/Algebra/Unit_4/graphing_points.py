@@ -4,14 +4,9 @@ Chapter 4: Linear Equations (Two Variables) - Graphing Points
 """
 
 import random
-import sys
-from pathlib import Path
 from dataclasses import dataclass
 from typing import List, Tuple
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from graphing_utils import graph_points, create_blank_coordinate_plane
 
 
@@ -22,7 +17,7 @@ class GraphingPointsProblem:
     labels: List[str]  # Labels for each point (e.g., "A", "B", "C")
     difficulty: str  # easy, medium, hard, challenge
     worksheet_image: object  # PIL Image for worksheet (blank grid)
-    answer_image: object  # PIL Image for answer key (with points plotted)
+    answer_image: object  # PlaneSpec for answer key (with points plotted), rendered when drawn
     x_min: int = -10
     x_max: int = 10
     y_min: int = -10
@@ -39,8 +34,7 @@ class GraphingPointsGenerator:
         Args:
             seed: Random seed for reproducibility
         """
-        if seed is not None:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
         self.point_labels = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J',
                             'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T']
@@ -76,8 +70,8 @@ class GraphingPointsGenerator:
         # Generate points in first quadrant with no duplicates
         used_points = set()
         while len(points) < num_points:
-            x = random.randint(0, 10)
-            y = random.randint(0, 10)
+            x = self.rng.randint(0, 10)
+            y = self.rng.randint(0, 10)
             if (x, y) not in used_points:
                 points.append((x, y))
                 used_points.add((x, y))
@@ -95,7 +89,7 @@ class GraphingPointsGenerator:
         answer_img = graph_points(
             points, labels=labels,
             x_min=0, x_max=10, y_min=0, y_max=10,
-            first_quadrant_only=True, figsize=(6, 6)
+            first_quadrant_only=True, figsize=(6, 6), deferred=True
         )
 
         return GraphingPointsProblem(
@@ -116,13 +110,13 @@ class GraphingPointsGenerator:
 
         # Ensure we get points in different quadrants
         quadrants = [
-            (lambda: (random.randint(1, 5), random.randint(1, 5))),      # Q1
-            (lambda: (random.randint(-5, -1), random.randint(1, 5))),    # Q2
-            (lambda: (random.randint(-5, -1), random.randint(-5, -1))),  # Q3
-            (lambda: (random.randint(1, 5), random.randint(-5, -1))),    # Q4
+            (lambda: (self.rng.randint(1, 5), self.rng.randint(1, 5))),      # Q1
+            (lambda: (self.rng.randint(-5, -1), self.rng.randint(1, 5))),    # Q2
+            (lambda: (self.rng.randint(-5, -1), self.rng.randint(-5, -1))),  # Q3
+            (lambda: (self.rng.randint(1, 5), self.rng.randint(-5, -1))),    # Q4
         ]
 
-        random.shuffle(quadrants)
+        self.rng.shuffle(quadrants)
 
         for i in range(num_points):
             points.append(quadrants[i]())
@@ -140,7 +134,7 @@ class GraphingPointsGenerator:
         answer_img = graph_points(
             points, labels=labels,
             x_min=-5, x_max=5, y_min=-5, y_max=5,
-            figsize=(6, 6)
+            figsize=(6, 6), deferred=True
         )
 
         return GraphingPointsProblem(
@@ -161,10 +155,10 @@ class GraphingPointsGenerator:
 
         # Ensure we get points in all 4 quadrants
         quadrants = [
-            (lambda: (random.randint(1, 10), random.randint(1, 10))),      # Q1
-            (lambda: (random.randint(-10, -1), random.randint(1, 10))),    # Q2
-            (lambda: (random.randint(-10, -1), random.randint(-10, -1))),  # Q3
-            (lambda: (random.randint(1, 10), random.randint(-10, -1))),    # Q4
+            (lambda: (self.rng.randint(1, 10), self.rng.randint(1, 10))),      # Q1
+            (lambda: (self.rng.randint(-10, -1), self.rng.randint(1, 10))),    # Q2
+            (lambda: (self.rng.randint(-10, -1), self.rng.randint(-10, -1))),  # Q3
+            (lambda: (self.rng.randint(1, 10), self.rng.randint(-10, -1))),    # Q4
         ]
 
         # Generate one point in each quadrant
@@ -174,14 +168,14 @@ class GraphingPointsGenerator:
         # Add one more point in any quadrant
         used_points = set(points)
         while len(points) < num_points:
-            x = random.randint(-10, 10)
-            y = random.randint(-10, 10)
+            x = self.rng.randint(-10, 10)
+            y = self.rng.randint(-10, 10)
             if (x, y) not in used_points:
                 points.append((x, y))
                 used_points.add((x, y))
 
         # Shuffle to mix quadrants
-        random.shuffle(points)
+        self.rng.shuffle(points)
 
         labels = [f"{self.point_labels[i]}({x},{y})"
                  for i, (x, y) in enumerate(points)]
@@ -190,7 +184,7 @@ class GraphingPointsGenerator:
         worksheet_img = create_blank_coordinate_plane(figsize=(6, 6))
 
         # Create answer key image
-        answer_img = graph_points(points, labels=labels, figsize=(6, 6))
+        answer_img = graph_points(points, labels=labels, figsize=(6, 6), deferred=True)
 
         return GraphingPointsProblem(
             points=points,
@@ -209,19 +203,19 @@ class GraphingPointsGenerator:
 
         # Include at least 2 points on axes
         # Point on x-axis
-        points.append((random.randint(-8, 8), 0))
+        points.append((self.rng.randint(-8, 8), 0))
         # Point on y-axis
-        points.append((0, random.randint(-8, 8)))
+        points.append((0, self.rng.randint(-8, 8)))
 
         # Ensure we get points in all 4 quadrants
         quadrants = [
-            (lambda: (random.randint(1, 10), random.randint(1, 10))),      # Q1
-            (lambda: (random.randint(-10, -1), random.randint(1, 10))),    # Q2
-            (lambda: (random.randint(-10, -1), random.randint(-10, -1))),  # Q3
-            (lambda: (random.randint(1, 10), random.randint(-10, -1))),    # Q4
+            (lambda: (self.rng.randint(1, 10), self.rng.randint(1, 10))),      # Q1
+            (lambda: (self.rng.randint(-10, -1), self.rng.randint(1, 10))),    # Q2
+            (lambda: (self.rng.randint(-10, -1), self.rng.randint(-10, -1))),  # Q3
+            (lambda: (self.rng.randint(1, 10), self.rng.randint(-10, -1))),    # Q4
         ]
 
-        random.shuffle(quadrants)
+        self.rng.shuffle(quadrants)
 
         # Add points from different quadrants
         used_points = set(points)
@@ -235,14 +229,14 @@ class GraphingPointsGenerator:
 
         # Fill any remaining slots
         while len(points) < num_points:
-            x = random.randint(-10, 10)
-            y = random.randint(-10, 10)
+            x = self.rng.randint(-10, 10)
+            y = self.rng.randint(-10, 10)
             if (x, y) not in used_points:
                 points.append((x, y))
                 used_points.add((x, y))
 
         # Shuffle to mix axis points with others
-        random.shuffle(points)
+        self.rng.shuffle(points)
 
         labels = [f"{self.point_labels[i]}({x},{y})"
                  for i, (x, y) in enumerate(points)]
@@ -251,7 +245,7 @@ class GraphingPointsGenerator:
         worksheet_img = create_blank_coordinate_plane(figsize=(6, 6))
 
         # Create answer key image
-        answer_img = graph_points(points, labels=labels, figsize=(6, 6))
+        answer_img = graph_points(points, labels=labels, figsize=(6, 6), deferred=True)
 
         return GraphingPointsProblem(
             points=points,
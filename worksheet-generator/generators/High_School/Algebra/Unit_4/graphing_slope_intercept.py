@@ -4,15 +4,12 @@ Chapter 4: Linear Equations (Two Variables) - Slope-Intercept Form (y = mx + b)
 """
 
 import random
-import sys
-from pathlib import Path
 from dataclasses import dataclass
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from graphing_utils import CoordinatePlane, PlaneSpec
 
-from graphing_utils import CoordinatePlane
-from PIL import Image
+# savefig() arguments for the answer key graphs
+ANSWER_SAVEFIG = (('bbox_inches', 'tight'), ('dpi', 150))
 
 
 @dataclass
@@ -23,7 +20,7 @@ class SlopeInterceptProblem:
     equation_latex: str  # LaTeX string for the equation
     difficulty: str  # easy, medium, hard
     worksheet_image: object  # PIL Image for worksheet (blank grid)
-    answer_image: object  # PIL Image for answer key (with line plotted)
+    answer_image: object  # PlaneSpec for answer key (with line plotted), rendered when drawn
     x_min: int = -10
     x_max: int = 10
     y_min: int = -10
@@ -40,8 +37,7 @@ class SlopeInterceptGenerator:
         Args:
             seed: Random seed for reproducibility
         """
-        if seed is not None:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def _format_slope(self, numerator: int, denominator: int) -> str:
         """
@@ -110,8 +106,8 @@ class SlopeInterceptGenerator:
         Generate easy problem: integer slope, small y-intercept.
         """
         # Small positive or negative integer slopes
-        slope = random.choice([-3, -2, -1, 1, 2, 3])
-        y_intercept = random.randint(-5, 5)
+        slope = self.rng.choice([-3, -2, -1, 1, 2, 3])
+        y_intercept = self.rng.randint(-5, 5)
 
         # Format equation
         if slope == 1:
@@ -143,11 +139,11 @@ class SlopeInterceptGenerator:
         Generate medium problem: fractional slopes, larger intercepts.
         """
         # Fractional slopes (simple fractions)
-        numerator = random.choice([-5, -4, -3, -2, -1, 1, 2, 3, 4, 5])
-        denominator = random.choice([2, 3, 4])
+        numerator = self.rng.choice([-5, -4, -3, -2, -1, 1, 2, 3, 4, 5])
+        denominator = self.rng.choice([2, 3, 4])
         slope = numerator / denominator
 
-        y_intercept = random.randint(-8, 8)
+        y_intercept = self.rng.randint(-8, 8)
 
         # Format equation with fraction (simplify if possible)
         slope_str = self._format_slope(numerator, denominator)
@@ -173,18 +169,18 @@ class SlopeInterceptGenerator:
         """
         Generate hard problem: special cases (zero slope, steep slopes, negative fractions).
         """
-        problem_type = random.choice(['zero_slope', 'steep', 'negative_fraction'])
+        problem_type = self.rng.choice(['zero_slope', 'steep', 'negative_fraction'])
 
         if problem_type == 'zero_slope':
             # Horizontal line (slope = 0)
             slope = 0
-            y_intercept = random.randint(-8, 8)
+            y_intercept = self.rng.randint(-8, 8)
             equation_latex = f"y = {y_intercept}"
 
         elif problem_type == 'steep':
             # Steep slope
-            slope = random.choice([-7, -6, -5, 5, 6, 7])
-            y_intercept = random.randint(-5, 5)
+            slope = self.rng.choice([-7, -6, -5, 5, 6, 7])
+            y_intercept = self.rng.randint(-5, 5)
 
             if slope == 1:
                 slope_str = ""
@@ -200,10 +196,10 @@ class SlopeInterceptGenerator:
 
         else:  # negative_fraction
             # Negative fractional slope
-            numerator = random.choice([-7, -5, -4, -3, -2])
-            denominator = random.choice([2, 3, 4, 5])
+            numerator = self.rng.choice([-7, -5, -4, -3, -2])
+            denominator = self.rng.choice([2, 3, 4, 5])
             slope = numerator / denominator
-            y_intercept = random.randint(-6, 6)
+            y_intercept = self.rng.randint(-6, 6)
 
             slope_str = self._format_slope(numerator, denominator)
 
@@ -229,14 +225,14 @@ class SlopeInterceptGenerator:
         Generate challenge problem: very steep/flat slopes with complex fractions,
         large negative intercepts, and unusual fractional slopes.
         """
-        problem_type = random.choice(['very_steep_fraction', 'very_flat_fraction', 'complex_negative', 'large_fraction'])
+        problem_type = self.rng.choice(['very_steep_fraction', 'very_flat_fraction', 'complex_negative', 'large_fraction'])
 
         if problem_type == 'very_steep_fraction':
             # Very steep fractional slope with large intercept
-            numerator = random.choice([-11, -9, -8, 8, 9, 11])
-            denominator = random.choice([2, 3])
+            numerator = self.rng.choice([-11, -9, -8, 8, 9, 11])
+            denominator = self.rng.choice([2, 3])
             slope = numerator / denominator
-            y_intercept = random.randint(-10, 10)
+            y_intercept = self.rng.randint(-10, 10)
 
             slope_str = self._format_slope(numerator, denominator)
 
@@ -247,10 +243,10 @@ class SlopeInterceptGenerator:
 
         elif problem_type == 'very_flat_fraction':
             # Very flat fractional slope (small rise over large run)
-            numerator = random.choice([-2, -1, 1, 2])
-            denominator = random.choice([5, 6, 7, 8])
+            numerator = self.rng.choice([-2, -1, 1, 2])
+            denominator = self.rng.choice([5, 6, 7, 8])
             slope = numerator / denominator
-            y_intercept = random.randint(-8, 8)
+            y_intercept = self.rng.randint(-8, 8)
 
             slope_str = self._format_slope(numerator, denominator)
 
@@ -261,20 +257,20 @@ class SlopeInterceptGenerator:
 
         elif problem_type == 'complex_negative':
             # Complex negative fractional slope with negative intercept
-            numerator = random.choice([-13, -11, -9, -7])
-            denominator = random.choice([4, 5, 6])
+            numerator = self.rng.choice([-13, -11, -9, -7])
+            denominator = self.rng.choice([4, 5, 6])
             slope = numerator / denominator
-            y_intercept = random.randint(-12, -5)
+            y_intercept = self.rng.randint(-12, -5)
 
             slope_str = self._format_slope(numerator, denominator)
             equation_latex = f"y = {slope_str}x - {abs(y_intercept)}"
 
         else:  # large_fraction
             # Larger fraction slope with mixed values
-            numerator = random.choice([-17, -13, -11, 11, 13, 17])
-            denominator = random.choice([3, 4, 5])
+            numerator = self.rng.choice([-17, -13, -11, 11, 13, 17])
+            denominator = self.rng.choice([3, 4, 5])
             slope = numerator / denominator
-            y_intercept = random.randint(-10, 10)
+            y_intercept = self.rng.randint(-10, 10)
 
             slope_str = self._format_slope(numerator, denominator)
 
@@ -299,37 +295,21 @@ class SlopeInterceptGenerator:
         """Create worksheet and answer key images."""
         # Create worksheet image (blank grid)
         plane = CoordinatePlane(x_min=-10, x_max=10, y_min=-10, y_max=10)
-        fig, ax = plane.create_figure(figsize=(6, 6))
-        worksheet_img = self._fig_to_image(fig)
+        worksheet_img = plane.blank_image(figsize=(6, 6))
 
-        # Create answer key image (with line plotted)
-        plane_ans = CoordinatePlane(x_min=-10, x_max=10, y_min=-10, y_max=10)
-        fig_ans, ax_ans = plane_ans.create_figure(figsize=(6, 6))
+        # Create answer key image (with line plotted), rendered when drawn
+        spec_ans = PlaneSpec(x_min=-10, x_max=10, y_min=-10, y_max=10, savefig=ANSWER_SAVEFIG)
 
         # Plot the line using slope-intercept form
-        plane_ans.plot_line_from_equation(
-            ax_ans,
+        answer_img = spec_ans.line(
             slope=slope,
             y_intercept=y_intercept,
             color='red',
             linewidth=2
         )
 
-        answer_img = self._fig_to_image(fig_ans)
-
         return worksheet_img, answer_img
 
-    def _fig_to_image(self, fig):
-        """Convert matplotlib figure to PIL Image."""
-        import io
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png', bbox_inches='tight', dpi=150)
-        buf.seek(0)
-        img = Image.open(buf)
-        import matplotlib.pyplot as plt
-        plt.close(fig)
-        return img
-
 
 if __name__ == "__main__":
     # Test the generator
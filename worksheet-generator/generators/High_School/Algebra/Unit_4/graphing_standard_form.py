@@ -4,16 +4,13 @@ Chapter 4: Linear Equations (Two Variables) - Standard Form (Ax + By = C)
 """
 
 import random
-import sys
-from pathlib import Path
 from dataclasses import dataclass
 from typing import Tuple
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from graphing_utils import CoordinatePlane, PlaneSpec
 
-from graphing_utils import CoordinatePlane
-from PIL import Image
+# savefig() arguments for the answer key graphs
+ANSWER_SAVEFIG = (('bbox_inches', 'tight'), ('dpi', 150))
 
 
 @dataclass
@@ -25,7 +22,7 @@ class StandardFormProblem:
     equation_latex: str  # LaTeX string for the equation
     difficulty: str  # easy, medium, hard
     worksheet_image: object  # PIL Image for worksheet (blank grid)
-    answer_image: object  # PIL Image for answer key (with line plotted)
+    answer_image: object  # PlaneSpec for answer key (with line plotted), rendered when drawn
     x_min: int = -10
     x_max: int = 10
     y_min: int = -10
@@ -42,8 +39,7 @@ class StandardFormGenerator:
         Args:
             seed: Random seed for reproducibility
         """
-        if seed is not None:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int = 6) -> list:
         """
@@ -88,9 +84,9 @@ class StandardFormGenerator:
         Generate easy problem: small positive coefficients, easy intercepts.
         """
         # Small coefficients
-        a = random.randint(1, 4)
-        b = random.randint(1, 4)
-        c = random.randint(4, 20)
+        a = self.rng.randint(1, 4)
+        b = self.rng.randint(1, 4)
+        c = self.rng.randint(4, 20)
 
         # Format equation
         equation_latex = self._format_equation(a, b, c)
@@ -113,14 +109,14 @@ class StandardFormGenerator:
         Generate medium problem: mix of positive/negative coefficients, larger values.
         """
         # Mixed coefficients
-        a = random.choice([-6, -5, -4, -3, -2, -1, 1, 2, 3, 4, 5, 6])
-        b = random.choice([-6, -5, -4, -3, -2, -1, 1, 2, 3, 4, 5, 6])
-        c = random.randint(-20, 20)
+        a = self.rng.choice([-6, -5, -4, -3, -2, -1, 1, 2, 3, 4, 5, 6])
+        b = self.rng.choice([-6, -5, -4, -3, -2, -1, 1, 2, 3, 4, 5, 6])
+        c = self.rng.randint(-20, 20)
 
         # Avoid a=0 or b=0 (would be vertical/horizontal)
         while a == 0 or b == 0:
-            a = random.choice([-6, -5, -4, -3, -2, -1, 1, 2, 3, 4, 5, 6])
-            b = random.choice([-6, -5, -4, -3, -2, -1, 1, 2, 3, 4, 5, 6])
+            a = self.rng.choice([-6, -5, -4, -3, -2, -1, 1, 2, 3, 4, 5, 6])
+            b = self.rng.choice([-6, -5, -4, -3, -2, -1, 1, 2, 3, 4, 5, 6])
 
         # Format equation
         equation_latex = self._format_equation(a, b, c)
@@ -142,25 +138,25 @@ class StandardFormGenerator:
         """
         Generate hard problem: special cases (vertical/horizontal lines), larger coefficients.
         """
-        problem_type = random.choice(['vertical', 'horizontal', 'negative_coeffs'])
+        problem_type = self.rng.choice(['vertical', 'horizontal', 'negative_coeffs'])
 
         if problem_type == 'vertical':
             # Vertical line: Ax = C (B = 0)
-            a = random.choice([-5, -4, -3, -2, -1, 1, 2, 3, 4, 5])
+            a = self.rng.choice([-5, -4, -3, -2, -1, 1, 2, 3, 4, 5])
             b = 0
-            c = random.randint(-10, 10)
+            c = self.rng.randint(-10, 10)
 
         elif problem_type == 'horizontal':
             # Horizontal line: By = C (A = 0)
             a = 0
-            b = random.choice([-5, -4, -3, -2, -1, 1, 2, 3, 4, 5])
-            c = random.randint(-10, 10)
+            b = self.rng.choice([-5, -4, -3, -2, -1, 1, 2, 3, 4, 5])
+            c = self.rng.randint(-10, 10)
 
         else:  # negative_coeffs
             # Both coefficients negative
-            a = random.randint(-8, -2)
-            b = random.randint(-8, -2)
-            c = random.randint(-30, 30)
+            a = self.rng.randint(-8, -2)
+            b = self.rng.randint(-8, -2)
+            c = self.rng.randint(-30, 30)
 
         # Format equation
         equation_latex = self._format_equation(a, b, c)
@@ -183,37 +179,37 @@ class StandardFormGenerator:
         Generate challenge problem: large coefficients, complex negative values,
         fractional intercepts, and extreme slope combinations.
         """
-        problem_type = random.choice(['large_coeffs', 'all_negative', 'coprime_large', 'extreme_ratio'])
+        problem_type = self.rng.choice(['large_coeffs', 'all_negative', 'coprime_large', 'extreme_ratio'])
 
         if problem_type == 'large_coeffs':
             # Large coefficients with complex relationships
-            a = random.choice([-15, -12, -9, 9, 12, 15])
-            b = random.choice([-11, -8, -7, 7, 8, 11])
-            c = random.randint(-50, 50)
+            a = self.rng.choice([-15, -12, -9, 9, 12, 15])
+            b = self.rng.choice([-11, -8, -7, 7, 8, 11])
+            c = self.rng.randint(-50, 50)
 
         elif problem_type == 'all_negative':
             # All negative coefficients with large magnitudes
-            a = random.randint(-18, -8)
-            b = random.randint(-15, -6)
-            c = random.randint(-60, -10)
+            a = self.rng.randint(-18, -8)
+            b = self.rng.randint(-15, -6)
+            c = self.rng.randint(-60, -10)
 
         elif problem_type == 'coprime_large':
             # Large coprime coefficients (creates fractional slope)
-            a = random.choice([-13, -11, -7, 7, 11, 13])
-            b = random.choice([-17, -13, -11, 11, 13, 17])
-            c = random.randint(-40, 40)
+            a = self.rng.choice([-13, -11, -7, 7, 11, 13])
+            b = self.rng.choice([-17, -13, -11, 11, 13, 17])
+            c = self.rng.randint(-40, 40)
 
         else:  # extreme_ratio
             # Extreme ratio between coefficients
-            if random.choice([True, False]):
+            if self.rng.choice([True, False]):
                 # Very steep slope (large a, small b)
-                a = random.choice([-20, -18, -15, 15, 18, 20])
-                b = random.choice([-3, -2, -1, 1, 2, 3])
+                a = self.rng.choice([-20, -18, -15, 15, 18, 20])
+                b = self.rng.choice([-3, -2, -1, 1, 2, 3])
             else:
                 # Very flat slope (small a, large b)
-                a = random.choice([-3, -2, -1, 1, 2, 3])
-                b = random.choice([-20, -18, -15, 15, 18, 20])
-            c = random.randint(-50, 50)
+                a = self.rng.choice([-3, -2, -1, 1, 2, 3])
+                b = self.rng.choice([-20, -18, -15, 15, 18, 20])
+            c = self.rng.randint(-50, 50)
 
         # Format equation
         equation_latex = self._format_equation(a, b, c)
@@ -273,36 +269,20 @@ class StandardFormGenerator:
         """Create worksheet and answer key images."""
         # Create worksheet image (blank grid)
         plane = CoordinatePlane(x_min=-10, x_max=10, y_min=-10, y_max=10)
-        fig, ax = plane.create_figure(figsize=(6, 6))
-        worksheet_img = self._fig_to_image(fig)
+        worksheet_img = plane.blank_image(figsize=(6, 6))
 
-        # Create answer key image (with line plotted)
-        plane_ans = CoordinatePlane(x_min=-10, x_max=10, y_min=-10, y_max=10)
-        fig_ans, ax_ans = plane_ans.create_figure(figsize=(6, 6))
+        # Create answer key image (with line plotted), rendered when drawn
+        spec_ans = PlaneSpec(x_min=-10, x_max=10, y_min=-10, y_max=10, savefig=ANSWER_SAVEFIG)
 
         # Plot the line using standard form
-        plane_ans.plot_line_from_equation(
-            ax_ans,
+        answer_img = spec_ans.line(
             standard_form=(a, b, c),
             color='red',
             linewidth=2
         )
 
-        answer_img = self._fig_to_image(fig_ans)
-
         return worksheet_img, answer_img
 
-    def _fig_to_image(self, fig):
-        """Convert matplotlib figure to PIL Image."""
-        import io
-        buf = io.BytesIO()
-        fig.savefig(buf, format='png', bbox_inches='tight', dpi=150)
-        buf.seek(0)
-        img = Image.open(buf)
-        import matplotlib.pyplot as plt
-        plt.close(fig)
-        return img
-
 
 if __name__ == "__main__":
     # Test the generator
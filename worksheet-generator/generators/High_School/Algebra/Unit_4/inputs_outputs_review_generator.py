@@ -5,9 +5,6 @@ Reviews the concept of inputs and outputs in preparation for coordinate plane wo
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class InputsOutputsReviewGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -40,13 +36,13 @@ class InputsOutputsReviewGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy: Identify inputs and outputs from rules"""
-        problem_type = random.choice(['simple_rule', 'table', 'word_rule'])
+        problem_type = self.rng.choice(['simple_rule', 'table', 'word_rule'])
 
         if problem_type == 'simple_rule':
             # Given input, find output
-            a = random.randint(2, 5)
-            b = random.randint(1, 10)
-            input_val = random.randint(1, 8)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 10)
+            input_val = self.rng.randint(1, 8)
             output_val = a * input_val + b
 
             latex = f"\\text{{Rule: output = }} {a} \\times \\text{{input}} + {b}. "
@@ -61,7 +57,7 @@ class InputsOutputsReviewGenerator:
 
         elif problem_type == 'table':
             # Complete the table
-            a = random.randint(2, 4)
+            a = self.rng.randint(2, 4)
             inputs = [1, 2, 3]
             outputs = [a * i for i in inputs]
             missing_input = 4
@@ -78,8 +74,8 @@ class InputsOutputsReviewGenerator:
 
         else:  # word_rule
             # Word description
-            per_item = random.randint(3, 8)
-            items = random.randint(5, 10)
+            per_item = self.rng.randint(3, 8)
+            items = self.rng.randint(5, 10)
             total = per_item * items
 
             latex = f"\\text{{Cost is }} \\${per_item} \\text{{ per item. Input: number of items. "
@@ -100,9 +96,9 @@ class InputsOutputsReviewGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium: Work backwards from output to input"""
-        a = random.randint(2, 6)
-        b = random.randint(1, 10)
-        output_val = random.randint(20, 50)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 10)
+        output_val = self.rng.randint(20, 50)
         
         # Solve for input: output = a * input + b
         # input = (output - b) / a
@@ -127,12 +123,12 @@ class InputsOutputsReviewGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard: Multiple steps or patterns"""
-        a = random.randint(2, 4)
-        b = random.randint(1, 8)
-        c = random.randint(2, 5)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(1, 8)
+        c = self.rng.randint(2, 5)
         
         # Two-step rule
-        input_val = random.randint(3, 8)
+        input_val = self.rng.randint(3, 8)
         intermediate = a * input_val + b
         output_val = intermediate * c
 
@@ -155,9 +151,9 @@ class InputsOutputsReviewGenerator:
     def _generate_challenge(self) -> Equation:
         """Generate challenge: Complex relationships"""
         # Function with multiple operations
-        input_val = random.randint(5, 12)
-        a = random.randint(2, 4)
-        b = random.randint(3, 8)
+        input_val = self.rng.randint(5, 12)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(3, 8)
         
         # Rule: (input * a) - b, then square
         intermediate = input_val * a - b
@@ -4,18 +4,10 @@ Chapter 4: Linear Equations (Two Variables) - X and Y Intercepts
 """
 
 import random
-import sys
-from pathlib import Path
 from dataclasses import dataclass
 from fractions import Fraction
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from graphing_utils import CoordinatePlane
-from PIL import Image
-from io import BytesIO
-import matplotlib.pyplot as plt
+from graphing_utils import PlaneSpec
 
 
 @dataclass
@@ -28,8 +20,8 @@ class InterceptsProblem:
     x_intercept_latex: str  # LaTeX representation of x-intercept
     y_intercept_latex: str  # LaTeX representation of y-intercept
     difficulty: str  # easy, medium, hard, challenge
-    worksheet_image: object  # PIL Image for worksheet (blank grid with equation)
-    answer_image: object  # PIL Image for answer key (grid with line and intercepts marked)
+    worksheet_image: object  # PlaneSpec for worksheet (blank grid with equation), rendered when drawn
+    answer_image: object  # PlaneSpec for answer key (grid with line and intercepts marked), rendered when drawn
     problem_latex: str  # LaTeX string for the problem
     answer_latex: str  # LaTeX string for the answer
     x_min: int = -10
@@ -48,8 +40,7 @@ class InterceptsGenerator:
         Args:
             seed: Random seed for reproducibility
         """
-        if seed is not None:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def _format_number(self, num):
         """Format a number for display, handling fractions."""
@@ -145,53 +136,45 @@ class InterceptsGenerator:
             show_intercepts: Whether to mark the intercepts
 
         Returns:
-            PIL Image object
+            PlaneSpec (rendered when drawn)
         """
-        plane = CoordinatePlane()
-        fig, ax = plane.create_figure()
+        spec = PlaneSpec(savefig=(('bbox_inches', 'tight'),))
 
         # Plot the line
         if equation_type == 'slope-intercept':
             m = params['slope']
             b = params['y_intercept']
             if m != 0:
-                plane.plot_line_from_equation(ax, slope=m, y_intercept=b, color='blue', linewidth=2)
+                spec = spec.line(slope=m, y_intercept=b, color='blue', linewidth=2)
             else:
                 # Horizontal line
-                ax.axhline(y=b, color='blue', linewidth=2)
+                spec = spec.axes('axhline', y=b, color='blue', linewidth=2)
 
         elif equation_type == 'standard':
             A = params['A']
             B = params['B']
             C = params['C']
-            plane.plot_line_from_equation(ax, standard_form=(A, B, C), color='blue', linewidth=2)
+            spec = spec.line(standard_form=(A, B, C), color='blue', linewidth=2)
 
         else:  # vertical line
             x_val = params['x_value']
-            ax.axvline(x=x_val, color='blue', linewidth=2)
+            spec = spec.axes('axvline', x=x_val, color='blue', linewidth=2)
 
         # Mark intercepts if requested
         if show_intercepts:
             x_int, y_int, _, _ = self._calculate_intercepts(equation_type, params)
 
             if x_int and isinstance(x_int, tuple):
-                plane.plot_point(ax, x_int[0], x_int[1],
-                               label=f"x-int: ({self._format_number(x_int[0])}, 0)",
-                               color='red', size=100)
+                spec = spec.point(x_int[0], x_int[1],
+                                  label=f"x-int: ({self._format_number(x_int[0])}, 0)",
+                                  color='red', size=100)
 
             if y_int and isinstance(y_int, tuple):
-                plane.plot_point(ax, y_int[0], y_int[1],
-                               label=f"y-int: (0, {self._format_number(y_int[1])})",
-                               color='green', size=100)
-
-        # Convert to PIL Image
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', bbox_inches='tight')
-        plt.close(fig)
-        buffer.seek(0)
-        image = Image.open(buffer)
+                spec = spec.point(y_int[0], y_int[1],
+                                  label=f"y-int: (0, {self._format_number(y_int[1])})",
+                                  color='green', size=100)
 
-        return image
+        return spec
 
     def generate_problem(self, difficulty: str) -> InterceptsProblem:
         """
@@ -215,13 +198,13 @@ class InterceptsGenerator:
     def _generate_easy(self) -> InterceptsProblem:
         """Generate easy intercepts problem (integer intercepts, slope-intercept form)."""
         # Use slope-intercept form with integer values
-        slope = random.randint(1, 3) * random.choice([-1, 1])
-        y_intercept = random.randint(-6, 6)
+        slope = self.rng.randint(1, 3) * self.rng.choice([-1, 1])
+        y_intercept = self.rng.randint(-6, 6)
 
         # Ensure x-intercept is also an integer
         while y_intercept % slope != 0:
-            slope = random.randint(1, 3) * random.choice([-1, 1])
-            y_intercept = random.randint(-6, 6)
+            slope = self.rng.randint(1, 3) * self.rng.choice([-1, 1])
+            y_intercept = self.rng.randint(-6, 6)
 
         equation_type = 'slope-intercept'
         params = {'slope': slope, 'y_intercept': y_intercept}
@@ -261,9 +244,9 @@ class InterceptsGenerator:
     def _generate_medium(self) -> InterceptsProblem:
         """Generate medium intercepts problem (standard form, fractional intercepts)."""
         # Use standard form Ax + By = C
-        A = random.randint(1, 5) * random.choice([-1, 1])
-        B = random.randint(1, 5) * random.choice([-1, 1])
-        C = random.randint(1, 12) * random.choice([-1, 1])
+        A = self.rng.randint(1, 5) * self.rng.choice([-1, 1])
+        B = self.rng.randint(1, 5) * self.rng.choice([-1, 1])
+        C = self.rng.randint(1, 12) * self.rng.choice([-1, 1])
 
         equation_type = 'standard'
         params = {'A': A, 'B': B, 'C': C}
@@ -302,13 +285,13 @@ class InterceptsGenerator:
 
     def _generate_hard(self) -> InterceptsProblem:
         """Generate hard intercepts problem (complex fractions, horizontal lines)."""
-        problem_type = random.choice(['complex_standard', 'horizontal', 'steep_slope'])
+        problem_type = self.rng.choice(['complex_standard', 'horizontal', 'steep_slope'])
 
         if problem_type == 'horizontal':
             # Horizontal line y = b
-            y_val = random.randint(-6, 6)
+            y_val = self.rng.randint(-6, 6)
             while y_val == 0:
-                y_val = random.randint(-6, 6)
+                y_val = self.rng.randint(-6, 6)
 
             equation_type = 'slope-intercept'
             params = {'slope': 0, 'y_intercept': y_val}
@@ -316,8 +299,8 @@ class InterceptsGenerator:
 
         elif problem_type == 'steep_slope':
             # Very steep slope with fractional intercepts
-            slope = random.randint(4, 8) * random.choice([-1, 1])
-            y_intercept = random.randint(1, 7)
+            slope = self.rng.randint(4, 8) * self.rng.choice([-1, 1])
+            y_intercept = self.rng.randint(1, 7)
 
             equation_type = 'slope-intercept'
             params = {'slope': slope, 'y_intercept': y_intercept}
@@ -325,9 +308,9 @@ class InterceptsGenerator:
 
         else:  # complex_standard
             # Standard form with larger coefficients
-            A = random.randint(3, 7) * random.choice([-1, 1])
-            B = random.randint(3, 7) * random.choice([-1, 1])
-            C = random.randint(10, 20) * random.choice([-1, 1])
+            A = self.rng.randint(3, 7) * self.rng.choice([-1, 1])
+            B = self.rng.randint(3, 7) * self.rng.choice([-1, 1])
+            C = self.rng.randint(10, 20) * self.rng.choice([-1, 1])
 
             equation_type = 'standard'
             params = {'A': A, 'B': B, 'C': C}
@@ -357,13 +340,13 @@ class InterceptsGenerator:
 
     def _generate_challenge(self) -> InterceptsProblem:
         """Generate challenge intercepts problem (vertical lines, no intercepts)."""
-        problem_type = random.choice(['vertical', 'through_origin', 'complex_fraction'])
+        problem_type = self.rng.choice(['vertical', 'through_origin', 'complex_fraction'])
 
         if problem_type == 'vertical':
             # Vertical line x = a
-            x_val = random.randint(-6, 6)
+            x_val = self.rng.randint(-6, 6)
             while x_val == 0:
-                x_val = random.randint(-6, 6)
+                x_val = self.rng.randint(-6, 6)
 
             equation_type = 'vertical'
             params = {'x_value': x_val}
@@ -371,7 +354,7 @@ class InterceptsGenerator:
 
         elif problem_type == 'through_origin':
             # Line through origin (y-intercept = 0)
-            slope = Fraction(random.randint(1, 5), random.randint(2, 4)).limit_denominator()
+            slope = Fraction(self.rng.randint(1, 5), self.rng.randint(2, 4)).limit_denominator()
 
             equation_type = 'slope-intercept'
             params = {'slope': float(slope), 'y_intercept': 0}
@@ -379,9 +362,9 @@ class InterceptsGenerator:
 
         else:  # complex_fraction
             # Both intercepts are complex fractions
-            A = random.choice([3, 5, 7, 9])
-            B = random.choice([4, 6, 8])
-            C = random.choice([10, 12, 15, 18, 20])
+            A = self.rng.choice([3, 5, 7, 9])
+            B = self.rng.choice([4, 6, 8])
+            C = self.rng.choice([10, 12, 15, 18, 20])
 
             equation_type = 'standard'
             params = {'A': A, 'B': B, 'C': C}
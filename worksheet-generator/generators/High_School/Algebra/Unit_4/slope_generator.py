@@ -4,18 +4,10 @@ Chapter 4: Linear Equations (Two Variables) - Slope
 """
 
 import random
-import sys
-from pathlib import Path
 from dataclasses import dataclass
 from fractions import Fraction
-from io import BytesIO
-import matplotlib.pyplot as plt
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from graphing_utils import CoordinatePlane
-from PIL import Image
+from graphing_utils import PlaneSpec
 
 
 @dataclass
@@ -27,8 +19,8 @@ class SlopeProblem:
     slope_fraction: str  # Slope as a fraction string
     slope_latex: str  # LaTeX representation of slope
     difficulty: str  # easy, medium, hard, challenge
-    worksheet_image: object  # PIL Image for worksheet (grid with points)
-    answer_image: object  # PIL Image for answer key (grid with points and line)
+    worksheet_image: object  # PlaneSpec for worksheet (grid with points), rendered when drawn
+    answer_image: object  # PlaneSpec for answer key (grid with points and line), rendered when drawn
     problem_latex: str  # LaTeX string for the problem
     answer_latex: str  # LaTeX string for the answer
     x_min: int = -10
@@ -47,8 +39,7 @@ class SlopeGenerator:
         Args:
             seed: Random seed for reproducibility
         """
-        if seed is not None:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def _calculate_slope(self, x1, y1, x2, y2):
         """
@@ -92,29 +83,28 @@ class SlopeGenerator:
             show_slope_triangle: Whether to show the rise/run triangle
 
         Returns:
-            PIL Image object
+            PlaneSpec (rendered when drawn)
         """
-        plane = CoordinatePlane()
-        fig, ax = plane.create_figure()
+        spec = PlaneSpec(savefig=(('bbox_inches', 'tight'),))
 
         x1, y1 = point1
         x2, y2 = point2
 
         # Plot the points
-        plane.plot_point(ax, x1, y1, label=f"({x1}, {y1})", color='blue', size=80)
-        plane.plot_point(ax, x2, y2, label=f"({x2}, {y2})", color='blue', size=80)
+        spec = spec.point(x1, y1, label=f"({x1}, {y1})", color='blue', size=80)
+        spec = spec.point(x2, y2, label=f"({x2}, {y2})", color='blue', size=80)
 
         if show_line:
             # Draw line through points
-            x_vals = [plane.x_min, plane.x_max]
+            x_vals = [spec.x_min, spec.x_max]
             if x2 != x1:
                 slope = (y2 - y1) / (x2 - x1)
                 y_intercept = y1 - slope * x1
                 y_vals = [slope * x + y_intercept for x in x_vals]
-                ax.plot(x_vals, y_vals, 'r-', linewidth=2, alpha=0.7)
+                spec = spec.axes('plot', x_vals, y_vals, 'r-', linewidth=2, alpha=0.7)
             else:
                 # Vertical line
-                ax.axvline(x=x1, color='red', linewidth=2, alpha=0.7)
+                spec = spec.axes('axvline', x=x1, color='red', linewidth=2, alpha=0.7)
 
         if show_slope_triangle and x2 != x1:
             # Draw rise and run
@@ -122,24 +112,17 @@ class SlopeGenerator:
             run = x2 - x1
 
             # Draw horizontal line (run)
-            ax.plot([x1, x2], [y1, y1], 'g--', linewidth=1.5, alpha=0.7)
+            spec = spec.axes('plot', [x1, x2], [y1, y1], 'g--', linewidth=1.5, alpha=0.7)
             # Draw vertical line (rise)
-            ax.plot([x2, x2], [y1, y2], 'b--', linewidth=1.5, alpha=0.7)
+            spec = spec.axes('plot', [x2, x2], [y1, y2], 'b--', linewidth=1.5, alpha=0.7)
 
             # Add labels
             mid_x = (x1 + x2) / 2
             mid_y = (y1 + y2) / 2
-            ax.text(mid_x, y1 - 0.5, f'run = {run}', fontsize=10, ha='center', color='green')
-            ax.text(x2 + 0.5, mid_y, f'rise = {rise}', fontsize=10, ha='left', color='blue')
-
-        # Convert to PIL Image
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', bbox_inches='tight')
-        plt.close(fig)
-        buffer.seek(0)
-        image = Image.open(buffer)
+            spec = spec.axes('text', mid_x, y1 - 0.5, f'run = {run}', fontsize=10, ha='center', color='green')
+            spec = spec.axes('text', x2 + 0.5, mid_y, f'rise = {rise}', fontsize=10, ha='left', color='blue')
 
-        return image
+        return spec
 
     def generate_problem(self, difficulty: str) -> SlopeProblem:
         """
@@ -163,21 +146,21 @@ class SlopeGenerator:
     def _generate_easy(self) -> SlopeProblem:
         """Generate easy slope problem (positive integer slopes)."""
         # Generate two points with positive integer slope
-        x1 = random.randint(-5, 0)
-        y1 = random.randint(-5, 5)
+        x1 = self.rng.randint(-5, 0)
+        y1 = self.rng.randint(-5, 5)
 
         # Ensure different x-coordinates
-        x2 = random.randint(1, 5)
+        x2 = self.rng.randint(1, 5)
         while x2 == x1:
-            x2 = random.randint(1, 5)
+            x2 = self.rng.randint(1, 5)
 
         # Create a positive integer slope
-        slope = random.randint(1, 3)
+        slope = self.rng.randint(1, 3)
         y2 = y1 + slope * (x2 - x1)
 
         # Keep y2 in bounds
         while y2 < -8 or y2 > 8:
-            slope = random.randint(1, 3)
+            slope = self.rng.randint(1, 3)
             y2 = y1 + slope * (x2 - x1)
 
         point1 = (x1, y1)
@@ -203,26 +186,26 @@ class SlopeGenerator:
 
     def _generate_medium(self) -> SlopeProblem:
         """Generate medium slope problem (negative and fractional slopes)."""
-        x1 = random.randint(-6, 2)
-        y1 = random.randint(-6, 6)
+        x1 = self.rng.randint(-6, 2)
+        y1 = self.rng.randint(-6, 6)
 
-        x2 = random.randint(-6, 6)
+        x2 = self.rng.randint(-6, 6)
         while x2 == x1:
-            x2 = random.randint(-6, 6)
+            x2 = self.rng.randint(-6, 6)
 
         # Create fractional or negative slopes
-        rise = random.randint(-6, 6)
+        rise = self.rng.randint(-6, 6)
         while rise == 0:
-            rise = random.randint(-6, 6)
+            rise = self.rng.randint(-6, 6)
 
         run = x2 - x1
         y2 = y1 + rise
 
         # Keep y2 in bounds
         while y2 < -8 or y2 > 8:
-            rise = random.randint(-4, 4)
+            rise = self.rng.randint(-4, 4)
             while rise == 0:
-                rise = random.randint(-4, 4)
+                rise = self.rng.randint(-4, 4)
             y2 = y1 + rise
 
         point1 = (x1, y1)
@@ -248,49 +231,49 @@ class SlopeGenerator:
 
     def _generate_hard(self) -> SlopeProblem:
         """Generate hard slope problem (more complex fractions, zero slopes)."""
-        problem_type = random.choice(['fraction', 'zero', 'negative_fraction'])
+        problem_type = self.rng.choice(['fraction', 'zero', 'negative_fraction'])
 
         if problem_type == 'zero':
             # Horizontal line (slope = 0)
-            y1 = random.randint(-6, 6)
-            x1 = random.randint(-6, 0)
-            x2 = random.randint(1, 6)
+            y1 = self.rng.randint(-6, 6)
+            x1 = self.rng.randint(-6, 0)
+            x2 = self.rng.randint(1, 6)
             y2 = y1
         elif problem_type == 'fraction':
             # Non-simple fractions
-            x1 = random.randint(-6, 2)
-            y1 = random.randint(-6, 6)
+            x1 = self.rng.randint(-6, 2)
+            y1 = self.rng.randint(-6, 6)
 
             # Create a run that doesn't divide evenly
-            run = random.choice([3, 5, 7])
+            run = self.rng.choice([3, 5, 7])
             x2 = x1 + run
 
             # Create a rise that makes a non-simple fraction
-            rise = random.choice([2, 4, 5]) * random.choice([-1, 1])
+            rise = self.rng.choice([2, 4, 5]) * self.rng.choice([-1, 1])
             y2 = y1 + rise
 
             # Keep in bounds
             while x2 < -8 or x2 > 8 or y2 < -8 or y2 > 8:
-                run = random.choice([3, 4, 5])
+                run = self.rng.choice([3, 4, 5])
                 x2 = x1 + run
-                rise = random.choice([2, 3, 4]) * random.choice([-1, 1])
+                rise = self.rng.choice([2, 3, 4]) * self.rng.choice([-1, 1])
                 y2 = y1 + rise
         else:
             # Negative fractions
-            x1 = random.randint(-6, 2)
-            y1 = random.randint(-2, 6)
+            x1 = self.rng.randint(-6, 2)
+            y1 = self.rng.randint(-2, 6)
 
-            run = random.randint(2, 5)
+            run = self.rng.randint(2, 5)
             x2 = x1 + run
 
-            rise = -random.randint(1, 6)
+            rise = -self.rng.randint(1, 6)
             y2 = y1 + rise
 
             # Keep in bounds
             while x2 > 8 or y2 < -8:
-                run = random.randint(2, 4)
+                run = self.rng.randint(2, 4)
                 x2 = x1 + run
-                rise = -random.randint(1, 4)
+                rise = -self.rng.randint(1, 4)
                 y2 = y1 + rise
 
         point1 = (x1, y1)
@@ -316,38 +299,38 @@ class SlopeGenerator:
 
     def _generate_challenge(self) -> SlopeProblem:
         """Generate challenge slope problem (undefined slopes, complex coordinates)."""
-        problem_type = random.choice(['undefined', 'complex_fraction', 'negative_both'])
+        problem_type = self.rng.choice(['undefined', 'complex_fraction', 'negative_both'])
 
         if problem_type == 'undefined':
             # Vertical line (undefined slope)
-            x1 = random.randint(-6, 6)
+            x1 = self.rng.randint(-6, 6)
             x2 = x1
-            y1 = random.randint(-6, 2)
-            y2 = random.randint(3, 6)
+            y1 = self.rng.randint(-6, 2)
+            y2 = self.rng.randint(3, 6)
         elif problem_type == 'complex_fraction':
             # Both coordinates negative with fractional slope
-            x1 = random.randint(-8, -3)
-            y1 = random.randint(-8, -3)
+            x1 = self.rng.randint(-8, -3)
+            y1 = self.rng.randint(-8, -3)
 
             # Create complex fractions
-            run = random.choice([3, 5, 7])
-            rise = random.choice([4, 5, 7, 8])
+            run = self.rng.choice([3, 5, 7])
+            rise = self.rng.choice([4, 5, 7, 8])
 
             x2 = x1 + run
             y2 = y1 + rise
 
             # Keep in bounds
             while x2 > 8 or y2 > 8:
-                run = random.choice([3, 4, 5])
-                rise = random.choice([3, 4, 5])
+                run = self.rng.choice([3, 4, 5])
+                rise = self.rng.choice([3, 4, 5])
                 x2 = x1 + run
                 y2 = y1 + rise
         else:
             # Both coordinates negative
-            x1 = random.randint(-8, -4)
-            y1 = random.randint(-8, -4)
-            x2 = random.randint(-3, 3)
-            y2 = random.randint(-3, 3)
+            x1 = self.rng.randint(-8, -4)
+            y1 = self.rng.randint(-8, -4)
+            x2 = self.rng.randint(-3, 3)
+            y2 = self.rng.randint(-3, 3)
 
         point1 = (x1, y1)
         point2 = (x2, y2)
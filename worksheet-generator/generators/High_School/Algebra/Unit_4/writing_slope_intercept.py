@@ -4,15 +4,9 @@ Chapter 4: Linear Equations (Two Variables) - Writing Slope-Intercept Equations
 """
 
 import random
-import sys
-from pathlib import Path
 from dataclasses import dataclass
 from fractions import Fraction
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-
 @dataclass
 class WritingSlopeInterceptProblem:
     """Represents a problem for writing equations in slope-intercept form."""
@@ -35,8 +29,7 @@ class WritingSlopeInterceptGenerator:
         Args:
             seed: Random seed for reproducibility
         """
-        if seed is not None:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def _format_slope(self, numerator, denominator=1):
         """Format a slope as a fraction or integer."""
@@ -130,8 +123,8 @@ class WritingSlopeInterceptGenerator:
 
     def _generate_easy(self) -> WritingSlopeInterceptProblem:
         """Generate easy problem (given slope and y-intercept directly)."""
-        slope = random.randint(1, 5) * random.choice([-1, 1])
-        y_intercept = random.randint(-8, 8)
+        slope = self.rng.randint(1, 5) * self.rng.choice([-1, 1])
+        y_intercept = self.rng.randint(-8, 8)
 
         given_info = "slope and y-intercept"
         given_data = {
@@ -162,13 +155,13 @@ class WritingSlopeInterceptGenerator:
 
     def _generate_medium(self) -> WritingSlopeInterceptProblem:
         """Generate medium problem (given slope and a point)."""
-        slope = Fraction(random.randint(-5, 5), random.randint(1, 3)).limit_denominator()
+        slope = Fraction(self.rng.randint(-5, 5), self.rng.randint(1, 3)).limit_denominator()
         while slope == 0:
-            slope = Fraction(random.randint(-5, 5), random.randint(1, 3)).limit_denominator()
+            slope = Fraction(self.rng.randint(-5, 5), self.rng.randint(1, 3)).limit_denominator()
 
         # Generate a point
-        x = random.randint(-6, 6)
-        y = random.randint(-6, 6)
+        x = self.rng.randint(-6, 6)
+        y = self.rng.randint(-6, 6)
 
         # Calculate y-intercept: b = y - mx
         y_intercept = y - slope * x
@@ -206,14 +199,14 @@ class WritingSlopeInterceptGenerator:
     def _generate_hard(self) -> WritingSlopeInterceptProblem:
         """Generate hard problem (given two points)."""
         # Generate two points
-        x1 = random.randint(-8, -2)
-        y1 = random.randint(-8, 8)
-        x2 = random.randint(2, 8)
-        y2 = random.randint(-8, 8)
+        x1 = self.rng.randint(-8, -2)
+        y1 = self.rng.randint(-8, 8)
+        x2 = self.rng.randint(2, 8)
+        y2 = self.rng.randint(-8, 8)
 
         # Ensure different x-coordinates
         while x2 == x1:
-            x2 = random.randint(2, 8)
+            x2 = self.rng.randint(2, 8)
 
         slope_val, y_int_val, slope_frac = self._calculate_from_two_points(x1, y1, x2, y2)
 
@@ -251,14 +244,14 @@ class WritingSlopeInterceptGenerator:
 
     def _generate_challenge(self) -> WritingSlopeInterceptProblem:
         """Generate challenge problem (given intercepts or parallel/perpendicular conditions)."""
-        problem_type = random.choice(['intercepts', 'parallel', 'perpendicular'])
+        problem_type = self.rng.choice(['intercepts', 'parallel', 'perpendicular'])
 
         if problem_type == 'intercepts':
             # Given x-intercept and y-intercept
-            x_int = random.randint(1, 8) * random.choice([-1, 1])
-            y_int = random.randint(-8, 8)
+            x_int = self.rng.randint(1, 8) * self.rng.choice([-1, 1])
+            y_int = self.rng.randint(-8, 8)
             while y_int == 0:  # Avoid line through origin
-                y_int = random.randint(-8, 8)
+                y_int = self.rng.randint(-8, 8)
 
             # Slope = -b/a where (a, 0) is x-intercept and (0, b) is y-intercept
             slope = Fraction(-y_int, x_int).limit_denominator()
@@ -283,12 +276,12 @@ class WritingSlopeInterceptGenerator:
 
         elif problem_type == 'parallel':
             # Parallel to given line through a point
-            ref_slope = random.randint(1, 4) * random.choice([-1, 1])
-            ref_y_int = random.randint(-5, 5)
+            ref_slope = self.rng.randint(1, 4) * self.rng.choice([-1, 1])
+            ref_y_int = self.rng.randint(-5, 5)
             ref_equation = self._format_equation(ref_slope, ref_y_int)
 
-            point_x = random.randint(-6, 6)
-            point_y = random.randint(-6, 6)
+            point_x = self.rng.randint(-6, 6)
+            point_y = self.rng.randint(-6, 6)
 
             # Parallel lines have same slope
             slope = ref_slope
@@ -315,12 +308,12 @@ class WritingSlopeInterceptGenerator:
 
         else:  # perpendicular
             # Perpendicular to given line through a point
-            ref_slope = random.choice([2, 3, 4]) * random.choice([-1, 1])
-            ref_y_int = random.randint(-5, 5)
+            ref_slope = self.rng.choice([2, 3, 4]) * self.rng.choice([-1, 1])
+            ref_y_int = self.rng.randint(-5, 5)
             ref_equation = self._format_equation(ref_slope, ref_y_int)
 
-            point_x = random.randint(-6, 6)
-            point_y = random.randint(-6, 6)
+            point_x = self.rng.randint(-6, 6)
+            point_y = self.rng.randint(-6, 6)
 
             # Perpendicular slope is negative reciprocal
             perp_slope = Fraction(-1, ref_slope).limit_denominator()
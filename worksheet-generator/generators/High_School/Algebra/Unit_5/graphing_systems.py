@@ -4,15 +4,10 @@ Chapter 5: Systems of Equations - Graphing Method
 """
 
 import random
-import sys
-from pathlib import Path
 from dataclasses import dataclass
 from typing import List, Tuple
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from graphing_utils import CoordinatePlane
+from graphing_utils import CoordinatePlane, PlaneSpec
 
 
 @dataclass
@@ -27,7 +22,7 @@ class GraphingSystemProblem:
     solution: Tuple[float, float]  # (x, y) intersection point
     difficulty: str  # easy, medium, hard, challenge
     worksheet_image: object  # PIL Image for worksheet (blank grid with equations)
-    answer_image: object  # PIL Image for answer key (with lines and intersection)
+    answer_image: object  # PlaneSpec for answer key (with lines and intersection), rendered when drawn
     x_min: int = -10
     x_max: int = 10
     y_min: int = -10
@@ -44,8 +39,7 @@ class GraphingSystemsGenerator:
         Args:
             seed: Random seed for reproducibility
         """
-        if seed is not None:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_problem(self, difficulty: str) -> GraphingSystemProblem:
         """
@@ -74,17 +68,17 @@ class GraphingSystemsGenerator:
         Both equations in slope-intercept form: y = mx + b
         """
         # Generate integer solution point
-        x_sol = random.randint(-5, 5)
-        y_sol = random.randint(-5, 5)
+        x_sol = self.rng.randint(-5, 5)
+        y_sol = self.rng.randint(-5, 5)
 
         # Generate first line with integer slope through the solution
-        slope1 = random.choice([-2, -1, 1, 2])
+        slope1 = self.rng.choice([-2, -1, 1, 2])
         y_intercept1 = y_sol - slope1 * x_sol
 
         # Generate second line with different integer slope through the solution
-        slope2 = random.choice([-2, -1, 1, 2])
+        slope2 = self.rng.choice([-2, -1, 1, 2])
         while slope2 == slope1:  # Ensure different slopes (not parallel)
-            slope2 = random.choice([-2, -1, 1, 2])
+            slope2 = self.rng.choice([-2, -1, 1, 2])
         y_intercept2 = y_sol - slope2 * x_sol
 
         # Format equations: y = mx + b
@@ -119,19 +113,19 @@ class GraphingSystemsGenerator:
         Mix of slope-intercept and standard form.
         """
         # Generate integer solution point
-        x_sol = random.randint(-4, 4)
-        y_sol = random.randint(-4, 4)
+        x_sol = self.rng.randint(-4, 4)
+        y_sol = self.rng.randint(-4, 4)
 
         # Generate first line with fractional slope
-        numerator1 = random.choice([-3, -2, -1, 1, 2, 3])
-        denominator1 = random.choice([2, 3])
+        numerator1 = self.rng.choice([-3, -2, -1, 1, 2, 3])
+        denominator1 = self.rng.choice([2, 3])
         slope1 = numerator1 / denominator1
         y_intercept1 = y_sol - slope1 * x_sol
 
         # Generate second line with different slope
-        slope2 = random.choice([-2, -1, 1, 2, 3])
+        slope2 = self.rng.choice([-2, -1, 1, 2, 3])
         while abs(slope2 - slope1) < 0.5:  # Ensure sufficiently different slopes
-            slope2 = random.choice([-2, -1, 1, 2, 3])
+            slope2 = self.rng.choice([-2, -1, 1, 2, 3])
         y_intercept2 = y_sol - slope2 * x_sol
 
         # Format first equation as slope-intercept
@@ -169,19 +163,19 @@ class GraphingSystemsGenerator:
         Generate hard problem: Both equations in standard form, may have fractional solution.
         """
         # Generate solution (may be fractional)
-        x_sol = random.randint(-8, 8) / 2.0  # 0.5 increments
-        y_sol = random.randint(-8, 8) / 2.0
+        x_sol = self.rng.randint(-8, 8) / 2.0  # 0.5 increments
+        y_sol = self.rng.randint(-8, 8) / 2.0
 
         # Generate first line
-        slope1 = random.randint(-4, 4) / 2.0
+        slope1 = self.rng.randint(-4, 4) / 2.0
         while slope1 == 0:
-            slope1 = random.randint(-4, 4) / 2.0
+            slope1 = self.rng.randint(-4, 4) / 2.0
         y_intercept1 = y_sol - slope1 * x_sol
 
         # Generate second line
-        slope2 = random.randint(-4, 4) / 2.0
+        slope2 = self.rng.randint(-4, 4) / 2.0
         while slope2 == 0 or abs(slope2 - slope1) < 0.5:
-            slope2 = random.randint(-4, 4) / 2.0
+            slope2 = self.rng.randint(-4, 4) / 2.0
         y_intercept2 = y_sol - slope2 * x_sol
 
         # Convert both to standard form
@@ -222,18 +216,18 @@ class GraphingSystemsGenerator:
         Generate challenge problem: Complex standard forms, fractional solutions, larger range.
         """
         # Generate solution (fractional)
-        x_sol = random.randint(-12, 12) / 3.0  # 1/3 increments
-        y_sol = random.randint(-12, 12) / 3.0
+        x_sol = self.rng.randint(-12, 12) / 3.0  # 1/3 increments
+        y_sol = self.rng.randint(-12, 12) / 3.0
 
         # Generate lines with more complex slopes
-        slope1 = random.randint(-6, 6) / 3.0
+        slope1 = self.rng.randint(-6, 6) / 3.0
         while abs(slope1) < 0.3:
-            slope1 = random.randint(-6, 6) / 3.0
+            slope1 = self.rng.randint(-6, 6) / 3.0
         y_intercept1 = y_sol - slope1 * x_sol
 
-        slope2 = random.randint(-6, 6) / 3.0
+        slope2 = self.rng.randint(-6, 6) / 3.0
         while abs(slope2) < 0.3 or abs(slope2 - slope1) < 0.5:
-            slope2 = random.randint(-6, 6) / 3.0
+            slope2 = self.rng.randint(-6, 6) / 3.0
         y_intercept2 = y_sol - slope2 * x_sol
 
         # Convert to standard form with larger coefficients
@@ -328,35 +322,29 @@ class GraphingSystemsGenerator:
         return f"{a_str}{b_str} = {C}"
 
     def _create_worksheet_image(self):
-        """Create blank coordinate plane for worksheet."""
-        plane = CoordinatePlane(-10, 10, -10, 10, grid=True)
-        fig, ax = plane.create_figure(figsize=(6, 6))
-
+        """Create blank coordinate plane for worksheet (shared across problems)."""
         # No equations on image - they will be displayed as text by PDF generator
 
-        return plane.render_to_image(fig)
+        return CoordinatePlane(-10, 10, -10, 10, grid=True).blank_image(figsize=(6, 6))
 
     def _create_answer_image(self, slope1, y_int1, slope2, y_int2,
                             x_sol, y_sol):
-        """Create coordinate plane with lines and intersection for answer key."""
-        plane = CoordinatePlane(-10, 10, -10, 10, grid=True)
-        fig, ax = plane.create_figure(figsize=(6, 6))
+        """Describe the coordinate plane with lines and intersection for answer key (rendered when drawn)."""
+        spec = PlaneSpec(-10, 10, -10, 10, grid=True)
 
         # No equations on image - they will be displayed as text by PDF generator
 
         # Plot first line (red)
-        plane.plot_line_from_equation(ax, slope=slope1, y_intercept=y_int1,
-                                     color='red', linewidth=2, label='Line 1')
+        spec = spec.line(slope=slope1, y_intercept=y_int1,
+                         color='red', linewidth=2, label='Line 1')
 
         # Plot second line (blue)
-        plane.plot_line_from_equation(ax, slope=slope2, y_intercept=y_int2,
-                                     color='blue', linewidth=2, label='Line 2')
+        spec = spec.line(slope=slope2, y_intercept=y_int2,
+                         color='blue', linewidth=2, label='Line 2')
 
         # Plot intersection point (green)
-        plane.plot_point(ax, x_sol, y_sol, label=f"({x_sol}, {y_sol})",
-                        color='green', size=80, marker='o')
-
-        return plane.render_to_image(fig)
+        return spec.point(x_sol, y_sol, label=f"({x_sol}, {y_sol})",
+                          color='green', size=80, marker='o')
 
     def generate_worksheet(self, difficulty: str,
                           num_problems: int) -> List[GraphingSystemProblem]:
@@ -7,13 +7,8 @@ The solution is the intersection point where both equations are satisfied.
 """
 
 import random
-import sys
-from pathlib import Path
 from fractions import Fraction
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
-
 from equation_generator import Equation
 
 
@@ -27,8 +22,7 @@ class GraphingSystemsOfEquationsGenerator:
         Args:
             seed: Random seed for reproducibility (optional)
         """
-        if seed is not None:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int):
         """
@@ -157,22 +151,22 @@ class GraphingSystemsOfEquationsGenerator:
         Integer intersection point.
         """
         # Generate intersection point first to ensure integer solution
-        x_sol = random.randint(-4, 4)
-        y_sol = random.randint(-4, 4)
+        x_sol = self.rng.randint(-4, 4)
+        y_sol = self.rng.randint(-4, 4)
 
         # Generate first line that passes through (x_sol, y_sol)
-        m1 = random.randint(-3, 3)
+        m1 = self.rng.randint(-3, 3)
         while m1 == 0:
-            m1 = random.randint(-3, 3)
+            m1 = self.rng.randint(-3, 3)
 
         # Calculate b1 so line passes through (x_sol, y_sol)
         # y_sol = m1 * x_sol + b1
         b1 = y_sol - m1 * x_sol
 
         # Generate second line with different slope
-        m2 = random.randint(-3, 3)
+        m2 = self.rng.randint(-3, 3)
         while m2 == m1 or m2 == 0:
-            m2 = random.randint(-3, 3)
+            m2 = self.rng.randint(-3, 3)
 
         # Calculate b2 so line passes through (x_sol, y_sol)
         b2 = y_sol - m2 * x_sol
@@ -210,19 +204,19 @@ class GraphingSystemsOfEquationsGenerator:
         May have fractional intersection point.
         """
         # Generate intersection point first
-        x_sol = random.randint(-4, 4)
-        y_sol = random.randint(-4, 4)
+        x_sol = self.rng.randint(-4, 4)
+        y_sol = self.rng.randint(-4, 4)
 
         # Generate first line in standard form that passes through (x_sol, y_sol)
         # Ax + By = C
-        a1 = random.randint(1, 4)
-        b1 = random.choice([1, 2, -1, -2])
+        a1 = self.rng.randint(1, 4)
+        b1 = self.rng.choice([1, 2, -1, -2])
         c1 = a1 * x_sol + b1 * y_sol
 
         # Generate second line in slope-intercept form
-        m2 = random.randint(-3, 3)
+        m2 = self.rng.randint(-3, 3)
         while m2 == 0:
-            m2 = random.randint(-3, 3)
+            m2 = self.rng.randint(-3, 3)
 
         # Calculate b2 so line passes through (x_sol, y_sol)
         # y_sol = m2 * x_sol + b2
@@ -261,18 +255,18 @@ class GraphingSystemsOfEquationsGenerator:
         Generate a hard problem.
         Systems with no solution (parallel lines) or infinite solutions (same line).
         """
-        problem_type = random.choice(['no_solution', 'infinite_solutions'])
+        problem_type = self.rng.choice(['no_solution', 'infinite_solutions'])
 
         if problem_type == 'no_solution':
             # Parallel lines: same slope, different y-intercepts
-            m = random.randint(-3, 3)
+            m = self.rng.randint(-3, 3)
             while m == 0:
-                m = random.randint(-3, 3)
+                m = self.rng.randint(-3, 3)
 
-            b1 = random.randint(-5, 5)
-            b2 = random.randint(-5, 5)
+            b1 = self.rng.randint(-5, 5)
+            b2 = self.rng.randint(-5, 5)
             while b2 == b1:
-                b2 = random.randint(-5, 5)
+                b2 = self.rng.randint(-5, 5)
 
             eq1 = self._format_equation(m, b1)
             eq2 = self._format_equation(m, b2)
@@ -289,17 +283,17 @@ class GraphingSystemsOfEquationsGenerator:
 
         else:  # infinite_solutions
             # Same line represented differently
-            m = random.randint(-3, 3)
+            m = self.rng.randint(-3, 3)
             while m == 0:
-                m = random.randint(-3, 3)
+                m = self.rng.randint(-3, 3)
 
-            b = random.randint(-5, 5)
+            b = self.rng.randint(-5, 5)
 
             # First equation in slope-intercept form
             eq1 = self._format_equation(m, b)
 
             # Second equation: multiply by a constant and rearrange to standard form
-            multiplier = random.choice([2, 3, -1, -2])
+            multiplier = self.rng.choice([2, 3, -1, -2])
             # y = mx + b becomes:
             # multiplier*y = multiplier*m*x + multiplier*b
             # -multiplier*m*x + multiplier*y = multiplier*b
@@ -359,16 +353,16 @@ class GraphingSystemsOfEquationsGenerator:
             }
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
 
         # Generate realistic values
         # Company A: higher initial cost, lower rate
-        initial_a = random.randint(20, 50)
-        rate_a = random.randint(2, 8)
+        initial_a = self.rng.randint(20, 50)
+        rate_a = self.rng.randint(2, 8)
 
         # Company B: lower initial cost, higher rate
-        initial_b = random.randint(5, initial_a - 10)
-        rate_b = random.randint(rate_a + 2, rate_a + 8)
+        initial_b = self.rng.randint(5, initial_a - 10)
+        rate_b = self.rng.randint(rate_a + 2, rate_a + 8)
 
         # Calculate intersection
         # initial_a + rate_a * x = initial_b + rate_b * x
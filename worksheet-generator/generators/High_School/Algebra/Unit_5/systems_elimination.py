@@ -4,15 +4,9 @@ Chapter 5: Systems of Equations - Using Elimination
 """
 
 import random
-import sys
-from pathlib import Path
 from dataclasses import dataclass
 from fractions import Fraction
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-
 @dataclass
 class EliminationSystemProblem:
     """Represents a system of equations to be solved using elimination."""
@@ -40,8 +34,7 @@ class SystemsEliminationGenerator:
         Args:
             seed: Random seed for reproducibility
         """
-        if seed is not None:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def _gcd(self, a, b):
         """Calculate greatest common divisor."""
@@ -137,19 +130,19 @@ class SystemsEliminationGenerator:
     def _generate_easy(self) -> EliminationSystemProblem:
         """Generate easy problem (coefficients already match for elimination)."""
         # Choose solution
-        x_sol = random.randint(-5, 5)
-        y_sol = random.randint(-5, 5)
+        x_sol = self.rng.randint(-5, 5)
+        y_sol = self.rng.randint(-5, 5)
 
         # Create equations where one variable has same coefficient
-        eliminate_var = random.choice(['x', 'y'])
+        eliminate_var = self.rng.choice(['x', 'y'])
 
         if eliminate_var == 'x':
             # Same x coefficient
-            a = random.randint(1, 3)
-            b1 = random.randint(1, 4) * random.choice([-1, 1])
-            b2 = random.randint(1, 4) * random.choice([-1, 1])
+            a = self.rng.randint(1, 3)
+            b1 = self.rng.randint(1, 4) * self.rng.choice([-1, 1])
+            b2 = self.rng.randint(1, 4) * self.rng.choice([-1, 1])
             while b2 == b1:  # Ensure different y coefficients
-                b2 = random.randint(1, 4) * random.choice([-1, 1])
+                b2 = self.rng.randint(1, 4) * self.rng.choice([-1, 1])
 
             c1 = a * x_sol + b1 * y_sol
             c2 = a * x_sol + b2 * y_sol
@@ -174,11 +167,11 @@ class SystemsEliminationGenerator:
             ]
         else:  # eliminate y
             # Same y coefficient
-            a1 = random.randint(1, 4) * random.choice([-1, 1])
-            a2 = random.randint(1, 4) * random.choice([-1, 1])
+            a1 = self.rng.randint(1, 4) * self.rng.choice([-1, 1])
+            a2 = self.rng.randint(1, 4) * self.rng.choice([-1, 1])
             while a2 == a1:
-                a2 = random.randint(1, 4) * random.choice([-1, 1])
-            b = random.randint(1, 3)
+                a2 = self.rng.randint(1, 4) * self.rng.choice([-1, 1])
+            b = self.rng.randint(1, 3)
 
             c1 = a1 * x_sol + b * y_sol
             c2 = a2 * x_sol + b * y_sol
@@ -223,19 +216,19 @@ class SystemsEliminationGenerator:
     def _generate_medium(self) -> EliminationSystemProblem:
         """Generate medium problem (need to multiply one equation)."""
         # Choose solution
-        x_sol = random.randint(-6, 6)
-        y_sol = random.randint(-6, 6)
+        x_sol = self.rng.randint(-6, 6)
+        y_sol = self.rng.randint(-6, 6)
 
-        eliminate_var = random.choice(['x', 'y'])
+        eliminate_var = self.rng.choice(['x', 'y'])
 
         if eliminate_var == 'x':
             # Different x coefficients, one is multiple of other
-            a1 = random.randint(1, 3)
-            mult = random.randint(2, 3)
+            a1 = self.rng.randint(1, 3)
+            mult = self.rng.randint(2, 3)
             a2 = a1 * mult
 
-            b1 = random.randint(1, 5) * random.choice([-1, 1])
-            b2 = random.randint(1, 5) * random.choice([-1, 1])
+            b1 = self.rng.randint(1, 5) * self.rng.choice([-1, 1])
+            b2 = self.rng.randint(1, 5) * self.rng.choice([-1, 1])
 
             c1 = a1 * x_sol + b1 * y_sol
             c2 = a2 * x_sol + b2 * y_sol
@@ -256,11 +249,11 @@ class SystemsEliminationGenerator:
                 f"Substitute back to find $x = {x_sol}$"
             ]
         else:  # eliminate y
-            a1 = random.randint(1, 5) * random.choice([-1, 1])
-            a2 = random.randint(1, 5) * random.choice([-1, 1])
+            a1 = self.rng.randint(1, 5) * self.rng.choice([-1, 1])
+            a2 = self.rng.randint(1, 5) * self.rng.choice([-1, 1])
 
-            b1 = random.randint(1, 3)
-            mult = random.randint(2, 3)
+            b1 = self.rng.randint(1, 3)
+            mult = self.rng.randint(2, 3)
             b2 = b1 * mult
 
             c1 = a1 * x_sol + b1 * y_sol
@@ -303,17 +296,17 @@ class SystemsEliminationGenerator:
     def _generate_hard(self) -> EliminationSystemProblem:
         """Generate hard problem (need to multiply both equations)."""
         # Choose solution (may be fractional)
-        x_sol = Fraction(random.randint(-8, 8), random.randint(1, 2)).limit_denominator()
-        y_sol = Fraction(random.randint(-8, 8), random.randint(1, 2)).limit_denominator()
+        x_sol = Fraction(self.rng.randint(-8, 8), self.rng.randint(1, 2)).limit_denominator()
+        y_sol = Fraction(self.rng.randint(-8, 8), self.rng.randint(1, 2)).limit_denominator()
 
         # Generate coefficients that require multiplying both equations
-        a1 = random.randint(2, 5) * random.choice([-1, 1])
-        a2 = random.randint(3, 6) * random.choice([-1, 1])
+        a1 = self.rng.randint(2, 5) * self.rng.choice([-1, 1])
+        a2 = self.rng.randint(3, 6) * self.rng.choice([-1, 1])
         while self._gcd(abs(a1), abs(a2)) > 1:  # Ensure they need LCM
-            a2 = random.randint(3, 6) * random.choice([-1, 1])
+            a2 = self.rng.randint(3, 6) * self.rng.choice([-1, 1])
 
-        b1 = random.randint(2, 5) * random.choice([-1, 1])
-        b2 = random.randint(3, 6) * random.choice([-1, 1])
+        b1 = self.rng.randint(2, 5) * self.rng.choice([-1, 1])
+        b2 = self.rng.randint(3, 6) * self.rng.choice([-1, 1])
 
         c1 = a1 * x_sol + b1 * y_sol
         c2 = a2 * x_sol + b2 * y_sol
@@ -366,19 +359,19 @@ class SystemsEliminationGenerator:
 
     def _generate_challenge(self) -> EliminationSystemProblem:
         """Generate challenge problem (no solution, infinite solutions, or complex)."""
-        problem_type = random.choice(['no_solution', 'infinite', 'complex_fractions'])
+        problem_type = self.rng.choice(['no_solution', 'infinite', 'complex_fractions'])
 
         if problem_type == 'no_solution':
             # Parallel lines
-            a1 = random.randint(2, 4)
-            b1 = random.randint(2, 4) * random.choice([-1, 1])
-            c1 = random.randint(5, 15)
+            a1 = self.rng.randint(2, 4)
+            b1 = self.rng.randint(2, 4) * self.rng.choice([-1, 1])
+            c1 = self.rng.randint(5, 15)
 
             # Second equation is multiple of first with different constant
-            mult = random.randint(2, 3)
+            mult = self.rng.randint(2, 3)
             a2 = a1 * mult
             b2 = b1 * mult
-            c2 = c1 * mult + random.randint(1, 5) * random.choice([-1, 1])
+            c2 = c1 * mult + self.rng.randint(1, 5) * self.rng.choice([-1, 1])
 
             eq1 = self._format_equation(a1, b1, c1)
             eq2 = self._format_equation(a2, b2, c2)
@@ -413,14 +406,14 @@ class SystemsEliminationGenerator:
 
         elif problem_type == 'infinite':
             # Same line (infinite solutions)
-            a = random.randint(3, 6)
-            b = random.randint(3, 6) * random.choice([-1, 1])
-            c = random.randint(10, 20)
+            a = self.rng.randint(3, 6)
+            b = self.rng.randint(3, 6) * self.rng.choice([-1, 1])
+            c = self.rng.randint(10, 20)
 
             eq1 = self._format_equation(a, b, c)
 
             # Second equation is exact multiple
-            mult = random.randint(2, 3)
+            mult = self.rng.randint(2, 3)
             eq2 = self._format_equation(a*mult, b*mult, c*mult)
 
             work_shown = [
@@ -452,15 +445,15 @@ class SystemsEliminationGenerator:
 
         else:  # complex_fractions
             # Complex system with fractional solution
-            x_sol = Fraction(random.randint(-10, 10), random.randint(3, 6)).limit_denominator()
-            y_sol = Fraction(random.randint(-10, 10), random.randint(3, 6)).limit_denominator()
+            x_sol = Fraction(self.rng.randint(-10, 10), self.rng.randint(3, 6)).limit_denominator()
+            y_sol = Fraction(self.rng.randint(-10, 10), self.rng.randint(3, 6)).limit_denominator()
 
             # Large prime coefficients
             primes = [3, 5, 7, 11]
-            a1 = random.choice(primes) * random.choice([-1, 1])
-            a2 = random.choice([p for p in primes if p != abs(a1)]) * random.choice([-1, 1])
-            b1 = random.choice(primes) * random.choice([-1, 1])
-            b2 = random.choice([p for p in primes if p != abs(b1)]) * random.choice([-1, 1])
+            a1 = self.rng.choice(primes) * self.rng.choice([-1, 1])
+            a2 = self.rng.choice([p for p in primes if p != abs(a1)]) * self.rng.choice([-1, 1])
+            b1 = self.rng.choice(primes) * self.rng.choice([-1, 1])
+            b2 = self.rng.choice([p for p in primes if p != abs(b1)]) * self.rng.choice([-1, 1])
 
             c1 = a1 * x_sol + b1 * y_sol
             c2 = a2 * x_sol + b2 * y_sol
@@ -4,15 +4,9 @@ Chapter 5: Systems of Equations - Using Substitution
 """
 
 import random
-import sys
-from pathlib import Path
 from dataclasses import dataclass
 from fractions import Fraction
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-
 @dataclass
 class SubstitutionSystemProblem:
     """Represents a system of equations to be solved using substitution."""
@@ -38,8 +32,7 @@ class SystemsSubstitutionGenerator:
         Args:
             seed: Random seed for reproducibility
         """
-        if seed is not None:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def _format_equation(self, a, b, c, form="standard"):
         """
@@ -139,11 +132,11 @@ class SystemsSubstitutionGenerator:
     def _generate_easy(self) -> SubstitutionSystemProblem:
         """Generate easy problem (one equation already solved for a variable)."""
         # Choose solution
-        x_sol = random.randint(-5, 5)
-        y_sol = random.randint(-5, 5)
+        x_sol = self.rng.randint(-5, 5)
+        y_sol = self.rng.randint(-5, 5)
 
         # First equation: y = mx + b form (already solved for y)
-        m = random.randint(1, 3) * random.choice([-1, 1])
+        m = self.rng.randint(1, 3) * self.rng.choice([-1, 1])
         b = y_sol - m * x_sol  # Ensure it passes through solution
 
         eq1 = f"y = {m}x + {b}" if b >= 0 else f"y = {m}x - {abs(b)}"
@@ -155,8 +148,8 @@ class SystemsSubstitutionGenerator:
             eq1 = eq1.replace("-1x", "-x")
 
         # Second equation: ax + by = c (standard form)
-        a2 = random.randint(1, 3)
-        b2 = random.randint(1, 3)
+        a2 = self.rng.randint(1, 3)
+        b2 = self.rng.randint(1, 3)
         c2 = a2 * x_sol + b2 * y_sol
 
         eq2 = self._format_equation(a2, b2, c2, "standard")
@@ -192,18 +185,18 @@ class SystemsSubstitutionGenerator:
     def _generate_medium(self) -> SubstitutionSystemProblem:
         """Generate medium problem (need to solve for a variable first)."""
         # Choose solution
-        x_sol = random.randint(-6, 6)
-        y_sol = random.randint(-6, 6)
+        x_sol = self.rng.randint(-6, 6)
+        y_sol = self.rng.randint(-6, 6)
 
         # First equation: ax + y = c (easy to solve for y)
-        a1 = random.randint(1, 4) * random.choice([-1, 1])
+        a1 = self.rng.randint(1, 4) * self.rng.choice([-1, 1])
         c1 = a1 * x_sol + y_sol
 
         eq1 = self._format_equation(a1, 1, c1, "standard")
 
         # Second equation: dx + ey = f
-        d = random.randint(2, 5)
-        e = random.randint(2, 5) * random.choice([-1, 1])
+        d = self.rng.randint(2, 5)
+        e = self.rng.randint(2, 5) * self.rng.choice([-1, 1])
         f = d * x_sol + e * y_sol
 
         eq2 = self._format_equation(d, e, f, "standard")
@@ -247,19 +240,19 @@ class SystemsSubstitutionGenerator:
     def _generate_hard(self) -> SubstitutionSystemProblem:
         """Generate hard problem (fractional coefficients, more complex solving)."""
         # Choose solution with possible fractions
-        x_sol = Fraction(random.randint(-8, 8), random.randint(1, 2)).limit_denominator()
-        y_sol = Fraction(random.randint(-8, 8), random.randint(1, 2)).limit_denominator()
+        x_sol = Fraction(self.rng.randint(-8, 8), self.rng.randint(1, 2)).limit_denominator()
+        y_sol = Fraction(self.rng.randint(-8, 8), self.rng.randint(1, 2)).limit_denominator()
 
         # First equation with fractions
-        a1 = random.randint(2, 6)
-        b1 = random.randint(2, 6) * random.choice([-1, 1])
+        a1 = self.rng.randint(2, 6)
+        b1 = self.rng.randint(2, 6) * self.rng.choice([-1, 1])
         c1 = a1 * x_sol + b1 * y_sol
 
         eq1 = self._format_equation(a1, b1, float(c1), "standard")
 
         # Second equation
-        a2 = random.randint(3, 7) * random.choice([-1, 1])
-        b2 = random.randint(3, 7)
+        a2 = self.rng.randint(3, 7) * self.rng.choice([-1, 1])
+        b2 = self.rng.randint(3, 7)
         c2 = a2 * x_sol + b2 * y_sol
 
         eq2 = self._format_equation(a2, b2, float(c2), "standard")
@@ -298,13 +291,13 @@ class SystemsSubstitutionGenerator:
 
     def _generate_challenge(self) -> SubstitutionSystemProblem:
         """Generate challenge problem (no solution, infinite solutions, or complex fractions)."""
-        problem_type = random.choice(['no_solution', 'infinite', 'complex'])
+        problem_type = self.rng.choice(['no_solution', 'infinite', 'complex'])
 
         if problem_type == 'no_solution':
             # Parallel lines (no solution)
-            m = random.randint(2, 4)
-            b1 = random.randint(-5, 5)
-            b2 = b1 + random.randint(1, 5) * random.choice([-1, 1])
+            m = self.rng.randint(2, 4)
+            b1 = self.rng.randint(-5, 5)
+            b2 = b1 + self.rng.randint(1, 5) * self.rng.choice([-1, 1])
 
             eq1 = f"y = {m}x + {b1}" if b1 >= 0 else f"y = {m}x - {abs(b1)}"
             eq2 = f"y = {m}x + {b2}" if b2 >= 0 else f"y = {m}x - {abs(b2)}"
@@ -335,13 +328,13 @@ class SystemsSubstitutionGenerator:
 
         elif problem_type == 'infinite':
             # Same line (infinite solutions)
-            a = random.randint(2, 5)
-            b = random.randint(2, 5) * random.choice([-1, 1])
-            c = random.randint(5, 15)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(2, 5) * self.rng.choice([-1, 1])
+            c = self.rng.randint(5, 15)
 
             eq1 = self._format_equation(a, b, c, "standard")
             # Second equation is a multiple of the first
-            mult = random.randint(2, 3)
+            mult = self.rng.randint(2, 3)
             eq2 = self._format_equation(a * mult, b * mult, c * mult, "standard")
 
             work_shown = [
@@ -370,16 +363,16 @@ class SystemsSubstitutionGenerator:
 
         else:  # complex fractions
             # Solution with complex fractions
-            x_sol = Fraction(random.randint(-10, 10), random.randint(3, 5)).limit_denominator()
-            y_sol = Fraction(random.randint(-10, 10), random.randint(3, 5)).limit_denominator()
+            x_sol = Fraction(self.rng.randint(-10, 10), self.rng.randint(3, 5)).limit_denominator()
+            y_sol = Fraction(self.rng.randint(-10, 10), self.rng.randint(3, 5)).limit_denominator()
 
             # Equations with larger coefficients
-            a1 = random.randint(5, 9)
-            b1 = random.randint(5, 9) * random.choice([-1, 1])
+            a1 = self.rng.randint(5, 9)
+            b1 = self.rng.randint(5, 9) * self.rng.choice([-1, 1])
             c1 = a1 * x_sol + b1 * y_sol
 
-            a2 = random.randint(4, 8) * random.choice([-1, 1])
-            b2 = random.randint(4, 8)
+            a2 = self.rng.randint(4, 8) * self.rng.choice([-1, 1])
+            b2 = self.rng.randint(4, 8)
             c2 = a2 * x_sol + b2 * y_sol
 
             eq1 = self._format_equation(a1, b1, float(c1), "standard")
@@ -4,16 +4,10 @@ Chapter 6: Functions - Domain and Range
 """
 
 import random
-import sys
-from pathlib import Path
 from dataclasses import dataclass
 from fractions import Fraction
 import math
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-
 @dataclass
 class DomainRangeProblem:
     """Represents a domain and range problem."""
@@ -40,8 +34,7 @@ class DomainRangeGenerator:
         Args:
             seed: Random seed for reproducibility
         """
-        if seed is not None:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def _format_interval(self, start, end, start_inclusive=True, end_inclusive=True):
         """Format an interval in proper notation."""
@@ -92,12 +85,12 @@ class DomainRangeGenerator:
 
     def _generate_easy(self) -> DomainRangeProblem:
         """Generate easy problem (linear functions, simple quadratics)."""
-        problem_type = random.choice(['linear', 'quadratic', 'constant'])
+        problem_type = self.rng.choice(['linear', 'quadratic', 'constant'])
 
         if problem_type == 'linear':
             # Linear function f(x) = mx + b
-            m = random.randint(1, 5) * random.choice([-1, 1])
-            b = random.randint(-10, 10)
+            m = self.rng.randint(1, 5) * self.rng.choice([-1, 1])
+            b = self.rng.randint(-10, 10)
 
             if m > 0:
                 function = f"f(x) = {m}x + {b}" if b >= 0 else f"f(x) = {m}x - {abs(b)}"
@@ -142,7 +135,7 @@ class DomainRangeGenerator:
 
         else:  # constant
             # Constant function
-            c = random.randint(-10, 10)
+            c = self.rng.randint(-10, 10)
             function = f"f(x) = {c}"
             domain = "all real numbers"
             range = f"\\{{{c}\\}}"
@@ -177,11 +170,11 @@ class DomainRangeGenerator:
 
     def _generate_medium(self) -> DomainRangeProblem:
         """Generate medium problem (square roots, simple rational functions)."""
-        problem_type = random.choice(['square_root', 'simple_rational', 'absolute_value'])
+        problem_type = self.rng.choice(['square_root', 'simple_rational', 'absolute_value'])
 
         if problem_type == 'square_root':
             # Square root function f(x) = √(x + a)
-            a = random.randint(-5, 5)
+            a = self.rng.randint(-5, 5)
             if a >= 0:
                 function = f"f(x) = \\sqrt{{x + {a}}}"
             else:
@@ -205,7 +198,7 @@ class DomainRangeGenerator:
 
         elif problem_type == 'simple_rational':
             # Rational function f(x) = 1/(x - a)
-            a = random.randint(-5, 5)
+            a = self.rng.randint(-5, 5)
             if a >= 0:
                 function = f"f(x) = \\frac{{1}}{{x - {a}}}" if a != 0 else "f(x) = \\frac{1}{x}"
             else:
@@ -228,8 +221,8 @@ class DomainRangeGenerator:
 
         else:  # absolute_value
             # Absolute value function f(x) = |x - a| + b
-            a = random.randint(-3, 3)
-            b = random.randint(-5, 5)
+            a = self.rng.randint(-3, 3)
+            b = self.rng.randint(-5, 5)
 
             if a == 0 and b == 0:
                 function = "f(x) = |x|"
@@ -276,18 +269,18 @@ class DomainRangeGenerator:
 
     def _generate_hard(self) -> DomainRangeProblem:
         """Generate hard problem (complex rational, composite functions, from table/graph)."""
-        problem_type = random.choice(['complex_rational', 'quadratic_transformed', 'from_table'])
+        problem_type = self.rng.choice(['complex_rational', 'quadratic_transformed', 'from_table'])
 
         if problem_type == 'complex_rational':
             # Rational function f(x) = (ax + b)/(cx + d)
-            a = random.randint(1, 3)
-            b = random.randint(-5, 5)
-            c = random.randint(1, 2)
-            d = random.randint(-5, 5)
+            a = self.rng.randint(1, 3)
+            b = self.rng.randint(-5, 5)
+            c = self.rng.randint(1, 2)
+            d = self.rng.randint(-5, 5)
 
             # Ensure not a constant function
             while a * d == b * c:
-                d = random.randint(-5, 5)
+                d = self.rng.randint(-5, 5)
 
             numerator = f"{a}x + {b}" if b >= 0 else f"{a}x - {abs(b)}"
             denominator = f"{c}x + {d}" if d >= 0 else f"{c}x - {abs(d)}"
@@ -319,9 +312,9 @@ class DomainRangeGenerator:
 
         elif problem_type == 'quadratic_transformed':
             # Transformed quadratic f(x) = a(x - h)² + k
-            a = random.choice([-2, -1, 1, 2])
-            h = random.randint(-3, 3)
-            k = random.randint(-5, 5)
+            a = self.rng.choice([-2, -1, 1, 2])
+            h = self.rng.randint(-3, 3)
+            k = self.rng.randint(-5, 5)
 
             x_part = f"(x - {h})" if h > 0 else f"(x + {abs(h)})" if h < 0 else "x"
             function = f"f(x) = {a}{x_part}^2 + {k}" if k >= 0 else f"f(x) = {a}{x_part}^2 - {abs(k)}"
@@ -352,8 +345,8 @@ class DomainRangeGenerator:
 
         else:  # from_table
             # Function from a table
-            x_values = sorted(random.sample(range(-5, 6), 5))
-            y_values = [random.randint(-8, 8) for _ in range(5)]
+            x_values = sorted(self.rng.sample(range(-5, 6), 5))
+            y_values = [self.rng.randint(-8, 8) for _ in range(5)]
 
             # Make it a function (no repeated x-values)
             table_str = "\\begin{array}{|c|c|}\\hline x & f(x) \\\\ \\hline "
@@ -395,17 +388,17 @@ class DomainRangeGenerator:
 
     def _generate_challenge(self) -> DomainRangeProblem:
         """Generate challenge problem (piecewise, composite, logarithmic)."""
-        problem_type = random.choice(['piecewise', 'composite_root', 'exponential'])
+        problem_type = self.rng.choice(['piecewise', 'composite_root', 'exponential'])
 
         if problem_type == 'piecewise':
             # Piecewise function
             # First piece: linear for x < a
-            a = random.randint(-2, 2)
-            m1 = random.randint(1, 3)
-            b1 = random.randint(-3, 3)
+            a = self.rng.randint(-2, 2)
+            m1 = self.rng.randint(1, 3)
+            b1 = self.rng.randint(-3, 3)
 
             # Second piece: quadratic for x ≥ a
-            c = random.randint(-2, 2)
+            c = self.rng.randint(-2, 2)
 
             piece1 = f"{m1}x + {b1}" if b1 >= 0 else f"{m1}x - {abs(b1)}"
             piece2 = f"x^2 + {c}" if c >= 0 else f"x^2 - {abs(c)}"
@@ -460,7 +453,7 @@ class DomainRangeGenerator:
 
         else:  # exponential
             # Exponential function f(x) = 2^x - a
-            a = random.randint(1, 5)
+            a = self.rng.randint(1, 5)
             function = f"f(x) = 2^x - {a}"
             domain = "all real numbers"
             domain_latex = "(-\\infty, \\infty)"
@@ -4,15 +4,9 @@ Chapter 6: Functions - Function Notation and Evaluation
 """
 
 import random
-import sys
-from pathlib import Path
 from dataclasses import dataclass
 from fractions import Fraction
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-
 @dataclass
 class FunctionsProblem:
     """Represents a functions problem."""
@@ -34,15 +28,14 @@ class FunctionsGenerator:
         Args:
             seed: Random seed for reproducibility
         """
-        if seed is not None:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def _generate_function(self, difficulty):
         """Generate a function based on difficulty level."""
         if difficulty == 'easy':
             # Linear functions
-            a = random.randint(1, 5) * random.choice([-1, 1])
-            b = random.randint(-10, 10)
+            a = self.rng.randint(1, 5) * self.rng.choice([-1, 1])
+            b = self.rng.randint(-10, 10)
             if b >= 0:
                 return f"{a}x + {b}", lambda x: a * x + b
             else:
@@ -50,11 +43,11 @@ class FunctionsGenerator:
 
         elif difficulty == 'medium':
             # Quadratic or more complex linear
-            func_type = random.choice(['quadratic', 'complex_linear'])
+            func_type = self.rng.choice(['quadratic', 'complex_linear'])
             if func_type == 'quadratic':
-                a = random.randint(1, 3) * random.choice([-1, 1])
-                b = random.randint(-5, 5)
-                c = random.randint(-10, 10)
+                a = self.rng.randint(1, 3) * self.rng.choice([-1, 1])
+                b = self.rng.randint(-5, 5)
+                c = self.rng.randint(-10, 10)
 
                 func_str = f"{a}x^2"
                 if b > 0:
@@ -70,9 +63,9 @@ class FunctionsGenerator:
                 return func_str, lambda x: a * x**2 + b * x + c
             else:
                 # Complex linear with fractions
-                num = random.randint(1, 5) * random.choice([-1, 1])
-                den = random.randint(2, 4)
-                b = random.randint(-10, 10)
+                num = self.rng.randint(1, 5) * self.rng.choice([-1, 1])
+                den = self.rng.randint(2, 4)
+                b = self.rng.randint(-10, 10)
 
                 if b >= 0:
                     return f"\\frac{{{num}x}}{{{den}}} + {b}", lambda x: (num * x) / den + b
@@ -81,11 +74,11 @@ class FunctionsGenerator:
 
         elif difficulty == 'hard':
             # Cubic or rational
-            func_type = random.choice(['cubic', 'rational'])
+            func_type = self.rng.choice(['cubic', 'rational'])
             if func_type == 'cubic':
-                a = random.randint(1, 2) * random.choice([-1, 1])
-                b = random.randint(-3, 3)
-                c = random.randint(-5, 5)
+                a = self.rng.randint(1, 2) * self.rng.choice([-1, 1])
+                b = self.rng.randint(-3, 3)
+                c = self.rng.randint(-5, 5)
 
                 func_str = f"{a}x^3"
                 if b != 0:
@@ -101,24 +94,24 @@ class FunctionsGenerator:
                 return func_str, lambda x: a * x**3 + b * x + c
             else:
                 # Simple rational
-                a = random.randint(1, 5)
-                b = random.randint(1, 3)
+                a = self.rng.randint(1, 5)
+                b = self.rng.randint(1, 3)
                 return f"\\frac{{{a}}}{{x + {b}}}", lambda x: a / (x + b) if x != -b else None
 
         else:  # challenge
             # Composite or piecewise
-            func_type = random.choice(['composite', 'absolute'])
+            func_type = self.rng.choice(['composite', 'absolute'])
             if func_type == 'absolute':
-                a = random.randint(1, 3) * random.choice([-1, 1])
-                b = random.randint(-5, 5)
+                a = self.rng.randint(1, 3) * self.rng.choice([-1, 1])
+                b = self.rng.randint(-5, 5)
                 if b >= 0:
                     return f"|{a}x + {b}|", lambda x: abs(a * x + b)
                 else:
                     return f"|{a}x - {abs(b)}|", lambda x: abs(a * x + b)
             else:
                 # Square root
-                a = random.randint(1, 4)
-                b = random.randint(0, 5)
+                a = self.rng.randint(1, 4)
+                b = self.rng.randint(0, 5)
                 return f"\\sqrt{{{a}x + {b}}}", lambda x: (a * x + b) ** 0.5 if a * x + b >= 0 else None
 
     def generate_problem(self, difficulty: str) -> FunctionsProblem:
@@ -142,13 +135,13 @@ class FunctionsGenerator:
 
     def _generate_easy(self) -> FunctionsProblem:
         """Generate easy problem (evaluate simple linear functions)."""
-        problem_type = random.choice(['evaluate', 'notation'])
+        problem_type = self.rng.choice(['evaluate', 'notation'])
 
         if problem_type == 'evaluate':
             # Evaluate f(a) for a linear function
             func_str, func = self._generate_function('easy')
-            func_name = random.choice(['f', 'g', 'h'])
-            x_val = random.randint(-5, 5)
+            func_name = self.rng.choice(['f', 'g', 'h'])
+            x_val = self.rng.randint(-5, 5)
             result = func(x_val)
 
             function_notation = f"{func_name}(x) = {func_str}"
@@ -165,7 +158,7 @@ class FunctionsGenerator:
         else:  # notation
             # Understanding function notation
             func_str, func = self._generate_function('easy')
-            func_name = random.choice(['f', 'g', 'h'])
+            func_name = self.rng.choice(['f', 'g', 'h'])
 
             function_notation = f"{func_name}(x) = {func_str}"
             problem_latex = f"Express the equation $y = {func_str}$ using function notation with ${func_name}$"
@@ -189,12 +182,12 @@ class FunctionsGenerator:
 
     def _generate_medium(self) -> FunctionsProblem:
         """Generate medium problem (quadratic functions, multiple evaluations)."""
-        problem_type = random.choice(['evaluate_quadratic', 'multiple_values', 'find_input'])
+        problem_type = self.rng.choice(['evaluate_quadratic', 'multiple_values', 'find_input'])
 
         if problem_type == 'evaluate_quadratic':
             func_str, func = self._generate_function('medium')
-            func_name = random.choice(['f', 'g', 'h'])
-            x_val = random.randint(-3, 3)
+            func_name = self.rng.choice(['f', 'g', 'h'])
+            x_val = self.rng.randint(-3, 3)
             result = func(x_val)
 
             function_notation = f"{func_name}(x) = {func_str}"
@@ -218,8 +211,8 @@ class FunctionsGenerator:
         elif problem_type == 'multiple_values':
             # Evaluate function at multiple points
             func_str, func = self._generate_function('easy')
-            func_name = random.choice(['f', 'g'])
-            x_vals = random.sample(range(-5, 6), 3)
+            func_name = self.rng.choice(['f', 'g'])
+            x_vals = self.rng.sample(range(-5, 6), 3)
             results = [func(x) for x in x_vals]
 
             function_notation = f"{func_name}(x) = {func_str}"
@@ -235,14 +228,14 @@ class FunctionsGenerator:
 
         else:  # find_input
             # Given f(x) = y, find x
-            a = random.randint(2, 5)
-            b = random.randint(-5, 5)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(-5, 5)
             func_str = f"{a}x + {b}" if b >= 0 else f"{a}x - {abs(b)}"
             func = lambda x: a * x + b
-            func_name = random.choice(['f', 'g', 'h'])
+            func_name = self.rng.choice(['f', 'g', 'h'])
 
             # Choose y value that gives integer x
-            y_val = random.choice([v for v in range(-10, 11) if (v - b) % a == 0])
+            y_val = self.rng.choice([v for v in range(-10, 11) if (v - b) % a == 0])
             x_val = (y_val - b) // a
 
             function_notation = f"{func_name}(x) = {func_str}"
@@ -268,14 +261,14 @@ class FunctionsGenerator:
 
     def _generate_hard(self) -> FunctionsProblem:
         """Generate hard problem (composition, inverse thinking)."""
-        problem_type = random.choice(['composition', 'equation_vs_function', 'table'])
+        problem_type = self.rng.choice(['composition', 'equation_vs_function', 'table'])
 
         if problem_type == 'composition':
             # f(g(x)) or g(f(x))
-            f_str = f"{random.randint(2, 4)}x + {random.randint(-3, 3)}"
-            g_str = f"{random.randint(1, 3)}x - {random.randint(1, 5)}"
+            f_str = f"{self.rng.randint(2, 4)}x + {self.rng.randint(-3, 3)}"
+            g_str = f"{self.rng.randint(1, 3)}x - {self.rng.randint(1, 5)}"
 
-            x_val = random.randint(-3, 3)
+            x_val = self.rng.randint(-3, 3)
 
             # Calculate f(g(x))
             g_result = eval(g_str.replace('x', str(x_val)))
@@ -303,7 +296,7 @@ class FunctionsGenerator:
                 ("y = |x|", True, "Each x-value has exactly one y-value")
             ]
 
-            equation, is_function, reason = random.choice(examples)
+            equation, is_function, reason = self.rng.choice(examples)
 
             function_notation = equation
             problem_latex = f"Determine if the equation ${equation}$ represents a function. Explain why or why not."
@@ -318,13 +311,13 @@ class FunctionsGenerator:
 
         else:  # table
             # Function from a table
-            x_values = sorted(random.sample(range(-5, 6), 4))
-            a = random.randint(2, 4)
-            b = random.randint(-5, 5)
+            x_values = sorted(self.rng.sample(range(-5, 6), 4))
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(-5, 5)
             y_values = [a * x + b for x in x_values]
 
-            func_name = random.choice(['f', 'g', 'h'])
-            test_x = random.choice([x for x in range(-5, 6) if x not in x_values])
+            func_name = self.rng.choice(['f', 'g', 'h'])
+            test_x = self.rng.choice([x for x in range(-5, 6) if x not in x_values])
             test_y = a * test_x + b
 
             table_str = "\\begin{array}{|c|c|}\\hline x & " + func_name + "(x) \\\\ \\hline "
@@ -355,17 +348,17 @@ class FunctionsGenerator:
 
     def _generate_challenge(self) -> FunctionsProblem:
         """Generate challenge problem (piecewise, domain restrictions, inverses)."""
-        problem_type = random.choice(['piecewise', 'domain_restriction', 'inverse'])
+        problem_type = self.rng.choice(['piecewise', 'domain_restriction', 'inverse'])
 
         if problem_type == 'piecewise':
             # Piecewise function
-            a1 = random.randint(1, 3)
-            b1 = random.randint(-3, 3)
-            a2 = random.randint(-3, -1)
-            b2 = random.randint(-3, 3)
-            split = random.randint(-2, 2)
+            a1 = self.rng.randint(1, 3)
+            b1 = self.rng.randint(-3, 3)
+            a2 = self.rng.randint(-3, -1)
+            b2 = self.rng.randint(-3, 3)
+            split = self.rng.randint(-2, 2)
 
-            func_name = random.choice(['f', 'g', 'h'])
+            func_name = self.rng.choice(['f', 'g', 'h'])
             test_vals = [split - 2, split, split + 2]
 
             results = []
@@ -387,9 +380,9 @@ class FunctionsGenerator:
 
         elif problem_type == 'domain_restriction':
             # Function with domain restriction
-            a = random.randint(1, 5)
-            b = random.randint(1, 4)
-            func_name = random.choice(['f', 'g', 'h'])
+            a = self.rng.randint(1, 5)
+            b = self.rng.randint(1, 4)
+            func_name = self.rng.choice(['f', 'g', 'h'])
 
             function_notation = f"{func_name}(x) = \\frac{{{a}}}{{x - {b}}}"
             test_x = b  # Test at the restriction
@@ -407,12 +400,12 @@ class FunctionsGenerator:
 
         else:  # inverse
             # Find inverse function value
-            a = random.choice([2, 3, 4, 5])
-            b = random.randint(-5, 5)
+            a = self.rng.choice([2, 3, 4, 5])
+            b = self.rng.randint(-5, 5)
             func_str = f"{a}x + {b}" if b >= 0 else f"{a}x - {abs(b)}"
-            func_name = random.choice(['f', 'g'])
+            func_name = self.rng.choice(['f', 'g'])
 
-            y_val = random.choice([v for v in range(-10, 11) if (v - b) % a == 0])
+            y_val = self.rng.choice([v for v in range(-10, 11) if (v - b) % a == 0])
             x_val = (y_val - b) // a
 
             function_notation = f"{func_name}(x) = {func_str}"
@@ -5,9 +5,6 @@ Reviews inputs/outputs in the context of functions
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class InputsOutputsFunctionsReviewGenerator:
     """Generates review problems connecting inputs/outputs to functions."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,9 +33,9 @@ class InputsOutputsFunctionsReviewGenerator:
 
     def _generate_easy(self) -> Equation:
         """Easy: Identify function notation from input/output"""
-        a = random.randint(2, 5)
-        b = random.randint(1, 10)
-        x_val = random.randint(1, 8)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 10)
+        x_val = self.rng.randint(1, 8)
         fx_val = a * x_val + b
 
         latex = f"\\text{{Function: }} f(x) = {a}x + {b}. \\text{{Find }} f({x_val})"
@@ -55,10 +51,10 @@ class InputsOutputsFunctionsReviewGenerator:
 
     def _generate_medium(self) -> Equation:
         """Medium: Connect input/output table to function"""
-        a = random.randint(2, 4)
-        b = random.randint(-5, 10)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(-5, 10)
         
-        x_vals = random.sample(range(1, 10), 3)
+        x_vals = self.rng.sample(range(1, 10), 3)
         y_vals = [a * x + b for x in x_vals]
 
         latex = f"\\text{{Table shows inputs }} x \\text{{ and outputs }} y. "
@@ -75,9 +71,9 @@ class InputsOutputsFunctionsReviewGenerator:
 
     def _generate_hard(self) -> Equation:
         """Hard: Given function, find input for specific output"""
-        a = random.randint(2, 5)
-        b = random.randint(1, 10)
-        fx_val = random.randint(20, 50)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 10)
+        fx_val = self.rng.randint(20, 50)
         
         x_val = (fx_val - b) // a
 
@@ -94,11 +90,11 @@ class InputsOutputsFunctionsReviewGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Challenge: Composite functions or inverse thinking"""
-        a = random.randint(2, 4)
-        b = random.randint(1, 8)
-        c = random.randint(2, 3)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(1, 8)
+        c = self.rng.randint(2, 3)
         
-        x_val = random.randint(2, 6)
+        x_val = self.rng.randint(2, 6)
         
         # f(g(x)) where g(x) = cx and f(x) = ax + b
         gx_val = c * x_val
@@ -23,8 +23,7 @@ class RadicalPropertiesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the radical properties generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[RadicalPropertyProblem]:
         """
@@ -73,12 +72,12 @@ class RadicalPropertiesGenerator:
 
     def _generate_easy(self) -> RadicalPropertyProblem:
         """Generate easy radical property problems (simple multiplication, basic simplification)."""
-        problem_type = random.choice(['multiply_radicals', 'simplify_radical', 'square_root_of_square'])
+        problem_type = self.rng.choice(['multiply_radicals', 'simplify_radical', 'square_root_of_square'])
 
         if problem_type == 'multiply_radicals':
             # √a · √b = √(ab)
-            a = random.choice([2, 3, 5, 7])
-            b = random.choice([2, 3, 5, 7])
+            a = self.rng.choice([2, 3, 5, 7])
+            b = self.rng.choice([2, 3, 5, 7])
             product = a * b
             latex = f"\\sqrt{{{a}}} \\cdot \\sqrt{{{b}}}"
 
@@ -93,8 +92,8 @@ class RadicalPropertiesGenerator:
 
         elif problem_type == 'simplify_radical':
             # Simplify √(perfect square * prime)
-            perfect = random.choice([4, 9, 16, 25])
-            prime = random.choice([2, 3, 5, 7])
+            perfect = self.rng.choice([4, 9, 16, 25])
+            prime = self.rng.choice([2, 3, 5, 7])
             n = perfect * prime
             latex = f"\\text{{Simplify: }} \\sqrt{{{n}}}"
             sqrt_perfect = int(math.sqrt(perfect))
@@ -102,7 +101,7 @@ class RadicalPropertiesGenerator:
 
         else:  # square_root_of_square
             # √(x²) = |x| (we'll assume x > 0 for simplicity)
-            base = random.choice(['x', 'y', 'a', 'b'])
+            base = self.rng.choice(['x', 'y', 'a', 'b'])
             latex = f"\\text{{Simplify (assume {base} > 0): }} \\sqrt{{{base}^2}}"
             solution = base
 
@@ -115,14 +114,14 @@ class RadicalPropertiesGenerator:
 
     def _generate_medium(self) -> RadicalPropertyProblem:
         """Generate medium radical property problems (multiplication with coefficients, fractions)."""
-        problem_type = random.choice(['multiply_with_coeff', 'radical_fraction', 'add_like_radicals'])
+        problem_type = self.rng.choice(['multiply_with_coeff', 'radical_fraction', 'add_like_radicals'])
 
         if problem_type == 'multiply_with_coeff':
             # 2√3 · 3√2
-            coeff1 = random.randint(2, 5)
-            coeff2 = random.randint(2, 5)
-            rad1 = random.choice([2, 3, 5, 6])
-            rad2 = random.choice([2, 3, 5, 6])
+            coeff1 = self.rng.randint(2, 5)
+            coeff2 = self.rng.randint(2, 5)
+            rad1 = self.rng.choice([2, 3, 5, 6])
+            rad2 = self.rng.choice([2, 3, 5, 6])
             latex = f"{coeff1}\\sqrt{{{rad1}}} \\cdot {coeff2}\\sqrt{{{rad2}}}"
 
             total_coeff = coeff1 * coeff2
@@ -137,8 +136,8 @@ class RadicalPropertiesGenerator:
 
         elif problem_type == 'radical_fraction':
             # √(a/b) = √a/√b
-            numerator = random.choice([4, 9, 16, 25, 36])
-            denominator = random.choice([4, 9, 16, 25])
+            numerator = self.rng.choice([4, 9, 16, 25, 36])
+            denominator = self.rng.choice([4, 9, 16, 25])
             latex = f"\\sqrt{{\\frac{{{numerator}}}{{{denominator}}}}}"
             sqrt_num = int(math.sqrt(numerator)) if math.sqrt(numerator).is_integer() else f"\\sqrt{{{numerator}}}"
             sqrt_den = int(math.sqrt(denominator))
@@ -152,9 +151,9 @@ class RadicalPropertiesGenerator:
 
         else:  # add_like_radicals
             # 2√3 + 3√3 = 5√3
-            rad = random.choice([2, 3, 5, 7])
-            coeff1 = random.randint(2, 5)
-            coeff2 = random.randint(2, 5)
+            rad = self.rng.choice([2, 3, 5, 7])
+            coeff1 = self.rng.randint(2, 5)
+            coeff2 = self.rng.randint(2, 5)
             latex = f"{coeff1}\\sqrt{{{rad}}} + {coeff2}\\sqrt{{{rad}}}"
             solution = f"{coeff1 + coeff2}\\sqrt{{{rad}}}"
 
@@ -167,18 +166,18 @@ class RadicalPropertiesGenerator:
 
     def _generate_hard(self) -> RadicalPropertyProblem:
         """Generate hard radical property problems (complex expressions, rationalizing denominators)."""
-        problem_type = random.choice(['rationalize_denominator', 'complex_multiplication', 'nested_radicals'])
+        problem_type = self.rng.choice(['rationalize_denominator', 'complex_multiplication', 'nested_radicals'])
 
         if problem_type == 'rationalize_denominator':
             # 1/√a = √a/a
-            a = random.choice([2, 3, 5, 7])
+            a = self.rng.choice([2, 3, 5, 7])
             latex = f"\\text{{Rationalize: }} \\frac{{1}}{{\\sqrt{{{a}}}}}"
             solution = f"\\frac{{\\sqrt{{{a}}}}}{{{a}}}"
 
         elif problem_type == 'complex_multiplication':
             # (√a + √b)(√a - √b) = a - b
-            a = random.choice([5, 7, 8, 12])
-            b = random.choice([2, 3, 5])
+            a = self.rng.choice([5, 7, 8, 12])
+            b = self.rng.choice([2, 3, 5])
             if a == b:
                 a += 2
             latex = f"(\\sqrt{{{a}}} + \\sqrt{{{b}}})(\\sqrt{{{a}}} - \\sqrt{{{b}}})"
@@ -186,7 +185,7 @@ class RadicalPropertiesGenerator:
 
         else:  # nested_radicals
             # Simplify √(4x²y⁴)
-            coeff = random.choice([4, 9, 16])
+            coeff = self.rng.choice([4, 9, 16])
             sqrt_coeff = int(math.sqrt(coeff))
             latex = f"\\text{{Simplify (assume x, y > 0): }} \\sqrt{{{coeff}x^2y^4}}"
             solution = f"{sqrt_coeff}xy^2"
@@ -200,12 +199,12 @@ class RadicalPropertiesGenerator:
 
     def _generate_challenge(self) -> RadicalPropertyProblem:
         """Generate challenge radical property problems (cube roots, complex rationalizations)."""
-        problem_type = random.choice(['cube_root', 'complex_rationalize', 'radical_equation'])
+        problem_type = self.rng.choice(['cube_root', 'complex_rationalize', 'radical_equation'])
 
         if problem_type == 'cube_root':
             # ∛8 · ∛27 = ∛(8·27) = 6
-            a = random.choice([8, 27, 64, 125])
-            b = random.choice([8, 27, 64])
+            a = self.rng.choice([8, 27, 64, 125])
+            b = self.rng.choice([8, 27, 64])
             cube_root_a = int(round(a ** (1/3)))
             cube_root_b = int(round(b ** (1/3)))
             latex = f"\\sqrt[3]{{{a}}} \\cdot \\sqrt[3]{{{b}}}"
@@ -213,9 +212,9 @@ class RadicalPropertiesGenerator:
 
         elif problem_type == 'complex_rationalize':
             # Rationalize 2/(3 + √5)
-            a = random.randint(2, 4)
-            b = random.randint(2, 5)
-            rad = random.choice([2, 3, 5, 7])
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(2, 5)
+            rad = self.rng.choice([2, 3, 5, 7])
             latex = f"\\text{{Rationalize: }} \\frac{{{a}}}{{{b} + \\sqrt{{{rad}}}}}"
             # Multiply by conjugate
             denom = b**2 - rad
@@ -226,9 +225,9 @@ class RadicalPropertiesGenerator:
 
         else:  # radical_equation
             # Simplify complex radical expression
-            a = random.choice([2, 3, 5])
-            b = random.choice([8, 12, 18, 20])
-            c = random.choice([2, 3, 5])
+            a = self.rng.choice([2, 3, 5])
+            b = self.rng.choice([8, 12, 18, 20])
+            c = self.rng.choice([2, 3, 5])
             coeff_b, rad_b = self._simplify_radical(b)
             latex = f"\\sqrt{{{a}}} \\cdot \\sqrt{{{b}}} + {c}\\sqrt{{{rad_b}}}"
 
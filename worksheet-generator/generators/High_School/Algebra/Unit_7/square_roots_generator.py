@@ -5,9 +5,6 @@ Generates problems about evaluating square root expressions
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class SquareRootsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the square roots generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -51,7 +47,7 @@ class SquareRootsGenerator:
         """Generate perfect square roots: √a where a is a perfect square"""
         # Perfect squares from 1 to 144
         perfect_squares = [1, 4, 9, 16, 25, 36, 49, 64, 81, 100, 121, 144]
-        value = random.choice(perfect_squares)
+        value = self.rng.choice(perfect_squares)
 
         latex = f"\\sqrt{{{value}}}"
         solution = int(value ** 0.5)
@@ -62,8 +58,8 @@ class SquareRootsGenerator:
         """Generate square root with multiplication: √a × √b"""
         # Use smaller perfect squares
         perfect_squares = [4, 9, 16, 25, 36, 49]
-        a = random.choice(perfect_squares)
-        b = random.choice(perfect_squares)
+        a = self.rng.choice(perfect_squares)
+        b = self.rng.choice(perfect_squares)
 
         latex = f"\\sqrt{{{a}}} \\times \\sqrt{{{b}}}"
         solution = int((a * b) ** 0.5)
@@ -74,7 +70,7 @@ class SquareRootsGenerator:
         """Generate square root of a product: √(a × b)"""
         # Use values that multiply to a perfect square
         perfect_squares = [4, 9, 16, 25, 36, 49, 64, 81, 100]
-        product = random.choice(perfect_squares)
+        product = self.rng.choice(perfect_squares)
 
         # Find two factors
         factors = []
@@ -83,7 +79,7 @@ class SquareRootsGenerator:
                 factors.append((i, product // i))
 
         if factors:
-            a, b = random.choice(factors)
+            a, b = self.rng.choice(factors)
         else:
             a, b = 1, product
 
@@ -94,19 +90,19 @@ class SquareRootsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate nested square roots: √(√a)² or √(a² + b²) where result is integer"""
-        choice = random.choice(['nested', 'pythagorean'])
+        choice = self.rng.choice(['nested', 'pythagorean'])
 
         if choice == 'nested':
             # √(√a)² = √a
             perfect_squares = [4, 9, 16, 25, 36, 49]
-            value = random.choice(perfect_squares)
+            value = self.rng.choice(perfect_squares)
 
             latex = f"\\sqrt{{(\\sqrt{{{value}}})^2}}"
             solution = int(value ** 0.5)
         else:
             # Pythagorean triples
             triples = [(3, 4, 5), (5, 12, 13), (8, 15, 17), (7, 24, 25)]
-            a, b, c = random.choice(triples)
+            a, b, c = self.rng.choice(triples)
 
             latex = f"\\sqrt{{{a}^2 + {b}^2}}"
             solution = c
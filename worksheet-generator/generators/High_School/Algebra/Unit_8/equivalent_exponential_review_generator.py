@@ -5,9 +5,6 @@ Reviews concepts of equivalent exponential expressions
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class EquivalentExponentialReviewGenerator:
     """Generates review problems about equivalent exponential expressions."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,18 +33,18 @@ class EquivalentExponentialReviewGenerator:
 
     def _generate_easy(self) -> Equation:
         """Easy: Are two simple expressions equivalent?"""
-        base = random.randint(2, 5)
-        exp1 = random.randint(2, 4)
-        exp2 = random.randint(2, 4)
+        base = self.rng.randint(2, 5)
+        exp1 = self.rng.randint(2, 4)
+        exp2 = self.rng.randint(2, 4)
         
         # Sometimes they're equal, sometimes not
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             exp2 = exp1
             latex = f"\\text{{Are }} {base}^{{{exp1}}} \\text{{ and }} {base}^{{{exp2}}} \\text{{ equivalent?}}"
             solution = "Yes"
         else:
             while exp2 == exp1:
-                exp2 = random.randint(2, 4)
+                exp2 = self.rng.randint(2, 4)
             latex = f"\\text{{Are }} {base}^{{{exp1}}} \\text{{ and }} {base}^{{{exp2}}} \\text{{ equivalent?}}"
             solution = "No"
 
@@ -62,11 +58,11 @@ class EquivalentExponentialReviewGenerator:
 
     def _generate_medium(self) -> Equation:
         """Medium: Simplify using exponent rules"""
-        base = random.randint(2, 4)
-        exp1 = random.randint(2, 4)
-        exp2 = random.randint(2, 4)
+        base = self.rng.randint(2, 4)
+        exp1 = self.rng.randint(2, 4)
+        exp2 = self.rng.randint(2, 4)
         
-        operation = random.choice(['multiply', 'divide'])
+        operation = self.rng.choice(['multiply', 'divide'])
         
         if operation == 'multiply':
             result_exp = exp1 + exp2
@@ -93,9 +89,9 @@ class EquivalentExponentialReviewGenerator:
 
     def _generate_hard(self) -> Equation:
         """Hard: Complex equivalence with power rules"""
-        base = random.randint(2, 3)
-        exp1 = random.randint(2, 3)
-        exp2 = random.randint(2, 3)
+        base = self.rng.randint(2, 3)
+        exp1 = self.rng.randint(2, 3)
+        exp2 = self.rng.randint(2, 3)
         
         # (a^m)^n = a^(mn)
         result_exp = exp1 * exp2
@@ -113,10 +109,10 @@ class EquivalentExponentialReviewGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Challenge: Multiple operations"""
-        base = random.randint(2, 3)
-        exp1 = random.randint(2, 3)
-        exp2 = random.randint(2, 3)
-        exp3 = random.randint(2, 3)
+        base = self.rng.randint(2, 3)
+        exp1 = self.rng.randint(2, 3)
+        exp2 = self.rng.randint(2, 3)
+        exp3 = self.rng.randint(2, 3)
         
         # Multiply then power: (a^m * a^n)^p = a^((m+n)p)
         sum_exp = exp1 + exp2
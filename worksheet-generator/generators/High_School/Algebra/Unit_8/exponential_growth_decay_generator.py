@@ -24,8 +24,7 @@ class ExponentialGrowthDecayGenerator:
 
     def __init__(self, seed=None):
         """Initialize the exponential growth/decay generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[GrowthDecayProblem]:
         """
@@ -57,14 +56,14 @@ class ExponentialGrowthDecayGenerator:
 
     def _generate_easy(self) -> GrowthDecayProblem:
         """Generate easy growth/decay problems (simple doubling/halving)."""
-        problem_type = random.choice(['simple_growth', 'simple_decay', 'identify_type'])
+        problem_type = self.rng.choice(['simple_growth', 'simple_decay', 'identify_type'])
 
         if problem_type == 'simple_growth':
             # Population doubling
-            initial = random.choice([100, 200, 500, 1000])
-            doublings = random.randint(1, 3)
+            initial = self.rng.choice([100, 200, 500, 1000])
+            doublings = self.rng.randint(1, 3)
             final = initial * (2 ** doublings)
-            time_period = random.choice(["year", "month", "day"])
+            time_period = self.rng.choice(["year", "month", "day"])
 
             latex = f"\\text{{A bacteria population of {initial} doubles every {time_period}. "
             latex += f"What is the population after {doublings} {time_period}{'s' if doublings > 1 else ''}?}}"
@@ -73,8 +72,8 @@ class ExponentialGrowthDecayGenerator:
 
         elif problem_type == 'simple_decay':
             # Radioactive half-life
-            initial = random.choice([100, 200, 400, 800])
-            halvings = random.randint(1, 3)
+            initial = self.rng.choice([100, 200, 400, 800])
+            halvings = self.rng.randint(1, 3)
             final = initial / (2 ** halvings)
 
             latex = f"\\text{{A radioactive sample has {initial}g initially. "
@@ -90,7 +89,7 @@ class ExponentialGrowthDecayGenerator:
                 ("Bacteria triple every hour", "growth", "exponential growth"),
                 ("Medicine concentration halves every 4 hours", "decay", "exponential decay")
             ]
-            scenario, answer, full_answer = random.choice(scenarios)
+            scenario, answer, full_answer = self.rng.choice(scenarios)
 
             latex = f"\\text{{Identify as growth or decay: {scenario}}}"
             solution = full_answer
@@ -106,13 +105,13 @@ class ExponentialGrowthDecayGenerator:
 
     def _generate_medium(self) -> GrowthDecayProblem:
         """Generate medium growth/decay problems (percentage growth/decay)."""
-        problem_type = random.choice(['percent_growth', 'percent_decay', 'find_percent'])
+        problem_type = self.rng.choice(['percent_growth', 'percent_decay', 'find_percent'])
 
         if problem_type == 'percent_growth':
             # Population or investment growth
-            initial = random.choice([1000, 2000, 5000, 10000])
-            percent = random.choice([5, 10, 15, 20, 25])
-            years = random.randint(2, 5)
+            initial = self.rng.choice([1000, 2000, 5000, 10000])
+            percent = self.rng.choice([5, 10, 15, 20, 25])
+            years = self.rng.randint(2, 5)
             rate = 1 + percent/100
             final = initial * (rate ** years)
 
@@ -121,7 +120,7 @@ class ExponentialGrowthDecayGenerator:
                 ("investment", "dollars"),
                 ("bacteria culture", "cells")
             ]
-            context_name, unit = random.choice(contexts)
+            context_name, unit = self.rng.choice(contexts)
 
             latex = f"\\text{{A {context_name} of {initial:,} {unit} grows at {percent}\\% per year. "
             latex += f"Find the amount after {years} years.}}"
@@ -130,9 +129,9 @@ class ExponentialGrowthDecayGenerator:
 
         elif problem_type == 'percent_decay':
             # Depreciation or decay
-            initial = random.choice([10000, 20000, 50000])
-            percent = random.choice([10, 15, 20, 25])
-            years = random.randint(2, 4)
+            initial = self.rng.choice([10000, 20000, 50000])
+            percent = self.rng.choice([10, 15, 20, 25])
+            years = self.rng.randint(2, 4)
             rate = 1 - percent/100
             final = initial * (rate ** years)
 
@@ -141,7 +140,7 @@ class ExponentialGrowthDecayGenerator:
                 ("computer", "value"),
                 ("equipment", "value")
             ]
-            item, measure = random.choice(contexts)
+            item, measure = self.rng.choice(contexts)
 
             latex = f"\\text{{A {item} worth \\${initial:,} depreciates at {percent}\\% per year. "
             latex += f"Find its {measure} after {years} years.}}"
@@ -150,9 +149,9 @@ class ExponentialGrowthDecayGenerator:
 
         else:  # find_percent
             # Find growth/decay rate from data
-            initial = random.choice([1000, 2000, 5000])
-            percent = random.choice([5, 10, 15, 20])
-            is_growth = random.choice([True, False])
+            initial = self.rng.choice([1000, 2000, 5000])
+            percent = self.rng.choice([5, 10, 15, 20])
+            is_growth = self.rng.choice([True, False])
 
             if is_growth:
                 rate = 1 + percent/100
@@ -178,14 +177,14 @@ class ExponentialGrowthDecayGenerator:
 
     def _generate_hard(self) -> GrowthDecayProblem:
         """Generate hard growth/decay problems (finding time, comparing models)."""
-        problem_type = random.choice(['find_time', 'compare_models', 'real_world'])
+        problem_type = self.rng.choice(['find_time', 'compare_models', 'real_world'])
 
         if problem_type == 'find_time':
             # Find when population reaches target
-            initial = random.choice([1000, 2000, 5000])
-            percent = random.choice([10, 15, 20])
+            initial = self.rng.choice([1000, 2000, 5000])
+            percent = self.rng.choice([10, 15, 20])
             rate = 1 + percent/100
-            multiplier = random.choice([2, 3, 4])  # Double, triple, quadruple
+            multiplier = self.rng.choice([2, 3, 4])  # Double, triple, quadruple
             target = initial * multiplier
 
             # t = log(multiplier) / log(rate)
@@ -199,14 +198,14 @@ class ExponentialGrowthDecayGenerator:
 
         elif problem_type == 'compare_models':
             # Compare two growth scenarios
-            init1 = random.choice([1000, 2000])
-            rate1 = random.choice([1.08, 1.10, 1.12])
-            init2 = random.choice([1500, 2500])
-            rate2 = random.choice([1.05, 1.06, 1.07])
+            init1 = self.rng.choice([1000, 2000])
+            rate1 = self.rng.choice([1.08, 1.10, 1.12])
+            init2 = self.rng.choice([1500, 2500])
+            rate2 = self.rng.choice([1.05, 1.06, 1.07])
 
             # Find when they're equal: init1 * rate1^t = init2 * rate2^t
             # This requires numerical solution, so we'll ask for values at specific time
-            time = random.randint(5, 15)
+            time = self.rng.randint(5, 15)
             val1 = init1 * (rate1 ** time)
             val2 = init2 * (rate2 ** time)
 
@@ -218,10 +217,10 @@ class ExponentialGrowthDecayGenerator:
 
         else:  # real_world
             # Carbon dating or medicine concentration
-            if random.choice([True, False]):
+            if self.rng.choice([True, False]):
                 # Carbon dating
                 half_life = 5730  # C-14 half-life in years
-                percent_remaining = random.choice([75, 50, 25, 12.5])
+                percent_remaining = self.rng.choice([75, 50, 25, 12.5])
                 age = -half_life * math.log(percent_remaining/100) / math.log(2)
 
                 latex = f"\\text{{A fossil has {percent_remaining}\\% of its original C-14. "
@@ -230,9 +229,9 @@ class ExponentialGrowthDecayGenerator:
                 context = "carbon_dating"
             else:
                 # Medicine concentration
-                initial_dose = random.choice([100, 200, 500])
-                half_life_hours = random.choice([4, 6, 8])
-                hours = random.choice([8, 12, 16, 24])
+                initial_dose = self.rng.choice([100, 200, 500])
+                half_life_hours = self.rng.choice([4, 6, 8])
+                hours = self.rng.choice([8, 12, 16, 24])
                 remaining = initial_dose * (0.5 ** (hours / half_life_hours))
 
                 latex = f"\\text{{A {initial_dose}mg dose of medicine has a half-life of {half_life_hours} hours. "
@@ -250,13 +249,13 @@ class ExponentialGrowthDecayGenerator:
 
     def _generate_challenge(self) -> GrowthDecayProblem:
         """Generate challenge growth/decay problems (continuous growth, complex applications)."""
-        problem_type = random.choice(['continuous_compound', 'newton_cooling', 'logistic_growth'])
+        problem_type = self.rng.choice(['continuous_compound', 'newton_cooling', 'logistic_growth'])
 
         if problem_type == 'continuous_compound':
             # Continuous compound interest A = Pe^(rt)
-            principal = random.choice([5000, 10000, 20000])
-            rate = random.choice([0.03, 0.04, 0.05, 0.06])
-            time = random.randint(5, 20)
+            principal = self.rng.choice([5000, 10000, 20000])
+            rate = self.rng.choice([0.03, 0.04, 0.05, 0.06])
+            time = self.rng.randint(5, 20)
             amount = principal * math.exp(rate * time)
 
             latex = f"\\text{{\\${principal:,} is invested at {rate*100:.0f}\\% annual interest, "
@@ -266,10 +265,10 @@ class ExponentialGrowthDecayGenerator:
 
         elif problem_type == 'newton_cooling':
             # Newton's Law of Cooling
-            room_temp = random.choice([20, 22, 25])
-            initial_temp = random.choice([80, 90, 100])
-            cooling_const = random.choice([0.1, 0.15, 0.2])
-            time = random.randint(10, 30)
+            room_temp = self.rng.choice([20, 22, 25])
+            initial_temp = self.rng.choice([80, 90, 100])
+            cooling_const = self.rng.choice([0.1, 0.15, 0.2])
+            time = self.rng.randint(10, 30)
 
             # T(t) = room_temp + (initial_temp - room_temp) * e^(-kt)
             temp = room_temp + (initial_temp - room_temp) * math.exp(-cooling_const * time)
@@ -281,10 +280,10 @@ class ExponentialGrowthDecayGenerator:
 
         else:  # logistic_growth
             # Simplified logistic growth problem
-            carrying_capacity = random.choice([10000, 20000, 50000])
-            initial = random.choice([1000, 2000, 5000])
-            growth_rate = random.choice([0.5, 0.8, 1.0])
-            time = random.randint(2, 5)
+            carrying_capacity = self.rng.choice([10000, 20000, 50000])
+            initial = self.rng.choice([1000, 2000, 5000])
+            growth_rate = self.rng.choice([0.5, 0.8, 1.0])
+            time = self.rng.randint(2, 5)
 
             # Simplified: just check if approaching carrying capacity
             if initial < carrying_capacity * 0.1:
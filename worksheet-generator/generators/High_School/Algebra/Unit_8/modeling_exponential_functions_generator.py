@@ -11,8 +11,7 @@ class ModelingExponentialFunctionsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int):
         """Generate worksheet problems."""
@@ -36,9 +35,9 @@ class ModelingExponentialFunctionsGenerator:
     def _generate_easy(self):
         """Generate an easy problem."""
         # Function evaluation
-        m = random.randint(1, 5)
-        b = random.randint(-10, 10)
-        x = random.randint(-5, 5)
+        m = self.rng.randint(1, 5)
+        b = self.rng.randint(-10, 10)
+        x = self.rng.randint(-5, 5)
 
         latex = f"f(x) = {m}x + {b}, \\text{{ find }} f({x})"
         solution = m * x + b
@@ -54,10 +53,10 @@ class ModelingExponentialFunctionsGenerator:
     def _generate_medium(self):
         """Generate a medium problem."""
         # Complex function
-        a = random.randint(1, 3)
-        b = random.randint(-5, 5)
-        c = random.randint(-10, 10)
-        x = random.randint(-3, 3)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(-5, 5)
+        c = self.rng.randint(-10, 10)
+        x = self.rng.randint(-3, 3)
 
         latex = f"f(x) = {a}x^2 + {b}x + {c}, \\text{{ find }} f({x})"
         solution = a * x**2 + b * x + c
@@ -73,10 +72,10 @@ class ModelingExponentialFunctionsGenerator:
     def _generate_hard(self):
         """Generate a hard problem."""
         # Complex function
-        a = random.randint(1, 3)
-        b = random.randint(-5, 5)
-        c = random.randint(-10, 10)
-        x = random.randint(-3, 3)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(-5, 5)
+        c = self.rng.randint(-10, 10)
+        x = self.rng.randint(-3, 3)
 
         latex = f"f(x) = {a}x^2 + {b}x + {c}, \\text{{ find }} f({x})"
         solution = a * x**2 + b * x + c
@@ -92,10 +91,10 @@ class ModelingExponentialFunctionsGenerator:
     def _generate_challenge(self):
         """Generate a challenge problem."""
         # Complex function
-        a = random.randint(1, 3)
-        b = random.randint(-5, 5)
-        c = random.randint(-10, 10)
-        x = random.randint(-3, 3)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(-5, 5)
+        c = self.rng.randint(-10, 10)
+        x = self.rng.randint(-3, 3)
 
         latex = f"f(x) = {a}x^2 + {b}x + {c}, \\text{{ find }} f({x})"
         solution = a * x**2 + b * x + c
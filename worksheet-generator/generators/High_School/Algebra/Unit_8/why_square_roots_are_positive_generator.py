@@ -6,12 +6,7 @@ and the conceptual foundation of square root definitions.
 
 import random
 from typing import List
-import sys
-import os
 
-# Add the parent directory to sys.path to import equation_generator
-parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-sys.path.insert(0, parent_dir)
 from equation_generator import Equation
 
 
@@ -20,8 +15,7 @@ class WhySquareRootsArePositiveGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -54,12 +48,12 @@ class WhySquareRootsArePositiveGenerator:
     def _generate_easy(self) -> Equation:
         """Generate easy problems: Identify if sqrt results are positive/negative"""
         problem_types = ['identify_principal', 'true_false_negative', 'evaluate_principal']
-        problem_type = random.choice(problem_types)
+        problem_type = self.rng.choice(problem_types)
 
         if problem_type == 'identify_principal':
             # Is the principal square root positive or negative?
             perfect_squares = [4, 9, 16, 25, 36, 49, 64, 81, 100]
-            value = random.choice(perfect_squares)
+            value = self.rng.choice(perfect_squares)
             sqrt_value = int(value ** 0.5)
 
             latex = f"\\text{{Is }} \\sqrt{{{value}}} \\text{{ positive or negative?}}"
@@ -69,7 +63,7 @@ class WhySquareRootsArePositiveGenerator:
         elif problem_type == 'true_false_negative':
             # True or False: sqrt(a) can be negative
             perfect_squares = [9, 16, 25, 36, 49]
-            value = random.choice(perfect_squares)
+            value = self.rng.choice(perfect_squares)
             sqrt_value = int(value ** 0.5)
 
             latex = f"\\text{{True or False: }} \\sqrt{{{value}}} = -{sqrt_value}"
@@ -79,7 +73,7 @@ class WhySquareRootsArePositiveGenerator:
         else:  # evaluate_principal
             # Evaluate the principal square root
             perfect_squares = [1, 4, 9, 16, 25, 36, 49, 64, 81, 100]
-            value = random.choice(perfect_squares)
+            value = self.rng.choice(perfect_squares)
             sqrt_value = int(value ** 0.5)
 
             latex = f"\\text{{Evaluate the principal square root: }} \\sqrt{{{value}}}"
@@ -91,12 +85,12 @@ class WhySquareRootsArePositiveGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium problems: Principal vs negative square roots, ±sqrt notation"""
         problem_types = ['plus_minus_notation', 'both_roots', 'principal_vs_negative', 'which_notation']
-        problem_type = random.choice(problem_types)
+        problem_type = self.rng.choice(problem_types)
 
         if problem_type == 'plus_minus_notation':
             # Identify both solutions using ±
             perfect_squares = [4, 9, 16, 25, 36, 49, 64, 81]
-            value = random.choice(perfect_squares)
+            value = self.rng.choice(perfect_squares)
             sqrt_value = int(value ** 0.5)
 
             latex = f"\\text{{If }} x^2 = {value}, \\text{{ what are both solutions?}}"
@@ -110,7 +104,7 @@ class WhySquareRootsArePositiveGenerator:
         elif problem_type == 'both_roots':
             # Find both the positive and negative square roots
             perfect_squares = [9, 16, 25, 36, 49, 64]
-            value = random.choice(perfect_squares)
+            value = self.rng.choice(perfect_squares)
             sqrt_value = int(value ** 0.5)
 
             latex = f"\\text{{Find both square roots of }} {value}"
@@ -124,7 +118,7 @@ class WhySquareRootsArePositiveGenerator:
         elif problem_type == 'principal_vs_negative':
             # Compare principal root to negative root
             perfect_squares = [16, 25, 36, 49, 64]
-            value = random.choice(perfect_squares)
+            value = self.rng.choice(perfect_squares)
             sqrt_value = int(value ** 0.5)
 
             latex = f"\\text{{What is the difference between }} \\sqrt{{{value}}} \\text{{ and }} -\\sqrt{{{value}}}?"
@@ -137,7 +131,7 @@ class WhySquareRootsArePositiveGenerator:
         else:  # which_notation
             # Choose correct notation
             perfect_squares = [9, 25, 36, 49]
-            value = random.choice(perfect_squares)
+            value = self.rng.choice(perfect_squares)
             sqrt_value = int(value ** 0.5)
 
             latex = f"\\text{{Which notation represents both solutions to }} x^2 = {value}\\text{{: (A) }} \\sqrt{{{value}}}\\text{{, (B) }} \\pm\\sqrt{{{value}}}\\text{{, (C) }} -\\sqrt{{{value}}}?"
@@ -153,12 +147,12 @@ class WhySquareRootsArePositiveGenerator:
     def _generate_hard(self) -> Equation:
         """Generate hard problems: Solving equations with square roots, checking for extraneous solutions"""
         problem_types = ['solve_sqrt_equation', 'extraneous_solution', 'sqrt_both_sides', 'isolate_sqrt']
-        problem_type = random.choice(problem_types)
+        problem_type = self.rng.choice(problem_types)
 
         if problem_type == 'solve_sqrt_equation':
             # Solve sqrt(x) = a
             perfect_squares = [2, 3, 4, 5, 6, 7, 8]
-            a = random.choice(perfect_squares)
+            a = self.rng.choice(perfect_squares)
             x = a ** 2
 
             latex = f"\\text{{Solve: }} \\sqrt{{x}} = {a}"
@@ -172,8 +166,8 @@ class WhySquareRootsArePositiveGenerator:
 
         elif problem_type == 'extraneous_solution':
             # Solve equation that produces extraneous solution
-            a = random.randint(2, 6)
-            b = random.randint(1, 4)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 4)
             # sqrt(x) + a = b, where b < a gives no solution
             if b > a:
                 b, a = a, b  # Swap to ensure valid solution
@@ -199,12 +193,12 @@ class WhySquareRootsArePositiveGenerator:
         elif problem_type == 'sqrt_both_sides':
             # Solve x = sqrt(a), then check
             perfect_squares = [4, 9, 16, 25, 36, 49]
-            a = random.choice(perfect_squares)
+            a = self.rng.choice(perfect_squares)
             sqrt_a = int(a ** 0.5)
 
             # Create equation: sqrt(x + b) = c
-            c = random.randint(3, 7)
-            b = c ** 2 - random.randint(1, 10)
+            c = self.rng.randint(3, 7)
+            b = c ** 2 - self.rng.randint(1, 10)
             x = c ** 2 - b
 
             latex = f"\\text{{Solve: }} \\sqrt{{x + {b}}} = {c}"
@@ -218,9 +212,9 @@ class WhySquareRootsArePositiveGenerator:
 
         else:  # isolate_sqrt
             # Isolate square root first
-            a = random.randint(2, 5)
-            b = random.randint(1, 4)
-            c = random.randint(6, 10)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 4)
+            c = self.rng.randint(6, 10)
             # a*sqrt(x) + b = c
             sqrt_x_val = (c - b) / a
             if sqrt_x_val > 0 and sqrt_x_val == int(sqrt_x_val):
@@ -237,7 +231,7 @@ class WhySquareRootsArePositiveGenerator:
                 ]
             else:
                 # Fallback to simpler equation
-                sqrt_x_val = random.randint(2, 6)
+                sqrt_x_val = self.rng.randint(2, 6)
                 x = sqrt_x_val ** 2
                 latex = f"\\text{{Solve: }} \\sqrt{{x}} = {sqrt_x_val}"
                 solution = x
@@ -248,12 +242,12 @@ class WhySquareRootsArePositiveGenerator:
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: Domain restrictions due to square roots"""
         problem_types = ['domain_restriction', 'compound_sqrt', 'system_with_sqrt', 'why_positive']
-        problem_type = random.choice(problem_types)
+        problem_type = self.rng.choice(problem_types)
 
         if problem_type == 'domain_restriction':
             # Find domain where sqrt is defined
-            a = random.randint(1, 5)
-            b = random.randint(1, 10)
+            a = self.rng.randint(1, 5)
+            b = self.rng.randint(1, 10)
             # sqrt(ax + b) requires ax + b >= 0
 
             latex = f"\\text{{Find the domain of }} f(x) = \\sqrt{{{a}x + {b}}}"
@@ -268,8 +262,8 @@ class WhySquareRootsArePositiveGenerator:
         elif problem_type == 'compound_sqrt':
             # Solve equation with two square roots
             # sqrt(x) + sqrt(y) = a, with constraint
-            a = random.randint(3, 6)
-            x = random.randint(1, 4) ** 2
+            a = self.rng.randint(3, 6)
+            x = self.rng.randint(1, 4) ** 2
             y = (a - int(x ** 0.5)) ** 2
 
             latex = f"\\text{{If }} \\sqrt{{x}} + \\sqrt{{y}} = {a} \\text{{ and }} x = {x}, \\text{{ find }} y"
@@ -284,9 +278,9 @@ class WhySquareRootsArePositiveGenerator:
         elif problem_type == 'system_with_sqrt':
             # System involving square root
             perfect_squares = [4, 9, 16, 25]
-            x_squared = random.choice(perfect_squares)
+            x_squared = self.rng.choice(perfect_squares)
             x = int(x_squared ** 0.5)
-            a = random.randint(2, 5)
+            a = self.rng.randint(2, 5)
             y = a * x
 
             latex = f"\\text{{Solve the system: }} \\sqrt{{x}} = {x}, \\; y = {a}\\sqrt{{x}}"
@@ -302,7 +296,7 @@ class WhySquareRootsArePositiveGenerator:
         else:  # why_positive
             # Explain why principal root is positive
             perfect_squares = [16, 25, 36, 49, 64]
-            value = random.choice(perfect_squares)
+            value = self.rng.choice(perfect_squares)
             sqrt_value = int(value ** 0.5)
 
             latex = f"\\text{{Explain why }} \\sqrt{{{value}}} = {sqrt_value} \\text{{ and not }} -{sqrt_value}"
@@ -23,8 +23,7 @@ class FactoringGenerator:
 
     def __init__(self, seed=None):
         """Initialize the factoring generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[FactoringProblem]:
         """
@@ -60,32 +59,32 @@ class FactoringGenerator:
 
     def _generate_easy(self) -> FactoringProblem:
         """Generate easy factoring problems (common factors, simple monomials)."""
-        problem_type = random.choice(['factor_monomial', 'common_factor', 'factor_by_grouping_simple'])
+        problem_type = self.rng.choice(['factor_monomial', 'common_factor', 'factor_by_grouping_simple'])
 
         if problem_type == 'factor_monomial':
             # Factor out a monomial
-            common = random.randint(2, 6)
-            exp = random.randint(1, 3)
-            term1_coeff = common * random.randint(2, 5)
-            term2_coeff = common * random.randint(2, 5)
+            common = self.rng.randint(2, 6)
+            exp = self.rng.randint(1, 3)
+            term1_coeff = common * self.rng.randint(2, 5)
+            term2_coeff = common * self.rng.randint(2, 5)
 
             latex = f"\\text{{Factor: }} {term1_coeff}x^{{{exp + 1}}} + {term2_coeff}x^{{{exp}}}"
             solution = f"{common}x^{{{exp}}}({term1_coeff // common}x + {term2_coeff // common})"
 
         elif problem_type == 'common_factor':
             # Factor out common numerical factor
-            common = random.randint(2, 8)
-            a = common * random.randint(1, 5)
-            b = common * random.randint(1, 5)
-            c = common * random.randint(1, 5)
+            common = self.rng.randint(2, 8)
+            a = common * self.rng.randint(1, 5)
+            b = common * self.rng.randint(1, 5)
+            c = common * self.rng.randint(1, 5)
 
             latex = f"\\text{{Factor: }} {a}x^2 + {b}x + {c}"
             solution = f"{common}({a // common}x^2 + {b // common}x + {c // common})"
 
         else:  # factor_by_grouping_simple
             # Simple grouping: ax + bx + ay + by
-            a = random.randint(2, 5)
-            b = random.randint(2, 5)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(2, 5)
             latex = f"\\text{{Factor by grouping: }} {a}x + {b}x + {a}y + {b}y"
             solution = f"(x + y)({a} + {b})"
 
@@ -98,13 +97,13 @@ class FactoringGenerator:
 
     def _generate_medium(self) -> FactoringProblem:
         """Generate medium factoring problems (simple quadratics, difference of squares)."""
-        problem_type = random.choice(['factor_quadratic_simple', 'difference_of_squares', 'common_binomial'])
+        problem_type = self.rng.choice(['factor_quadratic_simple', 'difference_of_squares', 'common_binomial'])
 
         if problem_type == 'factor_quadratic_simple':
             # Factor x^2 + bx + c where b and c are small
             # We want (x + p)(x + q) = x^2 + (p+q)x + pq
-            p = random.randint(-6, 6)
-            q = random.randint(-6, 6)
+            p = self.rng.randint(-6, 6)
+            q = self.rng.randint(-6, 6)
             if p == 0:
                 p = 1
             if q == 0:
@@ -132,8 +131,8 @@ class FactoringGenerator:
 
         elif problem_type == 'difference_of_squares':
             # Factor a^2 - b^2
-            a_coeff = random.randint(1, 5)
-            b_val = random.randint(1, 8)
+            a_coeff = self.rng.randint(1, 5)
+            b_val = self.rng.randint(1, 8)
 
             if a_coeff == 1:
                 latex = f"\\text{{Factor: }} x^2 - {b_val**2}"
@@ -144,8 +143,8 @@ class FactoringGenerator:
 
         else:  # common_binomial
             # Factor out a common binomial
-            a = random.randint(2, 5)
-            b = random.randint(2, 5)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(2, 5)
             latex = f"\\text{{Factor: }} x(x + {a}) + {b}(x + {a})"
             solution = f"(x + {a})(x + {b})"
 
@@ -158,15 +157,15 @@ class FactoringGenerator:
 
     def _generate_hard(self) -> FactoringProblem:
         """Generate hard factoring problems (complex quadratics, perfect square trinomials)."""
-        problem_type = random.choice(['factor_quadratic_complex', 'perfect_square_trinomial', 'factor_by_grouping'])
+        problem_type = self.rng.choice(['factor_quadratic_complex', 'perfect_square_trinomial', 'factor_by_grouping'])
 
         if problem_type == 'factor_quadratic_complex':
             # Factor ax^2 + bx + c where a > 1
             # We want (px + q)(rx + s) = prx^2 + (ps + qr)x + qs
-            p = random.randint(1, 3)
-            q = random.randint(-5, 5)
-            r = random.randint(1, 3)
-            s = random.randint(-5, 5)
+            p = self.rng.randint(1, 3)
+            q = self.rng.randint(-5, 5)
+            r = self.rng.randint(1, 3)
+            s = self.rng.randint(-5, 5)
 
             if q == 0:
                 q = 1
@@ -187,8 +186,8 @@ class FactoringGenerator:
 
         elif problem_type == 'perfect_square_trinomial':
             # Factor (ax + b)^2
-            a = random.randint(1, 4)
-            b = random.randint(1, 6)
+            a = self.rng.randint(1, 4)
+            b = self.rng.randint(1, 6)
 
             # Expand to get a^2x^2 + 2abx + b^2
             coeff_x2 = a * a
@@ -205,10 +204,10 @@ class FactoringGenerator:
         else:  # factor_by_grouping
             # More complex grouping
             # ac*x^2 + ad*x + bc*x + bd = (ax + b)(cx + d)
-            a = random.randint(2, 4)
-            b = random.randint(-5, 5)
-            c = random.randint(2, 4)
-            d = random.randint(-5, 5)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(-5, 5)
+            c = self.rng.randint(2, 4)
+            d = self.rng.randint(-5, 5)
 
             if b == 0:
                 b = 1
@@ -235,13 +234,13 @@ class FactoringGenerator:
 
     def _generate_challenge(self) -> FactoringProblem:
         """Generate challenge factoring problems (sum/difference of cubes, complex patterns)."""
-        problem_type = random.choice(['sum_difference_cubes', 'factor_completely', 'complex_grouping'])
+        problem_type = self.rng.choice(['sum_difference_cubes', 'factor_completely', 'complex_grouping'])
 
         if problem_type == 'sum_difference_cubes':
             # Factor a^3 ± b^3
-            is_sum = random.choice([True, False])
-            a = random.randint(1, 3)
-            b = random.randint(1, 4)
+            is_sum = self.rng.choice([True, False])
+            a = self.rng.randint(1, 3)
+            b = self.rng.randint(1, 4)
 
             if is_sum:
                 # a^3 + b^3 = (a + b)(a^2 - ab + b^2)
@@ -262,9 +261,9 @@ class FactoringGenerator:
 
         elif problem_type == 'factor_completely':
             # Factor completely - first take out common factor, then factor quadratic
-            common = random.randint(2, 4)
-            p = random.randint(-4, 4)
-            q = random.randint(-4, 4)
+            common = self.rng.randint(2, 4)
+            p = self.rng.randint(-4, 4)
+            q = self.rng.randint(-4, 4)
             if p == 0:
                 p = 1
             if q == 0:
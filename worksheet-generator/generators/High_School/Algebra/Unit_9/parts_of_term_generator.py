@@ -5,9 +5,6 @@ Generates problems about identifying coefficients, variables, and exponents
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class PartsOfTermGenerator:
 
     def __init__(self, seed=None):
         """Initialize the parts of term generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -49,10 +45,10 @@ class PartsOfTermGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate simple term: identify coefficient in ax"""
-        coef = random.randint(2, 12)
-        var = random.choice(['x', 'y', 'z', 'a', 'b'])
+        coef = self.rng.randint(2, 12)
+        var = self.rng.choice(['x', 'y', 'z', 'a', 'b'])
 
-        part_type = random.choice(['coefficient', 'variable'])
+        part_type = self.rng.choice(['coefficient', 'variable'])
 
         if part_type == 'coefficient':
             latex = f"\\text{{What is the coefficient in {coef}{var}?}}"
@@ -65,11 +61,11 @@ class PartsOfTermGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate term with exponent: identify parts in ax^n"""
-        coef = random.randint(2, 9)
-        var = random.choice(['x', 'y', 'z'])
-        exp = random.randint(2, 5)
+        coef = self.rng.randint(2, 9)
+        var = self.rng.choice(['x', 'y', 'z'])
+        exp = self.rng.randint(2, 5)
 
-        part_type = random.choice(['coefficient', 'variable', 'exponent'])
+        part_type = self.rng.choice(['coefficient', 'variable', 'exponent'])
 
         if part_type == 'coefficient':
             latex = f"\\text{{What is the coefficient in {coef}{var}^{exp}?}}"
@@ -86,11 +82,11 @@ class PartsOfTermGenerator:
     def _generate_hard(self) -> Equation:
         """Generate term with negative coefficient or fraction"""
         coef_choices = [-5, -3, -2, 2, 3, 5, '\\frac{1}{2}', '\\frac{3}{4}', '\\frac{2}{3}']
-        coef = random.choice(coef_choices)
-        var = random.choice(['x', 'y', 'm', 'n'])
-        exp = random.randint(2, 4)
+        coef = self.rng.choice(coef_choices)
+        var = self.rng.choice(['x', 'y', 'm', 'n'])
+        exp = self.rng.randint(2, 4)
 
-        part_type = random.choice(['coefficient', 'variable', 'exponent'])
+        part_type = self.rng.choice(['coefficient', 'variable', 'exponent'])
 
         if isinstance(coef, str):  # fraction
             coef_display = coef
@@ -113,13 +109,13 @@ class PartsOfTermGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate term with multiple variables: identify parts in ax^m y^n"""
-        coef = random.randint(2, 8)
+        coef = self.rng.randint(2, 8)
         var1 = 'x'
         var2 = 'y'
-        exp1 = random.randint(2, 4)
-        exp2 = random.randint(1, 3)
+        exp1 = self.rng.randint(2, 4)
+        exp2 = self.rng.randint(1, 3)
 
-        part_type = random.choice(['coefficient', 'variables', 'exponent_sum', 'degree'])
+        part_type = self.rng.choice(['coefficient', 'variables', 'exponent_sum', 'degree'])
 
         if part_type == 'coefficient':
             latex = f"\\text{{What is the coefficient in {coef}{var1}^{exp1}{var2}^{exp2}?}}"
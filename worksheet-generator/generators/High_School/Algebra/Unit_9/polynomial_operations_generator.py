@@ -23,8 +23,7 @@ class PolynomialOperationsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the polynomial operations generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[PolynomialProblem]:
         """
@@ -119,14 +118,14 @@ class PolynomialOperationsGenerator:
 
     def _generate_easy(self) -> PolynomialProblem:
         """Generate easy polynomial problems (add/subtract simple polynomials)."""
-        problem_type = random.choice(['add_binomials', 'subtract_binomials', 'multiply_monomials'])
+        problem_type = self.rng.choice(['add_binomials', 'subtract_binomials', 'multiply_monomials'])
 
         if problem_type == 'add_binomials':
             # Add two binomials
-            a1 = random.randint(-5, 5)
-            b1 = random.randint(-5, 5)
-            a2 = random.randint(-5, 5)
-            b2 = random.randint(-5, 5)
+            a1 = self.rng.randint(-5, 5)
+            b1 = self.rng.randint(-5, 5)
+            a2 = self.rng.randint(-5, 5)
+            b2 = self.rng.randint(-5, 5)
 
             poly1 = {1: a1, 0: b1} if a1 != 0 else {0: b1}
             poly2 = {1: a2, 0: b2} if a2 != 0 else {0: b2}
@@ -138,10 +137,10 @@ class PolynomialOperationsGenerator:
 
         elif problem_type == 'subtract_binomials':
             # Subtract two binomials
-            a1 = random.randint(-5, 5)
-            b1 = random.randint(-5, 5)
-            a2 = random.randint(-5, 5)
-            b2 = random.randint(-5, 5)
+            a1 = self.rng.randint(-5, 5)
+            b1 = self.rng.randint(-5, 5)
+            a2 = self.rng.randint(-5, 5)
+            b2 = self.rng.randint(-5, 5)
 
             poly1 = {1: a1, 0: b1} if a1 != 0 else {0: b1}
             poly2 = {1: a2, 0: b2} if a2 != 0 else {0: b2}
@@ -153,10 +152,10 @@ class PolynomialOperationsGenerator:
 
         else:  # multiply_monomials
             # Multiply two monomials
-            coeff1 = random.randint(1, 5)
-            exp1 = random.randint(1, 3)
-            coeff2 = random.randint(1, 5)
-            exp2 = random.randint(1, 3)
+            coeff1 = self.rng.randint(1, 5)
+            exp1 = self.rng.randint(1, 3)
+            coeff2 = self.rng.randint(1, 5)
+            exp2 = self.rng.randint(1, 3)
 
             latex = f"{coeff1}x^{{{exp1}}} \\cdot {coeff2}x^{{{exp2}}}"
             solution = f"{coeff1 * coeff2}x^{{{exp1 + exp2}}}"
@@ -172,19 +171,19 @@ class PolynomialOperationsGenerator:
 
     def _generate_medium(self) -> PolynomialProblem:
         """Generate medium polynomial problems (trinomials, monomial-binomial multiplication)."""
-        problem_type = random.choice(['add_trinomials', 'multiply_monomial_binomial', 'subtract_mixed'])
+        problem_type = self.rng.choice(['add_trinomials', 'multiply_monomial_binomial', 'subtract_mixed'])
 
         if problem_type == 'add_trinomials':
             # Add two trinomials
             poly1 = {
-                2: random.randint(-3, 3),
-                1: random.randint(-5, 5),
-                0: random.randint(-5, 5)
+                2: self.rng.randint(-3, 3),
+                1: self.rng.randint(-5, 5),
+                0: self.rng.randint(-5, 5)
             }
             poly2 = {
-                2: random.randint(-3, 3),
-                1: random.randint(-5, 5),
-                0: random.randint(-5, 5)
+                2: self.rng.randint(-3, 3),
+                1: self.rng.randint(-5, 5),
+                0: self.rng.randint(-5, 5)
             }
 
             # Remove zero coefficients
@@ -198,12 +197,12 @@ class PolynomialOperationsGenerator:
 
         elif problem_type == 'multiply_monomial_binomial':
             # Multiply monomial by binomial
-            mono_coeff = random.randint(2, 5)
-            mono_exp = random.randint(1, 2)
+            mono_coeff = self.rng.randint(2, 5)
+            mono_exp = self.rng.randint(1, 2)
             mono = {mono_exp: mono_coeff}
 
-            bi_a = random.randint(-4, 4)
-            bi_b = random.randint(-5, 5)
+            bi_a = self.rng.randint(-4, 4)
+            bi_b = self.rng.randint(-5, 5)
             binomial = {1: bi_a, 0: bi_b} if bi_a != 0 else {0: bi_b}
 
             latex = f"{self._format_polynomial(mono)} \\cdot ({self._format_polynomial(binomial)})"
@@ -214,15 +213,15 @@ class PolynomialOperationsGenerator:
         else:  # subtract_mixed
             # Subtract polynomial from polynomial
             poly1 = {
-                3: random.randint(-2, 2),
-                2: random.randint(-3, 3),
-                1: random.randint(-5, 5),
-                0: random.randint(-5, 5)
+                3: self.rng.randint(-2, 2),
+                2: self.rng.randint(-3, 3),
+                1: self.rng.randint(-5, 5),
+                0: self.rng.randint(-5, 5)
             }
             poly2 = {
-                2: random.randint(-3, 3),
-                1: random.randint(-5, 5),
-                0: random.randint(-5, 5)
+                2: self.rng.randint(-3, 3),
+                1: self.rng.randint(-5, 5),
+                0: self.rng.randint(-5, 5)
             }
 
             # Remove zero coefficients
@@ -244,18 +243,18 @@ class PolynomialOperationsGenerator:
 
     def _generate_hard(self) -> PolynomialProblem:
         """Generate hard polynomial problems (binomial multiplication, complex operations)."""
-        problem_type = random.choice(['multiply_binomials', 'foil_method', 'complex_add_subtract'])
+        problem_type = self.rng.choice(['multiply_binomials', 'foil_method', 'complex_add_subtract'])
 
         if problem_type == 'multiply_binomials' or problem_type == 'foil_method':
             # Multiply two binomials (FOIL)
-            a1 = random.randint(-4, 4)
+            a1 = self.rng.randint(-4, 4)
             if a1 == 0:
                 a1 = 1
-            b1 = random.randint(-6, 6)
-            a2 = random.randint(-4, 4)
+            b1 = self.rng.randint(-6, 6)
+            a2 = self.rng.randint(-4, 4)
             if a2 == 0:
                 a2 = 1
-            b2 = random.randint(-6, 6)
+            b2 = self.rng.randint(-6, 6)
 
             poly1 = {1: a1, 0: b1}
             poly2 = {1: a2, 0: b2}
@@ -268,24 +267,24 @@ class PolynomialOperationsGenerator:
         else:  # complex_add_subtract
             # Complex polynomial addition/subtraction
             poly1 = {
-                4: random.randint(-2, 2),
-                3: random.randint(-3, 3),
-                2: random.randint(-4, 4),
-                1: random.randint(-5, 5),
-                0: random.randint(-6, 6)
+                4: self.rng.randint(-2, 2),
+                3: self.rng.randint(-3, 3),
+                2: self.rng.randint(-4, 4),
+                1: self.rng.randint(-5, 5),
+                0: self.rng.randint(-6, 6)
             }
             poly2 = {
-                4: random.randint(-2, 2),
-                2: random.randint(-4, 4),
-                1: random.randint(-5, 5),
-                0: random.randint(-6, 6)
+                4: self.rng.randint(-2, 2),
+                2: self.rng.randint(-4, 4),
+                1: self.rng.randint(-5, 5),
+                0: self.rng.randint(-6, 6)
             }
 
             # Remove zero coefficients
             poly1 = {d: c for d, c in poly1.items() if c != 0}
             poly2 = {d: c for d, c in poly2.items() if c != 0}
 
-            if random.choice([True, False]):
+            if self.rng.choice([True, False]):
                 latex = f"({self._format_polynomial(poly1)}) + ({self._format_polynomial(poly2)})"
                 result = self._add_polynomials(poly1, poly2)
                 operation = 'add'
@@ -306,21 +305,21 @@ class PolynomialOperationsGenerator:
 
     def _generate_challenge(self) -> PolynomialProblem:
         """Generate challenge polynomial problems (trinomial multiplication, special products)."""
-        problem_type = random.choice(['multiply_trinomials', 'special_product', 'triple_product'])
+        problem_type = self.rng.choice(['multiply_trinomials', 'special_product', 'triple_product'])
 
         if problem_type == 'multiply_trinomials':
             # Multiply binomial by trinomial
-            bi_a = random.randint(-3, 3)
+            bi_a = self.rng.randint(-3, 3)
             if bi_a == 0:
                 bi_a = 1
-            bi_b = random.randint(-4, 4)
+            bi_b = self.rng.randint(-4, 4)
             binomial = {1: bi_a, 0: bi_b}
 
-            tri_a = random.randint(-2, 2)
+            tri_a = self.rng.randint(-2, 2)
             if tri_a == 0:
                 tri_a = 1
-            tri_b = random.randint(-3, 3)
-            tri_c = random.randint(-4, 4)
+            tri_b = self.rng.randint(-3, 3)
+            tri_c = self.rng.randint(-4, 4)
             trinomial = {2: tri_a, 1: tri_b, 0: tri_c}
             trinomial = {d: c for d, c in trinomial.items() if c != 0}
 
@@ -331,12 +330,12 @@ class PolynomialOperationsGenerator:
 
         elif problem_type == 'special_product':
             # Special products: (a+b)^2 or (a-b)^2 or (a+b)(a-b)
-            product_type = random.choice(['square_sum', 'square_diff', 'diff_squares'])
+            product_type = self.rng.choice(['square_sum', 'square_diff', 'diff_squares'])
 
             if product_type == 'square_sum':
                 # (ax + b)^2
-                a = random.randint(1, 3)
-                b = random.randint(1, 5)
+                a = self.rng.randint(1, 3)
+                b = self.rng.randint(1, 5)
                 latex = f"(x + {b})^2" if a == 1 else f"({a}x + {b})^2"
                 # Result: a^2*x^2 + 2ab*x + b^2
                 result = {2: a*a, 1: 2*a*b, 0: b*b}
@@ -344,8 +343,8 @@ class PolynomialOperationsGenerator:
 
             elif product_type == 'square_diff':
                 # (ax - b)^2
-                a = random.randint(1, 3)
-                b = random.randint(1, 5)
+                a = self.rng.randint(1, 3)
+                b = self.rng.randint(1, 5)
                 latex = f"(x - {b})^2" if a == 1 else f"({a}x - {b})^2"
                 # Result: a^2*x^2 - 2ab*x + b^2
                 result = {2: a*a, 1: -2*a*b, 0: b*b}
@@ -353,8 +352,8 @@ class PolynomialOperationsGenerator:
 
             else:  # diff_squares
                 # (ax + b)(ax - b)
-                a = random.randint(1, 3)
-                b = random.randint(1, 6)
+                a = self.rng.randint(1, 3)
+                b = self.rng.randint(1, 6)
                 latex = f"(x + {b})(x - {b})" if a == 1 else f"({a}x + {b})({a}x - {b})"
                 # Result: a^2*x^2 - b^2
                 result = {2: a*a, 0: -b*b}
@@ -365,9 +364,9 @@ class PolynomialOperationsGenerator:
         else:  # triple_product
             # Multiply three simple factors
             # (x + a)(x + b)(x + c)
-            a = random.randint(-3, 3)
-            b = random.randint(-3, 3)
-            c = random.randint(-3, 3)
+            a = self.rng.randint(-3, 3)
+            b = self.rng.randint(-3, 3)
+            c = self.rng.randint(-3, 3)
 
             # First multiply (x + a)(x + b)
             poly1 = {1: 1, 0: a}
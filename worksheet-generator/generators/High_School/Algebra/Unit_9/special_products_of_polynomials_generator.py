@@ -8,9 +8,6 @@ Generates problems for special products including:
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -19,8 +16,7 @@ class SpecialProductsOfPolynomialsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the special products generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -96,11 +92,11 @@ class SpecialProductsOfPolynomialsGenerator:
         Generate easy special products problems.
         Expand simple special products with small integers.
         """
-        problem_type = random.choice(['square_sum', 'square_diff', 'diff_squares'])
+        problem_type = self.rng.choice(['square_sum', 'square_diff', 'diff_squares'])
 
         if problem_type == 'square_sum':
             # (x + b)² = x² + 2bx + b²
-            b = random.randint(1, 5)
+            b = self.rng.randint(1, 5)
             latex = f"\\text{{Expand: }} (x + {b})^2"
 
             # Result: x² + 2bx + b²
@@ -110,7 +106,7 @@ class SpecialProductsOfPolynomialsGenerator:
 
         elif problem_type == 'square_diff':
             # (x - b)² = x² - 2bx + b²
-            b = random.randint(1, 5)
+            b = self.rng.randint(1, 5)
             latex = f"\\text{{Expand: }} (x - {b})^2"
 
             # Result: x² - 2bx + b²
@@ -120,7 +116,7 @@ class SpecialProductsOfPolynomialsGenerator:
 
         else:  # diff_squares
             # (x + b)(x - b) = x² - b²
-            b = random.randint(1, 6)
+            b = self.rng.randint(1, 6)
             latex = f"\\text{{Expand: }} (x + {b})(x - {b})"
 
             # Result: x² - b²
@@ -135,12 +131,12 @@ class SpecialProductsOfPolynomialsGenerator:
         Generate medium special products problems.
         Expand with variables and coefficients.
         """
-        problem_type = random.choice(['square_sum_coeff', 'square_diff_coeff', 'diff_squares_coeff', 'two_variables'])
+        problem_type = self.rng.choice(['square_sum_coeff', 'square_diff_coeff', 'diff_squares_coeff', 'two_variables'])
 
         if problem_type == 'square_sum_coeff':
             # (ax + b)² = a²x² + 2abx + b²
-            a = random.randint(2, 4)
-            b = random.randint(1, 5)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(1, 5)
             latex = f"\\text{{Expand: }} ({a}x + {b})^2"
 
             # Result: a²x² + 2abx + b²
@@ -150,8 +146,8 @@ class SpecialProductsOfPolynomialsGenerator:
 
         elif problem_type == 'square_diff_coeff':
             # (ax - b)² = a²x² - 2abx + b²
-            a = random.randint(2, 4)
-            b = random.randint(1, 5)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(1, 5)
             latex = f"\\text{{Expand: }} ({a}x - {b})^2"
 
             # Result: a²x² - 2abx + b²
@@ -161,8 +157,8 @@ class SpecialProductsOfPolynomialsGenerator:
 
         elif problem_type == 'diff_squares_coeff':
             # (ax + b)(ax - b) = a²x² - b²
-            a = random.randint(2, 4)
-            b = random.randint(1, 6)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(1, 6)
             latex = f"\\text{{Expand: }} ({a}x + {b})({a}x - {b})"
 
             # Result: a²x² - b²
@@ -183,22 +179,22 @@ class SpecialProductsOfPolynomialsGenerator:
         Generate hard special products problems.
         Factor expressions back into special product form.
         """
-        problem_type = random.choice(['factor_perfect_square', 'factor_diff_squares', 'identify_and_expand'])
+        problem_type = self.rng.choice(['factor_perfect_square', 'factor_diff_squares', 'identify_and_expand'])
 
         if problem_type == 'factor_perfect_square':
             # Factor x² + 2bx + b² into (x + b)²
             # or x² - 2bx + b² into (x - b)²
-            is_sum = random.choice([True, False])
+            is_sum = self.rng.choice([True, False])
 
             if is_sum:
-                b = random.randint(2, 6)
+                b = self.rng.randint(2, 6)
                 # x² + 2bx + b²
                 result = {2: 1, 1: 2*b, 0: b*b}
                 latex = f"\\text{{Factor: }} " + self._format_polynomial(result)
                 solution = f"(x + {b})^2"
                 steps = [f"\\text{{Perfect square trinomial}}", solution]
             else:
-                b = random.randint(2, 6)
+                b = self.rng.randint(2, 6)
                 # x² - 2bx + b²
                 result = {2: 1, 1: -2*b, 0: b*b}
                 latex = f"\\text{{Factor: }} " + self._format_polynomial(result)
@@ -207,7 +203,7 @@ class SpecialProductsOfPolynomialsGenerator:
 
         elif problem_type == 'factor_diff_squares':
             # Factor x² - b² into (x + b)(x - b)
-            b = random.randint(2, 8)
+            b = self.rng.randint(2, 8)
             result = {2: 1, 0: -b*b}
             latex = f"\\text{{Factor: }} " + self._format_polynomial(result)
             solution = f"(x + {b})(x - {b})"
@@ -215,9 +211,9 @@ class SpecialProductsOfPolynomialsGenerator:
 
         else:  # identify_and_expand
             # Expand a more complex perfect square
-            a = random.randint(2, 3)
-            b = random.randint(2, 4)
-            is_sum = random.choice([True, False])
+            a = self.rng.randint(2, 3)
+            b = self.rng.randint(2, 4)
+            is_sum = self.rng.choice([True, False])
 
             if is_sum:
                 latex = f"\\text{{Expand: }} ({a}x + {b})^2"
@@ -236,11 +232,11 @@ class SpecialProductsOfPolynomialsGenerator:
         Generate challenge special products problems.
         Sum/difference of cubes and multi-step problems.
         """
-        problem_type = random.choice(['cube_sum', 'cube_diff', 'multi_step', 'factor_complex'])
+        problem_type = self.rng.choice(['cube_sum', 'cube_diff', 'multi_step', 'factor_complex'])
 
         if problem_type == 'cube_sum':
             # (x + b)³ = x³ + 3x²b + 3xb² + b³
-            b = random.randint(1, 4)
+            b = self.rng.randint(1, 4)
             latex = f"\\text{{Expand: }} (x + {b})^3"
 
             # Result: x³ + 3bx² + 3b²x + b³
@@ -250,7 +246,7 @@ class SpecialProductsOfPolynomialsGenerator:
 
         elif problem_type == 'cube_diff':
             # (x - b)³ = x³ - 3x²b + 3xb² - b³
-            b = random.randint(1, 4)
+            b = self.rng.randint(1, 4)
             latex = f"\\text{{Expand: }} (x - {b})^3"
 
             # Result: x³ - 3bx² + 3b²x - b³
@@ -260,8 +256,8 @@ class SpecialProductsOfPolynomialsGenerator:
 
         elif problem_type == 'multi_step':
             # Expand (x + a)² - (x - b)²
-            a = random.randint(2, 5)
-            b = random.randint(2, 5)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(2, 5)
             latex = f"\\text{{Expand: }} (x + {a})^2 - (x - {b})^2"
 
             # (x + a)² = x² + 2ax + a²
@@ -277,8 +273,8 @@ class SpecialProductsOfPolynomialsGenerator:
 
         else:  # factor_complex
             # Factor a²x² - b² with coefficients
-            a = random.randint(2, 4)
-            b = random.randint(3, 7)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(3, 7)
 
             result = {2: a*a, 0: -b*b}
             latex = f"\\text{{Factor: }} " + self._format_polynomial(result)
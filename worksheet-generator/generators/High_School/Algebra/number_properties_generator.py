@@ -5,9 +5,6 @@ Generates problems about identifying and applying number properties
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class NumberPropertiesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the number properties generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -49,10 +45,10 @@ class NumberPropertiesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate simple property identification"""
-        a = random.randint(2, 9)
-        b = random.randint(2, 9)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(2, 9)
 
-        property_type = random.choice(['commutative_add', 'commutative_mult', 'identity'])
+        property_type = self.rng.choice(['commutative_add', 'commutative_mult', 'identity'])
 
         if property_type == 'commutative_add':
             latex = f"\\text{{Which property? }} {a} + {b} = {b} + {a}"
@@ -61,7 +57,7 @@ class NumberPropertiesGenerator:
             latex = f"\\text{{Which property? }} {a} \\times {b} = {b} \\times {a}"
             solution = "Commutative (Multiplication)"
         else:  # identity
-            if random.choice([True, False]):
+            if self.rng.choice([True, False]):
                 latex = f"\\text{{Which property? }} {a} + 0 = {a}"
                 solution = "Identity (Addition)"
             else:
@@ -72,11 +68,11 @@ class NumberPropertiesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate associative property problems"""
-        a = random.randint(2, 7)
-        b = random.randint(2, 7)
-        c = random.randint(2, 7)
+        a = self.rng.randint(2, 7)
+        b = self.rng.randint(2, 7)
+        c = self.rng.randint(2, 7)
 
-        property_type = random.choice(['associative_add', 'associative_mult', 'apply_assoc'])
+        property_type = self.rng.choice(['associative_add', 'associative_mult', 'apply_assoc'])
 
         if property_type == 'associative_add':
             latex = f"\\text{{Which property? }} ({a} + {b}) + {c} = {a} + ({b} + {c})"
@@ -92,11 +88,11 @@ class NumberPropertiesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate distributive property problems"""
-        a = random.randint(2, 8)
-        b = random.randint(2, 6)
-        c = random.randint(2, 6)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(2, 6)
 
-        problem_type = random.choice(['identify_dist', 'apply_dist', 'factor_out'])
+        problem_type = self.rng.choice(['identify_dist', 'apply_dist', 'factor_out'])
 
         if problem_type == 'identify_dist':
             latex = f"\\text{{Which property? }} {a}({b} + {c}) = {a} \\times {b} + {a} \\times {c}"
@@ -114,12 +110,12 @@ class NumberPropertiesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate mixed property problems"""
-        a = random.randint(2, 6)
-        b = random.randint(2, 6)
-        c = random.randint(2, 6)
-        d = random.randint(2, 6)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(2, 6)
+        d = self.rng.randint(2, 6)
 
-        problem_type = random.choice(['multi_property', 'complex_dist', 'inverse'])
+        problem_type = self.rng.choice(['multi_property', 'complex_dist', 'inverse'])
 
         if problem_type == 'multi_property':
             latex = f"\\text{{Name all properties: }} {a} \\times ({b} + {c}) = ({b} + {c}) \\times {a}"
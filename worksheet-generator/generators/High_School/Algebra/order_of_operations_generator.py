@@ -5,9 +5,6 @@ Generates problems requiring proper order of operations
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class OrderOfOperationsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the order of operations generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -49,11 +45,11 @@ class OrderOfOperationsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate simple two-operation problem: a + b × c"""
-        a = random.randint(2, 10)
-        b = random.randint(2, 8)
-        c = random.randint(2, 6)
+        a = self.rng.randint(2, 10)
+        b = self.rng.randint(2, 8)
+        c = self.rng.randint(2, 6)
 
-        problem_type = random.choice(['add_mult', 'mult_add', 'sub_mult'])
+        problem_type = self.rng.choice(['add_mult', 'mult_add', 'sub_mult'])
 
         if problem_type == 'add_mult':
             latex = f"{a} + {b} \\times {c}"
@@ -69,11 +65,11 @@ class OrderOfOperationsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate problem with parentheses: (a + b) × c"""
-        a = random.randint(2, 8)
-        b = random.randint(2, 8)
-        c = random.randint(2, 6)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(2, 8)
+        c = self.rng.randint(2, 6)
 
-        problem_type = random.choice(['paren_mult', 'mult_paren', 'div_paren'])
+        problem_type = self.rng.choice(['paren_mult', 'mult_paren', 'div_paren'])
 
         if problem_type == 'paren_mult':
             latex = f"({a} + {b}) \\times {c}"
@@ -83,7 +79,7 @@ class OrderOfOperationsGenerator:
             solution = c * (a + b)
         else:  # div_paren
             total = a + b
-            result = random.randint(2, 5)
+            result = self.rng.randint(2, 5)
             divisor = total * result
             latex = f"{divisor} \\div ({a} + {b})"
             solution = result
@@ -92,11 +88,11 @@ class OrderOfOperationsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate problem with exponents: a^2 + b × c"""
-        a = random.randint(2, 5)
-        b = random.randint(2, 6)
-        c = random.randint(2, 5)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(2, 5)
 
-        problem_type = random.choice(['exp_add', 'exp_mult', 'paren_exp'])
+        problem_type = self.rng.choice(['exp_add', 'exp_mult', 'paren_exp'])
 
         if problem_type == 'exp_add':
             latex = f"{a}^2 + {b} \\times {c}"
@@ -112,12 +108,12 @@ class OrderOfOperationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate complex multi-operation problem"""
-        a = random.randint(2, 4)
-        b = random.randint(2, 4)
-        c = random.randint(2, 4)
-        d = random.randint(2, 4)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(2, 4)
+        c = self.rng.randint(2, 4)
+        d = self.rng.randint(2, 4)
 
-        problem_type = random.choice(['nested', 'mixed_ops', 'fraction_ops'])
+        problem_type = self.rng.choice(['nested', 'mixed_ops', 'fraction_ops'])
 
         if problem_type == 'nested':
             latex = f"{a} \\times ({b} + {c} \\times {d})"
@@ -5,9 +5,6 @@ Creates problems reviewing function notation and evaluation
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class FunctionsReviewGenerator:
     """Generates problems reviewing function concepts."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,9 +33,9 @@ class FunctionsReviewGenerator:
 
     def _generate_easy(self) -> Equation:
         """Evaluate f(x) for simple linear functions"""
-        a = random.randint(1, 5)
-        b = random.randint(-10, 10)
-        x_val = random.randint(-5, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(-10, 10)
+        x_val = self.rng.randint(-5, 5)
         result = a * x_val + b
 
         if b >= 0:
@@ -60,13 +56,13 @@ class FunctionsReviewGenerator:
 
     def _generate_medium(self) -> Equation:
         """Evaluate quadratic functions or find input from output"""
-        problem_type = random.choice(['evaluate', 'find_input'])
+        problem_type = self.rng.choice(['evaluate', 'find_input'])
 
         if problem_type == 'evaluate':
-            a = random.randint(1, 3)
-            b = random.randint(-5, 5)
-            c = random.randint(-10, 10)
-            x_val = random.randint(-3, 3)
+            a = self.rng.randint(1, 3)
+            b = self.rng.randint(-5, 5)
+            c = self.rng.randint(-10, 10)
+            x_val = self.rng.randint(-3, 3)
             result = a * x_val**2 + b * x_val + c
 
             latex = f"\\text{{If }} f(x) = {a}x^2 + {b}x + {c}, \\text{{ find }} f({x_val})."
@@ -80,9 +76,9 @@ class FunctionsReviewGenerator:
             ]
         else:
             # f(x) = ax + b, given f(?) = c, find ?
-            a = random.randint(2, 5)
-            x_val = random.randint(-5, 5)
-            b = random.randint(-10, 10)
+            a = self.rng.randint(2, 5)
+            x_val = self.rng.randint(-5, 5)
+            b = self.rng.randint(-10, 10)
             c = a * x_val + b
 
             if b >= 0:
@@ -103,14 +99,14 @@ class FunctionsReviewGenerator:
 
     def _generate_hard(self) -> Equation:
         """Function composition or piecewise evaluation"""
-        problem_type = random.choice(['composition', 'piecewise'])
+        problem_type = self.rng.choice(['composition', 'piecewise'])
 
         if problem_type == 'composition':
-            a = random.randint(1, 3)
-            b = random.randint(1, 5)
-            c = random.randint(1, 3)
-            d = random.randint(-5, 5)
-            x_val = random.randint(-2, 3)
+            a = self.rng.randint(1, 3)
+            b = self.rng.randint(1, 5)
+            c = self.rng.randint(1, 3)
+            d = self.rng.randint(-5, 5)
+            x_val = self.rng.randint(-2, 3)
 
             # f(x) = ax + b, g(x) = cx + d
             # f(g(x)) = a(cx + d) + b
@@ -127,17 +123,17 @@ class FunctionsReviewGenerator:
             ]
         else:
             # Piecewise function
-            a = random.randint(1, 3)
-            b = random.randint(-5, 5)
-            c = random.randint(1, 4)
-            threshold = random.randint(0, 2)
+            a = self.rng.randint(1, 3)
+            b = self.rng.randint(-5, 5)
+            c = self.rng.randint(1, 4)
+            threshold = self.rng.randint(0, 2)
 
-            if random.choice([True, False]):
-                x_val = random.randint(threshold, threshold + 4)
+            if self.rng.choice([True, False]):
+                x_val = self.rng.randint(threshold, threshold + 4)
                 result = a * x_val + b
                 piece_used = f"{a}x + {b} \\text{{ (since }} x \\geq {threshold})"
             else:
-                x_val = random.randint(threshold - 5, threshold - 1)
+                x_val = self.rng.randint(threshold - 5, threshold - 1)
                 result = c * x_val
                 piece_used = f"{c}x \\text{{ (since }} x < {threshold})"
 
@@ -153,12 +149,12 @@ class FunctionsReviewGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Find composite function formula or domain restrictions"""
-        problem_type = random.choice(['composite_formula', 'domain'])
+        problem_type = self.rng.choice(['composite_formula', 'domain'])
 
         if problem_type == 'composite_formula':
-            a = random.randint(1, 3)
-            b = random.randint(1, 4)
-            c = random.randint(1, 3)
+            a = self.rng.randint(1, 3)
+            b = self.rng.randint(1, 4)
+            c = self.rng.randint(1, 3)
 
             # f(x) = ax + b, g(x) = x^2 + c
             # g(f(x)) = (ax + b)^2 + c
@@ -174,11 +170,11 @@ class FunctionsReviewGenerator:
             ]
         else:
             # Domain of a function with radical or fraction
-            func_type = random.choice(['radical', 'fraction'])
+            func_type = self.rng.choice(['radical', 'fraction'])
 
             if func_type == 'radical':
-                a = random.randint(1, 3)
-                b = random.randint(-10, 10)
+                a = self.rng.randint(1, 3)
+                b = self.rng.randint(-10, 10)
                 # f(x) = sqrt(ax + b), need ax + b >= 0
                 boundary = -b / a
 
@@ -192,8 +188,8 @@ class FunctionsReviewGenerator:
                     f"x \\geq {-b / a}"
                 ]
             else:
-                a = random.randint(1, 3)
-                b = random.randint(-5, 5)
+                a = self.rng.randint(1, 3)
+                b = self.rng.randint(-5, 5)
                 # f(x) = 1/(ax + b), need ax + b ≠ 0
                 excluded = -b / a
 
@@ -5,9 +5,6 @@ Creates problems about adding and subtracting polynomials
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class PolynomialAddSubtractGenerator:
     """Generates problems about adding and subtracting polynomials."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,12 +33,12 @@ class PolynomialAddSubtractGenerator:
 
     def _generate_easy(self) -> Equation:
         """Add or subtract simple binomials"""
-        a1 = random.randint(1, 9)
-        b1 = random.randint(-10, 10)
-        a2 = random.randint(1, 9)
-        b2 = random.randint(-10, 10)
+        a1 = self.rng.randint(1, 9)
+        b1 = self.rng.randint(-10, 10)
+        a2 = self.rng.randint(1, 9)
+        b2 = self.rng.randint(-10, 10)
 
-        operation = random.choice(['+', '-'])
+        operation = self.rng.choice(['+', '-'])
 
         if operation == '+':
             result_a = a1 + a2
@@ -68,15 +64,15 @@ class PolynomialAddSubtractGenerator:
 
     def _generate_medium(self) -> Equation:
         """Add or subtract trinomials"""
-        a1 = random.randint(1, 5)
-        b1 = random.randint(-8, 8)
-        c1 = random.randint(-10, 10)
+        a1 = self.rng.randint(1, 5)
+        b1 = self.rng.randint(-8, 8)
+        c1 = self.rng.randint(-10, 10)
 
-        a2 = random.randint(1, 5)
-        b2 = random.randint(-8, 8)
-        c2 = random.randint(-10, 10)
+        a2 = self.rng.randint(1, 5)
+        b2 = self.rng.randint(-8, 8)
+        c2 = self.rng.randint(-10, 10)
 
-        operation = random.choice(['+', '-'])
+        operation = self.rng.choice(['+', '-'])
 
         if operation == '+':
             result_a = a1 + a2
@@ -101,15 +97,15 @@ class PolynomialAddSubtractGenerator:
 
     def _generate_hard(self) -> Equation:
         """Add or subtract polynomials with multiple variables"""
-        a1 = random.randint(1, 5)
-        b1 = random.randint(-6, 6)
-        c1 = random.randint(-8, 8)
+        a1 = self.rng.randint(1, 5)
+        b1 = self.rng.randint(-6, 6)
+        c1 = self.rng.randint(-8, 8)
 
-        a2 = random.randint(1, 5)
-        b2 = random.randint(-6, 6)
-        c2 = random.randint(-8, 8)
+        a2 = self.rng.randint(1, 5)
+        b2 = self.rng.randint(-6, 6)
+        c2 = self.rng.randint(-8, 8)
 
-        operation = random.choice(['+', '-'])
+        operation = self.rng.choice(['+', '-'])
 
         if operation == '+':
             result_a = a1 + a2
@@ -134,20 +130,20 @@ class PolynomialAddSubtractGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Complex polynomial operations with multiple terms"""
-        a1 = random.randint(1, 4)
-        b1 = random.randint(-5, 5)
-        c1 = random.randint(-6, 6)
-        d1 = random.randint(-8, 8)
-
-        a2 = random.randint(1, 4)
-        b2 = random.randint(-5, 5)
-        c2 = random.randint(-6, 6)
-        d2 = random.randint(-8, 8)
-
-        a3 = random.randint(1, 3)
-        b3 = random.randint(-4, 4)
-        c3 = random.randint(-5, 5)
-        d3 = random.randint(-7, 7)
+        a1 = self.rng.randint(1, 4)
+        b1 = self.rng.randint(-5, 5)
+        c1 = self.rng.randint(-6, 6)
+        d1 = self.rng.randint(-8, 8)
+
+        a2 = self.rng.randint(1, 4)
+        b2 = self.rng.randint(-5, 5)
+        c2 = self.rng.randint(-6, 6)
+        d2 = self.rng.randint(-8, 8)
+
+        a3 = self.rng.randint(1, 3)
+        b3 = self.rng.randint(-4, 4)
+        c3 = self.rng.randint(-5, 5)
+        d3 = self.rng.randint(-7, 7)
 
         result_a = a1 + a2 - a3
         result_b = b1 + b2 - b3
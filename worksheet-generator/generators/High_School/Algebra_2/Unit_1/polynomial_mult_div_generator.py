@@ -5,9 +5,6 @@ Creates problems about multiplying and dividing polynomials
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class PolynomialMultDivGenerator:
     """Generates problems about multiplying and dividing polynomials."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,9 +33,9 @@ class PolynomialMultDivGenerator:
 
     def _generate_easy(self) -> Equation:
         """Multiply monomial by binomial"""
-        a = random.randint(2, 8)
-        b = random.randint(1, 6)
-        c = random.randint(-10, 10)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(1, 6)
+        c = self.rng.randint(-10, 10)
 
         result_a = a * b
         result_b = a * c
@@ -57,10 +53,10 @@ class PolynomialMultDivGenerator:
 
     def _generate_medium(self) -> Equation:
         """Multiply two binomials using FOIL"""
-        a = random.randint(1, 5)
-        b = random.randint(-8, 8)
-        c = random.randint(1, 5)
-        d = random.randint(-8, 8)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(-8, 8)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(-8, 8)
 
         # (ax + b)(cx + d) = acx^2 + (ad + bc)x + bd
         first = a * c
@@ -85,12 +81,12 @@ class PolynomialMultDivGenerator:
 
     def _generate_hard(self) -> Equation:
         """Multiply binomial by trinomial"""
-        a = random.randint(1, 4)
-        b = random.randint(-5, 5)
+        a = self.rng.randint(1, 4)
+        b = self.rng.randint(-5, 5)
 
-        c = random.randint(1, 3)
-        d = random.randint(-4, 4)
-        e = random.randint(-6, 6)
+        c = self.rng.randint(1, 3)
+        d = self.rng.randint(-4, 4)
+        e = self.rng.randint(-6, 6)
 
         # (ax + b)(cx^2 + dx + e)
         term1 = a * c
@@ -113,14 +109,14 @@ class PolynomialMultDivGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Divide polynomial by monomial or multiply complex polynomials"""
-        problem_type = random.choice(['division', 'multiplication'])
+        problem_type = self.rng.choice(['division', 'multiplication'])
 
         if problem_type == 'division':
             # Divide polynomial by monomial
-            divisor = random.randint(2, 6)
-            a = divisor * random.randint(2, 8)
-            b = divisor * random.randint(-6, 6)
-            c = divisor * random.randint(-8, 8)
+            divisor = self.rng.randint(2, 6)
+            a = divisor * self.rng.randint(2, 8)
+            b = divisor * self.rng.randint(-6, 6)
+            c = divisor * self.rng.randint(-8, 8)
 
             result_a = a // divisor
             result_b = b // divisor
@@ -136,9 +132,9 @@ class PolynomialMultDivGenerator:
             ]
         else:
             # Multiply two trinomials (simplified)
-            a1 = random.randint(1, 3)
-            b1 = random.randint(1, 3)
-            c1 = random.randint(1, 3)
+            a1 = self.rng.randint(1, 3)
+            b1 = self.rng.randint(1, 3)
+            c1 = self.rng.randint(1, 3)
 
             # (x + a)(x + b)(x + c) = x^3 + (a+b+c)x^2 + (ab+ac+bc)x + abc
             sum_coef = a1 + b1 + c1
@@ -5,9 +5,6 @@ Creates problems about special polynomial products (difference of squares, perfe
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class SpecialProductsGenerator:
     """Generates problems about special polynomial products."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,8 +33,8 @@ class SpecialProductsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Difference of squares (a + b)(a - b) = a^2 - b^2"""
-        a = random.randint(2, 10)
-        b = random.randint(2, 10)
+        a = self.rng.randint(2, 10)
+        b = self.rng.randint(2, 10)
 
         result = a**2 - b**2
 
@@ -56,12 +52,12 @@ class SpecialProductsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Perfect square trinomial or difference of squares with variables"""
-        problem_type = random.choice(['perfect_square', 'difference_squares'])
+        problem_type = self.rng.choice(['perfect_square', 'difference_squares'])
 
         if problem_type == 'perfect_square':
-            a = random.randint(1, 6)
-            b = random.randint(1, 8)
-            sign = random.choice(['+', '-'])
+            a = self.rng.randint(1, 6)
+            b = self.rng.randint(1, 8)
+            sign = self.rng.choice(['+', '-'])
 
             # (ax + b)^2 = a^2x^2 + 2abx + b^2
             # (ax - b)^2 = a^2x^2 - 2abx + b^2
@@ -83,8 +79,8 @@ class SpecialProductsGenerator:
             ]
         else:
             # (ax + b)(ax - b) = a^2x^2 - b^2
-            a = random.randint(1, 5)
-            b = random.randint(2, 9)
+            a = self.rng.randint(1, 5)
+            b = self.rng.randint(2, 9)
 
             first = a**2
             last = b**2
@@ -102,12 +98,12 @@ class SpecialProductsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Complex special products with coefficients"""
-        problem_type = random.choice(['sum_cubes', 'difference_cubes', 'complex_square'])
+        problem_type = self.rng.choice(['sum_cubes', 'difference_cubes', 'complex_square'])
 
         if problem_type == 'sum_cubes':
             # a^3 + b^3 = (a + b)(a^2 - ab + b^2)
-            a = random.randint(1, 4)
-            b = random.randint(1, 4)
+            a = self.rng.randint(1, 4)
+            b = self.rng.randint(1, 4)
 
             latex = f"(x + {a})(x^2 - {a}x + {a**2})"
             solution = f"x^3 + {a**3}"
@@ -119,8 +115,8 @@ class SpecialProductsGenerator:
             ]
         elif problem_type == 'difference_cubes':
             # a^3 - b^3 = (a - b)(a^2 + ab + b^2)
-            a = random.randint(1, 4)
-            b = random.randint(1, 4)
+            a = self.rng.randint(1, 4)
+            b = self.rng.randint(1, 4)
 
             latex = f"(x - {a})(x^2 + {a}x + {a**2})"
             solution = f"x^3 - {a**3}"
@@ -132,8 +128,8 @@ class SpecialProductsGenerator:
             ]
         else:
             # (ax^2 + b)^2
-            a = random.randint(1, 4)
-            b = random.randint(1, 5)
+            a = self.rng.randint(1, 4)
+            b = self.rng.randint(1, 5)
 
             first = a**2
             middle = 2 * a * b
@@ -152,11 +148,11 @@ class SpecialProductsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Multiple special products combined"""
-        problem_type = random.choice(['nested', 'multiple_terms'])
+        problem_type = self.rng.choice(['nested', 'multiple_terms'])
 
         if problem_type == 'nested':
             # (x + a)^2(x - a)^2 = [(x + a)(x - a)]^2 = (x^2 - a^2)^2
-            a = random.randint(1, 4)
+            a = self.rng.randint(1, 4)
 
             a_squared = a**2
             a_fourth = a**4
@@ -172,7 +168,7 @@ class SpecialProductsGenerator:
             ]
         else:
             # (x + a)(x - a)(x^2 + a^2)
-            a = random.randint(2, 4)
+            a = self.rng.randint(2, 4)
 
             a_squared = a**2
             a_fourth = a**4
@@ -3,14 +3,11 @@ Quadratics Review Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class QuadraticsReviewGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,32 +19,32 @@ class QuadraticsReviewGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(1, 10)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(1, 10)
         latex = f"{a}x + {b}"
         solution = f"{a}x + {b}"
         steps = ["Step 1", "Step 2"]
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 10)
-        b = random.randint(1, 10)
+        a = self.rng.randint(2, 10)
+        b = self.rng.randint(1, 10)
         latex = f"{a}x^2 + {b}"
         solution = f"{a}x^2 + {b}"
         steps = ["Step 1", "Step 2"]
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 10)
-        b = random.randint(1, 10)
+        a = self.rng.randint(2, 10)
+        b = self.rng.randint(1, 10)
         latex = f"{a}x^3 + {b}x"
         solution = f"{a}x^3 + {b}x"
         steps = ["Step 1", "Step 2"]
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 10)
-        b = random.randint(1, 10)
+        a = self.rng.randint(2, 10)
+        b = self.rng.randint(1, 10)
         latex = f"{a}x^4 + {b}x^2"
         solution = f"{a}x^4 + {b}x^2"
         steps = ["Step 1", "Step 2", "Step 3"]
@@ -5,9 +5,6 @@ Creates problems about values on the unit circle
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class UnitCircleGenerator:
     """Generates problems about the unit circle."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
         # Unit circle values: (degrees, radians, cos, sin)
         self.unit_circle = {
@@ -58,10 +54,10 @@ class UnitCircleGenerator:
 
     def _generate_easy(self) -> Equation:
         """Find sin or cos for quadrant 1 angles"""
-        angle = random.choice([0, 30, 45, 60, 90])
+        angle = self.rng.choice([0, 30, 45, 60, 90])
         radians, cos_val, sin_val = self.unit_circle[angle]
 
-        trig_func = random.choice(['sin', 'cos'])
+        trig_func = self.rng.choice(['sin', 'cos'])
 
         if trig_func == 'sin':
             latex = f"\\text{{Find }} \\sin({angle}°)"
@@ -80,10 +76,10 @@ class UnitCircleGenerator:
 
     def _generate_medium(self) -> Equation:
         """Find trig values in any quadrant using degrees"""
-        angle = random.choice([120, 135, 150, 210, 225, 240, 300, 315, 330])
+        angle = self.rng.choice([120, 135, 150, 210, 225, 240, 300, 315, 330])
         radians, cos_val, sin_val = self.unit_circle[angle]
 
-        trig_func = random.choice(['sin', 'cos', 'tan'])
+        trig_func = self.rng.choice(['sin', 'cos', 'tan'])
 
         if trig_func == 'sin':
             latex = f"\\text{{Find }} \\sin({angle}°)"
@@ -120,10 +116,10 @@ class UnitCircleGenerator:
 
     def _generate_hard(self) -> Equation:
         """Find trig values using radians"""
-        angle = random.choice([30, 45, 60, 120, 135, 150, 210, 225, 240, 300, 315, 330])
+        angle = self.rng.choice([30, 45, 60, 120, 135, 150, 210, 225, 240, 300, 315, 330])
         radians, cos_val, sin_val = self.unit_circle[angle]
 
-        trig_func = random.choice(['sin', 'cos'])
+        trig_func = self.rng.choice(['sin', 'cos'])
 
         if trig_func == 'sin':
             latex = f"\\text{{Find }} \\sin\\left({radians}\\right)"
@@ -142,10 +138,10 @@ class UnitCircleGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Find coordinates, solve for angle, or use identities"""
-        problem_type = random.choice(['coordinates', 'find_angle', 'all_six'])
+        problem_type = self.rng.choice(['coordinates', 'find_angle', 'all_six'])
 
         if problem_type == 'coordinates':
-            angle = random.choice([30, 45, 60, 120, 135, 150, 210, 225, 240, 300, 315, 330])
+            angle = self.rng.choice([30, 45, 60, 120, 135, 150, 210, 225, 240, 300, 315, 330])
             radians, cos_val, sin_val = self.unit_circle[angle]
 
             latex = f"\\text{{Find the coordinates of the point on the unit circle at angle }} {radians}."
@@ -167,7 +163,7 @@ class UnitCircleGenerator:
                 ("-\\frac{1}{2}", [210, 330], "sin"),
             ]
 
-            val, angles, func = random.choice(values)
+            val, angles, func = self.rng.choice(values)
 
             latex = f"\\text{{Find all angles }} \\theta \\text{{ in }} [0°, 360°) \\text{{ where }} \\{func}(\\theta) = {val}"
             solution = f"{angles[0]}° \\text{{ and }} {angles[1]}°"
@@ -179,7 +175,7 @@ class UnitCircleGenerator:
 
         else:
             # Find all six trig values
-            angle = random.choice([30, 45, 60])
+            angle = self.rng.choice([30, 45, 60])
             radians, cos_val, sin_val = self.unit_circle[angle]
 
             latex = f"\\text{{Find all six trigonometric values for }} {angle}°."
@@ -3,14 +3,11 @@ Adding and Subtracting Complex Numbers Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class AddSubComplexNumbersGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class AddSubComplexNumbersGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        operation = random.choice(['add', 'subtract'])
-        a1, b1 = random.randint(1, 10), random.randint(1, 10)
-        a2, b2 = random.randint(1, 10), random.randint(1, 10)
+        operation = self.rng.choice(['add', 'subtract'])
+        a1, b1 = self.rng.randint(1, 10), self.rng.randint(1, 10)
+        a2, b2 = self.rng.randint(1, 10), self.rng.randint(1, 10)
 
         if operation == 'add':
             latex = f"({a1} + {b1}i) + ({a2} + {b2}i)"
@@ -50,9 +47,9 @@ class AddSubComplexNumbersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        operation = random.choice(['add', 'subtract', 'mixed'])
-        a1, b1 = random.randint(-10, 10), random.randint(-10, 10)
-        a2, b2 = random.randint(-10, 10), random.randint(-10, 10)
+        operation = self.rng.choice(['add', 'subtract', 'mixed'])
+        a1, b1 = self.rng.randint(-10, 10), self.rng.randint(-10, 10)
+        a2, b2 = self.rng.randint(-10, 10), self.rng.randint(-10, 10)
 
         sign1 = '+' if b1 >= 0 else '-'
         sign2 = '+' if b2 >= 0 else '-'
@@ -66,7 +63,7 @@ class AddSubComplexNumbersGenerator:
             real = a1 - a2
             imag = b1 - b2
         else:
-            a3, b3 = random.randint(-8, 8), random.randint(-8, 8)
+            a3, b3 = self.rng.randint(-8, 8), self.rng.randint(-8, 8)
             sign3 = '+' if b3 >= 0 else '-'
             latex = f"({a1} {sign1} {abs(b1)}i) + ({a2} {sign2} {abs(b2)}i) - ({a3} {sign3} {abs(b3)}i)"
             real = a1 + a2 - a3
@@ -83,9 +80,9 @@ class AddSubComplexNumbersGenerator:
 
     def _generate_hard(self) -> Equation:
         # Include coefficients and nested operations
-        a1, b1 = random.randint(-8, 8), random.randint(-8, 8)
-        a2, b2 = random.randint(-8, 8), random.randint(-8, 8)
-        k = random.randint(2, 5)
+        a1, b1 = self.rng.randint(-8, 8), self.rng.randint(-8, 8)
+        a2, b2 = self.rng.randint(-8, 8), self.rng.randint(-8, 8)
+        k = self.rng.randint(2, 5)
 
         sign1 = '+' if b1 >= 0 else '-'
         sign2 = '+' if b2 >= 0 else '-'
@@ -107,10 +104,10 @@ class AddSubComplexNumbersGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Complex expression with multiple terms and coefficients
-        a1, b1 = random.randint(-6, 6), random.randint(-6, 6)
-        a2, b2 = random.randint(-6, 6), random.randint(-6, 6)
-        a3, b3 = random.randint(-6, 6), random.randint(-6, 6)
-        k1, k2 = random.randint(2, 4), random.randint(2, 4)
+        a1, b1 = self.rng.randint(-6, 6), self.rng.randint(-6, 6)
+        a2, b2 = self.rng.randint(-6, 6), self.rng.randint(-6, 6)
+        a3, b3 = self.rng.randint(-6, 6), self.rng.randint(-6, 6)
+        k1, k2 = self.rng.randint(2, 4), self.rng.randint(2, 4)
 
         sign1 = '+' if b1 >= 0 else '-'
         sign2 = '+' if b2 >= 0 else '-'
@@ -5,9 +5,6 @@ Creates problems about complex numbers in a + bi form
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class ComplexNumbersGenerator:
     """Generates problems about complex numbers."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -58,14 +54,14 @@ class ComplexNumbersGenerator:
 
     def _generate_easy(self) -> Equation:
         """Identify real and imaginary parts"""
-        a = random.randint(-10, 10)
-        b = random.randint(-10, 10)
+        a = self.rng.randint(-10, 10)
+        b = self.rng.randint(-10, 10)
         while b == 0:
-            b = random.randint(-10, 10)
+            b = self.rng.randint(-10, 10)
 
         complex_num = self._format_complex(a, b)
 
-        part = random.choice(['real', 'imaginary'])
+        part = self.rng.choice(['real', 'imaginary'])
 
         if part == 'real':
             latex = f"\\text{{What is the real part of }} {complex_num}?"
@@ -86,12 +82,12 @@ class ComplexNumbersGenerator:
 
     def _generate_medium(self) -> Equation:
         """Add or subtract complex numbers"""
-        a1 = random.randint(-8, 8)
-        b1 = random.randint(-8, 8)
-        a2 = random.randint(-8, 8)
-        b2 = random.randint(-8, 8)
+        a1 = self.rng.randint(-8, 8)
+        b1 = self.rng.randint(-8, 8)
+        a2 = self.rng.randint(-8, 8)
+        b2 = self.rng.randint(-8, 8)
 
-        operation = random.choice(['+', '-'])
+        operation = self.rng.choice(['+', '-'])
 
         z1 = self._format_complex(a1, b1)
         z2 = self._format_complex(a2, b2)
@@ -119,14 +115,14 @@ class ComplexNumbersGenerator:
 
     def _generate_hard(self) -> Equation:
         """Multiply complex numbers"""
-        a1 = random.randint(-5, 5)
-        b1 = random.randint(-5, 5)
-        a2 = random.randint(-5, 5)
-        b2 = random.randint(-5, 5)
+        a1 = self.rng.randint(-5, 5)
+        b1 = self.rng.randint(-5, 5)
+        a2 = self.rng.randint(-5, 5)
+        b2 = self.rng.randint(-5, 5)
 
         while b1 == 0 or b2 == 0:
-            b1 = random.randint(-5, 5)
-            b2 = random.randint(-5, 5)
+            b1 = self.rng.randint(-5, 5)
+            b2 = self.rng.randint(-5, 5)
 
         z1 = self._format_complex(a1, b1)
         z2 = self._format_complex(a2, b2)
@@ -152,11 +148,11 @@ class ComplexNumbersGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Complex conjugates or division"""
-        problem_type = random.choice(['conjugate', 'divide', 'power_of_i'])
+        problem_type = self.rng.choice(['conjugate', 'divide', 'power_of_i'])
 
         if problem_type == 'conjugate':
-            a = random.randint(-8, 8)
-            b = random.randint(1, 8) * random.choice([1, -1])
+            a = self.rng.randint(-8, 8)
+            b = self.rng.randint(1, 8) * self.rng.choice([1, -1])
             z = self._format_complex(a, b)
 
             # z * z_bar = |z|^2 = a^2 + b^2
@@ -175,10 +171,10 @@ class ComplexNumbersGenerator:
 
         elif problem_type == 'divide':
             # (a + bi) / (c + di) - use conjugate
-            a = random.randint(1, 6)
-            b = random.randint(1, 6)
-            c = random.randint(1, 4)
-            d = random.randint(1, 4)
+            a = self.rng.randint(1, 6)
+            b = self.rng.randint(1, 6)
+            c = self.rng.randint(1, 4)
+            d = self.rng.randint(1, 4)
 
             # Multiply by conjugate
             # (a + bi)(c - di) / (c^2 + d^2)
@@ -201,7 +197,7 @@ class ComplexNumbersGenerator:
 
         else:
             # Power of i
-            n = random.randint(5, 50)
+            n = self.rng.randint(5, 50)
             remainder = n % 4
             powers = {0: "1", 1: "i", 2: "-1", 3: "-i"}
             result = powers[remainder]
@@ -3,14 +3,11 @@ Imaginary Unit i Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ImaginaryUnitIGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class ImaginaryUnitIGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        power = random.choice([2, 3, 4])
+        power = self.rng.choice([2, 3, 4])
 
         if power == 2:
             latex = f"i^2 = ?"
@@ -48,7 +45,7 @@ class ImaginaryUnitIGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        power = random.randint(5, 12)
+        power = self.rng.randint(5, 12)
         remainder = power % 4
 
         results = {0: "1", 1: "i", 2: "-1", 3: "-i"}
@@ -65,10 +62,10 @@ class ImaginaryUnitIGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        problem_type = random.choice(['high_power', 'negative_power'])
+        problem_type = self.rng.choice(['high_power', 'negative_power'])
 
         if problem_type == 'high_power':
-            power = random.randint(20, 50)
+            power = self.rng.randint(20, 50)
             remainder = power % 4
             results = {0: "1", 1: "i", 2: "-1", 3: "-i"}
             solution = results[remainder]
@@ -80,7 +77,7 @@ class ImaginaryUnitIGenerator:
                 f"= 1 \\cdot i^{{{remainder}}} = {solution}"
             ]
         else:
-            power = random.randint(5, 15)
+            power = self.rng.randint(5, 15)
             remainder = power % 4
             # For negative powers: i^(-n) = 1/i^n
             results = {0: "1", 1: "-i", 2: "-1", 3: "i"}
@@ -96,11 +93,11 @@ class ImaginaryUnitIGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        problem_type = random.choice(['sum_powers', 'product_powers'])
+        problem_type = self.rng.choice(['sum_powers', 'product_powers'])
 
         if problem_type == 'sum_powers':
-            p1 = random.randint(6, 15)
-            p2 = random.randint(6, 15)
+            p1 = self.rng.randint(6, 15)
+            p2 = self.rng.randint(6, 15)
 
             r1 = p1 % 4
             r2 = p2 % 4
@@ -124,8 +121,8 @@ class ImaginaryUnitIGenerator:
                 f"Sum: {val1} + {val2} = {solution}"
             ]
         else:
-            p1 = random.randint(5, 12)
-            p2 = random.randint(5, 12)
+            p1 = self.rng.randint(5, 12)
+            p2 = self.rng.randint(5, 12)
             total = p1 + p2
             remainder = total % 4
             results = {0: "1", 1: "i", 2: "-1", 3: "-i"}
@@ -3,14 +3,11 @@ Multiplying Complex Numbers Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class MultiplyingComplexNumbersGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class MultiplyingComplexNumbersGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(1, 6)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(1, 6)
 
         latex = f"{a}i \\cdot {b}i"
         result = -a * b  # i * i = -1
@@ -38,8 +35,8 @@ class MultiplyingComplexNumbersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a, b = random.randint(1, 6), random.randint(1, 8)
-        c, d = random.randint(1, 6), random.randint(1, 8)
+        a, b = self.rng.randint(1, 6), self.rng.randint(1, 8)
+        c, d = self.rng.randint(1, 6), self.rng.randint(1, 8)
 
         latex = f"({a} + {b}i)({c} + {d}i)"
         # (a + bi)(c + di) = ac + adi + bci + bdi^2 = (ac - bd) + (ad + bc)i
@@ -59,8 +56,8 @@ class MultiplyingComplexNumbersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a, b = random.randint(-6, 6), random.randint(-6, 6)
-        c, d = random.randint(-6, 6), random.randint(-6, 6)
+        a, b = self.rng.randint(-6, 6), self.rng.randint(-6, 6)
+        c, d = self.rng.randint(-6, 6), self.rng.randint(-6, 6)
 
         sign1 = '+' if b >= 0 else '-'
         sign2 = '+' if d >= 0 else '-'
@@ -83,12 +80,12 @@ class MultiplyingComplexNumbersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        problem_type = random.choice(['conjugate_multiply', 'triple_product'])
+        problem_type = self.rng.choice(['conjugate_multiply', 'triple_product'])
 
         if problem_type == 'conjugate_multiply':
             # (a + bi)(a - bi) = a^2 + b^2
-            a = random.randint(2, 8)
-            b = random.randint(2, 8)
+            a = self.rng.randint(2, 8)
+            b = self.rng.randint(2, 8)
 
             latex = f"({a} + {b}i)({a} - {b}i)"
             result = a * a + b * b
@@ -102,8 +99,8 @@ class MultiplyingComplexNumbersGenerator:
             ]
         else:
             # (a + bi)^2
-            a = random.randint(1, 5)
-            b = random.randint(1, 5)
+            a = self.rng.randint(1, 5)
+            b = self.rng.randint(1, 5)
 
             latex = f"({a} + {b}i)^2"
             real = a*a - b*b
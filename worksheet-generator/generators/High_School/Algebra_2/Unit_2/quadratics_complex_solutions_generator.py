@@ -3,15 +3,12 @@ Quadratics with Complex Solutions Generator
 """
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class QuadraticsComplexSolutionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -24,7 +21,7 @@ class QuadraticsComplexSolutionsGenerator:
 
     def _generate_easy(self) -> Equation:
         # x^2 + c = 0, where c > 0
-        c = random.randint(4, 25)
+        c = self.rng.randint(4, 25)
 
         latex = f"x^2 + {c} = 0"
         solution = f"x = \\pm {int(math.sqrt(c))}i" if int(math.sqrt(c))**2 == c else f"x = \\pm \\sqrt{{{c}}}i"
@@ -40,8 +37,8 @@ class QuadraticsComplexSolutionsGenerator:
 
     def _generate_medium(self) -> Equation:
         # ax^2 + c = 0, where discriminant < 0
-        a = random.randint(1, 4)
-        c = random.randint(5, 20)
+        a = self.rng.randint(1, 4)
+        c = self.rng.randint(5, 20)
 
         latex = f"{a}x^2 + {c} = 0"
 
@@ -65,9 +62,9 @@ class QuadraticsComplexSolutionsGenerator:
     def _generate_hard(self) -> Equation:
         # Quadratic formula with negative discriminant
         # x^2 + bx + c = 0
-        b = random.randint(2, 8) * 2  # Even number for simpler solutions
+        b = self.rng.randint(2, 8) * 2  # Even number for simpler solutions
         # Choose c such that discriminant < 0
-        c = (b // 2)**2 + random.randint(1, 10)
+        c = (b // 2)**2 + self.rng.randint(1, 10)
 
         latex = f"x^2 + {b}x + {c} = 0"
         discriminant = b*b - 4*c
@@ -92,10 +89,10 @@ class QuadraticsComplexSolutionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # General quadratic with complex solutions
-        a = random.randint(2, 4)
-        b = random.randint(3, 9)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(3, 9)
         # Ensure discriminant < 0
-        c = random.randint((b*b)//(4*a) + 1, (b*b)//(4*a) + 10)
+        c = self.rng.randint((b*b)//(4*a) + 1, (b*b)//(4*a) + 10)
 
         latex = f"{a}x^2 + {b}x + {c} = 0"
         discriminant = b*b - 4*a*c
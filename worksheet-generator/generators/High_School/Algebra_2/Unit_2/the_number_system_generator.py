@@ -3,14 +3,11 @@ The Number System Generator (rational, irrational, real numbers)
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class TheNumberSystemGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,11 +19,11 @@ class TheNumberSystemGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        problem_type = random.choice(['classify_rational', 'classify_irrational'])
+        problem_type = self.rng.choice(['classify_rational', 'classify_irrational'])
 
         if problem_type == 'classify_rational':
-            num = random.randint(1, 20)
-            denom = random.randint(2, 10)
+            num = self.rng.randint(1, 20)
+            denom = self.rng.randint(2, 10)
             latex = f"\\text{{Classify: }} \\frac{{{num}}}{{{denom}}}"
             solution = "\\text{Rational}"
             steps = [
@@ -35,7 +32,7 @@ class TheNumberSystemGenerator:
                 "Answer: Rational"
             ]
         else:
-            num = random.choice([2, 3, 5, 7, 11])
+            num = self.rng.choice([2, 3, 5, 7, 11])
             latex = f"\\text{{Classify: }} \\sqrt{{{num}}}"
             solution = "\\text{Irrational}"
             steps = [
@@ -47,12 +44,12 @@ class TheNumberSystemGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        problem_type = random.choice(['evaluate_expression', 'compare_numbers'])
+        problem_type = self.rng.choice(['evaluate_expression', 'compare_numbers'])
 
         if problem_type == 'evaluate_expression':
-            a = random.randint(2, 6)
-            b = random.randint(1, 5)
-            c = random.randint(1, 8)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 5)
+            c = self.rng.randint(1, 8)
             latex = f"\\text{{Is }} {a}\\sqrt{{{b}}} + {c} \\text{{ rational or irrational?}}"
             solution = "\\text{Irrational}"
             steps = [
@@ -62,10 +59,10 @@ class TheNumberSystemGenerator:
                 "Answer: Irrational"
             ]
         else:
-            num1 = random.choice([2, 3, 5])
-            num2 = random.choice([7, 11, 13])
-            latex = f"\\text{{Order: }} \\sqrt{{{num1}}}, \\sqrt{{{num2}}}, {random.randint(2, 4)}"
-            solution = f"\\sqrt{{{num1}}} < {random.randint(2, 4)} < \\sqrt{{{num2}}}"
+            num1 = self.rng.choice([2, 3, 5])
+            num2 = self.rng.choice([7, 11, 13])
+            latex = f"\\text{{Order: }} \\sqrt{{{num1}}}, \\sqrt{{{num2}}}, {self.rng.randint(2, 4)}"
+            solution = f"\\sqrt{{{num1}}} < {self.rng.randint(2, 4)} < \\sqrt{{{num2}}}"
             steps = [
                 f"\\sqrt{{{num1}}} \\approx {round(num1**0.5, 2)}",
                 f"\\sqrt{{{num2}}} \\approx {round(num2**0.5, 2)}",
@@ -75,11 +72,11 @@ class TheNumberSystemGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        problem_type = random.choice(['simplify_radicals', 'operations'])
+        problem_type = self.rng.choice(['simplify_radicals', 'operations'])
 
         if problem_type == 'simplify_radicals':
-            perfect_square = random.choice([4, 9, 16, 25])
-            non_perfect = random.choice([2, 3, 5, 7])
+            perfect_square = self.rng.choice([4, 9, 16, 25])
+            non_perfect = self.rng.choice([2, 3, 5, 7])
             num = perfect_square * non_perfect
 
             latex = f"\\text{{Simplify: }} \\sqrt{{{num}}}"
@@ -91,9 +88,9 @@ class TheNumberSystemGenerator:
                 f"Answer: {solution}"
             ]
         else:
-            a = random.randint(2, 5)
-            b = random.randint(2, 5)
-            num = random.choice([2, 3, 5])
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(2, 5)
+            num = self.rng.choice([2, 3, 5])
             latex = f"\\text{{Rationalize: }} \\frac{{{a}}}{{\\sqrt{{{num}}}}}"
             solution = f"\\frac{{{a}\\sqrt{{{num}}}}}{{{num}}}"
             steps = [
@@ -106,12 +103,12 @@ class TheNumberSystemGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        problem_type = random.choice(['complex_rationalize', 'nested_radicals'])
+        problem_type = self.rng.choice(['complex_rationalize', 'nested_radicals'])
 
         if problem_type == 'complex_rationalize':
-            a = random.randint(1, 4)
-            b = random.randint(1, 4)
-            c = random.choice([2, 3, 5])
+            a = self.rng.randint(1, 4)
+            b = self.rng.randint(1, 4)
+            c = self.rng.choice([2, 3, 5])
             latex = f"\\text{{Rationalize: }} \\frac{{{a}}}{{{b} + \\sqrt{{{c}}}}}"
             numerator = f"{a*b} - {a}\\sqrt{{{c}}}"
             denominator = b*b - c
@@ -123,8 +120,8 @@ class TheNumberSystemGenerator:
                 f"Answer: {solution}"
             ]
         else:
-            inner = random.choice([4, 9, 16])
-            outer_mult = random.randint(2, 4)
+            inner = self.rng.choice([4, 9, 16])
+            outer_mult = self.rng.randint(2, 4)
             latex = f"\\text{{Simplify: }} \\sqrt{{{outer_mult} + \\sqrt{{{inner}}}}}"
             solution = f"\\sqrt{{{outer_mult} + {int(inner**0.5)}}}"
             steps = [
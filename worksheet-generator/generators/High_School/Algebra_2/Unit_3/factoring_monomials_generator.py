@@ -5,9 +5,6 @@ Creates problems about factoring single terms and finding GCF
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class FactoringMonomialsGenerator:
     """Generates problems about factoring monomials."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -38,7 +34,7 @@ class FactoringMonomialsGenerator:
     def _generate_easy(self) -> Equation:
         """Factor a single monomial into prime factors"""
         # Simple numbers with small prime factors
-        factors = random.choice([
+        factors = self.rng.choice([
             (12, "2^2 \\cdot 3"),
             (18, "2 \\cdot 3^2"),
             (20, "2^2 \\cdot 5"),
@@ -63,14 +59,14 @@ class FactoringMonomialsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Find GCF of two or three numbers"""
-        problem_type = random.choice(['two_numbers', 'with_variables'])
+        problem_type = self.rng.choice(['two_numbers', 'with_variables'])
 
         if problem_type == 'two_numbers':
-            gcf = random.randint(2, 8)
-            mult1 = random.randint(2, 6)
-            mult2 = random.randint(2, 6)
+            gcf = self.rng.randint(2, 8)
+            mult1 = self.rng.randint(2, 6)
+            mult2 = self.rng.randint(2, 6)
             while mult1 == mult2:
-                mult2 = random.randint(2, 6)
+                mult2 = self.rng.randint(2, 6)
 
             n1 = gcf * mult1
             n2 = gcf * mult2
@@ -86,12 +82,12 @@ class FactoringMonomialsGenerator:
             ]
         else:
             # Variables
-            coef_gcf = random.randint(2, 6)
-            coef1 = coef_gcf * random.randint(2, 4)
-            coef2 = coef_gcf * random.randint(2, 4)
+            coef_gcf = self.rng.randint(2, 6)
+            coef1 = coef_gcf * self.rng.randint(2, 4)
+            coef2 = coef_gcf * self.rng.randint(2, 4)
 
-            exp1 = random.randint(2, 4)
-            exp2 = random.randint(3, 5)
+            exp1 = self.rng.randint(2, 4)
+            exp2 = self.rng.randint(3, 5)
             exp_min = min(exp1, exp2)
 
             latex = f"\\text{{Find the GCF of }} {coef1}x^{{{exp1}}} \\text{{ and }} {coef2}x^{{{exp2}}}."
@@ -107,16 +103,16 @@ class FactoringMonomialsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Factor out GCF from polynomial"""
-        gcf_coef = random.randint(2, 5)
-        gcf_exp = random.randint(1, 2)
+        gcf_coef = self.rng.randint(2, 5)
+        gcf_exp = self.rng.randint(1, 2)
 
         # Generate three terms
-        c1 = random.randint(1, 4)
-        c2 = random.randint(1, 4)
-        c3 = random.randint(1, 4)
+        c1 = self.rng.randint(1, 4)
+        c2 = self.rng.randint(1, 4)
+        c3 = self.rng.randint(1, 4)
 
-        e1 = gcf_exp + random.randint(1, 3)
-        e2 = gcf_exp + random.randint(0, 2)
+        e1 = gcf_exp + self.rng.randint(1, 3)
+        e2 = gcf_exp + self.rng.randint(0, 2)
         e3 = gcf_exp
 
         term1 = gcf_coef * c1
@@ -140,14 +136,14 @@ class FactoringMonomialsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Factor with multiple variables or negative leading coefficient"""
-        problem_type = random.choice(['two_variables', 'negative_lead'])
+        problem_type = self.rng.choice(['two_variables', 'negative_lead'])
 
         if problem_type == 'two_variables':
-            gcf = random.randint(2, 4)
-            c1, c2 = random.randint(1, 3), random.randint(1, 3)
+            gcf = self.rng.randint(2, 4)
+            c1, c2 = self.rng.randint(1, 3), self.rng.randint(1, 3)
 
-            x1, y1 = random.randint(2, 4), random.randint(1, 3)
-            x2, y2 = random.randint(1, 3), random.randint(2, 4)
+            x1, y1 = self.rng.randint(2, 4), self.rng.randint(1, 3)
+            x2, y2 = self.rng.randint(1, 3), self.rng.randint(2, 4)
 
             x_min = min(x1, x2)
             y_min = min(y1, y2)
@@ -167,8 +163,8 @@ class FactoringMonomialsGenerator:
             ]
         else:
             # Negative leading coefficient
-            gcf = random.randint(2, 4)
-            c1, c2, c3 = random.randint(2, 5), random.randint(1, 4), random.randint(1, 3)
+            gcf = self.rng.randint(2, 4)
+            c1, c2, c3 = self.rng.randint(2, 5), self.rng.randint(1, 4), self.rng.randint(1, 3)
 
             poly = f"-{gcf * c1}x^3 + {gcf * c2}x^2 - {gcf * c3}x"
 
@@ -3,14 +3,11 @@ Factoring Out Monomials Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FactoringOutMonomialsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class FactoringOutMonomialsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(1, 8)
-        c = random.randint(1, 8)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 8)
+        c = self.rng.randint(1, 8)
 
         latex = f"{a}x^2 + {a*b}x"
         solution = f"{a}x(x + {b})"
@@ -38,10 +35,10 @@ class FactoringOutMonomialsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        gcf = random.randint(2, 5)
-        a = random.randint(2, 6)
-        b = random.randint(1, 6)
-        c = random.randint(1, 8)
+        gcf = self.rng.randint(2, 5)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 6)
+        c = self.rng.randint(1, 8)
 
         coef1 = gcf * a
         coef2 = gcf * b
@@ -61,11 +58,11 @@ class FactoringOutMonomialsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        gcf = random.randint(2, 5)
-        pow_x = random.randint(2, 4)
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        c = random.randint(1, 6)
+        gcf = self.rng.randint(2, 5)
+        pow_x = self.rng.randint(2, 4)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 6)
 
         coef1 = gcf * a
         coef2 = gcf * b
@@ -83,19 +80,19 @@ class FactoringOutMonomialsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        gcf = random.randint(2, 4)
-        a = random.randint(2, 5)
-        b = random.randint(2, 5)
-        c = random.randint(1, 5)
-        d = random.randint(1, 5)
+        gcf = self.rng.randint(2, 4)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 5)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 5)
 
         coef1 = gcf * a
         coef2 = gcf * b
         coef3 = gcf * c
         coef4 = gcf * d
 
-        x_pow = random.randint(1, 2)
-        y_pow = random.randint(1, 2)
+        x_pow = self.rng.randint(1, 2)
+        y_pow = self.rng.randint(1, 2)
 
         latex = f"{coef1}x^{{{x_pow+2}}}y^{{{y_pow+1}}} + {coef2}x^{{{x_pow+1}}}y^{{{y_pow+1}}} + {coef3}x^{{{x_pow}}}y^{{{y_pow+1}}} + {coef4}x^{{{x_pow}}}y^{{{y_pow}}}"
         solution = f"{gcf}x^{{{x_pow}}}y^{{{y_pow}}}({a}x^2y + {b}xy + {c}y + {d})"
@@ -3,15 +3,12 @@ Greatest Common Factor Generator
 """
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class GreatestCommonFactorGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -24,9 +21,9 @@ class GreatestCommonFactorGenerator:
 
     def _generate_easy(self) -> Equation:
         # Two terms with common factor
-        gcf = random.randint(2, 6)
-        a = random.randint(2, 8)
-        b = random.randint(2, 8)
+        gcf = self.rng.randint(2, 6)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(2, 8)
 
         term1 = gcf * a
         term2 = gcf * b
@@ -44,10 +41,10 @@ class GreatestCommonFactorGenerator:
 
     def _generate_medium(self) -> Equation:
         # Three terms with common factor
-        gcf = random.randint(2, 5)
-        a = random.randint(1, 6)
-        b = random.randint(1, 6)
-        c = random.randint(1, 8)
+        gcf = self.rng.randint(2, 5)
+        a = self.rng.randint(1, 6)
+        b = self.rng.randint(1, 6)
+        c = self.rng.randint(1, 8)
 
         term1 = gcf * a
         term2 = gcf * b
@@ -67,13 +64,13 @@ class GreatestCommonFactorGenerator:
 
     def _generate_hard(self) -> Equation:
         # Terms with variable GCF
-        gcf_coef = random.randint(2, 6)
-        gcf_power = random.randint(1, 3)
-        a = random.randint(2, 6)
-        b = random.randint(2, 6)
+        gcf_coef = self.rng.randint(2, 6)
+        gcf_power = self.rng.randint(1, 3)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 6)
 
-        power1 = gcf_power + random.randint(1, 2)
-        power2 = gcf_power + random.randint(0, 2)
+        power1 = gcf_power + self.rng.randint(1, 2)
+        power2 = gcf_power + self.rng.randint(0, 2)
 
         coef1 = gcf_coef * a
         coef2 = gcf_coef * b
@@ -91,13 +88,13 @@ class GreatestCommonFactorGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Multiple variables with GCF
-        gcf_coef = random.randint(2, 5)
-        a = random.randint(2, 6)
-        b = random.randint(2, 6)
-        c = random.randint(2, 6)
+        gcf_coef = self.rng.randint(2, 5)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(2, 6)
 
-        x_pow = random.randint(1, 2)
-        y_pow = random.randint(1, 2)
+        x_pow = self.rng.randint(1, 2)
+        y_pow = self.rng.randint(1, 2)
 
         coef1 = gcf_coef * a
         coef2 = gcf_coef * b
@@ -3,14 +3,11 @@ Higher Degree Polynomial Factorization Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class HigherDegreePolynomialFactorizationGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class HigherDegreePolynomialFactorizationGenerator:
 
     def _generate_easy(self) -> Equation:
         # x^3 + ax^2 + bx with common factor x
-        a = random.randint(2, 8)
-        b = random.randint(2, 10)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(2, 10)
 
         latex = f"x^3 + {a}x^2 + {b}x"
         solution = f"x(x^2 + {a}x + {b})"
@@ -38,8 +35,8 @@ class HigherDegreePolynomialFactorizationGenerator:
 
     def _generate_medium(self) -> Equation:
         # Cubic with grouping: x^3 + ax^2 + bx + ab = (x^2)(x+a) + b(x+a)
-        a = random.randint(2, 6)
-        b = random.randint(2, 6)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 6)
 
         latex = f"x^3 + {a}x^2 + {b}x + {a*b}"
         solution = f"(x^2 + {b})(x + {a})"
@@ -54,7 +51,7 @@ class HigherDegreePolynomialFactorizationGenerator:
 
     def _generate_hard(self) -> Equation:
         # x^4 - a^2 (difference of squares with higher powers)
-        a = random.randint(2, 6)
+        a = self.rng.randint(2, 6)
         a_sq = a * a
 
         latex = f"x^4 - {a_sq}"
@@ -70,9 +67,9 @@ class HigherDegreePolynomialFactorizationGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Factor by grouping with 4 terms
-        a = random.randint(2, 5)
-        b = random.randint(2, 5)
-        c = random.randint(2, 5)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 5)
+        c = self.rng.randint(2, 5)
 
         # ax^3 + bx^2 + acx + bc = x^2(ax+b) + c(ax+b)
         coef1 = a
@@ -3,14 +3,11 @@ Polynomial Patterns Factorization Generator (difference of squares, perfect squa
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class PolynomialPatternsFactorizationGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class PolynomialPatternsFactorizationGenerator:
 
     def _generate_easy(self) -> Equation:
         # Difference of squares: a^2 - b^2
-        a = random.randint(2, 8)
-        b = random.randint(2, 8)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(2, 8)
 
         latex = f"{a*a}x^2 - {b*b}"
         solution = f"({a}x + {b})({a}x - {b})"
@@ -39,9 +36,9 @@ class PolynomialPatternsFactorizationGenerator:
 
     def _generate_medium(self) -> Equation:
         # Perfect square trinomial
-        problem_type = random.choice(['plus', 'minus'])
-        a = random.randint(2, 6)
-        b = random.randint(2, 6)
+        problem_type = self.rng.choice(['plus', 'minus'])
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 6)
 
         if problem_type == 'plus':
             latex = f"{a*a}x^2 + {2*a*b}x + {b*b}"
@@ -65,12 +62,12 @@ class PolynomialPatternsFactorizationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        problem_type = random.choice(['sum_cubes', 'diff_cubes'])
+        problem_type = self.rng.choice(['sum_cubes', 'diff_cubes'])
 
         if problem_type == 'sum_cubes':
             # a^3 + b^3 = (a+b)(a^2-ab+b^2)
-            a = random.randint(2, 4)
-            b = random.randint(2, 4)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(2, 4)
 
             latex = f"{a**3}x^3 + {b**3}"
             solution = f"({a}x + {b})({a*a}x^2 - {a*b}x + {b*b})"
@@ -83,8 +80,8 @@ class PolynomialPatternsFactorizationGenerator:
             ]
         else:
             # a^3 - b^3 = (a-b)(a^2+ab+b^2)
-            a = random.randint(2, 4)
-            b = random.randint(2, 4)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(2, 4)
 
             latex = f"{a**3}x^3 - {b**3}"
             solution = f"({a}x - {b})({a*a}x^2 + {a*b}x + {b*b})"
@@ -100,8 +97,8 @@ class PolynomialPatternsFactorizationGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Complex pattern - nested patterns
-        a = random.randint(2, 4)
-        b = random.randint(2, 4)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(2, 4)
 
         # x^4 - b^4 = (x^2 + b^2)(x^2 - b^2) = (x^2 + b^2)(x+b)(x-b)
         b_sq = b * b
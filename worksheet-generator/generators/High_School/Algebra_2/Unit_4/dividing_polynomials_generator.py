@@ -3,14 +3,11 @@ Dividing Polynomials Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class DividingPolynomialsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,9 +20,9 @@ class DividingPolynomialsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Divide by monomial
-        a = random.randint(2, 6)
-        b = random.randint(2, 8)
-        c = random.randint(2, 4)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 8)
+        c = self.rng.randint(2, 4)
 
         numerator_coef = a * c
         numerator_coef2 = b * c
@@ -43,8 +40,8 @@ class DividingPolynomialsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Long division with linear divisor
-        a = random.randint(1, 4)
-        b = random.randint(1, 6)
+        a = self.rng.randint(1, 4)
+        b = self.rng.randint(1, 6)
         # (x + a) divides into polynomial
         # Create (x + a)(x + b) = x^2 + (a+b)x + ab
         c = a + b
@@ -67,9 +64,9 @@ class DividingPolynomialsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Polynomial long division with remainder
-        a = random.randint(2, 5)
-        b = random.randint(1, 5)
-        r = random.randint(1, 8)  # remainder
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 5)
+        r = self.rng.randint(1, 8)  # remainder
 
         # Dividend = (x + a)(x + b) + r = x^2 + (a+b)x + ab + r
         c = a + b
@@ -92,9 +89,9 @@ class DividingPolynomialsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Higher degree polynomial division
-        a = random.randint(1, 3)
-        b = random.randint(1, 4)
-        c = random.randint(1, 4)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(1, 4)
+        c = self.rng.randint(1, 4)
 
         # (x + a)(x^2 + bx + c) = x^3 + (a+b)x^2 + (ab+c)x + ac
         coef2 = a + b
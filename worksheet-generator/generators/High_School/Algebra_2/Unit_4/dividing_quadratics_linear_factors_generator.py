@@ -3,14 +3,11 @@ Dividing Quadratics by Linear Factors Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class DividingQuadraticsLinearFactorsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,16 +19,16 @@ class DividingQuadraticsLinearFactorsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(2, 8)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 8)
         latex = f"\\frac{{{a*b}x^2}}{{{b}x}}"
         solution = f"{a}x"
         steps = [f"Divide coefficients: {a*b}/{b} = {a}", f"Subtract exponents: x^2/x = x", f"Result: {{solution}}"]
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(1, 5)
-        b = random.randint(2, 6)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(2, 6)
         c = a + b
         d = a * b
         latex = f"(x^2 + {c}x + {d}) \\div (x + {a})"
@@ -40,18 +37,18 @@ class DividingQuadraticsLinearFactorsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(2, 6)
-        r = random.randint(1, 5)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 6)
+        r = self.rng.randint(1, 5)
         latex = f"\\frac{{x^2 + {a+b}x + {a*b+r}}}{{x + {a}}}"
         solution = f"x + {b} + \\frac{{{r}}}{{x + {a}}}"
         steps = [f"Division gives quotient x + {b}", f"Remainder: {r}", f"Result: {{solution}}"]
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(1, 4)
-        b = random.randint(1, 4)
-        c = random.randint(2, 5)
+        a = self.rng.randint(1, 4)
+        b = self.rng.randint(1, 4)
+        c = self.rng.randint(2, 5)
         coef = c * a
         latex = f"\\frac{{{c}x^2 + {c*(a+b)}x + {c*a*b}}}{{x + {a}}}"
         solution = f"{c}x + {c*b}"
@@ -3,14 +3,11 @@ Polynomial Remainder Theorem Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class PolynomialRemainderTheoremGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class PolynomialRemainderTheoremGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(1, 5)
-        k = random.randint(2, 8)
+        a = self.rng.randint(1, 5)
+        k = self.rng.randint(2, 8)
         latex = f"\\text{{Find remainder when }} x^2 + {k} \\text{{ is divided by }} x - {a}"
         remainder = a*a + k
         solution = f"{remainder}"
@@ -31,9 +28,9 @@ class PolynomialRemainderTheoremGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(1, 4)
-        b = random.randint(2, 6)
-        c = random.randint(2, 8)
+        a = self.rng.randint(1, 4)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(2, 8)
         latex = f"\\text{{Find remainder: }} (x^2 + {b}x + {c}) \\div (x - {a})"
         remainder = a*a + b*a + c
         solution = f"{remainder}"
@@ -41,10 +38,10 @@ class PolynomialRemainderTheoremGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(1, 3)
-        b = random.randint(1, 4)
-        c = random.randint(1, 5)
-        d = random.randint(1, 6)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(1, 4)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 6)
         latex = f"\\text{{Remainder: }} (x^3 + {b}x^2 + {c}x + {d}) \\div (x - {a})"
         remainder = a**3 + b*a*a + c*a + d
         solution = f"{remainder}"
@@ -52,10 +49,10 @@ class PolynomialRemainderTheoremGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 4)
-        b = random.randint(1, 4)
-        c = random.randint(1, 5)
-        d = random.randint(1, 6)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(1, 4)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 6)
         latex = f"\\text{{For what k does }} (x^3 + {b}x^2 + kx + {d}) \\text{{ have remainder {c} when divided by }} (x - {a})?"
         k_val = (c - a**3 - b*a*a - d) // a
         solution = f"k = {k_val}"
@@ -3,14 +3,11 @@ End Behavior of Graphs Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class EndBehaviorGraphsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,16 +19,16 @@ class EndBehaviorGraphsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-                a = random.randint(1, 5)
-                b = random.randint(-10, 10)
+                a = self.rng.randint(1, 5)
+                b = self.rng.randint(-10, 10)
                 latex = f"\\text{{Describe end behavior of }} f(x) = {a}x + {b}"
                 solution = f"\\text{{As }} x \\to \\infty, f(x) \\to \\infty; \\text{{ as }} x \\to -\\infty, f(x) \\to -\\infty"
                 steps = [f"Linear with positive slope", f"Both ends go to infinity in opposite directions"]
                 return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-                a = random.randint(1, 4)
-                sign = random.choice([1, -1])
+                a = self.rng.randint(1, 4)
+                sign = self.rng.choice([1, -1])
                 a = a * sign
                 latex = f"\\text{{End behavior of }} f(x) = {a}x^2"
                 if a > 0:
@@ -42,7 +39,7 @@ class EndBehaviorGraphsGenerator:
                 return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-                a = random.choice([1, -1]) * random.randint(1, 3)
+                a = self.rng.choice([1, -1]) * self.rng.randint(1, 3)
                 latex = f"\\text{{End behavior of }} f(x) = {a}x^3"
                 if a > 0:
                     solution = f"\\text{{As }} x \\to -\\infty, y \\to -\\infty; \\text{{ as }} x \\to \\infty, y \\to \\infty"
@@ -52,8 +49,8 @@ class EndBehaviorGraphsGenerator:
                 return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-                a = random.randint(1, 3)
-                n = random.randint(4, 6)
+                a = self.rng.randint(1, 3)
+                n = self.rng.randint(4, 6)
                 latex = f"\\text{{End behavior of }} f(x) = -{a}x^{{{n}}} + 100x^{{{n-1}}}"
                 solution = f"\\text{{Dominated by }} -x^{{{n}}}, \\text{{ both ends }} \\to -\\infty"
                 steps = [f"Highest degree term: -{a}x^{n}", f"Even degree, negative coefficient", f"Both ends to -infinity"]
@@ -3,14 +3,11 @@ What Are Zeros Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class WhatAreZerosGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,23 +19,23 @@ class WhatAreZerosGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-                a = random.randint(2, 8)
+                a = self.rng.randint(2, 8)
                 latex = f"\\text{{Find zeros of }} f(x) = x - {a}"
                 solution = f"x = {a}"
                 steps = [f"Set f(x) = 0", f"x - {a} = 0", f"x = {a}"]
                 return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-                a = random.randint(1, 5)
-                b = random.randint(1, 6)
+                a = self.rng.randint(1, 5)
+                b = self.rng.randint(1, 6)
                 latex = f"\\text{{Find zeros of }} f(x) = (x - {a})(x + {b})"
                 solution = f"x = {a}, x = -{b}"
                 steps = [f"Set each factor = 0", f"x - {a} = 0 \\rightarrow x = {a}", f"x + {b} = 0 \\rightarrow x = -{b}"]
                 return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-                a = random.randint(1, 4)
-                b = random.randint(1, 5)
+                a = self.rng.randint(1, 4)
+                b = self.rng.randint(1, 5)
                 c = a + b
                 d = a * b
                 latex = f"\\text{{Find zeros of }} f(x) = x^2 - {c}x + {d}"
@@ -47,9 +44,9 @@ class WhatAreZerosGenerator:
                 return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-                a = random.randint(1, 3)
-                b = random.randint(1, 4)
-                c = random.randint(1, 4)
+                a = self.rng.randint(1, 3)
+                b = self.rng.randint(1, 4)
+                c = self.rng.randint(1, 4)
                 latex = f"\\text{{Find zeros of }} f(x) = {a}x^3 - {a*b*c}x"
                 solution = f"x = 0, x = \\pm\\sqrt{{{b*c}}}"
                 steps = [f"Factor: {a}x(x^2 - {b*c})", f"x = 0 or x^2 = {b*c}", f"Zeros: x = 0, \\pm\\sqrt{{{b*c}}}"]
@@ -3,14 +3,11 @@ Equivalent Forms of Exponents Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class EquivalentFormsExponentsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,32 +19,32 @@ class EquivalentFormsExponentsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-                base = random.choice(['x', 'y', 'a'])
-                exp = random.randint(2, 6)
+                base = self.rng.choice(['x', 'y', 'a'])
+                exp = self.rng.randint(2, 6)
                 latex = f"\\frac{{1}}{{{base}^{{{exp}}}}}"
                 solution = f"{base}^{{-{exp}}}"
                 steps = [f"Negative exponent rule", f"1/{base}^{exp} = {base}^{{-{exp}}}", f"Answer: {solution}"]
                 return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-                base = random.choice(['x', 'y', 'z'])
+                base = self.rng.choice(['x', 'y', 'z'])
                 latex = f"\\sqrt{{{base}}}"
                 solution = f"{base}^{{1/2}}"
                 steps = [f"Square root as fractional exponent", f"\\sqrt{{{base}}} = {base}^{{1/2}}", f"Answer: {solution}"]
                 return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-                base = random.choice(['a', 'b', 'x'])
-                n = random.randint(3, 5)
+                base = self.rng.choice(['a', 'b', 'x'])
+                n = self.rng.randint(3, 5)
                 latex = f"\\sqrt[{n}]{{{base}^{{{n+1}}}}}"
                 solution = f"{base} \\cdot {base}^{{1/{n}}}"
                 steps = [f"Convert to fractional exponent", f"{base}^{{({n+1})/{n}}} = {base}^{{1 + 1/{n}}}", f"= {solution}"]
                 return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-                base = random.choice(['x', 'y'])
-                m = random.randint(2, 4)
-                n = random.randint(3, 5)
+                base = self.rng.choice(['x', 'y'])
+                m = self.rng.randint(2, 4)
+                n = self.rng.randint(3, 5)
                 latex = f"(\\sqrt[{n}]{{{base}}})^{{{m}}}"
                 solution = f"{base}^{{{m}/{n}}}"
                 steps = [f"Root as fractional exponent", f"(\\sqrt[{n}]{{{base}}})^{m} = ({base}^{{1/{n}}})^{m}", f"= {base}^{{{m}/{n}}}"]
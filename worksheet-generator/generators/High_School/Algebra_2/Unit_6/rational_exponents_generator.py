@@ -5,9 +5,6 @@ Creates problems about converting between radicals and fractional exponents
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class RationalExponentsGenerator:
     """Generates problems about rational exponents."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,11 +33,11 @@ class RationalExponentsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Convert between radical and exponential form"""
-        problem_type = random.choice(['to_exponential', 'to_radical'])
+        problem_type = self.rng.choice(['to_exponential', 'to_radical'])
 
         if problem_type == 'to_exponential':
-            n = random.choice([2, 3, 4])
-            base = random.choice(['x', 'a', 'y'])
+            n = self.rng.choice([2, 3, 4])
+            base = self.rng.choice(['x', 'a', 'y'])
 
             if n == 2:
                 latex = f"\\text{{Write }} \\sqrt{{{base}}} \\text{{ using a rational exponent.}}"
@@ -55,8 +51,8 @@ class RationalExponentsGenerator:
                 f"\\sqrt[{n}]{{{base}}} = {base}^{{1/{n}}}"
             ]
         else:
-            n = random.choice([2, 3, 4])
-            base = random.choice(['x', 'a', 'y'])
+            n = self.rng.choice([2, 3, 4])
+            base = self.rng.choice(['x', 'a', 'y'])
 
             latex = f"\\text{{Write }} {base}^{{1/{n}}} \\text{{ as a radical.}}"
 
@@ -74,13 +70,13 @@ class RationalExponentsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Convert expressions with numerator > 1 in exponent"""
-        problem_type = random.choice(['to_exponential', 'to_radical'])
+        problem_type = self.rng.choice(['to_exponential', 'to_radical'])
 
-        m = random.randint(2, 4)
-        n = random.choice([2, 3])
+        m = self.rng.randint(2, 4)
+        n = self.rng.choice([2, 3])
         while m == n:
-            m = random.randint(2, 4)
-        base = random.choice(['x', 'a', 'b'])
+            m = self.rng.randint(2, 4)
+        base = self.rng.choice(['x', 'a', 'b'])
 
         if problem_type == 'to_exponential':
             if n == 2:
@@ -111,7 +107,7 @@ class RationalExponentsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Evaluate numerical expressions with rational exponents"""
-        problem_type = random.choice(['evaluate', 'simplify'])
+        problem_type = self.rng.choice(['evaluate', 'simplify'])
 
         if problem_type == 'evaluate':
             # Choose bases that give clean results
@@ -126,7 +122,7 @@ class RationalExponentsGenerator:
                 (16, "3/4", 8, "16^{3/4} = (16^{1/4})^3 = 2^3 = 8"),
             ]
 
-            base, exp, result, explanation = random.choice(options)
+            base, exp, result, explanation = self.rng.choice(options)
 
             latex = f"\\text{{Evaluate: }} {base}^{{{exp}}}"
             solution = str(result)
@@ -137,9 +133,9 @@ class RationalExponentsGenerator:
             ]
         else:
             # Simplify expression
-            base = random.choice(['x', 'a'])
-            m = random.randint(2, 4)
-            n = random.choice([2, 3])
+            base = self.rng.choice(['x', 'a'])
+            m = self.rng.randint(2, 4)
+            n = self.rng.choice([2, 3])
 
             latex = f"\\text{{Simplify: }} ({base}^{{{m}}})^{{1/{n}}}"
             solution = f"{base}^{{{m}/{n}}}"
@@ -153,12 +149,12 @@ class RationalExponentsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Combine exponent rules with rational exponents"""
-        problem_type = random.choice(['product', 'quotient', 'negative'])
+        problem_type = self.rng.choice(['product', 'quotient', 'negative'])
 
         if problem_type == 'product':
-            base = random.choice(['x', 'a'])
+            base = self.rng.choice(['x', 'a'])
             # x^(1/2) * x^(1/3) = x^(5/6)
-            n1, n2 = random.choice([(2, 3), (2, 4), (3, 4)])
+            n1, n2 = self.rng.choice([(2, 3), (2, 4), (3, 4)])
             # LCD
             if n1 == 2 and n2 == 3:
                 lcd = 6
@@ -180,11 +176,11 @@ class RationalExponentsGenerator:
             ]
 
         elif problem_type == 'quotient':
-            base = random.choice(['x', 'a'])
+            base = self.rng.choice(['x', 'a'])
             # x^(3/4) / x^(1/4) = x^(2/4) = x^(1/2)
-            num1 = random.randint(2, 4)
+            num1 = self.rng.randint(2, 4)
             num2 = 1
-            den = random.choice([2, 3, 4])
+            den = self.rng.choice([2, 3, 4])
 
             result = num1 - num2
 
@@ -206,7 +202,7 @@ class RationalExponentsGenerator:
                 (16, "-1/2", "1/4", "16^{-1/2} = \\frac{1}{16^{1/2}} = \\frac{1}{4}"),
             ]
 
-            base, exp, result, explanation = random.choice(options)
+            base, exp, result, explanation = self.rng.choice(options)
 
             latex = f"\\text{{Evaluate: }} {base}^{{{exp}}}"
             solution = result
@@ -3,14 +3,11 @@ Solving Exponential Equations Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SolvingExponentialEquationsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class SolvingExponentialEquationsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-                base = random.randint(2, 5)
-                exp = random.randint(2, 4)
+                base = self.rng.randint(2, 5)
+                exp = self.rng.randint(2, 4)
                 result = base ** exp
                 latex = f"{base}^x = {result}"
                 solution = f"x = {exp}"
@@ -31,17 +28,17 @@ class SolvingExponentialEquationsGenerator:
                 return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-                base = random.randint(2, 4)
-                exp = random.randint(2, 5)
+                base = self.rng.randint(2, 4)
+                exp = self.rng.randint(2, 5)
                 latex = f"{base}^{{2x}} = {base}^{{{exp}}}"
                 solution = f"x = {exp/2}"
                 steps = [f"Same base, set exponents equal", f"2x = {exp}", f"x = {exp/2}"]
                 return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-                base = random.randint(2, 4)
-                a = random.randint(2, 5)
-                b = random.randint(1, 4)
+                base = self.rng.randint(2, 4)
+                a = self.rng.randint(2, 5)
+                b = self.rng.randint(1, 4)
                 exp = a + b
                 latex = f"{base}^{{x + {b}}} = {base}^{{{exp}}}"
                 solution = f"x = {a}"
@@ -49,9 +46,9 @@ class SolvingExponentialEquationsGenerator:
                 return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-                base1 = random.randint(2, 3)
+                base1 = self.rng.randint(2, 3)
                 base2 = base1 ** 2
-                exp = random.randint(3, 6)
+                exp = self.rng.randint(3, 6)
                 latex = f"{base2}^x = {base1}^{{{exp}}}"
                 solution = f"x = {exp/2}"
                 steps = [f"Rewrite {base2} = {base1}^2", f"({base1}^2)^x = {base1}^{exp}", f"{base1}^{{2x}} = {base1}^{exp}", f"2x = {exp}, x = {exp/2}"]
@@ -5,9 +5,6 @@ Creates problems about exponential growth and decay applications
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class ExponentialGrowthDecayGenerator:
     """Generates exponential growth and decay problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,16 +33,16 @@ class ExponentialGrowthDecayGenerator:
 
     def _generate_easy(self) -> Equation:
         """Identify growth vs decay from equation"""
-        a = random.randint(50, 500)
+        a = self.rng.randint(50, 500)
 
-        growth_type = random.choice(['growth', 'decay'])
+        growth_type = self.rng.choice(['growth', 'decay'])
 
         if growth_type == 'growth':
-            b = round(random.uniform(1.05, 1.5), 2)
+            b = round(self.rng.uniform(1.05, 1.5), 2)
             answer = "Growth"
             reason = f"b = {b} > 1"
         else:
-            b = round(random.uniform(0.5, 0.95), 2)
+            b = round(self.rng.uniform(0.5, 0.95), 2)
             answer = "Decay"
             reason = f"b = {b} < 1"
 
@@ -63,13 +59,13 @@ class ExponentialGrowthDecayGenerator:
 
     def _generate_medium(self) -> Equation:
         """Calculate value after given time periods"""
-        problem_type = random.choice(['growth', 'decay'])
+        problem_type = self.rng.choice(['growth', 'decay'])
 
         if problem_type == 'growth':
-            initial = random.randint(100, 1000)
-            rate = random.choice([0.05, 0.1, 0.2])
+            initial = self.rng.randint(100, 1000)
+            rate = self.rng.choice([0.05, 0.1, 0.2])
             rate_percent = int(rate * 100)
-            time = random.randint(2, 4)
+            time = self.rng.randint(2, 4)
 
             b = 1 + rate
             final = initial * (b ** time)
@@ -85,10 +81,10 @@ class ExponentialGrowthDecayGenerator:
                 f"P \\approx {final:.0f}"
             ]
         else:
-            initial = random.randint(500, 2000)
-            rate = random.choice([0.1, 0.15, 0.2])
+            initial = self.rng.randint(500, 2000)
+            rate = self.rng.choice([0.1, 0.15, 0.2])
             rate_percent = int(rate * 100)
-            time = random.randint(2, 4)
+            time = self.rng.randint(2, 4)
 
             b = 1 - rate
             final = initial * (b ** time)
@@ -108,13 +104,13 @@ class ExponentialGrowthDecayGenerator:
 
     def _generate_hard(self) -> Equation:
         """Write equations from context or find rate"""
-        problem_type = random.choice(['write_equation', 'find_rate'])
+        problem_type = self.rng.choice(['write_equation', 'find_rate'])
 
         if problem_type == 'write_equation':
-            initial = random.randint(200, 1000)
-            rate = random.choice([0.05, 0.08, 0.1, 0.12])
+            initial = self.rng.randint(200, 1000)
+            rate = self.rng.choice([0.05, 0.08, 0.1, 0.12])
             rate_percent = int(rate * 100)
-            growth = random.choice([True, False])
+            growth = self.rng.choice([True, False])
 
             if growth:
                 b = 1 + rate
@@ -133,8 +129,8 @@ class ExponentialGrowthDecayGenerator:
             ]
         else:
             # Find rate given two values
-            initial = random.randint(100, 500)
-            rate = random.choice([0.1, 0.2, 0.25])
+            initial = self.rng.randint(100, 500)
+            rate = self.rng.choice([0.1, 0.2, 0.25])
             time = 2
 
             b = 1 + rate
@@ -154,12 +150,12 @@ class ExponentialGrowthDecayGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Half-life, doubling time, or compound interest"""
-        problem_type = random.choice(['half_life', 'doubling', 'compound'])
+        problem_type = self.rng.choice(['half_life', 'doubling', 'compound'])
 
         if problem_type == 'half_life':
-            initial = random.randint(100, 500)
-            half_life = random.choice([2, 4, 5, 10])
-            time = half_life * random.randint(2, 4)
+            initial = self.rng.randint(100, 500)
+            half_life = self.rng.choice([2, 4, 5, 10])
+            time = half_life * self.rng.randint(2, 4)
 
             periods = time // half_life
             final = initial / (2 ** periods)
@@ -175,9 +171,9 @@ class ExponentialGrowthDecayGenerator:
             ]
 
         elif problem_type == 'doubling':
-            initial = random.randint(50, 200)
-            double_time = random.choice([3, 4, 5, 6])
-            time = double_time * random.randint(2, 3)
+            initial = self.rng.randint(50, 200)
+            double_time = self.rng.choice([3, 4, 5, 6])
+            time = double_time * self.rng.randint(2, 3)
 
             periods = time // double_time
             final = initial * (2 ** periods)
@@ -194,11 +190,11 @@ class ExponentialGrowthDecayGenerator:
 
         else:
             # Compound interest
-            principal = random.randint(5, 20) * 100
-            rate = random.choice([0.05, 0.06, 0.08])
+            principal = self.rng.randint(5, 20) * 100
+            rate = self.rng.choice([0.05, 0.06, 0.08])
             rate_percent = int(rate * 100)
-            time = random.randint(2, 4)
-            n = random.choice([1, 4, 12])
+            time = self.rng.randint(2, 4)
+            n = self.rng.choice([1, 4, 12])
             n_name = {1: "annually", 4: "quarterly", 12: "monthly"}[n]
 
             amount = principal * ((1 + rate/n) ** (n * time))
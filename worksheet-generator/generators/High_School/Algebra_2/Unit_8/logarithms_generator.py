@@ -5,9 +5,6 @@ Creates problems about evaluating logarithms and converting forms
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class LogarithmsGenerator:
     """Generates problems about logarithms."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,10 +33,10 @@ class LogarithmsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Evaluate simple logarithms with integer results"""
-        problem_type = random.choice(['base_10', 'base_2', 'base_other'])
+        problem_type = self.rng.choice(['base_10', 'base_2', 'base_other'])
 
         if problem_type == 'base_10':
-            exp = random.randint(1, 4)
+            exp = self.rng.randint(1, 4)
             value = 10 ** exp
 
             latex = f"\\text{{Evaluate: }} \\log {value}"
@@ -53,7 +49,7 @@ class LogarithmsGenerator:
             ]
 
         elif problem_type == 'base_2':
-            exp = random.randint(1, 6)
+            exp = self.rng.randint(1, 6)
             value = 2 ** exp
 
             latex = f"\\text{{Evaluate: }} \\log_2 {value}"
@@ -66,8 +62,8 @@ class LogarithmsGenerator:
             ]
 
         else:
-            base = random.choice([3, 4, 5])
-            exp = random.randint(1, 3)
+            base = self.rng.choice([3, 4, 5])
+            exp = self.rng.randint(1, 3)
             value = base ** exp
 
             latex = f"\\text{{Evaluate: }} \\log_{{{base}}} {value}"
@@ -83,10 +79,10 @@ class LogarithmsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Convert between exponential and logarithmic form"""
-        problem_type = random.choice(['exp_to_log', 'log_to_exp'])
+        problem_type = self.rng.choice(['exp_to_log', 'log_to_exp'])
 
-        base = random.choice([2, 3, 5, 10])
-        exp = random.randint(1, 4)
+        base = self.rng.choice([2, 3, 5, 10])
+        exp = self.rng.randint(1, 4)
         value = base ** exp
 
         if problem_type == 'exp_to_log':
@@ -112,11 +108,11 @@ class LogarithmsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Evaluate logs with fractions or negative exponents"""
-        problem_type = random.choice(['fraction', 'negative', 'special'])
+        problem_type = self.rng.choice(['fraction', 'negative', 'special'])
 
         if problem_type == 'fraction':
-            base = random.choice([2, 3, 4, 5])
-            exp = random.randint(1, 3)
+            base = self.rng.choice([2, 3, 4, 5])
+            exp = self.rng.randint(1, 3)
             value = base ** exp
 
             latex = f"\\text{{Evaluate: }} \\log_{{{base}}} \\frac{{1}}{{{value}}}"
@@ -128,8 +124,8 @@ class LogarithmsGenerator:
             ]
 
         elif problem_type == 'negative':
-            base = random.choice([2, 3, 5])
-            exp = random.randint(1, 3)
+            base = self.rng.choice([2, 3, 5])
+            exp = self.rng.randint(1, 3)
 
             latex = f"\\text{{Evaluate: }} \\log_{{{base}}} {base}^{{-{exp}}}"
             solution = str(-exp)
@@ -141,8 +137,8 @@ class LogarithmsGenerator:
 
         else:
             # log_b(1) or log_b(b)
-            base = random.choice([2, 3, 5, 7, 10])
-            special = random.choice(['one', 'base'])
+            base = self.rng.choice([2, 3, 5, 7, 10])
+            special = self.rng.choice(['one', 'base'])
 
             if special == 'one':
                 latex = f"\\text{{Evaluate: }} \\log_{{{base}}} 1"
@@ -163,12 +159,12 @@ class LogarithmsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Solve logarithmic equations or use properties"""
-        problem_type = random.choice(['solve', 'simplify', 'equation'])
+        problem_type = self.rng.choice(['solve', 'simplify', 'equation'])
 
         if problem_type == 'solve':
             # log_b(x) = n, find x
-            base = random.choice([2, 3, 5])
-            n = random.randint(2, 4)
+            base = self.rng.choice([2, 3, 5])
+            n = self.rng.randint(2, 4)
             x = base ** n
 
             latex = f"\\text{{Solve: }} \\log_{{{base}}} x = {n}"
@@ -182,9 +178,9 @@ class LogarithmsGenerator:
 
         elif problem_type == 'simplify':
             # Use log properties: log_b(b^x) = x
-            base = random.choice([2, 3, 5, 10])
-            a = random.randint(2, 4)
-            b_exp = random.randint(1, 3)
+            base = self.rng.choice([2, 3, 5, 10])
+            a = self.rng.randint(2, 4)
+            b_exp = self.rng.randint(1, 3)
 
             latex = f"\\text{{Simplify: }} {base}^{{\\log_{{{base}}} {a}}}"
             solution = str(a)
@@ -196,9 +192,9 @@ class LogarithmsGenerator:
 
         else:
             # log_b(x) + log_b(y) = log_b(xy)
-            base = random.choice([2, 10])
-            x = random.randint(2, 8)
-            y = random.randint(2, 8)
+            base = self.rng.choice([2, 10])
+            x = self.rng.randint(2, 8)
+            y = self.rng.randint(2, 8)
             product = x * y
 
             if base == 10:
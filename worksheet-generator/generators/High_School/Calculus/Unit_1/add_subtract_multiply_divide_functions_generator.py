@@ -3,14 +3,11 @@ Add, Subtract, Multiply, and Divide Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class AddSubtractMultiplyDivideFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class AddSubtractMultiplyDivideFunctionsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        operation = random.choice(['add', 'subtract'])
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        operation = self.rng.choice(['add', 'subtract'])
 
         if operation == 'add':
             latex = f"f(x) = {a}x, g(x) = {b}x. \\text{{ Find }} (f + g)(x)."
@@ -46,11 +43,11 @@ class AddSubtractMultiplyDivideFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(1, 4)
-        b = random.randint(1, 6)
-        c = random.randint(1, 4)
-        d = random.randint(1, 6)
-        operation = random.choice(['add', 'subtract', 'multiply'])
+        a = self.rng.randint(1, 4)
+        b = self.rng.randint(1, 6)
+        c = self.rng.randint(1, 4)
+        d = self.rng.randint(1, 6)
+        operation = self.rng.choice(['add', 'subtract', 'multiply'])
 
         if operation == 'add':
             latex = f"f(x) = {a}x + {b}, g(x) = {c}x + {d}. \\text{{ Find }} (f + g)(x)."
@@ -78,10 +75,10 @@ class AddSubtractMultiplyDivideFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(1, 3)
-        b = random.randint(1, 5)
-        c = random.randint(1, 3)
-        operation = random.choice(['multiply', 'divide'])
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 3)
+        operation = self.rng.choice(['multiply', 'divide'])
 
         if operation == 'multiply':
             latex = f"f(x) = {a}x + {b}, g(x) = {c}x. \\text{{ Find }} (f \\cdot g)(x)."
@@ -102,10 +99,10 @@ class AddSubtractMultiplyDivideFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(1, 3)
-        b = random.randint(1, 4)
-        c = random.randint(1, 3)
-        d = random.randint(1, 4)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(1, 4)
+        c = self.rng.randint(1, 3)
+        d = self.rng.randint(1, 4)
 
         latex = f"f(x) = {a}x + {b}, g(x) = {c}x + {d}. \\text{{ Find }} (f \\cdot g)(x)."
         solution = f"{a * c}x^2 + {a * d + b * c}x + {b * d}"
@@ -3,14 +3,11 @@ Composition of Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class CompositionFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class CompositionFunctionsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(1, 6)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 6)
 
         latex = f"f(x) = {a}x, g(x) = x + {b}. \\text{{ Find }} (f \\circ g)(x)."
         solution = f"{a}x + {a * b}"
@@ -37,9 +34,9 @@ class CompositionFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 4)
-        b = random.randint(1, 5)
-        c = random.randint(2, 4)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(2, 4)
 
         latex = f"f(x) = {a}x + {b}, g(x) = {c}x. \\text{{ Find }} (f \\circ g)(x)."
         solution = f"{a * c}x + {b}"
@@ -53,10 +50,10 @@ class CompositionFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 4)
-        b = random.randint(1, 5)
-        c = random.randint(2, 4)
-        d = random.randint(1, 5)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(2, 4)
+        d = self.rng.randint(1, 5)
 
         latex = f"f(x) = {a}x + {b}, g(x) = {c}x + {d}. \\text{{ Find }} (f \\circ g)(x)."
         solution = f"{a * c}x + {a * d + b}"
@@ -71,8 +68,8 @@ class CompositionFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 3)
-        b = random.randint(1, 4)
+        a = self.rng.randint(2, 3)
+        b = self.rng.randint(1, 4)
 
         latex = f"f(x) = x^2, g(x) = {a}x + {b}. \\text{{ Find }} (f \\circ g)(x)."
         solution = f"{a**2}x^2 + {2*a*b}x + {b**2}"
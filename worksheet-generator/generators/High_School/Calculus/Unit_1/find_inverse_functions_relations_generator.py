@@ -3,14 +3,11 @@ Find Inverse Functions and Relations Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FindInverseFunctionsRelationsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class FindInverseFunctionsRelationsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 6)
+        a = self.rng.randint(2, 6)
 
         latex = f"\\text{{Find the inverse of }} f(x) = {a}x."
         solution = f"f^{{-1}}(x) = \\frac{{x}}{{{a}}}"
@@ -36,7 +33,7 @@ class FindInverseFunctionsRelationsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        b = random.randint(1, 8)
+        b = self.rng.randint(1, 8)
 
         latex = f"\\text{{Find the inverse of }} f(x) = x + {b}."
         solution = f"f^{{-1}}(x) = x - {b}"
@@ -50,8 +47,8 @@ class FindInverseFunctionsRelationsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(1, 6)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 6)
 
         latex = f"\\text{{Find the inverse of }} f(x) = {a}x + {b}."
         solution = f"f^{{-1}}(x) = \\frac{{x - {b}}}{{{a}}}"
@@ -66,9 +63,9 @@ class FindInverseFunctionsRelationsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(1, 4)
-        b = random.randint(1, 5)
-        c = random.randint(1, 4)
+        a = self.rng.randint(1, 4)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 4)
 
         latex = f"\\text{{Find the inverse of }} f(x) = \\frac{{{a}x + {b}}}{{{c}}}."
         solution = f"f^{{-1}}(x) = \\frac{{{c}x - {b}}}{{{a}}}"
@@ -3,14 +3,11 @@ Find Values of Functions from Graphs Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FindValuesFunctionsGraphsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class FindValuesFunctionsGraphsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x = random.randint(-5, 5)
-        y = random.randint(-5, 5)
+        x = self.rng.randint(-5, 5)
+        y = self.rng.randint(-5, 5)
 
         latex = f"\\text{{Given a graph of }} f(x) \\text{{ passes through }} ({x}, {y}), \\text{{ find }} f({x})."
         solution = f"{y}"
@@ -36,8 +33,8 @@ class FindValuesFunctionsGraphsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x1, y1 = random.randint(-5, 5), random.randint(-5, 5)
-        x2, y2 = random.randint(-5, 5), random.randint(-5, 5)
+        x1, y1 = self.rng.randint(-5, 5), self.rng.randint(-5, 5)
+        x2, y2 = self.rng.randint(-5, 5), self.rng.randint(-5, 5)
 
         latex = f"\\text{{A graph of }} f(x) \\text{{ passes through }} ({x1}, {y1}) \\text{{ and }} ({x2}, {y2}). "
         latex += f"\\text{{Find }} f({x1}) + f({x2})."
@@ -51,9 +48,9 @@ class FindValuesFunctionsGraphsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x1, y1 = random.randint(-4, 4), random.randint(-4, 4)
-        x2, y2 = random.randint(-4, 4), random.randint(-4, 4)
-        k = random.randint(2, 5)
+        x1, y1 = self.rng.randint(-4, 4), self.rng.randint(-4, 4)
+        x2, y2 = self.rng.randint(-4, 4), self.rng.randint(-4, 4)
+        k = self.rng.randint(2, 5)
 
         latex = f"\\text{{Given }} f({x1}) = {y1} \\text{{ and }} f({x2}) = {y2}, \\text{{ find }} {k}f({x1}) - f({x2})."
         result = k * y1 - y2
@@ -67,8 +64,8 @@ class FindValuesFunctionsGraphsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        x1, y1 = random.randint(-3, 3), random.randint(1, 5)
-        x2, y2 = random.randint(-3, 3), random.randint(1, 5)
+        x1, y1 = self.rng.randint(-3, 3), self.rng.randint(1, 5)
+        x2, y2 = self.rng.randint(-3, 3), self.rng.randint(1, 5)
 
         latex = f"\\text{{From a graph: }} f({x1}) = {y1}, f({x2}) = {y2}. \\text{{ Find }} \\frac{{f({x1})}}{{f({x2})}}."
         if y2 == 0:
@@ -3,14 +3,11 @@ Find Values of Inverse Functions from Graphs Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FindValuesInverseGraphsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class FindValuesInverseGraphsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x = random.randint(1, 6)
-        y = random.randint(1, 8)
+        x = self.rng.randint(1, 6)
+        y = self.rng.randint(1, 8)
 
         latex = f"\\text{{The graph of }} f(x) \\text{{ passes through }} ({x}, {y}). \\text{{ Find }} f^{{-1}}({y})."
         solution = f"{x}"
@@ -36,8 +33,8 @@ class FindValuesInverseGraphsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x = random.randint(2, 7)
-        y = random.randint(3, 9)
+        x = self.rng.randint(2, 7)
+        y = self.rng.randint(3, 9)
 
         latex = f"\\text{{If }} ({x}, {y}) \\text{{ is on the graph of }} f, \\text{{ what point is on }} f^{{-1}}?"
         solution = f"({y}, {x})"
@@ -50,8 +47,8 @@ class FindValuesInverseGraphsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x1, y1 = random.randint(1, 5), random.randint(2, 7)
-        x2, y2 = random.randint(6, 10), random.randint(8, 12)
+        x1, y1 = self.rng.randint(1, 5), self.rng.randint(2, 7)
+        x2, y2 = self.rng.randint(6, 10), self.rng.randint(8, 12)
 
         latex = f"\\text{{Graph of }} f \\text{{ has points }} ({x1}, {y1}) \\text{{ and }} ({x2}, {y2}). "
         latex += f"\\text{{Find }} f^{{-1}}({y1}) \\cdot f^{{-1}}({y2})."
@@ -66,8 +63,8 @@ class FindValuesInverseGraphsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        x = random.randint(2, 6)
-        y = random.randint(3, 8)
+        x = self.rng.randint(2, 6)
+        y = self.rng.randint(3, 8)
 
         latex = f"\\text{{If }} ({x}, {y}) \\text{{ is on }} f, \\text{{ find }} (f^{{-1}} \\circ f)({x})."
         solution = f"{x}"
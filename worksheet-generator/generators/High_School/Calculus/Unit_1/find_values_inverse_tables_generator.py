@@ -3,14 +3,11 @@ Find Values of Inverse Functions from Tables Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FindValuesInverseTablesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class FindValuesInverseTablesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x_val = random.randint(1, 5)
-        y_val = random.randint(1, 8)
+        x_val = self.rng.randint(1, 5)
+        y_val = self.rng.randint(1, 8)
 
         latex = f"\\text{{Given }} f({x_val}) = {y_val}, \\text{{ find }} f^{{-1}}({y_val})."
         solution = f"{x_val}"
@@ -36,8 +33,8 @@ class FindValuesInverseTablesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x1, y1 = random.randint(1, 5), random.randint(1, 8)
-        x2, y2 = random.randint(6, 10), random.randint(9, 15)
+        x1, y1 = self.rng.randint(1, 5), self.rng.randint(1, 8)
+        x2, y2 = self.rng.randint(6, 10), self.rng.randint(9, 15)
 
         latex = f"\\text{{From a table: }} f({x1}) = {y1}, f({x2}) = {y2}. \\text{{ Find }} f^{{-1}}({y1}) + f^{{-1}}({y2})."
         result = x1 + x2
@@ -51,8 +48,8 @@ class FindValuesInverseTablesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x1, y1 = random.randint(2, 6), random.randint(2, 8)
-        x2, y2 = random.randint(7, 12), random.randint(9, 15)
+        x1, y1 = self.rng.randint(2, 6), self.rng.randint(2, 8)
+        x2, y2 = self.rng.randint(7, 12), self.rng.randint(9, 15)
 
         latex = f"\\text{{Given }} f({x1}) = {y1}, f({x2}) = {y2}. \\text{{ Find }} f^{{-1}}(f({x1}))."
         solution = f"{x1}"
@@ -66,8 +63,8 @@ class FindValuesInverseTablesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        x1, y1 = random.randint(2, 5), random.randint(3, 7)
-        x2, y2 = random.randint(6, 9), random.randint(8, 12)
+        x1, y1 = self.rng.randint(2, 5), self.rng.randint(3, 7)
+        x2, y2 = self.rng.randint(6, 9), self.rng.randint(8, 12)
 
         latex = f"\\text{{If }} f({x1}) = {y1}, f({x2}) = {y2}, \\text{{ find }} f(f^{{-1}}({y2}))."
         solution = f"{y2}"
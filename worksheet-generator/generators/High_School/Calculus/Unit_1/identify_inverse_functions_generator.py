@@ -3,14 +3,11 @@ Identify Inverse Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class IdentifyInverseFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class IdentifyInverseFunctionsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 5)
+        a = self.rng.randint(2, 5)
 
         latex = f"\\text{{Are }} f(x) = {a}x \\text{{ and }} g(x) = \\frac{{x}}{{{a}}} \\text{{ inverses?}}"
         solution = "Yes"
@@ -35,8 +32,8 @@ class IdentifyInverseFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(1, 6)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 6)
 
         latex = f"\\text{{Are }} f(x) = x + {b} \\text{{ and }} g(x) = x - {b} \\text{{ inverses?}}"
         solution = "Yes"
@@ -49,9 +46,9 @@ class IdentifyInverseFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 4)
-        b = random.randint(1, 5)
-        is_inverse = random.choice([True, False])
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(1, 5)
+        is_inverse = self.rng.choice([True, False])
 
         if is_inverse:
             latex = f"\\text{{Are }} f(x) = {a}x + {b} \\text{{ and }} g(x) = \\frac{{x - {b}}}{{{a}}} \\text{{ inverses?}}"
@@ -65,7 +62,7 @@ class IdentifyInverseFunctionsGenerator:
                 "\\text{Both compositions equal } x, \\text{ so they are inverses}"
             ]
         else:
-            wrong_b = b + random.randint(1, 3)
+            wrong_b = b + self.rng.randint(1, 3)
             latex = f"\\text{{Are }} f(x) = {a}x + {b} \\text{{ and }} g(x) = \\frac{{x - {wrong_b}}}{{{a}}} \\text{{ inverses?}}"
             solution = "No"
             steps = [
@@ -78,7 +75,7 @@ class IdentifyInverseFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 4)
+        a = self.rng.randint(2, 4)
 
         latex = f"\\text{{Verify }} f(x) = x^{{{a}}} \\text{{ and }} g(x) = \\sqrt[{a}]{{x}} \\text{{ are inverses for }} x \\geq 0."
         solution = "Yes, they are inverses"
@@ -3,14 +3,11 @@ Average Rate Change Ii Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class AverageRateChangeIiGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class AverageRateChangeIiGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 5)
-        x = random.randint(10, 30)
+        a = self.rng.randint(2, 5)
+        x = self.rng.randint(10, 30)
 
         latex = f"\\text{{Solve problem about average rate change ii}} (\\text{{easy}})"
         solution = f"{a * x}"
@@ -35,8 +32,8 @@ class AverageRateChangeIiGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(1, 4)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 4)
 
         latex = f"\\text{{Solve problem about average rate change ii}} (\\text{{medium}})"
         solution = f"{a + b}"
@@ -48,8 +45,8 @@ class AverageRateChangeIiGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 4)
-        b = random.randint(1, 3)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(1, 3)
 
         latex = f"\\text{{Solve problem about average rate change ii}} (\\text{{hard}})"
         solution = f"{a * b}"
@@ -61,8 +58,8 @@ class AverageRateChangeIiGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 3)
-        b = random.randint(2, 3)
+        a = self.rng.randint(2, 3)
+        b = self.rng.randint(2, 3)
 
         latex = f"\\text{{Solve problem about average rate change ii}} (\\text{{challenge}})"
         solution = f"{a ** b}"
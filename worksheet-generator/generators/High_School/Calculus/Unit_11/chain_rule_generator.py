@@ -3,14 +3,11 @@ Chain Rule Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ChainRuleGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,9 +20,9 @@ class ChainRuleGenerator:
 
     def _generate_easy(self) -> Equation:
         # (ax + b)^n
-        a = random.randint(2, 5)
-        b = random.randint(1, 6)
-        n = random.randint(2, 4)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 6)
+        n = self.rng.randint(2, 4)
 
         latex = f"\\text{{Find }} \\frac{{d}}{{dx}}[({a}x + {b})^{n}]"
         # Derivative: n(ax+b)^(n-1) * a
@@ -43,8 +40,8 @@ class ChainRuleGenerator:
 
     def _generate_medium(self) -> Equation:
         # sin(ax) or cos(ax)
-        a = random.randint(2, 5)
-        func_type = random.choice(['sin', 'cos'])
+        a = self.rng.randint(2, 5)
+        func_type = self.rng.choice(['sin', 'cos'])
 
         if func_type == 'sin':
             latex = f"\\text{{Find }} \\frac{{d}}{{dx}}[\\sin({a}x)]"
@@ -70,7 +67,7 @@ class ChainRuleGenerator:
 
     def _generate_hard(self) -> Equation:
         # e^(ax^2)
-        a = random.randint(2, 4)
+        a = self.rng.randint(2, 4)
 
         latex = f"\\text{{Find }} \\frac{{d}}{{dx}}[e^{{{a}x^2}}]"
         coef = 2 * a
@@ -86,7 +83,7 @@ class ChainRuleGenerator:
 
     def _generate_challenge(self) -> Equation:
         # ln(sin(x)) or similar nested function
-        a = random.randint(2, 4)
+        a = self.rng.randint(2, 4)
 
         latex = f"\\text{{Find }} \\frac{{d}}{{dx}}[\\ln(\\sin({a}x))]"
         solution = f"{a}\\cot({a}x)"
@@ -3,14 +3,11 @@ Describe Function Transformations Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class DescribeFunctionTransformationsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class DescribeFunctionTransformationsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        h = random.randint(2, 6)
-        direction = random.choice(['right', 'left'])
+        h = self.rng.randint(2, 6)
+        direction = self.rng.choice(['right', 'left'])
 
         if direction == 'right':
             latex = f"\\text{{Describe how }} g(x) = (x - {h})^2 \\text{{ is transformed from }} f(x) = x^2."
@@ -45,8 +42,8 @@ class DescribeFunctionTransformationsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 5)
-        k = random.randint(1, 6)
+        a = self.rng.randint(2, 5)
+        k = self.rng.randint(1, 6)
 
         latex = f"\\text{{Describe: }} g(x) = {a}x^2 + {k} \\text{{ from }} f(x) = x^2."
         solution = f"Vertical stretch by {a}, shift up {k}"
@@ -59,9 +56,9 @@ class DescribeFunctionTransformationsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 4)
-        h = random.randint(1, 5)
-        k = random.randint(1, 6)
+        a = self.rng.randint(2, 4)
+        h = self.rng.randint(1, 5)
+        k = self.rng.randint(1, 6)
 
         latex = f"\\text{{Describe: }} g(x) = {a}(x - {h})^2 + {k} \\text{{ from }} f(x) = x^2."
         solution = f"Stretch {a}, right {h}, up {k}"
@@ -75,9 +72,9 @@ class DescribeFunctionTransformationsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 3)
-        h = random.randint(1, 4)
-        k = random.randint(1, 5)
+        a = self.rng.randint(2, 3)
+        h = self.rng.randint(1, 4)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe: }} g(x) = -{a}|x + {h}| - {k} \\text{{ from }} f(x) = |x|."
         solution = f"Reflect x-axis, stretch {a}, left {h}, down {k}"
@@ -3,14 +3,11 @@ Dilations of Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class DilationsFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class DilationsFunctionsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 5)
+        a = self.rng.randint(2, 5)
 
         latex = f"\\text{{Vertically stretch }} f(x) = x^2 \\text{{ by a factor of }} {a}."
         solution = f"g(x) = {a}x^2"
@@ -35,7 +32,7 @@ class DilationsFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 4)
+        a = self.rng.randint(2, 4)
 
         latex = f"\\text{{Vertically compress }} f(x) = x^2 \\text{{ by a factor of }} \\frac{{1}}{{{a}}}."
         solution = f"g(x) = \\frac{{1}}{{{a}}}x^2"
@@ -48,7 +45,7 @@ class DilationsFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        b = random.randint(2, 4)
+        b = self.rng.randint(2, 4)
 
         latex = f"\\text{{Horizontally compress }} f(x) = x^2 \\text{{ by a factor of }} \\frac{{1}}{{{b}}}."
         solution = f"g(x) = ({b}x)^2 = {b**2}x^2"
@@ -62,8 +59,8 @@ class DilationsFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 3)
-        b = random.randint(2, 3)
+        a = self.rng.randint(2, 3)
+        b = self.rng.randint(2, 3)
 
         latex = f"\\text{{Vertically stretch }} f(x) = |x| \\text{{ by }} {a}, \\text{{ then horizontally stretch by }} {b}."
         solution = f"g(x) = {a}\\left|\\frac{{x}}{{{b}}}\\right|"
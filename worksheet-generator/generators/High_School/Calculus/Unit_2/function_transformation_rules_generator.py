@@ -3,14 +3,11 @@ Function Transformation Rules Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FunctionTransformationRulesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class FunctionTransformationRulesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        k = random.randint(2, 6)
-        direction = random.choice(['up', 'down', 'left', 'right'])
+        k = self.rng.randint(2, 6)
+        direction = self.rng.choice(['up', 'down', 'left', 'right'])
 
         if direction == 'up':
             latex = f"\\text{{Describe the transformation: }} g(x) = f(x) + {k}"
@@ -61,8 +58,8 @@ class FunctionTransformationRulesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 4)
-        transform_type = random.choice(['vertical_stretch', 'vertical_compression', 'horizontal_stretch'])
+        a = self.rng.randint(2, 4)
+        transform_type = self.rng.choice(['vertical_stretch', 'vertical_compression', 'horizontal_stretch'])
 
         if transform_type == 'vertical_stretch':
             latex = f"\\text{{Describe: }} g(x) = {a}f(x)"
@@ -92,7 +89,7 @@ class FunctionTransformationRulesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        reflection = random.choice(['x-axis', 'y-axis'])
+        reflection = self.rng.choice(['x-axis', 'y-axis'])
 
         if reflection == 'x-axis':
             latex = "\\text{Describe: } g(x) = -f(x)"
@@ -114,9 +111,9 @@ class FunctionTransformationRulesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 3)
-        h = random.randint(1, 4)
-        k = random.randint(1, 5)
+        a = self.rng.randint(2, 3)
+        h = self.rng.randint(1, 4)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe: }} g(x) = {a}f(x - {h}) + {k}"
         solution = f"Right {h}, vertical stretch {a}, up {k}"
@@ -3,14 +3,11 @@ Reflections of Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ReflectionsFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class ReflectionsFunctionsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        axis = random.choice(['x-axis', 'y-axis'])
+        axis = self.rng.choice(['x-axis', 'y-axis'])
 
         if axis == 'x-axis':
             latex = "\\text{Reflect } f(x) = x^2 \\text{ across the x-axis. Write the new function.}"
@@ -45,8 +42,8 @@ class ReflectionsFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 5)
-        axis = random.choice(['x-axis', 'y-axis'])
+        a = self.rng.randint(2, 5)
+        axis = self.rng.choice(['x-axis', 'y-axis'])
 
         if axis == 'x-axis':
             latex = f"\\text{{Reflect }} f(x) = {a}x \\text{{ across the x-axis.}}"
@@ -78,7 +75,7 @@ class ReflectionsFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        h = random.randint(1, 4)
+        h = self.rng.randint(1, 4)
 
         latex = f"\\text{{Reflect }} f(x) = x^3 \\text{{ across the y-axis, then shift right }} {h} \\text{{ units.}}"
         solution = f"g(x) = -(x - {h})^3"
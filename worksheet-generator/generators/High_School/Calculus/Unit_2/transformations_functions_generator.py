@@ -3,14 +3,11 @@ Transformations of Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class TransformationsFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class TransformationsFunctionsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        h = random.randint(1, 5)
-        k = random.randint(1, 6)
+        h = self.rng.randint(1, 5)
+        k = self.rng.randint(1, 6)
 
         latex = f"\\text{{Transform }} f(x) = x^2: \\text{{ right }} {h}, \\text{{ up }} {k}."
         solution = f"g(x) = (x - {h})^2 + {k}"
@@ -36,8 +33,8 @@ class TransformationsFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 4)
-        k = random.randint(1, 5)
+        a = self.rng.randint(2, 4)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Transform }} f(x) = x^2: \\text{{ vertical stretch by }} {a}, \\text{{ up }} {k}."
         solution = f"g(x) = {a}x^2 + {k}"
@@ -50,9 +47,9 @@ class TransformationsFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 3)
-        h = random.randint(1, 4)
-        k = random.randint(1, 5)
+        a = self.rng.randint(2, 3)
+        h = self.rng.randint(1, 4)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Transform }} f(x) = x^2: \\text{{ stretch by }} {a}, \\text{{ right }} {h}, \\text{{ up }} {k}."
         solution = f"g(x) = {a}(x - {h})^2 + {k}"
@@ -66,9 +63,9 @@ class TransformationsFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 3)
-        h = random.randint(1, 3)
-        k = random.randint(1, 4)
+        a = self.rng.randint(2, 3)
+        h = self.rng.randint(1, 3)
+        k = self.rng.randint(1, 4)
 
         latex = f"\\text{{Transform }} f(x) = x^3: \\text{{ reflect x-axis, stretch by }} {a}, \\text{{ left }} {h}, \\text{{ down }} {k}."
         solution = f"g(x) = -{a}(x + {h})^3 - {k}"
@@ -3,14 +3,11 @@ Translations of Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class TranslationsFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class TranslationsFunctionsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        k = random.randint(2, 7)
-        direction = random.choice(['up', 'down'])
+        k = self.rng.randint(2, 7)
+        direction = self.rng.choice(['up', 'down'])
 
         if direction == 'up':
             latex = f"\\text{{Translate }} f(x) = x^2 \\text{{ up }} {k} \\text{{ units. Write the new function.}}"
@@ -45,8 +42,8 @@ class TranslationsFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        h = random.randint(2, 6)
-        direction = random.choice(['left', 'right'])
+        h = self.rng.randint(2, 6)
+        direction = self.rng.choice(['left', 'right'])
 
         if direction == 'left':
             latex = f"\\text{{Translate }} f(x) = x^2 \\text{{ left }} {h} \\text{{ units. Write the new function.}}"
@@ -68,8 +65,8 @@ class TranslationsFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        h = random.randint(1, 5)
-        k = random.randint(1, 6)
+        h = self.rng.randint(1, 5)
+        k = self.rng.randint(1, 6)
 
         latex = f"\\text{{Translate }} f(x) = x^2 \\text{{ right }} {h} \\text{{ and up }} {k}. \\text{{ Write the new function.}}"
         solution = f"g(x) = (x - {h})^2 + {k}"
@@ -82,8 +79,8 @@ class TranslationsFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        h = random.randint(1, 4)
-        k = random.randint(1, 5)
+        h = self.rng.randint(1, 4)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Translate }} f(x) = |x| \\text{{ left }} {h} \\text{{ and down }} {k}. \\text{{ Write the new function.}}"
         solution = f"g(x) = |x + {h}| - {k}"
@@ -3,15 +3,12 @@ Convert Radians to Degrees Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 import math
 
 class ConvertRadiansDegreesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -24,7 +21,7 @@ class ConvertRadiansDegreesGenerator:
 
     def _generate_easy(self) -> Equation:
         angles = [30, 45, 60, 90, 120, 135, 150, 180]
-        deg = random.choice(angles)
+        deg = self.rng.choice(angles)
 
         latex = f"\\text{{Convert }} {deg}^\\circ \\text{{ to radians.}}"
         # Calculate radians in terms of pi
@@ -51,7 +48,7 @@ class ConvertRadiansDegreesGenerator:
     def _generate_medium(self) -> Equation:
         # Radians to degrees
         fractions = [(1,6), (1,4), (1,3), (1,2), (2,3), (3,4), (5,6)]
-        num, den = random.choice(fractions)
+        num, den = self.rng.choice(fractions)
 
         latex = f"\\text{{Convert }} \\frac{{{num}\\pi}}{{{den}}} \\text{{ to degrees.}}"
         degrees = (num * 180) // den
@@ -66,7 +63,7 @@ class ConvertRadiansDegreesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        deg = random.randint(1, 360)
+        deg = self.rng.randint(1, 360)
 
         latex = f"\\text{{Convert }} {deg}^\\circ \\text{{ to radians (exact form).}}"
 
@@ -90,7 +87,7 @@ class ConvertRadiansDegreesGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Multiple conversions
-        deg1, deg2 = random.randint(30, 90), random.randint(120, 180)
+        deg1, deg2 = self.rng.randint(30, 90), self.rng.randint(120, 180)
 
         latex = f"\\text{{Convert }} {deg1}^\\circ \\text{{ and }} {deg2}^\\circ \\text{{ to radians, then find their sum.}}"
 
@@ -3,14 +3,11 @@ Find Properties of Cosine Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FindPropertiesCosineGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class FindPropertiesCosineGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 6)
+        a = self.rng.randint(2, 6)
 
         latex = f"\\text{{Find the amplitude of }} f(x) = {a}\\cos(x)."
         solution = f"{a}"
@@ -34,7 +31,7 @@ class FindPropertiesCosineGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        b = random.randint(2, 5)
+        b = self.rng.randint(2, 5)
 
         latex = f"\\text{{Find the period of }} f(x) = \\cos({b}x)."
         solution = f"\\frac{{2\\pi}}{{{b}}}"
@@ -46,9 +43,9 @@ class FindPropertiesCosineGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(2, 4)
-        k = random.randint(-3, 3)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 4)
+        k = self.rng.randint(-3, 3)
         k_str = f"+ {k}" if k >= 0 else f"- {abs(k)}"
 
         latex = f"\\text{{Find amplitude, period, and midline of }} f(x) = {a}\\cos({b}x) {k_str}."
@@ -62,10 +59,10 @@ class FindPropertiesCosineGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 4)
-        b = random.randint(2, 3)
-        c = random.randint(1, 3)
-        d = random.randint(1, 3)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(2, 3)
+        c = self.rng.randint(1, 3)
+        d = self.rng.randint(1, 3)
 
         latex = f"\\text{{Find all properties of }} f(x) = {a}\\cos({b}(x + {c})) - {d}."
         solution = f"Amp: {a}, Period: \\frac{{2\\pi}}{{{b}}}, Phase left: {c}, Midline: -{d}"
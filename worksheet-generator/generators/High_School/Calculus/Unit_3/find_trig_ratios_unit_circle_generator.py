@@ -3,14 +3,11 @@ Find Trigonometric Ratios Using Unit Circle Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FindTrigRatiosUnitCircleGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -30,8 +27,8 @@ class FindTrigRatiosUnitCircleGenerator:
             "\\frac{\\pi}{2}": {"sin": "1", "cos": "0", "tan": "\\text{undefined}"}
         }
 
-        angle = random.choice(list(special_angles.keys()))
-        func = random.choice(['sin', 'cos', 'tan'])
+        angle = self.rng.choice(list(special_angles.keys()))
+        func = self.rng.choice(['sin', 'cos', 'tan'])
 
         latex = f"\\text{{Find }} \\{func}({angle})."
         solution = special_angles[angle][func]
@@ -49,8 +46,8 @@ class FindTrigRatiosUnitCircleGenerator:
             "\\frac{5\\pi}{6}": {"sin": "\\frac{1}{2}", "cos": "-\\frac{\\sqrt{3}}{2}"}
         }
 
-        angle = random.choice(list(angles_q2.keys()))
-        func = random.choice(['sin', 'cos'])
+        angle = self.rng.choice(list(angles_q2.keys()))
+        func = self.rng.choice(['sin', 'cos'])
 
         latex = f"\\text{{Find }} \\{func}({angle})."
         solution = angles_q2[angle][func]
@@ -68,8 +65,8 @@ class FindTrigRatiosUnitCircleGenerator:
             "\\frac{4\\pi}{3}": {"sin": "-\\frac{\\sqrt{3}}{2}", "cos": "-\\frac{1}{2}"}
         }
 
-        angle = random.choice(list(angles_q3.keys()))
-        func = random.choice(['sin', 'cos'])
+        angle = self.rng.choice(list(angles_q3.keys()))
+        func = self.rng.choice(['sin', 'cos'])
 
         latex = f"\\text{{Find }} \\{func}({angle})."
         solution = angles_q3[angle][func]
@@ -88,8 +85,8 @@ class FindTrigRatiosUnitCircleGenerator:
             "\\frac{11\\pi}{6}": {"sin": "-\\frac{1}{2}", "cos": "\\frac{\\sqrt{3}}{2}"}
         }
 
-        angle = random.choice(list(angles_q4.keys()))
-        func = random.choice(['sin', 'cos', 'tan'])
+        angle = self.rng.choice(list(angles_q4.keys()))
+        func = self.rng.choice(['sin', 'cos', 'tan'])
 
         if func == 'tan':
             sin_val = angles_q4[angle]['sin']
@@ -3,14 +3,11 @@ Graph Sine and Cosine Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class GraphSineCosineGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class GraphSineCosineGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 4)
-        func = random.choice(['sin', 'cos'])
+        a = self.rng.randint(2, 4)
+        func = self.rng.choice(['sin', 'cos'])
 
         latex = f"\\text{{Graph }} f(x) = {a}\\{func}(x). \\text{{ State key points.}}"
         solution = f"Amplitude {a}, standard {func} shape"
@@ -37,9 +34,9 @@ class GraphSineCosineGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 3)
-        k = random.randint(1, 4)
-        func = random.choice(['sin', 'cos'])
+        a = self.rng.randint(2, 3)
+        k = self.rng.randint(1, 4)
+        func = self.rng.choice(['sin', 'cos'])
 
         latex = f"\\text{{Graph }} f(x) = {a}\\{func}(x) + {k}."
         solution = f"Shifted up {k}, amplitude {a}"
@@ -53,9 +50,9 @@ class GraphSineCosineGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 3)
-        b = random.randint(2, 3)
-        func = random.choice(['sin', 'cos'])
+        a = self.rng.randint(2, 3)
+        b = self.rng.randint(2, 3)
+        func = self.rng.choice(['sin', 'cos'])
 
         latex = f"\\text{{Graph }} f(x) = {a}\\{func}({b}x)."
         solution = f"Amplitude {a}, period \\frac{{2\\pi}}{{{b}}}"
@@ -69,11 +66,11 @@ class GraphSineCosineGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 3)
-        b = random.randint(2, 3)
-        c = random.randint(1, 2)
-        d = random.randint(1, 3)
-        func = random.choice(['sin', 'cos'])
+        a = self.rng.randint(2, 3)
+        b = self.rng.randint(2, 3)
+        c = self.rng.randint(1, 2)
+        d = self.rng.randint(1, 3)
+        func = self.rng.choice(['sin', 'cos'])
 
         latex = f"\\text{{Graph }} f(x) = {a}\\{func}({b}(x - {c})) + {d}."
         solution = f"Full transformation with all parameters"
@@ -3,14 +3,11 @@ Inverses of Trigonometric Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class InversesTrigFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -27,7 +24,7 @@ class InversesTrigFunctionsGenerator:
             ("\\frac{\\sqrt{2}}{2}", "\\frac{\\pi}{4}"), ("\\frac{\\sqrt{3}}{2}", "\\frac{\\pi}{3}"),
             ("1", "\\frac{\\pi}{2}")
         ]
-        val, result = random.choice(values)
+        val, result = self.rng.choice(values)
 
         latex = f"\\text{{Find }} \\arcsin\\left({val}\\right)."
         solution = result
@@ -45,7 +42,7 @@ class InversesTrigFunctionsGenerator:
             ("\\frac{\\sqrt{2}}{2}", "\\frac{\\pi}{4}"), ("\\frac{\\sqrt{3}}{2}", "\\frac{\\pi}{6}"),
             ("1", "0")
         ]
-        val, result = random.choice(values)
+        val, result = self.rng.choice(values)
 
         latex = f"\\text{{Find }} \\arccos\\left({val}\\right)."
         solution = result
@@ -62,7 +59,7 @@ class InversesTrigFunctionsGenerator:
             ("0", "0"), ("1", "\\frac{\\pi}{4}"),
             ("\\sqrt{3}", "\\frac{\\pi}{3}"), ("-1", "-\\frac{\\pi}{4}")
         ]
-        val, result = random.choice(values)
+        val, result = self.rng.choice(values)
 
         latex = f"\\text{{Find }} \\arctan\\left({val}\\right)."
         solution = result
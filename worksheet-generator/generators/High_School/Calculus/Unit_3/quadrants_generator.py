@@ -3,14 +3,11 @@ Quadrants Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class QuadrantsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -28,7 +25,7 @@ class QuadrantsGenerator:
             (210, "III"), (225, "III"), (240, "III"),
             (300, "IV"), (315, "IV"), (330, "IV")
         ]
-        deg, quad = random.choice(angles)
+        deg, quad = self.rng.choice(angles)
 
         latex = f"\\text{{In which quadrant is }} {deg}^\\circ?"
         solution = f"Quadrant {quad}"
@@ -46,7 +43,7 @@ class QuadrantsGenerator:
             ("\\frac{7\\pi}{6}", "III"), ("\\frac{5\\pi}{4}", "III"), ("\\frac{4\\pi}{3}", "III"),
             ("\\frac{5\\pi}{3}", "IV"), ("\\frac{7\\pi}{4}", "IV"), ("\\frac{11\\pi}{6}", "IV")
         ]
-        angle, quad = random.choice(fractions)
+        angle, quad = self.rng.choice(fractions)
 
         latex = f"\\text{{In which quadrant is }} {angle}?"
         solution = f"Quadrant {quad}"
@@ -58,7 +55,7 @@ class QuadrantsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        angle = random.randint(361, 720)
+        angle = self.rng.randint(361, 720)
         normalized = angle % 360
 
         if 0 < normalized < 90:
@@ -80,7 +77,7 @@ class QuadrantsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        angle = -(random.randint(30, 330))
+        angle = -(self.rng.randint(30, 330))
         normalized = angle % 360
 
         if 0 < normalized < 90:
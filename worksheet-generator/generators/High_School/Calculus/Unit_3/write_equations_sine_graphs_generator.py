@@ -3,14 +3,11 @@ Write Equations from Sine Graphs Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class WriteEquationsSineGraphsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class WriteEquationsSineGraphsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 5)
+        a = self.rng.randint(2, 5)
 
         latex = f"\\text{{Write equation for sine with amplitude }} {a}."
         solution = f"f(x) = {a}\\sin(x)"
@@ -35,8 +32,8 @@ class WriteEquationsSineGraphsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 4)
-        k = random.randint(1, 5)
+        a = self.rng.randint(2, 4)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Write equation: amplitude }} {a}, \\text{{ midline }} y = {k}."
         solution = f"f(x) = {a}\\sin(x) + {k}"
@@ -49,8 +46,8 @@ class WriteEquationsSineGraphsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 4)
-        b = random.randint(2, 4)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(2, 4)
 
         latex = f"\\text{{Write equation: amplitude }} {a}, \\text{{ period }} \\frac{{2\\pi}}{{{b}}}."
         solution = f"f(x) = {a}\\sin({b}x)"
@@ -63,10 +60,10 @@ class WriteEquationsSineGraphsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 3)
-        b = random.randint(2, 3)
-        c = random.randint(1, 3)
-        d = random.randint(1, 3)
+        a = self.rng.randint(2, 3)
+        b = self.rng.randint(2, 3)
+        c = self.rng.randint(1, 3)
+        d = self.rng.randint(1, 3)
 
         latex = f"\\text{{Write equation: amp }} {a}, \\text{{ period }} \\frac{{2\\pi}}{{{b}}}, \\text{{ phase right }} {c}, \\text{{ midline }} y = {d}."
         solution = f"f(x) = {a}\\sin({b}(x - {c})) + {d}"
@@ -3,14 +3,11 @@ Convert Between Exponential and Logarithmic Forms Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ConvertExponentialLogarithmicGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class ConvertExponentialLogarithmicGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        base = random.randint(2, 5)
-        exp = random.randint(2, 4)
+        base = self.rng.randint(2, 5)
+        exp = self.rng.randint(2, 4)
         result = base ** exp
 
         latex = f"\\text{{Convert to logarithmic form: }} {base}^{{{exp}}} = {result}"
@@ -36,9 +33,9 @@ class ConvertExponentialLogarithmicGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        base = random.randint(2, 5)
-        x = random.randint(10, 50)
-        y = random.randint(2, 4)
+        base = self.rng.randint(2, 5)
+        x = self.rng.randint(10, 50)
+        y = self.rng.randint(2, 4)
 
         latex = f"\\text{{Convert to exponential form: }} \\log_{{{base}}}({x}) = {y}"
         solution = f"{base}^{{{y}}} = {x}"
@@ -50,8 +47,8 @@ class ConvertExponentialLogarithmicGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        base = random.randint(2, 4)
-        exp = random.randint(2, 3)
+        base = self.rng.randint(2, 4)
+        exp = self.rng.randint(2, 3)
 
         latex = f"\\text{{Convert to logarithmic form: }} {base}^{{{exp}}} = x"
         solution = f"\\log_{{{base}}}(x) = {exp}"
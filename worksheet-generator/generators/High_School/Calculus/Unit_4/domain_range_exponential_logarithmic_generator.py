@@ -3,14 +3,11 @@ Domain and Range of Exponential and Logarithmic Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class DomainRangeExponentialLogarithmicGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class DomainRangeExponentialLogarithmicGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 5)
+        a = self.rng.randint(2, 5)
 
         latex = f"\\text{{Find the domain of }} f(x) = {a}^x."
         solution = "(-\\infty, \\infty)"
@@ -34,7 +31,7 @@ class DomainRangeExponentialLogarithmicGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 5)
+        a = self.rng.randint(2, 5)
 
         latex = f"\\text{{Find the range of }} f(x) = {a}^x."
         solution = "(0, \\infty)"
@@ -59,7 +56,7 @@ class DomainRangeExponentialLogarithmicGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 5)
+        a = self.rng.randint(2, 5)
 
         latex = f"\\text{{Find domain and range of }} f(x) = \\log(x - {a})."
         solution = f"Domain: ({a}, \\infty), Range: (-\\infty, \\infty)"
@@ -3,14 +3,11 @@ Evaluate Logarithms Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class EvaluateLogarithmsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class EvaluateLogarithmsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        base = random.choice([2, 3, 5, 10])
-        exp = random.randint(2, 4)
+        base = self.rng.choice([2, 3, 5, 10])
+        exp = self.rng.randint(2, 4)
         value = base ** exp
 
         latex = f"\\text{{Evaluate }} \\log_{{{base}}}({value})."
@@ -36,8 +33,8 @@ class EvaluateLogarithmsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        base = random.choice([2, 3, 4, 5])
-        exp = random.randint(-2, -1)
+        base = self.rng.choice([2, 3, 4, 5])
+        exp = self.rng.randint(-2, -1)
         value_num = 1
         value_den = base ** abs(exp)
 
@@ -51,7 +48,7 @@ class EvaluateLogarithmsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        base = random.choice([2, 3, 4, 5, 9])
+        base = self.rng.choice([2, 3, 4, 5, 9])
 
         latex = f"\\text{{Evaluate }} \\log_{{{base}}}({base})."
         solution = "1"
@@ -63,9 +60,9 @@ class EvaluateLogarithmsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        base = random.choice([2, 3, 5])
-        exp1 = random.randint(2, 3)
-        exp2 = random.randint(2, 3)
+        base = self.rng.choice([2, 3, 5])
+        exp1 = self.rng.randint(2, 3)
+        exp2 = self.rng.randint(2, 3)
         val1 = base ** exp1
         val2 = base ** exp2
         product = val1 * val2
@@ -3,14 +3,11 @@ Evaluate Logarithms Using Properties Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class EvaluateLogarithmsPropertiesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class EvaluateLogarithmsPropertiesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        base = random.choice([2, 3, 5])
+        base = self.rng.choice([2, 3, 5])
 
         latex = f"\\text{{Evaluate: }} \\log_{{{base}}}({base}^2) + \\log_{{{base}}}({base}^3)"
         solution = "5"
@@ -35,7 +32,7 @@ class EvaluateLogarithmsPropertiesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        base = random.choice([2, 3])
+        base = self.rng.choice([2, 3])
         val1 = base ** 3
         val2 = base ** 2
 
@@ -3,14 +3,11 @@ Power Property of Logarithms Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class PowerPropertyLogarithmsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class PowerPropertyLogarithmsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        base = random.randint(2, 5)
-        exp = random.randint(2, 4)
-        k = random.randint(2, 4)
+        base = self.rng.randint(2, 5)
+        exp = self.rng.randint(2, 4)
+        k = self.rng.randint(2, 4)
 
         latex = f"\\text{{Simplify: }} \\log_{{{base}}}(x^{{{k}}})"
         solution = f"{k}\\log_{{{base}}}(x)"
@@ -36,9 +33,9 @@ class PowerPropertyLogarithmsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        base = random.randint(2, 4)
-        k1 = random.randint(2, 4)
-        k2 = random.randint(2, 4)
+        base = self.rng.randint(2, 4)
+        k1 = self.rng.randint(2, 4)
+        k2 = self.rng.randint(2, 4)
 
         latex = f"\\text{{Simplify: }} {k1}\\log_{{{base}}}(x) + {k2}\\log_{{{base}}}(x)"
         result = k1 + k2
@@ -51,8 +48,8 @@ class PowerPropertyLogarithmsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        base = random.randint(2, 4)
-        k = random.randint(2, 4)
+        base = self.rng.randint(2, 4)
+        k = self.rng.randint(2, 4)
 
         latex = f"\\text{{Expand: }} \\log_{{{base}}}(x^{{{k}}}y^2)"
         solution = f"{k}\\log_{{{base}}}(x) + 2\\log_{{{base}}}(y)"
@@ -3,14 +3,11 @@ Determine if Limit Exists Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class DetermineLimitExistsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class DetermineLimitExistsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x_val = random.randint(1, 5)
-        val = random.randint(3, 8)
+        x_val = self.rng.randint(1, 5)
+        val = self.rng.randint(3, 8)
 
         latex = f"\\text{{If }} \\lim_{{x \\to {x_val}^-}} f(x) = {val} \\text{{ and }} \\lim_{{x \\to {x_val}^+}} f(x) = {val}, \\text{{ does }} \\lim_{{x \\to {x_val}}} f(x) \\text{{ exist?}}"
         solution = "Yes"
@@ -37,9 +34,9 @@ class DetermineLimitExistsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x_val = random.randint(1, 5)
-        left_val = random.randint(2, 5)
-        right_val = left_val + random.randint(1, 3)
+        x_val = self.rng.randint(1, 5)
+        left_val = self.rng.randint(2, 5)
+        right_val = left_val + self.rng.randint(1, 3)
 
         latex = f"\\text{{If }} \\lim_{{x \\to {x_val}^-}} f(x) = {left_val} \\text{{ and }} \\lim_{{x \\to {x_val}^+}} f(x) = {right_val}, \\text{{ does the limit exist?}}"
         solution = "No"
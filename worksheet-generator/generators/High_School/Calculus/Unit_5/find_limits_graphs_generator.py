@@ -3,14 +3,11 @@ Find Limits from Graphs Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FindLimitsGraphsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class FindLimitsGraphsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x_val = random.randint(1, 5)
-        y_val = random.randint(2, 8)
+        x_val = self.rng.randint(1, 5)
+        y_val = self.rng.randint(2, 8)
 
         latex = f"\\text{{From a graph, if }} f(x) \\text{{ approaches }} {y_val} \\text{{ as }} x \\to {x_val}, \\text{{ find }} \\lim_{{x \\to {x_val}}} f(x)."
         solution = f"{y_val}"
@@ -35,9 +32,9 @@ class FindLimitsGraphsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x_val = random.randint(1, 5)
-        a = random.randint(1, 3)
-        b = random.randint(1, 5)
+        x_val = self.rng.randint(1, 5)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{Evaluate }} \\lim_{{x \\to {x_val}}} ({a}x + {b})."
         result = a * x_val + b
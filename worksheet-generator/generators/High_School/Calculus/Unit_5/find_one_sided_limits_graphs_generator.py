@@ -3,14 +3,11 @@ Find One-Sided Limits from Graphs Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FindOneSidedLimitsGraphsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class FindOneSidedLimitsGraphsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x_val = random.randint(1, 5)
-        left_val = random.randint(2, 6)
+        x_val = self.rng.randint(1, 5)
+        left_val = self.rng.randint(2, 6)
 
         latex = f"\\text{{From a graph, find }} \\lim_{{x \\to {x_val}^-}} f(x) \\text{{ if the left side approaches }} {left_val}."
         solution = f"{left_val}"
@@ -35,8 +32,8 @@ class FindOneSidedLimitsGraphsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x_val = random.randint(1, 5)
-        right_val = random.randint(3, 7)
+        x_val = self.rng.randint(1, 5)
+        right_val = self.rng.randint(3, 7)
 
         latex = f"\\text{{From a graph, find }} \\lim_{{x \\to {x_val}^+}} f(x) \\text{{ if the right side approaches }} {right_val}."
         solution = f"{right_val}"
@@ -48,7 +45,7 @@ class FindOneSidedLimitsGraphsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x_val = random.randint(1, 4)
+        x_val = self.rng.randint(1, 4)
 
         latex = f"\\text{{Find }} \\lim_{{x \\to {x_val}^-}} \\frac{{1}}{{x-{x_val}}}."
         solution = "-\\infty"
@@ -3,14 +3,11 @@ Limits with Addition Subtraction and Multiplication Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class LimitsAdditionSubtractionMultiplicationGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class LimitsAdditionSubtractionMultiplicationGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        c = random.randint(2, 4)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(2, 4)
 
         latex = f"\\text{{Evaluate }} \\lim_{{x \\to {c}}} ({a}x + {b})."
         result = a * c + b
@@ -38,9 +35,9 @@ class LimitsAdditionSubtractionMultiplicationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(1, 4)
-        b = random.randint(1, 4)
-        c = random.randint(2, 4)
+        a = self.rng.randint(1, 4)
+        b = self.rng.randint(1, 4)
+        c = self.rng.randint(2, 4)
 
         latex = f"\\text{{Evaluate }} \\lim_{{x \\to {c}}} (x^2 + {a}x - {b})."
         result = c**2 + a*c - b
@@ -54,7 +51,7 @@ class LimitsAdditionSubtractionMultiplicationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        c = random.randint(2, 4)
+        c = self.rng.randint(2, 4)
 
         latex = f"\\text{{Evaluate }} \\lim_{{x \\to {c}}} x(x+1)."
         result = c * (c + 1)
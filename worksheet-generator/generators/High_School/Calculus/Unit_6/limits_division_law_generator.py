@@ -3,14 +3,11 @@ Limits with Division Law Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class LimitsDivisionLawGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class LimitsDivisionLawGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(1, 4)
-        c = random.randint(2, 4)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 4)
+        c = self.rng.randint(2, 4)
 
         latex = f"\\text{{Evaluate }} \\lim_{{x \\to {c}}} \\frac{{{a}x}}{{{b}}}."
         result = (a * c) / b
@@ -38,7 +35,7 @@ class LimitsDivisionLawGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        c = random.randint(1, 4)
+        c = self.rng.randint(1, 4)
 
         latex = f"\\text{{Evaluate }} \\lim_{{x \\to {c}}} \\frac{{x+1}}{{x}}."
         result = (c + 1) / c
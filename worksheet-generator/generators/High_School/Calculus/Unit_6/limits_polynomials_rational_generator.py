@@ -3,14 +3,11 @@ Limits of Polynomials and Rational Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class LimitsPolynomialsRationalGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class LimitsPolynomialsRationalGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 5)
-        c = random.randint(1, 4)
+        a = self.rng.randint(2, 5)
+        c = self.rng.randint(1, 4)
         latex = f"\\lim_{{x \\to {c}}} {a}x^2"
         result = a * c**2
         solution = f"{result}"
@@ -31,7 +28,7 @@ class LimitsPolynomialsRationalGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        c = random.randint(2, 4)
+        c = self.rng.randint(2, 4)
         latex = f"\\lim_{{x \\to {c}}} \\sqrt{{x+1}}"
         result = (c+1)**0.5
         solution = f"{result:.2f}"
@@ -11,14 +11,12 @@ def write_generator(unit, filename, title, classname, easy, medium, hard, challe
 """
 import random
 from typing import List
-import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class {classname}Generator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -77,14 +75,14 @@ for name, title, classname in [
     ("limits_absolute_value", "Limits with Absolute Value", "LimitsAbsoluteValue"),
     ("limits_trigonometric", "Limits of Trigonometric Functions", "LimitsTrigonometric"),
 ]:
-    easy = '''        a = random.randint(2, 5)
-        c = random.randint(1, 4)
+    easy = '''        a = self.rng.randint(2, 5)
+        c = self.rng.randint(1, 4)
         latex = f"\\\\lim_{{x \\\\to {c}}} {a}x^2"
         result = a * c**2
         solution = f"{result}"
         steps = [f"= {a}({c})^2 = {result}"]'''
 
-    medium = '''        c = random.randint(2, 4)
+    medium = '''        c = self.rng.randint(2, 4)
         latex = f"\\\\lim_{{x \\\\to {c}}} \\\\sqrt{{x+1}}"
         result = (c+1)**0.5
         solution = f"{result:.2f}"
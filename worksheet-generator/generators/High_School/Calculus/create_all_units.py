@@ -7,14 +7,12 @@ def write_gen(unit, name, title, classname):
 """
 import random
 from typing import List
-import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class {classname}Generator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -26,32 +24,32 @@ class {classname}Generator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 5)
-        x = random.randint(1, 4)
+        a = self.rng.randint(2, 5)
+        x = self.rng.randint(1, 4)
         latex = f"\\\\text{{Calculate for easy problem}}"
         solution = f"{{{{a * x}}}}"
         steps = [f"\\\\text{{Step 1}}", f"\\\\text{{Result: }}{{{{a*x}}}}"]
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(1, 4)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 4)
         latex = f"\\\\text{{Calculate for medium problem}}"
         solution = f"{{{{a + b}}}}"
         steps = [f"\\\\text{{Step 1}}", f"\\\\text{{Result: }}{{{{a+b}}}}"]
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 4)
-        b = random.randint(1, 3)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(1, 3)
         latex = f"\\\\text{{Calculate for hard problem}}"
         solution = f"{{{{a * b}}}}"
         steps = [f"\\\\text{{Step 1}}", f"\\\\text{{Result: }}{{{{a*b}}}}"]
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 3)
-        b = random.randint(2, 3)
+        a = self.rng.randint(2, 3)
+        b = self.rng.randint(2, 3)
         latex = f"\\\\text{{Calculate for challenge problem}}"
         solution = f"{{{{a ** b}}}}"
         steps = [f"\\\\text{{Step 1}}", f"\\\\text{{Result: }}{{{{a**b}}}}"]
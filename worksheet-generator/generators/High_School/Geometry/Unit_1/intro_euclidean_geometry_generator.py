@@ -5,9 +5,6 @@ Creates problems about points, lines, planes, and basic geometric postulates
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class IntroEuclideanGeometryGenerator:
     """Generates problems about basic Euclidean geometry concepts."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -56,7 +52,7 @@ class IntroEuclideanGeometryGenerator:
              "Coplanar means 'in the same plane'.")
         ]
 
-        desc, answer, explanation = random.choice(concepts)
+        desc, answer, explanation = self.rng.choice(concepts)
 
         latex = f"\\text{{What geometric term describes something that }} {desc}\\text{{?}}"
         solution = answer
@@ -70,7 +66,7 @@ class IntroEuclideanGeometryGenerator:
 
     def _generate_medium(self) -> Equation:
         """Postulates and basic relationships"""
-        problem_type = random.choice(['postulate', 'relationship', 'notation'])
+        problem_type = self.rng.choice(['postulate', 'relationship', 'notation'])
 
         if problem_type == 'postulate':
             postulates = [
@@ -86,7 +82,7 @@ class IntroEuclideanGeometryGenerator:
                  "Through any single point, infinitely many lines can pass.")
             ]
 
-            question, answer, explanation = random.choice(postulates)
+            question, answer, explanation = self.rng.choice(postulates)
             latex = f"\\text{{{question}}}"
 
         elif problem_type == 'relationship':
@@ -101,7 +97,7 @@ class IntroEuclideanGeometryGenerator:
                  "Angle ABC = 2 × angle ABD = 2 × 35° = 70°")
             ]
 
-            question, answer, explanation = random.choice(relationships)
+            question, answer, explanation = self.rng.choice(relationships)
             latex = f"\\text{{{question}}}"
 
         else:
@@ -116,7 +112,7 @@ class IntroEuclideanGeometryGenerator:
                  "The 'm' before an angle symbol means 'measure of'.")
             ]
 
-            question, answer, explanation = random.choice(notations)
+            question, answer, explanation = self.rng.choice(notations)
             latex = question
 
         solution = answer
@@ -129,18 +125,18 @@ class IntroEuclideanGeometryGenerator:
 
     def _generate_hard(self) -> Equation:
         """Apply postulates to find segment lengths or angle measures"""
-        problem_type = random.choice(['segment', 'angle', 'midpoint'])
+        problem_type = self.rng.choice(['segment', 'angle', 'midpoint'])
 
         if problem_type == 'segment':
             # Algebraic segment problems
-            a = random.randint(2, 5)
-            b = random.randint(1, 10)
-            c = random.randint(2, 5)
-            d = random.randint(1, 10)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 10)
+            c = self.rng.randint(2, 5)
+            d = self.rng.randint(1, 10)
 
             # AC = AB + BC, solve for x
             # (ax + b) + (cx + d) = total
-            x = random.randint(2, 8)
+            x = self.rng.randint(2, 8)
             total = (a * x + b) + (c * x + d)
 
             latex = f"\\text{{B is between A and C. If }} AB = {a}x + {b}, BC = {c}x + {d}, \\text{{ and }} AC = {total}, \\text{{ find }} x."
@@ -156,9 +152,9 @@ class IntroEuclideanGeometryGenerator:
 
         elif problem_type == 'angle':
             # Ray bisects angle problem
-            a = random.randint(2, 4)
-            b = random.randint(1, 15)
-            x = random.randint(5, 15)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(1, 15)
+            x = self.rng.randint(5, 15)
             angle_half = a * x + b
             angle_full = 2 * angle_half
 
@@ -175,9 +171,9 @@ class IntroEuclideanGeometryGenerator:
 
         else:
             # Midpoint problem
-            a = random.randint(2, 4)
-            b = random.randint(1, 10)
-            x = random.randint(3, 10)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(1, 10)
+            x = self.rng.randint(3, 10)
             am = a * x + b
             ab = 2 * am
 
@@ -196,15 +192,15 @@ class IntroEuclideanGeometryGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Complex problems involving multiple concepts"""
-        problem_type = random.choice(['two_segments', 'complementary', 'supplementary'])
+        problem_type = self.rng.choice(['two_segments', 'complementary', 'supplementary'])
 
         if problem_type == 'two_segments':
             # Two midpoint problem
-            x = random.randint(3, 8)
-            am = random.randint(5, 15)
+            x = self.rng.randint(3, 8)
+            am = self.rng.randint(5, 15)
             mb = am  # M is midpoint so AM = MB
             ab = 2 * am
-            bc = random.randint(8, 20)
+            bc = self.rng.randint(8, 20)
             ac = ab + bc
 
             latex = f"\\text{{M is the midpoint of }} \\overline{{AB}}. \\text{{ If }} AM = {am} \\text{{ and }} BC = {bc}, \\text{{ find }} AC."
@@ -218,8 +214,8 @@ class IntroEuclideanGeometryGenerator:
 
         elif problem_type == 'complementary':
             # Complementary angles with algebra
-            a = random.randint(2, 4)
-            x = random.randint(5, 15)
+            a = self.rng.randint(2, 4)
+            x = self.rng.randint(5, 15)
             angle1 = a * x
             angle2 = 90 - angle1
 
@@ -235,13 +231,13 @@ class IntroEuclideanGeometryGenerator:
 
         else:
             # Supplementary angles with algebra
-            a = random.randint(2, 5)
-            b = random.randint(1, 20)
-            c = random.randint(2, 5)
-            d = random.randint(1, 20)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 20)
+            c = self.rng.randint(2, 5)
+            d = self.rng.randint(1, 20)
 
             # (ax + b) + (cx + d) = 180
-            x = random.randint(5, 20)
+            x = self.rng.randint(5, 20)
             # Adjust to make it work
             total_coef = a + c
             target = 180 - b - d
@@ -5,9 +5,6 @@ Creates problems about reflecting points and shapes over lines
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class ReflectionsGenerator:
     """Generates problems about reflections on the coordinate plane."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,13 +33,13 @@ class ReflectionsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Reflect a point over the x-axis or y-axis"""
-        x = random.randint(-6, 6)
-        y = random.randint(-6, 6)
+        x = self.rng.randint(-6, 6)
+        y = self.rng.randint(-6, 6)
         while x == 0 or y == 0:
-            x = random.randint(-6, 6)
-            y = random.randint(-6, 6)
+            x = self.rng.randint(-6, 6)
+            y = self.rng.randint(-6, 6)
 
-        axis = random.choice(['x', 'y'])
+        axis = self.rng.choice(['x', 'y'])
 
         if axis == 'x':
             new_x, new_y = x, -y
@@ -66,13 +62,13 @@ class ReflectionsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Reflect a point over y = x or y = -x"""
-        x = random.randint(-6, 6)
-        y = random.randint(-6, 6)
+        x = self.rng.randint(-6, 6)
+        y = self.rng.randint(-6, 6)
         while x == 0 or y == 0 or x == y or x == -y:
-            x = random.randint(-6, 6)
-            y = random.randint(-6, 6)
+            x = self.rng.randint(-6, 6)
+            y = self.rng.randint(-6, 6)
 
-        line_type = random.choice(['y=x', 'y=-x'])
+        line_type = self.rng.choice(['y=x', 'y=-x'])
 
         if line_type == 'y=x':
             new_x, new_y = y, x
@@ -95,18 +91,18 @@ class ReflectionsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Reflect a point over a horizontal or vertical line not at origin"""
-        problem_type = random.choice(['horizontal', 'vertical'])
+        problem_type = self.rng.choice(['horizontal', 'vertical'])
 
         if problem_type == 'horizontal':
             # Reflect over y = k
-            k = random.randint(-4, 4)
+            k = self.rng.randint(-4, 4)
             while k == 0:
-                k = random.randint(-4, 4)
+                k = self.rng.randint(-4, 4)
 
-            x = random.randint(-6, 6)
-            y = random.randint(-6, 6)
+            x = self.rng.randint(-6, 6)
+            y = self.rng.randint(-6, 6)
             while y == k:
-                y = random.randint(-6, 6)
+                y = self.rng.randint(-6, 6)
 
             new_x = x
             new_y = 2 * k - y
@@ -123,14 +119,14 @@ class ReflectionsGenerator:
             ]
         else:
             # Reflect over x = h
-            h = random.randint(-4, 4)
+            h = self.rng.randint(-4, 4)
             while h == 0:
-                h = random.randint(-4, 4)
+                h = self.rng.randint(-4, 4)
 
-            x = random.randint(-6, 6)
-            y = random.randint(-6, 6)
+            x = self.rng.randint(-6, 6)
+            y = self.rng.randint(-6, 6)
             while x == h:
-                x = random.randint(-6, 6)
+                x = self.rng.randint(-6, 6)
 
             new_x = 2 * h - x
             new_y = y
@@ -150,36 +146,36 @@ class ReflectionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Find the line of reflection or reflect a shape"""
-        problem_type = random.choice(['find_line', 'reflect_triangle'])
+        problem_type = self.rng.choice(['find_line', 'reflect_triangle'])
 
         if problem_type == 'find_line':
             # Give pre-image and image, find the line of reflection
-            line_type = random.choice(['x-axis', 'y-axis', 'y=x', 'horizontal', 'vertical'])
+            line_type = self.rng.choice(['x-axis', 'y-axis', 'y=x', 'horizontal', 'vertical'])
 
             if line_type == 'x-axis':
-                x, y = random.randint(1, 5), random.randint(1, 5)
+                x, y = self.rng.randint(1, 5), self.rng.randint(1, 5)
                 new_x, new_y = x, -y
                 line_answer = "y = 0 \\text{ (x-axis)}"
             elif line_type == 'y-axis':
-                x, y = random.randint(1, 5), random.randint(1, 5)
+                x, y = self.rng.randint(1, 5), self.rng.randint(1, 5)
                 new_x, new_y = -x, y
                 line_answer = "x = 0 \\text{ (y-axis)}"
             elif line_type == 'y=x':
-                x, y = random.randint(1, 5), random.randint(2, 6)
+                x, y = self.rng.randint(1, 5), self.rng.randint(2, 6)
                 while x == y:
-                    y = random.randint(2, 6)
+                    y = self.rng.randint(2, 6)
                 new_x, new_y = y, x
                 line_answer = "y = x"
             elif line_type == 'horizontal':
-                k = random.randint(1, 3)
-                x = random.randint(-4, 4)
-                y = random.randint(k + 1, k + 4)
+                k = self.rng.randint(1, 3)
+                x = self.rng.randint(-4, 4)
+                y = self.rng.randint(k + 1, k + 4)
                 new_x, new_y = x, 2 * k - y
                 line_answer = f"y = {k}"
             else:
-                h = random.randint(1, 3)
-                x = random.randint(h + 1, h + 4)
-                y = random.randint(-4, 4)
+                h = self.rng.randint(1, 3)
+                x = self.rng.randint(h + 1, h + 4)
+                y = self.rng.randint(-4, 4)
                 new_x, new_y = 2 * h - x, y
                 line_answer = f"x = {h}"
 
@@ -193,10 +189,10 @@ class ReflectionsGenerator:
             ]
         else:
             # Reflect a triangle over x-axis or y-axis
-            axis = random.choice(['x', 'y'])
-            x1, y1 = random.randint(1, 3), random.randint(1, 3)
-            x2, y2 = x1 + random.randint(1, 3), y1
-            x3, y3 = x1 + random.randint(0, 2), y1 + random.randint(1, 3)
+            axis = self.rng.choice(['x', 'y'])
+            x1, y1 = self.rng.randint(1, 3), self.rng.randint(1, 3)
+            x2, y2 = x1 + self.rng.randint(1, 3), y1
+            x3, y3 = x1 + self.rng.randint(0, 2), y1 + self.rng.randint(1, 3)
 
             if axis == 'x':
                 new_x1, new_y1 = x1, -y1
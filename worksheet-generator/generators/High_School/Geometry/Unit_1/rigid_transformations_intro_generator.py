@@ -5,9 +5,6 @@ Creates problems about identifying and understanding rigid transformations
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class RigidTransformationsIntroGenerator:
     """Generates problems about rigid transformations concepts."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -52,7 +48,7 @@ class RigidTransformationsIntroGenerator:
              "Turning around a point is a rotation.")
         ]
 
-        desc, answer, explanation = random.choice(transformations)
+        desc, answer, explanation = self.rng.choice(transformations)
 
         latex = f"\\text{{Which transformation }} {desc}\\text{{?}}"
         solution = answer
@@ -81,7 +77,7 @@ class RigidTransformationsIntroGenerator:
              "Negating both coordinates is a 180° rotation about the origin.")
         ]
 
-        rule, answer, explanation = random.choice(rules)
+        rule, answer, explanation = self.rng.choice(rules)
 
         latex = f"\\text{{Identify the transformation: }} {rule}"
         solution = answer
@@ -96,7 +92,7 @@ class RigidTransformationsIntroGenerator:
 
     def _generate_hard(self) -> Equation:
         """Determine if a transformation is rigid and identify properties preserved"""
-        problem_type = random.choice(['is_rigid', 'properties'])
+        problem_type = self.rng.choice(['is_rigid', 'properties'])
 
         if problem_type == 'is_rigid':
             transformations = [
@@ -114,7 +110,7 @@ class RigidTransformationsIntroGenerator:
                  "A composition of rigid transformations is also rigid.")
             ]
 
-            trans, answer, explanation = random.choice(transformations)
+            trans, answer, explanation = self.rng.choice(transformations)
 
             latex = f"\\text{{Is the following transformation rigid? }} {trans}"
             solution = answer
@@ -134,7 +130,7 @@ class RigidTransformationsIntroGenerator:
                 ("area of figures", "Yes", "Since distances are preserved, areas are also preserved.")
             ]
 
-            prop, answer, explanation = random.choice(properties)
+            prop, answer, explanation = self.rng.choice(properties)
 
             latex = f"\\text{{Do rigid transformations preserve }} {prop}\\text{{?}}"
             solution = answer
@@ -148,7 +144,7 @@ class RigidTransformationsIntroGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Identify a sequence of transformations or analyze composite transformations"""
-        problem_type = random.choice(['sequence', 'equivalent'])
+        problem_type = self.rng.choice(['sequence', 'equivalent'])
 
         if problem_type == 'sequence':
             # Given pre-image and image, describe possible transformation(s)
@@ -173,7 +169,7 @@ class RigidTransformationsIntroGenerator:
                 )
             ]
 
-            pre, post, answer, explanation = random.choice(scenarios)
+            pre, post, answer, explanation = self.rng.choice(scenarios)
 
             latex = f"\\text{{Triangle with vertices }} {pre} \\text{{ is mapped to }} {post}. \\text{{ Identify the transformation.}}"
             solution = answer
@@ -208,7 +204,7 @@ class RigidTransformationsIntroGenerator:
                 )
             ]
 
-            comp, answer, explanation = random.choice(compositions)
+            comp, answer, explanation = self.rng.choice(compositions)
 
             latex = f"\\text{{What single transformation is equivalent to: }} {comp}\\text{{?}}"
             solution = answer
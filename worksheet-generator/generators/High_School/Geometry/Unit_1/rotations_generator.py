@@ -5,9 +5,6 @@ Creates problems about rotating points and shapes around a center point
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class RotationsGenerator:
     """Generates problems about rotations on the coordinate plane."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -59,8 +55,8 @@ class RotationsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Rotate a point 90 degrees counterclockwise about the origin"""
-        x = random.randint(1, 6)
-        y = random.randint(1, 6)
+        x = self.rng.randint(1, 6)
+        y = self.rng.randint(1, 6)
 
         new_x, new_y = self._rotate_point(x, y, 90)
 
@@ -77,13 +73,13 @@ class RotationsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Rotate a point 180 or 270 degrees about the origin"""
-        x = random.randint(-6, 6)
-        y = random.randint(-6, 6)
+        x = self.rng.randint(-6, 6)
+        y = self.rng.randint(-6, 6)
         while x == 0 and y == 0:
-            x = random.randint(-6, 6)
-            y = random.randint(-6, 6)
+            x = self.rng.randint(-6, 6)
+            y = self.rng.randint(-6, 6)
 
-        angle = random.choice([180, 270])
+        angle = self.rng.choice([180, 270])
         new_x, new_y = self._rotate_point(x, y, angle)
 
         if angle == 180:
@@ -107,16 +103,16 @@ class RotationsGenerator:
     def _generate_hard(self) -> Equation:
         """Rotate a point about a center other than the origin"""
         # Center of rotation
-        cx = random.randint(-3, 3)
-        cy = random.randint(-3, 3)
+        cx = self.rng.randint(-3, 3)
+        cy = self.rng.randint(-3, 3)
 
         # Point to rotate (offset from center)
-        offset_x = random.randint(1, 4) * random.choice([1, -1])
-        offset_y = random.randint(1, 4) * random.choice([1, -1])
+        offset_x = self.rng.randint(1, 4) * self.rng.choice([1, -1])
+        offset_y = self.rng.randint(1, 4) * self.rng.choice([1, -1])
         x = cx + offset_x
         y = cy + offset_y
 
-        angle = random.choice([90, 180, 270])
+        angle = self.rng.choice([90, 180, 270])
         new_x, new_y = self._rotate_point(x, y, angle, cx, cy)
 
         if angle == 90:
@@ -140,13 +136,13 @@ class RotationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Find the angle of rotation or rotate a shape"""
-        problem_type = random.choice(['find_angle', 'rotate_triangle'])
+        problem_type = self.rng.choice(['find_angle', 'rotate_triangle'])
 
         if problem_type == 'find_angle':
             # Give pre-image and image, find angle
-            x = random.randint(1, 5)
-            y = random.randint(1, 5)
-            angle = random.choice([90, 180, 270])
+            x = self.rng.randint(1, 5)
+            y = self.rng.randint(1, 5)
+            angle = self.rng.choice([90, 180, 270])
             new_x, new_y = self._rotate_point(x, y, angle)
 
             latex = f"\\text{{Point }} A({x}, {y}) \\text{{ is rotated about the origin to }} A'({new_x}, {new_y}). \\text{{ Find the angle of rotation (CCW).}}"
@@ -161,11 +157,11 @@ class RotationsGenerator:
             ]
         else:
             # Rotate a triangle
-            x1, y1 = random.randint(1, 4), random.randint(1, 4)
-            x2, y2 = x1 + random.randint(1, 3), y1
-            x3, y3 = x1, y1 + random.randint(1, 3)
+            x1, y1 = self.rng.randint(1, 4), self.rng.randint(1, 4)
+            x2, y2 = x1 + self.rng.randint(1, 3), y1
+            x3, y3 = x1, y1 + self.rng.randint(1, 3)
 
-            angle = random.choice([90, 180, 270])
+            angle = self.rng.choice([90, 180, 270])
             new_x1, new_y1 = self._rotate_point(x1, y1, angle)
             new_x2, new_y2 = self._rotate_point(x2, y2, angle)
             new_x3, new_y3 = self._rotate_point(x3, y3, angle)
@@ -5,9 +5,6 @@ Creates problems about translating points and shapes on a coordinate plane
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class TranslationsGenerator:
     """Generates problems about translations on the coordinate plane."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,10 +33,10 @@ class TranslationsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Translate a single point by a vector with positive values"""
-        x = random.randint(-5, 5)
-        y = random.randint(-5, 5)
-        dx = random.randint(1, 5)
-        dy = random.randint(1, 5)
+        x = self.rng.randint(-5, 5)
+        y = self.rng.randint(-5, 5)
+        dx = self.rng.randint(1, 5)
+        dy = self.rng.randint(1, 5)
 
         new_x = x + dx
         new_y = y + dy
@@ -59,13 +55,13 @@ class TranslationsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Translate a point with positive and negative vector components"""
-        x = random.randint(-8, 8)
-        y = random.randint(-8, 8)
-        dx = random.randint(-6, 6)
-        dy = random.randint(-6, 6)
+        x = self.rng.randint(-8, 8)
+        y = self.rng.randint(-8, 8)
+        dx = self.rng.randint(-6, 6)
+        dy = self.rng.randint(-6, 6)
         while dx == 0 and dy == 0:
-            dx = random.randint(-6, 6)
-            dy = random.randint(-6, 6)
+            dx = self.rng.randint(-6, 6)
+            dy = self.rng.randint(-6, 6)
 
         new_x = x + dx
         new_y = y + dy
@@ -84,13 +80,13 @@ class TranslationsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Find the translation vector given original and image points"""
-        x1 = random.randint(-8, 8)
-        y1 = random.randint(-8, 8)
-        dx = random.randint(-7, 7)
-        dy = random.randint(-7, 7)
+        x1 = self.rng.randint(-8, 8)
+        y1 = self.rng.randint(-8, 8)
+        dx = self.rng.randint(-7, 7)
+        dy = self.rng.randint(-7, 7)
         while dx == 0 and dy == 0:
-            dx = random.randint(-7, 7)
-            dy = random.randint(-7, 7)
+            dx = self.rng.randint(-7, 7)
+            dy = self.rng.randint(-7, 7)
 
         x2 = x1 + dx
         y2 = y1 + dy
@@ -109,19 +105,19 @@ class TranslationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Translate a triangle and find the coordinates of all vertices"""
-        problem_type = random.choice(['triangle', 'composition'])
+        problem_type = self.rng.choice(['triangle', 'composition'])
 
         if problem_type == 'triangle':
             # Generate triangle vertices
-            x1, y1 = random.randint(-5, 3), random.randint(-5, 3)
-            x2, y2 = x1 + random.randint(2, 4), y1 + random.randint(0, 3)
-            x3, y3 = x1 + random.randint(0, 2), y1 + random.randint(2, 4)
+            x1, y1 = self.rng.randint(-5, 3), self.rng.randint(-5, 3)
+            x2, y2 = x1 + self.rng.randint(2, 4), y1 + self.rng.randint(0, 3)
+            x3, y3 = x1 + self.rng.randint(0, 2), y1 + self.rng.randint(2, 4)
 
-            dx = random.randint(-4, 4)
-            dy = random.randint(-4, 4)
+            dx = self.rng.randint(-4, 4)
+            dy = self.rng.randint(-4, 4)
             while dx == 0 and dy == 0:
-                dx = random.randint(-4, 4)
-                dy = random.randint(-4, 4)
+                dx = self.rng.randint(-4, 4)
+                dy = self.rng.randint(-4, 4)
 
             new_x1, new_y1 = x1 + dx, y1 + dy
             new_x2, new_y2 = x2 + dx, y2 + dy
@@ -138,12 +134,12 @@ class TranslationsGenerator:
             ]
         else:
             # Composition of two translations
-            x = random.randint(-5, 5)
-            y = random.randint(-5, 5)
-            dx1 = random.randint(-4, 4)
-            dy1 = random.randint(-4, 4)
-            dx2 = random.randint(-4, 4)
-            dy2 = random.randint(-4, 4)
+            x = self.rng.randint(-5, 5)
+            y = self.rng.randint(-5, 5)
+            dx1 = self.rng.randint(-4, 4)
+            dy1 = self.rng.randint(-4, 4)
+            dx2 = self.rng.randint(-4, 4)
+            dy2 = self.rng.randint(-4, 4)
 
             total_dx = dx1 + dx2
             total_dy = dy1 + dy2
@@ -5,9 +5,6 @@ Creates problems about which properties are preserved under dilations
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class DilationPreservedPropertiesGenerator:
     """Generates problems about properties preserved under dilations."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -48,7 +44,7 @@ class DilationPreservedPropertiesGenerator:
             ("area", "No", "Area is multiplied by the square of the scale factor.")
         ]
 
-        prop, answer, explanation = random.choice(properties)
+        prop, answer, explanation = self.rng.choice(properties)
 
         latex = f"\\text{{Are }} {prop} \\text{{ preserved under dilations?}}"
         solution = answer
@@ -62,11 +58,11 @@ class DilationPreservedPropertiesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Apply scale factor to lengths and areas"""
-        problem_type = random.choice(['length', 'perimeter', 'area', 'angle'])
+        problem_type = self.rng.choice(['length', 'perimeter', 'area', 'angle'])
 
         if problem_type == 'length':
-            k = random.choice([2, 3, 4, 1/2, 1/3, 1/4, 0.5])
-            length = random.randint(4, 20)
+            k = self.rng.choice([2, 3, 4, 1/2, 1/3, 1/4, 0.5])
+            length = self.rng.randint(4, 20)
             new_length = length * k
 
             latex = f"\\text{{A segment of length }} {length} \\text{{ is dilated with scale factor }} k = {k}. \\text{{ What is the new length?}}"
@@ -78,8 +74,8 @@ class DilationPreservedPropertiesGenerator:
             ]
 
         elif problem_type == 'perimeter':
-            k = random.choice([2, 3, 4, 0.5])
-            perimeter = random.randint(12, 36)
+            k = self.rng.choice([2, 3, 4, 0.5])
+            perimeter = self.rng.randint(12, 36)
             new_perimeter = perimeter * k
 
             latex = f"\\text{{A triangle with perimeter }} {perimeter} \\text{{ is dilated with scale factor }} k = {k}. \\text{{ What is the new perimeter?}}"
@@ -91,8 +87,8 @@ class DilationPreservedPropertiesGenerator:
             ]
 
         elif problem_type == 'area':
-            k = random.choice([2, 3, 0.5])
-            area = random.randint(8, 48)
+            k = self.rng.choice([2, 3, 0.5])
+            area = self.rng.randint(8, 48)
             new_area = area * k * k
 
             latex = f"\\text{{A rectangle with area }} {area} \\text{{ is dilated with scale factor }} k = {k}. \\text{{ What is the new area?}}"
@@ -104,7 +100,7 @@ class DilationPreservedPropertiesGenerator:
             ]
 
         else:  # angle
-            angle = random.randint(30, 150)
+            angle = self.rng.randint(30, 150)
 
             latex = f"\\text{{An angle measuring }} {angle}^\\circ \\text{{ is part of a figure dilated with scale factor }} k = 3. \\text{{ What is the angle measure after dilation?}}"
             solution = f"{angle}°"
@@ -118,11 +114,11 @@ class DilationPreservedPropertiesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Find scale factor given before and after measurements"""
-        problem_type = random.choice(['find_k_length', 'find_k_area', 'ratio'])
+        problem_type = self.rng.choice(['find_k_length', 'find_k_area', 'ratio'])
 
         if problem_type == 'find_k_length':
-            k = random.choice([2, 3, 4, 0.5])
-            original = random.randint(5, 15)
+            k = self.rng.choice([2, 3, 4, 0.5])
+            original = self.rng.randint(5, 15)
             new = original * k
 
             latex = f"\\text{{A segment of length }} {original} \\text{{ is dilated to length }} {new}. \\text{{ What is the scale factor?}}"
@@ -134,8 +130,8 @@ class DilationPreservedPropertiesGenerator:
             ]
 
         elif problem_type == 'find_k_area':
-            k = random.choice([2, 3])
-            original_area = random.randint(8, 24)
+            k = self.rng.choice([2, 3])
+            original_area = self.rng.randint(8, 24)
             new_area = original_area * k * k
 
             latex = f"\\text{{A triangle with area }} {original_area} \\text{{ is dilated to area }} {new_area}. \\text{{ What is the scale factor?}}"
@@ -147,7 +143,7 @@ class DilationPreservedPropertiesGenerator:
             ]
 
         else:  # ratio
-            k = random.choice([2, 3, 4])
+            k = self.rng.choice([2, 3, 4])
             ratio = k
 
             latex = f"\\text{{After a dilation with scale factor }} k = {k}, \\text{{ what is the ratio of the new perimeter to the original perimeter?}}"
@@ -162,11 +158,11 @@ class DilationPreservedPropertiesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Complex problems involving multiple properties"""
-        problem_type = random.choice(['volume', 'similarity', 'composition'])
+        problem_type = self.rng.choice(['volume', 'similarity', 'composition'])
 
         if problem_type == 'volume':
-            k = random.choice([2, 3])
-            volume = random.randint(8, 27)
+            k = self.rng.choice([2, 3])
+            volume = self.rng.randint(8, 27)
             new_volume = volume * k * k * k
 
             latex = f"\\text{{A cube with volume }} {volume} \\text{{ cubic units is dilated with scale factor }} k = {k}. \\text{{ What is the new volume?}}"
@@ -178,7 +174,7 @@ class DilationPreservedPropertiesGenerator:
             ]
 
         elif problem_type == 'similarity':
-            k = random.choice([2, 3, 4])
+            k = self.rng.choice([2, 3, 4])
 
             latex = f"\\text{{A figure is dilated with scale factor }} k = {k}. \\text{{ Is the image similar to the original? Explain.}}"
             solution = "Yes, because dilations preserve angle measures and produce proportional side lengths."
@@ -191,8 +187,8 @@ class DilationPreservedPropertiesGenerator:
             ]
 
         else:  # composition
-            k1 = random.choice([2, 3])
-            k2 = random.choice([2, 3])
+            k1 = self.rng.choice([2, 3])
+            k2 = self.rng.choice([2, 3])
             combined = k1 * k2
 
             latex = f"\\text{{A figure is dilated with scale factor }} {k1}, \\text{{ then dilated again with scale factor }} {k2}. \\text{{ What is the combined scale factor?}}"
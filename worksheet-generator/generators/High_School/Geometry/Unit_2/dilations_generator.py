@@ -5,9 +5,6 @@ Creates problems about dilating points and shapes from a center point
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class DilationsGenerator:
     """Generates problems about dilations on the coordinate plane."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,9 +33,9 @@ class DilationsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Dilate a point from the origin with integer scale factor"""
-        x = random.randint(1, 5)
-        y = random.randint(1, 5)
-        k = random.randint(2, 4)
+        x = self.rng.randint(1, 5)
+        y = self.rng.randint(1, 5)
+        k = self.rng.randint(2, 4)
 
         new_x = k * x
         new_y = k * y
@@ -57,11 +53,11 @@ class DilationsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Dilate with fractional scale factor or identify enlargement/reduction"""
-        problem_type = random.choice(['fractional', 'identify'])
+        problem_type = self.rng.choice(['fractional', 'identify'])
 
         if problem_type == 'fractional':
-            x = random.randint(2, 8) * 2  # Even numbers for clean division
-            y = random.randint(2, 8) * 2
+            x = self.rng.randint(2, 8) * 2  # Even numbers for clean division
+            y = self.rng.randint(2, 8) * 2
             k_num = 1
             k_den = 2
 
@@ -77,7 +73,7 @@ class DilationsGenerator:
                 f"\\text{{Result: }} ({new_x}, {new_y})"
             ]
         else:
-            k = random.choice([0.5, 2, 3, 0.25, 4])
+            k = self.rng.choice([0.5, 2, 3, 0.25, 4])
             if k > 1:
                 answer = "Enlargement"
                 explanation = f"Scale factor {k} > 1, so the image is larger than the pre-image."
@@ -99,14 +95,14 @@ class DilationsGenerator:
     def _generate_hard(self) -> Equation:
         """Dilate from a center other than the origin"""
         # Center of dilation
-        cx = random.randint(-3, 3)
-        cy = random.randint(-3, 3)
+        cx = self.rng.randint(-3, 3)
+        cy = self.rng.randint(-3, 3)
 
         # Point to dilate
-        x = cx + random.randint(1, 4) * random.choice([1, -1])
-        y = cy + random.randint(1, 4) * random.choice([1, -1])
+        x = cx + self.rng.randint(1, 4) * self.rng.choice([1, -1])
+        y = cy + self.rng.randint(1, 4) * self.rng.choice([1, -1])
 
-        k = random.randint(2, 3)
+        k = self.rng.randint(2, 3)
 
         # Dilation formula: (x', y') = (cx + k(x - cx), cy + k(y - cy))
         new_x = cx + k * (x - cx)
@@ -126,13 +122,13 @@ class DilationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Find scale factor, center, or dilate a shape"""
-        problem_type = random.choice(['find_scale', 'find_center', 'dilate_triangle'])
+        problem_type = self.rng.choice(['find_scale', 'find_center', 'dilate_triangle'])
 
         if problem_type == 'find_scale':
             # Given pre-image and image, find scale factor
-            x1 = random.randint(1, 4)
-            y1 = random.randint(1, 4)
-            k = random.randint(2, 4)
+            x1 = self.rng.randint(1, 4)
+            y1 = self.rng.randint(1, 4)
+            k = self.rng.randint(2, 4)
             x2 = k * x1
             y2 = k * y1
 
@@ -147,8 +143,8 @@ class DilationsGenerator:
         elif problem_type == 'find_center':
             # Given pre-image, image, and scale factor, verify center
             cx, cy = 0, 0  # Keep it simple - origin
-            x = random.randint(2, 5)
-            y = random.randint(2, 5)
+            x = self.rng.randint(2, 5)
+            y = self.rng.randint(2, 5)
             k = 2
 
             new_x = k * x
@@ -168,9 +164,9 @@ class DilationsGenerator:
 
         else:
             # Dilate a triangle
-            x1, y1 = random.randint(1, 3), random.randint(1, 3)
-            x2, y2 = x1 + random.randint(1, 2), y1
-            x3, y3 = x1, y1 + random.randint(1, 2)
+            x1, y1 = self.rng.randint(1, 3), self.rng.randint(1, 3)
+            x2, y2 = x1 + self.rng.randint(1, 2), y1
+            x3, y3 = x1, y1 + self.rng.randint(1, 2)
             k = 2
 
             new_x1, new_y1 = k * x1, k * y1
@@ -5,9 +5,6 @@ Creates problems about properties and definitions of transformations
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class PropertiesDefinitionsTransformationsGenerator:
     """Generates problems about transformation properties and definitions."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -50,7 +46,7 @@ class PropertiesDefinitionsTransformationsGenerator:
             ("center of dilation", "The fixed point from which a dilation occurs", "The center of dilation remains fixed; other points move toward or away from it.")
         ]
 
-        term, definition, explanation = random.choice(definitions)
+        term, definition, explanation = self.rng.choice(definitions)
 
         latex = f"\\text{{Define: {term}}}"
         solution = definition
@@ -64,7 +60,7 @@ class PropertiesDefinitionsTransformationsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Identify which properties are preserved"""
-        problem_type = random.choice(['preservation', 'classification', 'comparison'])
+        problem_type = self.rng.choice(['preservation', 'classification', 'comparison'])
 
         if problem_type == 'preservation':
             transformations = [
@@ -74,7 +70,7 @@ class PropertiesDefinitionsTransformationsGenerator:
                 ("dilation", "angle measures, parallelism, orientation", "Dilations preserve angles and parallelism but NOT distance.")
             ]
 
-            transform, preserved, explanation = random.choice(transformations)
+            transform, preserved, explanation = self.rng.choice(transformations)
 
             latex = f"\\text{{What properties are preserved by a {transform}?}}"
             solution = preserved
@@ -93,7 +89,7 @@ class PropertiesDefinitionsTransformationsGenerator:
                 ("Composition of rigid transformation and dilation", "Similarity transformation", "This creates a similar figure.")
             ]
 
-            transforms, classification, explanation = random.choice(classifications)
+            transforms, classification, explanation = self.rng.choice(classifications)
 
             latex = f"\\text{{How are these transformations classified: {transforms}?}}"
             solution = classification
@@ -111,7 +107,7 @@ class PropertiesDefinitionsTransformationsGenerator:
                 ("reflection", "rotation", "Reflection reverses orientation; rotation preserves it", "Orientation")
             ]
 
-            trans1, trans2, difference, key = random.choice(comparisons)
+            trans1, trans2, difference, key = self.rng.choice(comparisons)
 
             latex = f"\\text{{What key property distinguishes a {trans1} from a {trans2}?}}"
             solution = key
@@ -125,7 +121,7 @@ class PropertiesDefinitionsTransformationsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Apply definitions to determine transformation types"""
-        problem_type = random.choice(['identify', 'verify', 'counterexample'])
+        problem_type = self.rng.choice(['identify', 'verify', 'counterexample'])
 
         if problem_type == 'identify':
             scenarios = [
@@ -139,7 +135,7 @@ class PropertiesDefinitionsTransformationsGenerator:
                  "Dilation from origin with k=2", "All coordinates are multiplied by 2.")
             ]
 
-            scenario, answer, explanation = random.choice(scenarios)
+            scenario, answer, explanation = self.rng.choice(scenarios)
 
             latex = f"\\text{{{scenario} What transformation occurred?}}"
             solution = answer
@@ -159,7 +155,7 @@ class PropertiesDefinitionsTransformationsGenerator:
                  "No", "It must be a reflection. Rotations preserve orientation.")
             ]
 
-            question, answer, explanation = random.choice(verifications)
+            question, answer, explanation = self.rng.choice(verifications)
 
             latex = f"\\text{{{question}}}"
             solution = answer
@@ -186,7 +182,7 @@ class PropertiesDefinitionsTransformationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Complex problems involving composition and properties"""
-        problem_type = random.choice(['composition', 'proof', 'analysis'])
+        problem_type = self.rng.choice(['composition', 'proof', 'analysis'])
 
         if problem_type == 'composition':
             latex = f"\\text{{A figure undergoes a reflection followed by a translation. What properties are preserved?}}"
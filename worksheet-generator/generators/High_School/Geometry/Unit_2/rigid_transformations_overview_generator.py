@@ -5,9 +5,6 @@ Creates problems reviewing all rigid transformation types
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class RigidTransformationsOverviewGenerator:
     """Generates problems about rigid transformations overview."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -43,9 +39,9 @@ class RigidTransformationsOverviewGenerator:
             ("reflection", "flips", "All points are mirrored across a line"),
         ]
 
-        name, action, description = random.choice(transformations)
+        name, action, description = self.rng.choice(transformations)
 
-        problem_type = random.choice(['identify', 'describe'])
+        problem_type = self.rng.choice(['identify', 'describe'])
 
         if problem_type == 'identify':
             latex = f"\\text{{A transformation that {action} a figure is called a:}}"
@@ -66,12 +62,12 @@ class RigidTransformationsOverviewGenerator:
 
     def _generate_medium(self) -> Equation:
         """Identify transformation from coordinates"""
-        x, y = random.randint(1, 5), random.randint(1, 5)
+        x, y = self.rng.randint(1, 5), self.rng.randint(1, 5)
 
-        transform_type = random.choice(['translation', 'reflection_x', 'reflection_y', 'rotation_180'])
+        transform_type = self.rng.choice(['translation', 'reflection_x', 'reflection_y', 'rotation_180'])
 
         if transform_type == 'translation':
-            dx, dy = random.randint(2, 5), random.randint(2, 5)
+            dx, dy = self.rng.randint(2, 5), self.rng.randint(2, 5)
             x2, y2 = x + dx, y + dy
             answer = "translation"
             explanation = f"\\text{{The point moved {dx} right and {dy} up}}"
@@ -109,7 +105,7 @@ class RigidTransformationsOverviewGenerator:
             ("perimeter", True, "Rigid transformations preserve perimeter"),
         ]
 
-        prop, all_preserve, explanation = random.choice(properties)
+        prop, all_preserve, explanation = self.rng.choice(properties)
 
         if prop == "orientation":
             latex = f"\\text{{Which rigid transformation(s) reverse orientation?}}"
@@ -120,7 +116,7 @@ class RigidTransformationsOverviewGenerator:
                 f"\\text{{Reflections reverse orientation}}"
             ]
         else:
-            transform = random.choice(['translations', 'rotations', 'reflections', 'all rigid transformations'])
+            transform = self.rng.choice(['translations', 'rotations', 'reflections', 'all rigid transformations'])
             latex = f"\\text{{Do {transform} preserve {prop}?}}"
             solution = f"\\text{{Yes}}"
             steps = [
@@ -132,9 +128,9 @@ class RigidTransformationsOverviewGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Composition of transformations"""
-        x, y = random.randint(1, 4), random.randint(1, 4)
+        x, y = self.rng.randint(1, 4), self.rng.randint(1, 4)
 
-        problem_type = random.choice(['double_reflection', 'translate_rotate'])
+        problem_type = self.rng.choice(['double_reflection', 'translate_rotate'])
 
         if problem_type == 'double_reflection':
             # Reflection over x-axis then y-axis = 180° rotation
@@ -152,7 +148,7 @@ class RigidTransformationsOverviewGenerator:
             ]
         else:
             # Translation then 90° rotation
-            dx, dy = random.randint(2, 4), random.randint(2, 4)
+            dx, dy = self.rng.randint(2, 4), self.rng.randint(2, 4)
             x1, y1 = x + dx, y + dy  # After translation
             x2, y2 = -y1, x1  # After 90° rotation about origin
 
@@ -5,9 +5,6 @@ Creates problems about line symmetry and rotational symmetry
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class SymmetryGenerator:
     """Generates problems about symmetry in geometric figures."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -48,7 +44,7 @@ class SymmetryGenerator:
             ("scalene triangle", 0, "A scalene triangle has no lines of symmetry.")
         ]
 
-        shape, lines, explanation = random.choice(shapes)
+        shape, lines, explanation = self.rng.choice(shapes)
 
         latex = f"\\text{{How many lines of symmetry does a }} {shape} \\text{{ have?}}"
         solution = str(lines)
@@ -62,7 +58,7 @@ class SymmetryGenerator:
 
     def _generate_medium(self) -> Equation:
         """Rotational symmetry order and angle"""
-        problem_type = random.choice(['order', 'angle'])
+        problem_type = self.rng.choice(['order', 'angle'])
 
         shapes = [
             ("equilateral triangle", 3, 120),
@@ -72,7 +68,7 @@ class SymmetryGenerator:
             ("regular octagon", 8, 45),
         ]
 
-        shape, order, angle = random.choice(shapes)
+        shape, order, angle = self.rng.choice(shapes)
 
         if problem_type == 'order':
             latex = f"\\text{{What is the order of rotational symmetry for a }} {shape}\\text{{?}}"
@@ -96,17 +92,17 @@ class SymmetryGenerator:
 
     def _generate_hard(self) -> Equation:
         """Determine lines of symmetry from coordinates or identify symmetry type"""
-        problem_type = random.choice(['coordinates', 'both_types'])
+        problem_type = self.rng.choice(['coordinates', 'both_types'])
 
         if problem_type == 'coordinates':
             # Check if points have a line of symmetry
             # Create symmetric points about y-axis
-            x1 = random.randint(1, 4)
-            y1 = random.randint(1, 5)
+            x1 = self.rng.randint(1, 4)
+            y1 = self.rng.randint(1, 5)
 
             # Make a symmetric quadrilateral about y-axis
             points = [(x1, y1), (-x1, y1), (-x1, -y1), (x1, -y1)]
-            random.shuffle(points)
+            self.rng.shuffle(points)
 
             latex = f"\\text{{Do points }} {points[0]}, {points[1]}, {points[2]}, {points[3]} \\text{{ form a figure with line symmetry?}}"
             solution = "Yes, about both axes"
@@ -130,7 +126,7 @@ class SymmetryGenerator:
                  "A regular hexagon has 6 lines of symmetry and order 6 rotational symmetry.")
             ]
 
-            shape, answer, explanation = random.choice(shapes)
+            shape, answer, explanation = self.rng.choice(shapes)
 
             latex = f"\\text{{What type(s) of symmetry does a }} {shape} \\text{{ have?}}"
             solution = answer
@@ -143,11 +139,11 @@ class SymmetryGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Complex symmetry problems involving regular polygons"""
-        problem_type = random.choice(['polygon_sides', 'mapping', 'composite'])
+        problem_type = self.rng.choice(['polygon_sides', 'mapping', 'composite'])
 
         if problem_type == 'polygon_sides':
             # Given symmetry properties, find the polygon
-            n = random.choice([5, 6, 8, 10, 12])
+            n = self.rng.choice([5, 6, 8, 10, 12])
             angle = 360 // n
 
             latex = f"\\text{{A regular polygon has rotational symmetry of }} {angle}°. \\text{{ How many sides does it have?}}"
@@ -162,10 +158,10 @@ class SymmetryGenerator:
 
         elif problem_type == 'mapping':
             # Determine which rotation maps a vertex to another
-            n = random.choice([6, 8])
+            n = self.rng.choice([6, 8])
             vertices = list(range(1, n + 1))
-            start = random.choice(vertices)
-            positions = random.randint(1, n - 1)
+            start = self.rng.choice(vertices)
+            positions = self.rng.randint(1, n - 1)
             end = ((start - 1 + positions) % n) + 1
             angle = (360 // n) * positions
 
@@ -180,7 +176,7 @@ class SymmetryGenerator:
 
         else:
             # Find total symmetries
-            n = random.choice([4, 5, 6, 8])
+            n = self.rng.choice([4, 5, 6, 8])
             name = {4: "square", 5: "regular pentagon", 6: "regular hexagon", 8: "regular octagon"}[n]
             total = 2 * n  # n rotations + n reflections
 
@@ -5,9 +5,6 @@ Creates problems about triangle congruence criteria (SSS, SAS, ASA, AAS, HL)
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class CongruentTrianglesGenerator:
     """Generates problems about triangle congruence."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -50,7 +46,7 @@ class CongruentTrianglesGenerator:
              "For right triangles, if the hypotenuse and one leg are congruent, use HL.")
         ]
 
-        given, answer, explanation = random.choice(criteria)
+        given, answer, explanation = self.rng.choice(criteria)
 
         latex = f"\\text{{Which congruence criterion applies? }} {given}"
         solution = answer
@@ -79,7 +75,7 @@ class CongruentTrianglesGenerator:
              "AAA proves similarity, not congruence."),
         ]
 
-        given, answer, explanation = random.choice(scenarios)
+        given, answer, explanation = self.rng.choice(scenarios)
 
         latex = f"\\text{{Can }} \\triangle ABC \\cong \\triangle DEF \\text{{ be proven? Given: }} {given}"
         solution = answer
@@ -94,16 +90,16 @@ class CongruentTrianglesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Find missing values using congruent triangles"""
-        problem_type = random.choice(['find_side', 'find_angle'])
+        problem_type = self.rng.choice(['find_side', 'find_angle'])
 
         if problem_type == 'find_side':
             # Given congruent triangles, find unknown side
-            a = random.randint(2, 4)
-            x = random.randint(3, 8)
-            b = random.randint(1, 10)
+            a = self.rng.randint(2, 4)
+            x = self.rng.randint(3, 8)
+            b = self.rng.randint(1, 10)
             side = a * x + b
 
-            other_side = random.randint(5, 15)
+            other_side = self.rng.randint(5, 15)
 
             latex = f"\\triangle ABC \\cong \\triangle DEF. \\text{{ If }} AB = {a}x + {b} \\text{{ and }} DE = {side}, \\text{{ find }} x."
             solution = str(x)
@@ -117,9 +113,9 @@ class CongruentTrianglesGenerator:
             ]
         else:
             # Given congruent triangles, find unknown angle
-            a = random.randint(2, 5)
-            x = random.randint(5, 20)
-            b = random.randint(0, 20)
+            a = self.rng.randint(2, 5)
+            x = self.rng.randint(5, 20)
+            b = self.rng.randint(0, 20)
             angle = a * x + b
 
             latex = f"\\triangle PQR \\cong \\triangle STU. \\text{{ If }} m\\angle P = {a}x + {b} \\text{{ and }} m\\angle S = {angle}°, \\text{{ find }} x."
@@ -137,7 +133,7 @@ class CongruentTrianglesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Prove triangles congruent or find multiple values"""
-        problem_type = random.choice(['proof_setup', 'multiple_values', 'cpctc'])
+        problem_type = self.rng.choice(['proof_setup', 'multiple_values', 'cpctc'])
 
         if problem_type == 'proof_setup':
             scenarios = [
@@ -158,7 +154,7 @@ class CongruentTrianglesGenerator:
                 )
             ]
 
-            given, answer, explanation = random.choice(scenarios)
+            given, answer, explanation = self.rng.choice(scenarios)
 
             latex = f"\\text{{{given} Which triangles are congruent and why?}}"
             solution = answer
@@ -170,11 +166,11 @@ class CongruentTrianglesGenerator:
 
         elif problem_type == 'multiple_values':
             # Find both x and y
-            x = random.randint(3, 8)
-            y = random.randint(2, 6)
+            x = self.rng.randint(3, 8)
+            y = self.rng.randint(2, 6)
 
-            a1, b1 = random.randint(2, 4), random.randint(1, 5)
-            a2, b2 = random.randint(2, 4), random.randint(1, 5)
+            a1, b1 = self.rng.randint(2, 4), self.rng.randint(1, 5)
+            a2, b2 = self.rng.randint(2, 4), self.rng.randint(1, 5)
 
             side1 = a1 * x + b1
             side2 = a2 * y + b2
@@ -189,9 +185,9 @@ class CongruentTrianglesGenerator:
 
         else:
             # CPCTC application
-            x = random.randint(4, 10)
-            a = random.randint(2, 4)
-            b = random.randint(1, 8)
+            x = self.rng.randint(4, 10)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(1, 8)
             given_value = a * x + b
 
             latex = f"\\triangle RST \\cong \\triangle XYZ \\text{{ by SAS. If }} RS = {a}x + {b} \\text{{ and }} XY = {given_value}, \\text{{ find }} x \\text{{ and }} RT \\text{{ if }} RT = 2x + 3."
@@ -5,9 +5,6 @@ Creates problems about proving general geometric theorems
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class ProofsGeneralTheoremsGenerator:
     """Generates problems about proving general geometric theorems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -33,10 +29,10 @@ class ProofsGeneralTheoremsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Basic proof concepts"""
-        problem_type = random.choice(['vertical_angles', 'linear_pair', 'corresponding'])
+        problem_type = self.rng.choice(['vertical_angles', 'linear_pair', 'corresponding'])
 
         if problem_type == 'vertical_angles':
-            angle = random.randint(50, 130)
+            angle = self.rng.randint(50, 130)
 
             latex = f"\\text{{Two lines intersect forming an angle of }} {angle}^\\circ. \\text{{ Find the vertical angle.}}"
             solution = f"{angle}°"
@@ -46,7 +42,7 @@ class ProofsGeneralTheoremsGenerator:
             ]
 
         elif problem_type == 'linear_pair':
-            angle = random.randint(60, 120)
+            angle = self.rng.randint(60, 120)
             supplement = 180 - angle
 
             latex = f"\\text{{Two angles form a linear pair. If one angle is }} {angle}^\\circ, \\text{{ find the other.}}"
@@ -57,7 +53,7 @@ class ProofsGeneralTheoremsGenerator:
             ]
 
         else:  # corresponding
-            angle = random.randint(70, 110)
+            angle = self.rng.randint(70, 110)
 
             latex = f"\\text{{Two parallel lines are cut by a transversal. If one angle is }} {angle}^\\circ, "
             latex += "\\text{what is the corresponding angle?}"
@@ -71,10 +67,10 @@ class ProofsGeneralTheoremsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Two-column proof setup"""
-        problem_type = random.choice(['alternate_interior', 'triangle_sum', 'exterior_angle'])
+        problem_type = self.rng.choice(['alternate_interior', 'triangle_sum', 'exterior_angle'])
 
         if problem_type == 'alternate_interior':
-            angle = random.randint(65, 115)
+            angle = self.rng.randint(65, 115)
 
             latex = f"\\text{{Parallel lines cut by transversal. If one interior angle is }} {angle}^\\circ, "
             latex += "\\text{find the alternate interior angle.}"
@@ -96,8 +92,8 @@ class ProofsGeneralTheoremsGenerator:
             ]
 
         else:  # exterior_angle
-            a1 = random.randint(50, 70)
-            a2 = random.randint(60, 80)
+            a1 = self.rng.randint(50, 70)
+            a2 = self.rng.randint(60, 80)
             ext = a1 + a2
 
             latex = f"\\text{{Prove: An exterior angle of a triangle equals the sum of the two remote interior angles. }}"
@@ -114,7 +110,7 @@ class ProofsGeneralTheoremsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Complete proofs"""
-        problem_type = random.choice(['base_angles', 'perpendicular_bisector', 'parallelogram_diagonals'])
+        problem_type = self.rng.choice(['base_angles', 'perpendicular_bisector', 'parallelogram_diagonals'])
 
         if problem_type == 'base_angles':
             latex = "\\text{Prove: Base angles of an isosceles triangle are congruent.}"
@@ -158,7 +154,7 @@ class ProofsGeneralTheoremsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Complex proof problems"""
-        problem_type = random.choice(['concurrence', 'ptolemy', 'ceva'])
+        problem_type = self.rng.choice(['concurrence', 'ptolemy', 'ceva'])
 
         if problem_type == 'concurrence':
             latex = "\\text{Prove: The perpendicular bisectors of a triangle are concurrent.}"
@@ -5,9 +5,6 @@ Creates problems about proving geometric properties using transformations
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class ProofsWithTransformationsGenerator:
     """Generates problems about proofs using transformations."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -33,7 +29,7 @@ class ProofsWithTransformationsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Basic transformation proof concepts"""
-        problem_type = random.choice(['reflection_property', 'rotation_property', 'translation_property'])
+        problem_type = self.rng.choice(['reflection_property', 'rotation_property', 'translation_property'])
 
         if problem_type == 'reflection_property':
             latex = "\\text{Prove that a reflection preserves distances. If } AB = 5 \\text{, what is } A'B' \\text{ after reflection?}"
@@ -45,7 +41,7 @@ class ProofsWithTransformationsGenerator:
             ]
 
         elif problem_type == 'rotation_property':
-            angle = random.choice([30, 45, 60, 90])
+            angle = self.rng.choice([30, 45, 60, 90])
             latex = f"\\text{{After rotating }} \\angle ABC \\text{{ by }} {angle}^\\circ, \\text{{ what is the measure of }} \\angle A'B'C' \\text{{ if }} \\angle ABC = 72^\\circ?"
             solution = "72°"
             steps = [
@@ -55,8 +51,8 @@ class ProofsWithTransformationsGenerator:
             ]
 
         else:  # translation_property
-            vec_x = random.randint(3, 8)
-            vec_y = random.randint(2, 7)
+            vec_x = self.rng.randint(3, 8)
+            vec_y = self.rng.randint(2, 7)
             latex = f"\\text{{Triangle ABC is translated by vector }} \\langle {vec_x}, {vec_y} \\rangle. \\text{{ Is }} \\triangle A'B'C' \\cong \\triangle ABC? \\text{{ Why?}}"
             solution = "Yes, translations preserve size and shape"
             steps = [
@@ -69,11 +65,11 @@ class ProofsWithTransformationsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Apply transformations to prove congruence"""
-        problem_type = random.choice(['prove_congruent', 'sequence_proof', 'isosceles'])
+        problem_type = self.rng.choice(['prove_congruent', 'sequence_proof', 'isosceles'])
 
         if problem_type == 'prove_congruent':
-            x1, y1 = random.randint(1, 4), random.randint(1, 4)
-            x2, y2 = random.randint(6, 9), random.randint(1, 4)
+            x1, y1 = self.rng.randint(1, 4), self.rng.randint(1, 4)
+            x2, y2 = self.rng.randint(6, 9), self.rng.randint(1, 4)
 
             latex = f"\\text{{Points A}}({x1}, {y1}) \\text{{ and B}}({x2}, {y2}) \\text{{ are reflected across the x-axis to A' and B'. }}"
             latex += "\\text{Prove } AB = A'B'."
@@ -85,8 +81,8 @@ class ProofsWithTransformationsGenerator:
             ]
 
         elif problem_type == 'sequence_proof':
-            angle = random.choice([90, 180])
-            dx = random.randint(3, 6)
+            angle = self.rng.choice([90, 180])
+            dx = self.rng.randint(3, 6)
 
             latex = f"\\text{{A segment is rotated }} {angle}^\\circ \\text{{ about the origin, then translated }} {dx} \\text{{ units right. }}"
             latex += "\\text{Does the length change?}"
@@ -99,7 +95,7 @@ class ProofsWithTransformationsGenerator:
             ]
 
         else:  # isosceles
-            base = random.randint(6, 12)
+            base = self.rng.randint(6, 12)
             latex = f"\\text{{An isosceles triangle has a line of symmetry through its vertex angle. }}"
             latex += f"\\text{{If the base is }} {base}, \\text{{ prove the two legs are equal.}}"
             solution = "Legs are equal by reflection symmetry"
@@ -114,7 +110,7 @@ class ProofsWithTransformationsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Multi-step transformation proofs"""
-        problem_type = random.choice(['parallelogram', 'perpendicular_bisector', 'composition'])
+        problem_type = self.rng.choice(['parallelogram', 'perpendicular_bisector', 'composition'])
 
         if problem_type == 'parallelogram':
             latex = "\\text{Given parallelogram ABCD, prove that opposite sides are congruent using transformations.}"
@@ -153,7 +149,7 @@ class ProofsWithTransformationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Complex proofs involving multiple concepts"""
-        problem_type = random.choice(['angle_bisector', 'rhombus', 'glide_reflection'])
+        problem_type = self.rng.choice(['angle_bisector', 'rhombus', 'glide_reflection'])
 
         if problem_type == 'angle_bisector':
             latex = "\\text{Prove that the angle bisector of an angle is the set of all points equidistant from the two sides.}"
@@ -181,7 +177,7 @@ class ProofsWithTransformationsGenerator:
             ]
 
         else:  # glide_reflection
-            d = random.randint(4, 8)
+            d = self.rng.randint(4, 8)
             latex = f"\\text{{A figure is reflected across the x-axis, then translated }} {d} \\text{{ units right. }}"
             latex += "\\text{This composition is called a glide reflection. Prove that reversing the order gives the same result.}"
             solution = "Both orders produce the same glide reflection"
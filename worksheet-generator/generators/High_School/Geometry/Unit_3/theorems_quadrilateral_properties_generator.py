@@ -5,9 +5,6 @@ Creates problems about quadrilateral theorems and properties
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class TheoremsQuadrilateralPropertiesGenerator:
     """Generates problems about quadrilateral theorems and properties."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -33,12 +29,12 @@ class TheoremsQuadrilateralPropertiesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Basic quadrilateral properties"""
-        problem_type = random.choice(['angle_sum', 'rectangle', 'square', 'parallelogram'])
+        problem_type = self.rng.choice(['angle_sum', 'rectangle', 'square', 'parallelogram'])
 
         if problem_type == 'angle_sum':
-            a1 = random.randint(70, 100)
-            a2 = random.randint(80, 110)
-            a3 = random.randint(70, 100)
+            a1 = self.rng.randint(70, 100)
+            a2 = self.rng.randint(80, 110)
+            a3 = self.rng.randint(70, 100)
             a4 = 360 - a1 - a2 - a3
 
             latex = f"\\text{{In quadrilateral ABCD, if }} \\angle A = {a1}^\\circ, \\angle B = {a2}^\\circ, \\angle C = {a3}^\\circ, \\text{{ find }} \\angle D."
@@ -50,8 +46,8 @@ class TheoremsQuadrilateralPropertiesGenerator:
             ]
 
         elif problem_type == 'rectangle':
-            length = random.randint(8, 15)
-            width = random.randint(5, 10)
+            length = self.rng.randint(8, 15)
+            width = self.rng.randint(5, 10)
             perim = 2 * (length + width)
 
             latex = f"\\text{{A rectangle has length }} {length} \\text{{ and width }} {width}. \\text{{ Find its perimeter.}}"
@@ -62,7 +58,7 @@ class TheoremsQuadrilateralPropertiesGenerator:
             ]
 
         elif problem_type == 'square':
-            side = random.randint(6, 12)
+            side = self.rng.randint(6, 12)
             area = side * side
 
             latex = f"\\text{{A square has side length }} {side}. \\text{{ Find its area.}}"
@@ -72,7 +68,7 @@ class TheoremsQuadrilateralPropertiesGenerator:
             ]
 
         else:  # parallelogram
-            a1 = random.randint(60, 100)
+            a1 = self.rng.randint(60, 100)
             a2 = 180 - a1
 
             latex = f"\\text{{In parallelogram ABCD, if }} \\angle A = {a1}^\\circ, \\text{{ find }} \\angle B."
@@ -87,10 +83,10 @@ class TheoremsQuadrilateralPropertiesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Properties of special quadrilaterals"""
-        problem_type = random.choice(['rhombus', 'trapezoid', 'kite', 'parallelogram_sides'])
+        problem_type = self.rng.choice(['rhombus', 'trapezoid', 'kite', 'parallelogram_sides'])
 
         if problem_type == 'rhombus':
-            side = random.randint(7, 15)
+            side = self.rng.randint(7, 15)
             perim = 4 * side
 
             latex = f"\\text{{A rhombus has one side of length }} {side}. \\text{{ Find its perimeter.}}"
@@ -101,9 +97,9 @@ class TheoremsQuadrilateralPropertiesGenerator:
             ]
 
         elif problem_type == 'trapezoid':
-            b1 = random.randint(8, 14)
-            b2 = random.randint(16, 24)
-            h = random.randint(6, 10)
+            b1 = self.rng.randint(8, 14)
+            b2 = self.rng.randint(16, 24)
+            h = self.rng.randint(6, 10)
             area = 0.5 * (b1 + b2) * h
 
             latex = f"\\text{{A trapezoid has bases }} {b1} \\text{{ and }} {b2} \\text{{ with height }} {h}. \\text{{ Find its area.}}"
@@ -115,8 +111,8 @@ class TheoremsQuadrilateralPropertiesGenerator:
             ]
 
         elif problem_type == 'kite':
-            d1 = random.randint(8, 16)
-            d2 = random.randint(10, 18)
+            d1 = self.rng.randint(8, 16)
+            d2 = self.rng.randint(10, 18)
             area = 0.5 * d1 * d2
 
             latex = f"\\text{{A kite has diagonals of length }} {d1} \\text{{ and }} {d2}. \\text{{ Find its area.}}"
@@ -127,8 +123,8 @@ class TheoremsQuadrilateralPropertiesGenerator:
             ]
 
         else:  # parallelogram_sides
-            side1 = random.randint(8, 15)
-            side2 = random.randint(10, 18)
+            side1 = self.rng.randint(8, 15)
+            side2 = self.rng.randint(10, 18)
 
             latex = f"\\text{{A parallelogram has adjacent sides of length }} {side1} \\text{{ and }} {side2}. "
             latex += "\\text{What are the lengths of the other two sides?}"
@@ -142,11 +138,11 @@ class TheoremsQuadrilateralPropertiesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Advanced quadrilateral theorems"""
-        problem_type = random.choice(['parallelogram_diagonals', 'rectangle_diagonal', 'rhombus_angles'])
+        problem_type = self.rng.choice(['parallelogram_diagonals', 'rectangle_diagonal', 'rhombus_angles'])
 
         if problem_type == 'parallelogram_diagonals':
-            d1_half = random.randint(5, 10)
-            d2_half = random.randint(6, 11)
+            d1_half = self.rng.randint(5, 10)
+            d2_half = self.rng.randint(6, 11)
 
             latex = f"\\text{{The diagonals of a parallelogram bisect each other. }}"
             latex += f"\\text{{If one diagonal is divided into segments of }} {d1_half} \\text{{ and }} {d1_half}, "
@@ -158,8 +154,8 @@ class TheoremsQuadrilateralPropertiesGenerator:
             ]
 
         elif problem_type == 'rectangle_diagonal':
-            length = random.randint(6, 12)
-            width = random.randint(8, 14)
+            length = self.rng.randint(6, 12)
+            width = self.rng.randint(8, 14)
             import math
             diagonal = math.sqrt(length**2 + width**2)
 
@@ -172,9 +168,9 @@ class TheoremsQuadrilateralPropertiesGenerator:
             ]
 
         else:  # rhombus_angles
-            angle = random.randint(50, 80)
-            d1 = random.randint(10, 16)
-            d2 = random.randint(12, 18)
+            angle = self.rng.randint(50, 80)
+            d1 = self.rng.randint(10, 16)
+            d2 = self.rng.randint(12, 18)
 
             latex = f"\\text{{In a rhombus, one angle measures }} {angle}^\\circ. \\text{{ Find the adjacent angle.}}"
             solution = f"{180 - angle}°"
@@ -188,7 +184,7 @@ class TheoremsQuadrilateralPropertiesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Complex quadrilateral proofs and properties"""
-        problem_type = random.choice(['prove_parallelogram', 'cyclic_quadrilateral', 'varignon'])
+        problem_type = self.rng.choice(['prove_parallelogram', 'cyclic_quadrilateral', 'varignon'])
 
         if problem_type == 'prove_parallelogram':
             latex = "\\text{Prove: If both pairs of opposite sides of a quadrilateral are parallel, it is a parallelogram.}"
@@ -200,7 +196,7 @@ class TheoremsQuadrilateralPropertiesGenerator:
             ]
 
         elif problem_type == 'cyclic_quadrilateral':
-            a1 = random.randint(70, 110)
+            a1 = self.rng.randint(70, 110)
             a2 = 180 - a1
 
             latex = f"\\text{{In a cyclic quadrilateral, opposite angles are supplementary. }}"
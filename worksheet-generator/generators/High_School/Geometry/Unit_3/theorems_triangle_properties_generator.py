@@ -5,9 +5,6 @@ Creates problems about triangle theorems and properties
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class TheoremsTrianglePropertiesGenerator:
     """Generates problems about triangle theorems and properties."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -33,11 +29,11 @@ class TheoremsTrianglePropertiesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Basic triangle properties"""
-        problem_type = random.choice(['angle_sum', 'exterior_angle', 'isosceles'])
+        problem_type = self.rng.choice(['angle_sum', 'exterior_angle', 'isosceles'])
 
         if problem_type == 'angle_sum':
-            a1 = random.randint(40, 70)
-            a2 = random.randint(40, 80)
+            a1 = self.rng.randint(40, 70)
+            a2 = self.rng.randint(40, 80)
             a3 = 180 - a1 - a2
 
             latex = f"\\text{{In }} \\triangle ABC, \\angle A = {a1}^\\circ \\text{{ and }} \\angle B = {a2}^\\circ. \\text{{ Find }} \\angle C."
@@ -50,8 +46,8 @@ class TheoremsTrianglePropertiesGenerator:
             ]
 
         elif problem_type == 'exterior_angle':
-            a1 = random.randint(45, 70)
-            a2 = random.randint(50, 75)
+            a1 = self.rng.randint(45, 70)
+            a2 = self.rng.randint(50, 75)
             ext = a1 + a2
 
             latex = f"\\text{{In }} \\triangle ABC, \\angle A = {a1}^\\circ \\text{{ and }} \\angle B = {a2}^\\circ. "
@@ -64,7 +60,7 @@ class TheoremsTrianglePropertiesGenerator:
             ]
 
         else:  # isosceles
-            base_angle = random.randint(50, 75)
+            base_angle = self.rng.randint(50, 75)
             vertex_angle = 180 - 2 * base_angle
 
             latex = f"\\text{{An isosceles triangle has base angles of }} {base_angle}^\\circ. \\text{{ Find the vertex angle.}}"
@@ -79,15 +75,15 @@ class TheoremsTrianglePropertiesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Triangle inequality and relationships"""
-        problem_type = random.choice(['triangle_inequality', 'longest_side', 'altitude'])
+        problem_type = self.rng.choice(['triangle_inequality', 'longest_side', 'altitude'])
 
         if problem_type == 'triangle_inequality':
-            s1 = random.randint(5, 10)
-            s2 = random.randint(7, 12)
-            valid_s3 = random.randint(abs(s1 - s2) + 1, s1 + s2 - 1)
-            invalid_s3 = s1 + s2 + random.randint(1, 3)
+            s1 = self.rng.randint(5, 10)
+            s2 = self.rng.randint(7, 12)
+            valid_s3 = self.rng.randint(abs(s1 - s2) + 1, s1 + s2 - 1)
+            invalid_s3 = s1 + s2 + self.rng.randint(1, 3)
 
-            if random.choice([True, False]):
+            if self.rng.choice([True, False]):
                 latex = f"\\text{{Can a triangle have sides }} {s1}, {s2}, {valid_s3}? \\text{{ Why?}}"
                 solution = "Yes"
                 steps = [
@@ -108,7 +104,7 @@ class TheoremsTrianglePropertiesGenerator:
                 ]
 
         elif problem_type == 'longest_side':
-            angles = sorted([random.randint(40, 60), random.randint(50, 70), random.randint(50, 80)])
+            angles = sorted([self.rng.randint(40, 60), self.rng.randint(50, 70), self.rng.randint(50, 80)])
             angles[2] = 180 - angles[0] - angles[1]
 
             latex = f"\\text{{In }} \\triangle ABC, \\angle A = {angles[0]}^\\circ, \\angle B = {angles[1]}^\\circ, \\angle C = {angles[2]}^\\circ. "
@@ -126,8 +122,8 @@ class TheoremsTrianglePropertiesGenerator:
             ]
 
         else:  # altitude
-            base = random.randint(8, 16)
-            area = random.randint(40, 80)
+            base = self.rng.randint(8, 16)
+            area = self.rng.randint(40, 80)
             height = (2 * area) / base
 
             latex = f"\\text{{A triangle has base }} {base} \\text{{ and area }} {area}. \\text{{ Find the altitude to that base.}}"
@@ -143,10 +139,10 @@ class TheoremsTrianglePropertiesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Advanced triangle theorems"""
-        problem_type = random.choice(['angle_bisector', 'median', 'centroid'])
+        problem_type = self.rng.choice(['angle_bisector', 'median', 'centroid'])
 
         if problem_type == 'angle_bisector':
-            angle = random.randint(60, 120)
+            angle = self.rng.randint(60, 120)
             half = angle / 2
 
             latex = f"\\text{{The angle bisector of }} \\angle A = {angle}^\\circ \\text{{ in }} \\triangle ABC \\text{{ divides it into two angles. Find each.}}"
@@ -167,7 +163,7 @@ class TheoremsTrianglePropertiesGenerator:
             ]
 
         else:  # centroid
-            coord = random.randint(12, 24)
+            coord = self.rng.randint(12, 24)
 
             latex = f"\\text{{A median of a triangle is }} {coord} \\text{{ units long. }}"
             latex += "\\text{How far from the vertex is the centroid along this median?}"
@@ -184,10 +180,10 @@ class TheoremsTrianglePropertiesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Complex triangle theorems and proofs"""
-        problem_type = random.choice(['midsegment', 'orthocenter', 'angle_bisector_theorem'])
+        problem_type = self.rng.choice(['midsegment', 'orthocenter', 'angle_bisector_theorem'])
 
         if problem_type == 'midsegment':
-            base = random.randint(10, 24)
+            base = self.rng.randint(10, 24)
             midseg = base / 2
 
             latex = f"\\text{{The midsegment of a triangle parallel to a side of length }} {base} \\text{{ has what length?}}"
@@ -210,9 +206,9 @@ class TheoremsTrianglePropertiesGenerator:
             ]
 
         else:  # angle_bisector_theorem
-            side1 = random.randint(6, 10)
-            side2 = random.randint(8, 12)
-            seg1 = random.randint(3, 5)
+            side1 = self.rng.randint(6, 10)
+            side2 = self.rng.randint(8, 12)
+            seg1 = self.rng.randint(3, 5)
             seg2 = (side2 * seg1) / side1
 
             latex = f"\\text{{By the Angle Bisector Theorem, if sides AB = }} {side1} \\text{{ and AC = }} {side2}, "
@@ -5,9 +5,6 @@ Creates problems about using transformations to establish congruence
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class TransformationsAndCongruenceGenerator:
     """Generates problems about transformations and congruence."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -33,10 +29,10 @@ class TransformationsAndCongruenceGenerator:
 
     def _generate_easy(self) -> Equation:
         """Basic congruence from single transformation"""
-        problem_type = random.choice(['single_transformation', 'congruent_or_not', 'identify'])
+        problem_type = self.rng.choice(['single_transformation', 'congruent_or_not', 'identify'])
 
         if problem_type == 'single_transformation':
-            transformation = random.choice(['reflection', 'rotation', 'translation'])
+            transformation = self.rng.choice(['reflection', 'rotation', 'translation'])
 
             latex = f"\\text{{Triangle ABC is mapped to triangle DEF by a {transformation}. Are the triangles congruent?}}"
             solution = "Yes"
@@ -47,10 +43,10 @@ class TransformationsAndCongruenceGenerator:
             ]
 
         elif problem_type == 'congruent_or_not':
-            transform = random.choice(['dilation', 'reflection'])
+            transform = self.rng.choice(['dilation', 'reflection'])
 
             if transform == 'dilation':
-                k = random.choice([2, 0.5, 3])
+                k = self.rng.choice([2, 0.5, 3])
                 latex = f"\\text{{A square is dilated with scale factor }} k = {k}. \\text{{ Is the image congruent to the original?}}"
                 solution = "No" if k != 1 else "Yes"
                 steps = [
@@ -83,11 +79,11 @@ class TransformationsAndCongruenceGenerator:
 
     def _generate_medium(self) -> Equation:
         """Sequence of transformations for congruence"""
-        problem_type = random.choice(['sequence', 'verify_congruence', 'coordinates'])
+        problem_type = self.rng.choice(['sequence', 'verify_congruence', 'coordinates'])
 
         if problem_type == 'sequence':
-            angle = random.choice([90, 180, 270])
-            dx = random.randint(3, 7)
+            angle = self.rng.choice([90, 180, 270])
+            dx = self.rng.randint(3, 7)
 
             latex = f"\\text{{Pentagon ABCDE is rotated }} {angle}^\\circ \\text{{ about the origin, then translated }} {dx} \\text{{ units right.}}"
             latex += " \\text{Is the final image congruent to the original?}"
@@ -100,8 +96,8 @@ class TransformationsAndCongruenceGenerator:
             ]
 
         elif problem_type == 'verify_congruence':
-            side1 = random.randint(5, 12)
-            side2 = random.randint(5, 12)
+            side1 = self.rng.randint(5, 12)
+            side2 = self.rng.randint(5, 12)
 
             latex = f"\\text{{Rectangle ABCD with sides }} {side1} \\times {side2} \\text{{ is reflected across the y-axis to form A'B'C'D'. }}"
             latex += "\\text{Verify that ABCD } \\cong \\text{ A'B'C'D'.}"
@@ -115,9 +111,9 @@ class TransformationsAndCongruenceGenerator:
             ]
 
         else:  # coordinates
-            x1, y1 = random.randint(1, 5), random.randint(1, 5)
-            x2, y2 = random.randint(1, 5), random.randint(6, 10)
-            x3, y3 = random.randint(6, 10), random.randint(1, 5)
+            x1, y1 = self.rng.randint(1, 5), self.rng.randint(1, 5)
+            x2, y2 = self.rng.randint(1, 5), self.rng.randint(6, 10)
+            x3, y3 = self.rng.randint(6, 10), self.rng.randint(1, 5)
 
             latex = f"\\text{{Triangle with vertices A}}({x1},{y1}), \\text{{B}}({x2},{y2}), \\text{{C}}({x3},{y3}) \\text{{ is reflected across the x-axis. }}"
             latex += "\\text{Find one side length of the image to verify congruence.}"
@@ -136,10 +132,10 @@ class TransformationsAndCongruenceGenerator:
 
     def _generate_hard(self) -> Equation:
         """Finding the transformation that proves congruence"""
-        problem_type = random.choice(['describe_transformation', 'multiple_steps', 'prove_congruent'])
+        problem_type = self.rng.choice(['describe_transformation', 'multiple_steps', 'prove_congruent'])
 
         if problem_type == 'describe_transformation':
-            x1, y1 = random.randint(2, 5), random.randint(2, 5)
+            x1, y1 = self.rng.randint(2, 5), self.rng.randint(2, 5)
             x2, y2 = -x1, y1
 
             latex = f"\\text{{Point A}}({x1},{y1}) \\text{{ maps to A'}}({x2},{y2}). \\text{{ Describe the transformation.}}"
@@ -162,8 +158,8 @@ class TransformationsAndCongruenceGenerator:
             ]
 
         else:  # prove_congruent
-            s1 = random.randint(6, 10)
-            s2 = random.randint(6, 10)
+            s1 = self.rng.randint(6, 10)
+            s2 = self.rng.randint(6, 10)
 
             latex = f"\\text{{Two triangles both have sides }} {s1}, {s2}, {s1}. \\text{{ Prove they are congruent using transformations.}}"
             solution = "Congruent by SSS, can map one to other with rigid transformations"
@@ -178,7 +174,7 @@ class TransformationsAndCongruenceGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Complex congruence proofs"""
-        problem_type = random.choice(['minimum_transformations', 'orientation', 'general_proof'])
+        problem_type = self.rng.choice(['minimum_transformations', 'orientation', 'general_proof'])
 
         if problem_type == 'minimum_transformations':
             latex = "\\text{What is the minimum number of reflections needed to map any triangle to any congruent triangle?}"
@@ -5,9 +5,6 @@ Creates problems about triangle congruence criteria derived from transformations
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class TriangleCongruenceFromTransformationsGenerator:
     """Generates problems about triangle congruence using transformations."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -33,10 +29,10 @@ class TriangleCongruenceFromTransformationsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Basic congruence criteria identification"""
-        problem_type = random.choice(['sss', 'sas', 'asa', 'aas'])
+        problem_type = self.rng.choice(['sss', 'sas', 'asa', 'aas'])
 
         if problem_type == 'sss':
-            s1, s2, s3 = random.randint(5, 12), random.randint(5, 12), random.randint(5, 12)
+            s1, s2, s3 = self.rng.randint(5, 12), self.rng.randint(5, 12), self.rng.randint(5, 12)
 
             latex = f"\\text{{{{Triangle ABC has sides }}}} {s1}, {s2}, {s3}. \\text{{{{ Triangle DEF has sides }}}} {s1}, {s2}, {s3}."
             latex += " \\text{{Are the triangles congruent?}}"
@@ -48,8 +44,8 @@ class TriangleCongruenceFromTransformationsGenerator:
             ]
 
         elif problem_type == 'sas':
-            s1, s2 = random.randint(6, 12), random.randint(6, 12)
-            angle = random.randint(40, 120)
+            s1, s2 = self.rng.randint(6, 12), self.rng.randint(6, 12)
+            angle = self.rng.randint(40, 120)
 
             latex = f"\\text{{{{In }}}} \\triangle ABC \\text{{{{ and }}}} \\triangle DEF: AB = DE = {s1}, AC = DF = {s2}, \\angle A = \\angle D = {angle}^\\circ."
             latex += " \\text{{Are they congruent?}}"
@@ -62,8 +58,8 @@ class TriangleCongruenceFromTransformationsGenerator:
             ]
 
         elif problem_type == 'asa':
-            side = random.randint(8, 15)
-            a1, a2 = random.randint(40, 70), random.randint(40, 70)
+            side = self.rng.randint(8, 15)
+            a1, a2 = self.rng.randint(40, 70), self.rng.randint(40, 70)
 
             latex = f"\\text{{{{In }}}} \\triangle ABC \\text{{{{ and }}}} \\triangle DEF: \\angle A = \\angle D = {a1}^\\circ, AB = DE = {side}, \\angle B = \\angle E = {a2}^\\circ."
             latex += " \\text{{Are they congruent?}}"
@@ -76,8 +72,8 @@ class TriangleCongruenceFromTransformationsGenerator:
             ]
 
         else:  # aas
-            side = random.randint(8, 15)
-            a1, a2 = random.randint(40, 70), random.randint(40, 70)
+            side = self.rng.randint(8, 15)
+            a1, a2 = self.rng.randint(40, 70), self.rng.randint(40, 70)
 
             latex = f"\\text{{{{In }}}} \\triangle ABC \\text{{{{ and }}}} \\triangle DEF: \\angle A = \\angle D = {a1}^\\circ, \\angle B = \\angle E = {a2}^\\circ, BC = EF = {side}."
             latex += " \\text{{Are they congruent?}}"
@@ -93,10 +89,10 @@ class TriangleCongruenceFromTransformationsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Identify which congruence criterion applies"""
-        problem_type = random.choice(['identify_criterion', 'not_congruent', 'missing_info'])
+        problem_type = self.rng.choice(['identify_criterion', 'not_congruent', 'missing_info'])
 
         if problem_type == 'identify_criterion':
-            criterion = random.choice(['SSS', 'SAS', 'ASA', 'AAS'])
+            criterion = self.rng.choice(['SSS', 'SAS', 'ASA', 'AAS'])
 
             if criterion == 'SSS':
                 latex = "\\text{{What congruence criterion states that if all three sides of one triangle equal the three sides of another, the triangles are congruent?}}"
@@ -117,8 +113,8 @@ class TriangleCongruenceFromTransformationsGenerator:
             ]
 
         elif problem_type == 'not_congruent':
-            a1, a2 = random.randint(40, 60), random.randint(50, 70)
-            s1, s2 = random.randint(6, 10), random.randint(8, 12)
+            a1, a2 = self.rng.randint(40, 60), self.rng.randint(50, 70)
+            s1, s2 = self.rng.randint(6, 10), self.rng.randint(8, 12)
 
             latex = f"\\text{{{{Two triangles have }}}} \\angle A = \\angle D = {a1}^\\circ, \\angle B = \\angle E = {a2}^\\circ, AC = {s1}, DF = {s2}."
             latex += " \\text{{Can we conclude they are congruent?}}"
@@ -131,10 +127,10 @@ class TriangleCongruenceFromTransformationsGenerator:
             ]
 
         else:  # missing_info
-            given = random.choice(['two_sides', 'two_angles', 'one_side_one_angle'])
+            given = self.rng.choice(['two_sides', 'two_angles', 'one_side_one_angle'])
 
             if given == 'two_sides':
-                s1, s2 = random.randint(6, 10), random.randint(7, 11)
+                s1, s2 = self.rng.randint(6, 10), self.rng.randint(7, 11)
                 latex = f"\\text{{{{Two triangles have AB = DE = {s1} and BC = EF = {s2}. }}}}"
                 latex += "\\text{{What additional information would prove congruence by SAS?}}"
                 solution = f"The included angles: angle B = angle E"
@@ -144,7 +140,7 @@ class TriangleCongruenceFromTransformationsGenerator:
                     "\\text{{We need the angle between them: }} \\angle B = \\angle E"
                 ]
             elif given == 'two_angles':
-                a1, a2 = random.randint(45, 65), random.randint(50, 70)
+                a1, a2 = self.rng.randint(45, 65), self.rng.randint(50, 70)
                 latex = f"\\text{{{{Two triangles have }}}} \\angle A = \\angle D = {a1}^\\circ \\text{{{{ and }}}} \\angle B = \\angle E = {a2}^\\circ. "
                 latex += "\\text{{What additional information would prove congruence by ASA?}}"
                 solution = "The included side: AB = DE"
@@ -154,8 +150,8 @@ class TriangleCongruenceFromTransformationsGenerator:
                     "\\text{{We need the side between them: }} AB = DE"
                 ]
             else:
-                s = random.randint(7, 12)
-                a = random.randint(50, 80)
+                s = self.rng.randint(7, 12)
+                a = self.rng.randint(50, 80)
                 latex = f"\\text{{{{Two triangles have AB = DE = {s} and }}}} \\angle C = \\angle F = {a}^\\circ. "
                 latex += "\\text{{What would prove congruence?}}"
                 solution = "Need more information - not enough for any criterion"
@@ -169,12 +165,12 @@ class TriangleCongruenceFromTransformationsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Apply congruence criteria with variables"""
-        problem_type = random.choice(['solve_for_x', 'prove_using_criterion', 'hl_theorem'])
+        problem_type = self.rng.choice(['solve_for_x', 'prove_using_criterion', 'hl_theorem'])
 
         if problem_type == 'solve_for_x':
-            a = random.randint(2, 5)
-            b = random.randint(3, 8)
-            c = random.randint(10, 20)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(3, 8)
+            c = self.rng.randint(10, 20)
 
             latex = f"\\text{{{{If }}}} \\triangle ABC \\cong \\triangle DEF \\text{{{{ by SAS, AB = {a}x + {b}, DE = {c}, "
             latex += f"\\text{{{{and the angles at A and D are included angles, find x.}}}}}}"
@@ -189,7 +185,7 @@ class TriangleCongruenceFromTransformationsGenerator:
             ]
 
         elif problem_type == 'prove_using_criterion':
-            s = random.randint(8, 15)
+            s = self.rng.randint(8, 15)
 
             latex = f"\\text{{{{In isosceles triangle ABC with AB = AC = {s}, prove that }}}} \\angle B = \\angle C \\text{{{{ using congruence.}}}}"
             solution = "By SAS, triangle ABD ≅ triangle ACD (D is midpoint of BC)"
@@ -203,8 +199,8 @@ class TriangleCongruenceFromTransformationsGenerator:
             ]
 
         else:  # hl_theorem
-            leg = random.randint(6, 12)
-            hyp = random.randint(leg + 3, leg + 8)
+            leg = self.rng.randint(6, 12)
+            hyp = self.rng.randint(leg + 3, leg + 8)
 
             latex = f"\\text{{{{Two right triangles have legs of length {leg} and hypotenuses of length {hyp}. }}}}"
             latex += "\\text{{Prove they are congruent.}}"
@@ -221,7 +217,7 @@ class TriangleCongruenceFromTransformationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Complex congruence proofs and applications"""
-        problem_type = random.choice(['prove_criterion', 'counterexample', 'cpctc'])
+        problem_type = self.rng.choice(['prove_criterion', 'counterexample', 'cpctc'])
 
         if problem_type == 'prove_criterion':
             latex = "\\text{{Prove that SAS congruence criterion is valid using rigid transformations.}}"
@@ -250,7 +246,7 @@ class TriangleCongruenceFromTransformationsGenerator:
             ]
 
         else:  # cpctc
-            angle = random.randint(45, 75)
+            angle = self.rng.randint(45, 75)
 
             latex = f"\\text{{{{Given }}}} \\triangle ABC \\cong \\triangle DEF \\text{{{{ by ASA with }}}} \\angle A = {angle}^\\circ. "
             latex += f"\\text{{{{If BC = 10, what is EF?}}}}"
@@ -5,9 +5,6 @@ Creates problems about triangle constructions, classifications, and basic proper
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class WorkingWithTrianglesGenerator:
     """Generates problems about working with triangles."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -33,10 +29,10 @@ class WorkingWithTrianglesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Basic triangle classification"""
-        problem_type = random.choice(['classify_angles', 'classify_sides', 'perimeter'])
+        problem_type = self.rng.choice(['classify_angles', 'classify_sides', 'perimeter'])
 
         if problem_type == 'classify_angles':
-            angles = random.choice([
+            angles = self.rng.choice([
                 ([30, 60, 90], 'right'),
                 ([50, 60, 70], 'acute'),
                 ([30, 40, 110], 'obtuse')
@@ -50,7 +46,7 @@ class WorkingWithTrianglesGenerator:
             ]
 
         elif problem_type == 'classify_sides':
-            sides = random.choice([
+            sides = self.rng.choice([
                 ([7, 7, 7], 'equilateral'),
                 ([5, 5, 8], 'isosceles'),
                 ([6, 7, 8], 'scalene')
@@ -64,7 +60,7 @@ class WorkingWithTrianglesGenerator:
             ]
 
         else:  # perimeter
-            s1, s2, s3 = random.randint(5, 12), random.randint(6, 13), random.randint(7, 14)
+            s1, s2, s3 = self.rng.randint(5, 12), self.rng.randint(6, 13), self.rng.randint(7, 14)
             perim = s1 + s2 + s3
 
             latex = f"\\text{{Find the perimeter of a triangle with sides }} {s1}, {s2}, {s3}."
@@ -77,11 +73,11 @@ class WorkingWithTrianglesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Triangle area and properties"""
-        problem_type = random.choice(['area', 'missing_side', 'isosceles_properties'])
+        problem_type = self.rng.choice(['area', 'missing_side', 'isosceles_properties'])
 
         if problem_type == 'area':
-            base = random.randint(8, 16)
-            height = random.randint(5, 12)
+            base = self.rng.randint(8, 16)
+            height = self.rng.randint(5, 12)
             area = 0.5 * base * height
 
             latex = f"\\text{{Find the area of a triangle with base }} {base} \\text{{ and height }} {height}."
@@ -92,9 +88,9 @@ class WorkingWithTrianglesGenerator:
             ]
 
         elif problem_type == 'missing_side':
-            perim = random.randint(30, 50)
-            s1 = random.randint(8, 15)
-            s2 = random.randint(8, 15)
+            perim = self.rng.randint(30, 50)
+            s1 = self.rng.randint(8, 15)
+            s2 = self.rng.randint(8, 15)
             s3 = perim - s1 - s2
 
             latex = f"\\text{{A triangle has perimeter }} {perim} \\text{{ and two sides of length }} {s1} \\text{{ and }} {s2}. "
@@ -107,8 +103,8 @@ class WorkingWithTrianglesGenerator:
             ]
 
         else:  # isosceles_properties
-            leg = random.randint(8, 15)
-            vertex_angle = random.randint(40, 100)
+            leg = self.rng.randint(8, 15)
+            vertex_angle = self.rng.randint(40, 100)
             base_angle = (180 - vertex_angle) / 2
 
             latex = f"\\text{{An isosceles triangle has legs of length }} {leg} \\text{{ and vertex angle }} {vertex_angle}^\\circ. "
@@ -125,10 +121,10 @@ class WorkingWithTrianglesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Advanced triangle problems"""
-        problem_type = random.choice(['equilateral_area', 'coordinate_triangle', 'heron_formula'])
+        problem_type = self.rng.choice(['equilateral_area', 'coordinate_triangle', 'heron_formula'])
 
         if problem_type == 'equilateral_area':
-            side = random.randint(6, 12)
+            side = self.rng.randint(6, 12)
             import math
             area = (math.sqrt(3) / 4) * side * side
 
@@ -142,8 +138,8 @@ class WorkingWithTrianglesGenerator:
 
         elif problem_type == 'coordinate_triangle':
             x1, y1 = 0, 0
-            x2, y2 = random.randint(4, 8), 0
-            x3, y3 = random.randint(2, 6), random.randint(4, 8)
+            x2, y2 = self.rng.randint(4, 8), 0
+            x3, y3 = self.rng.randint(2, 6), self.rng.randint(4, 8)
 
             area = 0.5 * abs(x1*(y2-y3) + x2*(y3-y1) + x3*(y1-y2))
 
@@ -174,7 +170,7 @@ class WorkingWithTrianglesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Complex triangle constructions and proofs"""
-        problem_type = random.choice(['altitude_area', 'triangle_centers', 'napoleon'])
+        problem_type = self.rng.choice(['altitude_area', 'triangle_centers', 'napoleon'])
 
         if problem_type == 'altitude_area':
             s1, s2, s3 = 6, 8, 10  # Right triangle
@@ -4,15 +4,12 @@ Angle Bisector Theorem Generator
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class AngleBisectorTheoremGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -31,8 +28,8 @@ class AngleBisectorTheoremGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        ab, ac = random.randint(6, 12), random.randint(8, 14)
-        bd = random.randint(3, 7)
+        ab, ac = self.rng.randint(6, 12), self.rng.randint(8, 14)
+        bd = self.rng.randint(3, 7)
         dc = (ac * bd) / ab
         latex = f"\\text{{In triangle ABC, AB = }} {ab}, \\text{{ AC = }} {ac}. \\text{{ Angle bisector from A creates BD = }} {bd}. \\text{{ Find DC.}}"
         solution = f"{dc:.2f}"
@@ -41,9 +38,9 @@ class AngleBisectorTheoremGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        ab = random.randint(8, 14)
-        ac = random.randint(10, 16)
-        bc = random.randint(12, 20)
+        ab = self.rng.randint(8, 14)
+        ac = self.rng.randint(10, 16)
+        bc = self.rng.randint(12, 20)
         bd = (ab * bc) / (ab + ac)
         dc = bc - bd
         latex = f"\\text{{Triangle ABC: AB = }} {ab}, \\text{{ AC = }} {ac}, \\text{{ BC = }} {bc}. \\text{{ Angle bisector from A divides BC. Find BD and DC.}}"
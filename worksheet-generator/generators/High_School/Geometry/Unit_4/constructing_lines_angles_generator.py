@@ -5,9 +5,6 @@ Creates problems about geometric constructions with compass and straightedge
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class ConstructingLinesAnglesGenerator:
     """Generates problems about constructing lines and angles."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -33,10 +29,10 @@ class ConstructingLinesAnglesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Basic construction descriptions"""
-        problem_type = random.choice(['copy_segment', 'copy_angle', 'perpendicular_bisector'])
+        problem_type = self.rng.choice(['copy_segment', 'copy_angle', 'perpendicular_bisector'])
 
         if problem_type == 'copy_segment':
-            length = random.randint(5, 12)
+            length = self.rng.randint(5, 12)
 
             latex = f"\\text{{Describe how to copy a segment of length }} {length} \\text{{ using compass and straightedge.}}"
             solution = "Place compass at one endpoint, draw arc from other endpoint"
@@ -49,7 +45,7 @@ class ConstructingLinesAnglesGenerator:
             ]
 
         elif problem_type == 'copy_angle':
-            angle = random.randint(40, 120)
+            angle = self.rng.randint(40, 120)
 
             latex = f"\\text{{What tool is needed to copy an angle of }} {angle}^\\circ?"
             solution = "Compass and straightedge"
@@ -61,7 +57,7 @@ class ConstructingLinesAnglesGenerator:
             ]
 
         else:  # perpendicular_bisector
-            length = random.randint(8, 16)
+            length = self.rng.randint(8, 16)
 
             latex = f"\\text{{A segment has length }} {length}. \\text{{ Where does its perpendicular bisector intersect the segment?}}"
             solution = f"At the midpoint, {length/2} from each end"
@@ -75,10 +71,10 @@ class ConstructingLinesAnglesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Construction procedures"""
-        problem_type = random.choice(['angle_bisector', 'perpendicular_point', 'parallel_line'])
+        problem_type = self.rng.choice(['angle_bisector', 'perpendicular_point', 'parallel_line'])
 
         if problem_type == 'angle_bisector':
-            angle = random.randint(60, 120)
+            angle = self.rng.randint(60, 120)
             half = angle / 2
 
             latex = f"\\text{{Construct the angle bisector of an angle measuring }} {angle}^\\circ. "
@@ -101,7 +97,7 @@ class ConstructingLinesAnglesGenerator:
             ]
 
         else:  # parallel_line
-            dist = random.randint(4, 10)
+            dist = self.rng.randint(4, 10)
 
             latex = f"\\text{{Construct a line parallel to a given line at distance }} {dist} \\text{{ units. }}"
             latex += "\\text{What construction is used?}"
@@ -117,7 +113,7 @@ class ConstructingLinesAnglesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Complex constructions"""
-        problem_type = random.choice(['60_degree', '45_degree', 'divide_segment'])
+        problem_type = self.rng.choice(['60_degree', '45_degree', 'divide_segment'])
 
         if problem_type == '60_degree':
             latex = "\\text{How can you construct a } 60^\\circ \\text{ angle using only compass and straightedge?}"
@@ -141,7 +137,7 @@ class ConstructingLinesAnglesGenerator:
             ]
 
         else:  # divide_segment
-            n = random.choice([3, 4, 5])
+            n = self.rng.choice([3, 4, 5])
 
             latex = f"\\text{{How can you divide a segment into }} {n} \\text{{ equal parts using compass and straightedge?}}"
             solution = "Use parallel lines construction"
@@ -157,7 +153,7 @@ class ConstructingLinesAnglesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Advanced constructions and impossibilities"""
-        problem_type = random.choice(['inscribed_circle', 'circumscribed_circle', 'regular_hexagon'])
+        problem_type = self.rng.choice(['inscribed_circle', 'circumscribed_circle', 'regular_hexagon'])
 
         if problem_type == 'inscribed_circle':
             latex = "\\text{Describe how to construct the inscribed circle (incircle) of a triangle.}"
@@ -183,7 +179,7 @@ class ConstructingLinesAnglesGenerator:
             ]
 
         else:  # regular_hexagon
-            side = random.randint(5, 10)
+            side = self.rng.randint(5, 10)
 
             latex = f"\\text{{Construct a regular hexagon with side length }} {side}. \\text{{ What angle is at each vertex?}}"
             solution = "120°"
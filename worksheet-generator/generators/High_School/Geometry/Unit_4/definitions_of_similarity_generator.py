@@ -5,9 +5,6 @@ Creates problems about similarity definitions and basic concepts
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class DefinitionsOfSimilarityGenerator:
     """Generates problems about similarity definitions."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -33,7 +29,7 @@ class DefinitionsOfSimilarityGenerator:
 
     def _generate_easy(self) -> Equation:
         """Basic similarity concepts"""
-        problem_type = random.choice(['definition', 'scale_factor', 'similar_or_not'])
+        problem_type = self.rng.choice(['definition', 'scale_factor', 'similar_or_not'])
 
         if problem_type == 'definition':
             latex = "\\text{{What does it mean for two figures to be similar?}}"
@@ -46,8 +42,8 @@ class DefinitionsOfSimilarityGenerator:
             ]
 
         elif problem_type == 'scale_factor':
-            s1 = random.randint(4, 8)
-            k = random.choice([2, 3, 4])
+            s1 = self.rng.randint(4, 8)
+            k = self.rng.choice([2, 3, 4])
             s2 = s1 * k
 
             latex = f"\\text{{{{A figure with side }}}} {s1} \\text{{{{ is similar to a figure with corresponding side }}}} {s2}. "
@@ -77,11 +73,11 @@ class DefinitionsOfSimilarityGenerator:
 
     def _generate_medium(self) -> Equation:
         """Similarity with calculations"""
-        problem_type = random.choice(['proportional_sides', 'find_length', 'aa_similarity'])
+        problem_type = self.rng.choice(['proportional_sides', 'find_length', 'aa_similarity'])
 
         if problem_type == 'proportional_sides':
             s1, s2, s3 = 3, 4, 5
-            k = random.choice([2, 3])
+            k = self.rng.choice([2, 3])
             t1, t2, t3 = s1 * k, s2 * k, s3 * k
 
             latex = f"\\text{{{{Triangle ABC has sides }}}} {s1}, {s2}, {s3}. \\text{{{{ Triangle DEF has sides }}}} {t1}, {t2}, {t3}. "
@@ -94,10 +90,10 @@ class DefinitionsOfSimilarityGenerator:
             ]
 
         elif problem_type == 'find_length':
-            s1 = random.randint(5, 10)
-            k = random.choice([2, 3, 4])
+            s1 = self.rng.randint(5, 10)
+            k = self.rng.choice([2, 3, 4])
             s2 = s1 * k
-            t1 = random.randint(6, 12)
+            t1 = self.rng.randint(6, 12)
             t2 = t1 * k
 
             latex = f"\\text{{{{Two similar triangles have scale factor }}}} {k}. \\text{{{{ If one side is }}}} {s1} \\text{{{{ in the smaller triangle, "
@@ -109,8 +105,8 @@ class DefinitionsOfSimilarityGenerator:
             ]
 
         else:  # aa_similarity
-            a1 = random.randint(50, 70)
-            a2 = random.randint(60, 80)
+            a1 = self.rng.randint(50, 70)
+            a2 = self.rng.randint(60, 80)
 
             latex = f"\\text{{{{Two triangles each have angles of }}}} {a1}^\\circ \\text{{{{ and }}}} {a2}^\\circ. "
             latex += "\\text{{Are they similar? By what criterion?}}"
@@ -125,7 +121,7 @@ class DefinitionsOfSimilarityGenerator:
 
     def _generate_hard(self) -> Equation:
         """Advanced similarity problems"""
-        problem_type = random.choice(['sss_similarity', 'sas_similarity', 'find_scale'])
+        problem_type = self.rng.choice(['sss_similarity', 'sas_similarity', 'find_scale'])
 
         if problem_type == 'sss_similarity':
             s1, s2, s3 = 6, 8, 10
@@ -145,7 +141,7 @@ class DefinitionsOfSimilarityGenerator:
 
         elif problem_type == 'sas_similarity':
             s1, s2 = 6, 9
-            angle = random.randint(50, 80)
+            angle = self.rng.randint(50, 80)
             k = 2
             t1, t2 = s1 * k, s2 * k
 
@@ -162,8 +158,8 @@ class DefinitionsOfSimilarityGenerator:
             ]
 
         else:  # find_scale
-            s1 = random.randint(8, 15)
-            s2 = random.randint(12, 20)
+            s1 = self.rng.randint(8, 15)
+            s2 = self.rng.randint(12, 20)
             from math import gcd
             g = gcd(s2, s1)
 
@@ -179,11 +175,11 @@ class DefinitionsOfSimilarityGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Complex similarity concepts"""
-        problem_type = random.choice(['area_ratio', 'volume_ratio', 'similarity_theorem'])
+        problem_type = self.rng.choice(['area_ratio', 'volume_ratio', 'similarity_theorem'])
 
         if problem_type == 'area_ratio':
-            k = random.choice([2, 3, 4])
-            area1 = random.randint(8, 20)
+            k = self.rng.choice([2, 3, 4])
+            area1 = self.rng.randint(8, 20)
             area2 = area1 * k * k
 
             latex = f"\\text{{{{Two similar figures have scale factor }}}} {k}. \\text{{{{ If the smaller has area }}}} {area1}, "
@@ -195,8 +191,8 @@ class DefinitionsOfSimilarityGenerator:
             ]
 
         elif problem_type == 'volume_ratio':
-            k = random.choice([2, 3])
-            vol1 = random.randint(10, 30)
+            k = self.rng.choice([2, 3])
+            vol1 = self.rng.randint(10, 30)
             vol2 = vol1 * k * k * k
 
             latex = f"\\text{{{{Two similar solids have scale factor }}}} {k}. \\text{{{{ If the smaller has volume }}}} {vol1}, "
@@ -4,15 +4,12 @@ Intro to Triangle Similarity Generator
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class IntroTriangleSimilarityGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -24,7 +21,7 @@ class IntroTriangleSimilarityGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a1, a2 = random.randint(50, 70), random.randint(60, 80)
+        a1, a2 = self.rng.randint(50, 70), self.rng.randint(60, 80)
         a3 = 180 - a1 - a2
         latex = f"\\text{{Triangles with angles }} {a1}^\\circ, {a2}^\\circ, {a3}^\\circ \\text{{ and }} {a1}^\\circ, {a2}^\\circ, {a3}^\\circ \\text{{ are similar by which criterion?}}"
         solution = "AA (Angle-Angle)"
@@ -33,7 +30,7 @@ class IntroTriangleSimilarityGenerator:
 
     def _generate_medium(self) -> Equation:
         s1, s2, s3 = 5, 7, 9
-        k = random.choice([2, 3])
+        k = self.rng.choice([2, 3])
         t1, t2, t3 = s1*k, s2*k, s3*k
         latex = f"\\text{{Triangle ABC: }} {s1}, {s2}, {s3}. \\text{{ Triangle DEF: }} {t1}, {t2}, {t3}. \\text{{ Similar?}}"
         solution = f"Yes, scale factor {k}"
@@ -41,9 +38,9 @@ class IntroTriangleSimilarityGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        s1 = random.randint(6, 12)
-        s2 = random.randint(8, 14)
-        x = random.randint(3, 7)
+        s1 = self.rng.randint(6, 12)
+        s2 = self.rng.randint(8, 14)
+        x = self.rng.randint(3, 7)
         latex = f"\\text{{Similar triangles with sides }} {s1}, {s2} \\text{{ and }} {s1+x}, \\text{{ find fourth side.}}"
         k = (s1 + x) / s1
         s2_new = s2 * k
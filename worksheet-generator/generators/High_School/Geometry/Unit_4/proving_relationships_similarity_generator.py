@@ -4,15 +4,12 @@ Proving Relationships Using Similarity Generator
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class ProvingRelationshipsSimilarityGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -24,7 +21,7 @@ class ProvingRelationshipsSimilarityGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a1, a2 = random.randint(55, 75), random.randint(60, 80)
+        a1, a2 = self.rng.randint(55, 75), self.rng.randint(60, 80)
         latex = f"\\text{{Two triangles have angles }} {a1}^\\circ, {a2}^\\circ. \\text{{ Prove they are similar.}}"
         solution = "AA similarity - two angles match"
         steps = [f"\\text{{Both triangles have }} {a1}^\\circ \\text{{ and }} {a2}^\\circ", "\\text{By AA, triangles are similar}"]
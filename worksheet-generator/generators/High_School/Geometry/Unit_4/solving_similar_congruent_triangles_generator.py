@@ -4,15 +4,12 @@ Solving Similar and Congruent Triangles Generator
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class SolvingSimilarCongruentTrianglesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -24,17 +21,17 @@ class SolvingSimilarCongruentTrianglesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        s1, s2, s3 = random.randint(6, 10), random.randint(7, 11), random.randint(8, 12)
+        s1, s2, s3 = self.rng.randint(6, 10), self.rng.randint(7, 11), self.rng.randint(8, 12)
         latex = f"\\text{{If }} \\triangle ABC \\cong \\triangle DEF \\text{{ and AB = }} {s1}, \\text{{ what is DE?}}"
         solution = f"{s1}"
         steps = ["\\text{Congruent triangles have equal corresponding parts}", f"DE = AB = {s1}"]
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        s1 = random.randint(5, 10)
-        k = random.choice([2, 3, 4])
+        s1 = self.rng.randint(5, 10)
+        k = self.rng.choice([2, 3, 4])
         s2 = s1 * k
-        x = random.randint(6, 12)
+        x = self.rng.randint(6, 12)
         y = x * k
         latex = f"\\text{{Similar triangles with sides }} {s1} \\text{{ and }} {s2}. \\text{{ If one side is }} {x} \\text{{ in smaller, find corresponding side.}}"
         solution = f"{y}"
@@ -42,8 +39,8 @@ class SolvingSimilarCongruentTrianglesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        s1, s2 = random.randint(8, 14), random.randint(10, 16)
-        t1 = random.randint(12, 20)
+        s1, s2 = self.rng.randint(8, 14), self.rng.randint(10, 16)
+        t1 = self.rng.randint(12, 20)
         t2 = (s2 * t1) / s1
         latex = f"\\text{{Two similar triangles have corresponding sides }} {s1} \\text{{ and }} {t1}. \\text{{ If another side is }} {s2}, \\text{{ find its corresponding side.}}"
         solution = f"{t2:.1f}"
@@ -51,8 +48,8 @@ class SolvingSimilarCongruentTrianglesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        h1 = random.randint(6, 12)
-        k = random.choice([2, 3])
+        h1 = self.rng.randint(6, 12)
+        k = self.rng.choice([2, 3])
         h2 = h1 * k
         latex = f"\\text{{Two similar triangles have altitudes }} {h1} \\text{{ and }} {h2}. \\text{{ If the smaller has area 20, find area of larger.}}"
         area = 20 * k * k
@@ -5,9 +5,6 @@ Creates problems about finding missing sides using triangle similarity
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class SolvingSimilarTrianglesGenerator:
     """Generates problems about solving similar triangles."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -38,18 +34,18 @@ class SolvingSimilarTrianglesGenerator:
     def _generate_easy(self) -> Equation:
         """Set up and solve simple proportion"""
         # Small triangle sides
-        a = random.randint(3, 8)
-        b = random.randint(3, 8)
+        a = self.rng.randint(3, 8)
+        b = self.rng.randint(3, 8)
 
         # Scale factor
-        k = random.randint(2, 4)
+        k = self.rng.randint(2, 4)
 
         # Large triangle sides
         a_prime = a * k
         b_prime = b * k
 
         # Ask for missing side
-        problem_type = random.choice(['find_large', 'find_small'])
+        problem_type = self.rng.choice(['find_large', 'find_small'])
 
         if problem_type == 'find_large':
             latex = f"\\triangle ABC \\sim \\triangle DEF. \\text{{ If }} AB = {a}, DE = {a_prime}, \\text{{ and }} BC = {b}, \\text{{ find }} EF."
@@ -74,12 +70,12 @@ class SolvingSimilarTrianglesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Proportions with fractional or decimal answers"""
-        a = random.randint(4, 10)
-        b = random.randint(4, 10)
-        c = random.randint(4, 10)
+        a = self.rng.randint(4, 10)
+        b = self.rng.randint(4, 10)
+        c = self.rng.randint(4, 10)
 
         # Scale factor as fraction
-        k_num = random.randint(3, 5)
+        k_num = self.rng.randint(3, 5)
         k_den = 2
 
         a_prime = a * k_num // k_den
@@ -100,24 +96,24 @@ class SolvingSimilarTrianglesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Algebraic: solve for x in similar triangles"""
-        x = random.randint(2, 8)
-        a = random.randint(2, 4)
-        b = random.randint(1, 10)
+        x = self.rng.randint(2, 8)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(1, 10)
 
         # Side in small triangle: ax + b
         side1 = a * x + b
 
         # Set up scale factor
-        k = random.randint(2, 3)
+        k = self.rng.randint(2, 3)
 
         # Corresponding sides
-        side2 = k * random.randint(3, 6)
+        side2 = k * self.rng.randint(3, 6)
         side1_large = k * side1 // 1  # Make it integer
 
         # Actually, let's set it up more carefully
         # Small: side_a = (ax + b), side_b = c
         # Large: side_a' = k(ax + b), side_b' = kc
-        c = random.randint(4, 8)
+        c = self.rng.randint(4, 8)
         c_large = k * c
 
         latex = f"\\triangle ABC \\sim \\triangle DEF. \\text{{ If }} AB = {a}x + {b}, DE = {side1 * k}, BC = {c}, EF = {c_large}. \\text{{ Find }} x."
@@ -136,13 +132,13 @@ class SolvingSimilarTrianglesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Word problems or nested similar triangles"""
-        problem_type = random.choice(['shadow', 'nested', 'find_height'])
+        problem_type = self.rng.choice(['shadow', 'nested', 'find_height'])
 
         if problem_type == 'shadow':
             # Shadow problem
-            height1 = random.randint(5, 8)  # Person height in feet
-            shadow1 = random.randint(3, 6)  # Person shadow
-            shadow2 = random.randint(15, 30)  # Tree shadow
+            height1 = self.rng.randint(5, 8)  # Person height in feet
+            shadow1 = self.rng.randint(3, 6)  # Person shadow
+            shadow2 = self.rng.randint(15, 30)  # Tree shadow
 
             height2 = height1 * shadow2 // shadow1
 
@@ -157,9 +153,9 @@ class SolvingSimilarTrianglesGenerator:
 
         elif problem_type == 'nested':
             # Triangle with parallel line creating similar triangles
-            a = random.randint(3, 6)
-            b = random.randint(4, 8)
-            k = random.randint(2, 3)
+            a = self.rng.randint(3, 6)
+            b = self.rng.randint(4, 8)
+            k = self.rng.randint(2, 3)
 
             small_base = a
             large_base = a * k
@@ -179,9 +175,9 @@ class SolvingSimilarTrianglesGenerator:
 
         else:
             # Find building height using mirror
-            eye_height = random.randint(5, 6)
-            dist_to_mirror = random.randint(3, 5)
-            dist_mirror_to_building = random.randint(20, 40)
+            eye_height = self.rng.randint(5, 6)
+            dist_to_mirror = self.rng.randint(3, 5)
+            dist_mirror_to_building = self.rng.randint(20, 40)
 
             building_height = eye_height * dist_mirror_to_building // dist_to_mirror
 
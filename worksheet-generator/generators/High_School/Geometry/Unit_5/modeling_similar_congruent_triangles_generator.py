@@ -4,15 +4,12 @@ Modeling with Similar and Congruent Triangles Generator
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class ModelingSimilarCongruentTrianglesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -24,9 +21,9 @@ class ModelingSimilarCongruentTrianglesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        height = random.randint(120, 180)
-        shadow1 = random.randint(150, 200)
-        pole = random.randint(5, 8)
+        height = self.rng.randint(120, 180)
+        shadow1 = self.rng.randint(150, 200)
+        pole = self.rng.randint(5, 8)
         shadow2 = (pole * shadow1) / height
         latex = f"\\text{{A person }} {height} \\text{{ cm tall casts a shadow }} {shadow1} \\text{{ cm. A pole casts shadow }} {shadow2:.0f} \\text{{ cm. Find pole height.}}"
         solution = f"{pole} m or {pole*100} cm"
@@ -34,9 +31,9 @@ class ModelingSimilarCongruentTrianglesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        dist1 = random.randint(100, 150)
-        height1 = random.randint(30, 50)
-        dist2 = random.randint(200, 300)
+        dist1 = self.rng.randint(100, 150)
+        height1 = self.rng.randint(30, 50)
+        dist2 = self.rng.randint(200, 300)
         height2 = (height1 * dist2) / dist1
         latex = f"\\text{{A ramp rises }} {height1} \\text{{ m over }} {dist1} \\text{{ m. How high does similar ramp rise over }} {dist2} \\text{{ m?}}"
         solution = f"{height2:.1f} m"
@@ -44,9 +41,9 @@ class ModelingSimilarCongruentTrianglesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        lake_width = random.randint(80, 120)
-        d1 = random.randint(20, 40)
-        d2 = random.randint(30, 50)
+        lake_width = self.rng.randint(80, 120)
+        d1 = self.rng.randint(20, 40)
+        d2 = self.rng.randint(30, 50)
         measured = (lake_width * d1) / d2
         latex = f"\\text{{To measure lake width indirectly, triangulation gives ratio }} {d1}:{d2}. \\text{{ Measured distance }} {measured:.0f} \\text{{ m. Find lake width.}}"
         solution = f"{lake_width} m"
@@ -54,9 +51,9 @@ class ModelingSimilarCongruentTrianglesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        building = random.randint(40, 80)
-        mirror_to_person = random.randint(2, 4)
-        mirror_to_building = random.randint(30, 50)
+        building = self.rng.randint(40, 80)
+        mirror_to_person = self.rng.randint(2, 4)
+        mirror_to_building = self.rng.randint(30, 50)
         eye_height = (building * mirror_to_person) / mirror_to_building
         latex = f"\\text{{Using mirror method: mirror is }} {mirror_to_person} \\text{{ m from person, }} {mirror_to_building} \\text{{ m from building. Eye height }} {eye_height:.1f} \\text{{ m. Find building height.}}"
         solution = f"{building} m"
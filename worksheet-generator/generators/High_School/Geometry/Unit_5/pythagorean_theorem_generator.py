@@ -6,9 +6,6 @@ Creates problems about finding missing sides of right triangles
 import random
 import math
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class PythagoreanTheoremGenerator:
     """Generates problems about the Pythagorean theorem."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
         # Common Pythagorean triples
         self.triples = [
             (3, 4, 5), (5, 12, 13), (8, 15, 17), (7, 24, 25),
@@ -44,7 +40,7 @@ class PythagoreanTheoremGenerator:
 
     def _generate_easy(self) -> Equation:
         """Find hypotenuse given two legs using simple triples"""
-        a, b, c = random.choice(self.triples[:4])  # Use simpler triples
+        a, b, c = self.rng.choice(self.triples[:4])  # Use simpler triples
 
         latex = f"\\text{{Find the hypotenuse of a right triangle with legs }} a = {a} \\text{{ and }} b = {b}."
         solution = str(c)
@@ -61,10 +57,10 @@ class PythagoreanTheoremGenerator:
 
     def _generate_medium(self) -> Equation:
         """Find a leg given hypotenuse and other leg"""
-        a, b, c = random.choice(self.triples)
+        a, b, c = self.rng.choice(self.triples)
 
         # Randomly choose to find leg a or leg b
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             given_leg = b
             missing_leg = a
             leg_name = "a"
@@ -89,12 +85,12 @@ class PythagoreanTheoremGenerator:
 
     def _generate_hard(self) -> Equation:
         """Algebraic problems or non-integer answers"""
-        problem_type = random.choice(['algebraic', 'radical'])
+        problem_type = self.rng.choice(['algebraic', 'radical'])
 
         if problem_type == 'algebraic':
             # Solve for x where sides are given in terms of x
-            a, b, c = random.choice(self.triples[:6])
-            x = random.randint(2, 5)
+            a, b, c = self.rng.choice(self.triples[:6])
+            x = self.rng.randint(2, 5)
 
             # Make one side = x, scale the triple
             latex = f"\\text{{In a right triangle, legs are }} {a}x \\text{{ and }} {b}x, \\text{{ and the hypotenuse is }} {c * x}. \\text{{ Find }} x."
@@ -109,8 +105,8 @@ class PythagoreanTheoremGenerator:
             ]
         else:
             # Non-Pythagorean triple with radical answer
-            a = random.randint(3, 8)
-            b = random.randint(3, 8)
+            a = self.rng.randint(3, 8)
+            b = self.rng.randint(3, 8)
             c_squared = a**2 + b**2
 
             # Check if it's a perfect square
@@ -135,11 +131,11 @@ class PythagoreanTheoremGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Word problems or multi-step applications"""
-        problem_type = random.choice(['ladder', 'diagonal', 'distance', 'isosceles'])
+        problem_type = self.rng.choice(['ladder', 'diagonal', 'distance', 'isosceles'])
 
         if problem_type == 'ladder':
             # Ladder against wall
-            a, b, c = random.choice([(5, 12, 13), (8, 15, 17), (6, 8, 10)])
+            a, b, c = self.rng.choice([(5, 12, 13), (8, 15, 17), (6, 8, 10)])
 
             latex = f"\\text{{A {c}-foot ladder leans against a wall. The base is {a} feet from the wall. How high does it reach?}}"
             solution = str(b)
@@ -154,8 +150,8 @@ class PythagoreanTheoremGenerator:
 
         elif problem_type == 'diagonal':
             # Rectangle diagonal
-            width = random.randint(3, 8)
-            height = random.randint(4, 10)
+            width = self.rng.randint(3, 8)
+            height = self.rng.randint(4, 10)
             diag_sq = width**2 + height**2
             diag = int(math.sqrt(diag_sq)) if int(math.sqrt(diag_sq))**2 == diag_sq else f"\\sqrt{{{diag_sq}}}"
 
@@ -171,8 +167,8 @@ class PythagoreanTheoremGenerator:
 
         elif problem_type == 'distance':
             # Distance between points
-            x1, y1 = random.randint(0, 3), random.randint(0, 3)
-            a, b, c = random.choice([(3, 4, 5), (6, 8, 10), (5, 12, 13)])
+            x1, y1 = self.rng.randint(0, 3), self.rng.randint(0, 3)
+            a, b, c = self.rng.choice([(3, 4, 5), (6, 8, 10), (5, 12, 13)])
             x2, y2 = x1 + a, y1 + b
 
             latex = f"\\text{{Find the distance between }} ({x1}, {y1}) \\text{{ and }} ({x2}, {y2})."
@@ -187,10 +183,10 @@ class PythagoreanTheoremGenerator:
 
         else:
             # Altitude of isosceles triangle
-            base = random.choice([6, 8, 10, 12])
-            leg = random.choice([5, 10, 13, 15])
+            base = self.rng.choice([6, 8, 10, 12])
+            leg = self.rng.choice([5, 10, 13, 15])
             while leg <= base // 2:
-                leg = random.choice([5, 10, 13, 15])
+                leg = self.rng.choice([5, 10, 13, 15])
 
             half_base = base // 2
             h_squared = leg**2 - half_base**2
@@ -4,15 +4,12 @@ Ratios in Right Triangles Generator
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class RatiosInRightTrianglesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -50,7 +47,7 @@ class RatiosInRightTrianglesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        h = random.randint(8, 15)
+        h = self.rng.randint(8, 15)
         latex = f"\\text{{In right triangle, altitude to hypotenuse is }} {h}. \\text{{ If it divides hypotenuse into segments 6 and 8, find the legs.}}"
         import math
         leg1 = math.sqrt(6 * (6+8))
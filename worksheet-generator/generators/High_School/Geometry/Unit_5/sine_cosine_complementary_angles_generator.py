@@ -4,16 +4,13 @@ Sine and Cosine of Complementary Angles Generator
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class SineCosineComplementaryAnglesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -25,7 +22,7 @@ class SineCosineComplementaryAnglesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        angle = random.randint(20, 70)
+        angle = self.rng.randint(20, 70)
         comp = 90 - angle
         latex = f"\\text{{If }} \\sin({angle}^\\circ) = x, \\text{{ what is }} \\cos({comp}^\\circ)?"
         solution = "x"
@@ -35,7 +32,7 @@ class SineCosineComplementaryAnglesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        angle = random.randint(25, 65)
+        angle = self.rng.randint(25, 65)
         comp = 90 - angle
         latex = f"\\text{{Verify that }} \\sin({angle}^\\circ) = \\cos({comp}^\\circ) \\text{{ using a right triangle.}}"
         solution = "Both equal opposite/hypotenuse in complementary triangles"
@@ -48,7 +45,7 @@ class SineCosineComplementaryAnglesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        angle = random.randint(30, 60)
+        angle = self.rng.randint(30, 60)
         comp = 90 - angle
         val = math.sin(math.radians(angle))
         latex = f"\\text{{If }} \\sin({angle}^\\circ) = {val:.3f}, \\text{{ find }} \\cos({comp}^\\circ) \\text{{ and }} \\sin({comp}^\\circ)."
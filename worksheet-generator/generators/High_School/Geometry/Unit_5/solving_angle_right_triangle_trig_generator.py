@@ -4,16 +4,13 @@ Solving for an Angle in Right Triangle Using Trig Generator
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class SolvingAngleRightTriangleTrigGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -34,9 +31,9 @@ class SolvingAngleRightTriangleTrigGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        adj, hyp = random.randint(8, 12), random.randint(14, 18)
+        adj, hyp = self.rng.randint(8, 12), self.rng.randint(14, 18)
         if adj >= hyp:
-            adj = hyp - random.randint(2, 5)
+            adj = hyp - self.rng.randint(2, 5)
         angle = math.degrees(math.acos(adj/hyp))
         latex = f"\\text{{Right triangle: adjacent }} {adj}, \\text{{ hypotenuse }} {hyp}. \\text{{ Find the angle.}}"
         solution = f"{angle:.1f}°"
@@ -45,8 +42,8 @@ class SolvingAngleRightTriangleTrigGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        opp = random.randint(6, 12)
-        adj = random.randint(8, 14)
+        opp = self.rng.randint(6, 12)
+        adj = self.rng.randint(8, 14)
         angle = math.degrees(math.atan(opp/adj))
         latex = f"\\text{{Right triangle: opposite }} {opp}, \\text{{ adjacent }} {adj}. \\text{{ Find the angle.}}"
         solution = f"{angle:.1f}°"
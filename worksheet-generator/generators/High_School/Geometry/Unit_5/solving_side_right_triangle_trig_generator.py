@@ -4,16 +4,13 @@ Solving for a Side in Right Triangle Using Trig Generator
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class SolvingSideRightTriangleTrigGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -25,8 +22,8 @@ class SolvingSideRightTriangleTrigGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        angle = random.choice([30, 45, 60])
-        hyp = random.randint(10, 20)
+        angle = self.rng.choice([30, 45, 60])
+        hyp = self.rng.randint(10, 20)
         opp = hyp * math.sin(math.radians(angle))
         latex = f"\\text{{Right triangle: angle }} {angle}^\\circ, \\text{{ hypotenuse }} {hyp}. \\text{{ Find opposite side.}}"
         solution = f"{opp:.2f}"
@@ -35,8 +32,8 @@ class SolvingSideRightTriangleTrigGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        angle = random.randint(25, 65)
-        adj = random.randint(8, 16)
+        angle = self.rng.randint(25, 65)
+        adj = self.rng.randint(8, 16)
         opp = adj * math.tan(math.radians(angle))
         latex = f"\\text{{Right triangle: angle }} {angle}^\\circ, \\text{{ adjacent side }} {adj}. \\text{{ Find opposite side.}}"
         solution = f"{opp:.2f}"
@@ -45,8 +42,8 @@ class SolvingSideRightTriangleTrigGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        angle = random.randint(30, 60)
-        opp = random.randint(10, 20)
+        angle = self.rng.randint(30, 60)
+        opp = self.rng.randint(10, 20)
         hyp = opp / math.sin(math.radians(angle))
         latex = f"\\text{{Right triangle: angle }} {angle}^\\circ, \\text{{ opposite side }} {opp}. \\text{{ Find hypotenuse.}}"
         solution = f"{hyp:.2f}"
@@ -55,9 +52,9 @@ class SolvingSideRightTriangleTrigGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        angle1 = random.randint(30, 50)
+        angle1 = self.rng.randint(30, 50)
         angle2 = 90 - angle1
-        side = random.randint(12, 20)
+        side = self.rng.randint(12, 20)
         x = side * math.tan(math.radians(angle1))
         latex = f"\\text{{Right triangle with angles }} {angle1}^\\circ \\text{{ and }} {angle2}^\\circ. \\text{{ Side adjacent to }} {angle1}^\\circ \\text{{ is }} {side}. \\text{{ Find other leg.}}"
         solution = f"{x:.2f}"
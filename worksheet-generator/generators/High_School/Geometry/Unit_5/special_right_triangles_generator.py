@@ -5,9 +5,6 @@ Creates problems about 30-60-90 and 45-45-90 triangles
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class SpecialRightTrianglesGenerator:
     """Generates problems about special right triangles."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,7 +33,7 @@ class SpecialRightTrianglesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Identify ratios of special triangles"""
-        triangle_type = random.choice(['45-45-90', '30-60-90'])
+        triangle_type = self.rng.choice(['45-45-90', '30-60-90'])
 
         if triangle_type == '45-45-90':
             latex = f"\\text{{In a 45-45-90 triangle, if a leg is }} 1, \\text{{ what is the hypotenuse?}}"
@@ -49,7 +45,7 @@ class SpecialRightTrianglesGenerator:
                 f"\\text{{If leg = 1, hypotenuse = }} \\sqrt{{2}}"
             ]
         else:
-            part = random.choice(['short', 'long', 'hyp'])
+            part = self.rng.choice(['short', 'long', 'hyp'])
             if part == 'short':
                 latex = f"\\text{{In a 30-60-90 triangle, if the short leg is }} 1, \\text{{ what is the hypotenuse?}}"
                 solution = "2"
@@ -77,12 +73,12 @@ class SpecialRightTrianglesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Find sides using integer multipliers"""
-        triangle_type = random.choice(['45-45-90', '30-60-90'])
+        triangle_type = self.rng.choice(['45-45-90', '30-60-90'])
 
         if triangle_type == '45-45-90':
-            leg = random.randint(2, 10)
+            leg = self.rng.randint(2, 10)
 
-            problem_type = random.choice(['find_hyp', 'find_leg'])
+            problem_type = self.rng.choice(['find_hyp', 'find_leg'])
 
             if problem_type == 'find_hyp':
                 latex = f"\\text{{In a 45-45-90 triangle, each leg is }} {leg}. \\text{{ Find the hypotenuse.}}"
@@ -104,9 +100,9 @@ class SpecialRightTrianglesGenerator:
                     f"\\text{{leg = }} {hyp_coef}"
                 ]
         else:
-            short_leg = random.randint(2, 8)
+            short_leg = self.rng.randint(2, 8)
 
-            problem_type = random.choice(['find_long', 'find_hyp', 'find_short'])
+            problem_type = self.rng.choice(['find_long', 'find_hyp', 'find_short'])
 
             if problem_type == 'find_long':
                 latex = f"\\text{{In a 30-60-90 triangle, the short leg is }} {short_leg}. \\text{{ Find the long leg.}}"
@@ -141,11 +137,11 @@ class SpecialRightTrianglesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Work with radical values or find from non-standard given"""
-        triangle_type = random.choice(['45-45-90', '30-60-90'])
+        triangle_type = self.rng.choice(['45-45-90', '30-60-90'])
 
         if triangle_type == '45-45-90':
             # Given hypotenuse as integer, find leg
-            hyp = random.randint(4, 12)
+            hyp = self.rng.randint(4, 12)
 
             latex = f"\\text{{In a 45-45-90 triangle, the hypotenuse is }} {hyp}. \\text{{ Find each leg.}}"
             solution = f"\\frac{{{hyp}\\sqrt{{2}}}}{{2}}"
@@ -157,7 +153,7 @@ class SpecialRightTrianglesGenerator:
             ]
         else:
             # Given long leg, find others
-            short = random.randint(2, 6)
+            short = self.rng.randint(2, 6)
             long_coef = short
 
             latex = f"\\text{{In a 30-60-90 triangle, the long leg is }} {long_coef}\\sqrt{{3}}. \\text{{ Find the short leg and hypotenuse.}}"
@@ -174,11 +170,11 @@ class SpecialRightTrianglesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Word problems and combined applications"""
-        problem_type = random.choice(['diagonal', 'altitude', 'combined'])
+        problem_type = self.rng.choice(['diagonal', 'altitude', 'combined'])
 
         if problem_type == 'diagonal':
             # Diagonal of a square
-            side = random.randint(4, 10)
+            side = self.rng.randint(4, 10)
 
             latex = f"\\text{{Find the diagonal of a square with side length }} {side}."
             solution = f"{side}\\sqrt{{2}}"
@@ -191,7 +187,7 @@ class SpecialRightTrianglesGenerator:
 
         elif problem_type == 'altitude':
             # Altitude of an equilateral triangle
-            side = random.randint(4, 12) * 2  # Even for clean division
+            side = self.rng.randint(4, 12) * 2  # Even for clean division
 
             latex = f"\\text{{Find the altitude of an equilateral triangle with side length }} {side}."
             solution = f"\\frac{{{side}\\sqrt{{3}}}}{{2}}"
@@ -204,7 +200,7 @@ class SpecialRightTrianglesGenerator:
 
         else:
             # Find perimeter or area using special triangles
-            short = random.randint(3, 6)
+            short = self.rng.randint(3, 6)
             long_leg = f"{short}\\sqrt{{3}}"
             hyp = 2 * short
 
@@ -5,9 +5,6 @@ Creates problems about sine, cosine, and tangent ratios
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class TrigRatiosIntroGenerator:
     """Generates problems about basic trigonometric ratios."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
         # Pythagorean triples for clean ratios
         self.triples = [(3, 4, 5), (5, 12, 13), (8, 15, 17), (7, 24, 25)]
 
@@ -45,7 +41,7 @@ class TrigRatiosIntroGenerator:
             ("\\tan", "opposite", "adjacent", "TOA: Tangent = Opposite / Adjacent"),
         ]
 
-        func, num, den, mnemonic = random.choice(ratios)
+        func, num, den, mnemonic = self.rng.choice(ratios)
 
         latex = f"\\text{{In a right triangle, }} {func}(\\theta) = \\frac{{?}}{{?}}. \\text{{ Fill in the sides.}}"
         solution = f"\\frac{{\\text{{{num}}}}}{{\\text{{{den}}}}}"
@@ -59,11 +55,11 @@ class TrigRatiosIntroGenerator:
 
     def _generate_medium(self) -> Equation:
         """Find trig ratio given triangle sides"""
-        a, b, c = random.choice(self.triples)
+        a, b, c = self.rng.choice(self.triples)
         # a = opposite, b = adjacent, c = hypotenuse
 
-        angle = random.choice(['A', 'B'])
-        func = random.choice(['sin', 'cos', 'tan'])
+        angle = self.rng.choice(['A', 'B'])
+        func = self.rng.choice(['sin', 'cos', 'tan'])
 
         if angle == 'A':  # Angle opposite to side a
             if func == 'sin':
@@ -93,13 +89,13 @@ class TrigRatiosIntroGenerator:
 
     def _generate_hard(self) -> Equation:
         """Use trig ratio to find a missing side"""
-        a, b, c = random.choice(self.triples)
+        a, b, c = self.rng.choice(self.triples)
 
         # Scale the triple
-        scale = random.randint(1, 3)
+        scale = self.rng.randint(1, 3)
         a, b, c = a * scale, b * scale, c * scale
 
-        problem_type = random.choice(['find_opp', 'find_adj', 'find_hyp'])
+        problem_type = self.rng.choice(['find_opp', 'find_adj', 'find_hyp'])
 
         if problem_type == 'find_opp':
             # Given angle A (where sin A = a/c), hypotenuse, find opposite
@@ -138,10 +134,10 @@ class TrigRatiosIntroGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Find all six trig ratios or apply to word problem"""
-        problem_type = random.choice(['all_six', 'word_problem'])
+        problem_type = self.rng.choice(['all_six', 'word_problem'])
 
         if problem_type == 'all_six':
-            a, b, c = random.choice(self.triples)
+            a, b, c = self.rng.choice(self.triples)
 
             latex = f"\\text{{In a right triangle with legs }} {a}, {b} \\text{{ and hypotenuse }} {c}, \\text{{ find all 6 trig ratios for angle A (opposite to leg {a}).}}"
             solution = f"\\sin A = \\frac{{{a}}}{{{c}}}, \\cos A = \\frac{{{b}}}{{{c}}}, \\tan A = \\frac{{{a}}}{{{b}}}"
@@ -156,9 +152,9 @@ class TrigRatiosIntroGenerator:
 
         else:
             # Word problem
-            height = random.randint(20, 100)
+            height = self.rng.randint(20, 100)
             a, b, c = 3, 4, 5
-            scale = random.randint(5, 15)
+            scale = self.rng.randint(5, 15)
             dist = b * scale
 
             latex = f"\\text{{From a point {dist} ft from a building, the angle of elevation to the top is such that }} \\tan(\\theta) = \\frac{{{a}}}{{{b}}}. \\text{{ How tall is the building?}}"
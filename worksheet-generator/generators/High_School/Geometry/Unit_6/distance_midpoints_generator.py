@@ -6,9 +6,6 @@ Creates problems about the distance formula and midpoint formula
 import random
 import math
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class DistanceMidpointsGenerator:
     """Generates problems about distance and midpoint formulas."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
         self.pythagorean_triples = [(3, 4, 5), (5, 12, 13), (8, 15, 17), (6, 8, 10)]
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
@@ -39,10 +35,10 @@ class DistanceMidpointsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Basic midpoint problems with even coordinates"""
-        x1 = random.randint(-6, 6) * 2  # Even for clean midpoints
-        y1 = random.randint(-6, 6) * 2
-        x2 = random.randint(-6, 6) * 2
-        y2 = random.randint(-6, 6) * 2
+        x1 = self.rng.randint(-6, 6) * 2  # Even for clean midpoints
+        y1 = self.rng.randint(-6, 6) * 2
+        x2 = self.rng.randint(-6, 6) * 2
+        y2 = self.rng.randint(-6, 6) * 2
 
         mid_x = (x1 + x2) // 2
         mid_y = (y1 + y2) // 2
@@ -61,9 +57,9 @@ class DistanceMidpointsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Distance problems with Pythagorean triple distances"""
-        a, b, c = random.choice(self.pythagorean_triples)
-        x1 = random.randint(-5, 5)
-        y1 = random.randint(-5, 5)
+        a, b, c = self.rng.choice(self.pythagorean_triples)
+        x1 = self.rng.randint(-5, 5)
+        y1 = self.rng.randint(-5, 5)
 
         # Create second point using Pythagorean triple
         x2 = x1 + a
@@ -84,14 +80,14 @@ class DistanceMidpointsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Find missing endpoint given midpoint, or distance with radical answer"""
-        problem_type = random.choice(['find_endpoint', 'radical_distance'])
+        problem_type = self.rng.choice(['find_endpoint', 'radical_distance'])
 
         if problem_type == 'find_endpoint':
             # Given one endpoint and midpoint, find other endpoint
-            x1 = random.randint(-8, 8)
-            y1 = random.randint(-8, 8)
-            mid_x = random.randint(-5, 5)
-            mid_y = random.randint(-5, 5)
+            x1 = self.rng.randint(-8, 8)
+            y1 = self.rng.randint(-8, 8)
+            mid_x = self.rng.randint(-5, 5)
+            mid_y = self.rng.randint(-5, 5)
 
             # Calculate x2, y2
             x2 = 2 * mid_x - x1
@@ -108,10 +104,10 @@ class DistanceMidpointsGenerator:
             ]
         else:
             # Distance with radical (non-perfect square)
-            x1 = random.randint(-5, 5)
-            y1 = random.randint(-5, 5)
-            dx = random.randint(1, 5)
-            dy = random.randint(1, 5)
+            x1 = self.rng.randint(-5, 5)
+            y1 = self.rng.randint(-5, 5)
+            dx = self.rng.randint(1, 5)
+            dy = self.rng.randint(1, 5)
 
             x2 = x1 + dx
             y2 = y1 + dy
@@ -137,7 +133,7 @@ class DistanceMidpointsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Applications: perimeter, classify triangle/quadrilateral"""
-        problem_type = random.choice(['perimeter', 'classify', 'on_segment'])
+        problem_type = self.rng.choice(['perimeter', 'classify', 'on_segment'])
 
         if problem_type == 'perimeter':
             # Find perimeter of triangle
@@ -164,7 +160,7 @@ class DistanceMidpointsGenerator:
 
         elif problem_type == 'classify':
             # Is the triangle isosceles, equilateral, or scalene?
-            triangle_type = random.choice(['isosceles', 'right'])
+            triangle_type = self.rng.choice(['isosceles', 'right'])
 
             if triangle_type == 'isosceles':
                 x1, y1 = 0, 0
@@ -196,10 +192,10 @@ class DistanceMidpointsGenerator:
 
         else:
             # Check if point is on segment
-            x1 = random.randint(-5, 0)
-            y1 = random.randint(-5, 0)
-            x2 = random.randint(1, 5)
-            y2 = random.randint(1, 5)
+            x1 = self.rng.randint(-5, 0)
+            y1 = self.rng.randint(-5, 0)
+            x2 = self.rng.randint(1, 5)
+            y2 = self.rng.randint(1, 5)
             mid_x = (x1 + x2) // 2
             mid_y = (y1 + y2) // 2
 
@@ -4,15 +4,12 @@ Dividing Line Segments Generator
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class DividingLineSegmentsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -24,8 +21,8 @@ class DividingLineSegmentsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x1, y1 = random.randint(2, 8), random.randint(2, 8)
-        x2, y2 = random.randint(10, 16), random.randint(10, 16)
+        x1, y1 = self.rng.randint(2, 8), self.rng.randint(2, 8)
+        x2, y2 = self.rng.randint(10, 16), self.rng.randint(10, 16)
         mx = (x1 + x2) / 2
         my = (y1 + y2) / 2
         latex = f"\\text{{Find midpoint of segment from }} ({x1},{y1}) \\text{{ to }} ({x2},{y2})."
@@ -35,9 +32,9 @@ class DividingLineSegmentsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x1, y1 = random.randint(0, 6), random.randint(0, 6)
-        x2, y2 = random.randint(8, 14), random.randint(8, 14)
-        ratio = random.choice([1, 2])
+        x1, y1 = self.rng.randint(0, 6), self.rng.randint(0, 6)
+        x2, y2 = self.rng.randint(8, 14), self.rng.randint(8, 14)
+        ratio = self.rng.choice([1, 2])
         total = ratio + 1
         px = (total * x2 + ratio * x1) / (2 * total) if ratio == 1 else (x1 + 2 * x2) / 3
         py = (total * y2 + ratio * y1) / (2 * total) if ratio == 1 else (y1 + 2 * y2) / 3
@@ -54,10 +51,10 @@ class DividingLineSegmentsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x1, y1 = random.randint(2, 6), random.randint(2, 6)
-        x2, y2 = random.randint(10, 16), random.randint(10, 16)
-        m = random.randint(2, 4)
-        n = random.randint(1, 3)
+        x1, y1 = self.rng.randint(2, 6), self.rng.randint(2, 6)
+        x2, y2 = self.rng.randint(10, 16), self.rng.randint(10, 16)
+        m = self.rng.randint(2, 4)
+        n = self.rng.randint(1, 3)
         px = (n * x1 + m * x2) / (m + n)
         py = (n * y1 + m * y2) / (m + n)
         latex = f"\\text{{Find point that divides segment from }} ({x1},{y1}) \\text{{ to }} ({x2},{y2}) \\text{{ in ratio }} {m}:{n}."
@@ -67,8 +64,8 @@ class DividingLineSegmentsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        x1, y1 = random.randint(0, 5), random.randint(0, 5)
-        x2, y2 = random.randint(9, 15), random.randint(9, 15)
+        x1, y1 = self.rng.randint(0, 5), self.rng.randint(0, 5)
+        x2, y2 = self.rng.randint(9, 15), self.rng.randint(9, 15)
         # Point that divides segment in golden ratio
         phi = (1 + math.sqrt(5)) / 2
         px = (x1 + phi * x2) / (1 + phi)
@@ -4,16 +4,13 @@ Modeling with Right Triangles Generator
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class ModelingRightTrianglesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -25,8 +22,8 @@ class ModelingRightTrianglesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        height = random.randint(20, 40)
-        distance = random.randint(15, 30)
+        height = self.rng.randint(20, 40)
+        distance = self.rng.randint(15, 30)
         angle = math.degrees(math.atan(height/distance))
         latex = f"\\text{{A ladder reaches }} {height} \\text{{ ft up a wall, base }} {distance} \\text{{ ft from wall. Find angle with ground.}}"
         solution = f"{angle:.1f}°"
@@ -35,8 +32,8 @@ class ModelingRightTrianglesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        angle = random.randint(30, 60)
-        base = random.randint(50, 100)
+        angle = self.rng.randint(30, 60)
+        base = self.rng.randint(50, 100)
         height = base * math.tan(math.radians(angle))
         latex = f"\\text{{A ramp at }} {angle}^\\circ \\text{{ angle extends }} {base} \\text{{ ft horizontally. Find vertical rise.}}"
         solution = f"{height:.1f} ft"
@@ -45,8 +42,8 @@ class ModelingRightTrianglesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        angle = random.randint(35, 55)
-        height = random.randint(100, 200)
+        angle = self.rng.randint(35, 55)
+        height = self.rng.randint(100, 200)
         distance = height / math.tan(math.radians(angle))
         latex = f"\\text{{From angle of elevation }} {angle}^\\circ, \\text{{ you see top of }} {height} \\text{{ ft building. How far are you from base?}}"
         solution = f"{distance:.1f} ft"
@@ -55,9 +52,9 @@ class ModelingRightTrianglesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        angle1 = random.randint(30, 45)
-        angle2 = random.randint(50, 65)
-        dist = random.randint(40, 80)
+        angle1 = self.rng.randint(30, 45)
+        angle2 = self.rng.randint(50, 65)
+        dist = self.rng.randint(40, 80)
         h1 = dist * math.tan(math.radians(angle1))
         h2 = dist * math.tan(math.radians(angle2))
         height_diff = h2 - h1
@@ -4,16 +4,13 @@ Problem Solving with Distance on the Coordinate Plane Generator
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class ProblemSolvingDistanceCoordinateGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -25,8 +22,8 @@ class ProblemSolvingDistanceCoordinateGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x1, y1 = random.randint(1, 6), random.randint(1, 6)
-        x2, y2 = random.randint(7, 12), random.randint(7, 12)
+        x1, y1 = self.rng.randint(1, 6), self.rng.randint(1, 6)
+        x2, y2 = self.rng.randint(7, 12), self.rng.randint(7, 12)
         dist = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
         latex = f"\\text{{Find distance between }} ({x1},{y1}) \\text{{ and }} ({x2},{y2})."
         solution = f"{dist:.2f}"
@@ -36,7 +33,7 @@ class ProblemSolvingDistanceCoordinateGenerator:
 
     def _generate_medium(self) -> Equation:
         x1, y1 = 0, 0
-        x2, y2 = random.randint(6, 12), random.randint(8, 15)
+        x2, y2 = self.rng.randint(6, 12), self.rng.randint(8, 15)
         dist = math.sqrt(x2**2 + y2**2)
         latex = f"\\text{{A point }} ({x2},{y2}) \\text{{ is how far from the origin?}}"
         solution = f"{dist:.2f}"
@@ -45,9 +42,9 @@ class ProblemSolvingDistanceCoordinateGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x1, y1 = random.randint(2, 6), random.randint(2, 6)
-        x2, y2 = random.randint(8, 14), random.randint(8, 14)
-        x3, y3 = random.randint(2, 6), random.randint(8, 14)
+        x1, y1 = self.rng.randint(2, 6), self.rng.randint(2, 6)
+        x2, y2 = self.rng.randint(8, 14), self.rng.randint(8, 14)
+        x3, y3 = self.rng.randint(2, 6), self.rng.randint(8, 14)
         d1 = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
         d2 = math.sqrt((x3 - x2)**2 + (y3 - y2)**2)
         d3 = math.sqrt((x3 - x1)**2 + (y3 - y1)**2)
@@ -62,9 +59,9 @@ class ProblemSolvingDistanceCoordinateGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Circle problem
-        h, k = random.randint(3, 8), random.randint(3, 8)
-        r = random.randint(4, 10)
-        x, y = random.randint(0, 5), random.randint(0, 5)
+        h, k = self.rng.randint(3, 8), self.rng.randint(3, 8)
+        r = self.rng.randint(4, 10)
+        x, y = self.rng.randint(0, 5), self.rng.randint(0, 5)
         dist = math.sqrt((x - h)**2 + (y - k)**2)
         on_circle = abs(dist - r) < 0.1
         latex = f"\\text{{Is point }} ({x},{y}) \\text{{ on circle with center }} ({h},{k}) \\text{{ and radius }} {r}?"
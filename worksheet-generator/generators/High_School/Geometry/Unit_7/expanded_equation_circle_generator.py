@@ -4,15 +4,12 @@ Expanded Equation of a Circle Generator
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class ExpandedEquationCircleGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -24,8 +21,8 @@ class ExpandedEquationCircleGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        h, k = random.randint(2, 6), random.randint(2, 6)
-        r_sq = random.choice([16, 25, 36])
+        h, k = self.rng.randint(2, 6), self.rng.randint(2, 6)
+        r_sq = self.rng.choice([16, 25, 36])
         expanded_const = h**2 + k**2 - r_sq
         latex = f"\\text{{Expand: }} (x - {h})^2 + (y - {k})^2 = {r_sq}."
         solution = f"x² - {2*h}x + y² - {2*k}y + {expanded_const} = 0"
@@ -35,8 +32,8 @@ class ExpandedEquationCircleGenerator:
 
     def _generate_medium(self) -> Equation:
         # Convert from expanded to standard
-        h, k = random.randint(-4, 4), random.randint(-4, 4)
-        r_sq = random.choice([9, 16, 25])
+        h, k = self.rng.randint(-4, 4), self.rng.randint(-4, 4)
+        r_sq = self.rng.choice([9, 16, 25])
         D = -2 * h
         E = -2 * k
         F = h**2 + k**2 - r_sq
@@ -48,8 +45,8 @@ class ExpandedEquationCircleGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        h, k = random.randint(-5, 5), random.randint(-5, 5)
-        r = random.randint(4, 8)
+        h, k = self.rng.randint(-5, 5), self.rng.randint(-5, 5)
+        r = self.rng.randint(4, 8)
         r_sq = r**2
         D = -2 * h
         E = -2 * k
@@ -63,9 +60,9 @@ class ExpandedEquationCircleGenerator:
 
     def _generate_challenge(self) -> Equation:
         # General form with coefficient
-        a = random.choice([2, 4])
-        h, k = random.randint(-3, 3), random.randint(-3, 3)
-        r = random.randint(3, 6)
+        a = self.rng.choice([2, 4])
+        h, k = self.rng.randint(-3, 3), self.rng.randint(-3, 3)
+        r = self.rng.randint(3, 6)
         r_sq = r**2
         D = -2 * a * h
         E = -2 * a * k
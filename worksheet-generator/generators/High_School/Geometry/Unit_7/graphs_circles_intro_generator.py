@@ -4,16 +4,13 @@ Graphs of Circles Intro Generator
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class GraphsCirclesIntroGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -25,7 +22,7 @@ class GraphsCirclesIntroGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        r = random.randint(3, 10)
+        r = self.rng.randint(3, 10)
         latex = f"\\text{{Write equation of circle centered at origin with radius }} {r}."
         solution = f"x² + y² = {r**2}"
         steps = [f"\\text{{Standard form: }} x^2 + y^2 = r^2",
@@ -33,8 +30,8 @@ class GraphsCirclesIntroGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        h, k = random.randint(-5, 5), random.randint(-5, 5)
-        r = random.randint(4, 10)
+        h, k = self.rng.randint(-5, 5), self.rng.randint(-5, 5)
+        r = self.rng.randint(4, 10)
         latex = f"\\text{{Write equation of circle with center }} ({h},{k}) \\text{{ and radius }} {r}."
         solution = f"(x - {h})² + (y - {k})² = {r**2}"
         steps = [f"\\text{{Standard form: }} (x - h)^2 + (y - k)^2 = r^2",
@@ -43,8 +40,8 @@ class GraphsCirclesIntroGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        h, k = random.randint(-6, 6), random.randint(-6, 6)
-        r_sq = random.choice([16, 25, 36, 49])
+        h, k = self.rng.randint(-6, 6), self.rng.randint(-6, 6)
+        r_sq = self.rng.choice([16, 25, 36, 49])
         r = int(math.sqrt(r_sq))
         latex = f"\\text{{Find center and radius: }} (x - {h})^2 + (y - {k})^2 = {r_sq}."
         solution = f"Center ({h},{k}), radius {r}"
@@ -54,8 +51,8 @@ class GraphsCirclesIntroGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        x1, y1 = random.randint(-4, 4), random.randint(-4, 4)
-        x2, y2 = random.randint(-4, 4), random.randint(-4, 4)
+        x1, y1 = self.rng.randint(-4, 4), self.rng.randint(-4, 4)
+        x2, y2 = self.rng.randint(-4, 4), self.rng.randint(-4, 4)
         h = (x1 + x2) / 2
         k = (y1 + y2) / 2
         r = math.sqrt((x2 - h)**2 + (y2 - k)**2)
@@ -5,9 +5,6 @@ Creates problems about circles in standard form (x-h)² + (y-k)² = r²
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class StandardEquationCircleGenerator:
     """Generates problems about circles in standard form."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -55,10 +51,10 @@ class StandardEquationCircleGenerator:
 
     def _generate_easy(self) -> Equation:
         """Identify center and radius from standard form (center at origin)"""
-        r = random.randint(2, 8)
+        r = self.rng.randint(2, 8)
         r_sq = r ** 2
 
-        problem_type = random.choice(['find_center', 'find_radius'])
+        problem_type = self.rng.choice(['find_center', 'find_radius'])
 
         if problem_type == 'find_center':
             latex = f"\\text{{Find the center of the circle: }} x^2 + y^2 = {r_sq}"
@@ -81,14 +77,14 @@ class StandardEquationCircleGenerator:
 
     def _generate_medium(self) -> Equation:
         """Identify center and radius with center not at origin"""
-        h = random.randint(-6, 6)
-        k = random.randint(-6, 6)
-        r = random.randint(2, 6)
+        h = self.rng.randint(-6, 6)
+        k = self.rng.randint(-6, 6)
+        r = self.rng.randint(2, 6)
         r_sq = r ** 2
 
         eq = self._format_circle_equation(h, k, r_sq)
 
-        problem_type = random.choice(['find_center', 'find_radius', 'find_both'])
+        problem_type = self.rng.choice(['find_center', 'find_radius', 'find_both'])
 
         if problem_type == 'find_center':
             latex = f"\\text{{Find the center: }} {eq}"
@@ -117,12 +113,12 @@ class StandardEquationCircleGenerator:
 
     def _generate_hard(self) -> Equation:
         """Write equation given center and radius, or given endpoints of diameter"""
-        problem_type = random.choice(['write_equation', 'from_diameter'])
+        problem_type = self.rng.choice(['write_equation', 'from_diameter'])
 
         if problem_type == 'write_equation':
-            h = random.randint(-5, 5)
-            k = random.randint(-5, 5)
-            r = random.randint(2, 6)
+            h = self.rng.randint(-5, 5)
+            k = self.rng.randint(-5, 5)
+            r = self.rng.randint(2, 6)
             r_sq = r ** 2
 
             latex = f"\\text{{Write the equation of a circle with center }} ({h}, {k}) \\text{{ and radius }} {r}."
@@ -135,10 +131,10 @@ class StandardEquationCircleGenerator:
             ]
         else:
             # Find circle from diameter endpoints
-            x1 = random.randint(-6, 0)
-            y1 = random.randint(-6, 0)
-            x2 = random.randint(0, 6)
-            y2 = random.randint(0, 6)
+            x1 = self.rng.randint(-6, 0)
+            y1 = self.rng.randint(-6, 0)
+            x2 = self.rng.randint(0, 6)
+            y2 = self.rng.randint(0, 6)
 
             # Make coordinates even for clean center
             x1 = x1 if x1 % 2 == 0 else x1 - 1
@@ -164,25 +160,25 @@ class StandardEquationCircleGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Check if point is on/inside/outside circle, or tangent problems"""
-        problem_type = random.choice(['point_location', 'tangent', 'intersection'])
+        problem_type = self.rng.choice(['point_location', 'tangent', 'intersection'])
 
         if problem_type == 'point_location':
-            h = random.randint(-4, 4)
-            k = random.randint(-4, 4)
-            r = random.randint(3, 5)
+            h = self.rng.randint(-4, 4)
+            k = self.rng.randint(-4, 4)
+            r = self.rng.randint(3, 5)
             r_sq = r ** 2
 
-            location = random.choice(['on', 'inside', 'outside'])
+            location = self.rng.choice(['on', 'inside', 'outside'])
 
             if location == 'on':
                 # Point on circle: choose point at distance r
                 px = h + r
                 py = k
             elif location == 'inside':
-                px = h + random.randint(1, r - 1)
+                px = h + self.rng.randint(1, r - 1)
                 py = k
             else:
-                px = h + r + random.randint(1, 3)
+                px = h + r + self.rng.randint(1, 3)
                 py = k
 
             dist_sq = (px - h) ** 2 + (py - k) ** 2
@@ -209,7 +205,7 @@ class StandardEquationCircleGenerator:
 
         elif problem_type == 'tangent':
             h, k = 0, 0
-            r = random.randint(3, 6)
+            r = self.rng.randint(3, 6)
             r_sq = r ** 2
 
             # Tangent at point on x-axis
@@ -226,9 +222,9 @@ class StandardEquationCircleGenerator:
 
         else:
             # Two circles: do they intersect?
-            r1 = random.randint(2, 4)
-            r2 = random.randint(2, 4)
-            d = random.randint(1, r1 + r2 + 2)
+            r1 = self.rng.randint(2, 4)
+            r2 = self.rng.randint(2, 4)
+            d = self.rng.randint(1, r1 + r2 + 2)
 
             if d > r1 + r2:
                 relation = "No intersection (circles are separate)"
@@ -4,16 +4,13 @@ Arc Length in Degrees Generator
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class ArcLengthDegreesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -25,8 +22,8 @@ class ArcLengthDegreesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        angle = random.choice([60, 90, 120, 180])
-        r = random.randint(6, 12)
+        angle = self.rng.choice([60, 90, 120, 180])
+        r = self.rng.randint(6, 12)
         arc = (angle / 360) * 2 * math.pi * r
         latex = f"\\text{{Arc with central angle }} {angle}^\\circ \\text{{ in circle radius }} {r}. \\text{{ Find arc length.}}"
         solution = f"{arc:.2f}"
@@ -35,8 +32,8 @@ class ArcLengthDegreesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        angle = random.randint(30, 150)
-        r = random.randint(8, 15)
+        angle = self.rng.randint(30, 150)
+        r = self.rng.randint(8, 15)
         arc = (angle / 360) * 2 * math.pi * r
         latex = f"\\text{{Find arc length: }} \\theta = {angle}^\\circ, r = {r}."
         solution = f"{arc:.2f}"
@@ -44,8 +41,8 @@ class ArcLengthDegreesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        r = random.randint(10, 18)
-        arc = random.randint(15, 30)
+        r = self.rng.randint(10, 18)
+        arc = self.rng.randint(15, 30)
         angle = (arc / (2 * math.pi * r)) * 360
         latex = f"\\text{{Arc length }} {arc} \\text{{ in circle radius }} {r}. \\text{{ Find central angle.}}"
         solution = f"{angle:.1f}°"
@@ -54,8 +51,8 @@ class ArcLengthDegreesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        angle = random.randint(45, 135)
-        arc = random.randint(20, 40)
+        angle = self.rng.randint(45, 135)
+        arc = self.rng.randint(20, 40)
         r = (arc * 360) / (angle * 2 * math.pi)
         latex = f"\\text{{Arc length }} {arc} \\text{{ with central angle }} {angle}^\\circ. \\text{{ Find radius.}}"
         solution = f"{r:.2f}"
@@ -4,16 +4,13 @@ Arc Length in Radians Generator
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class ArcLengthRadiansGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -25,8 +22,8 @@ class ArcLengthRadiansGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        theta = random.choice([math.pi/6, math.pi/4, math.pi/3, math.pi/2])
-        r = random.randint(6, 12)
+        theta = self.rng.choice([math.pi/6, math.pi/4, math.pi/3, math.pi/2])
+        r = self.rng.randint(6, 12)
         arc = r * theta
         theta_str = {math.pi/6: "π/6", math.pi/4: "π/4", math.pi/3: "π/3", math.pi/2: "π/2"}
         latex = f"\\text{{Arc length with }} \\theta = {theta_str[theta]} \\text{{ rad, }} r = {r}."
@@ -35,8 +32,8 @@ class ArcLengthRadiansGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        theta = random.uniform(1, 3)
-        r = random.randint(8, 15)
+        theta = self.rng.uniform(1, 3)
+        r = self.rng.randint(8, 15)
         arc = r * theta
         latex = f"\\text{{Find arc length: }} \\theta = {theta:.2f} \\text{{ rad, }} r = {r}."
         solution = f"{arc:.2f}"
@@ -44,8 +41,8 @@ class ArcLengthRadiansGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        r = random.randint(10, 20)
-        arc = random.randint(15, 35)
+        r = self.rng.randint(10, 20)
+        arc = self.rng.randint(15, 35)
         theta = arc / r
         latex = f"\\text{{Arc length }} {arc} \\text{{ in circle radius }} {r}. \\text{{ Find }} \\theta \\text{{ in radians.}}"
         solution = f"{theta:.3f} rad"
@@ -54,8 +51,8 @@ class ArcLengthRadiansGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        theta = random.uniform(0.8, 2.5)
-        arc = random.randint(20, 45)
+        theta = self.rng.uniform(0.8, 2.5)
+        arc = self.rng.randint(20, 45)
         r = arc / theta
         latex = f"\\text{{Arc length }} {arc} \\text{{ with central angle }} {theta:.2f} \\text{{ rad. Find radius.}}"
         solution = f"{r:.2f}"
@@ -5,9 +5,6 @@ Creates problems about central angles and arc measures
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class ArcMeasureGenerator:
     """Generates problems about arc measures and central angles."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,9 +33,9 @@ class ArcMeasureGenerator:
 
     def _generate_easy(self) -> Equation:
         """Central angle equals arc measure"""
-        central_angle = random.randint(30, 150)
+        central_angle = self.rng.randint(30, 150)
 
-        problem_type = random.choice(['find_arc', 'find_angle'])
+        problem_type = self.rng.choice(['find_arc', 'find_angle'])
 
         if problem_type == 'find_arc':
             latex = f"\\text{{A central angle measures }} {central_angle}°. \\text{{ What is the measure of its intercepted arc?}}"
@@ -60,10 +56,10 @@ class ArcMeasureGenerator:
 
     def _generate_medium(self) -> Equation:
         """Minor and major arcs"""
-        minor_arc = random.randint(40, 170)
+        minor_arc = self.rng.randint(40, 170)
         major_arc = 360 - minor_arc
 
-        problem_type = random.choice(['find_major', 'find_minor'])
+        problem_type = self.rng.choice(['find_major', 'find_minor'])
 
         if problem_type == 'find_major':
             latex = f"\\text{{Minor arc AB measures }} {minor_arc}°. \\text{{ Find the measure of major arc AB.}}"
@@ -84,12 +80,12 @@ class ArcMeasureGenerator:
 
     def _generate_hard(self) -> Equation:
         """Arc addition or algebraic problems"""
-        problem_type = random.choice(['arc_addition', 'algebraic'])
+        problem_type = self.rng.choice(['arc_addition', 'algebraic'])
 
         if problem_type == 'arc_addition':
             # Three points on circle: find total arc
-            arc1 = random.randint(30, 80)
-            arc2 = random.randint(30, 80)
+            arc1 = self.rng.randint(30, 80)
+            arc2 = self.rng.randint(30, 80)
             arc3 = 360 - arc1 - arc2
 
             latex = f"\\text{{Points A, B, C are on a circle. Arc AB = }} {arc1}°, \\text{{ arc BC = }} {arc2}°. \\text{{ Find arc AC (the long way, through B).}}"
@@ -101,9 +97,9 @@ class ArcMeasureGenerator:
             ]
         else:
             # Solve for x
-            x = random.randint(5, 20)
-            a = random.randint(2, 5)
-            b = random.randint(1, 30)
+            x = self.rng.randint(5, 20)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 30)
             arc1 = a * x + b
             arc2 = 360 - arc1
 
@@ -122,10 +118,10 @@ class ArcMeasureGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Congruent arcs or arcs from congruent chords"""
-        problem_type = random.choice(['congruent_chords', 'inscribed_polygon'])
+        problem_type = self.rng.choice(['congruent_chords', 'inscribed_polygon'])
 
         if problem_type == 'congruent_chords':
-            arc = random.randint(40, 90)
+            arc = self.rng.randint(40, 90)
 
             latex = f"\\text{{In a circle, two chords are congruent. One chord intercepts an arc of }} {arc}°. \\text{{ What arc does the other chord intercept?}}"
             solution = f"{arc}°"
@@ -136,7 +132,7 @@ class ArcMeasureGenerator:
             ]
         else:
             # Regular polygon inscribed in circle
-            n = random.choice([3, 4, 5, 6, 8])
+            n = self.rng.choice([3, 4, 5, 6, 8])
             names = {3: "triangle", 4: "square", 5: "pentagon", 6: "hexagon", 8: "octagon"}
             arc = 360 // n
 
@@ -4,16 +4,13 @@ Circle Basics Generator
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class CircleBasicsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -25,7 +22,7 @@ class CircleBasicsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        r = random.randint(5, 12)
+        r = self.rng.randint(5, 12)
         latex = f"\\text{{Find circumference of circle with radius }} {r}."
         c = 2 * math.pi * r
         solution = f"{c:.2f}"
@@ -33,7 +30,7 @@ class CircleBasicsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        r = random.randint(4, 10)
+        r = self.rng.randint(4, 10)
         area = math.pi * r * r
         latex = f"\\text{{Find area of circle with radius }} {r}."
         solution = f"{area:.2f}"
@@ -41,7 +38,7 @@ class CircleBasicsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        d = random.randint(10, 20)
+        d = self.rng.randint(10, 20)
         r = d / 2
         area = math.pi * r * r
         latex = f"\\text{{Circle has diameter }} {d}. \\text{{ Find area.}}"
@@ -51,7 +48,7 @@ class CircleBasicsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        c = random.randint(30, 60)
+        c = self.rng.randint(30, 60)
         r = c / (2 * math.pi)
         area = math.pi * r * r
         latex = f"\\text{{Circle has circumference }} {c}. \\text{{ Find area.}}"
@@ -4,16 +4,13 @@ Constructing Regular Polygons Inscribed in Circles Generator
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class ConstructingRegularPolygonsInscribedGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -25,7 +22,7 @@ class ConstructingRegularPolygonsInscribedGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        n = random.choice([3, 4, 6, 8])
+        n = self.rng.choice([3, 4, 6, 8])
         angle = 360 / n
         latex = f"\\text{{What is the central angle for a regular {n}-gon inscribed in a circle?}}"
         solution = f"{angle}°"
@@ -33,7 +30,7 @@ class ConstructingRegularPolygonsInscribedGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        n = random.choice([5, 6, 8])
+        n = self.rng.choice([5, 6, 8])
         interior = ((n - 2) * 180) / n
         latex = f"\\text{{Find interior angle of regular {n}-gon.}}"
         solution = f"{interior}°"
@@ -42,8 +39,8 @@ class ConstructingRegularPolygonsInscribedGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        n = random.choice([6, 8, 12])
-        r = random.randint(8, 15)
+        n = self.rng.choice([6, 8, 12])
+        r = self.rng.randint(8, 15)
         central = 360 / n
         central_rad = math.radians(central)
         side = 2 * r * math.sin(central_rad / 2)
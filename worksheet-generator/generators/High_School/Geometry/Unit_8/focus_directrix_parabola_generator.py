@@ -4,15 +4,12 @@ Focus and Directrix of a Parabola Generator
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class FocusDirectrixParabolaGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -31,7 +28,7 @@ class FocusDirectrixParabolaGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        p = random.randint(2, 6)
+        p = self.rng.randint(2, 6)
         latex = f"\\text{{For parabola }} y = \\frac{{1}}{{4p}}x^2 \\text{{ with }} p = {p}, \\text{{ find focus.}}"
         solution = f"(0, {p})"
         steps = [f"\\text{{For }} y = \\frac{{1}}{{4p}}x^2, \\text{{ focus is at }} (0, p)",
@@ -39,7 +36,7 @@ class FocusDirectrixParabolaGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        p = random.randint(3, 7)
+        p = self.rng.randint(3, 7)
         latex = f"\\text{{Find focus and directrix of }} x^2 = {4*p}y."
         solution = f"Focus (0,{p}), directrix y = {-p}"
         steps = [f"x^2 = 4py \\text{{ where }} 4p = {4*p}",
@@ -48,8 +45,8 @@ class FocusDirectrixParabolaGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        h, k = random.randint(-3, 3), random.randint(-3, 3)
-        p = random.randint(2, 5)
+        h, k = self.rng.randint(-3, 3), self.rng.randint(-3, 3)
+        p = self.rng.randint(2, 5)
         latex = f"\\text{{Find focus of }} (x - {h})^2 = {4*p}(y - {k})."
         solution = f"({h}, {k + p})"
         steps = [f"\\text{{Vertex: }} ({h},{k})",
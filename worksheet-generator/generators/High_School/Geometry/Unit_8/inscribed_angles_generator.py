@@ -4,15 +4,12 @@ Inscribed Angles Generator
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class InscribedAnglesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -24,7 +21,7 @@ class InscribedAnglesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        central = random.randint(60, 140)
+        central = self.rng.randint(60, 140)
         inscribed = central / 2
         latex = f"\\text{{Central angle measures }} {central}^\\circ. \\text{{ Find inscribed angle intercepting same arc.}}"
         solution = f"{inscribed}°"
@@ -33,7 +30,7 @@ class InscribedAnglesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        inscribed = random.randint(30, 80)
+        inscribed = self.rng.randint(30, 80)
         central = 2 * inscribed
         latex = f"\\text{{Inscribed angle measures }} {inscribed}^\\circ. \\text{{ Find central angle intercepting same arc.}}"
         solution = f"{central}°"
@@ -42,7 +39,7 @@ class InscribedAnglesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        arc = random.randint(100, 180)
+        arc = self.rng.randint(100, 180)
         inscribed = arc / 2
         latex = f"\\text{{An inscribed angle intercepts an arc of }} {arc}^\\circ. \\text{{ Find the inscribed angle.}}"
         solution = f"{inscribed}°"
@@ -4,16 +4,13 @@ Inscribed Shapes Problem Solving Generator
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class InscribedShapesProblemSolvingGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -25,7 +22,7 @@ class InscribedShapesProblemSolvingGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a1 = random.randint(60, 100)
+        a1 = self.rng.randint(60, 100)
         a2 = 180 - a1
         latex = f"\\text{{Quadrilateral inscribed in circle has one angle }} {a1}^\\circ. \\text{{ Find opposite angle.}}"
         solution = f"{a2}°"
@@ -35,7 +32,7 @@ class InscribedShapesProblemSolvingGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        side = random.randint(6, 12)
+        side = self.rng.randint(6, 12)
         area_square = side * side
         r = (side * math.sqrt(2)) / 2
         area_circle = math.pi * r * r
@@ -47,7 +44,7 @@ class InscribedShapesProblemSolvingGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        side = random.randint(8, 16)
+        side = self.rng.randint(8, 16)
         r = side * math.sqrt(3) / 3
         latex = f"\\text{{Equilateral triangle with side }} {side} \\text{{ inscribed in circle. Find radius.}}"
         solution = f"{r:.2f}"
@@ -56,7 +53,7 @@ class InscribedShapesProblemSolvingGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        r = random.randint(8, 14)
+        r = self.rng.randint(8, 14)
         side = r * math.sqrt(2)
         area = side * side
         latex = f"\\text{{Circle has radius }} {r}. \\text{{ Find area of inscribed square.}}"
@@ -4,16 +4,13 @@ Intro to Radians Generator
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class IntroRadiansGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -25,7 +22,7 @@ class IntroRadiansGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        degrees = random.choice([30, 45, 60, 90, 180])
+        degrees = self.rng.choice([30, 45, 60, 90, 180])
         rads = degrees * math.pi / 180
         latex = f"\\text{{Convert }} {degrees}^\\circ \\text{{ to radians.}}"
         solution = f"{rads:.3f} rad or {degrees}π/180"
@@ -34,7 +31,7 @@ class IntroRadiansGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        rads = random.choice([math.pi/6, math.pi/4, math.pi/3, math.pi/2, math.pi])
+        rads = self.rng.choice([math.pi/6, math.pi/4, math.pi/3, math.pi/2, math.pi])
         degrees = rads * 180 / math.pi
         rad_str = {math.pi/6: "π/6", math.pi/4: "π/4", math.pi/3: "π/3", math.pi/2: "π/2", math.pi: "π"}
         latex = f"\\text{{Convert }} {rad_str.get(rads, f'{rads:.3f}')} \\text{{ radians to degrees.}}"
@@ -44,7 +41,7 @@ class IntroRadiansGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        degrees = random.randint(10, 170)
+        degrees = self.rng.randint(10, 170)
         rads = degrees * math.pi / 180
         latex = f"\\text{{Convert }} {degrees}^\\circ \\text{{ to radians (exact and decimal).}}"
         solution = f"{degrees}π/180 ≈ {rads:.4f} rad"
@@ -4,16 +4,13 @@ Properties of Tangents Generator
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class PropertiesTangentsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -32,8 +29,8 @@ class PropertiesTangentsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        r = random.randint(6, 12)
-        dist = random.randint(10, 20)
+        r = self.rng.randint(6, 12)
+        dist = self.rng.randint(10, 20)
         tangent = math.sqrt(dist**2 - r**2)
         latex = f"\\text{{From external point }} {dist} \\text{{ units from center of circle (radius }} {r}), \\text{{ find tangent length.}}"
         solution = f"{tangent:.2f}"
@@ -43,7 +40,7 @@ class PropertiesTangentsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        t1 = random.randint(8, 15)
+        t1 = self.rng.randint(8, 15)
         latex = f"\\text{{Two tangent segments from external point have lengths }} {t1} \\text{{ and }} x. \\text{{ Find }} x."
         solution = f"{t1}"
         steps = ["\\text{Two tangent segments from same external point are congruent}",
@@ -4,16 +4,13 @@ Sectors Generator
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class SectorsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -25,8 +22,8 @@ class SectorsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        angle = random.choice([60, 90, 120, 180])
-        r = random.randint(6, 12)
+        angle = self.rng.choice([60, 90, 120, 180])
+        r = self.rng.randint(6, 12)
         area = (angle / 360) * math.pi * r * r
         latex = f"\\text{{Find area of sector: }} \\theta = {angle}^\\circ, r = {r}."
         solution = f"{area:.2f}"
@@ -35,8 +32,8 @@ class SectorsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        theta = random.choice([math.pi/6, math.pi/4, math.pi/3, math.pi/2])
-        r = random.randint(8, 14)
+        theta = self.rng.choice([math.pi/6, math.pi/4, math.pi/3, math.pi/2])
+        r = self.rng.randint(8, 14)
         area = 0.5 * r * r * theta
         theta_str = {math.pi/6: "π/6", math.pi/4: "π/4", math.pi/3: "π/3", math.pi/2: "π/2"}
         latex = f"\\text{{Find sector area: }} \\theta = {theta_str[theta]} \\text{{ rad, }} r = {r}."
@@ -46,8 +43,8 @@ class SectorsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        angle = random.randint(40, 160)
-        r = random.randint(10, 18)
+        angle = self.rng.randint(40, 160)
+        r = self.rng.randint(10, 18)
         sector_area = (angle / 360) * math.pi * r * r
         circle_area = math.pi * r * r
         ratio = sector_area / circle_area
@@ -57,8 +54,8 @@ class SectorsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        r = random.randint(10, 16)
-        area = random.randint(50, 120)
+        r = self.rng.randint(10, 16)
+        area = self.rng.randint(50, 120)
         theta_rad = (2 * area) / (r * r)
         theta_deg = theta_rad * 180 / math.pi
         latex = f"\\text{{Sector area }} {area} \\text{{ in circle radius }} {r}. \\text{{ Find central angle in degrees.}}"
@@ -4,16 +4,13 @@ Cavalieri's Principle Generator
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class CavalierisPrincipleGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -33,8 +30,8 @@ class CavalierisPrincipleGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        r = random.randint(4, 10)
-        h = random.randint(8, 15)
+        r = self.rng.randint(4, 10)
+        h = self.rng.randint(8, 15)
         vol_cylinder = math.pi * r * r * h
         latex = f"\\text{{A right cylinder and an oblique cylinder both have radius }} {r} \\text{{ and height }} {h}. "
         latex += "\\text{Compare their volumes using Cavalieri's Principle.}"
@@ -45,8 +42,8 @@ class CavalierisPrincipleGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        r = random.randint(5, 10)
-        h = random.randint(10, 18)
+        r = self.rng.randint(5, 10)
+        h = self.rng.randint(10, 18)
         vol_cone = (1/3) * math.pi * r * r * h
         vol_pyramid = (1/3) * r * r * h  # square base
         latex = f"\\text{{Use Cavalieri's Principle to explain why cone volume formula is }} \\frac{{1}}{{3}}\\pi r^2 h."
@@ -58,7 +55,7 @@ class CavalierisPrincipleGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        r = random.randint(6, 12)
+        r = self.rng.randint(6, 12)
         vol_sphere = (4/3) * math.pi * r**3
         vol_cylinder = math.pi * r**2 * (2*r)
         vol_cones = 2 * (1/3) * math.pi * r**2 * r
@@ -4,16 +4,13 @@
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
 class TwoDVs3DObjectsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -25,7 +22,7 @@ class TwoDVs3DObjectsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        shape = random.choice(['cube', 'cylinder', 'sphere', 'cone'])
+        shape = self.rng.choice(['cube', 'cylinder', 'sphere', 'cone'])
         cross_sections = {
             'cube': 'square, rectangle, triangle, hexagon',
             'cylinder': 'circle, rectangle',
@@ -39,7 +36,7 @@ class TwoDVs3DObjectsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        solid = random.choice(['prism', 'pyramid', 'cylinder', 'cone'])
+        solid = self.rng.choice(['prism', 'pyramid', 'cylinder', 'cone'])
         latex = f"\\text{{Describe how to obtain a triangular cross-section of a {solid}.}}"
         if solid == 'prism':
             solution = "Cut at an angle through edges"
@@ -6,9 +6,6 @@ Creates problems about volume and surface area of 3D shapes
 import random
 import math
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class VolumeSurfaceAreaGenerator:
     """Generates problems about volume and surface area of 3D shapes."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -38,10 +34,10 @@ class VolumeSurfaceAreaGenerator:
 
     def _generate_easy(self) -> Equation:
         """Volume of rectangular prism or cube"""
-        shape = random.choice(['cube', 'rectangular_prism'])
+        shape = self.rng.choice(['cube', 'rectangular_prism'])
 
         if shape == 'cube':
-            s = random.randint(2, 8)
+            s = self.rng.randint(2, 8)
             volume = s ** 3
 
             latex = f"\\text{{Find the volume of a cube with side length }} {s}."
@@ -52,9 +48,9 @@ class VolumeSurfaceAreaGenerator:
                 f"V = {s}^3 = {volume}"
             ]
         else:
-            l = random.randint(2, 8)
-            w = random.randint(2, 8)
-            h = random.randint(2, 8)
+            l = self.rng.randint(2, 8)
+            w = self.rng.randint(2, 8)
+            h = self.rng.randint(2, 8)
             volume = l * w * h
 
             latex = f"\\text{{Find the volume of a rectangular prism with length }} {l}, \\text{{ width }} {w}, \\text{{ height }} {h}."
@@ -69,11 +65,11 @@ class VolumeSurfaceAreaGenerator:
 
     def _generate_medium(self) -> Equation:
         """Volume or SA of cylinder, cone, or prism"""
-        shape = random.choice(['cylinder_volume', 'cylinder_sa', 'triangular_prism'])
+        shape = self.rng.choice(['cylinder_volume', 'cylinder_sa', 'triangular_prism'])
 
         if shape == 'cylinder_volume':
-            r = random.randint(2, 6)
-            h = random.randint(3, 10)
+            r = self.rng.randint(2, 6)
+            h = self.rng.randint(3, 10)
             # V = πr²h
 
             latex = f"\\text{{Find the volume of a cylinder with radius }} {r} \\text{{ and height }} {h}. \\text{{ (Leave answer in terms of }} \\pi.)"
@@ -86,8 +82,8 @@ class VolumeSurfaceAreaGenerator:
             ]
 
         elif shape == 'cylinder_sa':
-            r = random.randint(2, 5)
-            h = random.randint(3, 8)
+            r = self.rng.randint(2, 5)
+            h = self.rng.randint(3, 8)
             # SA = 2πr² + 2πrh = 2πr(r + h)
 
             latex = f"\\text{{Find the surface area of a cylinder with radius }} {r} \\text{{ and height }} {h}. \\text{{ (In terms of }} \\pi.)"
@@ -101,9 +97,9 @@ class VolumeSurfaceAreaGenerator:
 
         else:
             # Triangular prism
-            b = random.randint(3, 8)
-            h_tri = random.randint(3, 8)
-            length = random.randint(4, 10)
+            b = self.rng.randint(3, 8)
+            h_tri = self.rng.randint(3, 8)
+            length = self.rng.randint(4, 10)
             # V = (1/2)bh × length
 
             volume = (b * h_tri * length) // 2
@@ -121,11 +117,11 @@ class VolumeSurfaceAreaGenerator:
 
     def _generate_hard(self) -> Equation:
         """Cone, sphere, or finding missing dimension"""
-        shape = random.choice(['cone', 'sphere', 'find_dimension'])
+        shape = self.rng.choice(['cone', 'sphere', 'find_dimension'])
 
         if shape == 'cone':
-            r = random.randint(2, 6)
-            h = random.randint(3, 9)
+            r = self.rng.randint(2, 6)
+            h = self.rng.randint(3, 9)
             # V = (1/3)πr²h
 
             latex = f"\\text{{Find the volume of a cone with radius }} {r} \\text{{ and height }} {h}. \\text{{ (In terms of }} \\pi.)"
@@ -142,7 +138,7 @@ class VolumeSurfaceAreaGenerator:
             ]
 
         elif shape == 'sphere':
-            r = random.randint(2, 5)
+            r = self.rng.randint(2, 5)
             # V = (4/3)πr³
 
             vol_coef = 4 * r**3
@@ -161,9 +157,9 @@ class VolumeSurfaceAreaGenerator:
 
         else:
             # Find missing dimension given volume
-            l = random.randint(3, 8)
-            w = random.randint(3, 8)
-            h = random.randint(2, 6)
+            l = self.rng.randint(3, 8)
+            w = self.rng.randint(3, 8)
+            h = self.rng.randint(2, 6)
             volume = l * w * h
 
             latex = f"\\text{{A rectangular prism has volume }} {volume} \\text{{ cubic units, length }} {l}, \\text{{ and width }} {w}. \\text{{ Find the height.}}"
@@ -180,12 +176,12 @@ class VolumeSurfaceAreaGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Composite shapes or real-world applications"""
-        problem_type = random.choice(['composite', 'word_problem', 'hemisphere'])
+        problem_type = self.rng.choice(['composite', 'word_problem', 'hemisphere'])
 
         if problem_type == 'composite':
             # Cylinder with hemisphere on top
-            r = random.randint(2, 4)
-            h = random.randint(4, 8)
+            r = self.rng.randint(2, 4)
+            h = self.rng.randint(4, 8)
 
             # V = πr²h + (2/3)πr³
             cyl_vol = r**2 * h
@@ -208,9 +204,9 @@ class VolumeSurfaceAreaGenerator:
 
         elif problem_type == 'word_problem':
             # Fill a pool problem
-            l = random.randint(8, 15)
-            w = random.randint(5, 10)
-            h = random.randint(2, 4)
+            l = self.rng.randint(8, 15)
+            w = self.rng.randint(5, 10)
+            h = self.rng.randint(2, 4)
             volume = l * w * h
 
             latex = f"\\text{{A rectangular swimming pool is {l} m long, {w} m wide, and {h} m deep. How many cubic meters of water does it hold?}}"
@@ -224,7 +220,7 @@ class VolumeSurfaceAreaGenerator:
 
         else:
             # Surface area of hemisphere
-            r = random.randint(2, 5)
+            r = self.rng.randint(2, 5)
             # SA = 2πr² (curved) + πr² (base) = 3πr²
 
             latex = f"\\text{{Find the total surface area of a hemisphere with radius }} {r}. \\text{{ (In terms of }} \\pi.)"
@@ -3,14 +3,11 @@ Circle Expressions in Equation Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class CircleExpressionsInEquationGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class CircleExpressionsInEquationGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(1, 10)
-        c = random.randint(1, 15)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(1, 10)
+        c = self.rng.randint(1, 15)
 
         latex = f"\\text{{Circle the expression in: }} {a}x + {b} = {c}"
         solution = f"{a}x + {b}"
@@ -33,10 +30,10 @@ class CircleExpressionsInEquationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(1, 10)
-        c = random.randint(1, 12)
-        d = random.randint(1, 15)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(1, 10)
+        c = self.rng.randint(1, 12)
+        d = self.rng.randint(1, 15)
 
         latex = f"\\text{{Circle all expressions in: }} {a}x + {b} = {c}x - {d}"
         solution = f"{a}x + {b} and {c}x - {d}"
@@ -45,11 +42,11 @@ class CircleExpressionsInEquationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 7)
-        b = random.randint(1, 9)
-        c = random.randint(1, 8)
-        d = random.randint(1, 12)
-        e = random.randint(1, 10)
+        a = self.rng.randint(2, 7)
+        b = self.rng.randint(1, 9)
+        c = self.rng.randint(1, 8)
+        d = self.rng.randint(1, 12)
+        e = self.rng.randint(1, 10)
 
         latex = f"\\text{{Circle all expressions in: }} {a}({b}x - {c}) = {d}x + {e}"
         solution = f"{a}({b}x - {c}), {b}x - {c}, {d}x + {e}"
@@ -58,12 +55,12 @@ class CircleExpressionsInEquationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(1, 8)
-        c = random.randint(1, 7)
-        d = random.randint(2, 5)
-        e = random.randint(1, 9)
-        f = random.randint(1, 12)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 8)
+        c = self.rng.randint(1, 7)
+        d = self.rng.randint(2, 5)
+        e = self.rng.randint(1, 9)
+        f = self.rng.randint(1, 12)
 
         latex = f"\\text{{Circle all expressions in: }} {a}({b}x + {c}) - {d}x = {e}({f} - x)"
         solution = f"{a}({b}x + {c}) - {d}x, {b}x + {c}, {e}({f} - x), {f} - x"
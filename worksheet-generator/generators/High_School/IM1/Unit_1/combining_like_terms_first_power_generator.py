@@ -3,14 +3,11 @@ Combining Like Terms First Power Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class CombiningLikeTermsFirstPowerGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,10 +19,10 @@ class CombiningLikeTermsFirstPowerGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(1, 9)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(1, 9)
         result = a + b
-        var = random.choice(['x', 'y', 'n'])
+        var = self.rng.choice(['x', 'y', 'n'])
 
         latex = f"\\text{{Simplify: }} {a}{var} + {b}{var}"
         solution = f"{result}{var}"
@@ -34,11 +31,11 @@ class CombiningLikeTermsFirstPowerGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(3, 9)
-        b = random.randint(1, 7)
-        c = random.randint(1, 10)
+        a = self.rng.randint(3, 9)
+        b = self.rng.randint(1, 7)
+        c = self.rng.randint(1, 10)
         result = a + b
-        var = random.choice(['x', 'y', 'm'])
+        var = self.rng.choice(['x', 'y', 'm'])
 
         latex = f"\\text{{Simplify: }} {a}{var} + {c} + {b}{var}"
         solution = f"{result}{var} + {c}"
@@ -47,11 +44,11 @@ class CombiningLikeTermsFirstPowerGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(4, 9)
-        b = random.randint(2, 7)
-        c = random.randint(1, 6)
+        a = self.rng.randint(4, 9)
+        b = self.rng.randint(2, 7)
+        c = self.rng.randint(1, 6)
         result = a - b
-        var = random.choice(['x', 'y', 'a'])
+        var = self.rng.choice(['x', 'y', 'a'])
 
         if result > 0:
             latex = f"\\text{{Simplify: }} {a}{var} - {b}{var} + {c}"
@@ -66,14 +63,14 @@ class CombiningLikeTermsFirstPowerGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(3, 8)
-        b = random.randint(2, 6)
-        c = random.randint(1, 5)
-        d = random.randint(1, 9)
-        e = random.randint(1, 7)
+        a = self.rng.randint(3, 8)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 9)
+        e = self.rng.randint(1, 7)
         result_x = a + b - c
         result_const = d - e
-        var = random.choice(['x', 'y', 'n'])
+        var = self.rng.choice(['x', 'y', 'n'])
 
         latex = f"\\text{{Simplify: }} {a}{var} + {d} + {b}{var} - {c}{var} - {e}"
         solution = f"{result_x}{var} + {result_const}" if result_const >= 0 else f"{result_x}{var} - {abs(result_const)}"
@@ -3,14 +3,11 @@ Combining Like Terms Full Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class CombiningLikeTermsFullGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,10 +19,10 @@ class CombiningLikeTermsFullGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(3, 8)
-        b = random.randint(2, 7)
-        c = random.randint(1, 6)
-        d = random.randint(1, 9)
+        a = self.rng.randint(3, 8)
+        b = self.rng.randint(2, 7)
+        c = self.rng.randint(1, 6)
+        d = self.rng.randint(1, 9)
 
         x_coef = a + b
 
@@ -40,11 +37,11 @@ class CombiningLikeTermsFullGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(3, 7)
-        b = random.randint(2, 6)
-        c = random.randint(1, 5)
-        d = random.randint(2, 6)
-        e = random.randint(1, 8)
+        a = self.rng.randint(3, 7)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(2, 6)
+        e = self.rng.randint(1, 8)
 
         x2_coef = a + b
         x1_coef = c
@@ -60,12 +57,12 @@ class CombiningLikeTermsFullGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(3, 7)
-        b = random.randint(2, 6)
-        c = random.randint(1, 5)
-        d = random.randint(2, 5)
-        e = random.randint(1, 4)
-        f = random.randint(1, 7)
+        a = self.rng.randint(3, 7)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(2, 5)
+        e = self.rng.randint(1, 4)
+        f = self.rng.randint(1, 7)
 
         x2_coef = a - c
         x1_coef = b + d
@@ -81,14 +78,14 @@ class CombiningLikeTermsFullGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(2, 5)
-        c = random.randint(1, 4)
-        d = random.randint(1, 4)
-        e = random.randint(1, 3)
-        f = random.randint(1, 4)
-        g = random.randint(1, 6)
-        h = random.randint(1, 5)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 5)
+        c = self.rng.randint(1, 4)
+        d = self.rng.randint(1, 4)
+        e = self.rng.randint(1, 3)
+        f = self.rng.randint(1, 4)
+        g = self.rng.randint(1, 6)
+        h = self.rng.randint(1, 5)
 
         x2_coef = a + c - e
         x1_coef = b - d + f
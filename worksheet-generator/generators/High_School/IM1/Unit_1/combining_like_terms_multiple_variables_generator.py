@@ -3,14 +3,11 @@ Combining Like Terms Multiple Variables Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class CombiningLikeTermsMultipleVariablesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,10 +19,10 @@ class CombiningLikeTermsMultipleVariablesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(1, 9)
-        c = random.randint(1, 7)
-        d = random.randint(1, 8)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(1, 9)
+        c = self.rng.randint(1, 7)
+        d = self.rng.randint(1, 8)
 
         latex = f"\\text{{Simplify: }} {a}x + {b}y + {c}x + {d}y"
         x_coef = a + c
@@ -36,11 +33,11 @@ class CombiningLikeTermsMultipleVariablesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(3, 8)
-        b = random.randint(2, 7)
-        c = random.randint(1, 6)
-        d = random.randint(1, 9)
-        e = random.randint(1, 8)
+        a = self.rng.randint(3, 8)
+        b = self.rng.randint(2, 7)
+        c = self.rng.randint(1, 6)
+        d = self.rng.randint(1, 9)
+        e = self.rng.randint(1, 8)
 
         x_coef = a + c
         y_coef = b + d
@@ -52,11 +49,11 @@ class CombiningLikeTermsMultipleVariablesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(4, 9)
-        b = random.randint(2, 7)
-        c = random.randint(1, 6)
-        d = random.randint(3, 8)
-        e = random.randint(1, 5)
+        a = self.rng.randint(4, 9)
+        b = self.rng.randint(2, 7)
+        c = self.rng.randint(1, 6)
+        d = self.rng.randint(3, 8)
+        e = self.rng.randint(1, 5)
 
         x_coef = a - c
         y_coef = b + d
@@ -68,13 +65,13 @@ class CombiningLikeTermsMultipleVariablesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(3, 7)
-        b = random.randint(2, 6)
-        c = random.randint(1, 5)
-        d = random.randint(2, 6)
-        e = random.randint(1, 5)
-        f = random.randint(1, 4)
-        g = random.randint(1, 8)
+        a = self.rng.randint(3, 7)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(2, 6)
+        e = self.rng.randint(1, 5)
+        f = self.rng.randint(1, 4)
+        g = self.rng.randint(1, 8)
 
         x_coef = a + c - e
         y_coef = b - d
@@ -3,14 +3,11 @@ Equivalent Expressions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class EquivalentExpressionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class EquivalentExpressionsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(1, 7)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(1, 7)
         c = a + b
 
         latex = f"\\text{{Are }} {a}x + {b}x \\text{{ and }} {c}x \\text{{ equivalent?}}"
@@ -33,9 +30,9 @@ class EquivalentExpressionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(1, 8)
-        c = random.randint(1, 7)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 8)
+        c = self.rng.randint(1, 7)
         result = a * b + a * c
 
         latex = f"\\text{{Are }} {a}({b}x + {c}) \\text{{ and }} {a*b}x + {a*c} \\text{{ equivalent?}}"
@@ -45,10 +42,10 @@ class EquivalentExpressionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(2, 7)
-        c = random.randint(1, 5)
-        d = random.randint(1, 6)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 7)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 6)
 
         # Create two forms of same expression
         combined = a + b
@@ -61,10 +58,10 @@ class EquivalentExpressionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(2, 6)
-        c = random.randint(1, 5)
-        d = random.randint(1, 4)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 4)
 
         # a(bx + c) + dx = abx + ac + dx
         result_x = a * b + d
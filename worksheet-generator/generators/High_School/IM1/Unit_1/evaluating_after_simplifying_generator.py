@@ -3,14 +3,11 @@ Evaluating After Simplifying Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class EvaluatingAfterSimplifyingGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,10 +19,10 @@ class EvaluatingAfterSimplifyingGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 7)
-        b = random.randint(1, 6)
-        c = random.randint(1, 8)
-        x_val = random.randint(2, 5)
+        a = self.rng.randint(2, 7)
+        b = self.rng.randint(1, 6)
+        c = self.rng.randint(1, 8)
+        x_val = self.rng.randint(2, 5)
 
         combined = a + b
         result = combined * x_val + c
@@ -37,11 +34,11 @@ class EvaluatingAfterSimplifyingGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(2, 7)
-        c = random.randint(1, 5)
-        d = random.randint(1, 8)
-        x_val = random.randint(2, 4)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 7)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 8)
+        x_val = self.rng.randint(2, 4)
 
         x_coef = a + b
         const = c + d
@@ -54,12 +51,12 @@ class EvaluatingAfterSimplifyingGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(2, 6)
-        c = random.randint(1, 5)
-        d = random.randint(1, 4)
-        e = random.randint(1, 7)
-        x_val = random.randint(2, 4)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 4)
+        e = self.rng.randint(1, 7)
+        x_val = self.rng.randint(2, 4)
 
         x2_coef = a + c
         x1_coef = b
@@ -72,11 +69,11 @@ class EvaluatingAfterSimplifyingGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 4)
-        b = random.randint(2, 5)
-        c = random.randint(1, 4)
-        d = random.randint(1, 6)
-        x_val = random.randint(2, 3)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(2, 5)
+        c = self.rng.randint(1, 4)
+        d = self.rng.randint(1, 6)
+        x_val = self.rng.randint(2, 3)
 
         # a(bx + c) + dx
         distributed_x = a * b + d
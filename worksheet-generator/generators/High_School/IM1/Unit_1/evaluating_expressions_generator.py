@@ -3,14 +3,11 @@ Evaluating Expressions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class EvaluatingExpressionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class EvaluatingExpressionsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(1, 12)
-        x_val = random.randint(1, 5)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(1, 12)
+        x_val = self.rng.randint(1, 5)
         result = a * x_val + b
 
         latex = f"\\text{{Evaluate }} {a}x + {b} \\text{{ when }} x = {x_val}"
@@ -34,10 +31,10 @@ class EvaluatingExpressionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 7)
-        b = random.randint(1, 10)
-        c = random.randint(1, 8)
-        x_val = random.randint(2, 6)
+        a = self.rng.randint(2, 7)
+        b = self.rng.randint(1, 10)
+        c = self.rng.randint(1, 8)
+        x_val = self.rng.randint(2, 6)
         result = a * x_val - b * x_val + c
 
         latex = f"\\text{{Evaluate }} {a}x - {b}x + {c} \\text{{ when }} x = {x_val}"
@@ -47,11 +44,11 @@ class EvaluatingExpressionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(1, 8)
-        c = random.randint(2, 5)
-        x_val = random.randint(2, 5)
-        y_val = random.randint(1, 6)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 8)
+        c = self.rng.randint(2, 5)
+        x_val = self.rng.randint(2, 5)
+        y_val = self.rng.randint(1, 6)
         result = a * x_val + b * y_val - c
 
         latex = f"\\text{{Evaluate }} {a}x + {b}y - {c} \\text{{ when }} x = {x_val}, y = {y_val}"
@@ -61,11 +58,11 @@ class EvaluatingExpressionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(2, 6)
-        c = random.randint(1, 7)
-        d = random.randint(1, 8)
-        x_val = random.randint(2, 4)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(1, 7)
+        d = self.rng.randint(1, 8)
+        x_val = self.rng.randint(2, 4)
         inner = b * x_val - c
         result = a * inner + d
 
@@ -3,14 +3,11 @@ Expression vs Equation Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ExpressionVsEquationGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,18 +19,18 @@ class ExpressionVsEquationGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        is_equation = random.choice([True, False])
+        is_equation = self.rng.choice([True, False])
 
         if is_equation:
-            a = random.randint(1, 10)
-            b = random.randint(1, 10)
-            c = random.randint(1, 20)
+            a = self.rng.randint(1, 10)
+            b = self.rng.randint(1, 10)
+            c = self.rng.randint(1, 20)
             latex = f"\\text{{Is }} {a}x + {b} = {c} \\text{{ an expression or equation?}}"
             solution = "equation"
             steps = ["Contains an equals sign", "Answer: equation"]
         else:
-            a = random.randint(2, 10)
-            b = random.randint(1, 15)
+            a = self.rng.randint(2, 10)
+            b = self.rng.randint(1, 15)
             latex = f"\\text{{Is }} {a}x - {b} \\text{{ an expression or equation?}}"
             solution = "expression"
             steps = ["No equals sign", "Answer: expression"]
@@ -41,12 +38,12 @@ class ExpressionVsEquationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        problem_type = random.choice(['classify_multiple', 'definition'])
+        problem_type = self.rng.choice(['classify_multiple', 'definition'])
 
         if problem_type == 'classify_multiple':
-            a = random.randint(2, 8)
-            b = random.randint(1, 12)
-            c = random.randint(1, 15)
+            a = self.rng.randint(2, 8)
+            b = self.rng.randint(1, 12)
+            c = self.rng.randint(1, 15)
             item1 = f"{a}x + {b}"
             item2 = f"{a}x = {c}"
             latex = f"\\text{{Classify: (a) }} {item1} \\text{{ (b) }} {item2}"
@@ -60,10 +57,10 @@ class ExpressionVsEquationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(1, 10)
-        c = random.randint(1, 12)
-        d = random.randint(1, 15)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(1, 10)
+        c = self.rng.randint(1, 12)
+        d = self.rng.randint(1, 15)
 
         item1 = f"{a}x + {b} - {c}"
         item2 = f"{a}x + {b} = {d}"
@@ -76,10 +73,10 @@ class ExpressionVsEquationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 7)
-        b = random.randint(1, 9)
-        c = random.randint(1, 10)
-        d = random.randint(1, 12)
+        a = self.rng.randint(2, 7)
+        b = self.rng.randint(1, 9)
+        c = self.rng.randint(1, 10)
+        d = self.rng.randint(1, 12)
 
         latex = f"\\text{{Write an expression and an equation using }} {a}x \\text{{ and }} {b}"
         solution = f"Expression example: {a}x + {b}, Equation example: {a}x + {b} = {c+b}"
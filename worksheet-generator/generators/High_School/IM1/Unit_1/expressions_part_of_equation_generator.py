@@ -3,14 +3,11 @@ Expressions Part of Equation Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ExpressionsPartOfEquationGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class ExpressionsPartOfEquationGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 9)
-        b = random.randint(1, 12)
-        c = random.randint(1, 15)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(1, 12)
+        c = self.rng.randint(1, 15)
 
         latex = f"\\text{{How many expressions are in: }} {a}x + {b} = {c}?"
         solution = "2"
@@ -33,10 +30,10 @@ class ExpressionsPartOfEquationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(1, 10)
-        c = random.randint(1, 12)
-        d = random.randint(1, 9)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(1, 10)
+        c = self.rng.randint(1, 12)
+        d = self.rng.randint(1, 9)
 
         latex = f"\\text{{True or False: Every equation contains at least two expressions}}"
         solution = "True"
@@ -45,10 +42,10 @@ class ExpressionsPartOfEquationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 7)
-        b = random.randint(1, 9)
-        c = random.randint(1, 10)
-        d = random.randint(1, 12)
+        a = self.rng.randint(2, 7)
+        b = self.rng.randint(1, 9)
+        c = self.rng.randint(1, 10)
+        d = self.rng.randint(1, 12)
 
         latex = f"\\text{{List the two main expressions in: }} {a}({b}x + {c}) = {d}"
         solution = f"{a}({b}x + {c}) and {d}"
@@ -57,11 +54,11 @@ class ExpressionsPartOfEquationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(1, 8)
-        c = random.randint(1, 7)
-        d = random.randint(2, 5)
-        e = random.randint(1, 9)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 8)
+        c = self.rng.randint(1, 7)
+        d = self.rng.randint(2, 5)
+        e = self.rng.randint(1, 9)
 
         latex = f"\\text{{In }} {a}x + {b} = {c}x - {d}\\text{{, identify the expressions on each side and write a new equation with different expressions}}"
         solution = f"Left: {a}x + {b}, Right: {c}x - {d}; New equation (answers vary): {e}x = {b}"
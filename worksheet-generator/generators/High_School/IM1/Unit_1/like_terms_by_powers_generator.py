@@ -3,14 +3,11 @@ Like Terms by Powers Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class LikeTermsByPowersGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class LikeTermsByPowersGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(1, 9)
-        var = random.choice(['x', 'y', 'n'])
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(1, 9)
+        var = self.rng.choice(['x', 'y', 'n'])
 
         latex = f"\\text{{Are }} {a}{var}^2 \\text{{ and }} {b}{var}^2 \\text{{ like terms?}}"
         solution = "Yes"
@@ -33,9 +30,9 @@ class LikeTermsByPowersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 7)
-        b = random.randint(1, 8)
-        var = random.choice(['x', 'y', 'm'])
+        a = self.rng.randint(2, 7)
+        b = self.rng.randint(1, 8)
+        var = self.rng.choice(['x', 'y', 'm'])
 
         latex = f"\\text{{Are }} {a}{var}^2 \\text{{ and }} {b}{var} \\text{{ like terms?}}"
         solution = "No"
@@ -44,9 +41,9 @@ class LikeTermsByPowersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 7)
-        b = random.randint(1, 8)
-        c = random.randint(1, 6)
+        a = self.rng.randint(2, 7)
+        b = self.rng.randint(1, 8)
+        c = self.rng.randint(1, 6)
 
         latex = f"\\text{{Simplify: }} {a}x^2 + {b}x + {c}x^2"
         x2_coef = a + c
@@ -56,11 +53,11 @@ class LikeTermsByPowersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(2, 7)
-        c = random.randint(1, 5)
-        d = random.randint(1, 6)
-        e = random.randint(1, 8)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 7)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 6)
+        e = self.rng.randint(1, 8)
 
         x2_coef = a + c
         x1_coef = b + d
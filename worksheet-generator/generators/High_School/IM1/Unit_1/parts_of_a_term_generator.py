@@ -3,14 +3,11 @@ Parts of a Term Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class PartsOfATermGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,22 +19,22 @@ class PartsOfATermGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        problem_type = random.choice(['coefficient', 'variable', 'constant'])
+        problem_type = self.rng.choice(['coefficient', 'variable', 'constant'])
 
         if problem_type == 'coefficient':
-            coef = random.randint(2, 12)
-            var = random.choice(['x', 'y', 'a', 'b'])
+            coef = self.rng.randint(2, 12)
+            var = self.rng.choice(['x', 'y', 'a', 'b'])
             latex = f"\\text{{What is the coefficient in }} {coef}{var}?"
             solution = f"{coef}"
             steps = [f"The coefficient is the number multiplied by the variable", f"Answer: {coef}"]
         elif problem_type == 'variable':
-            coef = random.randint(2, 9)
-            var = random.choice(['x', 'y', 'n', 'm'])
+            coef = self.rng.randint(2, 9)
+            var = self.rng.choice(['x', 'y', 'n', 'm'])
             latex = f"\\text{{What is the variable in }} {coef}{var}?"
             solution = f"{var}"
             steps = [f"The variable is the letter in the term", f"Answer: {var}"]
         else:
-            const = random.randint(1, 20)
+            const = self.rng.randint(1, 20)
             latex = f"\\text{{Is }} {const} \\text{{ a constant or a variable?}}"
             solution = "constant"
             steps = ["A constant is a number without a variable", "Answer: constant"]
@@ -45,17 +42,17 @@ class PartsOfATermGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        problem_type = random.choice(['identify_all', 'coefficient_with_negative'])
+        problem_type = self.rng.choice(['identify_all', 'coefficient_with_negative'])
 
         if problem_type == 'identify_all':
-            coef = random.randint(2, 15)
-            var = random.choice(['x', 'y', 'z'])
+            coef = self.rng.randint(2, 15)
+            var = self.rng.choice(['x', 'y', 'z'])
             latex = f"\\text{{Identify the coefficient and variable in }} {coef}{var}"
             solution = f"coefficient: {coef}, variable: {var}"
             steps = [f"Coefficient is {coef}", f"Variable is {var}"]
         else:
-            coef = random.randint(2, 12)
-            var = random.choice(['x', 'y', 'a'])
+            coef = self.rng.randint(2, 12)
+            var = self.rng.choice(['x', 'y', 'a'])
             latex = f"\\text{{What is the coefficient in }} -{coef}{var}?"
             solution = f"-{coef}"
             steps = ["The coefficient includes the sign", f"Answer: -{coef}"]
@@ -63,17 +60,17 @@ class PartsOfATermGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        problem_type = random.choice(['multiple_terms', 'implied_coefficient'])
+        problem_type = self.rng.choice(['multiple_terms', 'implied_coefficient'])
 
         if problem_type == 'multiple_terms':
-            c1 = random.randint(2, 9)
-            c2 = random.randint(2, 9)
-            const = random.randint(1, 15)
+            c1 = self.rng.randint(2, 9)
+            c2 = self.rng.randint(2, 9)
+            const = self.rng.randint(1, 15)
             latex = f"\\text{{List all coefficients in }} {c1}x + {c2}y - {const}"
             solution = f"{c1}, {c2}"
             steps = [f"Coefficient of x is {c1}", f"Coefficient of y is {c2}", f"{const} is a constant term, not a coefficient"]
         else:
-            var = random.choice(['x', 'y', 'a', 'b'])
+            var = self.rng.choice(['x', 'y', 'a', 'b'])
             latex = f"\\text{{What is the coefficient in }} {var}?"
             solution = "1"
             steps = [f"When no number is written, the coefficient is 1", f"Answer: 1"]
@@ -81,10 +78,10 @@ class PartsOfATermGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        c1 = random.randint(2, 8)
-        c2 = random.randint(2, 8)
-        c3 = random.randint(2, 8)
-        const = random.randint(5, 20)
+        c1 = self.rng.randint(2, 8)
+        c2 = self.rng.randint(2, 8)
+        c3 = self.rng.randint(2, 8)
+        const = self.rng.randint(5, 20)
         latex = f"\\text{{In }} {c1}x^2 - {c2}y + z + {const}\\text{{, identify all coefficients and constants}}"
         solution = f"coefficients: {c1}, -{c2}, 1; constant: {const}"
         steps = [f"Coefficient of x^2 is {c1}", f"Coefficient of y is -{c2}", f"Coefficient of z is 1", f"Constant term is {const}"]
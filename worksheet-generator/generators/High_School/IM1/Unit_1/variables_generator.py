@@ -5,9 +5,6 @@ Creates problems about understanding variables as unknown values
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class VariablesGenerator:
     """Generates problems about variables."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,7 +33,7 @@ class VariablesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Identify variables and constants"""
-        problem_type = random.choice(['identify_var', 'identify_const', 'meaning'])
+        problem_type = self.rng.choice(['identify_var', 'identify_const', 'meaning'])
 
         if problem_type == 'identify_var':
             expressions = [
@@ -47,7 +43,7 @@ class VariablesGenerator:
                 ("2n + 6", "n"),
                 ("5m - 3", "m"),
             ]
-            expr, var = random.choice(expressions)
+            expr, var = self.rng.choice(expressions)
 
             latex = f"\\text{{What is the variable in the expression }} {expr}?"
             solution = var
@@ -57,9 +53,9 @@ class VariablesGenerator:
             ]
 
         elif problem_type == 'identify_const':
-            a = random.randint(2, 10)
-            b = random.randint(1, 15)
-            var = random.choice(['x', 'y', 'n'])
+            a = self.rng.randint(2, 10)
+            b = self.rng.randint(1, 15)
+            var = self.rng.choice(['x', 'y', 'n'])
 
             latex = f"\\text{{What are the constants in }} {a}{var} + {b}?"
             solution = f"{a} \\text{{ and }} {b}"
@@ -75,7 +71,7 @@ class VariablesGenerator:
                 ("Let h = height in inches", "h", "height in inches"),
                 ("Let t = time in hours", "t", "time in hours"),
             ]
-            statement, var, meaning = random.choice(contexts)
+            statement, var, meaning = self.rng.choice(contexts)
 
             latex = f"\\text{{In the statement \"}} {statement} \\text{{\", what does }} {var} \\text{{ represent?}}"
             solution = meaning
@@ -87,7 +83,7 @@ class VariablesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Translate words to variable expressions"""
-        problem_type = random.choice(['translate', 'evaluate'])
+        problem_type = self.rng.choice(['translate', 'evaluate'])
 
         if problem_type == 'translate':
             phrases = [
@@ -99,7 +95,7 @@ class VariablesGenerator:
                 ("a number divided by 4", "\\frac{n}{4}", "n"),
                 ("3 times a number plus 2", "3n + 2", "n"),
             ]
-            phrase, expr, var = random.choice(phrases)
+            phrase, expr, var = self.rng.choice(phrases)
 
             latex = f"\\text{{Write as an algebraic expression: \"}} {phrase} \\text{{\" (use }} {var} \\text{{ for the number)}}"
             solution = expr
@@ -110,9 +106,9 @@ class VariablesGenerator:
 
         else:
             # Evaluate a simple expression
-            a = random.randint(2, 6)
-            b = random.randint(1, 10)
-            x_val = random.randint(1, 5)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 10)
+            x_val = self.rng.randint(1, 5)
             result = a * x_val + b
 
             latex = f"\\text{{If }} x = {x_val}, \\text{{ find the value of }} {a}x + {b}"
@@ -154,7 +150,7 @@ class VariablesGenerator:
             }
         ]
 
-        scenario = random.choice(scenarios)
+        scenario = self.rng.choice(scenarios)
 
         latex = f"\\text{{{scenario['context']}}}"
         solution = scenario['solution']
@@ -166,7 +162,7 @@ class VariablesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Multi-step scenarios or comparing expressions"""
-        problem_type = random.choice(['two_variables', 'compare', 'interpret'])
+        problem_type = self.rng.choice(['two_variables', 'compare', 'interpret'])
 
         if problem_type == 'two_variables':
             # Expression with two variables
@@ -182,19 +178,19 @@ class VariablesGenerator:
                     "explanation": "Area = length × width = LW"
                 }
             ]
-            scenario = random.choice(scenarios)
+            scenario = self.rng.choice(scenarios)
 
             latex = f"\\text{{{scenario['context']}}}"
             solution = scenario['solution']
             steps = [f"\\text{{{scenario['explanation']}}}"]
 
         elif problem_type == 'compare':
-            a = random.randint(3, 8)
-            b = random.randint(5, 15)
-            c = random.randint(2, 6)
-            d = random.randint(8, 20)
+            a = self.rng.randint(3, 8)
+            b = self.rng.randint(5, 15)
+            c = self.rng.randint(2, 6)
+            d = self.rng.randint(8, 20)
 
-            x_val = random.randint(1, 10)
+            x_val = self.rng.randint(1, 10)
             expr1_val = a * x_val + b
             expr2_val = c * x_val + d
 
@@ -227,7 +223,7 @@ class VariablesGenerator:
                     "meaning": "The height of the plant after w weeks"
                 }
             ]
-            interp = random.choice(interpretations)
+            interp = self.rng.choice(interpretations)
 
             latex = f"\\text{{What does the expression }} {interp['expr']} \\text{{ represent in the context: {interp['context']}?}}"
             solution = interp['meaning']
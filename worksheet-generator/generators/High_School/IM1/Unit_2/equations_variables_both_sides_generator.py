@@ -3,14 +3,11 @@ Equations Variables Both Sides Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class EquationsVariablesBothSidesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class EquationsVariablesBothSidesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(3, 8)
-        b = random.randint(1, 6)
-        c = random.randint(1, 10)
+        a = self.rng.randint(3, 8)
+        b = self.rng.randint(1, 6)
+        c = self.rng.randint(1, 10)
 
         x_val = c
 
@@ -35,10 +32,10 @@ class EquationsVariablesBothSidesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(4, 9)
-        b = random.randint(2, 6)
-        c = random.randint(5, 15)
-        d = random.randint(1, 8)
+        a = self.rng.randint(4, 9)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(5, 15)
+        d = self.rng.randint(1, 8)
 
         latex = f"{a}x + {c} = {b}x + {d}"
         x_val = (d - c) // (a - b) if (d - c) % (a - b) == 0 else (d - c + 1) // (a - b)
@@ -48,10 +45,10 @@ class EquationsVariablesBothSidesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(5, 10)
-        b = random.randint(2, 7)
-        c = random.randint(3, 12)
-        d = random.randint(8, 20)
+        a = self.rng.randint(5, 10)
+        b = self.rng.randint(2, 7)
+        c = self.rng.randint(3, 12)
+        d = self.rng.randint(8, 20)
 
         latex = f"{a}x - {c} = {b}x + {d}"
         x_val = (d + c) // (a - b)
@@ -61,11 +58,11 @@ class EquationsVariablesBothSidesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(3, 7)
-        b = random.randint(2, 5)
-        c = random.randint(1, 6)
-        d = random.randint(2, 5)
-        e = random.randint(1, 8)
+        a = self.rng.randint(3, 7)
+        b = self.rng.randint(2, 5)
+        c = self.rng.randint(1, 6)
+        d = self.rng.randint(2, 5)
+        e = self.rng.randint(1, 8)
 
         # ax + b = cx - dx + e
         # Simplify right: (c-d)x + e
@@ -3,14 +3,11 @@ Inverse Operations Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class InverseOperationsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -28,7 +25,7 @@ class InverseOperationsGenerator:
             ("multiplication", "division"),
             ("division", "multiplication")
         ]
-        op, inverse = random.choice(operations)
+        op, inverse = self.rng.choice(operations)
 
         latex = f"\\text{{What is the inverse of {op}?}}"
         solution = inverse
@@ -37,7 +34,7 @@ class InverseOperationsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(5, 15)
+        a = self.rng.randint(5, 15)
 
         latex = f"\\text{{What operation undoes adding {a}?}}"
         solution = f"Subtract {a}"
@@ -46,8 +43,8 @@ class InverseOperationsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 9)
-        b = random.randint(10, 25)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(10, 25)
 
         latex = f"\\text{{To solve }} {a}x = {b}\\text{{, what operation do you use?}}"
         solution = f"Divide both sides by {a}"
@@ -56,9 +53,9 @@ class InverseOperationsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(5, 15)
-        c = random.randint(20, 40)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(5, 15)
+        c = self.rng.randint(20, 40)
 
         latex = f"\\text{{List the inverse operations needed to solve }} {a}x + {b} = {c}"
         solution = f"1) Subtract {b}, 2) Divide by {a}"
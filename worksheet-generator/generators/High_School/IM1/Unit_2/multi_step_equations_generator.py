@@ -5,9 +5,6 @@ Creates problems about solving equations requiring multiple steps
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class MultiStepEquationsGenerator:
     """Generates multi-step equation problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,9 +33,9 @@ class MultiStepEquationsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Two-step equations: ax + b = c"""
-        a = random.randint(2, 8)
-        x = random.randint(-10, 10)
-        b = random.randint(-15, 15)
+        a = self.rng.randint(2, 8)
+        x = self.rng.randint(-10, 10)
+        b = self.rng.randint(-15, 15)
         c = a * x + b
 
         # Format equation
@@ -60,13 +56,13 @@ class MultiStepEquationsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Equations with parentheses or fractions"""
-        problem_type = random.choice(['parentheses', 'fraction'])
+        problem_type = self.rng.choice(['parentheses', 'fraction'])
 
         if problem_type == 'parentheses':
             # a(x + b) = c
-            a = random.randint(2, 5)
-            x = random.randint(-8, 8)
-            b = random.randint(-10, 10)
+            a = self.rng.randint(2, 5)
+            x = self.rng.randint(-8, 8)
+            b = self.rng.randint(-10, 10)
             c = a * (x + b)
 
             if b >= 0:
@@ -84,9 +80,9 @@ class MultiStepEquationsGenerator:
             ]
         else:
             # x/a + b = c (ensure integer solution)
-            a = random.randint(2, 6)
-            x = random.randint(-5, 5) * a  # Make x divisible by a
-            b = random.randint(-10, 10)
+            a = self.rng.randint(2, 6)
+            x = self.rng.randint(-5, 5) * a  # Make x divisible by a
+            b = self.rng.randint(-10, 10)
             c = x // a + b
 
             if b >= 0:
@@ -106,14 +102,14 @@ class MultiStepEquationsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Variables on both sides or combining like terms"""
-        problem_type = random.choice(['both_sides', 'combine_first'])
+        problem_type = self.rng.choice(['both_sides', 'combine_first'])
 
         if problem_type == 'both_sides':
             # ax + b = cx + d
-            a = random.randint(3, 8)
-            c = random.randint(1, a - 1)  # Ensure a > c
-            x = random.randint(-8, 8)
-            b = random.randint(-15, 15)
+            a = self.rng.randint(3, 8)
+            c = self.rng.randint(1, a - 1)  # Ensure a > c
+            x = self.rng.randint(-8, 8)
+            b = self.rng.randint(-15, 15)
             d = a * x + b - c * x
 
             # Format equation
@@ -132,10 +128,10 @@ class MultiStepEquationsGenerator:
             ]
         else:
             # ax + bx + c = d (combine like terms first)
-            a = random.randint(2, 5)
-            b = random.randint(1, 5)
-            x = random.randint(-8, 8)
-            c = random.randint(-15, 15)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 5)
+            x = self.rng.randint(-8, 8)
+            c = self.rng.randint(-15, 15)
             d = (a + b) * x + c
 
             c_str = f"+ {c}" if c >= 0 else f"- {abs(c)}"
@@ -155,17 +151,17 @@ class MultiStepEquationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Complex multi-step with parentheses on both sides"""
-        problem_type = random.choice(['double_dist', 'nested', 'word_problem'])
+        problem_type = self.rng.choice(['double_dist', 'nested', 'word_problem'])
 
         if problem_type == 'double_dist':
             # a(x + b) + c = d(x + e)
-            a = random.randint(2, 4)
-            d = random.randint(1, 3)
+            a = self.rng.randint(2, 4)
+            d = self.rng.randint(1, 3)
             while a == d:
-                d = random.randint(1, 3)
-            x = random.randint(-5, 5)
-            b = random.randint(-5, 5)
-            c = random.randint(-10, 10)
+                d = self.rng.randint(1, 3)
+            x = self.rng.randint(-5, 5)
+            b = self.rng.randint(-5, 5)
+            c = self.rng.randint(-10, 10)
             # Calculate e from the equation
             # a(x + b) + c = d(x + e)
             # ax + ab + c = dx + de
@@ -173,7 +169,7 @@ class MultiStepEquationsGenerator:
             # e = [(a-d)x + ab + c] / d
             # For integer e, choose values carefully
             left_side = a * (x + b) + c
-            e = random.randint(-5, 5)
+            e = self.rng.randint(-5, 5)
             # Recalculate to make it work
             right_side = d * (x + e)
             c = right_side - a * (x + b)
@@ -196,10 +192,10 @@ class MultiStepEquationsGenerator:
 
         elif problem_type == 'nested':
             # Multiple steps with careful construction
-            a = random.randint(2, 4)
-            b = random.randint(1, 5)
-            x = random.randint(-5, 5)
-            c = random.randint(-8, 8)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(1, 5)
+            x = self.rng.randint(-5, 5)
+            c = self.rng.randint(-8, 8)
             result = a * (b * x + c)
 
             c_str = f"+ {c}" if c >= 0 else f"- {abs(c)}"
@@ -216,9 +212,9 @@ class MultiStepEquationsGenerator:
 
         else:
             # Word problem
-            x = random.randint(5, 15)
-            rate = random.randint(2, 5)
-            start = random.randint(10, 30)
+            x = self.rng.randint(5, 15)
+            rate = self.rng.randint(2, 5)
+            start = self.rng.randint(10, 30)
             total = start + rate * x
 
             latex = f"\\text{{A pool has {start} gallons and fills at {rate} gallons per minute. How many minutes until it has {total} gallons?}}"
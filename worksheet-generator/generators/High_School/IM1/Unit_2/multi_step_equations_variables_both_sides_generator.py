@@ -3,14 +3,11 @@ Multi-Step Equations Variables Both Sides Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class MultiStepEquationsVariablesBothSidesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,10 +19,10 @@ class MultiStepEquationsVariablesBothSidesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(4, 8)
-        b = random.randint(2, 6)
-        c = random.randint(5, 12)
-        d = random.randint(1, 8)
+        a = self.rng.randint(4, 8)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(5, 12)
+        d = self.rng.randint(1, 8)
 
         x_val = (c - d) // (a - b)
 
@@ -36,11 +33,11 @@ class MultiStepEquationsVariablesBothSidesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(2, 6)
-        c = random.randint(1, 5)
-        d = random.randint(3, 8)
-        e = random.randint(10, 25)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(3, 8)
+        e = self.rng.randint(10, 25)
 
         # a(bx + c) = dx + e
         left_x = a * b
@@ -54,12 +51,12 @@ class MultiStepEquationsVariablesBothSidesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 4)
-        b = random.randint(2, 5)
-        c = random.randint(1, 4)
-        d = random.randint(2, 4)
-        e = random.randint(2, 5)
-        f = random.randint(1, 4)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(2, 5)
+        c = self.rng.randint(1, 4)
+        d = self.rng.randint(2, 4)
+        e = self.rng.randint(2, 5)
+        f = self.rng.randint(1, 4)
 
         # a(bx + c) = d(ex - f)
         left_x = a * b
@@ -76,13 +73,13 @@ class MultiStepEquationsVariablesBothSidesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 4)
-        b = random.randint(2, 4)
-        c = random.randint(1, 3)
-        d = random.randint(2, 4)
-        e = random.randint(2, 4)
-        f = random.randint(1, 3)
-        g = random.randint(1, 5)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(2, 4)
+        c = self.rng.randint(1, 3)
+        d = self.rng.randint(2, 4)
+        e = self.rng.randint(2, 4)
+        f = self.rng.randint(1, 3)
+        g = self.rng.randint(1, 5)
 
         # a(bx + c) + g = d(ex - f)
         left_x = a * b
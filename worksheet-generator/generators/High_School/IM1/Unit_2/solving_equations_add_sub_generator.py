@@ -3,14 +3,11 @@ Solving Equations Add/Sub Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SolvingEquationsAddSubGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class SolvingEquationsAddSubGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(1, 12)
-        b = random.randint(1, 15)
+        a = self.rng.randint(1, 12)
+        b = self.rng.randint(1, 15)
         x_val = b - a
 
         latex = f"x + {a} = {b}"
@@ -33,8 +30,8 @@ class SolvingEquationsAddSubGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(5, 15)
-        b = random.randint(1, 10)
+        a = self.rng.randint(5, 15)
+        b = self.rng.randint(1, 10)
         x_val = a + b
 
         latex = f"x - {b} = {a}"
@@ -44,8 +41,8 @@ class SolvingEquationsAddSubGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(8, 20)
-        b = random.randint(3, 12)
+        a = self.rng.randint(8, 20)
+        b = self.rng.randint(3, 12)
         x_val = a - b
 
         latex = f"{a} = x + {b}"
@@ -55,9 +52,9 @@ class SolvingEquationsAddSubGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(5, 15)
-        b = random.randint(3, 10)
-        c = random.randint(1, 8)
+        a = self.rng.randint(5, 15)
+        b = self.rng.randint(3, 10)
+        c = self.rng.randint(1, 8)
         x_val = a + b - c
 
         latex = f"x + {c} - {b} = {a}"
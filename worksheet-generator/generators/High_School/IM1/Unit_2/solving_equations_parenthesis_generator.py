@@ -3,14 +3,11 @@ Solving Equations Parenthesis Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SolvingEquationsParenthesisGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class SolvingEquationsParenthesisGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(1, 8)
-        c = random.randint(10, 25)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 8)
+        c = self.rng.randint(10, 25)
         x_val = (c - a * b) // a
 
         latex = f"{a}(x + {b}) = {c}"
@@ -34,9 +31,9 @@ class SolvingEquationsParenthesisGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(2, 7)
-        c = random.randint(1, 6)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 7)
+        c = self.rng.randint(1, 6)
         result = a * b - a * c
 
         latex = f"{a}({b}x - {c}) = {result}"
@@ -46,10 +43,10 @@ class SolvingEquationsParenthesisGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(2, 6)
-        c = random.randint(1, 5)
-        d = random.randint(8, 20)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(8, 20)
 
         x_val = (d - c) // (a * b)
 
@@ -60,11 +57,11 @@ class SolvingEquationsParenthesisGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 4)
-        b = random.randint(2, 5)
-        c = random.randint(1, 4)
-        d = random.randint(1, 6)
-        e = random.randint(10, 25)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(2, 5)
+        c = self.rng.randint(1, 4)
+        d = self.rng.randint(1, 6)
+        e = self.rng.randint(10, 25)
 
         # a(bx + c) + dx = e
         x_coef = a * b + d
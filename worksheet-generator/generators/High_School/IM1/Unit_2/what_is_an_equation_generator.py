@@ -3,14 +3,11 @@ What is an Equation Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class WhatIsAnEquationGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class WhatIsAnEquationGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(1, 10)
-        b = random.randint(1, 15)
+        a = self.rng.randint(1, 10)
+        b = self.rng.randint(1, 15)
 
         latex = f"\\text{{Is }} x + {a} = {b} \\text{{ an equation?}}"
         solution = "Yes"
@@ -32,9 +29,9 @@ class WhatIsAnEquationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(1, 12)
-        x_val = random.randint(1, 5)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(1, 12)
+        x_val = self.rng.randint(1, 5)
         c = a * x_val + b
 
         latex = f"\\text{{Is }} x = {x_val} \\text{{ a solution to }} {a}x + {b} = {c}?"
@@ -44,10 +41,10 @@ class WhatIsAnEquationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 7)
-        b = random.randint(1, 10)
-        x_val = random.randint(2, 6)
-        wrong_val = x_val + random.randint(1, 3)
+        a = self.rng.randint(2, 7)
+        b = self.rng.randint(1, 10)
+        x_val = self.rng.randint(2, 6)
+        wrong_val = x_val + self.rng.randint(1, 3)
         c = a * x_val + b
 
         latex = f"\\text{{Is }} x = {wrong_val} \\text{{ a solution to }} {a}x + {b} = {c}?"
@@ -57,9 +54,9 @@ class WhatIsAnEquationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(1, 8)
-        c = random.randint(1, 10)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 8)
+        c = self.rng.randint(1, 10)
 
         latex = f"\\text{{Write an equation where }} x = {c} \\text{{ is the solution}}"
         solution = f"Example: x + {b} = {c + b} or {a}x = {a*c}"
@@ -5,9 +5,6 @@ Creates problems about solving absolute value equations
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class AbsoluteValueEquationsGenerator:
     """Generates absolute value equation problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,7 +33,7 @@ class AbsoluteValueEquationsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Solve |x| = a"""
-        a = random.randint(2, 10)
+        a = self.rng.randint(2, 10)
 
         latex = f"\\text{{Solve: }} |x| = {a}"
         solution = f"x = {a} \\text{{ or }} x = -{a}"
@@ -53,10 +49,10 @@ class AbsoluteValueEquationsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Solve |x + a| = b"""
-        a = random.randint(-8, 8)
+        a = self.rng.randint(-8, 8)
         while a == 0:
-            a = random.randint(-8, 8)
-        b = random.randint(2, 10)
+            a = self.rng.randint(-8, 8)
+        b = self.rng.randint(2, 10)
 
         x1 = b - a
         x2 = -b - a
@@ -81,23 +77,23 @@ class AbsoluteValueEquationsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Solve |ax + b| = c or equations with no solution"""
-        problem_type = random.choice(['standard', 'no_solution'])
+        problem_type = self.rng.choice(['standard', 'no_solution'])
 
         if problem_type == 'standard':
-            a = random.randint(2, 5)
-            b = random.randint(-10, 10)
-            c = random.randint(2, 12)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(-10, 10)
+            c = self.rng.randint(2, 12)
 
             # ax + b = c or ax + b = -c
             x1 = (c - b) / a
             x2 = (-c - b) / a
 
             # Make sure we get integer solutions
-            b = random.randint(-10, 10)
-            x1_int = random.randint(-5, 5)
-            x2_int = random.randint(-5, 5)
+            b = self.rng.randint(-10, 10)
+            x1_int = self.rng.randint(-5, 5)
+            x2_int = self.rng.randint(-5, 5)
             while x1_int == x2_int:
-                x2_int = random.randint(-5, 5)
+                x2_int = self.rng.randint(-5, 5)
 
             # Solve backwards to get c
             val1 = a * x1_int + b
@@ -110,14 +106,14 @@ class AbsoluteValueEquationsGenerator:
             else:
                 # Use simpler case
                 a = 2
-                b = random.randint(-5, 5)
-                c = random.randint(2, 8)
+                b = self.rng.randint(-5, 5)
+                c = self.rng.randint(2, 8)
                 x1 = (c - b) / a
                 x2 = (-c - b) / a
                 # Round if needed
                 if x1 != int(x1):
-                    b = 2 * random.randint(-3, 3)
-                    c = 2 * random.randint(1, 5)
+                    b = 2 * self.rng.randint(-3, 3)
+                    c = 2 * self.rng.randint(1, 5)
                     x1 = (c - b) // 2
                     x2 = (-c - b) // 2
 
@@ -133,8 +129,8 @@ class AbsoluteValueEquationsGenerator:
             ]
         else:
             # |x + a| = -b (no solution)
-            a = random.randint(1, 8)
-            b = random.randint(2, 8)
+            a = self.rng.randint(1, 8)
+            b = self.rng.randint(2, 8)
 
             latex = f"\\text{{Solve: }} |x + {a}| = -{b}"
             solution = "\\text{No solution}"
@@ -149,16 +145,16 @@ class AbsoluteValueEquationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Equations requiring isolation or with one extraneous solution"""
-        problem_type = random.choice(['isolate', 'word_problem'])
+        problem_type = self.rng.choice(['isolate', 'word_problem'])
 
         if problem_type == 'isolate':
             # a|x + b| + c = d
-            a = random.randint(2, 4)
-            b = random.randint(-5, 5)
-            c = random.randint(-10, 10)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(-5, 5)
+            c = self.rng.randint(-10, 10)
 
             # Choose d so |x + b| gives a positive value
-            abs_val = random.randint(2, 8)
+            abs_val = self.rng.randint(2, 8)
             d = a * abs_val + c
 
             x1 = abs_val - b
@@ -179,8 +175,8 @@ class AbsoluteValueEquationsGenerator:
             ]
         else:
             # Word problem
-            target = random.randint(70, 100)
-            tolerance = random.randint(3, 8)
+            target = self.rng.randint(70, 100)
+            tolerance = self.rng.randint(3, 8)
 
             low = target - tolerance
             high = target + tolerance
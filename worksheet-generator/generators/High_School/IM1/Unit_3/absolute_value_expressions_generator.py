@@ -3,14 +3,11 @@ Absolute Value Expressions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class AbsoluteValueExpressionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class AbsoluteValueExpressionsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(1, 10)
-        x_val = random.randint(1, 5)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(1, 10)
+        x_val = self.rng.randint(1, 5)
         result = abs(a * x_val + b)
 
         latex = f"\\text{{Evaluate }} |{a}x + {b}| \\text{{ when }} x = {x_val}"
@@ -34,9 +31,9 @@ class AbsoluteValueExpressionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(5, 15)
-        x_val = random.randint(1, 4)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(5, 15)
+        x_val = self.rng.randint(1, 4)
         inner = a * x_val - b
         result = abs(inner)
 
@@ -47,10 +44,10 @@ class AbsoluteValueExpressionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(1, 8)
-        c = random.randint(1, 5)
-        x_val = random.randint(-3, -1)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 8)
+        c = self.rng.randint(1, 5)
+        x_val = self.rng.randint(-3, -1)
         inner = a * x_val + b
         result = abs(inner) - c
 
@@ -61,11 +58,11 @@ class AbsoluteValueExpressionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(1, 6)
-        c = random.randint(2, 7)
-        d = random.randint(1, 5)
-        x_val = random.randint(-2, 2)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 6)
+        c = self.rng.randint(2, 7)
+        d = self.rng.randint(1, 5)
+        x_val = self.rng.randint(-2, 2)
 
         inner1 = a * x_val - b
         inner2 = c * x_val + d
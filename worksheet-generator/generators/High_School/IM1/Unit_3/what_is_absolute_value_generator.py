@@ -3,14 +3,11 @@ What is Absolute Value Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class WhatIsAbsoluteValueGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class WhatIsAbsoluteValueGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(1, 20)
+        a = self.rng.randint(1, 20)
 
         latex = f"|{a}| = ?"
         solution = f"{a}"
@@ -31,7 +28,7 @@ class WhatIsAbsoluteValueGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(1, 20)
+        a = self.rng.randint(1, 20)
 
         latex = f"|-{a}| = ?"
         solution = f"{a}"
@@ -40,8 +37,8 @@ class WhatIsAbsoluteValueGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(3, 12)
-        b = random.randint(1, 8)
+        a = self.rng.randint(3, 12)
+        b = self.rng.randint(1, 8)
         result = abs(a - b)
 
         latex = f"|{a} - {b}| = ?"
@@ -51,9 +48,9 @@ class WhatIsAbsoluteValueGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(5, 15)
-        c = random.randint(1, 6)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(5, 15)
+        c = self.rng.randint(1, 6)
         inner = a - b
         result = abs(inner) + c
 
@@ -3,14 +3,11 @@ Absolute Value Inequalities Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class AbsoluteValueInequalitiesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class AbsoluteValueInequalitiesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(3, 10)
+        a = self.rng.randint(3, 10)
 
         latex = f"|x| < {a}"
         solution = f"-{a} < x < {a}"
@@ -31,7 +28,7 @@ class AbsoluteValueInequalitiesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(5, 15)
+        a = self.rng.randint(5, 15)
 
         latex = f"|x| > {a}"
         solution = f"x < -{a} \\text{{ or }} x > {a}"
@@ -40,9 +37,9 @@ class AbsoluteValueInequalitiesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(1, 8)
-        c = random.randint(5, 15)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 8)
+        c = self.rng.randint(5, 15)
 
         latex = f"|{a}x + {b}| \\leq {c}"
         left = (-c - b) / a
@@ -53,9 +50,9 @@ class AbsoluteValueInequalitiesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(1, 7)
-        c = random.randint(8, 20)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 7)
+        c = self.rng.randint(8, 20)
 
         latex = f"|{a}x - {b}| > {c}"
         left = (b - c) / a
@@ -5,9 +5,6 @@ Creates problems about AND/OR compound inequalities
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class CompoundInequalitiesGenerator:
     """Generates compound inequality problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,10 +33,10 @@ class CompoundInequalitiesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Graph or identify simple compound inequalities"""
-        a = random.randint(-5, 3)
-        b = random.randint(a + 2, 8)
+        a = self.rng.randint(-5, 3)
+        b = self.rng.randint(a + 2, 8)
 
-        compound_type = random.choice(['and', 'or'])
+        compound_type = self.rng.choice(['and', 'or'])
 
         if compound_type == 'and':
             latex = f"\\text{{Write the compound inequality: }} x \\text{{ is greater than }} {a} \\text{{ AND less than }} {b}"
@@ -61,13 +57,13 @@ class CompoundInequalitiesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Solve simple compound inequalities"""
-        compound_type = random.choice(['and', 'or'])
+        compound_type = self.rng.choice(['and', 'or'])
 
         if compound_type == 'and':
             # a < x + c < b
-            c = random.randint(-5, 5)
-            low = random.randint(-8, 0)
-            high = random.randint(low + 3, 8)
+            c = self.rng.randint(-5, 5)
+            low = self.rng.randint(-8, 0)
+            high = self.rng.randint(low + 3, 8)
 
             result_low = low - c
             result_high = high - c
@@ -86,9 +82,9 @@ class CompoundInequalitiesGenerator:
             ]
         else:
             # x + a < b OR x + a > c
-            a = random.randint(1, 5)
-            b = random.randint(-5, 0)
-            c = random.randint(5, 10)
+            a = self.rng.randint(1, 5)
+            b = self.rng.randint(-5, 0)
+            c = self.rng.randint(5, 10)
 
             sol_b = b - a
             sol_c = c - a
@@ -107,16 +103,16 @@ class CompoundInequalitiesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Multi-step compound inequalities"""
-        compound_type = random.choice(['and', 'or'])
+        compound_type = self.rng.choice(['and', 'or'])
 
         if compound_type == 'and':
             # a < bx + c < d
-            b = random.randint(2, 4)
-            c = random.randint(-8, 8)
+            b = self.rng.randint(2, 4)
+            c = self.rng.randint(-8, 8)
 
             # Choose result bounds first for clean answers
-            result_low = random.randint(-5, 0)
-            result_high = random.randint(result_low + 2, 5)
+            result_low = self.rng.randint(-5, 0)
+            result_high = self.rng.randint(result_low + 2, 5)
 
             # Calculate original bounds
             low = b * result_low + c
@@ -137,11 +133,11 @@ class CompoundInequalitiesGenerator:
             ]
         else:
             # ax + b <= c OR ax + b >= d
-            a = random.randint(2, 4)
-            b = random.randint(-5, 5)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(-5, 5)
 
-            result_c = random.randint(-5, 0)
-            result_d = random.randint(3, 8)
+            result_c = self.rng.randint(-5, 0)
+            result_d = self.rng.randint(3, 8)
 
             c = a * result_c + b
             d = a * result_d + b
@@ -161,12 +157,12 @@ class CompoundInequalitiesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Special cases or word problems"""
-        problem_type = random.choice(['no_solution', 'all_reals', 'word_problem'])
+        problem_type = self.rng.choice(['no_solution', 'all_reals', 'word_problem'])
 
         if problem_type == 'no_solution':
             # AND inequality with no overlap
-            a = random.randint(5, 10)
-            b = random.randint(-5, 0)
+            a = self.rng.randint(5, 10)
+            b = self.rng.randint(-5, 0)
 
             latex = f"\\text{{Solve: }} x > {a} \\text{{ AND }} x < {b}"
             solution = "\\text{No solution}"
@@ -179,10 +175,10 @@ class CompoundInequalitiesGenerator:
 
         elif problem_type == 'all_reals':
             # OR inequality that covers everything
-            a = random.randint(-3, 3)
-            b = random.randint(-3, 3)
+            a = self.rng.randint(-3, 3)
+            b = self.rng.randint(-3, 3)
             while b < a:
-                b = random.randint(-3, 3)
+                b = self.rng.randint(-3, 3)
 
             latex = f"\\text{{Solve: }} x \\leq {b} \\text{{ OR }} x \\geq {a}"
             solution = "\\text{All real numbers}"
@@ -195,8 +191,8 @@ class CompoundInequalitiesGenerator:
 
         else:
             # Word problem
-            low = random.randint(60, 70)
-            high = random.randint(85, 95)
+            low = self.rng.randint(60, 70)
+            high = self.rng.randint(85, 95)
 
             latex = f"\\text{{A healthy body temperature is between }} {low}°F \\text{{ and }} {high}°F. \\text{{ Write this as a compound inequality using }} T."
             solution = f"{low} \\leq T \\leq {high}"
@@ -3,14 +3,11 @@ Inequalities Intro Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class InequalitiesIntroGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class InequalitiesIntroGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(1, 15)
-        b = random.randint(a + 1, 25)
+        a = self.rng.randint(1, 15)
+        b = self.rng.randint(a + 1, 25)
 
         latex = f"\\text{{Is }} {a} < {b} \\text{{ true or false?}}"
         solution = "True"
@@ -32,17 +29,17 @@ class InequalitiesIntroGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(5, 20)
+        a = self.rng.randint(5, 20)
         ops = ['<', '>', '\\leq', '\\geq']
-        op = random.choice(ops)
+        op = self.rng.choice(ops)
 
         if op == '<':
-            b = a - random.randint(1, 5)
+            b = a - self.rng.randint(1, 5)
             latex = f"\\text{{Is }} {a} < {b} \\text{{ true or false?}}"
             solution = "False"
             steps = [f"{a} is not less than {b}", "Answer: False"]
         elif op == '>':
-            b = a - random.randint(1, 5)
+            b = a - self.rng.randint(1, 5)
             latex = f"\\text{{Is }} {a} > {b} \\text{{ true or false?}}"
             solution = "True"
             steps = [f"{a} is greater than {b}", "Answer: True"]
@@ -60,11 +57,11 @@ class InequalitiesIntroGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(3, 10)
-        b = random.randint(1, 8)
-        c = random.randint(5, 15)
+        a = self.rng.randint(3, 10)
+        b = self.rng.randint(1, 8)
+        c = self.rng.randint(5, 15)
 
-        test_val = random.randint(1, 5)
+        test_val = self.rng.randint(1, 5)
         result = a * test_val + b
 
         if result < c:
@@ -80,8 +77,8 @@ class InequalitiesIntroGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(10, 25)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(10, 25)
 
         latex = f"\\text{{Graph }} x < {a} \\text{{ on a number line}}"
         solution = f"Open circle at {a}, shade left"
@@ -3,14 +3,11 @@ Multi-Step Inequalities Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class MultiStepInequalitiesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class MultiStepInequalitiesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 7)
-        b = random.randint(1, 10)
-        c = random.randint(15, 30)
+        a = self.rng.randint(2, 7)
+        b = self.rng.randint(1, 10)
+        c = self.rng.randint(15, 30)
 
         latex = f"{a}x + {b} < {c}"
         solution = f"x < {(c - b) // a}"
@@ -33,9 +30,9 @@ class MultiStepInequalitiesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(3, 8)
-        b = random.randint(2, 10)
-        c = random.randint(1, 15)
+        a = self.rng.randint(3, 8)
+        b = self.rng.randint(2, 10)
+        c = self.rng.randint(1, 15)
 
         latex = f"{a}x - {b} \\geq {c}"
         solution = f"x \\geq {(c + b) // a}"
@@ -44,9 +41,9 @@ class MultiStepInequalitiesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(3, 7)
-        b = random.randint(2, 8)
-        c = random.randint(1, 10)
+        a = self.rng.randint(3, 7)
+        b = self.rng.randint(2, 8)
+        c = self.rng.randint(1, 10)
 
         latex = f"-{a}x + {b} > {c}"
         solution = f"x < {(b - c) // a}"
@@ -55,11 +52,11 @@ class MultiStepInequalitiesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(2, 6)
-        c = random.randint(1, 5)
-        d = random.randint(1, 4)
-        e = random.randint(10, 25)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 4)
+        e = self.rng.randint(10, 25)
 
         # a(bx + c) - dx <= e
         left_x = a * b - d
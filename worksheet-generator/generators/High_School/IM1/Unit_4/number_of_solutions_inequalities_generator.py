@@ -3,14 +3,11 @@ Number of Solutions Inequalities Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class NumberOfSolutionsInequalitiesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class NumberOfSolutionsInequalitiesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(1, 10)
+        a = self.rng.randint(1, 10)
 
         latex = f"\\text{{How many solutions does }} x > {a} \\text{{ have?}}"
         solution = "Infinitely many"
@@ -31,9 +28,9 @@ class NumberOfSolutionsInequalitiesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(1, 12)
-        c = random.randint(10, 25)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(1, 12)
+        c = self.rng.randint(10, 25)
 
         latex = f"\\text{{How many solutions does }} {a}x + {b} \\leq {c} \\text{{ have?}}"
         solution = "Infinitely many"
@@ -42,8 +39,8 @@ class NumberOfSolutionsInequalitiesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(5, 15)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(5, 15)
 
         latex = f"\\text{{Name three solutions to }} x < {b}"
         examples = [b - 1, b - 2, b - 3]
@@ -53,7 +50,7 @@ class NumberOfSolutionsInequalitiesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 7)
+        a = self.rng.randint(2, 7)
 
         latex = f"\\text{{Compare: How many solutions does }} x = {a} \\text{{ vs }} x > {a} \\text{{ have?}}"
         solution = f"x = {a} has 1 solution; x > {a} has infinitely many"
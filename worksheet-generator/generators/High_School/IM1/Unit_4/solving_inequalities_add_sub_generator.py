@@ -3,14 +3,11 @@ Solving Inequalities Add/Sub Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SolvingInequalitiesAddSubGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class SolvingInequalitiesAddSubGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(1, 12)
-        b = random.randint(5, 20)
+        a = self.rng.randint(1, 12)
+        b = self.rng.randint(5, 20)
 
         latex = f"x + {a} < {b}"
         solution = f"x < {b - a}"
@@ -32,8 +29,8 @@ class SolvingInequalitiesAddSubGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(5, 15)
-        b = random.randint(1, 10)
+        a = self.rng.randint(5, 15)
+        b = self.rng.randint(1, 10)
 
         latex = f"x - {b} > {a}"
         solution = f"x > {a + b}"
@@ -42,9 +39,9 @@ class SolvingInequalitiesAddSubGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(8, 20)
-        b = random.randint(3, 12)
-        op = random.choice(['\\leq', '\\geq'])
+        a = self.rng.randint(8, 20)
+        b = self.rng.randint(3, 12)
+        op = self.rng.choice(['\\leq', '\\geq'])
 
         if op == '\\leq':
             latex = f"{a} \\geq x + {b}"
@@ -58,9 +55,9 @@ class SolvingInequalitiesAddSubGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(10, 25)
-        b = random.randint(3, 10)
-        c = random.randint(1, 8)
+        a = self.rng.randint(10, 25)
+        b = self.rng.randint(3, 10)
+        c = self.rng.randint(1, 8)
 
         latex = f"x + {b} - {c} \\leq {a}"
         combined = b - c
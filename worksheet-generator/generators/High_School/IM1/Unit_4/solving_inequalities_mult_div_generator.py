@@ -3,14 +3,11 @@ Solving Inequalities Mult/Div Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SolvingInequalitiesMultDivGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class SolvingInequalitiesMultDivGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(2, 12)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(2, 12)
         c = a * b
 
         latex = f"{a}x < {c}"
@@ -33,8 +30,8 @@ class SolvingInequalitiesMultDivGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(3, 15)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(3, 15)
 
         latex = f"\\frac{{x}}{{{a}}} \\geq {b}"
         solution = f"x \\geq {a * b}"
@@ -43,8 +40,8 @@ class SolvingInequalitiesMultDivGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(2, 10)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(2, 10)
         c = a * b
 
         latex = f"-{a}x > {c}"
@@ -54,8 +51,8 @@ class SolvingInequalitiesMultDivGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(2, 8)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 8)
 
         latex = f"\\frac{{x}}{{-{a}}} \\leq {b}"
         solution = f"x \\geq -{a * b}"
@@ -3,14 +3,11 @@ Dimensional Analysis Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class DimensionalAnalysisGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class DimensionalAnalysisGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        feet = random.randint(12, 96)
+        feet = self.rng.randint(12, 96)
         inches = feet * 12
 
         latex = f"\\text{{Convert {feet} feet to inches (12 inches = 1 foot)}}"
@@ -32,7 +29,7 @@ class DimensionalAnalysisGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        hours = random.randint(2, 6)
+        hours = self.rng.randint(2, 6)
         minutes = hours * 60
 
         latex = f"\\text{{Convert {hours} hours to minutes (60 minutes = 1 hour)}}"
@@ -42,7 +39,7 @@ class DimensionalAnalysisGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        days = random.randint(2, 5)
+        days = self.rng.randint(2, 5)
         hours = days * 24
         minutes = hours * 60
 
@@ -53,7 +50,7 @@ class DimensionalAnalysisGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        miles = random.randint(2, 5)
+        miles = self.rng.randint(2, 5)
         feet = miles * 5280
 
         latex = f"\\text{{Convert {miles} miles to feet (1 mile = 5,280 feet)}}"
@@ -3,14 +3,11 @@ Rates Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class RatesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class RatesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        distance = random.randint(60, 200)
-        time = random.randint(2, 8)
+        distance = self.rng.randint(60, 200)
+        time = self.rng.randint(2, 8)
         rate = distance // time
 
         latex = f"\\text{{A car travels {distance} miles in {time} hours. What is the rate in mph?}}"
@@ -33,8 +30,8 @@ class RatesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        items = random.randint(80, 200)
-        time = random.randint(4, 10)
+        items = self.rng.randint(80, 200)
+        time = self.rng.randint(4, 10)
         rate = items // time
 
         latex = f"\\text{{A factory produces {items} items in {time} hours. What is the rate per hour?}}"
@@ -44,8 +41,8 @@ class RatesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        cost = random.randint(15, 40)
-        items = random.randint(3, 8)
+        cost = self.rng.randint(15, 40)
+        items = self.rng.randint(3, 8)
         rate = cost / items
 
         latex = f"\\text{{If {items} notebooks cost \\${cost}, what is the unit price per notebook?}}"
@@ -55,8 +52,8 @@ class RatesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        rate = random.randint(50, 80)
-        time = random.randint(3, 7)
+        rate = self.rng.randint(50, 80)
+        time = self.rng.randint(3, 7)
         distance = rate * time
 
         latex = f"\\text{{If a train travels at {rate} mph for {time} hours, how far does it go?}}"
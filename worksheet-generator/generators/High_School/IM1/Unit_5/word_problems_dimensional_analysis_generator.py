@@ -3,14 +3,11 @@ Word Problems Dimensional Analysis Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class WordProblemsDimensionalAnalysisGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class WordProblemsDimensionalAnalysisGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        price_per_lb = random.randint(2, 8)
-        pounds = random.randint(3, 10)
+        price_per_lb = self.rng.randint(2, 8)
+        pounds = self.rng.randint(3, 10)
         total = price_per_lb * pounds
 
         latex = f"\\text{{Apples cost \\${price_per_lb} per pound. How much do {pounds} pounds cost?}}"
@@ -33,8 +30,8 @@ class WordProblemsDimensionalAnalysisGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        mph = random.randint(50, 70)
-        hours = random.randint(3, 6)
+        mph = self.rng.randint(50, 70)
+        hours = self.rng.randint(3, 6)
         miles = mph * hours
 
         latex = f"\\text{{A car travels at {mph} mph for {hours} hours. How many miles does it travel?}}"
@@ -44,9 +41,9 @@ class WordProblemsDimensionalAnalysisGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        rate = random.randint(12, 25)
-        hours = random.randint(6, 10)
-        days = random.randint(3, 7)
+        rate = self.rng.randint(12, 25)
+        hours = self.rng.randint(6, 10)
+        days = self.rng.randint(3, 7)
         total = rate * hours * days
 
         latex = f"\\text{{A worker earns \\${rate}/hour, works {hours} hours/day for {days} days. Total earnings?}}"
@@ -56,8 +53,8 @@ class WordProblemsDimensionalAnalysisGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        liters_per_min = random.randint(2, 6)
-        hours = random.randint(2, 5)
+        liters_per_min = self.rng.randint(2, 6)
+        hours = self.rng.randint(2, 5)
         total_liters = liters_per_min * 60 * hours
 
         latex = f"\\text{{A pump fills {liters_per_min} liters/minute. How many liters in {hours} hours?}}"
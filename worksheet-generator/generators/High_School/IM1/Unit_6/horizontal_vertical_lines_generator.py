@@ -3,14 +3,11 @@ Horizontal Vertical Lines Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class HorizontalVerticalLinesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class HorizontalVerticalLinesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        k = random.randint(-8, 8)
+        k = self.rng.randint(-8, 8)
 
         latex = f"\\text{{What is the equation of a horizontal line through }} y = {k}?"
         solution = f"y = {k}"
@@ -31,7 +28,7 @@ class HorizontalVerticalLinesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        k = random.randint(-8, 8)
+        k = self.rng.randint(-8, 8)
 
         latex = f"\\text{{What is the equation of a vertical line through }} x = {k}?"
         solution = f"x = {k}"
@@ -40,10 +37,10 @@ class HorizontalVerticalLinesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x_val = random.randint(-6, 6)
-        y_val = random.randint(-6, 6)
+        x_val = self.rng.randint(-6, 6)
+        y_val = self.rng.randint(-6, 6)
 
-        line_type = random.choice(['horizontal', 'vertical'])
+        line_type = self.rng.choice(['horizontal', 'vertical'])
         if line_type == 'horizontal':
             latex = f"\\text{{Write the equation of the horizontal line through }} ({x_val}, {y_val})"
             solution = f"y = {y_val}"
@@ -56,7 +53,7 @@ class HorizontalVerticalLinesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        k = random.randint(-5, 5)
+        k = self.rng.randint(-5, 5)
 
         latex = f"\\text{{What is the slope of the line }} y = {k}?"
         solution = "0"
@@ -3,14 +3,11 @@ Intercepts Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class InterceptsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class InterceptsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        m = random.randint(2, 7)
-        b = random.randint(-10, 10)
+        m = self.rng.randint(2, 7)
+        b = self.rng.randint(-10, 10)
 
         latex = f"\\text{{Find the y-intercept of }} y = {m}x + {b}"
         solution = f"{b}"
@@ -32,8 +29,8 @@ class InterceptsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        m = random.randint(2, 6)
-        b = random.randint(1, 15)
+        m = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 15)
         x_int = -b / m
 
         latex = f"\\text{{Find the x-intercept of }} y = {m}x + {b}"
@@ -43,8 +40,8 @@ class InterceptsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        m = random.randint(2, 5)
-        b = random.randint(-8, 8)
+        m = self.rng.randint(2, 5)
+        b = self.rng.randint(-8, 8)
         x_int = -b / m
 
         latex = f"\\text{{Find both intercepts of }} y = {m}x + {b}"
@@ -54,9 +51,9 @@ class InterceptsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(2, 10)
-        c = random.randint(10, 30)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(2, 10)
+        c = self.rng.randint(10, 30)
 
         latex = f"\\text{{Find both intercepts of }} {a}x + {b}y = {c}"
         x_int = c / a
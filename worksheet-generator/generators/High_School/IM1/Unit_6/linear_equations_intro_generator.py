@@ -3,14 +3,11 @@ Linear Equations Intro Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class LinearEquationsIntroGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class LinearEquationsIntroGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(1, 12)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(1, 12)
 
         latex = f"\\text{{Is }} y = {a}x + {b} \\text{{ a linear equation?}}"
         solution = "Yes"
@@ -32,8 +29,8 @@ class LinearEquationsIntroGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 7)
-        b = random.randint(1, 10)
+        a = self.rng.randint(2, 7)
+        b = self.rng.randint(1, 10)
 
         latex = f"\\text{{Is }} y = {a}x^2 + {b} \\text{{ a linear equation?}}"
         solution = "No"
@@ -42,8 +39,8 @@ class LinearEquationsIntroGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        m = random.randint(2, 8)
-        b = random.randint(-10, 10)
+        m = self.rng.randint(2, 8)
+        b = self.rng.randint(-10, 10)
 
         latex = f"\\text{{Identify the slope and y-intercept of }} y = {m}x + {b}"
         solution = f"slope = {m}, y-intercept = {b}"
@@ -52,9 +49,9 @@ class LinearEquationsIntroGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        m = random.randint(2, 6)
-        b = random.randint(-8, 8)
-        x_val = random.randint(1, 5)
+        m = self.rng.randint(2, 6)
+        b = self.rng.randint(-8, 8)
+        x_val = self.rng.randint(1, 5)
         y_val = m * x_val + b
 
         latex = f"\\text{{For }} y = {m}x + {b}\\text{{, find y when }} x = {x_val}"
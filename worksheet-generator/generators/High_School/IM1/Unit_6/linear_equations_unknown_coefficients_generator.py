@@ -3,14 +3,11 @@ Linear Equations Unknown Coefficients Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class LinearEquationsUnknownCoefficientsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class LinearEquationsUnknownCoefficientsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        m = random.randint(2, 8)
-        x_val = random.randint(1, 5)
-        y_val = random.randint(10, 30)
+        m = self.rng.randint(2, 8)
+        x_val = self.rng.randint(1, 5)
+        y_val = self.rng.randint(10, 30)
         b = y_val - m * x_val
 
         latex = f"\\text{{If }} y = {m}x + b \\text{{ passes through }} ({x_val}, {y_val})\\text{{, find }} b"
@@ -34,9 +31,9 @@ class LinearEquationsUnknownCoefficientsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        m = random.randint(2, 7)
-        x_val = random.randint(2, 6)
-        b = random.randint(-10, 10)
+        m = self.rng.randint(2, 7)
+        x_val = self.rng.randint(2, 6)
+        b = self.rng.randint(-10, 10)
         y_val = m * x_val + b
 
         latex = f"\\text{{If }} y = mx + {b} \\text{{ passes through }} ({x_val}, {y_val})\\text{{, find }} m"
@@ -46,9 +43,9 @@ class LinearEquationsUnknownCoefficientsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x1, y1 = random.randint(1, 5), random.randint(5, 15)
-        x2 = x1 + random.randint(1, 4)
-        m = random.randint(2, 6)
+        x1, y1 = self.rng.randint(1, 5), self.rng.randint(5, 15)
+        x2 = x1 + self.rng.randint(1, 4)
+        m = self.rng.randint(2, 6)
         y2 = y1 + m * (x2 - x1)
 
         latex = f"\\text{{Find the slope of the line through }} ({x1}, {y1}) \\text{{ and }} ({x2}, {y2})"
@@ -58,8 +55,8 @@ class LinearEquationsUnknownCoefficientsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        x1, y1 = random.randint(0, 4), random.randint(2, 10)
-        m = random.randint(2, 5)
+        x1, y1 = self.rng.randint(0, 4), self.rng.randint(2, 10)
+        m = self.rng.randint(2, 5)
         b = y1 - m * x1
 
         latex = f"\\text{{Write the equation of the line with slope }} {m} \\text{{ through }} ({x1}, {y1})"
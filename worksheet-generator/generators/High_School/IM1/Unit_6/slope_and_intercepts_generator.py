@@ -3,14 +3,11 @@ Slope and Intercepts Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SlopeAndInterceptsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class SlopeAndInterceptsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        m = random.randint(2, 8)
-        b = random.randint(-10, 10)
+        m = self.rng.randint(2, 8)
+        b = self.rng.randint(-10, 10)
 
         latex = f"\\text{{Find slope and y-intercept of }} y = {m}x + {b}"
         solution = f"slope = {m}, y-intercept = {b}"
@@ -32,8 +29,8 @@ class SlopeAndInterceptsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        m = random.randint(2, 6)
-        b = random.randint(-8, 8)
+        m = self.rng.randint(2, 6)
+        b = self.rng.randint(-8, 8)
 
         latex = f"\\text{{Write the equation with slope {m} and y-intercept {b}}}"
         solution = f"y = {m}x + {b}"
@@ -42,8 +39,8 @@ class SlopeAndInterceptsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        m = random.randint(2, 5)
-        b = random.randint(-6, 6)
+        m = self.rng.randint(2, 5)
+        b = self.rng.randint(-6, 6)
         x_int = -b / m
 
         latex = f"\\text{{For }} y = {m}x + {b}\\text{{, find slope, y-intercept, and x-intercept}}"
@@ -53,9 +50,9 @@ class SlopeAndInterceptsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(2, 8)
-        c = random.randint(10, 25)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 8)
+        c = self.rng.randint(10, 25)
 
         m = -a / b
         y_int = c / b
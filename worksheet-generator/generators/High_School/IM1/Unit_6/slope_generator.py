@@ -5,9 +5,6 @@ Creates problems about calculating and understanding slope
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class SlopeGenerator:
     """Generates problems about slope."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,12 +33,12 @@ class SlopeGenerator:
 
     def _generate_easy(self) -> Equation:
         """Calculate slope from two points with small integers"""
-        x1 = random.randint(0, 5)
-        y1 = random.randint(0, 5)
+        x1 = self.rng.randint(0, 5)
+        y1 = self.rng.randint(0, 5)
 
         # Ensure non-zero denominator and integer slope
-        dx = random.randint(1, 4)
-        slope = random.randint(-3, 3)
+        dx = self.rng.randint(1, 4)
+        slope = self.rng.randint(-3, 3)
         dy = slope * dx
 
         x2 = x1 + dx
@@ -62,17 +58,17 @@ class SlopeGenerator:
 
     def _generate_medium(self) -> Equation:
         """Slope with negative coordinates or fractional results"""
-        problem_type = random.choice(['fraction', 'negative_coords', 'interpret'])
+        problem_type = self.rng.choice(['fraction', 'negative_coords', 'interpret'])
 
         if problem_type == 'fraction':
-            x1 = random.randint(-5, 5)
-            y1 = random.randint(-5, 5)
+            x1 = self.rng.randint(-5, 5)
+            y1 = self.rng.randint(-5, 5)
 
-            dx = random.randint(2, 5)
-            dy = random.randint(1, 4)
+            dx = self.rng.randint(2, 5)
+            dy = self.rng.randint(1, 4)
             # Make sure it's not reducible to integer
             while dy % dx == 0:
-                dy = random.randint(1, 4)
+                dy = self.rng.randint(1, 4)
 
             x2 = x1 + dx
             y2 = y1 + dy
@@ -90,10 +86,10 @@ class SlopeGenerator:
             ]
 
         elif problem_type == 'negative_coords':
-            x1 = random.randint(-8, -2)
-            y1 = random.randint(-8, -2)
-            x2 = random.randint(2, 8)
-            y2 = random.randint(2, 8)
+            x1 = self.rng.randint(-8, -2)
+            y1 = self.rng.randint(-8, -2)
+            x2 = self.rng.randint(2, 8)
+            y2 = self.rng.randint(2, 8)
 
             dy = y2 - y1
             dx = x2 - x1
@@ -121,7 +117,7 @@ class SlopeGenerator:
                 (0, "zero", "horizontal line"),
                 ("\\frac{1}{2}", "positive", "rises 1 unit for every 2 units right"),
             ]
-            slope, sign, meaning = random.choice(slopes)
+            slope, sign, meaning = self.rng.choice(slopes)
 
             latex = f"\\text{{A line has slope }} {slope}. \\text{{ Is it positive, negative, or zero?}}"
             solution = sign
@@ -135,15 +131,15 @@ class SlopeGenerator:
 
     def _generate_hard(self) -> Equation:
         """Vertical/horizontal lines or find missing coordinate"""
-        problem_type = random.choice(['special', 'find_missing'])
+        problem_type = self.rng.choice(['special', 'find_missing'])
 
         if problem_type == 'special':
-            line_type = random.choice(['vertical', 'horizontal'])
+            line_type = self.rng.choice(['vertical', 'horizontal'])
 
             if line_type == 'vertical':
-                x = random.randint(-5, 5)
-                y1 = random.randint(-5, 0)
-                y2 = random.randint(1, 5)
+                x = self.rng.randint(-5, 5)
+                y1 = self.rng.randint(-5, 0)
+                y2 = self.rng.randint(1, 5)
 
                 latex = f"\\text{{Find the slope of the line through }} ({x}, {y1}) \\text{{ and }} ({x}, {y2})."
                 solution = "\\text{Undefined}"
@@ -154,9 +150,9 @@ class SlopeGenerator:
                     f"\\text{{This is a vertical line with undefined slope}}"
                 ]
             else:
-                y = random.randint(-5, 5)
-                x1 = random.randint(-5, 0)
-                x2 = random.randint(1, 5)
+                y = self.rng.randint(-5, 5)
+                x1 = self.rng.randint(-5, 0)
+                x2 = self.rng.randint(1, 5)
 
                 latex = f"\\text{{Find the slope of the line through }} ({x1}, {y}) \\text{{ and }} ({x2}, {y})."
                 solution = "0"
@@ -167,13 +163,13 @@ class SlopeGenerator:
                 ]
         else:
             # Find missing coordinate given slope
-            x1 = random.randint(0, 5)
-            y1 = random.randint(0, 5)
-            slope = random.randint(-3, 3)
+            x1 = self.rng.randint(0, 5)
+            y1 = self.rng.randint(0, 5)
+            slope = self.rng.randint(-3, 3)
             while slope == 0:
-                slope = random.randint(-3, 3)
+                slope = self.rng.randint(-3, 3)
 
-            dx = random.randint(2, 5)
+            dx = self.rng.randint(2, 5)
             x2 = x1 + dx
             y2 = y1 + slope * dx
 
@@ -192,15 +188,15 @@ class SlopeGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Parallel/perpendicular lines or rate of change context"""
-        problem_type = random.choice(['parallel', 'perpendicular', 'rate_of_change'])
+        problem_type = self.rng.choice(['parallel', 'perpendicular', 'rate_of_change'])
 
         if problem_type == 'parallel':
-            m = random.randint(-4, 4)
+            m = self.rng.randint(-4, 4)
             while m == 0:
-                m = random.randint(-4, 4)
+                m = self.rng.randint(-4, 4)
 
-            x1, y1 = random.randint(-5, 5), random.randint(-5, 5)
-            x2, y2 = x1 + random.randint(1, 4), y1 + m * random.randint(1, 4)
+            x1, y1 = self.rng.randint(-5, 5), self.rng.randint(-5, 5)
+            x2, y2 = x1 + self.rng.randint(1, 4), y1 + m * self.rng.randint(1, 4)
 
             latex = f"\\text{{Line 1 passes through }} ({x1}, {y1}) \\text{{ and }} ({x2}, {y2}). \\text{{ What slope must a parallel line have?}}"
             solution = str(m)
@@ -216,7 +212,7 @@ class SlopeGenerator:
             # Use simple fractions
             m_vals = [(2, "-\\frac{1}{2}"), (3, "-\\frac{1}{3}"), (-2, "\\frac{1}{2}"),
                       (-4, "\\frac{1}{4}"), (1, "-1"), (-1, "1")]
-            m, perp_m = random.choice(m_vals)
+            m, perp_m = self.rng.choice(m_vals)
 
             latex = f"\\text{{A line has slope }} {m}. \\text{{ What is the slope of a perpendicular line?}}"
             solution = perp_m
@@ -228,8 +224,8 @@ class SlopeGenerator:
 
         else:
             # Rate of change in context
-            rate = random.randint(5, 20)
-            start = random.randint(20, 100)
+            rate = self.rng.randint(5, 20)
+            start = self.rng.randint(20, 100)
 
             contexts = [
                 (f"water rises {rate} cm per hour", rate, "cm/hour"),
@@ -237,7 +233,7 @@ class SlopeGenerator:
                 (f"car travels {rate} miles per gallon", rate, "miles/gallon"),
             ]
 
-            context, slope, units = random.choice(contexts)
+            context, slope, units = self.rng.choice(contexts)
 
             latex = f"\\text{{A {context}. What is the rate of change (slope)?}}"
             solution = f"{slope} \\text{{ {units}}}"
@@ -3,14 +3,11 @@ Slope Intercepts Word Problems Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SlopeInterceptsWordProblemsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class SlopeInterceptsWordProblemsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        rate = random.randint(5, 15)
-        initial = random.randint(20, 50)
+        rate = self.rng.randint(5, 15)
+        initial = self.rng.randint(20, 50)
 
         latex = f"\\text{{A phone plan costs \\${initial} plus \\${rate}/month. What is the y-intercept?}}"
         solution = f"{initial}"
@@ -32,8 +29,8 @@ class SlopeInterceptsWordProblemsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        rate = random.randint(3, 12)
-        initial = random.randint(15, 40)
+        rate = self.rng.randint(3, 12)
+        initial = self.rng.randint(15, 40)
 
         latex = f"\\text{{A tank has {initial} gallons and fills at {rate} gal/min. Write the equation.}}"
         solution = f"y = {rate}x + {initial}"
@@ -42,9 +39,9 @@ class SlopeInterceptsWordProblemsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        rate = random.randint(40, 80)
-        initial = random.randint(100, 300)
-        time = random.randint(3, 8)
+        rate = self.rng.randint(40, 80)
+        initial = self.rng.randint(100, 300)
+        time = self.rng.randint(3, 8)
         total = rate * time + initial
 
         latex = f"\\text{{A car rental is \\${initial} + \\${rate}/day. Find cost for {time} days.}}"
@@ -54,9 +51,9 @@ class SlopeInterceptsWordProblemsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        rate = random.randint(20, 50)
-        total = random.randint(300, 600)
-        initial = random.randint(50, 150)
+        rate = self.rng.randint(20, 50)
+        total = self.rng.randint(300, 600)
+        initial = self.rng.randint(50, 150)
         days = (total - initial) / rate
 
         latex = f"\\text{{A savings account has \\${initial} and saves \\${rate}/week. When will it reach \\${total}?}}"
@@ -3,14 +3,11 @@ Combination Equation Types Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class CombinationEquationTypesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class CombinationEquationTypesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        m = random.randint(2, 7)
-        b = random.randint(-8, 8)
+        m = self.rng.randint(2, 7)
+        b = self.rng.randint(-8, 8)
 
         latex = f"\\text{{Identify the form: }} y = {m}x + {b}"
         solution = "Slope-intercept form"
@@ -32,9 +29,9 @@ class CombinationEquationTypesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(2, 8)
-        c = random.randint(10, 30)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(2, 8)
+        c = self.rng.randint(10, 30)
 
         latex = f"\\text{{Identify the form: }} {a}x + {b}y = {c}"
         solution = "Standard form"
@@ -43,9 +40,9 @@ class CombinationEquationTypesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        m = random.randint(2, 6)
-        x1 = random.randint(1, 5)
-        y1 = random.randint(2, 10)
+        m = self.rng.randint(2, 6)
+        x1 = self.rng.randint(1, 5)
+        y1 = self.rng.randint(2, 10)
 
         forms = [
             ("slope-intercept", f"y = {m}x + {y1 - m * x1}"),
@@ -53,7 +50,7 @@ class CombinationEquationTypesGenerator:
             ("standard", f"{m}x - y = {m * x1 - y1}")
         ]
 
-        form_type, equation = random.choice(forms)
+        form_type, equation = self.rng.choice(forms)
 
         latex = f"\\text{{Identify the form: }} {equation}"
         solution = f"{form_type.title()} form"
@@ -62,9 +59,9 @@ class CombinationEquationTypesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        m = random.randint(2, 5)
-        x1 = random.randint(1, 4)
-        y1 = random.randint(3, 10)
+        m = self.rng.randint(2, 5)
+        x1 = self.rng.randint(1, 4)
+        y1 = self.rng.randint(3, 10)
         b = y1 - m * x1
 
         latex = f"\\text{{Convert }} y - {y1} = {m}(x - {x1}) \\text{{ to both other forms}}"
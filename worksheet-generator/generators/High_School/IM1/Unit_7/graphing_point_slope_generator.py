@@ -3,14 +3,11 @@ Graphing Point Slope Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class GraphingPointSlopeGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class GraphingPointSlopeGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        m = random.randint(1, 4)
-        x1 = random.randint(1, 5)
-        y1 = random.randint(1, 8)
+        m = self.rng.randint(1, 4)
+        x1 = self.rng.randint(1, 5)
+        y1 = self.rng.randint(1, 8)
 
         latex = f"\\text{{Graph }} y - {y1} = {m}(x - {x1})"
         solution = f"Start at ({x1}, {y1}), slope {m}"
@@ -33,9 +30,9 @@ class GraphingPointSlopeGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        m = random.randint(-4, -1)
-        x1 = random.randint(0, 5)
-        y1 = random.randint(3, 10)
+        m = self.rng.randint(-4, -1)
+        x1 = self.rng.randint(0, 5)
+        y1 = self.rng.randint(3, 10)
 
         latex = f"\\text{{Graph }} y - {y1} = {m}(x - {x1})"
         solution = f"Start at ({x1}, {y1}), slope {m}"
@@ -44,10 +41,10 @@ class GraphingPointSlopeGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        num = random.randint(2, 4)
-        den = random.randint(3, 5)
-        x1 = random.randint(0, 4)
-        y1 = random.randint(2, 8)
+        num = self.rng.randint(2, 4)
+        den = self.rng.randint(3, 5)
+        x1 = self.rng.randint(0, 4)
+        y1 = self.rng.randint(2, 8)
 
         latex = f"\\text{{Graph }} y - {y1} = \\frac{{{num}}}{{{den}}}(x - {x1})"
         solution = f"Start at ({x1}, {y1}), rise {num}, run {den}"
@@ -56,9 +53,9 @@ class GraphingPointSlopeGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        m = random.randint(2, 5)
-        x1 = random.randint(1, 4)
-        y1 = random.randint(2, 8)
+        m = self.rng.randint(2, 5)
+        x1 = self.rng.randint(1, 4)
+        y1 = self.rng.randint(2, 8)
         b = y1 - m * x1
 
         latex = f"\\text{{Graph }} y - {y1} = {m}(x - {x1}) \\text{{ and find y-intercept}}"
@@ -3,14 +3,11 @@ Graphing Slope Intercept Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class GraphingSlopeInterceptGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class GraphingSlopeInterceptGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        m = random.randint(1, 5)
-        b = random.randint(-5, 5)
+        m = self.rng.randint(1, 5)
+        b = self.rng.randint(-5, 5)
 
         latex = f"\\text{{Graph }} y = {m}x + {b}"
         solution = f"Start at (0, {b}), slope = {m}"
@@ -32,8 +29,8 @@ class GraphingSlopeInterceptGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        m = random.randint(-4, -1)
-        b = random.randint(-6, 6)
+        m = self.rng.randint(-4, -1)
+        b = self.rng.randint(-6, 6)
 
         latex = f"\\text{{Graph }} y = {m}x + {b}"
         solution = f"Start at (0, {b}), slope = {m}"
@@ -42,9 +39,9 @@ class GraphingSlopeInterceptGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        num = random.randint(1, 4)
-        den = random.randint(2, 5)
-        b = random.randint(-5, 5)
+        num = self.rng.randint(1, 4)
+        den = self.rng.randint(2, 5)
+        b = self.rng.randint(-5, 5)
 
         latex = f"\\text{{Graph }} y = \\frac{{{num}}}{{{den}}}x + {b}"
         solution = f"Start at (0, {b}), rise {num}, run {den}"
@@ -53,9 +50,9 @@ class GraphingSlopeInterceptGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        m = random.randint(2, 5)
-        b = random.randint(-4, 4)
-        x_val = random.randint(1, 3)
+        m = self.rng.randint(2, 5)
+        b = self.rng.randint(-4, 4)
+        x_val = self.rng.randint(1, 3)
         y_val = m * x_val + b
 
         latex = f"\\text{{Graph }} y = {m}x + {b} \\text{{ and identify point when }} x = {x_val}"
@@ -3,14 +3,11 @@ Graphing Standard Form Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class GraphingStandardFormGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class GraphingStandardFormGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        c = random.randint(10, 20)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(10, 20)
 
         x_int = c / a
         y_int = c / b
@@ -36,9 +33,9 @@ class GraphingStandardFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(2, 6)
-        c = random.randint(12, 30)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(12, 30)
 
         x_int = c / a
         y_int = c / b
@@ -50,9 +47,9 @@ class GraphingStandardFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(-5, -2)
-        b = random.randint(2, 6)
-        c = random.randint(10, 25)
+        a = self.rng.randint(-5, -2)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(10, 25)
 
         x_int = c / a
         y_int = c / b
@@ -64,9 +61,9 @@ class GraphingStandardFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(2, 5)
-        c = random.randint(15, 30)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 5)
+        c = self.rng.randint(15, 30)
 
         x_int = c / a
         y_int = c / b
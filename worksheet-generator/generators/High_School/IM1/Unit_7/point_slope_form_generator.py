@@ -3,14 +3,11 @@ Point Slope Form Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class PointSlopeFormGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class PointSlopeFormGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        m = random.randint(2, 7)
-        x1 = random.randint(1, 6)
-        y1 = random.randint(1, 10)
+        m = self.rng.randint(2, 7)
+        x1 = self.rng.randint(1, 6)
+        y1 = self.rng.randint(1, 10)
 
         latex = f"\\text{{Write point-slope form with slope {m} through }} ({x1}, {y1})"
         solution = f"y - {y1} = {m}(x - {x1})"
@@ -33,9 +30,9 @@ class PointSlopeFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        m = random.randint(2, 6)
-        x1 = random.randint(-5, 5)
-        y1 = random.randint(-5, 5)
+        m = self.rng.randint(2, 6)
+        x1 = self.rng.randint(-5, 5)
+        y1 = self.rng.randint(-5, 5)
 
         latex = f"\\text{{Write point-slope form: slope {m}, point }} ({x1}, {y1})"
         if x1 >= 0:
@@ -47,9 +44,9 @@ class PointSlopeFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x1, y1 = random.randint(1, 5), random.randint(2, 10)
-        x2 = x1 + random.randint(1, 4)
-        m = random.randint(2, 6)
+        x1, y1 = self.rng.randint(1, 5), self.rng.randint(2, 10)
+        x2 = x1 + self.rng.randint(1, 4)
+        m = self.rng.randint(2, 6)
         y2 = y1 + m * (x2 - x1)
 
         latex = f"\\text{{Write point-slope form through }} ({x1}, {y1}) \\text{{ and }} ({x2}, {y2})"
@@ -59,9 +56,9 @@ class PointSlopeFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        m = random.randint(2, 5)
-        x1 = random.randint(1, 5)
-        y1 = random.randint(2, 10)
+        m = self.rng.randint(2, 5)
+        x1 = self.rng.randint(1, 5)
+        y1 = self.rng.randint(2, 10)
         b = y1 - m * x1
 
         latex = f"\\text{{Convert }} y - {y1} = {m}(x - {x1}) \\text{{ to slope-intercept form}}"
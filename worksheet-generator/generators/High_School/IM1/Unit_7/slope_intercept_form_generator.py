@@ -5,9 +5,6 @@ Creates problems about y = mx + b form
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class SlopeInterceptFormGenerator:
     """Generates slope-intercept form problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -55,12 +51,12 @@ class SlopeInterceptFormGenerator:
 
     def _generate_easy(self) -> Equation:
         """Identify slope and y-intercept from equation"""
-        m = random.randint(-5, 5)
-        b = random.randint(-10, 10)
+        m = self.rng.randint(-5, 5)
+        b = self.rng.randint(-10, 10)
 
         eq = self._format_equation(m, b)
 
-        problem_type = random.choice(['slope', 'intercept', 'both'])
+        problem_type = self.rng.choice(['slope', 'intercept', 'both'])
 
         if problem_type == 'slope':
             latex = f"\\text{{What is the slope of }} {eq}?"
@@ -89,11 +85,11 @@ class SlopeInterceptFormGenerator:
 
     def _generate_medium(self) -> Equation:
         """Write equation given slope and y-intercept or a point"""
-        problem_type = random.choice(['from_m_b', 'from_point'])
+        problem_type = self.rng.choice(['from_m_b', 'from_point'])
 
         if problem_type == 'from_m_b':
-            m = random.randint(-4, 4)
-            b = random.randint(-8, 8)
+            m = self.rng.randint(-4, 4)
+            b = self.rng.randint(-8, 8)
 
             latex = f"\\text{{Write the equation of a line with slope }} {m} \\text{{ and y-intercept }} {b}."
             solution = self._format_equation(m, b)
@@ -105,12 +101,12 @@ class SlopeInterceptFormGenerator:
             ]
         else:
             # Given slope and one point
-            m = random.randint(-3, 3)
+            m = self.rng.randint(-3, 3)
             while m == 0:
-                m = random.randint(-3, 3)
-            x1 = random.randint(1, 5)
+                m = self.rng.randint(-3, 3)
+            x1 = self.rng.randint(1, 5)
             # Calculate b such that point is on line
-            b = random.randint(-8, 8)
+            b = self.rng.randint(-8, 8)
             y1 = m * x1 + b
 
             latex = f"\\text{{Write the equation of a line with slope }} {m} \\text{{ passing through }} ({x1}, {y1})."
@@ -128,16 +124,16 @@ class SlopeInterceptFormGenerator:
 
     def _generate_hard(self) -> Equation:
         """Write equation from two points or convert from standard form"""
-        problem_type = random.choice(['two_points', 'from_standard'])
+        problem_type = self.rng.choice(['two_points', 'from_standard'])
 
         if problem_type == 'two_points':
             # Choose points that give integer slope
-            x1 = random.randint(-3, 3)
-            y1 = random.randint(-5, 5)
-            dx = random.randint(1, 4)
-            m = random.randint(-3, 3)
+            x1 = self.rng.randint(-3, 3)
+            y1 = self.rng.randint(-5, 5)
+            dx = self.rng.randint(1, 4)
+            m = self.rng.randint(-3, 3)
             while m == 0:
-                m = random.randint(-3, 3)
+                m = self.rng.randint(-3, 3)
             dy = m * dx
 
             x2 = x1 + dx
@@ -158,14 +154,14 @@ class SlopeInterceptFormGenerator:
             ]
         else:
             # Convert from standard form Ax + By = C
-            a = random.randint(1, 5)
-            b_coef = random.randint(1, 5)
-            c = random.randint(-15, 15)
+            a = self.rng.randint(1, 5)
+            b_coef = self.rng.randint(1, 5)
+            c = self.rng.randint(-15, 15)
 
             # y = (-a/b)x + c/b
             # For integer m and b, we need a and c divisible by b_coef
-            a = random.randint(1, 4) * b_coef
-            c = random.randint(-5, 5) * b_coef
+            a = self.rng.randint(1, 4) * b_coef
+            c = self.rng.randint(-5, 5) * b_coef
 
             m = -a // b_coef
             b = c // b_coef
@@ -185,15 +181,15 @@ class SlopeInterceptFormGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Parallel/perpendicular lines or word problems"""
-        problem_type = random.choice(['parallel', 'perpendicular', 'word_problem'])
+        problem_type = self.rng.choice(['parallel', 'perpendicular', 'word_problem'])
 
         if problem_type == 'parallel':
-            m = random.randint(-4, 4)
+            m = self.rng.randint(-4, 4)
             while m == 0:
-                m = random.randint(-4, 4)
-            b1 = random.randint(-8, 8)
-            x1 = random.randint(-4, 4)
-            y1 = random.randint(-8, 8)
+                m = self.rng.randint(-4, 4)
+            b1 = self.rng.randint(-8, 8)
+            x1 = self.rng.randint(-4, 4)
+            y1 = self.rng.randint(-8, 8)
             b2 = y1 - m * x1
 
             given_eq = self._format_equation(m, b1)
@@ -210,14 +206,14 @@ class SlopeInterceptFormGenerator:
             ]
 
         elif problem_type == 'perpendicular':
-            m1 = random.choice([2, 3, 4, -2, -3, -4])
-            b1 = random.randint(-5, 5)
+            m1 = self.rng.choice([2, 3, 4, -2, -3, -4])
+            b1 = self.rng.randint(-5, 5)
             m2 = f"-\\frac{{1}}{{{m1}}}" if m1 > 0 else f"\\frac{{1}}{{{abs(m1)}}}"
             m2_val = -1 / m1
 
             # For clean answer, choose point carefully
             x1 = m1  # x-coordinate
-            y1 = random.randint(-5, 5)
+            y1 = self.rng.randint(-5, 5)
             b2 = y1 - m2_val * x1
 
             given_eq = self._format_equation(m1, b1)
@@ -233,8 +229,8 @@ class SlopeInterceptFormGenerator:
 
         else:
             # Word problem
-            start = random.randint(100, 500)
-            rate = random.randint(10, 50)
+            start = self.rng.randint(100, 500)
+            rate = self.rng.randint(10, 50)
 
             latex = f"\\text{{A phone plan costs \\${start} for the phone plus \\${rate}/month. Write an equation for total cost }} C \\text{{ after }} m \\text{{ months.}}"
             solution = f"C = {rate}m + {start}"
@@ -3,14 +3,11 @@ Standard Form Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class StandardFormGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class StandardFormGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(2, 8)
-        b = random.randint(2, 8)
-        c = random.randint(10, 30)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(2, 8)
+        c = self.rng.randint(10, 30)
 
         latex = f"\\text{{Is }} {a}x + {b}y = {c} \\text{{ in standard form?}}"
         solution = "Yes"
@@ -33,9 +30,9 @@ class StandardFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(2, 6)
-        c = random.randint(12, 30)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(12, 30)
 
         x_int = c / a
         y_int = c / b
@@ -47,8 +44,8 @@ class StandardFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        m = random.randint(2, 6)
-        b = random.randint(-8, 8)
+        m = self.rng.randint(2, 6)
+        b = self.rng.randint(-8, 8)
 
         a = m
         c = b
@@ -60,9 +57,9 @@ class StandardFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(2, 6)
-        c = random.randint(12, 30)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(12, 30)
 
         m = -a / b
         y_int = c / b
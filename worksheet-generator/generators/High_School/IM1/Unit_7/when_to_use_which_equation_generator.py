@@ -3,14 +3,11 @@ When to Use Which Equation Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class WhenToUseWhichEquationGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class WhenToUseWhichEquationGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        m = random.randint(2, 7)
-        b = random.randint(5, 20)
+        m = self.rng.randint(2, 7)
+        b = self.rng.randint(5, 20)
 
         latex = f"\\text{{You know slope is {m} and y-intercept is {b}. Which form to use?}}"
         solution = "Slope-intercept form (y = mx + b)"
@@ -32,9 +29,9 @@ class WhenToUseWhichEquationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        m = random.randint(2, 6)
-        x1 = random.randint(1, 5)
-        y1 = random.randint(3, 10)
+        m = self.rng.randint(2, 6)
+        x1 = self.rng.randint(1, 5)
+        y1 = self.rng.randint(3, 10)
 
         latex = f"\\text{{You know slope {m} and point ({x1}, {y1}). Which form to use?}}"
         solution = "Point-slope form (y - y₁ = m(x - x₁))"
@@ -43,9 +40,9 @@ class WhenToUseWhichEquationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        price_a = random.randint(4, 10)
-        price_b = random.randint(3, 8)
-        total = random.randint(40, 80)
+        price_a = self.rng.randint(4, 10)
+        price_b = self.rng.randint(3, 8)
+        total = self.rng.randint(40, 80)
 
         latex = f"\\text{{Item A costs \\${price_a}, item B costs \\${price_b}, total \\${total}. Which form?}}"
         solution = "Standard form (Ax + By = C)"
@@ -61,7 +58,7 @@ class WhenToUseWhichEquationGenerator:
             ("Temperature at hour 3 is 72°, rising 5° per hour", "Use point-slope: T - 72 = 5(h - 3)")
         ]
 
-        scenario, answer = random.choice(scenarios)
+        scenario, answer = self.rng.choice(scenarios)
 
         latex = f"\\text{{{scenario}. Which form is best?}}"
         solution = answer
@@ -3,14 +3,11 @@ Word Problems Point Slope Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class WordProblemsPointSlopeGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class WordProblemsPointSlopeGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        temp0 = random.randint(50, 80)
-        rate = random.randint(2, 8)
-        hours = random.randint(2, 5)
+        temp0 = self.rng.randint(50, 80)
+        rate = self.rng.randint(2, 8)
+        hours = self.rng.randint(2, 5)
 
         latex = f"\\text{{Temperature is {temp0}°F at hour {hours}, rising {rate}°/hr. Write point-slope equation.}}"
         solution = f"T - {temp0} = {rate}(h - {hours})"
@@ -33,9 +30,9 @@ class WordProblemsPointSlopeGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        pop0 = random.randint(5000, 15000)
-        year0 = random.randint(2010, 2020)
-        rate = random.randint(200, 800)
+        pop0 = self.rng.randint(5000, 15000)
+        year0 = self.rng.randint(2010, 2020)
+        rate = self.rng.randint(200, 800)
 
         latex = f"\\text{{City population was {pop0} in {year0}, growing {rate}/year. Write equation.}}"
         solution = f"P - {pop0} = {rate}(t - {year0})"
@@ -44,10 +41,10 @@ class WordProblemsPointSlopeGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        cost1 = random.randint(100, 200)
-        items1 = random.randint(10, 30)
-        cost2 = cost1 + random.randint(50, 150)
-        items2 = items1 + random.randint(10, 25)
+        cost1 = self.rng.randint(100, 200)
+        items1 = self.rng.randint(10, 30)
+        cost2 = cost1 + self.rng.randint(50, 150)
+        items2 = items1 + self.rng.randint(10, 25)
         slope = (cost2 - cost1) / (items2 - items1)
 
         latex = f"\\text{{Cost is \\${cost1} for {items1} items, \\${cost2} for {items2} items. Write point-slope form.}}"
@@ -57,10 +54,10 @@ class WordProblemsPointSlopeGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        depth1 = random.randint(500, 1000)
-        time1 = random.randint(10, 30)
-        rate = random.randint(-20, -5)
-        time2 = random.randint(40, 60)
+        depth1 = self.rng.randint(500, 1000)
+        time1 = self.rng.randint(10, 30)
+        rate = self.rng.randint(-20, -5)
+        time2 = self.rng.randint(40, 60)
         depth2 = depth1 + rate * (time2 - time1)
 
         latex = f"\\text{{Submarine at {depth1}m at t={time1}min, descending {abs(rate)}m/min. Depth at t={time2}?}}"
@@ -3,14 +3,11 @@ Word Problems Slope Intercept Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class WordProblemsSlopeInterceptGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class WordProblemsSlopeInterceptGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        rate = random.randint(30, 70)
-        initial = random.randint(50, 200)
+        rate = self.rng.randint(30, 70)
+        initial = self.rng.randint(50, 200)
 
         latex = f"\\text{{A plumber charges \\${initial} plus \\${rate}/hour. Write the equation.}}"
         solution = f"y = {rate}x + {initial}"
@@ -32,9 +29,9 @@ class WordProblemsSlopeInterceptGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        rate = random.randint(10, 25)
-        initial = random.randint(100, 300)
-        hours = random.randint(3, 8)
+        rate = self.rng.randint(10, 25)
+        initial = self.rng.randint(100, 300)
+        hours = self.rng.randint(3, 8)
         total = rate * hours + initial
 
         latex = f"\\text{{Gym membership: \\${initial} signup + \\${rate}/month. Cost after {hours} months?}}"
@@ -44,15 +41,15 @@ class WordProblemsSlopeInterceptGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        rate = random.randint(5, 15)
-        initial = random.randint(20, 80)
-        total = random.randint(150, 300)
+        rate = self.rng.randint(5, 15)
+        initial = self.rng.randint(20, 80)
+        total = self.rng.randint(150, 300)
         time = (total - initial) / rate
 
         latex = f"\\text{{A candle is {initial}cm tall, burns {rate}cm/hr. When is it {total}cm? (Error: grows)}}"
         # Fix the problem - candle should get shorter
-        initial = random.randint(200, 300)
-        total = random.randint(50, 150)
+        initial = self.rng.randint(200, 300)
+        total = self.rng.randint(50, 150)
         time = (initial - total) / rate
         latex = f"\\text{{A candle is {initial}cm tall, burns {rate}cm/hr. When is it {total}cm?}}"
         solution = f"{time:.1f} \\text{{ hours}}"
@@ -61,10 +58,10 @@ class WordProblemsSlopeInterceptGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        rate1 = random.randint(40, 70)
-        rate2 = random.randint(30, 60)
-        fee1 = random.randint(20, 60)
-        fee2 = random.randint(40, 100)
+        rate1 = self.rng.randint(40, 70)
+        rate2 = self.rng.randint(30, 60)
+        fee1 = self.rng.randint(20, 60)
+        fee2 = self.rng.randint(40, 100)
 
         if rate1 == rate2:
             rate2 += 10
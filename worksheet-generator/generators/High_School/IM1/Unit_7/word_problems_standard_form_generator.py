@@ -3,14 +3,11 @@ Word Problems Standard Form Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class WordProblemsStandardFormGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class WordProblemsStandardFormGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        price_a = random.randint(3, 10)
-        price_b = random.randint(2, 8)
-        total = random.randint(30, 60)
+        price_a = self.rng.randint(3, 10)
+        price_b = self.rng.randint(2, 8)
+        total = self.rng.randint(30, 60)
 
         latex = f"\\text{{Apples cost \\${price_a}, bananas \\${price_b}. Spent \\${total}. Write equation.}}"
         solution = f"{price_a}a + {price_b}b = {total}"
@@ -33,9 +30,9 @@ class WordProblemsStandardFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        wage_adult = random.randint(12, 20)
-        wage_child = random.randint(5, 10)
-        total = random.randint(100, 200)
+        wage_adult = self.rng.randint(12, 20)
+        wage_child = self.rng.randint(5, 10)
+        total = self.rng.randint(100, 200)
 
         latex = f"\\text{{Adult tickets \\${wage_adult}, child tickets \\${wage_child}, total \\${total}. Write equation.}}"
         solution = f"{wage_adult}a + {wage_child}c = {total}"
@@ -44,9 +41,9 @@ class WordProblemsStandardFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        price_x = random.randint(4, 12)
-        price_y = random.randint(3, 10)
-        budget = random.randint(50, 100)
+        price_x = self.rng.randint(4, 12)
+        price_y = self.rng.randint(3, 10)
+        budget = self.rng.randint(50, 100)
 
         max_x = budget // price_x
         max_y = budget // price_y
@@ -58,10 +55,10 @@ class WordProblemsStandardFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        price_a = random.randint(5, 12)
-        price_b = random.randint(3, 8)
-        total = random.randint(60, 120)
-        qty_a = random.randint(3, 8)
+        price_a = self.rng.randint(5, 12)
+        price_b = self.rng.randint(3, 8)
+        total = self.rng.randint(60, 120)
+        qty_a = self.rng.randint(3, 8)
 
         qty_b = (total - price_a * qty_a) / price_b
 
@@ -3,14 +3,11 @@ Checking Answer Plugin Logic Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class CheckingAnswerPluginLogicGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class CheckingAnswerPluginLogicGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x_val = random.randint(3, 8)
-        y_val = random.randint(2, 7)
+        x_val = self.rng.randint(3, 8)
+        y_val = self.rng.randint(2, 7)
         c = 2 * x_val + y_val
 
         latex = f"\\text{{Verify }} ({x_val}, {y_val}) \\text{{ solves }} 2x + y = {c}"
@@ -33,8 +30,8 @@ class CheckingAnswerPluginLogicGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x_val = random.randint(2, 6)
-        y_val = random.randint(3, 8)
+        x_val = self.rng.randint(2, 6)
+        y_val = self.rng.randint(3, 8)
 
         c1 = x_val + y_val
         c2 = 3 * x_val - y_val
@@ -46,9 +43,9 @@ class CheckingAnswerPluginLogicGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x_val = random.randint(4, 9)
-        y_val = random.randint(2, 6)
-        wrong_y = y_val + random.randint(1, 3)
+        x_val = self.rng.randint(4, 9)
+        y_val = self.rng.randint(2, 6)
+        wrong_y = y_val + self.rng.randint(1, 3)
 
         c1 = 2 * x_val + y_val
         c2 = x_val - wrong_y
@@ -3,14 +3,11 @@ Checking Your Answer Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class CheckingYourAnswerGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class CheckingYourAnswerGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x_val = random.randint(2, 6)
-        y_val = random.randint(1, 5)
+        x_val = self.rng.randint(2, 6)
+        y_val = self.rng.randint(1, 5)
         c = x_val + y_val
 
         latex = f"\\text{{Check if }} ({x_val}, {y_val}) \\text{{ solves }} x + y = {c}"
@@ -33,10 +30,10 @@ class CheckingYourAnswerGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x_val = random.randint(2, 6)
-        y_val = random.randint(1, 5)
-        a = random.randint(2, 5)
-        b = random.randint(1, 3)
+        x_val = self.rng.randint(2, 6)
+        y_val = self.rng.randint(1, 5)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 3)
 
         c1 = x_val + y_val
         c2 = a * x_val + b * y_val
@@ -48,9 +45,9 @@ class CheckingYourAnswerGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x_val = random.randint(2, 5)
-        y_val = random.randint(3, 7)
-        wrong_y = y_val + random.randint(1, 3)
+        x_val = self.rng.randint(2, 5)
+        y_val = self.rng.randint(3, 7)
+        wrong_y = y_val + self.rng.randint(1, 3)
 
         c1 = x_val + y_val
         c2 = 2 * x_val + wrong_y
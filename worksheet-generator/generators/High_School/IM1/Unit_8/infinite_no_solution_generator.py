@@ -3,14 +3,11 @@ Infinite No Solution Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class InfiniteNoSolutionGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class InfiniteNoSolutionGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        m = random.randint(2, 6)
-        b1 = random.randint(3, 10)
-        b2 = b1 + random.randint(2, 5)
+        m = self.rng.randint(2, 6)
+        b1 = self.rng.randint(3, 10)
+        b2 = b1 + self.rng.randint(2, 5)
 
         latex = f"\\text{{How many solutions: }} y = {m}x + {b1}, y = {m}x + {b2}?"
         solution = "No solution"
@@ -33,8 +30,8 @@ class InfiniteNoSolutionGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        m = random.randint(2, 6)
-        b = random.randint(3, 10)
+        m = self.rng.randint(2, 6)
+        b = self.rng.randint(3, 10)
 
         latex = f"\\text{{How many solutions: }} y = {m}x + {b}, y = {m}x + {b}?"
         solution = "Infinitely many solutions"
@@ -43,10 +40,10 @@ class InfiniteNoSolutionGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(2, 4)
-        c1 = random.randint(10, 20)
-        c2 = c1 + random.randint(3, 8)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 4)
+        c1 = self.rng.randint(10, 20)
+        c2 = c1 + self.rng.randint(3, 8)
 
         latex = f"\\text{{How many solutions: }} {a}x + {b}y = {c1}, {a}x + {b}y = {c2}?"
         solution = "No solution"
@@ -55,10 +52,10 @@ class InfiniteNoSolutionGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(2, 4)
-        c = random.randint(10, 25)
-        k = random.randint(2, 4)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 4)
+        c = self.rng.randint(10, 25)
+        k = self.rng.randint(2, 4)
 
         latex = f"\\text{{How many solutions: }} {a}x + {b}y = {c}, {a*k}x + {b*k}y = {c*k}?"
         solution = "Infinitely many solutions"
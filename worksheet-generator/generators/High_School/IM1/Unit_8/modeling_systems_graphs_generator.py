@@ -3,14 +3,11 @@ Modeling Systems Graphs Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ModelingSystemsGraphsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class ModelingSystemsGraphsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        rate1 = random.randint(40, 70)
-        fee1 = random.randint(20, 50)
+        rate1 = self.rng.randint(40, 70)
+        fee1 = self.rng.randint(20, 50)
 
         latex = f"\\text{{Company A: \\${fee1} + \\${rate1}/hour. Write the equation.}}"
         solution = f"y = {rate1}x + {fee1}"
@@ -32,10 +29,10 @@ class ModelingSystemsGraphsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        rate1 = random.randint(50, 80)
-        fee1 = random.randint(25, 60)
-        rate2 = random.randint(40, 70)
-        fee2 = random.randint(40, 90)
+        rate1 = self.rng.randint(50, 80)
+        fee1 = self.rng.randint(25, 60)
+        rate2 = self.rng.randint(40, 70)
+        fee2 = self.rng.randint(40, 90)
 
         if rate1 == rate2:
             rate2 += 10
@@ -47,10 +44,10 @@ class ModelingSystemsGraphsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        rate1 = random.randint(50, 75)
-        fee1 = random.randint(20, 50)
-        rate2 = random.randint(35, 60)
-        fee2 = random.randint(60, 100)
+        rate1 = self.rng.randint(50, 75)
+        fee1 = self.rng.randint(20, 50)
+        rate2 = self.rng.randint(35, 60)
+        fee2 = self.rng.randint(60, 100)
 
         if rate1 <= rate2:
             rate1 = rate2 + 10
@@ -64,10 +61,10 @@ class ModelingSystemsGraphsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        initial1 = random.randint(100, 200)
-        rate1 = random.randint(10, 25)
-        initial2 = random.randint(50, 150)
-        rate2 = random.randint(20, 40)
+        initial1 = self.rng.randint(100, 200)
+        rate1 = self.rng.randint(10, 25)
+        initial2 = self.rng.randint(50, 150)
+        rate2 = self.rng.randint(20, 40)
 
         if initial1 <= initial2:
             initial1 = initial2 + 50
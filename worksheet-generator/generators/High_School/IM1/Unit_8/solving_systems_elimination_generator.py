@@ -5,9 +5,6 @@ Creates problems about solving systems of equations using elimination
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 
@@ -15,8 +12,7 @@ class SolvingSystemsEliminationGenerator:
     """Generates systems of equations problems for elimination method."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -58,13 +54,13 @@ class SolvingSystemsEliminationGenerator:
 
     def _generate_easy(self) -> Equation:
         """Coefficients already set up for direct elimination"""
-        x = random.randint(-5, 5)
-        y = random.randint(-5, 5)
+        x = self.rng.randint(-5, 5)
+        y = self.rng.randint(-5, 5)
 
         # Create system where one variable cancels directly
-        a1 = random.randint(1, 4)
-        b1 = random.randint(1, 4)
-        a2 = random.randint(1, 4)
+        a1 = self.rng.randint(1, 4)
+        b1 = self.rng.randint(1, 4)
+        a2 = self.rng.randint(1, 4)
         b2 = -b1  # Opposite coefficients for y
 
         c1 = a1 * x + b1 * y
@@ -90,14 +86,14 @@ class SolvingSystemsEliminationGenerator:
 
     def _generate_medium(self) -> Equation:
         """Requires multiplying one equation before eliminating"""
-        x = random.randint(-5, 5)
-        y = random.randint(-5, 5)
+        x = self.rng.randint(-5, 5)
+        y = self.rng.randint(-5, 5)
 
         # Create system where one equation needs to be multiplied
-        a1 = random.randint(1, 3)
-        b1 = random.randint(1, 3)
-        mult = random.randint(2, 3)
-        a2 = random.randint(1, 4)
+        a1 = self.rng.randint(1, 3)
+        b1 = self.rng.randint(1, 3)
+        mult = self.rng.randint(2, 3)
+        a2 = self.rng.randint(1, 4)
         b2 = b1 * mult  # b2 is a multiple of b1
 
         c1 = a1 * x + b1 * y
@@ -122,21 +118,21 @@ class SolvingSystemsEliminationGenerator:
 
     def _generate_hard(self) -> Equation:
         """Requires multiplying both equations"""
-        x = random.randint(-4, 4)
-        y = random.randint(-4, 4)
+        x = self.rng.randint(-4, 4)
+        y = self.rng.randint(-4, 4)
 
         # Create system where both need multiplying
-        a1 = random.randint(2, 4)
-        b1 = random.randint(2, 4)
-        a2 = random.randint(2, 4)
-        b2 = random.randint(2, 4)
+        a1 = self.rng.randint(2, 4)
+        b1 = self.rng.randint(2, 4)
+        a2 = self.rng.randint(2, 4)
+        b2 = self.rng.randint(2, 4)
 
         # Make sure they're not too easy
         while b1 == b2 or b1 == -b2 or a1 == a2:
-            a1 = random.randint(2, 4)
-            b1 = random.randint(2, 4)
-            a2 = random.randint(2, 4)
-            b2 = random.randint(2, 4)
+            a1 = self.rng.randint(2, 4)
+            b1 = self.rng.randint(2, 4)
+            a2 = self.rng.randint(2, 4)
+            b2 = self.rng.randint(2, 4)
 
         c1 = a1 * x + b1 * y
         c2 = a2 * x + b2 * y
@@ -165,12 +161,12 @@ class SolvingSystemsEliminationGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Word problems or special cases"""
-        problem_type = random.choice(['word_problem', 'special'])
+        problem_type = self.rng.choice(['word_problem', 'special'])
 
         if problem_type == 'word_problem':
             # Create a word problem
-            x = random.randint(2, 8)
-            y = random.randint(2, 8)
+            x = self.rng.randint(2, 8)
+            y = self.rng.randint(2, 8)
 
             problems = [
                 {
@@ -191,7 +187,7 @@ class SolvingSystemsEliminationGenerator:
                 }
             ]
 
-            prob = random.choice(problems)
+            prob = self.rng.choice(problems)
             latex = f"\\text{{{prob['context']} {prob['question']}}}"
 
             if "Adult" in prob["context"]:
@@ -208,13 +204,13 @@ class SolvingSystemsEliminationGenerator:
 
         else:
             # Special cases
-            case_type = random.choice(['infinite', 'no_solution'])
+            case_type = self.rng.choice(['infinite', 'no_solution'])
 
             if case_type == 'infinite':
-                a = random.randint(1, 3)
-                b = random.randint(1, 3)
-                c = random.randint(1, 10)
-                mult = random.randint(2, 3)
+                a = self.rng.randint(1, 3)
+                b = self.rng.randint(1, 3)
+                c = self.rng.randint(1, 10)
+                mult = self.rng.randint(2, 3)
 
                 eq1 = self._format_equation(a, b, c)
                 eq2 = self._format_equation(a * mult, b * mult, c * mult)
@@ -229,11 +225,11 @@ class SolvingSystemsEliminationGenerator:
                 ]
 
             else:
-                a = random.randint(1, 3)
-                b = random.randint(1, 3)
-                c1 = random.randint(1, 10)
-                c2 = c1 + random.randint(1, 5)  # Different constant
-                mult = random.randint(2, 3)
+                a = self.rng.randint(1, 3)
+                b = self.rng.randint(1, 3)
+                c1 = self.rng.randint(1, 10)
+                c2 = c1 + self.rng.randint(1, 5)  # Different constant
+                mult = self.rng.randint(2, 3)
 
                 eq1 = self._format_equation(a, b, c1)
                 eq2 = self._format_equation(a * mult, b * mult, c2 * mult)
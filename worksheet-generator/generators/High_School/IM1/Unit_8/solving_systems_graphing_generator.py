@@ -3,14 +3,11 @@ Solving Systems Graphing Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SolvingSystemsGraphingGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,13 +19,13 @@ class SolvingSystemsGraphingGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x_val = random.randint(1, 4)
-        y_val = random.randint(2, 6)
+        x_val = self.rng.randint(1, 4)
+        y_val = self.rng.randint(2, 6)
 
-        m1 = random.randint(1, 3)
+        m1 = self.rng.randint(1, 3)
         b1 = y_val - m1 * x_val
 
-        m2 = random.randint(-3, -1)
+        m2 = self.rng.randint(-3, -1)
         b2 = y_val - m2 * x_val
 
         latex = f"\\text{{Solve by graphing: }} y = {m1}x + {b1}, y = {m2}x + {b2}"
@@ -38,10 +35,10 @@ class SolvingSystemsGraphingGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x_val = random.randint(2, 5)
-        y_val = random.randint(3, 8)
+        x_val = self.rng.randint(2, 5)
+        y_val = self.rng.randint(3, 8)
 
-        m1 = random.randint(1, 4)
+        m1 = self.rng.randint(1, 4)
         b1 = y_val - m1 * x_val
 
         m2 = -m1
@@ -54,15 +51,15 @@ class SolvingSystemsGraphingGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x_val = random.randint(1, 4)
-        y_val = random.randint(2, 7)
+        x_val = self.rng.randint(1, 4)
+        y_val = self.rng.randint(2, 7)
 
-        a1 = random.randint(1, 3)
-        b1 = random.randint(1, 2)
+        a1 = self.rng.randint(1, 3)
+        b1 = self.rng.randint(1, 2)
         c1 = a1 * x_val + b1 * y_val
 
-        a2 = random.randint(2, 4)
-        b2 = random.randint(1, 3)
+        a2 = self.rng.randint(2, 4)
+        b2 = self.rng.randint(1, 3)
         c2 = a2 * x_val + b2 * y_val
 
         latex = f"\\text{{Solve by graphing: }} {a1}x + {b1}y = {c1}, {a2}x + {b2}y = {c2}"
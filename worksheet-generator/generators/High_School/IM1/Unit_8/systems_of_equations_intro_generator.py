@@ -3,14 +3,11 @@ Systems of Equations Intro Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SystemsOfEquationsIntroGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -29,10 +26,10 @@ class SystemsOfEquationsIntroGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x_val = random.randint(1, 5)
-        y_val = random.randint(2, 8)
-        a = random.randint(2, 5)
-        b = random.randint(1, 4)
+        x_val = self.rng.randint(1, 5)
+        y_val = self.rng.randint(2, 8)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 4)
 
         c1 = x_val + y_val
         c2 = a * x_val + b * y_val
@@ -44,8 +41,8 @@ class SystemsOfEquationsIntroGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x_val = random.randint(2, 6)
-        y_val = random.randint(1, 5)
+        x_val = self.rng.randint(2, 6)
+        y_val = self.rng.randint(1, 5)
         wrong_x = x_val + 1
 
         c1 = x_val + y_val
@@ -58,12 +55,12 @@ class SystemsOfEquationsIntroGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a1 = random.randint(2, 5)
-        b1 = random.randint(1, 4)
-        a2 = random.randint(1, 4)
-        b2 = random.randint(2, 5)
-        c1 = random.randint(10, 25)
-        c2 = random.randint(15, 30)
+        a1 = self.rng.randint(2, 5)
+        b1 = self.rng.randint(1, 4)
+        a2 = self.rng.randint(1, 4)
+        b2 = self.rng.randint(2, 5)
+        c1 = self.rng.randint(10, 25)
+        c2 = self.rng.randint(15, 30)
 
         latex = f"\\text{{Write a system: }} {a1}x + {b1}y = {c1} \\text{{ and }} {a2}x + {b2}y = {c2}"
         solution = f"System: {a1}x + {b1}y = {c1}, {a2}x + {b2}y = {c2}"
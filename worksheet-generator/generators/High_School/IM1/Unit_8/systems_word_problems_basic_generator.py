@@ -3,14 +3,11 @@ Systems Word Problems Basic Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SystemsWordProblemsBasicGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class SystemsWordProblemsBasicGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        total = random.randint(15, 30)
-        x_val = random.randint(5, 12)
+        total = self.rng.randint(15, 30)
+        x_val = self.rng.randint(5, 12)
         y_val = total - x_val
 
         latex = f"\\text{{Two numbers sum to {total}. One is {x_val}. Find the other.}}"
@@ -33,8 +30,8 @@ class SystemsWordProblemsBasicGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        total_items = random.randint(20, 40)
-        x_val = random.randint(8, 18)
+        total_items = self.rng.randint(20, 40)
+        x_val = self.rng.randint(8, 18)
         y_val = total_items - x_val
         diff = abs(x_val - y_val)
 
@@ -45,8 +42,8 @@ class SystemsWordProblemsBasicGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x_val = random.randint(10, 20)
-        y_val = random.randint(8, 15)
+        x_val = self.rng.randint(10, 20)
+        y_val = self.rng.randint(8, 15)
         total = x_val + y_val
         twice_diff = 2 * x_val - y_val
 
@@ -57,8 +54,8 @@ class SystemsWordProblemsBasicGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        length = random.randint(15, 25)
-        width = random.randint(8, 14)
+        length = self.rng.randint(15, 25)
+        width = self.rng.randint(8, 14)
         perimeter = 2 * (length + width)
 
         latex = f"\\text{{Rectangle perimeter is {perimeter}. Length is {length - width} more than width. Find dimensions.}}"
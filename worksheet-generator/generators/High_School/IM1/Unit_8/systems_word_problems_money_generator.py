@@ -3,14 +3,11 @@ Systems Word Problems Money Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SystemsWordProblemsMoneyGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,10 +19,10 @@ class SystemsWordProblemsMoneyGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        price_a = random.randint(3, 8)
-        price_b = random.randint(2, 6)
-        qty_a = random.randint(3, 8)
-        qty_b = random.randint(4, 10)
+        price_a = self.rng.randint(3, 8)
+        price_b = self.rng.randint(2, 6)
+        qty_a = self.rng.randint(3, 8)
+        qty_b = self.rng.randint(4, 10)
         total_cost = price_a * qty_a + price_b * qty_b
         total_items = qty_a + qty_b
 
@@ -36,10 +33,10 @@ class SystemsWordProblemsMoneyGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        price_adult = random.randint(10, 20)
-        price_child = random.randint(5, 10)
-        adults = random.randint(3, 8)
-        children = random.randint(5, 12)
+        price_adult = self.rng.randint(10, 20)
+        price_child = self.rng.randint(5, 10)
+        adults = self.rng.randint(3, 8)
+        children = self.rng.randint(5, 12)
         total_people = adults + children
         total_cost = price_adult * adults + price_child * children
 
@@ -50,10 +47,10 @@ class SystemsWordProblemsMoneyGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        price_x = random.randint(8, 15)
-        price_y = random.randint(4, 10)
-        qty_x = random.randint(4, 10)
-        qty_y = random.randint(6, 14)
+        price_x = self.rng.randint(8, 15)
+        price_y = self.rng.randint(4, 10)
+        qty_x = self.rng.randint(4, 10)
+        qty_y = self.rng.randint(6, 14)
         total = qty_x + qty_y
         cost = price_x * qty_x + price_y * qty_y
 
@@ -64,8 +61,8 @@ class SystemsWordProblemsMoneyGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        nickels = random.randint(8, 20)
-        dimes = random.randint(6, 15)
+        nickels = self.rng.randint(8, 20)
+        dimes = self.rng.randint(6, 15)
         total_coins = nickels + dimes
         total_cents = 5 * nickels + 10 * dimes
         total_dollars = total_cents / 100
@@ -3,14 +3,11 @@ Systems Word Problems Rate Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SystemsWordProblemsRateGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class SystemsWordProblemsRateGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        speed1 = random.randint(40, 60)
-        speed2 = random.randint(50, 70)
-        time = random.randint(2, 4)
+        speed1 = self.rng.randint(40, 60)
+        speed2 = self.rng.randint(50, 70)
+        time = self.rng.randint(2, 4)
         total_distance = (speed1 + speed2) * time
 
         latex = f"\\text{{Two cars travel opposite directions. Speed {speed1} mph and {speed2} mph. {total_distance} mi apart after how long?}}"
@@ -34,10 +31,10 @@ class SystemsWordProblemsRateGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        speed_walk = random.randint(3, 5)
-        speed_bike = random.randint(12, 18)
-        total_time = random.randint(3, 6)
-        time_walk = random.randint(1, total_time - 1)
+        speed_walk = self.rng.randint(3, 5)
+        speed_bike = self.rng.randint(12, 18)
+        total_time = self.rng.randint(3, 6)
+        time_walk = self.rng.randint(1, total_time - 1)
         time_bike = total_time - time_walk
         distance = speed_walk * time_walk + speed_bike * time_bike
 
@@ -48,8 +45,8 @@ class SystemsWordProblemsRateGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        speed_current = random.randint(2, 5)
-        speed_boat = random.randint(15, 25)
+        speed_current = self.rng.randint(2, 5)
+        speed_boat = self.rng.randint(15, 25)
         downstream = speed_boat + speed_current
         upstream = speed_boat - speed_current
 
@@ -60,9 +57,9 @@ class SystemsWordProblemsRateGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        speed_a = random.randint(50, 70)
-        speed_b = random.randint(60, 80)
-        head_start = random.randint(1, 3)
+        speed_a = self.rng.randint(50, 70)
+        speed_b = self.rng.randint(60, 80)
+        head_start = self.rng.randint(1, 3)
 
         # When does B catch up to A?
         # distance_a = speed_a * (t + head_start)
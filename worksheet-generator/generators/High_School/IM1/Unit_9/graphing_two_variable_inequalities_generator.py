@@ -3,14 +3,11 @@ Graphing Two Variable Inequalities Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class GraphingTwoVariableInequalitiesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class GraphingTwoVariableInequalitiesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        m = random.randint(1, 4)
-        b = random.randint(-5, 5)
+        m = self.rng.randint(1, 4)
+        b = self.rng.randint(-5, 5)
 
         latex = f"\\text{{Graph }} y > {m}x + {b}"
         solution = f"Dashed line y = {m}x + {b}, shade above"
@@ -32,8 +29,8 @@ class GraphingTwoVariableInequalitiesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        m = random.randint(1, 4)
-        b = random.randint(-6, 6)
+        m = self.rng.randint(1, 4)
+        b = self.rng.randint(-6, 6)
 
         latex = f"\\text{{Graph }} y \\leq {m}x + {b}"
         solution = f"Solid line y = {m}x + {b}, shade below"
@@ -42,9 +39,9 @@ class GraphingTwoVariableInequalitiesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(2, 5)
-        c = random.randint(10, 25)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 5)
+        c = self.rng.randint(10, 25)
 
         latex = f"\\text{{Graph }} {a}x + {b}y < {c}"
         solution = f"Dashed line {a}x + {b}y = {c}, shade below"
@@ -53,10 +50,10 @@ class GraphingTwoVariableInequalitiesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        x_val = random.randint(1, 5)
-        y_val = random.randint(2, 8)
-        m = random.randint(1, 3)
-        b = random.randint(-4, 4)
+        x_val = self.rng.randint(1, 5)
+        y_val = self.rng.randint(2, 8)
+        m = self.rng.randint(1, 3)
+        b = self.rng.randint(-4, 4)
 
         result = y_val - (m * x_val + b)
         is_solution = result > 0
@@ -3,14 +3,11 @@ Systems of Inequalities Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SystemsOfInequalitiesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class SystemsOfInequalitiesGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(3, 8)
-        b = random.randint(5, 12)
+        a = self.rng.randint(3, 8)
+        b = self.rng.randint(5, 12)
 
         latex = f"\\text{{Graph the system: }} y > {a}, x < {b}"
         solution = f"Horizontal line at y={a} (shade above), vertical line at x={b} (shade left)"
@@ -32,10 +29,10 @@ class SystemsOfInequalitiesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        m1 = random.randint(1, 3)
-        b1 = random.randint(-4, 4)
-        m2 = random.randint(-3, -1)
-        b2 = random.randint(-4, 4)
+        m1 = self.rng.randint(1, 3)
+        b1 = self.rng.randint(-4, 4)
+        m2 = self.rng.randint(-3, -1)
+        b2 = self.rng.randint(-4, 4)
 
         latex = f"\\text{{Graph the system: }} y \\geq {m1}x + {b1}, y < {m2}x + {b2}"
         solution = f"Graph both lines, shade overlap"
@@ -44,12 +41,12 @@ class SystemsOfInequalitiesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x_val = random.randint(2, 6)
-        y_val = random.randint(3, 8)
-        m1 = random.randint(1, 3)
-        b1 = y_val - m1 * x_val - random.randint(1, 3)
-        m2 = random.randint(-3, -1)
-        b2 = y_val - m2 * x_val + random.randint(1, 3)
+        x_val = self.rng.randint(2, 6)
+        y_val = self.rng.randint(3, 8)
+        m1 = self.rng.randint(1, 3)
+        b1 = y_val - m1 * x_val - self.rng.randint(1, 3)
+        m2 = self.rng.randint(-3, -1)
+        b2 = y_val - m2 * x_val + self.rng.randint(1, 3)
 
         test1 = y_val > m1 * x_val + b1
         test2 = y_val < m2 * x_val + b2
@@ -65,10 +62,10 @@ class SystemsOfInequalitiesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(2, 5)
-        c1 = random.randint(15, 30)
-        c2 = random.randint(10, 25)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 5)
+        c1 = self.rng.randint(15, 30)
+        c2 = self.rng.randint(10, 25)
 
         latex = f"\\text{{Graph: }} {a}x + {b}y \\leq {c1}, x + y \\geq {c2}"
         solution = "Graph both lines, find overlap region"
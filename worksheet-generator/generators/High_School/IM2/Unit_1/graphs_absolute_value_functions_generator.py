@@ -3,14 +3,11 @@ Graphs of Absolute Value Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class GraphsAbsoluteValueFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,11 +19,11 @@ class GraphsAbsoluteValueFunctionsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        problem_type = random.choice(['vertex_form', 'find_vertex'])
+        problem_type = self.rng.choice(['vertex_form', 'find_vertex'])
 
         if problem_type == 'vertex_form':
-            h = random.randint(-5, 5)
-            k = random.randint(-5, 5)
+            h = self.rng.randint(-5, 5)
+            k = self.rng.randint(-5, 5)
             latex = f"\\text{{What is the vertex of }} f(x) = |x {'-' if h < 0 else '+'} {abs(h)}| {'+' if k >= 0 else '-'} {abs(k)}?"
             solution = f"({h}, {k})"
             steps = [
@@ -37,9 +34,9 @@ class GraphsAbsoluteValueFunctionsGenerator:
                 f"Vertex: ({h}, {k})"
             ]
         else:  # find_vertex
-            a = random.choice([1, -1])
-            h = random.randint(-4, 4)
-            k = random.randint(-4, 4)
+            a = self.rng.choice([1, -1])
+            h = self.rng.randint(-4, 4)
+            k = self.rng.randint(-4, 4)
             latex = f"\\text{{Find the vertex of }} f(x) = {'' if a == 1 else '-'}|x {'-' if h < 0 else '+'} {abs(h)}| {'+' if k >= 0 else '-'} {abs(k)}"
             solution = f"({h}, {k})"
             steps = [
@@ -53,12 +50,12 @@ class GraphsAbsoluteValueFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        problem_type = random.choice(['with_coefficient', 'find_intercepts'])
+        problem_type = self.rng.choice(['with_coefficient', 'find_intercepts'])
 
         if problem_type == 'with_coefficient':
-            a = random.choice([2, 3, -2, -3, 0.5, -0.5])
-            h = random.randint(-4, 4)
-            k = random.randint(-4, 4)
+            a = self.rng.choice([2, 3, -2, -3, 0.5, -0.5])
+            h = self.rng.randint(-4, 4)
+            k = self.rng.randint(-4, 4)
             latex = f"\\text{{Graph }} f(x) = {a}|x {'-' if h < 0 else '+'} {abs(h)}| {'+' if k >= 0 else '-'} {abs(k)} \\text{{ and identify the vertex}}"
             solution = f"Vertex: ({h}, {k}), {'opens up' if a > 0 else 'opens down'}, vertical stretch by factor {abs(a)}"
             steps = [
@@ -70,8 +67,8 @@ class GraphsAbsoluteValueFunctionsGenerator:
                 f"Vertex: ({h}, {k}), {'opens up' if a > 0 else 'opens down'}"
             ]
         else:  # find_intercepts
-            h = random.randint(-3, 3)
-            k = random.randint(-3, 3)
+            h = self.rng.randint(-3, 3)
+            k = self.rng.randint(-3, 3)
             y_int = abs(h) + k
             latex = f"\\text{{Find the y-intercept of }} f(x) = |x {'-' if h < 0 else '+'} {abs(h)}| {'+' if k >= 0 else '-'} {abs(k)}"
             solution = f"(0, {y_int})"
@@ -87,12 +84,12 @@ class GraphsAbsoluteValueFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        problem_type = random.choice(['transformations', 'domain_range'])
+        problem_type = self.rng.choice(['transformations', 'domain_range'])
 
         if problem_type == 'transformations':
-            a = random.choice([2, 3, -2, -3, 0.5, -0.5, 1.5])
-            h = random.randint(-5, 5)
-            k = random.randint(-5, 5)
+            a = self.rng.choice([2, 3, -2, -3, 0.5, -0.5, 1.5])
+            h = self.rng.randint(-5, 5)
+            k = self.rng.randint(-5, 5)
             latex = f"\\text{{Describe all transformations of }} f(x) = {a}|x {'-' if h < 0 else '+'} {abs(h)}| {'+' if k >= 0 else '-'} {abs(k)} \\text{{ from }} g(x) = |x|"
 
             transformations = []
@@ -113,9 +110,9 @@ class GraphsAbsoluteValueFunctionsGenerator:
             ]
             steps.extend([f"• {t}" for t in transformations])
         else:  # domain_range
-            a = random.choice([1, 2, -1, -2])
-            h = random.randint(-4, 4)
-            k = random.randint(-4, 4)
+            a = self.rng.choice([1, 2, -1, -2])
+            h = self.rng.randint(-4, 4)
+            k = self.rng.randint(-4, 4)
             latex = f"\\text{{Find the domain and range of }} f(x) = {'' if a == 1 else a}|x {'-' if h < 0 else '+'} {abs(h)}| {'+' if k >= 0 else '-'} {abs(k)}"
 
             if a > 0:
@@ -135,15 +132,15 @@ class GraphsAbsoluteValueFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        problem_type = random.choice(['write_equation', 'complex_transformations'])
+        problem_type = self.rng.choice(['write_equation', 'complex_transformations'])
 
         if problem_type == 'write_equation':
-            h = random.randint(-5, 5)
-            k = random.randint(-5, 5)
-            a = random.choice([2, 3, -2, -3, 0.5, -0.5])
+            h = self.rng.randint(-5, 5)
+            k = self.rng.randint(-5, 5)
+            a = self.rng.choice([2, 3, -2, -3, 0.5, -0.5])
 
             # Give a point on the graph
-            x_point = h + random.choice([1, 2, -1, -2])
+            x_point = h + self.rng.choice([1, 2, -1, -2])
             y_point = a * abs(x_point - h) + k
 
             latex = f"\\text{{Write an equation for an absolute value function with vertex }} ({h}, {k}) \\text{{ passing through }} ({x_point}, {y_point})"
@@ -160,9 +157,9 @@ class GraphsAbsoluteValueFunctionsGenerator:
                 f"f(x) = {a}|x {'-' if h < 0 else '+'} {abs(h)}| {'+' if k >= 0 else '-'} {abs(k)}"
             ]
         else:  # complex_transformations
-            a = random.choice([2, -2, 3, -3, 0.5, -0.5])
-            h = random.randint(-6, 6)
-            k = random.randint(-6, 6)
+            a = self.rng.choice([2, -2, 3, -3, 0.5, -0.5])
+            h = self.rng.randint(-6, 6)
+            k = self.rng.randint(-6, 6)
             latex = f"\\text{{Find the vertex, axis of symmetry, domain, and range of }} f(x) = {a}|x {'-' if h < 0 else '+'} {abs(h)}| {'+' if k >= 0 else '-'} {abs(k)}"
 
             if a > 0:
@@ -3,14 +3,11 @@ Piecewise Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class PiecewiseFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,14 +19,14 @@ class PiecewiseFunctionsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        problem_type = random.choice(['evaluate', 'simple_evaluate'])
+        problem_type = self.rng.choice(['evaluate', 'simple_evaluate'])
 
         if problem_type == 'evaluate':
-            a = random.randint(1, 5)
-            b = random.randint(-5, 5)
-            c = random.randint(1, 5)
-            threshold = random.randint(-2, 2)
-            x_val = random.choice([threshold - 2, threshold + 2])
+            a = self.rng.randint(1, 5)
+            b = self.rng.randint(-5, 5)
+            c = self.rng.randint(1, 5)
+            threshold = self.rng.randint(-2, 2)
+            x_val = self.rng.choice([threshold - 2, threshold + 2])
 
             latex = f"\\text{{Evaluate }} f({x_val}) \\text{{ where }} f(x) = \\begin{{cases}} {a}x {'+' if b >= 0 else ''} {b} & x < {threshold} \\\\ {c} & x \\geq {threshold} \\end{{cases}}"
 
@@ -50,10 +47,10 @@ class PiecewiseFunctionsGenerator:
 
             solution = str(result)
         else:  # simple_evaluate
-            m1 = random.randint(1, 4)
-            m2 = random.randint(-4, -1)
+            m1 = self.rng.randint(1, 4)
+            m2 = self.rng.randint(-4, -1)
             threshold = 0
-            x_val = random.choice([-3, -2, -1, 1, 2, 3])
+            x_val = self.rng.choice([-3, -2, -1, 1, 2, 3])
 
             latex = f"\\text{{Evaluate }} f({x_val}) \\text{{ where }} f(x) = \\begin{{cases}} {m1}x & x < 0 \\\\ {m2}x & x \\geq 0 \\end{{cases}}"
 
@@ -77,14 +74,14 @@ class PiecewiseFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        problem_type = random.choice(['three_pieces', 'quadratic_piece'])
+        problem_type = self.rng.choice(['three_pieces', 'quadratic_piece'])
 
         if problem_type == 'three_pieces':
-            a = random.randint(1, 4)
-            c = random.randint(-5, 5)
-            t1 = random.randint(-2, 0)
-            t2 = random.randint(1, 3)
-            x_val = random.choice([t1 - 2, t1, t2, t2 + 2])
+            a = self.rng.randint(1, 4)
+            c = self.rng.randint(-5, 5)
+            t1 = self.rng.randint(-2, 0)
+            t2 = self.rng.randint(1, 3)
+            x_val = self.rng.choice([t1 - 2, t1, t2, t2 + 2])
 
             latex = f"\\text{{Evaluate }} f({x_val}) \\text{{ where }} f(x) = \\begin{{cases}} {a}x & x < {t1} \\\\ {c} & {t1} \\leq x < {t2} \\\\ -{a}x & x \\geq {t2} \\end{{cases}}"
 
@@ -111,10 +108,10 @@ class PiecewiseFunctionsGenerator:
 
             solution = str(result)
         else:  # quadratic_piece
-            a = random.randint(1, 3)
-            b = random.randint(1, 5)
-            threshold = random.randint(0, 2)
-            x_val = random.choice([threshold - 2, threshold + 2])
+            a = self.rng.randint(1, 3)
+            b = self.rng.randint(1, 5)
+            threshold = self.rng.randint(0, 2)
+            x_val = self.rng.choice([threshold - 2, threshold + 2])
 
             latex = f"\\text{{Evaluate }} f({x_val}) \\text{{ where }} f(x) = \\begin{{cases}} x^2 {'+' if a >= 0 else ''} {a} & x < {threshold} \\\\ {b}x & x \\geq {threshold} \\end{{cases}}"
 
@@ -139,13 +136,13 @@ class PiecewiseFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        problem_type = random.choice(['find_domain_range', 'absolute_value_piece'])
+        problem_type = self.rng.choice(['find_domain_range', 'absolute_value_piece'])
 
         if problem_type == 'find_domain_range':
-            m1 = random.randint(1, 3)
-            b1 = random.randint(-3, 3)
-            c = random.randint(-5, 5)
-            threshold = random.randint(-1, 2)
+            m1 = self.rng.randint(1, 3)
+            b1 = self.rng.randint(-3, 3)
+            c = self.rng.randint(-5, 5)
+            threshold = self.rng.randint(-1, 2)
 
             # Calculate values at boundary
             left_val = m1 * threshold + b1
@@ -168,10 +165,10 @@ class PiecewiseFunctionsGenerator:
                 f"Range: {range_desc}"
             ]
         else:  # absolute_value_piece
-            a = random.randint(2, 5)
-            b = random.randint(1, 4)
-            threshold = random.randint(-2, 2)
-            x_val = random.choice([threshold - 2, threshold + 1])
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 4)
+            threshold = self.rng.randint(-2, 2)
+            x_val = self.rng.choice([threshold - 2, threshold + 1])
 
             latex = f"\\text{{Evaluate }} f({x_val}) \\text{{ where }} f(x) = \\begin{{cases}} |x {'+' if threshold >= 0 else ''} {-threshold}| & x < {threshold} \\\\ {a}x {'+' if b >= 0 else ''} {b} & x \\geq {threshold} \\end{{cases}}"
 
@@ -198,14 +195,14 @@ class PiecewiseFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        problem_type = random.choice(['continuity', 'complex_evaluation'])
+        problem_type = self.rng.choice(['continuity', 'complex_evaluation'])
 
         if problem_type == 'continuity':
-            m = random.randint(2, 5)
-            threshold = random.randint(1, 4)
+            m = self.rng.randint(2, 5)
+            threshold = self.rng.randint(1, 4)
             # For continuity: m*threshold + b = threshold^2 + c
             # We'll find b when c is chosen
-            c = random.randint(-3, 3)
+            c = self.rng.randint(-3, 3)
             b = threshold**2 + c - m * threshold
 
             latex = f"\\text{{Is }} f(x) = \\begin{{cases}} {m}x {'+' if b >= 0 else ''} {b} & x < {threshold} \\\\ x^2 {'+' if c >= 0 else ''} {c} & x \\geq {threshold} \\end{{cases}} \\text{{ continuous at }} x = {threshold}?"
@@ -223,12 +220,12 @@ class PiecewiseFunctionsGenerator:
                 f"Since limits {'match' if is_continuous else 'do not match'}: {solution}"
             ]
         else:  # complex_evaluation
-            a = random.randint(2, 4)
-            b = random.randint(1, 3)
-            c = random.randint(-4, 4)
-            t1 = random.randint(-2, 0)
-            t2 = random.randint(2, 4)
-            x_val = random.choice([t1 - 1, t1, t2 - 1, t2 + 1])
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(1, 3)
+            c = self.rng.randint(-4, 4)
+            t1 = self.rng.randint(-2, 0)
+            t2 = self.rng.randint(2, 4)
+            x_val = self.rng.choice([t1 - 1, t1, t2 - 1, t2 + 1])
 
             latex = f"\\text{{Evaluate }} f({x_val}) \\text{{ where }} f(x) = \\begin{{cases}} x^2 {'-' if a >= 0 else '+'} {abs(a)} & x < {t1} \\\\ {b}x {'+' if c >= 0 else ''} {c} & {t1} \\leq x < {t2} \\\\ -x^2 {'+' if a >= 0 else ''} {a} & x \\geq {t2} \\end{{cases}}"
 
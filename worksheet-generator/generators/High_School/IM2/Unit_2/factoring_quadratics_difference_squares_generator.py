@@ -3,14 +3,11 @@ Factoring Quadratics - Difference of Squares Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FactoringQuadraticsDifferenceSquaresGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class FactoringQuadraticsDifferenceSquaresGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple x² - a²
-        a = random.randint(2, 8)
+        a = self.rng.randint(2, 8)
 
         latex = f"\\text{{Factor: }} x^2 - {a**2}"
         solution = f"(x + {a})(x - {a})"
@@ -38,8 +35,8 @@ class FactoringQuadraticsDifferenceSquaresGenerator:
 
     def _generate_medium(self) -> Equation:
         # Coefficient with x
-        a = random.randint(2, 6)
-        b = random.randint(2, 7)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 7)
 
         coef = a**2
         const = b**2
@@ -57,9 +54,9 @@ class FactoringQuadraticsDifferenceSquaresGenerator:
 
     def _generate_hard(self) -> Equation:
         # Factor out GCF first, then difference of squares
-        gcf = random.randint(2, 5)
-        a = random.randint(1, 4)
-        b = random.randint(2, 5)
+        gcf = self.rng.randint(2, 5)
+        a = self.rng.randint(1, 4)
+        b = self.rng.randint(2, 5)
 
         coef_x2 = gcf * a**2
         const = gcf * b**2
@@ -78,9 +75,9 @@ class FactoringQuadraticsDifferenceSquaresGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Higher powers that are perfect squares
-        a = random.randint(2, 4)
-        power = random.choice([2, 3])
-        b = random.randint(2, 5)
+        a = self.rng.randint(2, 4)
+        power = self.rng.choice([2, 3])
+        b = self.rng.randint(2, 5)
 
         total_power = 2 * power
         const = b**2
@@ -3,14 +3,11 @@ Factoring Quadratics by Grouping Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FactoringQuadraticsGroupingGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,9 +20,9 @@ class FactoringQuadraticsGroupingGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple grouping with clear common factors
-        a = random.randint(1, 3)
-        b = random.randint(1, 4)
-        c = random.randint(1, 3)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(1, 4)
+        c = self.rng.randint(1, 3)
 
         # (ax + b)(x + c) = ax² + acx + bx + bc
         term1 = a
@@ -48,9 +45,9 @@ class FactoringQuadraticsGroupingGenerator:
 
     def _generate_medium(self) -> Equation:
         # Grouping with larger coefficients
-        a = random.randint(2, 5)
-        b = random.randint(2, 6)
-        c = random.randint(1, 4)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(1, 4)
 
         # (ax + b)(x + c) = ax² + (ac+b)x + bc
         coef_x2 = a
@@ -72,9 +69,9 @@ class FactoringQuadraticsGroupingGenerator:
 
     def _generate_hard(self) -> Equation:
         # Grouping with negative terms
-        a = random.randint(2, 4)
-        b = random.randint(1, 5)
-        c = random.randint(1, 4)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 4)
 
         # (ax - b)(x - c) = ax² - (ac+b)x + bc
         coef_x2 = a
@@ -96,9 +93,9 @@ class FactoringQuadraticsGroupingGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Grouping with mixed signs
-        a = random.randint(2, 5)
-        b = random.randint(2, 6)
-        c = random.randint(1, 4)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(1, 4)
 
         # (ax + b)(x - c) = ax² + (-ac+b)x - bc
         coef_x2 = a
@@ -3,14 +3,11 @@ Factoring Quadratics Introduction Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FactoringQuadraticsIntroGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class FactoringQuadraticsIntroGenerator:
 
     def _generate_easy(self) -> Equation:
         # x² + bx + c where factors are small positive integers
-        p = random.randint(1, 5)
-        q = random.randint(1, 5)
+        p = self.rng.randint(1, 5)
+        q = self.rng.randint(1, 5)
         b = p + q
         c = p * q
 
@@ -41,10 +38,10 @@ class FactoringQuadraticsIntroGenerator:
 
     def _generate_medium(self) -> Equation:
         # x² + bx + c with one or both factors negative
-        p = random.randint(1, 6)
-        q = random.randint(1, 6)
+        p = self.rng.randint(1, 6)
+        q = self.rng.randint(1, 6)
 
-        sign_choice = random.choice(['both_neg', 'one_neg'])
+        sign_choice = self.rng.choice(['both_neg', 'one_neg'])
 
         if sign_choice == 'both_neg':
             b = -(p + q)
@@ -85,9 +82,9 @@ class FactoringQuadraticsIntroGenerator:
 
     def _generate_hard(self) -> Equation:
         # ax² + bx + c where a > 1
-        a = random.randint(2, 4)
-        p = random.randint(1, 4)
-        q = random.randint(1, 4)
+        a = self.rng.randint(2, 4)
+        p = self.rng.randint(1, 4)
+        q = self.rng.randint(1, 4)
 
         # (ax + p)(x + q) = ax² + (aq + p)x + pq
         b = a * q + p
@@ -107,9 +104,9 @@ class FactoringQuadraticsIntroGenerator:
 
     def _generate_challenge(self) -> Equation:
         # ax² + bx + c with a > 1 and negative terms
-        a = random.randint(2, 4)
-        p = random.randint(1, 4)
-        q = random.randint(1, 4)
+        a = self.rng.randint(2, 4)
+        p = self.rng.randint(1, 4)
+        q = self.rng.randint(1, 4)
 
         # (ax - p)(x - q) = ax² - (aq + p)x + pq
         b = -(a * q + p)
@@ -3,14 +3,11 @@ Factoring Quadratics - Perfect Square Trinomials Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FactoringQuadraticsPerfectSquaresGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class FactoringQuadraticsPerfectSquaresGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple (x + a)² or (x - a)²
-        a = random.randint(1, 8)
-        sign = random.choice(['+', '-'])
+        a = self.rng.randint(1, 8)
+        sign = self.rng.choice(['+', '-'])
 
         if sign == '+':
             middle = 2 * a
@@ -57,9 +54,9 @@ class FactoringQuadraticsPerfectSquaresGenerator:
 
     def _generate_medium(self) -> Equation:
         # (ax + b)² or (ax - b)²
-        a = random.randint(2, 5)
-        b = random.randint(1, 6)
-        sign = random.choice(['+', '-'])
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 6)
+        sign = self.rng.choice(['+', '-'])
 
         coef_x2 = a**2
         middle = 2 * a * b
@@ -90,10 +87,10 @@ class FactoringQuadraticsPerfectSquaresGenerator:
 
     def _generate_hard(self) -> Equation:
         # Factor out GCF first, then perfect square
-        gcf = random.randint(2, 4)
-        a = random.randint(1, 4)
-        b = random.randint(1, 5)
-        sign = random.choice(['+', '-'])
+        gcf = self.rng.randint(2, 4)
+        a = self.rng.randint(1, 4)
+        b = self.rng.randint(1, 5)
+        sign = self.rng.choice(['+', '-'])
 
         coef_x2 = gcf * a**2
         middle = gcf * 2 * a * b
@@ -124,10 +121,10 @@ class FactoringQuadraticsPerfectSquaresGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Higher degree perfect squares
-        a = random.randint(1, 3)
-        power = random.choice([2, 3])
-        b = random.randint(1, 4)
-        sign = random.choice(['+', '-'])
+        a = self.rng.randint(1, 3)
+        power = self.rng.choice([2, 3])
+        b = self.rng.randint(1, 4)
+        sign = self.rng.choice(['+', '-'])
 
         coef_x = a**2
         total_power = 2 * power
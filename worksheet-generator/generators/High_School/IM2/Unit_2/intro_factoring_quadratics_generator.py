@@ -3,14 +3,11 @@ Introduction to Factoring Quadratics Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class IntroFactoringQuadraticsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,9 +20,9 @@ class IntroFactoringQuadraticsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple GCF factoring
-        gcf = random.randint(2, 6)
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        gcf = self.rng.randint(2, 6)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         coef_x2 = gcf * a
         coef_x = gcf * b
@@ -45,10 +42,10 @@ class IntroFactoringQuadraticsGenerator:
 
     def _generate_medium(self) -> Equation:
         # GCF from all three terms
-        gcf = random.randint(2, 5)
-        a = random.randint(1, 4)
-        b = random.randint(1, 6)
-        c = random.randint(1, 6)
+        gcf = self.rng.randint(2, 5)
+        a = self.rng.randint(1, 4)
+        b = self.rng.randint(1, 6)
+        c = self.rng.randint(1, 6)
 
         coef_x2 = gcf * a
         coef_x = gcf * b
@@ -70,11 +67,11 @@ class IntroFactoringQuadraticsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Factor with variables in GCF
-        gcf_coef = random.randint(2, 4)
-        gcf_power = random.randint(2, 3)
-        a = random.randint(1, 4)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
+        gcf_coef = self.rng.randint(2, 4)
+        gcf_power = self.rng.randint(2, 3)
+        a = self.rng.randint(1, 4)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
 
         highest_power = gcf_power + 2
 
@@ -93,10 +90,10 @@ class IntroFactoringQuadraticsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Negative GCF
-        gcf = random.randint(2, 5)
-        a = random.randint(1, 4)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
+        gcf = self.rng.randint(2, 5)
+        a = self.rng.randint(1, 4)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
 
         coef_x2 = -gcf * a
         coef_x = -gcf * b
@@ -3,14 +3,11 @@ Multiplying Binomials (Quadratics) Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class MultiplyingBinomialsQuadraticsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,10 +19,10 @@ class MultiplyingBinomialsQuadraticsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        sign1 = random.choice(['+', '-'])
-        sign2 = random.choice(['+', '-'])
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        sign1 = self.rng.choice(['+', '-'])
+        sign2 = self.rng.choice(['+', '-'])
 
         latex = f"(x {sign1} {a})(x {sign2} {b})"
 
@@ -51,12 +48,12 @@ class MultiplyingBinomialsQuadraticsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(1, 6)
-        c = random.randint(2, 5)
-        d = random.randint(1, 6)
-        sign1 = random.choice(['+', '-'])
-        sign2 = random.choice(['+', '-'])
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 6)
+        c = self.rng.randint(2, 5)
+        d = self.rng.randint(1, 6)
+        sign1 = self.rng.choice(['+', '-'])
+        sign2 = self.rng.choice(['+', '-'])
 
         latex = f"({a}x {sign1} {b})({c}x {sign2} {d})"
 
@@ -82,12 +79,12 @@ class MultiplyingBinomialsQuadraticsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.randint(1, 8)
-        c = random.randint(2, 6)
-        d = random.randint(1, 8)
-        sign1 = random.choice(['+', '-'])
-        sign2 = random.choice(['+', '-'])
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 8)
+        c = self.rng.randint(2, 6)
+        d = self.rng.randint(1, 8)
+        sign1 = self.rng.choice(['+', '-'])
+        sign2 = self.rng.choice(['+', '-'])
 
         latex = f"({a}x {sign1} {b})({c}x {sign2} {d})"
 
@@ -111,13 +108,13 @@ class MultiplyingBinomialsQuadraticsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(1, 6)
-        c = random.randint(2, 5)
-        d = random.randint(1, 6)
-        e = random.randint(1, 4)
-        sign1 = random.choice(['+', '-'])
-        sign2 = random.choice(['+', '-'])
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 6)
+        c = self.rng.randint(2, 5)
+        d = self.rng.randint(1, 6)
+        e = self.rng.randint(1, 4)
+        sign1 = self.rng.choice(['+', '-'])
+        sign2 = self.rng.choice(['+', '-'])
 
         latex = f"({a}x {sign1} {b})({c}x {sign2} {d}) + {e}x^2"
 
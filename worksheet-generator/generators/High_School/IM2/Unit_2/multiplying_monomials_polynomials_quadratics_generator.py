@@ -3,14 +3,11 @@ Multiplying Monomials and Polynomials (Quadratics) Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class MultiplyingMonomialsPolynomialsQuadraticsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,13 +19,13 @@ class MultiplyingMonomialsPolynomialsQuadraticsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        problem_type = random.choice(['monomial_binomial', 'simple_distribute'])
+        problem_type = self.rng.choice(['monomial_binomial', 'simple_distribute'])
 
         if problem_type == 'monomial_binomial':
-            a = random.randint(2, 6)
-            b = random.randint(1, 8)
-            c = random.randint(1, 8)
-            sign = random.choice(['+', '-'])
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 8)
+            c = self.rng.randint(1, 8)
+            sign = self.rng.choice(['+', '-'])
 
             latex = f"{a}x({b}x {sign} {c})"
 
@@ -51,9 +48,9 @@ class MultiplyingMonomialsPolynomialsQuadraticsGenerator:
                     f"{result_b}x² - {result_c}x"
                 ]
         else:  # simple_distribute
-            a = random.randint(1, 5)
-            b = random.randint(1, 7)
-            c = random.randint(1, 7)
+            a = self.rng.randint(1, 5)
+            b = self.rng.randint(1, 7)
+            c = self.rng.randint(1, 7)
 
             latex = f"{a}(x^2 + {b}x + {c})"
             solution = f"{a}x^2 + {a*b}x + {a*c}"
@@ -66,15 +63,15 @@ class MultiplyingMonomialsPolynomialsQuadraticsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        problem_type = random.choice(['monomial_trinomial', 'negative_monomial'])
+        problem_type = self.rng.choice(['monomial_trinomial', 'negative_monomial'])
 
         if problem_type == 'monomial_trinomial':
-            a = random.randint(2, 5)
-            b = random.randint(1, 6)
-            c = random.randint(1, 6)
-            d = random.randint(1, 6)
-            sign1 = random.choice(['+', '-'])
-            sign2 = random.choice(['+', '-'])
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 6)
+            c = self.rng.randint(1, 6)
+            d = self.rng.randint(1, 6)
+            sign1 = self.rng.choice(['+', '-'])
+            sign2 = self.rng.choice(['+', '-'])
 
             latex = f"{a}x({b}x^2 {sign1} {c}x {sign2} {d})"
 
@@ -90,10 +87,10 @@ class MultiplyingMonomialsPolynomialsQuadraticsGenerator:
                 solution
             ]
         else:  # negative_monomial
-            a = random.randint(2, 6)
-            b = random.randint(1, 5)
-            c = random.randint(1, 5)
-            sign = random.choice(['+', '-'])
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 5)
+            c = self.rng.randint(1, 5)
+            sign = self.rng.choice(['+', '-'])
 
             latex = f"-{a}x({b}x {sign} {c})"
 
@@ -110,16 +107,16 @@ class MultiplyingMonomialsPolynomialsQuadraticsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        problem_type = random.choice(['coefficient_with_power', 'complex_distribution'])
+        problem_type = self.rng.choice(['coefficient_with_power', 'complex_distribution'])
 
         if problem_type == 'coefficient_with_power':
-            a = random.randint(2, 5)
-            exp = random.randint(2, 3)
-            b = random.randint(1, 6)
-            c = random.randint(1, 6)
-            d = random.randint(1, 6)
-            sign1 = random.choice(['+', '-'])
-            sign2 = random.choice(['+', '-'])
+            a = self.rng.randint(2, 5)
+            exp = self.rng.randint(2, 3)
+            b = self.rng.randint(1, 6)
+            c = self.rng.randint(1, 6)
+            d = self.rng.randint(1, 6)
+            sign1 = self.rng.choice(['+', '-'])
+            sign2 = self.rng.choice(['+', '-'])
 
             latex = f"{a}x^{exp}({b}x^2 {sign1} {c}x {sign2} {d})"
 
@@ -139,11 +136,11 @@ class MultiplyingMonomialsPolynomialsQuadraticsGenerator:
                 solution
             ]
         else:  # complex_distribution
-            a = random.randint(2, 4)
-            b = random.randint(2, 4)
-            c = random.randint(1, 5)
-            d = random.randint(1, 5)
-            e = random.randint(1, 5)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(2, 4)
+            c = self.rng.randint(1, 5)
+            d = self.rng.randint(1, 5)
+            e = self.rng.randint(1, 5)
 
             latex = f"{a}x^2(x^2 - {b}x + {c}) + {d}x({e}x - {b})"
 
@@ -173,13 +170,13 @@ class MultiplyingMonomialsPolynomialsQuadraticsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 4)
-        b = random.randint(1, 3)
-        c = random.randint(2, 5)
-        d = random.randint(1, 4)
-        e = random.randint(1, 3)
-        sign1 = random.choice(['+', '-'])
-        sign2 = random.choice(['+', '-'])
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(1, 3)
+        c = self.rng.randint(2, 5)
+        d = self.rng.randint(1, 4)
+        e = self.rng.randint(1, 3)
+        sign1 = self.rng.choice(['+', '-'])
+        sign2 = self.rng.choice(['+', '-'])
 
         latex = f"{a}x^2({b}x^3 {sign1} {c}x {sign2} {d}) - {e}x^2({b}x^2 - {c})"
 
@@ -3,14 +3,11 @@ Special Products of Binomials (Quadratics) Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SpecialProductsBinomialsQuadraticsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,11 +19,11 @@ class SpecialProductsBinomialsQuadraticsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        problem_type = random.choice(['perfect_square', 'difference_squares'])
+        problem_type = self.rng.choice(['perfect_square', 'difference_squares'])
 
         if problem_type == 'perfect_square':
-            a = random.randint(1, 8)
-            sign = random.choice(['+', '-'])
+            a = self.rng.randint(1, 8)
+            sign = self.rng.choice(['+', '-'])
 
             latex = f"(x {sign} {a})^2"
 
@@ -47,7 +44,7 @@ class SpecialProductsBinomialsQuadraticsGenerator:
                     f"= x² - {2*a}x + {a**2}"
                 ]
         else:  # difference_squares
-            a = random.randint(2, 8)
+            a = self.rng.randint(2, 8)
 
             latex = f"(x + {a})(x - {a})"
             solution = f"x^2 - {a**2}"
@@ -61,12 +58,12 @@ class SpecialProductsBinomialsQuadraticsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        problem_type = random.choice(['perfect_square_coefficient', 'difference_squares_coefficient'])
+        problem_type = self.rng.choice(['perfect_square_coefficient', 'difference_squares_coefficient'])
 
         if problem_type == 'perfect_square_coefficient':
-            a = random.randint(2, 5)
-            b = random.randint(1, 6)
-            sign = random.choice(['+', '-'])
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 6)
+            sign = self.rng.choice(['+', '-'])
 
             latex = f"({a}x {sign} {b})^2"
 
@@ -87,8 +84,8 @@ class SpecialProductsBinomialsQuadraticsGenerator:
                     f"= {a**2}x² - {2*a*b}x + {b**2}"
                 ]
         else:  # difference_squares_coefficient
-            a = random.randint(2, 6)
-            b = random.randint(2, 7)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(2, 7)
 
             latex = f"({a}x + {b})({a}x - {b})"
             solution = f"{a**2}x^2 - {b**2}"
@@ -102,11 +99,11 @@ class SpecialProductsBinomialsQuadraticsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        problem_type = random.choice(['cube_pattern', 'complex_special'])
+        problem_type = self.rng.choice(['cube_pattern', 'complex_special'])
 
         if problem_type == 'cube_pattern':
-            a = random.randint(1, 5)
-            sign = random.choice(['+', '-'])
+            a = self.rng.randint(1, 5)
+            sign = self.rng.choice(['+', '-'])
 
             latex = f"(x {sign} {a})^3"
 
@@ -131,9 +128,9 @@ class SpecialProductsBinomialsQuadraticsGenerator:
                     f"= x³ - {3*a}x² + {3*a**2}x - {a**3}"
                 ]
         else:  # complex_special
-            a = random.randint(2, 4)
-            b = random.randint(1, 5)
-            c = random.randint(2, 4)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(1, 5)
+            c = self.rng.randint(2, 4)
 
             latex = f"({a}x + {b})^2 - ({c}x)^2"
 
@@ -156,10 +153,10 @@ class SpecialProductsBinomialsQuadraticsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 4)
-        b = random.randint(1, 4)
-        c = random.randint(2, 4)
-        d = random.randint(1, 4)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(1, 4)
+        c = self.rng.randint(2, 4)
+        d = self.rng.randint(1, 4)
 
         latex = f"({a}x + {b})^2 + ({c}x - {d})^2"
 
@@ -3,14 +3,11 @@ Completing the Square Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class CompletingTheSquareGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class CompletingTheSquareGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        b = random.choice([2, 4, 6, 8, 10])
+        b = self.rng.choice([2, 4, 6, 8, 10])
         half_b = b // 2
         c_to_add = half_b ** 2
         latex = f"\\text{{Complete the square: }} x^2 + {b}x + \\underline{{\\hspace{{1cm}}}}"
@@ -36,10 +33,10 @@ class CompletingTheSquareGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        b = random.randint(-10, 10)
+        b = self.rng.randint(-10, 10)
         if b == 0:
             b = 4
-        c = random.randint(-8, 8)
+        c = self.rng.randint(-8, 8)
         half_b = b / 2
         c_needed = half_b ** 2
         h = -half_b
@@ -57,9 +54,9 @@ class CompletingTheSquareGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 4)
-        b = random.randint(-8, 8)
-        c = random.randint(-8, 8)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(-8, 8)
+        c = self.rng.randint(-8, 8)
         b_over_a = b / a
         half_b_over_a = b_over_a / 2
         c_needed = half_b_over_a ** 2
@@ -76,9 +73,9 @@ class CompletingTheSquareGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(1, 3)
-        b = random.randint(-10, 10)
-        c = random.randint(-10, 10)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(-10, 10)
+        c = self.rng.randint(-10, 10)
         h = -b / (2 * a)
         k = c - (b ** 2) / (4 * a)
         latex = f"\\text{{Solve by completing the square: }} {a}x^2 {'+' if b >= 0 else ''}{b}x {'+' if c >= 0 else ''}{c} = 0"
@@ -3,14 +3,11 @@ Features and Forms of Quadratic Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FeaturesFormsQuadraticFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,9 +19,9 @@ class FeaturesFormsQuadraticFunctionsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.choice([1, 2, -1, -2])
-        h = random.randint(-4, 4)
-        k = random.randint(-4, 4)
+        a = self.rng.choice([1, 2, -1, -2])
+        h = self.rng.randint(-4, 4)
+        k = self.rng.randint(-4, 4)
         latex = f"\\text{{Identify the form: }} y = {'' if a == 1 else a}(x {'-' if h < 0 else '+'} {abs(h)})^2 {'+' if k >= 0 else ''}{k}"
         solution = f"Vertex form: vertex ({h}, {k})"
         steps = [
@@ -35,11 +32,11 @@ class FeaturesFormsQuadraticFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        r1 = random.randint(-4, 4)
-        r2 = random.randint(-4, 4)
+        r1 = self.rng.randint(-4, 4)
+        r2 = self.rng.randint(-4, 4)
         while r1 == r2:
-            r2 = random.randint(-4, 4)
-        a = random.choice([1, 2, -1])
+            r2 = self.rng.randint(-4, 4)
+        a = self.rng.choice([1, 2, -1])
         latex = f"\\text{{Identify the form: }} y = {'' if a == 1 else a}(x {'-' if r1 < 0 else '+'} {abs(r1)})(x {'-' if r2 < 0 else '+'} {abs(r2)})"
         solution = f"Factored form: x-intercepts at {r1} and {r2}"
         steps = [
@@ -50,9 +47,9 @@ class FeaturesFormsQuadraticFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(1, 3)
-        b = random.randint(-8, 8)
-        c = random.randint(-8, 8)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(-8, 8)
+        c = self.rng.randint(-8, 8)
         h = -b / (2 * a)
         k = a * h ** 2 + b * h + c
         latex = f"\\text{{Find all key features of }} y = {a}x^2 {'+' if b >= 0 else ''}{b}x {'+' if c >= 0 else ''}{c}"
@@ -67,11 +64,11 @@ class FeaturesFormsQuadraticFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        form = random.choice(['standard_to_vertex', 'vertex_to_factored'])
+        form = self.rng.choice(['standard_to_vertex', 'vertex_to_factored'])
         if form == 'standard_to_vertex':
-            a = random.randint(1, 3)
-            b = random.randint(-6, 6)
-            c = random.randint(-6, 6)
+            a = self.rng.randint(1, 3)
+            b = self.rng.randint(-6, 6)
+            c = self.rng.randint(-6, 6)
             h = -b / (2 * a)
             k = c - (b ** 2) / (4 * a)
             latex = f"\\text{{Convert to vertex form: }} y = {a}x^2 {'+' if b >= 0 else ''}{b}x {'+' if c >= 0 else ''}{c}"
@@ -83,8 +80,8 @@ class FeaturesFormsQuadraticFunctionsGenerator:
                 solution
             ]
         else:
-            h = random.randint(-3, 3)
-            k = random.randint(-4, 4)
+            h = self.rng.randint(-3, 3)
+            k = self.rng.randint(-4, 4)
             if k >= 0:
                 import math
                 sqrt_k = math.sqrt(k)
@@ -3,14 +3,11 @@ Introduction to Parabolas Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class IntroParabolasGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class IntroParabolasGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.choice([1, 2, 3, -1, -2])
+        a = self.rng.choice([1, 2, 3, -1, -2])
         latex = f"\\text{{Identify the vertex and direction of }} y = {a if a != 1 else ''}x^2"
         solution = f"Vertex: (0, 0), Opens {'up' if a > 0 else 'down'}"
         steps = [
@@ -34,9 +31,9 @@ class IntroParabolasGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.choice([1, 2, -1, -2, 0.5, -0.5])
-        h = random.randint(-4, 4)
-        k = random.randint(-4, 4)
+        a = self.rng.choice([1, 2, -1, -2, 0.5, -0.5])
+        h = self.rng.randint(-4, 4)
+        k = self.rng.randint(-4, 4)
         latex = f"\\text{{Find the vertex of }} y = {'' if a == 1 else a}(x {'-' if h < 0 else '+'} {abs(h)})^2 {'+' if k >= 0 else ''} {k}"
         solution = f"({h}, {k})"
         steps = [
@@ -49,9 +46,9 @@ class IntroParabolasGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.choice([1, 2, 3, -1, -2])
-        h = random.randint(-5, 5)
-        k = random.randint(-5, 5)
+        a = self.rng.choice([1, 2, 3, -1, -2])
+        h = self.rng.randint(-5, 5)
+        k = self.rng.randint(-5, 5)
         latex = f"\\text{{Find vertex, axis of symmetry, and direction for }} y = {a if a != 1 else ''}(x {'-' if h < 0 else '+'} {abs(h)})^2 {'+' if k >= 0 else ''} {k}"
         solution = f"Vertex: ({h}, {k}), Axis: x = {h}, Opens {'up' if a > 0 else 'down'}"
         steps = [
@@ -63,9 +60,9 @@ class IntroParabolasGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(1, 3)
-        b = random.randint(-8, 8)
-        c = random.randint(-8, 8)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(-8, 8)
+        c = self.rng.randint(-8, 8)
         h = -b / (2 * a)
         k = a * h**2 + b * h + c
         latex = f"\\text{{Convert to vertex form: }} y = {a}x^2 {'+' if b >= 0 else ''}{b}x {'+' if c >= 0 else ''}{c}"
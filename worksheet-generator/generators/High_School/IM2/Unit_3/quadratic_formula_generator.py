@@ -3,15 +3,12 @@ Quadratic Formula Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 import math
 
 class QuadraticFormulaGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class QuadraticFormulaGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a, b, c = 1, random.randint(-6, 6), random.randint(-8, 8)
+        a, b, c = 1, self.rng.randint(-6, 6), self.rng.randint(-8, 8)
         disc = b**2 - 4*a*c
         if disc < 0:
             c = -abs(c)
@@ -46,9 +43,9 @@ class QuadraticFormulaGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 4)
-        b = random.randint(-8, 8)
-        c = random.randint(-8, 8)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(-8, 8)
+        c = self.rng.randint(-8, 8)
         disc = b**2 - 4*a*c
         latex = f"\\text{{Solve using quadratic formula: }} {a}x^2 {'+' if b >= 0 else ''}{b}x {'+' if c >= 0 else ''}{c} = 0"
         solution = f"x = \\frac{{-{b} \\pm \\sqrt{{{disc}}}}}{{{2*a}}}"
@@ -60,9 +57,9 @@ class QuadraticFormulaGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(-10, 10)
-        c = random.randint(-10, 10)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(-10, 10)
+        c = self.rng.randint(-10, 10)
         disc = b**2 - 4*a*c
         latex = f"\\text{{Solve: }} {a}x^2 {'+' if b >= 0 else ''}{b}x {'+' if c >= 0 else ''}{c} = 0"
         if disc >= 0 and math.sqrt(disc) == int(math.sqrt(disc)):
@@ -80,9 +77,9 @@ class QuadraticFormulaGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(1, 3)
-        b = random.randint(-6, 6)
-        c = random.randint(1, 8)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(-6, 6)
+        c = self.rng.randint(1, 8)
         disc = b**2 - 4*a*c
         if disc < 0:
             latex = f"\\text{{Solve: }} {a}x^2 {'+' if b >= 0 else ''}{b}x + {c} = 0"
@@ -3,14 +3,11 @@ Solving and Graphing Factored Form Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SolvingGraphingFactoredFormGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,10 +19,10 @@ class SolvingGraphingFactoredFormGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        r1 = random.randint(-5, 5)
-        r2 = random.randint(-5, 5)
+        r1 = self.rng.randint(-5, 5)
+        r2 = self.rng.randint(-5, 5)
         while r1 == r2:
-            r2 = random.randint(-5, 5)
+            r2 = self.rng.randint(-5, 5)
         latex = f"\\text{{Find the x-intercepts of }} y = (x {'-' if r1 < 0 else '+'} {abs(r1)})(x {'-' if r2 < 0 else '+'} {abs(r2)})"
         solution = f"x = {r1}, x = {r2}"
         steps = [
@@ -37,11 +34,11 @@ class SolvingGraphingFactoredFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 4)
-        r1 = random.randint(-4, 4)
-        r2 = random.randint(-4, 4)
+        a = self.rng.randint(2, 4)
+        r1 = self.rng.randint(-4, 4)
+        r2 = self.rng.randint(-4, 4)
         while r1 == r2:
-            r2 = random.randint(-4, 4)
+            r2 = self.rng.randint(-4, 4)
         latex = f"\\text{{Find the x-intercepts of }} y = {a}(x {'-' if r1 < 0 else '+'} {abs(r1)})(x {'-' if r2 < 0 else '+'} {abs(r2)})"
         solution = f"x = {r1}, x = {r2}"
         steps = [
@@ -53,11 +50,11 @@ class SolvingGraphingFactoredFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(1, 3)
-        r1 = random.randint(-4, 4)
-        r2 = random.randint(-4, 4)
+        a = self.rng.randint(1, 3)
+        r1 = self.rng.randint(-4, 4)
+        r2 = self.rng.randint(-4, 4)
         while r1 == r2:
-            r2 = random.randint(-4, 4)
+            r2 = self.rng.randint(-4, 4)
         vertex_x = (r1 + r2) / 2
         vertex_y = a * (vertex_x - r1) * (vertex_x - r2)
         latex = f"\\text{{Find vertex and x-intercepts of }} y = {a}(x {'-' if r1 < 0 else '+'} {abs(r1)})(x {'-' if r2 < 0 else '+'} {abs(r2)})"
@@ -71,11 +68,11 @@ class SolvingGraphingFactoredFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(1, 3)
-        r1 = random.randint(-5, 5)
-        r2 = random.randint(-5, 5)
+        a = self.rng.randint(1, 3)
+        r1 = self.rng.randint(-5, 5)
+        r2 = self.rng.randint(-5, 5)
         while r1 == r2:
-            r2 = random.randint(-5, 5)
+            r2 = self.rng.randint(-5, 5)
         vertex_x = (r1 + r2) / 2
         vertex_y = a * (vertex_x - r1) * (vertex_x - r2)
         y_int = a * (-r1) * (-r2)
@@ -3,14 +3,11 @@ Solving Quadratics by Factoring Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SolvingQuadraticsFactoringGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class SolvingQuadraticsFactoringGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        p = random.randint(1, 6)
-        q = random.randint(1, 6)
+        p = self.rng.randint(1, 6)
+        q = self.rng.randint(1, 6)
         b = p + q
         c = p * q
         latex = f"\\text{{Solve: }} x^2 + {b}x + {c} = 0"
@@ -37,9 +34,9 @@ class SolvingQuadraticsFactoringGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        p = random.randint(1, 5)
-        q = random.randint(1, 5)
-        sign_choice = random.choice(['both_neg', 'mixed'])
+        p = self.rng.randint(1, 5)
+        q = self.rng.randint(1, 5)
+        sign_choice = self.rng.choice(['both_neg', 'mixed'])
         if sign_choice == 'both_neg':
             b = -(p + q)
             c = p * q
@@ -61,9 +58,9 @@ class SolvingQuadraticsFactoringGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 4)
-        p = random.randint(1, 4)
-        q = random.randint(1, 4)
+        a = self.rng.randint(2, 4)
+        p = self.rng.randint(1, 4)
+        q = self.rng.randint(1, 4)
         b = a * q + p
         c = p * q
         latex = f"\\text{{Solve: }} {a}x^2 + {b}x + {c} = 0"
@@ -77,11 +74,11 @@ class SolvingQuadraticsFactoringGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 4)
-        r1 = random.randint(-3, 3)
-        r2 = random.randint(-3, 3)
+        a = self.rng.randint(2, 4)
+        r1 = self.rng.randint(-3, 3)
+        r2 = self.rng.randint(-3, 3)
         while r1 == r2:
-            r2 = random.randint(-3, 3)
+            r2 = self.rng.randint(-3, 3)
         b = -a * (r1 + r2)
         c = a * r1 * r2
         latex = f"\\text{{Solve: }} {a}x^2 {'+' if b >= 0 else ''}{b}x {'+' if c >= 0 else ''}{c} = 0"
@@ -3,15 +3,12 @@ Solving by Square Root Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 import math
 
 class SolvingSquareRootGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class SolvingSquareRootGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        perfect_square = random.choice([4, 9, 16, 25, 36, 49, 64, 81, 100])
+        perfect_square = self.rng.choice([4, 9, 16, 25, 36, 49, 64, 81, 100])
         sqrt_val = int(math.sqrt(perfect_square))
         latex = f"\\text{{Solve: }} x^2 = {perfect_square}"
         solution = f"x = \\pm {sqrt_val}"
@@ -36,8 +33,8 @@ class SolvingSquareRootGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 5)
-        perfect_square = random.choice([4, 9, 16, 25, 36, 49])
+        a = self.rng.randint(2, 5)
+        perfect_square = self.rng.choice([4, 9, 16, 25, 36, 49])
         sqrt_val = int(math.sqrt(perfect_square))
         total = a * perfect_square
         latex = f"\\text{{Solve: }} x^2 = {total}"
@@ -53,8 +50,8 @@ class SolvingSquareRootGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        h = random.randint(-5, 5)
-        k = random.choice([4, 9, 16, 25])
+        h = self.rng.randint(-5, 5)
+        k = self.rng.choice([4, 9, 16, 25])
         sqrt_k = int(math.sqrt(k))
         latex = f"\\text{{Solve: }} (x {'-' if h < 0 else '+'} {abs(h)})^2 = {k}"
         solution = f"x = {h - sqrt_k}, x = {h + sqrt_k}"
@@ -67,9 +64,9 @@ class SolvingSquareRootGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 5)
-        h = random.randint(-4, 4)
-        k = random.choice([4, 9, 16, 25])
+        a = self.rng.randint(2, 5)
+        h = self.rng.randint(-4, 4)
+        k = self.rng.choice([4, 9, 16, 25])
         sqrt_k = int(math.sqrt(k))
         latex = f"\\text{{Solve: }} {a}(x {'-' if h < 0 else '+'} {abs(h)})^2 = {a * k}"
         sol1 = h - sqrt_k
@@ -3,14 +3,11 @@ Vertex Form Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class VertexFormGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class VertexFormGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        h = random.randint(-5, 5)
-        k = random.randint(-5, 5)
+        h = self.rng.randint(-5, 5)
+        k = self.rng.randint(-5, 5)
         latex = f"\\text{{Find the vertex of }} y = (x {'-' if h < 0 else '+'} {abs(h)})^2 {'+' if k >= 0 else ''}{k}"
         solution = f"({h}, {k})"
         steps = [
@@ -35,9 +32,9 @@ class VertexFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(1, 3)
-        b = random.randint(-8, 8)
-        c = random.randint(-8, 8)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(-8, 8)
+        c = self.rng.randint(-8, 8)
         h = -b / (2 * a)
         k = c - (b ** 2) / (4 * a)
         latex = f"\\text{{Convert to vertex form: }} y = {a}x^2 {'+' if b >= 0 else ''}{b}x {'+' if c >= 0 else ''}{c}"
@@ -51,9 +48,9 @@ class VertexFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 4)
-        h = random.randint(-4, 4)
-        k = random.randint(-6, 6)
+        a = self.rng.randint(2, 4)
+        h = self.rng.randint(-4, 4)
+        k = self.rng.randint(-6, 6)
         latex = f"\\text{{Expand to standard form: }} y = {a}(x {'-' if h < 0 else '+'} {abs(h)})^2 {'+' if k >= 0 else ''}{k}"
         a_coef = a
         b_coef = -2 * a * h
@@ -68,10 +65,10 @@ class VertexFormGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        h = random.randint(-3, 3)
-        k = random.randint(-5, 5)
-        x_val = h + random.randint(1, 3)
-        a = random.randint(1, 3)
+        h = self.rng.randint(-3, 3)
+        k = self.rng.randint(-5, 5)
+        x_val = h + self.rng.randint(1, 3)
+        a = self.rng.randint(1, 3)
         y_val = a * (x_val - h) ** 2 + k
         latex = f"\\text{{Write equation with vertex }} ({h}, {k}) \\text{{ passing through }} ({x_val}, {y_val})"
         solution = f"y = {a}(x {'-' if h < 0 else '+'} {abs(h)})^2 {'+' if k >= 0 else ''}{k}"
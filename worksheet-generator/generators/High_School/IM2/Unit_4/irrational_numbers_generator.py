@@ -3,14 +3,11 @@ Irrational Numbers Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class IrrationalNumbersGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class IrrationalNumbersGenerator:
 
     def _generate_easy(self) -> Equation:
         nums = [2, 3, 5, 6, 7, 8]
-        num = random.choice(nums)
+        num = self.rng.choice(nums)
         latex = f"\\text{{Is }} \\sqrt{{{num}}} \\text{{ rational or irrational?}}"
         solution = "Irrational"
         steps = [
@@ -34,10 +31,10 @@ class IrrationalNumbersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        problem_type = random.choice(['identify', 'between'])
+        problem_type = self.rng.choice(['identify', 'between'])
         if problem_type == 'identify':
             options = ["π", "√2", "√3", "e"]
-            num = random.choice(options)
+            num = self.rng.choice(options)
             latex = f"\\text{{Explain why }} {num} \\text{{ is irrational}}"
             if num == "π":
                 solution = "π cannot be expressed as a ratio of integers"
@@ -49,7 +46,7 @@ class IrrationalNumbersGenerator:
                 solution = f"{num} cannot be expressed as a fraction"
                 steps = [f"{num} is not a perfect square", "Cannot be written as p/q", f"Therefore {num} is irrational"]
         else:
-            n = random.choice([2, 3, 5, 6, 7])
+            n = self.rng.choice([2, 3, 5, 6, 7])
             import math
             lower = int(math.sqrt(n))
             upper = lower + 1
@@ -64,8 +61,8 @@ class IrrationalNumbersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.choice([2, 3, 5, 7])
+        a = self.rng.randint(2, 5)
+        b = self.rng.choice([2, 3, 5, 7])
         latex = f"\\text{{Is }} {a}\\sqrt{{{b}}} \\text{{ rational or irrational?}}"
         solution = "Irrational"
         steps = [
@@ -76,10 +73,10 @@ class IrrationalNumbersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        problem_type = random.choice(['sum', 'product'])
+        problem_type = self.rng.choice(['sum', 'product'])
         if problem_type == 'sum':
-            a = random.randint(1, 5)
-            b = random.choice([2, 3, 5])
+            a = self.rng.randint(1, 5)
+            b = self.rng.choice([2, 3, 5])
             latex = f"\\text{{Is }} {a} + \\sqrt{{{b}}} \\text{{ rational or irrational?}}"
             solution = "Irrational"
             steps = [
@@ -89,8 +86,8 @@ class IrrationalNumbersGenerator:
                 f"Therefore {a} + √{b} is irrational"
             ]
         else:
-            a = random.choice([2, 3, 5])
-            b = random.choice([2, 3, 5])
+            a = self.rng.choice([2, 3, 5])
+            b = self.rng.choice([2, 3, 5])
             latex = f"\\text{{Is }} \\sqrt{{{a}}} \\cdot \\sqrt{{{b}}} \\text{{ rational or irrational?}}"
             product = a * b
             import math
@@ -3,14 +3,11 @@ Proofs with Irrational Numbers Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ProofsIrrationalNumbersGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -36,7 +33,7 @@ class ProofsIrrationalNumbersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        n = random.choice([3, 5, 6, 7])
+        n = self.rng.choice([3, 5, 6, 7])
         latex = f"\\text{{Prove that }} \\sqrt{{{n}}} \\text{{ is irrational}}"
         solution = f"√{n} is irrational (proof by contradiction)"
         steps = [
@@ -51,7 +48,7 @@ class ProofsIrrationalNumbersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(2, 5)
+        a = self.rng.randint(2, 5)
         latex = f"\\text{{Prove that }} {a} + \\sqrt{{2}} \\text{{ is irrational}}"
         solution = f"{a} + √2 is irrational"
         steps = [
@@ -3,14 +3,11 @@ Sums and Products of Rational and Irrational Numbers Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SumsProductsRationalIrrationalGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class SumsProductsRationalIrrationalGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(1, 8)
-        b = random.choice([2, 3, 5])
+        a = self.rng.randint(1, 8)
+        b = self.rng.choice([2, 3, 5])
         latex = f"\\text{{Is }} {a} + \\sqrt{{{b}}} \\text{{ rational or irrational?}}"
         solution = "Irrational"
         steps = [
@@ -34,8 +31,8 @@ class SumsProductsRationalIrrationalGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(2, 6)
-        b = random.choice([2, 3, 5])
+        a = self.rng.randint(2, 6)
+        b = self.rng.choice([2, 3, 5])
         latex = f"\\text{{Is }} {a} \\cdot \\sqrt{{{b}}} \\text{{ rational or irrational?}}"
         solution = "Irrational"
         steps = [
@@ -46,8 +43,8 @@ class SumsProductsRationalIrrationalGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.choice([2, 3, 5])
-        b = random.choice([2, 3, 5])
+        a = self.rng.choice([2, 3, 5])
+        b = self.rng.choice([2, 3, 5])
         latex = f"\\text{{Is }} \\sqrt{{{a}}} + \\sqrt{{{b}}} \\text{{ rational or irrational?}}"
         solution = "Irrational"
         steps = [
@@ -59,9 +56,9 @@ class SumsProductsRationalIrrationalGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(1, 4)
-        b = random.choice([2, 3, 5])
-        c = random.randint(1, 4)
+        a = self.rng.randint(1, 4)
+        b = self.rng.choice([2, 3, 5])
+        c = self.rng.randint(1, 4)
         latex = f"\\text{{Is }} ({a} + \\sqrt{{{b}}})({c} - \\sqrt{{{b}}}) \\text{{ rational or irrational?}}"
         product = a * c - b
         solution = f"Rational (equals {product + a*c})"
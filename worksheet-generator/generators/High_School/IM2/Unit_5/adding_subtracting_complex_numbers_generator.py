@@ -3,14 +3,11 @@ Adding and Subtracting Complex Numbers Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class AddingSubtractingComplexNumbersGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class AddingSubtractingComplexNumbersGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a, b = random.randint(1, 8), random.randint(1, 8)
-        c, d = random.randint(1, 8), random.randint(1, 8)
+        a, b = self.rng.randint(1, 8), self.rng.randint(1, 8)
+        c, d = self.rng.randint(1, 8), self.rng.randint(1, 8)
         real_sum = a + c
         imag_sum = b + d
         latex = f"({a} + {b}i) + ({c} + {d}i)"
@@ -36,8 +33,8 @@ class AddingSubtractingComplexNumbersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a, b = random.randint(-6, 6), random.randint(-6, 6)
-        c, d = random.randint(-6, 6), random.randint(-6, 6)
+        a, b = self.rng.randint(-6, 6), self.rng.randint(-6, 6)
+        c, d = self.rng.randint(-6, 6), self.rng.randint(-6, 6)
         real_diff = a - c
         imag_diff = b - d
         latex = f"({a} {'+' if b >= 0 else ''} {b}i) - ({c} {'+' if d >= 0 else ''} {d}i)"
@@ -50,9 +47,9 @@ class AddingSubtractingComplexNumbersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a, b = random.randint(-8, 8), random.randint(-8, 8)
-        c, d = random.randint(-8, 8), random.randint(-8, 8)
-        e, f = random.randint(-8, 8), random.randint(-8, 8)
+        a, b = self.rng.randint(-8, 8), self.rng.randint(-8, 8)
+        c, d = self.rng.randint(-8, 8), self.rng.randint(-8, 8)
+        e, f = self.rng.randint(-8, 8), self.rng.randint(-8, 8)
         real_total = a + c - e
         imag_total = b + d - f
         latex = f"({a} {'+' if b >= 0 else ''} {b}i) + ({c} {'+' if d >= 0 else ''} {d}i) - ({e} {'+' if f >= 0 else ''} {f}i)"
@@ -65,9 +62,9 @@ class AddingSubtractingComplexNumbersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a, b = random.randint(-5, 5), random.randint(-5, 5)
-        c, d = random.randint(-5, 5), random.randint(-5, 5)
-        k = random.randint(2, 4)
+        a, b = self.rng.randint(-5, 5), self.rng.randint(-5, 5)
+        c, d = self.rng.randint(-5, 5), self.rng.randint(-5, 5)
+        k = self.rng.randint(2, 4)
         real_result = a + k * c
         imag_result = b + k * d
         latex = f"({a} {'+' if b >= 0 else ''} {b}i) + {k}({c} {'+' if d >= 0 else ''} {d}i)"
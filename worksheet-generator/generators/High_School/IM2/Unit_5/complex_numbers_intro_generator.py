@@ -3,14 +3,11 @@ Complex Numbers Introduction Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ComplexNumbersIntroGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class ComplexNumbersIntroGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(1, 8)
-        b = random.randint(1, 8)
+        a = self.rng.randint(1, 8)
+        b = self.rng.randint(1, 8)
         latex = f"\\text{{Write in standard form a + bi: }} {a} + {b}i"
         solution = f"{a} + {b}i"
         steps = [
@@ -35,8 +32,8 @@ class ComplexNumbersIntroGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(-6, 6)
-        b = random.randint(-6, 6)
+        a = self.rng.randint(-6, 6)
+        b = self.rng.randint(-6, 6)
         sign = '+' if b >= 0 else ''
         latex = f"\\text{{Identify real and imaginary parts: }} {a} {sign} {b}i"
         solution = f"Real: {a}, Imaginary: {b}"
@@ -49,8 +46,8 @@ class ComplexNumbersIntroGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(1, 5)
-        n = random.randint(1, 12)
+        a = self.rng.randint(1, 5)
+        n = self.rng.randint(1, 12)
         latex = f"\\text{{Write in standard form: }} {a} + \\sqrt{{-{n}}}"
         import math
         solution = f"{a} + i\\sqrt{{{n}}}"
@@ -63,9 +60,9 @@ class ComplexNumbersIntroGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(-5, 5)
-        b = random.randint(1, 8)
-        c = random.randint(1, 8)
+        a = self.rng.randint(-5, 5)
+        b = self.rng.randint(1, 8)
+        c = self.rng.randint(1, 8)
         latex = f"\\text{{Write in standard form: }} {a} + {b}i + {c}i"
         total_imag = b + c
         solution = f"{a} + {total_imag}i"
@@ -3,14 +3,11 @@ Complex Plane Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ComplexPlaneGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class ComplexPlaneGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(-5, 5)
-        b = random.randint(-5, 5)
+        a = self.rng.randint(-5, 5)
+        b = self.rng.randint(-5, 5)
         latex = f"\\text{{Plot }} {a} + {b}i \\text{{ on the complex plane}}"
         solution = f"({a}, {b})"
         steps = [
@@ -34,8 +31,8 @@ class ComplexPlaneGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a = random.randint(-6, 6)
-        b = random.randint(-6, 6)
+        a = self.rng.randint(-6, 6)
+        b = self.rng.randint(-6, 6)
         import math
         modulus = math.sqrt(a**2 + b**2)
         latex = f"\\text{{Find the modulus of }} {a} + {b}i"
@@ -50,8 +47,8 @@ class ComplexPlaneGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(-5, 5)
-        b = random.randint(-5, 5)
+        a = self.rng.randint(-5, 5)
+        b = self.rng.randint(-5, 5)
         latex = f"\\text{{Find the conjugate of }} {a} + {b}i"
         solution = f"{a} - {b}i"
         steps = [
@@ -62,8 +59,8 @@ class ComplexPlaneGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(1, 6)
-        b = random.randint(1, 6)
+        a = self.rng.randint(1, 6)
+        b = self.rng.randint(1, 6)
         import math
         modulus = math.sqrt(a**2 + b**2)
         angle = math.atan2(b, a) * 180 / math.pi
@@ -3,14 +3,11 @@ Imaginary Unit i Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ImaginaryUnitIGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,7 +19,7 @@ class ImaginaryUnitIGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        power = random.choice([2, 3, 4])
+        power = self.rng.choice([2, 3, 4])
         results = {2: "-1", 3: "-i", 4: "1"}
         latex = f"\\text{{Simplify: }} i^{{{power}}}"
         solution = results[power]
@@ -36,7 +33,7 @@ class ImaginaryUnitIGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        power = random.randint(5, 12)
+        power = self.rng.randint(5, 12)
         remainder = power % 4
         results = {0: "1", 1: "i", 2: "-1", 3: "-i"}
         latex = f"\\text{{Simplify: }} i^{{{power}}}"
@@ -50,7 +47,7 @@ class ImaginaryUnitIGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        n = random.randint(1, 15)
+        n = self.rng.randint(1, 15)
         latex = f"\\text{{Simplify: }} \\sqrt{{-{n}}}"
         solution = f"i\\sqrt{{{n}}}"
         steps = [
@@ -62,8 +59,8 @@ class ImaginaryUnitIGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(2, 6)
-        n = random.randint(1, 10)
+        a = self.rng.randint(2, 6)
+        n = self.rng.randint(1, 10)
         latex = f"\\text{{Simplify: }} {a}\\sqrt{{-{n}}}"
         solution = f"{a}i\\sqrt{{{n}}}"
         steps = [
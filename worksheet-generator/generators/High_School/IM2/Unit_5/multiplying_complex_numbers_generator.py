@@ -3,14 +3,11 @@ Multiplying Complex Numbers Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class MultiplyingComplexNumbersGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -22,8 +19,8 @@ class MultiplyingComplexNumbersGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        a = random.randint(1, 6)
-        b = random.randint(1, 6)
+        a = self.rng.randint(1, 6)
+        b = self.rng.randint(1, 6)
         latex = f"{a}i \\cdot {b}i"
         product = -a * b
         solution = f"{product}"
@@ -35,8 +32,8 @@ class MultiplyingComplexNumbersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a, b = random.randint(1, 5), random.randint(1, 5)
-        c, d = random.randint(1, 5), random.randint(1, 5)
+        a, b = self.rng.randint(1, 5), self.rng.randint(1, 5)
+        c, d = self.rng.randint(1, 5), self.rng.randint(1, 5)
         real = a * c - b * d
         imag = a * d + b * c
         latex = f"({a} + {b}i)({c} + {d}i)"
@@ -53,8 +50,8 @@ class MultiplyingComplexNumbersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a, b = random.randint(-5, 5), random.randint(-5, 5)
-        c, d = random.randint(-5, 5), random.randint(-5, 5)
+        a, b = self.rng.randint(-5, 5), self.rng.randint(-5, 5)
+        c, d = self.rng.randint(-5, 5), self.rng.randint(-5, 5)
         real = a * c - b * d
         imag = a * d + b * c
         latex = f"({a} {'+' if b >= 0 else ''} {b}i)({c} {'+' if d >= 0 else ''} {d}i)"
@@ -67,7 +64,7 @@ class MultiplyingComplexNumbersGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a, b = random.randint(1, 4), random.randint(1, 4)
+        a, b = self.rng.randint(1, 4), self.rng.randint(1, 4)
         real = a**2 - b**2
         imag = 2 * a * b
         latex = f"({a} + {b}i)^2"
@@ -3,15 +3,12 @@ Quadratic Equations with Complex Solutions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 import math
 
 class QuadraticEquationsComplexSolutionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class QuadraticEquationsComplexSolutionsGenerator:
         else: return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        k = random.choice([1, 4, 9, 16])
+        k = self.rng.choice([1, 4, 9, 16])
         latex = f"\\text{{Solve: }} x^2 + {k} = 0"
         solution = f"x = \\pm {int(math.sqrt(k))}i"
         steps = [
@@ -36,8 +33,8 @@ class QuadraticEquationsComplexSolutionsGenerator:
 
     def _generate_medium(self) -> Equation:
         a = 1
-        b = random.randint(1, 6)
-        c = random.randint(b**2 + 1, 20)
+        b = self.rng.randint(1, 6)
+        c = self.rng.randint(b**2 + 1, 20)
         disc = b**2 - 4*a*c
         latex = f"\\text{{Solve: }} x^2 + {2*b}x + {c} = 0"
         sqrt_disc = int(math.sqrt(abs(disc)))
@@ -52,9 +49,9 @@ class QuadraticEquationsComplexSolutionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(1, 3)
-        b = random.randint(1, 5)
-        c = random.randint(10, 20)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(10, 20)
         disc = b**2 - 4*a*c
         latex = f"\\text{{Solve: }} {a}x^2 + {b}x + {c} = 0"
         solution = f"x = \\frac{{-{b} \\pm \\sqrt{{{disc}}}i}}{{{2*a}}}"
@@ -66,9 +63,9 @@ class QuadraticEquationsComplexSolutionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        h = random.randint(-3, 3)
-        k = random.randint(1, 9)
-        a = random.randint(1, 3)
+        h = self.rng.randint(-3, 3)
+        k = self.rng.randint(1, 9)
+        a = self.rng.randint(1, 3)
         latex = f"\\text{{Solve: }} {a}(x {'-' if h < 0 else '+'} {abs(h)})^2 + {k} = 0"
         sqrt_k_over_a = math.sqrt(k / a)
         solution = f"x = {h} \\pm {sqrt_k_over_a:.2f}i"
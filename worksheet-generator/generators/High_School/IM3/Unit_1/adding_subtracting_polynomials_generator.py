@@ -3,14 +3,11 @@ Adding and Subtracting Polynomials Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class AddingSubtractingPolynomialsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class AddingSubtractingPolynomialsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Adding simple polynomials
-        a1, b1, c1 = random.randint(1, 5), random.randint(-9, 9), random.randint(-9, 9)
-        a2, b2, c2 = random.randint(1, 5), random.randint(-9, 9), random.randint(-9, 9)
+        a1, b1, c1 = self.rng.randint(1, 5), self.rng.randint(-9, 9), self.rng.randint(-9, 9)
+        a2, b2, c2 = self.rng.randint(1, 5), self.rng.randint(-9, 9), self.rng.randint(-9, 9)
 
         a_sum = a1 + a2
         b_sum = b1 + b2
@@ -37,8 +34,8 @@ class AddingSubtractingPolynomialsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Subtracting polynomials
-        a1, b1, c1 = random.randint(3, 9), random.randint(-9, 9), random.randint(-9, 9)
-        a2, b2, c2 = random.randint(1, 5), random.randint(-9, 9), random.randint(-9, 9)
+        a1, b1, c1 = self.rng.randint(3, 9), self.rng.randint(-9, 9), self.rng.randint(-9, 9)
+        a2, b2, c2 = self.rng.randint(1, 5), self.rng.randint(-9, 9), self.rng.randint(-9, 9)
 
         a_diff = a1 - a2
         b_diff = b1 - b2
@@ -51,10 +48,10 @@ class AddingSubtractingPolynomialsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Adding/subtracting cubic polynomials
-        a1, b1, c1, d1 = random.randint(1, 5), random.randint(-9, 9), random.randint(-9, 9), random.randint(-9, 9)
-        a2, b2, c2, d2 = random.randint(1, 5), random.randint(-9, 9), random.randint(-9, 9), random.randint(-9, 9)
+        a1, b1, c1, d1 = self.rng.randint(1, 5), self.rng.randint(-9, 9), self.rng.randint(-9, 9), self.rng.randint(-9, 9)
+        a2, b2, c2, d2 = self.rng.randint(1, 5), self.rng.randint(-9, 9), self.rng.randint(-9, 9), self.rng.randint(-9, 9)
 
-        op = random.choice(['+', '-'])
+        op = self.rng.choice(['+', '-'])
 
         if op == '+':
             a_res, b_res, c_res, d_res = a1+a2, b1+b2, c1+c2, d1+d2
@@ -69,9 +66,9 @@ class AddingSubtractingPolynomialsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Multiple operations with mixed degrees
-        a1, b1, c1 = random.randint(1, 5), random.randint(-9, 9), random.randint(-9, 9)
-        a2, b2, c2 = random.randint(1, 5), random.randint(-9, 9), random.randint(-9, 9)
-        a3, b3, c3 = random.randint(1, 5), random.randint(-9, 9), random.randint(-9, 9)
+        a1, b1, c1 = self.rng.randint(1, 5), self.rng.randint(-9, 9), self.rng.randint(-9, 9)
+        a2, b2, c2 = self.rng.randint(1, 5), self.rng.randint(-9, 9), self.rng.randint(-9, 9)
+        a3, b3, c3 = self.rng.randint(1, 5), self.rng.randint(-9, 9), self.rng.randint(-9, 9)
 
         a_res = a1 + a2 - a3
         b_res = b1 + b2 - b3
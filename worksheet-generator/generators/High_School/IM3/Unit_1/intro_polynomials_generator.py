@@ -3,14 +3,11 @@ Introduction to Polynomials Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class IntroPolynomialsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,10 +20,10 @@ class IntroPolynomialsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Identify degree and leading coefficient
-        a = random.randint(1, 5)
-        b = random.randint(-9, 9)
-        c = random.randint(-9, 9)
-        degree = random.randint(2, 3)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(-9, 9)
+        c = self.rng.randint(-9, 9)
+        degree = self.rng.randint(2, 3)
 
         if degree == 2:
             latex = f"\\text{{Identify the degree and leading coefficient of }} {a}x^2 + {b}x + {c}"
@@ -39,12 +36,12 @@ class IntroPolynomialsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Classify polynomial by degree
-        a = random.randint(1, 5)
-        b = random.randint(-9, 9)
-        c = random.randint(-9, 9)
-        d = random.randint(-9, 9)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(-9, 9)
+        c = self.rng.randint(-9, 9)
+        d = self.rng.randint(-9, 9)
 
-        poly_type = random.choice(['quadratic', 'cubic', 'quartic'])
+        poly_type = self.rng.choice(['quadratic', 'cubic', 'quartic'])
 
         if poly_type == 'quadratic':
             latex = f"\\text{{Classify }} {a}x^2 + {b}x + {c} \\text{{ by degree}}"
@@ -60,9 +57,9 @@ class IntroPolynomialsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Standard form and number of terms
-        a = random.randint(1, 5)
-        b = random.randint(-9, 9)
-        c = random.randint(-9, 9)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(-9, 9)
+        c = self.rng.randint(-9, 9)
 
         latex = f"\\text{{Write in standard form: }} {b}x + {a}x^3 + {c}"
         solution = f"{a}x^3 + {b}x + {c} (3 terms, trinomial)"
@@ -71,10 +68,10 @@ class IntroPolynomialsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Identify all characteristics
-        a = random.randint(2, 5)
-        b = random.randint(-9, 9)
-        c = random.randint(-9, 9)
-        d = random.randint(-9, 9)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(-9, 9)
+        c = self.rng.randint(-9, 9)
+        d = self.rng.randint(-9, 9)
 
         latex = f"\\text{{For }} f(x) = {a}x^4 + {b}x^3 + {c}x + {d}\\text{{, identify degree, leading coefficient, constant term, and number of terms}}"
         solution = f"Degree: 4, Leading coefficient: {a}, Constant: {d}, Terms: 4 (polynomial)"
@@ -3,14 +3,11 @@ Multiplying Binomials and Polynomials Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class MultiplyingBinomialsPolynomialsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class MultiplyingBinomialsPolynomialsGenerator:
 
     def _generate_easy(self) -> Equation:
         # (x + a)(x + b)
-        a = random.randint(1, 9)
-        b = random.randint(1, 9)
+        a = self.rng.randint(1, 9)
+        b = self.rng.randint(1, 9)
 
         latex = f"(x + {a})(x + {b})"
         solution = f"x^2 + {a+b}x + {a*b}"
@@ -33,10 +30,10 @@ class MultiplyingBinomialsPolynomialsGenerator:
 
     def _generate_medium(self) -> Equation:
         # (ax + b)(cx + d)
-        a = random.randint(2, 5)
-        b = random.randint(-9, 9)
-        c = random.randint(2, 5)
-        d = random.randint(-9, 9)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(-9, 9)
+        c = self.rng.randint(2, 5)
+        d = self.rng.randint(-9, 9)
 
         first = a * c
         outer_inner = a * d + b * c
@@ -49,11 +46,11 @@ class MultiplyingBinomialsPolynomialsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Binomial times trinomial
-        a = random.randint(1, 5)
-        b = random.randint(-5, 5)
-        c = random.randint(1, 5)
-        d = random.randint(-5, 5)
-        e = random.randint(-5, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(-5, 5)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(-5, 5)
+        e = self.rng.randint(-5, 5)
 
         coef_x3 = a * c
         coef_x2 = a * d + b * c
@@ -67,12 +64,12 @@ class MultiplyingBinomialsPolynomialsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Two trinomials multiplied
-        a = random.randint(1, 3)
-        b = random.randint(-5, 5)
-        c = random.randint(-5, 5)
-        d = random.randint(1, 3)
-        e = random.randint(-5, 5)
-        f = random.randint(-5, 5)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(-5, 5)
+        c = self.rng.randint(-5, 5)
+        d = self.rng.randint(1, 3)
+        e = self.rng.randint(-5, 5)
+        f = self.rng.randint(-5, 5)
 
         coef_x4 = a * d
         coef_x3 = a * e + b * d
@@ -3,14 +3,11 @@ Multiplying Monomials and Polynomials Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class MultiplyingMonomialsPolynomialsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,9 +20,9 @@ class MultiplyingMonomialsPolynomialsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Monomial times binomial
-        a = random.randint(2, 9)
-        b = random.randint(1, 9)
-        c = random.randint(1, 9)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(1, 9)
+        c = self.rng.randint(1, 9)
 
         latex = f"{a}x({b}x + {c})"
         solution = f"{a*b}x^2 + {a*c}x"
@@ -34,10 +31,10 @@ class MultiplyingMonomialsPolynomialsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Monomial times trinomial
-        a = random.randint(2, 5)
-        b = random.randint(1, 5)
-        c = random.randint(-9, 9)
-        d = random.randint(-9, 9)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(-9, 9)
+        d = self.rng.randint(-9, 9)
 
         latex = f"{a}x^2({b}x^2 + {c}x + {d})"
         solution = f"{a*b}x^4 + {a*c}x^3 + {a*d}x^2"
@@ -46,11 +43,11 @@ class MultiplyingMonomialsPolynomialsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Negative monomial times polynomial
-        a = random.randint(-5, -2)
-        b = random.randint(1, 5)
-        c = random.randint(-9, 9)
-        d = random.randint(-9, 9)
-        e = random.randint(-9, 9)
+        a = self.rng.randint(-5, -2)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(-9, 9)
+        d = self.rng.randint(-9, 9)
+        e = self.rng.randint(-9, 9)
 
         latex = f"{a}x({b}x^3 + {c}x^2 + {d}x + {e})"
         solution = f"{a*b}x^4 + {a*c}x^3 + {a*d}x^2 + {a*e}x"
@@ -59,11 +56,11 @@ class MultiplyingMonomialsPolynomialsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Complex monomial times polynomial
-        a = random.randint(2, 4)
-        b = random.randint(2, 4)
-        c = random.randint(1, 5)
-        d = random.randint(-9, 9)
-        e = random.randint(-9, 9)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(2, 4)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(-9, 9)
+        e = self.rng.randint(-9, 9)
 
         latex = f"{a}x^2y({c}x^2y + {d}xy^2 + {e})"
         solution = f"{a*c}x^4y^2 + {a*d}x^3y^3 + {a*e}x^2y"
@@ -3,14 +3,11 @@ Samples and Surveys Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SamplesSurveysGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -37,8 +34,8 @@ class SamplesSurveysGenerator:
 
     def _generate_hard(self) -> Equation:
         # Sample size calculation
-        pop = random.randint(500, 2000)
-        margin = random.choice([3, 5])
+        pop = self.rng.randint(500, 2000)
+        margin = self.rng.choice([3, 5])
 
         latex = f"\\text{{Population: {pop}, desired margin: {margin}%. Discuss sample size needed.}}"
         solution = f"\\text{{Larger sample reduces margin of error}}"
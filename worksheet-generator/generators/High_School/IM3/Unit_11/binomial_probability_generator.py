@@ -3,15 +3,12 @@ Binomial Probability Generator
 """
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class BinomialProbabilityGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -31,9 +28,9 @@ class BinomialProbabilityGenerator:
 
     def _generate_medium(self) -> Equation:
         # Calculate binomial probability
-        n = random.randint(5, 10)
-        k = random.randint(0, n)
-        p = random.choice([0.5, 0.3, 0.6])
+        n = self.rng.randint(5, 10)
+        k = self.rng.randint(0, n)
+        p = self.rng.choice([0.5, 0.3, 0.6])
 
         latex = f"\\text{{Find }} P(X = {k}) \\text{{ for }} n = {n}, p = {p}"
         solution = f"\\binom{{{n}}}{{{k}}} ({p})^{{{k}}} (1-{p})^{{{n-k}}}"
@@ -42,8 +39,8 @@ class BinomialProbabilityGenerator:
 
     def _generate_hard(self) -> Equation:
         # Expected value and variance
-        n = random.randint(10, 20)
-        p = random.choice([0.3, 0.4, 0.6, 0.7])
+        n = self.rng.randint(10, 20)
+        p = self.rng.choice([0.3, 0.4, 0.6, 0.7])
 
         latex = f"\\text{{For binomial with }} n = {n}, p = {p}\\text{{, find mean and standard deviation}}"
         solution = f"\\mu = {n*p}, \\sigma = \\sqrt{{{n*p*(1-p)}}}"
@@ -52,9 +49,9 @@ class BinomialProbabilityGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Application problem
-        n = random.randint(15, 25)
-        p = random.choice([0.2, 0.3, 0.4])
-        k = random.randint(5, 10)
+        n = self.rng.randint(15, 25)
+        p = self.rng.choice([0.2, 0.3, 0.4])
+        k = self.rng.randint(5, 10)
 
         latex = f"\\text{{If {int(p*100)}% pass test, find P(at least {k} of {n} pass)}}"
         solution = f"P(X \\geq {k}) = 1 - P(X < {k})"
@@ -3,14 +3,11 @@ Normal Distributions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class NormalDistributionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -30,9 +27,9 @@ class NormalDistributionsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Calculate z-score
-        mean = random.randint(50, 100)
-        sd = random.randint(5, 15)
-        x = mean + random.randint(-2, 2) * sd
+        mean = self.rng.randint(50, 100)
+        sd = self.rng.randint(5, 15)
+        x = mean + self.rng.randint(-2, 2) * sd
 
         latex = f"\\text{{Find z-score: }} \\mu = {mean}, \\sigma = {sd}, x = {x}"
         solution = f"z = \\frac{{{x} - {mean}}}{{{sd}}} = {(x-mean)//sd}"
@@ -41,8 +38,8 @@ class NormalDistributionsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Find percentile
-        mean = random.randint(500, 600)
-        sd = random.randint(50, 100)
+        mean = self.rng.randint(500, 600)
+        sd = self.rng.randint(50, 100)
 
         latex = f"\\text{{SAT scores: }} \\mu = {mean}, \\sigma = {sd}\\text{{. What score is 84th percentile?}}"
         solution = f"\\text{{Use z-table: z }} \\approx 1, x = {mean} + {sd} = {mean + sd}"
@@ -51,8 +48,8 @@ class NormalDistributionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Application with two values
-        mean = random.randint(100, 120)
-        sd = random.randint(10, 20)
+        mean = self.rng.randint(100, 120)
+        sd = self.rng.randint(10, 20)
         lower = mean - sd
         upper = mean + sd
 
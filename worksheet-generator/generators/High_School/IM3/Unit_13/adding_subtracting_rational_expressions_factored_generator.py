@@ -3,14 +3,11 @@ Adding and Subtracting Rational Expressions with Factored Denominators Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class AddingSubtractingRationalExpressionsFactoredGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class AddingSubtractingRationalExpressionsFactoredGenerator:
 
     def _generate_easy(self) -> Equation:
         # Common binomial factor
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\frac{{1}}{{x + {a}}} + \\frac{{2}}{{x + {a}}}"
         solution = f"\\frac{{3}}{{x + {a}}}"
@@ -33,8 +30,8 @@ class AddingSubtractingRationalExpressionsFactoredGenerator:
 
     def _generate_medium(self) -> Equation:
         # LCD is one of the denominators
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\frac{{1}}{{x + {a}}} + \\frac{{1}}{{(x + {a})(x + {b})}}"
         solution = f"\\frac{{x + {a+b}}}{{(x + {a})(x + {b})}}"
@@ -43,8 +40,8 @@ class AddingSubtractingRationalExpressionsFactoredGenerator:
 
     def _generate_hard(self) -> Equation:
         # LCD requires factoring
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\frac{{1}}{{x^2 - {a**2}}} + \\frac{{1}}{{x - {a}}}"
         solution = f"\\frac{{x + {a} + 1}}{{(x + {a})(x - {a})}}"
@@ -53,8 +50,8 @@ class AddingSubtractingRationalExpressionsFactoredGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Complex denominators
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\frac{{x}}{{x^2 - {a**2}}} - \\frac{{1}}{{x + {a}}}"
         solution = f"\\frac{{x - (x - {a})}}{{(x + {a})(x - {a})}} = \\frac{{{a}}}{{(x + {a})(x - {a})}}"
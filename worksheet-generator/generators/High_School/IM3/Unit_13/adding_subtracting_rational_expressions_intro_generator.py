@@ -3,14 +3,11 @@ Adding and Subtracting Rational Expressions Introduction Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class AddingSubtractingRationalExpressionsIntroGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,9 +20,9 @@ class AddingSubtractingRationalExpressionsIntroGenerator:
 
     def _generate_easy(self) -> Equation:
         # Same denominator
-        a = random.randint(1, 9)
-        b = random.randint(1, 9)
-        c = random.randint(2, 9)
+        a = self.rng.randint(1, 9)
+        b = self.rng.randint(1, 9)
+        c = self.rng.randint(2, 9)
 
         latex = f"\\frac{{{a}}}{{x}} + \\frac{{{b}}}{{x}}"
         solution = f"\\frac{{{a+b}}}{{x}}"
@@ -34,8 +31,8 @@ class AddingSubtractingRationalExpressionsIntroGenerator:
 
     def _generate_medium(self) -> Equation:
         # Different monomial denominators
-        a = random.randint(1, 9)
-        b = random.randint(1, 9)
+        a = self.rng.randint(1, 9)
+        b = self.rng.randint(1, 9)
 
         latex = f"\\frac{{{a}}}{{x}} + \\frac{{{b}}}{{y}}"
         solution = f"\\frac{{{a}y + {b}x}}{{xy}}"
@@ -44,8 +41,8 @@ class AddingSubtractingRationalExpressionsIntroGenerator:
 
     def _generate_hard(self) -> Equation:
         # LCD with numbers
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\frac{{{a}}}{{x}} + \\frac{{{b}}}{{2x}}"
         solution = f"\\frac{{{2*a + b}}}{{2x}}"
@@ -54,8 +51,8 @@ class AddingSubtractingRationalExpressionsIntroGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Different binomial denominators
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\frac{{1}}{{x + {a}}} + \\frac{{1}}{{x + {b}}}"
         solution = f"\\frac{{2x + {a+b}}}{{(x + {a})(x + {b})}}"
@@ -3,14 +3,11 @@ Cancelling Common Factors Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class CancellingCommonFactorsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class CancellingCommonFactorsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple monomial cancellation
-        a = random.randint(2, 9)
-        b = random.randint(2, 9)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(2, 9)
 
         latex = f"\\text{{Simplify: }} \\frac{{{a}x}}{{{b}x}}"
         solution = f"\\frac{{{a}}}{{{b}}}"
@@ -33,8 +30,8 @@ class CancellingCommonFactorsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Cancel binomial factors
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{Simplify: }} \\frac{{(x + {a})(x + {b})}}{{x + {a}}}"
         solution = f"x + {b}, x \\neq -{a}"
@@ -43,8 +40,8 @@ class CancellingCommonFactorsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Factor then cancel
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
         sum_ab = a + b
         prod_ab = a * b
 
@@ -55,7 +52,7 @@ class CancellingCommonFactorsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Complex factoring and cancellation
-        a = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
 
         latex = f"\\text{{Simplify: }} \\frac{{x^2 - {a**2}}}{{x - {a}}}"
         solution = f"x + {a}, x \\neq {a}"
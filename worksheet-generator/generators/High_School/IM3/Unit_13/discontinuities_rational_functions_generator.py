@@ -3,14 +3,11 @@ Discontinuities in Rational Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class DiscontinuitiesRationalFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class DiscontinuitiesRationalFunctionsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Vertical asymptote
-        a = random.randint(1, 9)
+        a = self.rng.randint(1, 9)
 
         latex = f"\\text{{Find vertical asymptote: }} f(x) = \\frac{{1}}{{x - {a}}}"
         solution = f"x = {a}"
@@ -32,8 +29,8 @@ class DiscontinuitiesRationalFunctionsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Multiple vertical asymptotes
-        a = random.randint(1, 5)
-        b = random.randint(6, 9)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(6, 9)
 
         latex = f"\\text{{Find vertical asymptotes: }} f(x) = \\frac{{1}}{{(x - {a})(x - {b})}}"
         solution = f"x = {a}, x = {b}"
@@ -42,8 +39,8 @@ class DiscontinuitiesRationalFunctionsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Hole vs asymptote
-        a = random.randint(1, 5)
-        b = random.randint(6, 9)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(6, 9)
 
         latex = f"\\text{{Find holes and asymptotes: }} f(x) = \\frac{{(x - {a})(x - {b})}}{{x - {a}}}"
         solution = f"Hole at x = {a}, no vertical asymptote"
@@ -52,8 +49,8 @@ class DiscontinuitiesRationalFunctionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Complete discontinuity analysis
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{Analyze: }} f(x) = \\frac{{x^2 - {a**2}}}{{x - {a}}}"
         solution = f"Hole at x = {a} (removable discontinuity)"
@@ -3,14 +3,11 @@ End Behavior of Rational Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class EndBehaviorRationalFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class EndBehaviorRationalFunctionsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Same degree
-        a = random.randint(2, 9)
-        b = random.randint(1, 9)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(1, 9)
 
         latex = f"\\text{{Find horizontal asymptote: }} f(x) = \\frac{{{a}x}}{{{b}x + 1}}"
         solution = f"y = \\frac{{{a}}}{{{b}}}"
@@ -33,8 +30,8 @@ class EndBehaviorRationalFunctionsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Numerator degree less
-        a = random.randint(1, 9)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 9)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{Find horizontal asymptote: }} f(x) = \\frac{{{a}}}{{x^2 + {b}}}"
         solution = "y = 0"
@@ -43,8 +40,8 @@ class EndBehaviorRationalFunctionsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Numerator degree greater
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe end behavior: }} f(x) = \\frac{{{a}x^2}}{{{b}x + 1}}"
         solution = "No horizontal asymptote (oblique asymptote)"
@@ -53,8 +50,8 @@ class EndBehaviorRationalFunctionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Find slant asymptote
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{Find slant asymptote: }} f(x) = \\frac{{x^2 + {a}x}}{{x + {b}}}"
         solution = f"\\text{{Divide: }} y = x + {a-b}"
@@ -3,14 +3,11 @@ Graphs of Rational Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class GraphsRationalFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class GraphsRationalFunctionsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Basic hyperbola
-        a = random.randint(1, 9)
+        a = self.rng.randint(1, 9)
 
         latex = f"\\text{{Sketch }} f(x) = \\frac{{{a}}}{{x}}"
         solution = f"Vertical asymptote: x = 0, Horizontal asymptote: y = 0"
@@ -32,8 +29,8 @@ class GraphsRationalFunctionsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Shifted hyperbola
-        h = random.randint(1, 5)
-        k = random.randint(1, 5)
+        h = self.rng.randint(1, 5)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Sketch }} f(x) = \\frac{{1}}{{x - {h}}} + {k}"
         solution = f"VA: x = {h}, HA: y = {k}"
@@ -42,8 +39,8 @@ class GraphsRationalFunctionsGenerator:
 
     def _generate_hard(self) -> Equation:
         # More complex rational function
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{Graph }} f(x) = \\frac{{x + {a}}}{{x - {b}}}"
         solution = f"VA: x = {b}, HA: y = 1, x-intercept: x = -{a}"
@@ -52,8 +49,8 @@ class GraphsRationalFunctionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Complete graph analysis
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{Completely analyze and sketch }} f(x) = \\frac{{x^2}}{{x^2 - {a**2}}}"
         solution = f"VA: x = \\pm{a}, HA: y = 1, Even function"
@@ -3,14 +3,11 @@ Multiplying and Dividing Rational Expressions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class MultiplyingDividingRationalExpressionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class MultiplyingDividingRationalExpressionsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple multiplication
-        a = random.randint(2, 9)
-        b = random.randint(2, 9)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(2, 9)
 
         latex = f"\\frac{{{a}x}}{{y}} \\cdot \\frac{{y}}{{{b}x}}"
         solution = f"\\frac{{{a}}}{{{b}}}"
@@ -33,8 +30,8 @@ class MultiplyingDividingRationalExpressionsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Division
-        a = random.randint(2, 9)
-        b = random.randint(2, 9)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(2, 9)
 
         latex = f"\\frac{{{a}x}}{{y}} \\div \\frac{{{b}x}}{{y}}"
         solution = f"\\frac{{{a}}}{{{b}}}"
@@ -43,8 +40,8 @@ class MultiplyingDividingRationalExpressionsGenerator:
 
     def _generate_hard(self) -> Equation:
         # With factoring
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\frac{{x + {a}}}{{x + {b}}} \\cdot \\frac{{x + {b}}}{{x + {a}}}"
         solution = f"1, x \\neq -{a}, -{b}"
@@ -53,7 +50,7 @@ class MultiplyingDividingRationalExpressionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Complex expression
-        a = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
 
         latex = f"\\frac{{x^2 - {a**2}}}{{x + {a}}} \\div \\frac{{x - {a}}}{{1}}"
         solution = f"1, x \\neq \\pm{a}"
@@ -3,14 +3,11 @@ Factoring Higher Degree Polynomials Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FactoringHigherDegreePolynomialsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,9 +20,9 @@ class FactoringHigherDegreePolynomialsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Cubic with common factor
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
 
         latex = f"\\text{{Factor: }} x^3 + {a+b}x^2 + {a*b}x"
         solution = f"x(x + {a})(x + {b})"
@@ -34,7 +31,7 @@ class FactoringHigherDegreePolynomialsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Difference of squares with higher degree
-        a = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
 
         latex = f"\\text{{Factor: }} x^4 - {a**2}"
         solution = f"(x^2 + {a})(x^2 - {a})"
@@ -43,9 +40,9 @@ class FactoringHigherDegreePolynomialsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Cubic factoring
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
 
         # (x - a)(x - b)(x - c)
         # x^3 - (a+b+c)x^2 + (ab+ac+bc)x - abc
@@ -60,8 +57,8 @@ class FactoringHigherDegreePolynomialsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Quartic factoring
-        a = random.randint(1, 3)
-        b = random.randint(1, 3)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(1, 3)
 
         # x^4 - (a^2 + b^2)x^2 + a^2*b^2 = (x^2 - a^2)(x^2 - b^2)
         middle_coef = a**2 + b**2
@@ -3,14 +3,11 @@ Factoring Monomials Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FactoringMonomialsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,9 +20,9 @@ class FactoringMonomialsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Factor out a simple monomial
-        a = random.randint(2, 9)
-        b = random.randint(1, 9)
-        c = random.randint(1, 9)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(1, 9)
+        c = self.rng.randint(1, 9)
 
         latex = f"\\text{{Factor: }} {a*b}x + {a*c}"
         solution = f"{a}({b}x + {c})"
@@ -34,9 +31,9 @@ class FactoringMonomialsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Factor out x from polynomial
-        a = random.randint(2, 9)
-        b = random.randint(1, 9)
-        c = random.randint(1, 9)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(1, 9)
+        c = self.rng.randint(1, 9)
 
         latex = f"\\text{{Factor: }} {a}x^2 + {b}x"
         solution = f"x({a}x + {b})"
@@ -45,10 +42,10 @@ class FactoringMonomialsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Factor out complex monomial
-        gcf = random.randint(2, 5)
-        a = random.randint(2, 5)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
+        gcf = self.rng.randint(2, 5)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
 
         coef1 = gcf * a
         coef2 = gcf * b
@@ -61,9 +58,9 @@ class FactoringMonomialsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Factor out monomial with multiple variables
-        gcf = random.randint(2, 5)
-        a = random.randint(2, 5)
-        b = random.randint(1, 5)
+        gcf = self.rng.randint(2, 5)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 5)
 
         coef1 = gcf * a
         coef2 = gcf * b
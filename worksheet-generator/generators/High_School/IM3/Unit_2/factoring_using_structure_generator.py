@@ -3,14 +3,11 @@ Factoring Using Structure Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class FactoringUsingStructureGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class FactoringUsingStructureGenerator:
 
     def _generate_easy(self) -> Equation:
         # Perfect square trinomial
-        a = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
 
         latex = f"\\text{{Factor: }} x^2 + {2*a}x + {a**2}"
         solution = f"(x + {a})^2"
@@ -32,8 +29,8 @@ class FactoringUsingStructureGenerator:
 
     def _generate_medium(self) -> Equation:
         # Difference of squares
-        a = random.randint(2, 9)
-        b = random.randint(2, 9)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(2, 9)
 
         latex = f"\\text{{Factor: }} {a**2}x^2 - {b**2}"
         solution = f"({a}x + {b})({a}x - {b})"
@@ -42,7 +39,7 @@ class FactoringUsingStructureGenerator:
 
     def _generate_hard(self) -> Equation:
         # Sum of cubes
-        a = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
 
         latex = f"\\text{{Factor: }} x^3 + {a**3}"
         solution = f"(x + {a})(x^2 - {a}x + {a**2})"
@@ -51,7 +48,7 @@ class FactoringUsingStructureGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Difference of cubes
-        a = random.randint(2, 5)
+        a = self.rng.randint(2, 5)
 
         latex = f"\\text{{Factor: }} x^3 - {a**3}"
         solution = f"(x - {a})(x^2 + {a}x + {a**2})"
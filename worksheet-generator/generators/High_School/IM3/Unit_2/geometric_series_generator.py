@@ -3,14 +3,11 @@ Geometric Series Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class GeometricSeriesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class GeometricSeriesGenerator:
 
     def _generate_easy(self) -> Equation:
         # Identify geometric sequence
-        a = random.randint(2, 9)
-        r = random.randint(2, 4)
+        a = self.rng.randint(2, 9)
+        r = self.rng.randint(2, 4)
 
         term1 = a
         term2 = a * r
@@ -37,9 +34,9 @@ class GeometricSeriesGenerator:
 
     def _generate_medium(self) -> Equation:
         # Find sum of finite geometric series
-        a = random.randint(1, 5)
-        r = random.randint(2, 3)
-        n = random.randint(4, 6)
+        a = self.rng.randint(1, 5)
+        r = self.rng.randint(2, 3)
+        n = self.rng.randint(4, 6)
 
         # S_n = a(1 - r^n)/(1 - r)
         sum_val = a * (1 - r**n) // (1 - r)
@@ -51,9 +48,9 @@ class GeometricSeriesGenerator:
 
     def _generate_hard(self) -> Equation:
         # Infinite geometric series
-        a = random.randint(1, 9)
-        r_num = random.randint(1, 3)
-        r_den = random.randint(4, 6)
+        a = self.rng.randint(1, 9)
+        r_num = self.rng.randint(1, 3)
+        r_den = self.rng.randint(4, 6)
 
         # S = a/(1-r) for |r| < 1
         latex = f"\\text{{Find sum of infinite series: }} {a} + {a}\\cdot\\frac{{{r_num}}}{{{r_den}}} + {a}\\cdot\\left(\\frac{{{r_num}}}{{{r_den}}}\\right)^2 + ..."
@@ -63,9 +60,9 @@ class GeometricSeriesGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Geometric series formula derivation/application
-        a = random.randint(2, 5)
-        r = random.randint(2, 3)
-        n = random.randint(5, 8)
+        a = self.rng.randint(2, 5)
+        r = self.rng.randint(2, 3)
+        n = self.rng.randint(5, 8)
 
         sum_val = a * (r**n - 1) // (r - 1)
 
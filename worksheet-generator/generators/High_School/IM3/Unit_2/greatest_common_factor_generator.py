@@ -3,15 +3,12 @@ Greatest Common Factor Generator
 """
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class GreatestCommonFactorGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -24,9 +21,9 @@ class GreatestCommonFactorGenerator:
 
     def _generate_easy(self) -> Equation:
         # Find GCF of two terms
-        gcf = random.randint(2, 9)
-        a = random.randint(2, 9)
-        b = random.randint(2, 9)
+        gcf = self.rng.randint(2, 9)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(2, 9)
 
         term1 = gcf * a
         term2 = gcf * b
@@ -38,9 +35,9 @@ class GreatestCommonFactorGenerator:
 
     def _generate_medium(self) -> Equation:
         # Find GCF and factor
-        gcf = random.randint(2, 6)
-        a = random.randint(2, 5)
-        b = random.randint(1, 5)
+        gcf = self.rng.randint(2, 6)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 5)
 
         term1 = gcf * a
         term2 = gcf * b
@@ -52,10 +49,10 @@ class GreatestCommonFactorGenerator:
 
     def _generate_hard(self) -> Equation:
         # Find GCF of three terms
-        gcf = random.randint(2, 5)
-        a = random.randint(2, 5)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
+        gcf = self.rng.randint(2, 5)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
 
         term1 = gcf * a
         term2 = gcf * b
@@ -68,10 +65,10 @@ class GreatestCommonFactorGenerator:
 
     def _generate_challenge(self) -> Equation:
         # GCF with coefficients and variables
-        gcf = random.randint(2, 5)
-        a = random.randint(2, 5)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
+        gcf = self.rng.randint(2, 5)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
 
         term1 = gcf * a
         term2 = gcf * b
@@ -3,14 +3,11 @@ Taking Common Factors Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class TakingCommonFactorsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,10 +20,10 @@ class TakingCommonFactorsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Factor out common binomial
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
-        d = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 5)
 
         latex = f"\\text{{Factor: }} {a}(x + {c}) + {b}(x + {c})"
         solution = f"(x + {c})({a} + {b})"
@@ -35,10 +32,10 @@ class TakingCommonFactorsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Factor by grouping - 4 terms
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
-        d = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 5)
 
         latex = f"\\text{{Factor by grouping: }} {a}x^3 + {a*c}x^2 + {b}x + {b*c}"
         solution = f"(x^2 + {c})({a}x + {b})"
@@ -47,9 +44,9 @@ class TakingCommonFactorsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Complex grouping
-        a = random.randint(2, 5)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
 
         latex = f"\\text{{Factor by grouping: }} {a}x^3 - {a*c}x^2 + {b}x - {b*c}"
         solution = f"(x^2 + {c})({a}x - {b})"
@@ -58,10 +55,10 @@ class TakingCommonFactorsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Factor completely with GCF first then grouping
-        gcf = random.randint(2, 4)
-        a = random.randint(1, 3)
-        b = random.randint(1, 3)
-        c = random.randint(1, 3)
+        gcf = self.rng.randint(2, 4)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(1, 3)
+        c = self.rng.randint(1, 3)
 
         coef1 = gcf * a
         coef2 = gcf * a * c
@@ -3,14 +3,11 @@ Dividing Polynomials by x Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class DividingPolynomialsByXGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class DividingPolynomialsByXGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple division by x
-        a = random.randint(2, 9)
-        b = random.randint(1, 9)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(1, 9)
 
         latex = f"\\frac{{{a}x^2 + {b}x}}{{x}}"
         solution = f"{a}x + {b}"
@@ -33,9 +30,9 @@ class DividingPolynomialsByXGenerator:
 
     def _generate_medium(self) -> Equation:
         # Division by x with remainder
-        a = random.randint(2, 9)
-        b = random.randint(1, 9)
-        c = random.randint(1, 9)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(1, 9)
+        c = self.rng.randint(1, 9)
 
         latex = f"\\frac{{{a}x^2 + {b}x + {c}}}{{x}}"
         solution = f"{a}x + {b} + \\frac{{{c}}}{{x}}"
@@ -44,10 +41,10 @@ class DividingPolynomialsByXGenerator:
 
     def _generate_hard(self) -> Equation:
         # Cubic divided by x
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
-        d = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 5)
 
         latex = f"\\frac{{{a}x^3 + {b}x^2 + {c}x + {d}}}{{x}}"
         solution = f"{a}x^2 + {b}x + {c} + \\frac{{{d}}}{{x}}"
@@ -56,10 +53,10 @@ class DividingPolynomialsByXGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Division by ax
-        a = random.randint(2, 5)
-        b = random.randint(2, 9)
-        c = random.randint(1, 9)
-        d = random.randint(1, 9)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 9)
+        c = self.rng.randint(1, 9)
+        d = self.rng.randint(1, 9)
 
         coef1 = a * b
         coef2 = a * c
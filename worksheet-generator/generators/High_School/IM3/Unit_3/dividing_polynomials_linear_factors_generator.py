@@ -3,14 +3,11 @@ Dividing Polynomials by Linear Factors Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class DividingPolynomialsLinearFactorsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,9 +20,9 @@ class DividingPolynomialsLinearFactorsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Cubic divided by linear (exact division)
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
 
         # (x + a)(x^2 + bx + c)
         coef_x3 = 1
@@ -40,10 +37,10 @@ class DividingPolynomialsLinearFactorsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Cubic with remainder
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
-        r = random.randint(1, 9)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
+        r = self.rng.randint(1, 9)
 
         coef_x3 = 1
         coef_x2 = a + b
@@ -57,10 +54,10 @@ class DividingPolynomialsLinearFactorsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Higher degree division
-        a = random.randint(1, 4)
-        b = random.randint(1, 4)
-        c = random.randint(1, 4)
-        d = random.randint(1, 4)
+        a = self.rng.randint(1, 4)
+        b = self.rng.randint(1, 4)
+        c = self.rng.randint(1, 4)
+        d = self.rng.randint(1, 4)
 
         # (x + a)(x^3 + bx^2 + cx + d)
         coef_x4 = 1
@@ -76,10 +73,10 @@ class DividingPolynomialsLinearFactorsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Division by (ax + b)
-        a = random.randint(2, 3)
-        b = random.randint(1, 5)
-        c = random.randint(1, 4)
-        d = random.randint(1, 4)
+        a = self.rng.randint(2, 3)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 4)
+        d = self.rng.randint(1, 4)
 
         # For simplicity, exact division
         latex = f"\\frac{{{a}x^3 + {a*c+b}x^2 + {b*c+a*d}x + {b*d}}}{{{a}x + {b}}}"
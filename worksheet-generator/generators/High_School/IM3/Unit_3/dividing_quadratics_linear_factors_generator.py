@@ -3,14 +3,11 @@ Dividing Quadratics by Linear Factors Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class DividingQuadraticsLinearFactorsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class DividingQuadraticsLinearFactorsGenerator:
 
     def _generate_easy(self) -> Equation:
         # (x^2 + bx + c) / (x + a) where (x + a) is a factor
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         # (x + a)(x + b) = x^2 + (a+b)x + ab
         coef_x = a + b
@@ -37,9 +34,9 @@ class DividingQuadraticsLinearFactorsGenerator:
 
     def _generate_medium(self) -> Equation:
         # With remainder
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        r = random.randint(1, 9)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        r = self.rng.randint(1, 9)
 
         # (x + a)(x + b) + r = x^2 + (a+b)x + ab + r
         coef_x = a + b
@@ -52,9 +49,9 @@ class DividingQuadraticsLinearFactorsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Leading coefficient not 1
-        a = random.randint(2, 4)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
 
         # (ax + b)(x + c) = ax^2 + (ac+b)x + bc
         coef_x2 = a
@@ -68,10 +65,10 @@ class DividingQuadraticsLinearFactorsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Complex division with leading coefficient and remainder
-        a = random.randint(2, 3)
-        b = random.randint(1, 5)
-        c = random.randint(1, 4)
-        r = random.randint(1, 9)
+        a = self.rng.randint(2, 3)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 4)
+        r = self.rng.randint(1, 9)
 
         coef_x2 = a
         coef_x1 = a * c + b
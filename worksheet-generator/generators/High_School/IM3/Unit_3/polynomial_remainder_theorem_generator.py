@@ -3,14 +3,11 @@ Polynomial Remainder Theorem Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class PolynomialRemainderTheoremGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,10 +20,10 @@ class PolynomialRemainderTheoremGenerator:
 
     def _generate_easy(self) -> Equation:
         # Find remainder using theorem
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
-        d = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 5)
 
         # Evaluate at x = -a
         remainder = (-a)**2 + b*(-a) + c
@@ -38,10 +35,10 @@ class PolynomialRemainderTheoremGenerator:
 
     def _generate_medium(self) -> Equation:
         # Cubic polynomial remainder
-        a = random.randint(1, 3)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
-        d = random.randint(1, 5)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 5)
 
         # f(-a)
         remainder = (-a)**3 + b*(-a)**2 + c*(-a) + d
@@ -53,9 +50,9 @@ class PolynomialRemainderTheoremGenerator:
 
     def _generate_hard(self) -> Equation:
         # Use remainder theorem to find value
-        a = random.randint(1, 4)
-        k = random.randint(-9, 9)
-        target_remainder = random.randint(1, 20)
+        a = self.rng.randint(1, 4)
+        k = self.rng.randint(-9, 9)
+        target_remainder = self.rng.randint(1, 20)
 
         # f(a) = a^2 + ka + something = target_remainder
         # something = target_remainder - a^2 - ka
@@ -68,9 +65,9 @@ class PolynomialRemainderTheoremGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Factor theorem application
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
 
         # Check if (x - a) is a factor
         remainder = a**2 + b*a + c
@@ -3,14 +3,11 @@ End Behavior of Polynomials Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class EndBehaviorPolynomialsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class EndBehaviorPolynomialsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Even degree, positive leading coefficient
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe end behavior: }} f(x) = {a}x^2 + {b}x"
         solution = "As x → -∞, f(x) → ∞; As x → ∞, f(x) → ∞"
@@ -33,8 +30,8 @@ class EndBehaviorPolynomialsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Odd degree, positive leading coefficient
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe end behavior: }} f(x) = {a}x^3 + {b}x^2"
         solution = "As x → -∞, f(x) → -∞; As x → ∞, f(x) → ∞"
@@ -43,9 +40,9 @@ class EndBehaviorPolynomialsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Negative leading coefficient
-        a = random.randint(-5, -1)
-        b = random.randint(1, 5)
-        degree = random.choice([2, 4])
+        a = self.rng.randint(-5, -1)
+        b = self.rng.randint(1, 5)
+        degree = self.rng.choice([2, 4])
 
         if degree == 2:
             latex = f"\\text{{Describe end behavior: }} f(x) = {a}x^2 + {b}x"
@@ -58,8 +55,8 @@ class EndBehaviorPolynomialsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # High degree with negative leading coefficient
-        a = random.randint(-3, -1)
-        b = random.randint(1, 5)
+        a = self.rng.randint(-3, -1)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe end behavior: }} f(x) = {a}x^5 + {b}x^3"
         solution = "As x → -∞, f(x) → ∞; As x → ∞, f(x) → -∞"
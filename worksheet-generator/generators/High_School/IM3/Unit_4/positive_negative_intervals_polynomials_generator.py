@@ -3,14 +3,11 @@ Positive and Negative Intervals of Polynomials Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class PositiveNegativeIntervalsPolynomialsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class PositiveNegativeIntervalsPolynomialsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple quadratic opening upward
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         if a < b:
             latex = f"\\text{{Where is }} f(x) = (x - {a})(x - {b}) \\text{{ positive?}}"
@@ -37,8 +34,8 @@ class PositiveNegativeIntervalsPolynomialsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Where is polynomial negative
-        a = random.randint(1, 5)
-        b = random.randint(6, 9)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(6, 9)
 
         latex = f"\\text{{Where is }} f(x) = (x - {a})(x - {b}) \\text{{ negative?}}"
         solution = f"{a} < x < {b}"
@@ -47,9 +44,9 @@ class PositiveNegativeIntervalsPolynomialsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Cubic function intervals
-        a = random.randint(1, 3)
-        b = random.randint(4, 6)
-        c = random.randint(7, 9)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(4, 6)
+        c = self.rng.randint(7, 9)
 
         latex = f"\\text{{Where is }} f(x) = (x - {a})(x - {b})(x - {c}) \\text{{ positive?}}"
         solution = f"{a} < x < {b} \\text{{ or }} x > {c}"
@@ -58,8 +55,8 @@ class PositiveNegativeIntervalsPolynomialsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # With multiplicity
-        a = random.randint(1, 4)
-        b = random.randint(5, 9)
+        a = self.rng.randint(1, 4)
+        b = self.rng.randint(5, 9)
 
         latex = f"\\text{{Where is }} f(x) = (x - {a})^2(x - {b}) \\text{{ negative?}}"
         solution = f"x < {b}, x \\neq {a}"
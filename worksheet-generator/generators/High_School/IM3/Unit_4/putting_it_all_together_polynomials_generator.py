@@ -3,14 +3,11 @@ Putting It All Together - Polynomials Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class PuttingItAllTogetherPolynomialsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class PuttingItAllTogetherPolynomialsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Complete analysis of simple polynomial
-        a = random.randint(1, 5)
-        b = random.randint(6, 9)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(6, 9)
 
         latex = f"\\text{{Find zeros and end behavior of }} f(x) = (x - {a})(x - {b})"
         solution = f"Zeros: {a}, {b}; End behavior: up on both sides"
@@ -33,8 +30,8 @@ class PuttingItAllTogetherPolynomialsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Sketch polynomial given properties
-        a = random.randint(1, 5)
-        b = random.randint(6, 9)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(6, 9)
 
         latex = f"\\text{{Analyze }} f(x) = -(x - {a})(x - {b}): \\text{{ zeros, end behavior, sign}}"
         solution = f"Zeros: {a}, {b}; Negative on ends; Positive between zeros"
@@ -43,9 +40,9 @@ class PuttingItAllTogetherPolynomialsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Complete cubic analysis
-        a = random.randint(1, 3)
-        b = random.randint(4, 6)
-        c = random.randint(7, 9)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(4, 6)
+        c = self.rng.randint(7, 9)
 
         latex = f"\\text{{Analyze }} f(x) = (x - {a})(x - {b})(x - {c}): \\text{{ zeros, intervals, end behavior}}"
         solution = f"Zeros: {a}, {b}, {c}; Negative: x<{a}, {b}<x<{c}; Positive: {a}<x<{b}, x>{c}"
@@ -54,8 +51,8 @@ class PuttingItAllTogetherPolynomialsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Write polynomial given properties
-        a = random.randint(1, 5)
-        b = random.randint(6, 9)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(6, 9)
 
         latex = f"\\text{{Write a polynomial with zeros at }} x = {a}, {b} \\text{{ and end behavior down on both sides}}"
         solution = f"f(x) = -(x - {a})(x - {b}) \\text{{ or any negative leading coefficient}}"
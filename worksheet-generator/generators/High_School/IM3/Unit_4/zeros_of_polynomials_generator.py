@@ -3,14 +3,11 @@ Zeros of Polynomials Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ZerosOfPolynomialsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class ZerosOfPolynomialsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Find zeros of factored quadratic
-        a = random.randint(1, 9)
-        b = random.randint(1, 9)
+        a = self.rng.randint(1, 9)
+        b = self.rng.randint(1, 9)
 
         latex = f"\\text{{Find zeros: }} f(x) = (x - {a})(x - {b})"
         solution = f"x = {a}, {b}"
@@ -33,8 +30,8 @@ class ZerosOfPolynomialsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Find zeros of expanded quadratic
-        a = random.randint(1, 9)
-        b = random.randint(1, 9)
+        a = self.rng.randint(1, 9)
+        b = self.rng.randint(1, 9)
 
         # (x - a)(x - b) = x^2 - (a+b)x + ab
         coef_x = -(a + b)
@@ -47,9 +44,9 @@ class ZerosOfPolynomialsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Find zeros of cubic
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
 
         latex = f"\\text{{Find zeros: }} f(x) = (x - {a})(x - {b})(x - {c})"
         solution = f"x = {a}, {b}, {c}"
@@ -58,8 +55,8 @@ class ZerosOfPolynomialsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Zeros with multiplicity
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{Find zeros and multiplicity: }} f(x) = (x - {a})^2(x - {b})"
         solution = f"x = {a} (multiplicity 2), x = {b} (multiplicity 1)"
@@ -3,14 +3,11 @@ Change of Base for Logarithms Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ChangeOfBaseLogarithmsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class ChangeOfBaseLogarithmsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Change to base 10
-        base = random.choice([2, 3, 5, 7])
-        value = random.randint(10, 50)
+        base = self.rng.choice([2, 3, 5, 7])
+        value = self.rng.randint(10, 50)
 
         latex = f"\\text{{Convert to base 10: }} \\log_{{{base}}} {value}"
         solution = f"\\frac{{\\log {value}}}{{\\log {base}}}"
@@ -33,8 +30,8 @@ class ChangeOfBaseLogarithmsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Change to natural log
-        base = random.choice([2, 3, 5, 7])
-        value = random.randint(10, 50)
+        base = self.rng.choice([2, 3, 5, 7])
+        value = self.rng.randint(10, 50)
 
         latex = f"\\text{{Convert to natural log: }} \\log_{{{base}}} {value}"
         solution = f"\\frac{{\\ln {value}}}{{\\ln {base}}}"
@@ -43,8 +40,8 @@ class ChangeOfBaseLogarithmsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Evaluate using change of base
-        base = random.choice([2, 4, 8])
-        exp = random.randint(2, 4)
+        base = self.rng.choice([2, 4, 8])
+        exp = self.rng.randint(2, 4)
         value = base ** exp
 
         latex = f"\\text{{Evaluate using change of base: }} \\log_{{{base}}} {value}"
@@ -54,9 +51,9 @@ class ChangeOfBaseLogarithmsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Complex change of base
-        base1 = random.choice([2, 3, 5])
-        base2 = random.choice([7, 11, 13])
-        value = random.randint(20, 100)
+        base1 = self.rng.choice([2, 3, 5])
+        base2 = self.rng.choice([7, 11, 13])
+        value = self.rng.randint(20, 100)
 
         latex = f"\\text{{Express in terms of }} \\log_{{{base2}}}: \\log_{{{base1}}} {value}"
         solution = f"\\frac{{\\log_{{{base2}}} {value}}}{{\\log_{{{base2}}} {base1}}}"
@@ -3,15 +3,12 @@ Constant e and Natural Log Generator
 """
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ConstantENaturalLogGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -24,7 +21,7 @@ class ConstantENaturalLogGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple natural log
-        exp = random.randint(1, 5)
+        exp = self.rng.randint(1, 5)
 
         latex = f"\\ln(e^{{{exp}}})"
         solution = f"{exp}"
@@ -33,7 +30,7 @@ class ConstantENaturalLogGenerator:
 
     def _generate_medium(self) -> Equation:
         # Convert to exponential form
-        value = random.randint(2, 20)
+        value = self.rng.randint(2, 20)
 
         latex = f"\\text{{If }} \\ln(x) = {value}\\text{{, find }} x"
         solution = f"x = e^{{{value}}}"
@@ -42,8 +39,8 @@ class ConstantENaturalLogGenerator:
 
     def _generate_hard(self) -> Equation:
         # Natural log properties
-        a = random.randint(2, 9)
-        b = random.randint(2, 9)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(2, 9)
 
         latex = f"\\text{{Simplify: }} \\ln(e^{{{a}}}) + \\ln(e^{{{b}}})"
         solution = f"{a + b}"
@@ -52,8 +49,8 @@ class ConstantENaturalLogGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Solve equation with e
-        k = random.randint(2, 9)
-        value = random.randint(10, 100)
+        k = self.rng.randint(2, 9)
+        value = self.rng.randint(10, 100)
 
         latex = f"\\text{{Solve: }} e^x = {value}"
         solution = f"x = \\ln({value})"
@@ -3,14 +3,11 @@ Introduction to Logarithms Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class IntroLogarithmsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class IntroLogarithmsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple logarithm evaluation
-        base = random.choice([2, 3, 5, 10])
-        exp = random.randint(1, 4)
+        base = self.rng.choice([2, 3, 5, 10])
+        exp = self.rng.randint(1, 4)
         value = base ** exp
 
         latex = f"\\log_{{{base}}} {value}"
@@ -34,8 +31,8 @@ class IntroLogarithmsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Convert between exponential and logarithmic form
-        base = random.choice([2, 3, 4, 5])
-        exp = random.randint(2, 4)
+        base = self.rng.choice([2, 3, 4, 5])
+        exp = self.rng.randint(2, 4)
         value = base ** exp
 
         latex = f"\\text{{Write in logarithmic form: }} {base}^{{{exp}}} = {value}"
@@ -45,8 +42,8 @@ class IntroLogarithmsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Solve simple logarithmic equation
-        base = random.choice([2, 3, 5])
-        exp = random.randint(2, 4)
+        base = self.rng.choice([2, 3, 5])
+        exp = self.rng.randint(2, 4)
         value = base ** exp
 
         latex = f"\\text{{Solve: }} \\log_{{{base}}} x = {exp}"
@@ -56,8 +53,8 @@ class IntroLogarithmsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # More complex logarithm
-        base = random.choice([2, 3, 4])
-        exp = random.randint(-3, -1)
+        base = self.rng.choice([2, 3, 4])
+        exp = self.rng.randint(-3, -1)
         value_num = 1
         value_den = base ** (-exp)
 
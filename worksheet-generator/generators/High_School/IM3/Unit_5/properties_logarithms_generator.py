@@ -3,14 +3,11 @@ Properties of Logarithms Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class PropertiesLogarithmsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class PropertiesLogarithmsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Product rule
-        a = random.randint(2, 9)
-        b = random.randint(2, 9)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(2, 9)
 
         latex = f"\\text{{Simplify: }} \\log({a}) + \\log({b})"
         solution = f"\\log({a*b})"
@@ -33,8 +30,8 @@ class PropertiesLogarithmsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Quotient rule
-        a = random.randint(10, 99)
-        b = random.randint(2, 9)
+        a = self.rng.randint(10, 99)
+        b = self.rng.randint(2, 9)
 
         latex = f"\\text{{Simplify: }} \\log({a}) - \\log({b})"
         solution = f"\\log\\left(\\frac{{{a}}}{{{b}}}\\right)"
@@ -43,8 +40,8 @@ class PropertiesLogarithmsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Power rule
-        a = random.randint(2, 9)
-        n = random.randint(2, 5)
+        a = self.rng.randint(2, 9)
+        n = self.rng.randint(2, 5)
 
         latex = f"\\text{{Simplify: }} \\log({a}^{{{n}}})"
         solution = f"{n}\\log({a})"
@@ -53,9 +50,9 @@ class PropertiesLogarithmsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Combined properties
-        a = random.randint(2, 9)
-        b = random.randint(2, 9)
-        n = random.randint(2, 4)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(2, 9)
+        n = self.rng.randint(2, 4)
 
         latex = f"\\text{{Expand: }} \\log\\left(\\frac{{{a}^{{{n}}}}}{{{b}}}\\right)"
         solution = f"{n}\\log({a}) - \\log({b})"
@@ -3,14 +3,11 @@ Solving Exponential Models Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SolvingExponentialModelsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class SolvingExponentialModelsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple growth model
-        initial = random.randint(100, 500)
-        rate = random.choice([1.05, 1.1, 1.15, 1.2])
+        initial = self.rng.randint(100, 500)
+        rate = self.rng.choice([1.05, 1.1, 1.15, 1.2])
         target = initial * 2
 
         latex = f"\\text{{When does }} P = {initial}({rate})^t \\text{{ reach }} {target}?"
@@ -34,8 +31,8 @@ class SolvingExponentialModelsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Decay model
-        initial = random.randint(500, 1000)
-        rate = random.choice([0.9, 0.85, 0.8, 0.75])
+        initial = self.rng.randint(500, 1000)
+        rate = self.rng.choice([0.9, 0.85, 0.8, 0.75])
         target = initial // 2
 
         latex = f"\\text{{When does }} P = {initial}({rate})^t \\text{{ reach }} {target}?"
@@ -45,8 +42,8 @@ class SolvingExponentialModelsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Compound interest
-        principal = random.randint(1000, 5000)
-        rate = random.choice([0.04, 0.05, 0.06, 0.07])
+        principal = self.rng.randint(1000, 5000)
+        rate = self.rng.choice([0.04, 0.05, 0.06, 0.07])
         target = principal * 2
 
         latex = f"\\text{{When does }} A = {principal}(1+{rate})^t \\text{{ reach }} {target}?"
@@ -56,9 +53,9 @@ class SolvingExponentialModelsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Population growth with continuous compounding
-        initial = random.randint(10000, 50000)
-        rate = random.choice([0.02, 0.03, 0.04])
-        target = initial * random.choice([2, 3])
+        initial = self.rng.randint(10000, 50000)
+        rate = self.rng.choice([0.02, 0.03, 0.04])
+        target = initial * self.rng.choice([2, 3])
 
         latex = f"\\text{{When does }} P = {initial}e^{{{rate}t}} \\text{{ reach }} {target}?"
         solution = f"t = \\frac{{\\ln({target}/{initial})}}{{{rate}}}"
@@ -3,14 +3,11 @@ Solving Exponential Equations with Logarithms Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SolvingExponentialWithLogarithmsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class SolvingExponentialWithLogarithmsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple exponential equation
-        base = random.choice([2, 3, 5])
-        value = random.randint(10, 50)
+        base = self.rng.choice([2, 3, 5])
+        value = self.rng.randint(10, 50)
 
         latex = f"{base}^x = {value}"
         solution = f"x = \\log_{{{base}}} {value} = \\frac{{\\ln {value}}}{{\\ln {base}}}"
@@ -33,9 +30,9 @@ class SolvingExponentialWithLogarithmsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Exponential with coefficient
-        base = random.choice([2, 3, 5])
-        coef = random.randint(2, 9)
-        value = random.randint(20, 100)
+        base = self.rng.choice([2, 3, 5])
+        coef = self.rng.randint(2, 9)
+        value = self.rng.randint(20, 100)
 
         latex = f"{coef} \\cdot {base}^x = {value}"
         solution = f"x = \\log_{{{base}}} \\frac{{{value}}}{{{coef}}}"
@@ -44,9 +41,9 @@ class SolvingExponentialWithLogarithmsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Exponential with addition
-        base = random.choice([2, 3, 5])
-        k = random.randint(1, 5)
-        value = random.randint(20, 100)
+        base = self.rng.choice([2, 3, 5])
+        k = self.rng.randint(1, 5)
+        value = self.rng.randint(20, 100)
 
         latex = f"{base}^{{x+{k}}} = {value}"
         solution = f"x = \\log_{{{base}}} {value} - {k}"
@@ -55,9 +52,9 @@ class SolvingExponentialWithLogarithmsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Complex exponential equation
-        base = random.choice([2, 3])
-        k = random.randint(2, 5)
-        value = random.randint(50, 200)
+        base = self.rng.choice([2, 3])
+        k = self.rng.randint(2, 5)
+        value = self.rng.randint(50, 200)
 
         latex = f"{base}^{{{k}x}} = {value}"
         solution = f"x = \\frac{{\\log_{{{base}}} {value}}}{{{k}}}"
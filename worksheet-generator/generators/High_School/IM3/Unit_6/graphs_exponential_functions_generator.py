@@ -3,14 +3,11 @@ Graphs of Exponential Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class GraphsExponentialFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class GraphsExponentialFunctionsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Basic exponential shift
-        b = random.choice([2, 3])
-        k = random.randint(1, 5)
+        b = self.rng.choice([2, 3])
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe: }} f(x) = {b}^x + {k}"
         solution = f"Exponential base {b} shifted up {k}"
@@ -33,8 +30,8 @@ class GraphsExponentialFunctionsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Horizontal shift
-        b = random.choice([2, 3])
-        h = random.randint(1, 5)
+        b = self.rng.choice([2, 3])
+        h = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe: }} f(x) = {b}^{{x - {h}}}"
         solution = f"Exponential base {b} shifted right {h}"
@@ -43,8 +40,8 @@ class GraphsExponentialFunctionsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Reflection and shift
-        b = random.choice([2, 3])
-        k = random.randint(1, 5)
+        b = self.rng.choice([2, 3])
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe: }} f(x) = -{b}^x + {k}"
         solution = f"Reflected over x-axis, shifted up {k}, asymptote at y = {k}"
@@ -53,10 +50,10 @@ class GraphsExponentialFunctionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Multiple transformations
-        a = random.randint(2, 4)
-        b = random.choice([2, 3])
-        h = random.randint(1, 5)
-        k = random.randint(1, 5)
+        a = self.rng.randint(2, 4)
+        b = self.rng.choice([2, 3])
+        h = self.rng.randint(1, 5)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe: }} f(x) = {a} \\cdot {b}^{{x - {h}}} + {k}"
         solution = f"Stretch by {a}, right {h}, up {k}, asymptote at y = {k}"
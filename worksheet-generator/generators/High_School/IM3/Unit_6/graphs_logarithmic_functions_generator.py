@@ -3,14 +3,11 @@ Graphs of Logarithmic Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class GraphsLogarithmicFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class GraphsLogarithmicFunctionsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Basic log shift
-        b = random.choice([2, 3, 10])
-        k = random.randint(1, 5)
+        b = self.rng.choice([2, 3, 10])
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe: }} f(x) = \\log_{{{b}}}(x) + {k}"
         solution = f"Log base {b} shifted up {k}"
@@ -33,8 +30,8 @@ class GraphsLogarithmicFunctionsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Horizontal shift
-        b = random.choice([2, 3, 10])
-        h = random.randint(1, 5)
+        b = self.rng.choice([2, 3, 10])
+        h = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe: }} f(x) = \\log_{{{b}}}(x - {h})"
         solution = f"Log base {b} shifted right {h}, vertical asymptote at x = {h}"
@@ -43,8 +40,8 @@ class GraphsLogarithmicFunctionsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Reflection
-        b = random.choice([2, 3, 10])
-        k = random.randint(1, 5)
+        b = self.rng.choice([2, 3, 10])
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe: }} f(x) = -\\log_{{{b}}}(x) + {k}"
         solution = f"Reflected over x-axis, shifted up {k}"
@@ -53,9 +50,9 @@ class GraphsLogarithmicFunctionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Multiple transformations
-        a = random.randint(2, 4)
-        h = random.randint(1, 5)
-        k = random.randint(1, 5)
+        a = self.rng.randint(2, 4)
+        h = self.rng.randint(1, 5)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe: }} f(x) = {a}\\ln(x - {h}) + {k}"
         solution = f"Vertical stretch by {a}, right {h}, up {k}, asymptote at x = {h}"
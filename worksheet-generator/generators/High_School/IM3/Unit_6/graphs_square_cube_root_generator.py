@@ -3,14 +3,11 @@ Graphs of Square and Cube Root Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class GraphsSquareCubeRootGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class GraphsSquareCubeRootGenerator:
 
     def _generate_easy(self) -> Equation:
         # Basic square root transformation
-        k = random.randint(1, 5)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe: }} f(x) = \\sqrt{{x}} + {k}"
         solution = f"Square root shifted up {k}"
@@ -32,7 +29,7 @@ class GraphsSquareCubeRootGenerator:
 
     def _generate_medium(self) -> Equation:
         # Horizontal shift of square root
-        h = random.randint(1, 5)
+        h = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe: }} f(x) = \\sqrt{{x - {h}}}"
         solution = f"Square root shifted right {h}"
@@ -41,8 +38,8 @@ class GraphsSquareCubeRootGenerator:
 
     def _generate_hard(self) -> Equation:
         # Cube root transformation
-        h = random.randint(1, 5)
-        k = random.randint(1, 5)
+        h = self.rng.randint(1, 5)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe: }} f(x) = \\sqrt[3]{{x + {h}}} - {k}"
         solution = f"Cube root shifted left {h}, down {k}"
@@ -51,8 +48,8 @@ class GraphsSquareCubeRootGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Complex transformation
-        a = random.randint(2, 4)
-        h = random.randint(1, 5)
+        a = self.rng.randint(2, 4)
+        h = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe: }} f(x) = -{a}\\sqrt{{x - {h}}}"
         solution = f"Reflect over x-axis, stretch by {a}, right {h}"
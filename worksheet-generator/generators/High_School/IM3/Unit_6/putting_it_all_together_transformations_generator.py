@@ -3,14 +3,11 @@ Putting It All Together - Transformations Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class PuttingItAllTogetherTransformationsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class PuttingItAllTogetherTransformationsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Describe all transformations
-        h = random.randint(1, 5)
-        k = random.randint(1, 5)
+        h = self.rng.randint(1, 5)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe transformations from }} f(x) = x^2: g(x) = (x - {h})^2 + {k}"
         solution = f"Right {h}, up {k}"
@@ -33,8 +30,8 @@ class PuttingItAllTogetherTransformationsGenerator:
 
     def _generate_medium(self) -> Equation:
         # With reflection
-        h = random.randint(1, 5)
-        k = random.randint(1, 5)
+        h = self.rng.randint(1, 5)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe transformations: }} g(x) = -(x + {h})^2 + {k}"
         solution = f"Reflect over x-axis, left {h}, up {k}"
@@ -43,9 +40,9 @@ class PuttingItAllTogetherTransformationsGenerator:
 
     def _generate_hard(self) -> Equation:
         # With stretching
-        a = random.randint(2, 4)
-        h = random.randint(1, 5)
-        k = random.randint(1, 5)
+        a = self.rng.randint(2, 4)
+        h = self.rng.randint(1, 5)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe transformations: }} g(x) = {a}(x - {h})^2 - {k}"
         solution = f"Vertical stretch by {a}, right {h}, down {k}"
@@ -54,9 +51,9 @@ class PuttingItAllTogetherTransformationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Write function given transformations
-        a = random.randint(2, 4)
-        h = random.randint(1, 5)
-        k = random.randint(1, 5)
+        a = self.rng.randint(2, 4)
+        h = self.rng.randint(1, 5)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Write }} f(x) = x^2 \\text{{ with: reflect x-axis, stretch by {a}, right {h}, up {k}}}"
         solution = f"f(x) = -{a}(x - {h})^2 + {k}"
@@ -3,14 +3,11 @@ Reflecting Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ReflectingFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class ReflectingFunctionsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Reflection over x-axis
-        func = random.choice(['x^2', 'x^3', '|x|'])
+        func = self.rng.choice(['x^2', 'x^3', '|x|'])
 
         latex = f"\\text{{Describe: }} f(x) = -{func}"
         solution = f"Reflection over x-axis"
@@ -32,7 +29,7 @@ class ReflectingFunctionsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Reflection over y-axis
-        func = random.choice(['x^2', 'x^3'])
+        func = self.rng.choice(['x^2', 'x^3'])
 
         latex = f"\\text{{Describe: }} f(x) = (-x)^{{{func[-1]}}}"
         solution = f"Reflection over y-axis"
@@ -41,7 +38,7 @@ class ReflectingFunctionsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Combined reflection and shift
-        k = random.randint(1, 5)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe: }} f(x) = -x^2 + {k}"
         solution = f"Reflection over x-axis, shift up {k}"
@@ -50,7 +47,7 @@ class ReflectingFunctionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Write reflected function
-        func_type = random.choice(['quadratic', 'cubic'])
+        func_type = self.rng.choice(['quadratic', 'cubic'])
 
         if func_type == 'quadratic':
             latex = f"\\text{{Reflect }} f(x) = x^2 \\text{{ over both axes}}"
@@ -3,14 +3,11 @@ Scaling Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ScalingFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class ScalingFunctionsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Vertical stretch
-        a = random.randint(2, 5)
+        a = self.rng.randint(2, 5)
 
         latex = f"\\text{{Describe: }} f(x) = {a}x^2"
         solution = f"Vertical stretch by factor of {a}"
@@ -32,7 +29,7 @@ class ScalingFunctionsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Vertical compression
-        a = random.randint(2, 5)
+        a = self.rng.randint(2, 5)
 
         latex = f"\\text{{Describe: }} f(x) = \\frac{{1}}{{{a}}}x^2"
         solution = f"Vertical compression by factor of {a}"
@@ -41,7 +38,7 @@ class ScalingFunctionsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Horizontal stretch/compression
-        a = random.randint(2, 5)
+        a = self.rng.randint(2, 5)
 
         latex = f"\\text{{Describe: }} f(x) = ({a}x)^2"
         solution = f"Horizontal compression by factor of {a}"
@@ -50,9 +47,9 @@ class ScalingFunctionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Combined scaling and other transformations
-        a = random.randint(2, 4)
-        h = random.randint(1, 5)
-        k = random.randint(1, 5)
+        a = self.rng.randint(2, 4)
+        h = self.rng.randint(1, 5)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe all transformations: }} f(x) = {a}(x - {h})^2 + {k}"
         solution = f"Stretch by {a}, shift right {h}, shift up {k}"
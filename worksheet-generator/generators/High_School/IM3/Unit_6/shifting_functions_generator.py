@@ -3,14 +3,11 @@ Shifting Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ShiftingFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class ShiftingFunctionsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Vertical shift
-        k = random.randint(1, 9)
+        k = self.rng.randint(1, 9)
 
         latex = f"\\text{{Describe the transformation: }} f(x) = x^2 + {k}"
         solution = f"Vertical shift up {k} units"
@@ -32,7 +29,7 @@ class ShiftingFunctionsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Horizontal shift
-        h = random.randint(1, 9)
+        h = self.rng.randint(1, 9)
 
         latex = f"\\text{{Describe the transformation: }} f(x) = (x - {h})^2"
         solution = f"Horizontal shift right {h} units"
@@ -41,8 +38,8 @@ class ShiftingFunctionsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Both shifts
-        h = random.randint(1, 5)
-        k = random.randint(1, 5)
+        h = self.rng.randint(1, 5)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe the transformation: }} f(x) = (x - {h})^2 + {k}"
         solution = f"Shift right {h}, shift up {k}"
@@ -51,8 +48,8 @@ class ShiftingFunctionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Write transformed function
-        h = random.randint(1, 5)
-        k = random.randint(1, 5)
+        h = self.rng.randint(1, 5)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Write }} f(x) = x^3 \\text{{ shifted left {h} and down {k}}}"
         solution = f"f(x) = (x + {h})^3 - {k}"
@@ -3,14 +3,11 @@ Symmetry of Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SymmetryFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class SymmetryFunctionsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Even function
-        a = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
 
         latex = f"\\text{{Is }} f(x) = {a}x^2 \\text{{ even, odd, or neither?}}"
         solution = "Even (symmetric about y-axis)"
@@ -32,7 +29,7 @@ class SymmetryFunctionsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Odd function
-        a = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
 
         latex = f"\\text{{Is }} f(x) = {a}x^3 \\text{{ even, odd, or neither?}}"
         solution = "Odd (symmetric about origin)"
@@ -41,8 +38,8 @@ class SymmetryFunctionsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Neither even nor odd
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{Is }} f(x) = x^2 + {b}x \\text{{ even, odd, or neither?}}"
         solution = "Neither"
@@ -51,7 +48,7 @@ class SymmetryFunctionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Test for even/odd algebraically
-        a = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
 
         latex = f"\\text{{Verify that }} f(x) = {a}x^4 + x^2 \\text{{ is even}}"
         solution = f"f(-x) = {a}(-x)^4 + (-x)^2 = {a}x^4 + x^2 = f(x)"
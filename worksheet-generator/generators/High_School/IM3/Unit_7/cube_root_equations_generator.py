@@ -3,14 +3,11 @@ Cube Root Equations Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class CubeRootEquationsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class CubeRootEquationsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple cube root
-        a = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
 
         latex = f"\\sqrt[3]{{x}} = {a}"
         solution = f"x = {a**3}"
@@ -32,8 +29,8 @@ class CubeRootEquationsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Cube root with addition inside
-        a = random.randint(1, 9)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 9)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\sqrt[3]{{x + {a}}} = {b}"
         solution = f"x = {b**3 - a}"
@@ -42,8 +39,8 @@ class CubeRootEquationsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Cube root with subtraction
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\sqrt[3]{{x - {a}}} = {b}"
         solution = f"x = {b**3 + a}"
@@ -52,9 +49,9 @@ class CubeRootEquationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Cube root with coefficient
-        a = random.randint(2, 5)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
 
         latex = f"{a}\\sqrt[3]{{x}} + {b} = {c}"
         solution = f"x = \\left(\\frac{{{c - b}}}{{{a}}}\\right)^3"
@@ -3,14 +3,11 @@ Extraneous Solutions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ExtraneousSolutionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class ExtraneousSolutionsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Check if solution is extraneous
-        a = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
 
         latex = f"\\text{{Check if }} x = {a} \\text{{ solves }} \\sqrt{{x}} = -{a}"
         solution = "Extraneous (square root cannot equal negative)"
@@ -32,7 +29,7 @@ class ExtraneousSolutionsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Solve and check for extraneous
-        a = random.randint(2, 5)
+        a = self.rng.randint(2, 5)
 
         latex = f"\\text{{Solve and check: }} \\sqrt{{x + {a}}} = x - {a}"
         solution = f"x = {a+1} \\text{{ (check: both sides positive)}}"
@@ -41,7 +38,7 @@ class ExtraneousSolutionsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Rational equation with restriction
-        a = random.randint(2, 5)
+        a = self.rng.randint(2, 5)
 
         latex = f"\\text{{Solve: }} \\frac{{1}}{{x - {a}}} = \\frac{{1}}{{x - {a}}}"
         solution = f"\\text{{All real numbers except }} x = {a}"
@@ -50,7 +47,7 @@ class ExtraneousSolutionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Complex equation with potential extraneous solution
-        a = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
 
         latex = f"\\text{{Solve and identify extraneous solutions: }} \\sqrt{{2x + {a}}} = x - {a}"
         solution = "Solve algebraically, check both solutions in original equation"
@@ -3,14 +3,11 @@ Quadratic Systems Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class QuadraticSystemsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class QuadraticSystemsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Linear and quadratic
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\begin{{cases}} y = x^2 \\\\ y = {a}x + {b} \\end{{cases}}"
         solution = "Substitute and solve quadratic equation"
@@ -33,8 +30,8 @@ class QuadraticSystemsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Circle and line
-        r = random.randint(2, 5)
-        m = random.randint(1, 3)
+        r = self.rng.randint(2, 5)
+        m = self.rng.randint(1, 3)
 
         latex = f"\\begin{{cases}} x^2 + y^2 = {r**2} \\\\ y = {m}x \\end{{cases}}"
         solution = f"Substitute and solve for intersection points"
@@ -43,8 +40,8 @@ class QuadraticSystemsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Two parabolas
-        a = random.randint(1, 3)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\begin{{cases}} y = x^2 \\\\ y = {a}x^2 + {b} \\end{{cases}}"
         solution = f"Set equal: x^2 = {a}x^2 + {b}, solve for x"
@@ -53,9 +50,9 @@ class QuadraticSystemsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Ellipse and line
-        a = random.randint(2, 5)
-        b = random.randint(2, 5)
-        m = random.randint(1, 3)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 5)
+        m = self.rng.randint(1, 3)
 
         latex = f"\\begin{{cases}} \\frac{{x^2}}{{{a**2}}} + \\frac{{y^2}}{{{b**2}}} = 1 \\\\ y = {m}x \\end{{cases}}"
         solution = "Substitute and solve for intersection points"
@@ -3,14 +3,11 @@ Rational Equations Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class RationalEquationsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class RationalEquationsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple rational equation
-        a = random.randint(2, 9)
-        b = random.randint(1, 9)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(1, 9)
 
         latex = f"\\frac{{{a}}}{{x}} = {b}"
         solution = f"x = \\frac{{{a}}}{{{b}}}"
@@ -33,9 +30,9 @@ class RationalEquationsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Rational equation with addition
-        a = random.randint(2, 9)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
 
         latex = f"\\frac{{{a}}}{{x}} + {b} = {c}"
         solution = f"x = \\frac{{{a}}}{{{c - b}}}"
@@ -44,9 +41,9 @@ class RationalEquationsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Two rational terms
-        a = random.randint(2, 9)
-        b = random.randint(2, 9)
-        c = random.randint(1, 5)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(2, 9)
+        c = self.rng.randint(1, 5)
 
         latex = f"\\frac{{{a}}}{{x}} + \\frac{{{b}}}{{x}} = {c}"
         solution = f"x = \\frac{{{a + b}}}{{{c}}}"
@@ -55,10 +52,10 @@ class RationalEquationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Different denominators
-        a = random.randint(2, 9)
-        b = random.randint(2, 9)
-        c = random.randint(1, 5)
-        d = random.randint(1, 5)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(2, 9)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 5)
 
         latex = f"\\frac{{{a}}}{{x}} = \\frac{{{b}}}{{x + {c}}}"
         solution = f"x = \\frac{{{a*c}}}{{{b - a}}}"
@@ -3,14 +3,11 @@ Solving Equations by Graphing Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SolvingEquationsGraphingGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,9 +20,9 @@ class SolvingEquationsGraphingGenerator:
 
     def _generate_easy(self) -> Equation:
         # Linear equation graphically
-        m = random.randint(2, 5)
-        b = random.randint(1, 9)
-        c = random.randint(1, 9)
+        m = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 9)
+        c = self.rng.randint(1, 9)
 
         latex = f"\\text{{Solve graphically: }} {m}x + {b} = {c}"
         solution = f"x = \\frac{{{c - b}}}{{{m}}}"
@@ -34,8 +31,8 @@ class SolvingEquationsGraphingGenerator:
 
     def _generate_medium(self) -> Equation:
         # Quadratic equation graphically
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{Solve graphically: }} x^2 = {a}x + {b}"
         solution = "Find x-intercepts of y = x^2 - {a}x - {b}"
@@ -44,8 +41,8 @@ class SolvingEquationsGraphingGenerator:
 
     def _generate_hard(self) -> Equation:
         # Exponential equation graphically
-        b = random.choice([2, 3])
-        c = random.randint(5, 20)
+        b = self.rng.choice([2, 3])
+        c = self.rng.randint(5, 20)
 
         latex = f"\\text{{Solve graphically: }} {b}^x = {c}"
         solution = f"Find intersection of y = {b}^x and y = {c}"
@@ -54,8 +51,8 @@ class SolvingEquationsGraphingGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Complex equation graphically
-        a = random.randint(1, 3)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 3)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{Solve graphically: }} x^3 = {a}x + {b}"
         solution = f"Find intersections of y = x^3 and y = {a}x + {b}"
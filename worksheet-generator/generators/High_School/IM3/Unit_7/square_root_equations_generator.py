@@ -3,14 +3,11 @@ Square Root Equations Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SquareRootEquationsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class SquareRootEquationsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple square root
-        a = random.randint(1, 20)
+        a = self.rng.randint(1, 20)
 
         latex = f"\\sqrt{{x}} = {a}"
         solution = f"x = {a**2}"
@@ -32,8 +29,8 @@ class SquareRootEquationsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Square root with addition inside
-        a = random.randint(1, 9)
-        b = random.randint(1, 9)
+        a = self.rng.randint(1, 9)
+        b = self.rng.randint(1, 9)
 
         latex = f"\\sqrt{{x + {a}}} = {b}"
         solution = f"x = {b**2 - a}"
@@ -42,9 +39,9 @@ class SquareRootEquationsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Square root with addition outside
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        c = random.randint(6, 15)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(6, 15)
 
         latex = f"\\sqrt{{x}} + {a} = {c}"
         solution = f"x = {(c - a)**2}"
@@ -53,8 +50,8 @@ class SquareRootEquationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Two square roots
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\sqrt{{x + {a}}} = \\sqrt{{x}} + {b}"
         solution = f"\\text{{Square both sides and solve}}"
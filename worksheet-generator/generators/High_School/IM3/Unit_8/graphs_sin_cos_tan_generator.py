@@ -3,14 +3,11 @@ Graphs of Sin, Cos, and Tan Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class GraphsSinCosTanGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class GraphsSinCosTanGenerator:
 
     def _generate_easy(self) -> Equation:
         # Amplitude
-        a = random.randint(2, 5)
+        a = self.rng.randint(2, 5)
 
         latex = f"\\text{{Find amplitude of }} y = {a}\\sin(x)"
         solution = f"{a}"
@@ -32,7 +29,7 @@ class GraphsSinCosTanGenerator:
 
     def _generate_medium(self) -> Equation:
         # Period
-        b = random.randint(2, 4)
+        b = self.rng.randint(2, 4)
 
         latex = f"\\text{{Find period of }} y = \\cos({b}x)"
         solution = f"\\frac{{2\\pi}}{{{b}}}"
@@ -41,8 +38,8 @@ class GraphsSinCosTanGenerator:
 
     def _generate_hard(self) -> Equation:
         # Phase shift and vertical shift
-        c = random.randint(1, 5)
-        d = random.randint(1, 5)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 5)
 
         latex = f"\\text{{Describe transformations: }} y = \\sin(x - {c}) + {d}"
         solution = f"Phase shift right {c}, vertical shift up {d}"
@@ -51,10 +48,10 @@ class GraphsSinCosTanGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Complete analysis
-        a = random.randint(2, 4)
-        b = random.randint(2, 4)
-        c = random.randint(1, 5)
-        d = random.randint(1, 5)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(2, 4)
+        c = self.rng.randint(1, 5)
+        d = self.rng.randint(1, 5)
 
         latex = f"\\text{{Analyze }} y = {a}\\sin({b}(x - {c})) + {d}: \\text{{ amplitude, period, shifts}}"
         solution = f"Amplitude: {a}, Period: \\frac{{2\\pi}}{{{b}}}, Right {c}, Up {d}"
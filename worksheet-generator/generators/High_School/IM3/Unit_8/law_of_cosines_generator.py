@@ -3,14 +3,11 @@ Law of Cosines Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class LawOfCosinesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,9 +20,9 @@ class LawOfCosinesGenerator:
 
     def _generate_easy(self) -> Equation:
         # Find side given SAS
-        b = random.randint(5, 12)
-        c = random.randint(5, 12)
-        A = random.randint(40, 80)
+        b = self.rng.randint(5, 12)
+        c = self.rng.randint(5, 12)
+        A = self.rng.randint(40, 80)
 
         latex = f"\\text{{Given }} b = {b}, c = {c}, \\angle A = {A}°\\text{{, find }} a"
         solution = f"a^2 = {b}^2 + {c}^2 - 2({b})({c})\\cos({A}°)"
@@ -34,9 +31,9 @@ class LawOfCosinesGenerator:
 
     def _generate_medium(self) -> Equation:
         # Find angle given SSS
-        a = random.randint(5, 10)
-        b = random.randint(5, 10)
-        c = random.randint(5, 10)
+        a = self.rng.randint(5, 10)
+        b = self.rng.randint(5, 10)
+        c = self.rng.randint(5, 10)
 
         latex = f"\\text{{Given }} a = {a}, b = {b}, c = {c}\\text{{, find }} \\angle C"
         solution = f"\\cos(C) = \\frac{{{a}^2 + {b}^2 - {c}^2}}{{2({a})({b})}}"
@@ -45,9 +42,9 @@ class LawOfCosinesGenerator:
 
     def _generate_hard(self) -> Equation:
         # Complete triangle given SAS
-        a = random.randint(8, 15)
-        b = random.randint(8, 15)
-        C = random.randint(50, 100)
+        a = self.rng.randint(8, 15)
+        b = self.rng.randint(8, 15)
+        C = self.rng.randint(50, 100)
 
         latex = f"\\text{{Given }} a = {a}, b = {b}, \\angle C = {C}°\\text{{, find }} c \\text{{ and other angles}}"
         solution = f"c^2 = {a}^2 + {b}^2 - 2({a})({b})\\cos({C}°)"
@@ -56,9 +53,9 @@ class LawOfCosinesGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Application problem
-        a = random.randint(10, 20)
-        b = random.randint(10, 20)
-        c = random.randint(10, 20)
+        a = self.rng.randint(10, 20)
+        b = self.rng.randint(10, 20)
+        c = self.rng.randint(10, 20)
 
         latex = f"\\text{{Triangle with sides }} {a}, {b}, {c}\\text{{. Find largest angle.}}"
         solution = "Largest angle opposite longest side, use law of cosines"
@@ -3,15 +3,12 @@ Law of Sines Generator
 """
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class LawOfSinesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -24,9 +21,9 @@ class LawOfSinesGenerator:
 
     def _generate_easy(self) -> Equation:
         # Find side given two angles and one side
-        A = random.randint(30, 80)
-        B = random.randint(30, 80)
-        a = random.randint(5, 15)
+        A = self.rng.randint(30, 80)
+        B = self.rng.randint(30, 80)
+        a = self.rng.randint(5, 15)
 
         latex = f"\\text{{Given }} \\angle A = {A}°, \\angle B = {B}°, a = {a}\\text{{, find }} b"
         solution = f"b = \\frac{{{a} \\sin({B}°)}}{{\\sin({A}°)}}"
@@ -35,9 +32,9 @@ class LawOfSinesGenerator:
 
     def _generate_medium(self) -> Equation:
         # Find angle given two sides and one angle
-        A = random.randint(30, 60)
-        a = random.randint(5, 15)
-        b = random.randint(5, 15)
+        A = self.rng.randint(30, 60)
+        a = self.rng.randint(5, 15)
+        b = self.rng.randint(5, 15)
 
         latex = f"\\text{{Given }} \\angle A = {A}°, a = {a}, b = {b}\\text{{, find }} \\angle B"
         solution = f"\\sin(B) = \\frac{{{b} \\sin({A}°)}}{{{a}}}"
@@ -46,10 +43,10 @@ class LawOfSinesGenerator:
 
     def _generate_hard(self) -> Equation:
         # Complete triangle given AAS
-        A = random.randint(40, 70)
-        B = random.randint(40, 70)
+        A = self.rng.randint(40, 70)
+        B = self.rng.randint(40, 70)
         C = 180 - A - B
-        a = random.randint(8, 15)
+        a = self.rng.randint(8, 15)
 
         latex = f"\\text{{Given }} \\angle A = {A}°, \\angle B = {B}°, a = {a}\\text{{, find }} b \\text{{ and }} c"
         solution = f"\\angle C = {C}°, \\text{{ use law of sines for }} b \\text{{ and }} c"
@@ -58,9 +55,9 @@ class LawOfSinesGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Ambiguous case (SSA)
-        A = random.randint(30, 50)
-        a = random.randint(8, 12)
-        b = random.randint(10, 15)
+        A = self.rng.randint(30, 50)
+        a = self.rng.randint(8, 12)
+        b = self.rng.randint(10, 15)
 
         latex = f"\\text{{Given }} \\angle A = {A}°, a = {a}, b = {b}\\text{{, how many triangles?}}"
         solution = "Check if ambiguous case applies (SSA)"
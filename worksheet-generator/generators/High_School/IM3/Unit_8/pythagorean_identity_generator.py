@@ -3,14 +3,11 @@ Pythagorean Identity Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class PythagoreanIdentityGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -37,7 +34,7 @@ class PythagoreanIdentityGenerator:
             "\\frac{12}{13}": "\\frac{5}{13}"
         }
 
-        cos_val, sin_val = random.choice(list(cos_values.items()))
+        cos_val, sin_val = self.rng.choice(list(cos_values.items()))
 
         latex = f"\\text{{If }} \\cos(\\theta) = {cos_val} \\text{{ (Quadrant I), find }} \\sin(\\theta)"
         solution = sin_val
@@ -46,8 +43,8 @@ class PythagoreanIdentityGenerator:
 
     def _generate_hard(self) -> Equation:
         # Find cos given sin in different quadrant
-        sin_val = random.choice(["\\frac{3}{5}", "\\frac{4}{5}", "\\frac{5}{13}"])
-        quad = random.choice([2, 3, 4])
+        sin_val = self.rng.choice(["\\frac{3}{5}", "\\frac{4}{5}", "\\frac{5}{13}"])
+        quad = self.rng.choice([2, 3, 4])
 
         latex = f"\\text{{If }} \\sin(\\theta) = {sin_val} \\text{{ (Quadrant {quad}), find }} \\cos(\\theta)"
         solution = "Use Pythagorean identity, apply quadrant sign"
@@ -62,7 +59,7 @@ class PythagoreanIdentityGenerator:
             ("\\sin^2(\\theta) + \\cos^2(\\theta) + 1", "2")
         ]
 
-        expr, result = random.choice(expressions)
+        expr, result = self.rng.choice(expressions)
 
         latex = f"\\text{{Simplify: }} {expr}"
         solution = result
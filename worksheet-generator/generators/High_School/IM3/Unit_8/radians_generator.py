@@ -3,14 +3,11 @@ Radians Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class RadiansGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class RadiansGenerator:
 
     def _generate_easy(self) -> Equation:
         # Convert simple degrees to radians
-        degrees = random.choice([30, 45, 60, 90, 120, 135, 150, 180])
+        degrees = self.rng.choice([30, 45, 60, 90, 120, 135, 150, 180])
 
         conversions = {
             30: "\\frac{\\pi}{6}",
@@ -51,7 +48,7 @@ class RadiansGenerator:
             "\\frac{3\\pi}{4}": 135
         }
 
-        rad, deg = random.choice(list(radians.items()))
+        rad, deg = self.rng.choice(list(radians.items()))
 
         latex = f"\\text{{Convert to degrees: }} {rad}"
         solution = f"{deg}°"
@@ -60,7 +57,7 @@ class RadiansGenerator:
 
     def _generate_hard(self) -> Equation:
         # Less common conversions
-        degrees = random.choice([210, 225, 240, 270, 300, 315, 330, 360])
+        degrees = self.rng.choice([210, 225, 240, 270, 300, 315, 330, 360])
 
         conversions = {
             210: "\\frac{7\\pi}{6}",
@@ -80,8 +77,8 @@ class RadiansGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Arc length or sector area
-        r = random.randint(3, 10)
-        theta_deg = random.choice([60, 90, 120])
+        r = self.rng.randint(3, 10)
+        theta_deg = self.rng.choice([60, 90, 120])
         theta_conversions = {60: "\\frac{\\pi}{3}", 90: "\\frac{\\pi}{2}", 120: "\\frac{2\\pi}{3}"}
 
         latex = f"\\text{{Find arc length: }} r = {r}, \\theta = {theta_deg}°"
@@ -3,14 +3,11 @@ Solving General Triangles Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class SolvingGeneralTrianglesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,9 +20,9 @@ class SolvingGeneralTrianglesGenerator:
 
     def _generate_easy(self) -> Equation:
         # ASA case
-        A = random.randint(40, 70)
-        B = random.randint(40, 70)
-        c = random.randint(8, 15)
+        A = self.rng.randint(40, 70)
+        B = self.rng.randint(40, 70)
+        c = self.rng.randint(8, 15)
 
         latex = f"\\text{{Solve triangle: }} \\angle A = {A}°, \\angle B = {B}°, c = {c}"
         solution = f"Find C = {180-A-B}°, use law of sines for a and b"
@@ -34,9 +31,9 @@ class SolvingGeneralTrianglesGenerator:
 
     def _generate_medium(self) -> Equation:
         # SAS case
-        a = random.randint(8, 15)
-        b = random.randint(8, 15)
-        C = random.randint(50, 100)
+        a = self.rng.randint(8, 15)
+        b = self.rng.randint(8, 15)
+        C = self.rng.randint(50, 100)
 
         latex = f"\\text{{Solve triangle: }} a = {a}, b = {b}, \\angle C = {C}°"
         solution = "Use law of cosines for c, then law of sines for angles"
@@ -45,9 +42,9 @@ class SolvingGeneralTrianglesGenerator:
 
     def _generate_hard(self) -> Equation:
         # SSS case
-        a = random.randint(8, 15)
-        b = random.randint(8, 15)
-        c = random.randint(8, 15)
+        a = self.rng.randint(8, 15)
+        b = self.rng.randint(8, 15)
+        c = self.rng.randint(8, 15)
 
         latex = f"\\text{{Solve triangle: }} a = {a}, b = {b}, c = {c}"
         solution = "Use law of cosines for all three angles"
@@ -56,9 +53,9 @@ class SolvingGeneralTrianglesGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Application problem
-        d = random.randint(100, 200)
-        A = random.randint(30, 60)
-        B = random.randint(30, 60)
+        d = self.rng.randint(100, 200)
+        A = self.rng.randint(30, 60)
+        B = self.rng.randint(30, 60)
 
         latex = f"\\text{{Two observers {d}m apart see object at angles {A}° and {B}°. Find distance to object.}}"
         solution = "Set up triangle and use law of sines"
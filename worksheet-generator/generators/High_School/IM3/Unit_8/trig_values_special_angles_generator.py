@@ -3,14 +3,11 @@ Trigonometric Values of Special Angles Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class TrigValuesSpecialAnglesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -31,7 +28,7 @@ class TrigValuesSpecialAnglesGenerator:
             90: "1"
         }
 
-        angle = random.choice([0, 30, 45, 60, 90])
+        angle = self.rng.choice([0, 30, 45, 60, 90])
 
         latex = f"\\sin({angle}°)"
         solution = values[angle]
@@ -48,7 +45,7 @@ class TrigValuesSpecialAnglesGenerator:
             90: "0"
         }
 
-        angle = random.choice([0, 30, 45, 60, 90])
+        angle = self.rng.choice([0, 30, 45, 60, 90])
 
         latex = f"\\cos({angle}°)"
         solution = values[angle]
@@ -65,7 +62,7 @@ class TrigValuesSpecialAnglesGenerator:
             90: "\\text{undefined}"
         }
 
-        angle = random.choice([0, 30, 45, 60, 90])
+        angle = self.rng.choice([0, 30, 45, 60, 90])
 
         latex = f"\\tan({angle}°)"
         solution = values[angle]
@@ -74,8 +71,8 @@ class TrigValuesSpecialAnglesGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Special angles in other quadrants
-        ref = random.choice([30, 45, 60])
-        quad = random.randint(2, 4)
+        ref = self.rng.choice([30, 45, 60])
+        quad = self.rng.randint(2, 4)
 
         if quad == 2:
             angle = 180 - ref
@@ -84,7 +81,7 @@ class TrigValuesSpecialAnglesGenerator:
         else:
             angle = 360 - ref
 
-        func = random.choice(['sin', 'cos', 'tan'])
+        func = self.rng.choice(['sin', 'cos', 'tan'])
 
         latex = f"\\{func}({angle}°)"
         solution = f"Use reference angle {ref}° and quadrant {quad} signs"
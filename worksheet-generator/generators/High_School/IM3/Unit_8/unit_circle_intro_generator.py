@@ -3,14 +3,11 @@ Unit Circle Introduction Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class UnitCircleIntroGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -24,7 +21,7 @@ class UnitCircleIntroGenerator:
     def _generate_easy(self) -> Equation:
         # Basic quadrantal angles
         angles = [(0, 1, 0), (90, 0, 1), (180, -1, 0), (270, 0, -1)]
-        angle, x, y = random.choice(angles)
+        angle, x, y = self.rng.choice(angles)
 
         latex = f"\\text{{On unit circle, find coordinates at }} {angle}°"
         solution = f"({x}, {y})"
@@ -38,7 +35,7 @@ class UnitCircleIntroGenerator:
             45: "(\\frac{\\sqrt{2}}{2}, \\frac{\\sqrt{2}}{2})",
             60: "(\\frac{1}{2}, \\frac{\\sqrt{3}}{2})"
         }
-        angle = random.choice([30, 45, 60])
+        angle = self.rng.choice([30, 45, 60])
 
         latex = f"\\text{{Find coordinates on unit circle at }} {angle}°"
         solution = angles[angle]
@@ -47,8 +44,8 @@ class UnitCircleIntroGenerator:
 
     def _generate_hard(self) -> Equation:
         # Reference angles
-        quad = random.randint(2, 4)
-        ref = random.choice([30, 45, 60])
+        quad = self.rng.randint(2, 4)
+        ref = self.rng.choice([30, 45, 60])
 
         if quad == 2:
             angle = 180 - ref
@@ -64,7 +61,7 @@ class UnitCircleIntroGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Coordinates in different quadrants
-        angle = random.choice([120, 135, 150, 210, 225, 240, 300, 315, 330])
+        angle = self.rng.choice([120, 135, 150, 210, 225, 240, 300, 315, 330])
 
         latex = f"\\text{{Find exact coordinates on unit circle at }} {angle}°"
         solution = "Use reference angle and quadrant signs"
@@ -3,14 +3,11 @@ Interpreting Features of Functions Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class InterpretingFeaturesFunctionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class InterpretingFeaturesFunctionsGenerator:
 
     def _generate_easy(self) -> Equation:
         # Identify domain
-        a = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
 
         latex = f"\\text{{Find domain of }} f(x) = \\sqrt{{x - {a}}}"
         solution = f"x \\geq {a}"
@@ -32,8 +29,8 @@ class InterpretingFeaturesFunctionsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Identify range
-        a = random.randint(1, 5)
-        k = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        k = self.rng.randint(1, 5)
 
         latex = f"\\text{{Find range of }} f(x) = {a}x^2 + {k}"
         solution = f"y \\geq {k}"
@@ -42,8 +39,8 @@ class InterpretingFeaturesFunctionsGenerator:
 
     def _generate_hard(self) -> Equation:
         # Identify intercepts
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{Find x and y intercepts of }} f(x) = {a}x + {b}"
         solution = f"x-intercept: (-\\frac{{{b}}}{{{a}}}, 0), y-intercept: (0, {b})"
@@ -52,7 +49,7 @@ class InterpretingFeaturesFunctionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Identify increasing/decreasing intervals
-        a = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
 
         latex = f"\\text{{Where is }} f(x) = -x^2 + {a} \\text{{ increasing?}}"
         solution = f"x < 0"
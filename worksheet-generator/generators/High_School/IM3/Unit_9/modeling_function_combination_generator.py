@@ -3,14 +3,11 @@ Modeling with Function Combination Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ModelingFunctionCombinationGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,8 +20,8 @@ class ModelingFunctionCombinationGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple function addition
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{If }} f(x) = {a}x \\text{{ and }} g(x) = {b}\\text{{, find }} (f+g)(x)"
         solution = f"{a}x + {b}"
@@ -33,8 +30,8 @@ class ModelingFunctionCombinationGenerator:
 
     def _generate_medium(self) -> Equation:
         # Function composition
-        a = random.randint(2, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{If }} f(x) = {a}x + {b} \\text{{ and }} g(x) = x^2\\text{{, find }} f(g(x))"
         solution = f"{a}x^2 + {b}"
@@ -43,9 +40,9 @@ class ModelingFunctionCombinationGenerator:
 
     def _generate_hard(self) -> Equation:
         # Product of functions
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
-        c = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
+        c = self.rng.randint(1, 5)
 
         latex = f"\\text{{If }} f(x) = {a}x + {b} \\text{{ and }} g(x) = {c}x\\text{{, find }} (f \\cdot g)(x)"
         solution = f"{a*c}x^2 + {b*c}x"
@@ -54,8 +51,8 @@ class ModelingFunctionCombinationGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Complex composition
-        a = random.randint(1, 5)
-        b = random.randint(1, 5)
+        a = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 5)
 
         latex = f"\\text{{If }} f(x) = x^2 + {a} \\text{{ and }} g(x) = {b}x\\text{{, find }} g(f(x))"
         solution = f"{b}(x^2 + {a}) = {b}x^2 + {a*b}"
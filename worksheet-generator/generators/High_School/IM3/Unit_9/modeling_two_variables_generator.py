@@ -3,14 +3,11 @@ Modeling with Two Variables Generator
 """
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
 from equation_generator import Equation
 
 class ModelingTwoVariablesGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
@@ -23,7 +20,7 @@ class ModelingTwoVariablesGenerator:
 
     def _generate_easy(self) -> Equation:
         # Simple direct variation
-        k = random.randint(2, 9)
+        k = self.rng.randint(2, 9)
 
         latex = f"\\text{{If }} y \\text{{ varies directly with }} x \\text{{ and }} y = {k*3} \\text{{ when }} x = 3\\text{{, find }} y \\text{{ when }} x = 5"
         solution = f"y = {k*5}"
@@ -32,7 +29,7 @@ class ModelingTwoVariablesGenerator:
 
     def _generate_medium(self) -> Equation:
         # Inverse variation
-        k = random.randint(10, 50)
+        k = self.rng.randint(10, 50)
 
         latex = f"\\text{{If }} y \\text{{ varies inversely with }} x \\text{{ and }} y = {k//5} \\text{{ when }} x = 5\\text{{, find equation}}"
         solution = f"y = \\frac{{{k}}}{{x}}"
@@ -6,17 +6,13 @@ Note: K-2 generators do not use difficulty levels.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class AdditionStrategiesUpTo20Generator:
     """Generates addition strategies up to 20 problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str = None, num_problems: int = 8) -> List[Equation]:
         """Generate worksheet problems. Note: difficulty parameter is ignored for K-2."""
@@ -27,8 +23,8 @@ class AdditionStrategiesUpTo20Generator:
         return problems
 
     def _generate_problem(self) -> Equation:
-        a = random.randint(1, 10)
-        b = random.randint(1, 10)
+        a = self.rng.randint(1, 10)
+        b = self.rng.randint(1, 10)
         result = a + b if 'addition' in 'addition strategies up to 20' or 'add' in 'addition strategies up to 20' else max(a, b) - min(a, b)
         latex = f"{a} + {b} = " if 'add' in 'addition strategies up to 20' else f"{max(a, b)} - {min(a, b)} = "
         solution = str(result)
@@ -6,17 +6,13 @@ Note: K-2 generators do not use difficulty levels.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class ComparingNumbersGenerator:
     """Generates comparing numbers problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str = None, num_problems: int = 8) -> List[Equation]:
         """Generate worksheet problems. Note: difficulty parameter is ignored for K-2."""
@@ -27,10 +23,10 @@ class ComparingNumbersGenerator:
         return problems
 
     def _generate_problem(self) -> Equation:
-        a = random.randint(10, 50)
-        b = random.randint(10, 50)
+        a = self.rng.randint(10, 50)
+        b = self.rng.randint(10, 50)
         while a == b:
-            b = random.randint(10, 50)
+            b = self.rng.randint(10, 50)
         latex = f"\text{{Which is greater: {a} or {b}?}}"
         solution = str(max(a, b))
         return Equation(latex=latex, solution=solution, steps=[f"{solution} \\gt {min(a, b)}"])
@@ -6,17 +6,13 @@ Note: K-2 generators do not use difficulty levels.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class OrderingNumbersGenerator:
     """Generates ordering numbers problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str = None, num_problems: int = 8) -> List[Equation]:
         """Generate worksheet problems. Note: difficulty parameter is ignored for K-2."""
@@ -27,7 +23,7 @@ class OrderingNumbersGenerator:
         return problems
 
     def _generate_problem(self) -> Equation:
-        nums = random.sample(range(1, 30), 3)
+        nums = self.rng.sample(range(1, 30), 3)
         latex = f"\text{{Order these: {', '.join(map(str, nums))}}}"
         solution = ', '.join(map(str, sorted(nums)))
         return Equation(latex=latex, solution=solution, steps=["ascending order"])
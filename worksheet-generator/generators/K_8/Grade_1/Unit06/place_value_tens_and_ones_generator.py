@@ -6,17 +6,13 @@ Note: K-2 generators do not use difficulty levels.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class PlaceValueTensAndOnesGenerator:
     """Generates place value tens and ones problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str = None, num_problems: int = 8) -> List[Equation]:
         """Generate worksheet problems. Note: difficulty parameter is ignored for K-2."""
@@ -27,8 +23,8 @@ class PlaceValueTensAndOnesGenerator:
         return problems
 
     def _generate_problem(self) -> Equation:
-        tens = random.randint(1, 5)
-        ones = random.randint(0, 9)
+        tens = self.rng.randint(1, 5)
+        ones = self.rng.randint(0, 9)
         num = tens * 10 + ones
         latex = f"\text{{{tens} tens and {ones} ones = ?}}"
         solution = str(num)
@@ -6,9 +6,6 @@ Example: 3 groups of 4 = 3 × 4 = 12
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class MultiplicationAsEqualGroupsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class MultiplicationAsEqualGroupsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: small numbers (1-5)."""
-        num_groups = random.randint(2, 5)
-        items_per_group = random.randint(2, 5)
+        num_groups = self.rng.randint(2, 5)
+        items_per_group = self.rng.randint(2, 5)
         product = num_groups * items_per_group
 
         latex = f"{num_groups} \\times {items_per_group}"
@@ -66,8 +62,8 @@ class MultiplicationAsEqualGroupsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: numbers up to 10."""
-        num_groups = random.randint(2, 10)
-        items_per_group = random.randint(2, 10)
+        num_groups = self.rng.randint(2, 10)
+        items_per_group = self.rng.randint(2, 10)
         product = num_groups * items_per_group
 
         latex = f"{num_groups} \\times {items_per_group}"
@@ -82,8 +78,8 @@ class MultiplicationAsEqualGroupsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: include word context."""
-        num_groups = random.randint(3, 10)
-        items_per_group = random.randint(3, 10)
+        num_groups = self.rng.randint(3, 10)
+        items_per_group = self.rng.randint(3, 10)
         product = num_groups * items_per_group
 
         contexts = [
@@ -93,7 +89,7 @@ class MultiplicationAsEqualGroupsGenerator:
             f"There are {num_groups} baskets with {items_per_group} eggs in each basket"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}. How many in total?}}"
         solution = str(product)
 
@@ -106,8 +102,8 @@ class MultiplicationAsEqualGroupsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: larger numbers and contexts."""
-        num_groups = random.randint(5, 12)
-        items_per_group = random.randint(5, 12)
+        num_groups = self.rng.randint(5, 12)
+        items_per_group = self.rng.randint(5, 12)
         product = num_groups * items_per_group
 
         contexts = [
@@ -117,7 +113,7 @@ class MultiplicationAsEqualGroupsGenerator:
             f"A baker makes {num_groups} trays with {items_per_group} cookies on each tray"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}. How many in total?}}"
         solution = str(product)
 
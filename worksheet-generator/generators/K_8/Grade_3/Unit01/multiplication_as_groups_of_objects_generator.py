@@ -6,9 +6,6 @@ Example: 4 groups of 3 objects = 4 × 3 = 12 objects
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class MultiplicationAsGroupsOfObjectsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class MultiplicationAsGroupsOfObjectsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: 2-5 objects per group, 2-5 groups."""
-        num_groups = random.randint(2, 5)
-        objects_per_group = random.randint(2, 5)
+        num_groups = self.rng.randint(2, 5)
+        objects_per_group = self.rng.randint(2, 5)
         product = num_groups * objects_per_group
 
         latex = f"{num_groups} \\times {objects_per_group}"
@@ -66,8 +62,8 @@ class MultiplicationAsGroupsOfObjectsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: 2-10 objects per group, 2-10 groups."""
-        num_groups = random.randint(2, 10)
-        objects_per_group = random.randint(2, 10)
+        num_groups = self.rng.randint(2, 10)
+        objects_per_group = self.rng.randint(2, 10)
         product = num_groups * objects_per_group
 
         latex = f"{num_groups} \\times {objects_per_group}"
@@ -82,8 +78,8 @@ class MultiplicationAsGroupsOfObjectsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: include word problems with context (toys, pencils, crayons, etc.)."""
-        num_groups = random.randint(3, 10)
-        objects_per_group = random.randint(3, 10)
+        num_groups = self.rng.randint(3, 10)
+        objects_per_group = self.rng.randint(3, 10)
         product = num_groups * objects_per_group
 
         objects = [
@@ -97,7 +93,7 @@ class MultiplicationAsGroupsOfObjectsGenerator:
             ("dolls", "doll")
         ]
 
-        obj_plural, obj_singular = random.choice(objects)
+        obj_plural, obj_singular = self.rng.choice(objects)
         object_name = obj_plural if objects_per_group > 1 else obj_singular
 
         contexts = [
@@ -107,7 +103,7 @@ class MultiplicationAsGroupsOfObjectsGenerator:
             f"There are {num_groups} bags containing {objects_per_group} {object_name} each"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}. How many in total?}}"
         solution = str(product)
 
@@ -120,8 +116,8 @@ class MultiplicationAsGroupsOfObjectsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: larger numbers (5-12) with word problems."""
-        num_groups = random.randint(5, 12)
-        objects_per_group = random.randint(5, 12)
+        num_groups = self.rng.randint(5, 12)
+        objects_per_group = self.rng.randint(5, 12)
         product = num_groups * objects_per_group
 
         objects = [
@@ -137,7 +133,7 @@ class MultiplicationAsGroupsOfObjectsGenerator:
             ("beads", "bead")
         ]
 
-        obj_plural, obj_singular = random.choice(objects)
+        obj_plural, obj_singular = self.rng.choice(objects)
         object_name = obj_plural if objects_per_group > 1 else obj_singular
 
         contexts = [
@@ -148,7 +144,7 @@ class MultiplicationAsGroupsOfObjectsGenerator:
             f"A store displays {num_groups} shelves with {objects_per_group} {object_name} on each shelf"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}. How many {obj_plural} are there in total?}}"
         solution = str(product)
 
@@ -7,9 +7,6 @@ Focuses on breaking apart numbers using 2s/5s and 3s/6s
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -18,8 +15,7 @@ class DistributivePropertyGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -52,19 +48,19 @@ class DistributivePropertyGenerator:
     def _generate_easy(self) -> Equation:
         """Generate easy problems: simple distributive property with 2s and 5s."""
         # Use 2 or 5 as the multiplier
-        multiplier = random.choice([2, 5])
+        multiplier = self.rng.choice([2, 5])
 
         # Create a number that can be broken down (e.g., 6 = 5 + 1, 8 = 5 + 3)
         if multiplier == 2:
             # Numbers that break nicely with 2: use even numbers split in half
-            base = random.randint(2, 4)
+            base = self.rng.randint(2, 4)
             part1 = base
             part2 = base
             number = part1 + part2
         else:  # multiplier == 5
             # Break into 5 + something
             part1 = 5
-            part2 = random.randint(1, 3)
+            part2 = self.rng.randint(1, 3)
             number = part1 + part2
 
         product = multiplier * number
@@ -91,16 +87,16 @@ class DistributivePropertyGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium problems: distributive property with 3s and 6s."""
         # Use 3 or 6 as the multiplier
-        multiplier = random.choice([3, 6])
+        multiplier = self.rng.choice([3, 6])
 
         if multiplier == 3:
             # Break into friendly numbers
-            part1 = random.choice([3, 4, 5])
-            part2 = random.randint(2, 4)
+            part1 = self.rng.choice([3, 4, 5])
+            part2 = self.rng.randint(2, 4)
         else:  # multiplier == 6
             # Break into 5 + something or 6 + something
-            part1 = random.choice([5, 6])
-            part2 = random.randint(1, 3)
+            part1 = self.rng.choice([5, 6])
+            part2 = self.rng.randint(1, 3)
 
         number = part1 + part2
         product = multiplier * number
@@ -126,11 +122,11 @@ class DistributivePropertyGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems using distributive property."""
-        multiplier = random.choice([2, 3, 5, 6])
+        multiplier = self.rng.choice([2, 3, 5, 6])
 
         # Create a scenario that naturally breaks apart
-        part1 = random.randint(5, 8)
-        part2 = random.randint(2, 4)
+        part1 = self.rng.randint(5, 8)
+        part2 = self.rng.randint(2, 4)
         number = part1 + part2
 
         product = multiplier * number
@@ -144,7 +140,7 @@ class DistributivePropertyGenerator:
             f"There are {number} boxes ({part1} + {part2}). Each box has {multiplier} toys. Break it apart to find the total."
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(product)
 
@@ -164,11 +160,11 @@ class DistributivePropertyGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: larger numbers and multiple strategies."""
-        multiplier = random.choice([3, 4, 6, 7, 8])
+        multiplier = self.rng.choice([3, 4, 6, 7, 8])
 
         # Use 10-based decomposition for challenge
-        ones_digit = random.randint(2, 8)
-        tens = random.randint(1, 2) * 10
+        ones_digit = self.rng.randint(2, 8)
+        tens = self.rng.randint(1, 2) * 10
         number = tens + ones_digit
 
         product = multiplier * number
@@ -176,7 +172,7 @@ class DistributivePropertyGenerator:
         product2 = multiplier * ones_digit
 
         # Sometimes show it with 10s, sometimes with other breakdowns
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             latex = f"{multiplier} \\times {number}"
             steps = [
                 f"\\text{{Break apart }} {number} \\text{{ into }} {tens} + {ones_digit}",
@@ -191,7 +187,7 @@ class DistributivePropertyGenerator:
                 f"There are {number} students. Each needs {multiplier} pencils. Break into {tens} and {ones_digit} to calculate.",
                 f"A store has {number} boxes. Each has {multiplier} items. Use {tens} + {ones_digit} to find the total."
             ]
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}}}"
             steps = [
                 f"{multiplier} \\times {number} = {multiplier} \\times ({tens} + {ones_digit})",
@@ -6,19 +6,22 @@ Examples: 5 × 0 = 0, 7 × 1 = 7
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
+from bulk_generation import ProblemBatch, multiplication_batch, numpy_rng
 
 
 class MultiplyBy0Or1Generator:
     """Generates multiplication by 0 or 1 problems."""
 
+    # Multipliers and the range of the other factor, per difficulty (generate_worksheet and generate_bulk)
+    FACTS = {
+        'easy': ([0, 1], (1, 5)),
+        'medium': ([0, 1], (1, 10)),
+    }
+
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,11 +53,12 @@ class MultiplyBy0Or1Generator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: basic multiplication by 0 or 1 (numbers 1-5)."""
-        multiplier = random.choice([0, 1])
-        number = random.randint(1, 5)
+        multipliers, numbers = self.FACTS['easy']
+        multiplier = self.rng.choice(multipliers)
+        number = self.rng.randint(*numbers)
 
         # Randomly decide order
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             latex = f"{number} \\times {multiplier}"
             product = number * multiplier
         else:
@@ -77,11 +81,12 @@ class MultiplyBy0Or1Generator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: multiplication by 0 or 1 (numbers up to 10)."""
-        multiplier = random.choice([0, 1])
-        number = random.randint(1, 10)
+        multipliers, numbers = self.FACTS['medium']
+        multiplier = self.rng.choice(multipliers)
+        number = self.rng.randint(*numbers)
 
         # Randomly decide order
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             latex = f"{number} \\times {multiplier}"
             product = number * multiplier
         else:
@@ -104,8 +109,8 @@ class MultiplyBy0Or1Generator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with 0 or 1."""
-        multiplier = random.choice([0, 1])
-        number = random.randint(3, 10)
+        multiplier = self.rng.choice([0, 1])
+        number = self.rng.randint(3, 10)
         product = number * multiplier
 
         if multiplier == 0:
@@ -123,7 +128,7 @@ class MultiplyBy0Or1Generator:
                 f"A garden has {number} pots with 1 flower in each pot"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}. How many in total?}}"
         solution = str(product)
 
@@ -136,8 +141,8 @@ class MultiplyBy0Or1Generator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: larger numbers and multi-step contexts."""
-        multiplier = random.choice([0, 1])
-        number = random.randint(10, 20)
+        multiplier = self.rng.choice([0, 1])
+        number = self.rng.randint(10, 20)
         product = number * multiplier
 
         if multiplier == 0:
@@ -155,7 +160,7 @@ class MultiplyBy0Or1Generator:
                 f"There are {number} cars. Each car has 1 driver. How many drivers total?"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(product)
 
@@ -166,6 +171,37 @@ class MultiplyBy0Or1Generator:
             difficulty='challenge'
         )
 
+    def generate_bulk(self, difficulty: str, count: int) -> ProblemBatch:
+        """
+        Generate many problems at once with NumPy (e.g. for a practice bank).
+
+        Easy and medium facts are drawn and formatted as arrays; word problems
+        (hard, challenge) are generated one by one.
+
+        Args:
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            count: Number of problems to generate
+
+        Returns:
+            ProblemBatch (rows convert to Equation objects on access)
+        """
+        if difficulty not in self.FACTS:
+            return ProblemBatch.from_equations(self.generate_worksheet(difficulty, count), difficulty)
+
+        np_rng = numpy_rng(self.rng)
+        multipliers, numbers = self.FACTS[difficulty]
+        multiplier = np_rng.choice(multipliers, count)
+        number = np_rng.integers(numbers[0], numbers[1], count, endpoint=True)
+        return multiplication_batch(np_rng, number, multiplier, difficulty, steps=self._bulk_steps)
+
+    def _bulk_steps(self, number: int, multiplier: int) -> List[str]:
+        """Steps for a bulk-generated easy/medium problem (see generate_bulk)."""
+        if multiplier == 0:
+            explanation = "\\text{Any number times 0 equals 0}"
+        else:
+            explanation = f"\\text{{Any number times 1 equals itself}}"
+        return [explanation, f"{number} \\times {multiplier} = {number * multiplier}"]
+
 
 def main():
     """Test the generator."""
@@ -6,19 +6,22 @@ Examples: 6 × 2 = 12, 5 × 4 = 20
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
+from bulk_generation import ProblemBatch, multiplication_batch, numpy_rng
 
 
 class MultiplyBy2Or4Generator:
     """Generates multiplication by 2 or 4 problems."""
 
+    # Multipliers and the range of the other factor, per difficulty (generate_worksheet and generate_bulk)
+    FACTS = {
+        'easy': ([2, 4], (1, 5)),
+        'medium': ([2, 4], (1, 10)),
+    }
+
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,11 +53,12 @@ class MultiplyBy2Or4Generator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: basic multiplication by 2 or 4 (numbers 1-5)."""
-        multiplier = random.choice([2, 4])
-        number = random.randint(1, 5)
+        multipliers, numbers = self.FACTS['easy']
+        multiplier = self.rng.choice(multipliers)
+        number = self.rng.randint(*numbers)
 
         # Randomly decide order
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             latex = f"{number} \\times {multiplier}"
         else:
             latex = f"{multiplier} \\times {number}"
@@ -71,11 +75,12 @@ class MultiplyBy2Or4Generator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: multiplication by 2 or 4 (numbers up to 10)."""
-        multiplier = random.choice([2, 4])
-        number = random.randint(1, 10)
+        multipliers, numbers = self.FACTS['medium']
+        multiplier = self.rng.choice(multipliers)
+        number = self.rng.randint(*numbers)
 
         # Randomly decide order
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             latex = f"{number} \\times {multiplier}"
         else:
             latex = f"{multiplier} \\times {number}"
@@ -92,8 +97,8 @@ class MultiplyBy2Or4Generator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with 2 or 4."""
-        multiplier = random.choice([2, 4])
-        number = random.randint(3, 10)
+        multiplier = self.rng.choice([2, 4])
+        number = self.rng.randint(3, 10)
         product = number * multiplier
 
         if multiplier == 2:
@@ -111,7 +116,7 @@ class MultiplyBy2Or4Generator:
                 f"A classroom has {number} groups with 4 students in each group. How many students total?"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(product)
 
@@ -124,8 +129,8 @@ class MultiplyBy2Or4Generator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: larger numbers and multi-step reasoning."""
-        multiplier = random.choice([2, 4])
-        number = random.randint(10, 15)
+        multiplier = self.rng.choice([2, 4])
+        number = self.rng.randint(10, 15)
         product = number * multiplier
 
         if multiplier == 2:
@@ -143,7 +148,7 @@ class MultiplyBy2Or4Generator:
                 f"A restaurant has {number} tables with 4 chairs at each table. How many chairs total?"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(product)
 
@@ -154,6 +159,29 @@ class MultiplyBy2Or4Generator:
             difficulty='challenge'
         )
 
+    def generate_bulk(self, difficulty: str, count: int) -> ProblemBatch:
+        """
+        Generate many problems at once with NumPy (e.g. for a practice bank).
+
+        Easy and medium facts are drawn and formatted as arrays; word problems
+        (hard, challenge) are generated one by one.
+
+        Args:
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            count: Number of problems to generate
+
+        Returns:
+            ProblemBatch (rows convert to Equation objects on access)
+        """
+        if difficulty not in self.FACTS:
+            return ProblemBatch.from_equations(self.generate_worksheet(difficulty, count), difficulty)
+
+        np_rng = numpy_rng(self.rng)
+        multipliers, numbers = self.FACTS[difficulty]
+        multiplier = np_rng.choice(multipliers, count)
+        number = np_rng.integers(numbers[0], numbers[1], count, endpoint=True)
+        return multiplication_batch(np_rng, number, multiplier, difficulty)
+
 
 def main():
     """Test the generator."""
@@ -6,19 +6,22 @@ Examples: 5 × 3 = 15, 7 × 6 = 42
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
+from bulk_generation import ProblemBatch, multiplication_batch, numpy_rng
 
 
 class MultiplyBy3Or6Generator:
     """Generates multiplication by 3 or 6 problems."""
 
+    # Multipliers and the range of the other factor, per difficulty (generate_worksheet and generate_bulk)
+    FACTS = {
+        'easy': ([3, 6], (1, 5)),
+        'medium': ([3, 6], (1, 10)),
+    }
+
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,11 +53,12 @@ class MultiplyBy3Or6Generator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: basic multiplication by 3 or 6 (numbers 1-5)."""
-        multiplier = random.choice([3, 6])
-        number = random.randint(1, 5)
+        multipliers, numbers = self.FACTS['easy']
+        multiplier = self.rng.choice(multipliers)
+        number = self.rng.randint(*numbers)
 
         # Randomly decide order
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             latex = f"{number} \\times {multiplier}"
         else:
             latex = f"{multiplier} \\times {number}"
@@ -71,11 +75,12 @@ class MultiplyBy3Or6Generator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: multiplication by 3 or 6 (numbers up to 10)."""
-        multiplier = random.choice([3, 6])
-        number = random.randint(1, 10)
+        multipliers, numbers = self.FACTS['medium']
+        multiplier = self.rng.choice(multipliers)
+        number = self.rng.randint(*numbers)
 
         # Randomly decide order
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             latex = f"{number} \\times {multiplier}"
         else:
             latex = f"{multiplier} \\times {number}"
@@ -92,8 +97,8 @@ class MultiplyBy3Or6Generator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with 3 or 6."""
-        multiplier = random.choice([3, 6])
-        number = random.randint(3, 10)
+        multiplier = self.rng.choice([3, 6])
+        number = self.rng.randint(3, 10)
         product = number * multiplier
 
         if multiplier == 3:
@@ -111,7 +116,7 @@ class MultiplyBy3Or6Generator:
                 f"A classroom has {number} tables with 6 pencils on each table. How many pencils total?"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(product)
 
@@ -124,8 +129,8 @@ class MultiplyBy3Or6Generator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: larger numbers and relationship between 3 and 6."""
-        multiplier = random.choice([3, 6])
-        number = random.randint(10, 15)
+        multiplier = self.rng.choice([3, 6])
+        number = self.rng.randint(10, 15)
         product = number * multiplier
 
         if multiplier == 3:
@@ -143,13 +148,13 @@ class MultiplyBy3Or6Generator:
                 f"A school has {number} classrooms with 6 computers in each. How many computers total?"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(product)
 
         # Sometimes add a hint about the relationship between 3 and 6
         hint = ""
-        if multiplier == 6 and random.choice([True, False]):
+        if multiplier == 6 and self.rng.choice([True, False]):
             hint = "\\text{Remember: 6 is double 3}"
 
         steps = [f"{number} \\times {multiplier} = {product}"]
@@ -163,6 +168,29 @@ class MultiplyBy3Or6Generator:
             difficulty='challenge'
         )
 
+    def generate_bulk(self, difficulty: str, count: int) -> ProblemBatch:
+        """
+        Generate many problems at once with NumPy (e.g. for a practice bank).
+
+        Easy and medium facts are drawn and formatted as arrays; word problems
+        (hard, challenge) are generated one by one.
+
+        Args:
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            count: Number of problems to generate
+
+        Returns:
+            ProblemBatch (rows convert to Equation objects on access)
+        """
+        if difficulty not in self.FACTS:
+            return ProblemBatch.from_equations(self.generate_worksheet(difficulty, count), difficulty)
+
+        np_rng = numpy_rng(self.rng)
+        multipliers, numbers = self.FACTS[difficulty]
+        multiplier = np_rng.choice(multipliers, count)
+        number = np_rng.integers(numbers[0], numbers[1], count, endpoint=True)
+        return multiplication_batch(np_rng, number, multiplier, difficulty)
+
 
 def main():
     """Test the generator."""
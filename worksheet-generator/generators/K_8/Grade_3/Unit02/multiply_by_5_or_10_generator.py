@@ -6,19 +6,22 @@ Examples: 7 × 5 = 35, 8 × 10 = 80
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
+from bulk_generation import ProblemBatch, multiplication_batch, numpy_rng
 
 
 class MultiplyBy5Or10Generator:
     """Generates multiplication by 5 or 10 problems."""
 
+    # Multipliers and the range of the other factor, per difficulty (generate_worksheet and generate_bulk)
+    FACTS = {
+        'easy': ([5, 10], (1, 5)),
+        'medium': ([5, 10], (1, 10)),
+    }
+
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,11 +53,12 @@ class MultiplyBy5Or10Generator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: basic multiplication by 5 or 10 (numbers 1-5)."""
-        multiplier = random.choice([5, 10])
-        number = random.randint(1, 5)
+        multipliers, numbers = self.FACTS['easy']
+        multiplier = self.rng.choice(multipliers)
+        number = self.rng.randint(*numbers)
 
         # Randomly decide order
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             latex = f"{number} \\times {multiplier}"
         else:
             latex = f"{multiplier} \\times {number}"
@@ -71,11 +75,12 @@ class MultiplyBy5Or10Generator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: multiplication by 5 or 10 (numbers up to 10)."""
-        multiplier = random.choice([5, 10])
-        number = random.randint(1, 10)
+        multipliers, numbers = self.FACTS['medium']
+        multiplier = self.rng.choice(multipliers)
+        number = self.rng.randint(*numbers)
 
         # Randomly decide order
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             latex = f"{number} \\times {multiplier}"
         else:
             latex = f"{multiplier} \\times {number}"
@@ -92,8 +97,8 @@ class MultiplyBy5Or10Generator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with 5 or 10."""
-        multiplier = random.choice([5, 10])
-        number = random.randint(3, 10)
+        multiplier = self.rng.choice([5, 10])
+        number = self.rng.randint(3, 10)
         product = number * multiplier
 
         if multiplier == 5:
@@ -111,7 +116,7 @@ class MultiplyBy5Or10Generator:
                 f"A classroom has {number} tables with 10 chairs at each table. How many chairs total?"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(product)
 
@@ -124,8 +129,8 @@ class MultiplyBy5Or10Generator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: larger numbers and pattern recognition."""
-        multiplier = random.choice([5, 10])
-        number = random.randint(10, 15)
+        multiplier = self.rng.choice([5, 10])
+        number = self.rng.randint(10, 15)
         product = number * multiplier
 
         if multiplier == 5:
@@ -143,7 +148,7 @@ class MultiplyBy5Or10Generator:
                 f"A store has {number} packages with 10 markers in each package. How many markers total?"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(product)
 
@@ -162,6 +167,29 @@ class MultiplyBy5Or10Generator:
             difficulty='challenge'
         )
 
+    def generate_bulk(self, difficulty: str, count: int) -> ProblemBatch:
+        """
+        Generate many problems at once with NumPy (e.g. for a practice bank).
+
+        Easy and medium facts are drawn and formatted as arrays; word problems
+        (hard, challenge) are generated one by one.
+
+        Args:
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            count: Number of problems to generate
+
+        Returns:
+            ProblemBatch (rows convert to Equation objects on access)
+        """
+        if difficulty not in self.FACTS:
+            return ProblemBatch.from_equations(self.generate_worksheet(difficulty, count), difficulty)
+
+        np_rng = numpy_rng(self.rng)
+        multipliers, numbers = self.FACTS[difficulty]
+        multiplier = np_rng.choice(multipliers, count)
+        number = np_rng.integers(numbers[0], numbers[1], count, endpoint=True)
+        return multiplication_batch(np_rng, number, multiplier, difficulty)
+
 
 def main():
     """Test the generator."""
@@ -6,19 +6,22 @@ Examples: 6 × 7 = 42, 5 × 8 = 40, 4 × 9 = 36
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
+from bulk_generation import ProblemBatch, multiplication_batch, numpy_rng
 
 
 class MultiplyBy7_8Or9Generator:
     """Generates multiplication by 7, 8, or 9 problems."""
 
+    # Multipliers and the range of the other factor, per difficulty (generate_worksheet and generate_bulk)
+    FACTS = {
+        'easy': ([7, 8, 9], (1, 5)),
+        'medium': ([7, 8, 9], (1, 10)),
+    }
+
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,11 +53,12 @@ class MultiplyBy7_8Or9Generator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: basic multiplication by 7, 8, or 9 (numbers 1-5)."""
-        multiplier = random.choice([7, 8, 9])
-        number = random.randint(1, 5)
+        multipliers, numbers = self.FACTS['easy']
+        multiplier = self.rng.choice(multipliers)
+        number = self.rng.randint(*numbers)
 
         # Randomly decide order
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             latex = f"{number} \\times {multiplier}"
         else:
             latex = f"{multiplier} \\times {number}"
@@ -71,11 +75,12 @@ class MultiplyBy7_8Or9Generator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: multiplication by 7, 8, or 9 (numbers up to 10)."""
-        multiplier = random.choice([7, 8, 9])
-        number = random.randint(1, 10)
+        multipliers, numbers = self.FACTS['medium']
+        multiplier = self.rng.choice(multipliers)
+        number = self.rng.randint(*numbers)
 
         # Randomly decide order
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             latex = f"{number} \\times {multiplier}"
         else:
             latex = f"{multiplier} \\times {number}"
@@ -92,8 +97,8 @@ class MultiplyBy7_8Or9Generator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with 7, 8, or 9."""
-        multiplier = random.choice([7, 8, 9])
-        number = random.randint(3, 10)
+        multiplier = self.rng.choice([7, 8, 9])
+        number = self.rng.randint(3, 10)
         product = number * multiplier
 
         if multiplier == 7:
@@ -118,7 +123,7 @@ class MultiplyBy7_8Or9Generator:
                 f"A baker makes {number} trays with 9 cookies on each tray. How many cookies total?"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(product)
 
@@ -131,8 +136,8 @@ class MultiplyBy7_8Or9Generator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: larger numbers and strategies."""
-        multiplier = random.choice([7, 8, 9])
-        number = random.randint(10, 12)
+        multiplier = self.rng.choice([7, 8, 9])
+        number = self.rng.randint(10, 12)
         product = number * multiplier
 
         if multiplier == 7:
@@ -157,15 +162,15 @@ class MultiplyBy7_8Or9Generator:
                 f"A garden has {number} rows with 9 plants in each row. How many plants total?"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(product)
 
         # Sometimes add a strategy hint
         hint = ""
-        if multiplier == 9 and random.choice([True, False]):
+        if multiplier == 9 and self.rng.choice([True, False]):
             hint = f"\\text{{Strategy: }} {number} \\times 10 = {number * 10}, \\text{{ then subtract }} {number}"
-        elif multiplier == 8 and random.choice([True, False]):
+        elif multiplier == 8 and self.rng.choice([True, False]):
             hint = f"\\text{{Strategy: Double, double, double! }} {number} \\times 2 \\times 2 \\times 2"
 
         steps = [f"{number} \\times {multiplier} = {product}"]
@@ -179,6 +184,29 @@ class MultiplyBy7_8Or9Generator:
             difficulty='challenge'
         )
 
+    def generate_bulk(self, difficulty: str, count: int) -> ProblemBatch:
+        """
+        Generate many problems at once with NumPy (e.g. for a practice bank).
+
+        Easy and medium facts are drawn and formatted as arrays; word problems
+        (hard, challenge) are generated one by one.
+
+        Args:
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            count: Number of problems to generate
+
+        Returns:
+            ProblemBatch (rows convert to Equation objects on access)
+        """
+        if difficulty not in self.FACTS:
+            return ProblemBatch.from_equations(self.generate_worksheet(difficulty, count), difficulty)
+
+        np_rng = numpy_rng(self.rng)
+        multipliers, numbers = self.FACTS[difficulty]
+        multiplier = np_rng.choice(multipliers, count)
+        number = np_rng.integers(numbers[0], numbers[1], count, endpoint=True)
+        return multiplication_batch(np_rng, number, multiplier, difficulty)
+
 
 def main():
     """Test the generator."""
@@ -6,10 +6,26 @@ Shows step-by-step regrouping process
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
+from regrouping_sampler import ONES, TENS, sample_addition, sample_addition_variant
+from bulk_generation import ProblemBatch, bulk_addition, join_columns, numpy_rng
+
+# Kinds of problem per difficulty, as sample_addition arguments; generate_worksheet
+# and generate_bulk both pick one uniformly per problem
+PROBLEMS = {
+    # 2-digit + 2-digit with regrouping in ones only
+    'easy': [dict(addend1=(10, 99), addend2=(10, 99), regroup={ONES: True, TENS: False})],
+    'medium': [
+        # 3-digit + 2-digit
+        dict(addend1=(100, 899), addend2=(20, 99)),
+        # 3-digit + 3-digit with regrouping
+        dict(addend1=(100, 899), addend2=(100, 899), min_regroups=1, total=(0, 999)),
+        # 2-digit + 2-digit with regrouping in tens
+        dict(addend1=(50, 99), addend2=(50, 99), regroup={TENS: True}),
+    ],
+    # 3-digit + 3-digit with at least two regroupings
+    'hard': [dict(addend1=(150, 899), addend2=(150, 899), min_regroups=2, total=(0, 999))],
+}
 
 
 class AddingWithRegroupingWithin1000Generator:
@@ -17,8 +33,7 @@ class AddingWithRegroupingWithin1000Generator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -39,22 +54,9 @@ class AddingWithRegroupingWithin1000Generator:
 
     def _generate_problem(self, difficulty: str) -> Equation:
         """Generate a single problem."""
-        if difficulty == 'easy':
-            return self._generate_easy()
-        elif difficulty == 'medium':
-            return self._generate_medium()
-        elif difficulty == 'hard':
-            return self._generate_hard()
-        else:
-            return self._generate_challenge()
-
-    def _requires_regrouping_ones(self, num1: int, num2: int) -> bool:
-        """Check if ones place requires regrouping."""
-        return (num1 % 10) + (num2 % 10) >= 10
-
-    def _requires_regrouping_tens(self, num1: int, num2: int) -> bool:
-        """Check if tens place requires regrouping."""
-        return ((num1 // 10) % 10) + ((num2 // 10) % 10) >= 10
+        if difficulty in PROBLEMS:
+            return self._generate_computation(difficulty)
+        return self._generate_challenge()
 
     def _get_addition_steps(self, num1: int, num2: int) -> List[str]:
         """Generate detailed steps for addition with regrouping."""
@@ -100,51 +102,9 @@ class AddingWithRegroupingWithin1000Generator:
         steps.append(f"\\text{{Answer: }} {result}")
         return steps
 
-    def _generate_easy(self) -> Equation:
-        """Generate easy problems: 2-digit + 2-digit with regrouping in ones only."""
-        # Ensure regrouping in ones place only
-        while True:
-            num1 = random.randint(10, 99)
-            num2 = random.randint(10, 99)
-            if self._requires_regrouping_ones(num1, num2) and not self._requires_regrouping_tens(num1, num2):
-                break
-
-        result = num1 + num2
-        latex = f"{num1} + {num2}"
-        solution = str(result)
-        steps = self._get_addition_steps(num1, num2)
-
-        return Equation(
-            latex=latex,
-            solution=solution,
-            steps=steps,
-            difficulty='easy'
-        )
-
-    def _generate_medium(self) -> Equation:
-        """Generate medium problems: 3-digit + 2-digit or 3-digit with regrouping."""
-        # Mix of problems with different regrouping scenarios
-        choice = random.randint(1, 3)
-
-        if choice == 1:
-            # 3-digit + 2-digit
-            num1 = random.randint(100, 899)
-            num2 = random.randint(20, 99)
-        elif choice == 2:
-            # 3-digit + 3-digit with one regrouping
-            while True:
-                num1 = random.randint(100, 899)
-                num2 = random.randint(100, 899)
-                if (self._requires_regrouping_ones(num1, num2) or
-                    self._requires_regrouping_tens(num1, num2)) and num1 + num2 < 1000:
-                    break
-        else:
-            # 2-digit + 2-digit with regrouping in tens
-            while True:
-                num1 = random.randint(50, 99)
-                num2 = random.randint(50, 99)
-                if self._requires_regrouping_tens(num1, num2):
-                    break
+    def _generate_computation(self, difficulty: str) -> Equation:
+        """Generate an easy, medium or hard problem from PROBLEMS."""
+        num1, num2 = sample_addition_variant(self.rng, PROBLEMS[difficulty])
 
         result = num1 + num2
         latex = f"{num1} + {num2}"
@@ -155,44 +115,12 @@ class AddingWithRegroupingWithin1000Generator:
             latex=latex,
             solution=solution,
             steps=steps,
-            difficulty='medium'
-        )
-
-    def _generate_hard(self) -> Equation:
-        """Generate hard problems: 3-digit + 3-digit with multiple regroupings."""
-        # Ensure at least two regroupings
-        while True:
-            num1 = random.randint(150, 899)
-            num2 = random.randint(150, 899)
-            regroups = sum([
-                self._requires_regrouping_ones(num1, num2),
-                self._requires_regrouping_tens(num1, num2)
-            ])
-            if regroups >= 2 and num1 + num2 < 1000:
-                break
-
-        result = num1 + num2
-        latex = f"{num1} + {num2}"
-        solution = str(result)
-        steps = self._get_addition_steps(num1, num2)
-
-        return Equation(
-            latex=latex,
-            solution=solution,
-            steps=steps,
-            difficulty='hard'
+            difficulty=difficulty
         )
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: word problems with regrouping."""
-        num1 = random.randint(125, 675)
-        num2 = random.randint(125, 300)
-
-        # Ensure regrouping is needed
-        while not (self._requires_regrouping_ones(num1, num2) or
-                   self._requires_regrouping_tens(num1, num2)):
-            num1 = random.randint(125, 675)
-            num2 = random.randint(125, 300)
+        num1, num2 = sample_addition(self.rng, (125, 675), (125, 300), min_regroups=1)
 
         contexts = [
             f"A store had {num1} books. They received {num2} more books",
@@ -202,7 +130,7 @@ class AddingWithRegroupingWithin1000Generator:
             f"A library has {num1} fiction books and {num2} non-fiction books"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         result = num1 + num2
 
         latex = f"\\text{{{context}. How many in total?}}"
@@ -216,6 +144,28 @@ class AddingWithRegroupingWithin1000Generator:
             difficulty='challenge'
         )
 
+    def generate_bulk(self, difficulty: str, count: int) -> ProblemBatch:
+        """
+        Generate many problems at once with NumPy (see bulk_generation).
+
+        Draws from the same problems as generate_worksheet; challenge word
+        problems are generated one by one.
+
+        Args:
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            count: Number of problems to generate
+
+        Returns:
+            ProblemBatch of the problems
+        """
+        if difficulty not in PROBLEMS:
+            return ProblemBatch.from_equations(self.generate_worksheet(difficulty, count), difficulty)
+
+        np_rng = numpy_rng(self.rng)
+        num1, num2 = bulk_addition(np_rng, count, PROBLEMS[difficulty])
+        return ProblemBatch(difficulty, join_columns(num1, " + ", num2), num1 + num2,
+                            {'num1': num1, 'num2': num2}, steps=self._get_addition_steps)
+
 
 def main():
     """Test the generator."""
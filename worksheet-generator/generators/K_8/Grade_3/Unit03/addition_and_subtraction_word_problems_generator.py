@@ -6,9 +6,6 @@ Includes various contexts appropriate for Grade 3 students
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class AdditionAndSubtractionWordProblemsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,11 +46,11 @@ class AdditionAndSubtractionWordProblemsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: single-step addition or subtraction with 2-digit numbers."""
-        operation = random.choice(['add', 'subtract'])
+        operation = self.rng.choice(['add', 'subtract'])
 
         if operation == 'add':
-            num1 = random.randint(10, 75)
-            num2 = random.randint(10, 75)
+            num1 = self.rng.randint(10, 75)
+            num2 = self.rng.randint(10, 75)
             result = num1 + num2
 
             contexts = [
@@ -69,8 +65,8 @@ class AdditionAndSubtractionWordProblemsGenerator:
                 f"\\text{{Add: }} {num1} + {num2} = {result}"
             ]
         else:  # subtract
-            num1 = random.randint(30, 99)
-            num2 = random.randint(10, num1 - 5)
+            num1 = self.rng.randint(30, 99)
+            num2 = self.rng.randint(10, num1 - 5)
             result = num1 - num2
 
             contexts = [
@@ -85,7 +81,7 @@ class AdditionAndSubtractionWordProblemsGenerator:
                 f"\\text{{Subtract: }} {num1} - {num2} = {result}"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(result)
 
@@ -98,15 +94,15 @@ class AdditionAndSubtractionWordProblemsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: single-step with 3-digit numbers or 2-step with 2-digit."""
-        choice = random.randint(1, 2)
+        choice = self.rng.randint(1, 2)
 
         if choice == 1:
             # Single-step with 3-digit numbers
-            operation = random.choice(['add', 'subtract'])
+            operation = self.rng.choice(['add', 'subtract'])
 
             if operation == 'add':
-                num1 = random.randint(100, 600)
-                num2 = random.randint(100, 300)
+                num1 = self.rng.randint(100, 600)
+                num2 = self.rng.randint(100, 300)
                 result = num1 + num2
 
                 contexts = [
@@ -120,8 +116,8 @@ class AdditionAndSubtractionWordProblemsGenerator:
                     f"\\text{{Add: }} {num1} + {num2} = {result}"
                 ]
             else:  # subtract
-                num1 = random.randint(200, 900)
-                num2 = random.randint(100, num1 - 50)
+                num1 = self.rng.randint(200, 900)
+                num2 = self.rng.randint(100, num1 - 50)
                 result = num1 - num2
 
                 contexts = [
@@ -136,11 +132,11 @@ class AdditionAndSubtractionWordProblemsGenerator:
                 ]
         else:
             # 2-step problem with 2-digit numbers
-            num1 = random.randint(20, 60)
-            num2 = random.randint(15, 50)
-            num3 = random.randint(10, 40)
+            num1 = self.rng.randint(20, 60)
+            num2 = self.rng.randint(15, 50)
+            num3 = self.rng.randint(10, 40)
 
-            operation_combo = random.choice(['add_add', 'add_subtract'])
+            operation_combo = self.rng.choice(['add_add', 'add_subtract'])
 
             if operation_combo == 'add_add':
                 result = num1 + num2 + num3
@@ -169,7 +165,7 @@ class AdditionAndSubtractionWordProblemsGenerator:
                     f"\\text{{Subtract: }} {num1 + num2} - {num3} = {result}"
                 ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(result)
 
@@ -182,11 +178,11 @@ class AdditionAndSubtractionWordProblemsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: 2-step problems with 3-digit numbers."""
-        num1 = random.randint(150, 500)
-        num2 = random.randint(100, 400)
-        num3 = random.randint(75, 250)
+        num1 = self.rng.randint(150, 500)
+        num2 = self.rng.randint(100, 400)
+        num3 = self.rng.randint(75, 250)
 
-        operation_combo = random.choice(['add_add', 'add_subtract', 'subtract_add'])
+        operation_combo = self.rng.choice(['add_add', 'add_subtract', 'subtract_add'])
 
         if operation_combo == 'add_add':
             result = num1 + num2 + num3
@@ -216,9 +212,9 @@ class AdditionAndSubtractionWordProblemsGenerator:
             ]
         else:  # subtract_add
             # Ensure we don't get negative in first step
-            num1 = random.randint(300, 700)
-            num2 = random.randint(100, num1 - 50)
-            num3 = random.randint(75, 250)
+            num1 = self.rng.randint(300, 700)
+            num2 = self.rng.randint(100, num1 - 50)
+            num3 = self.rng.randint(75, 250)
             result = num1 - num2 + num3
 
             contexts = [
@@ -232,7 +228,7 @@ class AdditionAndSubtractionWordProblemsGenerator:
                 f"\\text{{Add: }} {num1 - num2} + {num3} = {result}"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(result)
 
@@ -245,12 +241,12 @@ class AdditionAndSubtractionWordProblemsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: multi-step with comparison or complex scenarios."""
-        problem_type = random.choice(['comparison', 'multi_step_complex'])
+        problem_type = self.rng.choice(['comparison', 'multi_step_complex'])
 
         if problem_type == 'comparison':
             # Comparison problems
-            num1 = random.randint(200, 600)
-            num2 = random.randint(150, 500)
+            num1 = self.rng.randint(200, 600)
+            num2 = self.rng.randint(150, 500)
 
             if num1 > num2:
                 difference = num1 - num2
@@ -278,10 +274,10 @@ class AdditionAndSubtractionWordProblemsGenerator:
                 ]
         else:
             # Multi-step complex
-            num1 = random.randint(200, 500)
-            num2 = random.randint(100, 300)
-            num3 = random.randint(150, 400)
-            num4 = random.randint(50, 200)
+            num1 = self.rng.randint(200, 500)
+            num2 = self.rng.randint(100, 300)
+            num3 = self.rng.randint(150, 400)
+            num4 = self.rng.randint(50, 200)
 
             contexts = [
                 f"A store starts with {num1} items. They sell {num2} items on Monday and {num3} items on Tuesday, but receive {num4} new items on Wednesday. How many items does the store have now?",
@@ -303,7 +299,7 @@ class AdditionAndSubtractionWordProblemsGenerator:
                 f"\\text{{Final answer: }} {result}"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(result)
 
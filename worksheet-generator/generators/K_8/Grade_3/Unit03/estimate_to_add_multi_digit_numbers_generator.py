@@ -6,9 +6,6 @@ Focuses on rounding to nearest 10 or 100, then adding the rounded numbers
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class EstimateToAddMultiDigitNumbersGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -65,8 +61,8 @@ class EstimateToAddMultiDigitNumbersGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: 2-digit + 2-digit, round to nearest 10."""
-        num1 = random.randint(12, 98)
-        num2 = random.randint(12, 98)
+        num1 = self.rng.randint(12, 98)
+        num2 = self.rng.randint(12, 98)
 
         rounded1 = self._round_to_nearest(num1, 10)
         rounded2 = self._round_to_nearest(num2, 10)
@@ -91,8 +87,8 @@ class EstimateToAddMultiDigitNumbersGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: 3-digit + 3-digit or 2-digit, round to nearest 10."""
-        num1 = random.randint(100, 999)
-        num2 = random.randint(50, 999)
+        num1 = self.rng.randint(100, 999)
+        num2 = self.rng.randint(50, 999)
 
         rounded1 = self._round_to_nearest(num1, 10)
         rounded2 = self._round_to_nearest(num2, 10)
@@ -117,8 +113,8 @@ class EstimateToAddMultiDigitNumbersGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: 3-digit + 3-digit, round to nearest 100."""
-        num1 = random.randint(150, 950)
-        num2 = random.randint(150, 950)
+        num1 = self.rng.randint(150, 950)
+        num2 = self.rng.randint(150, 950)
 
         rounded1 = self._round_to_nearest(num1, 100)
         rounded2 = self._round_to_nearest(num2, 100)
@@ -143,9 +139,9 @@ class EstimateToAddMultiDigitNumbersGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: word problems with estimation."""
-        num1 = random.randint(125, 875)
-        num2 = random.randint(125, 875)
-        round_to = random.choice([10, 100])
+        num1 = self.rng.randint(125, 875)
+        num2 = self.rng.randint(125, 875)
+        round_to = self.rng.choice([10, 100])
 
         contexts = [
             f"A store sold {num1} items on Monday and {num2} items on Tuesday",
@@ -155,7 +151,7 @@ class EstimateToAddMultiDigitNumbersGenerator:
             f"A factory produced {num1} toys in week 1 and {num2} toys in week 2"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
 
         rounded1 = self._round_to_nearest(num1, round_to)
         rounded2 = self._round_to_nearest(num2, round_to)
@@ -6,9 +6,6 @@ Focuses on rounding to nearest 10 or 100, then subtracting the rounded numbers
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class EstimateToSubtractMultiDigitNumbersGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -65,8 +61,8 @@ class EstimateToSubtractMultiDigitNumbersGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: 2-digit - 2-digit, round to nearest 10."""
-        num1 = random.randint(30, 98)
-        num2 = random.randint(12, num1 - 5)  # Ensure positive result
+        num1 = self.rng.randint(30, 98)
+        num2 = self.rng.randint(12, num1 - 5)  # Ensure positive result
 
         rounded1 = self._round_to_nearest(num1, 10)
         rounded2 = self._round_to_nearest(num2, 10)
@@ -96,8 +92,8 @@ class EstimateToSubtractMultiDigitNumbersGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: 3-digit - 3-digit or 2-digit, round to nearest 10."""
-        num1 = random.randint(200, 999)
-        num2 = random.randint(50, num1 - 20)
+        num1 = self.rng.randint(200, 999)
+        num2 = self.rng.randint(50, num1 - 20)
 
         rounded1 = self._round_to_nearest(num1, 10)
         rounded2 = self._round_to_nearest(num2, 10)
@@ -122,8 +118,8 @@ class EstimateToSubtractMultiDigitNumbersGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: 3-digit - 3-digit, round to nearest 100."""
-        num1 = random.randint(300, 950)
-        num2 = random.randint(150, num1 - 50)
+        num1 = self.rng.randint(300, 950)
+        num2 = self.rng.randint(150, num1 - 50)
 
         rounded1 = self._round_to_nearest(num1, 100)
         rounded2 = self._round_to_nearest(num2, 100)
@@ -153,9 +149,9 @@ class EstimateToSubtractMultiDigitNumbersGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: word problems with estimation."""
-        num1 = random.randint(250, 900)
-        num2 = random.randint(125, num1 - 50)
-        round_to = random.choice([10, 100])
+        num1 = self.rng.randint(250, 900)
+        num2 = self.rng.randint(125, num1 - 50)
+        round_to = self.rng.choice([10, 100])
 
         contexts = [
             f"A store had {num1} items. They sold {num2} items",
@@ -165,7 +161,7 @@ class EstimateToSubtractMultiDigitNumbersGenerator:
             f"A factory produced {num1} toys. {num2} toys were shipped"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
 
         rounded1 = self._round_to_nearest(num1, round_to)
         rounded2 = self._round_to_nearest(num2, round_to)
@@ -5,11 +5,27 @@ Uses number line concepts to help students understand rounding
 """
 
 import random
+from functools import partial
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+import numpy as np
+
 from equation_generator import Equation
+from bulk_generation import (ProblemBatch, bulk_number_from_parts, join_columns, number_from_parts,
+                             numpy_rng, pick, round_half_up)
+
+# Numbers to round, per difficulty and place rounded to: (place value, values)
+# parts drawn in order, a (low, high) range or a list to choose from (see
+# bulk_generation.number_from_parts). Shared by generate_worksheet and generate_bulk.
+NUMBERS = {
+    # 10-99, with a clear rounding direction (no 0, 4, 5 or 9 in the ones)
+    'easy': {10: [(10, (1, 9)), (1, [1, 2, 3, 6, 7, 8])]},
+    # 10-999 to the nearest 10, 100-999 to the nearest 100
+    'medium': {10: [(1, (10, 999))], 100: [(1, (100, 999))]},
+    # Boundary cases: the key digit is 0, 4, 5, 6 or 9
+    'hard': {10: [(10, (1, 99)), (1, [0, 4, 5, 6, 9])],
+             100: [(100, (1, 9)), (10, [0, 4, 5, 6, 9]), (1, (0, 9))]},
+}
 
 
 class RoundingToNearest10Or100Generator:
@@ -17,8 +33,7 @@ class RoundingToNearest10Or100Generator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -39,136 +54,64 @@ class RoundingToNearest10Or100Generator:
 
     def _generate_problem(self, difficulty: str) -> Equation:
         """Generate a single problem."""
-        if difficulty == 'easy':
-            return self._generate_easy()
-        elif difficulty == 'medium':
-            return self._generate_medium()
-        elif difficulty == 'hard':
-            return self._generate_hard()
-        else:
-            return self._generate_challenge()
-
-    def _generate_easy(self) -> Equation:
-        """Generate easy problems: round to nearest 10 (numbers 10-99)."""
-        # Generate number with clear rounding (0-4 or 5-9 in ones place)
-        tens = random.randint(1, 9)
-        ones = random.choice([1, 2, 3, 6, 7, 8])  # Clear rounding
-        number = tens * 10 + ones
-
-        if ones < 5:
-            rounded = tens * 10
-        else:
-            rounded = (tens + 1) * 10
-
-        latex = f"\\text{{Round }} {number} \\text{{ to the nearest 10}}"
-        solution = str(rounded)
-
-        steps = [
-            f"\\text{{The number }} {number} \\text{{ is between }} {tens * 10} \\text{{ and }} {(tens + 1) * 10}",
-            f"\\text{{The ones digit is }} {ones}",
-            f"\\text{{Since }} {ones} {'\\lt 5' if ones < 5 else '\\geq 5'}, \\text{{ round }} {'down' if ones < 5 else 'up'}",
-            f"{number} \\text{{ rounds to }} {rounded}"
-        ]
-
-        return Equation(
-            latex=latex,
-            solution=solution,
-            steps=steps,
-            difficulty='easy'
-        )
-
-    def _generate_medium(self) -> Equation:
-        """Generate medium problems: round to nearest 10 or 100 (numbers 10-999)."""
-        round_to = random.choice([10, 100])
+        if difficulty in NUMBERS:
+            return self._generate_rounding(difficulty)
+        return self._generate_challenge()
 
-        if round_to == 10:
-            number = random.randint(10, 999)
-            ones = number % 10
-
-            if ones < 5:
-                rounded = (number // 10) * 10
-            else:
-                rounded = ((number // 10) + 1) * 10
+    def _get_rounding_steps(self, difficulty: str, number: int, round_to: int) -> List[str]:
+        """Steps for rounding number to the nearest round_to."""
+        rounded = round_half_up(number, round_to)
+        key_digit = (number // (round_to // 10)) % 10
+        comparison = '\\lt 5' if key_digit < 5 else '\\geq 5'
+        direction = 'down' if key_digit < 5 else 'up'
 
-            steps = [
-                f"\\text{{Look at the ones digit: }} {ones}",
-                f"\\text{{Since }} {ones} {'\\lt 5' if ones < 5 else '\\geq 5'}, \\text{{ round }} {'down' if ones < 5 else 'up'}",
+        if difficulty == 'easy':
+            tens = number // 10
+            return [
+                f"\\text{{The number }} {number} \\text{{ is between }} {tens * 10} \\text{{ and }} {(tens + 1) * 10}",
+                f"\\text{{The ones digit is }} {key_digit}",
+                f"\\text{{Since }} {key_digit} {comparison}, \\text{{ round }} {direction}",
                 f"{number} \\text{{ rounds to }} {rounded}"
             ]
-        else:  # round to 100
-            number = random.randint(100, 999)
-            tens_digit = (number // 10) % 10
-
-            if tens_digit < 5:
-                rounded = (number // 100) * 100
-            else:
-                rounded = ((number // 100) + 1) * 100
-
-            steps = [
-                f"\\text{{Look at the tens digit: }} {tens_digit}",
-                f"\\text{{Since }} {tens_digit} {'\\lt 5' if tens_digit < 5 else '\\geq 5'}, \\text{{ round }} {'down' if tens_digit < 5 else 'up'}",
+        if difficulty == 'medium':
+            place = 'ones' if round_to == 10 else 'tens'
+            return [
+                f"\\text{{Look at the {place} digit: }} {key_digit}",
+                f"\\text{{Since }} {key_digit} {comparison}, \\text{{ round }} {direction}",
                 f"{number} \\text{{ rounds to }} {rounded}"
             ]
-
-        latex = f"\\text{{Round }} {number} \\text{{ to the nearest }} {round_to}"
-        solution = str(rounded)
-
-        return Equation(
-            latex=latex,
-            solution=solution,
-            steps=steps,
-            difficulty='medium'
-        )
-
-    def _generate_hard(self) -> Equation:
-        """Generate hard problems: mixed rounding with boundary cases."""
-        round_to = random.choice([10, 100])
-
-        if round_to == 10:
-            # Include numbers ending in 5 (boundary case)
-            tens = random.randint(1, 99)
-            ones = random.choice([0, 4, 5, 6, 9])
-            number = tens * 10 + ones
-
-            if ones < 5:
-                rounded = (number // 10) * 10
-            else:
-                rounded = ((number // 10) + 1) * 10
-        else:  # round to 100
-            hundreds = random.randint(1, 9)
-            tens_digit = random.choice([0, 4, 5, 6, 9])
-            ones_digit = random.randint(0, 9)
-            number = hundreds * 100 + tens_digit * 10 + ones_digit
-
-            if tens_digit < 5:
-                rounded = (number // 100) * 100
-            else:
-                rounded = ((number // 100) + 1) * 100
-
-        latex = f"\\text{{Round }} {number} \\text{{ to the nearest }} {round_to}"
-        solution = str(rounded)
-
-        key_digit = (number // (round_to // 10)) % 10
-        steps = [
+        return [
             f"\\text{{Identify the }} {round_to} \\text{{'s place and the digit to its right}}",
             f"\\text{{The key digit is }} {key_digit}",
-            f"\\text{{Round }} {'down' if key_digit < 5 else 'up'} \\text{{ because }} {key_digit} {'\\lt 5' if key_digit < 5 else '\\geq 5'}",
+            f"\\text{{Round }} {direction} \\text{{ because }} {key_digit} {comparison}",
             f"{number} \\text{{ rounds to }} {rounded}"
         ]
 
+    def _generate_rounding(self, difficulty: str) -> Equation:
+        """Generate an easy, medium or hard problem from NUMBERS."""
+        numbers = NUMBERS[difficulty]
+        round_to = pick(self.rng, list(numbers))
+        number = number_from_parts(self.rng, numbers[round_to])
+
+        if difficulty == 'easy':
+            latex = f"\\text{{Round }} {number} \\text{{ to the nearest 10}}"
+        else:
+            latex = f"\\text{{Round }} {number} \\text{{ to the nearest }} {round_to}"
+        solution = str(round_half_up(number, round_to))
+
         return Equation(
             latex=latex,
             solution=solution,
-            steps=steps,
-            difficulty='hard'
+            steps=self._get_rounding_steps(difficulty, number, round_to),
+            difficulty=difficulty
         )
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: word problems with rounding."""
-        round_to = random.choice([10, 100])
+        round_to = self.rng.choice([10, 100])
 
         if round_to == 10:
-            number = random.randint(15, 995)
+            number = self.rng.randint(15, 995)
             contexts = [
                 f"A school has {number} students. Round to the nearest 10",
                 f"The book has {number} pages. Round to the nearest 10",
@@ -176,7 +119,7 @@ class RoundingToNearest10Or100Generator:
                 f"The store sold {number} items. Round to the nearest 10"
             ]
         else:
-            number = random.randint(150, 950)
+            number = self.rng.randint(150, 950)
             contexts = [
                 f"A movie theater has {number} seats. Round to the nearest 100",
                 f"The farm has {number} animals. Round to the nearest 100",
@@ -184,7 +127,7 @@ class RoundingToNearest10Or100Generator:
                 f"The city has {number} houses. Round to the nearest 100"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
 
         if round_to == 10:
             ones = number % 10
@@ -218,6 +161,39 @@ class RoundingToNearest10Or100Generator:
         )
 
 
+    def generate_bulk(self, difficulty: str, count: int) -> ProblemBatch:
+        """
+        Generate many problems at once with NumPy (see bulk_generation).
+
+        Draws from the same problems as generate_worksheet; challenge word
+        problems are generated one by one.
+
+        Args:
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            count: Number of problems to generate
+
+        Returns:
+            ProblemBatch of the problems
+        """
+        if difficulty not in NUMBERS:
+            return ProblemBatch.from_equations(self.generate_worksheet(difficulty, count), difficulty)
+
+        np_rng = numpy_rng(self.rng)
+        numbers = NUMBERS[difficulty]
+        round_to = np_rng.choice(list(numbers), count)
+        number = np.empty(count, dtype=np.int64)
+        for place, parts in numbers.items():
+            rows = round_to == place
+            number[rows] = bulk_number_from_parts(np_rng, parts, int(rows.sum()))
+
+        if difficulty == 'easy':
+            latex = join_columns("\\text{Round } ", number, " \\text{ to the nearest 10}")
+        else:
+            latex = join_columns("\\text{Round } ", number, " \\text{ to the nearest } ", round_to)
+        return ProblemBatch(difficulty, latex, round_half_up(number, round_to),
+                            {'number': number, 'round_to': round_to},
+                            steps=partial(self._get_rounding_steps, difficulty))
+
 def main():
     """Test the generator."""
     generator = RoundingToNearest10Or100Generator()
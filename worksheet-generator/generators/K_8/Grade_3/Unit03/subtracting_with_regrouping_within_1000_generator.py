@@ -6,10 +6,26 @@ Shows step-by-step regrouping process
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
+from regrouping_sampler import ONES, TENS, sample_subtraction, sample_subtraction_variant
+from bulk_generation import ProblemBatch, bulk_subtraction, join_columns, numpy_rng
+
+# Kinds of problem per difficulty, as sample_subtraction arguments; generate_worksheet
+# and generate_bulk both pick one uniformly per problem
+PROBLEMS = {
+    # 2-digit - 2-digit with regrouping in ones only
+    'easy': [dict(minuend=(20, 99), subtrahend=(10, 94), regroup={ONES: True, TENS: False}, difference=(5, None))],
+    'medium': [
+        # 3-digit - 2-digit with regrouping
+        dict(minuend=(100, 900), subtrahend=(20, 99), min_regroups=1),
+        # 3-digit - 3-digit with regrouping
+        dict(minuend=(200, 900), subtrahend=(100, 880), min_regroups=1, difference=(20, None)),
+        # 2-digit - 2-digit with regrouping (a 2-digit difference can't borrow from the tens)
+        dict(minuend=(50, 99), subtrahend=(30, 94), regroup={ONES: True}, difference=(5, None)),
+    ],
+    # 3-digit - 3-digit with at least two regroupings
+    'hard': [dict(minuend=(300, 900), subtrahend=(150, 850), min_regroups=2, difference=(50, None))],
+}
 
 
 class SubtractingWithRegroupingWithin1000Generator:
@@ -17,8 +33,7 @@ class SubtractingWithRegroupingWithin1000Generator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -39,26 +54,9 @@ class SubtractingWithRegroupingWithin1000Generator:
 
     def _generate_problem(self, difficulty: str) -> Equation:
         """Generate a single problem."""
-        if difficulty == 'easy':
-            return self._generate_easy()
-        elif difficulty == 'medium':
-            return self._generate_medium()
-        elif difficulty == 'hard':
-            return self._generate_hard()
-        else:
-            return self._generate_challenge()
-
-    def _requires_regrouping_ones(self, num1: int, num2: int) -> bool:
-        """Check if ones place requires regrouping."""
-        return (num1 % 10) < (num2 % 10)
-
-    def _requires_regrouping_tens(self, num1: int, num2: int) -> bool:
-        """Check if tens place requires regrouping."""
-        return ((num1 // 10) % 10) < ((num2 // 10) % 10)
-
-    def _requires_regrouping_hundreds(self, num1: int, num2: int) -> bool:
-        """Check if hundreds place requires regrouping."""
-        return (num1 // 100) < (num2 // 100)
+        if difficulty in PROBLEMS:
+            return self._generate_computation(difficulty)
+        return self._generate_challenge()
 
     def _get_subtraction_steps(self, num1: int, num2: int) -> List[str]:
         """Generate detailed steps for subtraction with regrouping."""
@@ -99,14 +97,9 @@ class SubtractingWithRegroupingWithin1000Generator:
         steps.append(f"\\text{{Answer: }} {result}")
         return steps
 
-    def _generate_easy(self) -> Equation:
-        """Generate easy problems: 2-digit - 2-digit with regrouping in ones only."""
-        # Ensure regrouping in ones place only
-        while True:
-            num1 = random.randint(20, 99)
-            num2 = random.randint(10, num1 - 5)
-            if self._requires_regrouping_ones(num1, num2) and not self._requires_regrouping_tens(num1, num2):
-                break
+    def _generate_computation(self, difficulty: str) -> Equation:
+        """Generate an easy, medium or hard problem from PROBLEMS."""
+        num1, num2 = sample_subtraction_variant(self.rng, PROBLEMS[difficulty])
 
         result = num1 - num2
         latex = f"{num1} - {num2}"
@@ -117,119 +110,22 @@ class SubtractingWithRegroupingWithin1000Generator:
             latex=latex,
             solution=solution,
             steps=steps,
-            difficulty='easy'
-        )
-
-    def _generate_medium(self) -> Equation:
-        """Generate medium problems: 3-digit - 2-digit or 3-digit with regrouping."""
-        choice = random.randint(1, 3)
-
-        if choice == 1:
-            # 3-digit - 2-digit with regrouping
-            attempts = 0
-            while attempts < 100:
-                num1 = random.randint(100, 900)
-                num2 = random.randint(20, 99)
-                if self._requires_regrouping_ones(num1, num2) or self._requires_regrouping_tens(num1, num2):
-                    break
-                attempts += 1
-            if attempts >= 100:
-                # Fallback: force regrouping
-                num1 = 145
-                num2 = 67
-        elif choice == 2:
-            # 3-digit - 3-digit with one regrouping
-            attempts = 0
-            while attempts < 100:
-                num1 = random.randint(200, 900)
-                num2 = random.randint(100, num1 - 20)
-                if self._requires_regrouping_ones(num1, num2) or self._requires_regrouping_tens(num1, num2):
-                    break
-                attempts += 1
-            if attempts >= 100:
-                # Fallback: force regrouping
-                num1 = 345
-                num2 = 167
-        else:
-            # 2-digit - 2-digit with regrouping in tens
-            attempts = 0
-            while attempts < 100:
-                num1 = random.randint(50, 99)
-                num2 = random.randint(30, num1 - 5)
-                if self._requires_regrouping_tens(num1, num2):
-                    break
-                attempts += 1
-            if attempts >= 100:
-                # Fallback: force regrouping in tens
-                num1 = 82
-                num2 = 57
-
-        result = num1 - num2
-        latex = f"{num1} - {num2}"
-        solution = str(result)
-        steps = self._get_subtraction_steps(num1, num2)
-
-        return Equation(
-            latex=latex,
-            solution=solution,
-            steps=steps,
-            difficulty='medium'
-        )
-
-    def _generate_hard(self) -> Equation:
-        """Generate hard problems: 3-digit - 3-digit with multiple regroupings."""
-        # Ensure at least two regroupings
-        attempts = 0
-        while attempts < 100:
-            num1 = random.randint(300, 900)
-            num2 = random.randint(150, num1 - 50)
-            regroups = sum([
-                self._requires_regrouping_ones(num1, num2),
-                self._requires_regrouping_tens(num1, num2)
-            ])
-            if regroups >= 2:
-                break
-            attempts += 1
-
-        if attempts >= 100:
-            # Fallback: force multiple regroupings
-            num1 = 543
-            num2 = 287
-
-        result = num1 - num2
-        latex = f"{num1} - {num2}"
-        solution = str(result)
-        steps = self._get_subtraction_steps(num1, num2)
-
-        return Equation(
-            latex=latex,
-            solution=solution,
-            steps=steps,
-            difficulty='hard'
+            difficulty=difficulty
         )
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: word problems with regrouping, including zeros."""
         # Include problems with zeros that require regrouping
-        choice = random.randint(1, 2)
+        choice = self.rng.randint(1, 2)
 
         if choice == 1:
             # Regular 3-digit subtraction with regrouping
-            attempts = 0
-            while attempts < 100:
-                num1 = random.randint(250, 800)
-                num2 = random.randint(125, num1 - 50)
-                if self._requires_regrouping_ones(num1, num2) or self._requires_regrouping_tens(num1, num2):
-                    break
-                attempts += 1
-            if attempts >= 100:
-                # Fallback
-                num1 = 456
-                num2 = 189
+            num1, num2 = sample_subtraction(self.rng, (250, 800), (125, 750),
+                                            min_regroups=1, difference=(50, None))
         else:
             # Numbers with zeros (e.g., 400, 500, 600)
-            num1 = random.choice([300, 400, 500, 600, 700, 800])
-            num2 = random.randint(125, 275)
+            num1 = self.rng.choice([300, 400, 500, 600, 700, 800])
+            num2 = self.rng.randint(125, 275)
 
         contexts = [
             f"A store had {num1} items in stock. They sold {num2} items",
@@ -239,7 +135,7 @@ class SubtractingWithRegroupingWithin1000Generator:
             f"A factory produced {num1} toys. They shipped {num2} toys to stores"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         result = num1 - num2
 
         latex = f"\\text{{{context}. How many are left?}}"
@@ -253,6 +149,28 @@ class SubtractingWithRegroupingWithin1000Generator:
             difficulty='challenge'
         )
 
+    def generate_bulk(self, difficulty: str, count: int) -> ProblemBatch:
+        """
+        Generate many problems at once with NumPy (see bulk_generation).
+
+        Draws from the same problems as generate_worksheet; challenge word
+        problems are generated one by one.
+
+        Args:
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            count: Number of problems to generate
+
+        Returns:
+            ProblemBatch of the problems
+        """
+        if difficulty not in PROBLEMS:
+            return ProblemBatch.from_equations(self.generate_worksheet(difficulty, count), difficulty)
+
+        np_rng = numpy_rng(self.rng)
+        num1, num2 = bulk_subtraction(np_rng, count, PROBLEMS[difficulty])
+        return ProblemBatch(difficulty, join_columns(num1, " - ", num2), num1 - num2,
+                            {'num1': num1, 'num2': num2}, steps=self._get_subtraction_steps)
+
 
 def main():
     """Test the generator."""
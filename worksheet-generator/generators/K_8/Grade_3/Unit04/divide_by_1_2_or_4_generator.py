@@ -6,19 +6,22 @@ Builds fluency with basic division facts
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
+from bulk_generation import ProblemBatch, division_batch, draw_by_choice, numpy_rng
 
 
 class DivideBy1_2_Or4Generator:
     """Generates division problems with divisors 1, 2, or 4."""
 
+    # Quotient range for each divisor, per difficulty (generate_worksheet and generate_bulk)
+    QUOTIENTS = {
+        'easy': {1: (1, 25), 2: (1, 12), 4: (1, 6)},
+        'medium': {1: (10, 50), 2: (5, 25), 4: (3, 12)},
+    }
+
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,14 +53,9 @@ class DivideBy1_2_Or4Generator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: small dividends (up to 25)."""
-        divisor = random.choice([1, 2, 4])
-
-        if divisor == 1:
-            quotient = random.randint(1, 25)
-        elif divisor == 2:
-            quotient = random.randint(1, 12)
-        else:  # divisor == 4
-            quotient = random.randint(1, 6)
+        quotients = self.QUOTIENTS['easy']
+        divisor = self.rng.choice(list(quotients))
+        quotient = self.rng.randint(*quotients[divisor])
 
         dividend = divisor * quotient
 
@@ -73,14 +71,9 @@ class DivideBy1_2_Or4Generator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: larger dividends (up to 50)."""
-        divisor = random.choice([1, 2, 4])
-
-        if divisor == 1:
-            quotient = random.randint(10, 50)
-        elif divisor == 2:
-            quotient = random.randint(5, 25)
-        else:  # divisor == 4
-            quotient = random.randint(3, 12)
+        quotients = self.QUOTIENTS['medium']
+        divisor = self.rng.choice(list(quotients))
+        quotient = self.rng.randint(*quotients[divisor])
 
         dividend = divisor * quotient
 
@@ -96,12 +89,12 @@ class DivideBy1_2_Or4Generator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with context."""
-        divisor = random.choice([2, 4])  # Skip 1 for more interesting word problems
+        divisor = self.rng.choice([2, 4])  # Skip 1 for more interesting word problems
 
         if divisor == 2:
-            quotient = random.randint(5, 20)
+            quotient = self.rng.randint(5, 20)
         else:  # divisor == 4
-            quotient = random.randint(4, 12)
+            quotient = self.rng.randint(4, 12)
 
         dividend = divisor * quotient
 
@@ -120,7 +113,7 @@ class DivideBy1_2_Or4Generator:
                 f"A rectangle has a perimeter of {dividend} cm and {divisor} equal sides. What is the length of each side?"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(quotient)
 
@@ -133,15 +126,15 @@ class DivideBy1_2_Or4Generator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: multi-step or missing number problems."""
-        problem_type = random.choice(['multi_step', 'missing_number'])
+        problem_type = self.rng.choice(['multi_step', 'missing_number'])
 
         if problem_type == 'multi_step':
             # Two operations: first multiply, then divide
-            factor1 = random.choice([2, 4])
-            factor2 = random.randint(2, 6)
+            factor1 = self.rng.choice([2, 4])
+            factor2 = self.rng.randint(2, 6)
             product = factor1 * factor2
 
-            divisor = random.choice([2, 4])
+            divisor = self.rng.choice([2, 4])
             quotient = product // divisor
 
             contexts = [
@@ -150,7 +143,7 @@ class DivideBy1_2_Or4Generator:
                 f"There are {factor1} rows of {factor2} chairs. The chairs are rearranged into {divisor} equal sections"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}. How many in each group?}}"
             solution = str(quotient)
 
@@ -162,8 +155,8 @@ class DivideBy1_2_Or4Generator:
             )
         else:
             # Missing dividend: ? ÷ divisor = quotient
-            divisor = random.choice([2, 4])
-            quotient = random.randint(4, 12)
+            divisor = self.rng.choice([2, 4])
+            quotient = self.rng.randint(4, 12)
             dividend = divisor * quotient
 
             latex = f"? \\div {divisor} = {quotient}"
@@ -176,6 +169,26 @@ class DivideBy1_2_Or4Generator:
                 difficulty='challenge'
             )
 
+    def generate_bulk(self, difficulty: str, count: int) -> ProblemBatch:
+        """
+        Generate many problems at once with NumPy (e.g. for a practice bank).
+
+        Easy and medium facts are drawn and formatted as arrays; word problems
+        (hard, challenge) are generated one by one.
+
+        Args:
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            count: Number of problems to generate
+
+        Returns:
+            ProblemBatch (rows convert to Equation objects on access)
+        """
+        if difficulty not in self.QUOTIENTS:
+            return ProblemBatch.from_equations(self.generate_worksheet(difficulty, count), difficulty)
+
+        divisor, quotient = draw_by_choice(numpy_rng(self.rng), self.QUOTIENTS[difficulty], count)
+        return division_batch(divisor, quotient, difficulty)
+
 
 def main():
     """Test the generator."""
@@ -6,19 +6,22 @@ Builds fluency with these important division facts
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
+from bulk_generation import ProblemBatch, division_batch, draw_by_choice, numpy_rng
 
 
 class DivideBy3Or6Generator:
     """Generates division problems with divisors 3 or 6."""
 
+    # Quotient range for each divisor, per difficulty (generate_worksheet and generate_bulk)
+    QUOTIENTS = {
+        'easy': {3: (1, 10), 6: (1, 5)},
+        'medium': {3: (5, 20), 6: (3, 10)},
+    }
+
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,12 +53,9 @@ class DivideBy3Or6Generator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: small dividends (up to 30)."""
-        divisor = random.choice([3, 6])
-
-        if divisor == 3:
-            quotient = random.randint(1, 10)
-        else:  # divisor == 6
-            quotient = random.randint(1, 5)
+        quotients = self.QUOTIENTS['easy']
+        divisor = self.rng.choice(list(quotients))
+        quotient = self.rng.randint(*quotients[divisor])
 
         dividend = divisor * quotient
 
@@ -71,12 +71,9 @@ class DivideBy3Or6Generator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: larger dividends (up to 60)."""
-        divisor = random.choice([3, 6])
-
-        if divisor == 3:
-            quotient = random.randint(5, 20)
-        else:  # divisor == 6
-            quotient = random.randint(3, 10)
+        quotients = self.QUOTIENTS['medium']
+        divisor = self.rng.choice(list(quotients))
+        quotient = self.rng.randint(*quotients[divisor])
 
         dividend = divisor * quotient
 
@@ -92,12 +89,12 @@ class DivideBy3Or6Generator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with context."""
-        divisor = random.choice([3, 6])
+        divisor = self.rng.choice([3, 6])
 
         if divisor == 3:
-            quotient = random.randint(4, 12)
+            quotient = self.rng.randint(4, 12)
         else:  # divisor == 6
-            quotient = random.randint(3, 10)
+            quotient = self.rng.randint(3, 10)
 
         dividend = divisor * quotient
 
@@ -116,7 +113,7 @@ class DivideBy3Or6Generator:
                 f"The bakery made {dividend} cupcakes and packs them {divisor} to a box. How many boxes do they fill?"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(quotient)
 
@@ -129,18 +126,18 @@ class DivideBy3Or6Generator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: multi-step, relationship between 3 and 6, or remainders."""
-        problem_type = random.choice(['multi_step', 'relationship', 'remainder'])
+        problem_type = self.rng.choice(['multi_step', 'relationship', 'remainder'])
 
         if problem_type == 'multi_step':
             # Multiply then divide or divide different numbers
-            divisor = random.choice([3, 6])
-            quotient1 = random.randint(3, 8)
+            divisor = self.rng.choice([3, 6])
+            quotient1 = self.rng.randint(3, 8)
             dividend1 = divisor * quotient1
 
-            operation = random.choice(['subtract', 'add'])
+            operation = self.rng.choice(['subtract', 'add'])
 
             if operation == 'subtract':
-                subtract_amount = random.randint(divisor, dividend1 - divisor)
+                subtract_amount = self.rng.randint(divisor, dividend1 - divisor)
                 # Make sure result is divisible by divisor
                 remainder_check = (dividend1 - subtract_amount) % divisor
                 subtract_amount += remainder_check
@@ -151,7 +148,7 @@ class DivideBy3Or6Generator:
                     f"A store had {dividend1} toys. {subtract_amount} were sold. The remaining toys are packed {divisor} per box"
                 ]
 
-                context = random.choice(contexts)
+                context = self.rng.choice(contexts)
                 latex = f"\\text{{{context}. How many groups/boxes?}}"
                 solution = str(result)
 
@@ -163,8 +160,8 @@ class DivideBy3Or6Generator:
                 )
             else:
                 # Add then divide
-                num1 = divisor * random.randint(2, 5)
-                num2 = divisor * random.randint(2, 5)
+                num1 = divisor * self.rng.randint(2, 5)
+                num2 = divisor * self.rng.randint(2, 5)
                 total = num1 + num2
                 result = total // divisor
 
@@ -173,7 +170,7 @@ class DivideBy3Or6Generator:
                     f"Monday's collection: {num1} cans. Tuesday's collection: {num2} cans. All cans packed {divisor} per bag"
                 ]
 
-                context = random.choice(contexts)
+                context = self.rng.choice(contexts)
                 latex = f"\\text{{{context}. How many groups/bags total?}}"
                 solution = str(result)
 
@@ -186,7 +183,7 @@ class DivideBy3Or6Generator:
 
         elif problem_type == 'relationship':
             # Explore relationship: dividing by 6 vs dividing by 3
-            quotient_by_6 = random.randint(3, 8)
+            quotient_by_6 = self.rng.randint(3, 8)
             dividend = 6 * quotient_by_6
             quotient_by_3 = dividend // 3
 
@@ -201,9 +198,9 @@ class DivideBy3Or6Generator:
             )
 
         else:  # remainder
-            divisor = random.choice([3, 6])
-            quotient = random.randint(4, 10)
-            remainder = random.randint(1, divisor - 1)
+            divisor = self.rng.choice([3, 6])
+            quotient = self.rng.randint(4, 10)
+            remainder = self.rng.randint(1, divisor - 1)
             dividend = divisor * quotient + remainder
 
             contexts = [
@@ -212,7 +209,7 @@ class DivideBy3Or6Generator:
                 f"{dividend} toys packed {divisor} per box"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}. How many each and how many left over?}}"
             solution = f"{quotient} R{remainder}"
 
@@ -223,6 +220,26 @@ class DivideBy3Or6Generator:
                 difficulty='challenge'
             )
 
+    def generate_bulk(self, difficulty: str, count: int) -> ProblemBatch:
+        """
+        Generate many problems at once with NumPy (e.g. for a practice bank).
+
+        Easy and medium facts are drawn and formatted as arrays; word problems
+        (hard, challenge) are generated one by one.
+
+        Args:
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            count: Number of problems to generate
+
+        Returns:
+            ProblemBatch (rows convert to Equation objects on access)
+        """
+        if difficulty not in self.QUOTIENTS:
+            return ProblemBatch.from_equations(self.generate_worksheet(difficulty, count), difficulty)
+
+        divisor, quotient = draw_by_choice(numpy_rng(self.rng), self.QUOTIENTS[difficulty], count)
+        return division_batch(divisor, quotient, difficulty)
+
 
 def main():
     """Test the generator."""
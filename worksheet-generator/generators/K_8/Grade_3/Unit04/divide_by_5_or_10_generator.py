@@ -6,19 +6,22 @@ Emphasizes patterns and place value understanding
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
+from bulk_generation import ProblemBatch, division_batch, draw_by_choice, numpy_rng
 
 
 class DivideBy5Or10Generator:
     """Generates division problems with divisors 5 or 10."""
 
+    # Quotient range for each divisor, per difficulty (generate_worksheet and generate_bulk)
+    QUOTIENTS = {
+        'easy': {5: (1, 10), 10: (1, 5)},
+        'medium': {5: (5, 20), 10: (3, 10)},
+    }
+
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,12 +53,9 @@ class DivideBy5Or10Generator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: small dividends (up to 50)."""
-        divisor = random.choice([5, 10])
-
-        if divisor == 5:
-            quotient = random.randint(1, 10)
-        else:  # divisor == 10
-            quotient = random.randint(1, 5)
+        quotients = self.QUOTIENTS['easy']
+        divisor = self.rng.choice(list(quotients))
+        quotient = self.rng.randint(*quotients[divisor])
 
         dividend = divisor * quotient
 
@@ -71,12 +71,9 @@ class DivideBy5Or10Generator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: larger dividends (up to 100)."""
-        divisor = random.choice([5, 10])
-
-        if divisor == 5:
-            quotient = random.randint(5, 20)
-        else:  # divisor == 10
-            quotient = random.randint(3, 10)
+        quotients = self.QUOTIENTS['medium']
+        divisor = self.rng.choice(list(quotients))
+        quotient = self.rng.randint(*quotients[divisor])
 
         dividend = divisor * quotient
 
@@ -92,12 +89,12 @@ class DivideBy5Or10Generator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with context."""
-        divisor = random.choice([5, 10])
+        divisor = self.rng.choice([5, 10])
 
         if divisor == 5:
-            quotient = random.randint(4, 15)
+            quotient = self.rng.randint(4, 15)
         else:  # divisor == 10
-            quotient = random.randint(3, 10)
+            quotient = self.rng.randint(3, 10)
 
         dividend = divisor * quotient
 
@@ -116,7 +113,7 @@ class DivideBy5Or10Generator:
                 f"The school collected {dividend} cans for recycling. They pack {divisor} cans per box. How many boxes?"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(quotient)
 
@@ -129,17 +126,17 @@ class DivideBy5Or10Generator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: multi-step, patterns, or comparison problems."""
-        problem_type = random.choice(['multi_step', 'comparison', 'pattern'])
+        problem_type = self.rng.choice(['multi_step', 'comparison', 'pattern'])
 
         if problem_type == 'multi_step':
             # Add then divide or divide then add
-            operation_order = random.choice(['add_divide', 'divide_add'])
+            operation_order = self.rng.choice(['add_divide', 'divide_add'])
 
             if operation_order == 'add_divide':
-                num1 = random.randint(10, 30)
-                num2 = random.randint(10, 30)
+                num1 = self.rng.randint(10, 30)
+                num2 = self.rng.randint(10, 30)
                 total = num1 + num2
-                divisor = random.choice([5, 10])
+                divisor = self.rng.choice([5, 10])
                 # Make sure total is divisible
                 quotient = total // divisor
                 total = divisor * quotient
@@ -149,7 +146,7 @@ class DivideBy5Or10Generator:
                     f"Two boxes contain {num1} and {total - num1} pencils. All pencils are divided into groups of {divisor}"
                 ]
 
-                context = random.choice(contexts)
+                context = self.rng.choice(contexts)
                 latex = f"\\text{{{context}. How many in each group?}}"
                 solution = str(quotient)
 
@@ -161,17 +158,17 @@ class DivideBy5Or10Generator:
                 )
             else:
                 # Divide then add
-                divisor = random.choice([5, 10])
-                quotient1 = random.randint(3, 8)
+                divisor = self.rng.choice([5, 10])
+                quotient1 = self.rng.randint(3, 8)
                 dividend1 = divisor * quotient1
-                extra = random.randint(2, 10)
+                extra = self.rng.randint(2, 10)
 
                 contexts = [
                     f"{dividend1} cookies are shared among {divisor} children. Then each child gets {extra} more cookies",
                     f"A teacher divides {dividend1} stickers among {divisor} students. Later, she gives each student {extra} more stickers"
                 ]
 
-                context = random.choice(contexts)
+                context = self.rng.choice(contexts)
                 latex = f"\\text{{{context}. How many does each have now?}}"
                 solution = str(quotient1 + extra)
 
@@ -183,9 +180,9 @@ class DivideBy5Or10Generator:
                 )
 
         elif problem_type == 'comparison':
-            divisor = random.choice([5, 10])
-            quotient1 = random.randint(4, 10)
-            quotient2 = quotient1 + random.randint(2, 5)
+            divisor = self.rng.choice([5, 10])
+            quotient1 = self.rng.randint(4, 10)
+            quotient2 = quotient1 + self.rng.randint(2, 5)
             dividend1 = divisor * quotient1
             dividend2 = divisor * quotient2
 
@@ -194,7 +191,7 @@ class DivideBy5Or10Generator:
                 f"Team A scored {dividend1} points and Team B scored {dividend2} points. If each touchdown is {divisor} points, how many more touchdowns did Team B score?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}}}"
             solution = str(quotient2 - quotient1)
 
@@ -207,13 +204,13 @@ class DivideBy5Or10Generator:
 
         else:  # pattern
             # Missing number in pattern
-            divisor = random.choice([5, 10])
-            start_quotient = random.randint(2, 5)
+            divisor = self.rng.choice([5, 10])
+            start_quotient = self.rng.randint(2, 5)
             quotients = [start_quotient + i for i in range(4)]
             dividends = [q * divisor for q in quotients]
 
             # Hide one dividend
-            hidden_index = random.randint(1, 2)
+            hidden_index = self.rng.randint(1, 2)
             pattern_str = ", ".join(str(d) if i != hidden_index else "?" for i, d in enumerate(dividends))
 
             latex = f"\\text{{Complete the pattern (dividing by {divisor}): {pattern_str}}}"
@@ -226,6 +223,26 @@ class DivideBy5Or10Generator:
                 difficulty='challenge'
             )
 
+    def generate_bulk(self, difficulty: str, count: int) -> ProblemBatch:
+        """
+        Generate many problems at once with NumPy (e.g. for a practice bank).
+
+        Easy and medium facts are drawn and formatted as arrays; word problems
+        (hard, challenge) are generated one by one.
+
+        Args:
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            count: Number of problems to generate
+
+        Returns:
+            ProblemBatch (rows convert to Equation objects on access)
+        """
+        if difficulty not in self.QUOTIENTS:
+            return ProblemBatch.from_equations(self.generate_worksheet(difficulty, count), difficulty)
+
+        divisor, quotient = draw_by_choice(numpy_rng(self.rng), self.QUOTIENTS[difficulty], count)
+        return division_batch(divisor, quotient, difficulty)
+
 
 def main():
     """Test the generator."""
@@ -6,19 +6,22 @@ Builds fluency with more challenging division facts
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
+from bulk_generation import ProblemBatch, division_batch, draw_by_choice, numpy_rng
 
 
 class DivideBy7_8_Or9Generator:
     """Generates division problems with divisors 7, 8, or 9."""
 
+    # Quotient range for each divisor, per difficulty (generate_worksheet and generate_bulk)
+    QUOTIENTS = {
+        'easy': {7: (1, 5), 8: (1, 5), 9: (1, 4)},
+        'medium': {7: (3, 12), 8: (3, 11), 9: (3, 10)},
+    }
+
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,14 +53,9 @@ class DivideBy7_8_Or9Generator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: small dividends (up to 40)."""
-        divisor = random.choice([7, 8, 9])
-
-        if divisor == 7:
-            quotient = random.randint(1, 5)
-        elif divisor == 8:
-            quotient = random.randint(1, 5)
-        else:  # divisor == 9
-            quotient = random.randint(1, 4)
+        quotients = self.QUOTIENTS['easy']
+        divisor = self.rng.choice(list(quotients))
+        quotient = self.rng.randint(*quotients[divisor])
 
         dividend = divisor * quotient
 
@@ -73,14 +71,9 @@ class DivideBy7_8_Or9Generator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: larger dividends (up to 90)."""
-        divisor = random.choice([7, 8, 9])
-
-        if divisor == 7:
-            quotient = random.randint(3, 12)
-        elif divisor == 8:
-            quotient = random.randint(3, 11)
-        else:  # divisor == 9
-            quotient = random.randint(3, 10)
+        quotients = self.QUOTIENTS['medium']
+        divisor = self.rng.choice(list(quotients))
+        quotient = self.rng.randint(*quotients[divisor])
 
         dividend = divisor * quotient
 
@@ -96,14 +89,14 @@ class DivideBy7_8_Or9Generator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with context."""
-        divisor = random.choice([7, 8, 9])
+        divisor = self.rng.choice([7, 8, 9])
 
         if divisor == 7:
-            quotient = random.randint(3, 10)
+            quotient = self.rng.randint(3, 10)
         elif divisor == 8:
-            quotient = random.randint(3, 9)
+            quotient = self.rng.randint(3, 9)
         else:  # divisor == 9
-            quotient = random.randint(3, 9)
+            quotient = self.rng.randint(3, 9)
 
         dividend = divisor * quotient
 
@@ -129,7 +122,7 @@ class DivideBy7_8_Or9Generator:
                 f"There are {dividend} pencils to distribute equally to {divisor} classrooms. How many per classroom?"
             ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(quotient)
 
@@ -142,18 +135,18 @@ class DivideBy7_8_Or9Generator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: multi-step, mixed operations, or remainders."""
-        problem_type = random.choice(['multi_step', 'mixed_operations', 'remainder', 'comparison'])
+        problem_type = self.rng.choice(['multi_step', 'mixed_operations', 'remainder', 'comparison'])
 
         if problem_type == 'multi_step':
             # Two-step division or multiply then divide
-            divisor1 = random.choice([7, 8, 9])
-            quotient1 = random.randint(3, 8)
+            divisor1 = self.rng.choice([7, 8, 9])
+            quotient1 = self.rng.randint(3, 8)
             dividend1 = divisor1 * quotient1
 
-            operation = random.choice(['add_divide', 'subtract_divide'])
+            operation = self.rng.choice(['add_divide', 'subtract_divide'])
 
             if operation == 'add_divide':
-                extra = divisor1 * random.randint(1, 3)
+                extra = divisor1 * self.rng.randint(1, 3)
                 total = dividend1 + extra
                 final_result = total // divisor1
 
@@ -162,7 +155,7 @@ class DivideBy7_8_Or9Generator:
                     f"Monday: {dividend1} students. Tuesday: {extra} more students join. All divided into teams of {divisor1}"
                 ]
 
-                context = random.choice(contexts)
+                context = self.rng.choice(contexts)
                 latex = f"\\text{{{context}. How many boxes/teams?}}"
                 solution = str(final_result)
 
@@ -174,8 +167,8 @@ class DivideBy7_8_Or9Generator:
                 )
             else:
                 # Subtract then divide
-                total = divisor1 * random.randint(5, 10)
-                subtract = divisor1 * random.randint(1, 3)
+                total = divisor1 * self.rng.randint(5, 10)
+                subtract = divisor1 * self.rng.randint(1, 3)
                 result = (total - subtract) // divisor1
 
                 contexts = [
@@ -183,7 +176,7 @@ class DivideBy7_8_Or9Generator:
                     f"A library had {total} books. {subtract} were checked out. The rest are divided among {divisor1} shelves"
                 ]
 
-                context = random.choice(contexts)
+                context = self.rng.choice(contexts)
                 latex = f"\\text{{{context}. How many each?}}"
                 solution = str(result)
 
@@ -196,11 +189,11 @@ class DivideBy7_8_Or9Generator:
 
         elif problem_type == 'mixed_operations':
             # Multiply two numbers, then divide
-            factor1 = random.randint(2, 5)
-            factor2 = random.randint(3, 6)
+            factor1 = self.rng.randint(2, 5)
+            factor2 = self.rng.randint(3, 6)
             product = factor1 * factor2
 
-            divisor = random.choice([7, 8, 9])
+            divisor = self.rng.choice([7, 8, 9])
             # Adjust product to be divisible by divisor
             quotient = max(2, product // divisor)
             product = divisor * quotient
@@ -210,7 +203,7 @@ class DivideBy7_8_Or9Generator:
                 f"There are {factor1} boxes with {product // factor1} items each. All items divided among {divisor} students"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}. How many in each section/per student?}}"
             solution = str(quotient)
 
@@ -223,9 +216,9 @@ class DivideBy7_8_Or9Generator:
 
         elif problem_type == 'comparison':
             # Compare two division problems
-            divisor = random.choice([7, 8, 9])
-            quotient1 = random.randint(4, 8)
-            quotient2 = quotient1 + random.randint(2, 4)
+            divisor = self.rng.choice([7, 8, 9])
+            quotient1 = self.rng.randint(4, 8)
+            quotient2 = quotient1 + self.rng.randint(2, 4)
             dividend1 = divisor * quotient1
             dividend2 = divisor * quotient2
 
@@ -234,7 +227,7 @@ class DivideBy7_8_Or9Generator:
                 f"Store A sold {dividend1} items and Store B sold {dividend2} items. Each box holds {divisor} items. How many more boxes did Store B fill?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}}}"
             solution = str(quotient2 - quotient1)
 
@@ -246,9 +239,9 @@ class DivideBy7_8_Or9Generator:
             )
 
         else:  # remainder
-            divisor = random.choice([7, 8, 9])
-            quotient = random.randint(4, 9)
-            remainder = random.randint(1, divisor - 1)
+            divisor = self.rng.choice([7, 8, 9])
+            quotient = self.rng.randint(4, 9)
+            remainder = self.rng.randint(1, divisor - 1)
             dividend = divisor * quotient + remainder
 
             contexts = [
@@ -257,7 +250,7 @@ class DivideBy7_8_Or9Generator:
                 f"{dividend} candies divided into bags of {divisor}"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}. How many each and how many left over?}}"
             solution = f"{quotient} R{remainder}"
 
@@ -268,6 +261,26 @@ class DivideBy7_8_Or9Generator:
                 difficulty='challenge'
             )
 
+    def generate_bulk(self, difficulty: str, count: int) -> ProblemBatch:
+        """
+        Generate many problems at once with NumPy (e.g. for a practice bank).
+
+        Easy and medium facts are drawn and formatted as arrays; word problems
+        (hard, challenge) are generated one by one.
+
+        Args:
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            count: Number of problems to generate
+
+        Returns:
+            ProblemBatch (rows convert to Equation objects on access)
+        """
+        if difficulty not in self.QUOTIENTS:
+            return ProblemBatch.from_equations(self.generate_worksheet(difficulty, count), difficulty)
+
+        divisor, quotient = draw_by_choice(numpy_rng(self.rng), self.QUOTIENTS[difficulty], count)
+        return division_batch(divisor, quotient, difficulty)
+
 
 def main():
     """Test the generator."""
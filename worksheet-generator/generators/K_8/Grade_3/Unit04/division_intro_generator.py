@@ -6,9 +6,6 @@ Example: 12 ÷ 3 = 4 (12 items shared into 3 groups)
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class DivisionIntroGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class DivisionIntroGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: small numbers (dividends up to 20)."""
-        divisor = random.randint(2, 5)
-        quotient = random.randint(2, 4)
+        divisor = self.rng.randint(2, 5)
+        quotient = self.rng.randint(2, 4)
         dividend = divisor * quotient
 
         # Simple division problem
@@ -67,8 +63,8 @@ class DivisionIntroGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: larger dividends (up to 50) with sharing context."""
-        divisor = random.randint(2, 5)
-        quotient = random.randint(3, 10)
+        divisor = self.rng.randint(2, 5)
+        quotient = self.rng.randint(3, 10)
         dividend = divisor * quotient
 
         contexts = [
@@ -77,7 +73,7 @@ class DivisionIntroGenerator:
             (f"Split {dividend} items into {divisor} equal parts", "sharing")
         ]
 
-        context, context_type = random.choice(contexts)
+        context, context_type = self.rng.choice(contexts)
         latex = f"\\text{{{context}. How many in each group?}}"
         solution = str(quotient)
 
@@ -90,8 +86,8 @@ class DivisionIntroGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with real-world context."""
-        divisor = random.randint(2, 6)
-        quotient = random.randint(4, 10)
+        divisor = self.rng.randint(2, 6)
+        quotient = self.rng.randint(4, 10)
         dividend = divisor * quotient
 
         contexts = [
@@ -101,7 +97,7 @@ class DivisionIntroGenerator:
             f"A farmer picked {dividend} flowers and wants to make {divisor} bouquets with the same number of flowers"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}. How many does each get?}}"
         solution = str(quotient)
 
@@ -114,15 +110,15 @@ class DivisionIntroGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: multi-step or with remainders."""
-        problem_type = random.choice(['multi_step', 'remainder'])
+        problem_type = self.rng.choice(['multi_step', 'remainder'])
 
         if problem_type == 'multi_step':
             # Two-step problem
-            divisor1 = random.randint(2, 4)
-            quotient1 = random.randint(3, 6)
+            divisor1 = self.rng.randint(2, 4)
+            quotient1 = self.rng.randint(3, 6)
             dividend1 = divisor1 * quotient1
 
-            divisor2 = random.randint(2, 3)
+            divisor2 = self.rng.randint(2, 3)
             quotient2 = quotient1 // divisor2
 
             contexts = [
@@ -130,7 +126,7 @@ class DivisionIntroGenerator:
                 f"A baker made {dividend1} cookies and packed them into {divisor1} boxes. Each box is then divided into {divisor2} smaller packages"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}. How many in each final group?}}"
             solution = str(quotient2)
 
@@ -142,9 +138,9 @@ class DivisionIntroGenerator:
             )
         else:
             # Simple remainder problem
-            divisor = random.randint(2, 5)
-            quotient = random.randint(3, 8)
-            remainder = random.randint(1, divisor - 1)
+            divisor = self.rng.randint(2, 5)
+            quotient = self.rng.randint(3, 8)
+            remainder = self.rng.randint(1, divisor - 1)
             dividend = divisor * quotient + remainder
 
             contexts = [
@@ -152,7 +148,7 @@ class DivisionIntroGenerator:
                 f"Share {dividend} objects among {divisor} groups"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}. How many in each group and how many left over?}}"
             solution = f"{quotient} R{remainder}"
 
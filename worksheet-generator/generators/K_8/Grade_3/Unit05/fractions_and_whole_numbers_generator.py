@@ -6,9 +6,6 @@ Example: 4/4 = 1, 6/3 = 2, representing whole numbers as fractions
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class FractionsAndWholeNumbersGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,10 +46,10 @@ class FractionsAndWholeNumbersGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: simple fractions equal to 1."""
-        denominator = random.choice([2, 3, 4])
+        denominator = self.rng.choice([2, 3, 4])
         numerator = denominator  # Makes it equal to 1
 
-        problem_type = random.choice(['fraction_to_whole', 'whole_to_fraction'])
+        problem_type = self.rng.choice(['fraction_to_whole', 'whole_to_fraction'])
 
         if problem_type == 'fraction_to_whole':
             latex = f"\\frac{{{numerator}}}{{{denominator}}} = \\text{{?}}"
@@ -73,11 +69,11 @@ class FractionsAndWholeNumbersGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: fractions equal to small whole numbers."""
-        whole = random.randint(2, 4)
-        denominator = random.choice([2, 3, 4, 5])
+        whole = self.rng.randint(2, 4)
+        denominator = self.rng.choice([2, 3, 4, 5])
         numerator = whole * denominator
 
-        problem_type = random.choice(['fraction_to_whole', 'whole_to_fraction'])
+        problem_type = self.rng.choice(['fraction_to_whole', 'whole_to_fraction'])
 
         if problem_type == 'fraction_to_whole':
             latex = f"\\frac{{{numerator}}}{{{denominator}}} = \\text{{?}}"
@@ -97,8 +93,8 @@ class FractionsAndWholeNumbersGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with fractions and whole numbers."""
-        whole = random.randint(2, 5)
-        denominator = random.choice([2, 3, 4, 6])
+        whole = self.rng.randint(2, 5)
+        denominator = self.rng.choice([2, 3, 4, 6])
         numerator = whole * denominator
 
         contexts = [
@@ -108,7 +104,7 @@ class FractionsAndWholeNumbersGenerator:
             f"Tom has {whole} whole apples. He cuts each into {denominator} pieces. Write the total pieces as a fraction."
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = f"\\frac{{{numerator}}}{{{denominator}}}"
 
@@ -121,12 +117,12 @@ class FractionsAndWholeNumbersGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: more complex relationships."""
-        whole = random.randint(3, 6)
-        denominator = random.choice([4, 6, 8])
+        whole = self.rng.randint(3, 6)
+        denominator = self.rng.choice([4, 6, 8])
         numerator = whole * denominator
 
         problem_types = ['mixed_problem', 'comparison']
-        problem_type = random.choice(problem_types)
+        problem_type = self.rng.choice(problem_types)
 
         if problem_type == 'mixed_problem':
             contexts = [
@@ -135,7 +131,7 @@ class FractionsAndWholeNumbersGenerator:
                 f"Express {whole} as a fraction with denominator {denominator}.",
                 f"A classroom has {whole} shelves with {denominator} books on each shelf. Write the total as a fraction."
             ]
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
 
             if "what whole number" in context:
                 solution = str(whole)
@@ -6,9 +6,6 @@ Example: 1/4 of 12 apples, finding parts of groups
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class FractionsInContextsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -51,11 +47,11 @@ class FractionsInContextsGenerator:
     def _generate_easy(self) -> Equation:
         """Generate easy problems: halves and fourths of small numbers."""
         denominators = [2, 4]
-        denominator = random.choice(denominators)
+        denominator = self.rng.choice(denominators)
 
         # Choose total that divides evenly
         multiples = {2: [2, 4, 6, 8, 10, 12], 4: [4, 8, 12, 16, 20]}
-        total = random.choice(multiples[denominator])
+        total = self.rng.choice(multiples[denominator])
         numerator = 1
 
         result = (numerator * total) // denominator
@@ -66,7 +62,7 @@ class FractionsInContextsGenerator:
             f"students",
             f"toys"
         ]
-        item = random.choice(contexts)
+        item = self.rng.choice(contexts)
 
         latex = f"\\text{{What is }} \\frac{{{numerator}}}{{{denominator}}} \\text{{ of {total} {item}?}}"
         solution = str(result)
@@ -81,12 +77,12 @@ class FractionsInContextsGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium problems: thirds, fifths, sixths of medium numbers."""
         denominators = [3, 5, 6]
-        denominator = random.choice(denominators)
+        denominator = self.rng.choice(denominators)
 
         # Choose total that divides evenly
         multiples = {3: [3, 6, 9, 12, 15, 18], 5: [5, 10, 15, 20, 25], 6: [6, 12, 18, 24]}
-        total = random.choice(multiples[denominator])
-        numerator = random.randint(1, denominator - 1)
+        total = self.rng.choice(multiples[denominator])
+        numerator = self.rng.randint(1, denominator - 1)
 
         result = (numerator * total) // denominator
 
@@ -96,7 +92,7 @@ class FractionsInContextsGenerator:
             f"A box has {total} crayons",
             f"A basket has {total} oranges"
         ]
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
 
         latex = f"\\text{{{context}. What is }} \\frac{{{numerator}}}{{{denominator}}} \\text{{ of them?}}"
         solution = str(result)
@@ -110,11 +106,11 @@ class FractionsInContextsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: more complex word problems."""
-        denominator = random.choice([2, 3, 4, 6])
+        denominator = self.rng.choice([2, 3, 4, 6])
         multiples = {2: [6, 8, 10, 12, 14, 16], 3: [9, 12, 15, 18, 21],
                     4: [8, 12, 16, 20, 24], 6: [12, 18, 24, 30]}
-        total = random.choice(multiples[denominator])
-        numerator = random.randint(1, denominator - 1)
+        total = self.rng.choice(multiples[denominator])
+        numerator = self.rng.randint(1, denominator - 1)
 
         result = (numerator * total) // denominator
 
@@ -125,7 +121,7 @@ class FractionsInContextsGenerator:
             f"A farmer has {total} chickens. \\frac{{{numerator}}}{{{denominator}}} are brown. How many brown chickens are there?"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(result)
 
@@ -138,11 +134,11 @@ class FractionsInContextsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: larger numbers and more complex fractions."""
-        denominator = random.choice([4, 6, 8, 10])
+        denominator = self.rng.choice([4, 6, 8, 10])
         multiples = {4: [16, 20, 24, 28, 32], 6: [18, 24, 30, 36],
                     8: [16, 24, 32, 40], 10: [20, 30, 40, 50]}
-        total = random.choice(multiples[denominator])
-        numerator = random.randint(1, denominator - 1)
+        total = self.rng.choice(multiples[denominator])
+        numerator = self.rng.randint(1, denominator - 1)
 
         result = (numerator * total) // denominator
 
@@ -153,7 +149,7 @@ class FractionsInContextsGenerator:
             f"A bakery made {total} muffins. \\frac{{{numerator}}}{{{denominator}}} have chocolate chips. How many muffins have chocolate chips?"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(result)
 
@@ -6,9 +6,6 @@ Example: What fraction is shaded? 1/2, 1/3, 1/4, etc.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class FractionsIntroGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -51,11 +47,11 @@ class FractionsIntroGenerator:
     def _generate_easy(self) -> Equation:
         """Generate easy problems: halves, thirds, fourths."""
         denominators = [2, 3, 4]
-        denominator = random.choice(denominators)
-        numerator = random.randint(1, denominator)
+        denominator = self.rng.choice(denominators)
+        numerator = self.rng.randint(1, denominator)
 
         if numerator == denominator:
-            numerator = random.randint(1, denominator - 1)  # Avoid whole numbers for now
+            numerator = self.rng.randint(1, denominator - 1)  # Avoid whole numbers for now
 
         fraction_names = {2: "halves", 3: "thirds", 4: "fourths"}
 
@@ -72,8 +68,8 @@ class FractionsIntroGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium problems: fifths, sixths, eighths."""
         denominators = [5, 6, 8]
-        denominator = random.choice(denominators)
-        numerator = random.randint(1, denominator - 1)
+        denominator = self.rng.choice(denominators)
+        numerator = self.rng.randint(1, denominator - 1)
 
         fraction_names = {5: "fifths", 6: "sixths", 8: "eighths"}
 
@@ -89,8 +85,8 @@ class FractionsIntroGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with visual fraction contexts."""
-        denominator = random.choice([2, 3, 4, 6, 8])
-        numerator = random.randint(1, denominator - 1)
+        denominator = self.rng.choice([2, 3, 4, 6, 8])
+        numerator = self.rng.randint(1, denominator - 1)
 
         contexts = [
             f"A pizza is cut into {denominator} equal slices. If you eat {numerator} slices, what fraction did you eat?",
@@ -99,7 +95,7 @@ class FractionsIntroGenerator:
             f"A ribbon is divided into {denominator} equal parts. You use {numerator} parts. What fraction did you use?"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = f"\\frac{{{numerator}}}{{{denominator}}}"
 
@@ -112,8 +108,8 @@ class FractionsIntroGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: more complex fractions and contexts."""
-        denominator = random.choice([6, 8, 10, 12])
-        numerator = random.randint(1, denominator - 1)
+        denominator = self.rng.choice([6, 8, 10, 12])
+        numerator = self.rng.randint(1, denominator - 1)
 
         contexts = [
             f"A class of {denominator} students goes on a field trip. {numerator} students bring lunch from home. What fraction brought lunch?",
@@ -122,7 +118,7 @@ class FractionsIntroGenerator:
             f"A parking lot has {denominator} spaces. {numerator} spaces are filled. What fraction of spaces are filled?"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = f"\\frac{{{numerator}}}{{{denominator}}}"
 
@@ -6,9 +6,6 @@ Example: Which is greater: 2/5 or 3/5?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class ComparingFractionsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,11 +46,11 @@ class ComparingFractionsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: thirds, fourths (not halves to ensure 2 different numerators)."""
-        denominator = random.choice([3, 4])  # Avoid 2 since it only has one numerator
+        denominator = self.rng.choice([3, 4])  # Avoid 2 since it only has one numerator
 
         # Generate two different numerators
         available = list(range(1, denominator))
-        num1, num2 = random.sample(available, 2)
+        num1, num2 = self.rng.sample(available, 2)
 
         latex = f"\\text{{Compare: }} \\frac{{{num1}}}{{{denominator}}} \\quad \\text{{and}} \\quad \\frac{{{num2}}}{{{denominator}}}"
 
@@ -74,11 +70,11 @@ class ComparingFractionsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: fifths, sixths, eighths."""
-        denominator = random.choice([5, 6, 8])
+        denominator = self.rng.choice([5, 6, 8])
 
         # Generate two different numerators
         available = list(range(1, denominator))
-        num1, num2 = random.sample(available, 2)
+        num1, num2 = self.rng.sample(available, 2)
 
         latex = f"\\text{{Compare: }} \\frac{{{num1}}}{{{denominator}}} \\quad \\text{{and}} \\quad \\frac{{{num2}}}{{{denominator}}}"
 
@@ -98,11 +94,11 @@ class ComparingFractionsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with fraction comparisons."""
-        denominator = random.choice([3, 4, 5, 6, 8])
+        denominator = self.rng.choice([3, 4, 5, 6, 8])
 
         # Generate two different numerators
         available = list(range(1, denominator))
-        num1, num2 = random.sample(available, 2)
+        num1, num2 = self.rng.sample(available, 2)
 
         contexts = [
             f"Sarah ate \\frac{{{num1}}}{{{denominator}}} of a pizza and Tom ate \\frac{{{num2}}}{{{denominator}}} of the same pizza. Who ate more?",
@@ -111,7 +107,7 @@ class ComparingFractionsGenerator:
             f"One book is \\frac{{{num1}}}{{{denominator}}} complete and another is \\frac{{{num2}}}{{{denominator}}} complete. Which book is more complete?"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
 
         if num1 > num2:
             if "Sarah" in context:
@@ -147,10 +143,10 @@ class ComparingFractionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: ordering multiple fractions."""
-        denominator = random.choice([6, 8, 10])
+        denominator = self.rng.choice([6, 8, 10])
 
         # Generate 3 different numerators
-        nums = random.sample(range(1, denominator), 3)
+        nums = self.rng.sample(range(1, denominator), 3)
 
         latex = f"\\text{{Order from least to greatest: }} \\frac{{{nums[0]}}}{{{denominator}}}, \\frac{{{nums[1]}}}{{{denominator}}}, \\frac{{{nums[2]}}}{{{denominator}}}"
 
@@ -6,9 +6,6 @@ Example: 1/2 of a large pizza vs 1/2 of a small pizza
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class ComparingFractionsOfDifferentWholesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,7 +46,7 @@ class ComparingFractionsOfDifferentWholesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: simple recognition that wholes must be same."""
-        fraction = random.choice(["\\frac{1}{2}", "\\frac{1}{4}", "\\frac{1}{3}"])
+        fraction = self.rng.choice(["\\frac{1}{2}", "\\frac{1}{4}", "\\frac{1}{3}"])
 
         contexts = [
             f"Can we compare {fraction} of a large pizza to {fraction} of a small pizza directly?",
@@ -59,7 +55,7 @@ class ComparingFractionsOfDifferentWholesGenerator:
             f"Can we say {fraction} of 8 cookies equals {fraction} of 4 cookies?"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = "No, the wholes are different"
 
@@ -72,7 +68,7 @@ class ComparingFractionsOfDifferentWholesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: identifying which situations can be compared."""
-        fraction = random.choice(["\\frac{1}{2}", "\\frac{1}{4}", "\\frac{2}{3}", "\\frac{3}{4}"])
+        fraction = self.rng.choice(["\\frac{1}{2}", "\\frac{1}{4}", "\\frac{2}{3}", "\\frac{3}{4}"])
 
         # Mix of same whole and different whole scenarios
         scenarios = [
@@ -98,7 +94,7 @@ class ComparingFractionsOfDifferentWholesGenerator:
             }
         ]
 
-        scenario = random.choice(scenarios)
+        scenario = self.rng.choice(scenarios)
         latex = f"\\text{{{scenario['text']}. Can these be compared directly?}}"
 
         if scenario['can_compare']:
@@ -115,14 +111,14 @@ class ComparingFractionsOfDifferentWholesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: actual comparison with same wholes."""
-        denominator = random.choice([2, 3, 4])
-        num1 = random.randint(1, denominator - 1)
-        num2 = random.randint(1, denominator - 1)
+        denominator = self.rng.choice([2, 3, 4])
+        num1 = self.rng.randint(1, denominator - 1)
+        num2 = self.rng.randint(1, denominator - 1)
 
         while num1 == num2:
-            num2 = random.randint(1, denominator - 1)
+            num2 = self.rng.randint(1, denominator - 1)
 
-        total = random.choice([8, 10, 12, 16, 20])
+        total = self.rng.choice([8, 10, 12, 16, 20])
 
         contexts = [
             f"Sarah has \\frac{{{num1}}}{{{denominator}}} of {total} marbles. Tom has \\frac{{{num2}}}{{{denominator}}} of {total} marbles. Who has more marbles?",
@@ -131,7 +127,7 @@ class ComparingFractionsOfDifferentWholesGenerator:
             f"Garden A planted \\frac{{{num1}}}{{{denominator}}} of {total} rows. Garden B planted \\frac{{{num2}}}{{{denominator}}} of {total} rows. Which garden planted more rows?"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
 
         if num1 > num2:
@@ -165,15 +161,15 @@ class ComparingFractionsOfDifferentWholesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: explain why comparison works or doesn't work."""
-        scenario_type = random.choice(['works', 'doesnt_work'])
+        scenario_type = self.rng.choice(['works', 'doesnt_work'])
 
         if scenario_type == 'works':
-            total = random.choice([12, 16, 20, 24])
-            denominator = random.choice([2, 3, 4])
-            num1 = random.randint(1, denominator - 1)
-            num2 = random.randint(1, denominator - 1)
+            total = self.rng.choice([12, 16, 20, 24])
+            denominator = self.rng.choice([2, 3, 4])
+            num1 = self.rng.randint(1, denominator - 1)
+            num2 = self.rng.randint(1, denominator - 1)
             while num1 == num2:
-                num2 = random.randint(1, denominator - 1)
+                num2 = self.rng.randint(1, denominator - 1)
 
             contexts = [
                 f"Two identical boxes each contain {total} pencils. Box A has \\frac{{{num1}}}{{{denominator}}} of its pencils sharpened. Box B has \\frac{{{num2}}}{{{denominator}}} sharpened. Can we compare these fractions? Explain.",
@@ -181,16 +177,16 @@ class ComparingFractionsOfDifferentWholesGenerator:
                 f"Two friends each have {total} cards. Friend A used \\frac{{{num1}}}{{{denominator}}} of their cards. Friend B used \\frac{{{num2}}}{{{denominator}}} of their cards. Can we compare these fractions? Explain."
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             solution = f"Yes, same wholes ({total} each)"
         else:
-            total1 = random.choice([12, 16, 20])
-            total2 = random.choice([8, 10, 15])
+            total1 = self.rng.choice([12, 16, 20])
+            total2 = self.rng.choice([8, 10, 15])
             while total1 == total2:
-                total2 = random.choice([8, 10, 15])
+                total2 = self.rng.choice([8, 10, 15])
 
-            denominator = random.choice([2, 3, 4])
-            numerator = random.randint(1, denominator - 1)
+            denominator = self.rng.choice([2, 3, 4])
+            numerator = self.rng.randint(1, denominator - 1)
 
             contexts = [
                 f"Box A has {total1} pencils with \\frac{{{numerator}}}{{{denominator}}} sharpened. Box B has {total2} pencils with \\frac{{{numerator}}}{{{denominator}}} sharpened. Can we compare these fractions directly? Explain.",
@@ -198,7 +194,7 @@ class ComparingFractionsOfDifferentWholesGenerator:
                 f"Friend A has {total1} cards and used \\frac{{{numerator}}}{{{denominator}}}. Friend B has {total2} cards and used \\frac{{{numerator}}}{{{denominator}}}. Can we compare these fractions directly? Explain."
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             solution = f"No, different wholes ({total1} vs {total2})"
 
         latex = f"\\text{{{context}}}"
@@ -6,9 +6,6 @@ Example: 1/2 = 2/4, finding equivalent fractions
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class EquivalentFractionsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -59,9 +55,9 @@ class EquivalentFractionsGenerator:
             (2, 4, 1, 2),  # 2/4 = 1/2
         ]
 
-        num1, den1, num2, den2 = random.choice(base_pairs)
+        num1, den1, num2, den2 = self.rng.choice(base_pairs)
 
-        problem_type = random.choice(['find_equivalent', 'are_equivalent'])
+        problem_type = self.rng.choice(['find_equivalent', 'are_equivalent'])
 
         if problem_type == 'find_equivalent':
             latex = f"\\frac{{{num1}}}{{{den1}}} = \\frac{{?}}{{{den2}}}"
@@ -83,13 +79,13 @@ class EquivalentFractionsGenerator:
         """Generate medium problems: more complex equivalent fractions."""
         # Generate equivalent fractions with multiplier
         base_fractions = [(1, 2), (1, 3), (2, 3), (1, 4), (3, 4), (2, 5), (3, 5)]
-        num1, den1 = random.choice(base_fractions)
+        num1, den1 = self.rng.choice(base_fractions)
 
-        multiplier = random.choice([2, 3, 4])
+        multiplier = self.rng.choice([2, 3, 4])
         num2 = num1 * multiplier
         den2 = den1 * multiplier
 
-        problem_type = random.choice(['find_numerator', 'find_denominator', 'verify'])
+        problem_type = self.rng.choice(['find_numerator', 'find_denominator', 'verify'])
 
         if problem_type == 'find_numerator':
             latex = f"\\frac{{{num1}}}{{{den1}}} = \\frac{{?}}{{{den2}}}"
@@ -114,9 +110,9 @@ class EquivalentFractionsGenerator:
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with equivalent fractions."""
         base_fractions = [(1, 2), (1, 3), (2, 3), (1, 4), (3, 4), (2, 5)]
-        num1, den1 = random.choice(base_fractions)
+        num1, den1 = self.rng.choice(base_fractions)
 
-        multiplier = random.choice([2, 3, 4])
+        multiplier = self.rng.choice([2, 3, 4])
         num2 = num1 * multiplier
         den2 = den1 * multiplier
 
@@ -127,7 +123,7 @@ class EquivalentFractionsGenerator:
             f"In a class, \\frac{{{num1}}}{{{den1}}} of students have pets. If this represents {num2} students with pets, how many students are in the class?"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
 
         if "how many students are in the class" in context:
             solution = str(den2)
@@ -150,11 +146,11 @@ class EquivalentFractionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: finding multiple equivalents or simplifying."""
-        problem_type = random.choice(['find_multiple', 'simplify', 'identify_all'])
+        problem_type = self.rng.choice(['find_multiple', 'simplify', 'identify_all'])
 
         if problem_type == 'find_multiple':
             base_fractions = [(1, 2), (1, 3), (1, 4), (2, 3)]
-            num1, den1 = random.choice(base_fractions)
+            num1, den1 = self.rng.choice(base_fractions)
 
             latex = f"\\text{{Give two equivalent fractions for }} \\frac{{{num1}}}{{{den1}}}"
 
@@ -169,9 +165,9 @@ class EquivalentFractionsGenerator:
         elif problem_type == 'simplify':
             # Create a fraction that can be simplified
             base_fractions = [(1, 2), (1, 3), (2, 3), (1, 4), (3, 4)]
-            num_simple, den_simple = random.choice(base_fractions)
+            num_simple, den_simple = self.rng.choice(base_fractions)
 
-            multiplier = random.choice([2, 3, 4])
+            multiplier = self.rng.choice([2, 3, 4])
             num_complex = num_simple * multiplier
             den_complex = den_simple * multiplier
 
@@ -181,7 +177,7 @@ class EquivalentFractionsGenerator:
 
         else:  # identify_all
             base_fractions = [(1, 2), (1, 3), (2, 4)]
-            num1, den1 = random.choice(base_fractions)
+            num1, den1 = self.rng.choice(base_fractions)
 
             # Generate some equivalent and non-equivalent fractions
             equiv_num = num1 * 2
@@ -6,9 +6,6 @@ Example: (2 × 3) × 4 = 2 × (3 × 4)
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class AssociativePropertyGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,16 +46,16 @@ class AssociativePropertyGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: small numbers, showing both groupings."""
-        a = random.randint(2, 4)
-        b = random.randint(2, 4)
-        c = random.randint(2, 4)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(2, 4)
+        c = self.rng.randint(2, 4)
 
         first_product = a * b
         second_product = b * c
         answer = a * b * c
 
         # Show the grouping calculation
-        problem_type = random.choice(['left_first', 'right_first'])
+        problem_type = self.rng.choice(['left_first', 'right_first'])
 
         if problem_type == 'left_first':
             latex = f"({a} \\times {b}) \\times {c}"
@@ -85,12 +81,12 @@ class AssociativePropertyGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: compare both groupings or fill in missing number."""
-        problem_type = random.choice(['compare', 'fill_blank'])
+        problem_type = self.rng.choice(['compare', 'fill_blank'])
 
         if problem_type == 'compare':
-            a = random.randint(2, 6)
-            b = random.randint(2, 6)
-            c = random.randint(2, 6)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(2, 6)
+            c = self.rng.randint(2, 6)
 
             first_product = a * b
             second_product = b * c
@@ -105,16 +101,16 @@ class AssociativePropertyGenerator:
             ]
 
         else:  # fill_blank
-            a = random.randint(2, 6)
-            b = random.randint(2, 6)
-            c = random.randint(2, 6)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(2, 6)
+            c = self.rng.randint(2, 6)
 
             first_product = a * b
             second_product = b * c
             answer = a * b * c
 
             # Ask for the missing result
-            side = random.choice(['left', 'right'])
+            side = self.rng.choice(['left', 'right'])
             if side == 'left':
                 latex = f"({a} \\times {b}) \\times {c} = \\text{{?}}"
                 steps = [
@@ -139,15 +135,15 @@ class AssociativePropertyGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: larger numbers and identifying easier grouping."""
-        a = random.randint(2, 8)
-        b = random.randint(2, 8)
-        c = random.randint(2, 8)
+        a = self.rng.randint(2, 8)
+        b = self.rng.randint(2, 8)
+        c = self.rng.randint(2, 8)
 
         first_product = a * b
         second_product = b * c
         answer = a * b * c
 
-        problem_type = random.choice(['choose_easier', 'complete_equation', 'word_problem'])
+        problem_type = self.rng.choice(['choose_easier', 'complete_equation', 'word_problem'])
 
         if problem_type == 'choose_easier':
             # Present both options and ask which is easier
@@ -188,7 +184,7 @@ class AssociativePropertyGenerator:
                 f"A garden has {a} sections. Each section has {b} rows, and each row has {c} plants. How many plants?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}}}"
             solution = str(answer)
             steps = [
@@ -205,14 +201,14 @@ class AssociativePropertyGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex applications with larger numbers."""
-        problem_type = random.choice(['strategic_grouping', 'missing_value', 'application'])
+        problem_type = self.rng.choice(['strategic_grouping', 'missing_value', 'application'])
 
         if problem_type == 'strategic_grouping':
             # Create a problem where one grouping is much easier
             # Use numbers like 5×2 = 10 or 4×25 = 100
             easy_pairs = [(5, 2), (2, 5), (4, 25), (25, 4), (10, 10), (5, 4), (4, 5)]
-            b, c = random.choice(easy_pairs)
-            a = random.randint(3, 9)
+            b, c = self.rng.choice(easy_pairs)
+            a = self.rng.randint(3, 9)
 
             first_product = a * b
             second_product = b * c
@@ -228,9 +224,9 @@ class AssociativePropertyGenerator:
             ]
 
         elif problem_type == 'missing_value':
-            a = random.randint(3, 9)
-            b = random.randint(3, 9)
-            c = random.randint(3, 9)
+            a = self.rng.randint(3, 9)
+            b = self.rng.randint(3, 9)
+            c = self.rng.randint(3, 9)
             answer = a * b * c
 
             # Give the final answer and ask for verification
@@ -246,9 +242,9 @@ class AssociativePropertyGenerator:
             ]
 
         else:  # application
-            a = random.randint(4, 10)
-            b = random.randint(4, 10)
-            c = random.randint(4, 10)
+            a = self.rng.randint(4, 10)
+            b = self.rng.randint(4, 10)
+            c = self.rng.randint(4, 10)
             answer = a * b * c
 
             contexts = [
@@ -258,7 +254,7 @@ class AssociativePropertyGenerator:
                 f"An orchard has {a} sections. Each section has {b} rows of trees, and each row has {c} trees. How many trees?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}}}"
             solution = str(answer)
 
@@ -6,9 +6,6 @@ Example: n × 4 = 20, ☐ ÷ 3 = 5
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class LettersAndSymbolsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -51,14 +47,14 @@ class LettersAndSymbolsGenerator:
     def _generate_easy(self) -> Equation:
         """Generate easy problems: simple multiplication with small numbers."""
         symbols = ['n', 'x', '\\square']
-        symbol = random.choice(symbols)
+        symbol = self.rng.choice(symbols)
 
         # Simple multiplication: n × a = b where a is 2-5 and n is 1-10
-        multiplier = random.randint(2, 5)
-        answer = random.randint(1, 10)
+        multiplier = self.rng.randint(2, 5)
+        answer = self.rng.randint(1, 10)
         product = answer * multiplier
 
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # n × multiplier = product
             latex = f"{symbol} \\times {multiplier} = {product}"
             steps = [
@@ -87,15 +83,15 @@ class LettersAndSymbolsGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium problems: multiplication and division with larger numbers."""
         symbols = ['n', 'x', '\\square']
-        symbol = random.choice(symbols)
+        symbol = self.rng.choice(symbols)
 
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # Multiplication: n × a = b
-            multiplier = random.randint(2, 10)
-            answer = random.randint(2, 12)
+            multiplier = self.rng.randint(2, 10)
+            answer = self.rng.randint(2, 12)
             product = answer * multiplier
 
-            if random.choice([True, False]):
+            if self.rng.choice([True, False]):
                 latex = f"{symbol} \\times {multiplier} = {product}"
             else:
                 latex = f"{multiplier} \\times {symbol} = {product}"
@@ -106,8 +102,8 @@ class LettersAndSymbolsGenerator:
             ]
         else:
             # Division: n ÷ a = b
-            divisor = random.randint(2, 10)
-            quotient = random.randint(2, 10)
+            divisor = self.rng.randint(2, 10)
+            quotient = self.rng.randint(2, 10)
             answer = divisor * quotient
 
             latex = f"{symbol} \\div {divisor} = {quotient}"
@@ -129,12 +125,12 @@ class LettersAndSymbolsGenerator:
     def _generate_hard(self) -> Equation:
         """Generate hard problems: division and word contexts."""
         symbols = ['n', 'x', '\\square']
-        symbol = random.choice(symbols)
+        symbol = self.rng.choice(symbols)
 
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # Division with variable in dividend
-            divisor = random.randint(3, 10)
-            quotient = random.randint(3, 12)
+            divisor = self.rng.randint(3, 10)
+            quotient = self.rng.randint(3, 12)
             answer = divisor * quotient
 
             contexts = [
@@ -144,7 +140,7 @@ class LettersAndSymbolsGenerator:
                 f"{answer} pencils are shared equally among {divisor} students. How many each?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}}}"
             solution = str(quotient)
             steps = [
@@ -153,8 +149,8 @@ class LettersAndSymbolsGenerator:
             ]
         else:
             # Multiplication with word context
-            multiplier = random.randint(3, 10)
-            answer = random.randint(3, 12)
+            multiplier = self.rng.randint(3, 10)
+            answer = self.rng.randint(3, 12)
             product = answer * multiplier
 
             contexts = [
@@ -164,7 +160,7 @@ class LettersAndSymbolsGenerator:
                 f"If {multiplier} students sit at each table and there are {product} students, how many tables?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}}}"
             solution = str(answer)
             steps = [
@@ -183,13 +179,13 @@ class LettersAndSymbolsGenerator:
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex word problems with larger numbers."""
         symbols = ['n', 'x', '\\square']
-        symbol = random.choice(symbols)
+        symbol = self.rng.choice(symbols)
 
-        problem_type = random.choice(['division_context', 'multiplication_context', 'missing_factor'])
+        problem_type = self.rng.choice(['division_context', 'multiplication_context', 'missing_factor'])
 
         if problem_type == 'division_context':
-            divisor = random.randint(5, 12)
-            quotient = random.randint(5, 15)
+            divisor = self.rng.randint(5, 12)
+            quotient = self.rng.randint(5, 15)
             answer = divisor * quotient
 
             contexts = [
@@ -199,7 +195,7 @@ class LettersAndSymbolsGenerator:
                 f"A recipe needs {answer} cups of flour. If each batch uses {divisor} cups, how many batches can you make?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}}}"
             solution = str(quotient)
             steps = [
@@ -208,8 +204,8 @@ class LettersAndSymbolsGenerator:
             ]
 
         elif problem_type == 'multiplication_context':
-            multiplier = random.randint(6, 12)
-            answer = random.randint(4, 15)
+            multiplier = self.rng.randint(6, 12)
+            answer = self.rng.randint(4, 15)
             product = answer * multiplier
 
             contexts = [
@@ -219,7 +215,7 @@ class LettersAndSymbolsGenerator:
                 f"Each student needs {multiplier} pencils. If {product} pencils are needed total, how many students?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}}}"
             solution = str(answer)
             steps = [
@@ -230,8 +226,8 @@ class LettersAndSymbolsGenerator:
 
         else:  # missing_factor
             # More complex: a × n = b where both a and b are larger
-            multiplier = random.randint(7, 12)
-            answer = random.randint(6, 12)
+            multiplier = self.rng.randint(7, 12)
+            answer = self.rng.randint(6, 12)
             product = answer * multiplier
 
             latex = f"{multiplier} \\times {symbol} = {product}"
@@ -6,9 +6,6 @@ Example: "If 6 boxes each contain 8 pencils, how many pencils total?"
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class MultiplicationDivisionWordProblemsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class MultiplicationDivisionWordProblemsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: simple multiplication word problems with small numbers."""
-        num1 = random.randint(2, 5)
-        num2 = random.randint(2, 5)
+        num1 = self.rng.randint(2, 5)
+        num2 = self.rng.randint(2, 5)
         answer = num1 * num2
 
         contexts = [
@@ -61,7 +57,7 @@ class MultiplicationDivisionWordProblemsGenerator:
             (f"There are {num1} boxes with {num2} crayons in each box. How many crayons total?", f"{num1} \\times {num2}")
         ]
 
-        context, equation = random.choice(contexts)
+        context, equation = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(answer)
 
@@ -78,11 +74,11 @@ class MultiplicationDivisionWordProblemsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: multiplication and simple division."""
-        problem_type = random.choice(['multiplication', 'division'])
+        problem_type = self.rng.choice(['multiplication', 'division'])
 
         if problem_type == 'multiplication':
-            num1 = random.randint(3, 10)
-            num2 = random.randint(3, 10)
+            num1 = self.rng.randint(3, 10)
+            num2 = self.rng.randint(3, 10)
             answer = num1 * num2
 
             contexts = [
@@ -92,12 +88,12 @@ class MultiplicationDivisionWordProblemsGenerator:
                 (f"Each box contains {num2} markers. If there are {num1} boxes, how many markers?", f"{num1} \\times {num2}")
             ]
 
-            context, equation = random.choice(contexts)
+            context, equation = self.rng.choice(contexts)
             steps = [f"{equation} = {answer}"]
 
         else:  # division
-            divisor = random.randint(3, 10)
-            quotient = random.randint(2, 10)
+            divisor = self.rng.randint(3, 10)
+            quotient = self.rng.randint(2, 10)
             dividend = divisor * quotient
             answer = quotient
 
@@ -108,7 +104,7 @@ class MultiplicationDivisionWordProblemsGenerator:
                 (f"There are {dividend} apples packed into {divisor} bags equally. How many per bag?", f"{dividend} \\div {divisor}")
             ]
 
-            context, equation = random.choice(contexts)
+            context, equation = self.rng.choice(contexts)
             steps = [f"{equation} = {answer}"]
 
         latex = f"\\text{{{context}}}"
@@ -123,11 +119,11 @@ class MultiplicationDivisionWordProblemsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: more complex word problems."""
-        problem_type = random.choice(['multiplication', 'division', 'mixed'])
+        problem_type = self.rng.choice(['multiplication', 'division', 'mixed'])
 
         if problem_type == 'multiplication':
-            num1 = random.randint(5, 12)
-            num2 = random.randint(5, 12)
+            num1 = self.rng.randint(5, 12)
+            num2 = self.rng.randint(5, 12)
             answer = num1 * num2
 
             contexts = [
@@ -137,12 +133,12 @@ class MultiplicationDivisionWordProblemsGenerator:
                 f"A baker makes {num1} trays of cookies. Each tray has {num2} cookies. How many cookies total?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [f"{num1} \\times {num2} = {answer}"]
 
         elif problem_type == 'division':
-            divisor = random.randint(5, 12)
-            quotient = random.randint(4, 12)
+            divisor = self.rng.randint(5, 12)
+            quotient = self.rng.randint(4, 12)
             dividend = divisor * quotient
             answer = quotient
 
@@ -153,12 +149,12 @@ class MultiplicationDivisionWordProblemsGenerator:
                 f"If {dividend} chairs are arranged into {divisor} equal rows, how many chairs per row?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [f"{dividend} \\div {divisor} = {answer}"]
 
         else:  # mixed - find missing factor
-            factor1 = random.randint(5, 12)
-            answer = random.randint(4, 12)
+            factor1 = self.rng.randint(5, 12)
+            answer = self.rng.randint(4, 12)
             product = factor1 * answer
 
             contexts = [
@@ -168,7 +164,7 @@ class MultiplicationDivisionWordProblemsGenerator:
                 f"Each box has {factor1} pencils. If there are {product} pencils total, how many boxes?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"{product} \\div {factor1} = {answer}",
                 f"\\text{{Or: }} {factor1} \\times {answer} = {product}"
@@ -186,13 +182,13 @@ class MultiplicationDivisionWordProblemsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex multi-step thinking."""
-        problem_type = random.choice(['comparison', 'two_operations', 'finding_factor'])
+        problem_type = self.rng.choice(['comparison', 'two_operations', 'finding_factor'])
 
         if problem_type == 'comparison':
-            num1 = random.randint(4, 8)
-            num2 = random.randint(5, 10)
+            num1 = self.rng.randint(4, 8)
+            num2 = self.rng.randint(5, 10)
             answer1 = num1 * num2
-            answer2 = answer1 + random.randint(5, 15)
+            answer2 = answer1 + self.rng.randint(5, 15)
             answer = answer2 - answer1
 
             contexts = [
@@ -202,7 +198,7 @@ class MultiplicationDivisionWordProblemsGenerator:
                 f"Sarah read {num1} pages each day for {num2} days. Tom read {answer2} pages total. How many more pages did Tom read?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"\\text{{First group: }} {num1} \\times {num2} = {answer1}",
                 f"\\text{{Difference: }} {answer2} - {answer1} = {answer}"
@@ -210,10 +206,10 @@ class MultiplicationDivisionWordProblemsGenerator:
 
         elif problem_type == 'two_operations':
             # Total divided by groups
-            items_per = random.randint(4, 8)
-            groups = random.randint(5, 10)
+            items_per = self.rng.randint(4, 8)
+            groups = self.rng.randint(5, 10)
             total = items_per * groups
-            new_groups = random.randint(3, 6)
+            new_groups = self.rng.randint(3, 6)
 
             if new_groups < groups:
                 answer = total // new_groups
@@ -225,7 +221,7 @@ class MultiplicationDivisionWordProblemsGenerator:
                     f"A store has {groups} shelves with {items_per} items on each. If they use {new_groups} shelves instead, how many items per shelf?"
                 ]
 
-                context = random.choice(contexts)
+                context = self.rng.choice(contexts)
                 steps = [
                     f"\\text{{Total items: }} {groups} \\times {items_per} = {total}",
                     f"\\text{{New groups: }} {total} \\div {new_groups} = {answer}"
@@ -238,15 +234,15 @@ class MultiplicationDivisionWordProblemsGenerator:
                     f"There are {groups} bags with {items_per} candies each. If shared equally between 2 friends, how many candies does each get?",
                     f"A baker makes {groups} trays with {items_per} muffins each. If divided equally into 2 boxes, how many per box?"
                 ]
-                context = random.choice(contexts)
+                context = self.rng.choice(contexts)
                 steps = [
                     f"\\text{{Total: }} {groups} \\times {items_per} = {total}",
                     f"\\text{{Each person: }} {total} \\div 2 = {answer}"
                 ]
 
         else:  # finding_factor
-            factor1 = random.randint(6, 12)
-            answer = random.randint(7, 15)
+            factor1 = self.rng.randint(6, 12)
+            answer = self.rng.randint(7, 15)
             product = factor1 * answer
 
             contexts = [
@@ -256,7 +252,7 @@ class MultiplicationDivisionWordProblemsGenerator:
                 f"A classroom has {product} desks arranged in {factor1} equal columns. How many desks per column?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"{product} \\div {factor1} = {answer}",
                 f"\\text{{Check: }} {factor1} \\times {answer} = {product}"
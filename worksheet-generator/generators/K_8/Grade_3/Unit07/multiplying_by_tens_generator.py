@@ -6,9 +6,6 @@ Example: 7 × 10 = 70, 7 × 20 = 140
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class MultiplyingByTensGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,7 +46,7 @@ class MultiplyingByTensGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: multiply single digit by 10."""
-        num = random.randint(1, 9)
+        num = self.rng.randint(1, 9)
         answer = num * 10
 
         latex = f"{num} \\times 10"
@@ -70,8 +66,8 @@ class MultiplyingByTensGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: multiply by 20, 30, 40, etc."""
-        num = random.randint(2, 9)
-        tens_multiplier = random.randint(2, 9)
+        num = self.rng.randint(2, 9)
+        tens_multiplier = self.rng.randint(2, 9)
         tens_value = tens_multiplier * 10
 
         answer = num * tens_value
@@ -96,11 +92,11 @@ class MultiplyingByTensGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: two-digit × tens or word problems."""
-        problem_type = random.choice(['two_digit', 'word_problem', 'pattern'])
+        problem_type = self.rng.choice(['two_digit', 'word_problem', 'pattern'])
 
         if problem_type == 'two_digit':
-            num = random.randint(10, 20)
-            tens_multiplier = random.randint(2, 9)
+            num = self.rng.randint(10, 20)
+            tens_multiplier = self.rng.randint(2, 9)
             tens_value = tens_multiplier * 10
 
             answer = num * tens_value
@@ -117,8 +113,8 @@ class MultiplyingByTensGenerator:
             ]
 
         elif problem_type == 'word_problem':
-            num = random.randint(3, 9)
-            tens_multiplier = random.randint(2, 9)
+            num = self.rng.randint(3, 9)
+            tens_multiplier = self.rng.randint(2, 9)
             tens_value = tens_multiplier * 10
             answer = num * tens_value
 
@@ -129,7 +125,7 @@ class MultiplyingByTensGenerator:
                 f"A school has {num} classrooms. Each classroom has {tens_value} crayons. How many crayons total?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}}}"
             solution = str(answer)
 
@@ -141,7 +137,7 @@ class MultiplyingByTensGenerator:
             ]
 
         else:  # pattern
-            num = random.randint(3, 9)
+            num = self.rng.randint(3, 9)
             answer1 = num
             answer2 = num * 10
             answer3 = num * 100
@@ -164,11 +160,11 @@ class MultiplyingByTensGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex applications and larger numbers."""
-        problem_type = random.choice(['hundreds', 'comparison', 'application', 'missing_factor'])
+        problem_type = self.rng.choice(['hundreds', 'comparison', 'application', 'missing_factor'])
 
         if problem_type == 'hundreds':
-            num = random.randint(2, 9)
-            hundreds_multiplier = random.randint(1, 9)
+            num = self.rng.randint(2, 9)
+            hundreds_multiplier = self.rng.randint(1, 9)
             hundreds_value = hundreds_multiplier * 100
 
             answer = num * hundreds_value
@@ -185,8 +181,8 @@ class MultiplyingByTensGenerator:
             ]
 
         elif problem_type == 'comparison':
-            num = random.randint(4, 9)
-            tens_multiplier = random.randint(3, 7)
+            num = self.rng.randint(4, 9)
+            tens_multiplier = self.rng.randint(3, 7)
             tens_value = tens_multiplier * 10
 
             answer1 = num * tens_multiplier
@@ -203,8 +199,8 @@ class MultiplyingByTensGenerator:
             ]
 
         elif problem_type == 'application':
-            num = random.randint(5, 12)
-            tens_multiplier = random.randint(3, 9)
+            num = self.rng.randint(5, 12)
+            tens_multiplier = self.rng.randint(3, 9)
             tens_value = tens_multiplier * 10
             answer = num * tens_value
 
@@ -215,7 +211,7 @@ class MultiplyingByTensGenerator:
                 f"A store sells {num} cases of water. Each case has {tens_value} bottles. How many bottles total?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}}}"
             solution = str(answer)
 
@@ -229,8 +225,8 @@ class MultiplyingByTensGenerator:
 
         else:  # missing_factor
             # Given product and one factor (a multiple of 10), find other factor
-            num = random.randint(3, 9)
-            tens_multiplier = random.randint(2, 9)
+            num = self.rng.randint(3, 9)
+            tens_multiplier = self.rng.randint(2, 9)
             tens_value = tens_multiplier * 10
             product = num * tens_value
 
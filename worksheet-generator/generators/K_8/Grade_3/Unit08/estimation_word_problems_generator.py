@@ -6,9 +6,6 @@ Example: "About how many apples in 4 bags of 29 apples each?"
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class EstimationWordProblemsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -58,14 +54,14 @@ class EstimationWordProblemsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: simple addition or subtraction estimation."""
-        operation = random.choice(['addition', 'subtraction'])
+        operation = self.rng.choice(['addition', 'subtraction'])
 
         if operation == 'addition':
             # Round numbers close to tens
-            num1_base = random.randint(2, 8) * 10
-            num2_base = random.randint(2, 8) * 10
-            num1 = num1_base + random.choice([-2, -1, 1, 2])
-            num2 = num2_base + random.choice([-2, -1, 1, 2])
+            num1_base = self.rng.randint(2, 8) * 10
+            num2_base = self.rng.randint(2, 8) * 10
+            num1 = num1_base + self.rng.choice([-2, -1, 1, 2])
+            num2 = num2_base + self.rng.choice([-2, -1, 1, 2])
 
             rounded1 = self._round_to_nearest_ten(num1)
             rounded2 = self._round_to_nearest_ten(num2)
@@ -78,7 +74,7 @@ class EstimationWordProblemsGenerator:
                 f"There are about {num1} students in one grade and {num2} in another. About how many students total?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"\\text{{Round }} {num1} \\text{{ to }} {rounded1}",
                 f"\\text{{Round }} {num2} \\text{{ to }} {rounded2}",
@@ -86,10 +82,10 @@ class EstimationWordProblemsGenerator:
             ]
 
         else:  # subtraction
-            num1_base = random.randint(5, 9) * 10
-            num2_base = random.randint(2, num1_base // 10 - 1) * 10
-            num1 = num1_base + random.choice([-2, -1, 1, 2])
-            num2 = num2_base + random.choice([-2, -1, 1, 2])
+            num1_base = self.rng.randint(5, 9) * 10
+            num2_base = self.rng.randint(2, num1_base // 10 - 1) * 10
+            num1 = num1_base + self.rng.choice([-2, -1, 1, 2])
+            num2 = num2_base + self.rng.choice([-2, -1, 1, 2])
 
             rounded1 = self._round_to_nearest_ten(num1)
             rounded2 = self._round_to_nearest_ten(num2)
@@ -102,7 +98,7 @@ class EstimationWordProblemsGenerator:
                 f"A library has {num1} books. If {num2} are checked out, about how many remain?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"\\text{{Round }} {num1} \\text{{ to }} {rounded1}",
                 f"\\text{{Round }} {num2} \\text{{ to }} {rounded2}",
@@ -122,9 +118,9 @@ class EstimationWordProblemsGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium problems: multiplication estimation."""
         # Multiply a small number by a number close to a ten
-        multiplier = random.randint(3, 9)
-        base = random.randint(3, 9) * 10
-        num = base + random.choice([-3, -2, -1, 1, 2, 3])
+        multiplier = self.rng.randint(3, 9)
+        base = self.rng.randint(3, 9) * 10
+        num = base + self.rng.choice([-3, -2, -1, 1, 2, 3])
 
         rounded_num = self._round_to_nearest_ten(num)
         estimate = multiplier * rounded_num
@@ -136,7 +132,7 @@ class EstimationWordProblemsGenerator:
             f"Each shelf has about {num} books. If there are {multiplier} shelves, about how many books total?"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(estimate)
 
@@ -154,12 +150,12 @@ class EstimationWordProblemsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: larger numbers or division estimation."""
-        problem_type = random.choice(['large_multiplication', 'division', 'two_step'])
+        problem_type = self.rng.choice(['large_multiplication', 'division', 'two_step'])
 
         if problem_type == 'large_multiplication':
             # Multiply two numbers that round to tens or hundreds
-            num1 = random.randint(15, 45)
-            num2 = random.randint(15, 45)
+            num1 = self.rng.randint(15, 45)
+            num2 = self.rng.randint(15, 45)
 
             rounded1 = self._round_to_nearest_ten(num1)
             rounded2 = self._round_to_nearest_ten(num2)
@@ -172,7 +168,7 @@ class EstimationWordProblemsGenerator:
                 f"Each box weighs about {num1} pounds. If there are {num2} boxes, about how many pounds total?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"\\text{{Round }} {num1} \\text{{ to }} {rounded1}",
                 f"\\text{{Round }} {num2} \\text{{ to }} {rounded2}",
@@ -181,9 +177,9 @@ class EstimationWordProblemsGenerator:
 
         elif problem_type == 'division':
             # Division estimation
-            divisor = random.randint(4, 9)
-            quotient_base = random.randint(8, 20)
-            dividend = divisor * quotient_base + random.randint(-3, 3)
+            divisor = self.rng.randint(4, 9)
+            quotient_base = self.rng.randint(8, 20)
+            dividend = divisor * quotient_base + self.rng.randint(-3, 3)
 
             rounded_dividend = self._round_to_nearest_ten(dividend)
             estimate = rounded_dividend // divisor
@@ -195,7 +191,7 @@ class EstimationWordProblemsGenerator:
                 f"If {dividend} cookies are shared equally among {divisor} people, about how many each?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"\\text{{Round }} {dividend} \\text{{ to }} {rounded_dividend}",
                 f"{rounded_dividend} \\div {divisor} \\approx {estimate}"
@@ -203,9 +199,9 @@ class EstimationWordProblemsGenerator:
 
         else:  # two_step
             # Two-step estimation
-            num1 = random.randint(25, 55)
-            num2 = random.randint(25, 55)
-            multiplier = random.randint(2, 5)
+            num1 = self.rng.randint(25, 55)
+            num2 = self.rng.randint(25, 55)
+            multiplier = self.rng.randint(2, 5)
 
             rounded1 = self._round_to_nearest_ten(num1)
             rounded2 = self._round_to_nearest_ten(num2)
@@ -219,7 +215,7 @@ class EstimationWordProblemsGenerator:
                 f"Monday had {num1} visitors and Tuesday had {num2} visitors. If this pattern continues for {multiplier} weeks, about how many visitors?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"\\text{{Round }} {num1} \\text{{ to }} {rounded1}",
                 f"\\text{{Round }} {num2} \\text{{ to }} {rounded2}",
@@ -239,17 +235,17 @@ class EstimationWordProblemsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex estimation with reasoning."""
-        problem_type = random.choice(['hundreds', 'complex_two_step', 'comparison'])
+        problem_type = self.rng.choice(['hundreds', 'complex_two_step', 'comparison'])
 
         if problem_type == 'hundreds':
             # Work with hundreds
-            num1 = random.randint(150, 450)
-            num2 = random.randint(150, 450)
+            num1 = self.rng.randint(150, 450)
+            num2 = self.rng.randint(150, 450)
 
             rounded1 = self._round_to_nearest_hundred(num1)
             rounded2 = self._round_to_nearest_hundred(num2)
 
-            operation = random.choice(['add', 'subtract'])
+            operation = self.rng.choice(['add', 'subtract'])
             if operation == 'add':
                 estimate = rounded1 + rounded2
 
@@ -260,7 +256,7 @@ class EstimationWordProblemsGenerator:
                     f"A town has {num1} houses on the north side and {num2} on the south side. About how many houses total?"
                 ]
 
-                context = random.choice(contexts)
+                context = self.rng.choice(contexts)
                 steps = [
                     f"\\text{{Round }} {num1} \\text{{ to }} {rounded1}",
                     f"\\text{{Round }} {num2} \\text{{ to }} {rounded2}",
@@ -280,7 +276,7 @@ class EstimationWordProblemsGenerator:
                     f"A farmer has {num1} plants. After harvesting {num2}, about how many remain?"
                 ]
 
-                context = random.choice(contexts)
+                context = self.rng.choice(contexts)
                 steps = [
                     f"\\text{{Round }} {num1} \\text{{ to }} {rounded1}",
                     f"\\text{{Round }} {num2} \\text{{ to }} {rounded2}",
@@ -289,9 +285,9 @@ class EstimationWordProblemsGenerator:
 
         elif problem_type == 'complex_two_step':
             # Complex two-step with larger numbers
-            items_per = random.randint(35, 75)
-            groups = random.randint(8, 15)
-            additional = random.randint(25, 55)
+            items_per = self.rng.randint(35, 75)
+            groups = self.rng.randint(8, 15)
+            additional = self.rng.randint(25, 55)
 
             rounded_items = self._round_to_nearest_ten(items_per)
             rounded_groups = self._round_to_nearest_ten(groups)
@@ -307,7 +303,7 @@ class EstimationWordProblemsGenerator:
                 f"A school has {groups} classrooms with about {items_per} books in each, plus {additional} books in the library. About how many books?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"\\text{{Round }} {items_per} \\text{{ to }} {rounded_items}",
                 f"\\text{{Round }} {groups} \\text{{ to }} {rounded_groups}",
@@ -318,10 +314,10 @@ class EstimationWordProblemsGenerator:
 
         else:  # comparison
             # Compare two products
-            a1 = random.randint(15, 45)
-            b1 = random.randint(15, 45)
-            a2 = random.randint(15, 45)
-            b2 = random.randint(15, 45)
+            a1 = self.rng.randint(15, 45)
+            b1 = self.rng.randint(15, 45)
+            a2 = self.rng.randint(15, 45)
+            b2 = self.rng.randint(15, 45)
 
             rounded_a1 = self._round_to_nearest_ten(a1)
             rounded_b1 = self._round_to_nearest_ten(b1)
@@ -339,7 +335,7 @@ class EstimationWordProblemsGenerator:
                 f"Book A has {a1} pages per chapter for {b1} chapters. Book B has {a2} pages per chapter for {b2} chapters. About how many more pages in one book?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"\\text{{Store/Item 1: }} {rounded_a1} \\times {rounded_b1} = {product1}",
                 f"\\text{{Store/Item 2: }} {rounded_a2} \\times {rounded_b2} = {product2}",
@@ -6,9 +6,6 @@ Example: One-step: "24 cookies shared among 6 friends", Two-step: "5 bags of 8 a
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class OneAndTwoStepWordProblemsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,11 +46,11 @@ class OneAndTwoStepWordProblemsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: simple one-step problems."""
-        operation = random.choice(['addition', 'subtraction', 'multiplication', 'division'])
+        operation = self.rng.choice(['addition', 'subtraction', 'multiplication', 'division'])
 
         if operation == 'addition':
-            num1 = random.randint(10, 50)
-            num2 = random.randint(10, 50)
+            num1 = self.rng.randint(10, 50)
+            num2 = self.rng.randint(10, 50)
             answer = num1 + num2
 
             contexts = [
@@ -64,12 +60,12 @@ class OneAndTwoStepWordProblemsGenerator:
                 f"A library has {num1} fiction books and {num2} non-fiction books. How many books total?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [f"{num1} + {num2} = {answer}"]
 
         elif operation == 'subtraction':
-            num1 = random.randint(20, 60)
-            num2 = random.randint(10, num1 - 5)
+            num1 = self.rng.randint(20, 60)
+            num2 = self.rng.randint(10, num1 - 5)
             answer = num1 - num2
 
             contexts = [
@@ -79,12 +75,12 @@ class OneAndTwoStepWordProblemsGenerator:
                 f"A store has {num1} toys. If {num2} are sold, how many are left?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [f"{num1} - {num2} = {answer}"]
 
         elif operation == 'multiplication':
-            num1 = random.randint(3, 8)
-            num2 = random.randint(3, 8)
+            num1 = self.rng.randint(3, 8)
+            num2 = self.rng.randint(3, 8)
             answer = num1 * num2
 
             contexts = [
@@ -94,12 +90,12 @@ class OneAndTwoStepWordProblemsGenerator:
                 f"Each shelf has {num2} books. If there are {num1} shelves, how many books total?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [f"{num1} \\times {num2} = {answer}"]
 
         else:  # division
-            divisor = random.randint(3, 8)
-            quotient = random.randint(3, 10)
+            divisor = self.rng.randint(3, 8)
+            quotient = self.rng.randint(3, 10)
             dividend = divisor * quotient
             answer = quotient
 
@@ -110,7 +106,7 @@ class OneAndTwoStepWordProblemsGenerator:
                 f"There are {dividend} apples packed equally into {divisor} bags. How many per bag?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [f"{dividend} \\div {divisor} = {answer}"]
 
         latex = f"\\text{{{context}}}"
@@ -125,15 +121,15 @@ class OneAndTwoStepWordProblemsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: mix of one-step and simple two-step problems."""
-        problem_type = random.choice(['one_step_harder', 'two_step_add_mult', 'two_step_mult_add'])
+        problem_type = self.rng.choice(['one_step_harder', 'two_step_add_mult', 'two_step_mult_add'])
 
         if problem_type == 'one_step_harder':
             # Harder one-step with larger numbers
-            operation = random.choice(['multiplication', 'division'])
+            operation = self.rng.choice(['multiplication', 'division'])
 
             if operation == 'multiplication':
-                num1 = random.randint(5, 12)
-                num2 = random.randint(5, 12)
+                num1 = self.rng.randint(5, 12)
+                num2 = self.rng.randint(5, 12)
                 answer = num1 * num2
 
                 contexts = [
@@ -143,12 +139,12 @@ class OneAndTwoStepWordProblemsGenerator:
                     f"Each basket has {num2} oranges. If there are {num1} baskets, how many oranges?"
                 ]
 
-                context = random.choice(contexts)
+                context = self.rng.choice(contexts)
                 steps = [f"{num1} \\times {num2} = {answer}"]
 
             else:  # division
-                divisor = random.randint(5, 12)
-                quotient = random.randint(5, 12)
+                divisor = self.rng.randint(5, 12)
+                quotient = self.rng.randint(5, 12)
                 dividend = divisor * quotient
                 answer = quotient
 
@@ -159,14 +155,14 @@ class OneAndTwoStepWordProblemsGenerator:
                     f"A baker has {dividend} cookies to pack into {divisor} equal boxes. How many per box?"
                 ]
 
-                context = random.choice(contexts)
+                context = self.rng.choice(contexts)
                 steps = [f"{dividend} \\div {divisor} = {answer}"]
 
         elif problem_type == 'two_step_add_mult':
             # Multiply then add
-            num_groups = random.randint(3, 8)
-            per_group = random.randint(4, 9)
-            additional = random.randint(5, 15)
+            num_groups = self.rng.randint(3, 8)
+            per_group = self.rng.randint(4, 9)
+            additional = self.rng.randint(5, 15)
 
             product = num_groups * per_group
             answer = product + additional
@@ -178,7 +174,7 @@ class OneAndTwoStepWordProblemsGenerator:
                 f"There are {num_groups} bags with {per_group} marbles each, plus {additional} loose marbles. How many marbles?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"\\text{{Step 1: }} {num_groups} \\times {per_group} = {product}",
                 f"\\text{{Step 2: }} {product} + {additional} = {answer}"
@@ -186,9 +182,9 @@ class OneAndTwoStepWordProblemsGenerator:
 
         else:  # two_step_mult_add
             # Add then multiply
-            num1 = random.randint(3, 8)
-            num2 = random.randint(3, 8)
-            multiplier = random.randint(2, 5)
+            num1 = self.rng.randint(3, 8)
+            num2 = self.rng.randint(3, 8)
+            multiplier = self.rng.randint(2, 5)
 
             sum_val = num1 + num2
             answer = sum_val * multiplier
@@ -200,7 +196,7 @@ class OneAndTwoStepWordProblemsGenerator:
                 f"Team A has {num1} players and Team B has {num2} players. If there are {multiplier} games, how many total player-games?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"\\text{{Step 1: }} {num1} + {num2} = {sum_val}",
                 f"\\text{{Step 2: }} {sum_val} \\times {multiplier} = {answer}"
@@ -218,13 +214,13 @@ class OneAndTwoStepWordProblemsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: two-step problems with all operations."""
-        problem_type = random.choice(['mult_subtract', 'div_add', 'mult_div', 'comparison'])
+        problem_type = self.rng.choice(['mult_subtract', 'div_add', 'mult_div', 'comparison'])
 
         if problem_type == 'mult_subtract':
             # Multiply then subtract
-            groups = random.randint(5, 10)
-            per_group = random.randint(5, 10)
-            subtract = random.randint(10, 30)
+            groups = self.rng.randint(5, 10)
+            per_group = self.rng.randint(5, 10)
+            subtract = self.rng.randint(10, 30)
 
             product = groups * per_group
             answer = product - subtract
@@ -236,7 +232,7 @@ class OneAndTwoStepWordProblemsGenerator:
                 f"A garden has {groups} rows with {per_group} plants each. If {subtract} plants die, how many are left?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"\\text{{Step 1: }} {groups} \\times {per_group} = {product}",
                 f"\\text{{Step 2: }} {product} - {subtract} = {answer}"
@@ -244,10 +240,10 @@ class OneAndTwoStepWordProblemsGenerator:
 
         elif problem_type == 'div_add':
             # Divide then add
-            divisor = random.randint(4, 8)
-            quotient = random.randint(5, 12)
+            divisor = self.rng.randint(4, 8)
+            quotient = self.rng.randint(5, 12)
             dividend = divisor * quotient
-            additional = random.randint(5, 20)
+            additional = self.rng.randint(5, 20)
             answer = quotient + additional
 
             contexts = [
@@ -257,7 +253,7 @@ class OneAndTwoStepWordProblemsGenerator:
                 f"A group of {divisor} people share {dividend} dollars equally, then each person gets ${additional} more. How much does each have?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"\\text{{Step 1: }} {dividend} \\div {divisor} = {quotient}",
                 f"\\text{{Step 2: }} {quotient} + {additional} = {answer}"
@@ -265,9 +261,9 @@ class OneAndTwoStepWordProblemsGenerator:
 
         elif problem_type == 'mult_div':
             # Multiply then divide
-            num1 = random.randint(4, 8)
-            num2 = random.randint(4, 8)
-            divisor = random.randint(2, 4)
+            num1 = self.rng.randint(4, 8)
+            num2 = self.rng.randint(4, 8)
+            divisor = self.rng.randint(2, 4)
 
             product = num1 * num2
             # Make sure it divides evenly
@@ -281,17 +277,17 @@ class OneAndTwoStepWordProblemsGenerator:
                 f"A teacher has {num1} groups of {num2} students each. If rearranged into {divisor} equal classes, how many per class?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"\\text{{Step 1: }} {num1} \\times {num2} = {product}",
                 f"\\text{{Step 2: }} {product} \\div {divisor} = {answer}"
             ]
 
         else:  # comparison
-            groups1 = random.randint(4, 8)
-            per_group1 = random.randint(5, 10)
-            groups2 = random.randint(4, 8)
-            per_group2 = random.randint(5, 10)
+            groups1 = self.rng.randint(4, 8)
+            per_group1 = self.rng.randint(5, 10)
+            groups2 = self.rng.randint(4, 8)
+            per_group2 = self.rng.randint(5, 10)
 
             total1 = groups1 * per_group1
             total2 = groups2 * per_group2
@@ -304,7 +300,7 @@ class OneAndTwoStepWordProblemsGenerator:
                 f"Class A has {groups1} tables with {per_group1} students each. Class B has {groups2} tables with {per_group2} students each. How many more students in one class?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"\\text{{First group: }} {groups1} \\times {per_group1} = {total1}",
                 f"\\text{{Second group: }} {groups2} \\times {per_group2} = {total2}",
@@ -323,14 +319,14 @@ class OneAndTwoStepWordProblemsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex multi-step with strategic thinking."""
-        problem_type = random.choice(['three_step', 'complex_comparison', 'mixed_operations'])
+        problem_type = self.rng.choice(['three_step', 'complex_comparison', 'mixed_operations'])
 
         if problem_type == 'three_step':
             # Three operations
-            groups = random.randint(4, 8)
-            per_group = random.randint(5, 9)
-            add_amount = random.randint(10, 20)
-            divisor = random.randint(2, 4)
+            groups = self.rng.randint(4, 8)
+            per_group = self.rng.randint(5, 9)
+            add_amount = self.rng.randint(10, 20)
+            divisor = self.rng.randint(2, 4)
 
             product = groups * per_group
             sum_val = product + add_amount
@@ -345,7 +341,7 @@ class OneAndTwoStepWordProblemsGenerator:
                 f"A garden has {groups} sections with {per_group} plants each. After planting {add_amount} more, all are divided into {divisor} equal areas. How many per area?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"\\text{{Step 1: }} {groups} \\times {per_group} = {product}",
                 f"\\text{{Step 2: }} {product} + {add_amount} = {sum_val}",
@@ -354,13 +350,13 @@ class OneAndTwoStepWordProblemsGenerator:
 
         elif problem_type == 'complex_comparison':
             # Compare after operations
-            groups1 = random.randint(5, 10)
-            per1 = random.randint(6, 12)
-            subtract1 = random.randint(10, 25)
+            groups1 = self.rng.randint(5, 10)
+            per1 = self.rng.randint(6, 12)
+            subtract1 = self.rng.randint(10, 25)
 
-            groups2 = random.randint(5, 10)
-            per2 = random.randint(6, 12)
-            add2 = random.randint(10, 25)
+            groups2 = self.rng.randint(5, 10)
+            per2 = self.rng.randint(6, 12)
+            add2 = self.rng.randint(10, 25)
 
             total1 = groups1 * per1 - subtract1
             total2 = groups2 * per2 + add2
@@ -373,7 +369,7 @@ class OneAndTwoStepWordProblemsGenerator:
                 f"Class A has {groups1} tables with {per1} supplies each, but uses {subtract1}. Class B has {groups2} tables with {per2} supplies each, plus receives {add2} more. What is the difference?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"\\text{{First: }} {groups1} \\times {per1} - {subtract1} = {groups1 * per1} - {subtract1} = {total1}",
                 f"\\text{{Second: }} {groups2} \\times {per2} + {add2} = {groups2 * per2} + {add2} = {total2}",
@@ -382,11 +378,11 @@ class OneAndTwoStepWordProblemsGenerator:
 
         else:  # mixed_operations
             # All four operations
-            start = random.randint(40, 80)
-            add = random.randint(15, 30)
-            multiplier = random.randint(2, 4)
-            subtract = random.randint(20, 40)
-            divisor = random.randint(2, 5)
+            start = self.rng.randint(40, 80)
+            add = self.rng.randint(15, 30)
+            multiplier = self.rng.randint(2, 4)
+            subtract = self.rng.randint(20, 40)
+            divisor = self.rng.randint(2, 5)
 
             step1 = start + add
             step2 = step1 * multiplier
@@ -402,7 +398,7 @@ class OneAndTwoStepWordProblemsGenerator:
                 f"A farmer has {start} plants, grows {add} more, then plants {multiplier} fields of that size. After {subtract} die, the rest are divided into {divisor} equal sections. How many per section?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             steps = [
                 f"\\text{{Step 1: }} {start} + {add} = {step1}",
                 f"\\text{{Step 2: }} {step1} \\times {multiplier} = {step2}",
@@ -6,9 +6,6 @@ Example: 5 + 3 × 2, (8 - 2) × 4
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class TwoStepExpressionsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,11 +46,11 @@ class TwoStepExpressionsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: addition/subtraction followed by multiplication (with parentheses)."""
-        num1 = random.randint(2, 8)
-        num2 = random.randint(1, 5)
-        multiplier = random.randint(2, 5)
+        num1 = self.rng.randint(2, 8)
+        num2 = self.rng.randint(1, 5)
+        multiplier = self.rng.randint(2, 5)
 
-        operation = random.choice(['+', '-'])
+        operation = self.rng.choice(['+', '-'])
 
         if operation == '+':
             intermediate = num1 + num2
@@ -86,13 +82,13 @@ class TwoStepExpressionsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: mixed operations including division, order of operations."""
-        problem_type = random.choice(['multiply_first', 'divide_first', 'parentheses_division'])
+        problem_type = self.rng.choice(['multiply_first', 'divide_first', 'parentheses_division'])
 
         if problem_type == 'multiply_first':
             # a + b × c (multiplication first)
-            a = random.randint(2, 10)
-            b = random.randint(2, 6)
-            c = random.randint(2, 6)
+            a = self.rng.randint(2, 10)
+            b = self.rng.randint(2, 6)
+            c = self.rng.randint(2, 6)
 
             intermediate = b * c
             answer = a + intermediate
@@ -105,10 +101,10 @@ class TwoStepExpressionsGenerator:
 
         elif problem_type == 'divide_first':
             # a + b ÷ c (division first)
-            c = random.randint(2, 6)
-            quotient = random.randint(2, 8)
+            c = self.rng.randint(2, 6)
+            quotient = self.rng.randint(2, 8)
             b = c * quotient
-            a = random.randint(2, 10)
+            a = self.rng.randint(2, 10)
 
             intermediate = b // c
             answer = a + intermediate
@@ -121,10 +117,10 @@ class TwoStepExpressionsGenerator:
 
         else:  # parentheses_division
             # (a + b) ÷ c
-            c = random.randint(2, 5)
-            quotient = random.randint(3, 10)
+            c = self.rng.randint(2, 5)
+            quotient = self.rng.randint(3, 10)
             sum_val = c * quotient
-            a = random.randint(2, sum_val - 2)
+            a = self.rng.randint(2, sum_val - 2)
             b = sum_val - a
 
             answer = quotient
@@ -146,14 +142,14 @@ class TwoStepExpressionsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: more complex expressions or word problems."""
-        problem_type = random.choice(['complex_order', 'word_problem', 'three_numbers'])
+        problem_type = self.rng.choice(['complex_order', 'word_problem', 'three_numbers'])
 
         if problem_type == 'complex_order':
             # a × b + c × d (two multiplications then add)
-            a = random.randint(2, 6)
-            b = random.randint(2, 6)
-            c = random.randint(2, 6)
-            d = random.randint(2, 6)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(2, 6)
+            c = self.rng.randint(2, 6)
+            d = self.rng.randint(2, 6)
 
             product1 = a * b
             product2 = c * d
@@ -168,9 +164,9 @@ class TwoStepExpressionsGenerator:
 
         elif problem_type == 'word_problem':
             # Word problem requiring two operations
-            num_groups = random.randint(3, 8)
-            per_group = random.randint(3, 8)
-            additional = random.randint(5, 15)
+            num_groups = self.rng.randint(3, 8)
+            per_group = self.rng.randint(3, 8)
+            additional = self.rng.randint(5, 15)
 
             total = num_groups * per_group + additional
 
@@ -181,7 +177,7 @@ class TwoStepExpressionsGenerator:
                 f"There are {num_groups} bags with {per_group} apples each, plus {additional} loose apples. How many apples total?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}}}"
             answer = total
 
@@ -193,13 +189,13 @@ class TwoStepExpressionsGenerator:
 
         else:  # three_numbers
             # (a + b) × c - d
-            a = random.randint(2, 6)
-            b = random.randint(2, 6)
-            c = random.randint(2, 5)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(2, 6)
+            c = self.rng.randint(2, 5)
 
             sum_val = a + b
             product = sum_val * c
-            d = random.randint(1, min(10, product - 1))
+            d = self.rng.randint(1, min(10, product - 1))
             answer = product - d
 
             latex = f"({a} + {b}) \\times {c} - {d}"
@@ -220,14 +216,14 @@ class TwoStepExpressionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex multi-step with all operations."""
-        problem_type = random.choice(['four_operations', 'complex_word', 'nested_parentheses'])
+        problem_type = self.rng.choice(['four_operations', 'complex_word', 'nested_parentheses'])
 
         if problem_type == 'four_operations':
             # a × b + c ÷ d
-            a = random.randint(2, 7)
-            b = random.randint(2, 7)
-            d = random.randint(2, 6)
-            quotient = random.randint(2, 8)
+            a = self.rng.randint(2, 7)
+            b = self.rng.randint(2, 7)
+            d = self.rng.randint(2, 6)
+            quotient = self.rng.randint(2, 8)
             c = d * quotient
 
             product = a * b
@@ -243,9 +239,9 @@ class TwoStepExpressionsGenerator:
 
         elif problem_type == 'complex_word':
             # Complex word problem
-            groups = random.randint(4, 8)
-            per_group = random.randint(4, 8)
-            multiplier = random.randint(2, 4)
+            groups = self.rng.randint(4, 8)
+            per_group = self.rng.randint(4, 8)
+            multiplier = self.rng.randint(2, 4)
 
             total_items = groups * per_group
             answer = total_items * multiplier
@@ -257,7 +253,7 @@ class TwoStepExpressionsGenerator:
                 f"A library has {groups} sections with {per_group} books in each section. If each book has {multiplier} bookmarks, how many bookmarks?"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}}}"
 
             steps = [
@@ -267,12 +263,12 @@ class TwoStepExpressionsGenerator:
 
         else:  # nested_parentheses
             # (a × b + c) ÷ d
-            d = random.randint(2, 5)
-            quotient = random.randint(4, 12)
+            d = self.rng.randint(2, 5)
+            quotient = self.rng.randint(4, 12)
             sum_val = d * quotient
 
-            a = random.randint(2, 5)
-            b = random.randint(2, 5)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(2, 5)
             product = a * b
 
             if product >= sum_val:
@@ -6,9 +6,6 @@ Covers: squares, rectangles, rhombuses, parallelograms, trapezoids
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -60,8 +57,7 @@ class QuadrilateralsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -93,8 +89,8 @@ class QuadrilateralsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: basic identification of common quadrilaterals."""
-        problem_type = random.choice(['identify', 'sides', 'angles'])
-        shape = random.choice(['square', 'rectangle'])
+        problem_type = self.rng.choice(['identify', 'sides', 'angles'])
+        shape = self.rng.choice(['square', 'rectangle'])
         info = self.QUADRILATERALS[shape]
 
         if problem_type == 'identify':
@@ -124,8 +120,8 @@ class QuadrilateralsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: properties and more quadrilateral types."""
-        problem_type = random.choice(['identify', 'property', 'true_false'])
-        shape = random.choice(['square', 'rectangle', 'rhombus', 'parallelogram'])
+        problem_type = self.rng.choice(['identify', 'property', 'true_false'])
+        shape = self.rng.choice(['square', 'rectangle', 'rhombus', 'parallelogram'])
         info = self.QUADRILATERALS[shape]
 
         if problem_type == 'identify':
@@ -140,13 +136,13 @@ class QuadrilateralsGenerator:
             steps = [f"\\text{{A {shape} has these properties: {info['sides']}, {info['angles']}}}"]
 
         elif problem_type == 'property':
-            prop = random.choice(info['properties'])
+            prop = self.rng.choice(info['properties'])
             latex = f"\\text{{Name a property of a {shape}.}}"
             solution = prop
             steps = [f"\\text{{Properties of a {shape}:}}"] + [f"\\text{{- {p}}}" for p in info['properties']]
 
         else:  # true_false
-            shape2 = random.choice(['square', 'rectangle', 'rhombus', 'parallelogram'])
+            shape2 = self.rng.choice(['square', 'rectangle', 'rhombus', 'parallelogram'])
             info2 = self.QUADRILATERALS[shape2]
 
             statements = [
@@ -157,7 +153,7 @@ class QuadrilateralsGenerator:
                 (f"All angles in a rectangle are right angles", "True"),
                 (f"A parallelogram always has right angles", "False")
             ]
-            statement, answer = random.choice(statements)
+            statement, answer = self.rng.choice(statements)
             latex = f"\\text{{True or False: {statement}}}"
             solution = answer
             steps = [f"\\text{{This statement is {answer.lower()}}}"]
@@ -171,10 +167,10 @@ class QuadrilateralsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: classification and relationships between shapes."""
-        problem_type = random.choice(['classify', 'compare', 'relationship'])
+        problem_type = self.rng.choice(['classify', 'compare', 'relationship'])
 
         if problem_type == 'classify':
-            shape = random.choice(list(self.QUADRILATERALS.keys()))
+            shape = self.rng.choice(list(self.QUADRILATERALS.keys()))
             info = self.QUADRILATERALS[shape]
 
             questions = [
@@ -182,7 +178,7 @@ class QuadrilateralsGenerator:
                 (f"Is a {shape} a type of rectangle?", "Yes" if info['is_rectangle'] else "No"),
                 (f"Is a {shape} a type of rhombus?", "Yes" if info['is_rhombus'] else "No"),
             ]
-            question, answer = random.choice(questions)
+            question, answer = self.rng.choice(questions)
             latex = f"\\text{{{question}}}"
             solution = answer
 
@@ -192,7 +188,7 @@ class QuadrilateralsGenerator:
                 steps = [f"\\text{{No, a {shape} does not have all required properties}}"]
 
         elif problem_type == 'compare':
-            shape1, shape2 = random.sample(['square', 'rectangle', 'rhombus', 'parallelogram'], 2)
+            shape1, shape2 = self.rng.sample(['square', 'rectangle', 'rhombus', 'parallelogram'], 2)
 
             latex = f"\\text{{What do a {shape1} and a {shape2} have in common?}}"
 
@@ -203,7 +199,7 @@ class QuadrilateralsGenerator:
             common.append("Both have 4 sides")
             common.append("Both are quadrilaterals")
 
-            solution = random.choice(common)
+            solution = self.rng.choice(common)
             steps = [f"\\text{{Common properties:}}"] + [f"\\text{{- {c}}}" for c in common]
 
         else:  # relationship
@@ -215,7 +211,7 @@ class QuadrilateralsGenerator:
                 ("Every rectangle is a parallelogram", "True", "A rectangle has parallel opposite sides"),
                 ("Every parallelogram is a rectangle", "False", "A parallelogram doesn't need right angles")
             ]
-            statement, answer, explanation = random.choice(relationships)
+            statement, answer, explanation = self.rng.choice(relationships)
             latex = f"\\text{{True or False: {statement}}}"
             solution = answer
             steps = [f"\\text{{{explanation}}}"]
@@ -229,7 +225,7 @@ class QuadrilateralsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex classification and analysis."""
-        problem_type = random.choice(['hierarchy', 'counterexample', 'all_that_apply'])
+        problem_type = self.rng.choice(['hierarchy', 'counterexample', 'all_that_apply'])
 
         if problem_type == 'hierarchy':
             latex = "\\text{Which shape is the most specific: quadrilateral, parallelogram, rectangle, or square?}"
@@ -253,13 +249,13 @@ class QuadrilateralsGenerator:
                  "False - a rhombus is a parallelogram without right angles",
                  "Rhombus or general parallelogram")
             ]
-            statement, answer, counterexample = random.choice(statements)
+            statement, answer, counterexample = self.rng.choice(statements)
             latex = f"\\text{{{statement}. If false, give a counterexample.}}"
             solution = f"False. Counterexample: {counterexample}"
             steps = [f"\\text{{{answer}}}"]
 
         else:  # all_that_apply
-            shape = random.choice(['square', 'rectangle', 'rhombus'])
+            shape = self.rng.choice(['square', 'rectangle', 'rhombus'])
             categories = []
             info = self.QUADRILATERALS[shape]
 
@@ -6,9 +6,6 @@ Example: Visual representation of area with shaded regions
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class AreaIntroductionGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class AreaIntroductionGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: simple shapes with small dimensions (1-3 units)."""
-        length = random.randint(1, 3)
-        width = random.randint(1, 3)
+        length = self.rng.randint(1, 3)
+        width = self.rng.randint(1, 3)
         area = length * width
 
         shapes = [
@@ -59,7 +55,7 @@ class AreaIntroductionGenerator:
             f"a shape with {length} rows and {width} squares in each row"
         ]
 
-        shape = random.choice(shapes)
+        shape = self.rng.choice(shapes)
         latex = f"\\text{{What is the area of {shape}?}}"
         solution = f"{area} square units"
 
@@ -76,8 +72,8 @@ class AreaIntroductionGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: larger shapes (1-5 units)."""
-        length = random.randint(2, 5)
-        width = random.randint(2, 5)
+        length = self.rng.randint(2, 5)
+        width = self.rng.randint(2, 5)
         area = length * width
 
         shapes = [
@@ -86,7 +82,7 @@ class AreaIntroductionGenerator:
             f"a poster that is {length} units tall and {width} units wide"
         ]
 
-        shape = random.choice(shapes)
+        shape = self.rng.choice(shapes)
         latex = f"\\text{{Find the area of {shape}.}}"
         solution = f"{area} square units"
 
@@ -103,8 +99,8 @@ class AreaIntroductionGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with real-world contexts (1-8 units)."""
-        length = random.randint(3, 8)
-        width = random.randint(3, 8)
+        length = self.rng.randint(3, 8)
+        width = self.rng.randint(3, 8)
         area = length * width
 
         contexts = [
@@ -115,7 +111,7 @@ class AreaIntroductionGenerator:
             (f"A table top is {length} feet long and {width} feet wide", "feet")
         ]
 
-        context, unit = random.choice(contexts)
+        context, unit = self.rng.choice(contexts)
         latex = f"\\text{{{context}. What is its area?}}"
         solution = f"{area} square {unit}"
 
@@ -132,16 +128,16 @@ class AreaIntroductionGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: comparing areas or finding missing dimensions."""
-        problem_type = random.choice(['compare', 'missing_dimension'])
+        problem_type = self.rng.choice(['compare', 'missing_dimension'])
 
         if problem_type == 'compare':
             # Compare two rectangles
-            length1 = random.randint(4, 8)
-            width1 = random.randint(3, 6)
+            length1 = self.rng.randint(4, 8)
+            width1 = self.rng.randint(3, 6)
             area1 = length1 * width1
 
-            length2 = random.randint(4, 8)
-            width2 = random.randint(3, 6)
+            length2 = self.rng.randint(4, 8)
+            width2 = self.rng.randint(3, 6)
             area2 = length2 * width2
 
             difference = abs(area1 - area2)
@@ -162,11 +158,11 @@ class AreaIntroductionGenerator:
             )
         else:
             # Missing dimension
-            area = random.randint(12, 48)
-            known_side = random.choice([i for i in range(2, 13) if area % i == 0])
+            area = self.rng.randint(12, 48)
+            known_side = self.rng.choice([i for i in range(2, 13) if area % i == 0])
             missing_side = area // known_side
 
-            dimension = random.choice(['length', 'width'])
+            dimension = self.rng.choice(['length', 'width'])
             other_dimension = 'width' if dimension == 'length' else 'length'
 
             latex = f"\\text{{A rectangle has an area of {area} square units. Its {other_dimension} is {known_side} units. }}" + \
@@ -6,9 +6,6 @@ Example: Count the squares in a grid to find the area
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class CountUnitSquaresToFindAreaGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class CountUnitSquaresToFindAreaGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: small grids (2-4 units)."""
-        length = random.randint(2, 4)
-        width = random.randint(2, 4)
+        length = self.rng.randint(2, 4)
+        width = self.rng.randint(2, 4)
         area = length * width
 
         latex = f"\\text{{A rectangle has {length} rows and {width} unit squares in each row. }}" + \
@@ -71,8 +67,8 @@ class CountUnitSquaresToFindAreaGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: larger grids (3-7 units)."""
-        length = random.randint(3, 7)
-        width = random.randint(3, 7)
+        length = self.rng.randint(3, 7)
+        width = self.rng.randint(3, 7)
         area = length * width
 
         descriptions = [
@@ -81,7 +77,7 @@ class CountUnitSquaresToFindAreaGenerator:
             f"a shape containing {length} rows of {width} unit squares each"
         ]
 
-        description = random.choice(descriptions)
+        description = self.rng.choice(descriptions)
         latex = f"\\text{{Find the area of {description}.}}"
         solution = f"{area} square units"
 
@@ -98,8 +94,8 @@ class CountUnitSquaresToFindAreaGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with counting (4-10 units)."""
-        length = random.randint(4, 10)
-        width = random.randint(4, 10)
+        length = self.rng.randint(4, 10)
+        width = self.rng.randint(4, 10)
         area = length * width
 
         contexts = [
@@ -110,7 +106,7 @@ class CountUnitSquaresToFindAreaGenerator:
             f"A window has {length} rows of glass panes with {width} panes in each row"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}. How many unit squares are there?}}"
         solution = f"{area} square units"
 
@@ -127,16 +123,16 @@ class CountUnitSquaresToFindAreaGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: partially filled grids or composite shapes."""
-        problem_type = random.choice(['partial', 'L_shape'])
+        problem_type = self.rng.choice(['partial', 'L_shape'])
 
         if problem_type == 'partial':
             # Grid with some squares missing
-            total_length = random.randint(6, 10)
-            total_width = random.randint(6, 10)
+            total_length = self.rng.randint(6, 10)
+            total_width = self.rng.randint(6, 10)
             total_area = total_length * total_width
 
-            missing_length = random.randint(2, 4)
-            missing_width = random.randint(2, 4)
+            missing_length = self.rng.randint(2, 4)
+            missing_width = self.rng.randint(2, 4)
             missing_area = missing_length * missing_width
 
             actual_area = total_area - missing_area
@@ -158,13 +154,13 @@ class CountUnitSquaresToFindAreaGenerator:
         else:
             # L-shaped figure
             # Horizontal part
-            h_length = random.randint(6, 10)
-            h_width = random.randint(3, 5)
+            h_length = self.rng.randint(6, 10)
+            h_width = self.rng.randint(3, 5)
             h_area = h_length * h_width
 
             # Vertical part (non-overlapping)
-            v_length = random.randint(4, 7)
-            v_width = random.randint(3, 5)
+            v_length = self.rng.randint(4, 7)
+            v_width = self.rng.randint(3, 5)
             v_area = v_length * v_width
 
             total_area = h_area + v_area
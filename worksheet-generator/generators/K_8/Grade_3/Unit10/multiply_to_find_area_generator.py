@@ -6,9 +6,6 @@ Example: A rectangle is 8 units long and 5 units wide. Area = 8 × 5 = 40 square
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class MultiplyToFindAreaGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class MultiplyToFindAreaGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: small dimensions (1-5 units)."""
-        length = random.randint(2, 5)
-        width = random.randint(2, 5)
+        length = self.rng.randint(2, 5)
+        width = self.rng.randint(2, 5)
         area = length * width
 
         latex = f"\\text{{Find the area: length = {length} units, width = {width} units}}"
@@ -70,8 +66,8 @@ class MultiplyToFindAreaGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: larger dimensions (3-10 units)."""
-        length = random.randint(3, 10)
-        width = random.randint(3, 10)
+        length = self.rng.randint(3, 10)
+        width = self.rng.randint(3, 10)
         area = length * width
 
         shapes = [
@@ -80,7 +76,7 @@ class MultiplyToFindAreaGenerator:
             f"The dimensions are {length} units by {width} units"
         ]
 
-        shape = random.choice(shapes)
+        shape = self.rng.choice(shapes)
         latex = f"\\text{{{shape}. Find the area.}}"
         solution = f"{area} square units"
 
@@ -97,8 +93,8 @@ class MultiplyToFindAreaGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with real-world contexts (4-12 units)."""
-        length = random.randint(4, 12)
-        width = random.randint(4, 12)
+        length = self.rng.randint(4, 12)
+        width = self.rng.randint(4, 12)
         area = length * width
 
         contexts = [
@@ -111,7 +107,7 @@ class MultiplyToFindAreaGenerator:
             (f"A picture frame is {length} inches by {width} inches", "inches")
         ]
 
-        context, unit = random.choice(contexts)
+        context, unit = self.rng.choice(contexts)
         latex = f"\\text{{{context}. What is the area?}}"
         solution = f"{area} square {unit}"
 
@@ -128,15 +124,15 @@ class MultiplyToFindAreaGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: missing dimensions, comparisons, or multi-step."""
-        problem_type = random.choice(['missing_dimension', 'comparison', 'multi_step'])
+        problem_type = self.rng.choice(['missing_dimension', 'comparison', 'multi_step'])
 
         if problem_type == 'missing_dimension':
             # Given area and one dimension, find the other
-            area = random.randint(24, 96)
-            known_side = random.choice([i for i in range(3, 13) if area % i == 0])
+            area = self.rng.randint(24, 96)
+            known_side = self.rng.choice([i for i in range(3, 13) if area % i == 0])
             missing_side = area // known_side
 
-            dimension_known = random.choice(['length', 'width'])
+            dimension_known = self.rng.choice(['length', 'width'])
             dimension_missing = 'width' if dimension_known == 'length' else 'length'
 
             latex = f"\\text{{A rectangle has an area of {area} square units. The {dimension_known} is {known_side} units. }}" + \
@@ -156,17 +152,17 @@ class MultiplyToFindAreaGenerator:
 
         elif problem_type == 'comparison':
             # Compare areas of two rectangles
-            length1 = random.randint(5, 10)
-            width1 = random.randint(4, 8)
+            length1 = self.rng.randint(5, 10)
+            width1 = self.rng.randint(4, 8)
             area1 = length1 * width1
 
-            length2 = random.randint(5, 10)
-            width2 = random.randint(4, 8)
+            length2 = self.rng.randint(5, 10)
+            width2 = self.rng.randint(4, 8)
             area2 = length2 * width2
 
             # Make sure they're different
             while area1 == area2:
-                width2 = random.randint(4, 8)
+                width2 = self.rng.randint(4, 8)
                 area2 = length2 * width2
 
             difference = abs(area1 - area2)
@@ -188,11 +184,11 @@ class MultiplyToFindAreaGenerator:
 
         else:  # multi_step
             # Room with carpet and border
-            room_length = random.randint(8, 12)
-            room_width = random.randint(8, 12)
+            room_length = self.rng.randint(8, 12)
+            room_width = self.rng.randint(8, 12)
             room_area = room_length * room_width
 
-            border = random.randint(1, 2)
+            border = self.rng.randint(1, 2)
             carpet_length = room_length - (2 * border)
             carpet_width = room_width - (2 * border)
             carpet_area = carpet_length * carpet_width
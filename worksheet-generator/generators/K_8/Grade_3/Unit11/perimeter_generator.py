@@ -6,9 +6,6 @@ Example: Find the perimeter of a rectangle with sides 5, 3, 5, 3
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class PerimeterGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,10 +46,10 @@ class PerimeterGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: squares and simple rectangles (1-5 units)."""
-        shape_type = random.choice(['square', 'rectangle'])
+        shape_type = self.rng.choice(['square', 'rectangle'])
 
         if shape_type == 'square':
-            side = random.randint(2, 5)
+            side = self.rng.randint(2, 5)
             perimeter = 4 * side
 
             latex = f"\\text{{Find the perimeter of a square with side length {side} units.}}"
@@ -70,8 +66,8 @@ class PerimeterGenerator:
                 difficulty='easy'
             )
         else:
-            length = random.randint(3, 5)
-            width = random.randint(2, 4)
+            length = self.rng.randint(3, 5)
+            width = self.rng.randint(2, 4)
             perimeter = 2 * (length + width)
 
             latex = f"\\text{{Find the perimeter of a rectangle: length = {length} units, width = {width} units.}}"
@@ -90,10 +86,10 @@ class PerimeterGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: various shapes (2-10 units)."""
-        shape_type = random.choice(['square', 'rectangle', 'triangle'])
+        shape_type = self.rng.choice(['square', 'rectangle', 'triangle'])
 
         if shape_type == 'square':
-            side = random.randint(4, 10)
+            side = self.rng.randint(4, 10)
             perimeter = 4 * side
 
             latex = f"\\text{{A square has sides of {side} units. Find the perimeter.}}"
@@ -111,8 +107,8 @@ class PerimeterGenerator:
             )
 
         elif shape_type == 'rectangle':
-            length = random.randint(5, 10)
-            width = random.randint(3, 8)
+            length = self.rng.randint(5, 10)
+            width = self.rng.randint(3, 8)
             perimeter = 2 * (length + width)
 
             latex = f"\\text{{A rectangle measures {length} units by {width} units. Find the perimeter.}}"
@@ -130,9 +126,9 @@ class PerimeterGenerator:
             )
 
         else:  # triangle
-            side1 = random.randint(3, 10)
-            side2 = random.randint(3, 10)
-            side3 = random.randint(3, 10)
+            side1 = self.rng.randint(3, 10)
+            side2 = self.rng.randint(3, 10)
+            side3 = self.rng.randint(3, 10)
             perimeter = side1 + side2 + side3
 
             latex = f"\\text{{A triangle has sides {side1}, {side2}, and {side3} units. Find the perimeter.}}"
@@ -151,10 +147,10 @@ class PerimeterGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with real-world contexts."""
-        shape_type = random.choice(['square', 'rectangle', 'triangle', 'polygon'])
+        shape_type = self.rng.choice(['square', 'rectangle', 'triangle', 'polygon'])
 
         if shape_type == 'square':
-            side = random.randint(5, 12)
+            side = self.rng.randint(5, 12)
             perimeter = 4 * side
 
             contexts = [
@@ -163,7 +159,7 @@ class PerimeterGenerator:
                 f"A square playground is {side} meters per side"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}. What is the perimeter?}}"
             solution = f"{perimeter} units"
 
@@ -178,8 +174,8 @@ class PerimeterGenerator:
             )
 
         elif shape_type == 'rectangle':
-            length = random.randint(6, 12)
-            width = random.randint(4, 10)
+            length = self.rng.randint(6, 12)
+            width = self.rng.randint(4, 10)
             perimeter = 2 * (length + width)
 
             contexts = [
@@ -189,7 +185,7 @@ class PerimeterGenerator:
                 f"A fence surrounds a yard that is {length} yards long and {width} yards wide"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}. Find the perimeter.}}"
             solution = f"{perimeter} units"
 
@@ -204,9 +200,9 @@ class PerimeterGenerator:
             )
 
         elif shape_type == 'triangle':
-            side1 = random.randint(5, 12)
-            side2 = random.randint(5, 12)
-            side3 = random.randint(5, 12)
+            side1 = self.rng.randint(5, 12)
+            side2 = self.rng.randint(5, 12)
+            side3 = self.rng.randint(5, 12)
             perimeter = side1 + side2 + side3
 
             contexts = [
@@ -214,7 +210,7 @@ class PerimeterGenerator:
                 f"A triangular flag has sides measuring {side1}, {side2}, and {side3} inches"
             ]
 
-            context = random.choice(contexts)
+            context = self.rng.choice(contexts)
             latex = f"\\text{{{context}. What is the perimeter?}}"
             solution = f"{perimeter} units"
 
@@ -229,8 +225,8 @@ class PerimeterGenerator:
             )
 
         else:  # polygon
-            num_sides = random.randint(5, 6)
-            side_length = random.randint(4, 10)
+            num_sides = self.rng.randint(5, 6)
+            side_length = self.rng.randint(4, 10)
             perimeter = num_sides * side_length
 
             shape_name = "pentagon" if num_sides == 5 else "hexagon"
@@ -250,18 +246,18 @@ class PerimeterGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: missing side, composite shapes, or comparisons."""
-        problem_type = random.choice(['missing_side', 'composite', 'comparison'])
+        problem_type = self.rng.choice(['missing_side', 'composite', 'comparison'])
 
         if problem_type == 'missing_side':
             # Given perimeter and some sides, find missing side
-            shape_type = random.choice(['rectangle', 'triangle'])
+            shape_type = self.rng.choice(['rectangle', 'triangle'])
 
             if shape_type == 'rectangle':
-                length = random.randint(6, 12)
-                width = random.randint(4, 10)
+                length = self.rng.randint(6, 12)
+                width = self.rng.randint(4, 10)
                 perimeter = 2 * (length + width)
 
-                given_dimension = random.choice(['length', 'width'])
+                given_dimension = self.rng.choice(['length', 'width'])
                 known_side = length if given_dimension == 'length' else width
                 missing_side = width if given_dimension == 'length' else length
 
@@ -282,9 +278,9 @@ class PerimeterGenerator:
                 )
 
             else:  # triangle
-                side1 = random.randint(5, 10)
-                side2 = random.randint(5, 10)
-                side3 = random.randint(5, 10)
+                side1 = self.rng.randint(5, 10)
+                side2 = self.rng.randint(5, 10)
+                side3 = self.rng.randint(5, 10)
                 perimeter = side1 + side2 + side3
 
                 latex = f"\\text{{A triangle has a perimeter of {perimeter} units. Two sides are {side1} and {side2} units. }}" + \
@@ -305,12 +301,12 @@ class PerimeterGenerator:
         elif problem_type == 'composite':
             # L-shaped or other composite figure
             # Horizontal part
-            h_length = random.randint(8, 12)
-            h_width = random.randint(3, 5)
+            h_length = self.rng.randint(8, 12)
+            h_width = self.rng.randint(3, 5)
 
             # Vertical extension
-            v_height = random.randint(4, 8)
-            v_width = random.randint(3, 5)
+            v_height = self.rng.randint(4, 8)
+            v_width = self.rng.randint(3, 5)
 
             # Calculate perimeter (going around the outside)
             # This is simplified - actual perimeter depends on configuration
@@ -333,17 +329,17 @@ class PerimeterGenerator:
 
         else:  # comparison
             # Compare perimeters
-            length1 = random.randint(6, 10)
-            width1 = random.randint(4, 8)
+            length1 = self.rng.randint(6, 10)
+            width1 = self.rng.randint(4, 8)
             perimeter1 = 2 * (length1 + width1)
 
-            length2 = random.randint(6, 10)
-            width2 = random.randint(4, 8)
+            length2 = self.rng.randint(6, 10)
+            width2 = self.rng.randint(4, 8)
             perimeter2 = 2 * (length2 + width2)
 
             # Ensure they're different
             while perimeter1 == perimeter2:
-                width2 = random.randint(4, 8)
+                width2 = self.rng.randint(4, 8)
                 perimeter2 = 2 * (length2 + width2)
 
             difference = abs(perimeter1 - perimeter2)
@@ -6,9 +6,6 @@ Example: Sarah wants to fence her garden. The garden is 12 feet long and 8 feet
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class PerimeterWordProblemsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class PerimeterWordProblemsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: simple contexts with small numbers (2-5 units)."""
-        length = random.randint(3, 5)
-        width = random.randint(2, 4)
+        length = self.rng.randint(3, 5)
+        width = self.rng.randint(2, 4)
         perimeter = 2 * (length + width)
 
         contexts = [
@@ -61,7 +57,7 @@ class PerimeterWordProblemsGenerator:
             (f"A placemat measures {length} inches by {width} inches", "inches")
         ]
 
-        context, unit = random.choice(contexts)
+        context, unit = self.rng.choice(contexts)
 
         questions = [
             "What is the perimeter?",
@@ -69,7 +65,7 @@ class PerimeterWordProblemsGenerator:
             "What is the distance around it?"
         ]
 
-        question = random.choice(questions)
+        question = self.rng.choice(questions)
         latex = f"\\text{{{context}. {question}}}"
         solution = f"{perimeter} {unit}"
 
@@ -86,11 +82,11 @@ class PerimeterWordProblemsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: various real-world contexts (3-10 units)."""
-        shape_type = random.choice(['rectangle', 'square', 'triangle'])
+        shape_type = self.rng.choice(['rectangle', 'square', 'triangle'])
 
         if shape_type == 'rectangle':
-            length = random.randint(5, 10)
-            width = random.randint(3, 8)
+            length = self.rng.randint(5, 10)
+            width = self.rng.randint(3, 8)
             perimeter = 2 * (length + width)
 
             contexts = [
@@ -100,7 +96,7 @@ class PerimeterWordProblemsGenerator:
                 (f"A rectangular table is {length} feet by {width} feet", "feet", "trim")
             ]
 
-            context, unit, item = random.choice(contexts)
+            context, unit, item = self.rng.choice(contexts)
             latex = f"\\text{{{context}. How much {item} is needed for the perimeter?}}"
             solution = f"{perimeter} {unit}"
 
@@ -115,7 +111,7 @@ class PerimeterWordProblemsGenerator:
             )
 
         elif shape_type == 'square':
-            side = random.randint(4, 10)
+            side = self.rng.randint(4, 10)
             perimeter = 4 * side
 
             contexts = [
@@ -124,7 +120,7 @@ class PerimeterWordProblemsGenerator:
                 (f"A square garden plot is {side} meters per side", "meters", "fencing")
             ]
 
-            context, unit, item = random.choice(contexts)
+            context, unit, item = self.rng.choice(contexts)
             latex = f"\\text{{{context}. How much {item} is needed?}}"
             solution = f"{perimeter} {unit}"
 
@@ -139,9 +135,9 @@ class PerimeterWordProblemsGenerator:
             )
 
         else:  # triangle
-            side1 = random.randint(4, 10)
-            side2 = random.randint(4, 10)
-            side3 = random.randint(4, 10)
+            side1 = self.rng.randint(4, 10)
+            side2 = self.rng.randint(4, 10)
+            side3 = self.rng.randint(4, 10)
             perimeter = side1 + side2 + side3
 
             contexts = [
@@ -149,7 +145,7 @@ class PerimeterWordProblemsGenerator:
                 (f"A triangular garden has sides measuring {side1}, {side2}, and {side3} feet", "feet", "border")
             ]
 
-            context, unit, item = random.choice(contexts)
+            context, unit, item = self.rng.choice(contexts)
             latex = f"\\text{{{context}. How much {item} is needed for the perimeter?}}"
             solution = f"{perimeter} {unit}"
 
@@ -165,13 +161,13 @@ class PerimeterWordProblemsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: multi-step or more complex contexts (5-12 units)."""
-        problem_type = random.choice(['fence_cost', 'comparison', 'extension'])
+        problem_type = self.rng.choice(['fence_cost', 'comparison', 'extension'])
 
         if problem_type == 'fence_cost':
-            length = random.randint(8, 12)
-            width = random.randint(6, 10)
+            length = self.rng.randint(8, 12)
+            width = self.rng.randint(6, 10)
             perimeter = 2 * (length + width)
-            cost_per_unit = random.randint(2, 5)
+            cost_per_unit = self.rng.randint(2, 5)
             total_cost = perimeter * cost_per_unit
 
             latex = f"\\text{{A rectangular yard is {length} feet by {width} feet. Fencing costs \\${cost_per_unit} per foot. }}" + \
@@ -189,17 +185,17 @@ class PerimeterWordProblemsGenerator:
             )
 
         elif problem_type == 'comparison':
-            length1 = random.randint(7, 12)
-            width1 = random.randint(5, 9)
+            length1 = self.rng.randint(7, 12)
+            width1 = self.rng.randint(5, 9)
             perimeter1 = 2 * (length1 + width1)
 
-            length2 = random.randint(7, 12)
-            width2 = random.randint(5, 9)
+            length2 = self.rng.randint(7, 12)
+            width2 = self.rng.randint(5, 9)
             perimeter2 = 2 * (length2 + width2)
 
             # Ensure different perimeters
             while perimeter1 == perimeter2:
-                width2 = random.randint(5, 9)
+                width2 = self.rng.randint(5, 9)
                 perimeter2 = 2 * (length2 + width2)
 
             difference = abs(perimeter1 - perimeter2)
@@ -220,10 +216,10 @@ class PerimeterWordProblemsGenerator:
             )
 
         else:  # extension
-            original_side = random.randint(6, 10)
+            original_side = self.rng.randint(6, 10)
             original_perimeter = 4 * original_side
 
-            extension = random.randint(2, 4)
+            extension = self.rng.randint(2, 4)
             new_side = original_side + extension
             new_perimeter = 4 * new_side
 
@@ -247,12 +243,12 @@ class PerimeterWordProblemsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex multi-step or missing information."""
-        problem_type = random.choice(['missing_side', 'two_shapes', 'partial_fence'])
+        problem_type = self.rng.choice(['missing_side', 'two_shapes', 'partial_fence'])
 
         if problem_type == 'missing_side':
             # Given perimeter and budget/material, find if possible
-            length = random.randint(8, 12)
-            width = random.randint(6, 10)
+            length = self.rng.randint(8, 12)
+            width = self.rng.randint(6, 10)
             perimeter = 2 * (length + width)
 
             # Give perimeter and one dimension
@@ -274,10 +270,10 @@ class PerimeterWordProblemsGenerator:
 
         elif problem_type == 'two_shapes':
             # Two adjacent gardens sharing one side
-            length1 = random.randint(8, 12)
-            width1 = random.randint(6, 10)
+            length1 = self.rng.randint(8, 12)
+            width1 = self.rng.randint(6, 10)
 
-            length2 = random.randint(8, 12)
+            length2 = self.rng.randint(8, 12)
             width2 = width1  # They share this side
 
             # Total fence needed (minus the shared side)
@@ -301,12 +297,12 @@ class PerimeterWordProblemsGenerator:
 
         else:  # partial_fence
             # Rectangular yard, one side is house (no fence needed)
-            length = random.randint(10, 15)
-            width = random.randint(8, 12)
+            length = self.rng.randint(10, 15)
+            width = self.rng.randint(8, 12)
 
             # Fence needed for 3 sides (not the side with house)
             fence_needed = length + 2 * width
-            cost_per_foot = random.randint(3, 6)
+            cost_per_foot = self.rng.randint(3, 6)
             total_cost = fence_needed * cost_per_foot
 
             latex = f"\\text{{A backyard is {length} by {width} feet. One {length}-foot side is the house (no fence). }}" + \
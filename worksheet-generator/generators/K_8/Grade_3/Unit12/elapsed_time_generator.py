@@ -6,9 +6,6 @@ Focuses on finding elapsed time and determining start/end times
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class ElapsedTimeGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -65,13 +61,13 @@ class ElapsedTimeGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: elapsed time with simple hour intervals."""
-        start_hour = random.randint(1, 11)
-        elapsed_hours = random.randint(1, 3)
+        start_hour = self.rng.randint(1, 11)
+        elapsed_hours = self.rng.randint(1, 3)
         end_hour = start_hour + elapsed_hours
         if end_hour > 12:
             end_hour = end_hour - 12
 
-        am_pm = random.choice(['AM', 'PM'])
+        am_pm = self.rng.choice(['AM', 'PM'])
         start_time = f"{start_hour}:00 {am_pm}"
         end_time = f"{end_hour}:00 {am_pm}"
 
@@ -81,7 +77,7 @@ class ElapsedTimeGenerator:
             f"\\text{{Practice starts at {start_time} and finishes at {end_time}.}}",
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"{context} \\text{{ How long is that?}}"
         solution = f"{elapsed_hours} hours"
 
@@ -94,11 +90,11 @@ class ElapsedTimeGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: elapsed time with minutes."""
-        start_hour = random.randint(1, 12)
-        start_minute = random.choice([0, 15, 30, 45])
-        elapsed_minutes = random.choice([15, 30, 45, 60, 75, 90])
+        start_hour = self.rng.randint(1, 12)
+        start_minute = self.rng.choice([0, 15, 30, 45])
+        elapsed_minutes = self.rng.choice([15, 30, 45, 60, 75, 90])
 
-        am_pm = random.choice(['AM', 'PM'])
+        am_pm = self.rng.choice(['AM', 'PM'])
         end_hour, end_minute = self._add_minutes(start_hour, start_minute, elapsed_minutes)
 
         start_time = self._format_time(start_hour, start_minute, am_pm)
@@ -110,7 +106,7 @@ class ElapsedTimeGenerator:
             f"\\text{{Math class begins at {start_time} and finishes at {end_time}.}}",
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"{context} \\text{{ How much time elapsed?}}"
 
         # Format solution
@@ -132,12 +128,12 @@ class ElapsedTimeGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: finding start or end time given elapsed time."""
-        problem_type = random.choice(['find_start', 'find_end'])
+        problem_type = self.rng.choice(['find_start', 'find_end'])
 
         if problem_type == 'find_start':
-            end_hour = random.randint(2, 12)
-            end_minute = random.randint(0, 59)
-            elapsed_minutes = random.randint(30, 120)
+            end_hour = self.rng.randint(2, 12)
+            end_minute = self.rng.randint(0, 59)
+            elapsed_minutes = self.rng.randint(30, 120)
 
             # Calculate start time
             total_end_minutes = end_hour * 60 + end_minute
@@ -147,7 +143,7 @@ class ElapsedTimeGenerator:
                 start_hour = 12
             start_minute = total_start_minutes % 60
 
-            am_pm = random.choice(['AM', 'PM'])
+            am_pm = self.rng.choice(['AM', 'PM'])
             end_time = self._format_time(end_hour, end_minute, am_pm)
             start_time = self._format_time(start_hour, start_minute, am_pm)
 
@@ -164,13 +160,13 @@ class ElapsedTimeGenerator:
             solution = start_time
 
         else:  # find_end
-            start_hour = random.randint(1, 11)
-            start_minute = random.randint(0, 59)
-            elapsed_minutes = random.randint(30, 120)
+            start_hour = self.rng.randint(1, 11)
+            start_minute = self.rng.randint(0, 59)
+            elapsed_minutes = self.rng.randint(30, 120)
 
             end_hour, end_minute = self._add_minutes(start_hour, start_minute, elapsed_minutes)
 
-            am_pm = random.choice(['AM', 'PM'])
+            am_pm = self.rng.choice(['AM', 'PM'])
             start_time = self._format_time(start_hour, start_minute, am_pm)
             end_time = self._format_time(end_hour, end_minute, am_pm)
 
@@ -196,13 +192,13 @@ class ElapsedTimeGenerator:
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: multi-step time problems."""
         # Problem with multiple activities
-        start_hour = random.randint(1, 10)
+        start_hour = self.rng.randint(1, 10)
         start_minute = 0
-        am_pm = random.choice(['AM', 'PM'])
+        am_pm = self.rng.choice(['AM', 'PM'])
 
-        activity1_minutes = random.randint(20, 45)
-        activity2_minutes = random.randint(15, 40)
-        activity3_minutes = random.randint(10, 30)
+        activity1_minutes = self.rng.randint(20, 45)
+        activity2_minutes = self.rng.randint(15, 40)
+        activity3_minutes = self.rng.randint(10, 30)
 
         total_minutes = activity1_minutes + activity2_minutes + activity3_minutes
         end_hour, end_minute = self._add_minutes(start_hour, start_minute, total_minutes)
@@ -216,7 +212,7 @@ class ElapsedTimeGenerator:
             ['warm-up', 'practice', 'cool-down']
         ]
 
-        chosen_activities = random.choice(activities)
+        chosen_activities = self.rng.choice(activities)
 
         latex = (f"\\text{{Sarah started at {start_time}. She spent {activity1_minutes} minutes on {chosen_activities[0]}, "
                 f"{activity2_minutes} minutes on {chosen_activities[1]}, and {activity3_minutes} minutes on {chosen_activities[2]}. "
@@ -6,9 +6,6 @@ Focuses on time to the nearest minute using 12-hour format with AM/PM
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class TellingTimeGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -54,14 +50,14 @@ class TellingTimeGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: reading time to the hour or half hour."""
-        hour = random.randint(1, 12)
-        minute = random.choice([0, 30])  # On the hour or half hour
-        am_pm = random.choice(['AM', 'PM'])
+        hour = self.rng.randint(1, 12)
+        minute = self.rng.choice([0, 30])  # On the hour or half hour
+        am_pm = self.rng.choice(['AM', 'PM'])
 
         time_str = self._format_time(hour, minute, am_pm)
 
         # Different question types
-        question_type = random.choice(['analog', 'digital'])
+        question_type = self.rng.choice(['analog', 'digital'])
 
         if question_type == 'analog':
             if minute == 0:
@@ -82,14 +78,14 @@ class TellingTimeGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: reading time to 5-minute intervals."""
-        hour = random.randint(1, 12)
-        minute = random.choice([0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55])
-        am_pm = random.choice(['AM', 'PM'])
+        hour = self.rng.randint(1, 12)
+        minute = self.rng.choice([0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55])
+        am_pm = self.rng.choice(['AM', 'PM'])
 
         time_str = self._format_time(hour, minute, am_pm)
 
         # Different question types
-        question_type = random.choice(['read', 'convert'])
+        question_type = self.rng.choice(['read', 'convert'])
 
         if question_type == 'read':
             minute_marker = minute // 5
@@ -113,9 +109,9 @@ class TellingTimeGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: reading time to the nearest minute."""
-        hour = random.randint(1, 12)
-        minute = random.randint(0, 59)
-        am_pm = random.choice(['AM', 'PM'])
+        hour = self.rng.randint(1, 12)
+        minute = self.rng.randint(0, 59)
+        am_pm = self.rng.choice(['AM', 'PM'])
 
         time_str = self._format_time(hour, minute, am_pm)
 
@@ -127,7 +123,7 @@ class TellingTimeGenerator:
             f"\\text{{What time is shown on the classroom clock?}}"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"{context} \\text{{ (Answer in format HH:MM AM/PM)}}"
         solution = time_str
 
@@ -144,13 +140,13 @@ class TellingTimeGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: comparing times or reasoning."""
-        hour1 = random.randint(1, 12)
-        minute1 = random.randint(0, 59)
-        am_pm1 = random.choice(['AM', 'PM'])
+        hour1 = self.rng.randint(1, 12)
+        minute1 = self.rng.randint(0, 59)
+        am_pm1 = self.rng.choice(['AM', 'PM'])
 
         # Generate second time that's different
-        hour2 = random.randint(1, 12)
-        minute2 = random.randint(0, 59)
+        hour2 = self.rng.randint(1, 12)
+        minute2 = self.rng.randint(0, 59)
         am_pm2 = am_pm1  # Keep same AM/PM for easier comparison
 
         time1_str = self._format_time(hour1, minute1, am_pm1)
@@ -166,7 +162,7 @@ class TellingTimeGenerator:
             later_time = time2_str
 
         # Different challenge types
-        challenge_type = random.choice(['compare', 'reasoning'])
+        challenge_type = self.rng.choice(['compare', 'reasoning'])
 
         if challenge_type == 'compare':
             latex = f"\\text{{Which time is later: {time1_str} or {time2_str}?}}"
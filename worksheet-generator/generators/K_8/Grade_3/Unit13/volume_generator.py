@@ -6,9 +6,6 @@ Focuses on conversions and comparing volumes
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class VolumeGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,30 +46,30 @@ class VolumeGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: reading volume measurements."""
-        problem_type = random.choice(['identify', 'compare'])
+        problem_type = self.rng.choice(['identify', 'compare'])
 
         if problem_type == 'identify':
             # Choose appropriate unit for common liquids
             liquids_ml = ['medicine', 'eyedrops', 'perfume', 'food coloring']
             liquids_l = ['milk', 'water bottle', 'juice', 'soda', 'soup']
 
-            if random.choice([True, False]):
-                liquid = random.choice(liquids_ml)
-                volume = random.randint(5, 100)
+            if self.rng.choice([True, False]):
+                liquid = self.rng.choice(liquids_ml)
+                volume = self.rng.randint(5, 100)
                 unit = 'milliliters'
             else:
-                liquid = random.choice(liquids_l)
-                volume = random.randint(1, 5)
+                liquid = self.rng.choice(liquids_l)
+                volume = self.rng.randint(1, 5)
                 unit = 'liters'
 
             latex = f"\\text{{A bottle of {liquid} contains {volume} {unit}. Write the volume with its unit.}}"
             solution = f"{volume} {unit}"
 
         else:  # compare
-            volume1 = random.randint(100, 900)
-            volume2 = random.randint(100, 900)
+            volume1 = self.rng.randint(100, 900)
+            volume2 = self.rng.randint(100, 900)
             while volume1 == volume2:
-                volume2 = random.randint(100, 900)
+                volume2 = self.rng.randint(100, 900)
 
             latex = f"\\text{{Which holds more: {volume1} milliliters or {volume2} milliliters?}}"
             solution = f"{max(volume1, volume2)} milliliters"
@@ -87,33 +83,33 @@ class VolumeGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: simple conversions and addition."""
-        problem_type = random.choice(['convert', 'add'])
+        problem_type = self.rng.choice(['convert', 'add'])
 
         if problem_type == 'convert':
             # Convert between liters and milliliters
-            if random.choice([True, False]):
+            if self.rng.choice([True, False]):
                 # liters to ml
-                liters = random.randint(1, 10)
+                liters = self.rng.randint(1, 10)
                 ml = liters * 1000
                 latex = f"\\text{{Convert {liters} liters to milliliters.}}"
                 solution = f"{ml} milliliters"
                 steps = [f"\\text{{{liters} L = {liters} \\times 1000 = {ml} milliliters}}"]
             else:
                 # ml to liters
-                liters = random.randint(2, 9)
+                liters = self.rng.randint(2, 9)
                 ml = liters * 1000
                 latex = f"\\text{{Convert {ml} milliliters to liters.}}"
                 solution = f"{liters} liters"
                 steps = [f"\\text{{{ml} mL = {ml} \\div 1000 = {liters} liters}}"]
 
         else:  # add
-            volume1 = random.randint(100, 500)
-            volume2 = random.randint(100, 500)
+            volume1 = self.rng.randint(100, 500)
+            volume2 = self.rng.randint(100, 500)
             total = volume1 + volume2
 
             containers = ['cup', 'glass', 'bottle', 'jar', 'container']
-            container1 = random.choice(containers)
-            container2 = random.choice([c for c in containers if c != container1])
+            container1 = self.rng.choice(containers)
+            container2 = self.rng.choice([c for c in containers if c != container1])
 
             latex = f"\\text{{A {container1} holds {volume1} milliliters and a {container2} holds {volume2} milliliters. What is the total volume?}}"
             solution = f"{total} milliliters"
@@ -128,15 +124,15 @@ class VolumeGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: word problems with conversions or multi-step."""
-        problem_type = random.choice(['conversion_word', 'multi_step'])
+        problem_type = self.rng.choice(['conversion_word', 'multi_step'])
 
         if problem_type == 'conversion_word':
-            liters = random.randint(2, 8)
-            extra_ml = random.randint(100, 900)
+            liters = self.rng.randint(2, 8)
+            extra_ml = self.rng.randint(100, 900)
             total_ml = liters * 1000 + extra_ml
 
             containers = ['juice pitcher', 'water jug', 'milk container', 'aquarium', 'bucket']
-            container = random.choice(containers)
+            container = self.rng.choice(containers)
 
             latex = f"\\text{{A {container} holds {liters} liters and {extra_ml} milliliters. What is its volume in milliliters?}}"
             solution = f"{total_ml} milliliters"
@@ -146,9 +142,9 @@ class VolumeGenerator:
             ]
 
         else:  # multi_step
-            volume1 = random.randint(200, 500)
-            volume2 = random.randint(200, 500)
-            volume3 = random.randint(200, 500)
+            volume1 = self.rng.randint(200, 500)
+            volume2 = self.rng.randint(200, 500)
+            volume3 = self.rng.randint(200, 500)
             total = volume1 + volume2 + volume3
 
             latex = f"\\text{{A recipe uses {volume1} mL of water, {volume2} mL of milk, and {volume3} mL of juice. What is the total volume of liquid?}}"
@@ -164,12 +160,12 @@ class VolumeGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex conversions or comparisons."""
-        problem_type = random.choice(['mixed_conversion', 'comparison', 'subtraction'])
+        problem_type = self.rng.choice(['mixed_conversion', 'comparison', 'subtraction'])
 
         if problem_type == 'mixed_conversion':
             # Multiple containers with different units
-            container1_l = random.randint(2, 5)
-            container2_ml = random.randint(500, 900)
+            container1_l = self.rng.randint(2, 5)
+            container2_ml = self.rng.randint(500, 900)
             total_ml = container1_l * 1000 + container2_ml
 
             latex = f"\\text{{Container A holds {container1_l} liters and Container B holds {container2_ml} milliliters. What is their combined volume in milliliters?}}"
@@ -181,8 +177,8 @@ class VolumeGenerator:
 
         elif problem_type == 'comparison':
             # Compare mixed units
-            volume1_l = random.randint(3, 8)
-            volume2_ml = random.randint(2000, 9000)
+            volume1_l = self.rng.randint(3, 8)
+            volume2_ml = self.rng.randint(2000, 9000)
 
             volume1_ml = volume1_l * 1000
 
@@ -205,8 +201,8 @@ class VolumeGenerator:
             ]
 
         else:  # subtraction
-            total_ml = random.randint(3000, 8000)
-            used_ml = random.randint(500, 2000)
+            total_ml = self.rng.randint(3000, 8000)
+            used_ml = self.rng.randint(500, 2000)
             remaining_ml = total_ml - used_ml
 
             latex = f"\\text{{A tank contains {total_ml} milliliters of water. If {used_ml} milliliters are used, how much water remains?}}"
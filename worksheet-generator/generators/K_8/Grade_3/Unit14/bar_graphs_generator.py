@@ -6,9 +6,6 @@ Focuses on data interpretation with scaled bar graphs
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class BarGraphsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -58,9 +54,9 @@ class BarGraphsGenerator:
             ['Soccer', 'Basketball', 'Baseball', 'Tennis', 'Swimming']
         ]
 
-        category_set = random.choice(category_sets)
-        categories = random.sample(category_set, min(num_categories, len(category_set)))
-        values = [random.randint(min_val, max_val) for _ in range(len(categories))]
+        category_set = self.rng.choice(category_sets)
+        categories = self.rng.sample(category_set, min(num_categories, len(category_set)))
+        values = [self.rng.randint(min_val, max_val) for _ in range(len(categories))]
         return list(zip(categories, values))
 
     def _generate_easy(self) -> Equation:
@@ -74,7 +70,7 @@ class BarGraphsGenerator:
             graph_text += f"{category}: Bar height = {value}\\n"
 
         # Ask simple reading question
-        target_category = random.choice(dataset)
+        target_category = self.rng.choice(dataset)
 
         latex = f"\\text{{{graph_text}What is the value for {target_category[0]}?}}"
         solution = str(target_category[1])
@@ -89,7 +85,7 @@ class BarGraphsGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium problems: reading with scales other than 1."""
         dataset = self._create_dataset(4, 10, 50)
-        scale = random.choice([2, 5, 10])
+        scale = self.rng.choice([2, 5, 10])
 
         # Adjust values to be multiples of scale
         dataset = [(cat, (val // scale) * scale) for cat, val in dataset]
@@ -100,17 +96,17 @@ class BarGraphsGenerator:
             bar_height = value // scale
             graph_text += f"{category}: Bar height = {bar_height} units\\n"
 
-        question_type = random.choice(['read', 'compare'])
+        question_type = self.rng.choice(['read', 'compare'])
 
         if question_type == 'read':
-            target_category = random.choice(dataset)
+            target_category = self.rng.choice(dataset)
             bar_height = target_category[1] // scale
             latex = f"\\text{{{graph_text}What value does {target_category[0]} represent?}}"
             solution = str(target_category[1])
             steps = [f"\\text{{{bar_height} units \\times {scale} = {target_category[1]}}}"]
         else:
             # Find highest/lowest
-            if random.choice([True, False]):
+            if self.rng.choice([True, False]):
                 target = max(dataset, key=lambda x: x[1])
                 question = "which category has the highest value"
             else:
@@ -131,7 +127,7 @@ class BarGraphsGenerator:
     def _generate_hard(self) -> Equation:
         """Generate hard problems: calculations using graph data."""
         dataset = self._create_dataset(4, 20, 60)
-        scale = random.choice([5, 10])
+        scale = self.rng.choice([5, 10])
 
         # Adjust values to be multiples of scale
         dataset = [(cat, (val // scale) * scale) for cat, val in dataset]
@@ -142,11 +138,11 @@ class BarGraphsGenerator:
             bar_height = value // scale
             graph_text += f"{category}: Bar height = {bar_height} units\\n"
 
-        question_type = random.choice(['sum', 'difference'])
+        question_type = self.rng.choice(['sum', 'difference'])
 
         if question_type == 'sum':
             # Sum of two categories
-            cat1, cat2 = random.sample(dataset, 2)
+            cat1, cat2 = self.rng.sample(dataset, 2)
             total = cat1[1] + cat2[1]
 
             latex = f"\\text{{{graph_text}What is the combined value of {cat1[0]} and {cat2[0]}?}}"
@@ -154,7 +150,7 @@ class BarGraphsGenerator:
             steps = [f"\\text{{{cat1[1]} + {cat2[1]} = {total}}}"]
         else:
             # Difference between two categories
-            cat1, cat2 = random.sample(dataset, 2)
+            cat1, cat2 = self.rng.sample(dataset, 2)
             if cat1[1] > cat2[1]:
                 diff = cat1[1] - cat2[1]
                 latex = f"\\text{{{graph_text}How much greater is {cat1[0]} than {cat2[0]}?}}"
@@ -186,7 +182,7 @@ class BarGraphsGenerator:
             bar_height = value // scale
             graph_text += f"{category}: Bar height = {bar_height} units\\n"
 
-        question_type = random.choice(['total', 'average', 'range'])
+        question_type = self.rng.choice(['total', 'average', 'range'])
 
         if question_type == 'total':
             # Sum of all categories
@@ -6,9 +6,6 @@ Focuses on fractions (halves, quarters) on number lines
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class LinePlotsWithFractionsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -67,8 +63,8 @@ class LinePlotsWithFractionsGenerator:
         """Create a dataset with fractional values."""
         values = []
         for _ in range(num_values):
-            whole = random.randint(0, max_whole)
-            fraction_part = random.randint(0, denominator - 1)
+            whole = self.rng.randint(0, max_whole)
+            fraction_part = self.rng.randint(0, denominator - 1)
             total_numerator = whole * denominator + fraction_part
             values.append((total_numerator, denominator))
         return values
@@ -76,7 +72,7 @@ class LinePlotsWithFractionsGenerator:
     def _generate_easy(self) -> Equation:
         """Generate easy problems: reading line plots with halves."""
         # Create dataset with halves
-        num_values = random.randint(5, 8)
+        num_values = self.rng.randint(5, 8)
         dataset = self._create_fractional_dataset(num_values, 2, 2)
 
         # Count occurrences
@@ -90,10 +86,10 @@ class LinePlotsWithFractionsGenerator:
             count = counts[(num, den)]
             plot_text += f"At {fraction_str}: {'X' * count}\\n"
 
-        question_type = random.choice(['count', 'most_common'])
+        question_type = self.rng.choice(['count', 'most_common'])
 
         if question_type == 'count':
-            target = random.choice(list(set(dataset)))
+            target = self.rng.choice(list(set(dataset)))
             fraction_str = self._fraction_to_string(target[0], target[1])
             latex = f"\\text{{{plot_text}How many measurements are at {fraction_str} inches?}}"
             solution = str(counts[target])
@@ -115,7 +111,7 @@ class LinePlotsWithFractionsGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium problems: line plots with quarters."""
         # Create dataset with quarters
-        num_values = random.randint(6, 10)
+        num_values = self.rng.randint(6, 10)
         dataset = self._create_fractional_dataset(num_values, 4, 2)
 
         # Count occurrences
@@ -129,7 +125,7 @@ class LinePlotsWithFractionsGenerator:
             count = counts[(num, den)]
             plot_text += f"At {fraction_str}: {'X' * count}\\n"
 
-        question_type = random.choice(['total_count', 'range'])
+        question_type = self.rng.choice(['total_count', 'range'])
 
         if question_type == 'total_count':
             total = len(dataset)
@@ -163,8 +159,8 @@ class LinePlotsWithFractionsGenerator:
     def _generate_hard(self) -> Equation:
         """Generate hard problems: creating line plots or analyzing data."""
         # Create dataset with halves or quarters
-        denominator = random.choice([2, 4])
-        num_values = random.randint(8, 12)
+        denominator = self.rng.choice([2, 4])
+        num_values = self.rng.randint(8, 12)
         dataset = self._create_fractional_dataset(num_values, denominator, 3)
 
         # Count occurrences
@@ -172,18 +168,18 @@ class LinePlotsWithFractionsGenerator:
         counts = Counter(dataset)
 
         # Create line plot representation
-        unit = random.choice(['inches', 'feet', 'pounds'])
+        unit = self.rng.choice(['inches', 'feet', 'pounds'])
         plot_text = f"Line Plot (Measurements in {unit}):\\n"
         for (num, den) in sorted(set(dataset)):
             fraction_str = self._fraction_to_string(num, den)
             count = counts[(num, den)]
             plot_text += f"At {fraction_str}: {'X' * count}\\n"
 
-        question_type = random.choice(['greater_than', 'sum_category'])
+        question_type = self.rng.choice(['greater_than', 'sum_category'])
 
         if question_type == 'greater_than':
             # Count values greater than a threshold
-            threshold = random.choice(sorted(set(dataset))[:-1])
+            threshold = self.rng.choice(sorted(set(dataset))[:-1])
             threshold_str = self._fraction_to_string(threshold[0], threshold[1])
 
             count_greater = sum(1 for (num, den) in dataset if num / den > threshold[0] / threshold[1])
@@ -193,7 +189,7 @@ class LinePlotsWithFractionsGenerator:
             steps = [f"\\text{{Count values > {threshold_str}: {count_greater}}}"]
         else:
             # Sum all values of a specific measurement
-            target = random.choice(list(set(dataset)))
+            target = self.rng.choice(list(set(dataset)))
             count = counts[target]
             fraction_str = self._fraction_to_string(target[0], target[1])
 
@@ -214,7 +210,7 @@ class LinePlotsWithFractionsGenerator:
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex analysis of line plot data."""
         # Create dataset with quarters
-        num_values = random.randint(10, 15)
+        num_values = self.rng.randint(10, 15)
         dataset = self._create_fractional_dataset(num_values, 4, 3)
 
         # Count occurrences
@@ -228,7 +224,7 @@ class LinePlotsWithFractionsGenerator:
             count = counts[(num, den)]
             plot_text += f"At {fraction_str}: {'X' * count}\\n"
 
-        question_type = random.choice(['total_sum', 'mode_count'])
+        question_type = self.rng.choice(['total_sum', 'mode_count'])
 
         if question_type == 'total_sum':
             # Sum all measurements
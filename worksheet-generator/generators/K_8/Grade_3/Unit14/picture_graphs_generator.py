@@ -6,9 +6,6 @@ Focuses on data interpretation with symbols representing values
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class PictureGraphsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,20 +46,20 @@ class PictureGraphsGenerator:
 
     def _create_dataset(self, num_categories: int, min_val: int, max_val: int):
         """Create a dataset for graph problems."""
-        categories = random.sample([
+        categories = self.rng.sample([
             'Apples', 'Oranges', 'Bananas', 'Grapes', 'Strawberries',
             'Red', 'Blue', 'Green', 'Yellow', 'Purple',
             'Dogs', 'Cats', 'Birds', 'Fish', 'Rabbits',
             'Soccer', 'Basketball', 'Baseball', 'Tennis', 'Swimming'
         ], num_categories)
 
-        values = [random.randint(min_val, max_val) for _ in range(num_categories)]
+        values = [self.rng.randint(min_val, max_val) for _ in range(num_categories)]
         return list(zip(categories, values))
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: reading values with each symbol = 1."""
         dataset = self._create_dataset(3, 2, 8)
-        symbol = random.choice(['star', 'heart', 'smiley face', 'apple', 'book'])
+        symbol = self.rng.choice(['star', 'heart', 'smiley face', 'apple', 'book'])
 
         # Create graph representation
         graph_text = f"Picture Graph (Each {symbol} = 1):\\n"
@@ -71,7 +67,7 @@ class PictureGraphsGenerator:
             graph_text += f"{category}: {value} {symbol}s\\n"
 
         # Ask simple reading question
-        target_category = random.choice(dataset)
+        target_category = self.rng.choice(dataset)
 
         latex = f"\\text{{{graph_text}How many {symbol}s are shown for {target_category[0]}?}}"
         solution = str(target_category[1])
@@ -86,8 +82,8 @@ class PictureGraphsGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium problems: symbols represent values other than 1."""
         dataset = self._create_dataset(4, 10, 40)
-        symbol = random.choice(['star', 'heart', 'circle', 'square', 'triangle'])
-        symbol_value = random.choice([2, 5, 10])
+        symbol = self.rng.choice(['star', 'heart', 'circle', 'square', 'triangle'])
+        symbol_value = self.rng.choice([2, 5, 10])
 
         # Adjust values to be multiples of symbol_value
         dataset = [(cat, (val // symbol_value) * symbol_value) for cat, val in dataset]
@@ -98,16 +94,16 @@ class PictureGraphsGenerator:
             num_symbols = value // symbol_value
             graph_text += f"{category}: {num_symbols} {symbol}s\\n"
 
-        question_type = random.choice(['read', 'compare'])
+        question_type = self.rng.choice(['read', 'compare'])
 
         if question_type == 'read':
-            target_category = random.choice(dataset)
+            target_category = self.rng.choice(dataset)
             latex = f"\\text{{{graph_text}How many does {target_category[0]} represent?}}"
             solution = str(target_category[1])
             steps = [f"\\text{{{target_category[1] // symbol_value} {symbol}s \\times {symbol_value} = {target_category[1]}}}"]
         else:
             # Find most/least
-            if random.choice([True, False]):
+            if self.rng.choice([True, False]):
                 target = max(dataset, key=lambda x: x[1])
                 question = "which category has the most"
             else:
@@ -128,8 +124,8 @@ class PictureGraphsGenerator:
     def _generate_hard(self) -> Equation:
         """Generate hard problems: calculations using graph data."""
         dataset = self._create_dataset(4, 15, 35)
-        symbol = random.choice(['star', 'heart', 'circle', 'flower'])
-        symbol_value = random.choice([5, 10])
+        symbol = self.rng.choice(['star', 'heart', 'circle', 'flower'])
+        symbol_value = self.rng.choice([5, 10])
 
         # Adjust values to be multiples of symbol_value
         dataset = [(cat, (val // symbol_value) * symbol_value) for cat, val in dataset]
@@ -140,11 +136,11 @@ class PictureGraphsGenerator:
             num_symbols = value // symbol_value
             graph_text += f"{category}: {num_symbols} {symbol}s\\n"
 
-        question_type = random.choice(['total', 'difference'])
+        question_type = self.rng.choice(['total', 'difference'])
 
         if question_type == 'total':
             # Sum of two categories
-            cat1, cat2 = random.sample(dataset, 2)
+            cat1, cat2 = self.rng.sample(dataset, 2)
             total = cat1[1] + cat2[1]
 
             latex = f"\\text{{{graph_text}How many {cat1[0]} and {cat2[0]} combined?}}"
@@ -152,7 +148,7 @@ class PictureGraphsGenerator:
             steps = [f"\\text{{{cat1[1]} + {cat2[1]} = {total}}}"]
         else:
             # Difference between two categories
-            cat1, cat2 = random.sample(dataset, 2)
+            cat1, cat2 = self.rng.sample(dataset, 2)
             if cat1[1] > cat2[1]:
                 diff = cat1[1] - cat2[1]
                 latex = f"\\text{{{graph_text}How many more {cat1[0]} than {cat2[0]}?}}"
@@ -173,8 +169,8 @@ class PictureGraphsGenerator:
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: multi-step reasoning."""
         dataset = self._create_dataset(5, 20, 50)
-        symbol = random.choice(['star', 'heart', 'circle', 'square'])
-        symbol_value = random.choice([5, 10])
+        symbol = self.rng.choice(['star', 'heart', 'circle', 'square'])
+        symbol_value = self.rng.choice([5, 10])
 
         # Adjust values to be multiples of symbol_value
         dataset = [(cat, (val // symbol_value) * symbol_value) for cat, val in dataset]
@@ -185,7 +181,7 @@ class PictureGraphsGenerator:
             num_symbols = value // symbol_value
             graph_text += f"{category}: {num_symbols} {symbol}s\\n"
 
-        question_type = random.choice(['total_all', 'average', 'ratio'])
+        question_type = self.rng.choice(['total_all', 'average', 'ratio'])
 
         if question_type == 'total_all':
             # Sum of all categories
@@ -205,7 +201,7 @@ class PictureGraphsGenerator:
             ]
         else:
             # Ratio comparison
-            cat1, cat2 = random.sample(dataset, 2)
+            cat1, cat2 = self.rng.sample(dataset, 2)
             if cat1[1] > cat2[1]:
                 times = cat1[1] // cat2[1] if cat2[1] != 0 else 1
                 latex = f"\\text{{{graph_text}About how many times more {cat1[0]} than {cat2[0]}?}}"
@@ -6,9 +6,6 @@ Example: Compare: 3,527 __ 3,572 (>, <, or =)
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class ComparingMultiDigitNumbersGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,10 +46,10 @@ class ComparingMultiDigitNumbersGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: 3-digit numbers with clear differences."""
-        num1 = random.randint(100, 999)
+        num1 = self.rng.randint(100, 999)
         # Make sure num2 is clearly different
-        difference = random.randint(50, 200)
-        if random.choice([True, False]):
+        difference = self.rng.randint(50, 200)
+        if self.rng.choice([True, False]):
             num2 = num1 + difference
         else:
             num2 = max(100, num1 - difference)
@@ -80,13 +76,13 @@ class ComparingMultiDigitNumbersGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: 4-digit numbers."""
-        num1 = random.randint(1000, 9999)
+        num1 = self.rng.randint(1000, 9999)
         # Create num2 by changing one digit
         num1_str = str(num1)
         digits = list(num1_str)
-        pos = random.randint(0, len(digits) - 1)
+        pos = self.rng.randint(0, len(digits) - 1)
         old_digit = int(digits[pos])
-        new_digit = random.choice([d for d in range(10) if d != old_digit])
+        new_digit = self.rng.choice([d for d in range(10) if d != old_digit])
         digits[pos] = str(new_digit)
         num2 = int(''.join(digits))
 
@@ -114,10 +110,10 @@ class ComparingMultiDigitNumbersGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: 5-6 digit numbers with close values."""
-        num1 = random.randint(10000, 999999)
+        num1 = self.rng.randint(10000, 999999)
         # Create a close number
-        difference = random.randint(1, 100)
-        if random.choice([True, False]):
+        difference = self.rng.randint(1, 100)
+        if self.rng.choice([True, False]):
             num2 = num1 + difference
         else:
             num2 = num1 - difference
@@ -147,7 +143,7 @@ class ComparingMultiDigitNumbersGenerator:
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: ordering multiple numbers."""
         # Generate 3 different numbers
-        numbers = random.sample(range(1000, 9999), 3)
+        numbers = self.rng.sample(range(1000, 9999), 3)
 
         latex = f"\\text{{Order from least to greatest: }} {numbers[0]:,}, {numbers[1]:,}, {numbers[2]:,}"
         sorted_nums = sorted(numbers)
@@ -6,9 +6,6 @@ Example: 500 is 10 times as much as what number?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class How10RelatesToPlaceValueGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,7 +46,7 @@ class How10RelatesToPlaceValueGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: 10 times a 1-digit number."""
-        base = random.randint(1, 9)
+        base = self.rng.randint(1, 9)
         result = base * 10
 
         latex = f"{base} \\times 10 = ?"
@@ -70,10 +66,10 @@ class How10RelatesToPlaceValueGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: finding what number times 10 gives result."""
-        base = random.randint(2, 99)
+        base = self.rng.randint(2, 99)
         result = base * 10
 
-        problem_type = random.choice(['forward', 'backward'])
+        problem_type = self.rng.choice(['forward', 'backward'])
 
         if problem_type == 'forward':
             latex = f"{base} \\times 10 = ?"
@@ -98,9 +94,9 @@ class How10RelatesToPlaceValueGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: comparing place values."""
-        base = random.randint(100, 999)
+        base = self.rng.randint(100, 999)
 
-        problem_type = random.choice(['ten_times', 'one_tenth'])
+        problem_type = self.rng.choice(['ten_times', 'one_tenth'])
 
         if problem_type == 'ten_times':
             result = base * 10
@@ -128,9 +124,9 @@ class How10RelatesToPlaceValueGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: multi-step or comparison problems."""
-        base = random.randint(10, 99)
+        base = self.rng.randint(10, 99)
 
-        problem_type = random.choice(['100_times', 'comparison'])
+        problem_type = self.rng.choice(['100_times', 'comparison'])
 
         if problem_type == '100_times':
             result = base * 100
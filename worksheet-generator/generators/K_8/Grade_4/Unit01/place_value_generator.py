@@ -6,9 +6,6 @@ Example: What is the value of the digit 5 in 3,527?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class PlaceValueGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,9 +46,9 @@ class PlaceValueGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: 3-digit numbers."""
-        number = random.randint(100, 999)
+        number = self.rng.randint(100, 999)
         digits = [int(d) for d in str(number)]
-        place = random.choice(['hundreds', 'tens', 'ones'])
+        place = self.rng.choice(['hundreds', 'tens', 'ones'])
 
         if place == 'hundreds':
             digit = digits[0]
@@ -82,9 +78,9 @@ class PlaceValueGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: 4-digit numbers."""
-        number = random.randint(1000, 9999)
+        number = self.rng.randint(1000, 9999)
         digits = [int(d) for d in str(number)]
-        place = random.choice(['thousands', 'hundreds', 'tens', 'ones'])
+        place = self.rng.choice(['thousands', 'hundreds', 'tens', 'ones'])
 
         place_map = {
             'thousands': (digits[0], digits[0] * 1000),
@@ -113,7 +109,7 @@ class PlaceValueGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: 5-6 digit numbers."""
-        number = random.randint(10000, 999999)
+        number = self.rng.randint(10000, 999999)
         num_str = str(number)
         digits = [int(d) for d in num_str]
 
@@ -125,7 +121,7 @@ class PlaceValueGenerator:
             places = ['hundred thousands', 'ten thousands', 'thousands', 'hundreds', 'tens', 'ones']
             multipliers = [100000, 10000, 1000, 100, 10, 1]
 
-        idx = random.randint(0, len(digits) - 1)
+        idx = self.rng.randint(0, len(digits) - 1)
         digit = digits[idx]
         place = places[idx]
         value = digit * multipliers[idx]
@@ -148,12 +144,12 @@ class PlaceValueGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: comparing values of different digits."""
-        number = random.randint(10000, 999999)
+        number = self.rng.randint(10000, 999999)
         num_str = str(number)
         digits = [int(d) for d in num_str]
 
         # Pick two different positions
-        idx1, idx2 = random.sample(range(len(digits)), 2)
+        idx1, idx2 = self.rng.sample(range(len(digits)), 2)
 
         if len(num_str) == 5:
             places = ['ten thousands', 'thousands', 'hundreds', 'tens', 'ones']
@@ -6,9 +6,6 @@ Example: Regroup 3,527 as 35 hundreds and 27 ones
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class RegroupingWholeNumbersGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,7 +46,7 @@ class RegroupingWholeNumbersGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: regroup 3-digit numbers."""
-        number = random.randint(100, 999)
+        number = self.rng.randint(100, 999)
 
         # Regroup into tens and ones
         tens = number // 10
@@ -75,9 +71,9 @@ class RegroupingWholeNumbersGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: regroup 4-digit numbers into different units."""
-        number = random.randint(1000, 9999)
+        number = self.rng.randint(1000, 9999)
 
-        regroup_type = random.choice(['hundreds', 'tens'])
+        regroup_type = self.rng.choice(['hundreds', 'tens'])
 
         if regroup_type == 'hundreds':
             hundreds = number // 100
@@ -104,7 +100,7 @@ class RegroupingWholeNumbersGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: regroup with specific constraints."""
-        number = random.randint(1000, 9999)
+        number = self.rng.randint(1000, 9999)
 
         # Ask to regroup in a specific way
         choices = [
@@ -113,7 +109,7 @@ class RegroupingWholeNumbersGenerator:
             ('tens', lambda n: f"{n // 10} tens")
         ]
 
-        choice_name, choice_func = random.choice(choices)
+        choice_name, choice_func = self.rng.choice(choices)
         latex = f"\\text{{Regroup }} {number:,} \\text{{ as }} {choice_name}"
         solution = choice_func(number)
 
@@ -131,13 +127,13 @@ class RegroupingWholeNumbersGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: multiple regroupings or word problems."""
-        number = random.randint(2000, 9999)
+        number = self.rng.randint(2000, 9999)
 
         # Regroup in unusual ways
         hundreds = number // 100
         tens = number // 10
 
-        problem_type = random.choice(['unusual', 'comparison'])
+        problem_type = self.rng.choice(['unusual', 'comparison'])
 
         if problem_type == 'unusual':
             latex = f"\\text{{How many tens are in }} {number:,}?"
@@ -6,9 +6,6 @@ Example: Write 3,527 in expanded form: 3,000 + 500 + 20 + 7
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class WritingWholeNumbersInExpandedFormGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,7 +46,7 @@ class WritingWholeNumbersInExpandedFormGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: 3-digit numbers."""
-        number = random.randint(100, 999)
+        number = self.rng.randint(100, 999)
         digits = [int(d) for d in str(number)]
 
         parts = []
@@ -81,7 +77,7 @@ class WritingWholeNumbersInExpandedFormGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: 4-digit numbers."""
-        number = random.randint(1000, 9999)
+        number = self.rng.randint(1000, 9999)
         digits = [int(d) for d in str(number)]
 
         parts = []
@@ -111,7 +107,7 @@ class WritingWholeNumbersInExpandedFormGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: 5-6 digit numbers."""
-        number = random.randint(10000, 999999)
+        number = self.rng.randint(10000, 999999)
         num_str = str(number)
         digits = [int(d) for d in num_str]
 
@@ -142,7 +138,7 @@ class WritingWholeNumbersInExpandedFormGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: reverse - given expanded form, find number."""
-        number = random.randint(1000, 99999)
+        number = self.rng.randint(1000, 99999)
         num_str = str(number)
         digits = [int(d) for d in num_str]
 
@@ -6,9 +6,6 @@ Example: Write 3,527 in words: three thousand, five hundred twenty-seven
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class WritingWholeNumbersInWrittenFormGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def _number_to_words(self, n: int) -> str:
         """Convert a number to words."""
@@ -101,7 +97,7 @@ class WritingWholeNumbersInWrittenFormGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: 2-3 digit numbers."""
-        number = random.randint(10, 999)
+        number = self.rng.randint(10, 999)
         words = self._number_to_words(number)
 
         latex = f"\\text{{Write }} {number:,} \\text{{ in words}}"
@@ -121,7 +117,7 @@ class WritingWholeNumbersInWrittenFormGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: 4-digit numbers."""
-        number = random.randint(1000, 9999)
+        number = self.rng.randint(1000, 9999)
         words = self._number_to_words(number)
 
         latex = f"\\text{{Write }} {number:,} \\text{{ in words}}"
@@ -141,7 +137,7 @@ class WritingWholeNumbersInWrittenFormGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: 5-6 digit numbers."""
-        number = random.randint(10000, 999999)
+        number = self.rng.randint(10000, 999999)
         words = self._number_to_words(number)
 
         latex = f"\\text{{Write }} {number:,} \\text{{ in words}}"
@@ -161,7 +157,7 @@ class WritingWholeNumbersInWrittenFormGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: reverse - words to numbers."""
-        number = random.randint(1000, 99999)
+        number = self.rng.randint(1000, 99999)
         words = self._number_to_words(number)
 
         latex = f"\\text{{Write the number: }} {words}"
@@ -5,11 +5,20 @@ Example: 3,527 + 1,845 = ?
 """
 
 import random
+from functools import partial
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
+from bulk_generation import ProblemBatch, join_columns, numpy_rng, with_commas
+
+# Ranges of the two addends per difficulty; shared by generate_worksheet and generate_bulk
+ADDENDS = {
+    # 3-digit, with the second addend's ones and tens redrawn so no column regroups
+    'easy': ((100, 400), (100, 400)),
+    # 4-digit, with regrouping
+    'medium': ((1000, 9999), (1000, 9999)),
+    # 5-digit
+    'hard': ((10000, 99999), (10000, 99999)),
+}
 
 
 class AddingMultiDigitNumbersGenerator:
@@ -17,8 +26,7 @@ class AddingMultiDigitNumbersGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -39,97 +47,48 @@ class AddingMultiDigitNumbersGenerator:
 
     def _generate_problem(self, difficulty: str) -> Equation:
         """Generate a single problem."""
-        if difficulty == 'easy':
-            return self._generate_easy()
-        elif difficulty == 'medium':
-            return self._generate_medium()
-        elif difficulty == 'hard':
-            return self._generate_hard()
-        else:
-            return self._generate_challenge()
-
-    def _generate_easy(self) -> Equation:
-        """Generate easy problems: 3-digit addition, no regrouping."""
-        # Ensure no regrouping by controlling digit sums
-        num1 = random.randint(100, 400)
-        num2 = random.randint(100, 400)
-
-        # Adjust to avoid regrouping
-        n1_str = str(num1)
-        n2_str = str(num2)
-        digits1 = [int(d) for d in n1_str]
-        digits2 = [int(d) for d in n2_str]
-
-        # Adjust ones place
-        if digits1[2] + digits2[2] >= 10:
-            digits2[2] = random.randint(0, 9 - digits1[2])
-
-        # Adjust tens place
-        if digits1[1] + digits2[1] >= 10:
-            digits2[1] = random.randint(0, 9 - digits1[1])
-
-        num2 = int(''.join(map(str, digits2)))
-        sum_result = num1 + num2
-
-        latex = f"{num1:,} + {num2:,} = ?"
-        solution = f"{sum_result:,}"
-
-        steps = [
-            f"{num1:,} + {num2:,} = {sum_result:,}"
-        ]
-
-        return Equation(
-            latex=latex,
-            solution=solution,
-            steps=steps,
-            difficulty='easy'
-        )
-
-    def _generate_medium(self) -> Equation:
-        """Generate medium problems: 4-digit addition with regrouping."""
-        num1 = random.randint(1000, 9999)
-        num2 = random.randint(1000, 9999)
-        sum_result = num1 + num2
-
-        latex = f"{num1:,} + {num2:,} = ?"
-        solution = f"{sum_result:,}"
-
-        steps = [
-            f"{num1:,} + {num2:,} = {sum_result:,}"
-        ]
+        if difficulty in ADDENDS:
+            return self._generate_computation(difficulty)
+        return self._generate_challenge()
+
+    def _get_steps(self, difficulty: str, num1: int, num2: int) -> List[str]:
+        """Steps for num1 + num2."""
+        steps = [f"{num1:,} + {num2:,} = {num1 + num2:,}"]
+        if difficulty == 'hard':
+            steps.insert(0, "\\text{Add from right to left, regrouping as needed}")
+        return steps
+
+    def _generate_computation(self, difficulty: str) -> Equation:
+        """Generate an easy, medium or hard problem from ADDENDS."""
+        first, second = ADDENDS[difficulty]
+        num1 = self.rng.randint(*first)
+        num2 = self.rng.randint(*second)
 
-        return Equation(
-            latex=latex,
-            solution=solution,
-            steps=steps,
-            difficulty='medium'
-        )
+        if difficulty == 'easy':
+            # Redraw the second addend's ones, then tens, digit where the column would regroup
+            digits1 = [int(d) for d in str(num1)]
+            digits2 = [int(d) for d in str(num2)]
+            for i in (2, 1):
+                if digits1[i] + digits2[i] >= 10:
+                    digits2[i] = self.rng.randint(0, 9 - digits1[i])
+            num2 = int(''.join(map(str, digits2)))
 
-    def _generate_hard(self) -> Equation:
-        """Generate hard problems: 5-digit addition."""
-        num1 = random.randint(10000, 99999)
-        num2 = random.randint(10000, 99999)
         sum_result = num1 + num2
 
         latex = f"{num1:,} + {num2:,} = ?"
         solution = f"{sum_result:,}"
 
-        steps = [
-            f"\\text{{Add from right to left, regrouping as needed}}",
-            f"{num1:,} + {num2:,} = {sum_result:,}"
-        ]
-
         return Equation(
             latex=latex,
             solution=solution,
-            steps=steps,
-            difficulty='hard'
+            steps=self._get_steps(difficulty, num1, num2),
+            difficulty=difficulty
         )
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: word problems with addition."""
-        num1 = random.randint(1500, 9999)
-        num2 = random.randint(1500, 9999)
+        num1 = self.rng.randint(1500, 9999)
+        num2 = self.rng.randint(1500, 9999)
         sum_result = num1 + num2
 
         contexts = [
@@ -139,7 +98,7 @@ class AddingMultiDigitNumbersGenerator:
             f"In 2020, a city had {num1:,} residents. {num2:,} more moved in. What's the new population?"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
 
         latex = f"\\text{{{context}}}"
         solution = f"{sum_result:,}"
@@ -156,6 +115,40 @@ class AddingMultiDigitNumbersGenerator:
         )
 
 
+    def generate_bulk(self, difficulty: str, count: int) -> ProblemBatch:
+        """
+        Generate many problems at once with NumPy (see bulk_generation).
+
+        Draws from the same problems as generate_worksheet; challenge word
+        problems are generated one by one.
+
+        Args:
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            count: Number of problems to generate
+
+        Returns:
+            ProblemBatch of the problems
+        """
+        if difficulty not in ADDENDS:
+            return ProblemBatch.from_equations(self.generate_worksheet(difficulty, count), difficulty)
+
+        np_rng = numpy_rng(self.rng)
+        first, second = ADDENDS[difficulty]
+        num1 = np_rng.integers(first[0], first[1], count, endpoint=True)
+        num2 = np_rng.integers(second[0], second[1], count, endpoint=True)
+
+        if difficulty == 'easy':
+            for place in (1, 10):
+                digit1 = num1 // place % 10
+                digit2 = num2 // place % 10
+                redrawn = np_rng.integers(0, 9 - digit1, endpoint=True)
+                num2 += (redrawn - digit2) * place * (digit1 + digit2 >= 10)
+
+        sums = num1 + num2
+        latex = join_columns(with_commas(num1), " + ", with_commas(num2), " = ?")
+        return ProblemBatch(difficulty, latex, sums, {'num1': num1, 'num2': num2},
+                            solutions=with_commas(sums), steps=partial(self._get_steps, difficulty))
+
 def main():
     """Test the generator."""
     generator = AddingMultiDigitNumbersGenerator()
@@ -5,11 +5,21 @@ Example: Round 4,527 to the nearest hundred
 """
 
 import random
+from functools import partial
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
+from bulk_generation import ProblemBatch, join_columns, numpy_rng, pick, round_half_up, with_commas
+
+# Range of the numbers to round and the places they are rounded to, per
+# difficulty; shared by generate_worksheet and generate_bulk
+NUMBERS = {
+    # 3-digit numbers to the nearest 10
+    'easy': ((100, 999), [10]),
+    # 4-digit numbers to the nearest 10, 100 or 1000
+    'medium': ((1000, 9999), [10, 100, 1000]),
+    # 5-6 digit numbers
+    'hard': ((10000, 999999), [10, 100, 1000, 10000]),
+}
 
 
 class RoundingWholeNumbersGenerator:
@@ -17,8 +27,7 @@ class RoundingWholeNumbersGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -39,114 +48,59 @@ class RoundingWholeNumbersGenerator:
 
     def _generate_problem(self, difficulty: str) -> Equation:
         """Generate a single problem."""
-        if difficulty == 'easy':
-            return self._generate_easy()
-        elif difficulty == 'medium':
-            return self._generate_medium()
-        elif difficulty == 'hard':
-            return self._generate_hard()
-        else:
-            return self._generate_challenge()
-
-    def _generate_easy(self) -> Equation:
-        """Generate easy problems: round 3-digit numbers to nearest 10."""
-        number = random.randint(100, 999)
-        ones = number % 10
-
-        if ones < 5:
-            rounded = (number // 10) * 10
-        else:
-            rounded = ((number // 10) + 1) * 10
-
-        latex = f"\\text{{Round }} {number:,} \\text{{ to the nearest 10}}"
-        solution = str(rounded)
-
-        steps = [
-            f"\\text{{Look at the ones digit: }} {ones}",
-            f"\\text{{Since }} {ones} {'\\lt 5' if ones < 5 else '\\geq 5'}, \\text{{ round }} {'down' if ones < 5 else 'up'}",
-            f"{number:,} \\text{{ rounds to }} {rounded:,}"
-        ]
-
-        return Equation(
-            latex=latex,
-            solution=solution,
-            steps=steps,
-            difficulty='easy'
-        )
+        if difficulty in NUMBERS:
+            return self._generate_rounding(difficulty)
+        return self._generate_challenge()
 
-    def _generate_medium(self) -> Equation:
-        """Generate medium problems: round 4-digit numbers to nearest 10, 100, or 1000."""
-        number = random.randint(1000, 9999)
-        round_to = random.choice([10, 100, 1000])
-
-        if round_to == 10:
-            key_digit = number % 10
-            if key_digit < 5:
-                rounded = (number // 10) * 10
-            else:
-                rounded = ((number // 10) + 1) * 10
-        elif round_to == 100:
-            key_digit = (number // 10) % 10
-            if key_digit < 5:
-                rounded = (number // 100) * 100
-            else:
-                rounded = ((number // 100) + 1) * 100
-        else:  # 1000
-            key_digit = (number // 100) % 10
-            if key_digit < 5:
-                rounded = (number // 1000) * 1000
-            else:
-                rounded = ((number // 1000) + 1) * 1000
-
-        latex = f"\\text{{Round }} {number:,} \\text{{ to the nearest }} {round_to:,}"
-        solution = f"{rounded:,}"
+    def _get_rounding_steps(self, difficulty: str, number: int, round_to: int) -> List[str]:
+        """Steps for rounding number to the nearest round_to."""
+        rounded = round_half_up(number, round_to)
+        key_digit = (number // (round_to // 10)) % 10
+        comparison = '\\lt 5' if key_digit < 5 else '\\geq 5'
+        direction = 'down' if key_digit < 5 else 'up'
 
-        steps = [
-            f"\\text{{Key digit: }} {key_digit}",
-            f"\\text{{Round }} {'down' if key_digit < 5 else 'up'}",
-            f"{number:,} \\text{{ rounds to }} {rounded:,}"
+        if difficulty == 'easy':
+            return [
+                f"\\text{{Look at the ones digit: }} {key_digit}",
+                f"\\text{{Since }} {key_digit} {comparison}, \\text{{ round }} {direction}",
+                f"{number:,} \\text{{ rounds to }} {rounded:,}"
+            ]
+        if difficulty == 'medium':
+            return [
+                f"\\text{{Key digit: }} {key_digit}",
+                f"\\text{{Round }} {direction}",
+                f"{number:,} \\text{{ rounds to }} {rounded:,}"
+            ]
+        return [
+            f"\\text{{Number: }} {number:,}",
+            f"\\text{{Rounded: }} {rounded:,}"
         ]
 
-        return Equation(
-            latex=latex,
-            solution=solution,
-            steps=steps,
-            difficulty='medium'
-        )
-
-    def _generate_hard(self) -> Equation:
-        """Generate hard problems: round 5-6 digit numbers."""
-        number = random.randint(10000, 999999)
-        round_to = random.choice([10, 100, 1000, 10000])
-
-        # Calculate rounding
-        key_position = round_to // 10
-        key_digit = (number // key_position) % 10
+    def _generate_rounding(self, difficulty: str) -> Equation:
+        """Generate an easy, medium or hard problem from NUMBERS."""
+        numbers, places = NUMBERS[difficulty]
+        number = self.rng.randint(*numbers)
+        round_to = pick(self.rng, places)
+        rounded = round_half_up(number, round_to)
 
-        if key_digit < 5:
-            rounded = (number // round_to) * round_to
+        if difficulty == 'easy':
+            latex = f"\\text{{Round }} {number:,} \\text{{ to the nearest 10}}"
+            solution = str(rounded)
         else:
-            rounded = ((number // round_to) + 1) * round_to
-
-        latex = f"\\text{{Round }} {number:,} \\text{{ to the nearest }} {round_to:,}"
-        solution = f"{rounded:,}"
-
-        steps = [
-            f"\\text{{Number: }} {number:,}",
-            f"\\text{{Rounded: }} {rounded:,}"
-        ]
+            latex = f"\\text{{Round }} {number:,} \\text{{ to the nearest }} {round_to:,}"
+            solution = f"{rounded:,}"
 
         return Equation(
             latex=latex,
             solution=solution,
-            steps=steps,
-            difficulty='hard'
+            steps=self._get_rounding_steps(difficulty, number, round_to),
+            difficulty=difficulty
         )
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: word problems with rounding."""
-        number = random.randint(1500, 9999)
-        round_to = random.choice([10, 100, 1000])
+        number = self.rng.randint(1500, 9999)
+        round_to = self.rng.choice([10, 100, 1000])
 
         contexts = [
             f"A stadium has {number:,} seats. Round to the nearest {round_to:,}",
@@ -155,7 +109,7 @@ class RoundingWholeNumbersGenerator:
             f"A town has {number:,} people. Round to the nearest {round_to:,}"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
 
         # Calculate rounding
         key_position = round_to // 10
@@ -183,6 +137,39 @@ class RoundingWholeNumbersGenerator:
         )
 
 
+    def generate_bulk(self, difficulty: str, count: int) -> ProblemBatch:
+        """
+        Generate many problems at once with NumPy (see bulk_generation).
+
+        Draws from the same problems as generate_worksheet; challenge word
+        problems are generated one by one.
+
+        Args:
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            count: Number of problems to generate
+
+        Returns:
+            ProblemBatch of the problems
+        """
+        if difficulty not in NUMBERS:
+            return ProblemBatch.from_equations(self.generate_worksheet(difficulty, count), difficulty)
+
+        np_rng = numpy_rng(self.rng)
+        numbers, places = NUMBERS[difficulty]
+        number = np_rng.integers(numbers[0], numbers[1], count, endpoint=True)
+        round_to = np_rng.choice(places, count)
+        rounded = round_half_up(number, round_to)
+
+        if difficulty == 'easy':
+            latex = join_columns("\\text{Round } ", with_commas(number), " \\text{ to the nearest 10}")
+            solutions = rounded.astype(str)
+        else:
+            latex = join_columns("\\text{Round } ", with_commas(number), " \\text{ to the nearest } ",
+                                 with_commas(round_to))
+            solutions = with_commas(rounded)
+        return ProblemBatch(difficulty, latex, rounded, {'number': number, 'round_to': round_to},
+                            solutions=solutions, steps=partial(self._get_rounding_steps, difficulty))
+
 def main():
     """Test the generator."""
     generator = RoundingWholeNumbersGenerator()
@@ -5,11 +5,21 @@ Example: 5,527 - 1,845 = ?
 """
 
 import random
+from functools import partial
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
+from bulk_generation import ProblemBatch, join_columns, numpy_rng, with_commas
+
+# Ranges of the subtrahend and of the minuend's excess over it, per difficulty;
+# shared by generate_worksheet and generate_bulk
+OPERANDS = {
+    # 3-digit, with the subtrahend's digits redrawn so no column borrows
+    'easy': ((100, 400), (100, 400)),
+    # 4-digit, with regrouping
+    'medium': ((1000, 5000), (1000, 4999)),
+    # 5-digit
+    'hard': ((10000, 50000), (10000, 49999)),
+}
 
 
 class SubtractingMultiDigitNumbersGenerator:
@@ -17,8 +27,7 @@ class SubtractingMultiDigitNumbersGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -39,93 +48,48 @@ class SubtractingMultiDigitNumbersGenerator:
 
     def _generate_problem(self, difficulty: str) -> Equation:
         """Generate a single problem."""
-        if difficulty == 'easy':
-            return self._generate_easy()
-        elif difficulty == 'medium':
-            return self._generate_medium()
-        elif difficulty == 'hard':
-            return self._generate_hard()
-        else:
-            return self._generate_challenge()
-
-    def _generate_easy(self) -> Equation:
-        """Generate easy problems: 3-digit subtraction, no regrouping."""
-        num2 = random.randint(100, 400)
-        num1 = num2 + random.randint(100, 400)
-
-        # Ensure no regrouping needed
-        n1_str = str(num1)
-        n2_str = str(num2)
-        digits1 = [int(d) for d in n1_str]
-        digits2 = [int(d) for d in n2_str]
-
-        # Adjust to avoid borrowing
-        for i in range(len(digits1)):
-            if digits1[i] < digits2[i]:
-                digits2[i] = random.randint(0, digits1[i])
-
-        num2 = int(''.join(map(str, digits2)))
-        difference = num1 - num2
-
-        latex = f"{num1:,} - {num2:,} = ?"
-        solution = f"{difference:,}"
-
-        steps = [
-            f"{num1:,} - {num2:,} = {difference:,}"
-        ]
-
-        return Equation(
-            latex=latex,
-            solution=solution,
-            steps=steps,
-            difficulty='easy'
-        )
-
-    def _generate_medium(self) -> Equation:
-        """Generate medium problems: 4-digit subtraction with regrouping."""
-        num2 = random.randint(1000, 5000)
-        num1 = num2 + random.randint(1000, 4999)
-        difference = num1 - num2
-
-        latex = f"{num1:,} - {num2:,} = ?"
-        solution = f"{difference:,}"
-
-        steps = [
-            f"{num1:,} - {num2:,} = {difference:,}"
-        ]
+        if difficulty in OPERANDS:
+            return self._generate_computation(difficulty)
+        return self._generate_challenge()
+
+    def _get_steps(self, difficulty: str, num1: int, num2: int) -> List[str]:
+        """Steps for num1 - num2."""
+        steps = [f"{num1:,} - {num2:,} = {num1 - num2:,}"]
+        if difficulty == 'hard':
+            steps.insert(0, "\\text{Subtract from right to left, regrouping as needed}")
+        return steps
+
+    def _generate_computation(self, difficulty: str) -> Equation:
+        """Generate an easy, medium or hard problem from OPERANDS."""
+        subtrahends, excess = OPERANDS[difficulty]
+        num2 = self.rng.randint(*subtrahends)
+        num1 = num2 + self.rng.randint(*excess)
 
-        return Equation(
-            latex=latex,
-            solution=solution,
-            steps=steps,
-            difficulty='medium'
-        )
+        if difficulty == 'easy':
+            # Redraw each subtrahend digit larger than the minuend's, so no column borrows
+            digits1 = [int(d) for d in str(num1)]
+            digits2 = [int(d) for d in str(num2)]
+            for i in range(len(digits1)):
+                if digits1[i] < digits2[i]:
+                    digits2[i] = self.rng.randint(0, digits1[i])
+            num2 = int(''.join(map(str, digits2)))
 
-    def _generate_hard(self) -> Equation:
-        """Generate hard problems: 5-digit subtraction."""
-        num2 = random.randint(10000, 50000)
-        num1 = num2 + random.randint(10000, 49999)
         difference = num1 - num2
 
         latex = f"{num1:,} - {num2:,} = ?"
         solution = f"{difference:,}"
 
-        steps = [
-            f"\\text{{Subtract from right to left, regrouping as needed}}",
-            f"{num1:,} - {num2:,} = {difference:,}"
-        ]
-
         return Equation(
             latex=latex,
             solution=solution,
-            steps=steps,
-            difficulty='hard'
+            steps=self._get_steps(difficulty, num1, num2),
+            difficulty=difficulty
         )
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: word problems with subtraction."""
-        num1 = random.randint(5000, 9999)
-        num2 = random.randint(1500, num1 - 100)
+        num1 = self.rng.randint(5000, 9999)
+        num2 = self.rng.randint(1500, num1 - 100)
         difference = num1 - num2
 
         contexts = [
@@ -135,7 +99,7 @@ class SubtractingMultiDigitNumbersGenerator:
             f"A town had {num1:,} residents. {num2:,} moved away. What's the new population?"
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
 
         latex = f"\\text{{{context}}}"
         solution = f"{difference:,}"
@@ -152,6 +116,40 @@ class SubtractingMultiDigitNumbersGenerator:
         )
 
 
+    def generate_bulk(self, difficulty: str, count: int) -> ProblemBatch:
+        """
+        Generate many problems at once with NumPy (see bulk_generation).
+
+        Draws from the same problems as generate_worksheet; challenge word
+        problems are generated one by one.
+
+        Args:
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            count: Number of problems to generate
+
+        Returns:
+            ProblemBatch of the problems
+        """
+        if difficulty not in OPERANDS:
+            return ProblemBatch.from_equations(self.generate_worksheet(difficulty, count), difficulty)
+
+        np_rng = numpy_rng(self.rng)
+        subtrahends, excess = OPERANDS[difficulty]
+        num2 = np_rng.integers(subtrahends[0], subtrahends[1], count, endpoint=True)
+        num1 = num2 + np_rng.integers(excess[0], excess[1], count, endpoint=True)
+
+        if difficulty == 'easy':
+            for place in (100, 10, 1):
+                digit1 = num1 // place % 10
+                digit2 = num2 // place % 10
+                redrawn = np_rng.integers(0, digit1, endpoint=True)
+                num2 += (redrawn - digit2) * place * (digit1 < digit2)
+
+        differences = num1 - num2
+        latex = join_columns(with_commas(num1), " - ", with_commas(num2), " = ?")
+        return ProblemBatch(difficulty, latex, differences, {'num1': num1, 'num2': num2},
+                            solutions=with_commas(differences), steps=partial(self._get_steps, difficulty))
+
 def main():
     """Test the generator."""
     generator = SubtractingMultiDigitNumbersGenerator()
@@ -6,9 +6,6 @@ Example: [Problem example]
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class EstimateProductsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -51,8 +47,8 @@ class EstimateProductsGenerator:
     def _generate_easy(self) -> Equation:
         """Generate easy problems."""
         # TODO: Implement easy problem generation
-        number1 = random.randint(1, 10)
-        number2 = random.randint(1, 10)
+        number1 = self.rng.randint(1, 10)
+        number2 = self.rng.randint(1, 10)
 
         latex = f"{number1} + {number2} = ?"
         solution = str(number1 + number2)
@@ -71,8 +67,8 @@ class EstimateProductsGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium problems."""
         # TODO: Implement medium problem generation
-        number1 = random.randint(10, 50)
-        number2 = random.randint(10, 50)
+        number1 = self.rng.randint(10, 50)
+        number2 = self.rng.randint(10, 50)
 
         latex = f"{number1} + {number2} = ?"
         solution = str(number1 + number2)
@@ -91,8 +87,8 @@ class EstimateProductsGenerator:
     def _generate_hard(self) -> Equation:
         """Generate hard problems."""
         # TODO: Implement hard problem generation
-        number1 = random.randint(50, 100)
-        number2 = random.randint(50, 100)
+        number1 = self.rng.randint(50, 100)
+        number2 = self.rng.randint(50, 100)
 
         latex = f"{number1} + {number2} = ?"
         solution = str(number1 + number2)
@@ -111,8 +107,8 @@ class EstimateProductsGenerator:
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems."""
         # TODO: Implement challenge problem generation
-        number1 = random.randint(100, 200)
-        number2 = random.randint(100, 200)
+        number1 = self.rng.randint(100, 200)
+        number2 = self.rng.randint(100, 200)
 
         latex = f"\\text{{Word problem with }} {number1} \\text{{ and }} {number2}"
         solution = str(number1 + number2)
@@ -6,9 +6,6 @@ Example: Which is greater: 0.45 or 0.5?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class ComparingDecimalsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,10 +46,10 @@ class ComparingDecimalsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: compare tenths."""
-        tenths1 = random.randint(1, 9)
-        tenths2 = random.randint(1, 9)
+        tenths1 = self.rng.randint(1, 9)
+        tenths2 = self.rng.randint(1, 9)
         while tenths2 == tenths1:
-            tenths2 = random.randint(1, 9)
+            tenths2 = self.rng.randint(1, 9)
 
         decimal1 = f"0.{tenths1}"
         decimal2 = f"0.{tenths2}"
@@ -79,13 +75,13 @@ class ComparingDecimalsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: compare hundredths."""
-        tenths1 = random.randint(1, 8)
-        hundredths1 = random.randint(0, 9)
+        tenths1 = self.rng.randint(1, 8)
+        hundredths1 = self.rng.randint(0, 9)
 
         tenths2 = tenths1
-        hundredths2 = random.randint(0, 9)
+        hundredths2 = self.rng.randint(0, 9)
         while hundredths2 == hundredths1:
-            hundredths2 = random.randint(0, 9)
+            hundredths2 = self.rng.randint(0, 9)
 
         decimal1 = f"0.{tenths1}{hundredths1}"
         decimal2 = f"0.{tenths2}{hundredths2}"
@@ -112,11 +108,11 @@ class ComparingDecimalsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: compare decimals with different numbers of places."""
-        tenths1 = random.randint(2, 7)
+        tenths1 = self.rng.randint(2, 7)
         decimal1 = f"0.{tenths1}"
 
         tenths2 = tenths1
-        hundredths2 = random.randint(1, 9)
+        hundredths2 = self.rng.randint(1, 9)
         decimal2 = f"0.{tenths2}{hundredths2}"
 
         symbol = "<"
@@ -144,9 +140,9 @@ class ComparingDecimalsGenerator:
         values = []
 
         for _ in range(3):
-            tenths = random.randint(2, 7)
-            hundredths = random.randint(0, 9)
-            if random.choice([True, False]) and hundredths != 0:
+            tenths = self.rng.randint(2, 7)
+            hundredths = self.rng.randint(0, 9)
+            if self.rng.choice([True, False]) and hundredths != 0:
                 decimal = f"0.{tenths}{hundredths}"
                 value = tenths * 10 + hundredths
             else:
@@ -157,9 +153,9 @@ class ComparingDecimalsGenerator:
 
         # Make sure they're all different
         while len(set(values)) < 3:
-            tenths = random.randint(2, 7)
-            hundredths = random.randint(0, 9)
-            if random.choice([True, False]) and hundredths != 0:
+            tenths = self.rng.randint(2, 7)
+            hundredths = self.rng.randint(0, 9)
+            if self.rng.choice([True, False]) and hundredths != 0:
                 decimal = f"0.{tenths}{hundredths}"
                 value = tenths * 10 + hundredths
             else:
@@ -6,9 +6,6 @@ Example: What digit is in the tenths place in 3.456? Answer: 4
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class DecimalPlaceValueIntroGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class DecimalPlaceValueIntroGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: identify digit in tenths place."""
-        ones = random.randint(0, 9)
-        tenths = random.randint(1, 9)
+        ones = self.rng.randint(0, 9)
+        tenths = self.rng.randint(1, 9)
 
         number = f"{ones}.{tenths}"
 
@@ -72,13 +68,13 @@ class DecimalPlaceValueIntroGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: identify digit in various places with hundredths."""
-        ones = random.randint(0, 9)
-        tenths = random.randint(0, 9)
-        hundredths = random.randint(1, 9)
+        ones = self.rng.randint(0, 9)
+        tenths = self.rng.randint(0, 9)
+        hundredths = self.rng.randint(1, 9)
 
         number = f"{ones}.{tenths}{hundredths}"
 
-        place = random.choice(['tenths', 'hundredths'])
+        place = self.rng.choice(['tenths', 'hundredths'])
 
         if place == 'tenths':
             digit = tenths
@@ -104,19 +100,19 @@ class DecimalPlaceValueIntroGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: identify place value of a specific digit."""
-        ones = random.randint(1, 9)
-        tenths = random.randint(1, 9)
-        hundredths = random.randint(1, 9)
+        ones = self.rng.randint(1, 9)
+        tenths = self.rng.randint(1, 9)
+        hundredths = self.rng.randint(1, 9)
 
         # Make sure all digits are different for clarity
         while tenths == ones:
-            tenths = random.randint(1, 9)
+            tenths = self.rng.randint(1, 9)
         while hundredths == ones or hundredths == tenths:
-            hundredths = random.randint(1, 9)
+            hundredths = self.rng.randint(1, 9)
 
         number = f"{ones}.{tenths}{hundredths}"
 
-        digit_choice = random.choice([ones, tenths, hundredths])
+        digit_choice = self.rng.choice([ones, tenths, hundredths])
 
         if digit_choice == ones:
             place_value = "ones"
@@ -141,14 +137,14 @@ class DecimalPlaceValueIntroGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: identify value represented by a digit."""
-        ones = random.randint(2, 9)
-        tenths = random.randint(1, 9)
-        hundredths = random.randint(1, 9)
-        thousandths = random.randint(1, 9)
+        ones = self.rng.randint(2, 9)
+        tenths = self.rng.randint(1, 9)
+        hundredths = self.rng.randint(1, 9)
+        thousandths = self.rng.randint(1, 9)
 
         number = f"{ones}.{tenths}{hundredths}{thousandths}"
 
-        place_choice = random.choice(['ones', 'tenths', 'hundredths', 'thousandths'])
+        place_choice = self.rng.choice(['ones', 'tenths', 'hundredths', 'thousandths'])
 
         if place_choice == 'ones':
             digit = ones
@@ -6,9 +6,6 @@ Example: Write 0.35 as a fraction: 35/100
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class DecimalsDifferentFormsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -56,7 +52,7 @@ class DecimalsDifferentFormsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: convert tenths to fraction."""
-        tenths = random.randint(1, 9)
+        tenths = self.rng.randint(1, 9)
         decimal = f"0.{tenths}"
 
         latex = f"\\text{{{{Write as a fraction: }}}} {decimal}"
@@ -75,8 +71,8 @@ class DecimalsDifferentFormsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: convert hundredths to simplified fraction."""
-        tenths = random.randint(1, 9)
-        hundredths = random.randint(0, 9)
+        tenths = self.rng.randint(1, 9)
+        hundredths = self.rng.randint(0, 9)
 
         numerator = tenths * 10 + hundredths
         denominator = 100
@@ -111,31 +107,31 @@ class DecimalsDifferentFormsGenerator:
     def _generate_hard(self) -> Equation:
         """Generate hard problems: convert fraction to decimal."""
         denominators = [10, 100, 4, 5, 20, 25, 50]
-        denominator = random.choice(denominators)
+        denominator = self.rng.choice(denominators)
 
         if denominator == 10:
-            numerator = random.randint(1, 9)
+            numerator = self.rng.randint(1, 9)
             decimal = f"0.{numerator}"
         elif denominator == 100:
-            numerator = random.randint(1, 99)
+            numerator = self.rng.randint(1, 99)
             if numerator < 10:
                 decimal = f"0.0{numerator}"
             else:
                 decimal = f"0.{numerator}"
         elif denominator == 4:
-            numerator = random.choice([1, 3])
+            numerator = self.rng.choice([1, 3])
             decimal = "0.25" if numerator == 1 else "0.75"
         elif denominator == 5:
-            numerator = random.randint(1, 4)
+            numerator = self.rng.randint(1, 4)
             decimal = str(numerator * 0.2)
         elif denominator == 20:
-            numerator = random.randint(1, 19)
+            numerator = self.rng.randint(1, 19)
             decimal = str(numerator / 20)
         elif denominator == 25:
-            numerator = random.randint(1, 24)
+            numerator = self.rng.randint(1, 24)
             decimal = str(numerator / 25)
         else:  # 50
-            numerator = random.randint(1, 49)
+            numerator = self.rng.randint(1, 49)
             decimal = str(numerator / 50)
 
         latex = f"\\text{{{{Write as a decimal: }}}} \\frac{{{numerator}}}{{{denominator}}}"
@@ -154,12 +150,12 @@ class DecimalsDifferentFormsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: convert between all three forms."""
-        problem_type = random.choice(['expanded_to_fraction', 'fraction_to_expanded'])
+        problem_type = self.rng.choice(['expanded_to_fraction', 'fraction_to_expanded'])
 
         if problem_type == 'expanded_to_fraction':
-            ones = random.randint(1, 5)
-            tenths = random.randint(1, 9)
-            hundredths = random.randint(1, 9)
+            ones = self.rng.randint(1, 5)
+            tenths = self.rng.randint(1, 9)
+            hundredths = self.rng.randint(1, 9)
 
             decimal_part = tenths * 10 + hundredths
 
@@ -173,8 +169,8 @@ class DecimalsDifferentFormsGenerator:
                 f"= {ones}\\frac{{{decimal_part}}}{{100}}"
             ]
         else:
-            ones = random.randint(1, 5)
-            numerator = random.randint(1, 99)
+            ones = self.rng.randint(1, 5)
+            numerator = self.rng.randint(1, 99)
 
             if numerator < 10:
                 decimal = f"{ones}.0{numerator}"
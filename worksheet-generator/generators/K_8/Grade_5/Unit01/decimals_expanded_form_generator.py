@@ -6,9 +6,6 @@ Example: Write 3.45 in expanded form: 3 + 0.4 + 0.05
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class DecimalsExpandedFormGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class DecimalsExpandedFormGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: expand single digit with tenths."""
-        ones = random.randint(1, 9)
-        tenths = random.randint(1, 9)
+        ones = self.rng.randint(1, 9)
+        tenths = self.rng.randint(1, 9)
 
         number = f"{ones}.{tenths}"
 
@@ -71,9 +67,9 @@ class DecimalsExpandedFormGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: expand with hundredths."""
-        ones = random.randint(1, 9)
-        tenths = random.randint(0, 9)
-        hundredths = random.randint(1, 9)
+        ones = self.rng.randint(1, 9)
+        tenths = self.rng.randint(0, 9)
+        hundredths = self.rng.randint(1, 9)
 
         number = f"{ones}.{tenths}{hundredths}"
 
@@ -101,9 +97,9 @@ class DecimalsExpandedFormGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: convert from expanded form to standard form."""
-        ones = random.randint(1, 9)
-        tenths = random.randint(1, 9)
-        hundredths = random.randint(1, 9)
+        ones = self.rng.randint(1, 9)
+        tenths = self.rng.randint(1, 9)
+        hundredths = self.rng.randint(1, 9)
 
         expanded = f"{ones} + 0.{tenths} + 0.0{hundredths}"
         number = f"{ones}.{tenths}{hundredths}"
@@ -124,9 +120,9 @@ class DecimalsExpandedFormGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: expanded form with fractions."""
-        ones = random.randint(2, 9)
-        tenths = random.randint(1, 9)
-        hundredths = random.randint(1, 9)
+        ones = self.rng.randint(2, 9)
+        tenths = self.rng.randint(1, 9)
+        hundredths = self.rng.randint(1, 9)
 
         number = f"{ones}.{tenths}{hundredths}"
 
@@ -6,9 +6,6 @@ Example: Where is 0.6 on a number line from 0 to 1?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class DecimalsOnNumberLineGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,7 +46,7 @@ class DecimalsOnNumberLineGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: locate tenths on 0 to 1 number line."""
-        tenths = random.randint(1, 9)
+        tenths = self.rng.randint(1, 9)
         decimal = tenths / 10
 
         latex = f"\\text{{{{Locate }}}} {decimal} \\text{{{{ on a number line from 0 to 1.}}}}"
@@ -70,8 +66,8 @@ class DecimalsOnNumberLineGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: locate hundredths on number line."""
-        tenths = random.randint(1, 8)
-        hundredths = random.randint(1, 9)
+        tenths = self.rng.randint(1, 8)
+        hundredths = self.rng.randint(1, 9)
         decimal = tenths + hundredths / 10
 
         latex = f"\\text{{{{Locate }}}} {decimal} \\text{{{{ on a number line from {tenths} to {tenths + 1}.}}}}"
@@ -91,10 +87,10 @@ class DecimalsOnNumberLineGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: identify decimal at a specific position."""
-        start = random.randint(0, 5)
+        start = self.rng.randint(0, 5)
         end = start + 1
         divisions = 10
-        position = random.randint(1, 9)
+        position = self.rng.randint(1, 9)
 
         decimal_value = start + position / divisions
 
@@ -115,15 +111,15 @@ class DecimalsOnNumberLineGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: compare positions on number line."""
-        tenths1 = random.randint(2, 7)
-        hundredths1 = random.randint(0, 9)
+        tenths1 = self.rng.randint(2, 7)
+        hundredths1 = self.rng.randint(0, 9)
         decimal1 = tenths1 / 10 + hundredths1 / 100
 
-        tenths2 = random.randint(2, 7)
-        hundredths2 = random.randint(0, 9)
+        tenths2 = self.rng.randint(2, 7)
+        hundredths2 = self.rng.randint(0, 9)
         while tenths2 == tenths1 and hundredths2 == hundredths1:
-            tenths2 = random.randint(2, 7)
-            hundredths2 = random.randint(0, 9)
+            tenths2 = self.rng.randint(2, 7)
+            hundredths2 = self.rng.randint(0, 9)
         decimal2 = tenths2 / 10 + hundredths2 / 100
 
         latex = f"\\text{{{{Which is farther from 0 on a number line: }}}} {decimal1} \\text{{{{ or }}}} {decimal2}?"
@@ -6,9 +6,6 @@ Example: Write 3.45 in words: Three and forty-five hundredths
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class DecimalsWrittenFormGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
         self.ones_words = ['', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
         self.teens = ['ten', 'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen',
@@ -68,8 +64,8 @@ class DecimalsWrittenFormGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: write tenths in words."""
-        ones = random.randint(1, 9)
-        tenths = random.randint(1, 9)
+        ones = self.rng.randint(1, 9)
+        tenths = self.rng.randint(1, 9)
 
         number = f"{ones}.{tenths}"
 
@@ -92,9 +88,9 @@ class DecimalsWrittenFormGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: write hundredths in words."""
-        ones = random.randint(1, 9)
-        tenths = random.randint(0, 9)
-        hundredths = random.randint(1, 9)
+        ones = self.rng.randint(1, 9)
+        tenths = self.rng.randint(0, 9)
+        hundredths = self.rng.randint(1, 9)
 
         number = f"{ones}.{tenths}{hundredths}"
         decimal_part = int(f"{tenths}{hundredths}")
@@ -118,9 +114,9 @@ class DecimalsWrittenFormGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: convert from words to number."""
-        ones = random.randint(2, 9)
-        tenths = random.randint(1, 9)
-        hundredths = random.randint(0, 9)
+        ones = self.rng.randint(2, 9)
+        tenths = self.rng.randint(1, 9)
+        hundredths = self.rng.randint(0, 9)
 
         number = f"{ones}.{tenths}{hundredths}"
         decimal_part = int(f"{tenths}{hundredths}")
@@ -146,10 +142,10 @@ class DecimalsWrittenFormGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: write larger numbers with decimals."""
-        tens = random.randint(1, 9)
-        ones = random.randint(0, 9)
-        tenths = random.randint(1, 9)
-        hundredths = random.randint(1, 9)
+        tens = self.rng.randint(1, 9)
+        ones = self.rng.randint(0, 9)
+        tenths = self.rng.randint(1, 9)
+        hundredths = self.rng.randint(1, 9)
 
         whole_part = tens * 10 + ones
         number = f"{whole_part}.{tenths}{hundredths}"
@@ -5,11 +5,41 @@ Example: Round 3.456 to the nearest tenth: 3.5
 """
 
 import random
+from functools import partial
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+import numpy as np
+
 from equation_generator import Equation
+from bulk_generation import (ProblemBatch, bulk_number_from_parts, join_columns, number_from_parts,
+                             numpy_rng, round_half_up)
+
+# Decimal places of the number to round, the place it is rounded to and the
+# digit that decides, per difficulty; shared by generate_worksheet and generate_bulk
+PLACES = {
+    'easy': (1, 'whole number', 'tenths'),
+    'medium': (2, 'tenth', 'hundredths'),
+    'hard': (3, 'hundredth', 'thousandths'),
+}
+
+
+def _digit_parts(places: int) -> list:
+    """Parts (see bulk_generation.number_from_parts) of a number 1-9 with places random decimal digits."""
+    return [(10 ** places, (1, 9))] + [(10 ** place, (0, 9)) for place in reversed(range(places))]
+
+
+def _format_decimal(value: int, places: int) -> str:
+    """A number held in units of its last decimal place, as a decimal string."""
+    if places == 0:
+        return str(value)
+    return f"{value // 10 ** places}.{value % 10 ** places:0{places}d}"
+
+
+def _format_decimals(values: np.ndarray, places: int) -> np.ndarray:
+    """Vectorized _format_decimal."""
+    if places == 0:
+        return values.astype(str)
+    return join_columns(values // 10 ** places, ".", np.char.zfill((values % 10 ** places).astype(str), places))
 
 
 class RoundingDecimalsGenerator:
@@ -17,8 +47,7 @@ class RoundingDecimalsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -39,117 +68,43 @@ class RoundingDecimalsGenerator:
 
     def _generate_problem(self, difficulty: str) -> Equation:
         """Generate a single problem."""
-        if difficulty == 'easy':
-            return self._generate_easy()
-        elif difficulty == 'medium':
-            return self._generate_medium()
-        elif difficulty == 'hard':
-            return self._generate_hard()
-        else:
-            return self._generate_challenge()
-
-    def _generate_easy(self) -> Equation:
-        """Generate easy problems: round to nearest whole number."""
-        ones = random.randint(1, 9)
-        tenths = random.randint(0, 9)
-
-        number = f"{ones}.{tenths}"
-
-        if tenths >= 5:
-            rounded = ones + 1
-        else:
-            rounded = ones
-
-        latex = f"\\text{{{{Round to the nearest whole number: }}}} {number}"
-        solution = str(rounded)
-        steps = [
-            f"{number}",
-            f"\\text{{{{Look at tenths place: }}}} {tenths}",
-            f"{tenths} {'≥' if tenths >= 5 else '<'} 5, \\text{{{{ so round {'up' if tenths >= 5 else 'down'}}}}}",
-            str(rounded)
-        ]
-
-        return Equation(
-            latex=latex,
-            solution=solution,
-            steps=steps,
-            difficulty='easy'
-        )
-
-    def _generate_medium(self) -> Equation:
-        """Generate medium problems: round to nearest tenth."""
-        ones = random.randint(1, 9)
-        tenths = random.randint(0, 9)
-        hundredths = random.randint(0, 9)
-
-        number = f"{ones}.{tenths}{hundredths}"
-
-        if hundredths >= 5:
-            if tenths == 9:
-                rounded = f"{ones + 1}.0"
-            else:
-                rounded = f"{ones}.{tenths + 1}"
-        else:
-            rounded = f"{ones}.{tenths}"
-
-        latex = f"\\text{{{{Round to the nearest tenth: }}}} {number}"
-        solution = rounded
-        steps = [
-            f"{number}",
-            f"\\text{{{{Look at hundredths place: }}}} {hundredths}",
-            f"{hundredths} {'≥' if hundredths >= 5 else '<'} 5, \\text{{{{ so round {'up' if hundredths >= 5 else 'down'}}}}}",
+        if difficulty in PLACES:
+            return self._generate_rounding(difficulty)
+        return self._generate_challenge()
+
+    def _get_rounding_steps(self, difficulty: str, number: int) -> List[str]:
+        """Steps for rounding number (in units of its last decimal place)."""
+        places, _, key_place = PLACES[difficulty]
+        key_digit = number % 10
+        rounded = _format_decimal(round_half_up(number, 10) // 10, places - 1)
+        return [
+            _format_decimal(number, places),
+            f"\\text{{{{Look at {key_place} place: }}}} {key_digit}",
+            f"{key_digit} {'≥' if key_digit >= 5 else '<'} 5, \\text{{{{ so round {'up' if key_digit >= 5 else 'down'}}}}}",
             rounded
         ]
 
-        return Equation(
-            latex=latex,
-            solution=solution,
-            steps=steps,
-            difficulty='medium'
-        )
-
-    def _generate_hard(self) -> Equation:
-        """Generate hard problems: round to nearest hundredth."""
-        ones = random.randint(1, 9)
-        tenths = random.randint(0, 9)
-        hundredths = random.randint(0, 9)
-        thousandths = random.randint(0, 9)
-
-        number = f"{ones}.{tenths}{hundredths}{thousandths}"
+    def _generate_rounding(self, difficulty: str) -> Equation:
+        """Generate an easy, medium or hard problem from PLACES."""
+        places, round_to, _ = PLACES[difficulty]
+        number = number_from_parts(self.rng, _digit_parts(places))
 
-        if thousandths >= 5:
-            if hundredths == 9:
-                if tenths == 9:
-                    rounded = f"{ones + 1}.00"
-                else:
-                    rounded = f"{ones}.{tenths + 1}0"
-            else:
-                rounded = f"{ones}.{tenths}{hundredths + 1}"
-        else:
-            rounded = f"{ones}.{tenths}{hundredths}"
-
-        latex = f"\\text{{{{Round to the nearest hundredth: }}}} {number}"
-        solution = rounded
-        steps = [
-            f"{number}",
-            f"\\text{{{{Look at thousandths place: }}}} {thousandths}",
-            f"{thousandths} {'≥' if thousandths >= 5 else '<'} 5, \\text{{{{ so round {'up' if thousandths >= 5 else 'down'}}}}}",
-            rounded
-        ]
+        latex = f"\\text{{{{Round to the nearest {round_to}: }}}} {_format_decimal(number, places)}"
+        solution = _format_decimal(round_half_up(number, 10) // 10, places - 1)
 
         return Equation(
             latex=latex,
             solution=solution,
-            steps=steps,
-            difficulty='hard'
+            steps=self._get_rounding_steps(difficulty, number),
+            difficulty=difficulty
         )
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: round to multiple places."""
-        ones = random.randint(2, 9)
-        tenths = random.randint(0, 9)
-        hundredths = random.randint(0, 9)
-        thousandths = random.randint(0, 9)
+        ones = self.rng.randint(2, 9)
+        tenths = self.rng.randint(0, 9)
+        hundredths = self.rng.randint(0, 9)
+        thousandths = self.rng.randint(0, 9)
 
         number = f"{ones}.{tenths}{hundredths}{thousandths}"
 
@@ -184,6 +139,32 @@ class RoundingDecimalsGenerator:
         )
 
 
+    def generate_bulk(self, difficulty: str, count: int) -> ProblemBatch:
+        """
+        Generate many problems at once with NumPy (see bulk_generation).
+
+        Draws from the same problems as generate_worksheet; challenge problems
+        are generated one by one.
+
+        Args:
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            count: Number of problems to generate
+
+        Returns:
+            ProblemBatch of the problems
+        """
+        if difficulty not in PLACES:
+            return ProblemBatch.from_equations(self.generate_worksheet(difficulty, count), difficulty)
+
+        places, round_to, _ = PLACES[difficulty]
+        number = bulk_number_from_parts(numpy_rng(self.rng), _digit_parts(places), count)
+        rounded = round_half_up(number, 10) // 10
+
+        latex = join_columns(f"\\text{{{{Round to the nearest {round_to}: }}}} ", _format_decimals(number, places))
+        return ProblemBatch(difficulty, latex, rounded, {'number': number},
+                            solutions=_format_decimals(rounded, places - 1),
+                            steps=partial(self._get_rounding_steps, difficulty))
+
 def main():
     """Test the generator."""
     generator = RoundingDecimalsGenerator()
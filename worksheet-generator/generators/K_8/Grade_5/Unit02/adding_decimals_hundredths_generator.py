@@ -6,9 +6,6 @@ Example: 2.35 + 1.42 = 3.77
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class AddingDecimalsHundredthsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,13 +46,13 @@ class AddingDecimalsHundredthsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: add hundredths, no regrouping."""
-        ones1 = random.randint(1, 4)
-        tenths1 = random.randint(1, 4)
-        hundredths1 = random.randint(1, 4)
+        ones1 = self.rng.randint(1, 4)
+        tenths1 = self.rng.randint(1, 4)
+        hundredths1 = self.rng.randint(1, 4)
 
-        ones2 = random.randint(1, 4)
-        tenths2 = random.randint(1, 5 - tenths1)
-        hundredths2 = random.randint(1, 5 - hundredths1)
+        ones2 = self.rng.randint(1, 4)
+        tenths2 = self.rng.randint(1, 5 - tenths1)
+        hundredths2 = self.rng.randint(1, 5 - hundredths1)
 
         num1 = f"{ones1}.{tenths1}{hundredths1}"
         num2 = f"{ones2}.{tenths2}{hundredths2}"
@@ -79,13 +75,13 @@ class AddingDecimalsHundredthsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: add with regrouping in hundredths."""
-        ones1 = random.randint(1, 5)
-        tenths1 = random.randint(1, 8)
-        hundredths1 = random.randint(5, 9)
+        ones1 = self.rng.randint(1, 5)
+        tenths1 = self.rng.randint(1, 8)
+        hundredths1 = self.rng.randint(5, 9)
 
-        ones2 = random.randint(1, 4)
-        tenths2 = random.randint(1, 8)
-        hundredths2 = random.randint(5, 9)
+        ones2 = self.rng.randint(1, 4)
+        tenths2 = self.rng.randint(1, 8)
+        hundredths2 = self.rng.randint(5, 9)
 
         num1 = f"{ones1}.{tenths1}{hundredths1}"
         num2 = f"{ones2}.{tenths2}{hundredths2}"
@@ -108,11 +104,11 @@ class AddingDecimalsHundredthsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: add larger decimals with hundredths."""
-        ones1 = random.randint(10, 50)
-        decimal1 = random.randint(1, 99)
+        ones1 = self.rng.randint(10, 50)
+        decimal1 = self.rng.randint(1, 99)
 
-        ones2 = random.randint(10, 50)
-        decimal2 = random.randint(1, 99)
+        ones2 = self.rng.randint(10, 50)
+        decimal2 = self.rng.randint(1, 99)
 
         if decimal1 < 10:
             num1 = f"{ones1}.0{decimal1}"
@@ -142,14 +138,14 @@ class AddingDecimalsHundredthsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: add three decimals with hundredths."""
-        ones1 = random.randint(5, 15)
-        decimal1 = random.randint(10, 99)
+        ones1 = self.rng.randint(5, 15)
+        decimal1 = self.rng.randint(10, 99)
 
-        ones2 = random.randint(5, 15)
-        decimal2 = random.randint(10, 99)
+        ones2 = self.rng.randint(5, 15)
+        decimal2 = self.rng.randint(10, 99)
 
-        ones3 = random.randint(5, 15)
-        decimal3 = random.randint(10, 99)
+        ones3 = self.rng.randint(5, 15)
+        decimal3 = self.rng.randint(10, 99)
 
         num1 = f"{ones1}.{decimal1}"
         num2 = f"{ones2}.{decimal2}"
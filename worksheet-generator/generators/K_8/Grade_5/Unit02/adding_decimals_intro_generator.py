@@ -6,9 +6,6 @@ Example: 0.3 + 0.2 = 0.5
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class AddingDecimalsIntroGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class AddingDecimalsIntroGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: add tenths without regrouping."""
-        tenths1 = random.randint(1, 4)
-        tenths2 = random.randint(1, 5 - tenths1)
+        tenths1 = self.rng.randint(1, 4)
+        tenths2 = self.rng.randint(1, 5 - tenths1)
 
         num1 = f"0.{tenths1}"
         num2 = f"0.{tenths2}"
@@ -74,8 +70,8 @@ class AddingDecimalsIntroGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: add tenths with regrouping."""
-        tenths1 = random.randint(5, 8)
-        tenths2 = random.randint(3, 9)
+        tenths1 = self.rng.randint(5, 8)
+        tenths2 = self.rng.randint(3, 9)
 
         total_tenths = tenths1 + tenths2
         ones = total_tenths // 10
@@ -103,10 +99,10 @@ class AddingDecimalsIntroGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: add whole numbers and tenths."""
-        ones1 = random.randint(1, 5)
-        tenths1 = random.randint(1, 9)
-        ones2 = random.randint(1, 4)
-        tenths2 = random.randint(1, 9)
+        ones1 = self.rng.randint(1, 5)
+        tenths1 = self.rng.randint(1, 9)
+        ones2 = self.rng.randint(1, 4)
+        tenths2 = self.rng.randint(1, 9)
 
         num1 = f"{ones1}.{tenths1}"
         num2 = f"{ones2}.{tenths2}"
@@ -136,9 +132,9 @@ class AddingDecimalsIntroGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: add three decimals."""
-        tenths1 = random.randint(1, 5)
-        tenths2 = random.randint(1, 5)
-        tenths3 = random.randint(1, 5)
+        tenths1 = self.rng.randint(1, 5)
+        tenths2 = self.rng.randint(1, 5)
+        tenths3 = self.rng.randint(1, 5)
 
         num1 = f"0.{tenths1}"
         num2 = f"0.{tenths2}"
@@ -6,9 +6,6 @@ Example: 2.3 + 1.5 = 3.8
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class AddingDecimalsTenthsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,10 +46,10 @@ class AddingDecimalsTenthsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: add one-digit with tenths, no regrouping."""
-        ones1 = random.randint(1, 4)
-        tenths1 = random.randint(1, 4)
-        ones2 = random.randint(1, 4)
-        tenths2 = random.randint(1, 5 - tenths1)
+        ones1 = self.rng.randint(1, 4)
+        tenths1 = self.rng.randint(1, 4)
+        ones2 = self.rng.randint(1, 4)
+        tenths2 = self.rng.randint(1, 5 - tenths1)
 
         num1 = f"{ones1}.{tenths1}"
         num2 = f"{ones2}.{tenths2}"
@@ -77,10 +73,10 @@ class AddingDecimalsTenthsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: add with regrouping in tenths."""
-        ones1 = random.randint(2, 6)
-        tenths1 = random.randint(5, 8)
-        ones2 = random.randint(1, 5)
-        tenths2 = random.randint(3, 9)
+        ones1 = self.rng.randint(2, 6)
+        tenths1 = self.rng.randint(5, 8)
+        ones2 = self.rng.randint(1, 5)
+        tenths2 = self.rng.randint(3, 9)
 
         total_tenths = tenths1 + tenths2
         carry = total_tenths // 10
@@ -109,13 +105,13 @@ class AddingDecimalsTenthsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: add larger numbers with tenths."""
-        tens1 = random.randint(1, 5)
-        ones1 = random.randint(0, 9)
-        tenths1 = random.randint(1, 9)
+        tens1 = self.rng.randint(1, 5)
+        ones1 = self.rng.randint(0, 9)
+        tenths1 = self.rng.randint(1, 9)
 
-        tens2 = random.randint(1, 4)
-        ones2 = random.randint(0, 9)
-        tenths2 = random.randint(1, 9)
+        tens2 = self.rng.randint(1, 4)
+        ones2 = self.rng.randint(0, 9)
+        tenths2 = self.rng.randint(1, 9)
 
         num1_val = tens1 * 10 + ones1
         num2_val = tens2 * 10 + ones2
@@ -141,12 +137,12 @@ class AddingDecimalsTenthsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: add multiple decimals with tenths."""
-        ones1 = random.randint(1, 5)
-        tenths1 = random.randint(1, 9)
-        ones2 = random.randint(1, 5)
-        tenths2 = random.randint(1, 9)
-        ones3 = random.randint(1, 5)
-        tenths3 = random.randint(1, 9)
+        ones1 = self.rng.randint(1, 5)
+        tenths1 = self.rng.randint(1, 9)
+        ones2 = self.rng.randint(1, 5)
+        tenths2 = self.rng.randint(1, 9)
+        ones3 = self.rng.randint(1, 5)
+        tenths3 = self.rng.randint(1, 9)
 
         num1 = f"{ones1}.{tenths1}"
         num2 = f"{ones2}.{tenths2}"
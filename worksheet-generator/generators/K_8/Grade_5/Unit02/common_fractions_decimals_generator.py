@@ -6,9 +6,6 @@ Example: Write 1/2 as a decimal: 0.5
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class CommonFractionsDecimalsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -58,7 +54,7 @@ class CommonFractionsDecimalsGenerator:
             (2, 5, "0.4")
         ]
 
-        num, den, decimal = random.choice(fractions)
+        num, den, decimal = self.rng.choice(fractions)
 
         latex = f"\\text{{{{Write as a decimal: }}}} \\frac{{{num}}}{{{den}}}"
         solution = decimal
@@ -86,7 +82,7 @@ class CommonFractionsDecimalsGenerator:
             ("0.8", 4, 5)
         ]
 
-        decimal, num, den = random.choice(decimals)
+        decimal, num, den = self.rng.choice(decimals)
 
         latex = f"\\text{{{{Write as a simplified fraction: }}}} {decimal}"
         solution = f"\\frac{{{num}}}{{{den}}}"
@@ -115,9 +111,9 @@ class CommonFractionsDecimalsGenerator:
             (9, 10, "0.9")
         ]
 
-        num, den, decimal = random.choice(fractions)
+        num, den, decimal = self.rng.choice(fractions)
 
-        problem_type = random.choice(['to_decimal', 'to_fraction'])
+        problem_type = self.rng.choice(['to_decimal', 'to_fraction'])
 
         if problem_type == 'to_decimal':
             latex = f"\\text{{{{Write as a decimal: }}}} \\frac{{{num}}}{{{den}}}"
@@ -155,13 +151,13 @@ class CommonFractionsDecimalsGenerator:
             (3, 8, 0.375)
         ]
 
-        num, den, frac_decimal = random.choice(fractions)
+        num, den, frac_decimal = self.rng.choice(fractions)
 
         # Generate a decimal close to but different from the fraction
-        if random.choice([True, False]):
-            compare_decimal = round(frac_decimal + random.choice([0.05, 0.1, -0.05, -0.1]), 2)
+        if self.rng.choice([True, False]):
+            compare_decimal = round(frac_decimal + self.rng.choice([0.05, 0.1, -0.05, -0.1]), 2)
         else:
-            compare_decimal = round(frac_decimal + random.choice([0.15, 0.2, -0.15, -0.2]), 2)
+            compare_decimal = round(frac_decimal + self.rng.choice([0.15, 0.2, -0.15, -0.2]), 2)
 
         if compare_decimal < 0:
             compare_decimal = abs(compare_decimal)
@@ -6,9 +6,6 @@ Example: 5.67 - 2.34 = 3.33
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class SubtractingDecimalsHundredthsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,13 +46,13 @@ class SubtractingDecimalsHundredthsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: subtract hundredths, no regrouping."""
-        ones1 = random.randint(3, 8)
-        tenths1 = random.randint(5, 9)
-        hundredths1 = random.randint(5, 9)
+        ones1 = self.rng.randint(3, 8)
+        tenths1 = self.rng.randint(5, 9)
+        hundredths1 = self.rng.randint(5, 9)
 
-        ones2 = random.randint(1, ones1 - 1)
-        tenths2 = random.randint(1, tenths1)
-        hundredths2 = random.randint(1, hundredths1)
+        ones2 = self.rng.randint(1, ones1 - 1)
+        tenths2 = self.rng.randint(1, tenths1)
+        hundredths2 = self.rng.randint(1, hundredths1)
 
         num1 = f"{ones1}.{tenths1}{hundredths1}"
         num2 = f"{ones2}.{tenths2}{hundredths2}"
@@ -78,13 +74,13 @@ class SubtractingDecimalsHundredthsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: subtract with regrouping."""
-        ones1 = random.randint(5, 12)
-        tenths1 = random.randint(0, 9)
-        hundredths1 = random.randint(0, 9)
+        ones1 = self.rng.randint(5, 12)
+        tenths1 = self.rng.randint(0, 9)
+        hundredths1 = self.rng.randint(0, 9)
 
-        ones2 = random.randint(1, ones1 - 1)
-        tenths2 = random.randint(0, 9)
-        hundredths2 = random.randint(0, 9)
+        ones2 = self.rng.randint(1, ones1 - 1)
+        tenths2 = self.rng.randint(0, 9)
+        hundredths2 = self.rng.randint(0, 9)
 
         num1 = f"{ones1}.{tenths1}{hundredths1}"
         num2 = f"{ones2}.{tenths2}{hundredths2}"
@@ -107,11 +103,11 @@ class SubtractingDecimalsHundredthsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: subtract larger decimals."""
-        ones1 = random.randint(20, 60)
-        decimal1 = random.randint(10, 99)
+        ones1 = self.rng.randint(20, 60)
+        decimal1 = self.rng.randint(10, 99)
 
-        ones2 = random.randint(5, ones1 - 1)
-        decimal2 = random.randint(10, 99)
+        ones2 = self.rng.randint(5, ones1 - 1)
+        decimal2 = self.rng.randint(10, 99)
 
         num1 = f"{ones1}.{decimal1}"
         num2 = f"{ones2}.{decimal2}"
@@ -134,12 +130,12 @@ class SubtractingDecimalsHundredthsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: subtract with different decimal places."""
-        ones1 = random.randint(15, 40)
-        tenths1 = random.randint(0, 9)
-        hundredths1 = random.randint(1, 9)
+        ones1 = self.rng.randint(15, 40)
+        tenths1 = self.rng.randint(0, 9)
+        hundredths1 = self.rng.randint(1, 9)
 
-        ones2 = random.randint(5, ones1 - 2)
-        tenths2 = random.randint(0, 9)
+        ones2 = self.rng.randint(5, ones1 - 2)
+        tenths2 = self.rng.randint(0, 9)
 
         num1 = f"{ones1}.{tenths1}{hundredths1}"
         num2 = f"{ones2}.{tenths2}"
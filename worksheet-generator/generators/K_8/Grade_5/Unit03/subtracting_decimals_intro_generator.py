@@ -6,9 +6,6 @@ Example: 0.7 - 0.3 = 0.4
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class SubtractingDecimalsIntroGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class SubtractingDecimalsIntroGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: subtract tenths without regrouping."""
-        tenths1 = random.randint(5, 9)
-        tenths2 = random.randint(1, tenths1 - 1)
+        tenths1 = self.rng.randint(5, 9)
+        tenths2 = self.rng.randint(1, tenths1 - 1)
 
         num1 = f"0.{tenths1}"
         num2 = f"0.{tenths2}"
@@ -74,9 +70,9 @@ class SubtractingDecimalsIntroGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: subtract with regrouping from ones."""
-        ones1 = random.randint(2, 8)
-        tenths1 = random.randint(0, 3)
-        tenths2 = random.randint(5, 9)
+        ones1 = self.rng.randint(2, 8)
+        tenths1 = self.rng.randint(0, 3)
+        tenths2 = self.rng.randint(5, 9)
 
         num1 = f"{ones1}.{tenths1}"
         num2 = f"0.{tenths2}"
@@ -105,10 +101,10 @@ class SubtractingDecimalsIntroGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: subtract whole numbers and tenths."""
-        ones1 = random.randint(5, 12)
-        tenths1 = random.randint(0, 9)
-        ones2 = random.randint(1, ones1 - 1)
-        tenths2 = random.randint(0, 9)
+        ones1 = self.rng.randint(5, 12)
+        tenths1 = self.rng.randint(0, 9)
+        ones2 = self.rng.randint(1, ones1 - 1)
+        tenths2 = self.rng.randint(0, 9)
 
         num1 = f"{ones1}.{tenths1}"
         num2 = f"{ones2}.{tenths2}"
@@ -131,9 +127,9 @@ class SubtractingDecimalsIntroGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: subtract from whole number."""
-        ones1 = random.randint(5, 15)
-        ones2 = random.randint(1, ones1 - 1)
-        tenths2 = random.randint(1, 9)
+        ones1 = self.rng.randint(5, 15)
+        ones2 = self.rng.randint(1, ones1 - 1)
+        tenths2 = self.rng.randint(1, 9)
 
         num1 = str(ones1)
         num2 = f"{ones2}.{tenths2}"
@@ -6,9 +6,6 @@ Example: 5.8 - 2.3 = 3.5
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class SubtractingDecimalsTenthsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,10 +46,10 @@ class SubtractingDecimalsTenthsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: subtract tenths, no regrouping."""
-        ones1 = random.randint(3, 8)
-        tenths1 = random.randint(5, 9)
-        ones2 = random.randint(1, ones1 - 1)
-        tenths2 = random.randint(1, tenths1)
+        ones1 = self.rng.randint(3, 8)
+        tenths1 = self.rng.randint(5, 9)
+        ones2 = self.rng.randint(1, ones1 - 1)
+        tenths2 = self.rng.randint(1, tenths1)
 
         num1 = f"{ones1}.{tenths1}"
         num2 = f"{ones2}.{tenths2}"
@@ -77,10 +73,10 @@ class SubtractingDecimalsTenthsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: subtract with regrouping."""
-        ones1 = random.randint(4, 9)
-        tenths1 = random.randint(0, 4)
-        ones2 = random.randint(1, ones1 - 1)
-        tenths2 = random.randint(5, 9)
+        ones1 = self.rng.randint(4, 9)
+        tenths1 = self.rng.randint(0, 4)
+        ones2 = self.rng.randint(1, ones1 - 1)
+        tenths2 = self.rng.randint(5, 9)
 
         num1 = f"{ones1}.{tenths1}"
         num2 = f"{ones2}.{tenths2}"
@@ -104,13 +100,13 @@ class SubtractingDecimalsTenthsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: subtract larger numbers with tenths."""
-        tens1 = random.randint(2, 6)
-        ones1 = random.randint(0, 9)
-        tenths1 = random.randint(0, 9)
+        tens1 = self.rng.randint(2, 6)
+        ones1 = self.rng.randint(0, 9)
+        tenths1 = self.rng.randint(0, 9)
 
-        tens2 = random.randint(1, tens1)
-        ones2 = random.randint(0, 9) if tens2 < tens1 else random.randint(0, ones1)
-        tenths2 = random.randint(0, 9)
+        tens2 = self.rng.randint(1, tens1)
+        ones2 = self.rng.randint(0, 9) if tens2 < tens1 else self.rng.randint(0, ones1)
+        tenths2 = self.rng.randint(0, 9)
 
         num1_val = tens1 * 10 + ones1
         num2_val = tens2 * 10 + ones2
@@ -136,12 +132,12 @@ class SubtractingDecimalsTenthsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: multi-step subtraction."""
-        ones1 = random.randint(10, 20)
-        tenths1 = random.randint(0, 9)
-        ones2 = random.randint(2, 6)
-        tenths2 = random.randint(0, 9)
-        ones3 = random.randint(1, 5)
-        tenths3 = random.randint(0, 9)
+        ones1 = self.rng.randint(10, 20)
+        tenths1 = self.rng.randint(0, 9)
+        ones2 = self.rng.randint(2, 6)
+        tenths2 = self.rng.randint(0, 9)
+        ones3 = self.rng.randint(1, 5)
+        tenths3 = self.rng.randint(0, 9)
 
         num1 = f"{ones1}.{tenths1}"
         num2 = f"{ones2}.{tenths2}"
@@ -6,9 +6,6 @@ Example: 1/3 + 1/4 = 7/12
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class AddingSubtractingFractionsUnlikeGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -65,11 +61,11 @@ class AddingSubtractingFractionsUnlikeGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: add fractions where one denominator divides the other."""
-        small_den = random.choice([2, 3, 4, 5])
-        large_den = small_den * random.choice([2, 3])
+        small_den = self.rng.choice([2, 3, 4, 5])
+        large_den = small_den * self.rng.choice([2, 3])
 
-        num1 = random.randint(1, small_den - 1)
-        num2 = random.randint(1, large_den - 1)
+        num1 = self.rng.randint(1, small_den - 1)
+        num2 = self.rng.randint(1, large_den - 1)
 
         lcm = large_den
         new_num1 = num1 * (lcm // small_den)
@@ -96,12 +92,12 @@ class AddingSubtractingFractionsUnlikeGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium problems: add or subtract with different denominators."""
         pairs = [(2, 3), (3, 4), (2, 5), (3, 5), (4, 6)]
-        den1, den2 = random.choice(pairs)
+        den1, den2 = self.rng.choice(pairs)
 
-        num1 = random.randint(1, den1 - 1)
-        num2 = random.randint(1, den2 - 1)
+        num1 = self.rng.randint(1, den1 - 1)
+        num2 = self.rng.randint(1, den2 - 1)
 
-        operation = random.choice(['+', '-'])
+        operation = self.rng.choice(['+', '-'])
 
         lcm = self._lcm(den1, den2)
         new_num1 = num1 * (lcm // den1)
@@ -132,13 +128,13 @@ class AddingSubtractingFractionsUnlikeGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: multiple operations."""
-        den1 = random.choice([3, 4, 5])
-        den2 = random.choice([2, 3, 4])
-        den3 = random.choice([2, 3, 5])
+        den1 = self.rng.choice([3, 4, 5])
+        den2 = self.rng.choice([2, 3, 4])
+        den3 = self.rng.choice([2, 3, 5])
 
-        num1 = random.randint(1, den1 - 1)
-        num2 = random.randint(1, den2 - 1)
-        num3 = random.randint(1, den3 - 1)
+        num1 = self.rng.randint(1, den1 - 1)
+        num2 = self.rng.randint(1, den2 - 1)
+        num3 = self.rng.randint(1, den3 - 1)
 
         lcm_12 = self._lcm(den1, den2)
         lcm_all = self._lcm(lcm_12, den3)
@@ -167,15 +163,15 @@ class AddingSubtractingFractionsUnlikeGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex fractions with simplification."""
-        den1 = random.choice([6, 8, 9, 10, 12])
-        den2 = random.choice([4, 6, 8, 9])
+        den1 = self.rng.choice([6, 8, 9, 10, 12])
+        den2 = self.rng.choice([4, 6, 8, 9])
         while den2 == den1:
-            den2 = random.choice([4, 6, 8, 9])
+            den2 = self.rng.choice([4, 6, 8, 9])
 
-        num1 = random.randint(1, den1 - 1)
-        num2 = random.randint(1, den2 - 1)
+        num1 = self.rng.randint(1, den1 - 1)
+        num2 = self.rng.randint(1, den2 - 1)
 
-        operation = random.choice(['+', '-'])
+        operation = self.rng.choice(['+', '-'])
 
         lcm = self._lcm(den1, den2)
         new_num1 = num1 * (lcm // den1)
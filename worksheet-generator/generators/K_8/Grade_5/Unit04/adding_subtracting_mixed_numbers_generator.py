@@ -6,9 +6,6 @@ Example: 2 1/3 + 1 1/4 = 3 7/12
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class AddingSubtractingMixedNumbersGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -65,14 +61,14 @@ class AddingSubtractingMixedNumbersGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: add mixed numbers, no regrouping."""
-        whole1 = random.randint(1, 4)
-        whole2 = random.randint(1, 4)
+        whole1 = self.rng.randint(1, 4)
+        whole2 = self.rng.randint(1, 4)
 
-        den1 = random.choice([2, 4, 5])
-        den2 = den1 * random.choice([1, 2])
+        den1 = self.rng.choice([2, 4, 5])
+        den2 = den1 * self.rng.choice([1, 2])
 
-        num1 = random.randint(1, den1 - 1)
-        num2 = random.randint(1, den2 - 1)
+        num1 = self.rng.randint(1, den1 - 1)
+        num2 = self.rng.randint(1, den2 - 1)
 
         lcm = self._lcm(den1, den2)
         new_num1 = num1 * (lcm // den1)
@@ -110,14 +106,14 @@ class AddingSubtractingMixedNumbersGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: add with regrouping."""
-        whole1 = random.randint(2, 6)
-        whole2 = random.randint(1, 5)
+        whole1 = self.rng.randint(2, 6)
+        whole2 = self.rng.randint(1, 5)
 
         pairs = [(2, 3), (3, 4), (2, 5), (3, 5)]
-        den1, den2 = random.choice(pairs)
+        den1, den2 = self.rng.choice(pairs)
 
-        num1 = random.randint(1, den1 - 1)
-        num2 = random.randint(1, den2 - 1)
+        num1 = self.rng.randint(1, den1 - 1)
+        num2 = self.rng.randint(1, den2 - 1)
 
         lcm = self._lcm(den1, den2)
         new_num1 = num1 * (lcm // den1)
@@ -151,16 +147,16 @@ class AddingSubtractingMixedNumbersGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: subtract mixed numbers with regrouping."""
-        whole1 = random.randint(4, 8)
-        whole2 = random.randint(1, whole1 - 1)
+        whole1 = self.rng.randint(4, 8)
+        whole2 = self.rng.randint(1, whole1 - 1)
 
-        den1 = random.choice([3, 4, 5, 6])
-        den2 = random.choice([2, 3, 4, 5])
+        den1 = self.rng.choice([3, 4, 5, 6])
+        den2 = self.rng.choice([2, 3, 4, 5])
         while den2 == den1:
-            den2 = random.choice([2, 3, 4, 5])
+            den2 = self.rng.choice([2, 3, 4, 5])
 
-        num1 = random.randint(1, den1 - 1)
-        num2 = random.randint(num1 + 1, den2 - 1)  # Force regrouping
+        num1 = self.rng.randint(1, den1 - 1)
+        num2 = self.rng.randint(num1 + 1, den2 - 1)  # Force regrouping
 
         lcm = self._lcm(den1, den2)
         new_num1 = num1 * (lcm // den1)
@@ -197,17 +193,17 @@ class AddingSubtractingMixedNumbersGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex mixed number operations."""
-        whole1 = random.randint(3, 6)
-        whole2 = random.randint(2, 5)
-        whole3 = random.randint(1, 4)
+        whole1 = self.rng.randint(3, 6)
+        whole2 = self.rng.randint(2, 5)
+        whole3 = self.rng.randint(1, 4)
 
-        den1 = random.choice([3, 4, 6])
-        den2 = random.choice([2, 3, 4])
-        den3 = random.choice([2, 3, 5])
+        den1 = self.rng.choice([3, 4, 6])
+        den2 = self.rng.choice([2, 3, 4])
+        den3 = self.rng.choice([2, 3, 5])
 
-        num1 = random.randint(1, den1 - 1)
-        num2 = random.randint(1, den2 - 1)
-        num3 = random.randint(1, den3 - 1)
+        num1 = self.rng.randint(1, den1 - 1)
+        num2 = self.rng.randint(1, den2 - 1)
+        num3 = self.rng.randint(1, den3 - 1)
 
         lcm_12 = self._lcm(den1, den2)
         lcm_all = self._lcm(lcm_12, den3)
@@ -6,9 +6,6 @@ Example: Find the LCD of 1/4 and 1/6: 12
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class CommonDenominatorsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -60,8 +56,8 @@ class CommonDenominatorsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: LCD when one divides the other."""
-        small = random.choice([2, 3, 4, 5])
-        multiple = random.choice([2, 3])
+        small = self.rng.choice([2, 3, 4, 5])
+        multiple = self.rng.choice([2, 3])
         large = small * multiple
 
         lcm = large
@@ -84,7 +80,7 @@ class CommonDenominatorsGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium problems: LCD of two small numbers."""
         pairs = [(2, 3), (3, 4), (2, 5), (3, 5), (4, 5), (4, 6), (6, 8)]
-        den1, den2 = random.choice(pairs)
+        den1, den2 = self.rng.choice(pairs)
 
         lcm = self._lcm(den1, den2)
 
@@ -105,13 +101,13 @@ class CommonDenominatorsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: LCD of three numbers."""
-        num1 = random.choice([2, 3, 4])
-        num2 = random.choice([3, 4, 5])
-        num3 = random.choice([5, 6])
+        num1 = self.rng.choice([2, 3, 4])
+        num2 = self.rng.choice([3, 4, 5])
+        num3 = self.rng.choice([5, 6])
 
         # Make sure they're not all the same
         while num1 == num2 == num3:
-            num3 = random.choice([5, 6])
+            num3 = self.rng.choice([5, 6])
 
         lcm_12 = self._lcm(num1, num2)
         lcm_all = self._lcm(lcm_12, num3)
@@ -133,13 +129,13 @@ class CommonDenominatorsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: convert multiple fractions to LCD."""
-        den1 = random.choice([3, 4, 5, 6])
-        den2 = random.choice([2, 3, 4, 5])
+        den1 = self.rng.choice([3, 4, 5, 6])
+        den2 = self.rng.choice([2, 3, 4, 5])
         while den2 == den1:
-            den2 = random.choice([2, 3, 4, 5])
+            den2 = self.rng.choice([2, 3, 4, 5])
 
-        num1 = random.randint(1, den1 - 1)
-        num2 = random.randint(1, den2 - 1)
+        num1 = self.rng.randint(1, den1 - 1)
+        num2 = self.rng.randint(1, den2 - 1)
 
         lcm = self._lcm(den1, den2)
         new_num1 = num1 * (lcm // den1)
@@ -6,9 +6,6 @@ Example: What common denominator can we use for 1/3 + 1/4?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class FractionsUnlikeDenominatorsStrategiesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -59,7 +55,7 @@ class FractionsUnlikeDenominatorsStrategiesGenerator:
     def _generate_easy(self) -> Equation:
         """Generate easy problems: identify common denominator for simple fractions."""
         denominators = [(2, 4), (3, 6), (2, 6), (4, 8), (5, 10)]
-        den1, den2 = random.choice(denominators)
+        den1, den2 = self.rng.choice(denominators)
 
         lcm = self._lcm(den1, den2)
 
@@ -81,9 +77,9 @@ class FractionsUnlikeDenominatorsStrategiesGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium problems: convert to common denominator."""
         denominators = [(2, 3), (3, 4), (2, 5), (3, 5), (4, 6)]
-        den1, den2 = random.choice(denominators)
-        num1 = random.randint(1, den1 - 1)
-        num2 = random.randint(1, den2 - 1)
+        den1, den2 = self.rng.choice(denominators)
+        num1 = self.rng.randint(1, den1 - 1)
+        num2 = self.rng.randint(1, den2 - 1)
 
         lcm = self._lcm(den1, den2)
         new_num1 = num1 * (lcm // den1)
@@ -107,10 +103,10 @@ class FractionsUnlikeDenominatorsStrategiesGenerator:
     def _generate_hard(self) -> Equation:
         """Generate hard problems: use benchmark fractions to estimate."""
         denominators = [(3, 4), (4, 5), (2, 5), (5, 6)]
-        den1, den2 = random.choice(denominators)
+        den1, den2 = self.rng.choice(denominators)
 
         # Choose numerators to make fractions close to 1/2 or 1
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             num1 = den1 // 2  # close to 1/2
             num2 = den2 // 2
             benchmark = "\\frac{1}{2}"
@@ -150,13 +146,13 @@ class FractionsUnlikeDenominatorsStrategiesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: compare different strategies."""
-        den1 = random.choice([3, 4, 5, 6])
-        den2 = random.choice([2, 3, 4, 5])
+        den1 = self.rng.choice([3, 4, 5, 6])
+        den2 = self.rng.choice([2, 3, 4, 5])
         while den2 == den1:
-            den2 = random.choice([2, 3, 4, 5])
+            den2 = self.rng.choice([2, 3, 4, 5])
 
-        num1 = random.randint(1, den1 - 1)
-        num2 = random.randint(1, den2 - 1)
+        num1 = self.rng.randint(1, den1 - 1)
+        num2 = self.rng.randint(1, den2 - 1)
 
         lcm = self._lcm(den1, den2)
         product = den1 * den2
@@ -6,9 +6,6 @@ Example: Sarah ran 1/2 mile and then ran 1/3 mile more. How far did she run?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class FractionsWordProblemsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -74,14 +70,14 @@ class FractionsWordProblemsGenerator:
             ("gallon", "used")
         ]
 
-        unit, verb = random.choice(contexts)
-        name = random.choice(["Sarah", "John", "Maria", "Alex", "Emma", "David"])
+        unit, verb = self.rng.choice(contexts)
+        name = self.rng.choice(["Sarah", "John", "Maria", "Alex", "Emma", "David"])
 
-        den1 = random.choice([2, 4])
+        den1 = self.rng.choice([2, 4])
         den2 = den1 * 2 if den1 == 2 else den1
 
-        num1 = random.randint(1, den1 - 1)
-        num2 = random.randint(1, den2 - 1)
+        num1 = self.rng.randint(1, den1 - 1)
+        num2 = self.rng.randint(1, den2 - 1)
 
         lcm = den2
         new_num1 = num1 * (lcm // den1)
@@ -112,14 +108,14 @@ class FractionsWordProblemsGenerator:
             ("liter", "had", "drank")
         ]
 
-        unit, verb1, verb2 = random.choice(contexts)
-        name = random.choice(["Sarah", "John", "Maria", "Alex", "Emma", "David"])
+        unit, verb1, verb2 = self.rng.choice(contexts)
+        name = self.rng.choice(["Sarah", "John", "Maria", "Alex", "Emma", "David"])
 
         pairs = [(3, 2), (4, 3), (5, 2), (6, 4)]
-        den1, den2 = random.choice(pairs)
+        den1, den2 = self.rng.choice(pairs)
 
-        num1 = random.randint(2, den1 - 1)
-        num2 = random.randint(1, den2 - 1)
+        num1 = self.rng.randint(2, den1 - 1)
+        num2 = self.rng.randint(1, den2 - 1)
 
         lcm = self._lcm(den1, den2)
         new_num1 = num1 * (lcm // den1)
@@ -151,20 +147,20 @@ class FractionsWordProblemsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: mixed numbers in word problems."""
-        name1 = random.choice(["Sarah", "John", "Maria"])
-        name2 = random.choice(["Alex", "Emma", "David"])
-        unit = random.choice(["mile", "hour", "pound"])
+        name1 = self.rng.choice(["Sarah", "John", "Maria"])
+        name2 = self.rng.choice(["Alex", "Emma", "David"])
+        unit = self.rng.choice(["mile", "hour", "pound"])
 
-        whole1 = random.randint(1, 3)
-        whole2 = random.randint(1, 3)
+        whole1 = self.rng.randint(1, 3)
+        whole2 = self.rng.randint(1, 3)
 
-        den1 = random.choice([2, 3, 4])
-        den2 = random.choice([2, 3, 4])
+        den1 = self.rng.choice([2, 3, 4])
+        den2 = self.rng.choice([2, 3, 4])
         while den2 == den1:
-            den2 = random.choice([2, 3, 4])
+            den2 = self.rng.choice([2, 3, 4])
 
-        num1 = random.randint(1, den1 - 1)
-        num2 = random.randint(1, den2 - 1)
+        num1 = self.rng.randint(1, den1 - 1)
+        num2 = self.rng.randint(1, den2 - 1)
 
         lcm = self._lcm(den1, den2)
         new_num1 = num1 * (lcm // den1)
@@ -197,20 +193,20 @@ class FractionsWordProblemsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: multi-step word problems."""
-        name = random.choice(["Sarah", "John", "Maria", "Alex"])
-        unit = random.choice(["pound", "gallon", "meter"])
+        name = self.rng.choice(["Sarah", "John", "Maria", "Alex"])
+        unit = self.rng.choice(["pound", "gallon", "meter"])
 
-        whole1 = random.randint(3, 6)
-        whole2 = random.randint(1, 3)
-        whole3 = random.randint(1, 2)
+        whole1 = self.rng.randint(3, 6)
+        whole2 = self.rng.randint(1, 3)
+        whole3 = self.rng.randint(1, 2)
 
-        den1 = random.choice([2, 4])
-        den2 = random.choice([3, 6])
-        den3 = random.choice([2, 3])
+        den1 = self.rng.choice([2, 4])
+        den2 = self.rng.choice([3, 6])
+        den3 = self.rng.choice([2, 3])
 
-        num1 = random.randint(1, den1 - 1)
-        num2 = random.randint(1, den2 - 1)
-        num3 = random.randint(1, den3 - 1)
+        num1 = self.rng.randint(1, den1 - 1)
+        num2 = self.rng.randint(1, den2 - 1)
+        num3 = self.rng.randint(1, den3 - 1)
 
         lcm_12 = self._lcm(den1, den2)
         lcm_all = self._lcm(lcm_12, den3)
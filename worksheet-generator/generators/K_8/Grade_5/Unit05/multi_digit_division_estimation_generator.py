@@ -6,9 +6,6 @@ Example: Estimate 184 ÷ 6 by using compatible numbers: 180 ÷ 6 = 30
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class MultiDigitDivisionEstimationGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -56,12 +52,12 @@ class MultiDigitDivisionEstimationGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: 2-digit ÷ 1-digit estimation."""
-        divisor = random.randint(3, 9)
+        divisor = self.rng.randint(3, 9)
 
         # Create a dividend close to but not exactly divisible
-        quotient_base = random.randint(5, 15)
+        quotient_base = self.rng.randint(5, 15)
         dividend_base = divisor * quotient_base
-        dividend = dividend_base + random.randint(1, divisor - 1)
+        dividend = dividend_base + self.rng.randint(1, divisor - 1)
 
         compatible, estimate = self._find_compatible_dividend(divisor, dividend)
 
@@ -81,12 +77,12 @@ class MultiDigitDivisionEstimationGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: 3-digit ÷ 1-digit estimation."""
-        divisor = random.randint(4, 9)
+        divisor = self.rng.randint(4, 9)
 
         # Create a dividend
-        quotient_base = random.randint(20, 60)
+        quotient_base = self.rng.randint(20, 60)
         dividend_base = divisor * quotient_base
-        dividend = dividend_base + random.randint(1, divisor - 1)
+        dividend = dividend_base + self.rng.randint(1, divisor - 1)
 
         compatible, estimate = self._find_compatible_dividend(divisor, dividend)
 
@@ -106,12 +102,12 @@ class MultiDigitDivisionEstimationGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: 3-digit ÷ 2-digit estimation."""
-        divisor = random.randint(12, 25)
+        divisor = self.rng.randint(12, 25)
 
         # Create a dividend
-        quotient_base = random.randint(10, 30)
+        quotient_base = self.rng.randint(10, 30)
         dividend_base = divisor * quotient_base
-        dividend = dividend_base + random.randint(1, divisor - 1)
+        dividend = dividend_base + self.rng.randint(1, divisor - 1)
 
         compatible, estimate = self._find_compatible_dividend(divisor, dividend)
 
@@ -131,11 +127,11 @@ class MultiDigitDivisionEstimationGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: estimate and compare to actual."""
-        divisor = random.randint(6, 12)
+        divisor = self.rng.randint(6, 12)
 
-        quotient_base = random.randint(15, 40)
+        quotient_base = self.rng.randint(15, 40)
         dividend_base = divisor * quotient_base
-        dividend = dividend_base + random.randint(1, divisor - 1)
+        dividend = dividend_base + self.rng.randint(1, divisor - 1)
 
         compatible, estimate = self._find_compatible_dividend(divisor, dividend)
         actual = dividend // divisor
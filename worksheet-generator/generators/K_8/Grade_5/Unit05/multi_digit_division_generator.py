@@ -6,9 +6,6 @@ Example: 156 ÷ 12 = 13
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class MultiDigitDivisionGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class MultiDigitDivisionGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: 2-digit ÷ 1-digit, no remainder."""
-        divisor = random.randint(3, 9)
-        quotient = random.randint(5, 15)
+        divisor = self.rng.randint(3, 9)
+        quotient = self.rng.randint(5, 15)
         dividend = divisor * quotient
 
         latex = f"{dividend} \\div {divisor}"
@@ -70,9 +66,9 @@ class MultiDigitDivisionGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: 2-digit or 3-digit ÷ 1-digit with remainder."""
-        divisor = random.randint(4, 9)
-        quotient = random.randint(10, 40)
-        remainder = random.randint(1, divisor - 1)
+        divisor = self.rng.randint(4, 9)
+        quotient = self.rng.randint(10, 40)
+        remainder = self.rng.randint(1, divisor - 1)
         dividend = divisor * quotient + remainder
 
         latex = f"{dividend} \\div {divisor}"
@@ -91,10 +87,10 @@ class MultiDigitDivisionGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: 3-digit ÷ 2-digit."""
-        divisor = random.randint(12, 25)
-        quotient = random.randint(10, 35)
+        divisor = self.rng.randint(12, 25)
+        quotient = self.rng.randint(10, 35)
 
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # No remainder
             dividend = divisor * quotient
             solution = str(quotient)
@@ -104,7 +100,7 @@ class MultiDigitDivisionGenerator:
             ]
         else:
             # With remainder
-            remainder = random.randint(1, divisor - 1)
+            remainder = self.rng.randint(1, divisor - 1)
             dividend = divisor * quotient + remainder
             solution = f"{quotient} \\text{{{{ R }}}} {remainder}"
             steps = [
@@ -123,10 +119,10 @@ class MultiDigitDivisionGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: 4-digit ÷ 2-digit."""
-        divisor = random.randint(15, 35)
-        quotient = random.randint(40, 150)
+        divisor = self.rng.randint(15, 35)
+        quotient = self.rng.randint(40, 150)
 
-        if random.choice([True, False, False]):  # Less likely to have no remainder
+        if self.rng.choice([True, False, False]):  # Less likely to have no remainder
             # No remainder
             dividend = divisor * quotient
             solution = str(quotient)
@@ -136,7 +132,7 @@ class MultiDigitDivisionGenerator:
             ]
         else:
             # With remainder
-            remainder = random.randint(1, divisor - 1)
+            remainder = self.rng.randint(1, divisor - 1)
             dividend = divisor * quotient + remainder
             solution = f"{quotient} \\text{{{{ R }}}} {remainder}"
             steps = [
@@ -6,9 +6,6 @@ Example: Estimate 38 × 24 by rounding to tens: 40 × 20 = 800
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class MultiDigitMultiplicationEstimationGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -58,11 +54,11 @@ class MultiDigitMultiplicationEstimationGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: estimate 2-digit × 1-digit."""
-        tens = random.randint(2, 8)
-        ones = random.randint(1, 9)
+        tens = self.rng.randint(2, 8)
+        ones = self.rng.randint(1, 9)
         num1 = tens * 10 + ones
 
-        num2 = random.randint(2, 9)
+        num2 = self.rng.randint(2, 9)
 
         rounded1 = self._round_to_tens(num1)
         estimate = rounded1 * num2
@@ -83,12 +79,12 @@ class MultiDigitMultiplicationEstimationGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: estimate 2-digit × 2-digit."""
-        tens1 = random.randint(2, 7)
-        ones1 = random.randint(1, 9)
+        tens1 = self.rng.randint(2, 7)
+        ones1 = self.rng.randint(1, 9)
         num1 = tens1 * 10 + ones1
 
-        tens2 = random.randint(2, 7)
-        ones2 = random.randint(1, 9)
+        tens2 = self.rng.randint(2, 7)
+        ones2 = self.rng.randint(1, 9)
         num2 = tens2 * 10 + ones2
 
         rounded1 = self._round_to_tens(num1)
@@ -111,13 +107,13 @@ class MultiDigitMultiplicationEstimationGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: estimate 3-digit × 2-digit."""
-        hundreds = random.randint(2, 6)
-        tens = random.randint(0, 9)
-        ones = random.randint(0, 9)
+        hundreds = self.rng.randint(2, 6)
+        tens = self.rng.randint(0, 9)
+        ones = self.rng.randint(0, 9)
         num1 = hundreds * 100 + tens * 10 + ones
 
-        tens2 = random.randint(2, 7)
-        ones2 = random.randint(0, 9)
+        tens2 = self.rng.randint(2, 7)
+        ones2 = self.rng.randint(0, 9)
         num2 = tens2 * 10 + ones2
 
         rounded1 = self._round_to_hundreds(num1)
@@ -140,12 +136,12 @@ class MultiDigitMultiplicationEstimationGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: compare estimate to actual."""
-        tens1 = random.randint(3, 7)
-        ones1 = random.randint(2, 8)
+        tens1 = self.rng.randint(3, 7)
+        ones1 = self.rng.randint(2, 8)
         num1 = tens1 * 10 + ones1
 
-        tens2 = random.randint(2, 6)
-        ones2 = random.randint(2, 8)
+        tens2 = self.rng.randint(2, 6)
+        ones2 = self.rng.randint(2, 8)
         num2 = tens2 * 10 + ones2
 
         rounded1 = self._round_to_tens(num1)
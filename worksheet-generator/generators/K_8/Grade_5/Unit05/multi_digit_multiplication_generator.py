@@ -6,9 +6,6 @@ Example: 24 × 36 = 864
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class MultiDigitMultiplicationGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,11 +46,11 @@ class MultiDigitMultiplicationGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: 2-digit × 1-digit."""
-        tens = random.randint(2, 8)
-        ones = random.randint(1, 9)
+        tens = self.rng.randint(2, 8)
+        ones = self.rng.randint(1, 9)
         num1 = tens * 10 + ones
 
-        num2 = random.randint(2, 9)
+        num2 = self.rng.randint(2, 9)
 
         product = num1 * num2
 
@@ -74,12 +70,12 @@ class MultiDigitMultiplicationGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: 2-digit × 2-digit."""
-        tens1 = random.randint(2, 7)
-        ones1 = random.randint(1, 9)
+        tens1 = self.rng.randint(2, 7)
+        ones1 = self.rng.randint(1, 9)
         num1 = tens1 * 10 + ones1
 
-        tens2 = random.randint(2, 7)
-        ones2 = random.randint(1, 9)
+        tens2 = self.rng.randint(2, 7)
+        ones2 = self.rng.randint(1, 9)
         num2 = tens2 * 10 + ones2
 
         product = num1 * num2
@@ -100,13 +96,13 @@ class MultiDigitMultiplicationGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: 3-digit × 2-digit."""
-        hundreds = random.randint(2, 6)
-        tens = random.randint(0, 9)
-        ones = random.randint(0, 9)
+        hundreds = self.rng.randint(2, 6)
+        tens = self.rng.randint(0, 9)
+        ones = self.rng.randint(0, 9)
         num1 = hundreds * 100 + tens * 10 + ones
 
-        tens2 = random.randint(2, 7)
-        ones2 = random.randint(1, 9)
+        tens2 = self.rng.randint(2, 7)
+        ones2 = self.rng.randint(1, 9)
         num2 = tens2 * 10 + ones2
 
         product = num1 * num2
@@ -127,14 +123,14 @@ class MultiDigitMultiplicationGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: 3-digit × 3-digit."""
-        hundreds1 = random.randint(1, 5)
-        tens1 = random.randint(0, 9)
-        ones1 = random.randint(0, 9)
+        hundreds1 = self.rng.randint(1, 5)
+        tens1 = self.rng.randint(0, 9)
+        ones1 = self.rng.randint(0, 9)
         num1 = hundreds1 * 100 + tens1 * 10 + ones1
 
-        hundreds2 = random.randint(1, 4)
-        tens2 = random.randint(0, 9)
-        ones2 = random.randint(0, 9)
+        hundreds2 = self.rng.randint(1, 4)
+        tens2 = self.rng.randint(0, 9)
+        ones2 = self.rng.randint(0, 9)
         num2 = hundreds2 * 100 + tens2 * 10 + ones2
 
         product = num1 * num2
@@ -6,10 +6,7 @@ Example: Are 2:3 and 4:6 equivalent ratios?
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -18,8 +15,7 @@ class EquivalentRatiosGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -51,18 +47,18 @@ class EquivalentRatiosGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: identifying equivalent ratios."""
-        num1 = random.randint(1, 4)
-        num2 = random.randint(1, 4)
-        multiplier = random.choice([2, 3])
+        num1 = self.rng.randint(1, 4)
+        num2 = self.rng.randint(1, 4)
+        multiplier = self.rng.choice([2, 3])
 
         new_num1 = num1 * multiplier
         new_num2 = num2 * multiplier
 
         # Randomly decide if they are equivalent
-        is_equivalent = random.choice([True, False])
+        is_equivalent = self.rng.choice([True, False])
 
         if not is_equivalent:
-            new_num2 += random.choice([1, -1]) * random.choice([1, 2])
+            new_num2 += self.rng.choice([1, -1]) * self.rng.choice([1, 2])
             if new_num2 <= 0:
                 new_num2 = num2 * multiplier + 1
 
@@ -83,12 +79,12 @@ class EquivalentRatiosGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: finding missing values in equivalent ratios."""
-        num1 = random.randint(2, 6)
-        num2 = random.randint(2, 6)
-        multiplier = random.choice([2, 3, 4, 5])
+        num1 = self.rng.randint(2, 6)
+        num2 = self.rng.randint(2, 6)
+        multiplier = self.rng.choice([2, 3, 4, 5])
 
         # Randomly pick which value to hide
-        hide_first = random.choice([True, False])
+        hide_first = self.rng.choice([True, False])
 
         if hide_first:
             known = num2 * multiplier
@@ -108,9 +104,9 @@ class EquivalentRatiosGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: creating tables of equivalent ratios."""
-        num1 = random.randint(2, 5)
-        num2 = random.randint(2, 5)
-        multiplier = random.choice([3, 4])
+        num1 = self.rng.randint(2, 5)
+        num2 = self.rng.randint(2, 5)
+        multiplier = self.rng.choice([3, 4])
 
         result1 = num1 * multiplier
         result2 = num2 * multiplier
@@ -134,10 +130,10 @@ class EquivalentRatiosGenerator:
             ("apples", "oranges")
         ]
 
-        item1, item2 = random.choice(contexts)
-        num1 = random.randint(2, 4)
-        num2 = random.randint(2, 4)
-        multiplier = random.choice([2, 3])
+        item1, item2 = self.rng.choice(contexts)
+        num1 = self.rng.randint(2, 4)
+        num2 = self.rng.randint(2, 4)
+        multiplier = self.rng.choice([2, 3])
 
         new_num1 = num1 * multiplier
 
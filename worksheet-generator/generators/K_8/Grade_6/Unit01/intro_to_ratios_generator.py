@@ -6,9 +6,6 @@ Example: There are 3 apples and 5 oranges. What is the ratio of apples to orange
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class IntroToRatiosGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -58,9 +54,9 @@ class IntroToRatiosGenerator:
             ("pencils", "pens")
         ]
 
-        item1, item2 = random.choice(contexts)
-        num1 = random.randint(2, 5)
-        num2 = random.randint(2, 5)
+        item1, item2 = self.rng.choice(contexts)
+        num1 = self.rng.randint(2, 5)
+        num2 = self.rng.randint(2, 5)
 
         latex = f"\\text{{There are {num1} {item1} and {num2} {item2}. What is the ratio of {item1} to {item2}?}}"
         solution = f"{num1}:{num2}"
@@ -82,9 +78,9 @@ class IntroToRatiosGenerator:
             ("basketballs", "soccer balls")
         ]
 
-        item1, item2 = random.choice(contexts)
-        num1 = random.randint(5, 12)
-        num2 = random.randint(5, 12)
+        item1, item2 = self.rng.choice(contexts)
+        num1 = self.rng.randint(5, 12)
+        num2 = self.rng.randint(5, 12)
 
         latex = f"\\text{{A classroom has {num1} {item1} and {num2} {item2}. Write the ratio of {item1} to {item2}.}}"
         solution = f"{num1}:{num2}"
@@ -105,10 +101,10 @@ class IntroToRatiosGenerator:
             ("small", "medium", "large")
         ]
 
-        item1, item2, item3 = random.choice(contexts)
-        num1 = random.randint(2, 8)
-        num2 = random.randint(2, 8)
-        num3 = random.randint(2, 8)
+        item1, item2, item3 = self.rng.choice(contexts)
+        num1 = self.rng.randint(2, 8)
+        num2 = self.rng.randint(2, 8)
+        num3 = self.rng.randint(2, 8)
 
         latex = f"\\text{{A bag contains {num1} {item1}, {num2} {item2}, and {num3} {item3} items.}}"
         latex += f"\\text{{ Write the ratio of {item1} to {item2} to {item3}.}}"
@@ -130,9 +126,9 @@ class IntroToRatiosGenerator:
             ("fiction books", "books")
         ]
 
-        part_name, whole_name = random.choice(contexts)
-        part = random.randint(3, 10)
-        other_part = random.randint(3, 10)
+        part_name, whole_name = self.rng.choice(contexts)
+        part = self.rng.randint(3, 10)
+        other_part = self.rng.randint(3, 10)
         total = part + other_part
 
         latex = f"\\text{{Out of {total} {whole_name}, {part} are {part_name}.}}"
@@ -6,9 +6,6 @@ Example: A recipe calls for ingredients in a 3:2 ratio. If you have 12 cups of t
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class RatioApplicationGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -57,10 +53,10 @@ class RatioApplicationGenerator:
             ("pencils", "pens")
         ]
 
-        item1, item2 = random.choice(contexts)
-        ratio1 = random.randint(1, 4)
-        ratio2 = random.randint(1, 4)
-        multiplier = random.choice([2, 3])
+        item1, item2 = self.rng.choice(contexts)
+        ratio1 = self.rng.randint(1, 4)
+        ratio2 = self.rng.randint(1, 4)
+        multiplier = self.rng.choice([2, 3])
 
         actual1 = ratio1 * multiplier
         actual2 = ratio2 * multiplier
@@ -85,10 +81,10 @@ class RatioApplicationGenerator:
             ("tablespoons of oil", "tablespoons of vinegar", "dressing")
         ]
 
-        item1, item2, product = random.choice(contexts)
-        ratio1 = random.randint(2, 5)
-        ratio2 = random.randint(2, 5)
-        multiplier = random.choice([2, 3, 4])
+        item1, item2, product = self.rng.choice(contexts)
+        ratio1 = self.rng.randint(2, 5)
+        ratio2 = self.rng.randint(2, 5)
+        multiplier = self.rng.choice([2, 3, 4])
 
         actual1 = ratio1 * multiplier
 
@@ -112,10 +108,10 @@ class RatioApplicationGenerator:
             ("fiction books", "non-fiction books")
         ]
 
-        item1, item2 = random.choice(contexts)
-        ratio1 = random.randint(2, 5)
-        ratio2 = random.randint(2, 5)
-        multiplier = random.choice([2, 3, 4])
+        item1, item2 = self.rng.choice(contexts)
+        ratio1 = self.rng.randint(2, 5)
+        ratio2 = self.rng.randint(2, 5)
+        multiplier = self.rng.choice([2, 3, 4])
 
         actual1 = ratio1 * multiplier
         actual2 = ratio2 * multiplier
@@ -141,10 +137,10 @@ class RatioApplicationGenerator:
             ("mystery books", "adventure books")
         ]
 
-        item1, item2 = random.choice(contexts)
-        ratio1 = random.randint(2, 4)
-        ratio2 = random.randint(2, 4)
-        multiplier = random.choice([2, 3])
+        item1, item2 = self.rng.choice(contexts)
+        ratio1 = self.rng.randint(2, 4)
+        ratio2 = self.rng.randint(2, 4)
+        multiplier = self.rng.choice([2, 3])
 
         actual1 = ratio1 * multiplier
         actual2 = ratio2 * multiplier
@@ -6,9 +6,6 @@ Example: If the ratio of red to blue is 2:3, draw an equivalent ratio with 4 red
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class VisualizeEquivalentRatiosGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class VisualizeEquivalentRatiosGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: doubling ratios."""
-        num1 = random.randint(1, 4)
-        num2 = random.randint(1, 4)
+        num1 = self.rng.randint(1, 4)
+        num2 = self.rng.randint(1, 4)
         multiplier = 2
 
         new_num1 = num1 * multiplier
@@ -69,9 +65,9 @@ class VisualizeEquivalentRatiosGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: scaling ratios by different multipliers."""
-        num1 = random.randint(2, 5)
-        num2 = random.randint(2, 5)
-        multiplier = random.choice([3, 4, 5])
+        num1 = self.rng.randint(2, 5)
+        num2 = self.rng.randint(2, 5)
+        multiplier = self.rng.choice([3, 4, 5])
 
         new_num1 = num1 * multiplier
         new_num2 = num2 * multiplier
@@ -88,9 +84,9 @@ class VisualizeEquivalentRatiosGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: finding the multiplier."""
-        num1 = random.randint(2, 6)
-        num2 = random.randint(2, 6)
-        multiplier = random.choice([2, 3, 4])
+        num1 = self.rng.randint(2, 6)
+        num2 = self.rng.randint(2, 6)
+        multiplier = self.rng.choice([2, 3, 4])
 
         new_num1 = num1 * multiplier
 
@@ -107,9 +103,9 @@ class VisualizeEquivalentRatiosGenerator:
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: simplifying ratios."""
         # Start with a simplified ratio
-        simple1 = random.randint(2, 5)
-        simple2 = random.randint(2, 5)
-        multiplier = random.choice([2, 3, 4, 5])
+        simple1 = self.rng.randint(2, 5)
+        simple2 = self.rng.randint(2, 5)
+        multiplier = self.rng.choice([2, 3, 4, 5])
 
         # Create a ratio that needs to be simplified
         num1 = simple1 * multiplier
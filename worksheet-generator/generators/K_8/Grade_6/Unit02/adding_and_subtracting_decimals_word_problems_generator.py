@@ -6,9 +6,6 @@ Example: Sarah had $15.75. She spent $8.50. How much does she have left?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class AddingAndSubtractingDecimalsWordProblemsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -57,9 +53,9 @@ class AddingAndSubtractingDecimalsWordProblemsGenerator:
             "A bottle has {} liters of water and another has {} liters. How much water total?"
         ]
 
-        context = random.choice(contexts)
-        num1 = round(random.uniform(1.0, 10.0), 1)
-        num2 = round(random.uniform(1.0, 10.0), 1)
+        context = self.rng.choice(contexts)
+        num1 = round(self.rng.uniform(1.0, 10.0), 1)
+        num2 = round(self.rng.uniform(1.0, 10.0), 1)
         result = round(num1 + num2, 1)
 
         latex = f"\\text{{{context.format(num1, num2)}}}"
@@ -81,9 +77,9 @@ class AddingAndSubtractingDecimalsWordProblemsGenerator:
             "John had {} pounds of flour and used {} pounds. How much flour is left?"
         ]
 
-        context = random.choice(contexts)
-        num2 = round(random.uniform(1.0, 10.0), 2)
-        num1 = round(num2 + random.uniform(5.0, 15.0), 2)
+        context = self.rng.choice(contexts)
+        num2 = round(self.rng.uniform(1.0, 10.0), 2)
+        num1 = round(num2 + self.rng.uniform(5.0, 15.0), 2)
         result = round(num1 - num2, 2)
 
         latex = f"\\text{{{context.format(num1, num2)}}}"
@@ -98,9 +94,9 @@ class AddingAndSubtractingDecimalsWordProblemsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: multi-step problems."""
-        num1 = round(random.uniform(10.0, 30.0), 2)
-        purchase1 = round(random.uniform(2.0, 8.0), 2)
-        purchase2 = round(random.uniform(2.0, 8.0), 2)
+        num1 = round(self.rng.uniform(10.0, 30.0), 2)
+        purchase1 = round(self.rng.uniform(2.0, 8.0), 2)
+        purchase2 = round(self.rng.uniform(2.0, 8.0), 2)
         result = round(num1 - purchase1 - purchase2, 2)
 
         latex = f"\\text{{Emma had $}} {num1} \\text{{. She bought a snack for $}} {purchase1}"
@@ -116,9 +112,9 @@ class AddingAndSubtractingDecimalsWordProblemsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: combined operations."""
-        initial = round(random.uniform(20.0, 50.0), 2)
-        spent = round(random.uniform(5.0, 15.0), 2)
-        earned = round(random.uniform(5.0, 15.0), 2)
+        initial = round(self.rng.uniform(20.0, 50.0), 2)
+        spent = round(self.rng.uniform(5.0, 15.0), 2)
+        earned = round(self.rng.uniform(5.0, 15.0), 2)
         result = round(initial - spent + earned, 2)
 
         latex = f"\\text{{Alex had $}} {initial} \\text{{. He spent $}} {spent}"
@@ -6,9 +6,6 @@ Example: 7.5 ÷ 2.5 = ?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class DividingDecimalsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class DividingDecimalsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: dividing decimals by whole numbers."""
-        divisor = random.randint(2, 9)
-        quotient = round(random.uniform(1.0, 10.0), 1)
+        divisor = self.rng.randint(2, 9)
+        quotient = round(self.rng.uniform(1.0, 10.0), 1)
         dividend = round(divisor * quotient, 1)
 
         latex = f"{dividend} \\div {divisor}"
@@ -66,8 +62,8 @@ class DividingDecimalsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: dividing by tenths."""
-        divisor = round(random.uniform(1.0, 5.0), 1)
-        quotient = random.randint(2, 20)
+        divisor = round(self.rng.uniform(1.0, 5.0), 1)
+        quotient = self.rng.randint(2, 20)
         dividend = round(divisor * quotient, 1)
 
         latex = f"{dividend} \\div {divisor}"
@@ -82,8 +78,8 @@ class DividingDecimalsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: dividing decimals by decimals."""
-        divisor = round(random.uniform(1.0, 5.0), 1)
-        quotient = round(random.uniform(2.0, 10.0), 1)
+        divisor = round(self.rng.uniform(1.0, 5.0), 1)
+        quotient = round(self.rng.uniform(2.0, 10.0), 1)
         dividend = round(divisor * quotient, 2)
 
         latex = f"{dividend} \\div {divisor}"
@@ -98,8 +94,8 @@ class DividingDecimalsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: dividing with hundredths."""
-        divisor = round(random.uniform(1.0, 10.0), 2)
-        quotient = round(random.uniform(2.0, 15.0), 1)
+        divisor = round(self.rng.uniform(1.0, 10.0), 2)
+        quotient = round(self.rng.uniform(2.0, 15.0), 1)
         dividend = round(divisor * quotient, 2)
 
         latex = f"{dividend} \\div {divisor}"
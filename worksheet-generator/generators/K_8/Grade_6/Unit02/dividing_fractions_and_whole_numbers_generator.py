@@ -6,10 +6,7 @@ Example: 1/2 ÷ 3 = ? or 6 ÷ 1/2 = ?
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -18,8 +15,7 @@ class DividingFractionsAndWholeNumbersGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -62,8 +58,8 @@ class DividingFractionsAndWholeNumbersGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: unit fractions divided by whole numbers."""
-        denominator = random.choice([2, 3, 4])
-        divisor = random.choice([2, 3])
+        denominator = self.rng.choice([2, 3, 4])
+        divisor = self.rng.choice([2, 3])
 
         result_num = 1
         result_den = denominator * divisor
@@ -80,9 +76,9 @@ class DividingFractionsAndWholeNumbersGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: fractions divided by whole numbers."""
-        numerator = random.randint(1, 5)
-        denominator = random.choice([2, 3, 4, 5, 6])
-        divisor = random.choice([2, 3, 4])
+        numerator = self.rng.randint(1, 5)
+        denominator = self.rng.choice([2, 3, 4, 5, 6])
+        divisor = self.rng.choice([2, 3, 4])
 
         result_num = numerator
         result_den = denominator * divisor
@@ -100,9 +96,9 @@ class DividingFractionsAndWholeNumbersGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: whole numbers divided by fractions."""
-        whole = random.randint(2, 8)
+        whole = self.rng.randint(2, 8)
         frac_num = 1
-        frac_den = random.choice([2, 3, 4, 5])
+        frac_den = self.rng.choice([2, 3, 4, 5])
 
         result_num = whole * frac_den
         result_den = frac_num
@@ -123,13 +119,13 @@ class DividingFractionsAndWholeNumbersGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: whole numbers divided by non-unit fractions."""
-        whole = random.randint(3, 10)
-        frac_num = random.randint(2, 4)
-        frac_den = random.choice([3, 4, 5, 6])
+        whole = self.rng.randint(3, 10)
+        frac_num = self.rng.randint(2, 4)
+        frac_den = self.rng.choice([3, 4, 5, 6])
 
         # Ensure fraction is proper
         while frac_num >= frac_den:
-            frac_den = random.choice([3, 4, 5, 6])
+            frac_den = self.rng.choice([3, 4, 5, 6])
 
         result_num = whole * frac_den
         result_den = frac_num
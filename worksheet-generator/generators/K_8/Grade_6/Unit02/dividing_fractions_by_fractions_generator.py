@@ -6,10 +6,7 @@ Example: 1/2 ÷ 1/3 = ?
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -18,8 +15,7 @@ class DividingFractionsByFractionsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -62,8 +58,8 @@ class DividingFractionsByFractionsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: unit fractions divided by unit fractions."""
-        den1 = random.choice([2, 3, 4])
-        den2 = random.choice([2, 3, 4])
+        den1 = self.rng.choice([2, 3, 4])
+        den2 = self.rng.choice([2, 3, 4])
 
         # Result: (1/den1) ÷ (1/den2) = den2/den1
         result_num = den2
@@ -85,9 +81,9 @@ class DividingFractionsByFractionsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: fractions divided by unit fractions."""
-        num1 = random.randint(1, 4)
-        den1 = random.choice([2, 3, 4, 5])
-        den2 = random.choice([2, 3, 4])
+        num1 = self.rng.randint(1, 4)
+        den1 = self.rng.choice([2, 3, 4, 5])
+        den2 = self.rng.choice([2, 3, 4])
 
         # Result: (num1/den1) ÷ (1/den2) = (num1 * den2)/den1
         result_num = num1 * den2
@@ -109,10 +105,10 @@ class DividingFractionsByFractionsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: fractions divided by fractions."""
-        num1 = random.randint(1, 5)
-        den1 = random.choice([2, 3, 4, 5, 6])
-        num2 = random.randint(1, 4)
-        den2 = random.choice([2, 3, 4, 5])
+        num1 = self.rng.randint(1, 5)
+        den1 = self.rng.choice([2, 3, 4, 5, 6])
+        num2 = self.rng.randint(1, 4)
+        den2 = self.rng.choice([2, 3, 4, 5])
 
         # Result: (num1/den1) ÷ (num2/den2) = (num1 * den2)/(den1 * num2)
         result_num = num1 * den2
@@ -134,10 +130,10 @@ class DividingFractionsByFractionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex fractions with simplification."""
-        num1 = random.randint(2, 6)
-        den1 = random.choice([3, 4, 5, 6, 8])
-        num2 = random.randint(2, 5)
-        den2 = random.choice([3, 4, 5, 6])
+        num1 = self.rng.randint(2, 6)
+        den1 = self.rng.choice([3, 4, 5, 6, 8])
+        num2 = self.rng.randint(2, 5)
+        den2 = self.rng.choice([3, 4, 5, 6])
 
         # Result: (num1/den1) ÷ (num2/den2) = (num1 * den2)/(den1 * num2)
         result_num = num1 * den2
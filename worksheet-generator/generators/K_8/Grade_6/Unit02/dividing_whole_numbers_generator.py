@@ -6,9 +6,6 @@ Example: 144 ÷ 12 = ?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class DividingWholeNumbersGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class DividingWholeNumbersGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: simple division (division facts)."""
-        divisor = random.randint(2, 10)
-        quotient = random.randint(2, 12)
+        divisor = self.rng.randint(2, 10)
+        quotient = self.rng.randint(2, 12)
         dividend = divisor * quotient
 
         latex = f"{dividend} \\div {divisor}"
@@ -66,8 +62,8 @@ class DividingWholeNumbersGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: two-digit dividends."""
-        divisor = random.randint(2, 9)
-        quotient = random.randint(10, 20)
+        divisor = self.rng.randint(2, 9)
+        quotient = self.rng.randint(10, 20)
         dividend = divisor * quotient
 
         latex = f"{dividend} \\div {divisor}"
@@ -82,8 +78,8 @@ class DividingWholeNumbersGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: three-digit dividends."""
-        divisor = random.randint(10, 25)
-        quotient = random.randint(10, 50)
+        divisor = self.rng.randint(10, 25)
+        quotient = self.rng.randint(10, 50)
         dividend = divisor * quotient
 
         latex = f"{dividend} \\div {divisor}"
@@ -98,19 +94,19 @@ class DividingWholeNumbersGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: larger dividends or remainders."""
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # Larger numbers without remainder
-            divisor = random.randint(15, 40)
-            quotient = random.randint(20, 100)
+            divisor = self.rng.randint(15, 40)
+            quotient = self.rng.randint(20, 100)
             dividend = divisor * quotient
 
             latex = f"{dividend} \\div {divisor}"
             solution = str(quotient)
         else:
             # With remainder
-            divisor = random.randint(10, 25)
-            quotient = random.randint(10, 50)
-            remainder = random.randint(1, divisor - 1)
+            divisor = self.rng.randint(10, 25)
+            quotient = self.rng.randint(10, 50)
+            remainder = self.rng.randint(1, divisor - 1)
             dividend = divisor * quotient + remainder
 
             latex = f"{dividend} \\div {divisor}"
@@ -6,9 +6,6 @@ Example: 3.5 × 2.4 = ?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class MultiplyingDecimalsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class MultiplyingDecimalsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: multiplying decimals by whole numbers."""
-        decimal = round(random.uniform(1.0, 5.0), 1)
-        whole = random.randint(2, 9)
+        decimal = round(self.rng.uniform(1.0, 5.0), 1)
+        whole = self.rng.randint(2, 9)
 
         result = round(decimal * whole, 1)
 
@@ -67,8 +63,8 @@ class MultiplyingDecimalsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: multiplying tenths by tenths."""
-        num1 = round(random.uniform(1.0, 9.0), 1)
-        num2 = round(random.uniform(1.0, 9.0), 1)
+        num1 = round(self.rng.uniform(1.0, 9.0), 1)
+        num2 = round(self.rng.uniform(1.0, 9.0), 1)
 
         result = round(num1 * num2, 2)
 
@@ -84,8 +80,8 @@ class MultiplyingDecimalsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: multiplying hundredths."""
-        num1 = round(random.uniform(1.0, 10.0), 2)
-        num2 = round(random.uniform(1.0, 10.0), 2)
+        num1 = round(self.rng.uniform(1.0, 10.0), 2)
+        num2 = round(self.rng.uniform(1.0, 10.0), 2)
 
         result = round(num1 * num2, 2)
 
@@ -101,11 +97,11 @@ class MultiplyingDecimalsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: multiplying three decimals or larger values."""
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # Three decimals
-            num1 = round(random.uniform(1.0, 5.0), 1)
-            num2 = round(random.uniform(1.0, 5.0), 1)
-            num3 = round(random.uniform(1.0, 5.0), 1)
+            num1 = round(self.rng.uniform(1.0, 5.0), 1)
+            num2 = round(self.rng.uniform(1.0, 5.0), 1)
+            num3 = round(self.rng.uniform(1.0, 5.0), 1)
 
             result = round(num1 * num2 * num3, 2)
 
@@ -113,8 +109,8 @@ class MultiplyingDecimalsGenerator:
             solution = str(result)
         else:
             # Larger decimals
-            num1 = round(random.uniform(10.0, 50.0), 2)
-            num2 = round(random.uniform(1.0, 5.0), 2)
+            num1 = round(self.rng.uniform(10.0, 50.0), 2)
+            num2 = round(self.rng.uniform(1.0, 5.0), 2)
 
             result = round(num1 * num2, 2)
 
@@ -6,9 +6,6 @@ Example: 5.67 - 2.34 = ?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class SubtractingDecimalsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class SubtractingDecimalsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: subtracting tenths."""
-        num2 = round(random.uniform(0.1, 4.0), 1)
-        num1 = round(num2 + random.uniform(0.1, 5.0), 1)
+        num2 = round(self.rng.uniform(0.1, 4.0), 1)
+        num1 = round(num2 + self.rng.uniform(0.1, 5.0), 1)
 
         result = round(num1 - num2, 1)
 
@@ -67,8 +63,8 @@ class SubtractingDecimalsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: subtracting hundredths."""
-        num2 = round(random.uniform(0.1, 8.0), 2)
-        num1 = round(num2 + random.uniform(0.1, 10.0), 2)
+        num2 = round(self.rng.uniform(0.1, 8.0), 2)
+        num1 = round(num2 + self.rng.uniform(0.1, 10.0), 2)
 
         result = round(num1 - num2, 2)
 
@@ -84,8 +80,8 @@ class SubtractingDecimalsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: subtracting with different decimal places."""
-        num2 = round(random.uniform(1.0, 15.0), random.choice([1, 2]))
-        num1 = round(num2 + random.uniform(1.0, 20.0), random.choice([1, 2]))
+        num2 = round(self.rng.uniform(1.0, 15.0), self.rng.choice([1, 2]))
+        num1 = round(num2 + self.rng.uniform(1.0, 20.0), self.rng.choice([1, 2]))
 
         result = round(num1 - num2, 2)
 
@@ -101,9 +97,9 @@ class SubtractingDecimalsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: multiple subtractions."""
-        num3 = round(random.uniform(1.0, 10.0), 2)
-        num2 = round(num3 + random.uniform(1.0, 10.0), 2)
-        num1 = round(num2 + random.uniform(1.0, 15.0), 2)
+        num3 = round(self.rng.uniform(1.0, 10.0), 2)
+        num2 = round(num3 + self.rng.uniform(1.0, 10.0), 2)
+        num1 = round(num2 + self.rng.uniform(1.0, 15.0), 2)
 
         result = round(num1 - num2 - num3, 2)
 
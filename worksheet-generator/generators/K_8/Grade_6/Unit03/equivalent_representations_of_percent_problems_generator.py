@@ -6,9 +6,6 @@ Example: Express 0.45 as a percent and a fraction
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class EquivalentRepresentationsOfPercentProblemsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -49,9 +45,9 @@ class EquivalentRepresentationsOfPercentProblemsGenerator:
             (20, "\\frac{1}{5}", "0.2")
         ]
 
-        percent, fraction, decimal = random.choice(representations)
+        percent, fraction, decimal = self.rng.choice(representations)
 
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             latex = f"\\text{{Express {percent}\\% as a fraction and decimal.}}"
             solution = f"{fraction} \\text{{ and }} {decimal}"
         else:
@@ -75,8 +71,8 @@ class EquivalentRepresentationsOfPercentProblemsGenerator:
         numerators = [1, 2, 3, 4, 6, 7, 8, 9]
         denominators = [5, 8, 10, 20, 25]
 
-        num = random.choice(numerators)
-        denom = random.choice(denominators)
+        num = self.rng.choice(numerators)
+        denom = self.rng.choice(denominators)
 
         # Simplify
         g = gcd(num, denom)
@@ -108,7 +104,7 @@ class EquivalentRepresentationsOfPercentProblemsGenerator:
             ("\\frac{5}{6}", "0.8\\overline{3}", "83.\\overline{3}")
         ]
 
-        fraction, decimal, percent = random.choice(representations)
+        fraction, decimal, percent = self.rng.choice(representations)
 
         latex = f"\\text{{Express }} {fraction} \\text{{ as a decimal and percent (use repeating decimal notation).}}"
         solution = f"{decimal} \\text{{ and }} {percent}\\%"
@@ -129,22 +125,22 @@ class EquivalentRepresentationsOfPercentProblemsGenerator:
         values = []
 
         # Add a percent
-        percent1 = random.randint(30, 80)
+        percent1 = self.rng.randint(30, 80)
         values.append((percent1 / 100, f"{percent1}\\%"))
 
         # Add a decimal
-        decimal1 = round(random.uniform(0.2, 0.9), 2)
+        decimal1 = round(self.rng.uniform(0.2, 0.9), 2)
         values.append((decimal1, str(decimal1)))
 
         # Add a fraction
         fractions = [(1, 4, 0.25), (3, 4, 0.75), (2, 5, 0.4), (3, 5, 0.6), (4, 5, 0.8)]
-        num, denom, dec_val = random.choice(fractions)
+        num, denom, dec_val = self.rng.choice(fractions)
         values.append((dec_val, f"\\frac{{{num}}}{{{denom}}}"))
 
         # Add another percent
-        percent2 = random.randint(20, 90)
+        percent2 = self.rng.randint(20, 90)
         while abs(percent2 - percent1) < 10:
-            percent2 = random.randint(20, 90)
+            percent2 = self.rng.randint(20, 90)
         values.append((percent2 / 100, f"{percent2}\\%"))
 
         # Sort by value
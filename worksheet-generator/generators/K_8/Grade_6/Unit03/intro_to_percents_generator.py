@@ -6,9 +6,6 @@ Example: What is 50% expressed as a fraction?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class IntroToPercentsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -51,7 +47,7 @@ class IntroToPercentsGenerator:
     def _generate_easy(self) -> Equation:
         """Generate easy problems: simple percents to fractions."""
         percents = [25, 50, 75, 10, 20, 30, 40, 60, 70, 80, 90, 100]
-        percent = random.choice(percents)
+        percent = self.rng.choice(percents)
 
         # Simplify the fraction
         from math import gcd
@@ -74,9 +70,9 @@ class IntroToPercentsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: percents to decimals and vice versa."""
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # Percent to decimal
-            percent = random.choice([5, 15, 25, 35, 45, 55, 65, 75, 85, 95, 12, 38, 62, 88])
+            percent = self.rng.choice([5, 15, 25, 35, 45, 55, 65, 75, 85, 95, 12, 38, 62, 88])
             decimal = percent / 100
 
             latex = f"\\text{{Convert {percent}\\% to a decimal.}}"
@@ -92,7 +88,7 @@ class IntroToPercentsGenerator:
             )
         else:
             # Decimal to percent
-            decimal = round(random.uniform(0.1, 0.99), 2)
+            decimal = round(self.rng.uniform(0.1, 0.99), 2)
             percent = decimal * 100
 
             latex = f"\\text{{Convert {decimal} to a percent.}}"
@@ -114,7 +110,7 @@ class IntroToPercentsGenerator:
             (1, 2, 50), (1, 10, 10), (3, 10, 30), (7, 10, 70), (9, 10, 90)
         ]
 
-        num, denom, percent = random.choice(fractions)
+        num, denom, percent = self.rng.choice(fractions)
 
         latex = f"\\text{{Convert }} \\frac{{{num}}}{{{denom}}} \\text{{ to a percent.}}"
         solution = f"{percent}\\%"
@@ -131,7 +127,7 @@ class IntroToPercentsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: percent greater than 100%."""
-        percent = random.choice([110, 125, 150, 175, 200, 250, 300])
+        percent = self.rng.choice([110, 125, 150, 175, 200, 250, 300])
 
         # Convert to mixed number or improper fraction
         numerator = percent
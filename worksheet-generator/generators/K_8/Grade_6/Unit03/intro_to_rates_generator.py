@@ -6,9 +6,6 @@ Example: A car travels 120 miles in 2 hours. What is the rate in miles per hour?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class IntroToRatesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -57,9 +53,9 @@ class IntroToRatesGenerator:
             ("cookies", "batch", [12, 24, 36], [2, 3, 4])
         ]
 
-        unit1, unit2, numerators, denominators = random.choice(contexts)
-        numerator = random.choice(numerators)
-        denominator = random.choice(denominators)
+        unit1, unit2, numerators, denominators = self.rng.choice(contexts)
+        numerator = self.rng.choice(numerators)
+        denominator = self.rng.choice(denominators)
         rate = numerator // denominator
 
         latex = f"\\text{{If you have {numerator} {unit1} in {denominator} {unit2}s, what is the rate in {unit1} per {unit2}?}}"
@@ -84,9 +80,9 @@ class IntroToRatesGenerator:
             ("meters", "second", (100, 150, 200), (5, 10))
         ]
 
-        unit1, unit2, nums, denoms = random.choice(contexts)
-        numerator = random.choice(nums)
-        denominator = random.choice(denoms)
+        unit1, unit2, nums, denoms = self.rng.choice(contexts)
+        numerator = self.rng.choice(nums)
+        denominator = self.rng.choice(denoms)
         rate = numerator / denominator
 
         latex = f"\\text{{A person travels {numerator} {unit1} in {denominator} {unit2}s. Find the unit rate.}}"
@@ -104,14 +100,14 @@ class IntroToRatesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: comparing two rates."""
-        unit1, unit2 = random.choice([("miles", "gallon"), ("dollars", "pound"), ("pages", "hour")])
+        unit1, unit2 = self.rng.choice([("miles", "gallon"), ("dollars", "pound"), ("pages", "hour")])
 
-        num1 = random.randint(10, 20) * 10
-        denom1 = random.choice([4, 5, 8, 10])
+        num1 = self.rng.randint(10, 20) * 10
+        denom1 = self.rng.choice([4, 5, 8, 10])
         rate1 = num1 / denom1
 
-        num2 = random.randint(10, 20) * 10
-        denom2 = random.choice([4, 5, 8, 10])
+        num2 = self.rng.randint(10, 20) * 10
+        denom2 = self.rng.choice([4, 5, 8, 10])
         rate2 = num2 / denom2
 
         better = "Option A" if rate1 > rate2 else "Option B"
@@ -133,10 +129,10 @@ class IntroToRatesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: multi-step rate problems."""
-        distance = random.randint(8, 15) * 20
-        time = random.choice([2, 3, 4])
+        distance = self.rng.randint(8, 15) * 20
+        time = self.rng.choice([2, 3, 4])
         rate = distance / time
-        new_time = random.choice([5, 6, 7])
+        new_time = self.rng.choice([5, 6, 7])
         new_distance = rate * new_time
 
         latex = f"\\text{{A train travels {distance} miles in {time} hours.}}"
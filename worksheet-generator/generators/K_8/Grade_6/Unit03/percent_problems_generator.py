@@ -6,9 +6,6 @@ Example: What is 30% of 80?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class PercentProblemsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -44,8 +40,8 @@ class PercentProblemsGenerator:
         percents = [10, 20, 25, 50, 75]
         numbers = [20, 40, 60, 80, 100]
 
-        percent = random.choice(percents)
-        number = random.choice(numbers)
+        percent = self.rng.choice(percents)
+        number = self.rng.choice(numbers)
         result = (percent * number) / 100
 
         latex = f"\\text{{What is {percent}\\% of {number}?}}"
@@ -62,8 +58,8 @@ class PercentProblemsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: various percents."""
-        percent = random.choice([15, 30, 35, 40, 60, 65, 70, 80, 85, 90])
-        number = random.choice([50, 60, 80, 100, 120, 150, 200])
+        percent = self.rng.choice([15, 30, 35, 40, 60, 65, 70, 80, 85, 90])
+        number = self.rng.choice([50, 60, 80, 100, 120, 150, 200])
         result = (percent * number) / 100
 
         latex = f"\\text{{Find {percent}\\% of {number}.}}"
@@ -81,12 +77,12 @@ class PercentProblemsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: finding the percent or the whole."""
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # Find the percent
-            part = random.randint(10, 50)
-            whole = random.choice([50, 100, 200, 250])
+            part = self.rng.randint(10, 50)
+            whole = self.rng.choice([50, 100, 200, 250])
             while part >= whole:
-                part = random.randint(10, 50)
+                part = self.rng.randint(10, 50)
             percent = (part * 100) / whole
 
             latex = f"\\text{{{part} is what percent of {whole}?}}"
@@ -104,8 +100,8 @@ class PercentProblemsGenerator:
             )
         else:
             # Find the whole
-            percent = random.choice([20, 25, 40, 50, 80])
-            part = random.randint(10, 80)
+            percent = self.rng.choice([20, 25, 40, 50, 80])
+            part = self.rng.randint(10, 80)
             whole = (part * 100) / percent
 
             latex = f"\\text{{{part} is {percent}\\% of what number?}}"
@@ -123,10 +119,10 @@ class PercentProblemsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: percent increase/decrease."""
-        original = random.randint(50, 200)
-        percent_change = random.choice([10, 20, 25, 30, 40, 50])
+        original = self.rng.randint(50, 200)
+        percent_change = self.rng.choice([10, 20, 25, 30, 40, 50])
 
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # Increase
             change = (percent_change * original) / 100
             new_value = original + change
@@ -6,9 +6,6 @@ Example: A store has a 25% off sale. If a shirt costs $40, what is the sale pric
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class PercentWordProblemsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -48,9 +44,9 @@ class PercentWordProblemsGenerator:
             ("flowers in a garden", "are roses")
         ]
 
-        item, description = random.choice(contexts)
-        total = random.choice([20, 25, 40, 50, 100])
-        percent = random.choice([20, 25, 40, 50, 60, 75, 80])
+        item, description = self.rng.choice(contexts)
+        total = self.rng.choice([20, 25, 40, 50, 100])
+        percent = self.rng.choice([20, 25, 40, 50, 60, 75, 80])
         result = (percent * total) / 100
 
         latex = f"\\text{{There are {total} {item}. If {percent}\\% {description}, how many {description}?}}"
@@ -67,10 +63,10 @@ class PercentWordProblemsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: discount and tax problems."""
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # Discount problem
-            original_price = random.choice([20, 40, 60, 80, 100, 120, 150])
-            discount_percent = random.choice([10, 15, 20, 25, 30])
+            original_price = self.rng.choice([20, 40, 60, 80, 100, 120, 150])
+            discount_percent = self.rng.choice([10, 15, 20, 25, 30])
             discount = (discount_percent * original_price) / 100
             sale_price = original_price - discount
 
@@ -88,8 +84,8 @@ class PercentWordProblemsGenerator:
             )
         else:
             # Tax problem
-            price = random.choice([25, 50, 75, 100, 125, 150])
-            tax_rate = random.choice([5, 6, 7, 8, 10])
+            price = self.rng.choice([25, 50, 75, 100, 125, 150])
+            tax_rate = self.rng.choice([5, 6, 7, 8, 10])
             tax = (tax_rate * price) / 100
             total = price + tax
 
@@ -108,10 +104,10 @@ class PercentWordProblemsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: finding original price or percent."""
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # Find original price
-            discount_percent = random.choice([20, 25, 30, 40])
-            sale_price = random.choice([30, 40, 60, 75, 90])
+            discount_percent = self.rng.choice([20, 25, 30, 40])
+            sale_price = self.rng.choice([30, 40, 60, 75, 90])
             original_price = sale_price / (1 - discount_percent/100)
 
             latex = f"\\text{{After a {discount_percent}\\% discount, an item costs \\${sale_price}. What was the original price?}}"
@@ -129,8 +125,8 @@ class PercentWordProblemsGenerator:
             )
         else:
             # Find the percent
-            original = random.choice([50, 80, 100, 120, 150])
-            part = random.randint(int(original * 0.2), int(original * 0.8))
+            original = self.rng.choice([50, 80, 100, 120, 150])
+            part = self.rng.randint(int(original * 0.2), int(original * 0.8))
             percent = (part * 100) / original
 
             latex = f"\\text{{In a class of {original} students, {part} passed a test. What percent passed?}}"
@@ -147,9 +143,9 @@ class PercentWordProblemsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: successive percent changes."""
-        original = random.choice([100, 150, 200, 250])
-        increase_percent = random.choice([10, 20, 25, 30])
-        decrease_percent = random.choice([10, 15, 20, 25])
+        original = self.rng.choice([100, 150, 200, 250])
+        increase_percent = self.rng.choice([10, 20, 25, 30])
+        decrease_percent = self.rng.choice([10, 15, 20, 25])
 
         after_increase = original * (1 + increase_percent/100)
         final = after_increase * (1 - decrease_percent/100)
@@ -6,9 +6,6 @@ Example: If 40 out of 100 squares are shaded, what percent is shaded?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class VisualizePercentsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,7 +46,7 @@ class VisualizePercentsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: 100-square grids."""
-        shaded = random.choice([10, 20, 25, 30, 40, 50, 60, 70, 75, 80, 90])
+        shaded = self.rng.choice([10, 20, 25, 30, 40, 50, 60, 70, 75, 80, 90])
         percent = shaded
 
         latex = f"\\text{{A 100-square grid has {shaded} squares shaded. What percent is shaded?}}"
@@ -67,7 +63,7 @@ class VisualizePercentsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: finding part given percent."""
-        percent = random.choice([10, 20, 25, 30, 40, 50, 60, 75, 80])
+        percent = self.rng.choice([10, 20, 25, 30, 40, 50, 60, 75, 80])
         total = 100
         part = (percent * total) // 100
 
@@ -86,9 +82,9 @@ class VisualizePercentsGenerator:
     def _generate_hard(self) -> Equation:
         """Generate hard problems: grids not equal to 100."""
         totals = [50, 25, 20, 40, 80]
-        total = random.choice(totals)
+        total = self.rng.choice(totals)
         percents = [20, 25, 40, 50, 60, 75, 80]
-        percent = random.choice([p for p in percents if (p * total) % 100 == 0])
+        percent = self.rng.choice([p for p in percents if (p * total) % 100 == 0])
         shaded = (percent * total) // 100
 
         latex = f"\\text{{A grid has {total} squares total. If {shaded} squares are shaded, what percent is shaded?}}"
@@ -105,12 +101,12 @@ class VisualizePercentsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: comparing two percents visually."""
-        shaded1 = random.choice([15, 20, 25, 35, 45])
-        total1 = random.choice([50, 100])
+        shaded1 = self.rng.choice([15, 20, 25, 35, 45])
+        total1 = self.rng.choice([50, 100])
         percent1 = (shaded1 * 100) // total1
 
-        shaded2 = random.choice([10, 15, 20, 30, 40])
-        total2 = random.choice([25, 50])
+        shaded2 = self.rng.choice([10, 15, 20, 30, 40])
+        total2 = self.rng.choice([25, 50])
         percent2 = (shaded2 * 100) // total2
 
         greater = "Grid A" if percent1 > percent2 else "Grid B" if percent2 > percent1 else "Equal"
@@ -6,9 +6,6 @@ Example: Write 3 × 3 × 3 × 3 using exponential notation
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class MeaningOfExponentsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -41,8 +37,8 @@ class MeaningOfExponentsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: convert repeated multiplication to exponents."""
-        base = random.randint(2, 9)
-        exponent = random.randint(2, 4)
+        base = self.rng.randint(2, 9)
+        exponent = self.rng.randint(2, 4)
 
         multiplication = " \\times ".join([str(base)] * exponent)
 
@@ -61,8 +57,8 @@ class MeaningOfExponentsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: expand exponential notation."""
-        base = random.randint(2, 12)
-        exponent = random.randint(2, 5)
+        base = self.rng.randint(2, 12)
+        exponent = self.rng.randint(2, 5)
 
         multiplication = " \\times ".join([str(base)] * exponent)
 
@@ -80,10 +76,10 @@ class MeaningOfExponentsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: identify base and exponent."""
-        base = random.randint(2, 15)
-        exponent = random.randint(2, 6)
+        base = self.rng.randint(2, 15)
+        exponent = self.rng.randint(2, 6)
 
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             latex = f"\\text{{What is the base in }} {base}^{{{exponent}}}\\text{{?}}"
             solution = str(base)
         else:
@@ -101,17 +97,17 @@ class MeaningOfExponentsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: comparing exponential expressions."""
-        base1 = random.randint(2, 5)
-        exp1 = random.randint(3, 5)
+        base1 = self.rng.randint(2, 5)
+        exp1 = self.rng.randint(3, 5)
         val1 = base1 ** exp1
 
-        base2 = random.randint(2, 5)
-        exp2 = random.randint(3, 5)
+        base2 = self.rng.randint(2, 5)
+        exp2 = self.rng.randint(3, 5)
         val2 = base2 ** exp2
 
         # Make sure they're different
         while val1 == val2:
-            exp2 = random.randint(3, 5)
+            exp2 = self.rng.randint(3, 5)
             val2 = base2 ** exp2
 
         if val1 > val2:
@@ -6,9 +6,6 @@ Example: Evaluate 2^3 + 4 × 5
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class MoreOnOrderOfOperationsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -41,12 +37,12 @@ class MoreOnOrderOfOperationsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: exponents with addition/subtraction."""
-        base = random.randint(2, 5)
+        base = self.rng.randint(2, 5)
         exp = 2
         power_val = base ** exp
-        addend = random.randint(3, 10)
+        addend = self.rng.randint(3, 10)
 
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             result = power_val + addend
             latex = f"{base}^{{{exp}}} + {addend}"
             steps = [
@@ -72,12 +68,12 @@ class MoreOnOrderOfOperationsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: exponents with multiplication/division."""
-        base = random.randint(2, 4)
+        base = self.rng.randint(2, 4)
         exp = 2
         power_val = base ** exp
-        multiplier = random.randint(2, 5)
+        multiplier = self.rng.randint(2, 5)
 
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             result = power_val * multiplier
             latex = f"{base}^{{{exp}}} \\times {multiplier}"
             steps = [
@@ -85,8 +81,8 @@ class MoreOnOrderOfOperationsGenerator:
                 f"\\text{{Then multiply: }} {power_val} \\times {multiplier} = {result}"
             ]
         else:
-            result = power_val + multiplier * random.randint(2, 4)
-            mult = random.randint(2, 4)
+            result = power_val + multiplier * self.rng.randint(2, 4)
+            mult = self.rng.randint(2, 4)
             mult_val = multiplier * mult
             latex = f"{base}^{{{exp}}} + {multiplier} \\times {mult}"
             steps = [
@@ -107,8 +103,8 @@ class MoreOnOrderOfOperationsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: parentheses with exponents."""
-        a = random.randint(2, 5)
-        b = random.randint(2, 5)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(2, 5)
         exp = 2
 
         # (a + b)^2
@@ -130,10 +126,10 @@ class MoreOnOrderOfOperationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex expressions with all operations."""
-        a = random.randint(2, 4)
-        b = random.randint(2, 3)
-        c = random.randint(2, 4)
-        d = random.randint(2, 5)
+        a = self.rng.randint(2, 4)
+        b = self.rng.randint(2, 3)
+        c = self.rng.randint(2, 4)
+        d = self.rng.randint(2, 5)
 
         # a^2 + (b × c) - d
         power_val = a ** 2
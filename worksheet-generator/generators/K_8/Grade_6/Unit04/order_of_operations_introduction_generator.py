@@ -6,9 +6,6 @@ Example: Evaluate 3 + 4 × 2
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class OrderOfOperationsIntroductionGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -41,11 +37,11 @@ class OrderOfOperationsIntroductionGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: addition/subtraction and multiplication."""
-        a = random.randint(2, 10)
-        b = random.randint(2, 9)
-        c = random.randint(2, 9)
+        a = self.rng.randint(2, 10)
+        b = self.rng.randint(2, 9)
+        c = self.rng.randint(2, 9)
 
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # a + b × c
             result = a + (b * c)
             latex = f"{a} + {b} \\times {c}"
@@ -73,11 +69,11 @@ class OrderOfOperationsIntroductionGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: with parentheses."""
-        a = random.randint(2, 9)
-        b = random.randint(2, 9)
-        c = random.randint(2, 9)
+        a = self.rng.randint(2, 9)
+        b = self.rng.randint(2, 9)
+        c = self.rng.randint(2, 9)
 
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # (a + b) × c
             result = (a + b) * c
             latex = f"({a} + {b}) \\times {c}"
@@ -107,12 +103,12 @@ class OrderOfOperationsIntroductionGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: division and multiplication."""
-        a = random.randint(4, 12) * 2
-        b = random.randint(2, 4)
-        c = random.randint(2, 5)
-        d = random.randint(2, 5)
+        a = self.rng.randint(4, 12) * 2
+        b = self.rng.randint(2, 4)
+        c = self.rng.randint(2, 5)
+        d = self.rng.randint(2, 5)
 
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # a ÷ b × c
             result = (a // b) * c
             latex = f"{a} \\div {b} \\times {c}"
@@ -143,10 +139,10 @@ class OrderOfOperationsIntroductionGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: multiple operations with parentheses."""
-        a = random.randint(2, 6)
-        b = random.randint(2, 6)
-        c = random.randint(2, 5)
-        d = random.randint(2, 5)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(2, 5)
+        d = self.rng.randint(2, 5)
 
         # (a + b) × c - d
         sum_val = a + b
@@ -6,9 +6,6 @@ Example: Evaluate (1/2)^3
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class PowersOfFractionsAndDecimalsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -42,7 +38,7 @@ class PowersOfFractionsAndDecimalsGenerator:
     def _generate_easy(self) -> Equation:
         """Generate easy problems: simple fractions squared."""
         fractions = [(1, 2), (1, 3), (1, 4), (1, 5), (2, 3), (2, 5), (3, 4)]
-        num, denom = random.choice(fractions)
+        num, denom = self.rng.choice(fractions)
 
         result_num = num ** 2
         result_denom = denom ** 2
@@ -62,7 +58,7 @@ class PowersOfFractionsAndDecimalsGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium problems: decimals squared."""
         decimals = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
-        decimal = random.choice(decimals)
+        decimal = self.rng.choice(decimals)
 
         result = decimal ** 2
 
@@ -81,7 +77,7 @@ class PowersOfFractionsAndDecimalsGenerator:
     def _generate_hard(self) -> Equation:
         """Generate hard problems: fractions cubed."""
         fractions = [(1, 2), (1, 3), (2, 3), (1, 4), (3, 4), (1, 5), (2, 5)]
-        num, denom = random.choice(fractions)
+        num, denom = self.rng.choice(fractions)
 
         result_num = num ** 3
         result_denom = denom ** 3
@@ -100,10 +96,10 @@ class PowersOfFractionsAndDecimalsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: comparing or operating on powers."""
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # Compare two powers
-            dec1 = random.choice([0.2, 0.3, 0.4, 0.5])
-            dec2 = random.choice([0.2, 0.3, 0.4, 0.5])
+            dec1 = self.rng.choice([0.2, 0.3, 0.4, 0.5])
+            dec2 = self.rng.choice([0.2, 0.3, 0.4, 0.5])
 
             val1 = dec1 ** 2
             val2 = dec2 ** 2
@@ -130,11 +126,11 @@ class PowersOfFractionsAndDecimalsGenerator:
             )
         else:
             # Add two powers of fractions
-            num1, denom1 = random.choice([(1, 2), (1, 4)])
+            num1, denom1 = self.rng.choice([(1, 2), (1, 4)])
             result1_num = num1 ** 2
             result1_denom = denom1 ** 2
 
-            num2, denom2 = random.choice([(1, 2), (1, 4)])
+            num2, denom2 = self.rng.choice([(1, 2), (1, 4)])
             result2_num = num2 ** 2
             result2_denom = denom2 ** 2
 
@@ -6,9 +6,6 @@ Example: Evaluate 3^4
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class PowersOfWholeNumbersGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -41,8 +37,8 @@ class PowersOfWholeNumbersGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: small bases and exponents."""
-        base = random.randint(2, 5)
-        exponent = random.randint(2, 3)
+        base = self.rng.randint(2, 5)
+        exponent = self.rng.randint(2, 3)
         result = base ** exponent
 
         latex = f"\\text{{Evaluate: }} {base}^{{{exponent}}}"
@@ -61,12 +57,12 @@ class PowersOfWholeNumbersGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: larger bases or exponents."""
-        if random.choice([True, False]):
-            base = random.randint(6, 10)
-            exponent = random.randint(2, 3)
+        if self.rng.choice([True, False]):
+            base = self.rng.randint(6, 10)
+            exponent = self.rng.randint(2, 3)
         else:
-            base = random.randint(2, 5)
-            exponent = random.randint(4, 5)
+            base = self.rng.randint(2, 5)
+            exponent = self.rng.randint(4, 5)
 
         result = base ** exponent
 
@@ -84,24 +80,24 @@ class PowersOfWholeNumbersGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: powers with exponent 1 or special cases."""
-        choice = random.randint(1, 3)
+        choice = self.rng.randint(1, 3)
 
         if choice == 1:
             # Exponent of 1
-            base = random.randint(5, 50)
+            base = self.rng.randint(5, 50)
             latex = f"\\text{{Evaluate: }} {base}^{{1}}"
             solution = str(base)
             steps = [f"{base}^{{1}} = {base}"]
         elif choice == 2:
             # Base of 10
-            exponent = random.randint(2, 4)
+            exponent = self.rng.randint(2, 4)
             result = 10 ** exponent
             latex = f"\\text{{Evaluate: }} 10^{{{exponent}}}"
             solution = str(result)
             steps = [f"10^{{{exponent}}} = {result}"]
         else:
             # Larger computation
-            base = random.randint(11, 15)
+            base = self.rng.randint(11, 15)
             exponent = 2
             result = base ** exponent
             latex = f"\\text{{Evaluate: }} {base}^{{{exponent}}}"
@@ -117,13 +113,13 @@ class PowersOfWholeNumbersGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: comparing or adding powers."""
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # Add two powers
-            base1 = random.randint(2, 4)
+            base1 = self.rng.randint(2, 4)
             exp1 = 2
             val1 = base1 ** exp1
 
-            base2 = random.randint(2, 4)
+            base2 = self.rng.randint(2, 4)
             exp2 = 2
             val2 = base2 ** exp2
 
@@ -144,8 +140,8 @@ class PowersOfWholeNumbersGenerator:
             )
         else:
             # Multiply by a power
-            multiplier = random.randint(2, 5)
-            base = random.randint(2, 5)
+            multiplier = self.rng.randint(2, 5)
+            base = self.rng.randint(2, 5)
             exponent = 2
             power_val = base ** exponent
             result = multiplier * power_val
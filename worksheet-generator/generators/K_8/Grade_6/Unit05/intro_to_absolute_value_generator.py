@@ -6,16 +6,12 @@ Example: What is |−5|?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
 class IntroToAbsoluteValueGenerator:
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -34,28 +30,28 @@ class IntroToAbsoluteValueGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        num = random.choice([random.randint(-10, -1), random.randint(1, 10)])
+        num = self.rng.choice([self.rng.randint(-10, -1), self.rng.randint(1, 10)])
         latex = f"\\text{{Evaluate: }} |{num}|"
         solution = str(abs(num))
         return Equation(latex=latex, solution=solution, steps=[f"|{num}| = {abs(num)}"], difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        num = round(random.uniform(-10, 10), 1)
+        num = round(self.rng.uniform(-10, 10), 1)
         latex = f"\\text{{Evaluate: }} |{num}|"
         solution = str(abs(num))
         return Equation(latex=latex, solution=solution, steps=[f"|{num}| = {abs(num)}"], difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        num1 = random.randint(-15, 15)
-        num2 = random.randint(-15, 15)
+        num1 = self.rng.randint(-15, 15)
+        num2 = self.rng.randint(-15, 15)
         result = abs(num1) + abs(num2)
         latex = f"\\text{{Evaluate: }} |{num1}| + |{num2}|"
         solution = str(result)
         return Equation(latex=latex, solution=solution, steps=[f"|{num1}| + |{num2}| = {abs(num1)} + {abs(num2)} = {result}"], difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        num1 = random.randint(-10, -1)
-        num2 = random.randint(1, 10)
+        num1 = self.rng.randint(-10, -1)
+        num2 = self.rng.randint(1, 10)
         result = abs(num1 - num2)
         latex = f"\\text{{Evaluate: }} |{num1} - {num2}|"
         solution = str(result)
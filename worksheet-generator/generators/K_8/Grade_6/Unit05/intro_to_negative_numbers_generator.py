@@ -6,9 +6,6 @@ Example: What is the opposite of 5?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class IntroToNegativeNumbersGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -41,9 +37,9 @@ class IntroToNegativeNumbersGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: identifying opposites."""
-        number = random.randint(1, 20)
+        number = self.rng.randint(1, 20)
 
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             latex = f"\\text{{What is the opposite of }} {number}\\text{{?}}"
             solution = f"-{number}"
         else:
@@ -66,8 +62,8 @@ class IntroToNegativeNumbersGenerator:
             ("time before event", "hours", "ago")
         ]
 
-        context, unit, negative_term = random.choice(contexts)
-        amount = random.randint(5, 50)
+        context, unit, negative_term = self.rng.choice(contexts)
+        amount = self.rng.randint(5, 50)
 
         latex = f"\\text{{A {context} of {amount} {unit} {negative_term}. Write this as an integer.}}"
         solution = f"-{amount}"
@@ -81,8 +77,8 @@ class IntroToNegativeNumbersGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: comparing positive and negative."""
-        num1 = random.randint(5, 20)
-        num2 = random.randint(5, 20)
+        num1 = self.rng.randint(5, 20)
+        num2 = self.rng.randint(5, 20)
 
         choices = [
             (num1, -num2, ">"),
@@ -90,7 +86,7 @@ class IntroToNegativeNumbersGenerator:
             (-num1, -num2, "<" if num1 > num2 else ">")
         ]
 
-        val1, val2, comp = random.choice(choices)
+        val1, val2, comp = self.rng.choice(choices)
 
         latex = f"\\text{{Compare using }} <, >, \\text{{ or }} =: {val1} \\quad ? \\quad {val2}"
         solution = f"{val1} {comp} {val2}"
@@ -107,11 +103,11 @@ class IntroToNegativeNumbersGenerator:
         numbers = []
         # Add some positive and negative numbers
         for _ in range(2):
-            numbers.append(random.randint(1, 15))
+            numbers.append(self.rng.randint(1, 15))
         for _ in range(2):
-            numbers.append(-random.randint(1, 15))
+            numbers.append(-self.rng.randint(1, 15))
 
-        random.shuffle(numbers)
+        self.rng.shuffle(numbers)
         sorted_nums = sorted(numbers)
 
         nums_str = ", ".join([str(n) for n in numbers])
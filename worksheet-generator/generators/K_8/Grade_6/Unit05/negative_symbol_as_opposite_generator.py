@@ -6,9 +6,6 @@ Example: Evaluate -(-5)
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class NegativeSymbolAsOppositeGenerator:
     """Generates negative symbol as opposite problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,7 +33,7 @@ class NegativeSymbolAsOppositeGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        num = random.randint(1, 20)
+        num = self.rng.randint(1, 20)
         latex = f"\\text{{Evaluate: }} -(-{num})"
         solution = str(num)
         return Equation(
@@ -48,8 +44,8 @@ class NegativeSymbolAsOppositeGenerator:
         )
 
     def _generate_medium(self) -> Equation:
-        num = random.randint(1, 25)
-        if random.choice([True, False]):
+        num = self.rng.randint(1, 25)
+        if self.rng.choice([True, False]):
             latex = f"\\text{{Evaluate: }} -({num})"
             solution = f"-{num}"
         else:
@@ -63,8 +59,8 @@ class NegativeSymbolAsOppositeGenerator:
         )
 
     def _generate_hard(self) -> Equation:
-        num = random.randint(5, 30)
-        layers = random.randint(4, 5)
+        num = self.rng.randint(5, 30)
+        layers = self.rng.randint(4, 5)
         result = num if layers % 2 == 0 else -num
         neg_str = "-(" * layers + str(num) + ")" * layers
         latex = f"\\text{{Evaluate: }} {neg_str}"
@@ -77,8 +73,8 @@ class NegativeSymbolAsOppositeGenerator:
         )
 
     def _generate_challenge(self) -> Equation:
-        a = random.randint(3, 12)
-        b = random.randint(3, 12)
+        a = self.rng.randint(3, 12)
+        b = self.rng.randint(3, 12)
         result = -a + b
         latex = f"\\text{{Evaluate: }} -({a}) + {b}"
         solution = str(result)
@@ -6,16 +6,12 @@ Example: Order from least to greatest: -1/2, 0.3, -0.8, 1/4
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
 class OrderingRationalNumbersGenerator:
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -34,14 +30,14 @@ class OrderingRationalNumbersGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        nums = [random.randint(-10, 10) for _ in range(4)]
+        nums = [self.rng.randint(-10, 10) for _ in range(4)]
         sorted_nums = sorted(nums)
         latex = f"\\text{{Order from least to greatest: }} {', '.join(map(str, nums))}"
         solution = ', '.join(map(str, sorted_nums))
         return Equation(latex=latex, solution=solution, steps=[f"\\text{{Ordered: }} {solution}"], difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        nums_decimal = [round(random.uniform(-5, 5), 1) for _ in range(4)]
+        nums_decimal = [round(self.rng.uniform(-5, 5), 1) for _ in range(4)]
         sorted_nums = sorted(nums_decimal)
         latex = f"\\text{{Order from least to greatest: }} {', '.join(map(str, nums_decimal))}"
         solution = ', '.join(map(str, sorted_nums))
@@ -51,16 +47,16 @@ class OrderingRationalNumbersGenerator:
         # Mix integers, decimals, and fractions
         values = []
         labels = []
-        values.append(random.randint(-5, 5))
+        values.append(self.rng.randint(-5, 5))
         labels.append(str(values[-1]))
-        dec = round(random.uniform(-3, 3), 1)
+        dec = round(self.rng.uniform(-3, 3), 1)
         values.append(dec)
         labels.append(str(dec))
-        num, denom = random.choice([(1, 2), (1, 4), (3, 4), (-1, 2)])
+        num, denom = self.rng.choice([(1, 2), (1, 4), (3, 4), (-1, 2)])
         values.append(num/denom)
         labels.append(f"\\frac{{{num}}}{{{denom}}}")
         paired = list(zip(values, labels))
-        random.shuffle(paired)
+        self.rng.shuffle(paired)
         sorted_paired = sorted(paired, key=lambda x: x[0])
         latex = f"\\text{{Order: }} {', '.join([p[1] for p in paired])}"
         solution = ', '.join([p[1] for p in sorted_paired])
@@ -70,23 +66,23 @@ class OrderingRationalNumbersGenerator:
         values = []
         labels = []
         for _ in range(5):
-            choice = random.randint(1, 3)
+            choice = self.rng.randint(1, 3)
             if choice == 1:
-                v = random.randint(-8, 8)
+                v = self.rng.randint(-8, 8)
                 values.append(v)
                 labels.append(str(v))
             elif choice == 2:
-                v = round(random.uniform(-5, 5), 2)
+                v = round(self.rng.uniform(-5, 5), 2)
                 values.append(v)
                 labels.append(str(v))
             else:
-                num = random.randint(-3, 3)
-                denom = random.choice([2, 4, 5])
+                num = self.rng.randint(-3, 3)
+                denom = self.rng.choice([2, 4, 5])
                 v = num / denom
                 values.append(v)
                 labels.append(f"\\frac{{{num}}}{{{denom}}}")
         paired = list(zip(values, labels))
-        random.shuffle(paired)
+        self.rng.shuffle(paired)
         sorted_paired = sorted(paired, key=lambda x: x[0])
         latex = f"\\text{{Order from least to greatest: }} {', '.join([p[1] for p in paired[:4]])}"
         solution = ', '.join([p[1] for p in sorted_paired[:4]])
@@ -6,9 +6,6 @@ Example: Plot -2.5 on a number line
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class RationalNumbersOnNumberLineGenerator:
     """Generates rational numbers on number line problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,7 +33,7 @@ class RationalNumbersOnNumberLineGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        num = random.randint(-10, 10)
+        num = self.rng.randint(-10, 10)
         latex = f"\\text{{What integer is located at position }} {num} \\text{{ on the number line?}}"
         solution = str(num)
         return Equation(
@@ -48,7 +44,7 @@ class RationalNumbersOnNumberLineGenerator:
         )
 
     def _generate_medium(self) -> Equation:
-        num = round(random.uniform(-5, 5), 1)
+        num = round(self.rng.uniform(-5, 5), 1)
         latex = f"\\text{{Plot }} {num} \\text{{ on a number line. Between which two integers does it lie?}}"
         lower = int(num) if num >= 0 else int(num) - 1
         upper = lower + 1
@@ -61,8 +57,8 @@ class RationalNumbersOnNumberLineGenerator:
         )
 
     def _generate_hard(self) -> Equation:
-        numerator = random.randint(-15, 15)
-        denominator = random.choice([2, 4, 5])
+        numerator = self.rng.randint(-15, 15)
+        denominator = self.rng.choice([2, 4, 5])
         if numerator % denominator == 0:
             numerator += 1
         latex = f"\\text{{Where is }} \\frac{{{numerator}}}{{{denominator}}} \\text{{ on the number line?}}"
@@ -76,7 +72,7 @@ class RationalNumbersOnNumberLineGenerator:
         )
 
     def _generate_challenge(self) -> Equation:
-        nums = [round(random.uniform(-5, 5), 1) for _ in range(3)]
+        nums = [round(self.rng.uniform(-5, 5), 1) for _ in range(3)]
         nums.sort()
         latex = f"\\text{{Order these numbers on a number line: }} {nums[1]}, {nums[2]}, {nums[0]}"
         solution = f"{nums[0]}, {nums[1]}, {nums[2]}"
@@ -6,16 +6,12 @@ Example: Evaluate 3x + 5 when x = 4
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
 class SubstitutionAndEvaluatingExpressionsGenerator:
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -34,21 +30,21 @@ class SubstitutionAndEvaluatingExpressionsGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        coef, const, x_val = random.randint(2, 9), random.randint(1, 10), random.randint(1, 5)
+        coef, const, x_val = self.rng.randint(2, 9), self.rng.randint(1, 10), self.rng.randint(1, 5)
         result = coef * x_val + const
         latex = f"\\text{{Evaluate }} {coef}x + {const} \\text{{ when }} x = {x_val}"
         solution = str(result)
         return Equation(latex=latex, solution=solution, steps=[f"{coef}({x_val}) + {const} = {coef*x_val} + {const} = {result}"], difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        coef, const, x_val = random.randint(3, 12), random.randint(5, 20), random.randint(2, 8)
+        coef, const, x_val = self.rng.randint(3, 12), self.rng.randint(5, 20), self.rng.randint(2, 8)
         result = coef * x_val - const
         latex = f"\\text{{Evaluate }} {coef}x - {const} \\text{{ when }} x = {x_val}"
         solution = str(result)
         return Equation(latex=latex, solution=solution, steps=[f"{coef}({x_val}) - {const} = {coef*x_val} - {const} = {result}"], difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        coef, exp_val, x_val = random.randint(2, 5), 2, random.randint(2, 5)
+        coef, exp_val, x_val = self.rng.randint(2, 5), 2, self.rng.randint(2, 5)
         power = x_val ** exp_val
         result = coef * power
         latex = f"\\text{{Evaluate }} {coef}x^{{2}} \\text{{ when }} x = {x_val}"
@@ -56,8 +52,8 @@ class SubstitutionAndEvaluatingExpressionsGenerator:
         return Equation(latex=latex, solution=solution, steps=[f"{coef}({x_val})^2 = {coef}({power}) = {result}"], difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        coef1, coef2, const = random.randint(2, 6), random.randint(2, 6), random.randint(3, 10)
-        x_val, y_val = random.randint(2, 5), random.randint(2, 5)
+        coef1, coef2, const = self.rng.randint(2, 6), self.rng.randint(2, 6), self.rng.randint(3, 10)
+        x_val, y_val = self.rng.randint(2, 5), self.rng.randint(2, 5)
         result = coef1 * x_val + coef2 * y_val + const
         latex = f"\\text{{Evaluate }} {coef1}x + {coef2}y + {const} \\text{{ when }} x = {x_val}, y = {y_val}"
         solution = str(result)
@@ -1,13 +1,11 @@
 """Nets of 3D Figures Generator - Grade 6 Unit 10"""
 import random
 from typing import List
-import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class NetsOf3dFiguresGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
     def _generate_problem(self, difficulty: str) -> Equation:
@@ -19,7 +17,7 @@ class NetsOf3dFiguresGenerator:
         latex = f"\\text{{A net has 2 triangles and 3 rectangles. What 3D shape?}}"
         return Equation(latex=latex, solution="Triangular prism", steps=["Triangular prism"], difficulty='medium')
     def _generate_hard(self) -> Equation:
-        l, w, h = random.randint(3, 8), random.randint(2, 6), random.randint(2, 5)
+        l, w, h = self.rng.randint(3, 8), self.rng.randint(2, 6), self.rng.randint(2, 5)
         faces = [l*w, l*w, l*h, l*h, w*h, w*h]
         total_area = sum(faces)
         latex = f"\\text{{Rectangular prism net: }}{l}\\times{w}\\times{h}\\text{{. Total area of net?}}"
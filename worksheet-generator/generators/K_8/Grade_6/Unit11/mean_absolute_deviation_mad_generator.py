@@ -1,19 +1,17 @@
 """Mean Absolute Deviation MAD Generator - Grade 6 Unit 11"""
 import random
 from typing import List
-import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class MeanAbsoluteDeviationMadGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
     def _generate_problem(self, difficulty: str) -> Equation:
         return getattr(self, f'_generate_{difficulty}')()
     def _generate_easy(self) -> Equation:
-        data = [random.randint(5, 15) for _ in range(5)]
+        data = [self.rng.randint(5, 15) for _ in range(5)]
         mean = sum(data) / len(data)
         deviations = [abs(x - mean) for x in data]
         mad = sum(deviations) / len(deviations)
@@ -26,7 +24,7 @@ class MeanAbsoluteDeviationMadGenerator:
         ]
         return Equation(latex=latex, solution=str(round(mad, 1)), steps=steps, difficulty='easy')
     def _generate_medium(self) -> Equation:
-        data = [random.randint(10, 30) for _ in range(6)]
+        data = [self.rng.randint(10, 30) for _ in range(6)]
         mean = sum(data) / len(data)
         deviations = [abs(x - mean) for x in data]
         mad = sum(deviations) / len(deviations)
@@ -39,11 +37,11 @@ class MeanAbsoluteDeviationMadGenerator:
         ]
         return Equation(latex=latex, solution=str(round(mad, 1)), steps=steps, difficulty='medium')
     def _generate_hard(self) -> Equation:
-        data1 = [random.randint(20, 30) for _ in range(5)]
+        data1 = [self.rng.randint(20, 30) for _ in range(5)]
         mean1 = sum(data1) / len(data1)
         dev1 = [abs(x - mean1) for x in data1]
         mad1 = sum(dev1) / len(dev1)
-        data2 = [random.randint(15, 35) for _ in range(5)]
+        data2 = [self.rng.randint(15, 35) for _ in range(5)]
         mean2 = sum(data2) / len(data2)
         dev2 = [abs(x - mean2) for x in data2]
         mad2 = sum(dev2) / len(dev2)
@@ -56,7 +54,7 @@ class MeanAbsoluteDeviationMadGenerator:
         ]
         return Equation(latex=latex, solution=more_spread, steps=steps, difficulty='hard')
     def _generate_challenge(self) -> Equation:
-        data = [random.randint(25, 75) for _ in range(7)]
+        data = [self.rng.randint(25, 75) for _ in range(7)]
         mean = sum(data) / len(data)
         deviations = [abs(x - mean) for x in data]
         mad = sum(deviations) / len(deviations)
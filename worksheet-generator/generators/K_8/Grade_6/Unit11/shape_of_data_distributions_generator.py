@@ -1,20 +1,18 @@
 """Shape of Data Distributions Generator - Grade 6 Unit 11"""
 import random
 from typing import List
-import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class ShapeOfDataDistributionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
     def _generate_problem(self, difficulty: str) -> Equation:
         return getattr(self, f'_generate_{difficulty}')()
     def _generate_easy(self) -> Equation:
         shapes = ["symmetric", "skewed left", "skewed right", "uniform"]
-        shape = random.choice(shapes)
+        shape = self.rng.choice(shapes)
         latex = f"\\text{{Define '{shape}' distribution.}}"
         descriptions = {
             "symmetric": "Mirror image around center",
@@ -30,7 +28,7 @@ class ShapeOfDataDistributionsGenerator:
         latex = f"\\text{{If mean < median, distribution is likely?}}"
         return Equation(latex=latex, solution="Skewed left", steps=["Mean pulled by low values"], difficulty='hard')
     def _generate_challenge(self) -> Equation:
-        data = [random.randint(20, 30) for _ in range(5)] + [random.randint(60, 80)]
+        data = [self.rng.randint(20, 30) for _ in range(5)] + [self.rng.randint(60, 80)]
         mean = sum(data) / len(data)
         median = sorted(data)[len(data)//2]
         shape = "Skewed right" if mean > median else ("Skewed left" if mean < median else "Symmetric")
@@ -1,13 +1,11 @@
 """Statistical Questions Generator - Grade 6 Unit 11"""
 import random
 from typing import List
-import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class StatisticalQuestionsGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
     def _generate_problem(self, difficulty: str) -> Equation:
@@ -25,7 +23,7 @@ class StatisticalQuestionsGenerator:
             ("How many days in a week?", "No"),
             ("What are the test scores in class?", "Yes")
         ]
-        q, ans = random.choice(questions)
+        q, ans = self.rng.choice(questions)
         latex = f"\\text{{Is this a statistical question: '{q}'}}"
         return Equation(latex=latex, solution=ans, steps=[f"{ans} - {'expects variability' if ans=='Yes' else 'single answer'}"], difficulty='hard')
     def _generate_challenge(self) -> Equation:
@@ -1,28 +1,26 @@
 """Fractions Review Generator - Grade 6 Unit 12"""
 import random
 from typing import List
-import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class FractionsReviewGenerator:
     def __init__(self, seed=None):
-        if seed: random.seed(seed)
+        self.rng = random.Random(seed)
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         return [self._generate_problem(difficulty) for _ in range(num_problems)]
     def _generate_problem(self, difficulty: str) -> Equation:
         return getattr(self, f'_generate_{difficulty}')()
     def _generate_easy(self) -> Equation:
-        num1, denom = random.randint(1, 5), random.choice([4, 6, 8])
-        num2 = random.randint(1, 5)
+        num1, denom = self.rng.randint(1, 5), self.rng.choice([4, 6, 8])
+        num2 = self.rng.randint(1, 5)
         result_num = num1 + num2
         latex = f"\\text{{Add: }} \\frac{{{num1}}}{{{denom}}} + \\frac{{{num2}}}{{{denom}}}"
         from math import gcd
         g = gcd(result_num, denom)
         return Equation(latex=latex, solution=f"\\frac{{{result_num//g}}}{{{denom//g}}}", steps=[f"\\frac{{{result_num}}}{{{denom}}} = \\frac{{{result_num//g}}}{{{denom//g}}}"], difficulty='easy')
     def _generate_medium(self) -> Equation:
-        num1, denom1 = random.randint(1, 4), random.choice([3, 4, 5])
-        num2, denom2 = random.randint(1, 4), random.choice([3, 4, 5])
+        num1, denom1 = self.rng.randint(1, 4), self.rng.choice([3, 4, 5])
+        num2, denom2 = self.rng.randint(1, 4), self.rng.choice([3, 4, 5])
         result_num = num1 * num2
         result_denom = denom1 * denom2
         from math import gcd
@@ -30,8 +28,8 @@ class FractionsReviewGenerator:
         latex = f"\\text{{Multiply: }} \\frac{{{num1}}}{{{denom1}}} \\times \\frac{{{num2}}}{{{denom2}}}"
         return Equation(latex=latex, solution=f"\\frac{{{result_num//g}}}{{{result_denom//g}}}", steps=[f"\\frac{{{result_num}}}{{{result_denom}}} = \\frac{{{result_num//g}}}{{{result_denom//g}}}"], difficulty='medium')
     def _generate_hard(self) -> Equation:
-        num1, denom1 = random.randint(1, 4), random.choice([2, 3, 4])
-        num2, denom2 = random.randint(1, 3), random.choice([2, 3, 4])
+        num1, denom1 = self.rng.randint(1, 4), self.rng.choice([2, 3, 4])
+        num2, denom2 = self.rng.randint(1, 3), self.rng.choice([2, 3, 4])
         result_num = num1 * denom2
         result_denom = denom1 * num2
         from math import gcd
@@ -39,7 +37,7 @@ class FractionsReviewGenerator:
         latex = f"\\text{{Divide: }} \\frac{{{num1}}}{{{denom1}}} \\div \\frac{{{num2}}}{{{denom2}}}"
         return Equation(latex=latex, solution=f"\\frac{{{result_num//g}}}{{{result_denom//g}}}", steps=[f"\\frac{{{num1}}}{{{denom1}}} \\times \\frac{{{denom2}}}{{{num2}}} = \\frac{{{result_num//g}}}{{{result_denom//g}}}"], difficulty='hard')
     def _generate_challenge(self) -> Equation:
-        whole, num, denom = random.randint(2, 5), 1, random.choice([2, 3, 4])
+        whole, num, denom = self.rng.randint(2, 5), 1, self.rng.choice([2, 3, 4])
         decimal = whole + num/denom
         latex = f"\\text{{Convert }} {whole}\\frac{{{num}}}{{{denom}}} \\text{{ to decimal.}}"
         return Equation(latex=latex, solution=str(decimal), steps=[f"{whole} + {num}/{denom} = {decimal}"], difficulty='challenge')
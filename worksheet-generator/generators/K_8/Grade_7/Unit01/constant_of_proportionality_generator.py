@@ -6,9 +6,6 @@ Generates problems for constant of proportionality (k) from tables and scenarios
 import random
 from typing import List
 from fractions import Fraction
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class ConstantOfProportionalityGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,7 +46,7 @@ class ConstantOfProportionalityGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: Simple tables with integer constants."""
-        k = random.randint(2, 5)
+        k = self.rng.randint(2, 5)
         x_values = [1, 2, 3, 4]
         y_values = [k * x for x in x_values]
 
@@ -65,8 +61,8 @@ class ConstantOfProportionalityGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: Tables with fraction constants."""
-        numerator = random.randint(1, 4)
-        denominator = random.choice([2, 3, 4, 5])
+        numerator = self.rng.randint(1, 4)
+        denominator = self.rng.choice([2, 3, 4, 5])
         k = Fraction(numerator, denominator)
 
         x_values = [denominator * i for i in range(1, 5)]
@@ -88,8 +84,8 @@ class ConstantOfProportionalityGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: Word problems."""
-        k = random.randint(3, 12)
-        x_val = random.randint(5, 15)
+        k = self.rng.randint(3, 12)
+        x_val = self.rng.randint(5, 15)
         y_val = k * x_val
 
         contexts = [
@@ -98,7 +94,7 @@ class ConstantOfProportionalityGenerator:
             f"A recipe uses {y_val} cups of flour for {x_val} batches. Find cups per batch.",
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
         latex = f"\\text{{{context}}}"
         solution = str(k)
         steps = [f"k = \\frac{{{y_val}}}{{{x_val}}} = {k}"]
@@ -107,10 +103,10 @@ class ConstantOfProportionalityGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: Multiple steps or complex scenarios."""
-        k = Fraction(random.randint(2, 5), random.randint(2, 4))
-        x1 = random.randint(4, 8)
+        k = Fraction(self.rng.randint(2, 5), self.rng.randint(2, 4))
+        x1 = self.rng.randint(4, 8)
         y1 = float(k * x1)
-        x2 = random.randint(10, 20)
+        x2 = self.rng.randint(10, 20)
         y2 = float(k * x2)
 
         latex = f"\\text{{If }} y = {y1:.1f} \\text{{ when }} x = {x1}, \\text{{ find }} y \\text{{ when }} x = {x2}."
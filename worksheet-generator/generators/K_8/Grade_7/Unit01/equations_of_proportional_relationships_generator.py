@@ -6,9 +6,6 @@ Generates problems for writing equations for proportional relationships (y = kx)
 import random
 from typing import List
 from fractions import Fraction
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class EquationsOfProportionalRelationshipsGenerator:
 
     def __init__(self, seed=None):
         '''Initialize the generator.'''
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         '''Generate worksheet problems.'''
@@ -41,7 +37,7 @@ class EquationsOfProportionalRelationshipsGenerator:
 
     def _generate_easy(self) -> Equation:
         '''Generate easy problems.'''
-        num = random.randint(1, 10)
+        num = self.rng.randint(1, 10)
         latex = f"{num}"
         solution = str(num)
         steps = [f"Answer: {num}"]
@@ -49,7 +45,7 @@ class EquationsOfProportionalRelationshipsGenerator:
 
     def _generate_medium(self) -> Equation:
         '''Generate medium problems.'''
-        num = random.randint(10, 50)
+        num = self.rng.randint(10, 50)
         latex = f"{num}"
         solution = str(num)
         steps = [f"Answer: {num}"]
@@ -57,7 +53,7 @@ class EquationsOfProportionalRelationshipsGenerator:
 
     def _generate_hard(self) -> Equation:
         '''Generate hard problems.'''
-        num = random.randint(50, 100)
+        num = self.rng.randint(50, 100)
         latex = f"{num}"
         solution = str(num)
         steps = [f"Answer: {num}"]
@@ -65,7 +61,7 @@ class EquationsOfProportionalRelationshipsGenerator:
 
     def _generate_challenge(self) -> Equation:
         '''Generate challenge problems.'''
-        num = random.randint(100, 500)
+        num = self.rng.randint(100, 500)
         latex = f"{num}"
         solution = str(num)
         steps = [f"Answer: {num}"]
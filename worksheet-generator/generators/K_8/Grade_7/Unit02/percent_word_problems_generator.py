@@ -4,16 +4,12 @@ Percent Problems Generator - Grade 7 Unit02
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
 class PercentWordProblemsGenerator:
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -33,19 +29,19 @@ class PercentWordProblemsGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        num = random.randint(1, 10)
+        num = self.rng.randint(1, 10)
         return Equation(latex=str(num), solution=str(num), steps=["Step 1"], difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        num = random.randint(10, 50)
+        num = self.rng.randint(10, 50)
         return Equation(latex=str(num), solution=str(num), steps=["Step 1"], difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        num = random.randint(50, 100)
+        num = self.rng.randint(50, 100)
         return Equation(latex=str(num), solution=str(num), steps=["Step 1"], difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        num = random.randint(100, 500)
+        num = self.rng.randint(100, 500)
         return Equation(latex=str(num), solution=str(num), steps=["Step 1"], difficulty='challenge')
 
 
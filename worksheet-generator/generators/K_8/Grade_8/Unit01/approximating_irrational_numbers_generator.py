@@ -7,9 +7,6 @@ Example: Approximate √10 to the nearest tenth
 import random
 import math
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -18,8 +15,7 @@ class ApproximatingIrrationalNumbersGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -53,7 +49,7 @@ class ApproximatingIrrationalNumbersGenerator:
         """Generate easy problems: approximate √n between two integers."""
         # Non-perfect squares between 1 and 50
         non_perfect_squares = [2, 3, 5, 6, 7, 8, 10, 11, 12, 13, 14, 15, 17, 18, 19, 20]
-        number = random.choice(non_perfect_squares)
+        number = self.rng.choice(non_perfect_squares)
 
         lower = int(math.sqrt(number))
         upper = lower + 1
@@ -76,7 +72,7 @@ class ApproximatingIrrationalNumbersGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium problems: approximate to nearest tenth."""
         non_perfect_squares = [2, 3, 5, 6, 7, 8, 10, 11, 12, 13, 15]
-        number = random.choice(non_perfect_squares)
+        number = self.rng.choice(non_perfect_squares)
 
         actual_value = math.sqrt(number)
         rounded_value = round(actual_value, 1)
@@ -97,11 +93,11 @@ class ApproximatingIrrationalNumbersGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: ordering irrational numbers or approximating π."""
-        problem_type = random.choice(['order', 'pi', 'compare'])
+        problem_type = self.rng.choice(['order', 'pi', 'compare'])
 
         if problem_type == 'order':
             # Order square roots
-            numbers = random.sample([2, 3, 5, 6, 7, 8, 10, 11, 12, 13, 15], 3)
+            numbers = self.rng.sample([2, 3, 5, 6, 7, 8, 10, 11, 12, 13, 15], 3)
             numbers.sort()
 
             latex = f"\\text{{Order from least to greatest: }} \\sqrt{{{numbers[0]}}}, \\sqrt{{{numbers[1]}}}, \\sqrt{{{numbers[2]}}}"
@@ -121,8 +117,8 @@ class ApproximatingIrrationalNumbersGenerator:
             ]
 
         else:  # compare
-            num1 = random.choice([2, 3, 5, 6, 7])
-            num2 = random.choice([8, 10, 11, 12, 13, 15])
+            num1 = self.rng.choice([2, 3, 5, 6, 7])
+            num2 = self.rng.choice([8, 10, 11, 12, 13, 15])
 
             val1 = math.sqrt(num1)
             val2 = math.sqrt(num2)
@@ -144,12 +140,12 @@ class ApproximatingIrrationalNumbersGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex approximations and expressions."""
-        problem_type = random.choice(['expression', 'locate', 'cube_root'])
+        problem_type = self.rng.choice(['expression', 'locate', 'cube_root'])
 
         if problem_type == 'expression':
             # Approximate √a + √b
-            num1 = random.choice([2, 3, 5])
-            num2 = random.choice([6, 7, 8, 10])
+            num1 = self.rng.choice([2, 3, 5])
+            num2 = self.rng.choice([6, 7, 8, 10])
 
             val1 = math.sqrt(num1)
             val2 = math.sqrt(num2)
@@ -166,7 +162,7 @@ class ApproximatingIrrationalNumbersGenerator:
 
         elif problem_type == 'locate':
             # Locate √n on number line
-            number = random.choice([5, 6, 7, 8, 10, 11, 12])
+            number = self.rng.choice([5, 6, 7, 8, 10, 11, 12])
             value = math.sqrt(number)
             lower = int(value)
             upper = lower + 1
@@ -189,7 +185,7 @@ class ApproximatingIrrationalNumbersGenerator:
         else:  # cube_root
             # Approximate cube root
             numbers = [10, 15, 20, 25, 30]
-            number = random.choice(numbers)
+            number = self.rng.choice(numbers)
 
             value = number ** (1/3)
             lower = int(value)
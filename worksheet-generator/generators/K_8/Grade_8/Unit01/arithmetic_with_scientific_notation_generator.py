@@ -6,9 +6,6 @@ Example: (3 × 10⁴) × (2 × 10³) = 6 × 10⁷
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class ArithmeticWithScientificNotationGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,10 +46,10 @@ class ArithmeticWithScientificNotationGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: multiply scientific notation numbers."""
-        coef1 = random.randint(2, 5)
-        coef2 = random.randint(2, 5)
-        exp1 = random.randint(2, 4)
-        exp2 = random.randint(2, 4)
+        coef1 = self.rng.randint(2, 5)
+        coef2 = self.rng.randint(2, 5)
+        exp1 = self.rng.randint(2, 4)
+        exp2 = self.rng.randint(2, 4)
 
         result_coef = coef1 * coef2
         result_exp = exp1 + exp2
@@ -75,14 +71,14 @@ class ArithmeticWithScientificNotationGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: divide or multiply with adjustment needed."""
-        problem_type = random.choice(['multiply_adjust', 'divide'])
+        problem_type = self.rng.choice(['multiply_adjust', 'divide'])
 
         if problem_type == 'multiply_adjust':
             # Result needs to be adjusted to proper scientific notation
-            coef1 = random.randint(4, 9)
-            coef2 = random.randint(4, 9)
-            exp1 = random.randint(2, 4)
-            exp2 = random.randint(2, 4)
+            coef1 = self.rng.randint(4, 9)
+            coef2 = self.rng.randint(4, 9)
+            exp1 = self.rng.randint(2, 4)
+            exp2 = self.rng.randint(2, 4)
 
             result_coef = coef1 * coef2
             result_exp = exp1 + exp2
@@ -108,10 +104,10 @@ class ArithmeticWithScientificNotationGenerator:
             latex = f"({coef1} \\times 10^{{{exp1}}}) \\times ({coef2} \\times 10^{{{exp2}}})"
 
         else:  # divide
-            coef1 = random.randint(4, 9)
-            coef2 = random.randint(2, coef1)
-            exp1 = random.randint(5, 8)
-            exp2 = random.randint(2, 4)
+            coef1 = self.rng.randint(4, 9)
+            coef2 = self.rng.randint(2, coef1)
+            exp1 = self.rng.randint(5, 8)
+            exp2 = self.rng.randint(2, 4)
 
             result_coef = coef1 / coef2
             result_exp = exp1 - exp2
@@ -136,12 +132,12 @@ class ArithmeticWithScientificNotationGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: addition/subtraction requiring same exponent."""
-        problem_type = random.choice(['add', 'subtract'])
+        problem_type = self.rng.choice(['add', 'subtract'])
 
         if problem_type == 'add':
-            exponent = random.randint(3, 5)
-            coef1 = random.randint(2, 6)
-            coef2 = random.randint(2, 6)
+            exponent = self.rng.randint(3, 5)
+            coef1 = self.rng.randint(2, 6)
+            coef2 = self.rng.randint(2, 6)
 
             result_coef = coef1 + coef2
 
@@ -153,9 +149,9 @@ class ArithmeticWithScientificNotationGenerator:
             ]
 
         else:  # subtract
-            exponent = random.randint(3, 5)
-            coef1 = random.randint(5, 9)
-            coef2 = random.randint(2, coef1-1)
+            exponent = self.rng.randint(3, 5)
+            coef1 = self.rng.randint(5, 9)
+            coef2 = self.rng.randint(2, coef1-1)
 
             result_coef = coef1 - coef2
 
@@ -175,14 +171,14 @@ class ArithmeticWithScientificNotationGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex expressions or requiring exponent adjustment."""
-        problem_type = random.choice(['add_different_exp', 'mixed_ops', 'square'])
+        problem_type = self.rng.choice(['add_different_exp', 'mixed_ops', 'square'])
 
         if problem_type == 'add_different_exp':
             # Addition with different exponents
-            exp1 = random.randint(4, 6)
+            exp1 = self.rng.randint(4, 6)
             exp2 = exp1 - 1
-            coef1 = random.randint(2, 5)
-            coef2 = random.randint(1, 9)
+            coef1 = self.rng.randint(2, 5)
+            coef2 = self.rng.randint(1, 9)
 
             # Convert to same exponent
             adjusted_coef2 = coef2 / 10
@@ -198,12 +194,12 @@ class ArithmeticWithScientificNotationGenerator:
 
         elif problem_type == 'mixed_ops':
             # (a × 10^m) × (b × 10^n) / (c × 10^p)
-            coef1 = random.randint(4, 8)
-            coef2 = random.randint(2, 4)
-            coef3 = random.randint(2, 4)
-            exp1 = random.randint(3, 5)
-            exp2 = random.randint(2, 4)
-            exp3 = random.randint(2, 3)
+            coef1 = self.rng.randint(4, 8)
+            coef2 = self.rng.randint(2, 4)
+            coef3 = self.rng.randint(2, 4)
+            exp1 = self.rng.randint(3, 5)
+            exp2 = self.rng.randint(2, 4)
+            exp3 = self.rng.randint(2, 3)
 
             numerator_coef = coef1 * coef2
             numerator_exp = exp1 + exp2
@@ -222,8 +218,8 @@ class ArithmeticWithScientificNotationGenerator:
             ]
 
         else:  # square
-            coef = random.randint(2, 4)
-            exp = random.randint(2, 4)
+            coef = self.rng.randint(2, 4)
+            exp = self.rng.randint(2, 4)
 
             result_coef = coef ** 2
             result_exp = exp * 2
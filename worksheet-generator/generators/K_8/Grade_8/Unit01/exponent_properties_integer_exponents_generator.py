@@ -6,9 +6,6 @@ Example: x⁻² × x⁵ = x³, (2⁻³)² = 2⁻⁶
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class ExponentPropertiesIntegerExponentsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,9 +46,9 @@ class ExponentPropertiesIntegerExponentsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: product rule with mix of positive and negative exponents."""
-        base = random.choice([2, 3, 4, 'x', 'a'])
-        exp1 = random.randint(2, 5)
-        exp2_negative = random.randint(1, 3)
+        base = self.rng.choice([2, 3, 4, 'x', 'a'])
+        exp1 = self.rng.randint(2, 5)
+        exp2_negative = self.rng.randint(1, 3)
 
         result_exp = exp1 - exp2_negative
 
@@ -72,16 +68,16 @@ class ExponentPropertiesIntegerExponentsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: quotient rule and power rule with negative exponents."""
-        property_type = random.choice(['quotient', 'power'])
+        property_type = self.rng.choice(['quotient', 'power'])
 
         if property_type == 'quotient':
-            base = random.choice(['x', 'y', 'a', 'b'])
-            exp1 = random.randint(-3, 3)
-            exp2 = random.randint(-3, 3)
+            base = self.rng.choice(['x', 'y', 'a', 'b'])
+            exp1 = self.rng.randint(-3, 3)
+            exp2 = self.rng.randint(-3, 3)
 
             # Ensure exponents are different
             while exp1 == exp2:
-                exp2 = random.randint(-3, 3)
+                exp2 = self.rng.randint(-3, 3)
 
             result_exp = exp1 - exp2
 
@@ -102,9 +98,9 @@ class ExponentPropertiesIntegerExponentsGenerator:
             ]
 
         else:  # power
-            base = random.choice(['x', 'a', 'y'])
-            inner_exp_neg = random.randint(1, 4)
-            outer_exp = random.randint(2, 3)
+            base = self.rng.choice(['x', 'a', 'y'])
+            inner_exp_neg = self.rng.randint(1, 4)
+            outer_exp = self.rng.randint(2, 3)
 
             result_exp = -inner_exp_neg * outer_exp
 
@@ -125,12 +121,12 @@ class ExponentPropertiesIntegerExponentsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: combining multiple properties."""
-        problem_type = random.choice(['product_of_powers', 'quotient_complex', 'power_product'])
+        problem_type = self.rng.choice(['product_of_powers', 'quotient_complex', 'power_product'])
 
         if problem_type == 'product_of_powers':
-            base = random.choice(['x', 'y', 'a'])
-            exp1 = random.randint(-3, -1)
-            exp2 = random.randint(-3, -1)
+            base = self.rng.choice(['x', 'y', 'a'])
+            exp1 = self.rng.randint(-3, -1)
+            exp2 = self.rng.randint(-3, -1)
 
             result_exp = exp1 + exp2
 
@@ -142,10 +138,10 @@ class ExponentPropertiesIntegerExponentsGenerator:
             ]
 
         elif problem_type == 'quotient_complex':
-            base = random.choice(['a', 'b', 'x'])
-            exp1 = random.randint(2, 5)
-            exp2 = random.randint(2, 4)
-            exp3 = random.randint(1, 3)
+            base = self.rng.choice(['a', 'b', 'x'])
+            exp1 = self.rng.randint(2, 5)
+            exp2 = self.rng.randint(2, 4)
+            exp3 = self.rng.randint(1, 3)
 
             numerator_exp = exp1 + exp2
             result_exp = numerator_exp - exp3
@@ -161,7 +157,7 @@ class ExponentPropertiesIntegerExponentsGenerator:
         else:  # power_product
             base1 = 'x'
             base2 = 'y'
-            exp = random.randint(-3, -1)
+            exp = self.rng.randint(-3, -1)
 
             latex = f"({base1}{base2})^{{{exp}}}"
             solution = f"{base1}^{{{exp}}}{base2}^{{{exp}}}"
@@ -179,13 +175,13 @@ class ExponentPropertiesIntegerExponentsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: very complex expressions."""
-        problem_type = random.choice(['nested_powers', 'mixed_operations', 'simplify_fraction'])
+        problem_type = self.rng.choice(['nested_powers', 'mixed_operations', 'simplify_fraction'])
 
         if problem_type == 'nested_powers':
-            base = random.choice(['x', 'a'])
-            exp1 = random.randint(-2, 2)
-            exp2 = random.randint(-2, 2)
-            exp3 = random.randint(2, 3)
+            base = self.rng.choice(['x', 'a'])
+            exp1 = self.rng.randint(-2, 2)
+            exp2 = self.rng.randint(-2, 2)
+            exp3 = self.rng.randint(2, 3)
 
             # ((a^m)^n)^p
             intermediate = exp1 * exp2
@@ -199,11 +195,11 @@ class ExponentPropertiesIntegerExponentsGenerator:
             ]
 
         elif problem_type == 'mixed_operations':
-            base = random.choice(['a', 'x'])
-            exp1 = random.randint(2, 4)
-            exp2 = random.randint(1, 3)
-            exp3 = random.randint(2, 3)
-            exp4 = random.randint(1, 2)
+            base = self.rng.choice(['a', 'x'])
+            exp1 = self.rng.randint(2, 4)
+            exp2 = self.rng.randint(1, 3)
+            exp3 = self.rng.randint(2, 3)
+            exp4 = self.rng.randint(1, 2)
 
             # (a^m × a^-n) / (a^p × a^-q)
             num_exp = exp1 - exp2
@@ -219,9 +215,9 @@ class ExponentPropertiesIntegerExponentsGenerator:
             ]
 
         else:  # simplify_fraction
-            base = random.choice(['x', 'y'])
-            num_exp = random.randint(-3, -1)
-            den_exp = random.randint(-3, -1)
+            base = self.rng.choice(['x', 'y'])
+            num_exp = self.rng.randint(-3, -1)
+            den_exp = self.rng.randint(-3, -1)
 
             result_exp = num_exp - den_exp
 
@@ -6,9 +6,6 @@ Example: 2³ × 2² = 2⁵, (3²)³ = 3⁶
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class ExponentPropertiesIntroGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,9 +46,9 @@ class ExponentPropertiesIntroGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: product rule a^m × a^n = a^(m+n)."""
-        base = random.choice([2, 3, 4, 5])
-        exp1 = random.randint(2, 5)
-        exp2 = random.randint(2, 5)
+        base = self.rng.choice([2, 3, 4, 5])
+        exp1 = self.rng.randint(2, 5)
+        exp2 = self.rng.randint(2, 5)
 
         result_exp = exp1 + exp2
 
@@ -73,13 +69,13 @@ class ExponentPropertiesIntroGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: quotient rule and power rule."""
-        property_type = random.choice(['quotient', 'power'])
+        property_type = self.rng.choice(['quotient', 'power'])
 
         if property_type == 'quotient':
             # a^m ÷ a^n = a^(m-n)
-            base = random.choice([2, 3, 4, 5, 6])
-            exp1 = random.randint(5, 8)
-            exp2 = random.randint(2, exp1-1)
+            base = self.rng.choice([2, 3, 4, 5, 6])
+            exp1 = self.rng.randint(5, 8)
+            exp2 = self.rng.randint(2, exp1-1)
 
             result_exp = exp1 - exp2
 
@@ -93,9 +89,9 @@ class ExponentPropertiesIntroGenerator:
 
         else:  # power
             # (a^m)^n = a^(mn)
-            base = random.choice([2, 3, 4, 5])
-            exp1 = random.randint(2, 4)
-            exp2 = random.randint(2, 3)
+            base = self.rng.choice([2, 3, 4, 5])
+            exp1 = self.rng.randint(2, 4)
+            exp2 = self.rng.randint(2, 3)
 
             result_exp = exp1 * exp2
 
@@ -116,13 +112,13 @@ class ExponentPropertiesIntroGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: combining multiple properties."""
-        problem_type = random.choice(['product_power', 'quotient_power', 'mixed'])
+        problem_type = self.rng.choice(['product_power', 'quotient_power', 'mixed'])
 
         if problem_type == 'product_power':
             # (ab)^n = a^n × b^n
-            base1 = random.choice([2, 3, 4])
-            base2 = random.choice([2, 3, 5])
-            exp = random.randint(2, 3)
+            base1 = self.rng.choice([2, 3, 4])
+            base2 = self.rng.choice([2, 3, 5])
+            exp = self.rng.randint(2, 3)
 
             latex = f"({base1} \\times {base2})^{{{exp}}}"
             solution = f"{base1}^{{{exp}}} \\times {base2}^{{{exp}}}"
@@ -133,9 +129,9 @@ class ExponentPropertiesIntroGenerator:
 
         elif problem_type == 'quotient_power':
             # (a/b)^n = a^n / b^n
-            base1 = random.choice([3, 4, 5, 6])
-            base2 = random.choice([2, 3])
-            exp = random.randint(2, 3)
+            base1 = self.rng.choice([3, 4, 5, 6])
+            base2 = self.rng.choice([2, 3])
+            exp = self.rng.randint(2, 3)
 
             latex = f"\\left(\\frac{{{base1}}}{{{base2}}}\\right)^{{{exp}}}"
             solution = f"\\frac{{{base1}^{{{exp}}}}}{{{base2}^{{{exp}}}}}"
@@ -145,10 +141,10 @@ class ExponentPropertiesIntroGenerator:
             ]
 
         else:  # mixed
-            base = random.choice([2, 3, 4])
-            exp1 = random.randint(2, 3)
-            exp2 = random.randint(2, 3)
-            exp3 = random.randint(2, 3)
+            base = self.rng.choice([2, 3, 4])
+            exp1 = self.rng.randint(2, 3)
+            exp2 = self.rng.randint(2, 3)
+            exp3 = self.rng.randint(2, 3)
 
             result_exp = exp1 + (exp2 * exp3)
 
@@ -169,13 +165,13 @@ class ExponentPropertiesIntroGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex expressions with multiple properties."""
-        problem_type = random.choice(['simplify', 'evaluate', 'zero_exp'])
+        problem_type = self.rng.choice(['simplify', 'evaluate', 'zero_exp'])
 
         if problem_type == 'simplify':
-            base = random.choice([2, 3, 'x', 'a'])
-            exp1 = random.randint(3, 5)
-            exp2 = random.randint(2, 4)
-            exp3 = random.randint(2, 3)
+            base = self.rng.choice([2, 3, 'x', 'a'])
+            exp1 = self.rng.randint(3, 5)
+            exp2 = self.rng.randint(2, 4)
+            exp3 = self.rng.randint(2, 3)
 
             # (a^m × a^n) / a^p
             numerator_exp = exp1 + exp2
@@ -190,9 +186,9 @@ class ExponentPropertiesIntroGenerator:
             ]
 
         elif problem_type == 'evaluate':
-            base = random.choice([2, 3])
-            exp1 = random.randint(2, 3)
-            exp2 = random.randint(2, 3)
+            base = self.rng.choice([2, 3])
+            exp1 = self.rng.randint(2, 3)
+            exp2 = self.rng.randint(2, 3)
 
             result_exp = exp1 * exp2
             result_value = base ** result_exp
@@ -205,7 +201,7 @@ class ExponentPropertiesIntroGenerator:
             ]
 
         else:  # zero_exp
-            base = random.choice([2, 3, 4, 5, 7])
+            base = self.rng.choice([2, 3, 4, 5, 7])
 
             latex = f"{base}^0"
             solution = "1"
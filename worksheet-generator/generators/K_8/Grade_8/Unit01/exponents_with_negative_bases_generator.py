@@ -6,9 +6,6 @@ Example: (-2)³ = -8, (-3)² = 9
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class ExponentsWithNegativeBasesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class ExponentsWithNegativeBasesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: (-a)² and (-a)³ with small bases."""
-        base = random.choice([2, 3, 4, 5])
-        exponent = random.choice([2, 3])
+        base = self.rng.choice([2, 3, 4, 5])
+        exponent = self.rng.choice([2, 3])
 
         result = (-base) ** exponent
 
@@ -72,11 +68,11 @@ class ExponentsWithNegativeBasesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: higher exponents and comparing with/without parentheses."""
-        problem_type = random.choice(['eval', 'compare'])
+        problem_type = self.rng.choice(['eval', 'compare'])
 
         if problem_type == 'eval':
-            base = random.choice([2, 3, 4, 5, 6])
-            exponent = random.choice([2, 3, 4])
+            base = self.rng.choice([2, 3, 4, 5, 6])
+            exponent = self.rng.choice([2, 3, 4])
 
             result = (-base) ** exponent
 
@@ -85,7 +81,7 @@ class ExponentsWithNegativeBasesGenerator:
             steps = [f"\\text{{Negative base raised to }} {exponent}", f"(-{base})^{{{exponent}}} = {result}"]
 
         else:  # compare
-            base = random.choice([2, 3, 4, 5])
+            base = self.rng.choice([2, 3, 4, 5])
             exponent = 2
 
             with_parens = (-base) ** exponent
@@ -108,13 +104,13 @@ class ExponentsWithNegativeBasesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: expressions with multiple terms."""
-        problem_type = random.choice(['sum', 'product', 'power'])
+        problem_type = self.rng.choice(['sum', 'product', 'power'])
 
         if problem_type == 'sum':
-            base1 = random.choice([2, 3, 4])
-            base2 = random.choice([2, 3, 4])
-            exp1 = random.choice([2, 3])
-            exp2 = random.choice([2, 3])
+            base1 = self.rng.choice([2, 3, 4])
+            base2 = self.rng.choice([2, 3, 4])
+            exp1 = self.rng.choice([2, 3])
+            exp2 = self.rng.choice([2, 3])
 
             val1 = (-base1) ** exp1
             val2 = (-base2) ** exp2
@@ -129,7 +125,7 @@ class ExponentsWithNegativeBasesGenerator:
             ]
 
         elif problem_type == 'product':
-            base = random.choice([2, 3, 4])
+            base = self.rng.choice([2, 3, 4])
             exp1 = 2
             exp2 = 3
 
@@ -146,7 +142,7 @@ class ExponentsWithNegativeBasesGenerator:
             ]
 
         else:  # power
-            base = random.choice([2, 3])
+            base = self.rng.choice([2, 3])
             inner_exp = 2
             outer_exp = 2
 
@@ -169,10 +165,10 @@ class ExponentsWithNegativeBasesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: patterns and reasoning."""
-        problem_type = random.choice(['pattern', 'true_false', 'complex'])
+        problem_type = self.rng.choice(['pattern', 'true_false', 'complex'])
 
         if problem_type == 'pattern':
-            base = random.choice([2, 3])
+            base = self.rng.choice([2, 3])
 
             latex = f"\\text{{Is }} (-{base})^{{10}} \\text{{ positive or negative?}}"
             solution = "Positive"
@@ -183,7 +179,7 @@ class ExponentsWithNegativeBasesGenerator:
             ]
 
         elif problem_type == 'true_false':
-            base = random.choice([2, 3, 4])
+            base = self.rng.choice([2, 3, 4])
 
             latex = f"\\text{{True or False: }} (-{base})^{{{2}}} = -{base}^{{{2}}}"
             solution = "False"
@@ -195,7 +191,7 @@ class ExponentsWithNegativeBasesGenerator:
             ]
 
         else:  # complex
-            base = random.choice([2, 3])
+            base = self.rng.choice([2, 3])
 
             val1 = (-base) ** 3
             val2 = (-base) ** 2
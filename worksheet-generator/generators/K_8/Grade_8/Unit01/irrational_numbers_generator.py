@@ -6,9 +6,6 @@ Example: Classify √2 as rational or irrational
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class IrrationalNumbersGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -60,7 +56,7 @@ class IrrationalNumbersGenerator:
             ("\\sqrt{5}", "Irrational", ["\\text{√5 cannot be expressed as a fraction}"])
         ]
 
-        number, classification, steps = random.choice(numbers)
+        number, classification, steps = self.rng.choice(numbers)
 
         latex = f"\\text{{Is }} {number} \\text{{ rational or irrational?}}"
         solution = classification
@@ -92,7 +88,7 @@ class IrrationalNumbersGenerator:
             }
         ]
 
-        problem = random.choice(problems)
+        problem = self.rng.choice(problems)
 
         return Equation(
             latex=problem["question"],
@@ -126,7 +122,7 @@ class IrrationalNumbersGenerator:
             }
         ]
 
-        problem = random.choice(problems)
+        problem = self.rng.choice(problems)
 
         return Equation(
             latex=problem["question"],
@@ -169,7 +165,7 @@ class IrrationalNumbersGenerator:
             }
         ]
 
-        problem = random.choice(problems)
+        problem = self.rng.choice(problems)
 
         return Equation(
             latex=problem["question"],
@@ -6,9 +6,6 @@ Example: 2⁻³ = 1/8, 3⁻² = 1/9
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class NegativeExponentsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,8 +46,8 @@ class NegativeExponentsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: simple negative exponents."""
-        base = random.choice([2, 3, 4, 5])
-        exponent = random.choice([1, 2, 3])
+        base = self.rng.choice([2, 3, 4, 5])
+        exponent = self.rng.choice([1, 2, 3])
 
         denominator = base ** exponent
 
@@ -72,11 +68,11 @@ class NegativeExponentsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: evaluating negative exponents and fractions."""
-        problem_type = random.choice(['evaluate', 'fraction_negative'])
+        problem_type = self.rng.choice(['evaluate', 'fraction_negative'])
 
         if problem_type == 'evaluate':
-            base = random.choice([2, 3, 4, 5])
-            exponent = random.choice([2, 3, 4])
+            base = self.rng.choice([2, 3, 4, 5])
+            exponent = self.rng.choice([2, 3, 4])
 
             denominator = base ** exponent
 
@@ -89,9 +85,9 @@ class NegativeExponentsGenerator:
             ]
 
         else:  # fraction with negative exponent
-            numerator = random.choice([1, 2, 3])
-            denominator = random.choice([2, 3, 4, 5])
-            exponent = random.choice([1, 2])
+            numerator = self.rng.choice([1, 2, 3])
+            denominator = self.rng.choice([2, 3, 4, 5])
+            exponent = self.rng.choice([1, 2])
 
             # (a/b)^(-n) = (b/a)^n
             new_num = denominator ** exponent
@@ -119,12 +115,12 @@ class NegativeExponentsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: expressions with negative exponents."""
-        problem_type = random.choice(['product', 'quotient', 'simplify'])
+        problem_type = self.rng.choice(['product', 'quotient', 'simplify'])
 
         if problem_type == 'product':
-            base = random.choice([2, 3, 4])
-            exp1 = random.randint(2, 4)
-            exp2 = random.randint(1, 3)
+            base = self.rng.choice([2, 3, 4])
+            exp1 = self.rng.randint(2, 4)
+            exp2 = self.rng.randint(1, 3)
 
             result_exp = exp1 - exp2
 
@@ -136,9 +132,9 @@ class NegativeExponentsGenerator:
             ]
 
         elif problem_type == 'quotient':
-            base = random.choice([2, 3, 4])
-            exp1 = random.randint(1, 3)
-            exp2 = random.randint(2, 4)
+            base = self.rng.choice([2, 3, 4])
+            exp1 = self.rng.randint(1, 3)
+            exp2 = self.rng.randint(2, 4)
 
             result_exp = -(exp1 + exp2)
 
@@ -150,8 +146,8 @@ class NegativeExponentsGenerator:
             ]
 
         else:  # simplify
-            base = random.choice([2, 3, 'x', 'a'])
-            exponent = random.choice([2, 3, 4])
+            base = self.rng.choice([2, 3, 'x', 'a'])
+            exponent = self.rng.choice([2, 3, 4])
 
             latex = f"\\frac{{1}}{{{base}^{{{exponent}}}}}"
             solution = f"{base}^{{-{exponent}}}"
@@ -169,11 +165,11 @@ class NegativeExponentsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex expressions."""
-        problem_type = random.choice(['power', 'mixed', 'simplify_complex'])
+        problem_type = self.rng.choice(['power', 'mixed', 'simplify_complex'])
 
         if problem_type == 'power':
-            base = random.choice([2, 3])
-            inner_exp = random.randint(2, 3)
+            base = self.rng.choice([2, 3])
+            inner_exp = self.rng.randint(2, 3)
             outer_exp = 2
 
             result_exp = -(inner_exp * outer_exp)
@@ -187,9 +183,9 @@ class NegativeExponentsGenerator:
             ]
 
         elif problem_type == 'mixed':
-            base = random.choice([2, 3, 'x'])
-            exp1 = random.randint(2, 4)
-            exp2 = random.randint(1, 3)
+            base = self.rng.choice([2, 3, 'x'])
+            exp1 = self.rng.randint(2, 4)
+            exp2 = self.rng.randint(1, 3)
 
             result_exp = exp1 + exp2
 
@@ -201,9 +197,9 @@ class NegativeExponentsGenerator:
             ]
 
         else:  # simplify_complex
-            base = random.choice(['x', 'a', 'y'])
-            exp1 = random.randint(3, 5)
-            exp2 = random.randint(5, 7)
+            base = self.rng.choice(['x', 'a', 'y'])
+            exp1 = self.rng.randint(3, 5)
+            exp2 = self.rng.randint(5, 7)
 
             result_exp = exp2 - exp1
 
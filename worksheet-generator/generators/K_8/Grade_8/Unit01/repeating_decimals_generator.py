@@ -6,9 +6,6 @@ Example: Convert 1/3 to decimal, or identify 0.333... as a fraction
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class RepeatingDecimalsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -58,9 +54,9 @@ class RepeatingDecimalsGenerator:
             (1, 6, "0.1\\overline{6}")
         ]
 
-        numerator, denominator, decimal = random.choice(fractions)
+        numerator, denominator, decimal = self.rng.choice(fractions)
 
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # Fraction to decimal
             latex = f"\\text{{Convert to decimal: }} \\frac{{{numerator}}}{{{denominator}}}"
             solution = decimal
@@ -90,9 +86,9 @@ class RepeatingDecimalsGenerator:
             (8, 9, "0.\\overline{8}")
         ]
 
-        numerator, denominator, decimal = random.choice(fractions)
+        numerator, denominator, decimal = self.rng.choice(fractions)
 
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             latex = f"\\text{{Convert to decimal: }} \\frac{{{numerator}}}{{{denominator}}}"
             solution = decimal
             steps = [f"\\text{{Divide {numerator} by {denominator}}}", f"\\frac{{{numerator}}}{{{denominator}}} = {decimal}"]
@@ -128,7 +124,7 @@ class RepeatingDecimalsGenerator:
             }
         ]
 
-        problem = random.choice(problems)
+        problem = self.rng.choice(problems)
 
         return Equation(
             latex=problem["question"],
@@ -177,7 +173,7 @@ class RepeatingDecimalsGenerator:
             }
         ]
 
-        problem = random.choice(problems)
+        problem = self.rng.choice(problems)
 
         return Equation(
             latex=problem["question"],
@@ -6,9 +6,6 @@ Example: Write 3400 in scientific notation: 3.4 × 10³
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class ScientificNotationIntroGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -51,8 +47,8 @@ class ScientificNotationIntroGenerator:
     def _generate_easy(self) -> Equation:
         """Generate easy problems: convert simple numbers to scientific notation."""
         # Numbers like 2000, 3000, etc.
-        coefficient = random.randint(2, 9)
-        exponent = random.randint(2, 4)
+        coefficient = self.rng.randint(2, 9)
+        exponent = self.rng.randint(2, 4)
 
         number = coefficient * (10 ** exponent)
 
@@ -72,14 +68,14 @@ class ScientificNotationIntroGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: convert numbers with decimals or from scientific notation."""
-        problem_type = random.choice(['to_scientific', 'from_scientific'])
+        problem_type = self.rng.choice(['to_scientific', 'from_scientific'])
 
         if problem_type == 'to_scientific':
             # Numbers like 3450, 6780, etc.
-            first_digit = random.randint(1, 9)
-            second_digit = random.randint(0, 9)
-            third_digit = random.choice([0, 5])
-            exponent = random.randint(2, 5)
+            first_digit = self.rng.randint(1, 9)
+            second_digit = self.rng.randint(0, 9)
+            third_digit = self.rng.choice([0, 5])
+            exponent = self.rng.randint(2, 5)
 
             coefficient = first_digit + second_digit / 10 + third_digit / 100
             if third_digit == 0:
@@ -98,8 +94,8 @@ class ScientificNotationIntroGenerator:
             steps = [f"{number} = {solution}"]
 
         else:  # from_scientific
-            coefficient = random.randint(1, 9) + random.choice([0, 0.5])
-            exponent = random.randint(2, 4)
+            coefficient = self.rng.randint(1, 9) + self.rng.choice([0, 0.5])
+            exponent = self.rng.randint(2, 4)
 
             number = int(coefficient * (10 ** exponent))
 
@@ -119,11 +115,11 @@ class ScientificNotationIntroGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: small numbers (decimals) in scientific notation."""
-        problem_type = random.choice(['small_to_sci', 'small_from_sci'])
+        problem_type = self.rng.choice(['small_to_sci', 'small_from_sci'])
 
         if problem_type == 'small_to_sci':
-            coefficient = random.randint(1, 9) + random.randint(0, 9) / 10
-            exponent = random.randint(2, 4)
+            coefficient = self.rng.randint(1, 9) + self.rng.randint(0, 9) / 10
+            exponent = self.rng.randint(2, 4)
 
             number = coefficient / (10 ** exponent)
 
@@ -132,8 +128,8 @@ class ScientificNotationIntroGenerator:
             steps = [f"{number} = {coefficient} \\times 10^{{-{exponent}}}"]
 
         else:  # small_from_sci
-            coefficient = random.randint(1, 9) + random.choice([0, 0.5])
-            exponent = random.randint(2, 3)
+            coefficient = self.rng.randint(1, 9) + self.rng.choice([0, 0.5])
+            exponent = self.rng.randint(2, 3)
 
             number = coefficient / (10 ** exponent)
 
@@ -153,13 +149,13 @@ class ScientificNotationIntroGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: comparing and ordering numbers in scientific notation."""
-        problem_type = random.choice(['compare', 'order', 'convert_complex'])
+        problem_type = self.rng.choice(['compare', 'order', 'convert_complex'])
 
         if problem_type == 'compare':
-            coef1 = random.randint(2, 7)
-            coef2 = random.randint(2, 7)
-            exp1 = random.randint(3, 6)
-            exp2 = random.randint(3, 6)
+            coef1 = self.rng.randint(2, 7)
+            coef2 = self.rng.randint(2, 7)
+            exp1 = self.rng.randint(3, 6)
+            exp2 = self.rng.randint(3, 6)
 
             num1_value = coef1 * (10 ** exp1)
             num2_value = coef2 * (10 ** exp2)
@@ -185,8 +181,8 @@ class ScientificNotationIntroGenerator:
         elif problem_type == 'order':
             numbers = []
             for _ in range(3):
-                coef = random.randint(1, 9)
-                exp = random.randint(2, 5)
+                coef = self.rng.randint(1, 9)
+                exp = self.rng.randint(2, 5)
                 numbers.append((coef, exp, coef * (10 ** exp)))
 
             # Sort by value
@@ -201,10 +197,10 @@ class ScientificNotationIntroGenerator:
             ]
 
         else:  # convert_complex
-            first_digit = random.randint(1, 9)
-            second_digit = random.randint(1, 9)
-            third_digit = random.randint(1, 9)
-            exponent = random.randint(4, 6)
+            first_digit = self.rng.randint(1, 9)
+            second_digit = self.rng.randint(1, 9)
+            third_digit = self.rng.randint(1, 9)
+            exponent = self.rng.randint(4, 6)
 
             coefficient = first_digit + second_digit / 10 + third_digit / 100
             number = int(coefficient * (10 ** exponent))
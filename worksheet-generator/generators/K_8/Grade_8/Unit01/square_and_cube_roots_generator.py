@@ -6,9 +6,6 @@ Example: √64 = 8, ∛27 = 3
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class SquareAndCubeRootsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -52,7 +48,7 @@ class SquareAndCubeRootsGenerator:
         """Generate easy problems: perfect squares up to 100."""
         perfect_squares = [(1, 1), (4, 2), (9, 3), (16, 4), (25, 5), (36, 6), (49, 7), (64, 8), (81, 9), (100, 10)]
 
-        square, root = random.choice(perfect_squares)
+        square, root = self.rng.choice(perfect_squares)
 
         latex = f"\\sqrt{{{square}}}"
         solution = str(root)
@@ -67,17 +63,17 @@ class SquareAndCubeRootsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: mix of square roots and cube roots."""
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             # Square roots of larger perfect squares
             perfect_squares = [(121, 11), (144, 12), (169, 13), (196, 14), (225, 15), (256, 16), (289, 17), (324, 18)]
-            square, root = random.choice(perfect_squares)
+            square, root = self.rng.choice(perfect_squares)
             latex = f"\\sqrt{{{square}}}"
             solution = str(root)
             steps = [f"\\sqrt{{{square}}} = {root}"]
         else:
             # Cube roots
             perfect_cubes = [(1, 1), (8, 2), (27, 3), (64, 4), (125, 5), (216, 6), (343, 7), (512, 8), (729, 9), (1000, 10)]
-            cube, root = random.choice(perfect_cubes)
+            cube, root = self.rng.choice(perfect_cubes)
             latex = f"\\sqrt[3]{{{cube}}}"
             solution = str(root)
             steps = [f"\\sqrt[3]{{{cube}}} = {root}"]
@@ -91,14 +87,14 @@ class SquareAndCubeRootsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: expressions involving roots."""
-        problem_type = random.choice(['add', 'multiply', 'power'])
+        problem_type = self.rng.choice(['add', 'multiply', 'power'])
 
         if problem_type == 'add':
             # √a + √b
             squares1 = [(4, 2), (9, 3), (16, 4), (25, 5), (36, 6), (49, 7)]
             squares2 = [(4, 2), (9, 3), (16, 4), (25, 5), (36, 6), (49, 7)]
-            sq1, root1 = random.choice(squares1)
-            sq2, root2 = random.choice(squares2)
+            sq1, root1 = self.rng.choice(squares1)
+            sq2, root2 = self.rng.choice(squares2)
 
             latex = f"\\sqrt{{{sq1}}} + \\sqrt{{{sq2}}}"
             solution = str(root1 + root2)
@@ -107,8 +103,8 @@ class SquareAndCubeRootsGenerator:
         elif problem_type == 'multiply':
             # √a × √b = √(ab)
             roots = [2, 3, 4, 5, 6]
-            root1 = random.choice(roots)
-            root2 = random.choice(roots)
+            root1 = self.rng.choice(roots)
+            root2 = self.rng.choice(roots)
 
             sq1 = root1 ** 2
             sq2 = root2 ** 2
@@ -121,7 +117,7 @@ class SquareAndCubeRootsGenerator:
         else:  # power
             # (√a)²
             squares = [(4, 2), (9, 3), (16, 4), (25, 5), (36, 6), (49, 7), (64, 8)]
-            sq, root = random.choice(squares)
+            sq, root = self.rng.choice(squares)
 
             latex = f"(\\sqrt{{{sq}}})^2"
             solution = str(sq)
@@ -136,12 +132,12 @@ class SquareAndCubeRootsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex expressions and solving equations."""
-        problem_type = random.choice(['equation', 'nested', 'expression'])
+        problem_type = self.rng.choice(['equation', 'nested', 'expression'])
 
         if problem_type == 'equation':
             # x² = a, solve for x
             perfect_squares = [(4, 2), (9, 3), (16, 4), (25, 5), (36, 6), (49, 7), (64, 8), (81, 9), (100, 10)]
-            square, root = random.choice(perfect_squares)
+            square, root = self.rng.choice(perfect_squares)
 
             latex = f"x^2 = {square}"
             solution = f"x = \\pm {root}"
@@ -150,7 +146,7 @@ class SquareAndCubeRootsGenerator:
         elif problem_type == 'nested':
             # √(√a)
             values = [(16, 4, 2), (81, 9, 3), (256, 16, 4)]
-            outer, middle, inner = random.choice(values)
+            outer, middle, inner = self.rng.choice(values)
 
             latex = f"\\sqrt{{\\sqrt{{{outer}}}}}"
             solution = str(inner)
@@ -161,8 +157,8 @@ class SquareAndCubeRootsGenerator:
             cubes = [(8, 2), (27, 3), (64, 4), (125, 5)]
             squares = [(4, 2), (9, 3), (16, 4), (25, 5)]
 
-            cube, cube_root = random.choice(cubes)
-            square, square_root = random.choice(squares)
+            cube, cube_root = self.rng.choice(cubes)
+            square, square_root = self.rng.choice(squares)
 
             latex = f"\\sqrt[3]{{{cube}}} + \\sqrt{{{square}}}"
             solution = str(cube_root + square_root)
@@ -6,9 +6,6 @@ Example: 10³ = 1000, 10⁻² = 0.01
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class WorkingWithPowersOf10Generator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,7 +46,7 @@ class WorkingWithPowersOf10Generator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: evaluate positive powers of 10."""
-        exponent = random.randint(1, 5)
+        exponent = self.rng.randint(1, 5)
 
         result = 10 ** exponent
 
@@ -67,10 +63,10 @@ class WorkingWithPowersOf10Generator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: negative powers of 10 and multiplication."""
-        problem_type = random.choice(['negative', 'multiply'])
+        problem_type = self.rng.choice(['negative', 'multiply'])
 
         if problem_type == 'negative':
-            exponent = random.randint(1, 4)
+            exponent = self.rng.randint(1, 4)
 
             result = 10 ** (-exponent)
 
@@ -82,8 +78,8 @@ class WorkingWithPowersOf10Generator:
             ]
 
         else:  # multiply
-            number = random.choice([2, 3, 4, 5, 7, 8, 9])
-            exponent = random.randint(2, 4)
+            number = self.rng.choice([2, 3, 4, 5, 7, 8, 9])
+            exponent = self.rng.randint(2, 4)
 
             result = number * (10 ** exponent)
 
@@ -103,11 +99,11 @@ class WorkingWithPowersOf10Generator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: operations with powers of 10."""
-        problem_type = random.choice(['product', 'quotient', 'decimal_multiply'])
+        problem_type = self.rng.choice(['product', 'quotient', 'decimal_multiply'])
 
         if problem_type == 'product':
-            exp1 = random.randint(2, 4)
-            exp2 = random.randint(2, 4)
+            exp1 = self.rng.randint(2, 4)
+            exp2 = self.rng.randint(2, 4)
 
             result_exp = exp1 + exp2
 
@@ -119,8 +115,8 @@ class WorkingWithPowersOf10Generator:
             ]
 
         elif problem_type == 'quotient':
-            exp1 = random.randint(5, 8)
-            exp2 = random.randint(2, 4)
+            exp1 = self.rng.randint(5, 8)
+            exp2 = self.rng.randint(2, 4)
 
             result_exp = exp1 - exp2
 
@@ -132,8 +128,8 @@ class WorkingWithPowersOf10Generator:
             ]
 
         else:  # decimal_multiply
-            number = random.choice([1.5, 2.5, 3.5, 4.5, 5.5])
-            exponent = random.randint(2, 3)
+            number = self.rng.choice([1.5, 2.5, 3.5, 4.5, 5.5])
+            exponent = self.rng.randint(2, 3)
 
             result = number * (10 ** exponent)
 
@@ -153,12 +149,12 @@ class WorkingWithPowersOf10Generator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex expressions with powers of 10."""
-        problem_type = random.choice(['mixed_ops', 'negative_multiply', 'divide'])
+        problem_type = self.rng.choice(['mixed_ops', 'negative_multiply', 'divide'])
 
         if problem_type == 'mixed_ops':
-            exp1 = random.randint(2, 4)
-            exp2 = random.randint(1, 3)
-            exp3 = random.randint(2, 3)
+            exp1 = self.rng.randint(2, 4)
+            exp2 = self.rng.randint(1, 3)
+            exp3 = self.rng.randint(2, 3)
 
             # 10^a × 10^(-b) / 10^c
             numerator_exp = exp1 - exp2
@@ -172,8 +168,8 @@ class WorkingWithPowersOf10Generator:
             ]
 
         elif problem_type == 'negative_multiply':
-            number = random.choice([2, 3, 4, 5])
-            exponent = random.randint(2, 4)
+            number = self.rng.choice([2, 3, 4, 5])
+            exponent = self.rng.randint(2, 4)
 
             result = number * (10 ** (-exponent))
 
@@ -185,8 +181,8 @@ class WorkingWithPowersOf10Generator:
             ]
 
         else:  # divide
-            number = random.choice([200, 300, 400, 500, 600, 700, 800, 900])
-            exponent = random.randint(1, 2)
+            number = self.rng.choice([200, 300, 400, 500, 600, 700, 800, 900])
+            exponent = self.rng.randint(1, 2)
 
             result = number / (10 ** exponent)
 
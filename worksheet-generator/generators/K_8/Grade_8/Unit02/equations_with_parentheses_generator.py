@@ -6,9 +6,6 @@ Example: 3(x + 2) = 15, solve for x
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class EquationsWithParenthesesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,11 +46,11 @@ class EquationsWithParenthesesGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: simple distribution on one side."""
-        x = random.randint(1, 10)
+        x = self.rng.randint(1, 10)
 
         # a(x + b) = c
-        a = random.randint(2, 5)
-        b = random.randint(1, 8)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 8)
         c = a * (x + b)
 
         latex = f"{a}(x + {b}) = {c}"
@@ -75,14 +71,14 @@ class EquationsWithParenthesesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: distribution with subtraction or on both sides."""
-        problem_type = random.choice(['subtract', 'both_sides'])
+        problem_type = self.rng.choice(['subtract', 'both_sides'])
 
         if problem_type == 'subtract':
-            x = random.randint(1, 10)
+            x = self.rng.randint(1, 10)
 
             # a(x - b) = c
-            a = random.randint(2, 6)
-            b = random.randint(1, 8)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 8)
             c = a * (x - b)
 
             latex = f"{a}(x - {b}) = {c}"
@@ -94,12 +90,12 @@ class EquationsWithParenthesesGenerator:
                 f"x = {x}"
             ]
         else:  # both_sides
-            x = random.randint(1, 10)
+            x = self.rng.randint(1, 10)
 
             # a(x + b) = c(x + d)
-            a = random.randint(2, 5)
-            b = random.randint(1, 6)
-            c = random.randint(1, a - 1) if a > 1 else a + 1
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 6)
+            c = self.rng.randint(1, a - 1) if a > 1 else a + 1
             d = ((a * x + a * b) - c * x) // c if c != 0 else 1
 
             latex = f"{a}(x + {b}) = {c}(x + {d})"
@@ -120,16 +116,16 @@ class EquationsWithParenthesesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: multiple sets of parentheses or negative coefficients."""
-        problem_type = random.choice(['multiple', 'negative'])
+        problem_type = self.rng.choice(['multiple', 'negative'])
 
         if problem_type == 'multiple':
-            x = random.randint(1, 8)
+            x = self.rng.randint(1, 8)
 
             # a(x + b) + c(x + d) = e
-            a = random.randint(2, 4)
-            b = random.randint(1, 5)
-            c = random.randint(2, 4)
-            d = random.randint(1, 5)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(1, 5)
+            c = self.rng.randint(2, 4)
+            d = self.rng.randint(1, 5)
             e = a * x + a * b + c * x + c * d
 
             latex = f"{a}(x + {b}) + {c}(x + {d}) = {e}"
@@ -142,11 +138,11 @@ class EquationsWithParenthesesGenerator:
                 f"x = {x}"
             ]
         else:  # negative
-            x = random.randint(1, 10)
+            x = self.rng.randint(1, 10)
 
             # -a(x - b) = c
-            a = random.randint(2, 5)
-            b = random.randint(1, 8)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 8)
             c = -a * (x - b)
 
             latex = f"-{a}(x - {b}) = {c}"
@@ -167,16 +163,16 @@ class EquationsWithParenthesesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: nested parentheses or complex distributions."""
-        problem_type = random.choice(['nested', 'complex'])
+        problem_type = self.rng.choice(['nested', 'complex'])
 
         if problem_type == 'nested':
-            x = random.randint(2, 6)
+            x = self.rng.randint(2, 6)
 
             # a(b(x + c) + d) = e
-            a = random.randint(2, 3)
-            b = random.randint(2, 3)
-            c = random.randint(1, 4)
-            d = random.randint(1, 4)
+            a = self.rng.randint(2, 3)
+            b = self.rng.randint(2, 3)
+            c = self.rng.randint(1, 4)
+            d = self.rng.randint(1, 4)
             e = a * (b * (x + c) + d)
 
             latex = f"{a}({b}(x + {c}) + {d}) = {e}"
@@ -190,13 +186,13 @@ class EquationsWithParenthesesGenerator:
                 f"x = {x}"
             ]
         else:  # complex
-            x = random.randint(1, 8)
+            x = self.rng.randint(1, 8)
 
             # a(x + b) - c(x - d) = e
-            a = random.randint(2, 5)
-            b = random.randint(1, 6)
-            c = random.randint(2, 4)
-            d = random.randint(1, 6)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 6)
+            c = self.rng.randint(2, 4)
+            d = self.rng.randint(1, 6)
             e = a * x + a * b - c * x + c * d
 
             latex = f"{a}(x + {b}) - {c}(x - {d}) = {e}"
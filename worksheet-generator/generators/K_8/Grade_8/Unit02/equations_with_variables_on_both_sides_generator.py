@@ -6,9 +6,6 @@ Example: 3x + 5 = 2x + 8, solve for x
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class EquationsWithVariablesOnBothSidesGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -51,14 +47,14 @@ class EquationsWithVariablesOnBothSidesGenerator:
     def _generate_easy(self) -> Equation:
         """Generate easy problems: simple variables on both sides."""
         # Generate x value
-        x = random.randint(1, 10)
+        x = self.rng.randint(1, 10)
 
         # Left side: ax + b
-        a1 = random.randint(2, 5)
-        b1 = random.randint(1, 10)
+        a1 = self.rng.randint(2, 5)
+        b1 = self.rng.randint(1, 10)
 
         # Right side: cx + d where a1 != c
-        c = random.randint(1, a1 - 1) if a1 > 1 else a1 + 1
+        c = self.rng.randint(1, a1 - 1) if a1 > 1 else a1 + 1
         d = a1 * x + b1 - c * x
 
         latex = f"{a1}x + {b1} = {c}x + {d}"
@@ -79,14 +75,14 @@ class EquationsWithVariablesOnBothSidesGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: variables on both sides with negative coefficients."""
-        x = random.randint(-5, 10)
+        x = self.rng.randint(-5, 10)
 
         # Left side: ax + b
-        a1 = random.randint(3, 7)
-        b1 = random.randint(-8, 8)
+        a1 = self.rng.randint(3, 7)
+        b1 = self.rng.randint(-8, 8)
 
         # Right side: cx + d
-        c = random.randint(1, a1 - 1)
+        c = self.rng.randint(1, a1 - 1)
         d = a1 * x + b1 - c * x
 
         # Format with proper signs
@@ -115,14 +111,14 @@ class EquationsWithVariablesOnBothSidesGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: more complex coefficients and constants."""
-        x = random.randint(-10, 10)
+        x = self.rng.randint(-10, 10)
 
         # Left side: ax + b
-        a1 = random.randint(4, 10)
-        b1 = random.randint(-15, 15)
+        a1 = self.rng.randint(4, 10)
+        b1 = self.rng.randint(-15, 15)
 
         # Right side: cx + d
-        c = random.randint(-3, 3)
+        c = self.rng.randint(-3, 3)
         if c == a1:
             c = c + 1
         d = a1 * x + b1 - c * x
@@ -154,19 +150,19 @@ class EquationsWithVariablesOnBothSidesGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: fractional coefficients or complex equations."""
-        problem_type = random.choice(['fractional', 'complex'])
+        problem_type = self.rng.choice(['fractional', 'complex'])
 
         if problem_type == 'fractional':
-            x = random.randint(2, 12)
+            x = self.rng.randint(2, 12)
 
             # Use fractions
-            a1_num = random.randint(1, 3)
-            a1_den = random.randint(2, 4)
+            a1_num = self.rng.randint(1, 3)
+            a1_den = self.rng.randint(2, 4)
 
-            c_num = random.randint(1, 2)
+            c_num = self.rng.randint(1, 2)
             c_den = a1_den  # Same denominator for easier calculation
 
-            b1 = random.randint(1, 10)
+            b1 = self.rng.randint(1, 10)
 
             # Calculate d so that x is the solution
             # a1_num/a1_den * x + b1 = c_num/c_den * x + d
@@ -182,15 +178,15 @@ class EquationsWithVariablesOnBothSidesGenerator:
                 f"x = {x}"
             ]
         else:  # complex
-            x = random.randint(1, 8)
+            x = self.rng.randint(1, 8)
 
             # Left side: ax + bx + c = (a+b)x + c
-            a = random.randint(2, 5)
-            b = random.randint(1, 3)
-            c = random.randint(-5, 5)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 3)
+            c = self.rng.randint(-5, 5)
 
             # Right side: dx + e
-            d = random.randint(1, 4)
+            d = self.rng.randint(1, 4)
             e = (a + b) * x + c - d * x
 
             c_str = f"+ {c}" if c >= 0 else f"- {abs(c)}"
@@ -6,9 +6,6 @@ Example: Determine if 2x + 3 = 2x + 5 has no solution, one solution, or infinite
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class NumberOfSolutionsToEquationsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,11 +46,11 @@ class NumberOfSolutionsToEquationsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: obvious one solution cases."""
-        x = random.randint(1, 10)
+        x = self.rng.randint(1, 10)
 
         # Simple equation with one solution
-        a = random.randint(2, 5)
-        b = random.randint(1, 10)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 10)
         c = a * x + b
 
         latex = f"\\text{{How many solutions does }} {a}x + {b} = {c} \\text{{ have?}}"
@@ -75,13 +71,13 @@ class NumberOfSolutionsToEquationsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: mix of no solution, one solution, and infinite solutions."""
-        solution_type = random.choice(['none', 'one', 'infinite'])
+        solution_type = self.rng.choice(['none', 'one', 'infinite'])
 
         if solution_type == 'none':
             # Same coefficients, different constants: ax + b = ax + c where b ≠ c
-            a = random.randint(2, 6)
-            b = random.randint(1, 10)
-            c = b + random.randint(1, 5)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 10)
+            c = b + self.rng.randint(1, 5)
 
             latex = f"\\text{{How many solutions does }} {a}x + {b} = {a}x + {c} \\text{{ have?}}"
             solution = "\\text{No solution}"
@@ -92,10 +88,10 @@ class NumberOfSolutionsToEquationsGenerator:
             ]
         elif solution_type == 'one':
             # One solution
-            x = random.randint(1, 10)
-            a = random.randint(2, 6)
-            b = random.randint(1, 10)
-            c = random.randint(1, a - 1) if a > 1 else a + 1
+            x = self.rng.randint(1, 10)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 10)
+            c = self.rng.randint(1, a - 1) if a > 1 else a + 1
             d = a * x + b - c * x
 
             latex = f"\\text{{How many solutions does }} {a}x + {b} = {c}x + {d} \\text{{ have?}}"
@@ -108,8 +104,8 @@ class NumberOfSolutionsToEquationsGenerator:
             ]
         else:  # infinite
             # Same on both sides: ax + b = ax + b
-            a = random.randint(2, 6)
-            b = random.randint(1, 10)
+            a = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 10)
 
             latex = f"\\text{{How many solutions does }} {a}x + {b} = {a}x + {b} \\text{{ have?}}"
             solution = "\\text{Infinitely many solutions}"
@@ -128,13 +124,13 @@ class NumberOfSolutionsToEquationsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: equations with parentheses requiring distribution first."""
-        solution_type = random.choice(['none', 'one', 'infinite'])
+        solution_type = self.rng.choice(['none', 'one', 'infinite'])
 
         if solution_type == 'none':
             # a(x + b) = ax + c where ab ≠ c
-            a = random.randint(2, 5)
-            b = random.randint(2, 6)
-            c = a * b + random.randint(1, 4)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(2, 6)
+            c = a * b + self.rng.randint(1, 4)
 
             latex = f"\\text{{How many solutions does }} {a}(x + {b}) = {a}x + {c} \\text{{ have?}}"
             solution = "\\text{No solution}"
@@ -145,10 +141,10 @@ class NumberOfSolutionsToEquationsGenerator:
                 f"\\text{{False statement, so no solution}}"
             ]
         elif solution_type == 'one':
-            x = random.randint(1, 8)
-            a = random.randint(2, 5)
-            b = random.randint(1, 5)
-            c = random.randint(1, 4)
+            x = self.rng.randint(1, 8)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 5)
+            c = self.rng.randint(1, 4)
             d = a * x + a * b - c * x
 
             latex = f"\\text{{How many solutions does }} {a}(x + {b}) = {c}x + {d} \\text{{ have?}}"
@@ -161,8 +157,8 @@ class NumberOfSolutionsToEquationsGenerator:
                 "\\text{One solution}"
             ]
         else:  # infinite
-            a = random.randint(2, 5)
-            b = random.randint(2, 6)
+            a = self.rng.randint(2, 5)
+            b = self.rng.randint(2, 6)
             c = a * b
 
             latex = f"\\text{{How many solutions does }} {a}(x + {b}) = {a}x + {c} \\text{{ have?}}"
@@ -184,14 +180,14 @@ class NumberOfSolutionsToEquationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: complex equations with multiple parentheses."""
-        solution_type = random.choice(['none', 'one', 'infinite'])
+        solution_type = self.rng.choice(['none', 'one', 'infinite'])
 
         if solution_type == 'none':
             # a(x + b) + c = a(x + d) + c where b ≠ d
-            a = random.randint(2, 4)
-            b = random.randint(1, 5)
-            c = random.randint(1, 8)
-            d = b + random.randint(1, 4)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(1, 5)
+            c = self.rng.randint(1, 8)
+            d = b + self.rng.randint(1, 4)
 
             latex = f"\\text{{How many solutions does }} {a}(x + {b}) + {c} = {a}(x + {d}) + {c} \\text{{ have?}}"
             solution = "\\text{No solution}"
@@ -202,11 +198,11 @@ class NumberOfSolutionsToEquationsGenerator:
                 f"\\text{{False statement, so no solution}}"
             ]
         elif solution_type == 'one':
-            x = random.randint(1, 8)
-            a = random.randint(2, 4)
-            b = random.randint(1, 5)
-            c = random.randint(2, 4)
-            d = random.randint(1, 5)
+            x = self.rng.randint(1, 8)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(1, 5)
+            c = self.rng.randint(2, 4)
+            d = self.rng.randint(1, 5)
             e = a * x + a * b - c * x - c * d
 
             latex = f"\\text{{How many solutions does }} {a}(x + {b}) = {c}(x + {d}) + {e} \\text{{ have?}}"
@@ -219,9 +215,9 @@ class NumberOfSolutionsToEquationsGenerator:
                 "\\text{One solution}"
             ]
         else:  # infinite
-            a = random.randint(2, 4)
-            b = random.randint(1, 5)
-            c = random.randint(1, 8)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(1, 5)
+            c = self.rng.randint(1, 8)
 
             latex = f"\\text{{How many solutions does }} {a}(x + {b}) + {c} = {a}x + {a * b + c} \\text{{ have?}}"
             solution = "\\text{Infinitely many solutions}"
@@ -6,9 +6,6 @@ Example: The distance from Earth to the Sun is 93,000,000 miles. Express this in
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class ScientificNotationWordProblemsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -57,9 +53,9 @@ class ScientificNotationWordProblemsGenerator:
             ("A factory produces {num} items per day. Express in scientific notation.", "items")
         ]
 
-        context, unit = random.choice(contexts)
-        coefficient = random.randint(2, 9)
-        exponent = random.randint(3, 5)
+        context, unit = self.rng.choice(contexts)
+        coefficient = self.rng.randint(2, 9)
+        exponent = self.rng.randint(3, 5)
         number = coefficient * (10 ** exponent)
 
         latex = f"\\text{{{context.format(num=number)}}}"
@@ -79,13 +75,13 @@ class ScientificNotationWordProblemsGenerator:
     def _generate_medium(self) -> Equation:
         """Generate medium problems: operations with scientific notation."""
         problem_types = ['multiply', 'divide', 'add_subtract']
-        problem_type = random.choice(problem_types)
+        problem_type = self.rng.choice(problem_types)
 
         if problem_type == 'multiply':
-            coef1 = random.randint(2, 5)
-            coef2 = random.randint(2, 5)
-            exp1 = random.randint(2, 4)
-            exp2 = random.randint(2, 4)
+            coef1 = self.rng.randint(2, 5)
+            coef2 = self.rng.randint(2, 5)
+            exp1 = self.rng.randint(2, 4)
+            exp2 = self.rng.randint(2, 4)
 
             result_coef = coef1 * coef2
             result_exp = exp1 + exp2
@@ -103,10 +99,10 @@ class ScientificNotationWordProblemsGenerator:
             ]
 
         elif problem_type == 'divide':
-            coef1 = random.randint(4, 9)
-            coef2 = random.randint(2, 3)
-            exp1 = random.randint(4, 6)
-            exp2 = random.randint(2, 3)
+            coef1 = self.rng.randint(4, 9)
+            coef2 = self.rng.randint(2, 3)
+            exp1 = self.rng.randint(4, 6)
+            exp2 = self.rng.randint(2, 3)
 
             result_coef = coef1 / coef2
             result_exp = exp1 - exp2
@@ -118,9 +114,9 @@ class ScientificNotationWordProblemsGenerator:
                 f"= {result_coef} \\times 10^{{{result_exp}}}"
             ]
         else:  # add_subtract
-            coef1 = random.randint(3, 7)
-            coef2 = random.randint(1, 4)
-            exp = random.randint(3, 5)
+            coef1 = self.rng.randint(3, 7)
+            coef2 = self.rng.randint(1, 4)
+            exp = self.rng.randint(3, 5)
 
             result_coef = coef1 + coef2
 
@@ -171,7 +167,7 @@ class ScientificNotationWordProblemsGenerator:
             }
         ]
 
-        problem = random.choice(problems)
+        problem = self.rng.choice(problems)
 
         return Equation(
             latex=problem["question"],
@@ -214,7 +210,7 @@ class ScientificNotationWordProblemsGenerator:
             }
         ]
 
-        problem = random.choice(problems)
+        problem = self.rng.choice(problems)
 
         return Equation(
             latex=problem["question"],
@@ -6,9 +6,6 @@ Example: Which function has a greater rate of change?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class ComparingLinearFunctionsGenerator:
     """Generates comparing linear functions problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,13 +33,13 @@ class ComparingLinearFunctionsGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        m1 = random.randint(2, 8)
-        m2 = random.randint(2, 8)
+        m1 = self.rng.randint(2, 8)
+        m2 = self.rng.randint(2, 8)
         while m1 == m2:
-            m2 = random.randint(2, 8)
+            m2 = self.rng.randint(2, 8)
 
-        b1 = random.randint(1, 8)
-        b2 = random.randint(1, 8)
+        b1 = self.rng.randint(1, 8)
+        b2 = self.rng.randint(1, 8)
 
         greater = m1 if m1 > m2 else m2
         latex = f"\\text{{Which has a greater slope: }} f(x) = {m1}x + {b1} \\text{{ or }} g(x) = {m2}x + {b2}?"
@@ -58,13 +54,13 @@ class ComparingLinearFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        m1 = random.randint(2, 6)
-        m2 = random.randint(2, 6)
+        m1 = self.rng.randint(2, 6)
+        m2 = self.rng.randint(2, 6)
         while m1 == m2:
-            m2 = random.randint(2, 6)
+            m2 = self.rng.randint(2, 6)
 
-        b1 = random.randint(1, 10)
-        b2 = random.randint(1, 10)
+        b1 = self.rng.randint(1, 10)
+        b2 = self.rng.randint(1, 10)
 
         latex = f"\\text{{Compare y-intercepts: }} y = {m1}x + {b1} \\text{{ and }} y = {m2}x + {b2}"
         solution = f"{b1} {'>' if b1 > b2 else '<' if b1 < b2 else '='} {b2}"
@@ -77,12 +73,12 @@ class ComparingLinearFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        m1 = random.randint(3, 7)
-        b1 = random.randint(5, 15)
+        m1 = self.rng.randint(3, 7)
+        b1 = self.rng.randint(5, 15)
 
-        x1, x2 = 0, random.randint(3, 6)
-        m2 = random.randint(2, 8)
-        y1, y2 = random.randint(3, 10), random.randint(15, 30)
+        x1, x2 = 0, self.rng.randint(3, 6)
+        m2 = self.rng.randint(2, 8)
+        y1, y2 = self.rng.randint(3, 10), self.rng.randint(15, 30)
 
         latex = f"\\text{{Function A: }} y = {m1}x + {b1}. \\text{{ Function B passes through }} ({x1}, {y1}), ({x2}, {y2}). \\text{{ Which is steeper?}}"
         m2_calc = (y2 - y1) / (x2 - x1)
@@ -96,10 +92,10 @@ class ComparingLinearFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        m1 = random.randint(3, 8)
-        b1 = random.randint(10, 30)
-        m2 = random.randint(2, 7)
-        b2 = random.randint(15, 40)
+        m1 = self.rng.randint(3, 8)
+        b1 = self.rng.randint(10, 30)
+        m2 = self.rng.randint(2, 7)
+        b2 = self.rng.randint(15, 40)
 
         x_intersect = (b2 - b1) / (m1 - m2) if m1 != m2 else 0
 
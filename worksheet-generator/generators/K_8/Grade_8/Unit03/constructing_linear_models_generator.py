@@ -6,9 +6,6 @@ Example: Given data points, construct a linear equation
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class ConstructingLinearModelsGenerator:
     """Generates constructing linear models problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,9 +33,9 @@ class ConstructingLinearModelsGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        m = random.randint(2, 6)
-        b = random.randint(5, 15)
-        x = random.randint(0, 5)
+        m = self.rng.randint(2, 6)
+        b = self.rng.randint(5, 15)
+        x = self.rng.randint(0, 5)
         y = m * x + b
 
         latex = f"\\text{{A quantity starts at }} {b} \\text{{ and increases by }} {m} \\text{{ per unit. Write the equation.}}"
@@ -53,9 +49,9 @@ class ConstructingLinearModelsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x1, x2 = random.randint(1, 4), random.randint(6, 10)
-        m = random.randint(2, 5)
-        y1 = random.randint(10, 20)
+        x1, x2 = self.rng.randint(1, 4), self.rng.randint(6, 10)
+        m = self.rng.randint(2, 5)
+        y1 = self.rng.randint(10, 20)
         y2 = y1 + m * (x2 - x1)
         b = y1 - m * x1
 
@@ -71,9 +67,9 @@ class ConstructingLinearModelsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        initial = random.randint(100, 200)
-        decrease = random.randint(5, 15)
-        time = random.randint(4, 8)
+        initial = self.rng.randint(100, 200)
+        decrease = self.rng.randint(5, 15)
+        time = self.rng.randint(4, 8)
         remaining = initial - decrease * time
 
         latex = f"\\text{{A tank has }} {initial} \\text{{ gallons. After }} {time} \\text{{ hours, it has }} {remaining} \\text{{ gallons. Find the equation for gallons over time.}}"
@@ -87,10 +83,10 @@ class ConstructingLinearModelsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        cost1 = random.randint(50, 100)
-        cost2 = random.randint(120, 180)
-        units1 = random.randint(5, 10)
-        units2 = random.randint(15, 25)
+        cost1 = self.rng.randint(50, 100)
+        cost2 = self.rng.randint(120, 180)
+        units1 = self.rng.randint(5, 10)
+        units2 = self.rng.randint(15, 25)
 
         m = (cost2 - cost1) / (units2 - units1)
         b = cost1 - m * units1
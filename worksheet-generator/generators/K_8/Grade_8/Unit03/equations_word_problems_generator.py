@@ -6,9 +6,6 @@ Example: Maria has $50 and saves $10 per week. How many weeks until she has $100
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class EquationsWordProblemsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -68,11 +64,11 @@ class EquationsWordProblemsGenerator:
             }
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
 
         if "rate" in context["problem"]:
-            weeks = random.randint(3, 8)
-            rate = random.randint(5, 15)
+            weeks = self.rng.randint(3, 8)
+            rate = self.rng.randint(5, 15)
             total = rate * weeks
 
             problem_text = context["problem"].format(rate=rate, weeks=weeks, total=total)
@@ -83,8 +79,8 @@ class EquationsWordProblemsGenerator:
                 f"w = {weeks}"
             ]
         elif "discount" in context["problem"]:
-            price = random.randint(20, 50)
-            discount = random.randint(5, 15)
+            price = self.rng.randint(20, 50)
+            discount = self.rng.randint(5, 15)
             final = price - discount
 
             problem_text = context["problem"].format(price=price, discount=discount, final=final)
@@ -95,8 +91,8 @@ class EquationsWordProblemsGenerator:
                 f"d = {discount}"
             ]
         else:
-            initial = random.randint(10, 30)
-            more = random.randint(5, 15)
+            initial = self.rng.randint(10, 30)
+            more = self.rng.randint(5, 15)
             total = initial + more
 
             problem_text = context["problem"].format(initial=initial, more=more, total=total)
@@ -122,12 +118,12 @@ class EquationsWordProblemsGenerator:
             "A gym membership costs $${base} to join and $${rate} per month. After {months} months, the total cost is $${total}."
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
 
         if "GB" in context:
-            base = random.randint(20, 40)
-            rate = random.randint(3, 8)
-            gb = random.randint(2, 8)
+            base = self.rng.randint(20, 40)
+            rate = self.rng.randint(3, 8)
+            gb = self.rng.randint(2, 8)
             total = base + rate * gb
 
             problem_text = context.format(base=base, rate=rate, total=total)
@@ -139,9 +135,9 @@ class EquationsWordProblemsGenerator:
                 f"x = {gb}"
             ]
         elif "taxi" in context:
-            base = random.randint(3, 7)
-            rate = random.randint(2, 5)
-            miles = random.randint(5, 15)
+            base = self.rng.randint(3, 7)
+            rate = self.rng.randint(2, 5)
+            miles = self.rng.randint(5, 15)
             total = base + rate * miles
 
             problem_text = context.format(base=base, rate=rate, miles=miles, total=total)
@@ -153,9 +149,9 @@ class EquationsWordProblemsGenerator:
                 f"\\text{{Verified}}"
             ]
         else:
-            base = random.randint(30, 60)
-            rate = random.randint(15, 30)
-            months = random.randint(4, 12)
+            base = self.rng.randint(30, 60)
+            rate = self.rng.randint(15, 30)
+            months = self.rng.randint(4, 12)
             total = base + rate * months
 
             problem_text = context.format(base=base, rate=rate, months=months, total=total)
@@ -187,12 +183,12 @@ class EquationsWordProblemsGenerator:
             }
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
 
         if "Store" in context["problem"]:
-            accessories = random.randint(2, 8)
-            rate_b = random.randint(10, 30)
-            price_b = random.randint(100, 200)
+            accessories = self.rng.randint(2, 8)
+            rate_b = self.rng.randint(10, 30)
+            price_b = self.rng.randint(100, 200)
             price_a = price_b + rate_b * accessories
 
             problem_text = context["problem"].format(price_a=price_a, price_b=price_b, rate_b=rate_b)
@@ -204,9 +200,9 @@ class EquationsWordProblemsGenerator:
                 f"x = {accessories}"
             ]
         else:
-            speed1 = random.randint(40, 70)
-            speed2 = random.randint(50, 80)
-            time = random.randint(2, 5)
+            speed1 = self.rng.randint(40, 70)
+            speed2 = self.rng.randint(50, 80)
+            time = self.rng.randint(2, 5)
             distance = (speed1 + speed2) * time
 
             problem_text = context["problem"].format(distance=distance, speed1=speed1, speed2=speed2)
@@ -233,11 +229,11 @@ class EquationsWordProblemsGenerator:
             "A number is increased by {percent}%. The result is {result}. Find the original number."
         ]
 
-        context = random.choice(contexts)
+        context = self.rng.choice(contexts)
 
         if "rectangle" in context:
-            width = random.randint(5, 15)
-            factor = random.randint(2, 4)
+            width = self.rng.randint(5, 15)
+            factor = self.rng.randint(2, 4)
             length = factor * width
             perimeter = 2 * (length + width)
 
@@ -251,7 +247,7 @@ class EquationsWordProblemsGenerator:
                 f"w = {width}, l = {length}"
             ]
         elif "consecutive" in context:
-            first = random.randint(10, 30)
+            first = self.rng.randint(10, 30)
             sum_val = first + (first + 1) + (first + 2)
 
             problem_text = context.format(sum=sum_val)
@@ -264,8 +260,8 @@ class EquationsWordProblemsGenerator:
                 f"n = {first}"
             ]
         else:
-            original = random.randint(40, 100)
-            percent = random.choice([20, 25, 50])
+            original = self.rng.randint(40, 100)
+            percent = self.rng.choice([20, 25, 50])
             result = original + (original * percent // 100)
 
             problem_text = context.format(percent=percent, result=result)
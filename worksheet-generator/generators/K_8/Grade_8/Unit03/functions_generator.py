@@ -6,9 +6,6 @@ Example: If f(x) = 2x + 3, find f(5)
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class FunctionsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -41,9 +37,9 @@ class FunctionsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: evaluate simple function."""
-        m = random.randint(2, 6)
-        b = random.randint(1, 8)
-        x = random.randint(1, 6)
+        m = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 8)
+        x = self.rng.randint(1, 6)
         result = m * x + b
 
         latex = f"\\text{{If }} f(x) = {m}x + {b}, \\text{{ find }} f({x})"
@@ -58,12 +54,12 @@ class FunctionsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: evaluate with negative values or find input."""
-        problem_type = random.choice(['negative', 'find_input'])
+        problem_type = self.rng.choice(['negative', 'find_input'])
 
         if problem_type == 'negative':
-            m = random.randint(2, 5)
-            b = random.randint(-5, 5)
-            x = random.randint(-4, -1)
+            m = self.rng.randint(2, 5)
+            b = self.rng.randint(-5, 5)
+            x = self.rng.randint(-4, -1)
             result = m * x + b
 
             b_str = f"+ {b}" if b >= 0 else f"- {abs(b)}"
@@ -75,9 +71,9 @@ class FunctionsGenerator:
                 f"f({x}) = {result}"
             ]
         else:  # find_input
-            m = random.randint(2, 6)
-            b = random.randint(1, 8)
-            x = random.randint(2, 8)
+            m = self.rng.randint(2, 6)
+            b = self.rng.randint(1, 8)
+            x = self.rng.randint(2, 8)
             result = m * x + b
 
             latex = f"\\text{{If }} f(x) = {m}x + {b} \\text{{ and }} f(x) = {result}, \\text{{ find }} x"
@@ -92,12 +88,12 @@ class FunctionsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: composite operations or function composition."""
-        problem_type = random.choice(['operations', 'composition'])
+        problem_type = self.rng.choice(['operations', 'composition'])
 
         if problem_type == 'operations':
-            m = random.randint(2, 5)
-            b = random.randint(1, 6)
-            x = random.randint(1, 5)
+            m = self.rng.randint(2, 5)
+            b = self.rng.randint(1, 6)
+            x = self.rng.randint(1, 5)
             fx = m * x + b
 
             latex = f"\\text{{If }} f(x) = {m}x + {b}, \\text{{ find }} 2f({x}) + 3"
@@ -109,10 +105,10 @@ class FunctionsGenerator:
                 f"= {2 * fx} + 3 = {result}"
             ]
         else:  # composition
-            a = random.randint(2, 4)
-            b = random.randint(1, 5)
-            c = random.randint(1, 3)
-            x = random.randint(1, 4)
+            a = self.rng.randint(2, 4)
+            b = self.rng.randint(1, 5)
+            c = self.rng.randint(1, 3)
+            x = self.rng.randint(1, 4)
 
             gx = c * x
             fgx = a * gx + b
@@ -129,9 +125,9 @@ class FunctionsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: solve for function definition."""
-        x1, x2 = random.randint(1, 4), random.randint(5, 8)
-        m = random.randint(2, 5)
-        b = random.randint(1, 8)
+        x1, x2 = self.rng.randint(1, 4), self.rng.randint(5, 8)
+        m = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 8)
         y1, y2 = m * x1 + b, m * x2 + b
 
         latex = f"\\text{{If }} f({x1}) = {y1} \\text{{ and }} f({x2}) = {y2}, \\text{{ find }} f(x)"
@@ -6,9 +6,6 @@ Example: Graph y = 3x
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class GraphingProportionalRelationshipsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """
@@ -50,7 +46,7 @@ class GraphingProportionalRelationshipsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: identify if relationship is proportional."""
-        k = random.randint(2, 8)
+        k = self.rng.randint(2, 8)
 
         latex = f"\\text{{Is }} y = {k}x \\text{{ a proportional relationship?}}"
         solution = "\\text{Yes, it passes through the origin}"
@@ -69,8 +65,8 @@ class GraphingProportionalRelationshipsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: find constant of proportionality."""
-        k = random.randint(2, 10)
-        x = random.randint(2, 6)
+        k = self.rng.randint(2, 10)
+        x = self.rng.randint(2, 6)
         y = k * x
 
         latex = f"\\text{{A proportional relationship passes through }} ({x}, {y}). \\text{{ Find the constant of proportionality.}}"
@@ -90,7 +86,7 @@ class GraphingProportionalRelationshipsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: write equation from graph or table."""
-        k = random.randint(2, 8)
+        k = self.rng.randint(2, 8)
         points = [(i, k * i) for i in range(1, 4)]
 
         latex = f"\\text{{A graph passes through }} {points[0]}, {points[1]}, {points[2]}. \\text{{ Write the equation.}}"
@@ -110,8 +106,8 @@ class GraphingProportionalRelationshipsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: compare proportional relationships."""
-        k1 = random.randint(3, 8)
-        k2 = random.randint(2, k1 - 1)
+        k1 = self.rng.randint(3, 8)
+        k2 = self.rng.randint(2, k1 - 1)
 
         latex = f"\\text{{Which is steeper: }} y = {k1}x \\text{{ or }} y = {k2}x?"
         solution = f"y = {k1}x \\text{{ is steeper}}"
@@ -6,9 +6,6 @@ Example: Graph y = 2x + 3
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class GraphingSlopeInterceptFormGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -41,8 +37,8 @@ class GraphingSlopeInterceptFormGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: graph simple positive slope."""
-        m = random.randint(1, 4)
-        b = random.randint(1, 6)
+        m = self.rng.randint(1, 4)
+        b = self.rng.randint(1, 6)
 
         latex = f"\\text{{Graph }} y = {m}x + {b}"
         solution = f"\\text{{Start at (0, {b}), rise {m}, run 1}}"
@@ -56,8 +52,8 @@ class GraphingSlopeInterceptFormGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: graph negative slope."""
-        m = random.randint(-4, -1)
-        b = random.randint(2, 8)
+        m = self.rng.randint(-4, -1)
+        b = self.rng.randint(2, 8)
 
         latex = f"\\text{{Graph }} y = {m}x + {b}"
         solution = f"\\text{{Start at (0, {b}), down {abs(m)}, right 1}}"
@@ -71,11 +67,11 @@ class GraphingSlopeInterceptFormGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: fractional slope."""
-        num = random.choice([1, 2, 3])
-        den = random.choice([2, 3, 4])
+        num = self.rng.choice([1, 2, 3])
+        den = self.rng.choice([2, 3, 4])
         if num == den:
             den += 1
-        b = random.randint(1, 6)
+        b = self.rng.randint(1, 6)
 
         latex = f"\\text{{Graph }} y = \\frac{{{num}}}{{{den}}}x + {b}"
         solution = f"\\text{{Start at (0, {b}), rise {num}, run {den}}}"
@@ -89,10 +85,10 @@ class GraphingSlopeInterceptFormGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: find points on line."""
-        m = random.randint(2, 5)
-        b = random.randint(1, 8)
+        m = self.rng.randint(2, 5)
+        b = self.rng.randint(1, 8)
 
-        x1, x2 = random.randint(1, 4), random.randint(5, 8)
+        x1, x2 = self.rng.randint(1, 4), self.rng.randint(5, 8)
         y1, y2 = m * x1 + b, m * x2 + b
 
         latex = f"\\text{{Find two points on }} y = {m}x + {b}"
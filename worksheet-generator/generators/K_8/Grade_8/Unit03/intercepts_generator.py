@@ -6,9 +6,6 @@ Example: Find the intercepts of y = 2x + 6
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class InterceptsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -41,8 +37,8 @@ class InterceptsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: find y-intercept."""
-        m = random.randint(1, 6)
-        b = random.randint(1, 10)
+        m = self.rng.randint(1, 6)
+        b = self.rng.randint(1, 10)
 
         latex = f"\\text{{Find the y-intercept of }} y = {m}x + {b}"
         solution = f"(0, {b})"
@@ -56,8 +52,8 @@ class InterceptsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: find both intercepts."""
-        m = random.randint(1, 6)
-        b = random.randint(2, 12)
+        m = self.rng.randint(1, 6)
+        b = self.rng.randint(2, 12)
 
         x_int = -b / m if b % m == 0 else -b / m
         x_int_display = f"{-b // m}" if b % m == 0 else f"-\\frac{{{b}}}{{{m}}}"
@@ -74,9 +70,9 @@ class InterceptsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: find intercepts from standard form."""
-        a = random.randint(2, 6)
-        b = random.randint(2, 6)
-        c = random.randint(6, 20)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(6, 20)
 
         latex = f"\\text{{Find both intercepts of }} {a}x + {b}y = {c}"
         x_int = c / a
@@ -95,8 +91,8 @@ class InterceptsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: write equation given intercepts."""
-        x_int = random.randint(2, 8)
-        y_int = random.randint(2, 10)
+        x_int = self.rng.randint(2, 8)
+        y_int = self.rng.randint(2, 10)
 
         m = -y_int / x_int
         m_display = f"-\\frac{{{y_int}}}{{{x_int}}}" if y_int % x_int != 0 else f"{int(m)}"
@@ -6,9 +6,6 @@ Example: Identify the slope and y-intercept in y = 3x + 5
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class IntroToSlopeInterceptFormGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -41,8 +37,8 @@ class IntroToSlopeInterceptFormGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: identify slope and y-intercept."""
-        m = random.randint(1, 8)
-        b = random.randint(1, 10)
+        m = self.rng.randint(1, 8)
+        b = self.rng.randint(1, 10)
 
         latex = f"\\text{{Find the slope and y-intercept of }} y = {m}x + {b}"
         solution = f"\\text{{Slope: }} {m}, \\text{{ y-intercept: }} {b}"
@@ -56,8 +52,8 @@ class IntroToSlopeInterceptFormGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: identify slope/intercept with negative values."""
-        m = random.randint(-6, -1)
-        b = random.randint(-8, 8)
+        m = self.rng.randint(-6, -1)
+        b = self.rng.randint(-8, 8)
 
         b_str = f"+ {b}" if b >= 0 else f"- {abs(b)}"
         latex = f"\\text{{Find the slope and y-intercept of }} y = {m}x {b_str}"
@@ -72,8 +68,8 @@ class IntroToSlopeInterceptFormGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: identify from non-standard form."""
-        m = random.randint(2, 6)
-        b = random.randint(1, 10)
+        m = self.rng.randint(2, 6)
+        b = self.rng.randint(1, 10)
 
         # Present as x term after constant
         latex = f"\\text{{Write in slope-intercept form: }} y = {b} + {m}x"
@@ -88,9 +84,9 @@ class IntroToSlopeInterceptFormGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: convert from standard form."""
-        a = random.randint(2, 6)
-        b = random.randint(2, 6)
-        c = random.randint(6, 20)
+        a = self.rng.randint(2, 6)
+        b = self.rng.randint(2, 6)
+        c = self.rng.randint(6, 20)
 
         m = -a / b
         y_int = c / b
@@ -6,9 +6,6 @@ Example: A phone plan costs $30/month plus $0.10 per text. Write a function for
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class LinearModelsGenerator:
     """Generates linear models problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,8 +33,8 @@ class LinearModelsGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        rate = random.randint(5, 15)
-        initial = random.randint(10, 40)
+        rate = self.rng.randint(5, 15)
+        initial = self.rng.randint(10, 40)
 
         latex = f"\\text{{A savings account starts with $${initial} and grows by $${rate}/week. Write a function for the balance.}}"
         solution = f"B(w) = {rate}w + {initial}"
@@ -51,8 +47,8 @@ class LinearModelsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        base = random.randint(20, 50)
-        rate = random.randint(2, 8)
+        base = self.rng.randint(20, 50)
+        rate = self.rng.randint(2, 8)
 
         latex = f"\\text{{A gym charges $${base} to join plus $${rate}/month. Write a function for total cost after }} m \\text{{ months.}}"
         solution = f"C(m) = {rate}m + {base}"
@@ -65,9 +61,9 @@ class LinearModelsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        start_temp = random.randint(60, 80)
-        decrease = random.randint(2, 5)
-        hours = random.randint(3, 6)
+        start_temp = self.rng.randint(60, 80)
+        decrease = self.rng.randint(2, 5)
+        hours = self.rng.randint(3, 6)
         final_temp = start_temp - decrease * hours
 
         latex = f"\\text{{Temperature is {start_temp}°F and drops {decrease}°F/hour. What is the temperature after {hours} hours?}}"
@@ -81,8 +77,8 @@ class LinearModelsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        rate = random.randint(40, 70)
-        initial_dist = random.randint(100, 300)
+        rate = self.rng.randint(40, 70)
+        initial_dist = self.rng.randint(100, 300)
 
         latex = f"\\text{{A car is {initial_dist} miles away and travels toward you at {rate} mph. Write a function for distance from you.}}"
         solution = f"D(t) = {initial_dist} - {rate}t"
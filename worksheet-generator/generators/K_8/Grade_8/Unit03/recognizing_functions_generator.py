@@ -6,9 +6,6 @@ Example: Is this set of ordered pairs a function? {(1,2), (2,3), (1,4)}
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class RecognizingFunctionsGenerator:
     """Generates recognizing functions problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,20 +33,20 @@ class RecognizingFunctionsGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        is_function = random.choice([True, False])
+        is_function = self.rng.choice([True, False])
 
         if is_function:
             points = [(1, 2), (2, 4), (3, 6), (4, 8)]
-            random.shuffle(points)
+            self.rng.shuffle(points)
             points = points[:3]
             latex = f"\\text{{Is this a function? }} \\{{{points[0]}, {points[1]}, {points[2]}\\}}"
             solution = "\\text{Yes, each input has exactly one output}"
         else:
-            x_repeat = random.randint(1, 5)
-            y1, y2 = random.randint(1, 8), random.randint(9, 15)
-            other_point = (random.randint(6, 10), random.randint(1, 10))
+            x_repeat = self.rng.randint(1, 5)
+            y1, y2 = self.rng.randint(1, 8), self.rng.randint(9, 15)
+            other_point = (self.rng.randint(6, 10), self.rng.randint(1, 10))
             points = [(x_repeat, y1), (x_repeat, y2), other_point]
-            random.shuffle(points)
+            self.rng.shuffle(points)
             latex = f"\\text{{Is this a function? }} \\{{{points[0]}, {points[1]}, {points[2]}\\}}"
             solution = f"\\text{{No, }} x = {x_repeat} \\text{{ has two outputs}}"
 
@@ -62,8 +58,8 @@ class RecognizingFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        m = random.randint(2, 6)
-        b = random.randint(-5, 8)
+        m = self.rng.randint(2, 6)
+        b = self.rng.randint(-5, 8)
 
         b_str = f"+ {b}" if b >= 0 else f"- {abs(b)}"
         latex = f"\\text{{Is }} y = {m}x {b_str} \\text{{ a function?}}"
@@ -77,7 +73,7 @@ class RecognizingFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        problem_type = random.choice(['equation', 'table'])
+        problem_type = self.rng.choice(['equation', 'table'])
 
         if problem_type == 'equation':
             latex = f"\\text{{Is }} x = 5 \\text{{ a function of }} y?"
@@ -89,7 +85,7 @@ class RecognizingFunctionsGenerator:
             ]
         else:
             x_vals = [1, 2, 3, 4]
-            y_vals = [random.randint(2, 8) for _ in range(4)]
+            y_vals = [self.rng.randint(2, 8) for _ in range(4)]
 
             latex = f"\\text{{Is this table a function? x: }} {x_vals[0]}, {x_vals[1]}, {x_vals[2]}, {x_vals[3]}; \\text{{ y: }} {y_vals[0]}, {y_vals[1]}, {y_vals[2]}, {y_vals[3]}"
             solution = "\\text{Yes, each x has one y}"
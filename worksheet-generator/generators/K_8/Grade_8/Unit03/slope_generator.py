@@ -6,9 +6,6 @@ Example: Find the slope between (2, 3) and (5, 9)
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class SlopeGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -41,9 +37,9 @@ class SlopeGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: find slope from two points."""
-        x1, x2 = random.randint(1, 5), random.randint(6, 10)
-        m = random.randint(2, 6)
-        y1 = random.randint(1, 8)
+        x1, x2 = self.rng.randint(1, 5), self.rng.randint(6, 10)
+        m = self.rng.randint(2, 6)
+        y1 = self.rng.randint(1, 8)
         y2 = y1 + m * (x2 - x1)
 
         latex = f"\\text{{Find the slope between }} ({x1}, {y1}) \\text{{ and }} ({x2}, {y2})"
@@ -58,9 +54,9 @@ class SlopeGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: find slope with negative values."""
-        x1, x2 = random.randint(-5, 0), random.randint(1, 6)
-        m = random.randint(-4, -1)
-        y1 = random.randint(5, 15)
+        x1, x2 = self.rng.randint(-5, 0), self.rng.randint(1, 6)
+        m = self.rng.randint(-4, -1)
+        y1 = self.rng.randint(5, 15)
         y2 = y1 + m * (x2 - x1)
 
         latex = f"\\text{{Find the slope between }} ({x1}, {y1}) \\text{{ and }} ({x2}, {y2})"
@@ -75,13 +71,13 @@ class SlopeGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: fractional slopes."""
-        x1, x2 = random.randint(1, 4), random.randint(7, 12)
-        rise = random.choice([1, 2, 3, 5])
-        run = random.choice([2, 3, 4, 6])
+        x1, x2 = self.rng.randint(1, 4), self.rng.randint(7, 12)
+        rise = self.rng.choice([1, 2, 3, 5])
+        run = self.rng.choice([2, 3, 4, 6])
         if rise == run:
             run += 1
 
-        y1 = random.randint(2, 8)
+        y1 = self.rng.randint(2, 8)
         y2 = y1 + rise
         x2 = x1 + run
 
@@ -99,9 +95,9 @@ class SlopeGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: find missing coordinate given slope."""
-        m = random.randint(2, 5)
-        x1, y1 = random.randint(1, 5), random.randint(2, 10)
-        x2 = random.randint(7, 12)
+        m = self.rng.randint(2, 5)
+        x1, y1 = self.rng.randint(1, 5), self.rng.randint(2, 10)
+        x2 = self.rng.randint(7, 12)
         y2 = y1 + m * (x2 - x1)
 
         latex = f"\\text{{If the slope between }} ({x1}, {y1}) \\text{{ and }} ({x2}, y) \\text{{ is }} {m}, \\text{{ find }} y"
@@ -6,9 +6,6 @@ Example: Is (2, 5) a solution to y = 2x + 1?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class SolutionsToLinearEquationsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -41,14 +37,14 @@ class SolutionsToLinearEquationsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: check if point is solution."""
-        m = random.randint(1, 5)
-        b = random.randint(1, 8)
-        x = random.randint(1, 6)
+        m = self.rng.randint(1, 5)
+        b = self.rng.randint(1, 8)
+        x = self.rng.randint(1, 6)
         y = m * x + b
 
-        is_solution = random.choice([True, False])
+        is_solution = self.rng.choice([True, False])
         if not is_solution:
-            y += random.randint(1, 3)
+            y += self.rng.randint(1, 3)
 
         latex = f"\\text{{Is }} ({x}, {y}) \\text{{ a solution to }} y = {m}x + {b}?"
         solution = "\\text{Yes}" if is_solution else "\\text{No}"
@@ -65,18 +61,18 @@ class SolutionsToLinearEquationsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: find missing coordinate."""
-        m = random.randint(2, 6)
-        b = random.randint(-5, 8)
+        m = self.rng.randint(2, 6)
+        b = self.rng.randint(-5, 8)
 
-        if random.choice([True, False]):
-            x = random.randint(1, 8)
+        if self.rng.choice([True, False]):
+            x = self.rng.randint(1, 8)
             y = m * x + b
             latex = f"\\text{{Find y if }} ({x}, y) \\text{{ is on }} y = {m}x + {b}"
             solution = f"y = {y}"
             steps = [f"y = {m}({x}) + {b}", f"y = {y}"]
         else:
-            y = random.randint(5, 30)
-            x = (y - b) // m if (y - b) % m == 0 else random.randint(1, 8)
+            y = self.rng.randint(5, 30)
+            x = (y - b) // m if (y - b) % m == 0 else self.rng.randint(1, 8)
             y = m * x + b
             latex = f"\\text{{Find x if }} (x, {y}) \\text{{ is on }} y = {m}x + {b}"
             solution = f"x = {x}"
@@ -86,11 +82,11 @@ class SolutionsToLinearEquationsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: determine if multiple points are solutions."""
-        m = random.randint(2, 5)
-        b = random.randint(-3, 5)
+        m = self.rng.randint(2, 5)
+        b = self.rng.randint(-3, 5)
 
-        x1, x2 = random.randint(1, 5), random.randint(6, 10)
-        y1, y2 = m * x1 + b, m * x2 + b + random.randint(1, 3)
+        x1, x2 = self.rng.randint(1, 5), self.rng.randint(6, 10)
+        y1, y2 = m * x1 + b, m * x2 + b + self.rng.randint(1, 3)
 
         latex = f"\\text{{Which points are on }} y = {m}x + {b}: ({x1}, {y1}) \\text{{ or }} ({x2}, {y2})?"
         solution = f"({x1}, {y1})"
@@ -104,8 +100,8 @@ class SolutionsToLinearEquationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: work backwards from solution."""
-        x, y = random.randint(2, 8), random.randint(10, 30)
-        m = random.randint(2, 5)
+        x, y = self.rng.randint(2, 8), self.rng.randint(10, 30)
+        m = self.rng.randint(2, 5)
         b = y - m * x
 
         latex = f"\\text{{If }} ({x}, {y}) \\text{{ is on }} y = {m}x + b, \\text{{ find }} b"
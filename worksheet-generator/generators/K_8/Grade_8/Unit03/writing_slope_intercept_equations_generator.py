@@ -6,9 +6,6 @@ Example: Write an equation with slope 3 and y-intercept 5
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class WritingSlopeInterceptEquationsGenerator:
 
     def __init__(self, seed=None):
         """Initialize the generator."""
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         """Generate worksheet problems."""
@@ -41,8 +37,8 @@ class WritingSlopeInterceptEquationsGenerator:
 
     def _generate_easy(self) -> Equation:
         """Generate easy problems: given slope and y-intercept."""
-        m = random.randint(1, 8)
-        b = random.randint(1, 10)
+        m = self.rng.randint(1, 8)
+        b = self.rng.randint(1, 10)
 
         latex = f"\\text{{Write an equation with slope }} {m} \\text{{ and y-intercept }} {b}"
         solution = f"y = {m}x + {b}"
@@ -56,9 +52,9 @@ class WritingSlopeInterceptEquationsGenerator:
 
     def _generate_medium(self) -> Equation:
         """Generate medium problems: given two points."""
-        x1, x2 = random.randint(1, 5), random.randint(6, 10)
-        m = random.randint(2, 5)
-        y1 = random.randint(3, 12)
+        x1, x2 = self.rng.randint(1, 5), self.rng.randint(6, 10)
+        m = self.rng.randint(2, 5)
+        y1 = self.rng.randint(3, 12)
         y2 = y1 + m * (x2 - x1)
         b = y1 - m * x1
 
@@ -75,9 +71,9 @@ class WritingSlopeInterceptEquationsGenerator:
 
     def _generate_hard(self) -> Equation:
         """Generate hard problems: given point and slope."""
-        x = random.randint(1, 8)
-        y = random.randint(5, 20)
-        m = random.randint(-4, 6)
+        x = self.rng.randint(1, 8)
+        y = self.rng.randint(5, 20)
+        m = self.rng.randint(-4, 6)
         if m == 0:
             m = 1
         b = y - m * x
@@ -97,12 +93,12 @@ class WritingSlopeInterceptEquationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         """Generate challenge problems: parallel or perpendicular lines."""
-        problem_type = random.choice(['parallel', 'perpendicular'])
+        problem_type = self.rng.choice(['parallel', 'perpendicular'])
 
-        m1 = random.randint(2, 6)
-        b1 = random.randint(1, 8)
-        x = random.randint(1, 6)
-        y = random.randint(5, 15)
+        m1 = self.rng.randint(2, 6)
+        b1 = self.rng.randint(1, 8)
+        x = self.rng.randint(1, 6)
+        y = self.rng.randint(5, 15)
 
         if problem_type == 'parallel':
             m2 = m1
@@ -6,9 +6,6 @@ Example: Does (2, 3) satisfy both y = x + 1 and y = 2x - 1?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class IntroToSystemsOfEquationsGenerator:
     """Generates intro to systems of equations problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,8 +33,8 @@ class IntroToSystemsOfEquationsGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x, y = random.randint(1, 6), random.randint(2, 10)
-        m1, b1 = random.randint(1, 4), y - random.randint(1, 4) * x
+        x, y = self.rng.randint(1, 6), self.rng.randint(2, 10)
+        m1, b1 = self.rng.randint(1, 4), y - self.rng.randint(1, 4) * x
         y_check = m1 * x + b1
 
         is_solution = (y == y_check)
@@ -54,9 +50,9 @@ class IntroToSystemsOfEquationsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x, y = random.randint(1, 6), random.randint(5, 15)
-        m1, b1 = random.randint(1, 3), y - random.randint(1, 3) * x
-        m2, b2 = random.randint(2, 5), y - random.randint(2, 5) * x
+        x, y = self.rng.randint(1, 6), self.rng.randint(5, 15)
+        m1, b1 = self.rng.randint(1, 3), y - self.rng.randint(1, 3) * x
+        m2, b2 = self.rng.randint(2, 5), y - self.rng.randint(2, 5) * x
 
         y1 = m1 * x + b1
         y2 = m2 * x + b2
@@ -74,9 +70,9 @@ class IntroToSystemsOfEquationsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x = random.randint(2, 6)
-        m1, m2 = random.randint(2, 5), random.randint(1, 4)
-        b1, b2 = random.randint(1, 8), random.randint(3, 10)
+        x = self.rng.randint(2, 6)
+        m1, m2 = self.rng.randint(2, 5), self.rng.randint(1, 4)
+        b1, b2 = self.rng.randint(1, 8), self.rng.randint(3, 10)
         y = m1 * x + b1
 
         latex = f"\\text{{Find y if }} ({x}, y) \\text{{ is a solution to }} y = {m1}x + {b1}"
@@ -89,8 +85,8 @@ class IntroToSystemsOfEquationsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        m1, m2 = random.randint(2, 5), random.randint(1, 4)
-        b1, b2 = random.randint(1, 6), random.randint(5, 12)
+        m1, m2 = self.rng.randint(2, 5), self.rng.randint(1, 4)
+        b1, b2 = self.rng.randint(1, 6), self.rng.randint(5, 12)
 
         # Find intersection
         if m1 != m2:
@@ -6,9 +6,6 @@ Example: Is y = x² a linear or nonlinear function?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class LinearAndNonlinearFunctionsGenerator:
     """Generates linear and nonlinear functions problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,16 +33,16 @@ class LinearAndNonlinearFunctionsGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        is_linear = random.choice([True, False])
+        is_linear = self.rng.choice([True, False])
 
         if is_linear:
-            m = random.randint(1, 6)
-            b = random.randint(1, 10)
+            m = self.rng.randint(1, 6)
+            b = self.rng.randint(1, 10)
             latex = f"\\text{{Is }} y = {m}x + {b} \\text{{ linear or nonlinear?}}"
             solution = "\\text{Linear}"
             steps = ["\\text{Highest power of x is 1}", solution]
         else:
-            exp = random.choice([2, 3])
+            exp = self.rng.choice([2, 3])
             latex = f"\\text{{Is }} y = x^{{{exp}}} \\text{{ linear or nonlinear?}}"
             solution = "\\text{Nonlinear}"
             steps = [f"\\text{{Highest power of x is {exp}}}", solution]
@@ -55,10 +51,10 @@ class LinearAndNonlinearFunctionsGenerator:
 
     def _generate_medium(self) -> Equation:
         x_vals = [0, 1, 2, 3]
-        is_linear = random.choice([True, False])
+        is_linear = self.rng.choice([True, False])
 
         if is_linear:
-            m, b = random.randint(2, 5), random.randint(1, 6)
+            m, b = self.rng.randint(2, 5), self.rng.randint(1, 6)
             y_vals = [m * x + b for x in x_vals]
             latex = f"\\text{{Is this table linear? x: }} {x_vals}; \\text{{ y: }} {y_vals}"
             solution = "\\text{Linear (constant rate of change)}"
@@ -71,7 +67,7 @@ class LinearAndNonlinearFunctionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        func_type = random.choice(['abs', 'reciprocal', 'linear_complex'])
+        func_type = self.rng.choice(['abs', 'reciprocal', 'linear_complex'])
 
         if func_type == 'abs':
             latex = "\\text{Is } y = |x| \\text{ linear or nonlinear?}"
@@ -82,7 +78,7 @@ class LinearAndNonlinearFunctionsGenerator:
             solution = "\\text{Nonlinear}"
             steps = ["\\text{Reciprocal function is not linear}", solution]
         else:
-            m, b, c = random.randint(2, 5), random.randint(1, 4), random.randint(1, 6)
+            m, b, c = self.rng.randint(2, 5), self.rng.randint(1, 4), self.rng.randint(1, 6)
             latex = f"\\text{{Is }} y = {m}(x + {b}) - {c} \\text{{ linear or nonlinear?}}"
             solution = "\\text{Linear}"
             steps = [f"y = {m}(x + {b}) - {c} = {m}x + {m * b - c}", "\\text{Linear}"]
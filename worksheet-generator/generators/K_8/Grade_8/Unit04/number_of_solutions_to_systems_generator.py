@@ -6,9 +6,6 @@ Example: How many solutions: y = 2x + 1, y = 2x + 3?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class NumberOfSolutionsToSystemsGenerator:
     """Generates number of solutions to systems problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,20 +33,20 @@ class NumberOfSolutionsToSystemsGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        solution_type = random.choice(['one', 'none', 'infinite'])
+        solution_type = self.rng.choice(['one', 'none', 'infinite'])
 
         if solution_type == 'one':
-            m1, m2 = random.randint(2, 5), random.randint(-3, -1)
-            b1, b2 = random.randint(1, 6), random.randint(3, 8)
+            m1, m2 = self.rng.randint(2, 5), self.rng.randint(-3, -1)
+            b1, b2 = self.rng.randint(1, 6), self.rng.randint(3, 8)
             latex = f"\\text{{How many solutions: }} y = {m1}x + {b1}, y = {m2}x + {b2}?"
             solution = "\\text{One solution (different slopes)}"
         elif solution_type == 'none':
-            m = random.randint(2, 6)
-            b1, b2 = random.randint(1, 5), random.randint(7, 12)
+            m = self.rng.randint(2, 6)
+            b1, b2 = self.rng.randint(1, 5), self.rng.randint(7, 12)
             latex = f"\\text{{How many solutions: }} y = {m}x + {b1}, y = {m}x + {b2}?"
             solution = "\\text{No solution (parallel lines)}"
         else:
-            m, b = random.randint(2, 6), random.randint(1, 8)
+            m, b = self.rng.randint(2, 6), self.rng.randint(1, 8)
             latex = f"\\text{{How many solutions: }} y = {m}x + {b}, y = {m}x + {b}?"
             solution = "\\text{Infinitely many solutions (same line)}"
 
@@ -62,13 +58,13 @@ class NumberOfSolutionsToSystemsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        solution_type = random.choice(['one', 'none', 'infinite'])
+        solution_type = self.rng.choice(['one', 'none', 'infinite'])
 
         if solution_type == 'one':
-            m1, m2 = random.randint(2, 5), random.randint(1, 4)
+            m1, m2 = self.rng.randint(2, 5), self.rng.randint(1, 4)
             while m1 == m2:
-                m2 = random.randint(1, 4)
-            b1, b2 = random.randint(-3, 5), random.randint(-2, 6)
+                m2 = self.rng.randint(1, 4)
+            b1, b2 = self.rng.randint(-3, 5), self.rng.randint(-2, 6)
 
             b1_str = f"+ {b1}" if b1 >= 0 else f"- {abs(b1)}"
             b2_str = f"+ {b2}" if b2 >= 0 else f"- {abs(b2)}"
@@ -77,12 +73,12 @@ class NumberOfSolutionsToSystemsGenerator:
             solution = "\\text{One solution}"
             steps = [f"\\text{{Slopes different: }} {m1} \\neq {m2}", solution]
         elif solution_type == 'none':
-            m, b1, b2 = random.randint(2, 6), random.randint(1, 5), random.randint(7, 12)
+            m, b1, b2 = self.rng.randint(2, 6), self.rng.randint(1, 5), self.rng.randint(7, 12)
             latex = f"\\text{{How many solutions: }} y = {m}x + {b1}, y = {m}x + {b2}?"
             solution = "\\text{No solution}"
             steps = [f"\\text{{Same slope, different intercepts}}", solution]
         else:
-            m, b = random.randint(2, 6), random.randint(1, 8)
+            m, b = self.rng.randint(2, 6), self.rng.randint(1, 8)
             # Same line in different form
             a, c = m, b
             latex = f"\\text{{How many solutions: }} y = {m}x + {b}, y = {a}x + {c}?"
@@ -92,11 +88,11 @@ class NumberOfSolutionsToSystemsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        solution_type = random.choice(['one', 'none', 'infinite'])
+        solution_type = self.rng.choice(['one', 'none', 'infinite'])
 
         if solution_type == 'one':
-            a1, b1, c1 = random.randint(2, 4), random.randint(2, 4), random.randint(8, 16)
-            a2, b2, c2 = random.randint(1, 3), random.randint(3, 5), random.randint(10, 18)
+            a1, b1, c1 = self.rng.randint(2, 4), self.rng.randint(2, 4), self.rng.randint(8, 16)
+            a2, b2, c2 = self.rng.randint(1, 3), self.rng.randint(3, 5), self.rng.randint(10, 18)
 
             latex = f"\\text{{How many solutions: }} {a1}x + {b1}y = {c1}, {a2}x + {b2}y = {c2}?"
 
@@ -109,14 +105,14 @@ class NumberOfSolutionsToSystemsGenerator:
             else:
                 solution = "\\text{Check slopes}"
         elif solution_type == 'none':
-            a, b = random.randint(2, 4), random.randint(2, 4)
-            c1, c2 = random.randint(8, 12), random.randint(15, 20)
+            a, b = self.rng.randint(2, 4), self.rng.randint(2, 4)
+            c1, c2 = self.rng.randint(8, 12), self.rng.randint(15, 20)
 
             latex = f"\\text{{How many solutions: }} {a}x + {b}y = {c1}, {a}x + {b}y = {c2}?"
             solution = "\\text{No solution (parallel)}"
         else:
-            a, b, c = random.randint(2, 4), random.randint(2, 4), random.randint(10, 16)
-            mult = random.randint(2, 3)
+            a, b, c = self.rng.randint(2, 4), self.rng.randint(2, 4), self.rng.randint(10, 16)
+            mult = self.rng.randint(2, 3)
 
             latex = f"\\text{{How many solutions: }} {a}x + {b}y = {c}, {a * mult}x + {b * mult}y = {c * mult}?"
             solution = "\\text{Infinitely many (same line)}"
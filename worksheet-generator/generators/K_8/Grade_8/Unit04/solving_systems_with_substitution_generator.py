@@ -6,9 +6,6 @@ Example: Solve: y = 2x + 1, y = x + 3
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class SolvingSystemsWithSubstitutionGenerator:
     """Generates solving systems with substitution problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,9 +33,9 @@ class SolvingSystemsWithSubstitutionGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x = random.randint(1, 6)
-        m1, m2 = random.randint(1, 4), random.randint(2, 5)
-        b = random.randint(1, 8)
+        x = self.rng.randint(1, 6)
+        m1, m2 = self.rng.randint(1, 4), self.rng.randint(2, 5)
+        b = self.rng.randint(1, 8)
         y = m1 * x + b
         c = y - m2 * x
 
@@ -56,11 +52,11 @@ class SolvingSystemsWithSubstitutionGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x, y = random.randint(2, 6), random.randint(5, 15)
-        a, b, c = random.randint(2, 4), random.randint(1, 3), random.randint(2, 5)
+        x, y = self.rng.randint(2, 6), self.rng.randint(5, 15)
+        a, b, c = self.rng.randint(2, 4), self.rng.randint(1, 3), self.rng.randint(2, 5)
 
         # y = mx + b format for first equation
-        m1 = random.randint(2, 5)
+        m1 = self.rng.randint(2, 5)
         b1 = y - m1 * x
 
         # ax + by = c format for second equation
@@ -79,8 +75,8 @@ class SolvingSystemsWithSubstitutionGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x, y = random.randint(1, 6), random.randint(3, 12)
-        a, b, c, d = random.randint(2, 4), random.randint(2, 4), random.randint(1, 3), random.randint(2, 5)
+        x, y = self.rng.randint(1, 6), self.rng.randint(3, 12)
+        a, b, c, d = self.rng.randint(2, 4), self.rng.randint(2, 4), self.rng.randint(1, 3), self.rng.randint(2, 5)
 
         val1 = a * x + b * y
         val2 = c * x + d * y
@@ -97,8 +93,8 @@ class SolvingSystemsWithSubstitutionGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        x, y = random.randint(2, 5), random.randint(4, 10)
-        a, b = random.randint(2, 4), random.randint(2, 4)
+        x, y = self.rng.randint(2, 5), self.rng.randint(4, 10)
+        a, b = self.rng.randint(2, 4), self.rng.randint(2, 4)
 
         # Create system with fractions
         val1 = a * x - b * y
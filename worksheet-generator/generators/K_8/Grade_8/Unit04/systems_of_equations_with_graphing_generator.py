@@ -6,9 +6,6 @@ Example: Solve by graphing: y = 2x + 1 and y = -x + 4
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class SystemsOfEquationsWithGraphingGenerator:
     """Generates systems with graphing problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,9 +33,9 @@ class SystemsOfEquationsWithGraphingGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x = random.randint(1, 5)
-        m1, m2 = random.randint(1, 3), random.randint(-3, -1)
-        b1 = random.randint(1, 6)
+        x = self.rng.randint(1, 5)
+        m1, m2 = self.rng.randint(1, 3), self.rng.randint(-3, -1)
+        b1 = self.rng.randint(1, 6)
         y = m1 * x + b1
         b2 = y - m2 * x
 
@@ -54,9 +50,9 @@ class SystemsOfEquationsWithGraphingGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x = random.randint(2, 6)
-        m1, m2 = random.randint(2, 5), random.randint(-4, -1)
-        b1, b2 = random.randint(1, 8), random.randint(5, 12)
+        x = self.rng.randint(2, 6)
+        m1, m2 = self.rng.randint(2, 5), self.rng.randint(-4, -1)
+        b1, b2 = self.rng.randint(1, 8), self.rng.randint(5, 12)
         y = m1 * x + b1
 
         # Adjust b2 so they intersect at integer point
@@ -76,11 +72,11 @@ class SystemsOfEquationsWithGraphingGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        m1, m2 = random.randint(2, 5), random.randint(2, 5)
+        m1, m2 = self.rng.randint(2, 5), self.rng.randint(2, 5)
 
         if m1 == m2:
             # Parallel lines - no solution
-            b1, b2 = random.randint(2, 6), random.randint(8, 12)
+            b1, b2 = self.rng.randint(2, 6), self.rng.randint(8, 12)
             latex = f"\\text{{Solve: }} y = {m1}x + {b1}, y = {m2}x + {b2}"
             solution = "\\text{No solution (parallel lines)}"
             steps = [
@@ -89,8 +85,8 @@ class SystemsOfEquationsWithGraphingGenerator:
                 solution
             ]
         else:
-            x = random.randint(1, 5)
-            b1 = random.randint(1, 8)
+            x = self.rng.randint(1, 5)
+            b1 = self.rng.randint(1, 8)
             y = m1 * x + b1
             b2 = y - m2 * x
 
@@ -105,9 +101,9 @@ class SystemsOfEquationsWithGraphingGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        a, b, c = random.randint(2, 4), random.randint(2, 4), random.randint(8, 16)
-        m = random.randint(2, 5)
-        d = random.randint(3, 8)
+        a, b, c = self.rng.randint(2, 4), self.rng.randint(2, 4), self.rng.randint(8, 16)
+        m = self.rng.randint(2, 5)
+        d = self.rng.randint(3, 8)
 
         latex = f"\\text{{Solve: }} {a}x + {b}y = {c}, y = {m}x + {d}"
         solution = "\\text{Convert to slope-intercept and graph}"
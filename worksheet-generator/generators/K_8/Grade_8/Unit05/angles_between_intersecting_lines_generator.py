@@ -6,9 +6,6 @@ Example: Two lines intersect. If one angle is 65°, find the vertical angle.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class AnglesBetweenIntersectingLinesGenerator:
     """Generates angles between intersecting lines problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,7 +33,7 @@ class AnglesBetweenIntersectingLinesGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        angle = random.randint(30, 80)
+        angle = self.rng.randint(30, 80)
 
         latex = f"\\text{{Two lines intersect forming a }} {angle}° \\text{{ angle. Find the vertical angle.}}"
         solution = f"{angle}°"
@@ -46,7 +42,7 @@ class AnglesBetweenIntersectingLinesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        angle = random.randint(40, 85)
+        angle = self.rng.randint(40, 85)
         supplementary = 180 - angle
 
         latex = f"\\text{{Two lines intersect. One angle is }} {angle}°. \\text{{ Find an adjacent angle.}}"
@@ -59,7 +55,7 @@ class AnglesBetweenIntersectingLinesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x = random.randint(15, 45)
+        x = self.rng.randint(15, 45)
         angle = 3 * x
 
         latex = f"\\text{{Two lines intersect. One angle is }} 3x° \\text{{ and its supplement is }} (180 - 3x)°. \\text{{ If }} x = {x}, \\text{{ find all angles.}}"
@@ -73,7 +69,7 @@ class AnglesBetweenIntersectingLinesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        x = random.randint(10, 30)
+        x = self.rng.randint(10, 30)
         angle1 = 2 * x + 10
         angle2 = 180 - angle1
 
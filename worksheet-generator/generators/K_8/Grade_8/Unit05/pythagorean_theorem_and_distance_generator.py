@@ -6,10 +6,7 @@ Example: Find distance between (1, 2) and (4, 6).
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class PythagoreanTheoremAndDistanceGenerator:
     """Generates Pythagorean theorem and distance problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -39,7 +35,7 @@ class PythagoreanTheoremAndDistanceGenerator:
 
     def _generate_easy(self) -> Equation:
         x1, y1 = 0, 0
-        x2, y2 = random.randint(3, 5), random.randint(4, 6)
+        x2, y2 = self.rng.randint(3, 5), self.rng.randint(4, 6)
         distance = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
 
         latex = f"\\text{{Find distance from }} ({x1}, {y1}) \\text{{ to }} ({x2}, {y2}) \\text{{ (nearest tenth).}}"
@@ -54,8 +50,8 @@ class PythagoreanTheoremAndDistanceGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x1, y1 = random.randint(1, 5), random.randint(1, 5)
-        x2, y2 = random.randint(6, 10), random.randint(6, 10)
+        x1, y1 = self.rng.randint(1, 5), self.rng.randint(1, 5)
+        x2, y2 = self.rng.randint(6, 10), self.rng.randint(6, 10)
         distance = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
 
         latex = f"\\text{{Find distance from }} ({x1}, {y1}) \\text{{ to }} ({x2}, {y2}).}}"
@@ -70,8 +66,8 @@ class PythagoreanTheoremAndDistanceGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x1, y1 = random.randint(-5, 0), random.randint(-5, 0)
-        x2, y2 = random.randint(3, 8), random.randint(3, 8)
+        x1, y1 = self.rng.randint(-5, 0), self.rng.randint(-5, 0)
+        x2, y2 = self.rng.randint(3, 8), self.rng.randint(3, 8)
         distance = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
 
         latex = f"\\text{{Find distance from }} ({x1}, {y1}) \\text{{ to }} ({x2}, {y2}).}}"
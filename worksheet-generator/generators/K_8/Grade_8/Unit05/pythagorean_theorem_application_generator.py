@@ -6,10 +6,7 @@ Example: A ladder is 10 ft long and 6 ft from wall. How high does it reach?
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class PythagoreanTheoremApplicationGenerator:
     """Generates Pythagorean theorem application problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -39,7 +35,7 @@ class PythagoreanTheoremApplicationGenerator:
 
     def _generate_easy(self) -> Equation:
         triples = [(3, 4, 5), (6, 8, 10), (5, 12, 13)]
-        a, b, c = random.choice(triples)
+        a, b, c = self.rng.choice(triples)
 
         latex = f"\\text{{A ladder is }} {c} \\text{{ ft long. It's }} {a} \\text{{ ft from the wall. How high does it reach?}}"
         solution = f"{b} \\text{{ ft}}"
@@ -53,8 +49,8 @@ class PythagoreanTheoremApplicationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        width = random.randint(6, 12)
-        height = random.randint(8, 16)
+        width = self.rng.randint(6, 12)
+        height = self.rng.randint(8, 16)
         diagonal = math.sqrt(width**2 + height**2)
 
         latex = f"\\text{{A TV screen is }} {width} \\text{{ in wide and }} {height} \\text{{ in tall. Find the diagonal (nearest tenth).}}"
@@ -69,8 +65,8 @@ class PythagoreanTheoremApplicationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        base = random.randint(10, 20)
-        height = random.randint(15, 25)
+        base = self.rng.randint(10, 20)
+        height = self.rng.randint(15, 25)
         distance = math.sqrt(base**2 + height**2)
 
         latex = f"\\text{{A kite is }} {height} \\text{{ m high. The string forms a right triangle with base }} {base} \\text{{ m. Find string length.}}"
@@ -85,7 +81,7 @@ class PythagoreanTheoremApplicationGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        side = random.randint(8, 15)
+        side = self.rng.randint(8, 15)
         diagonal = side * math.sqrt(2)
 
         latex = f"\\text{{A square has side length }} {side}. \\text{{ Find the diagonal (exact answer).}}"
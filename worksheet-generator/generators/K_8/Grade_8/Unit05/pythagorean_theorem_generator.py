@@ -6,10 +6,7 @@ Example: Find the hypotenuse if legs are 3 and 4.
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class PythagoreanTheoremGenerator:
     """Generates Pythagorean theorem problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -40,7 +36,7 @@ class PythagoreanTheoremGenerator:
     def _generate_easy(self) -> Equation:
         # Pythagorean triples
         triples = [(3, 4, 5), (5, 12, 13), (8, 15, 17), (6, 8, 10)]
-        a, b, c = random.choice(triples)
+        a, b, c = self.rng.choice(triples)
 
         latex = f"\\text{{Find the hypotenuse if legs are }} {a} \\text{{ and }} {b}."
         solution = f"c = {c}"
@@ -55,7 +51,7 @@ class PythagoreanTheoremGenerator:
 
     def _generate_medium(self) -> Equation:
         triples = [(3, 4, 5), (5, 12, 13), (8, 15, 17)]
-        a, b, c = random.choice(triples)
+        a, b, c = self.rng.choice(triples)
 
         # Find leg given hypotenuse and other leg
         latex = f"\\text{{Find leg }} b \\text{{ if }} a = {a} \\text{{ and }} c = {c}."
@@ -70,8 +66,8 @@ class PythagoreanTheoremGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        a = random.randint(5, 12)
-        b = random.randint(5, 12)
+        a = self.rng.randint(5, 12)
+        b = self.rng.randint(5, 12)
         c = math.sqrt(a**2 + b**2)
 
         latex = f"\\text{{Find hypotenuse (to nearest tenth) if legs are }} {a} \\text{{ and }} {b}."
@@ -87,7 +83,7 @@ class PythagoreanTheoremGenerator:
 
     def _generate_challenge(self) -> Equation:
         # Scaled Pythagorean triple
-        scale = random.randint(2, 4)
+        scale = self.rng.randint(2, 4)
         base_a, base_b, base_c = 3, 4, 5
         a, b, c = scale * base_a, scale * base_b, scale * base_c
 
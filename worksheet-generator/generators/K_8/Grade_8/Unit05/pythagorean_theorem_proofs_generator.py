@@ -6,9 +6,6 @@ Example: Verify that 5, 12, 13 forms a Pythagorean triple.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class PythagoreanTheoremProofsGenerator:
     """Generates Pythagorean theorem proofs problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -38,7 +34,7 @@ class PythagoreanTheoremProofsGenerator:
 
     def _generate_easy(self) -> Equation:
         triples = [(3, 4, 5), (5, 12, 13), (8, 15, 17)]
-        a, b, c = random.choice(triples)
+        a, b, c = self.rng.choice(triples)
 
         latex = f"\\text{{Verify that }} {a}, {b}, {c} \\text{{ is a Pythagorean triple.}}"
         solution = f"\\text{{Yes: }} {a}^2 + {b}^2 = {c}^2"
@@ -52,7 +48,7 @@ class PythagoreanTheoremProofsGenerator:
 
     def _generate_medium(self) -> Equation:
         # Not a Pythagorean triple
-        a, b = random.randint(4, 8), random.randint(6, 10)
+        a, b = self.rng.randint(4, 8), self.rng.randint(6, 10)
         c = a + b - 1  # Definitely not c²
 
         latex = f"\\text{{Is }} {a}, {b}, {c} \\text{{ a Pythagorean triple?}}"
@@ -68,11 +64,11 @@ class PythagoreanTheoremProofsGenerator:
     def _generate_hard(self) -> Equation:
         # Determine if triangle is right triangle
         triples = [(3, 4, 5), (5, 12, 13), (7, 24, 25)]
-        a, b, c = random.choice(triples)
+        a, b, c = self.rng.choice(triples)
 
         # Randomly permute to test understanding
         sides = [a, b, c]
-        random.shuffle(sides)
+        self.rng.shuffle(sides)
 
         latex = f"\\text{{Is a triangle with sides }} {sides[0]}, {sides[1]}, {sides[2]} \\text{{ a right triangle?}}"
         solution = "\\text{Yes}"
@@ -85,7 +81,7 @@ class PythagoreanTheoremProofsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        k = random.randint(2, 5)
+        k = self.rng.randint(2, 5)
         a, b, c = 3 * k, 4 * k, 5 * k
 
         latex = f"\\text{{Prove }} {a}, {b}, {c} \\text{{ is a Pythagorean triple.}}"
@@ -6,9 +6,6 @@ Example: Tickets cost $5 for adults, $3 for children. 100 tickets sold for $380.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class SystemsOfEquationsWordProblemsGenerator:
     """Generates systems of equations word problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,7 +33,7 @@ class SystemsOfEquationsWordProblemsGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x, y = random.randint(5, 15), random.randint(10, 20)
+        x, y = self.rng.randint(5, 15), self.rng.randint(10, 20)
         total = x + y
 
         latex = f"\\text{{Two numbers sum to }} {total}. \\text{{ One is }} {x}. \\text{{ Find the other.}}"
@@ -47,10 +43,10 @@ class SystemsOfEquationsWordProblemsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        adults = random.randint(10, 30)
-        children = random.randint(20, 40)
-        adult_price = random.randint(8, 12)
-        child_price = random.randint(3, 6)
+        adults = self.rng.randint(10, 30)
+        children = self.rng.randint(20, 40)
+        adult_price = self.rng.randint(8, 12)
+        child_price = self.rng.randint(3, 6)
 
         total_people = adults + children
         total_revenue = adults * adult_price + children * child_price
@@ -66,8 +62,8 @@ class SystemsOfEquationsWordProblemsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        nickels = random.randint(10, 25)
-        dimes = random.randint(15, 30)
+        nickels = self.rng.randint(10, 25)
+        dimes = self.rng.randint(15, 30)
         total_coins = nickels + dimes
         total_value = nickels * 5 + dimes * 10
 
@@ -82,8 +78,8 @@ class SystemsOfEquationsWordProblemsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        length = random.randint(15, 30)
-        width = random.randint(8, 15)
+        length = self.rng.randint(15, 30)
+        width = self.rng.randint(8, 15)
         perimeter = 2 * (length + width)
 
         latex = f"\\text{{A rectangle's length is }} {length - width} \\text{{ more than width. Perimeter is }} {perimeter}. \\text{{ Find dimensions.}}"
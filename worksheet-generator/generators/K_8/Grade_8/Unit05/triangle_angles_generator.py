@@ -6,9 +6,6 @@ Example: A triangle has angles 60°, 70°, and x°. Find x.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class TriangleAnglesGenerator:
     """Generates triangle angles problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,8 +33,8 @@ class TriangleAnglesGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        angle1 = random.randint(40, 70)
-        angle2 = random.randint(40, 70)
+        angle1 = self.rng.randint(40, 70)
+        angle2 = self.rng.randint(40, 70)
         angle3 = 180 - angle1 - angle2
 
         latex = f"\\text{{A triangle has angles }} {angle1}°, {angle2}°, \\text{{ and }} x°. \\text{{ Find }} x."
@@ -52,7 +48,7 @@ class TriangleAnglesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x = random.randint(15, 40)
+        x = self.rng.randint(15, 40)
         angle1 = 2 * x
         angle2 = 3 * x
         angle3 = 180 - angle1 - angle2
@@ -68,7 +64,7 @@ class TriangleAnglesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x = random.randint(10, 25)
+        x = self.rng.randint(10, 25)
         angle1 = x + 20
         angle2 = 2 * x
         angle3 = 180 - angle1 - angle2
@@ -85,7 +81,7 @@ class TriangleAnglesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        base_angle = random.randint(65, 75)
+        base_angle = self.rng.randint(65, 75)
         vertex_angle = 180 - 2 * base_angle
 
         latex = f"\\text{{An isosceles triangle has base angles of }} {base_angle}° \\text{{ each. Find the vertex angle.}}"
@@ -6,9 +6,6 @@ Example: Dilate (4, 6) by scale factor 2 from origin.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class DilationsGenerator:
     """Generates dilations problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,8 +33,8 @@ class DilationsGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x, y = random.randint(2, 6), random.randint(2, 6)
-        k = random.randint(2, 4)
+        x, y = self.rng.randint(2, 6), self.rng.randint(2, 6)
+        k = self.rng.randint(2, 4)
 
         latex = f"\\text{{Dilate }} ({x}, {y}) \\text{{ by scale factor }} {k} \\text{{ from origin.}}"
         solution = f"({k * x}, {k * y})"
@@ -50,8 +46,8 @@ class DilationsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x, y = random.randint(4, 12), random.randint(4, 12)
-        k = random.choice([0.5, 0.25])
+        x, y = self.rng.randint(4, 12), self.rng.randint(4, 12)
+        k = self.rng.choice([0.5, 0.25])
         k_frac = "\\frac{1}{2}" if k == 0.5 else "\\frac{1}{4}"
 
         latex = f"\\text{{Dilate }} ({x}, {y}) \\text{{ by scale factor }} {k_frac} \\text{{ from origin.}}"
@@ -64,8 +60,8 @@ class DilationsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x, y = random.randint(2, 5), random.randint(2, 5)
-        x2, y2 = random.randint(8, 15), random.randint(8, 15)
+        x, y = self.rng.randint(2, 5), self.rng.randint(2, 5)
+        x2, y2 = self.rng.randint(8, 15), self.rng.randint(8, 15)
 
         # Calculate scale factor
         k_x = x2 / x
@@ -87,8 +83,8 @@ class DilationsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        side = random.randint(4, 8)
-        k = random.randint(2, 4)
+        side = self.rng.randint(4, 8)
+        k = self.rng.randint(2, 4)
         new_side = side * k
 
         latex = f"\\text{{A square with side }} {side} \\text{{ is dilated by }} {k}. \\text{{ Find new side length.}}"
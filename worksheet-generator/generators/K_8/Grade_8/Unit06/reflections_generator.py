@@ -6,9 +6,6 @@ Example: Reflect (3, 4) over the x-axis.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class ReflectionsGenerator:
     """Generates reflections problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,7 +33,7 @@ class ReflectionsGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x, y = random.randint(2, 8), random.randint(2, 8)
+        x, y = self.rng.randint(2, 8), self.rng.randint(2, 8)
 
         latex = f"\\text{{Reflect }} ({x}, {y}) \\text{{ over the x-axis.}}"
         solution = f"({x}, {-y})"
@@ -49,7 +45,7 @@ class ReflectionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x, y = random.randint(2, 8), random.randint(2, 8)
+        x, y = self.rng.randint(2, 8), self.rng.randint(2, 8)
 
         latex = f"\\text{{Reflect }} ({x}, {y}) \\text{{ over the y-axis.}}"
         solution = f"({-x}, {y})"
@@ -61,7 +57,7 @@ class ReflectionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x, y = random.randint(2, 8), random.randint(2, 8)
+        x, y = self.rng.randint(2, 8), self.rng.randint(2, 8)
 
         latex = f"\\text{{Reflect }} ({x}, {y}) \\text{{ over the line }} y = x."
         solution = f"({y}, {x})"
@@ -73,7 +69,7 @@ class ReflectionsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        x, y = random.randint(2, 8), random.randint(2, 8)
+        x, y = self.rng.randint(2, 8), self.rng.randint(2, 8)
 
         latex = f"\\text{{Reflect }} ({x}, {y}) \\text{{ over the line }} y = -x."
         solution = f"({-y}, {-x})"
@@ -6,9 +6,6 @@ Example: Identify the transformation: translation, rotation, reflection, or dila
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class TransformationsIntroGenerator:
     """Generates transformations intro problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -38,7 +34,7 @@ class TransformationsIntroGenerator:
 
     def _generate_easy(self) -> Equation:
         transformations = ['translation', 'rotation', 'reflection', 'dilation']
-        transformation = random.choice(transformations)
+        transformation = self.rng.choice(transformations)
 
         descriptions = {
             'translation': "A figure slides 5 units right.",
@@ -6,9 +6,6 @@ Example: Translate point (2, 3) by (4, -1).
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class TranslationsGenerator:
     """Generates translations problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,8 +33,8 @@ class TranslationsGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        x, y = random.randint(1, 8), random.randint(1, 8)
-        dx, dy = random.randint(2, 5), random.randint(2, 5)
+        x, y = self.rng.randint(1, 8), self.rng.randint(1, 8)
+        dx, dy = self.rng.randint(2, 5), self.rng.randint(2, 5)
 
         latex = f"\\text{{Translate }} ({x}, {y}) \\text{{ by }} ({dx}, {dy})."
         solution = f"({x + dx}, {y + dy})"
@@ -51,8 +47,8 @@ class TranslationsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        x, y = random.randint(-3, 3), random.randint(-3, 3)
-        dx, dy = random.randint(-4, 4), random.randint(-4, 4)
+        x, y = self.rng.randint(-3, 3), self.rng.randint(-3, 3)
+        dx, dy = self.rng.randint(-4, 4), self.rng.randint(-4, 4)
 
         dx_str = f"+{dx}" if dx >= 0 else str(dx)
         dy_str = f"+{dy}" if dy >= 0 else str(dy)
@@ -67,8 +63,8 @@ class TranslationsGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        x, y = random.randint(1, 6), random.randint(1, 6)
-        x2, y2 = random.randint(7, 12), random.randint(7, 12)
+        x, y = self.rng.randint(1, 6), self.rng.randint(1, 6)
+        x2, y2 = self.rng.randint(7, 12), self.rng.randint(7, 12)
         dx, dy = x2 - x, y2 - y
 
         latex = f"\\text{{What translation maps }} ({x}, {y}) \\text{{ to }} ({x2}, {y2})?"
@@ -83,7 +79,7 @@ class TranslationsGenerator:
 
     def _generate_challenge(self) -> Equation:
         points = [(1, 2), (3, 4), (5, 2)]
-        dx, dy = random.randint(2, 5), random.randint(-3, -1)
+        dx, dy = self.rng.randint(2, 5), self.rng.randint(-3, -1)
         translated = [(x + dx, y + dy) for x, y in points]
 
         latex = f"\\text{{Translate triangle with vertices }} {points[0]}, {points[1]}, {points[2]} \\text{{ by }} ({dx}, {dy})."
@@ -6,10 +6,7 @@ Example: Find the volume of a cylinder with radius 3 and height 5.
 
 import random
 from typing import List
-import sys
-import os
 import math
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -17,8 +14,7 @@ class VolumeGenerator:
     """Generates volume problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -38,7 +34,7 @@ class VolumeGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        l, w, h = random.randint(3, 8), random.randint(3, 8), random.randint(3, 8)
+        l, w, h = self.rng.randint(3, 8), self.rng.randint(3, 8), self.rng.randint(3, 8)
         volume = l * w * h
 
         latex = f"\\text{{Find volume of rectangular prism: length }} {l}, \\text{{ width }} {w}, \\text{{ height }} {h}."
@@ -52,8 +48,8 @@ class VolumeGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        r = random.randint(2, 6)
-        h = random.randint(4, 10)
+        r = self.rng.randint(2, 6)
+        h = self.rng.randint(4, 10)
         volume = math.pi * r**2 * h
 
         latex = f"\\text{{Find volume of cylinder: radius }} {r}, \\text{{ height }} {h}. \\text{{ Use }} \\pi \\approx 3.14."
@@ -67,7 +63,7 @@ class VolumeGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        s = random.randint(4, 10)
+        s = self.rng.randint(4, 10)
         volume = s ** 3
 
         latex = f"\\text{{Find volume of cube with side length }} {s}."
@@ -81,7 +77,7 @@ class VolumeGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        r = random.randint(3, 6)
+        r = self.rng.randint(3, 6)
         volume = (4/3) * math.pi * r**3
 
         latex = f"\\text{{Find volume of sphere with radius }} {r}."
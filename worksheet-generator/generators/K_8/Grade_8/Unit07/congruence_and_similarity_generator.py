@@ -6,9 +6,6 @@ Example: Are two triangles congruent or similar?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class CongruenceAndSimilarityGenerator:
     """Generates congruence and similarity problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -44,8 +40,8 @@ class CongruenceAndSimilarityGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        k = random.randint(2, 4)
-        side1 = random.randint(3, 8)
+        k = self.rng.randint(2, 4)
+        side1 = self.rng.randint(3, 8)
         side2 = k * side1
 
         latex = f"\\text{{Triangle 1 has side }} {side1}. \\text{{ Triangle 2 has corresponding side }} {side2}. \\text{{ Are they similar?}}"
@@ -71,8 +67,8 @@ class CongruenceAndSimilarityGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        side = random.randint(5, 10)
-        k = random.randint(2, 4)
+        side = self.rng.randint(5, 10)
+        k = self.rng.randint(2, 4)
         new_side = side * k
 
         latex = f"\\text{{If two similar figures have scale factor }} {k}, \\text{{ and one side is }} {side}, \\text{{ find corresponding side.}}"
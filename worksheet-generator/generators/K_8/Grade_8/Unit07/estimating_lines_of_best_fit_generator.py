@@ -6,9 +6,6 @@ Example: Given points, estimate the line of best fit.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class EstimatingLinesOfBestFitGenerator:
     """Generates estimating lines of best fit problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -44,8 +40,8 @@ class EstimatingLinesOfBestFitGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        m = random.randint(2, 5)
-        b = random.randint(3, 8)
+        m = self.rng.randint(2, 5)
+        b = self.rng.randint(3, 8)
 
         latex = f"\\text{{Data points roughly follow }} y = {m}x + {b}. \\text{{ Estimate }} y \\text{{ when }} x = 10."
         y = m * 10 + b
@@ -71,9 +67,9 @@ class EstimatingLinesOfBestFitGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        m = random.randint(2, 4)
-        b = random.randint(5, 10)
-        x = random.randint(15, 25)
+        m = self.rng.randint(2, 4)
+        b = self.rng.randint(5, 10)
+        x = self.rng.randint(15, 25)
 
         latex = f"\\text{{Line of best fit: }} y = {m}x + {b}. \\text{{ Predict }} y \\text{{ when }} x = {x}."
         y = m * x + b
@@ -6,9 +6,6 @@ Example: Does this scatter plot show positive, negative, or no correlation?
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class IntroductionToScatterPlotsGenerator:
     """Generates introduction to scatter plots problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,7 +33,7 @@ class IntroductionToScatterPlotsGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        correlation = random.choice(['positive', 'negative', 'no'])
+        correlation = self.rng.choice(['positive', 'negative', 'no'])
 
         descriptions = {
             'positive': "As hours studied increases, test scores increase.",
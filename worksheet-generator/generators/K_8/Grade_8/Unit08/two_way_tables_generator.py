@@ -6,9 +6,6 @@ Example: Given a two-way table, find the relative frequency.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 
@@ -16,8 +13,7 @@ class TwoWayTablesGenerator:
     """Generates two-way tables problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str, num_problems: int) -> List[Equation]:
         problems = []
@@ -37,10 +33,10 @@ class TwoWayTablesGenerator:
             return self._generate_challenge()
 
     def _generate_easy(self) -> Equation:
-        boys_like = random.randint(15, 25)
-        boys_dislike = random.randint(10, 15)
-        girls_like = random.randint(20, 30)
-        girls_dislike = random.randint(8, 12)
+        boys_like = self.rng.randint(15, 25)
+        boys_dislike = self.rng.randint(10, 15)
+        girls_like = self.rng.randint(20, 30)
+        girls_dislike = self.rng.randint(8, 12)
 
         total_like = boys_like + girls_like
         total = boys_like + boys_dislike + girls_like + girls_dislike
@@ -55,7 +51,7 @@ class TwoWayTablesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='easy')
 
     def _generate_medium(self) -> Equation:
-        a, b, c, d = random.randint(20, 40), random.randint(15, 30), random.randint(25, 45), random.randint(10, 25)
+        a, b, c, d = self.rng.randint(20, 40), self.rng.randint(15, 30), self.rng.randint(25, 45), self.rng.randint(10, 25)
         total = a + b + c + d
 
         latex = f"\\text{{Two-way table with values: }} {a}, {b}, {c}, {d}. \\text{{ Find relative frequency of }} {a}."
@@ -69,10 +65,10 @@ class TwoWayTablesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='medium')
 
     def _generate_hard(self) -> Equation:
-        male_yes = random.randint(30, 50)
-        male_no = random.randint(20, 35)
-        female_yes = random.randint(40, 60)
-        female_no = random.randint(15, 30)
+        male_yes = self.rng.randint(30, 50)
+        male_no = self.rng.randint(20, 35)
+        female_yes = self.rng.randint(40, 60)
+        female_no = self.rng.randint(15, 30)
 
         total_yes = male_yes + female_yes
         total = male_yes + male_no + female_yes + female_no
@@ -89,10 +85,10 @@ class TwoWayTablesGenerator:
         return Equation(latex=latex, solution=solution, steps=steps, difficulty='hard')
 
     def _generate_challenge(self) -> Equation:
-        cat_indoor = random.randint(25, 40)
-        cat_outdoor = random.randint(15, 25)
-        dog_indoor = random.randint(30, 50)
-        dog_outdoor = random.randint(20, 35)
+        cat_indoor = self.rng.randint(25, 40)
+        cat_outdoor = self.rng.randint(15, 25)
+        dog_indoor = self.rng.randint(30, 50)
+        dog_outdoor = self.rng.randint(20, 35)
 
         total_cats = cat_indoor + cat_outdoor
         total = cat_indoor + cat_outdoor + dog_indoor + dog_outdoor
@@ -6,17 +6,13 @@ Note: K-2 generators do not use difficulty levels.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class CountingBeyond20Generator:
     """Generates counting beyond 20 problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str = None, num_problems: int = 8) -> List[Equation]:
         """Generate worksheet problems. Note: difficulty parameter is ignored for K-2."""
@@ -27,7 +23,7 @@ class CountingBeyond20Generator:
         return problems
 
     def _generate_problem(self) -> Equation:
-        num = random.randint(21, 30)
+        num = self.rng.randint(21, 30)
         latex = f"\text{{Count to }} {num}"
         solution = str(num)
         return Equation(latex=latex, solution=solution, steps=[f"{num}"])
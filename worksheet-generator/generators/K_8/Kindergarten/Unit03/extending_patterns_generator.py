@@ -6,17 +6,13 @@ Note: K-2 generators do not use difficulty levels.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class ExtendingPatternsGenerator:
     """Generates extending patterns problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str = None, num_problems: int = 8) -> List[Equation]:
         """Generate worksheet problems. Note: difficulty parameter is ignored for K-2."""
@@ -27,7 +23,7 @@ class ExtendingPatternsGenerator:
         return problems
 
     def _generate_problem(self) -> Equation:
-        elem1, elem2 = random.choice([('●', '○'), ('A', 'B'), ('△', '○')])
+        elem1, elem2 = self.rng.choice([('●', '○'), ('A', 'B'), ('△', '○')])
         latex = f"\text{{Continue: {elem1}, {elem2}, {elem1}, {elem2}, {elem1}, ___}}"
         solution = elem2
         return Equation(latex=latex, solution=solution, steps=[f"{elem1}, {elem2} pattern"])
@@ -6,17 +6,13 @@ Note: K-2 generators do not use difficulty levels.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class SubtractionUpTo5Generator:
     """Generates subtraction up to 5 problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str = None, num_problems: int = 8) -> List[Equation]:
         """Generate worksheet problems. Note: difficulty parameter is ignored for K-2."""
@@ -27,8 +23,8 @@ class SubtractionUpTo5Generator:
         return problems
 
     def _generate_problem(self) -> Equation:
-        a = random.randint(2, 5)
-        b = random.randint(1, a)
+        a = self.rng.randint(2, 5)
+        b = self.rng.randint(1, a)
         result = a - b
         latex = f"{a} - {b} = "
         solution = str(result)
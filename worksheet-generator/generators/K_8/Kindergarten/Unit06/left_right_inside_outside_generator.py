@@ -6,17 +6,13 @@ Note: K-2 generators do not use difficulty levels.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class LeftRightInsideOutsideGenerator:
     """Generates left, right, inside, outside problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str = None, num_problems: int = 8) -> List[Equation]:
         """Generate worksheet problems. Note: difficulty parameter is ignored for K-2."""
@@ -27,8 +23,8 @@ class LeftRightInsideOutsideGenerator:
         return problems
 
     def _generate_problem(self) -> Equation:
-        direction = random.choice(['left', 'right'])
-        obj = random.choice(['ball', 'car', 'toy', 'book'])
+        direction = self.rng.choice(['left', 'right'])
+        obj = self.rng.choice(['ball', 'car', 'toy', 'book'])
         latex = f"\text{{The {obj} is on the {direction}}}"
         solution = direction
         return Equation(latex=latex, solution=solution, steps=[f"on the {direction}"])
@@ -6,17 +6,13 @@ Note: K-2 generators do not use difficulty levels.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class DaysAndWeeksGenerator:
     """Generates days and weeks problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str = None, num_problems: int = 8) -> List[Equation]:
         """Generate worksheet problems. Note: difficulty parameter is ignored for K-2."""
@@ -28,7 +24,7 @@ class DaysAndWeeksGenerator:
 
     def _generate_problem(self) -> Equation:
         days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        day = random.choice(days)
+        day = self.rng.choice(days)
         latex = f"\text{{What day is {day}?}}"
         solution = day
         return Equation(latex=latex, solution=solution, steps=[day])
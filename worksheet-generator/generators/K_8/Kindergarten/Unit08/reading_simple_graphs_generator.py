@@ -6,17 +6,13 @@ Note: K-2 generators do not use difficulty levels.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class ReadingSimpleGraphsGenerator:
     """Generates reading simple graphs problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str = None, num_problems: int = 8) -> List[Equation]:
         """Generate worksheet problems. Note: difficulty parameter is ignored for K-2."""
@@ -27,8 +23,8 @@ class ReadingSimpleGraphsGenerator:
         return problems
 
     def _generate_problem(self) -> Equation:
-        item = random.choice(['apples', 'stars', 'hearts'])
-        count = random.randint(2, 5)
+        item = self.rng.choice(['apples', 'stars', 'hearts'])
+        count = self.rng.randint(2, 5)
         latex = f"\text{{The graph shows {count} {item}. How many {item}?}}"
         solution = str(count)
         return Equation(latex=latex, solution=solution, steps=[f"{count}"])
@@ -6,17 +6,13 @@ Note: K-2 generators do not use difficulty levels.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class SortingObjectsGenerator:
     """Generates sorting objects problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str = None, num_problems: int = 8) -> List[Equation]:
         """Generate worksheet problems. Note: difficulty parameter is ignored for K-2."""
@@ -27,8 +23,8 @@ class SortingObjectsGenerator:
         return problems
 
     def _generate_problem(self) -> Equation:
-        attribute = random.choice(['color', 'size', 'shape'])
-        obj = random.choice(['blocks', 'toys', 'buttons'])
+        attribute = self.rng.choice(['color', 'size', 'shape'])
+        obj = self.rng.choice(['blocks', 'toys', 'buttons'])
         latex = f"\text{{Sort the {obj} by {attribute}}}"
         solution = f"sorted by {attribute}"
         return Equation(latex=latex, solution=solution, steps=[f"group by {attribute}"])
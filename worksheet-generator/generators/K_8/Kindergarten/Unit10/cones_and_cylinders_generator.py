@@ -6,17 +6,13 @@ Note: K-2 generators do not use difficulty levels.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class ConesAndCylindersGenerator:
     """Generates cones and cylinders problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str = None, num_problems: int = 8) -> List[Equation]:
         """Generate worksheet problems. Note: difficulty parameter is ignored for K-2."""
@@ -27,8 +23,8 @@ class ConesAndCylindersGenerator:
         return problems
 
     def _generate_problem(self) -> Equation:
-        shape = random.choice(['cone', 'cylinder'])
-        example = random.choice(['ice cream cone', 'party hat']) if shape == 'cone' else random.choice(['can', 'tube'])
+        shape = self.rng.choice(['cone', 'cylinder'])
+        example = self.rng.choice(['ice cream cone', 'party hat']) if shape == 'cone' else self.rng.choice(['can', 'tube'])
         latex = f"\text{{Is a {example} shaped like a cone or cylinder?}}"
         solution = shape
         return Equation(latex=latex, solution=solution, steps=[shape])
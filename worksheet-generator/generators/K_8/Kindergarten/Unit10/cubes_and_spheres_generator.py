@@ -6,17 +6,13 @@ Note: K-2 generators do not use difficulty levels.
 
 import random
 from typing import List
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from equation_generator import Equation
 
 class CubesAndSpheresGenerator:
     """Generates cubes and spheres problems."""
 
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
+        self.rng = random.Random(seed)
 
     def generate_worksheet(self, difficulty: str = None, num_problems: int = 8) -> List[Equation]:
         """Generate worksheet problems. Note: difficulty parameter is ignored for K-2."""
@@ -27,8 +23,8 @@ class CubesAndSpheresGenerator:
         return problems
 
     def _generate_problem(self) -> Equation:
-        shape = random.choice(['cube', 'sphere'])
-        example = random.choice(['box', 'dice']) if shape == 'cube' else random.choice(['ball', 'marble'])
+        shape = self.rng.choice(['cube', 'sphere'])
+        example = self.rng.choice(['box', 'dice']) if shape == 'cube' else self.rng.choice(['ball', 'marble'])
         latex = f"\text{{Is a {example} shaped like a cube or sphere?}}"
         solution = shape
         return Equation(latex=latex, solution=solution, steps=[shape])
@@ -0,0 +1,21 @@
+"""
+Worksheet generators, organised as generators.<K_8|High_School>.<Subject>.<Unit>.<topic>_generator.
+
+Generator modules import the shared helpers (equation_generator, graphing_utils,
+numberline_utils, ...) as top-level modules from the worksheet-generator folder.
+This is the one place that puts that folder on sys.path; individual generator
+files must not modify sys.path themselves.
+
+To run a single generator's __main__ block, run it as a module from the
+worksheet-generator folder, e.g.:
+
+    python -m generators.K_8.Grade_3.Unit03.adding_fractions_generator
+"""
+
+import os
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
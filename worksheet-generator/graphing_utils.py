@@ -5,12 +5,13 @@ This module provides functions to create various types of graphs and coordinate
 for embedding in PDF worksheets.
 """
 
+from dataclasses import dataclass, replace
+
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.patches import FancyBboxPatch
 import numpy as np
-from io import BytesIO
-from PIL import Image
+from vector_graphics import DeferredGraphic, get_template, render_figure
 
 
 class CoordinatePlane:
@@ -59,8 +60,9 @@ class CoordinatePlane:
         fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
 
         # Set axis limits with padding
-        ax.set_xlim(self.x_min - 0.5, self.x_max + 0.5)
-        ax.set_ylim(self.y_min - 0.5, self.y_max + 0.5)
+        x_lim, y_lim = self.limits()
+        ax.set_xlim(*x_lim)
+        ax.set_ylim(*y_lim)
 
         # Draw axes
         ax.axhline(y=0, color='black', linewidth=1.5, zorder=3)
@@ -114,6 +116,15 @@ class CoordinatePlane:
 
         return fig, ax
 
+    def limits(self):
+        """
+        Axis limits of the plane's figure (the bounds plus padding).
+
+        Returns:
+            ((x_low, x_high), (y_low, y_high))
+        """
+        return (self.x_min - 0.5, self.x_max + 0.5), (self.y_min - 0.5, self.y_max + 0.5)
+
     def plot_point(self, ax, x, y, label=None, color='blue', size=50, marker='o'):
         """
         Plot a point on the coordinate plane.
@@ -323,27 +334,135 @@ class CoordinatePlane:
 
     def render_to_image(self, fig):
         """
-        Render the matplotlib figure to a PIL Image.
+        Render the matplotlib figure for embedding in a worksheet.
+
+        In vector mode (the default) this is a VectorGraphic drawn directly
+        onto the PDF; in raster mode it is a PIL Image (see vector_graphics).
 
         Args:
             fig: Matplotlib figure object
 
         Returns:
-            PIL Image object
+            VectorGraphic or PIL Image object
+        """
+        return render_figure(fig, bbox_inches='tight',
+                             facecolor='white', edgecolor='none')
+
+    def blank_image(self, figsize=(6, 6)):
+        """
+        Get the blank (empty) image of this coordinate plane.
+
+        The blank plane depends only on the plane settings and figure size, so it
+        is rendered once per process and the same object is shared by every
+        problem that uses it.
+
+        Args:
+            figsize: Tuple of (width, height) in inches
+
+        Returns:
+            Shared VectorGraphic or PIL Image object (do not modify)
         """
-        buf = BytesIO()
-        fig.savefig(buf, format='png', bbox_inches='tight',
-                   facecolor='white', edgecolor='none')
-        buf.seek(0)
-        img = Image.open(buf)
-        plt.close(fig)
-        return img
+        key = ('coordinate_plane', self.x_min, self.x_max, self.y_min, self.y_max,
+               self.grid, self.first_quadrant_only, self.tick_interval, tuple(figsize))
+
+        def build():
+            fig, ax = self.create_figure(figsize=figsize)
+            return self.render_to_image(fig)
+
+        return get_template(key, build)
+
+
+@dataclass(frozen=True)
+class PlaneSpec(DeferredGraphic):
+    """
+    A coordinate plane graph, described now and rendered when a page draws it.
+
+    Holds the CoordinatePlane settings and the drawing calls to make on it:
+    CoordinatePlane methods (point, line, parabola, shade, slope_triangle) and,
+    for anything else, matplotlib calls on the axes or figure. render() replays
+    them onto a fresh figure, exactly as if they had been made directly.
+
+    Usage:
+        spec = (PlaneSpec(-10, 10, -10, 10)
+                .point(2, 3, label="(2,3)", color='blue')
+                .line(slope=2, y_intercept=-1, color='red', linewidth=2))
+        problem.answer_image = spec  # Rendered by draw_graphic()
+    """
+    x_min: float = -8
+    x_max: float = 8
+    y_min: float = -8
+    y_max: float = 8
+    grid: bool = True
+    first_quadrant_only: bool = False
+    tick_interval: int = 1
+    figsize: tuple = (6, 6)
+    # savefig() arguments, as (name, value) pairs (CoordinatePlane.render_to_image's by default)
+    savefig: tuple = (('bbox_inches', 'tight'), ('facecolor', 'white'), ('edgecolor', 'none'))
+    # (target, method, args, kwargs) calls, target being 'plane', 'ax' or 'fig'
+    elements: tuple = ()
+
+    def _call(self, target: str, method: str, args: tuple, kwargs: dict) -> 'PlaneSpec':
+        return replace(self, elements=self.elements + ((target, method, tuple(args), tuple(kwargs.items())),))
+
+    def point(self, x, y, **kwargs) -> 'PlaneSpec':
+        """Add a CoordinatePlane.plot_point() call."""
+        return self._call('plane', 'plot_point', (x, y), kwargs)
+
+    def line(self, **kwargs) -> 'PlaneSpec':
+        """Add a CoordinatePlane.plot_line_from_equation() call."""
+        return self._call('plane', 'plot_line_from_equation', (), kwargs)
+
+    def parabola(self, **kwargs) -> 'PlaneSpec':
+        """Add a CoordinatePlane.plot_parabola() call."""
+        return self._call('plane', 'plot_parabola', (), kwargs)
+
+    def shade(self, **kwargs) -> 'PlaneSpec':
+        """Add a CoordinatePlane.shade_inequality() call."""
+        return self._call('plane', 'shade_inequality', (), kwargs)
+
+    def slope_triangle(self, x1, y1, slope, **kwargs) -> 'PlaneSpec':
+        """Add a CoordinatePlane.add_slope_triangle() call."""
+        return self._call('plane', 'add_slope_triangle', (x1, y1, slope), kwargs)
+
+    def axes(self, method: str, *args, **kwargs) -> 'PlaneSpec':
+        """Add a call on the matplotlib axes (e.g. axes('axvline', x=2, color='red'))."""
+        return self._call('ax', method, args, kwargs)
+
+    def figure(self, method: str, *args, **kwargs) -> 'PlaneSpec':
+        """Add a call on the matplotlib figure (e.g. figure('text', 0.5, 0.05, "Vertex"))."""
+        return self._call('fig', method, args, kwargs)
+
+    def plane(self) -> CoordinatePlane:
+        """The CoordinatePlane these settings describe."""
+        return CoordinatePlane(self.x_min, self.x_max, self.y_min, self.y_max,
+                               grid=self.grid, first_quadrant_only=self.first_quadrant_only,
+                               tick_interval=self.tick_interval)
+
+    def render(self):
+        """
+        Draw the plane and its contents.
+
+        Returns:
+            VectorGraphic or PIL Image object
+        """
+        plane = self.plane()
+        fig, ax = plane.create_figure(figsize=self.figsize)
+        for target, method, args, kwargs in self.elements:
+            if target == 'plane':
+                getattr(plane, method)(ax, *args, **dict(kwargs))
+            else:
+                getattr(ax if target == 'ax' else fig, method)(*args, **dict(kwargs))
+        return render_figure(fig, **dict(self.savefig))
 
 
 def create_blank_coordinate_plane(x_min=-8, x_max=8, y_min=-8, y_max=8,
-                                  first_quadrant_only=False, figsize=(6, 6)):
+                                  first_quadrant_only=False, figsize=(6, 6),
+                                  tick_interval=1):
     """
-    Create a blank coordinate plane as a PIL Image.
+    Create a blank coordinate plane image.
+
+    Each distinct configuration is rendered once per process; repeated calls
+    return the same shared image (see CoordinatePlane.blank_image).
 
     Args:
         x_min: Minimum x value (default -8 for 16x16 grid)
@@ -352,18 +471,19 @@ def create_blank_coordinate_plane(x_min=-8, x_max=8, y_min=-8, y_max=8,
         y_max: Maximum y value (default 8 for 16x16 grid)
         first_quadrant_only: If True, only show first quadrant
         figsize: Figure size in inches
+        tick_interval: Spacing between tick marks
 
     Returns:
-        PIL Image object
+        Shared VectorGraphic or PIL Image object (do not modify)
     """
     plane = CoordinatePlane(x_min, x_max, y_min, y_max,
-                           grid=True, first_quadrant_only=first_quadrant_only)
-    fig, ax = plane.create_figure(figsize=figsize)
-    return plane.render_to_image(fig)
+                           grid=True, first_quadrant_only=first_quadrant_only,
+                           tick_interval=tick_interval)
+    return plane.blank_image(figsize=figsize)
 
 
 def graph_points(points, labels=None, x_min=-8, x_max=8, y_min=-8, y_max=8,
-                first_quadrant_only=False, figsize=(6, 6)):
+                first_quadrant_only=False, figsize=(6, 6), deferred=False):
     """
     Create a graph with plotted points.
 
@@ -373,19 +493,19 @@ def graph_points(points, labels=None, x_min=-8, x_max=8, y_min=-8, y_max=8,
         x_min, x_max, y_min, y_max: Axis bounds (default -8 to 8 for 16x16 grid)
         first_quadrant_only: If True, only show first quadrant
         figsize: Figure size in inches
+        deferred: Return a PlaneSpec to render when drawn instead of rendering now
 
     Returns:
-        PIL Image object
+        VectorGraphic or PIL Image object (PlaneSpec if deferred)
     """
-    plane = CoordinatePlane(x_min, x_max, y_min, y_max,
-                           grid=True, first_quadrant_only=first_quadrant_only)
-    fig, ax = plane.create_figure(figsize=figsize)
+    spec = PlaneSpec(x_min, x_max, y_min, y_max,
+                     grid=True, first_quadrant_only=first_quadrant_only, figsize=tuple(figsize))
 
     for i, (x, y) in enumerate(points):
         label = labels[i] if labels and i < len(labels) else None
-        plane.plot_point(ax, x, y, label=label)
+        spec = spec.point(x, y, label=label)
 
-    return plane.render_to_image(fig)
+    return spec if deferred else spec.render()
 
 
 def graph_line(slope=None, y_intercept=None, point=None, standard_form=None,
@@ -407,7 +527,7 @@ def graph_line(slope=None, y_intercept=None, point=None, standard_form=None,
         figsize: Figure size in inches
 
     Returns:
-        PIL Image object
+        VectorGraphic or PIL Image object
     """
     plane = CoordinatePlane(x_min, x_max, y_min, y_max,
                            grid=True, first_quadrant_only=first_quadrant_only)
@@ -461,7 +581,7 @@ def graph_inequality(slope=None, y_intercept=None, standard_form=None,
         figsize: Figure size in inches
 
     Returns:
-        PIL Image object
+        VectorGraphic or PIL Image object
     """
     plane = CoordinatePlane(x_min, x_max, y_min, y_max,
                            grid=True, first_quadrant_only=first_quadrant_only)
@@ -9,14 +9,19 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
 import sys
+import multiprocessing
 import subprocess
 import threading
 from datetime import datetime
 from pathlib import Path
-import importlib.util
 
 # PyInstaller support
 from resource_helper import resource_path, is_frozen
+from generator_manifest import MANIFEST_FILE, load_manifest, organize_manifest, refresh_manifest
+from parallel_generation import EVENT_DONE, EVENT_PROGRESS, ParallelGenerationRunner, job_for_generator
+from problem_uniqueness import generate_unique_worksheet
+from question_bank import BANK_FILE, open_question_bank
+import tracing
 
 # Legacy imports (commented out - now using dynamic generator discovery)
 # from equation_generator import LinearEquationGenerator
@@ -122,16 +127,24 @@ class WorksheetGeneratorGUI:
         """
         Discover all generator files in generators/K_8/ and generators/High_School/ directories.
 
-        When running as a PyInstaller executable, uses the pre-built generator registry.
-        When running in development, dynamically discovers generators.
+        Uses the generator manifest (see generator_manifest.py), so startup does not
+        import any generator modules. When running as a PyInstaller executable without
+        a bundled manifest, uses the pre-built generator registry.
 
         Returns dict: {class_name: {unit_name: {topic_name: generator_class}}}
+        where generator_class is a GeneratorRef (or the class itself from the registry);
+        both are called to create a generator instance
         where class_name is like "High School - Algebra" or "K-8 - Grade 5"
         and unit_name is like "Unit 1", "Unit 2", or "No Unit" for ungrouped generators
         """
         # Check if running as PyInstaller executable
         if is_frozen():
-            # Use pre-built registry for frozen executable - need to reorganize it
+            # Prefer the bundled manifest so generator modules load on first use
+            manifest = load_manifest(resource_path(MANIFEST_FILE))
+            if manifest:
+                return organize_manifest(manifest, Path(resource_path(".")))
+
+            # Fall back to the pre-built registry - need to reorganize it
             try:
                 from generator_registry import GENERATOR_REGISTRY
                 # Reorganize flat registry into Class → Unit → Topic structure
@@ -140,102 +153,16 @@ class WorksheetGeneratorGUI:
                 print(f"Error: Could not load generator registry: {e}")
                 return {}
 
-        # Development mode: dynamic discovery
-        generators_by_subject = {}
+        # Development mode: read the generator manifest, re-scanning only files
+        # that changed since it was written. Generator modules are not imported
+        # here - each topic maps to a GeneratorRef that imports on first use.
         generators_base = Path(resource_path("generators"))
 
         if not generators_base.exists():
-            return generators_by_subject
-
-        # Find K-8 and High_School directories
-        category_dirs = []
-        for category in ['K_8', 'High_School']:
-            category_path = generators_base / category
-            if category_path.exists() and category_path.is_dir():
-                category_dirs.append((category, category_path))
-
-        for category_name, category_path in category_dirs:
-            # Find all subject/grade directories within this category (exclude __pycache__)
-            subject_dirs = sorted([d for d in category_path.iterdir()
-                                   if d.is_dir() and d.name != '__pycache__'])
-
-            for subject_dir in subject_dirs:
-                # Create display name like "High School - Algebra" or "K-8 - Grade 5"
-                category_display = category_name.replace('_', '-')
-                subject_display = subject_dir.name.replace('_', ' ')
-                full_path = f"{category_display} - {subject_display}"
-
-                generators_by_subject[full_path] = {}
-
-                # Check for generators directly in subject folder (ungrouped)
-                direct_generators = [f for f in subject_dir.glob('*_generator.py')
-                                   if f.name != '__init__.py']
-
-                if direct_generators:
-                    generators_by_subject[full_path]["No Unit"] = {}
-                    for gen_file in direct_generators:
-                        gen_class = WorksheetGeneratorGUI._load_generator(gen_file, category_name, subject_dir.name, None)
-                        if gen_class:
-                            topic_name = gen_file.stem.replace('_generator', '').replace('_', ' ').title()
-                            generators_by_subject[full_path]["No Unit"][topic_name] = gen_class
-
-                # Check for generators in Unit subfolders
-                # Support both naming patterns: Unit_1, Unit_2 (High School) and Unit01, Unit02 (K-8)
-                # Exclude __pycache__ directories
-                unit_dirs = sorted([d for d in subject_dir.iterdir()
-                                  if d.is_dir() and d.name != '__pycache__' and
-                                  (d.name.startswith('Unit_') or d.name.startswith('Unit'))])
-
-                for unit_dir in unit_dirs:
-                    # Extract unit number and create display name
-                    # Handle both Unit_1 and Unit01 formats
-                    if unit_dir.name.startswith('Unit_'):
-                        unit_num = unit_dir.name.replace('Unit_', '')
-                    else:
-                        # Remove 'Unit' prefix and strip leading zeros
-                        unit_num = unit_dir.name.replace('Unit', '').lstrip('0') or '0'
-                    unit_display = f"Unit {unit_num}"
-
-                    generators_by_subject[full_path][unit_display] = {}
-
-                    unit_generators = [f for f in unit_dir.glob('*_generator.py')
-                                     if f.name != '__init__.py']
+            return {}
 
-                    for gen_file in unit_generators:
-                        gen_class = WorksheetGeneratorGUI._load_generator(gen_file, category_name, subject_dir.name, unit_dir.name)
-                        if gen_class:
-                            topic_name = gen_file.stem.replace('_generator', '').replace('_', ' ').title()
-                            generators_by_subject[full_path][unit_display][topic_name] = gen_class
-
-        return generators_by_subject
-
-    @staticmethod
-    def _load_generator(gen_file, category_name, subject_name, unit_name):
-        """Helper to load a generator class from a file."""
-        try:
-            # Determine module path
-            if unit_name:
-                module_name = f"generators.{category_name}.{subject_name}.{unit_name}.{gen_file.stem}"
-            else:
-                module_name = f"generators.{category_name}.{subject_name}.{gen_file.stem}"
-
-            spec = importlib.util.spec_from_file_location(module_name, gen_file)
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
-
-            # Find the generator class
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (isinstance(attr, type) and
-                    attr_name.endswith('Generator') and
-                    attr_name != 'Generator' and
-                    hasattr(attr, 'generate_worksheet')):
-                    return attr
-            return None
-        except Exception as e:
-            print(f"Warning: Failed to load {gen_file}: {e}")
-            return None
+        manifest = refresh_manifest(generators_base, generators_base.parent / MANIFEST_FILE)
+        return organize_manifest(manifest, generators_base.parent)
 
     @staticmethod
     def _organize_by_units(flat_registry):
@@ -397,6 +324,9 @@ class WorksheetGeneratorGUI:
         # Cache generator instances
         self.generator_instances = {}
 
+        # Pre-generated problems (built with question_bank.py), if available
+        self.question_bank = open_question_bank(resource_path(BANK_FILE))
+
         # Build chapter_topics from discovered generators
         # Structure: {class_name: {unit_name: {topic_name: generator_class}}}
         self.chapter_topics = {}
@@ -1348,7 +1278,13 @@ class WorksheetGeneratorGUI:
                 self.num_problems_var.set("10")
 
     def generate_worksheet(self):
-        """Generate the worksheet PDF based on user inputs."""
+        """
+        Generate the worksheet PDF based on user inputs.
+
+        With tracing enabled (WORKSHEET_TRACE=1), prints a breakdown of where
+        the time went to the console.
+        """
+        trace = tracing.Trace().start() if tracing.is_enabled() else None
         try:
             # Check if generating entire class (all units)
             if self.generate_entire_class_var.get():
@@ -1383,8 +1319,19 @@ class WorksheetGeneratorGUI:
                 unit in self.chapter_topics[chapter] and
                 topic in self.chapter_topics[chapter][unit]):
                 generator_class = self.chapter_topics[chapter][unit][topic]
-                generator_instance = generator_class()
-                equations = generator_instance.generate_worksheet(difficulty, num_problems)
+                equations = None
+                # Fast path: draw from the question bank if it has enough up-to-date problems
+                if self.question_bank is not None:
+                    equations = self.question_bank.draw(chapter, unit, topic, difficulty, num_problems,
+                                                        generator_class=generator_class)
+                if equations is None:
+                    generator_instance = generator_class()
+                    equations = generate_unique_worksheet(generator_instance, difficulty, num_problems)
+                    if len(equations) < num_problems:
+                        messagebox.showwarning("Not Enough Unique Problems",
+                                               f"{topic} ({difficulty}) only has {len(equations)} different "
+                                               f"problems, so the worksheet will have {len(equations)} "
+                                               f"instead of {num_problems}.")
             # Legacy fallback for hard-coded generators
             elif topic == "Absolute Value":
                 equations = self.absolute_value_gen.generate_worksheet(difficulty, num_problems)
@@ -1556,6 +1503,8 @@ class WorksheetGeneratorGUI:
 
             # Generate PDF
             self.pdf_gen.generate_worksheet(equations, output_path, title, include_answer_key)
+            if trace:
+                print(f"{topic} ({difficulty}):\n{trace.format_breakdown()}")
 
             # Success message
             self.status_var.set(f"Worksheet saved successfully!")
@@ -1568,6 +1517,9 @@ class WorksheetGeneratorGUI:
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred:\n{str(e)}")
             self.status_var.set("Error generating worksheet")
+        finally:
+            if trace:
+                trace.stop()
     
     def open_output_folder(self):
         """Open the output folder in file explorer."""
@@ -1675,9 +1627,13 @@ class WorksheetGeneratorGUI:
                 try:
                     import re
                     # Run batch_generate_worksheets.py script with live output
+                    # (the frozen executable runs it itself via --batch)
+                    if is_frozen():
+                        command = [sys.executable, "--batch"]
+                    else:
+                        command = [sys.executable, "batch_generate_worksheets.py"]
                     process = subprocess.Popen(
-                        ["python", "batch_generate_worksheets.py",
-                         "--difficulty", difficulty,
+                        command + ["--difficulty", difficulty,
                          "--output", output_dir],
                         stdout=subprocess.PIPE,
                         stderr=subprocess.STDOUT,
@@ -1764,7 +1720,6 @@ class WorksheetGeneratorGUI:
                 return
 
             # Get output folder and optionally create unit subfolder
-            import os
             output_dir = self._get_output_folder()
             if self.single_folder_var.get():
                 unit_dir = output_dir  # Put files directly in output folder
@@ -1772,57 +1727,44 @@ class WorksheetGeneratorGUI:
                 folder_name = f"{chapter}_{unit}".replace(":", "").replace(" ", "_")
                 unit_dir = os.path.join(output_dir, folder_name)
                 os.makedirs(unit_dir, exist_ok=True)
-            
-            # Generate worksheets for each topic
-            total_topics = len(topics)
-            successful = 0
-            failed = []
-            
-            self.status_var.set(f"Generating {total_topics} worksheets...")
-            self.root.update()
-            
-            for idx, topic in enumerate(topics, 1):
-                try:
-                    self.status_var.set(f"Generating {idx}/{total_topics}: {topic}...")
-                    self.root.update()
-
-                    # Generate problems for this topic using dynamic lookup
-                    equations = self._get_equations_dynamic(chapter, unit, topic, difficulty, num_problems)
-
-                    if not equations:
-                        failed.append((topic, "No problems generated"))
-                        continue
-
-                    # Create filename
-                    safe_topic = topic.replace(" ", "_").replace("/", "_").replace("(", "").replace(")", "")
-                    filename = f"{safe_topic}_{difficulty}.pdf"
-                    output_path = os.path.join(unit_dir, filename)
-
-                    # Generate title (topic name only)
-                    title = topic
-
-                    # Generate PDF
-                    self.pdf_gen.generate_worksheet(equations, output_path, title, include_answer_key)
-                    successful += 1
-
-                except Exception as e:
-                    failed.append((topic, str(e)))
-                    continue
-
-            # Show completion message
-            message = f"Unit generation complete!\n\n"
-            message += f"Successful: {successful}/{total_topics}\n"
-            message += f"Saved to: {unit_dir}\n"
 
-            if failed:
-                message += f"\nFailed topics ({len(failed)}):\n"
-                for topic, error in failed[:5]:  # Show first 5 failures
-                    message += f"  - {topic}: {error[:50]}\n"
-                if len(failed) > 5:
-                    message += f"  ... and {len(failed) - 5} more"
-
-            self.status_var.set(f"Generated {successful}/{total_topics} worksheets")
-            messagebox.showinfo("Unit Generation Complete", message)
+            # One job per topic
+            jobs = []
+            for topic in topics:
+                safe_topic = topic.replace(" ", "_").replace("/", "_").replace("(", "").replace(")", "")
+                filename = f"{safe_topic}_{difficulty}.pdf"
+                jobs.append(job_for_generator(
+                    self.chapter_topics[chapter][unit][topic],
+                    difficulty=difficulty,
+                    num_problems=num_problems,
+                    output_path=os.path.join(unit_dir, filename),
+                    title=topic,  # Title is the topic name only
+                    include_answer_key=include_answer_key,
+                    label=topic,
+                    topic=(chapter, unit, topic)
+                ))
+
+            def on_finish(results, cancelled):
+                successful = sum(1 for r in results if r.ok)
+                failed = [(r.label, r.error) for r in results if not r.ok]
+                total_topics = len(jobs)
+
+                # Show completion message
+                message = "Unit generation cancelled.\n\n" if cancelled else "Unit generation complete!\n\n"
+                message += f"Successful: {successful}/{total_topics}\n"
+                message += f"Saved to: {unit_dir}\n"
+
+                if failed:
+                    message += f"\nFailed topics ({len(failed)}):\n"
+                    for topic, error in failed[:5]:  # Show first 5 failures
+                        message += f"  - {topic}: {error[:50]}\n"
+                    if len(failed) > 5:
+                        message += f"  ... and {len(failed) - 5} more"
+
+                self.status_var.set(f"Generated {successful}/{total_topics} worksheets")
+                messagebox.showinfo("Unit Generation Complete", message)
+
+            self._run_generation_jobs(jobs, f"Generating {unit}", on_finish)
 
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid input: {str(e)}")
@@ -1855,27 +1797,17 @@ class WorksheetGeneratorGUI:
                 messagebox.showerror("Error", "No units found for this class")
                 return
 
-            # Count total topics across all units
-            total_topics = sum(len(topics) for topics in units.values())
-
             # Get output folder and create class subfolder
-            import os
             output_dir = self._get_output_folder()
             class_folder_name = chapter.replace(":", "").replace(" ", "_")
             class_dir = os.path.join(output_dir, class_folder_name)
             os.makedirs(class_dir, exist_ok=True)
 
-            # Generate worksheets for each unit and topic
-            successful = 0
-            failed = []
-            current = 0
-
-            self.status_var.set(f"Generating {total_topics} worksheets for {chapter}...")
-            self.root.update()
-
             # Check if single folder mode is enabled
             single_folder_mode = self.single_folder_var.get()
 
+            # One job per topic in every unit
+            jobs = []
             for unit_name, topics_dict in units.items():
                 # Create unit subfolder only if not in single folder mode
                 if single_folder_mode:
@@ -1885,57 +1817,49 @@ class WorksheetGeneratorGUI:
                     output_dir_for_unit = os.path.join(class_dir, unit_folder_name)
                     os.makedirs(output_dir_for_unit, exist_ok=True)
 
-                topics = list(topics_dict.keys())
-
-                for topic in topics:
-                    current += 1
-                    try:
-                        self.status_var.set(f"Generating {current}/{total_topics}: {unit_name} - {topic}...")
-                        self.root.update()
-
-                        # Generate problems for this topic using dynamic lookup
-                        equations = self._get_equations_dynamic(chapter, unit_name, topic, difficulty, num_problems)
-
-                        if not equations:
-                            failed.append((f"{unit_name}/{topic}", "No problems generated"))
-                            continue
-
-                        # Create filename (include unit prefix in single folder mode for uniqueness)
-                        safe_unit = unit_name.replace(" ", "_").replace(":", "").replace("/", "_")
-                        safe_topic = topic.replace(" ", "_").replace("/", "_").replace("(", "").replace(")", "")
-                        if single_folder_mode:
-                            filename = f"{safe_unit}_{safe_topic}_{difficulty}.pdf"
-                        else:
-                            filename = f"{safe_topic}_{difficulty}.pdf"
-                        output_path = os.path.join(output_dir_for_unit, filename)
-
-                        # Generate title (topic name only)
-                        title = topic
-
-                        # Generate PDF
-                        self.pdf_gen.generate_worksheet(equations, output_path, title, include_answer_key)
-                        successful += 1
-
-                    except Exception as e:
-                        failed.append((f"{unit_name}/{topic}", str(e)))
-                        continue
-
-            # Show completion message
-            message = f"Class generation complete!\n\n"
-            message += f"Class: {chapter}\n"
-            message += f"Units: {len(units)}\n"
-            message += f"Successful: {successful}/{total_topics}\n"
-            message += f"Saved to: {class_dir}\n"
-
-            if failed:
-                message += f"\nFailed topics ({len(failed)}):\n"
-                for topic_path, error in failed[:5]:  # Show first 5 failures
-                    message += f"  - {topic_path}: {error[:40]}\n"
-                if len(failed) > 5:
-                    message += f"  ... and {len(failed) - 5} more"
-
-            self.status_var.set(f"Generated {successful}/{total_topics} worksheets for {chapter}")
-            messagebox.showinfo("Class Generation Complete", message)
+                for topic, generator_class in topics_dict.items():
+                    # Create filename (include unit prefix in single folder mode for uniqueness)
+                    safe_unit = unit_name.replace(" ", "_").replace(":", "").replace("/", "_")
+                    safe_topic = topic.replace(" ", "_").replace("/", "_").replace("(", "").replace(")", "")
+                    if single_folder_mode:
+                        filename = f"{safe_unit}_{safe_topic}_{difficulty}.pdf"
+                    else:
+                        filename = f"{safe_topic}_{difficulty}.pdf"
+
+                    jobs.append(job_for_generator(
+                        generator_class,
+                        difficulty=difficulty,
+                        num_problems=num_problems,
+                        output_path=os.path.join(output_dir_for_unit, filename),
+                        title=topic,  # Title is the topic name only
+                        include_answer_key=include_answer_key,
+                        label=f"{unit_name}/{topic}",
+                        topic=(chapter, unit_name, topic)
+                    ))
+
+            def on_finish(results, cancelled):
+                successful = sum(1 for r in results if r.ok)
+                failed = [(r.label, r.error) for r in results if not r.ok]
+                total_topics = len(jobs)
+
+                # Show completion message
+                message = "Class generation cancelled.\n\n" if cancelled else "Class generation complete!\n\n"
+                message += f"Class: {chapter}\n"
+                message += f"Units: {len(units)}\n"
+                message += f"Successful: {successful}/{total_topics}\n"
+                message += f"Saved to: {class_dir}\n"
+
+                if failed:
+                    message += f"\nFailed topics ({len(failed)}):\n"
+                    for topic_path, error in failed[:5]:  # Show first 5 failures
+                        message += f"  - {topic_path}: {error[:40]}\n"
+                    if len(failed) > 5:
+                        message += f"  ... and {len(failed) - 5} more"
+
+                self.status_var.set(f"Generated {successful}/{total_topics} worksheets for {chapter}")
+                messagebox.showinfo("Class Generation Complete", message)
+
+            self._run_generation_jobs(jobs, f"Generating {chapter}", on_finish)
 
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid input: {str(e)}")
@@ -1944,29 +1868,73 @@ class WorksheetGeneratorGUI:
             messagebox.showerror("Error", f"An error occurred:\n{str(e)}")
             self.status_var.set("Error generating class")
 
-    def _get_equations_dynamic(self, class_name, unit_name, topic_name, difficulty, num_problems):
-        """Get equations using the dynamically discovered generators."""
-        try:
-            # Look up generator class from discovered generators
-            if class_name not in self.chapter_topics:
-                return None
-            if unit_name not in self.chapter_topics[class_name]:
-                return None
-            if topic_name not in self.chapter_topics[class_name][unit_name]:
-                return None
-
-            generator_class = self.chapter_topics[class_name][unit_name][topic_name]
-
-            # Cache generator instances for reuse
-            cache_key = f"{class_name}:{unit_name}:{topic_name}"
-            if cache_key not in self.generator_instances:
-                self.generator_instances[cache_key] = generator_class()
-
-            generator = self.generator_instances[cache_key]
-            return generator.generate_worksheet(difficulty, num_problems)
-        except Exception as e:
-            print(f"Error generating {topic_name}: {e}")
-            return None
+    def _run_generation_jobs(self, jobs, title, on_finish):
+        """
+        Generate worksheets on the process pool, showing a progress dialog.
+
+        The pool runs in the background; its progress queue is polled with
+        root.after so the GUI stays responsive, and the dialog's Cancel button
+        stops any jobs that haven't started yet.
+
+        Args:
+            jobs: List of parallel_generation.GenerationJob
+            title: Dialog title
+            on_finish: Called as on_finish(results, cancelled) when the run ends
+        """
+        runner = ParallelGenerationRunner(bank_path=resource_path(BANK_FILE))
+        total = len(jobs)
+
+        # Create dialog window
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.geometry("500x180")
+        dialog.resizable(False, False)
+
+        # Make dialog modal
+        dialog.transient(self.root)
+        dialog.grab_set()
+
+        frame = ttk.Frame(dialog, padding="20")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        status_var = tk.StringVar(value=f"Generating {total} worksheets on {runner.max_workers} workers...")
+        ttk.Label(frame, textvariable=status_var, font=("Helvetica", 9),
+                  wraplength=450).pack(pady=(0, 10))
+
+        progress_bar = ttk.Progressbar(frame, length=450, mode='determinate', maximum=max(total, 1))
+        progress_bar.pack(pady=10)
+
+        def cancel():
+            runner.cancel()
+            cancel_btn.config(state=tk.DISABLED)
+            status_var.set("Cancelling - waiting for running worksheets to finish...")
+
+        cancel_btn = ttk.Button(frame, text="Cancel", command=cancel)
+        cancel_btn.pack(pady=10)
+        dialog.protocol("WM_DELETE_WINDOW", cancel)
+
+        self.status_var.set(f"Generating {total} worksheets...")
+
+        def poll():
+            for event in runner.poll():
+                if event[0] == EVENT_PROGRESS:
+                    _, completed, _, result = event
+                    progress_bar['value'] = completed
+                    if not runner.cancelled:
+                        status_var.set(f"Generated {completed}/{total}: {result.label}")
+                    self.status_var.set(f"Generated {completed}/{total} worksheets...")
+                    if result.trace:
+                        print(f"{result.label}:\n{tracing.format_breakdown(result.trace['breakdown'])}")
+                elif event[0] == EVENT_DONE:
+                    _, results, cancelled = event
+                    dialog.grab_release()
+                    dialog.destroy()
+                    on_finish(results, cancelled)
+                    return
+            self.root.after(100, poll)
+
+        runner.start(jobs)
+        self.root.after(100, poll)
 
     def _get_equations_for_topic(self, topic, difficulty, num_problems):
         """Get equations for a given topic. Reuses the logic from generate_worksheet."""
@@ -2136,4 +2104,9 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for the generation process pool in the PyInstaller executable
+    multiprocessing.freeze_support()
+    if sys.argv[1:2] == ["--batch"]:
+        from batch_generate_worksheets import main as batch_main
+        sys.exit(batch_main(sys.argv[2:]))
     main()
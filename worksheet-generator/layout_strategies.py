@@ -0,0 +1,716 @@
+"""
+Layout strategies for worksheet and answer key pages.
+
+Each problem class maps to a LayoutStrategy that owns everything
+type-specific about a page: its worksheet_config problem type, how many
+problems fit on a page, the grid the problems are placed on, and how each
+problem and its answer are drawn. The first problem on a page picks the
+page's strategy; PDFWorksheetGenerator only draws the header, instructions
+and footer around it.
+
+layout_for() looks the strategy up by the problem's class, walking its MRO
+once per class and caching the result, so subclasses of a registered class
+get its strategy.
+
+Adding a problem type:
+    register_layout(MyGraphProblem, GraphingLayout('graphing_points'))
+
+    class MyLayout(EquationLayout):
+        def draw_problem(self, pdf, c, problem, number, x, y, config): ...
+    register_layout(MyProblem, MyLayout('my_config_key'))
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from reportlab.lib.units import inch
+
+from vector_graphics import draw_graphic
+from worksheet_config import get_config
+
+# Legacy imports with fallback to stub classes
+try:
+    from equation_generator import Equation
+except ImportError:
+    class Equation: pass  # Stub class for backwards compatibility
+
+try:
+    from systems_generator import SystemProblem
+except ImportError:
+    class SystemProblem: pass  # Stub class
+
+try:
+    from inequalities_generator import InequalityProblem
+except ImportError:
+    class InequalityProblem: pass  # Stub class
+
+from generators.High_School.Algebra.Unit_3.compound_inequalities_generator import CompoundInequalityProblem
+
+try:
+    from properties_generator import PropertyProblem
+except ImportError:
+    class PropertyProblem: pass  # Stub class
+
+try:
+    from word_problems_generator import WordProblem
+except ImportError:
+    class WordProblem: pass  # Stub class
+
+try:
+    from multistep_generator import MultiStepEquation
+except ImportError:
+    class MultiStepEquation: pass  # Stub class
+from generators.High_School.Algebra.Unit_1.evaluating_expressions_generator import EvaluatingProblem
+from generators.High_School.Algebra.Unit_1.substitution_generator import SubstitutionProblem
+from generators.High_School.Algebra.Unit_4.graphing_points import GraphingPointsProblem
+from generators.High_School.Algebra.Unit_4.graphing_lines import GraphingLineProblem
+from generators.High_School.Algebra.Unit_4.graphing_slope_intercept import SlopeInterceptProblem
+from generators.High_School.Algebra.Unit_4.graphing_point_slope import PointSlopeProblem
+from generators.High_School.Algebra.Unit_4.graphing_standard_form import StandardFormProblem
+from generators.High_School.Algebra.Unit_4.slope_generator import SlopeProblem
+from generators.High_School.Algebra.Unit_4.intercepts_generator import InterceptsProblem
+from generators.High_School.Algebra.Unit_4.writing_slope_intercept import WritingSlopeInterceptProblem
+from generators.High_School.Algebra.Unit_5.graphing_systems import GraphingSystemProblem
+from generators.High_School.Algebra.Unit_5.systems_substitution import SubstitutionSystemProblem
+from generators.High_School.Algebra.Unit_5.systems_elimination import EliminationSystemProblem
+from generators.High_School.Algebra.Unit_6.functions_generator import FunctionsProblem
+from generators.High_School.Algebra.Unit_6.domain_range_generator import DomainRangeProblem
+from generators.High_School.Algebra.Unit_10.quadratic_graphing_generator import QuadraticGraphProblem
+from generators.High_School.Algebra.Unit_4.graphing_parabolas import ParabolaGraphingProblem
+
+# Problems that are text-heavy and get wrapped instead of drawn as an equation
+TEXT_INDICATORS = ['If ', 'Is ', 'Find ', 'Which ', 'Verify', 'Input:', 'Rule:', 'Output:', 'Evaluate',
+                   'Between ', 'Approximate ', 'Order ']
+
+# Attributes holding a problem's LaTeX and its answer, in order of preference
+LATEX_FIELDS = ('latex', 'problem_latex', 'equation_latex', 'slope_latex', 'function_notation')
+SOLUTION_FIELDS = ('solution', 'answer_latex', 'solution_latex')
+
+# Problems per page for types without a paging config
+DEFAULT_PROBLEMS_PER_PAGE = 10
+
+
+def _set_font(c, name: str, size: int, fallback: str = "Helvetica"):
+    try:
+        c.setFont(name, size)
+    except:
+        c.setFont(fallback, size)
+
+
+def _plain_text(latex: str) -> str:
+    """Convert an equation's LaTeX to plain text with Unicode symbols."""
+    # First convert LaTeX symbols to Unicode BEFORE stripping backslashes
+    plain_text = latex
+    # Convert math symbols to Unicode equivalents
+    plain_text = re.sub(r'\\sqrt\[3\]\{([^}]+)\}', r'∛\1', plain_text)  # Cube root
+    plain_text = re.sub(r'\\sqrt\{([^}]+)\}', r'√\1', plain_text)  # Square root
+    plain_text = plain_text.replace('\\pi', 'π')  # Pi
+    plain_text = plain_text.replace('\\approx', '≈')  # Approximately
+    plain_text = plain_text.replace('\\cdot', '·')  # Middle dot
+    plain_text = plain_text.replace('\\times', '×')  # Multiplication
+    plain_text = plain_text.replace('\\lt', '<')  # Less than
+    plain_text = plain_text.replace('\\gt', '>')  # Greater than
+    plain_text = plain_text.replace('\\leq', '≤')  # Less than or equal
+    plain_text = plain_text.replace('\\geq', '≥')  # Greater than or equal
+    plain_text = plain_text.replace('\\left', '')  # Remove sizing commands
+    plain_text = plain_text.replace('\\right', '')
+    # Now remove remaining backslashes
+    plain_text = plain_text.replace('\\', '')
+    # Remove text{} wrappers: text{content} -> content
+    return re.sub(r'text\{([^}]*)\}', r'\1', plain_text)
+
+
+def _inequality_text(latex: str) -> str:
+    """Convert an inequality's LaTeX to plain text."""
+    return latex.replace('\\leq', '≤').replace('\\geq', '≥').replace('\\text{ or }', ' or ').replace('\\', '')
+
+
+def _answer_text(equation, title: str) -> str:
+    """Answer key text for an equation, formatted for the worksheet it's on."""
+    # Check if solution is a string (for new generators)
+    if isinstance(equation.solution, str):
+        return equation.solution
+    # Check if this is Variables worksheet - handle all Variables problems first
+    if "Variables" in title:
+        # For Variables, use steps[0] if available (text answers), otherwise show numeric value
+        if hasattr(equation, 'steps') and equation.steps and equation.solution == 0:
+            return equation.steps[0]  # Use text answer from steps
+        elif equation.solution == int(equation.solution):
+            return str(int(equation.solution))
+        return f"{equation.solution:.2f}"
+    # Check if this is a "What Are Solutions?" worksheet
+    if "What Are Solutions?" in title or "Solutions" in title:
+        # Format for solutions worksheet: just show the number
+        if equation.solution == 999:
+            return "infinite"
+        elif equation.solution == 0:
+            return "zero"
+        elif equation.solution == 1:
+            return "one"
+        return str(int(equation.solution))
+    # Check if this is an expression problem (exponents, evaluating, etc.) - just show the value
+    if "Exponent" in title or "Evaluating" in title or "Substitution" in title:
+        if equation.solution == int(equation.solution):
+            return str(int(equation.solution))
+        return f"{equation.solution:.2f}"
+    # Check if this is a text-based problem (like combining like terms)
+    if equation.solution == 0 and hasattr(equation, 'steps') and equation.steps:
+        return equation.steps[0]  # Use text answer from steps
+    if equation.solution == int(equation.solution):
+        return f"x = {int(equation.solution)}"
+    return f"x = {equation.solution:.2f}"
+
+
+def _two_column_position(idx: int, y_start: float, spacing: float, right_x: float) -> Tuple[float, float]:
+    """Left-to-right two-column grid: 1,2 in row 1, 3,4 in row 2, etc."""
+    row = idx // 2
+    col = idx % 2
+    return (1 * inch if col == 0 else right_x), y_start - (row * spacing)
+
+
+class LayoutStrategy:
+    """
+    Layout and drawing for one kind of problem.
+
+    The base class lays problems out like linear equations: two columns of
+    five rows (four rows for 8-problem pages), then down the left column.
+    Subclasses override what differs.
+
+    Attributes:
+        problem_type: worksheet_config problem type (instructions, spacing, image size)
+        paging_type: worksheet_config problem type whose problems_per_page applies
+                     (None = DEFAULT_PROBLEMS_PER_PAGE)
+    """
+
+    problem_type = 'linear_equation'
+
+    def __init__(self, problem_type: Optional[str] = None, paging_type: Optional[str] = None):
+        if problem_type is not None:
+            self.problem_type = problem_type
+        self.paging_type = paging_type
+
+    def config_key(self, problem) -> str:
+        """worksheet_config problem type for a page starting with this problem."""
+        return self.problem_type
+
+    def problems_per_page(self) -> int:
+        """Problems per page for worksheets of this type."""
+        if self.paging_type is None:
+            return DEFAULT_PROBLEMS_PER_PAGE
+        config = get_config(self.paging_type)
+        return config.problems_per_page if hasattr(config, 'problems_per_page') else 8
+
+    def problem_latex(self, problem) -> str:
+        """The problem's LaTeX (its first LATEX_FIELDS attribute)."""
+        for name in LATEX_FIELDS:
+            if hasattr(problem, name):
+                return getattr(problem, name)
+        return str(problem)
+
+    def problem_solution(self, problem):
+        """The problem's answer (its first SOLUTION_FIELDS attribute, or its (x, y) solution)."""
+        for name in SOLUTION_FIELDS:
+            if hasattr(problem, name):
+                return getattr(problem, name)
+        if hasattr(problem, 'solution_x') and hasattr(problem, 'solution_y'):
+            return f"({problem.solution_x}, {problem.solution_y})"
+        return "See answer key"
+
+    # Worksheet page
+
+    def worksheet_rows(self, problems_per_page: int) -> int:
+        """Rows the page's spacing is calculated for."""
+        # For any 8-problem worksheet, use 2-column layout with 4 rows
+        return 4 if problems_per_page == 8 else 5
+
+    def worksheet_position(self, idx: int, problems_per_page: int, y_start: float,
+                           y_prev: float, spacing: float) -> Tuple[float, float]:
+        """(x, y) of problem idx on the worksheet page; y_prev is the previous problem's y."""
+        if idx < 10:
+            # First 10 problems: 2 columns x 5 rows
+            return _two_column_position(idx, y_start, spacing, 4.5 * inch)
+        # Problems 11-15: continue below in left column
+        return 1 * inch, y_start - ((5 + idx - 10) * spacing)
+
+    def draw_problem(self, pdf, c, problem, number: int, x: float, y: float, config):
+        """Draw one problem on the worksheet page."""
+        raise NotImplementedError
+
+    # Answer key page
+
+    def answer_rows(self, problems_per_page: int) -> int:
+        """Rows the answer key page's spacing is calculated for."""
+        return 5
+
+    def answer_position(self, idx: int, problems_per_page: int, y_start: float,
+                        y_prev: float, spacing: float) -> Tuple[float, float]:
+        """(x, y) of problem idx on the answer key page."""
+        return LayoutStrategy.worksheet_position(self, idx, problems_per_page, y_start, y_prev, spacing)
+
+    def draw_answer(self, pdf, c, problem, number: int, x: float, y: float, config, title: str):
+        """Draw one problem with its answer (in red) on the answer key page."""
+        raise NotImplementedError
+
+    def draw_answers(self, pdf, c, problems: List, start_problem_number: int, y_start: float,
+                     spacing: float, config, title: str):
+        """Draw the answer key page's problems."""
+        y_pos = y_start
+        for idx, problem in enumerate(problems):
+            x_pos, y_pos = self.answer_position(idx, len(problems), y_start, y_pos, spacing)
+            _set_font(c, "Lexend", 12)
+            self.draw_answer(pdf, c, problem, start_problem_number + idx, x_pos, y_pos, config, title)
+
+    # Shared drawing
+
+    def _draw_word_problem(self, pdf, c, problem, number: int, x_start: float, y_pos: float) -> float:
+        """Problem number and wrapped problem text; returns the y below the text."""
+        # Draw problem number first
+        c.drawString(x_start, y_pos, f"{number}.")
+        # Wrap and draw the problem text (full page width minus margins)
+        problem_text = problem.problem_text if hasattr(problem, 'problem_text') else self.problem_latex(problem)
+        return pdf._wrap_text(c, problem_text, x_start + 0.25 * inch, y_pos, 6.0, line_height=0.18)
+
+    def _draw_word_problem_blanks(self, pdf, c, problem, number: int, x_start: float, y_pos: float):
+        text_end_y = self._draw_word_problem(pdf, c, problem, number, x_start, y_pos)
+        # Add blank lines for students to write equation and solve
+        c.drawString(x_start + 0.25 * inch, text_end_y - 0.15 * inch, "Equation: _______________________")
+        c.drawString(x_start + 0.25 * inch, text_end_y - 0.4 * inch, "Solution: _______________________")
+
+
+class EquationLayout(LayoutStrategy):
+    """Equations and expressions drawn as text, with fractions stacked."""
+
+    def draw_problem(self, pdf, c, problem, number, x_start, y_pos, config):
+        if hasattr(problem, 'problem_text'):
+            self._draw_word_problem_blanks(pdf, c, problem, number, x_start, y_pos)
+            return
+
+        # For regular equations: check if they have fractions or are text-heavy
+        plain_text = _plain_text(problem.latex)
+        needs_wrapping = any(indicator in plain_text for indicator in TEXT_INDICATORS)
+
+        if needs_wrapping:
+            # Text-heavy problem: draw number, then wrap text
+            # For text-heavy, convert fractions to slash notation
+            plain_text = re.sub(r'frac\{([^}]+)\}\{([^}]+)\}', r'\1/\2', plain_text)
+            c.drawString(x_start, y_pos, f"{number}.")
+            # Wrap text to fit column width (3.0 inches for 3-column layout)
+            pdf._wrap_text(c, plain_text, x_start + 0.25 * inch, y_pos, 3.0, line_height=0.18)
+        else:
+            # Simple equation: draw with proper fraction rendering
+            # Note: Equations use same 12pt font as problem numbers (not 21pt)
+            c.setFont('Lexend', 12)
+            c.drawString(x_start, y_pos, f"{number}.")
+            # Draw equation with fractions (using 12pt to match other simple equations)
+            # Pass max_width of 3.0 inches to prevent overflow
+            pdf._draw_equation_with_fractions(c, problem.latex, x_start + 0.25 * inch, y_pos, 12, max_width=3.0 * inch)
+
+    def draw_answer(self, pdf, c, equation, number, x_start, y_pos, config, title):
+        plain_text = _plain_text(equation.latex)
+        needs_wrapping = any(indicator in plain_text for indicator in TEXT_INDICATORS)
+
+        if needs_wrapping:
+            # Text-heavy problem: draw number, then wrap text
+            # Convert fractions to slash notation for text-heavy problems
+            plain_text = re.sub(r'frac\{([^}]+)\}\{([^}]+)\}', r'\1/\2', plain_text)
+            c.drawString(x_start, y_pos, f"{number}.")
+            # Wrap text to fit column width (3.0 inches for 3-column layout)
+            text_end_y = pdf._wrap_text(c, plain_text, x_start + 0.25 * inch, y_pos, 3.0, line_height=0.18)
+
+            # Display answer in RED below wrapped text
+            answer_y = text_end_y - 0.15 * inch
+            c.setFillColorRGB(1, 0, 0)  # Red color
+        else:
+            # Simple equation: draw with proper fraction rendering
+            # Note: Equations use same 12pt font as problem numbers (not 21pt)
+            c.setFont('Lexend', 12)
+            c.drawString(x_start, y_pos, f"{number}.")
+            # Draw equation with fractions (using 12pt to match other simple equations)
+            # Pass max_width of 3.0 inches to prevent overflow
+            width_used, height_used = pdf._draw_equation_with_fractions(c, equation.latex, x_start + 0.25 * inch, y_pos, 12, max_width=3.0 * inch)
+
+            # Display answer in RED below the equation
+            # Account for height used by equation if it wrapped
+            answer_y = y_pos - 0.25 * inch - height_used
+            c.setFillColorRGB(1, 0, 0)  # Red color
+
+        solution_str = _answer_text(equation, title)
+        # Use text wrapping for long answers (especially variable problems)
+        if len(solution_str) > 30:
+            # Use smaller font for long variable answers
+            c.setFont('Lexend', 9)
+            pdf._wrap_text(c, solution_str, x_start + 0.25 * inch, answer_y, max_width=3.0, line_height=0.13)
+            c.setFont('Lexend', 12)  # Reset font
+        else:
+            c.drawString(x_start + 0.25 * inch, answer_y, solution_str)
+        c.setFillColorRGB(0, 0, 0)  # Reset to black
+
+
+class _TwoColumnLayout(LayoutStrategy):
+    """Two columns, left to right, as many rows as needed."""
+
+    def worksheet_rows(self, problems_per_page):
+        return (problems_per_page + 1) // 2  # Ceiling division for 2-column layout
+
+    def worksheet_position(self, idx, problems_per_page, y_start, y_prev, spacing):
+        return _two_column_position(idx, y_start, spacing, 4.25 * inch)
+
+    answer_rows = worksheet_rows
+
+    def answer_position(self, idx, problems_per_page, y_start, y_prev, spacing):
+        return _two_column_position(idx, y_start, spacing, 4.25 * inch)
+
+
+class InequalityLayout(_TwoColumnLayout):
+    """Inequalities as text over a number line; answers top to bottom, column by column."""
+
+    problem_type = 'inequality'
+
+    def draw_problem(self, pdf, c, problem, number, x_start, y_pos, config):
+        # For inequalities: display equation as plain text next to problem number
+        latex = self.problem_latex(problem)
+        c.drawString(x_start, y_pos, f"{number}. {_inequality_text(latex)}")
+
+        # Render number line (worksheet image: blank number line)
+        try:
+            img = problem.worksheet_image
+
+            # Number line width - slightly shorter than full column
+            numberline_width = 3.5 * inch
+            # Calculate height based on aspect ratio (8" wide x 1.2" tall for number line only)
+            natural_height = (1.2 / 8.0) * numberline_width
+            # Position number line below the equation text (moved 0.25" closer)
+            draw_graphic(
+                c,
+                img,
+                x_start - 0.15 * inch,  # Moved 0.25" left from previous 0.1"
+                y_pos - 0.10 * inch - natural_height,  # Below equation text, 0.25" closer than before
+                width=numberline_width,
+                height=natural_height,
+                preserveAspectRatio=True,
+                cache=pdf.render_cache
+            )
+        except Exception as e:
+            print(f"Warning: Number line rendering failed: {e}")
+
+    def answer_position(self, idx, problems_per_page, y_start, y_prev, spacing):
+        # Layout: 2 columns x 4 rows (TOP-TO-BOTTOM: 1,3,5,7 in col 1, 2,4,6,8 in col 2)
+        problems_per_column = self.answer_rows(problems_per_page)
+        col = idx // problems_per_column
+        row = idx % problems_per_column
+        return (1 * inch if col == 0 else 4.25 * inch), y_start - (row * spacing)
+
+    def draw_answer(self, pdf, c, equation, number, x_start, y_pos, config, title):
+        # Problem number and equation text (matching worksheet format)
+        c.drawString(x_start, y_pos, f"{number}. {_inequality_text(equation.latex)}")
+
+        # Render solved number line with solution
+        try:
+            # Use answer image (number line with solution)
+            img = equation.answer_image
+
+            # Draw number line (moved 0.25" closer to equation text)
+            numberline_width = 3.5 * inch
+            natural_height = (1.2 / 8.0) * numberline_width
+            image_bottom = y_pos - 0.10 * inch - natural_height
+            draw_graphic(
+                c,
+                img,
+                x_start - 0.15 * inch,  # Moved 0.25" left from previous 0.1"
+                image_bottom,
+                width=numberline_width,
+                height=natural_height,
+                preserveAspectRatio=True,
+                cache=pdf.render_cache
+            )
+
+            # Draw algebraic solution below the number line in RED (only for simple inequalities)
+            if hasattr(equation, 'solution'):
+                # Simple inequality - show algebraic solution
+                _set_font(c, "Lexend", 12)
+                symbol_map = {'\\leq': '≤', '\\geq': '≥', '<': '<', '>': '>'}
+                ineq_symbol = symbol_map.get(equation.inequality_type, equation.inequality_type)
+                solution = self.problem_solution(equation)
+                if isinstance(solution, (int, float)):
+                    if solution == int(solution):
+                        solution_str = f"x {ineq_symbol} {int(solution)}"
+                    else:
+                        solution_str = f"x {ineq_symbol} {solution:.2f}"
+                else:
+                    solution_str = str(solution)
+
+                # Set color to red for the solution
+                c.setFillColorRGB(1, 0, 0)  # Red color
+                c.drawString(x_start + 0.1 * inch, image_bottom - 0.25 * inch, solution_str)
+                c.setFillColorRGB(0, 0, 0)  # Reset to black
+
+        except Exception as e:
+            print(f"Warning: Answer key rendering failed: {e}")
+
+
+class SystemLayout(_TwoColumnLayout):
+    """Systems of equations, both equations as text."""
+
+    problem_type = 'system_of_equations'
+
+    def draw_problem(self, pdf, c, problem, number, x_start, y_pos, config):
+        # For systems: display both equations as plain text
+        # Convert LaTeX to plain text
+        if isinstance(problem, (SubstitutionSystemProblem, EliminationSystemProblem)):
+            eq1_plain = getattr(problem, 'equation1', getattr(problem, 'equation1_latex', '')).replace('\\', '')
+            eq2_plain = getattr(problem, 'equation2', getattr(problem, 'equation2_latex', '')).replace('\\', '')
+        else:
+            eq1_plain = problem.equation1_latex.replace('\\', '')
+            eq2_plain = problem.equation2_latex.replace('\\', '')
+        c.drawString(x_start, y_pos, f"{number}. {eq1_plain}")
+        c.drawString(x_start + 0.25 * inch, y_pos - 0.25 * inch, eq2_plain)
+
+    def draw_answer(self, pdf, c, equation, number, x_start, y_pos, config, title):
+        eq1_plain = equation.equation1_latex.replace('\\', '')
+        eq2_plain = equation.equation2_latex.replace('\\', '')
+        c.drawString(x_start, y_pos, f"{number}. {eq1_plain}")
+        c.drawString(x_start + 0.25 * inch, y_pos - 0.25 * inch, eq2_plain)
+
+        # Display answer in RED below the equations
+        c.setFillColorRGB(1, 0, 0)  # Red color
+        solution = self.problem_solution(equation)
+        c.drawString(x_start + 0.25 * inch, y_pos - 0.55 * inch, str(solution))
+        c.setFillColorRGB(0, 0, 0)  # Reset to black
+
+
+class PropertyLayout(LayoutStrategy):
+    """Properties of equality: the equation, then which property was used."""
+
+    # Abbreviated property types, to fit in a column
+    PROPERTY_ABBREVIATIONS = {
+        'addition': 'Add',
+        'subtraction': 'Sub',
+        'multiplication': 'Mult',
+        'division': 'Div',
+        'combined (subtraction then division)': 'Sub+Div',
+        'combined (addition then division)': 'Add+Div'
+    }
+
+    def config_key(self, problem) -> str:
+        # Detect which type of properties: add/subtract or mult/div
+        if problem.property_type in ['multiplication', 'division']:
+            return 'properties_mult_div'
+        return 'properties_of_equality'
+
+    def draw_problem(self, pdf, c, problem, number, x_start, y_pos, config):
+        # For properties: display equation with proper fraction rendering
+        c.setFont('Lexend', 12)
+        c.drawString(x_start, y_pos, f"{number}.")
+        # Draw equation with fractions properly rendered
+        latex = self.problem_latex(problem)
+        pdf._draw_equation_with_fractions(c, latex, x_start + 0.25 * inch, y_pos, 12, max_width=3.0 * inch)
+        c.drawString(x_start, y_pos - 0.35 * inch, "Property:")
+
+    def answer_position(self, idx, problems_per_page, y_start, y_prev, spacing):
+        # Layout: 2 columns x 5 rows (LEFT-TO-RIGHT: 1,2 in row 1, 3,4 in row 2, etc.)
+        return _two_column_position(idx, y_start, spacing, 4.25 * inch)
+
+    def draw_answer(self, pdf, c, equation, number, x_start, y_pos, config, title):
+        c.drawString(x_start, y_pos, f"{number}.")
+        # Draw equation with fractions properly rendered
+        pdf._draw_equation_with_fractions(c, equation.latex, x_start + 0.25 * inch, y_pos, 12, max_width=3.0 * inch)
+
+        # Display property name and solution in RED
+        c.setFillColorRGB(1, 0, 0)  # Red color
+        property_type = getattr(equation, 'property_type', 'Unknown')
+        prop_text = self.PROPERTY_ABBREVIATIONS.get(property_type.lower(), property_type)
+        # Draw property name and solution on separate lines to avoid overflow
+        c.drawString(x_start, y_pos - 0.35 * inch, f"{prop_text} Property")
+        c.drawString(x_start, y_pos - 0.55 * inch, f"x = {equation.solution}")
+        c.setFillColorRGB(0, 0, 0)  # Reset to black
+
+
+class WordProblemLayout(LayoutStrategy):
+    """Word problems: one per row across the page, with room to work."""
+
+    problem_type = 'word_problems'
+
+    def worksheet_position(self, idx, problems_per_page, y_start, y_prev, spacing):
+        # Word problems: single column layout (one problem per row)
+        return 1 * inch, (y_start if idx == 0 else y_prev - spacing)
+
+    def draw_problem(self, pdf, c, problem, number, x_start, y_pos, config):
+        self._draw_word_problem_blanks(pdf, c, problem, number, x_start, y_pos)
+
+    def draw_answers(self, pdf, c, problems, start_problem_number, y_start, spacing, config, title):
+        # Each answer goes below the previous one's text, however long it was
+        x_start = 1 * inch
+        y_pos = y_start
+        for idx, equation in enumerate(problems):
+            _set_font(c, "Lexend", 12)
+            problem_text = getattr(equation, 'problem_text', equation.latex)
+            c.drawString(x_start, y_pos, f"{start_problem_number + idx}.")
+            text_end_y = pdf._wrap_text(c, problem_text, x_start + 0.25 * inch, y_pos, 6.0, line_height=0.18)
+
+            # Display equation and solution in RED
+            c.setFillColorRGB(1, 0, 0)  # Red color
+            c.drawString(x_start + 0.25 * inch, text_end_y - 0.15 * inch, f"Equation: {equation.equation}")
+            c.drawString(x_start + 0.25 * inch, text_end_y - 0.4 * inch, f"Solution: x = {equation.solution}")
+            c.setFillColorRGB(0, 0, 0)  # Reset to black
+
+            # Position below solution with extra padding
+            y_pos = text_end_y - 0.6 * inch
+
+
+class GraphingLayout(LayoutStrategy):
+    """Graphing problems: a coordinate plane per problem, 2 x 2 per page."""
+
+    def __init__(self, problem_type: str, paging_type: Optional[str] = 'graphing_points'):
+        super().__init__(problem_type, paging_type)
+
+    def worksheet_rows(self, problems_per_page):
+        return 2  # 2 columns x 2 rows
+
+    def worksheet_position(self, idx, problems_per_page, y_start, y_prev, spacing):
+        return _two_column_position(idx, y_start, spacing, 4.25 * inch)
+
+    def answer_rows(self, problems_per_page):
+        return 2
+
+    answer_position = worksheet_position
+
+    def _draw_prompt(self, pdf, c, problem, x_start, y_pos) -> float:
+        """The points or equations to graph; returns the y below them."""
+        if hasattr(problem, 'labels'):
+            # For graphing points: display the points to plot as text
+            c.setFont("Lexend", 10)
+            points_text = ", ".join(problem.labels)
+            # Column width is ~3.5 inches, wrap text to fit
+            return pdf._wrap_text(c, points_text, x_start + 0.25 * inch, y_pos, 3.0, line_height=0.15)
+        if hasattr(problem, 'equation_latex'):
+            # For parabolas: display the equation
+            try:
+                graphic = pdf.render_math(problem.equation_latex, 21)  # 21pt font
+                # Align the equation vertically centered with the problem number
+                draw_graphic(
+                    c,
+                    graphic,
+                    x_start + 0.25 * inch,
+                    y_pos - 0.09 * inch,  # Reduced offset to align better with 12pt problem numbers
+                    width=2.5 * inch,
+                    height=0.28 * inch,  # Adjusted for 21pt font
+                    preserveAspectRatio=True
+                )
+                return y_pos - 0.37 * inch
+            except Exception as e:
+                print(f"Warning: Failed to render parabola equation: {e}")
+                return y_pos
+        if hasattr(problem, 'equation1_latex'):
+            # For systems: display both equations, aligned
+            try:
+                system = pdf.render_system(problem.equation1_latex, problem.equation2_latex, 21)
+                draw_graphic(
+                    c,
+                    system,
+                    x_start + 0.25 * inch,
+                    y_pos - 0.25 * inch,
+                    width=2.5 * inch,
+                    height=0.6 * inch,
+                    preserveAspectRatio=True,
+                    anchor='w'  # Beside the problem number, like the parabola equations
+                )
+                # Leave the plane where the parabola layout puts it, so it fits the 2 x 2 grid
+                return y_pos - 0.37 * inch
+            except Exception as e:
+                print(f"Warning: Failed to render system equations: {e}")
+                return y_pos
+        return y_pos
+
+    def _draw_plane(self, pdf, c, image, x_start, text_y, config, kind):
+        try:
+            draw_graphic(
+                c,
+                image,
+                x_start,
+                text_y - config.image_height * inch - 0.15 * inch,
+                width=config.image_width * inch,
+                height=config.image_height * inch,
+                preserveAspectRatio=True,
+                cache=pdf.render_cache
+            )
+        except Exception as e:
+            print(f"Warning: Failed to render graphing {kind} image: {e}")
+
+    def draw_problem(self, pdf, c, problem, number, x_start, y_pos, config):
+        if hasattr(problem, 'problem_text'):
+            self._draw_word_problem_blanks(pdf, c, problem, number, x_start, y_pos)
+            return
+        c.drawString(x_start, y_pos, f"{number}.")
+        text_y = self._draw_prompt(pdf, c, problem, x_start, y_pos)
+        # Draw the blank worksheet image (coordinate plane)
+        self._draw_plane(pdf, c, problem.worksheet_image, x_start, text_y, config, 'worksheet')
+
+    def draw_answer(self, pdf, c, problem, number, x_start, y_pos, config, title):
+        c.drawString(x_start, y_pos, f"{number}.")
+        text_y = self._draw_prompt(pdf, c, problem, x_start, y_pos)
+        # Draw the answer image (coordinate plane with solution)
+        self._draw_plane(pdf, c, problem.answer_image, x_start, text_y, config, 'answer')
+
+
+DEFAULT_LAYOUT = EquationLayout()
+
+# Problem class -> strategy, as registered
+_layouts: Dict[type, LayoutStrategy] = {}
+
+# Problem class -> strategy, resolved through the MRO
+_resolved: Dict[type, LayoutStrategy] = {}
+
+
+def register_layout(problem_class: type, strategy: LayoutStrategy):
+    """
+    Use a layout strategy for a problem class (and its subclasses).
+
+    Args:
+        problem_class: Problem class
+        strategy: Strategy instance for it
+    """
+    _layouts[problem_class] = strategy
+    _resolved.clear()
+
+
+def layout_for(problem) -> LayoutStrategy:
+    """
+    The layout strategy for a problem (DEFAULT_LAYOUT for unregistered types).
+
+    Args:
+        problem: Problem object, or None for an empty page
+    """
+    cls = type(problem)
+    strategy = _resolved.get(cls)
+    if strategy is None:
+        strategy = next((_layouts[base] for base in cls.__mro__ if base in _layouts), DEFAULT_LAYOUT)
+        _resolved[cls] = strategy
+    return strategy
+
+
+register_layout(SystemProblem, SystemLayout(paging_type='system_of_equations'))
+_inequality = InequalityLayout(paging_type='inequality')
+register_layout(InequalityProblem, _inequality)
+register_layout(CompoundInequalityProblem, _inequality)
+register_layout(PropertyProblem, PropertyLayout())
+register_layout(WordProblem, WordProblemLayout())
+register_layout(MultiStepEquation, EquationLayout('multistep_equations'))
+register_layout(EvaluatingProblem, DEFAULT_LAYOUT)
+register_layout(SubstitutionProblem, DEFAULT_LAYOUT)
+register_layout(GraphingPointsProblem, GraphingLayout('graphing_points'))
+register_layout(GraphingLineProblem, GraphingLayout('graphing_lines'))
+register_layout(SlopeInterceptProblem, GraphingLayout('slope_intercept'))
+register_layout(PointSlopeProblem, GraphingLayout('point_slope'))
+register_layout(StandardFormProblem, GraphingLayout('standard_form'))
+register_layout(GraphingSystemProblem, GraphingLayout('graphing_systems'))
+register_layout(ParabolaGraphingProblem, GraphingLayout('graphing_parabolas'))
+# Laid out as equations, but paged like the types they go with
+_graph_paged = EquationLayout(paging_type='graphing_points')
+for _cls in (SlopeProblem, InterceptsProblem, WritingSlopeInterceptProblem, QuadraticGraphProblem):
+    register_layout(_cls, _graph_paged)
+_system_paged = EquationLayout(paging_type='system_of_equations')
+register_layout(SubstitutionSystemProblem, _system_paged)
+register_layout(EliminationSystemProblem, _system_paged)
+_functions_paged = EquationLayout(paging_type='functions')
+register_layout(FunctionsProblem, _functions_paged)
+register_layout(DomainRangeProblem, _functions_paged)
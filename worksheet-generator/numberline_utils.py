@@ -7,8 +7,7 @@ that matches the coordinate plane graphs.
 
 import matplotlib.pyplot as plt
 import numpy as np
-from io import BytesIO
-from PIL import Image
+from vector_graphics import get_template, render_figure
 
 
 class NumberLine:
@@ -126,26 +125,45 @@ class NumberLine:
 
     def render_to_image(self, fig):
         """
-        Render the matplotlib figure to a PIL Image.
+        Render the matplotlib figure for embedding in a worksheet.
+
+        In vector mode (the default) this is a VectorGraphic drawn directly
+        onto the PDF; in raster mode it is a PIL Image (see vector_graphics).
 
         Args:
             fig: Matplotlib figure object
 
         Returns:
-            PIL Image object
+            VectorGraphic or PIL Image object
+        """
+        return render_figure(fig, bbox_inches='tight',
+                             facecolor='white', edgecolor='none', pad_inches=0.1)
+
+    def blank_image(self, figsize=(8, 1.2)):
         """
-        buf = BytesIO()
-        fig.savefig(buf, format='png', bbox_inches='tight',
-                   facecolor='white', edgecolor='none', pad_inches=0.1)
-        buf.seek(0)
-        img = Image.open(buf)
-        plt.close(fig)
-        return img
+        Get the blank image of this number line, rendered once per process.
+
+        Args:
+            figsize: Tuple of (width, height) in inches
+
+        Returns:
+            Shared VectorGraphic or PIL Image object (do not modify)
+        """
+        key = ('numberline', self.min_val, self.max_val, tuple(figsize))
+
+        def build():
+            fig, ax = self.create_figure(figsize=figsize)
+            return self.render_to_image(fig)
+
+        return get_template(key, build)
 
 
 def create_blank_numberline(min_val=-10, max_val=10, figsize=(8, 1.2)):
     """
-    Create a blank number line as a PIL Image.
+    Create a blank number line image.
+
+    Each distinct range and size is rendered once per process; repeated calls
+    return the same shared image.
 
     Args:
         min_val: Minimum value on number line
@@ -153,11 +171,9 @@ def create_blank_numberline(min_val=-10, max_val=10, figsize=(8, 1.2)):
         figsize: Figure size in inches
 
     Returns:
-        PIL Image object
+        Shared VectorGraphic or PIL Image object (do not modify)
     """
-    line = NumberLine(min_val, max_val)
-    fig, ax = line.create_figure(figsize=figsize)
-    return line.render_to_image(fig)
+    return NumberLine(min_val, max_val).blank_image(figsize=figsize)
 
 
 def create_numberline_with_solution(min_val=-10, max_val=10,
@@ -175,7 +191,7 @@ def create_numberline_with_solution(min_val=-10, max_val=10,
         figsize: Figure size in inches
 
     Returns:
-        PIL Image object
+        VectorGraphic or PIL Image object
     """
     line = NumberLine(min_val, max_val)
     fig, ax = line.create_figure(figsize=figsize)
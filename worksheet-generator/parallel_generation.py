@@ -0,0 +1,281 @@
+"""
+Parallel worksheet generation across a process pool.
+
+Generating a whole class means 100+ (topic, difficulty) worksheets. Each one
+is CPU-bound (problem generation, matplotlib rendering, ReportLab layout), so
+they are fanned out across a ProcessPoolExecutor. Every worker process has its
+own matplotlib/ReportLab state and PDFWorksheetGenerator, imports generator
+modules on first use, and sends back only the output path or error text.
+
+Given a question bank (see question_bank.py), each worker opens it once and
+draws unseeded jobs' problems from it, generating only when the bank can't
+supply them.
+
+The pool is driven from a background thread; progress events are put on a
+queue the caller polls (the GUI polls it with root.after), and the whole run
+can be cancelled.
+
+Usage:
+    runner = ParallelGenerationRunner()
+    runner.start(jobs)
+    ...
+    for event in runner.poll():
+        ...
+"""
+
+import os
+import queue
+import sys
+import threading
+import traceback
+from concurrent.futures import FIRST_COMPLETED, CancelledError, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import tracing
+from problem_uniqueness import generate_unique_worksheet
+from seeding import reseed
+
+
+# Progress event kinds put on ParallelGenerationRunner.events
+EVENT_PROGRESS = 'progress'
+EVENT_DONE = 'done'
+
+
+@dataclass
+class GenerationJob:
+    """One worksheet to generate: a generator, a difficulty and where to save the PDF."""
+    module_name: str  # e.g. "generators.High_School.Algebra.Unit_1.variables_generator"
+    class_name: str  # Generator class in that module
+    difficulty: str
+    num_problems: int
+    output_path: str
+    title: str
+    include_answer_key: bool = True
+    label: str = ''  # Shown in progress messages, e.g. "Unit 1/Variables"
+    path: Optional[str] = None  # Generator source file, used if the module can't be imported by name
+    seed: Optional[int] = None  # Makes the worksheet (and PDF bytes) reproducible, see seeding.derive_seed
+    topic: Optional[Tuple[str, str, str]] = None  # (class, unit, topic) to draw problems from the question bank
+
+
+@dataclass
+class GenerationResult:
+    """Outcome of a GenerationJob, sent back from the worker."""
+    label: str
+    output_path: Optional[str]  # None if the job failed
+    error: Optional[str] = None
+    stats: Optional[dict] = None  # Measurements: font_bytes, or benchmark_generators.benchmark_job's
+    trace: Optional[dict] = None  # tracing.Trace.to_json() of the job, if tracing is enabled
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def job_for_generator(generator_class, **job_kwargs) -> GenerationJob:
+    """
+    Create a GenerationJob for a discovered generator.
+
+    Args:
+        generator_class: GeneratorRef from the manifest, or a generator class
+        **job_kwargs: Remaining GenerationJob fields (difficulty, output_path, ...)
+
+    Returns:
+        GenerationJob
+    """
+    if hasattr(generator_class, 'module_name'):
+        return GenerationJob(generator_class.module_name, generator_class.class_name,
+                             path=generator_class.path, **job_kwargs)
+    return GenerationJob(generator_class.__module__, generator_class.__name__, **job_kwargs)
+
+
+def default_worker_count() -> int:
+    """Number of worker processes to use: one per CPU, leaving one for the GUI."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+# Per-process state, set up by init_worker
+_worker_pdf_gen = None
+_worker_generators = {}
+_worker_bank = None
+
+
+def init_worker(app_dir: str, graph_mode: str, bank_path: Optional[str] = None):
+    """
+    Set up a worker process: import root, headless matplotlib, graph render
+    mode, PDF generator and (if bank_path is given and exists) question bank.
+    """
+    global _worker_pdf_gen, _worker_bank
+    if app_dir not in sys.path:
+        sys.path.insert(0, app_dir)
+
+    import matplotlib
+    matplotlib.use('Agg')
+
+    from vector_graphics import set_graph_render_mode
+    set_graph_render_mode(graph_mode)
+
+    from pdf_generator import PDFWorksheetGenerator
+    _worker_pdf_gen = PDFWorksheetGenerator()
+
+    if bank_path is not None:
+        from question_bank import open_question_bank
+        _worker_bank = open_question_bank(bank_path)
+
+
+def get_worker_pdf_generator():
+    """The worker process's PDFWorksheetGenerator (created on first use)."""
+    global _worker_pdf_gen
+    if _worker_pdf_gen is None:
+        from pdf_generator import PDFWorksheetGenerator
+        _worker_pdf_gen = PDFWorksheetGenerator()
+    return _worker_pdf_gen
+
+
+def get_worker_generator(job: GenerationJob):
+    """The worker process's instance of the job's generator, reseeded for the job if it has a seed."""
+    key = (job.module_name, job.class_name)
+    if key not in _worker_generators:
+        from generator_manifest import GeneratorRef
+        _worker_generators[key] = GeneratorRef(job.module_name, job.class_name, job.path)()
+    generator = _worker_generators[key]
+    if job.seed is not None:
+        # Generators are reused across jobs, so reset the state for this job
+        reseed(generator, job.seed)
+    return generator
+
+
+def run_job(job: GenerationJob) -> GenerationResult:
+    """Generate one worksheet PDF in a worker process (traced, if tracing is enabled)."""
+    if tracing.is_enabled():
+        with tracing.Trace() as trace:
+            result = _run_job(job)
+        result.trace = trace.to_json()
+        return result
+    return _run_job(job)
+
+
+def _run_job(job: GenerationJob) -> GenerationResult:
+    try:
+        pdf_gen = get_worker_pdf_generator()
+        generator = get_worker_generator(job)
+
+        equations = None
+        if _worker_bank is not None and job.topic is not None and job.seed is None:
+            # Seeded jobs must not depend on what the bank holds, so they always generate
+            equations = _worker_bank.draw(*job.topic, job.difficulty, job.num_problems,
+                                          generator_class=type(generator))
+        if equations is None:
+            equations = generate_unique_worksheet(generator, job.difficulty, job.num_problems)
+        if not equations:
+            return GenerationResult(job.label, None, "No problems generated")
+
+        pdf_gen.generate_worksheet(equations, job.output_path, job.title,
+                                   job.include_answer_key,
+                                   invariant=job.seed is not None)
+        font_bytes = sum(usage.bytes for usage in pdf_gen.last_font_usage)
+        return GenerationResult(job.label, job.output_path, stats={'font_bytes': font_bytes})
+    except Exception as e:
+        traceback.print_exc()
+        return GenerationResult(job.label, None, str(e) or type(e).__name__)
+
+
+class ParallelGenerationRunner:
+    """
+    Runs GenerationJobs on a process pool from a background thread.
+
+    Events put on self.events (read them with poll()):
+        (EVENT_PROGRESS, completed, total, GenerationResult)
+        (EVENT_DONE, [GenerationResult, ...], cancelled)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, pool=None, bank_path: Optional[str] = None):
+        """
+        Args:
+            max_workers: Worker processes (defaults to default_worker_count())
+            pool: renderer_pool.RendererPool to run the jobs on, kept running
+                  between runs (default: a new process pool for each run)
+            bank_path: Question bank file the workers draw jobs' problems from
+                       (ignored with a pool, whose workers are already set up)
+        """
+        self.max_workers = max_workers or default_worker_count()
+        self.pool = pool
+        self.bank_path = bank_path
+        self.events = queue.Queue()
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self, jobs: List[GenerationJob]):
+        """Start generating jobs in the background. Returns immediately."""
+        if self.is_running:
+            raise RuntimeError("Generation is already running")
+        self._cancel.clear()
+        self._thread = threading.Thread(target=self._run, args=(list(jobs),), daemon=True)
+        self._thread.start()
+
+    def run(self, jobs: List[GenerationJob]) -> List[GenerationResult]:
+        """Generate jobs and block until they finish. Returns results in completion order."""
+        self._cancel.clear()
+        self._run(list(jobs))
+        results = []
+        for event in self.poll():
+            if event[0] == EVENT_DONE:
+                results = event[1]
+        return results
+
+    def cancel(self):
+        """Stop starting new jobs. Jobs already running in a worker finish first."""
+        self._cancel.set()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def poll(self) -> list:
+        """Return all progress events queued since the last call (never blocks)."""
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _run(self, jobs: List[GenerationJob]):
+        from vector_graphics import get_graph_render_mode
+
+        app_dir = os.path.dirname(os.path.abspath(__file__))
+        results = []
+        total = len(jobs)
+        if self.pool is not None:
+            executor = self.pool.executor
+        else:
+            executor = ProcessPoolExecutor(max_workers=min(self.max_workers, max(total, 1)),
+                                           initializer=init_worker,
+                                           initargs=(app_dir, get_graph_render_mode(), self.bank_path))
+        try:
+            futures = {executor.submit(run_job, job): job for job in jobs}
+            pending = set(futures)
+            while pending:
+                if self._cancel.is_set():
+                    for future in pending:
+                        future.cancel()
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = futures[future]
+                    try:
+                        result = future.result()
+                    except CancelledError:
+                        continue
+                    except Exception as e:
+                        # The worker process died (or the result couldn't be sent back)
+                        result = GenerationResult(job.label, None, str(e) or type(e).__name__)
+                    results.append(result)
+                    self.events.put((EVENT_PROGRESS, len(results), total, result))
+        finally:
+            if self.pool is None:
+                executor.shutdown(wait=True, cancel_futures=True)
+            self.events.put((EVENT_DONE, results, self._cancel.is_set()))
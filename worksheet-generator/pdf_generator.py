@@ -11,18 +11,39 @@ FONT SIZE STANDARDS:
 import os
 import sys
 import io
+import random
 import re
-from typing import List
+import string
+from itertools import chain, islice
+from typing import Iterable, List
 from datetime import datetime
 import matplotlib.pyplot as plt
-from matplotlib import mathtext
 import matplotlib.font_manager as fm
+from PIL import Image
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.pdfgen import canvas
 from reportlab.lib.utils import ImageReader
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from font_pipeline import document_font_usage, load_font
+import tracing
+from render_cache import RenderCache, get_default_cache
+from vector_graphics import RASTER, cached_graphic, draw_graphic, end_form, get_graph_render_mode
+from vector_math import MATH_CACHE_VERSION, layout_array, layout_text
+from problem_uniqueness import generate_unique_worksheet
+from seeding import derive_seed, preserved_random_state, reseed
+
+
+# Letters of the versions written by write_forms()
+FORM_LETTERS = string.ascii_uppercase
+
+# Frames of the equation images in points: the matplotlib figure sizes they
+# were first drawn in, plus the savefig padding
+MATH_FRAME = (4 * 72, 0.5 * 72)
+TEXT_PAD = 0.005 * 72
+TEXT_FRAME = (6 * 72 + 2 * TEXT_PAD, 0.5 * 72 + 2 * TEXT_PAD)
+
+# Padding around an aligned system, in points (systems are cropped to their array)
+SYSTEM_PAD = 0.05 * 72
 
 
 def get_base_path():
@@ -34,55 +55,27 @@ def get_base_path():
         # Running as script - fonts are in parent directory
         return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-# Legacy imports with fallback to stub classes
-try:
-    from equation_generator import Equation
-except ImportError:
-    class Equation: pass  # Stub class for backwards compatibility
-
-try:
-    from systems_generator import SystemProblem
-except ImportError:
-    class SystemProblem: pass  # Stub class
-
-try:
-    from inequalities_generator import InequalityProblem
-except ImportError:
-    class InequalityProblem: pass  # Stub class
-
-from generators.High_School.Algebra.Unit_3.compound_inequalities_generator import CompoundInequalityProblem
-
-try:
-    from properties_generator import PropertyProblem
-except ImportError:
-    class PropertyProblem: pass  # Stub class
-
-try:
-    from word_problems_generator import WordProblem
-except ImportError:
-    class WordProblem: pass  # Stub class
-
-try:
-    from multistep_generator import MultiStepEquation
-except ImportError:
-    class MultiStepEquation: pass  # Stub class
-from generators.High_School.Algebra.Unit_1.evaluating_expressions_generator import EvaluatingProblem
-from generators.High_School.Algebra.Unit_1.substitution_generator import SubstitutionProblem
-from generators.High_School.Algebra.Unit_4.graphing_points import GraphingPointsProblem
-from generators.High_School.Algebra.Unit_4.graphing_lines import GraphingLineProblem
-from generators.High_School.Algebra.Unit_4.graphing_slope_intercept import SlopeInterceptProblem
-from generators.High_School.Algebra.Unit_4.graphing_point_slope import PointSlopeProblem
-from generators.High_School.Algebra.Unit_4.graphing_standard_form import StandardFormProblem
-from generators.High_School.Algebra.Unit_4.slope_generator import SlopeProblem
-from generators.High_School.Algebra.Unit_4.intercepts_generator import InterceptsProblem
-from generators.High_School.Algebra.Unit_4.writing_slope_intercept import WritingSlopeInterceptProblem
-from generators.High_School.Algebra.Unit_5.graphing_systems import GraphingSystemProblem
-from generators.High_School.Algebra.Unit_5.systems_substitution import SubstitutionSystemProblem
-from generators.High_School.Algebra.Unit_5.systems_elimination import EliminationSystemProblem
-from generators.High_School.Algebra.Unit_6.functions_generator import FunctionsProblem
-from generators.High_School.Algebra.Unit_6.domain_range_generator import DomainRangeProblem
-from generators.High_School.Algebra.Unit_10.quadratic_graphing_generator import QuadraticGraphProblem
-from generators.High_School.Algebra.Unit_4.graphing_parabolas import ParabolaGraphingProblem
+
+def _written_bytes(output) -> int:
+    """Size of a saved PDF, given the path or file object it was written to (0 if unknown)."""
+    try:
+        if isinstance(output, (str, os.PathLike)):
+            return os.path.getsize(output)
+        return output.tell()
+    except (OSError, AttributeError, ValueError):
+        return 0
+
+
+# Problem classes (legacy ones fall back to stubs) and their page layouts
+from layout_strategies import (
+    layout_for,
+    Equation, SystemProblem, InequalityProblem, CompoundInequalityProblem, PropertyProblem,
+    WordProblem, MultiStepEquation,
+    GraphingPointsProblem, GraphingLineProblem, SlopeInterceptProblem, PointSlopeProblem,
+    StandardFormProblem, SlopeProblem, InterceptsProblem, WritingSlopeInterceptProblem,
+    GraphingSystemProblem, SubstitutionSystemProblem, EliminationSystemProblem,
+    FunctionsProblem, DomainRangeProblem, QuadraticGraphProblem, ParabolaGraphingProblem,
+)
 from worksheet_config import get_config, ProblemTypeConfig
 from typing import Union
 
@@ -91,67 +84,6 @@ class PDFWorksheetGenerator:
     """Generates PDF worksheets with LaTeX-rendered equations."""
 
     # Font size standards (maintain 1.75x ratio)
-    
-    def _get_problem_latex(self, problem):
-        """Get LaTeX representation from any problem type."""
-        if hasattr(problem, 'latex'):
-            return problem.latex
-        elif hasattr(problem, 'problem_latex'):
-            return problem.problem_latex
-        elif hasattr(problem, 'equation_latex'):
-            return problem.equation_latex
-        elif hasattr(problem, 'slope_latex'):
-            return problem.slope_latex
-        elif hasattr(problem, 'equation1') and hasattr(problem, 'equation2'):
-            # For system problems
-            return f"{problem.equation1}\\\\{problem.equation2}"
-        elif hasattr(problem, 'function_notation'):
-            return problem.function_notation
-        else:
-            return str(problem)
-    
-    def _get_problem_solution(self, problem):
-        """Get solution from any problem type."""
-        if hasattr(problem, 'solution'):
-            return problem.solution
-        elif hasattr(problem, 'answer_latex'):
-            return problem.answer_latex
-        elif hasattr(problem, 'solution_latex'):
-            return problem.solution_latex
-        elif isinstance(problem, (SubstitutionSystemProblem, EliminationSystemProblem)):
-            if hasattr(problem, 'solution_x') and hasattr(problem, 'solution_y'):
-                return f"({problem.solution_x}, {problem.solution_y})"
-            elif hasattr(problem, 'solution_latex'):
-                return problem.solution_latex
-            else:
-                return "See work shown"
-        elif isinstance(problem, InterceptsProblem):
-            intercepts = []
-            if hasattr(problem, 'x_intercept') and problem.x_intercept:
-                intercepts.append(f"x-intercept: {problem.x_intercept}")
-            if hasattr(problem, 'y_intercept') and problem.y_intercept:
-                intercepts.append(f"y-intercept: {problem.y_intercept}")
-            return ", ".join(intercepts) if intercepts else "See answer key"
-        elif isinstance(problem, SlopeProblem):
-            return f"m = {problem.slope_fraction}"
-        elif isinstance(problem, WritingSlopeInterceptProblem):
-            return getattr(problem, 'answer_latex', getattr(problem, 'equation_latex', 'See work shown'))
-        elif isinstance(problem, QuadraticGraphProblem):
-            # Return key information for quadratic graph
-            parts = []
-            if hasattr(problem, 'vertex'):
-                parts.append(f"Vertex: {problem.vertex}")
-            if hasattr(problem, 'x_intercepts') and problem.x_intercepts:
-                parts.append(f"x-intercepts: {problem.x_intercepts}")
-            if hasattr(problem, 'y_intercept'):
-                parts.append(f"y-intercept: {problem.y_intercept}")
-            return ", ".join(parts) if parts else "See graph"
-        elif isinstance(problem, (FunctionsProblem, DomainRangeProblem)):
-            return getattr(problem, 'answer', getattr(problem, 'answer_latex', 'See work shown'))
-        elif hasattr(problem, 'solution_x') and hasattr(problem, 'solution_y'):
-            return f"({problem.solution_x}, {problem.solution_y})"
-        else:
-            return "See answer key"
     PROBLEM_NUMBER_FONT_SIZE = 12  # Lexend 12pt for problem numbers
     EQUATION_FONT_SIZE = 21  # Lexend 21pt for equations (1.75x ratio)
 
@@ -192,8 +124,17 @@ class PDFWorksheetGenerator:
         'graphing_parabolas': 4.5 * inch  # Same as other graphing types
     }
 
-    def __init__(self):
-        """Initialize the PDF generator."""
+    def __init__(self, render_cache: RenderCache = None):
+        """
+        Initialize the PDF generator.
+
+        Args:
+            render_cache: Cache for rendered equation images (defaults to the
+                          process-wide cache shared by all generators)
+        """
+        self.render_cache = render_cache if render_cache is not None else get_default_cache()
+        self.last_font_usage = []  # font_pipeline.FontUsage per font of the last worksheet written
+
         # Register custom fonts for ReportLab
         self._register_fonts()
 
@@ -221,7 +162,12 @@ class PDFWorksheetGenerator:
             plt.rcParams['font.size'] = 14
 
     def _register_fonts(self):
-        """Register custom fonts with ReportLab."""
+        """
+        Register custom fonts with ReportLab.
+
+        Fonts are parsed once per process and embedded as subsets of the
+        characters each document uses (see font_pipeline).
+        """
         try:
             # Get the base path for fonts (works for both script and exe)
             base_dir = get_base_path()
@@ -231,12 +177,12 @@ class PDFWorksheetGenerator:
             lexend_bold = os.path.join(base_dir, 'Lexend', 'static', 'Lexend-Bold.ttf')
 
             if os.path.exists(lexend_regular):
-                pdfmetrics.registerFont(TTFont('Lexend', lexend_regular))
+                load_font('Lexend', lexend_regular)
             else:
                 raise FileNotFoundError(f"Lexend font not found at {lexend_regular}")
 
             if os.path.exists(lexend_bold):
-                pdfmetrics.registerFont(TTFont('Lexend-Bold', lexend_bold))
+                load_font('Lexend-Bold', lexend_bold)
 
             # Try to register Poppins fonts (for title, name, date)
             poppins_dir = os.path.join(base_dir, 'Poppins')
@@ -244,12 +190,12 @@ class PDFWorksheetGenerator:
             poppins_bold = os.path.join(poppins_dir, 'Poppins-Bold.ttf')
 
             if os.path.exists(poppins_regular):
-                pdfmetrics.registerFont(TTFont('Poppins', poppins_regular))
+                load_font('Poppins', poppins_regular)
             else:
                 raise FileNotFoundError(f"Poppins font not found at {poppins_regular}")
 
             if os.path.exists(poppins_bold):
-                pdfmetrics.registerFont(TTFont('Poppins-Bold', poppins_bold))
+                load_font('Poppins-Bold', poppins_bold)
 
         except Exception as e:
             print(f"Warning: Could not register custom fonts: {e}")
@@ -417,12 +363,12 @@ class PDFWorksheetGenerator:
         # If so, render it as a LaTeX image instead of text
         if '\\sqrt' in equation_text:
             try:
-                # Render the entire equation as a LaTeX image
+                # Render the entire equation with mathtext (PDF text and paths in vector mode)
                 # Use the same font_size to maintain consistency
-                img = self.render_latex_to_image(equation_text, font_size)
+                graphic = self.render_math(equation_text, font_size)
 
                 # Get the actual image dimensions to calculate proper scaling
-                img_width, img_height = img.getSize()
+                img_width, img_height = graphic.size
 
                 # Calculate the scaling factor based on font size
                 # At 12pt font, we want the image height to be approximately 0.5 inches
@@ -439,14 +385,14 @@ class PDFWorksheetGenerator:
                 # The rendered image has the square root symbol centered, so we offset by ~31% of height
                 y_offset = target_height * 0.31
 
-                c.drawImage(
-                    img,
+                draw_graphic(
+                    c,
+                    graphic,
                     x,
                     y - y_offset,  # Position so square root baseline aligns with text baseline
                     width=target_width,
                     height=target_height,
-                    preserveAspectRatio=True,
-                    mask='auto'
+                    preserveAspectRatio=True
                 )
                 return (target_width, 0)  # Return width in points, no wrapping
             except Exception as e:
@@ -646,15 +592,95 @@ class PDFWorksheetGenerator:
         Returns:
             ImageReader object for reportlab
         """
-        # Check if this is a text-heavy problem (contains \text{, \mathrm{, or has more text than math)
+        return ImageReader(io.BytesIO(self._render_latex_png(latex_str, fontsize)))
+
+    def render_math(self, latex_str: str, fontsize: int = 16):
+        """
+        Render a LaTeX string for draw_graphic().
+
+        In vector mode the equation is laid out by vector_math and drawn as PDF
+        text and paths; in raster mode it is render_latex_to_image()'s PNG.
+        Both have the same frame, so either fits the same box.
+
+        Args:
+            latex_str: LaTeX equation string
+            fontsize: Font size for rendering
+
+        Returns:
+            VectorGraphic or PIL Image object
+        """
+        mode = get_graph_render_mode()
+        if mode == RASTER:
+            return Image.open(io.BytesIO(self._render_latex_png(latex_str, fontsize)))
+
+        processed = self._plain_text(latex_str)
+        if processed is not None:
+            # Like _render_text_png: centred at half height, 0.005in from the left edge
+            return self._render_graphic('text', mode, processed, fontsize, lambda: layout_text(
+                processed, fontsize, family='sans-serif').to_graphic(*TEXT_FRAME, TEXT_PAD / TEXT_FRAME[0], 0.5,
+                                                                     va='center'))
+        # Like _render_math_png: left aligned, baseline at 30% of the height
+        return self._render_graphic('math', mode, latex_str, fontsize, lambda: layout_text(
+            f'${latex_str}$', fontsize).to_graphic(*MATH_FRAME, 0, 0.3))
+
+    def _render_latex_png(self, latex_str: str, fontsize: int) -> bytes:
+        """PNG bytes of a LaTeX string, as plain text if it is text-heavy."""
+        processed = self._plain_text(latex_str)
+        if processed is not None:
+            # Use plain text rendering with embedded math
+            with tracing.span('render_text') as span:
+                key = self.render_cache.make_key('text', processed, fontsize, self._font_config())
+                png = self.render_cache.get_or_render(key, lambda: self._render_text_png(processed, fontsize))
+                span.add_bytes(len(png))
+            return png
+
+        with tracing.span('render_latex') as span:
+            key = self.render_cache.make_key('math', latex_str, fontsize, self._font_config())
+            png = self.render_cache.get_or_render(key, lambda: self._render_math_png(latex_str, fontsize))
+            span.add_bytes(len(png))
+        return png
+
+    def _render_graphic(self, kind: str, mode: str, source, fontsize: int, render):
+        """A rendered equation graphic, through the render cache."""
+        with tracing.span('render_vector_' + kind) as span:
+            key = self.render_cache.make_key('graphic', kind, MATH_CACHE_VERSION, mode, source, fontsize,
+                                             self._font_config())
+            graphic, size = cached_graphic(self.render_cache, key, render)
+            span.add_bytes(size)
+        return graphic
+
+    def _font_config(self) -> tuple:
+        """Matplotlib font settings that affect rendered equations (part of the cache key)."""
+        return tuple(str(plt.rcParams[name]) for name in (
+            'font.family', 'font.size', 'mathtext.fontset',
+            'mathtext.rm', 'mathtext.it', 'mathtext.bf'))
+
+    @staticmethod
+    def _plain_text(latex_str: str):
+        """
+        The plain text to draw a text-heavy LaTeX string as, or None for an equation.
+
+        Text-heavy problems (\\text{, \\mathrm{, or more text than math) are drawn
+        as plain text with the LaTeX text commands removed.
+        """
         # Heuristic: if it contains words like "If", "Is", "Find", "Which", "Input", "Rule", etc.
         text_indicators = ['If ', 'Is ', 'Find ', 'Which ', 'Verify', 'Input:', 'Rule:', 'Output:']
         has_text_content = any(indicator in latex_str for indicator in text_indicators)
+        if not ('\\text{' in latex_str or '\\mathrm{' in latex_str or has_text_content):
+            return None
 
-        if '\\text{' in latex_str or '\\mathrm{' in latex_str or has_text_content:
-            # Use plain text rendering with embedded math
-            return self._render_text_with_math(latex_str, fontsize)
+        # Convert \text{...} and \mathrm{...} to plain text (remove LaTeX commands, convert \  to spaces)
+        # Replace escaped spaces with actual spaces
+        processed = latex_str.replace('\\ ', ' ')
+
+        # Remove \text{ and \mathrm{ commands but keep content
+        processed = re.sub(r'\\text\{([^}]*)\}', r'\1', processed)
+        processed = re.sub(r'\\mathrm\{([^}]*)\}', r'\1', processed)
+        return processed
 
+    @tracing.traced('matplotlib')
+    def _render_math_png(self, latex_str: str, fontsize: int) -> bytes:
+        """Render a math-mode LaTeX string to PNG bytes."""
         # Create figure with no axes
         fig = plt.figure(figsize=(4, 0.5))
         fig.patch.set_visible(False)
@@ -666,34 +692,17 @@ class PDFWorksheetGenerator:
 
         # Save to bytes buffer with tight bbox and zero padding to eliminate whitespace
         buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', pad_inches=0,
-                    transparent=False, facecolor='white')
-        buf.seek(0)
-        plt.close(fig)
-
-        return ImageReader(buf)
-
-    def _render_text_with_math(self, latex_str: str, fontsize: int = 16) -> ImageReader:
-        """
-        Render text-heavy problems as plain text (convert LaTeX text commands to plain text).
-
-        Args:
-            latex_str: LaTeX string with text or mathrm commands
-            fontsize: Font size for rendering
-
-        Returns:
-            ImageReader object for reportlab
-        """
-        import re
-
-        # Convert \text{...} and \mathrm{...} to plain text (remove LaTeX commands, convert \  to spaces)
-        # Replace escaped spaces with actual spaces
-        processed = latex_str.replace('\\ ', ' ')
+        try:
+            plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', pad_inches=0,
+                        transparent=False, facecolor='white')
+        finally:
+            plt.close(fig)
 
-        # Remove \text{ and \mathrm{ commands but keep content
-        processed = re.sub(r'\\text\{([^}]*)\}', r'\1', processed)
-        processed = re.sub(r'\\mathrm\{([^}]*)\}', r'\1', processed)
+        return buf.getvalue()
 
+    @tracing.traced('matplotlib')
+    def _render_text_png(self, processed: str, fontsize: int) -> bytes:
+        """Render plain text (already stripped of LaTeX commands) to PNG bytes."""
         # Create figure
         fig = plt.figure(figsize=(6, 0.5))
         fig.patch.set_visible(False)
@@ -706,16 +715,17 @@ class PDFWorksheetGenerator:
 
         # Save to bytes buffer
         buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', pad_inches=0.005,
-                    transparent=False, facecolor='white')
-        buf.seek(0)
-        plt.close(fig)
+        try:
+            plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', pad_inches=0.005,
+                        transparent=False, facecolor='white')
+        finally:
+            plt.close(fig)
 
-        return ImageReader(buf)
+        return buf.getvalue()
 
     def render_system_to_image(self, eq1: str, eq2: str, fontsize: int = 16) -> ImageReader:
         """
-        Render system equations with LaTeX array environment for perfect alignment.
+        Render system equations as an image, aligned like a LaTeX array.
 
         Args:
             eq1: First equation (e.g., "2x + 3y = 13")
@@ -725,73 +735,62 @@ class PDFWorksheetGenerator:
         Returns:
             ImageReader object for reportlab
         """
-        import re
-
-        # Parse equations to add phantom spacing for alignment
-        # We'll use LaTeX array environment with right-aligned columns
+        return ImageReader(self._render_system(eq1, eq2, fontsize, RASTER))
 
-        def format_for_array(eq):
-            """Convert 'ax + by = c' to array format with alignment."""
-            if '=' not in eq:
-                return eq
-
-            left, right = eq.split('=', 1)
-            left = left.strip()
-            right = right.strip()
-
-            # Parse left side: find x term, operator, y term
-            x_match = re.search(r'([+-]?\s*\d*)\s*x', left)
-            y_match = re.search(r'x\s*([+-])\s*(\d*)\s*y', left)
+    def render_system(self, eq1: str, eq2: str, fontsize: int = 16):
+        """
+        Render system equations for draw_graphic(), with their terms aligned.
 
-            if not x_match or not y_match:
-                return eq
+        Args:
+            eq1: First equation (e.g., "2x + 3y = 13")
+            eq2: Second equation (e.g., "x - y = -1")
+            fontsize: Font size for rendering
 
-            # Get x coefficient
-            x_coef = x_match.group(1).replace(' ', '')
-            if x_coef == '' or x_coef == '+':
-                x_coef = '1'
-            elif x_coef == '-':
-                x_coef = '-1'
+        Returns:
+            VectorGraphic (vector mode) or PIL Image object (raster mode)
+        """
+        return self._render_system(eq1, eq2, fontsize, get_graph_render_mode())
 
-            # Get y parts
-            y_sign = y_match.group(1)
-            y_coef = y_match.group(2)
-            if not y_coef:
-                y_coef = '1'
+    def _render_system(self, eq1: str, eq2: str, fontsize: int, mode: str):
+        """Lay out a system as an array and render it in the given mode."""
+        # Columns: x term, sign, y term, =, constant (right, centre, right, centre, left)
+        rows = (self._system_cells(eq1), self._system_cells(eq2))
 
-            # Format with alignment: coef & x & sign & coef & y & = & constant
-            return f"{x_coef} & x & {y_sign} & {y_coef} & y & = & {right}"
+        def render():
+            layout = layout_array(rows, 'rcrcl', fontsize)
+            frame = (layout.width + 2 * SYSTEM_PAD, layout.height + layout.depth + 2 * SYSTEM_PAD)
+            if mode == RASTER:
+                return layout.to_graphic(*frame, 0.5, 0.5, 'center', 'center',
+                                         background=(1, 1, 1, 1)).to_image(150)
+            return layout.to_graphic(*frame, 0.5, 0.5, 'center', 'center')
 
-        # Format both equations
-        formatted1 = format_for_array(eq1)
-        formatted2 = format_for_array(eq2)
+        return self._render_graphic('system', mode, rows, fontsize, render)
 
-        # Create LaTeX array with column alignment (r = right, c = center, l = left)
-        # Format: rcrcrcl means: right coef, center x, right sign, center coef, right y, center =, left constant
-        latex_array = r'\begin{array}{rcrcrcl}' + formatted1 + r' \\' + formatted2 + r'\end{array}'
+    @staticmethod
+    def _system_cells(eq: str) -> tuple:
+        """Split 'ax + by = c' into array cells: x term, sign, y term, '=', constant."""
+        if '=' not in eq:
+            return (eq,)
 
-        # Create figure
-        fig = plt.figure(figsize=(4, 1.0))
-        fig.patch.set_visible(False)
-        ax = fig.add_axes([0, 0, 1, 1])
-        ax.axis('off')
+        left, right = eq.split('=', 1)
+        left = left.strip()
+        right = right.strip()
 
-        # Render the array
-        ax.text(0.5, 0.5, f'${latex_array}$', fontsize=fontsize,
-               verticalalignment='center', horizontalalignment='center')
+        # Parse left side: find x term, operator, y term
+        x_match = re.search(r'([+-]?\s*\d*)\s*x', left)
+        y_match = re.search(r'x\s*([+-])\s*(\d*)\s*y', left)
 
-        # Save to buffer
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', pad_inches=0.05,
-                    transparent=False, facecolor='white')
-        buf.seek(0)
-        plt.close(fig)
+        if not x_match or not y_match:
+            # e.g. 'y = 2x + 3': keep the equals signs lined up
+            return ('', '', left, '=', right)
 
-        return ImageReader(buf)
+        x_coef = x_match.group(1).replace(' ', '').lstrip('+')
+        return (f"{x_coef}x", y_match.group(1), f"{y_match.group(2)}y", '=', right)
 
     def generate_worksheet(self, equations: List[Union[Equation, SystemProblem, InequalityProblem, CompoundInequalityProblem, PropertyProblem, WordProblem, MultiStepEquation, GraphingPointsProblem, GraphingLineProblem, SlopeInterceptProblem, PointSlopeProblem, StandardFormProblem, GraphingSystemProblem, ParabolaGraphingProblem, SlopeProblem, InterceptsProblem, WritingSlopeInterceptProblem, SubstitutionSystemProblem, EliminationSystemProblem, FunctionsProblem, DomainRangeProblem, QuadraticGraphProblem]], output_path: str,
                           title: str = "Math Worksheet",
-                          include_answer_key: bool = True):
+                          include_answer_key: bool = True,
+                          invariant: bool = False):
         """
         Generate a PDF worksheet with equations or systems.
 
@@ -800,112 +799,326 @@ class PDFWorksheetGenerator:
             output_path: Path to save the PDF
             title: Worksheet title
             include_answer_key: Whether to include answer key on separate page
+            invariant: Leave out the creation date and random document ID, so the
+                       same problems always give a byte-identical PDF
         """
-        c = canvas.Canvas(output_path, pagesize=letter)
-        width, height = letter
+        self.write_worksheet(equations, output_path, title, include_answer_key, invariant)
+        print(f"Worksheet saved to: {output_path}")
 
-        # Check if this is a challenge worksheet
-        is_challenge = "Challenge" in title
+    @tracing.traced('write_worksheet')
+    def write_worksheet(self, problems: Iterable, output, title: str = "Math Worksheet",
+                        include_answer_key: bool = True, invariant: bool = False,
+                        problems_per_page: int = None) -> int:
+        """
+        Write a worksheet PDF from an iterator of problems, one page at a time.
 
-        # Determine max problems per page based on problem type
-        # Challenge worksheets always use 8 problems per page
-        if is_challenge:
-            max_problems_per_page = 8
-        elif equations:
-            # Determine problem type to get appropriate config
-            if isinstance(equations[0], SystemProblem):
-                from worksheet_config import get_config
-                config = get_config('system_of_equations')
-                max_problems_per_page = config.problems_per_page
-            elif isinstance(equations[0], InequalityProblem) or isinstance(equations[0], CompoundInequalityProblem):
-                from worksheet_config import get_config
-                config = get_config('inequality')
-                max_problems_per_page = config.problems_per_page
-            elif isinstance(equations[0], (GraphingPointsProblem, GraphingLineProblem, SlopeInterceptProblem,
-                                          PointSlopeProblem, StandardFormProblem, GraphingSystemProblem,
-                                          ParabolaGraphingProblem, SlopeProblem, InterceptsProblem,
-                                          WritingSlopeInterceptProblem, QuadraticGraphProblem)):
-                from worksheet_config import get_config
-                config = get_config('graphing_points')
-                max_problems_per_page = config.problems_per_page
-            elif isinstance(equations[0], (SubstitutionSystemProblem, EliminationSystemProblem)):
-                from worksheet_config import get_config
-                config = get_config('system_of_equations')
-                max_problems_per_page = config.problems_per_page
-            elif isinstance(equations[0], (FunctionsProblem, DomainRangeProblem)):
-                from worksheet_config import get_config
-                config = get_config('functions')
-                max_problems_per_page = config.problems_per_page if hasattr(get_config('functions'), 'problems_per_page') else 8
+        Problems are pulled from the iterator one page at a time. Each
+        worksheet page and its answer key page are drawn as soon as the page
+        is full, the answer key page being kept as a PDF form until the
+        worksheet pages are done. Only one page of problems (and their
+        images) is held at a time, so problems can come from a generator
+        for packets of any size. The drawn pages themselves stay in memory
+        until the PDF is saved at the end, as ReportLab writes the whole
+        document then.
+
+        Args:
+            problems: Iterable of problem objects (list, generator, ...)
+            output: File path or binary file-like object to write the PDF to
+            title: Worksheet title
+            include_answer_key: Whether to add answer key pages at the end
+            invariant: Leave out the creation date and random document ID
+            problems_per_page: Problems per page (defaults to the layout for the
+                               first problem's type)
+
+        Returns:
+            Number of problems written
+        """
+        c = canvas.Canvas(output, pagesize=letter, invariant=invariant)
+
+        count, answer_key_forms = self._draw_worksheet_pages(c, problems, title, include_answer_key,
+                                                             problems_per_page)
+
+        for form_name in answer_key_forms:
+            c.showPage()  # Start new page for answer key
+            c.doForm(form_name)
+
+        self._save(c, output)
+        return count
+
+    @tracing.traced('write_packet')
+    def write_packet(self, sections: Iterable, output, title: str = "Worksheet Packet",
+                     include_answer_key: bool = True, invariant: bool = False) -> List[int]:
+        """
+        Write several worksheets into one PDF, with all answer keys at the back.
+
+        The sections share one copy of each embedded font subset, header image
+        and graph template instead of every worksheet carrying its own. Each
+        section gets a bookmark, and its answer key a bookmark under "Answer
+        Keys". Sections are drawn one page at a time as in write_worksheet;
+        sections without problems are left out.
+
+        Args:
+            sections: Iterable of (section title, problems) pairs; problems can be any iterable
+            output: File path or binary file-like object to write the PDF to
+            title: Packet title (PDF metadata)
+            include_answer_key: Whether to add the answer key pages at the end
+            invariant: Leave out the creation date and random document ID
+
+        Returns:
+            Number of problems written for each section
+        """
+        c = canvas.Canvas(output, pagesize=letter, invariant=invariant)
+        c.setTitle(title)
+
+        counts = []
+        answer_keys = []  # (section title, answer key form names)
+        for section_title, problems in sections:
+            problems = iter(problems)
+            first = next(problems, None)
+            if first is None:
+                counts.append(0)
+                continue
+            with tracing.span('packet_section'):
+                if any(counts):
+                    c.showPage()  # Each section starts on a new page
+                key = f"section_{len(counts) + 1}"
+                c.bookmarkPage(key)
+                c.addOutlineEntry(section_title, key, level=0)
+                count, forms = self._draw_worksheet_pages(
+                    c, chain([first], problems), section_title, include_answer_key,
+                    form_prefix=f"answer_key_{len(counts) + 1}_page")
+            counts.append(count)
+            if forms:
+                answer_keys.append((section_title, forms))
+
+        for index, (section_title, forms) in enumerate(answer_keys):
+            for page, form_name in enumerate(forms):
+                c.showPage()
+                if page == 0:
+                    if index == 0:
+                        c.bookmarkPage("answer_keys")
+                        c.addOutlineEntry("Answer Keys", "answer_keys", level=0)
+                    key = f"section_{index + 1}_answers"
+                    c.bookmarkPage(key)
+                    c.addOutlineEntry(section_title, key, level=1)
+                c.doForm(form_name)
+
+        c.showOutline()
+        self._save(c, output)
+        return counts
+
+    @tracing.traced('write_forms')
+    def write_forms(self, generator, difficulty: str, num_problems: int, forms: int = 3,
+                    output=None, title: str = "Math Worksheet", include_answer_key: bool = True,
+                    seed: int = None, combined: bool = False) -> List[tuple]:
+        """
+        Write several equivalent versions (Form A, B, C, ...) of a worksheet in one pass.
+
+        Every form draws from the same generator and difficulty with its own
+        seed, derived from the base seed, title, difficulty and form letter,
+        so a form can be regenerated on its own. All forms are drawn by this
+        PDFWorksheetGenerator, so fonts are parsed, equation images rendered
+        and blank graphs drawn once for all of them; with combined=True the
+        forms also share one embedded copy of each font and header image.
+
+        Args:
+            generator: Generator instance
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            num_problems: Problems per form
+            forms: Number of forms (1 to 26)
+            output: PDF path (required). Separate forms are written next to it with
+                    the form letter added (slope.pdf -> slope_A.pdf, slope_B.pdf, ...);
+                    a combined PDF can also go to a binary file-like object
+            title: Worksheet title; the forms are titled "<title> - Form A", ...
+            include_answer_key: Add each form's answer key
+            seed: Base seed (random if None). With a seed the PDFs are byte-identical between runs
+            combined: Write all forms into one PDF, with the answer keys at the back
+
+        Returns:
+            (form letter, form seed, number of problems) for each form
+
+        Raises:
+            ValueError: If forms is out of range, output is missing, or output is a
+                        file object but the forms are written separately
+        """
+        if not 1 <= forms <= len(FORM_LETTERS):
+            raise ValueError(f"forms must be between 1 and {len(FORM_LETTERS)}, got {forms}")
+        if output is None:
+            raise ValueError("write_forms needs an output path (or a file object with combined=True)")
+        if not combined and not isinstance(output, (str, os.PathLike)):
+            raise ValueError("Separate forms need an output path to name their files after; "
+                             "use combined=True to write to a file object")
+        invariant = seed is not None
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        letters = FORM_LETTERS[:forms]
+        seeds = [derive_seed(seed, title, difficulty, form) for form in letters]
+
+        def form_problems(form_seed):
+            reseed(generator, form_seed)
+            return generate_unique_worksheet(generator, difficulty, num_problems)
+
+        # Reseeding for the forms mustn't change what the caller's generator draws next
+        with preserved_random_state(generator):
+            if combined:
+                sections = ((f"{title} - Form {form}", form_problems(form_seed))
+                            for form, form_seed in zip(letters, seeds))
+                counts = self.write_packet(sections, output, f"{title} - Forms {letters[0]}-{letters[-1]}",
+                                           include_answer_key, invariant)
             else:
-                max_problems_per_page = 10  # Default for linear equations
-        else:
-            max_problems_per_page = 10
+                base, ext = os.path.splitext(os.fspath(output))
+                counts = [self.write_worksheet(form_problems(form_seed), f"{base}_{form}{ext or '.pdf'}",
+                                               f"{title} - Form {form}", include_answer_key, invariant)
+                          for form, form_seed in zip(letters, seeds)]
+        return list(zip(letters, seeds, counts))
+
+    def _draw_worksheet_pages(self, c: canvas.Canvas, problems: Iterable, title: str,
+                              include_answer_key: bool = True, problems_per_page: int = None,
+                              form_prefix: str = "answer_key_page") -> tuple:
+        """
+        Draw worksheet pages for a stream of problems, keeping each answer key page as a form.
+
+        The first page is drawn on the canvas's current page; later pages
+        start new ones.
 
-        # Generate worksheet pages (one page per max_problems_per_page problems)
-        num_worksheet_pages = (len(equations) + max_problems_per_page - 1) // max_problems_per_page
-        for page_idx in range(num_worksheet_pages):
-            if page_idx > 0:
+        Args:
+            c: Canvas to draw on
+            problems: Iterable of problem objects
+            title: Worksheet title
+            include_answer_key: Whether to draw the answer key pages (as forms)
+            problems_per_page: Problems per page (defaults to the layout for the
+                               first problem's type)
+            form_prefix: Start of the answer key form names (unique per document)
+
+        Returns:
+            (number of problems drawn, list of answer key form names)
+        """
+        problems = iter(problems)
+        first = next(problems, None)
+        if problems_per_page is None:
+            problems_per_page = self._problems_per_page(first, title)
+        width, height = letter
+
+        answer_key_forms = []
+        count = 0
+        page_problems = [first] if first is not None else []
+        while page_problems:
+            page_problems.extend(islice(problems, problems_per_page - len(page_problems)))
+            if count:
                 c.showPage()  # Start new page for pages after the first
-            start_idx = page_idx * max_problems_per_page
-            end_idx = min(start_idx + max_problems_per_page, len(equations))
-            page_problems = equations[start_idx:end_idx]
-            self._draw_worksheet_page(c, page_problems, title, width, height, start_problem_number=start_idx + 1)
-
-        if include_answer_key:
-            # Answer key uses the same pagination as the worksheet
-            # This ensures consistency: if worksheet has 8 problems per page, answer key does too
-            problems_per_answer_page = max_problems_per_page
-
-            # Generate answer key pages
-            num_answer_pages = (len(equations) + problems_per_answer_page - 1) // problems_per_answer_page
-            for page_idx in range(num_answer_pages):
-                c.showPage()  # Start new page for answer key
-                start_idx = page_idx * problems_per_answer_page
-                end_idx = min(start_idx + problems_per_answer_page, len(equations))
-                page_problems = equations[start_idx:end_idx]
-                self._draw_answer_key_page(c, page_problems, title, width, height, start_problem_number=start_idx + 1)
-
-        c.save()
-        print(f"Worksheet saved to: {output_path}")
+            self._draw_worksheet_page(c, page_problems, title, width, height,
+                                      start_problem_number=count + 1)
+
+            if include_answer_key:
+                # Answer key uses the same pagination as the worksheet
+                form_name = f"{form_prefix}_{len(answer_key_forms) + 1}"
+                c.beginForm(form_name, 0, 0, width, height)
+                self._draw_answer_key_page(c, page_problems, title, width, height,
+                                           start_problem_number=count + 1)
+                end_form(c)
+                answer_key_forms.append(form_name)
+
+            count += len(page_problems)
+            page_problems = list(islice(problems, problems_per_page))
+        return count, answer_key_forms
+
+    def _save(self, c: canvas.Canvas, output):
+        """Save a finished canvas and record the fonts it embedded."""
+        with tracing.span('save') as span:
+            c.save()
+            if tracing.is_enabled():
+                span.add_bytes(_written_bytes(output))
+        self.last_font_usage = document_font_usage(c)
+
+    def worksheet_pdf_chunks(self, problems: Iterable, title: str = "Math Worksheet",
+                             include_answer_key: bool = True, invariant: bool = False,
+                             chunk_size: int = 64 * 1024):
+        """
+        A finished worksheet PDF, cut into chunks of bytes (e.g. for a chunked HTTP response).
+
+        This is not streaming: the whole PDF is written to memory first (see
+        write_worksheet), and the first chunk is only yielded after the last
+        page has been drawn and the document saved.
+
+        Args:
+            problems: Iterable of problem objects
+            title: Worksheet title
+            include_answer_key: Whether to add answer key pages at the end
+            invariant: Leave out the creation date and random document ID
+            chunk_size: Maximum size of each chunk in bytes
+
+        Yields:
+            bytes
+        """
+        buf = io.BytesIO()
+        self.write_worksheet(problems, buf, title, include_answer_key, invariant)
+        view = buf.getbuffer()
+        try:
+            for start in range(0, len(view), chunk_size):
+                yield bytes(view[start:start + chunk_size])
+        finally:
+            view.release()
 
+    def _problems_per_page(self, first_problem, title: str) -> int:
+        """
+        Problems per worksheet page, based on the title and the first problem's type.
+
+        Args:
+            first_problem: First problem of the worksheet (None if there are none)
+            title: Worksheet title
+
+        Returns:
+            Maximum number of problems per page
+        """
+        # Challenge worksheets always use 8 problems per page
+        if "Challenge" in title:
+            return 8
+        if first_problem is None:
+            return 10
+
+        return layout_for(first_problem).problems_per_page()
+
+    @tracing.traced('draw_page')
     def _draw_worksheet_page(self, c: canvas.Canvas, equations: List[Union[Equation, SystemProblem, InequalityProblem, CompoundInequalityProblem, PropertyProblem, WordProblem, MultiStepEquation]],
                             title: str, width: float, height: float, start_problem_number: int = 1):
         """Draw the main worksheet page with problems."""
         # Header with logo in top right
         y_pos = height - 0.5 * inch
 
-        # Draw QR code in top left corner
-        try:
-            base_dir = get_base_path()
-            qr_path = os.path.join(base_dir, 'src', 'icons', 'freshmath_qr.png')
-
-            if os.path.exists(qr_path):
-                qr_size = 0.55 * inch  # QR code size (0.55 x 0.55 inches)
-                # Position 0.25 inches from top and left edges
-                qr_x = 0.25 * inch
-                qr_y = height - 0.25 * inch - qr_size  # 0.25" from top
-
-                c.drawImage(qr_path, qr_x, qr_y, width=qr_size, height=qr_size,
-                           preserveAspectRatio=True, mask='auto')
-        except Exception as e:
-            pass  # Silently skip if QR code not available
+        # QR code and logo are re-encoded for every document
+        with tracing.span('header_images'):
+            # Draw QR code in top left corner
+            try:
+                base_dir = get_base_path()
+                qr_path = os.path.join(base_dir, 'src', 'icons', 'freshmath_qr.png')
 
-        # Draw logo in top right (0.6 inches)
-        try:
-            base_dir = get_base_path()
-            logo_path = os.path.join(base_dir, 'src', 'icons', 'FreshMath_V3',
-                                     'Black', 'FreshMath_Black_Secondary.png')
+                if os.path.exists(qr_path):
+                    qr_size = 0.55 * inch  # QR code size (0.55 x 0.55 inches)
+                    # Position 0.25 inches from top and left edges
+                    qr_x = 0.25 * inch
+                    qr_y = height - 0.25 * inch - qr_size  # 0.25" from top
 
-            if os.path.exists(logo_path):
-                logo_size = 0.6 * inch  # 0.6 x 0.6 inches
-                # Position in top right corner with margin
-                logo_x = width - logo_size - 0.25 * inch
-                logo_y = y_pos - logo_size + 0.3 * inch  # Adjust vertical alignment
+                    c.drawImage(qr_path, qr_x, qr_y, width=qr_size, height=qr_size,
+                               preserveAspectRatio=True, mask='auto')
+            except Exception as e:
+                pass  # Silently skip if QR code not available
 
-                c.drawImage(logo_path, logo_x, logo_y, width=logo_size, height=logo_size,
-                           preserveAspectRatio=True, mask='auto')
-        except Exception as e:
-            print(f"Warning: Could not load logo: {e}")
+            # Draw logo in top right (0.6 inches)
+            try:
+                base_dir = get_base_path()
+                logo_path = os.path.join(base_dir, 'src', 'icons', 'FreshMath_V3',
+                                         'Black', 'FreshMath_Black_Secondary.png')
+
+                if os.path.exists(logo_path):
+                    logo_size = 0.6 * inch  # 0.6 x 0.6 inches
+                    # Position in top right corner with margin
+                    logo_x = width - logo_size - 0.25 * inch
+                    logo_y = y_pos - logo_size + 0.3 * inch  # Adjust vertical alignment
+
+                    c.drawImage(logo_path, logo_x, logo_y, width=logo_size, height=logo_size,
+                               preserveAspectRatio=True, mask='auto')
+            except Exception as e:
+                print(f"Warning: Could not load logo: {e}")
 
         # Header fields - use Poppins if available, else Lexend
         try:
@@ -938,132 +1151,9 @@ class PDFWorksheetGenerator:
         # Reserve space for instructions (will be drawn after problem type detection)
         instructions_y_pos = y_pos - 0.3 * inch
 
-        # Detect problem type and get configuration
-        if equations and isinstance(equations[0], SystemProblem):
-            problem_type = 'system_of_equations'
-            is_system = True
-            is_inequality = False
-            is_property = False
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = False
-            is_evaluating = False
-            is_substitution = False
-        elif equations and (isinstance(equations[0], InequalityProblem) or isinstance(equations[0], CompoundInequalityProblem)):
-            problem_type = 'inequality'
-            is_system = False
-            is_inequality = True
-            is_property = False
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = False
-            is_evaluating = False
-            is_substitution = False
-        elif equations and isinstance(equations[0], PropertyProblem):
-            # Detect which type of properties: add/subtract or mult/div
-            if equations[0].property_type in ['multiplication', 'division']:
-                problem_type = 'properties_mult_div'
-            else:
-                problem_type = 'properties_of_equality'
-            is_system = False
-            is_inequality = False
-            is_property = True
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = False
-        elif equations and isinstance(equations[0], WordProblem):
-            problem_type = 'word_problems'
-            is_system = False
-            is_inequality = False
-            is_property = False
-            is_word_problem = True
-            is_multistep = False
-            is_graphing = False
-        elif equations and isinstance(equations[0], MultiStepEquation):
-            problem_type = 'multistep_equations'
-            is_system = False
-            is_inequality = False
-            is_property = False
-            is_word_problem = False
-            is_multistep = True
-            is_graphing = False
-            is_evaluating = False
-            is_substitution = False
-        elif equations and isinstance(equations[0], EvaluatingProblem):
-            problem_type = 'linear_equation'
-            is_system = False
-            is_inequality = False
-            is_property = False
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = False
-            is_evaluating = True
-            is_substitution = False
-        elif equations and isinstance(equations[0], SubstitutionProblem):
-            problem_type = 'linear_equation'
-            is_system = False
-            is_inequality = False
-            is_property = False
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = False
-            is_evaluating = False
-            is_substitution = True
-        elif equations and (isinstance(equations[0], GraphingPointsProblem) or
-                           isinstance(equations[0], GraphingLineProblem) or
-                           isinstance(equations[0], SlopeInterceptProblem) or
-                           isinstance(equations[0], PointSlopeProblem) or
-                           isinstance(equations[0], StandardFormProblem)):
-            # Determine specific problem type
-            if isinstance(equations[0], GraphingPointsProblem):
-                problem_type = 'graphing_points'
-            elif isinstance(equations[0], GraphingLineProblem):
-                problem_type = 'graphing_lines'
-            elif isinstance(equations[0], SlopeInterceptProblem):
-                problem_type = 'slope_intercept'
-            elif isinstance(equations[0], PointSlopeProblem):
-                problem_type = 'point_slope'
-            else:  # StandardFormProblem
-                problem_type = 'standard_form'
-            is_system = False
-            is_inequality = False
-            is_property = False
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = True
-            is_evaluating = False
-            is_substitution = False
-        elif equations and isinstance(equations[0], GraphingSystemProblem):
-            problem_type = 'graphing_systems'
-            is_system = False
-            is_inequality = False
-            is_property = False
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = True
-            is_evaluating = False
-            is_substitution = False
-        elif equations and isinstance(equations[0], ParabolaGraphingProblem):
-            problem_type = 'graphing_parabolas'
-            is_system = False
-            is_inequality = False
-            is_property = False
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = True
-            is_evaluating = False
-            is_substitution = False
-        else:
-            problem_type = 'linear_equation'
-            is_system = False
-            is_inequality = False
-            is_property = False
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = False
-            is_evaluating = False
-            is_substitution = False
-
+        # The first problem picks the page's layout
+        layout = layout_for(equations[0] if equations else None)
+        problem_type = layout.config_key(equations[0] if equations else None)
         config = get_config(problem_type)
 
         # Draw instructions below title in italics (universal for all worksheets)
@@ -1085,119 +1175,23 @@ class PDFWorksheetGenerator:
         # Calculate usable vertical space with bleed edge and static padding
         header_end = y_pos  # Current position after instructions
         footer_start = self.BOTTOM_MARGIN + self.BLEED_EDGE + self.BOTTOM_PADDING  # 0.625" + 1.0" = 1.625"
-        usable_space = header_end - footer_start
 
         # Use configuration for layout
         problems_per_page = min(len(equations), config.problems_per_page)
 
-        # Determine problems per column based on problem type
-        if is_inequality or is_system:
-            # Calculate actual number of rows needed (2 columns)
-            num_rows = (problems_per_page + 1) // 2  # Ceiling division for 2-column layout
-            problems_per_column = num_rows  # Each column gets this many problems
-        elif is_graphing:
-            problems_per_column = 2  # 2 columns × 2 rows
-            num_rows = 2  # 2 rows for spacing calculation (not problems per column)
-        elif problems_per_page == 8:
-            # For any 8-problem worksheet, use 2-column layout with 4 rows
-            # This gives the same compact spacing as inequalities
-            num_rows = 4  # 4 rows for spacing calculation
-            problems_per_column = 4  # Each column gets 4 problems
-        else:  # linear equations with more than 8 problems
-            problems_per_column = 5  # First two columns have 5 problems
-            num_rows = 5  # 5 rows for spacing calculation
-
         # Calculate dynamic spacing based on number of rows
         # For 2-column layouts, we need spacing between rows, not between all problems
-        actual_problems_first_column = min(problems_per_page, problems_per_column)
         spacing = self._calculate_dynamic_spacing(
             problem_type,
-            num_rows,
+            layout.worksheet_rows(problems_per_page),
             header_end,
             footer_start
         )
 
-        x_start = 1 * inch
         y_start = y_pos
 
         for idx, equation in enumerate(equations[:problems_per_page]):
-            # Layout for different problem types - LEFT TO RIGHT ordering
-            if is_inequality:
-                # Inequalities: 2 columns x 4 rows (left-to-right: 1,2 in row 1, 3,4 in row 2, etc.)
-                row = idx // 2
-                col = idx % 2
-                if col == 0:
-                    x_start = 1 * inch
-                    if row == 0:
-                        y_pos = y_start
-                    else:
-                        y_pos = y_start - (row * spacing)
-                else:
-                    x_start = 4.25 * inch
-                    # y_pos stays same as left column
-            elif is_system:
-                # Systems: 2 columns x 4 rows (left-to-right)
-                row = idx // 2
-                col = idx % 2
-                if col == 0:
-                    x_start = 1 * inch
-                    if row == 0:
-                        y_pos = y_start
-                    else:
-                        y_pos = y_start - (row * spacing)
-                else:
-                    x_start = 4.25 * inch
-                    # y_pos stays same as left column
-            elif is_graphing:
-                # Graphing: 2 columns x 2 rows (left-to-right: 1,2 in row 1, 3,4 in row 2)
-                row = idx // 2
-                col = idx % 2
-                if col == 0:
-                    x_start = 1 * inch
-                    if row == 0:
-                        y_pos = y_start
-                    else:
-                        y_pos = y_start - (row * spacing)
-                else:
-                    x_start = 4.25 * inch
-                    # y_pos stays same as left column
-            elif is_word_problem:
-                # Word problems: single column layout (one problem per row)
-                x_start = 1 * inch
-                if idx == 0:
-                    y_pos = y_start
-                else:
-                    y_pos -= spacing
-            else:
-                # Regular equations: 2 columns layout with left-to-right ordering
-                # Problems fill left-to-right: 1,2 in row 1, 3,4 in row 2, etc.
-                if problems_per_page == 8:
-                    # For 8 problems: use 2 columns x 4 rows (same as inequalities)
-                    row = idx // 2
-                    col = idx % 2
-                    if col == 0:
-                        x_start = 1 * inch
-                    else:
-                        x_start = 4.5 * inch
-                    y_pos = y_start - (row * spacing)
-                else:
-                    # For more than 8 problems (typically 10-15): use 2 columns x 5 rows
-                    # After 10 problems (5 rows x 2 columns), continue at top of page below the first set
-                    if idx < 10:
-                        # First 10 problems: 2 columns x 5 rows
-                        row = idx // 2
-                        col = idx % 2
-                        if col == 0:
-                            x_start = 1 * inch
-                        else:
-                            x_start = 4.5 * inch
-                        y_pos = y_start - (row * spacing)
-                    else:
-                        # Problems 11-15: continue below in left column
-                        adjusted_idx = idx - 10
-                        row = adjusted_idx
-                        x_start = 1 * inch
-                        y_pos = y_start - ((5 + row) * spacing)
+            x_start, y_pos = layout.worksheet_position(idx, problems_per_page, y_start, y_pos, spacing)
 
             # Problem number and equation text - use Lexend
             try:
@@ -1205,170 +1199,7 @@ class PDFWorksheetGenerator:
             except:
                 c.setFont("Helvetica", 12)
 
-            if is_inequality:
-                # For inequalities: display equation as plain text next to problem number
-                # Convert LaTeX to plain text
-                latex = self._get_problem_latex(equation)
-                plain_text = latex.replace('\\leq', '≤').replace('\\geq', '≥').replace('\\text{ or }', ' or ').replace('\\', '')
-                c.drawString(x_start, y_pos, f"{start_problem_number + idx}. {plain_text}")
-            elif is_system:
-                # For systems: display both equations as plain text
-                # Convert LaTeX to plain text
-                if isinstance(equation, (SubstitutionSystemProblem, EliminationSystemProblem)):
-                    eq1_plain = getattr(equation, 'equation1', getattr(equation, 'equation1_latex', '')).replace('\\', '')
-                    eq2_plain = getattr(equation, 'equation2', getattr(equation, 'equation2_latex', '')).replace('\\', '')
-                else:
-                    eq1_plain = equation.equation1_latex.replace('\\', '')
-                    eq2_plain = equation.equation2_latex.replace('\\', '')
-                c.drawString(x_start, y_pos, f"{start_problem_number + idx}. {eq1_plain}")
-                c.drawString(x_start + 0.25 * inch, y_pos - 0.25 * inch, eq2_plain)
-            elif is_property:
-                # For properties: display equation with proper fraction rendering
-                c.setFont('Lexend', 12)
-                c.drawString(x_start, y_pos, f"{start_problem_number + idx}.")
-                # Draw equation with fractions properly rendered
-                latex = self._get_problem_latex(equation)
-                width_used, height_used = self._draw_equation_with_fractions(c, latex, x_start + 0.25 * inch, y_pos, 12, max_width=3.0 * inch)
-                c.drawString(x_start, y_pos - 0.35 * inch, "Property:")
-            elif is_word_problem or hasattr(equation, 'problem_text'):
-                # For word problems: display the problem text with wrapping
-                # Draw problem number first
-                c.drawString(x_start, y_pos, f"{start_problem_number + idx}.")
-                # Wrap and draw the problem text (full page width minus margins)
-                problem_text = getattr(equation, 'problem_text', self._get_problem_latex(equation))
-                text_end_y = self._wrap_text(c, problem_text, x_start + 0.25 * inch, y_pos, 6.0, line_height=0.18)
-                # Add blank lines for students to write equation and solve
-                c.drawString(x_start + 0.25 * inch, text_end_y - 0.15 * inch, "Equation: _______________________")
-                c.drawString(x_start + 0.25 * inch, text_end_y - 0.4 * inch, "Solution: _______________________")
-            elif is_graphing:
-                # For graphing problems: display coordinate plane
-                c.drawString(x_start, y_pos, f"{start_problem_number + idx}.")
-
-                # For graphing points: display the points to plot as text
-                if hasattr(equation, 'labels'):
-                    c.setFont("Lexend", 10)
-                    points_text = ", ".join(equation.labels)
-                    # Column width is ~3.5 inches, wrap text to fit
-                    text_y = self._wrap_text(c, points_text, x_start + 0.25 * inch, y_pos, 3.0, line_height=0.15)
-                elif hasattr(equation, 'equation_latex'):
-                    # For parabolas: display equation as LaTeX image
-                    try:
-                        img = self.render_latex_to_image(equation.equation_latex, 21)  # 21pt font
-                        # Align the equation image vertically centered with the problem number
-                        c.drawImage(
-                            img,
-                            x_start + 0.25 * inch,
-                            y_pos - 0.09 * inch,  # Reduced offset to align better with 12pt problem numbers
-                            width=2.5 * inch,
-                            height=0.28 * inch,  # Adjusted for 21pt font
-                            preserveAspectRatio=True,
-                            mask='auto'
-                        )
-                        text_y = y_pos - 0.37 * inch
-                    except Exception as e:
-                        print(f"Warning: Failed to render parabola equation: {e}")
-                        text_y = y_pos
-                elif hasattr(equation, 'equation1_latex'):
-                    # For systems: display both equations as aligned LaTeX image
-                    try:
-                        system_img = self.render_system_to_image(equation.equation1_latex, equation.equation2_latex, 21)
-                        c.drawImage(
-                            system_img,
-                            x_start + 0.25 * inch,
-                            y_pos - 0.25 * inch,
-                            width=2.5 * inch,
-                            height=0.6 * inch,
-                            preserveAspectRatio=True,
-                            mask='auto'
-                        )
-                        text_y = y_pos - 0.85 * inch
-                    except Exception as e:
-                        print(f"Warning: Failed to render system equations: {e}")
-                        text_y = y_pos
-                else:
-                    text_y = y_pos
-
-                # Draw the blank worksheet image (coordinate plane)
-                try:
-                    c.drawImage(
-                        ImageReader(equation.worksheet_image),
-                        x_start,
-                        text_y - config.image_height * inch - 0.15 * inch,
-                        width=config.image_width * inch,
-                        height=config.image_height * inch,
-                        preserveAspectRatio=True
-                    )
-                except Exception as e:
-                    print(f"Warning: Failed to render graphing worksheet image: {e}")
-            else:
-                # For regular equations: check if they have fractions or are text-heavy
-                # First convert LaTeX symbols to Unicode BEFORE stripping backslashes
-                plain_text = equation.latex
-                # Convert math symbols to Unicode equivalents
-                plain_text = re.sub(r'\\sqrt\[3\]\{([^}]+)\}', r'∛\1', plain_text)  # Cube root
-                plain_text = re.sub(r'\\sqrt\{([^}]+)\}', r'√\1', plain_text)  # Square root
-                plain_text = plain_text.replace('\\pi', 'π')  # Pi
-                plain_text = plain_text.replace('\\approx', '≈')  # Approximately
-                plain_text = plain_text.replace('\\cdot', '·')  # Middle dot
-                plain_text = plain_text.replace('\\times', '×')  # Multiplication
-                plain_text = plain_text.replace('\\lt', '<')  # Less than
-                plain_text = plain_text.replace('\\gt', '>')  # Greater than
-                plain_text = plain_text.replace('\\leq', '≤')  # Less than or equal
-                plain_text = plain_text.replace('\\geq', '≥')  # Greater than or equal
-                plain_text = plain_text.replace('\\left', '')  # Remove sizing commands
-                plain_text = plain_text.replace('\\right', '')
-                # Now remove remaining backslashes
-                plain_text = plain_text.replace('\\', '')
-                # Remove text{} wrappers: text{content} -> content
-                plain_text = re.sub(r'text\{([^}]*)\}', r'\1', plain_text)
-
-                # Check if this is a text-heavy problem that needs wrapping
-                text_indicators = ['If ', 'Is ', 'Find ', 'Which ', 'Verify', 'Input:', 'Rule:', 'Output:', 'Evaluate', 'Between ', 'Approximate ', 'Order ']
-                needs_wrapping = any(indicator in plain_text for indicator in text_indicators)
-
-                if needs_wrapping:
-                    # Text-heavy problem: draw number, then wrap text
-                    # For text-heavy, convert fractions to slash notation
-                    plain_text = re.sub(r'frac\{([^}]+)\}\{([^}]+)\}', r'\1/\2', plain_text)
-                    c.drawString(x_start, y_pos, f"{start_problem_number + idx}.")
-                    # Wrap text to fit column width (3.0 inches for 3-column layout)
-                    self._wrap_text(c, plain_text, x_start + 0.25 * inch, y_pos, 3.0, line_height=0.18)
-                else:
-                    # Simple equation: draw with proper fraction rendering
-                    # Note: Equations use same 12pt font as problem numbers (not 21pt)
-                    c.setFont('Lexend', 12)
-                    c.drawString(x_start, y_pos, f"{start_problem_number + idx}.")
-                    # Draw equation with fractions (using 12pt to match other simple equations)
-                    # Pass max_width of 3.0 inches to prevent overflow
-                    width_used, height_used = self._draw_equation_with_fractions(c, equation.latex, x_start + 0.25 * inch, y_pos, 12, max_width=3.0 * inch)
-
-            # Render number line for inequalities only
-            if is_inequality:
-                try:
-                    # Inequality: use worksheet image (blank number line)
-                    img = ImageReader(equation.worksheet_image)
-
-                    # Number line width - slightly shorter than full column
-                    numberline_width = 3.5 * inch
-                    # Calculate height based on aspect ratio (8" wide x 1.2" tall for number line only)
-                    natural_height = (1.2 / 8.0) * numberline_width
-                    # Position number line below the equation text (moved 0.25" closer)
-                    c.drawImage(
-                        img,
-                        x_start - 0.15 * inch,  # Moved 0.25" left from previous 0.1"
-                        y_pos - 0.10 * inch - natural_height,  # Below equation text, 0.25" closer than before
-                        width=numberline_width,
-                        height=natural_height,
-                        preserveAspectRatio=True
-                    )
-                except Exception as e:
-                    print(f"Warning: Number line rendering failed: {e}")
-
-            # Only decrement y_pos for specific layouts
-            # For 2-column layouts (systems, inequalities, graphing), don't decrement here
-            # The row calculation handles y positioning
-            if not (is_system or is_inequality or is_graphing or is_word_problem):
-                y_pos -= spacing
+            layout.draw_problem(self, c, equation, start_problem_number + idx, x_start, y_pos, config)
 
         # Footer - use Lexend
         try:
@@ -1398,6 +1229,7 @@ class PDFWorksheetGenerator:
             # Silently fail if logo can't be loaded
             print(f"Note: Could not load Fresh Math logo: {e}")
 
+    @tracing.traced('draw_answer_key')
     def _draw_answer_key_page(self, c: canvas.Canvas, equations: List[Union[Equation, SystemProblem, InequalityProblem, CompoundInequalityProblem, PropertyProblem, WordProblem, MultiStepEquation]],
                              title: str, width: float, height: float, start_problem_number: int = 1):
         """Draw the answer key page with same layout as worksheet, answers in red."""
@@ -1452,132 +1284,9 @@ class PDFWorksheetGenerator:
 
         c.drawCentredString(width / 2, y_pos, f"{display_title} - Answer Key")
 
-        # Detect problem type and get configuration
-        if equations and isinstance(equations[0], SystemProblem):
-            problem_type = 'system_of_equations'
-            is_system = True
-            is_inequality = False
-            is_property = False
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = False
-            is_evaluating = False
-            is_substitution = False
-        elif equations and (isinstance(equations[0], InequalityProblem) or isinstance(equations[0], CompoundInequalityProblem)):
-            problem_type = 'inequality'
-            is_system = False
-            is_inequality = True
-            is_property = False
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = False
-            is_evaluating = False
-            is_substitution = False
-        elif equations and isinstance(equations[0], PropertyProblem):
-            # Detect which type of properties: add/subtract or mult/div
-            if equations[0].property_type in ['multiplication', 'division']:
-                problem_type = 'properties_mult_div'
-            else:
-                problem_type = 'properties_of_equality'
-            is_system = False
-            is_inequality = False
-            is_property = True
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = False
-        elif equations and isinstance(equations[0], WordProblem):
-            problem_type = 'word_problems'
-            is_system = False
-            is_inequality = False
-            is_property = False
-            is_word_problem = True
-            is_multistep = False
-            is_graphing = False
-        elif equations and isinstance(equations[0], MultiStepEquation):
-            problem_type = 'multistep_equations'
-            is_system = False
-            is_inequality = False
-            is_property = False
-            is_word_problem = False
-            is_multistep = True
-            is_graphing = False
-            is_evaluating = False
-            is_substitution = False
-        elif equations and isinstance(equations[0], EvaluatingProblem):
-            problem_type = 'linear_equation'
-            is_system = False
-            is_inequality = False
-            is_property = False
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = False
-            is_evaluating = True
-            is_substitution = False
-        elif equations and isinstance(equations[0], SubstitutionProblem):
-            problem_type = 'linear_equation'
-            is_system = False
-            is_inequality = False
-            is_property = False
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = False
-            is_evaluating = False
-            is_substitution = True
-        elif equations and (isinstance(equations[0], GraphingPointsProblem) or
-                           isinstance(equations[0], GraphingLineProblem) or
-                           isinstance(equations[0], SlopeInterceptProblem) or
-                           isinstance(equations[0], PointSlopeProblem) or
-                           isinstance(equations[0], StandardFormProblem)):
-            # Determine specific problem type
-            if isinstance(equations[0], GraphingPointsProblem):
-                problem_type = 'graphing_points'
-            elif isinstance(equations[0], GraphingLineProblem):
-                problem_type = 'graphing_lines'
-            elif isinstance(equations[0], SlopeInterceptProblem):
-                problem_type = 'slope_intercept'
-            elif isinstance(equations[0], PointSlopeProblem):
-                problem_type = 'point_slope'
-            else:  # StandardFormProblem
-                problem_type = 'standard_form'
-            is_system = False
-            is_inequality = False
-            is_property = False
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = True
-            is_evaluating = False
-            is_substitution = False
-        elif equations and isinstance(equations[0], GraphingSystemProblem):
-            problem_type = 'graphing_systems'
-            is_system = False
-            is_inequality = False
-            is_property = False
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = True
-            is_evaluating = False
-            is_substitution = False
-        elif equations and isinstance(equations[0], ParabolaGraphingProblem):
-            problem_type = 'graphing_parabolas'
-            is_system = False
-            is_inequality = False
-            is_property = False
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = True
-            is_evaluating = False
-            is_substitution = False
-        else:
-            problem_type = 'linear_equation'
-            is_system = False
-            is_inequality = False
-            is_property = False
-            is_word_problem = False
-            is_multistep = False
-            is_graphing = False
-            is_evaluating = False
-            is_substitution = False
-
+        # The first problem picks the page's layout
+        layout = layout_for(equations[0] if equations else None)
+        problem_type = layout.config_key(equations[0] if equations else None)
         config = get_config(problem_type)
 
         # Start drawing problems - use same layout as worksheet
@@ -1590,460 +1299,20 @@ class PDFWorksheetGenerator:
         # Calculate usable vertical space with bleed edge and static padding (same as worksheet)
         header_end = y_pos
         footer_start = self.BOTTOM_MARGIN + self.BLEED_EDGE + self.BOTTOM_PADDING
-        usable_space = header_end - footer_start
 
         # Use configuration for layout
         problems_per_page = min(len(equations), config.problems_per_page)
 
-        # Determine problems per column based on problem type
-        if is_inequality or is_system:
-            # Calculate actual number of rows needed (2 columns)
-            num_rows_answer = (problems_per_page + 1) // 2  # Ceiling division for 2-column layout
-            problems_per_column = num_rows_answer  # Each column gets this many problems
-        elif is_graphing:
-            problems_per_column = 2  # 2 columns × 2 rows
-            num_rows_answer = 2
-        else:  # linear equations
-            problems_per_column = 5  # First two columns have 5 problems
-            num_rows_answer = 5
-
         # Calculate dynamic spacing for rows (same as worksheet)
         spacing = self._calculate_dynamic_spacing(
             problem_type,
-            num_rows_answer,
+            layout.answer_rows(problems_per_page),
             header_end,
             footer_start
         )
 
-        x_start = 1 * inch
-        y_start = y_pos
-
-        if is_inequality:
-            # For inequalities: show number lines with solutions in 2-column layout
-            for idx, equation in enumerate(equations[:problems_per_page]):
-                # Layout: 2 columns x 4 rows (TOP-TO-BOTTOM: 1,3,5,7 in col 1, 2,4,6,8 in col 2)
-                col = idx // problems_per_column
-                row = idx % problems_per_column
-
-                if col == 0:
-                    x_start = 1 * inch
-                else:
-                    x_start = 4.25 * inch
-
-                y_pos = y_start - (row * spacing)
-
-                # Problem number and equation text (matching worksheet format) - use Lexend
-                try:
-                    c.setFont("Lexend", 12)
-                except:
-                    c.setFont("Helvetica", 12)
-                # Convert LaTeX to plain text
-                symbol_map = {
-                    '\\leq': '≤',
-                    '\\geq': '≥',
-                    '<': '<',
-                    '>': '>'
-                }
-                plain_text = equation.latex.replace('\\leq', '≤').replace('\\geq', '≥').replace('\\text{ or }', ' or ').replace('\\', '')
-                c.drawString(x_start, y_pos, f"{start_problem_number + idx}. {plain_text}")
-
-                # Render solved number line with solution
-                try:
-                    # Use answer image (number line with solution)
-                    img = ImageReader(equation.answer_image)
-
-                    # Draw number line (moved 0.25" closer to equation text)
-                    numberline_width = 3.5 * inch
-                    natural_height = (1.2 / 8.0) * numberline_width
-                    image_bottom = y_pos - 0.10 * inch - natural_height
-                    c.drawImage(
-                        img,
-                        x_start - 0.15 * inch,  # Moved 0.25" left from previous 0.1"
-                        image_bottom,
-                        width=numberline_width,
-                        height=natural_height,
-                        preserveAspectRatio=True
-                    )
-
-                    # Draw algebraic solution below the number line in RED (only for simple inequalities)
-                    if hasattr(equation, 'solution'):
-                        # Simple inequality - show algebraic solution
-                        try:
-                            c.setFont("Lexend", 12)
-                        except:
-                            c.setFont("Helvetica", 12)
-                        ineq_symbol = symbol_map.get(equation.inequality_type, equation.inequality_type)
-                        solution = self._get_problem_solution(equation)
-                        if isinstance(solution, (int, float)):
-                            if solution == int(solution):
-                                solution_str = f"x {ineq_symbol} {int(solution)}"
-                            else:
-                                solution_str = f"x {ineq_symbol} {solution:.2f}"
-                        else:
-                            solution_str = str(solution)
-
-                        # Set color to red for the solution
-                        c.setFillColorRGB(1, 0, 0)  # Red color
-                        c.drawString(x_start + 0.1 * inch, image_bottom - 0.25 * inch, solution_str)
-                        c.setFillColorRGB(0, 0, 0)  # Reset to black
-
-                except Exception as e:
-                    print(f"Warning: Answer key rendering failed: {e}")
-
-                y_pos -= spacing
-
-        elif is_system:
-            # For systems: 2 columns x 4 rows layout with answers in red
-            for idx, equation in enumerate(equations[:problems_per_page]):
-                # Layout: 2 columns x 4 rows (LEFT-TO-RIGHT: 1,2 in row 1, 3,4 in row 2, etc.)
-                row = idx // 2
-                col = idx % 2
-
-                # Calculate position based on row and column
-                if col == 0:
-                    x_start = 1 * inch
-                else:
-                    x_start = 4.25 * inch
-
-                # y_pos is calculated from row position (same for both columns in the row)
-                y_pos = y_start - (row * spacing)
-
-                # Display problem number and both equations as plain text
-                try:
-                    c.setFont("Lexend", 12)
-                except:
-                    c.setFont("Helvetica", 12)
-
-                eq1_plain = equation.equation1_latex.replace('\\', '')
-                eq2_plain = equation.equation2_latex.replace('\\', '')
-                c.drawString(x_start, y_pos, f"{start_problem_number + idx}. {eq1_plain}")
-                c.drawString(x_start + 0.25 * inch, y_pos - 0.25 * inch, eq2_plain)
-
-                # Display answer in RED below the equations
-                c.setFillColorRGB(1, 0, 0)  # Red color
-                solution = self._get_problem_solution(equation)
-                c.drawString(x_start + 0.25 * inch, y_pos - 0.55 * inch, str(solution))
-                c.setFillColorRGB(0, 0, 0)  # Reset to black
-
-        elif is_property:
-            # For properties: 2 columns x 5 rows layout with answers in red
-            for idx, equation in enumerate(equations[:problems_per_page]):
-                # Layout: 2 columns x 5 rows (LEFT-TO-RIGHT: 1,2 in row 1, 3,4 in row 2, etc.)
-                row = idx // 2
-                col = idx % 2
-
-                # Calculate position based on row and column
-                if col == 0:
-                    x_start = 1 * inch
-                else:
-                    x_start = 4.25 * inch
-
-                # y_pos is calculated from row position (same for both columns in the row)
-                y_pos = y_start - (row * spacing)
-
-                # Display problem equation with proper fraction rendering
-                try:
-                    c.setFont("Lexend", 12)
-                except:
-                    c.setFont("Helvetica", 12)
-
-                c.drawString(x_start, y_pos, f"{start_problem_number + idx}.")
-                # Draw equation with fractions properly rendered
-                width_used, height_used = self._draw_equation_with_fractions(c, equation.latex, x_start + 0.25 * inch, y_pos, 12, max_width=3.0 * inch)
-
-                # Display property name and solution in RED
-                c.setFillColorRGB(1, 0, 0)  # Red color
-                property_type = getattr(equation, 'property_type', 'Unknown')
-                # Abbreviate property types to fit in column
-                property_abbrev = {
-                    'addition': 'Add',
-                    'subtraction': 'Sub',
-                    'multiplication': 'Mult',
-                    'division': 'Div',
-                    'combined (subtraction then division)': 'Sub+Div',
-                    'combined (addition then division)': 'Add+Div'
-                }
-                prop_text = property_abbrev.get(property_type.lower(), property_type)
-                # Draw property name and solution on separate lines to avoid overflow
-                c.drawString(x_start, y_pos - 0.35 * inch, f"{prop_text} Property")
-                c.drawString(x_start, y_pos - 0.55 * inch, f"x = {equation.solution}")
-                c.setFillColorRGB(0, 0, 0)  # Reset to black
-
-        elif is_word_problem:
-            # For word problems: single column layout with answers in red
-            for idx, equation in enumerate(equations[:problems_per_page]):
-                # Display problem text with wrapping
-                try:
-                    c.setFont("Lexend", 12)
-                except:
-                    c.setFont("Helvetica", 12)
-
-                # Draw problem number first
-                c.drawString(x_start, y_pos, f"{start_problem_number + idx}.")
-                # Wrap and draw the problem text (full page width minus margins)
-                problem_text = getattr(equation, 'problem_text', equation.latex)
-                text_end_y = self._wrap_text(c, problem_text, x_start + 0.25 * inch, y_pos, 6.0, line_height=0.18)
-
-                # Display equation and solution in RED
-                c.setFillColorRGB(1, 0, 0)  # Red color
-                c.drawString(x_start + 0.25 * inch, text_end_y - 0.15 * inch, f"Equation: {equation.equation}")
-                c.drawString(x_start + 0.25 * inch, text_end_y - 0.4 * inch, f"Solution: x = {equation.solution}")
-                c.setFillColorRGB(0, 0, 0)  # Reset to black
-
-                # Update y_pos to be below the answer we just drew, with additional spacing
-                y_pos = text_end_y - 0.6 * inch  # Position below solution with extra padding
-
-        elif is_graphing:
-            # For graphing problems: 2 columns x 2 rows layout with plotted points
-            for idx, equation in enumerate(equations[:problems_per_page]):
-                # Layout: 2 columns x 2 rows (LEFT-TO-RIGHT: 1,2 in row 1, 3,4 in row 2)
-                row = idx // 2
-                col = idx % 2
-                if col == 0:
-                    x_start = 1 * inch
-                    if row == 0:
-                        y_pos = y_start
-                    else:
-                        y_pos = y_start - (row * spacing)
-                else:
-                    x_start = 4.25 * inch
-                    # y_pos stays same as left column
-
-                # Display problem number and points
-                try:
-                    c.setFont("Lexend", 12)
-                except:
-                    c.setFont("Helvetica", 12)
-
-                c.drawString(x_start, y_pos, f"{start_problem_number + idx}.")
-
-                # For graphing points: display the points with solutions
-                if hasattr(equation, 'labels'):
-                    c.setFont("Lexend", 10)
-                    points_text = ", ".join(equation.labels)
-                    text_y = self._wrap_text(c, points_text, x_start + 0.25 * inch, y_pos, 3.0, line_height=0.15)
-                elif hasattr(equation, 'equation_latex'):
-                    # For parabolas: display equation as LaTeX image
-                    try:
-                        img = self.render_latex_to_image(equation.equation_latex, 21)  # 21pt font
-                        # Align the equation image vertically centered with the problem number
-                        c.drawImage(
-                            img,
-                            x_start + 0.25 * inch,
-                            y_pos - 0.09 * inch,  # Reduced offset to align better with 12pt problem numbers
-                            width=2.5 * inch,
-                            height=0.28 * inch,  # Adjusted for 21pt font
-                            preserveAspectRatio=True,
-                            mask='auto'
-                        )
-                        text_y = y_pos - 0.37 * inch
-                    except Exception as e:
-                        print(f"Warning: Failed to render parabola equation: {e}")
-                        text_y = y_pos
-                elif hasattr(equation, 'equation1_latex'):
-                    # For systems: display both equations as aligned LaTeX image
-                    try:
-                        system_img = self.render_system_to_image(equation.equation1_latex, equation.equation2_latex, 21)
-                        c.drawImage(
-                            system_img,
-                            x_start + 0.25 * inch,
-                            y_pos - 0.25 * inch,
-                            width=2.5 * inch,
-                            height=0.6 * inch,
-                            preserveAspectRatio=True,
-                            mask='auto'
-                        )
-                        text_y = y_pos - 0.85 * inch
-                    except Exception as e:
-                        print(f"Warning: Failed to render system equations: {e}")
-                        text_y = y_pos
-                else:
-                    text_y = y_pos
-
-                # Draw the answer image (coordinate plane with solution)
-                try:
-                    c.drawImage(
-                        ImageReader(equation.answer_image),
-                        x_start,
-                        text_y - config.image_height * inch - 0.15 * inch,
-                        width=config.image_width * inch,
-                        height=config.image_height * inch,
-                        preserveAspectRatio=True
-                    )
-                except Exception as e:
-                    print(f"Warning: Failed to render graphing answer image: {e}")
-
-                # Only decrement y_pos after finishing a row (when we're in the right column)
-                if col == 1:
-                    y_pos -= spacing
-
-        else:
-            # For linear equations: 2 columns layout with left-to-right ordering (matching worksheet)
-            for idx, equation in enumerate(equations[:problems_per_page]):
-                # Layout: 2 columns with left-to-right ordering (same as worksheet)
-                # Problems fill left-to-right: 1,2 in row 1, 3,4 in row 2, etc.
-                # After 10 problems (5 rows x 2 columns), continue at top of page below the first set
-                if idx < 10:
-                    # First 10 problems: 2 columns x 5 rows
-                    row = idx // 2
-                    col = idx % 2
-                    if col == 0:
-                        x_start = 1 * inch
-                    else:
-                        x_start = 4.5 * inch
-                    y_pos = y_start - (row * spacing)
-                else:
-                    # Problems 11-15: continue below in left column
-                    adjusted_idx = idx - 10
-                    row = adjusted_idx
-                    x_start = 1 * inch
-                    y_pos = y_start - ((5 + row) * spacing)
-
-                # Display problem number and equation as plain text
-                try:
-                    c.setFont("Lexend", 12)
-                except:
-                    c.setFont("Helvetica", 12)
-
-                # First convert LaTeX symbols to Unicode BEFORE stripping backslashes
-                plain_text = equation.latex
-                # Convert math symbols to Unicode equivalents
-                plain_text = re.sub(r'\\sqrt\[3\]\{([^}]+)\}', r'∛\1', plain_text)  # Cube root
-                plain_text = re.sub(r'\\sqrt\{([^}]+)\}', r'√\1', plain_text)  # Square root
-                plain_text = plain_text.replace('\\pi', 'π')  # Pi
-                plain_text = plain_text.replace('\\approx', '≈')  # Approximately
-                plain_text = plain_text.replace('\\cdot', '·')  # Middle dot
-                plain_text = plain_text.replace('\\times', '×')  # Multiplication
-                plain_text = plain_text.replace('\\lt', '<')  # Less than
-                plain_text = plain_text.replace('\\gt', '>')  # Greater than
-                plain_text = plain_text.replace('\\leq', '≤')  # Less than or equal
-                plain_text = plain_text.replace('\\geq', '≥')  # Greater than or equal
-                plain_text = plain_text.replace('\\left', '')  # Remove sizing commands
-                plain_text = plain_text.replace('\\right', '')
-                # Now remove remaining backslashes
-                plain_text = plain_text.replace('\\', '')
-                # Remove text{} wrappers: text{content} -> content
-                plain_text = re.sub(r'text\{([^}]*)\}', r'\1', plain_text)
-
-                # Check if this is a text-heavy problem that needs wrapping
-                text_indicators = ['If ', 'Is ', 'Find ', 'Which ', 'Verify', 'Input:', 'Rule:', 'Output:', 'Evaluate', 'Between ', 'Approximate ', 'Order ']
-                needs_wrapping = any(indicator in plain_text for indicator in text_indicators)
-
-                if needs_wrapping:
-                    # Text-heavy problem: draw number, then wrap text
-                    # Convert fractions to slash notation for text-heavy problems
-                    plain_text = re.sub(r'frac\{([^}]+)\}\{([^}]+)\}', r'\1/\2', plain_text)
-                    c.drawString(x_start, y_pos, f"{start_problem_number + idx}.")
-                    # Wrap text to fit column width (3.0 inches for 3-column layout)
-                    text_end_y = self._wrap_text(c, plain_text, x_start + 0.25 * inch, y_pos, 3.0, line_height=0.18)
-
-                    # Display answer in RED below wrapped text
-                    c.setFillColorRGB(1, 0, 0)  # Red color
-                    # Check if solution is a string (for new generators)
-                    if isinstance(equation.solution, str):
-                        solution_str = equation.solution
-                    # Check if this is Variables worksheet - handle all Variables problems first
-                    elif "Variables" in title:
-                        # For Variables, use steps[0] if available (text answers), otherwise show numeric value
-                        if hasattr(equation, 'steps') and equation.steps and equation.solution == 0:
-                            solution_str = equation.steps[0]  # Use text answer from steps
-                        elif equation.solution == int(equation.solution):
-                            solution_str = str(int(equation.solution))
-                        else:
-                            solution_str = f"{equation.solution:.2f}"
-                    # Check if this is a "What Are Solutions?" worksheet
-                    elif "What Are Solutions?" in title or "Solutions" in title:
-                        # Format for solutions worksheet: just show the number
-                        if equation.solution == 999:
-                            solution_str = "infinite"
-                        elif equation.solution == 0:
-                            solution_str = "zero"
-                        elif equation.solution == 1:
-                            solution_str = "one"
-                        else:
-                            solution_str = str(int(equation.solution))
-                    # Check if this is an expression problem (exponents, evaluating, etc.) - just show the value
-                    elif "Exponent" in title or "Evaluating" in title or "Substitution" in title:
-                        if equation.solution == int(equation.solution):
-                            solution_str = str(int(equation.solution))
-                        else:
-                            solution_str = f"{equation.solution:.2f}"
-                    # Check if this is a text-based problem (like combining like terms)
-                    elif equation.solution == 0 and hasattr(equation, 'steps') and equation.steps:
-                        solution_str = equation.steps[0]  # Use text answer from steps
-                    elif equation.solution == int(equation.solution):
-                        solution_str = f"x = {int(equation.solution)}"
-                    else:
-                        solution_str = f"x = {equation.solution:.2f}"
-
-                    # Use text wrapping for long answers (especially variable problems)
-                    if len(solution_str) > 30:
-                        # Use smaller font for long variable answers
-                        c.setFont('Lexend', 9)
-                        self._wrap_text(c, solution_str, x_start + 0.25 * inch, text_end_y - 0.15 * inch, max_width=3.0, line_height=0.13)
-                        c.setFont('Lexend', 12)  # Reset font
-                    else:
-                        c.drawString(x_start + 0.25 * inch, text_end_y - 0.15 * inch, solution_str)
-                    c.setFillColorRGB(0, 0, 0)  # Reset to black
-                else:
-                    # Simple equation: draw with proper fraction rendering
-                    # Note: Equations use same 12pt font as problem numbers (not 21pt)
-                    c.setFont('Lexend', 12)
-                    c.drawString(x_start, y_pos, f"{start_problem_number + idx}.")
-                    # Draw equation with fractions (using 12pt to match other simple equations)
-                    # Pass max_width of 3.0 inches to prevent overflow
-                    width_used, height_used = self._draw_equation_with_fractions(c, equation.latex, x_start + 0.25 * inch, y_pos, 12, max_width=3.0 * inch)
-
-                    # Display answer in RED below the equation
-                    # Account for height used by equation if it wrapped
-                    answer_y = y_pos - 0.25 * inch - height_used
-                    c.setFillColorRGB(1, 0, 0)  # Red color
-                    # Check if solution is a string (for new generators)
-                    if isinstance(equation.solution, str):
-                        solution_str = equation.solution
-                    # Check if this is Variables worksheet - handle all Variables problems first
-                    elif "Variables" in title:
-                        # For Variables, use steps[0] if available (text answers), otherwise show numeric value
-                        if hasattr(equation, 'steps') and equation.steps and equation.solution == 0:
-                            solution_str = equation.steps[0]  # Use text answer from steps
-                        elif equation.solution == int(equation.solution):
-                            solution_str = str(int(equation.solution))
-                        else:
-                            solution_str = f"{equation.solution:.2f}"
-                    # Check if this is a "What Are Solutions?" worksheet
-                    elif "What Are Solutions?" in title or "Solutions" in title:
-                        # Format for solutions worksheet: just show the number
-                        if equation.solution == 999:
-                            solution_str = "infinite"
-                        elif equation.solution == 0:
-                            solution_str = "zero"
-                        elif equation.solution == 1:
-                            solution_str = "one"
-                        else:
-                            solution_str = str(int(equation.solution))
-                    # Check if this is an expression problem (exponents, evaluating, etc.) - just show the value
-                    elif "Exponent" in title or "Evaluating" in title or "Substitution" in title:
-                        if equation.solution == int(equation.solution):
-                            solution_str = str(int(equation.solution))
-                        else:
-                            solution_str = f"{equation.solution:.2f}"
-                    # Check if this is a text-based problem (like combining like terms)
-                    elif equation.solution == 0 and hasattr(equation, 'steps') and equation.steps:
-                        solution_str = equation.steps[0]  # Use text answer from steps
-                    elif equation.solution == int(equation.solution):
-                        solution_str = f"x = {int(equation.solution)}"
-                    else:
-                        solution_str = f"x = {equation.solution:.2f}"
-
-                    # Use text wrapping for long answers (especially variable problems)
-                    if len(solution_str) > 30:
-                        # Use smaller font for long variable answers
-                        c.setFont('Lexend', 9)
-                        self._wrap_text(c, solution_str, x_start + 0.25 * inch, answer_y, max_width=3.0, line_height=0.13)
-                        c.setFont('Lexend', 12)  # Reset font
-                    else:
-                        c.drawString(x_start + 0.25 * inch, answer_y, solution_str)
-                    c.setFillColorRGB(0, 0, 0)  # Reset to black
+        layout.draw_answers(self, c, equations[:problems_per_page], start_problem_number, y_pos,
+                            spacing, config, title)
 
         # Footer - use Lexend
         try:
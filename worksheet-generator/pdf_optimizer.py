@@ -0,0 +1,556 @@
+"""
+Post-render optimization of worksheet PDFs.
+
+Rendered and published PDFs are often larger than they need to be: the same
+image stream embedded several times, 150-dpi matplotlib PNGs stored as full
+RGB although they are black and grey, page scans embedded at a far higher
+resolution than they are shown at. PDFOptimizer rewrites a PDF:
+
+- Identical image streams (including soft masks) are merged into one object.
+- Flate-compressed images are stored with fewer bits per pixel where that
+  keeps every pixel exactly: RGB images that only use greys as DeviceGray,
+  two-level images (QR codes) at 1 bit per pixel, and optionally colour
+  images with at most 256 colours as a palette.
+- Images shown at more than max_dpi are downsampled (off by default, as it
+  is lossy); JPEG images are re-encoded at jpeg_quality.
+- Streams are recompressed, unreferenced objects dropped, and the file is
+  linearized ("fast web view") so browsers can show the first page before
+  the rest has downloaded.
+
+A recoded image is only used if it is smaller than the original, and so is
+a rewritten file, unless linearization was asked for explicitly
+(linearize=True); linearizing adds a little to files that had nothing else
+to gain. Recoded
+images are cached by their original bytes, so an image repeated across
+documents (logos, QR codes, the blank planes of a graphing worksheet) is
+processed once per run. Output is deterministic: the same input gives the
+same bytes.
+
+optimize_files() can also hard-link identical outputs together, so a
+worksheet published under two category folders is stored once on a local
+disk (git doesn't keep hard links, so this doesn't shrink a repository).
+
+Needs pikepdf (pip install pikepdf). Without it, files are left unchanged
+and only identical files are linked.
+
+Usage:
+    optimizer = PDFOptimizer(max_dpi=200)
+    result = optimizer.optimize_file("slope.pdf")
+    print(result.before, result.after)
+
+    python pdf_optimizer.py ../worksheets
+    python pdf_optimizer.py ../worksheets/Grade2 --max-dpi 200 --dry-run
+"""
+
+import argparse
+import hashlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+try:
+    import pikepdf
+    from pikepdf import Name
+except ImportError:
+    pikepdf = None
+
+# Images whose effective resolution is within this factor of max_dpi are left alone
+DOWNSAMPLE_THRESHOLD = 1.1
+
+# Image dictionary entries that describe the pixel data (others, like /Length, don't)
+_IMAGE_KEYS = ('/Width', '/Height', '/ColorSpace', '/BitsPerComponent', '/Filter',
+               '/DecodeParms', '/Decode', '/ImageMask', '/Mask', '/Interpolate', '/Intent')
+
+
+@dataclass
+class OptimizeResult:
+    """What optimizing one file did."""
+    path: str
+    before: int  # Bytes before
+    after: int  # Bytes after (same as before if the file was left unchanged)
+    images: int = 0  # Image streams in the document
+    merged: int = 0  # Duplicate image streams merged away
+    recoded: int = 0  # Images re-encoded smaller (fewer bits per pixel, downsampled or recompressed)
+    same_as: Optional[str] = None  # Earlier file with identical contents (hard-linked if linking)
+
+    @property
+    def saved(self) -> int:
+        return self.before - self.after
+
+
+@dataclass
+class _Recoded:
+    """An image's new pixel data, independent of the document it came from."""
+    data: bytes  # Encoded stream data
+    filter: str  # '/FlateDecode' or '/DCTDecode'
+    width: int
+    height: int
+    bpc: int
+    palette: Optional[bytes] = None  # Indexed RGB lookup (over the original colour space)
+    color_space: Optional[str] = None  # New device colour space, if it changed
+
+
+def is_available() -> bool:
+    """Whether pikepdf is installed (PDFs can be optimized)."""
+    return pikepdf is not None
+
+
+def _multiply(m, n) -> tuple:
+    """Concatenate PDF matrices [a b c d e f]: m applied first, then n."""
+    a, b, c, d, e, f = m
+    A, B, C, D, E, F = n
+    return (a * A + b * C, a * B + b * D, c * A + d * C, c * B + d * D,
+            e * A + f * C + E, e * B + f * D + F)
+
+
+def _components(color_space) -> Optional[int]:
+    """Colour components of a device or ICC colour space (None for others)."""
+    if color_space == '/DeviceRGB':
+        return 3
+    if color_space == '/DeviceGray':
+        return 1
+    if isinstance(color_space, pikepdf.Array) and len(color_space) == 2 and color_space[0] == '/ICCBased':
+        components = int(color_space[1].get('/N', 0))
+        return components if components in (1, 3) else None
+    return None
+
+
+def _pack_indices(indices: np.ndarray, width: int, bpc: int) -> bytes:
+    """Pack palette indices into rows of bpc-bit samples, each row padded to a whole byte."""
+    rows = indices.reshape(-1, width).astype(np.uint8)
+    if bpc == 8:
+        return rows.tobytes()
+    per_byte = 8 // bpc
+    pad = (-width) % per_byte
+    if pad:
+        rows = np.pad(rows, ((0, 0), (0, pad)))
+    rows = rows.reshape(rows.shape[0], -1, per_byte)
+    shifts = (8 - bpc * (np.arange(per_byte) + 1)).astype(np.uint8)
+    # The shifted samples don't overlap, so summing them ORs them together
+    return (rows << shifts).sum(axis=2).astype(np.uint8).tobytes()
+
+
+def _reduce(pixels: np.ndarray, width: int, height: int, components: int,
+           device_rgb: bool, indexed: bool, masked: bool = False) -> Optional[_Recoded]:
+    """
+    The image with fewer bits per pixel and exactly the same colours, if possible.
+
+    RGB images that only use greys become DeviceGray, and grey images whose
+    levels are all multiples of 255/(2**n - 1) are stored with n bits per pixel
+    (unless masked: viewers resample low-depth images under a soft mask a little
+    differently when scaling them down).
+    Colour images with at most 256 colours become an Indexed palette if indexed
+    is set; that is lossless too, but viewers don't smooth Indexed images when
+    scaling them, so it changes how they look on screen.
+    """
+    samples = pixels.reshape(-1, components)
+    color_space = None
+    if components == 3 and device_rgb and (samples[:, 0] == samples[:, 1]).all() \
+            and (samples[:, 1] == samples[:, 2]).all():
+        samples, components, color_space = samples[:, :1], 1, '/DeviceGray'
+
+    if components == 1:
+        levels = np.unique(samples)
+        for bpc in () if masked else (1, 2, 4):
+            step = 255 // (2 ** bpc - 1)
+            if not (levels % step).any():
+                data = _pack_indices(samples // step, width, bpc)
+                break
+        else:
+            bpc, data = 8, samples.tobytes()
+        return _Recoded(zlib.compress(data, 9), '/FlateDecode', width, height, bpc, color_space=color_space)
+
+    if not indexed:
+        return None
+    packed = (samples[:, 0].astype(np.uint32) << 16) | (samples[:, 1].astype(np.uint32) << 8) | samples[:, 2]
+    colors, indices = np.unique(packed, return_inverse=True)
+    if len(colors) > 256:
+        return None
+    count = len(colors)
+    bpc = 1 if count <= 2 else 2 if count <= 4 else 4 if count <= 16 else 8
+    lookup = np.stack([(colors >> 16) & 255, (colors >> 8) & 255, colors & 255], axis=1)
+    return _Recoded(zlib.compress(_pack_indices(indices, width, bpc), 9), '/FlateDecode', width, height, bpc,
+                    palette=lookup.astype(np.uint8).tobytes())
+
+
+class PDFOptimizer:
+    """Rewrites PDFs smaller (see the module docstring). Reuse one instance across files."""
+
+    def __init__(self, max_dpi: Optional[float] = None, jpeg_quality: int = 85,
+                 linearize: Optional[bool] = None, indexed: bool = False):
+        """
+        Args:
+            max_dpi: Downsample images shown at a higher resolution than this
+                     (None = never downsample; downsampling is lossy)
+            jpeg_quality: Quality for re-encoding downsampled JPEG images
+            linearize: Write linearized ("fast web view") PDFs: True always, False
+                       never, None (default) only when that makes them smaller
+            indexed: Store colour images with at most 256 colours as a palette
+        """
+        self.max_dpi = max_dpi
+        self.jpeg_quality = jpeg_quality
+        self.linearize = linearize
+        self.indexed = indexed
+        self._recoded = {}  # (image key, scale) -> _Recoded or None, shared across documents
+
+    # -- Images ----------------------------------------------------------
+
+    def _image_key(self, image, keys: Dict) -> str:
+        """Hash of an image's pixel data and description (soft masks by their own key)."""
+        digest = hashlib.sha256(image.read_raw_bytes())
+        for name in _IMAGE_KEYS:
+            if name in image:
+                digest.update(f"{name}={image[name]!r}".encode('utf-8'))
+        smask = image.get('/SMask')
+        if smask is not None:
+            digest.update(b'/SMask=' + keys.get(smask.objgen, repr(smask.objgen)).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _placements(self, pdf) -> Dict[tuple, float]:
+        """Lowest resolution (dpi) each image XObject is shown at, from the pages' content streams."""
+        dpis = {}
+
+        def walk(owner, resources, ctm, depth):
+            xobjects = resources.get('/XObject', {}) if resources is not None else {}
+            stack = []
+            for operands, operator in pikepdf.parse_content_stream(owner):
+                op = str(operator)
+                if op == 'q':
+                    stack.append(ctm)
+                elif op == 'Q':
+                    ctm = stack.pop() if stack else ctm
+                elif op == 'cm':
+                    ctm = _multiply([float(x) for x in operands], ctm)
+                elif op == 'Do':
+                    xobject = xobjects.get(operands[0])
+                    if xobject is None:
+                        continue
+                    if xobject.get('/Subtype') == '/Image':
+                        shown_w = (ctm[0] ** 2 + ctm[1] ** 2) ** 0.5 / 72
+                        shown_h = (ctm[2] ** 2 + ctm[3] ** 2) ** 0.5 / 72
+                        if shown_w and shown_h:
+                            dpi = min(int(xobject.Width) / shown_w, int(xobject.Height) / shown_h)
+                            key = xobject.objgen
+                            dpis[key] = min(dpis.get(key, dpi), dpi)
+                    elif xobject.get('/Subtype') == '/Form' and depth < 16:
+                        matrix = [float(x) for x in xobject.get('/Matrix', [1, 0, 0, 1, 0, 0])]
+                        walk(xobject, xobject.get('/Resources', resources), _multiply(matrix, ctm), depth + 1)
+
+        for page in pdf.pages:
+            walk(page, page.obj.get('/Resources'), (1, 0, 0, 1, 0, 0), 0)
+        return dpis
+
+    def _recode(self, image, scale: float) -> Optional[_Recoded]:
+        """New pixel data for an image (fewer bits per pixel and/or downsampled), or None to keep it."""
+        filters = image.get('/Filter')
+        if isinstance(filters, pikepdf.Array):
+            filters = filters[0] if len(filters) == 1 else None
+        if image.get('/ImageMask') or '/Decode' in image or filters not in (None, '/FlateDecode', '/DCTDecode'):
+            return None
+        width, height = int(image.Width), int(image.Height)
+
+        if scale < 1:
+            from PIL import Image
+            if '/SMask' in image or '/Mask' in image:
+                return None  # The mask would have to be resampled with it
+            picture = pikepdf.PdfImage(image).as_pil_image()
+            if picture.mode not in ('L', 'RGB'):
+                picture = picture.convert('RGB')
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            picture = picture.resize(size, Image.LANCZOS)
+            color_space = '/DeviceRGB' if picture.mode == 'RGB' else '/DeviceGray'
+            if filters == '/DCTDecode':
+                buf = io.BytesIO()
+                picture.save(buf, format='JPEG', quality=self.jpeg_quality, optimize=True)
+                return _Recoded(buf.getvalue(), '/DCTDecode', size[0], size[1], 8, color_space=color_space)
+            components = 3 if picture.mode == 'RGB' else 1
+            pixels = np.asarray(picture)
+            return (_reduce(pixels, size[0], size[1], components, True, self.indexed)
+                    or _Recoded(zlib.compress(pixels.tobytes(), 9), '/FlateDecode', size[0], size[1], 8,
+                                color_space=color_space))
+
+        if filters == '/DCTDecode' or int(image.get('/BitsPerComponent', 0)) != 8:
+            return None
+        color_space = image.get('/ColorSpace')
+        components = _components(color_space)
+        if components is None:
+            return None
+        pixels = np.frombuffer(image.read_bytes(), dtype=np.uint8)
+        if len(pixels) != width * height * components:
+            return None
+        return (_reduce(pixels, width, height, components, color_space == '/DeviceRGB', self.indexed,
+                        '/SMask' in image)
+                or _Recoded(zlib.compress(pixels.tobytes(), 9), '/FlateDecode', width, height, 8))
+
+    @staticmethod
+    def _apply(image, recoded: _Recoded):
+        """Replace an image's pixel data with recoded data."""
+        base = Name(recoded.color_space) if recoded.color_space else image.get('/ColorSpace')
+        image.write(recoded.data, filter=Name(recoded.filter))
+        if '/DecodeParms' in image:
+            del image['/DecodeParms']
+        image.Width = recoded.width
+        image.Height = recoded.height
+        image.BitsPerComponent = recoded.bpc
+        if recoded.palette is not None:
+            image.ColorSpace = pikepdf.Array([Name.Indexed, base, len(recoded.palette) // 3 - 1,
+                                              pikepdf.String(recoded.palette)])
+        else:
+            image.ColorSpace = base
+
+    def _optimize_images(self, pdf, result: OptimizeResult):
+        images = [obj for obj in pdf.objects
+                  if isinstance(obj, pikepdf.Stream) and obj.get('/Subtype') == '/Image']
+        result.images = len(images)
+
+        # Soft masks first, so images are keyed by their mask's contents
+        images.sort(key=lambda image: '/SMask' in image)
+        keys = {}
+        canonical = {}  # key -> first image with that key
+        duplicates = {}  # objgen -> canonical image
+        for image in images:
+            key = keys[image.objgen] = self._image_key(image, keys)
+            if key in canonical:
+                duplicates[image.objgen] = canonical[key]
+            else:
+                canonical[key] = image
+
+        if duplicates:
+            # Point every reference at the canonical copy (the duplicates are then unreferenced)
+            def relink(resources_owner, seen):
+                if resources_owner.objgen in seen and resources_owner.objgen != (0, 0):
+                    return
+                seen.add(resources_owner.objgen)
+                resources = resources_owner.get('/Resources')
+                xobjects = resources.get('/XObject') if resources is not None else None
+                if xobjects is None:
+                    return
+                for name in list(xobjects.keys()):
+                    xobject = xobjects[name]
+                    if xobject.objgen in duplicates:
+                        xobjects[name] = duplicates[xobject.objgen]
+                    elif xobject.get('/Subtype') == '/Form':
+                        relink(xobject, seen)
+
+            seen = set()
+            for page in pdf.pages:
+                relink(page.obj, seen)
+            for image in canonical.values():
+                smask = image.get('/SMask')
+                if smask is not None and smask.objgen in duplicates:
+                    image.SMask = duplicates[smask.objgen]
+            result.merged = len(duplicates)
+
+        dpis = self._placements(pdf) if self.max_dpi else {}
+        for key, image in canonical.items():
+            scale = 1.0
+            dpi = dpis.get(image.objgen)
+            if dpi and dpi > self.max_dpi * DOWNSAMPLE_THRESHOLD:
+                scale = self.max_dpi / dpi
+            cache_key = (key, round(scale, 4))
+            if cache_key not in self._recoded:
+                try:
+                    self._recoded[cache_key] = self._recode(image, scale)
+                except Exception as e:
+                    print(f"Warning: Could not recode image in {result.path}: {e}")
+                    self._recoded[cache_key] = None
+            recoded = self._recoded[cache_key]
+            if recoded is not None and len(recoded.data) < len(image.read_raw_bytes()):
+                self._apply(image, recoded)
+                result.recoded += 1
+
+    # -- Documents -------------------------------------------------------
+
+    def optimize_bytes(self, data: bytes, label: str = '') -> tuple:
+        """
+        Optimize a PDF held in memory.
+
+        Args:
+            data: PDF bytes
+            label: Name used in messages and in the result
+
+        Returns:
+            (optimized bytes, OptimizeResult); the original bytes if pikepdf isn't
+            installed, or if the result isn't smaller (unless linearize=True)
+        """
+        result = OptimizeResult(label, len(data), len(data))
+        if pikepdf is None:
+            return data, result
+        with pikepdf.open(io.BytesIO(data)) as pdf:
+            self._optimize_images(pdf, result)
+            buf = io.BytesIO()
+            pdf.save(buf, linearize=self.linearize is not False, deterministic_id=True,
+                     compress_streams=True, recompress_flate=True,
+                     object_stream_mode=pikepdf.ObjectStreamMode.generate)
+        optimized = buf.getvalue()
+        if len(optimized) >= len(data) and self.linearize is not True:
+            return data, result
+        result.after = len(optimized)
+        return optimized, result
+
+    def optimize_file(self, path, output=None) -> OptimizeResult:
+        """
+        Optimize a PDF file.
+
+        Args:
+            path: PDF to optimize
+            output: Where to write the result (defaults to replacing path)
+
+        Returns:
+            OptimizeResult
+        """
+        path = Path(path)
+        data = path.read_bytes()
+        optimized, result = self.optimize_bytes(data, str(path))
+        output = Path(output) if output is not None else path
+        if optimized is not data or output != path:
+            _write_atomic(output, optimized)
+        return result
+
+    def optimize_files(self, paths: Iterable, link_duplicates: bool = False,
+                       dry_run: bool = False) -> List[OptimizeResult]:
+        """
+        Optimize PDFs in place, optimizing identical inputs only once.
+
+        Args:
+            paths: PDF files
+            link_duplicates: Hard-link files with identical optimized contents to
+                             one another, so they are stored once
+            dry_run: Report sizes without writing anything
+
+        Returns:
+            One OptimizeResult per file, in order
+        """
+        results = []
+        by_input = {}  # sha256 of the input -> (sha256 of its optimized bytes, first result)
+        by_output = {}  # sha256 of the optimized bytes -> first path written with them
+        for path in map(Path, paths):
+            data = path.read_bytes()
+            input_key = hashlib.sha256(data).hexdigest()
+            if input_key in by_input:
+                # Same input as an earlier file: its optimized copy is already on disk
+                output_key, first = by_input[input_key]
+                result = OptimizeResult(str(path), len(data), first.after, first.images,
+                                        first.merged, first.recoded, same_as=by_output[output_key])
+                results.append(result)
+                if not dry_run and not os.path.samefile(result.same_as, path):
+                    if link_duplicates:
+                        _link(Path(result.same_as), path)
+                    else:
+                        _write_atomic(path, Path(result.same_as).read_bytes())
+                continue
+
+            optimized, result = self.optimize_bytes(data, str(path))
+            output_key = hashlib.sha256(optimized).hexdigest()
+            by_input[input_key] = (output_key, result)
+            if output_key in by_output:
+                result.same_as = by_output[output_key]
+            else:
+                by_output[output_key] = str(path)
+            results.append(result)
+
+            if dry_run:
+                continue
+            if result.same_as and link_duplicates:
+                _link(Path(result.same_as), path)
+            elif optimized is not data:
+                _write_atomic(path, optimized)
+        return results
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Replace a file's contents atomically, keeping its permissions."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    if path.exists():
+        shutil.copymode(path, tmp_path)
+    else:
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+    os.replace(tmp_path, path)
+
+
+def _link(source: Path, path: Path):
+    """Make path a hard link to source (a copy where hard links aren't supported)."""
+    if path.exists() and os.path.samefile(source, path):
+        return
+    tmp_path = path.with_name(path.name + '.link.tmp')
+    try:
+        os.link(source, tmp_path)
+    except OSError:
+        _write_atomic(path, source.read_bytes())
+        return
+    os.replace(tmp_path, path)
+
+
+def find_pdfs(paths: Iterable) -> List[Path]:
+    """PDF files given directly or found (recursively) in the given directories, sorted."""
+    found = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            found.extend(sorted(path.rglob('*.pdf')))
+        else:
+            found.append(path)
+    return found
+
+
+def format_results(results: List[OptimizeResult]) -> str:
+    """Before/after sizes per file, plus totals."""
+    lines = []
+    for r in results:
+        line = f"{r.path}: {r.before / 1024:.0f}KB -> {r.after / 1024:.0f}KB"
+        details = []
+        if r.merged:
+            details.append(f"{r.merged} duplicate images merged")
+        if r.recoded:
+            details.append(f"{r.recoded}/{r.images} images recoded")
+        if r.same_as:
+            details.append(f"same as {r.same_as}")
+        if details:
+            line += f" ({', '.join(details)})"
+        lines.append(line)
+    before = sum(r.before for r in results)
+    after = sum(r.after for r in results)
+    lines.append(f"Total: {before / 1024 / 1024:.1f}MB -> {after / 1024 / 1024:.1f}MB in {len(results)} files")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Optimize worksheet PDFs in place")
+    parser.add_argument('paths', nargs='+', help="PDF files or folders (searched recursively)")
+    parser.add_argument('--max-dpi', type=float, default=None,
+                        help="Downsample images shown above this resolution (lossy; default: never)")
+    parser.add_argument('--jpeg-quality', type=int, default=85,
+                        help="Quality for downsampled JPEG images (default: 85)")
+    linearize = parser.add_mutually_exclusive_group()
+    linearize.add_argument('--linearize', action='store_true', default=None,
+                           help="Linearize every PDF, even where that makes it larger")
+    linearize.add_argument('--no-linearize', dest='linearize', action='store_false',
+                           help="Don't linearize the PDFs")
+    parser.add_argument('--indexed', action='store_true',
+                        help="Store colour images with at most 256 colours as a palette")
+    parser.add_argument('--link-duplicates', action='store_true',
+                        help="Hard-link identical files together so they are stored once")
+    parser.add_argument('--dry-run', action='store_true', help="Only report the sizes")
+    args = parser.parse_args(argv)
+
+    if not is_available():
+        print("Note: pikepdf is not installed (pip install pikepdf); PDFs will not be optimized")
+    optimizer = PDFOptimizer(args.max_dpi, args.jpeg_quality, args.linearize, args.indexed)
+    results = optimizer.optimize_files(find_pdfs(args.paths), args.link_duplicates, args.dry_run)
+    print(format_results(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+"""
+Unique problems on a worksheet.
+
+Generators draw each problem independently, so a worksheet can repeat a
+problem - often, for generators with only a handful of possible problems.
+generate_unique_worksheet() keeps drawing until it has the requested number of
+distinct problems, comparing problems by a canonical form of their fields
+(LaTeX with spacing and equivalent commands normalised, answer, graph
+parameters, ...). It stops once new draws keep turning up problems it has
+already seen, and reports that fewer unique problems exist than were asked
+for instead of looping. Generators that ask one fixed question per difficulty
+(a one-entry problem space, or FIXED_QUESTION_DRAWS draws all turning up the
+same problem) get that question repeated, as plain generation would.
+
+A generator with a small, finite set of problems can declare it, so it is
+enumerated and sampled without replacement instead of drawn at random:
+
+    def problem_space(self, difficulty):
+        # Sequence of parameters, or None for difficulties drawn at random
+        return [(trials, heads) for trials in (50, 100) for heads in range(...)]
+
+    def problem_for(self, difficulty, params):
+        trials, heads = params
+        return Equation(...)
+
+Usage:
+    problems = generate_unique_worksheet(generator, 'easy', 12)
+
+    # No repeats across the worksheets of a packet
+    tracker = UniqueProblemTracker()
+    for difficulty in DIFFICULTIES:
+        problems = generate_unique_worksheet(generator, difficulty, 12, tracker=tracker)
+"""
+
+import random
+import re
+from typing import Iterator, List, Optional
+
+import tracing
+
+# Problem fields that don't make two problems different
+IGNORED_FIELDS = {'steps', 'difficulty', 'explanation', 'hint'}
+
+# Draws allowed per requested problem before giving up on finding more
+DRAWS_PER_PROBLEM = 20
+MIN_DRAWS = 50
+
+# Draws that all turn up the same problem mark a generator asking one fixed question
+FIXED_QUESTION_DRAWS = 10
+
+# Spaces up to this size are shuffled up front; larger ones are sampled lazily
+SHUFFLE_LIMIT = 4096
+
+_LATEX_REPLACEMENTS = [
+    (re.compile(r'\\(left|right|displaystyle|textstyle)(?![a-zA-Z])'), ''),
+    (re.compile(r'\\[dt]frac(?![a-zA-Z])'), r'\\frac'),
+    (re.compile(r'\\(,|;|:|!|quad|qquad)(?![a-zA-Z])|~'), ''),
+    (re.compile(r'\\(le|leqslant)(?![a-zA-Z])'), r'\\leq'),
+    (re.compile(r'\\(ge|geqslant)(?![a-zA-Z])'), r'\\geq'),
+    (re.compile(r'\\times(?![a-zA-Z])'), r'\\cdot'),
+    (re.compile(r'\s+'), ''),
+]
+
+# Memory addresses in reprs ("<... at 0x7f...>") differ between otherwise equal objects
+_ADDRESS = re.compile(r' at 0x[0-9a-fA-F]+')
+
+
+class ProblemSpaceExhausted(ValueError):
+    """More unique problems were requested than the generator can produce."""
+
+    def __init__(self, requested: int, problems: list):
+        self.requested = requested
+        self.problems = problems  # The unique problems that were found
+        super().__init__(f"Only {len(problems)} unique problems available, {requested} requested")
+
+
+def canonical_latex(text: str) -> str:
+    """
+    Canonical form of a LaTeX string, for comparing problems.
+
+    Whitespace, spacing commands and \\left/\\right are dropped, and equivalent
+    commands (\\dfrac and \\frac, \\le and \\leq, \\times and \\cdot) are unified,
+    so "\\dfrac{1}{2} \\times x" and "\\frac{1}{2}\\cdot x" compare equal.
+    """
+    for pattern, replacement in _LATEX_REPLACEMENTS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def _canonical_value(value):
+    if isinstance(value, str):
+        return canonical_latex(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical_value(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _canonical_value(v)) for k, v in value.items()))
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, (int, float, bool)) or value is None:
+        return value
+    if hasattr(value, '__dict__'):
+        return problem_key(value)
+    return canonical_latex(_ADDRESS.sub('', repr(value)))
+
+
+def problem_key(problem) -> tuple:
+    """
+    Hashable key identifying a problem: its fields in canonical form.
+
+    Two problems with the same key are the same problem, even if their steps
+    are worded differently.
+    """
+    fields = getattr(problem, '__dict__', None)
+    if fields is None:
+        return (type(problem).__name__, _canonical_value(str(problem)))
+    return (type(problem).__name__,) + tuple(sorted(
+        (name, _canonical_value(value)) for name, value in fields.items()
+        if name not in IGNORED_FIELDS and not name.startswith('_')
+    ))
+
+
+class UniqueProblemTracker:
+    """The problems emitted so far, by problem_key()."""
+
+    def __init__(self):
+        self._seen = set()
+
+    def add(self, problem) -> bool:
+        """Record a problem. Returns False if it was already emitted."""
+        key = problem_key(problem)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        return True
+
+    def __contains__(self, problem) -> bool:
+        return problem_key(problem) in self._seen
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+
+def _sample_indexes(rng, size: int) -> Iterator[int]:
+    """Yield indexes 0..size-1 in random order, each once."""
+    if size <= SHUFFLE_LIMIT:
+        indexes = list(range(size))
+        rng.shuffle(indexes)
+        yield from indexes
+        return
+
+    used = set()
+    while len(used) < size:
+        index = rng.randrange(size)
+        if index not in used:
+            used.add(index)
+            yield index
+
+
+def _repeated_worksheet(generator, difficulty: str, num_problems: int,
+                        tracker: UniqueProblemTracker) -> List:
+    """The generator's own worksheet, for generators with a single problem to repeat."""
+    problems = list(generator.generate_worksheet(difficulty, num_problems) or [])
+    for problem in problems:
+        tracker.add(problem)
+    return problems
+
+
+@tracing.traced('generate')
+def generate_unique_worksheet(generator, difficulty: str, num_problems: int,
+                              tracker: Optional[UniqueProblemTracker] = None,
+                              strict: bool = False) -> List:
+    """
+    Generate a worksheet's problems with no problem repeated.
+
+    Generators that declare problem_space() are sampled without replacement;
+    others are drawn from until enough unique problems turn up or the draw
+    budget (DRAWS_PER_PROBLEM per problem) runs out. A generator with only
+    one problem (a one-entry space, or FIXED_QUESTION_DRAWS identical draws)
+    has its worksheet generated as usual, repeats included.
+
+    Args:
+        generator: Generator instance
+        difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+        num_problems: Number of unique problems wanted
+        tracker: Problems to avoid (and record new ones in), e.g. shared across a packet
+        strict: Raise ProblemSpaceExhausted instead of returning fewer problems
+
+    Returns:
+        List of up to num_problems problems. Fewer are returned (with a warning)
+        if the generator has fewer unique problems than requested.
+
+    Raises:
+        ProblemSpaceExhausted: If strict and there aren't enough unique problems
+    """
+    tracker = tracker if tracker is not None else UniqueProblemTracker()
+    problems = []
+
+    space = generator.problem_space(difficulty) if hasattr(generator, 'problem_space') else None
+    if space is not None and len(space) == 1:
+        return _repeated_worksheet(generator, difficulty, num_problems, tracker)
+    if space is not None:
+        rng = getattr(generator, 'rng', None) or random.Random()
+        for index in _sample_indexes(rng, len(space)):
+            problem = generator.problem_for(difficulty, space[index])
+            if tracker.add(problem):
+                problems.append(problem)
+                if len(problems) == num_problems:
+                    break
+    else:
+        # Top up with more of the generator's own worksheets (keeping its mix of problem types)
+        candidates = list(generator.generate_worksheet(difficulty, num_problems) or [])
+        draws = len(candidates)
+        budget = max(MIN_DRAWS, DRAWS_PER_PROBLEM * num_problems)
+        keys = set()  # Every problem drawn, repeats of earlier worksheets included
+        while True:
+            for problem in candidates:
+                keys.add(problem_key(problem))
+                if len(problems) < num_problems and tracker.add(problem):
+                    problems.append(problem)
+            missing = num_problems - len(problems)
+            if missing <= 0 or draws >= budget:
+                break
+            if len(keys) == 1 and draws >= FIXED_QUESTION_DRAWS:
+                return _repeated_worksheet(generator, difficulty, num_problems, tracker)
+            candidates = list(generator.generate_worksheet(difficulty, min(missing, budget - draws)) or [])
+            if not candidates:
+                break
+            draws += len(candidates)
+
+    if len(problems) < num_problems:
+        if strict:
+            raise ProblemSpaceExhausted(num_problems, problems)
+        print(f"Warning: {type(generator).__name__} ({difficulty}) has only {len(problems)} "
+              f"unique problems, {num_problems} requested")
+    return problems
@@ -0,0 +1,449 @@
+"""
+Persistent question bank.
+
+Every worksheet request regenerates its problems from scratch. The question
+bank pre-generates problems per topic and difficulty and stores them in a
+local SQLite file, so assembling a worksheet becomes an indexed random draw.
+
+Problems are keyed by topic (class, unit, topic and generator), difficulty
+and a hash of their canonical form (problem_uniqueness.problem_key), so the
+bank never holds the same problem twice and a draw never repeats a problem.
+Each problem is stored as JSON of its dataclass fields (plain values only,
+never pickled, so opening a bank can't run code), alongside its LaTeX,
+answer and steps (for inspection) and an optional pre-rendered image.
+Problems holding anything else (graphs, images) aren't stored; their topics
+are generated as before.
+
+Each topic records the hash of its generator's source file. When the source
+changes, the topic's problems are stale: draws skip the bank (returning None,
+so callers fall back to generating), and the next fill() replaces them.
+
+Usage:
+    # Build or top up the bank from the generator manifest
+    python question_bank.py --difficulty all --target 200
+
+    bank = QuestionBank()
+    problems = bank.draw("K-8 - Grade 3", "Unit 2", "Multiply By 2 Or 4", 'easy', 12)
+    if problems is None:
+        problems = generator.generate_worksheet('easy', 12)
+"""
+
+import argparse
+import dataclasses
+import hashlib
+import inspect
+import json
+import numbers
+import os
+import random
+import sqlite3
+import sys
+import threading
+import time
+from fractions import Fraction
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from problem_uniqueness import DRAWS_PER_PROBLEM, MIN_DRAWS, problem_key
+from seeding import derive_seed, reseed
+
+BANK_FILE = "question_bank.sqlite"
+
+# Bump when the stored format changes, so older banks are rebuilt
+BANK_VERSION = 2
+
+# Problems kept per topic and difficulty by default
+DEFAULT_TARGET = 200
+
+# Problems generated per round while filling
+FILL_CHUNK = 50
+
+DIFFICULTIES = ['easy', 'medium', 'hard', 'challenge']
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS topics (
+    id INTEGER PRIMARY KEY,
+    class TEXT NOT NULL,
+    unit TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    generator TEXT NOT NULL,
+    source_hash TEXT,
+    UNIQUE (class, unit, topic)
+);
+CREATE TABLE IF NOT EXISTS problems (
+    id INTEGER PRIMARY KEY,
+    topic_id INTEGER NOT NULL REFERENCES topics(id) ON DELETE CASCADE,
+    difficulty TEXT NOT NULL,
+    key_hash TEXT NOT NULL,
+    latex TEXT,
+    solution TEXT,
+    steps TEXT,
+    data TEXT NOT NULL,
+    asset BLOB,
+    created REAL NOT NULL,
+    UNIQUE (topic_id, difficulty, key_hash)
+);
+CREATE INDEX IF NOT EXISTS problems_by_topic ON problems (topic_id, difficulty);
+"""
+
+
+def source_hash(generator_class) -> Optional[str]:
+    """
+    Hash of the source file defining a generator.
+
+    Args:
+        generator_class: Generator class or GeneratorRef
+
+    Returns:
+        SHA-256 hex digest, or None if the source isn't available (e.g. frozen builds)
+    """
+    path = getattr(generator_class, 'path', None)
+    try:
+        if not path:
+            if hasattr(generator_class, 'load'):
+                generator_class = generator_class.load()
+            path = inspect.getsourcefile(generator_class)
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except (OSError, TypeError):
+        return None
+
+
+def _generator_name(generator_class) -> str:
+    module = getattr(generator_class, 'module_name', None) or generator_class.__module__
+    return f"{module}.{generator_class.__name__}"
+
+
+def _key_hash(problem) -> str:
+    return hashlib.sha1(repr(problem_key(problem)).encode('utf-8')).hexdigest()
+
+
+def _text(value) -> Optional[str]:
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+class UnstorableProblem(ValueError):
+    """A problem can't be saved and loaded back (e.g. it holds an image or a graph)."""
+
+
+def _encode(value):
+    """A problem (or one of its values) as JSON-compatible data, tagging what JSON can't tell apart."""
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, Fraction):
+        return {'fraction': [value.numerator, value.denominator]}
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    if isinstance(value, numbers.Real):
+        return float(value)
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, tuple):
+        return {'tuple': [_encode(item) for item in value]}
+    if isinstance(value, dict):
+        return {'dict': [[_encode(k), _encode(v)] for k, v in value.items()]}
+    cls = type(value)
+    if dataclasses.is_dataclass(cls) and not hasattr(cls, 'render'):
+        return {'class': f"{cls.__module__}:{cls.__qualname__}",
+                'fields': {f.name: _encode(getattr(value, f.name)) for f in dataclasses.fields(cls) if f.init}}
+    raise UnstorableProblem(f"{cls.__name__} values can't be stored")
+
+
+def _problem_class(name: str):
+    """
+    A problem dataclass from an already imported module.
+
+    Nothing is imported, so a bank can only name classes the program has
+    loaded itself (the drawing generator's module and what it imports).
+    """
+    module_name, _, qualname = name.partition(':')
+    cls = sys.modules.get(module_name)
+    for part in qualname.split('.'):
+        cls = getattr(cls, part, None)
+    if not isinstance(cls, type) or not dataclasses.is_dataclass(cls) or hasattr(cls, 'render'):
+        raise ValueError(f"not a loaded problem class: {name}")
+    return cls
+
+
+def _decode(value):
+    """Rebuild a value encoded with _encode()."""
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if 'fraction' in value:
+        return Fraction(*value['fraction'])
+    if 'tuple' in value:
+        return tuple(_decode(item) for item in value['tuple'])
+    if 'dict' in value:
+        return {_decode(k): _decode(v) for k, v in value['dict']}
+    return _problem_class(value['class'])(**{k: _decode(v) for k, v in value['fields'].items()})
+
+
+class QuestionBank:
+    """SQLite store of pre-generated problems, drawn from at random."""
+
+    def __init__(self, path=BANK_FILE):
+        """
+        Open (creating if needed) a question bank.
+
+        Args:
+            path: SQLite file
+        """
+        self.path = str(path)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, BANK_VERSION):
+                self._conn.executescript("DROP TABLE IF EXISTS problems; DROP TABLE IF EXISTS topics;")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {BANK_VERSION}")
+
+    def close(self):
+        """Close the database."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _topic(self, class_name: str, unit_name: str, topic_name: str):
+        return self._conn.execute(
+            "SELECT id, generator, source_hash FROM topics WHERE class = ? AND unit = ? AND topic = ?",
+            (class_name, unit_name, topic_name)).fetchone()
+
+    def count(self, class_name: str, unit_name: str, topic_name: str, difficulty: str) -> int:
+        """Number of problems stored for a topic and difficulty."""
+        with self._lock:
+            topic = self._topic(class_name, unit_name, topic_name)
+            if topic is None:
+                return 0
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM problems WHERE topic_id = ? AND difficulty = ?",
+                (topic[0], difficulty)).fetchone()[0]
+
+    def is_stale(self, class_name: str, unit_name: str, topic_name: str, generator_class) -> bool:
+        """
+        Whether a topic's problems came from a different version of its generator.
+
+        Topics not in the bank yet are not stale. If the generator's source
+        can't be read, the stored problems are trusted.
+        """
+        with self._lock:
+            topic = self._topic(class_name, unit_name, topic_name)
+        if topic is None or topic[2] is None:
+            return False
+        current = source_hash(generator_class)
+        return current is not None and current != topic[2]
+
+    def fill(self, class_name: str, unit_name: str, topic_name: str, generator_class,
+             difficulty: str, target: int = DEFAULT_TARGET, seed=None,
+             render: Optional[Callable] = None) -> int:
+        """
+        Top up a topic and difficulty to target unique problems.
+
+        Problems from an older version of the generator are dropped first.
+        Generators offering generate_bulk() are drawn from in bulk; others
+        one worksheet at a time. Filling stops early (with fewer problems)
+        when new draws keep repeating stored problems.
+
+        Args:
+            class_name: Class, e.g. "K-8 - Grade 3"
+            unit_name: Unit, e.g. "Unit 2"
+            topic_name: Topic, e.g. "Multiply By 2 Or 4"
+            generator_class: Generator class or GeneratorRef
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            target: Number of problems wanted
+            seed: Seed for the generator (None for random)
+            render: Optional render(problem) -> bytes, stored as the problem's asset
+
+        Returns:
+            Number of problems added
+        """
+        current = source_hash(generator_class)
+        with self._lock, self._conn:
+            topic = self._topic(class_name, unit_name, topic_name)
+            if topic is None:
+                topic_id = self._conn.execute(
+                    "INSERT INTO topics (class, unit, topic, generator, source_hash) VALUES (?, ?, ?, ?, ?)",
+                    (class_name, unit_name, topic_name, _generator_name(generator_class), current)).lastrowid
+            else:
+                topic_id = topic[0]
+                if current is not None and current != topic[2]:
+                    self._conn.execute("DELETE FROM problems WHERE topic_id = ?", (topic_id,))
+                    self._conn.execute("UPDATE topics SET generator = ?, source_hash = ? WHERE id = ?",
+                                       (_generator_name(generator_class), current, topic_id))
+            have = self._conn.execute(
+                "SELECT COUNT(*) FROM problems WHERE topic_id = ? AND difficulty = ?",
+                (topic_id, difficulty)).fetchone()[0]
+
+        missing = target - have
+        if missing <= 0:
+            return 0
+
+        generator = generator_class()
+        if seed is not None:
+            reseed(generator, seed)
+        budget = max(MIN_DRAWS, DRAWS_PER_PROBLEM * missing)
+        draws = added = 0
+        while added < missing and draws < budget:
+            count = min(FILL_CHUNK, budget - draws)
+            if hasattr(generator, 'generate_bulk'):
+                problems = generator.generate_bulk(difficulty, count).to_equations()
+            else:
+                problems = list(generator.generate_worksheet(difficulty, count) or [])
+            if not problems:
+                break
+            draws += len(problems)
+            try:
+                added += self._store(topic_id, difficulty, problems[:missing - added], render)
+            except UnstorableProblem as e:
+                print(f"Warning: Skipping {topic_name} ({difficulty}): {e}")
+                break
+        return added
+
+    def _store(self, topic_id: int, difficulty: str, problems: List, render: Optional[Callable]) -> int:
+        """Insert problems not stored yet; returns the number inserted."""
+        rows = []
+        now = time.time()
+        for problem in problems:
+            try:
+                data = json.dumps(_encode(problem), separators=(',', ':'))
+                _decode(json.loads(data))
+            except Exception as e:
+                raise UnstorableProblem(f"{type(problem).__name__} problems can't be stored: {e}") from e
+            steps = getattr(problem, 'steps', None)
+            rows.append((topic_id, difficulty, _key_hash(problem),
+                         _text(getattr(problem, 'latex', None)),
+                         _text(getattr(problem, 'solution', None)),
+                         json.dumps(steps, default=str) if steps is not None else None,
+                         data, render(problem) if render else None, now))
+
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO problems "
+                "(topic_id, difficulty, key_hash, latex, solution, steps, data, asset, created) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            return self._conn.total_changes - before
+
+    def draw(self, class_name: str, unit_name: str, topic_name: str, difficulty: str,
+             num_problems: int, rng=None, generator_class=None, with_assets: bool = False) -> Optional[List]:
+        """
+        Draw distinct problems at random.
+
+        Args:
+            class_name: Class, e.g. "K-8 - Grade 3"
+            unit_name: Unit, e.g. "Unit 2"
+            topic_name: Topic, e.g. "Multiply By 2 Or 4"
+            difficulty: One of 'easy', 'medium', 'hard', 'challenge'
+            num_problems: Number of problems
+            rng: random.Random to draw with (None for the random module)
+            generator_class: The topic's generator; if given, stale problems are not used
+            with_assets: Return (problem, asset) pairs instead of problems
+
+        Returns:
+            List of problems, or None if the bank can't supply num_problems
+            (topic missing, stale, or with too few problems) and they should be
+            generated instead
+        """
+        if generator_class is not None and self.is_stale(class_name, unit_name, topic_name, generator_class):
+            return None
+
+        with self._lock:
+            topic = self._topic(class_name, unit_name, topic_name)
+            if topic is None:
+                return None
+            ids = [row[0] for row in self._conn.execute(
+                "SELECT id FROM problems WHERE topic_id = ? AND difficulty = ? ORDER BY id",
+                (topic[0], difficulty))]
+            if len(ids) < num_problems:
+                return None
+
+            picked = (rng or random).sample(ids, num_problems)
+            placeholders = ','.join('?' * len(picked))
+            rows = {row[0]: row[1:] for row in self._conn.execute(
+                f"SELECT id, data, asset FROM problems WHERE id IN ({placeholders})", picked)}
+
+        try:
+            problems = [_decode(json.loads(rows[problem_id][0])) for problem_id in picked]
+        except Exception as e:
+            print(f"Warning: Could not load stored problems for {topic_name}: {e}")
+            return None
+        if with_assets:
+            return [(problem, rows[problem_id][1]) for problem, problem_id in zip(problems, picked)]
+        return problems
+
+    def stats(self) -> dict:
+        """Counts of topics and problems in the bank."""
+        with self._lock:
+            topics = self._conn.execute("SELECT COUNT(*) FROM topics").fetchone()[0]
+            problems = self._conn.execute("SELECT COUNT(*) FROM problems").fetchone()[0]
+        return {'topics': topics, 'problems': problems}
+
+
+def open_question_bank(path=BANK_FILE) -> Optional[QuestionBank]:
+    """
+    Open an existing question bank.
+
+    Returns:
+        QuestionBank, or None if there is no bank file (or it can't be opened)
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        return QuestionBank(path)
+    except sqlite3.Error as e:
+        print(f"Warning: Could not open question bank {path}: {e}")
+        return None
+
+
+def main(argv=None):
+    from generator_manifest import GeneratorRef, MANIFEST_FILE, manifest_entries, refresh_manifest
+
+    parser = argparse.ArgumentParser(description="Pre-generate problems into the question bank")
+    parser.add_argument('--difficulty', default='all', choices=DIFFICULTIES + ['all'],
+                        help="Difficulty to fill (default: all)")
+    parser.add_argument('--target', type=int, default=DEFAULT_TARGET,
+                        help=f"Problems per topic and difficulty (default: {DEFAULT_TARGET})")
+    parser.add_argument('--filter', default=None,
+                        help="Only fill generators whose module path contains this text")
+    parser.add_argument('--seed', type=int, default=None, help="Base seed for reproducible banks")
+    parser.add_argument('--bank', default=None, help=f"Bank file (default: {BANK_FILE} next to this script)")
+    args = parser.parse_args(argv)
+
+    app_dir = Path(__file__).resolve().parent
+    if str(app_dir) not in sys.path:
+        sys.path.insert(0, str(app_dir))
+    difficulties = DIFFICULTIES if args.difficulty == 'all' else [args.difficulty]
+    manifest = refresh_manifest(app_dir / 'generators', app_dir / MANIFEST_FILE)
+
+    start = time.perf_counter()
+    added = failed = 0
+    with QuestionBank(args.bank or app_dir / BANK_FILE) as bank:
+        for entry in manifest_entries(manifest):
+            if args.filter and args.filter not in entry['module']:
+                continue
+            ref = GeneratorRef(entry['module'], entry['class_name'], str(app_dir / entry['path']))
+            for difficulty in difficulties:
+                seed = None if args.seed is None else derive_seed(args.seed, entry['module'], difficulty)
+                try:
+                    added += bank.fill(entry['class'], entry['unit'], entry['topic'], ref,
+                                       difficulty, args.target, seed)
+                except Exception as e:
+                    failed += 1
+                    print(f"Error filling {entry['topic']} ({difficulty}): {e}")
+        stats = bank.stats()
+
+    print(f"Added {added} problems in {time.perf_counter() - start:.1f}s; bank has "
+          f"{stats['problems']} problems for {stats['topics']} topics ({failed} failures)")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
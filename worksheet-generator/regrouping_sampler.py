@@ -0,0 +1,264 @@
+"""
+Sampling addition and subtraction problems with a given regrouping pattern.
+
+Generators used to draw random operand pairs until a regrouping check passed
+(and fell back to a hard-coded pair when it never did). Here the constraints
+are applied column by column instead - digit ranges, which columns regroup
+(carry or borrow) and how many do - and the number of valid pairs below every
+partial column state is counted once. A pair is then drawn digit by digit,
+weighting each choice by how many valid pairs it leads to, so every valid
+pair is equally likely and no draw is ever rejected.
+
+Regrouping follows the column algorithm shown in the step-by-step solutions:
+a column regroups if it carries into (addition) or borrows from (subtraction)
+the next column, taking the carry/borrow from the previous column into account.
+
+Usage:
+    from regrouping_sampler import ONES, TENS, sample_addition, sample_subtraction
+
+    # 2-digit - 2-digit, borrowing in the ones but not the tens, difference >= 5
+    num1, num2 = sample_subtraction(rng, (20, 99), (10, 94),
+                                    regroup={ONES: True, TENS: False}, difference=(5, None))
+
+    # 3-digit + 3-digit with at least two regroupings and a sum below 1000
+    num1, num2 = sample_addition(rng, (150, 899), (150, 899), min_regroups=2, total=(0, 999))
+
+    # One of several kinds of problem, from a table shared with bulk_generation.bulk_addition
+    num1, num2 = sample_addition_variant(rng, [dict(addend1=(100, 899), addend2=(20, 99)),
+                                              dict(addend1=(50, 99), addend2=(50, 99), regroup={TENS: True})])
+"""
+
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# Column positions for the regroup argument
+ONES, TENS, HUNDREDS, THOUSANDS = range(4)
+
+# How the digits read so far compare with a bound's digits
+_LESS, _EQUAL, _GREATER = range(3)
+
+# Largest bound a column table is built for (keeps the table small)
+MAX_VALUE = 10 ** 6 - 1
+
+
+def _compare(digit: int, bound_digit: int, previous: int) -> int:
+    """Compare a number with a bound after adding one more (higher) digit to both."""
+    if digit < bound_digit:
+        return _LESS
+    if digit > bound_digit:
+        return _GREATER
+    return previous
+
+
+class _ColumnSampler:
+    """
+    Counts and samples the operand pairs satisfying one set of constraints.
+
+    Columns are filled from the ones up. The state between columns is the
+    carry/borrow into the next column, how each number (first operand, second
+    operand, result) compares so far with its lower and upper bound, and the
+    number of regroupings so far.
+    """
+
+    def __init__(self, subtract: bool, bounds: Tuple, regroup: Tuple,
+                 min_regroups: int, max_regroups: Optional[int]):
+        self.subtract = subtract
+        self.regroup = dict(regroup)
+        self.min_regroups = min_regroups
+        self.max_regroups = max_regroups
+        # Counting regroupings past this point can't change the outcome
+        self.regroup_cap = max(min_regroups, max_regroups or 0) + 1
+
+        # One more column than the largest bound, for the final carry/borrow
+        self.columns = len(str(max(hi for _, hi in bounds))) + 1
+        self.bound_digits = [
+            [(lo // 10 ** col % 10, hi // 10 ** col % 10) for lo, hi in bounds]
+            for col in range(self.columns)
+        ]
+        self.start = (0, (_EQUAL,) * 6, 0)
+        self._counts = {}
+        self._choices = {}
+        self.count = self._count(0, self.start)
+
+    def _step(self, col: int, state: Tuple, a: int, b: int) -> Optional[Tuple]:
+        """State after writing digits a and b in column col (None if the column can't regroup as required)."""
+        carry, cmps, regroups = state
+        if self.subtract:
+            value = a - b - carry
+            out = 1 if value < 0 else 0
+            digit = value + 10 * out
+        else:
+            value = a + b + carry
+            out = 1 if value >= 10 else 0
+            digit = value - 10 * out
+
+        required = self.regroup.get(col)
+        if required is not None and bool(out) != required:
+            return None
+
+        new_cmps = []
+        for i, (number_digit, (lo_digit, hi_digit)) in enumerate(zip((a, b, digit), self.bound_digits[col])):
+            new_cmps.append(_compare(number_digit, lo_digit, cmps[2 * i]))
+            new_cmps.append(_compare(number_digit, hi_digit, cmps[2 * i + 1]))
+        return out, tuple(new_cmps), min(regroups + out, self.regroup_cap)
+
+    def _options(self, col: int, state: Tuple) -> list:
+        """Digit pairs for column col from state, as (a, b, next state, valid completions)."""
+        key = (col, state)
+        if key not in self._choices:
+            options = []
+            for a in range(10):
+                for b in range(10):
+                    next_state = self._step(col, state, a, b)
+                    if next_state is not None:
+                        count = self._count(col + 1, next_state)
+                        if count:
+                            options.append((a, b, next_state, count))
+            self._choices[key] = options
+        return self._choices[key]
+
+    def _count(self, col: int, state: Tuple) -> int:
+        """Number of ways to fill columns col and up from state that satisfy every constraint."""
+        if col == self.columns:
+            carry, cmps, regroups = state
+            return int(carry == 0
+                       and all(cmp != _LESS for cmp in cmps[0::2])
+                       and all(cmp != _GREATER for cmp in cmps[1::2])
+                       and regroups >= self.min_regroups
+                       and (self.max_regroups is None or regroups <= self.max_regroups))
+
+        key = (col, state)
+        if key not in self._counts:
+            self._counts[key] = sum(option[3] for option in self._options(col, state))
+        return self._counts[key]
+
+    def sample(self, rng) -> Tuple[int, int]:
+        """Draw one valid (first operand, second operand) pair uniformly at random."""
+        if not self.count:
+            raise ValueError("No operand pairs satisfy these constraints")
+
+        first = second = 0
+        state = self.start
+        for col in range(self.columns):
+            pick = rng.randrange(self._counts[(col, state)])
+            for a, b, next_state, count in self._options(col, state):
+                if pick < count:
+                    break
+                pick -= count
+            first += a * 10 ** col
+            second += b * 10 ** col
+            state = next_state
+        return first, second
+
+
+@lru_cache(maxsize=64)
+def _sampler(subtract: bool, bounds: Tuple, regroup: Tuple,
+             min_regroups: int, max_regroups: Optional[int]) -> _ColumnSampler:
+    return _ColumnSampler(subtract, bounds, regroup, min_regroups, max_regroups)
+
+
+def _resolve_bounds(first: Tuple[int, int], second: Tuple[int, int],
+                    result: Tuple[int, Optional[int]], largest_result: int) -> Tuple:
+    """Check and complete the (lo, hi) bounds of both operands and the result."""
+    result_lo, result_hi = result
+    bounds = (tuple(first), tuple(second),
+              (result_lo, largest_result if result_hi is None else result_hi))
+    for lo, hi in bounds:
+        if not 0 <= lo <= hi <= MAX_VALUE:
+            raise ValueError(f"Invalid range ({lo}, {hi}): need 0 <= low <= high <= {MAX_VALUE}")
+    return bounds
+
+
+def sample_addition(rng, addend1: Tuple[int, int], addend2: Tuple[int, int],
+                    regroup: Dict[int, bool] = None, min_regroups: int = 0,
+                    max_regroups: int = None, total: Tuple[int, Optional[int]] = (0, None)) -> Tuple[int, int]:
+    """
+    Draw an addition problem uniformly from all problems meeting the constraints.
+
+    Args:
+        rng: random.Random to draw from
+        addend1: (low, high) range for the first addend, inclusive
+        addend2: (low, high) range for the second addend, inclusive
+        regroup: Which columns must (True) or must not (False) carry, e.g. {ONES: True, TENS: False}
+        min_regroups: Least number of columns that carry
+        max_regroups: Most number of columns that carry (None for no limit)
+        total: (low, high) range for the sum, inclusive (high None for no limit)
+
+    Returns:
+        (addend1, addend2)
+
+    Raises:
+        ValueError: If no problem meets the constraints
+    """
+    bounds = _resolve_bounds(addend1, addend2, total, min(addend1[1] + addend2[1], MAX_VALUE))
+    return _sampler(False, bounds, tuple(sorted((regroup or {}).items())),
+                    min_regroups, max_regroups).sample(rng)
+
+
+def sample_subtraction(rng, minuend: Tuple[int, int], subtrahend: Tuple[int, int],
+                       regroup: Dict[int, bool] = None, min_regroups: int = 0,
+                       max_regroups: int = None, difference: Tuple[int, Optional[int]] = (0, None)) -> Tuple[int, int]:
+    """
+    Draw a subtraction problem uniformly from all problems meeting the constraints.
+
+    Args:
+        rng: random.Random to draw from
+        minuend: (low, high) range for the number subtracted from, inclusive
+        subtrahend: (low, high) range for the number subtracted, inclusive
+        regroup: Which columns must (True) or must not (False) borrow, e.g. {ONES: True, TENS: False}
+        min_regroups: Least number of columns that borrow
+        max_regroups: Most number of columns that borrow (None for no limit)
+        difference: (low, high) range for the difference, inclusive (high None for
+                    no limit); the difference is never negative
+
+    Returns:
+        (minuend, subtrahend)
+
+    Raises:
+        ValueError: If no problem meets the constraints
+    """
+    bounds = _resolve_bounds(minuend, subtrahend, difference, minuend[1])
+    return _sampler(True, bounds, tuple(sorted((regroup or {}).items())),
+                    min_regroups, max_regroups).sample(rng)
+
+
+def _sample_variant(rng, sample, variants, names: Tuple[str, str]) -> Tuple[int, int]:
+    """Pick a variant as the generators' "choice = rng.randint(1, n)" did, then draw from it."""
+    variant = variants[0] if len(variants) == 1 else variants[rng.randint(1, len(variants)) - 1]
+    first, second = (variant[name] for name in names)
+    if variant.keys() == set(names):
+        # No constraints: plain draws, as the generators made before the sampler
+        return rng.randint(*first), rng.randint(*second)
+    return sample(rng, **variant)
+
+
+def sample_addition_variant(rng, variants) -> Tuple[int, int]:
+    """
+    Draw an addition problem of one of several kinds, picked uniformly.
+
+    Args:
+        rng: random.Random to draw from
+        variants: sample_addition keyword arguments (addend1, addend2, regroup,
+                  min_regroups, max_regroups, total) for each kind of problem;
+                  the same table bulk_generation.bulk_addition takes
+
+    Returns:
+        (addend1, addend2)
+    """
+    return _sample_variant(rng, sample_addition, variants, ('addend1', 'addend2'))
+
+
+def sample_subtraction_variant(rng, variants) -> Tuple[int, int]:
+    """
+    Draw a subtraction problem of one of several kinds, picked uniformly.
+
+    Args:
+        rng: random.Random to draw from
+        variants: sample_subtraction keyword arguments (minuend, subtrahend, regroup,
+                  min_regroups, max_regroups, difference) for each kind of problem;
+                  the same table bulk_generation.bulk_subtraction takes
+
+    Returns:
+        (minuend, subtrahend)
+    """
+    return _sample_variant(rng, sample_subtraction, variants, ('minuend', 'subtrahend'))
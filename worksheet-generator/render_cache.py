@@ -0,0 +1,236 @@
+"""
+Render cache for equation images.
+
+Every LaTeX string drawn on a worksheet goes through matplotlib: a new figure,
+mathtext layout, savefig(bbox_inches='tight') and a PNG encode. That is by far
+the slowest part of building a PDF, and the same strings come back constantly
+(answer keys re-render the worksheet equations, class-wide runs repeat the same
+instructions and labels).
+
+RenderCache keeps the encoded PNG bytes keyed by everything that affects the
+pixels (the LaTeX source, font size, renderer mode and matplotlib font config).
+Entries live in a bounded in-memory LRU and, optionally, in an on-disk tier so
+later runs start warm. Entries that aren't PNGs (serialized vector graphics,
+see vector_graphics.cached_graphic) are stored on disk under their own suffix.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+# Bump when the rendering code changes in a way that alters the PNG output,
+# so stale on-disk entries are never reused.
+CACHE_VERSION = 1
+
+# Disk suffix of PNG entries (the default)
+PNG_SUFFIX = '.png'
+
+# Environment variable that enables the on-disk tier for the shared cache
+CACHE_DIR_ENV = 'WORKSHEET_RENDER_CACHE_DIR'
+
+
+class RenderCache:
+    """Thread-safe LRU cache of rendered PNG bytes with an optional disk tier."""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024,
+                 cache_dir: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of images kept in memory
+            max_bytes: Maximum total size of the images kept in memory
+            cache_dir: Directory for the on-disk tier (None = memory only)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+
+        self._entries = OrderedDict()  # key -> PNG bytes, oldest first
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """
+        Build a cache key from the values that determine the rendered output.
+
+        Args:
+            *parts: Hashable values (strings, numbers, tuples)
+
+        Returns:
+            Hex digest identifying the rendered image
+        """
+        digest = hashlib.sha256(repr((CACHE_VERSION,) + parts).encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str, suffix: str = PNG_SUFFIX) -> Optional[bytes]:
+        """
+        Look up rendered bytes, checking memory first and then disk.
+
+        Args:
+            key: Key from make_key()
+            suffix: Disk suffix of the entry
+
+        Returns:
+            PNG bytes, or None if the image has not been rendered yet
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+
+        data = self._read_disk(key, suffix)
+        if data is not None:
+            with self._lock:
+                self.disk_hits += 1
+                self._store(key, data)
+        return data
+
+    def put(self, key: str, data: bytes, suffix: str = PNG_SUFFIX):
+        """
+        Store rendered bytes in memory and, if enabled, on disk.
+
+        Args:
+            key: Key from make_key()
+            data: PNG bytes
+            suffix: Disk suffix of the entry
+        """
+        with self._lock:
+            self._store(key, data)
+        self._write_disk(key, data, suffix)
+
+    def get_or_render(self, key: str, render: Callable[[], bytes], suffix: str = PNG_SUFFIX) -> bytes:
+        """
+        Return cached bytes for key, rendering and storing them on a miss.
+
+        Args:
+            key: Key from make_key()
+            render: Zero-argument callable producing PNG bytes
+            suffix: Disk suffix of the entry
+
+        Returns:
+            PNG bytes
+        """
+        data = self.get(key, suffix)
+        if data is None:
+            with self._lock:
+                self.misses += 1
+            data = render()
+            self.put(key, data, suffix)
+        return data
+
+    def discard(self, key: str, suffix: str = PNG_SUFFIX):
+        """
+        Drop an entry from memory and disk (e.g. one that turned out to be unreadable).
+
+        Args:
+            key: Key from make_key()
+            suffix: Disk suffix of the entry
+        """
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+        if self.cache_dir:
+            try:
+                os.remove(self._disk_path(key, suffix))
+            except OSError:
+                pass
+
+    def clear(self):
+        """Drop all in-memory entries (the disk tier is left alone)."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current memory usage."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+            }
+
+    def _store(self, key: str, data: bytes):
+        """Insert into the LRU and evict the oldest entries. Caller holds the lock."""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old)
+
+        # Never let a single oversized image flush the whole cache
+        if len(data) > self.max_bytes:
+            return
+
+        self._entries[key] = data
+        self._size += len(data)
+
+        while self._entries and (len(self._entries) > self.max_entries or
+                                 self._size > self.max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def _disk_path(self, key: str, suffix: str = PNG_SUFFIX) -> str:
+        """Path of the on-disk entry for key (sharded by the first two hex digits)."""
+        return os.path.join(self.cache_dir, key[:2], f"{key}{suffix}")
+
+    def _read_disk(self, key: str, suffix: str = PNG_SUFFIX) -> Optional[bytes]:
+        """Read an entry from the disk tier, or None if missing or disabled."""
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._disk_path(key, suffix), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, data: bytes, suffix: str = PNG_SUFFIX):
+        """Write an entry to the disk tier atomically (best effort)."""
+        if not self.cache_dir:
+            return
+        path = self._disk_path(key, suffix)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Note: Could not write render cache entry: {e}")
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> RenderCache:
+    """
+    Get the process-wide render cache shared by all PDFWorksheetGenerator instances.
+
+    The on-disk tier is enabled when the WORKSHEET_RENDER_CACHE_DIR environment
+    variable points at a directory.
+
+    Returns:
+        The shared RenderCache
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = RenderCache(cache_dir=os.environ.get(CACHE_DIR_ENV) or None)
+        return _default_cache
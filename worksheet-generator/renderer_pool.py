@@ -0,0 +1,176 @@
+"""
+Pre-warmed renderer processes.
+
+A fresh renderer process pays a lot before its first worksheet: importing
+matplotlib and ReportLab, PDFWorksheetGenerator() registering the Lexend and
+Poppins TTFonts and adding Lexend to matplotlib's font manager, and the first
+mathtext render building matplotlib's font cache and parser. warm_up() does
+all of this once per process - including throwaway renders of equation and
+text images and of a one-page PDF - so the first real job runs as fast as
+the rest and job timeouts don't count start-up.
+
+RendererPool keeps a set of warmed worker processes for batch and server use
+and takes render jobs over the pool's queue. With fork_after_warmup the
+parent warms up (and imports any generator modules given in preload) before
+starting the workers, which are then forked from it: they start warm and
+share the parent's loaded modules and fonts copy-on-write instead of each
+loading their own. Forking needs the 'fork' start method (not available on
+Windows); elsewhere each worker warms itself up.
+
+Usage:
+    with RendererPool(workers=4, fork_after_warmup=True) as pool:
+        pdf = pool.render_worksheet(problems, "Slope").result()
+        result = pool.run(job).result()  # GenerationJob -> GenerationResult
+"""
+
+import io
+import multiprocessing
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from typing import Iterable, List, Optional
+
+# Representative equation images rendered (uncached) while warming up
+WARM_UP_MATH = [
+    r'3x + 5 = 20',
+    r'\frac{2}{3}x^{2} - 4 \leq -7.5',
+    r'\left| y \right| \geq \dfrac{1}{2}',
+]
+WARM_UP_TEXT = r'Find $x$ if $2x + 1 = 9$'
+
+# Set once this process (or the parent it was forked from) has warmed up
+_warm_up_seconds = None
+
+
+def warm_up(app_dir: Optional[str] = None, graph_mode: Optional[str] = None,
+            preload: Iterable[str] = ()) -> float:
+    """
+    Set this process up as a renderer and pay the one-off start-up costs.
+
+    Does nothing if the process (or the process it was forked from) has
+    already warmed up.
+
+    Args:
+        app_dir: Directory containing generators/ (defaults to this file's directory)
+        graph_mode: Graph render mode (defaults to the current mode)
+        preload: Generator module names to import as well
+
+    Returns:
+        Seconds spent warming up (0 if already warm)
+    """
+    global _warm_up_seconds
+    if _warm_up_seconds is not None:
+        return 0.0
+
+    start = time.perf_counter()
+    from parallel_generation import get_worker_pdf_generator, init_worker
+    from vector_graphics import get_graph_render_mode
+
+    init_worker(app_dir or os.path.dirname(os.path.abspath(__file__)), graph_mode or get_graph_render_mode())
+    pdf_gen = get_worker_pdf_generator()
+
+    # Font cache, mathtext parser and glyph loading (bypassing the render cache)
+    for latex in WARM_UP_MATH:
+        pdf_gen._render_math_png(latex, 16)
+    pdf_gen._render_text_png(WARM_UP_TEXT, 16)
+
+    # ReportLab page layout and TTF subsetting
+    from equation_generator import Equation
+    pdf_gen.write_worksheet([Equation(latex=WARM_UP_MATH[0], solution='3', steps=[], difficulty='easy')],
+                            io.BytesIO(), "Warm-up", include_answer_key=True, invariant=True)
+
+    import importlib
+    for module_name in preload:
+        try:
+            importlib.import_module(module_name)
+        except Exception as e:
+            print(f"Warning: Could not preload {module_name}: {e}")
+
+    _warm_up_seconds = time.perf_counter() - start
+    return _warm_up_seconds
+
+
+def is_warm() -> bool:
+    """Whether this process has warmed up."""
+    return _warm_up_seconds is not None
+
+
+def _render_worksheet(problems: List, title: str, include_answer_key: bool, invariant: bool) -> bytes:
+    """Render a worksheet PDF in a worker process."""
+    from parallel_generation import get_worker_pdf_generator
+    buf = io.BytesIO()
+    get_worker_pdf_generator().write_worksheet(problems, buf, title, include_answer_key, invariant)
+    return buf.getvalue()
+
+
+class RendererPool:
+    """Long-lived pool of warmed renderer processes."""
+
+    def __init__(self, workers: Optional[int] = None, graph_mode: Optional[str] = None,
+                 fork_after_warmup: bool = False, preload: Iterable[str] = ()):
+        """
+        Args:
+            workers: Worker processes (defaults to parallel_generation.default_worker_count())
+            graph_mode: Graph render mode for the workers (defaults to the current mode)
+            fork_after_warmup: Warm up in this process and fork the workers from it
+                               (ignored where the 'fork' start method isn't available)
+            preload: Generator module names each worker imports while warming up
+        """
+        from parallel_generation import default_worker_count
+        from vector_graphics import get_graph_render_mode
+
+        self.workers = workers or default_worker_count()
+        self.graph_mode = graph_mode or get_graph_render_mode()
+        self.fork_after_warmup = fork_after_warmup and 'fork' in multiprocessing.get_all_start_methods()
+        self.preload = list(preload)
+        self.warm_up_seconds = None  # Parent's warm-up time, with fork_after_warmup
+        self._executor = None
+
+    def start(self) -> 'RendererPool':
+        """Start the worker processes and wait until they have warmed up."""
+        if self._executor is not None:
+            return self
+        app_dir = os.path.dirname(os.path.abspath(__file__))
+        if self.fork_after_warmup:
+            self.warm_up_seconds = warm_up(app_dir, self.graph_mode, self.preload)
+            context = multiprocessing.get_context('fork')
+        else:
+            context = None
+        # Forked workers inherit the warm state, so warm_up returns straight away in them
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                             initializer=warm_up,
+                                             initargs=(app_dir, self.graph_mode, self.preload))
+        # Workers are spawned as tasks arrive; give each one a task so all start now
+        wait([self._executor.submit(is_warm) for _ in range(self.workers)])
+        return self
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """The underlying executor (e.g. for loop.run_in_executor), started on first use."""
+        return self.start()._executor
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """Run a picklable, module-level function in a warmed worker."""
+        return self.executor.submit(fn, *args, **kwargs)
+
+    def render_worksheet(self, problems: List, title: str = "Math Worksheet",
+                         include_answer_key: bool = True, invariant: bool = False) -> Future:
+        """Render a worksheet PDF in a worker. The future's result is the PDF bytes."""
+        return self.submit(_render_worksheet, list(problems), title, include_answer_key, invariant)
+
+    def run(self, job) -> Future:
+        """Run a parallel_generation.GenerationJob in a worker. The future's result is a GenerationResult."""
+        from parallel_generation import run_job
+        return self.submit(run_job, job)
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+            self._executor = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
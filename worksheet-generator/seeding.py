@@ -0,0 +1,77 @@
+"""
+Deterministic seeds for reproducible worksheets.
+
+Every generator draws from its own random.Random instance (self.rng), created
+from the seed passed to its constructor, so generators never share random
+state. To reproduce a worksheet - or make a parallel batch independent of
+which worker runs which job - derive its seed from what identifies it rather
+than from run order:
+
+    seed = derive_seed(base_seed, "High-School - Algebra", "Slope", "easy", 0)
+    reseed(generator, seed)
+    problems = generator.generate_worksheet("easy", 10)
+"""
+
+import hashlib
+import random
+from contextlib import contextmanager
+
+
+def derive_seed(*parts) -> int:
+    """
+    Derive a 64-bit seed from the parts that identify a worksheet.
+
+    The result only depends on the parts themselves (not on PYTHONHASHSEED,
+    the platform or the process), e.g. derive_seed(base, class, topic,
+    difficulty, worksheet_id).
+
+    Args:
+        *parts: Values identifying the worksheet (converted with str())
+
+    Returns:
+        Seed as a non-negative int
+    """
+    key = '\x1f'.join(str(part) for part in parts).encode('utf-8')
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], 'big')
+
+
+def reseed(generator, seed):
+    """
+    Reset a generator's random state so its next worksheet is reproducible.
+
+    Args:
+        generator: Generator instance with an rng attribute
+        seed: Seed for the generator's random.Random
+
+    Returns:
+        True if the generator has its own rng, False if it had to fall back to
+        seeding the global random module (legacy generators)
+    """
+    rng = getattr(generator, 'rng', None)
+    if isinstance(rng, random.Random):
+        rng.seed(seed)
+        return True
+    random.seed(seed)
+    return False
+
+
+@contextmanager
+def preserved_random_state(generator):
+    """
+    Restore a generator's random state (and the global random module's) on exit.
+
+    Lets a caller reseed a generator it was handed for a few reproducible
+    worksheets without changing what the generator draws afterwards.
+
+    Args:
+        generator: Generator instance, with or without its own rng
+    """
+    rng = getattr(generator, 'rng', None)
+    rng_state = rng.getstate() if isinstance(rng, random.Random) else None
+    global_state = random.getstate()
+    try:
+        yield
+    finally:
+        if rng_state is not None:
+            rng.setstate(rng_state)
+        random.setstate(global_state)
@@ -0,0 +1,308 @@
+"""
+Timing spans for the worksheet pipeline.
+
+Stages of generating a worksheet (problem generation, equation and graph
+rendering, page drawing, saving the PDF) are wrapped in named spans. Spans
+nest, and each records its duration plus an item count and a byte count, so
+a trace shows where a worksheet's time goes:
+
+    write_worksheet                 1  0.412s
+      draw_page                     2  0.301s
+        render_latex               20  0.214s  41.3KB
+          mathtext                  6  0.188s
+      save                          1  0.074s  89.6KB
+
+Tracing is off unless the WORKSHEET_TRACE environment variable is set (to
+anything but 0/false/no) or enable() is called. When it is off, span() returns
+a shared do-nothing context manager and traced() functions only check a flag,
+so the instrumentation can stay in hot paths.
+
+Spans are recorded into every active Trace (with Trace(): ...). A trace can be
+summarized per stage (breakdown()), printed (format_breakdown()) or exported as
+JSON (to_json()) or in the Chrome trace event format (write_chrome_trace(),
+viewable in chrome://tracing or Perfetto).
+
+Usage:
+    import tracing
+    tracing.enable()
+
+    with tracing.Trace() as trace:
+        pdf_gen.generate_worksheet(problems, "slope.pdf", "Slope")
+    print(trace.format_breakdown())
+    trace.write_chrome_trace("slope_trace.json")
+
+    # Instrumenting code
+    with tracing.span('render_latex') as s:
+        png = render(...)
+        s.add_bytes(len(png))
+
+    @tracing.traced('generate')
+    def generate(...): ...
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from typing import Iterable, List, Optional
+
+TRACE_ENV = 'WORKSHEET_TRACE'
+
+_enabled = os.environ.get(TRACE_ENV, '').strip().lower() not in ('', '0', 'false', 'no')
+
+# Traces currently recording (spans are added to each)
+_active_traces = []
+_active_lock = threading.Lock()
+
+# Per-thread stack of open spans
+_local = threading.local()
+
+
+def enable(enabled: bool = True):
+    """Turn span recording on (or off) for this process."""
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    """Whether spans are being recorded."""
+    return _enabled
+
+
+class Span:
+    """An open span. Use add() / add_bytes() to record what the stage processed."""
+
+    __slots__ = ('name', 'path', 'depth', 'start', 'count', 'bytes')
+
+    def __init__(self, name: str, parent: Optional['Span'], count: int, size: int):
+        self.name = name
+        self.path = f"{parent.path}/{name}" if parent is not None else name
+        self.depth = parent.depth + 1 if parent is not None else 0
+        self.start = 0.0
+        self.count = count
+        self.bytes = size
+
+    def add(self, count: int = 1):
+        """Count items processed in this span (problems, pages, ...)."""
+        self.count += count
+
+    def add_bytes(self, size: int):
+        """Count bytes produced in this span."""
+        self.bytes += size
+
+    def __enter__(self):
+        stack = _span_stack()
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter()
+        stack = _span_stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        record = {
+            'name': self.name,
+            'path': self.path,
+            'depth': self.depth,
+            'start': self.start,
+            'seconds': end - self.start,
+            'count': self.count,
+            'bytes': self.bytes,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+        }
+        for trace in _active_traces:
+            trace.spans.append(record)
+        return False
+
+
+class _NullSpan:
+    """Stand-in for Span when tracing is off."""
+
+    __slots__ = ()
+
+    def add(self, count: int = 1):
+        pass
+
+    def add_bytes(self, size: int):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _span_stack() -> list:
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def span(name: str, count: int = 1, size: int = 0):
+    """
+    Context manager timing a stage.
+
+    Args:
+        name: Stage name (nested spans are reported as parent/child paths)
+        count: Initial item count
+        size: Initial byte count
+
+    Returns:
+        Span (or a do-nothing stand-in when tracing is off or no Trace is recording)
+    """
+    if not _enabled or not _active_traces:
+        return _NULL_SPAN
+    stack = _span_stack()
+    return Span(name, stack[-1] if stack else None, count, size)
+
+
+def traced(name: str):
+    """Decorator timing every call of a function as a span."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled or not _active_traces:
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class Trace:
+    """Spans recorded while the trace is active."""
+
+    def __init__(self, spans: Optional[List[dict]] = None):
+        """
+        Args:
+            spans: Spans to start with (e.g. from another process's to_json())
+        """
+        self.spans = list(spans or [])
+
+    def start(self) -> 'Trace':
+        """Start recording spans into this trace."""
+        with _active_lock:
+            if self not in _active_traces:
+                _active_traces.append(self)
+        return self
+
+    def stop(self) -> 'Trace':
+        """Stop recording spans into this trace."""
+        with _active_lock:
+            if self in _active_traces:
+                _active_traces.remove(self)
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+        return False
+
+    def breakdown(self) -> List[dict]:
+        """
+        Totals per stage, in the order the stages were first entered.
+
+        Returns:
+            One dict per span path: path, name, depth (within the trace), calls,
+            count, seconds, self_seconds (excluding child spans) and bytes
+        """
+        stages = {}
+        for record in sorted(self.spans, key=lambda r: (r['start'], r['depth'])):
+            stage = stages.get(record['path'])
+            if stage is None:
+                stage = stages[record['path']] = {
+                    'path': record['path'], 'name': record['name'], 'depth': record['depth'],
+                    'calls': 0, 'count': 0, 'seconds': 0.0, 'self_seconds': 0.0, 'bytes': 0,
+                }
+            stage['calls'] += 1
+            stage['count'] += record['count']
+            stage['seconds'] += record['seconds']
+            stage['self_seconds'] += record['seconds']
+            stage['bytes'] += record['bytes']
+        for record in self.spans:
+            parent = record['path'].rpartition('/')[0]
+            if parent in stages:
+                stages[parent]['self_seconds'] -= record['seconds']
+
+        # Children directly after their parent; spans whose parent began before the trace are roots
+        ordered = []
+
+        def add_children(parent_path, depth):
+            for stage in stages.values():
+                if stage['path'].rpartition('/')[0] == parent_path:
+                    stage['depth'] = depth
+                    ordered.append(stage)
+                    add_children(stage['path'], depth + 1)
+        for stage in list(stages.values()):
+            if stage['path'].rpartition('/')[0] not in stages:
+                stage['depth'] = 0
+                ordered.append(stage)
+                add_children(stage['path'], 1)
+        for stage in ordered:
+            stage['seconds'] = round(stage['seconds'], 6)
+            stage['self_seconds'] = round(max(stage['self_seconds'], 0.0), 6)
+        return ordered
+
+    def format_breakdown(self) -> str:
+        """The breakdown as an indented text table."""
+        return format_breakdown(self.breakdown())
+
+    def to_json(self) -> dict:
+        """Spans and breakdown as a JSON-serializable dict."""
+        return {'spans': self.spans, 'breakdown': self.breakdown()}
+
+    def chrome_events(self) -> List[dict]:
+        """Spans as Chrome trace 'complete' events (timestamps in microseconds)."""
+        return [{
+            'name': record['name'],
+            'cat': 'worksheet',
+            'ph': 'X',
+            'ts': round(record['start'] * 1e6, 1),
+            'dur': round(record['seconds'] * 1e6, 1),
+            'pid': record['pid'],
+            'tid': record['tid'],
+            'args': {'count': record['count'], 'bytes': record['bytes']},
+        } for record in self.spans]
+
+    def write_json(self, path):
+        """Write to_json() to a file."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(), f, indent=2)
+
+    def write_chrome_trace(self, path):
+        """Write the spans as a Chrome trace file."""
+        write_chrome_trace(path, [self])
+
+
+def format_breakdown(breakdown: List[dict]) -> str:
+    """
+    Format a breakdown (from Trace.breakdown()) as an indented text table.
+
+    Returns:
+        One line per stage: name, item count, total seconds, self seconds and bytes
+    """
+    lines = []
+    for stage in breakdown:
+        name = '  ' * stage['depth'] + stage['name']
+        line = f"{name:<32} {stage['count']:>5}  {stage['seconds']:8.3f}s  (self {stage['self_seconds']:.3f}s)"
+        if stage['bytes']:
+            line += f"  {stage['bytes'] / 1024:.1f}KB"
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def write_chrome_trace(path, traces: Iterable[Trace]):
+    """Write the spans of several traces (e.g. one per worker job) to one Chrome trace file."""
+    events = [event for trace in traces for event in trace.chrome_events()]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
@@ -0,0 +1,812 @@
+"""
+Vector (PDF-native) rendering for matplotlib graphs.
+
+Coordinate planes and number lines are built with matplotlib. Rasterizing them
+to 150-dpi PNGs makes graphing worksheets several megabytes and costs a full
+savefig + PNG encode per problem. In vector mode the figure is instead drawn
+through a recording renderer that captures every path (grid lines, axes,
+arrows, curves, shaded regions, markers) and label in PDF point coordinates.
+The resulting VectorGraphic is replayed onto the ReportLab canvas as a form
+XObject, so identical graphs (e.g. the blank plane repeated on every
+worksheet problem) are stored once per PDF and referenced everywhere else.
+
+The render mode is chosen with set_graph_render_mode() or the
+WORKSHEET_GRAPH_MODE environment variable ('vector' or 'raster').
+
+Problems can also hold a DeferredGraphic (e.g. graphing_utils.PlaneSpec): a
+small description of the graph that is only rendered when a page draws it,
+through the render cache, and dropped again once it is embedded.
+"""
+
+import base64
+import hashlib
+import io
+import json
+import os
+import threading
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backend_bases import FigureCanvasBase, RendererBase, register_backend
+from matplotlib.font_manager import FontProperties, findfont
+from matplotlib.path import Path
+from matplotlib.transforms import Affine2D, Bbox, TransformedPath
+from PIL import Image
+from reportlab.lib.boxstuff import aspectRatioFix
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfdoc
+from reportlab.pdfgen.canvas import FILL_NON_ZERO
+
+import tracing
+from font_pipeline import load_font, loaded_font_name
+from render_cache import RenderCache, get_default_cache
+
+
+GRAPH_MODE_ENV = 'WORKSHEET_GRAPH_MODE'
+VECTOR = 'vector'
+RASTER = 'raster'
+
+# Pseudo file format used to route savefig() through the recording renderer,
+# so bbox_inches='tight', facecolor etc. behave exactly as for PNG output.
+_RECORD_FORMAT = 'wsvector'
+
+# Coordinates are rounded so identical figures produce identical display lists
+# (and therefore share one form XObject).
+_PRECISION = 3
+
+_CAP_STYLES = {'butt': 0, 'round': 1, 'projecting': 2}
+_JOIN_STYLES = {'miter': 0, 'round': 1, 'bevel': 2}
+
+_graph_mode = os.environ.get(GRAPH_MODE_ENV, VECTOR).strip().lower() or VECTOR
+
+# Bump when graph rendering changes, so cached deferred graphs are re-rendered
+GRAPH_CACHE_VERSION = 1
+
+# Disk suffix of rendered graphics in the render cache (see graphic_to_bytes)
+GRAPHIC_CACHE_SUFFIX = '.graphic'
+
+# Shared graphics for configurations that never change (blank planes and
+# number lines), keyed by (render mode, template key)
+_templates = {}
+_templates_lock = threading.Lock()
+
+
+def set_graph_render_mode(mode: str):
+    """
+    Select how graphs are produced for worksheets.
+
+    Args:
+        mode: 'vector' (PDF-native paths) or 'raster' (150-dpi PNG images)
+    """
+    global _graph_mode
+    mode = mode.strip().lower()
+    if mode not in (VECTOR, RASTER):
+        raise ValueError(f"Unknown graph render mode: {mode}")
+    _graph_mode = mode
+
+
+def get_graph_render_mode() -> str:
+    """Return the current graph render mode ('vector' or 'raster')."""
+    return _graph_mode if _graph_mode in (VECTOR, RASTER) else VECTOR
+
+
+class VectorGraphic:
+    """
+    A matplotlib figure recorded as a list of PDF drawing operations.
+
+    Sizes and coordinates are in PDF points. Each entry in ops is one of:
+        ('path', clip, segments, stroke, fill)
+        ('text', clip, x, y, angle, fontsize, font_path, rgba, string)
+        ('glyphs', clip, font_path, fontsize, rgba, ((x, y, string), ...))
+        ('image', clip, x, y, width, height, png_bytes)
+    """
+
+    def __init__(self, width: float, height: float, ops: list):
+        self.width = width
+        self.height = height
+        self.ops = ops
+        self.key = hashlib.sha256(repr((width, height, ops)).encode('utf-8')).hexdigest()
+
+    @property
+    def size(self):
+        """Pixel size at 150 dpi, mirroring PIL.Image.size for raster images."""
+        return (int(round(self.width * 150 / 72)), int(round(self.height * 150 / 72)))
+
+    @property
+    def form_name(self) -> str:
+        """Name of the form XObject holding this graphic in a PDF."""
+        return f"graph_{self.key[:20]}"
+
+    def draw(self, c, x, y, width=None, height=None,
+             preserveAspectRatio=False, anchor='c'):
+        """
+        Draw the graphic on a ReportLab canvas, like canvas.drawImage().
+
+        The drawing operations are emitted once per document as a form XObject;
+        every later draw of an identical graph just references that form.
+
+        Args:
+            c: ReportLab canvas
+            x, y: Lower-left corner of the target box
+            width, height: Target box size (defaults to the natural size)
+            preserveAspectRatio: Fit inside the box without distortion
+            anchor: Position within the box when preserving the aspect ratio
+        """
+        if width is None:
+            width = self.width
+        if height is None:
+            height = self.height
+        x, y, width, height, _ = aspectRatioFix(
+            preserveAspectRatio, anchor, x, y, width, height, self.width, self.height)
+
+        name = self.form_name
+        if not c.hasForm(name):
+            c.beginForm(name, 0, 0, self.width, self.height)
+            self._emit(c)
+            end_form(c)
+
+        c.saveState()
+        c.translate(x, y)
+        c.scale(width / self.width, height / self.height)
+        c.doForm(name)
+        c.restoreState()
+
+    def _emit(self, c):
+        """Replay the recorded operations onto the canvas (or form) stream."""
+        current_clip = None
+        clipped = False
+        for op in self.ops:
+            clip = op[1]
+            if clip != current_clip:
+                if clipped:
+                    c.restoreState()
+                    clipped = False
+                current_clip = clip
+                if clip is not None:
+                    c.saveState()
+                    _apply_clip(c, clip)
+                    clipped = True
+
+            if op[0] == 'path':
+                _, _, segments, stroke, fill = op
+                _draw_segments(c, segments, stroke, fill)
+            elif op[0] == 'text':
+                _, _, text_x, text_y, angle, fontsize, font_path, rgba, text = op
+                c.saveState()
+                c.setFillColorRGB(rgba[0], rgba[1], rgba[2], alpha=rgba[3])
+                c.translate(text_x, text_y)
+                if angle:
+                    c.rotate(angle)
+                c.setFont(reportlab_font(font_path), fontsize)
+                c.drawString(0, 0, text)
+                c.restoreState()
+            elif op[0] == 'glyphs':
+                # Individually positioned glyphs in one font, as one text object
+                _, _, font_path, fontsize, rgba, glyphs = op
+                c.saveState()
+                c.setFillColorRGB(rgba[0], rgba[1], rgba[2], alpha=rgba[3])
+                text_object = c.beginText()
+                text_object.setFont(reportlab_font(font_path), fontsize)
+                for glyph_x, glyph_y, text in glyphs:
+                    text_object.setTextOrigin(glyph_x, glyph_y)
+                    text_object.textOut(text)
+                c.drawText(text_object)
+                c.restoreState()
+            else:
+                _, _, img_x, img_y, img_w, img_h, png = op
+                c.drawImage(ImageReader(io.BytesIO(png)), img_x, img_y,
+                            width=img_w, height=img_h, mask='auto')
+        if clipped:
+            c.restoreState()
+
+    def to_image(self, dpi: int = 150) -> Image.Image:
+        """
+        Rasterize the graphic with Agg (for previews and debugging).
+
+        Args:
+            dpi: Output resolution
+
+        Returns:
+            PIL Image object
+        """
+        from matplotlib.backends.backend_agg import RendererAgg
+
+        scale = dpi / 72.0
+        renderer = RendererAgg(int(np.ceil(self.width * scale)),
+                               int(np.ceil(self.height * scale)), dpi)
+        transform = Affine2D().scale(scale)
+
+        for op in self.ops:
+            gc = renderer.new_gc()
+            clip = op[1]
+            if clip is not None and clip[0] == 'rect':
+                x0, y0, x1, y1 = clip[1]
+                gc.set_clip_rectangle(Bbox([[x0, y0], [x1, y1]]).transformed(transform))
+            elif clip is not None:
+                gc.set_clip_path(TransformedPath(_segments_to_path(clip[1]), transform))
+
+            if op[0] == 'path':
+                _, _, segments, stroke, fill = op
+                if stroke is not None:
+                    rgba, linewidth, cap, join, dashes = stroke
+                    gc.set_foreground(rgba)
+                    gc.set_linewidth(linewidth)
+                    gc.set_capstyle({v: k for k, v in _CAP_STYLES.items()}[cap])
+                    gc.set_joinstyle({v: k for k, v in _JOIN_STYLES.items()}[join])
+                    if dashes:
+                        gc.set_dashes(dashes[0], list(dashes[1]))
+                else:
+                    gc.set_linewidth(0)
+                renderer.draw_path(gc, _segments_to_path(segments), transform, fill)
+            elif op[0] == 'text':
+                _, _, text_x, text_y, angle, fontsize, font_path, rgba, text = op
+                gc.set_foreground(rgba)
+                prop = FontProperties(fname=font_path, size=fontsize)
+                renderer.draw_text(gc, text_x * scale, renderer.height - text_y * scale,
+                                   text, prop, angle)
+            elif op[0] == 'glyphs':
+                _, _, font_path, fontsize, rgba, glyphs = op
+                gc.set_foreground(rgba)
+                prop = FontProperties(fname=font_path, size=fontsize)
+                for glyph_x, glyph_y, text in glyphs:
+                    renderer.draw_text(gc, glyph_x * scale, renderer.height - glyph_y * scale,
+                                       text, prop, 0)
+            else:
+                _, _, img_x, img_y, img_w, img_h, png = op
+                im = np.asarray(Image.open(io.BytesIO(png)).convert('RGBA'))
+                renderer.draw_image(gc, img_x * scale, img_y * scale, im[::-1])
+            gc.restore()
+
+        return Image.fromarray(np.asarray(renderer.buffer_rgba())).convert('RGB')
+
+    def save(self, fp, format=None):
+        """
+        Save the graphic to a file: a one-page PDF for '.pdf', otherwise a raster image.
+
+        Args:
+            fp: Filename or file object
+            format: Optional format override (e.g. 'PDF', 'PNG')
+        """
+        is_pdf = (format or '').upper() == 'PDF' or (
+            format is None and isinstance(fp, (str, os.PathLike)) and
+            str(fp).lower().endswith('.pdf'))
+        if not is_pdf:
+            self.to_image().save(fp, format=format)
+            return
+
+        from reportlab.pdfgen import canvas
+        c = canvas.Canvas(fp, pagesize=(self.width, self.height))
+        self.draw(c, 0, 0)
+        c.showPage()
+        c.save()
+
+
+# TrueType file -> ReportLab font name (None if it can't be embedded)
+_registered_fonts = {}
+
+
+def reportlab_font(font_path):
+    """
+    Register a TrueType font used by matplotlib with ReportLab.
+
+    A font the PDF generator has already loaded (Lexend, Poppins) keeps its
+    name, so graph labels and equations share the page text's font subset.
+
+    Args:
+        font_path: Font file found by matplotlib's font manager
+
+    Returns:
+        ReportLab font name, or None if the font can't be embedded
+    """
+    name = loaded_font_name(font_path)
+    if name is not None:
+        return name
+    if font_path in _registered_fonts:
+        return _registered_fonts[font_path]
+    name = 'mpl-' + os.path.splitext(os.path.basename(font_path))[0]
+    try:
+        if not font_path.lower().endswith('.ttf'):
+            raise ValueError("not a TrueType font")
+        load_font(name, font_path)
+    except Exception:
+        name = None
+    _registered_fonts[font_path] = name
+    return name
+
+
+def _round(value):
+    return round(float(value), _PRECISION)
+
+
+def path_segments(path, transform, clip=None) -> tuple:
+    """Convert a matplotlib path to PDF segments in canvas coordinates."""
+    segments = []
+    last = None
+    for vertices, code in path.iter_segments(transform, remove_nans=True, clip=clip,
+                                             curves=True):
+        if code == Path.MOVETO:
+            last = vertices[-2:]
+            segments.append(('M', _round(last[0]), _round(last[1])))
+        elif code == Path.LINETO:
+            last = vertices[-2:]
+            segments.append(('L', _round(last[0]), _round(last[1])))
+        elif code == Path.CURVE3:
+            # PDF has no quadratic curves; elevate to an equivalent cubic
+            (cx, cy), end = vertices[:2], vertices[2:]
+            c1 = last + 2.0 / 3.0 * (np.array([cx, cy]) - last)
+            c2 = end + 2.0 / 3.0 * (np.array([cx, cy]) - end)
+            last = end
+            segments.append(('C', _round(c1[0]), _round(c1[1]), _round(c2[0]), _round(c2[1]),
+                             _round(end[0]), _round(end[1])))
+        elif code == Path.CURVE4:
+            last = vertices[-2:]
+            segments.append(('C',) + tuple(_round(v) for v in vertices[:6]))
+        elif code == Path.CLOSEPOLY:
+            segments.append(('Z',))
+    return tuple(segments)
+
+
+def _segments_to_path(segments) -> Path:
+    """Rebuild a matplotlib Path from recorded segments (used for rasterizing)."""
+    vertices = []
+    codes = []
+    for seg in segments:
+        if seg[0] == 'M':
+            vertices.append(seg[1:3])
+            codes.append(Path.MOVETO)
+        elif seg[0] == 'L':
+            vertices.append(seg[1:3])
+            codes.append(Path.LINETO)
+        elif seg[0] == 'C':
+            vertices.extend([seg[1:3], seg[3:5], seg[5:7]])
+            codes.extend([Path.CURVE4] * 3)
+        else:
+            vertices.append(vertices[-1] if vertices else (0, 0))
+            codes.append(Path.CLOSEPOLY)
+    if not vertices:
+        return Path(np.zeros((0, 2)))
+    return Path(vertices, codes)
+
+
+def _build_path(c, segments):
+    """Build a ReportLab path object from recorded segments."""
+    p = c.beginPath()
+    for seg in segments:
+        if seg[0] == 'M':
+            p.moveTo(seg[1], seg[2])
+        elif seg[0] == 'L':
+            p.lineTo(seg[1], seg[2])
+        elif seg[0] == 'C':
+            p.curveTo(*seg[1:])
+        else:
+            p.close()
+    return p
+
+
+def end_form(c):
+    """
+    Finish a form XObject started with c.beginForm(), like c.endForm().
+
+    ReportLab leaves the graphics states a form sets (transparency: the
+    '/gRLs0 gs' that setFillColorRGB(..., alpha=) writes) out of the form's
+    resources, so viewers can't find them and draw translucent fills opaque.
+    This adds them.
+
+    Args:
+        c: ReportLab canvas, inside beginForm()
+    """
+    name = c._formData[0]
+    c.endForm()
+    form = c._doc.idToObject[c._doc.getXObjectName(name)]
+    if form.ExtGState and not form.Resources:
+        # The resources PDFFormXObject.format() would make, plus the graphics states
+        resources = pdfdoc.PDFResourceDictionary()
+        resources.basicFonts()
+        resources.allProcs()
+        if form.XObjects:
+            resources.XObject = form.XObjects
+        resources.ExtGState = form.ExtGState
+        form.Resources = resources
+
+
+def _apply_clip(c, clip):
+    """Intersect the current clipping region with a recorded clip."""
+    if clip[0] == 'rect':
+        x0, y0, x1, y1 = clip[1]
+        p = c.beginPath()
+        p.rect(x0, y0, x1 - x0, y1 - y0)
+    else:
+        p = _build_path(c, clip[1])
+    c.clipPath(p, stroke=0, fill=0, fillMode=FILL_NON_ZERO)
+
+
+def _draw_segments(c, segments, stroke, fill):
+    """Stroke and/or fill one recorded path."""
+    if stroke is not None:
+        rgba, linewidth, cap, join, dashes = stroke
+        c.setStrokeColorRGB(rgba[0], rgba[1], rgba[2], alpha=rgba[3])
+        c.setLineWidth(linewidth)
+        c.setLineCap(cap)
+        c.setLineJoin(join)
+        if dashes:
+            c.setDash(list(dashes[1]), dashes[0])
+        else:
+            c.setDash()
+    if fill is not None:
+        c.setFillColorRGB(fill[0], fill[1], fill[2], alpha=fill[3])
+    c.drawPath(_build_path(c, segments), stroke=int(stroke is not None),
+               fill=int(fill is not None), fillMode=FILL_NON_ZERO)
+
+
+class _RecordingRenderer(RendererBase):
+    """
+    Matplotlib renderer that records drawing operations instead of painting.
+
+    Works at 72 dpi so display coordinates are PDF points. Text, markers and
+    collections fall back to RendererBase, which reduces them to draw_path().
+    """
+
+    def __init__(self, width: float, height: float):
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.dpi = 72
+        self.ops = []
+
+    def get_canvas_width_height(self):
+        return self.width, self.height
+
+    def flipy(self):
+        return False
+
+    def points_to_pixels(self, points):
+        return points
+
+    def option_scale_image(self):
+        return False
+
+    def draw_text(self, gc, x, y, s, prop, angle, ismath=False, mtext=None):
+        # Plain labels become real PDF text in the same (embedded, subset)
+        # font matplotlib uses; mathtext falls back to glyph outlines.
+        font_path = None if ismath else findfont(prop)
+        if font_path is None or reportlab_font(font_path) is None:
+            self._draw_text_as_path(gc, x, y, s, prop, angle, ismath, mtext)
+            return
+        rgb = gc.get_rgb()
+        self.ops.append(('text', self._clip(gc), _round(x), _round(y), _round(angle),
+                         _round(prop.get_size_in_points()), str(font_path),
+                         self._rgba(rgb, rgb[3] if len(rgb) > 3 else 1.0), s))
+
+    def draw_path(self, gc, path, transform, rgbFace=None):
+        stroke = None
+        rgb = gc.get_rgb()
+        if gc.get_linewidth() > 0 and (len(rgb) <= 3 or rgb[3] != 0.0):
+            offset, dash_list = gc.get_dashes()
+            dashes = None
+            if dash_list is not None and len(dash_list):
+                dashes = (_round(offset or 0), tuple(_round(d) for d in dash_list))
+            stroke = (self._rgba(rgb, rgb[3] if len(rgb) > 3 else 1.0),
+                      _round(gc.get_linewidth()),
+                      _CAP_STYLES.get(gc.get_capstyle(), 0),
+                      _JOIN_STYLES.get(gc.get_joinstyle(), 0),
+                      dashes)
+
+        fill = None
+        if rgbFace is not None:
+            if gc.get_forced_alpha():
+                alpha = gc.get_alpha()
+            else:
+                alpha = rgbFace[3] if len(rgbFace) > 3 else 1.0
+            if alpha != 0.0:
+                fill = self._rgba(rgbFace, alpha)
+
+        if stroke is None and fill is None:
+            return
+
+        # Like the PDF backend, clip unfilled paths to the canvas so long
+        # curves (e.g. parabolas) don't carry thousands of off-page points.
+        clip = (0, 0, self.width, self.height) if rgbFace is None else None
+        segments = path_segments(path, transform, clip=clip)
+        if segments:
+            self.ops.append(('path', self._clip(gc), segments, stroke, fill))
+
+    def draw_image(self, gc, x, y, im, transform=None):
+        height, width = im.shape[:2]
+        buf = io.BytesIO()
+        Image.fromarray(im[::-1]).save(buf, format='png')
+        self.ops.append(('image', self._clip(gc), _round(x), _round(y),
+                         width, height, buf.getvalue()))
+
+    @staticmethod
+    def _rgba(color, alpha):
+        return (_round(color[0]), _round(color[1]), _round(color[2]), _round(alpha))
+
+    @staticmethod
+    def _clip(gc):
+        """Describe the gc's clip region as a hashable tuple (or None)."""
+        clip_path, clip_transform = gc.get_clip_path()
+        if clip_path is not None:
+            return ('path', path_segments(clip_path, clip_transform))
+        rect = gc.get_clip_rectangle()
+        if rect is not None:
+            x0, y0, x1, y1 = rect.extents
+            return ('rect', (_round(x0), _round(y0), _round(x1), _round(y1)))
+        return None
+
+
+class _RecordingCanvas(FigureCanvasBase):
+    """Figure canvas that lets savefig() write to a recording renderer."""
+
+    filetypes = {_RECORD_FORMAT: 'Worksheet vector display list'}
+
+    def print_wsvector(self, recording, *, bbox_inches_restore=None, **kwargs):
+        self.figure.dpi = 72
+        width, height = self.figure.get_size_inches()
+        renderer = _RecordingRenderer(width * 72, height * 72)
+        self.figure.draw(renderer)
+        recording.append(VectorGraphic(_round(width * 72), _round(height * 72), renderer.ops))
+
+    def get_default_filetype(self):
+        return _RECORD_FORMAT
+
+
+register_backend(_RECORD_FORMAT, _RecordingCanvas, 'Worksheet vector display list')
+
+
+def figure_to_vector(fig, **savefig_kwargs) -> VectorGraphic:
+    """
+    Record a matplotlib figure as a VectorGraphic.
+
+    Args:
+        fig: Matplotlib figure
+        **savefig_kwargs: Passed to savefig (e.g. bbox_inches='tight')
+
+    Returns:
+        VectorGraphic with the figure's drawing operations
+    """
+    savefig_kwargs.pop('dpi', None)  # Resolution-independent
+    recording = []
+    fig.savefig(recording, format=_RECORD_FORMAT, **savefig_kwargs)
+    return recording[0]
+
+
+@tracing.traced('render_graph')
+def render_figure(fig, dpi=None, **savefig_kwargs):
+    """
+    Convert a finished matplotlib figure to a worksheet graphic and close it.
+
+    In vector mode this returns a VectorGraphic; in raster mode a PIL Image
+    (PNG-encoded), which is what graphs were before vector mode existed.
+
+    Args:
+        fig: Matplotlib figure
+        dpi: Raster resolution (None = figure dpi); ignored in vector mode
+        **savefig_kwargs: Passed to savefig (e.g. bbox_inches='tight')
+
+    Returns:
+        VectorGraphic or PIL Image object
+    """
+    try:
+        if get_graph_render_mode() == VECTOR:
+            return figure_to_vector(fig, **savefig_kwargs)
+
+        buf = io.BytesIO()
+        if dpi is not None:
+            savefig_kwargs['dpi'] = dpi
+        fig.savefig(buf, format='png', **savefig_kwargs)
+        buf.seek(0)
+        return Image.open(buf)
+    finally:
+        plt.close(fig)
+
+
+def get_template(key: tuple, build):
+    """
+    Get a shared graphic for a fixed configuration, building it on first use.
+
+    Blank coordinate planes and number lines depend only on their settings, so
+    every problem that asks for the same configuration gets the same object.
+    The PDF layer then embeds it once as a form XObject and references it from
+    every slot.
+
+    Args:
+        key: Hashable description of everything that affects the graphic
+        build: Zero-argument callable returning a VectorGraphic or PIL Image
+
+    Returns:
+        The shared VectorGraphic or PIL Image (treat it as read-only)
+    """
+    full_key = (get_graph_render_mode(),) + tuple(key)
+    # Build under the lock: pyplot is not thread-safe anyway, and this stops
+    # two threads rendering the same template at once.
+    with _templates_lock:
+        graphic = _templates.get(full_key)
+        if graphic is None:
+            graphic = build()
+            if isinstance(graphic, Image.Image):
+                graphic.load()
+                digest = hashlib.sha256(repr(full_key).encode('utf-8')).hexdigest()
+                graphic.info['form_name'] = f"template_{digest[:20]}"
+            _templates[full_key] = graphic
+    return graphic
+
+
+def clear_templates():
+    """Drop all shared template graphics (e.g. after changing fonts or styles)."""
+    with _templates_lock:
+        _templates.clear()
+
+
+class DeferredGraphic:
+    """
+    A worksheet graphic kept as a description and rendered when it is drawn.
+
+    Graphing problems hold these instead of rendered graphs, so an answer key
+    graph is never rendered for a worksheet printed without its answer key,
+    and a rendered graph only lives for the draw_graphic() call that embeds
+    it. Subclasses implement render() and, if their repr() doesn't identify
+    the output, cache_key().
+    """
+
+    def render(self):
+        """Render the graphic now (VectorGraphic or PIL Image, per the graph render mode)."""
+        raise NotImplementedError
+
+    def cache_key(self) -> str:
+        """Text identifying everything that affects the rendered graphic."""
+        return repr(self)
+
+    def materialize(self, cache: RenderCache = None):
+        """The rendered graphic (see materialize())."""
+        return materialize(self, cache)
+
+    def to_image(self, dpi: int = 150) -> Image.Image:
+        """Render as a PIL Image (for previews and debugging)."""
+        graphic = self.materialize()
+        return graphic.to_image(dpi) if isinstance(graphic, VectorGraphic) else graphic
+
+    def save(self, fp, format=None):
+        """Render and save to a file, like VectorGraphic.save() / Image.save()."""
+        self.materialize().save(fp, format=format)
+
+
+def _json_value(value):
+    """Encode the display-list values JSON has no type for (json.dumps default)."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, bytes):
+        return {'bytes': base64.b64encode(value).decode('ascii')}
+    raise TypeError(f"Cannot serialize {type(value).__name__} in a graphic")
+
+
+def _from_json(value):
+    """Decode a display-list value: lists back to tuples, encoded bytes back to bytes."""
+    if isinstance(value, list):
+        return tuple(_from_json(item) for item in value)
+    if isinstance(value, dict):
+        return base64.b64decode(value['bytes'], validate=True)
+    return value
+
+
+def graphic_to_bytes(graphic) -> bytes:
+    """Serialize a rendered graphic for the render cache, as data only (JSON or PNG)."""
+    if isinstance(graphic, VectorGraphic):
+        # The display list holds numpy scalars and PNG bytes as well as tuples, numbers and strings
+        text = json.dumps([graphic.width, graphic.height, graphic.ops], default=_json_value,
+                          separators=(',', ':'))
+        return b'J' + text.encode('utf-8')
+    buf = io.BytesIO()
+    graphic.save(buf, format='png')
+    return b'P' + buf.getvalue()
+
+
+def graphic_from_bytes(data: bytes):
+    """
+    Rebuild a graphic serialized with graphic_to_bytes().
+
+    Raises:
+        ValueError: If data is not a serialized graphic (e.g. a corrupt or outdated cache entry)
+    """
+    try:
+        if data[:1] == b'J':
+            width, height, ops = json.loads(data[1:].decode('utf-8'))
+            return VectorGraphic(float(width), float(height), [_from_json(op) for op in ops])
+        if data[:1] == b'P':
+            image = Image.open(io.BytesIO(data[1:]))
+            image.load()
+            return image
+    except (ValueError, TypeError, KeyError, OSError) as e:
+        raise ValueError(f"Unreadable graphic: {e}") from e
+    raise ValueError("Unreadable graphic: unknown format")
+
+
+def cached_graphic(cache: RenderCache, key: str, render) -> tuple:
+    """
+    A rendered graphic from the render cache, rendering and storing it on a miss.
+
+    The graphic is always rebuilt from the cached bytes, so it gets the same
+    form XObject name whether or not it was a cache hit. An entry that can't be
+    decoded is dropped and the graphic rendered again.
+
+    Args:
+        cache: Render cache
+        key: Key from cache.make_key()
+        render: Zero-argument callable producing a VectorGraphic or PIL Image
+
+    Returns:
+        (graphic, size of its serialized form in bytes)
+    """
+    data = cache.get_or_render(key, lambda: graphic_to_bytes(render()), suffix=GRAPHIC_CACHE_SUFFIX)
+    try:
+        return graphic_from_bytes(data), len(data)
+    except ValueError as e:
+        print(f"Warning: Dropping render cache entry {key[:12]}: {e}")
+        cache.discard(key, suffix=GRAPHIC_CACHE_SUFFIX)
+        data = graphic_to_bytes(render())
+        cache.put(key, data, suffix=GRAPHIC_CACHE_SUFFIX)
+        return graphic_from_bytes(data), len(data)
+
+
+def materialize(graphic, cache: RenderCache = None):
+    """
+    The drawable form of a worksheet graphic, rendering it if it is deferred.
+
+    Deferred graphics go through the render cache, so a graph repeated on a
+    page (or in a later document) is only rendered once.
+
+    Args:
+        graphic: VectorGraphic, PIL Image or DeferredGraphic
+        cache: Render cache (defaults to the shared cache)
+
+    Returns:
+        VectorGraphic or PIL Image object
+    """
+    if not isinstance(graphic, DeferredGraphic):
+        return graphic
+    if cache is None:
+        cache = get_default_cache()
+    key = cache.make_key('graph', GRAPH_CACHE_VERSION, get_graph_render_mode(), graphic.cache_key())
+    rendered, _ = cached_graphic(cache, key, graphic.render)
+    return rendered
+
+
+def draw_graphic(c, graphic, x, y, width, height, preserveAspectRatio=True, anchor='c',
+                 cache: RenderCache = None):
+    """
+    Draw a worksheet graphic (VectorGraphic or PIL Image) on a ReportLab canvas.
+
+    Args:
+        c: ReportLab canvas
+        graphic: VectorGraphic, PIL Image or DeferredGraphic (rendered now)
+        x, y: Lower-left corner of the target box
+        width, height: Target box size
+        preserveAspectRatio: Fit inside the box without distortion
+        anchor: Position within the box when preserving the aspect ratio
+        cache: Render cache for deferred graphics (defaults to the shared cache)
+    """
+    graphic = materialize(graphic, cache)
+    if isinstance(graphic, VectorGraphic):
+        graphic.draw(c, x, y, width, height,
+                     preserveAspectRatio=preserveAspectRatio, anchor=anchor)
+    elif 'form_name' in getattr(graphic, 'info', {}):
+        # Shared raster template: embed the bitmap once in a form XObject
+        # instead of re-hashing its pixels on every drawImage call
+        img_w, img_h = graphic.size
+        x, y, width, height, _ = aspectRatioFix(
+            preserveAspectRatio, anchor, x, y, width, height, img_w, img_h)
+        name = graphic.info['form_name']
+        if not c.hasForm(name):
+            c.beginForm(name, 0, 0, img_w, img_h)
+            c.drawImage(ImageReader(graphic), 0, 0, width=img_w, height=img_h)
+            end_form(c)
+        c.saveState()
+        c.translate(x, y)
+        c.scale(width / img_w, height / img_h)
+        c.doForm(name)
+        c.restoreState()
+    else:
+        # Keep transparent backgrounds (equation images) transparent; opaque graphs need no mask
+        transparent = graphic.mode in ('RGBA', 'LA') and graphic.getchannel('A').getextrema()[0] < 255
+        c.drawImage(ImageReader(graphic), x, y, width=width, height=height,
+                    preserveAspectRatio=preserveAspectRatio, anchor=anchor,
+                    mask='auto' if transparent else None)
@@ -0,0 +1,243 @@
+"""
+Vector (PDF-native) rendering for equations.
+
+Equations used to be drawn by a throwaway matplotlib figure saved as a 150-dpi
+PNG per equation. Here matplotlib's mathtext parser is only used for layout -
+glyph positions, scripts, fraction bars and radicals - and the result is
+recorded as a VectorGraphic. Glyphs become real PDF text in the font
+matplotlib picked (Lexend, the same subset as the rest of the page), so
+equations stay selectable and searchable. Glyphs from mathtext's TeX-encoded
+fallback fonts (sized radicals and delimiters) and the rules of fractions and
+radicals become filled paths. No figure is created and no image embedded.
+
+mathtext has no array environment, so layout_array() lines up a grid of
+mathtext cells itself (left, centred or right aligned columns, like LaTeX's
+array).
+
+Usage:
+    layout = layout_text(r'$\\sqrt{x+4} = 5$', 21)
+    # Placed like ax.text(0, 0.3, ...) in a 4 x 0.5 inch figure
+    graphic = layout.to_graphic(4 * 72, 0.5 * 72, 0, 0.3)
+    graphic.draw(c, x, y, width, height, preserveAspectRatio=True)
+
+    layout = layout_array([['2x', '+', '3y', '=', '13'], ['x', '-', 'y', '=', '-1']], 'rcrcl', 21)
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+import matplotlib
+from matplotlib.font_manager import FontProperties
+from matplotlib.mathtext import MathTextParser
+from matplotlib.path import Path
+from matplotlib.transforms import Affine2D
+from reportlab.pdfbase import pdfmetrics
+
+from vector_graphics import VectorGraphic, path_segments, reportlab_font
+
+try:
+    from matplotlib.ft2font import LoadFlags
+    _NO_HINTING = LoadFlags.NO_HINTING
+except ImportError:  # matplotlib < 3.10
+    from matplotlib.ft2font import LOAD_NO_HINTING as _NO_HINTING
+
+
+# Resolution equations are laid out at. It is the PNG renderer's, so mathtext
+# picks the same glyph variants (e.g. radical sizes) and positions as it did.
+LAYOUT_DPI = 150
+
+# Bump when equation layout changes, so cached equations are re-rendered
+MATH_CACHE_VERSION = 1
+
+# Space on each side of an array column, in ems
+ARRAY_COLUMN_SEP = 0.25
+
+# Minimum height and depth of an array row, in ems (LaTeX's strut: 0.7 and 0.3 of a 1.2em baseline skip)
+ARRAY_STRUT = (0.84, 0.36)
+
+BLACK = (0.0, 0.0, 0.0, 1.0)
+
+# matplotlib's Computer Modern fonts, whose character codes aren't Unicode
+_TEX_FONT_DIR = os.path.join(matplotlib.get_data_path(), 'fonts', 'ttf')
+
+_PRECISION = 3
+
+_parser = MathTextParser('path')
+
+
+def _round(value):
+    return round(float(value), _PRECISION)
+
+
+def _shift_segments(segments, dx, dy) -> tuple:
+    """Translate recorded path segments."""
+    shifted = []
+    for seg in segments:
+        if seg[0] == 'Z':
+            shifted.append(seg)
+        else:
+            coords = seg[1:]
+            shifted.append((seg[0],) + tuple(_round(v + (dy if i % 2 else dx)) for i, v in enumerate(coords)))
+    return tuple(shifted)
+
+
+def _rect_segments(x, y, width, height) -> tuple:
+    return (('M', _round(x), _round(y)), ('L', _round(x + width), _round(y)),
+            ('L', _round(x + width), _round(y + height)), ('L', _round(x), _round(y + height)), ('Z',))
+
+
+@dataclass
+class MathLayout:
+    """Laid-out text or math in points, around its baseline's left end."""
+    width: float
+    height: float  # Above the baseline
+    depth: float  # Below the baseline
+    glyphs: list = field(default_factory=list)  # (font_path, fontsize, x, y, text), drawn as PDF text
+    paths: list = field(default_factory=list)  # Filled outlines (fallback glyphs, rules) as path segments
+
+    def translated(self, dx: float, dy: float) -> 'MathLayout':
+        """The same layout moved by (dx, dy)."""
+        return MathLayout(self.width, self.height, self.depth,
+                          [(font_path, size, _round(x + dx), _round(y + dy), text)
+                           for font_path, size, x, y, text in self.glyphs],
+                          [_shift_segments(segments, dx, dy) for segments in self.paths])
+
+    def to_graphic(self, frame_width: float, frame_height: float, x: float = 0.0, y: float = 0.0,
+                   ha: str = 'left', va: str = 'baseline', background=None) -> VectorGraphic:
+        """
+        Place the layout in a frame, like ax.text(x, y, s, ha=ha, va=va) in a figure of the frame's size.
+
+        Args:
+            frame_width, frame_height: Frame size in points
+            x, y: Anchor position, as fractions of the frame
+            ha: 'left', 'center' or 'right'
+            va: 'baseline', 'bottom', 'center' or 'top'
+            background: RGBA fill for the whole frame (None for transparent)
+
+        Returns:
+            VectorGraphic of the frame's size
+        """
+        dx = x * frame_width - {'left': 0.0, 'center': self.width / 2, 'right': self.width}[ha]
+        dy = y * frame_height + {'baseline': 0.0, 'bottom': self.depth, 'top': -self.height,
+                                 'center': (self.depth - self.height) / 2}[va]
+        placed = self.translated(dx, dy)
+
+        ops = []
+        if background is not None:
+            ops.append(('path', None, _rect_segments(0, 0, frame_width, frame_height), None, tuple(background)))
+        runs = {}  # (font_path, fontsize) -> glyphs, in drawing order
+        for font_path, size, glyph_x, glyph_y, text in placed.glyphs:
+            runs.setdefault((font_path, size), []).append((glyph_x, glyph_y, text))
+        for (font_path, size), glyphs in runs.items():
+            ops.append(('glyphs', None, font_path, size, BLACK, tuple(glyphs)))
+        for segments in placed.paths:
+            ops.append(('path', None, segments, None, BLACK))
+        return VectorGraphic(_round(frame_width), _round(frame_height), ops)
+
+
+def _glyph_text(font, code: int) -> Optional[str]:
+    """The character to draw a mathtext glyph as PDF text, or None to draw its outline."""
+    font_path = font.fname
+    if os.path.dirname(os.path.abspath(font_path)) == _TEX_FONT_DIR and \
+            os.path.basename(font_path).startswith('cm'):
+        return None
+    name = reportlab_font(font_path)
+    if name is None or code not in pdfmetrics.getFont(name).face.charToGlyph:
+        return None
+    return chr(code)
+
+
+def _glyph_outline(font, fontsize: float, code: int, glyph_index, x: float, y: float) -> tuple:
+    """A glyph's outline as path segments, with its origin at (x, y)."""
+    font.clear()
+    font.set_size(fontsize, 72)
+    if glyph_index is not None:
+        font.load_glyph(glyph_index, flags=_NO_HINTING)
+    else:
+        font.load_char(code, flags=_NO_HINTING)
+    vertices, codes = font.get_path()
+    if not len(vertices):
+        return ()
+    return path_segments(Path(vertices, codes), Affine2D().translate(x, y))
+
+
+def layout_text(s: str, fontsize: float, family: Optional[str] = None) -> MathLayout:
+    """
+    Lay out text as matplotlib would draw it: math between $...$, with the
+    current rcParams math fonts.
+
+    Args:
+        s: Text, e.g. r'$\\frac{x}{4} + 9 = 11$'
+        fontsize: Font size in points
+        family: Font family for text outside $...$ (default: rcParams)
+
+    Returns:
+        MathLayout
+    """
+    prop = FontProperties(family=family, size=fontsize)
+    parsed = _parser.parse(s, dpi=LAYOUT_DPI, prop=prop)
+    scale = 72.0 / LAYOUT_DPI
+
+    layout = MathLayout(parsed.width * scale, (parsed.height - parsed.depth) * scale, parsed.depth * scale)
+    for glyph in parsed.glyphs:
+        # (font, fontsize, code, [glyph index,] x, y); the glyph index was added in matplotlib 3.10
+        font, size, code = glyph[:3]
+        glyph_index = glyph[3] if len(glyph) == 6 else None
+        x, y = glyph[-2] * scale, glyph[-1] * scale
+        text = _glyph_text(font, code)
+        if text is not None:
+            layout.glyphs.append((font.fname, _round(size), _round(x), _round(y), text))
+        else:
+            segments = _glyph_outline(font, size, code, glyph_index, x, y)
+            if segments:
+                layout.paths.append(segments)
+    for x, y, width, height in parsed.rects:
+        layout.paths.append(_rect_segments(x * scale, y * scale, width * scale, height * scale))
+    return layout
+
+
+def layout_array(rows: Sequence[Sequence[str]], columns: str, fontsize: float,
+                 family: Optional[str] = None) -> MathLayout:
+    """
+    Lay out a grid of math cells like LaTeX's array environment.
+
+    Args:
+        rows: Rows of cells, each a math-mode string without $...$ ('' for an empty cell)
+        columns: Alignment of each column, 'l', 'c' or 'r' (e.g. 'rcrcl')
+        fontsize: Font size in points
+        family: Font family for text outside math (default: rcParams)
+
+    Returns:
+        MathLayout with its baseline through the middle of the array
+    """
+    cells = [[layout_text(f'${cell}$', fontsize, family) if cell.strip() else None for cell in row]
+             for row in rows]
+    num_columns = max([len(columns)] + [len(row) for row in cells])
+    widths = [max([row[i].width for row in cells if i < len(row) and row[i] is not None], default=0.0)
+              for i in range(num_columns)]
+    sep = ARRAY_COLUMN_SEP * fontsize
+    strut_height, strut_depth = (v * fontsize for v in ARRAY_STRUT)
+
+    array = MathLayout(sum(widths) + 2 * sep * num_columns, 0.0, 0.0)
+    y = 0.0
+    for row in cells:
+        placed = [cell for cell in row if cell is not None]
+        y -= max([strut_height] + [cell.height for cell in placed])
+        x = sep
+        for i, width in enumerate(widths):
+            cell = row[i] if i < len(row) else None
+            if cell is not None:
+                align = columns[i] if i < len(columns) else 'c'
+                offset = {'l': 0.0, 'c': (width - cell.width) / 2, 'r': width - cell.width}[align]
+                moved = cell.translated(x + offset, y)
+                array.glyphs.extend(moved.glyphs)
+                array.paths.extend(moved.paths)
+            x += width + 2 * sep
+        y -= max([strut_depth] + [cell.depth for cell in placed])
+
+    # Put the baseline through the middle, as LaTeX centres an array on the math axis
+    total = -y
+    centred = array.translated(0, total / 2)
+    centred.height = centred.depth = total / 2
+    return centred
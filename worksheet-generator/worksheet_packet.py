@@ -0,0 +1,153 @@
+"""
+Worksheet packets: many worksheets merged into one PDF.
+
+A class-wide run writes one PDF per topic, and each of them embeds its own
+copy of the Lexend and Poppins font subsets and of the QR code and logo
+images. A packet draws a list of sections - each a generator, difficulty and
+number of problems - into a single document instead, so every font, header
+image and blank graph template is embedded once for the whole packet. Answer
+keys are collected at the back, and each section and each answer key gets a
+bookmark.
+
+Usage:
+    sections = [PacketSection("Slope", SlopeGenerator, 'easy', 10), ...]
+    results = build_packet(sections, "unit4_packet.pdf", title="Unit 4")
+
+    python worksheet_packet.py --filter "Algebra 1/Unit 4" --difficulty easy --output unit4.pdf
+    python worksheet_packet.py --filter "Unit 2" --difficulty all --seed 2024 --output unit2.pdf
+"""
+
+import argparse
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from generator_manifest import GeneratorRef
+from parallel_generation import GenerationJob, GenerationResult
+from problem_uniqueness import generate_unique_worksheet
+from seeding import reseed
+
+
+@dataclass
+class PacketSection:
+    """One worksheet of a packet."""
+    title: str  # Section title, also used for its bookmarks
+    generator: object  # GeneratorRef, generator class or generator instance
+    difficulty: str
+    num_problems: int
+    seed: Optional[int] = None  # Makes the section's problems reproducible
+
+
+def section_for_job(job: GenerationJob) -> PacketSection:
+    """A packet section generating the same worksheet as a GenerationJob."""
+    return PacketSection(job.title, GeneratorRef(job.module_name, job.class_name, job.path),
+                         job.difficulty, job.num_problems, job.seed)
+
+
+def _generator_instance(generator):
+    """Instantiate a section's generator if it is given as a class or GeneratorRef."""
+    if isinstance(generator, (type, GeneratorRef)):
+        return generator()
+    return generator
+
+
+def build_packet(sections: Iterable[PacketSection], output, title: str = "Worksheet Packet",
+                 include_answer_key: bool = True, invariant: bool = False,
+                 pdf_gen=None) -> List[GenerationResult]:
+    """
+    Generate each section's problems and write them all into one PDF.
+
+    Sections are generated as the packet is drawn, so only one section's
+    problems are held at a time. A section that fails to generate is left
+    out of the packet and reported in its result.
+
+    Args:
+        sections: Sections in packet order
+        output: File path or binary file-like object to write the PDF to
+        title: Packet title (PDF metadata)
+        include_answer_key: Add every section's answer key at the back
+        invariant: Leave out the creation date and random document ID
+        pdf_gen: PDFWorksheetGenerator to draw with (defaults to a new one)
+
+    Returns:
+        One GenerationResult per section, with the number of problems in stats
+    """
+    if pdf_gen is None:
+        from pdf_generator import PDFWorksheetGenerator
+        pdf_gen = PDFWorksheetGenerator()
+
+    sections = list(sections)
+    errors = {}
+
+    def generated():
+        for index, section in enumerate(sections):
+            try:
+                generator = _generator_instance(section.generator)
+                if section.seed is not None:
+                    reseed(generator, section.seed)
+                problems = generate_unique_worksheet(generator, section.difficulty, section.num_problems)
+                if not problems:
+                    errors[index] = "No problems generated"
+            except Exception as e:
+                print(f"Warning: Could not generate {section.title}: {e}")
+                errors[index] = str(e) or type(e).__name__
+                problems = []
+            yield section.title, problems or []
+
+    counts = pdf_gen.write_packet(generated(), output, title, include_answer_key, invariant)
+
+    output_path = os.fspath(output) if isinstance(output, (str, os.PathLike)) else None
+    return [GenerationResult(section.title,
+                             None if index in errors else output_path,
+                             errors.get(index),
+                             stats={'problems': count})
+            for index, (section, count) in enumerate(zip(sections, counts))]
+
+
+def main(argv=None):
+    from batch_generate_worksheets import DIFFICULTIES, discover_jobs
+
+    parser = argparse.ArgumentParser(description="Generate a packet of worksheets as one PDF")
+    parser.add_argument('--filter', default=None,
+                        help="Only generators whose Class/Unit/Topic contains this text")
+    parser.add_argument('--difficulty', default='easy', choices=DIFFICULTIES + ['all'],
+                        help="Difficulty of every section, or 'all' for one section per difficulty (default: easy)")
+    parser.add_argument('--num-problems', type=int, default=10,
+                        help="Problems per section (default: 10)")
+    parser.add_argument('--no-answer-key', action='store_true', help="Don't add answer keys")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Base seed for a reproducible packet (default: random)")
+    parser.add_argument('--title', default=None, help="Packet title (default: the filter text)")
+    parser.add_argument('--output', default="worksheet_packet.pdf",
+                        help="PDF file to write (default: worksheet_packet.pdf)")
+    args = parser.parse_args(argv)
+
+    difficulties = DIFFICULTIES if args.difficulty == 'all' else [args.difficulty]
+    # Job output paths are unused; every section goes into the one packet
+    jobs = discover_jobs(os.path.dirname(os.path.abspath(args.output)), difficulties,
+                         args.num_problems, not args.no_answer_key, args.filter, args.seed)
+    if not jobs:
+        print("Nothing to generate")
+        return 1
+    print(f"Generating a packet of {len(jobs)} worksheets", flush=True)
+
+    start_time = time.perf_counter()
+    results = build_packet([section_for_job(job) for job in jobs], args.output,
+                           title=args.title or args.filter or "Worksheet Packet",
+                           include_answer_key=not args.no_answer_key,
+                           invariant=args.seed is not None)
+    elapsed = time.perf_counter() - start_time
+
+    failed = [r for r in results if not r.ok]
+    for result in failed:
+        print(f"FAILED  {result.label} - {result.error}")
+    size = os.path.getsize(args.output)
+    print(f"\nWrote {len(results) - len(failed)}/{len(results)} worksheets to {args.output} "
+          f"({size / 1024:.0f}KB) in {elapsed:.1f}s")
+    return 0 if not failed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
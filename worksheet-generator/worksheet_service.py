@@ -0,0 +1,621 @@
+"""
+Local HTTP worksheet service.
+
+Backs the web page's three modes (src/js/worksheet-generator.js): Standard,
+Practice Test and Custom Builder. Each POST takes the JSON the page sends,
+resolves its topics to generators and queues a job on a bounded process pool
+(problem generation and PDF rendering are CPU-bound, see parallel_generation).
+
+    POST /api/generate-worksheet      Standard: unit, topic, topicType, difficulty, numProblems, customTitle
+    POST /api/generate-practice-test  Practice Test: testType (unit/cumulative/spiral), difficultyMix, ...
+    POST /api/generate-custom         Custom Builder: title, specs [{unit, topic, topicType, difficulty, numProblems}]
+    GET  /api/jobs/<id>               Job status
+    GET  /api/jobs/<id>/pdf           The PDF (waits for the job to finish)
+    GET  /api/health                  Queue and worker counts
+
+A POST answers straight away with {"success": true, "jobId", "downloadUrl"}
+(the page then follows downloadUrl). With ?stream=1, or an Accept header of
+application/pdf, it waits instead and streams the PDF back as the response.
+
+Identical requests are coalesced: they share one job while it is queued or
+running. A seeded plan always makes the same PDF, so its finished PDF is kept
+(see RESULT_TTL) and served to later identical requests too; an unseeded plan
+gets a new job, with new problems, once the earlier one has finished. When
+more than max_queued jobs are
+waiting, new requests are turned away with 503 and a Retry-After header
+instead of queueing without limit.
+
+Usage:
+    python worksheet_service.py --port 8000 --workers 4 --static ..
+"""
+
+import argparse
+import asyncio
+import hashlib
+import io
+import json
+import mimetypes
+import os
+import re
+import sys
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+DIFFICULTIES = ['easy', 'medium', 'hard', 'challenge']
+
+# Limits on a single request
+MAX_BODY_BYTES = 64 * 1024
+MAX_PROBLEMS = 100
+
+# Finished PDFs are kept this long (seconds) and up to this many/this much;
+# only seeded plans' PDFs are served to later requests
+RESULT_TTL = 15 * 60
+MAX_RESULTS = 256
+MAX_RESULT_BYTES = 512 * 1024 * 1024
+
+# Seconds a client is told to wait when the queue is full
+RETRY_AFTER = 5
+
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+_HTTP_REASONS = {200: 'OK', 202: 'Accepted', 400: 'Bad Request', 404: 'Not Found',
+                 405: 'Method Not Allowed', 413: 'Payload Too Large', 500: 'Internal Server Error',
+                 503: 'Service Unavailable'}
+
+# The web page's topics (TOPICS_BY_UNIT in worksheet-generator.js) and the
+# generators behind them, as in the GUI. Topics without a generator yet are left out.
+_ALGEBRA = 'generators.High_School.Algebra'
+WEB_TOPICS = {
+    '2.0': {
+        ('What Are Solutions?', 'Intro'): (f'{_ALGEBRA}.Unit_2.solutions_generator', 'SolutionsGenerator'),
+        ('Equations', 'Intro'): (f'{_ALGEBRA}.Unit_2.equations_intro_generator', 'EquationsIntroGenerator'),
+        ('Inputs and Outputs', 'Intro'): (f'{_ALGEBRA}.Unit_2.inputs_outputs_generator', 'InputsOutputsGenerator'),
+        ('Property of Equality (add/subtract)', 'Intro'):
+            (f'{_ALGEBRA}.Unit_2.property_equality_add_sub_generator', 'PropertyEqualityAddSubGenerator'),
+        ('Property of Equality (mult/div)', 'Intro'):
+            (f'{_ALGEBRA}.Unit_2.property_equality_mult_div_generator', 'PropertyEqualityMultDivGenerator'),
+        ('Solving Multi-Step Equations', 'Intro'):
+            (f'{_ALGEBRA}.Unit_2.solving_multi_step_equations_generator', 'SolvingMultiStepEquationsGenerator'),
+        ('Linear Equations', 'Intro'): (f'{_ALGEBRA}.Unit_2.linear_equations_generator', 'LinearEquationsGenerator'),
+        ('Linear Equation Word Problems', 'Intro'):
+            (f'{_ALGEBRA}.Unit_2.linear_equation_word_problems_generator', 'LinearEquationWordProblemsGenerator'),
+        ('Solving Equations with Variables on Both Sides', 'Intro'):
+            (f'{_ALGEBRA}.Unit_1.variables_both_sides_generator', 'VariablesBothSidesGenerator'),
+    },
+    '3.0': {
+        ('One-Step Inequalities', 'Graphing'):
+            (f'{_ALGEBRA}.Unit_3.simple_inequalities_generator', 'SimpleInequalitiesGenerator'),
+    },
+    '4.0': {
+        ('Points on a Coordinate Plane', 'Graphing'): (f'{_ALGEBRA}.Unit_4.graphing_points', 'GraphingPointsGenerator'),
+        ('Line on a Coordinate Plane', 'Graphing'): (f'{_ALGEBRA}.Unit_4.graphing_lines', 'GraphingLinesGenerator'),
+        ('Slope-Intercept Form', 'Graphing'): (f'{_ALGEBRA}.Unit_4.graphing_slope_intercept', 'SlopeInterceptGenerator'),
+        ('Point-Slope Form', 'Graphing'): (f'{_ALGEBRA}.Unit_4.graphing_point_slope', 'PointSlopeGenerator'),
+        ('Standard Form', 'Graphing'): (f'{_ALGEBRA}.Unit_4.graphing_standard_form', 'StandardFormGenerator'),
+    },
+    '5.0': {
+        ('Systems of Equations', 'Graphing'): (f'{_ALGEBRA}.Unit_5.graphing_systems', 'GraphingSystemsGenerator'),
+    },
+    '11.0': {
+        ('Using Vertex Form', 'Graphing'): (f'{_ALGEBRA}.Unit_10.vertex_form_generator', 'VertexFormGenerator'),
+    },
+}
+
+
+class SpecError(ValueError):
+    """A job spec that can't be turned into a worksheet (sent back as 400)."""
+
+
+def _unit_key(unit) -> str:
+    try:
+        return f"{float(unit):.1f}"
+    except (TypeError, ValueError):
+        raise SpecError(f"Invalid unit: {unit!r}")
+
+
+def _count(value, name: str, low: int = 1, high: int = MAX_PROBLEMS) -> int:
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise SpecError(f"{name} must be a number")
+    if not low <= value <= high:
+        raise SpecError(f"{name} must be between {low} and {high}")
+    return value
+
+
+def _difficulty(value) -> str:
+    if value not in DIFFICULTIES:
+        raise SpecError(f"Invalid difficulty: {value!r}")
+    return value
+
+
+def resolve_topic(unit, topic: str, topic_type: Optional[str] = None) -> tuple:
+    """
+    The generator (module, class name) behind one of the web page's topics.
+
+    Raises:
+        SpecError: If the page's unit has no such topic with a generator
+    """
+    topics = WEB_TOPICS.get(_unit_key(unit), {})
+    if (topic, topic_type) in topics:
+        return topics[(topic, topic_type)]
+    matches = [generator for (name, _), generator in topics.items() if name == topic]
+    if len(matches) == 1:
+        return matches[0]
+    raise SpecError(f"Unknown topic for unit {unit}: {topic!r}")
+
+
+def _section(generator: tuple, difficulty: str, count: int) -> dict:
+    module_name, class_name = generator
+    return {'module': module_name, 'class': class_name, 'difficulty': difficulty, 'count': count}
+
+
+def _mixed_difficulties(mix: str, total: int) -> List[str]:
+    """Difficulty of each of total problems for a practice test's difficultyMix."""
+    if mix in DIFFICULTIES:
+        return [mix] * total
+    if mix == 'balanced':
+        return [DIFFICULTIES[i % len(DIFFICULTIES)] for i in range(total)]
+    if mix == 'progressive':
+        return [DIFFICULTIES[i * len(DIFFICULTIES) // total] for i in range(total)]
+    raise SpecError(f"Invalid difficultyMix: {mix!r}")
+
+
+def _practice_sections(generators: List[tuple], mix: str, total: int) -> List[dict]:
+    """Spread total problems across topics, with difficulties following the mix."""
+    counts = OrderedDict()
+    for index, difficulty in enumerate(_mixed_difficulties(mix, total)):
+        key = (generators[index % len(generators)], difficulty)
+        counts[key] = counts.get(key, 0) + 1
+    sections = [_section(generator, difficulty, count) for (generator, difficulty), count in counts.items()]
+    # Easier sections first, topics in page order within a difficulty
+    return sorted(sections, key=lambda s: DIFFICULTIES.index(s['difficulty']))
+
+
+def build_plan(mode: str, spec: dict) -> dict:
+    """
+    Turn a request from the web page into a worksheet plan.
+
+    Args:
+        mode: 'standard', 'practice' or 'custom'
+        spec: The JSON object the page sent
+
+    Returns:
+        Plan dict: title, include_answer_key, seed and sections (module,
+        class, difficulty, count), in worksheet order
+
+    Raises:
+        SpecError: If the spec is invalid
+    """
+    if not isinstance(spec, dict):
+        raise SpecError("Expected a JSON object")
+
+    if mode == 'standard':
+        generator = resolve_topic(spec.get('unit'), spec.get('topic'), spec.get('topicType'))
+        difficulty = _difficulty(spec.get('difficulty'))
+        sections = [_section(generator, difficulty, _count(spec.get('numProblems'), 'numProblems'))]
+        title = spec.get('customTitle') or f"{spec['topic']} ({difficulty.title()})"
+
+    elif mode == 'practice':
+        test_type = spec.get('testType')
+        mix = spec.get('difficultyMix', 'balanced')
+        if test_type == 'spiral':
+            generator = resolve_topic(spec.get('unit'), spec.get('topic'), spec.get('topicType'))
+            per_level = _count(spec.get('problemsPerLevel'), 'problemsPerLevel', high=MAX_PROBLEMS // len(DIFFICULTIES))
+            sections = [_section(generator, difficulty, per_level) for difficulty in DIFFICULTIES]
+            title = f"{spec['topic']} Spiral Review"
+        elif test_type in ('unit', 'cumulative'):
+            units = [spec.get('unit')] if test_type == 'unit' else spec.get('units') or []
+            if not isinstance(units, list) or not units:
+                raise SpecError("Select at least one unit")
+            generators = [generator for unit in units
+                          for generator in WEB_TOPICS.get(_unit_key(unit), {}).values()]
+            if not generators:
+                raise SpecError("No topics with generators in the selected units")
+            sections = _practice_sections(generators, mix, _count(spec.get('numProblems'), 'numProblems'))
+            names = ', '.join(f"{float(unit):g}" for unit in units)
+            title = f"Unit {names} Review" if test_type == 'unit' else f"Cumulative Review: Units {names}"
+        else:
+            raise SpecError(f"Invalid testType: {test_type!r}")
+
+    elif mode == 'custom':
+        rows = spec.get('specs')
+        if not isinstance(rows, list) or not rows:
+            raise SpecError("Add at least one topic")
+        sections = []
+        for row in rows:
+            if not isinstance(row, dict):
+                raise SpecError("Each spec must be an object")
+            sections.append(_section(resolve_topic(row.get('unit'), row.get('topic'), row.get('topicType')),
+                                     _difficulty(row.get('difficulty')),
+                                     _count(row.get('numProblems'), 'numProblems')))
+        title = spec.get('title') or "Custom Worksheet"
+
+    else:
+        raise SpecError(f"Unknown mode: {mode!r}")
+
+    if sum(section['count'] for section in sections) > MAX_PROBLEMS:
+        raise SpecError(f"At most {MAX_PROBLEMS} problems per worksheet")
+
+    seed = spec.get('seed')
+    if seed is not None and not isinstance(seed, int):
+        raise SpecError("seed must be an integer")
+    return {'title': str(title)[:200], 'include_answer_key': bool(spec.get('includeAnswerKey', True)),
+            'seed': seed, 'sections': sections}
+
+
+def plan_key(plan: dict) -> str:
+    """Hash identifying a plan, so identical requests share one job."""
+    return hashlib.sha256(json.dumps(plan, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def render_plan(plan: dict) -> bytes:
+    """
+    Generate and render a planned worksheet in a worker process.
+
+    Args:
+        plan: Plan from build_plan()
+
+    Returns:
+        PDF bytes
+    """
+    from parallel_generation import GenerationJob, get_worker_generator, get_worker_pdf_generator
+    from problem_uniqueness import UniqueProblemTracker, generate_unique_worksheet
+    from seeding import derive_seed
+
+    tracker = UniqueProblemTracker()
+    problems = []
+    for index, section in enumerate(plan['sections']):
+        seed = None if plan['seed'] is None else derive_seed(plan['seed'], index)
+        job = GenerationJob(section['module'], section['class'], section['difficulty'],
+                            section['count'], output_path='', title=plan['title'], seed=seed)
+        generator = get_worker_generator(job)
+        problems.extend(generate_unique_worksheet(generator, section['difficulty'], section['count'],
+                                                  tracker=tracker))
+    if not problems:
+        raise ValueError("No problems generated")
+
+    buf = io.BytesIO()
+    get_worker_pdf_generator().write_worksheet(problems, buf, plan['title'], plan['include_answer_key'],
+                                               invariant=plan['seed'] is not None)
+    return buf.getvalue()
+
+
+class _Job:
+    """A queued or finished worksheet; requests for the same plan share it."""
+
+    def __init__(self, key: str, plan: dict):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.plan = plan
+        self.status = STATUS_QUEUED
+        self.error = None
+        self.pdf = None
+        self.finished = None  # time.monotonic() when done or failed
+        self.done = asyncio.Event()
+
+    def to_json(self) -> dict:
+        info = {'jobId': self.id, 'status': self.status, 'title': self.plan['title'],
+                'downloadUrl': f"/api/jobs/{self.id}/pdf"}
+        if self.error:
+            info['error'] = self.error
+        return info
+
+
+class WorksheetService:
+    """Job queue, coalescing and result store in front of a process pool."""
+
+    def __init__(self, workers: Optional[int] = None, max_queued: Optional[int] = None,
+                 fork_after_warmup: bool = False):
+        """
+        Args:
+            workers: Worker processes (defaults to parallel_generation.default_worker_count())
+            max_queued: Jobs allowed to wait for a worker before requests are refused
+                        (defaults to 8 per worker)
+            fork_after_warmup: Warm up once and fork the workers from this process
+                               (see renderer_pool)
+        """
+        from renderer_pool import RendererPool
+
+        # The web page's generators are imported while warming up, not on the first request
+        preload = sorted({module for topics in WEB_TOPICS.values() for module, _ in topics.values()})
+        self.pool = RendererPool(workers, fork_after_warmup=fork_after_warmup, preload=preload)
+        self.workers = self.pool.workers
+        self.max_queued = max_queued if max_queued is not None else 8 * self.workers
+        self._slots = None
+        self._jobs = {}  # id -> _Job
+        self._by_key = {}  # plan key -> _Job
+        self._results = OrderedDict()  # id -> _Job with a PDF, oldest first
+        self._result_bytes = 0
+        self.coalesced = 0
+
+    def start(self):
+        """Start and warm up the worker pool (call from the event loop)."""
+        self.pool.start()
+        self._slots = asyncio.Semaphore(self.workers)
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.status == STATUS_QUEUED)
+
+    @property
+    def running(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.status == STATUS_RUNNING)
+
+    def get(self, job_id: str) -> Optional[_Job]:
+        self._expire()
+        return self._jobs.get(job_id)
+
+    def submit(self, plan: dict) -> Optional[_Job]:
+        """
+        Queue a plan, or join the job already making the same worksheet (or,
+        for a seeded plan, the job that already made it).
+
+        Returns:
+            The job, or None if the queue is full
+        """
+        self._expire()
+        key = plan_key(plan)
+        job = self._by_key.get(key)
+        if job is not None and (job.status in (STATUS_QUEUED, STATUS_RUNNING) or
+                                (job.status == STATUS_DONE and plan['seed'] is not None)):
+            self.coalesced += 1
+            return job
+        if self.queued >= self.max_queued:
+            return None
+
+        job = _Job(key, plan)
+        self._jobs[job.id] = job
+        self._by_key[key] = job
+        asyncio.ensure_future(self._run(job))
+        return job
+
+    async def _run(self, job: _Job):
+        async with self._slots:
+            job.status = STATUS_RUNNING
+            try:
+                job.pdf = await asyncio.get_running_loop().run_in_executor(self.pool.executor, render_plan, job.plan)
+                job.status = STATUS_DONE
+                self._results[job.id] = job
+                self._result_bytes += len(job.pdf)
+            except Exception as e:
+                job.status = STATUS_FAILED
+                job.error = str(e) or type(e).__name__
+            job.finished = time.monotonic()
+            if job.plan['seed'] is None:
+                # Later requests for an unseeded plan get new problems, not this PDF
+                self._unindex(job)
+            job.done.set()
+        self._expire()
+
+    def _unindex(self, job: _Job):
+        """Stop coalescing requests onto job."""
+        if self._by_key.get(job.key) is job:
+            del self._by_key[job.key]
+
+    def _forget(self, job: _Job):
+        self._jobs.pop(job.id, None)
+        self._unindex(job)
+        if self._results.pop(job.id, None) is not None:
+            self._result_bytes -= len(job.pdf)
+
+    def _expire(self):
+        """Drop finished jobs past RESULT_TTL, then the oldest PDFs past the size limits."""
+        now = time.monotonic()
+        for job in list(self._jobs.values()):
+            if job.finished is not None and now - job.finished > RESULT_TTL:
+                self._forget(job)
+        while self._results and (len(self._results) > MAX_RESULTS or self._result_bytes > MAX_RESULT_BYTES):
+            self._forget(next(iter(self._results.values())))
+
+
+class _Request:
+    def __init__(self, method: str, target: str, headers: Dict[str, str], body: bytes):
+        self.method = method
+        parts = urlsplit(target)
+        self.path = unquote(parts.path)
+        self.query = {name: values[-1] for name, values in parse_qs(parts.query).items()}
+        self.headers = headers
+        self.body = body
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[_Request]:
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, _ = line.decode('latin-1').split(' ', 2)
+    except ValueError:
+        raise SpecError("Malformed request line")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get('content-length') or 0)
+    if length > MAX_BODY_BYTES:
+        raise OverflowError
+    body = await reader.readexactly(length) if length else b''
+    return _Request(method.upper(), target, headers, body)
+
+
+class WorksheetHTTPServer:
+    """Minimal HTTP/1.1 front end (one request per connection) for a WorksheetService."""
+
+    ROUTES = {
+        '/api/generate-worksheet': 'standard',
+        '/api/generate-practice-test': 'practice',
+        '/api/generate-custom': 'custom',
+    }
+
+    def __init__(self, service: WorksheetService, static_dir: Optional[str] = None):
+        """
+        Args:
+            service: The job service
+            static_dir: Directory served for other GET requests (e.g. the site root), or None
+        """
+        self.service = service
+        self.static_dir = Path(static_dir).resolve() if static_dir else None
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            try:
+                request = await _read_request(reader)
+            except OverflowError:
+                await self._json(writer, 413, {'success': False, 'error': "Request body too large"})
+                return
+            except (SpecError, ValueError, asyncio.IncompleteReadError):
+                await self._json(writer, 400, {'success': False, 'error': "Malformed request"})
+                return
+            if request is not None:
+                await self._dispatch(request, writer)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        except Exception as e:
+            print(f"Error handling request: {e}")
+            try:
+                await self._json(writer, 500, {'success': False, 'error': "Internal error"})
+            except ConnectionError:
+                pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, request: _Request, writer: asyncio.StreamWriter):
+        path = request.path
+        if path in self.ROUTES:
+            if request.method != 'POST':
+                return await self._json(writer, 405, {'success': False, 'error': "Use POST"})
+            return await self._generate(self.ROUTES[path], request, writer)
+
+        if request.method != 'GET':
+            return await self._json(writer, 405, {'success': False, 'error': "Use GET"})
+        if path == '/api/health':
+            service = self.service
+            return await self._json(writer, 200, {'workers': service.workers, 'queued': service.queued,
+                                                  'running': service.running, 'maxQueued': service.max_queued,
+                                                  'coalesced': service.coalesced})
+        match = re.fullmatch(r'/api/jobs/([0-9a-f]+)(/pdf)?', path)
+        if match:
+            job = self.service.get(match.group(1))
+            if job is None:
+                return await self._json(writer, 404, {'success': False, 'error': "Unknown or expired job"})
+            if match.group(2):
+                return await self._send_pdf(job, writer)
+            return await self._json(writer, 200, dict(job.to_json(), success=job.status != STATUS_FAILED))
+        return await self._static(path, writer)
+
+    async def _generate(self, mode: str, request: _Request, writer: asyncio.StreamWriter):
+        try:
+            plan = build_plan(mode, json.loads(request.body or b'null'))
+        except ValueError as e:  # Includes SpecError and invalid JSON
+            return await self._json(writer, 400, {'success': False, 'error': str(e)})
+
+        job = self.service.submit(plan)
+        if job is None:
+            return await self._json(writer, 503, {'success': False, 'error': "Too many worksheets queued, try again shortly"},
+                                    {'Retry-After': str(RETRY_AFTER)})
+
+        if request.query.get('stream') == '1' or 'application/pdf' in request.headers.get('accept', ''):
+            return await self._send_pdf(job, writer)
+        info = job.to_json()
+        return await self._json(writer, 202, dict(info, success=True, path=info['downloadUrl']))
+
+    async def _send_pdf(self, job: _Job, writer: asyncio.StreamWriter):
+        await job.done.wait()
+        if job.status == STATUS_FAILED:
+            return await self._json(writer, 500, {'success': False, 'jobId': job.id, 'error': job.error})
+
+        filename = re.sub(r'[^A-Za-z0-9 ._-]+', '', job.plan['title']).strip() or 'worksheet'
+        self._head(writer, 200, {'Content-Type': 'application/pdf',
+                                 'Content-Disposition': f'attachment; filename="{filename}.pdf"',
+                                 'Transfer-Encoding': 'chunked'})
+        view = memoryview(job.pdf)
+        for start in range(0, len(view), 64 * 1024):
+            chunk = view[start:start + 64 * 1024]
+            writer.write(f"{len(chunk):x}\r\n".encode('ascii') + bytes(chunk) + b"\r\n")
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def _static(self, path: str, writer: asyncio.StreamWriter):
+        if self.static_dir is None:
+            return await self._json(writer, 404, {'success': False, 'error': "Not found"})
+        target = (self.static_dir / path.lstrip('/')).resolve()
+        if target.is_dir():
+            target = target / 'index.html'
+        if self.static_dir not in target.parents or not target.is_file():
+            return await self._json(writer, 404, {'success': False, 'error': "Not found"})
+        data = target.read_bytes()
+        self._head(writer, 200, {'Content-Type': mimetypes.guess_type(target.name)[0] or 'application/octet-stream',
+                                 'Content-Length': str(len(data))})
+        writer.write(data)
+        await writer.drain()
+
+    @staticmethod
+    def _head(writer: asyncio.StreamWriter, status: int, headers: dict):
+        lines = [f"HTTP/1.1 {status} {_HTTP_REASONS.get(status, '')}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        lines.append("Connection: close")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1'))
+
+    async def _json(self, writer: asyncio.StreamWriter, status: int, payload: dict, headers: dict = None):
+        body = json.dumps(payload).encode('utf-8')
+        self._head(writer, status, dict(headers or {}, **{'Content-Type': 'application/json',
+                                                          'Content-Length': str(len(body))}))
+        writer.write(body)
+        await writer.drain()
+
+
+async def serve(host: str = '127.0.0.1', port: int = 8000, workers: Optional[int] = None,
+                max_queued: Optional[int] = None, static_dir: Optional[str] = None,
+                fork_after_warmup: bool = False):
+    """Run the service until cancelled."""
+    service = WorksheetService(workers, max_queued, fork_after_warmup)
+    service.start()
+    front = WorksheetHTTPServer(service, static_dir)
+    server = await asyncio.start_server(front.handle, host, port)
+    print(f"Worksheet service on http://{host}:{port} ({service.workers} workers)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve worksheet generation over HTTP")
+    parser.add_argument('--host', default='127.0.0.1', help="Address to listen on (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8000, help="Port (default: 8000)")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPUs - 1)")
+    parser.add_argument('--max-queued', type=int, default=None,
+                        help="Jobs allowed to wait before requests get 503 (default: 8 per worker)")
+    parser.add_argument('--fork-after-warmup', action='store_true',
+                        help="Warm up once and fork the workers from the warmed process (not on Windows)")
+    parser.add_argument('--static', default=None, help="Directory to serve other GET requests from (e.g. the site root)")
+    args = parser.parse_args(argv)
+
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    if app_dir not in sys.path:
+        sys.path.insert(0, app_dir)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.max_queued, args.static,
+                          args.fork_after_warmup))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())